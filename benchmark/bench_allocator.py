@@ -0,0 +1,79 @@
+"""Allocation churn, one VkDeviceMemory per resource or suballocated
+
+Allocates and frees memory for a stream of buffers of mixed sizes, with
+vkAllocateMemory / vkFreeMemory for each one or with a
+vulkan.allocator.Allocator. The stub loader allocates nothing: this is the
+Python overhead only, the driver cost of the direct allocations (and their
+count limit) comes on top of it on a real device.
+
+Usage: python benchmark/bench_allocator.py (after building the package in
+place with vulkan_build.py, a stub loader is compiled when needed)
+"""
+import random
+import timeit
+
+from stub import reexec_with_stub
+
+
+LIVE = 1000
+OPERATIONS = 20000
+REPEAT = 5
+SIZES = (256, 4096, 65536, 1 << 20)
+
+
+def churn(allocate, free, sizes):
+    live = []
+    for size in sizes:
+        live.append(allocate(size))
+        if len(live) > LIVE:
+            free(live.pop(random.randrange(len(live))))
+    for allocation in live:
+        free(allocation)
+
+
+def main():
+    import vulkan as vk
+    from vulkan.allocator import Allocator
+    from vulkan.memory import MemoryTypes
+
+    device = vk.ffi.cast('VkDevice', 1)
+    physical_device = vk.ffi.cast('VkPhysicalDevice', 1)
+    random.seed(0)
+    sizes = [random.choice(SIZES) for _ in range(OPERATIONS)]
+
+    def direct():
+        def allocate(size):
+            return vk.vkAllocateMemory(device, vk.VkMemoryAllocateInfo(
+                allocationSize=size, memoryTypeIndex=0), None)
+
+        def free(memory):
+            vk.vkFreeMemory(device, memory, None)
+
+        churn(allocate, free, sizes)
+
+    def suballocated():
+        allocator = Allocator(device, physical_device)
+        # the stub reports no memory type
+        allocator.memory_types = MemoryTypes(
+            vk.VkPhysicalDeviceMemoryProperties(
+                memoryTypeCount=1, memoryTypes=[vk.VkMemoryType(
+                    propertyFlags=vk.VK_MEMORY_PROPERTY_DEVICE_LOCAL_BIT)],
+                memoryHeapCount=1, memoryHeaps=[vk.VkMemoryHeap(
+                    size=1 << 30)]))
+
+        def allocate(size):
+            return allocator.allocate(vk.VkMemoryRequirements(
+                size=size, alignment=256, memoryTypeBits=1))
+
+        churn(allocate, allocator.free, sizes)
+        allocator.destroy()
+
+    for name, fn in (('direct', direct), ('suballocated', suballocated)):
+        best = min(timeit.repeat(fn, number=1, repeat=REPEAT))
+        print('%-12s %6.2f us per allocation' %
+              (name, best / OPERATIONS * 1e6))
+
+
+if __name__ == '__main__':
+    reexec_with_stub()
+    main()
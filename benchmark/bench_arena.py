@@ -0,0 +1,54 @@
+"""Frame of transient structs with and without an arena
+
+Each frame builds the barriers, descriptor writes and submit infos of a
+typical render loop and drops them, with `ffi.new` per object or with a
+vulkan.arena.Arena reset per frame.
+
+Usage: python benchmark/bench_arena.py (after building the package in
+place with vulkan_build.py, a stub loader is compiled when needed)
+"""
+import timeit
+
+from stub import reexec_with_stub
+
+
+OBJECTS = 500
+FRAMES = 200
+REPEAT = 5
+
+
+def frame(vk):
+    buffer_info = vk.VkDescriptorBufferInfo(offset=0, range=256)
+    objects = []
+    for _ in range(OBJECTS):
+        objects.append(vk.VkImageMemoryBarrier(
+            srcAccessMask=vk.VK_ACCESS_TRANSFER_WRITE_BIT,
+            dstAccessMask=vk.VK_ACCESS_SHADER_READ_BIT,
+            oldLayout=vk.VK_IMAGE_LAYOUT_TRANSFER_DST_OPTIMAL,
+            newLayout=vk.VK_IMAGE_LAYOUT_SHADER_READ_ONLY_OPTIMAL))
+        objects.append(vk.VkWriteDescriptorSet(
+            dstBinding=0, descriptorType=vk.VK_DESCRIPTOR_TYPE_UNIFORM_BUFFER,
+            pBufferInfo=[buffer_info]))
+        objects.append(vk.VkSubmitInfo(
+            pWaitDstStageMask=[vk.VK_PIPELINE_STAGE_TRANSFER_BIT]))
+
+
+def main():
+    import vulkan as vk
+    from vulkan.arena import Arena
+
+    arena = Arena()
+
+    def with_arena():
+        with arena:
+            frame(vk)
+
+    for name, stmt in (('ffi.new', lambda: frame(vk)),
+                       ('arena', with_arena)):
+        t = min(timeit.repeat(stmt, number=FRAMES, repeat=REPEAT))
+        print('%-10s %8.2f ms/frame' % (name, t / FRAMES * 1e3))
+
+
+if __name__ == '__main__':
+    reexec_with_stub()
+    main()
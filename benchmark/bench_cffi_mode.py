@@ -0,0 +1,76 @@
+"""Compare the ABI and API cffi modes
+
+A stub `libvulkan.so.1` exporting every core command is compiled from
+`vulkan.cdef.h`, then the package is built twice in a temporary directory,
+once per mode. Import time and call overhead are measured in fresh
+interpreters so that both modes run against the same stub loader.
+
+Usage: python benchmark/bench_cffi_mode.py (needs a C compiler, POSIX only)
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from os import path
+
+from stub import PACKAGE, build_stub, vulkan_build
+
+
+IMPORT_RUNS = 10
+CALL_SCRIPT = '''
+import timeit
+import vulkan as vk
+from vulkan._vulkan import lib, ffi
+
+n = 200000
+for name, stmt in (
+        ('vkCmdDraw', lambda: vk.vkCmdDraw(None, 3, 1, 0, 0)),
+        ('lib.vkCmdDraw', lambda: lib.vkCmdDraw(ffi.NULL, 3, 1, 0, 0))):
+    t = min(timeit.repeat(stmt, number=n, repeat=5))
+    print('    %-20s %8.1f ns/call' % (name, t / n * 1e9))
+'''
+
+
+def build_package(tmp, mode, lib_dir):
+    root = path.join(tmp, mode)
+    shutil.copytree(PACKAGE, path.join(root, 'vulkan'),
+                    ignore=shutil.ignore_patterns('_vulkancache*',
+                                                  '__pycache__'))
+    vulkan_build.ffi.compile(tmpdir=root)
+    if mode == 'api':
+        os.environ['LIBRARY_PATH'] = lib_dir
+        vulkan_build.ffi_api().compile(tmpdir=root)
+    # warm the bytecode cache, we don't want to measure compilation
+    run(root, lib_dir, 'import vulkan')
+    return root
+
+
+def run(root, lib_dir, code):
+    env = dict(os.environ, LD_LIBRARY_PATH=lib_dir, PYTHONPATH=root)
+    return subprocess.run([sys.executable, '-c', code], env=env, cwd=root,
+                          check=True, stdout=subprocess.PIPE,
+                          universal_newlines=True).stdout
+
+
+def main():
+    tmp = tempfile.mkdtemp()
+    try:
+        lib_dir = build_stub(tmp)
+        for mode in ('abi', 'api'):
+            root = build_package(tmp, mode, lib_dir)
+            timings = [float(run(root, lib_dir,
+                                 'import time; t = time.perf_counter(); '
+                                 'import vulkan; '
+                                 'print(time.perf_counter() - t)'))
+                       for _ in range(IMPORT_RUNS)]
+            print('%s mode' % mode.upper())
+            print('    %-20s %8.1f ms' % ('import vulkan',
+                                          min(timings) * 1e3))
+            print(run(root, lib_dir, CALL_SCRIPT), end='')
+    finally:
+        shutil.rmtree(tmp)
+
+
+if __name__ == '__main__':
+    main()
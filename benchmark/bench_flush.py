@@ -0,0 +1,51 @@
+"""Flushes of the writes of a frame to non-coherent memory
+
+Compares a vkFlushMappedMemoryRanges call per written range
+(MappedMemory.flush) with the ranges recorded in a vulkan.memory.MappedRanges
+and flushed in a single call. The stub loader maps and flushes nothing: the
+copies are left out and only the Python and call overhead is measured.
+
+Usage: python benchmark/bench_flush.py (after building the package in
+place with vulkan_build.py, a stub loader is compiled when needed)
+"""
+import timeit
+
+from stub import reexec_with_stub
+
+
+SIZE = 1 << 20
+WRITES = 200
+NUMBER = 200
+REPEAT = 5
+
+
+def main():
+    import vulkan as vk
+    from vulkan.memory import MappedMemory, MappedRanges
+
+    device = vk.ffi.cast('VkDevice', 1)
+    memory = vk.ffi.cast('VkDeviceMemory', 1)
+    mapped = MappedMemory(device, memory, SIZE,
+                          vk.VK_MEMORY_PROPERTY_HOST_VISIBLE_BIT, 64)
+    ranges = MappedRanges()
+    # scattered writes, every other one in the atom of the previous one
+    offsets = [(i // 2) * 4096 + (i % 2) * 8 for i in range(WRITES)]
+
+    def per_write():
+        for offset in offsets:
+            mapped.flush(offset, 48)
+
+    def batched():
+        for offset in offsets:
+            ranges.add(mapped, offset, 48)
+        ranges.flush()
+
+    for name, fn in (('per write', per_write), ('batched', batched)):
+        best = min(timeit.repeat(fn, number=NUMBER, repeat=REPEAT))
+        print('%-10s %7.1f us per frame of %d writes' %
+              (name, best / NUMBER * 1e6, WRITES))
+
+
+if __name__ == '__main__':
+    reexec_with_stub()
+    main()
@@ -0,0 +1,59 @@
+"""Allocation and garbage collection cost of nested structs
+
+Builds 100k render pass create infos, each referencing arrays of structs
+that must be kept alive with it, then times a full collection while they
+are alive and their release.
+
+Usage: python benchmark/bench_keepalive.py (after building the package in
+place with vulkan_build.py, a stub loader is compiled when needed)
+"""
+import gc
+import time
+
+from stub import reexec_with_stub
+
+
+COUNT = 100000
+REPEAT = 5
+
+
+def build(vk):
+    color = vk.VkAttachmentReference(
+        attachment=0, layout=vk.VK_IMAGE_LAYOUT_COLOR_ATTACHMENT_OPTIMAL)
+    attachment = vk.VkAttachmentDescription(
+        format=vk.VK_FORMAT_B8G8R8A8_UNORM, samples=vk.VK_SAMPLE_COUNT_1_BIT,
+        finalLayout=vk.VK_IMAGE_LAYOUT_PRESENT_SRC_KHR)
+
+    return [vk.VkRenderPassCreateInfo(
+        pAttachments=[attachment],
+        pSubpasses=[vk.VkSubpassDescription(
+            pipelineBindPoint=vk.VK_PIPELINE_BIND_POINT_GRAPHICS,
+            pColorAttachments=[color])])
+        for _ in range(COUNT)]
+
+
+def measure(vk):
+    gc.collect()
+    start = time.perf_counter()
+    structs = build(vk)
+    built = time.perf_counter()
+    gc.collect()
+    collected = time.perf_counter()
+    del structs
+    gc.collect()
+    released = time.perf_counter()
+    return built - start, collected - built, released - collected
+
+
+def main():
+    import vulkan as vk
+
+    timings = [measure(vk) for _ in range(REPEAT)]
+    for name, values in zip(('build', 'gc.collect', 'release'),
+                            zip(*timings)):
+        print('%-12s %8.1f ms' % (name, min(values) * 1e3))
+
+
+if __name__ == '__main__':
+    reexec_with_stub()
+    main()
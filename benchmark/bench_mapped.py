@@ -0,0 +1,56 @@
+"""Readback of host visible memory, remapped or persistently mapped
+
+Compares the per-readback cost of vkMapMemory + numpy view + vkUnmapMemory
+with a numpy view of a vulkan.memory.MappedMemory, of coherent memory and of
+non-coherent memory (invalidated before the read).
+The stub loader maps nothing: only the Python and call overhead is
+measured, not the memory accesses.
+
+Usage: python benchmark/bench_mapped.py (after building the package in
+place with vulkan_build.py, a stub loader is compiled when needed)
+"""
+import timeit
+
+from stub import reexec_with_stub
+
+
+SIZE = 1 << 20
+NUMBER = 20000
+REPEAT = 5
+
+
+def main():
+    import numpy as np
+    import vulkan as vk
+    from vulkan.memory import MappedMemory
+
+    device = vk.ffi.cast('VkDevice', 1)
+    memory = vk.ffi.cast('VkDeviceMemory', 1)
+
+    def remap():
+        data = vk.vkMapMemory(device, memory, 0, SIZE, 0)
+        np.frombuffer(data, np.float32)
+        vk.vkUnmapMemory(device, memory)
+
+    coherent = MappedMemory(device, memory, SIZE,
+                            vk.VK_MEMORY_PROPERTY_HOST_VISIBLE_BIT |
+                            vk.VK_MEMORY_PROPERTY_HOST_COHERENT_BIT)
+    non_coherent = MappedMemory(device, memory, SIZE,
+                                vk.VK_MEMORY_PROPERTY_HOST_VISIBLE_BIT, 64)
+
+    def persistent():
+        coherent.array(0, SIZE // 4, np.float32)
+
+    def invalidated():
+        non_coherent.invalidate(0, SIZE)
+        non_coherent.array(0, SIZE // 4, np.float32)
+
+    for name, fn in (('remap', remap), ('persistent', persistent),
+                     ('invalidated', invalidated)):
+        best = min(timeit.repeat(fn, number=NUMBER, repeat=REPEAT))
+        print('%-12s %6.2f us' % (name, best / NUMBER * 1e6))
+
+
+if __name__ == '__main__':
+    reexec_with_stub()
+    main()
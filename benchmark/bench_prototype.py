@@ -0,0 +1,58 @@
+"""Graphics pipeline create info variants: rebuilt or cloned
+
+Usage: python benchmark/bench_prototype.py (after building the package in
+place with vulkan_build.py, a stub loader is compiled when needed)
+"""
+import timeit
+
+from stub import reexec_with_stub
+
+
+NUMBER = 2000
+REPEAT = 5
+
+
+def build(vk, render_pass):
+    return vk.VkGraphicsPipelineCreateInfo(
+        pStages=[
+            vk.VkPipelineShaderStageCreateInfo(
+                stage=vk.VK_SHADER_STAGE_VERTEX_BIT, pName='main'),
+            vk.VkPipelineShaderStageCreateInfo(
+                stage=vk.VK_SHADER_STAGE_FRAGMENT_BIT, pName='main')],
+        pVertexInputState=vk.VkPipelineVertexInputStateCreateInfo(
+            pVertexBindingDescriptions=[
+                vk.VkVertexInputBindingDescription(stride=32)],
+            pVertexAttributeDescriptions=[
+                vk.VkVertexInputAttributeDescription(location=i, offset=i * 8)
+                for i in range(3)]),
+        pInputAssemblyState=vk.VkPipelineInputAssemblyStateCreateInfo(
+            topology=vk.VK_PRIMITIVE_TOPOLOGY_TRIANGLE_LIST),
+        pViewportState=vk.VkPipelineViewportStateCreateInfo(
+            pViewports=[vk.VkViewport(width=800., height=600.)],
+            pScissors=[vk.VkRect2D()]),
+        pRasterizationState=vk.VkPipelineRasterizationStateCreateInfo(
+            lineWidth=1.),
+        pMultisampleState=vk.VkPipelineMultisampleStateCreateInfo(
+            rasterizationSamples=vk.VK_SAMPLE_COUNT_1_BIT),
+        pColorBlendState=vk.VkPipelineColorBlendStateCreateInfo(
+            pAttachments=[vk.VkPipelineColorBlendAttachmentState(
+                colorWriteMask=0xf)]),
+        renderPass=render_pass)
+
+
+def main():
+    import vulkan as vk
+    from vulkan.prototype import clone
+
+    render_pass = vk.ffi.cast('VkRenderPass', 1)
+    base = build(vk, None)
+    for name, stmt in (
+            ('build', lambda: build(vk, render_pass)),
+            ('clone', lambda: clone(base, renderPass=render_pass))):
+        t = min(timeit.repeat(stmt, number=NUMBER, repeat=REPEAT))
+        print('%-8s %8.2f us' % (name, t / NUMBER * 1e6))
+
+
+if __name__ == '__main__':
+    reexec_with_stub()
+    main()
@@ -0,0 +1,88 @@
+"""Construction time of the most common structs
+
+Usage: python benchmark/bench_structs.py (after building the package in
+place with vulkan_build.py, a stub loader is compiled when needed)
+"""
+import timeit
+
+from stub import reexec_with_stub
+
+
+NUMBER = 20000
+REPEAT = 5
+
+
+def structs(vk):
+    """Name and factory of the 20 structs built the most per frame"""
+    subresource = vk.VkImageSubresourceLayers(
+        aspectMask=vk.VK_IMAGE_ASPECT_COLOR_BIT, layerCount=1)
+    subresource_range = vk.VkImageSubresourceRange(
+        aspectMask=vk.VK_IMAGE_ASPECT_COLOR_BIT, levelCount=1, layerCount=1)
+    buffer_info = vk.VkDescriptorBufferInfo(offset=0, range=256)
+    extent = vk.VkExtent3D(width=256, height=256, depth=1)
+    clear = vk.VkClearValue(color=vk.VkClearColorValue(float32=[0, 0, 0, 1]))
+    area = vk.VkRect2D(extent=vk.VkExtent2D(width=800, height=600))
+
+    return [
+        ('VkBufferCopy', lambda: vk.VkBufferCopy(
+            srcOffset=0, dstOffset=64, size=1024)),
+        ('VkBufferImageCopy', lambda: vk.VkBufferImageCopy(
+            bufferOffset=0, imageSubresource=subresource,
+            imageExtent=extent)),
+        ('VkImageSubresourceLayers', lambda: vk.VkImageSubresourceLayers(
+            aspectMask=vk.VK_IMAGE_ASPECT_COLOR_BIT, layerCount=1)),
+        ('VkImageSubresourceRange', lambda: vk.VkImageSubresourceRange(
+            aspectMask=vk.VK_IMAGE_ASPECT_COLOR_BIT, levelCount=1,
+            layerCount=1)),
+        ('VkExtent3D', lambda: vk.VkExtent3D(width=256, height=256, depth=1)),
+        ('VkOffset3D', lambda: vk.VkOffset3D(x=1, y=2, z=3)),
+        ('VkViewport', lambda: vk.VkViewport(
+            width=800., height=600., maxDepth=1.)),
+        ('VkRect2D', lambda: vk.VkRect2D(
+            extent=vk.VkExtent2D(width=800, height=600))),
+        ('VkClearValue', lambda: vk.VkClearValue(
+            color=vk.VkClearColorValue(float32=[0, 0, 0, 1]))),
+        ('VkDescriptorBufferInfo', lambda: vk.VkDescriptorBufferInfo(
+            offset=0, range=256)),
+        ('VkDescriptorImageInfo', lambda: vk.VkDescriptorImageInfo(
+            imageLayout=vk.VK_IMAGE_LAYOUT_SHADER_READ_ONLY_OPTIMAL)),
+        ('VkWriteDescriptorSet', lambda: vk.VkWriteDescriptorSet(
+            dstBinding=0, descriptorType=vk.VK_DESCRIPTOR_TYPE_UNIFORM_BUFFER,
+            pBufferInfo=[buffer_info])),
+        ('VkMemoryBarrier', lambda: vk.VkMemoryBarrier(
+            srcAccessMask=vk.VK_ACCESS_TRANSFER_WRITE_BIT,
+            dstAccessMask=vk.VK_ACCESS_SHADER_READ_BIT)),
+        ('VkBufferMemoryBarrier', lambda: vk.VkBufferMemoryBarrier(
+            srcAccessMask=vk.VK_ACCESS_TRANSFER_WRITE_BIT,
+            dstAccessMask=vk.VK_ACCESS_SHADER_READ_BIT, size=1024)),
+        ('VkImageMemoryBarrier', lambda: vk.VkImageMemoryBarrier(
+            srcAccessMask=vk.VK_ACCESS_TRANSFER_WRITE_BIT,
+            dstAccessMask=vk.VK_ACCESS_SHADER_READ_BIT,
+            oldLayout=vk.VK_IMAGE_LAYOUT_TRANSFER_DST_OPTIMAL,
+            newLayout=vk.VK_IMAGE_LAYOUT_SHADER_READ_ONLY_OPTIMAL,
+            subresourceRange=subresource_range)),
+        ('VkCommandBufferBeginInfo', lambda: vk.VkCommandBufferBeginInfo(
+            flags=vk.VK_COMMAND_BUFFER_USAGE_ONE_TIME_SUBMIT_BIT)),
+        ('VkRenderPassBeginInfo', lambda: vk.VkRenderPassBeginInfo(
+            renderArea=area, pClearValues=[clear])),
+        ('VkSubmitInfo', lambda: vk.VkSubmitInfo(
+            pWaitDstStageMask=[vk.VK_PIPELINE_STAGE_TRANSFER_BIT])),
+        ('VkMappedMemoryRange', lambda: vk.VkMappedMemoryRange(
+            offset=0, size=1024)),
+    ]
+
+
+def main():
+    import vulkan as vk
+
+    total = 0
+    for name, factory in structs(vk):
+        t = min(timeit.repeat(factory, number=NUMBER, repeat=REPEAT))
+        total += t
+        print('%-28s %8.2f us' % (name, t / NUMBER * 1e6))
+    print('%-28s %8.2f us' % ('total', total / NUMBER * 1e6))
+
+
+if __name__ == '__main__':
+    reexec_with_stub()
+    main()
@@ -0,0 +1,66 @@
+"""Stub Vulkan loader for the benchmarks
+
+Every core command of `vulkan.cdef.h` is compiled as a no-op returning 0 in
+a `libvulkan.so.1`, so the package can be imported and called without a
+driver. POSIX only, needs a C compiler.
+
+Timings against the stub measure the Python overhead of the calls only:
+the commands do nothing, driver and GPU costs are not included.
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from os import path
+
+
+HERE = path.dirname(path.abspath(__file__))
+ROOT = path.join(HERE, path.pardir)
+PACKAGE = path.join(ROOT, 'vulkan')
+sys.path.insert(0, PACKAGE)
+
+import vulkan_build  # noqa
+
+
+def build_stub(tmp):
+    """Compile the stub in `tmp` and return its library folder"""
+    types, prototypes = vulkan_build.split_cdef(vulkan_build.cdef)
+    bodies = []
+    for match in vulkan_build.PROTOTYPE_RE.finditer(prototypes):
+        decl = match.group(0).strip()[:-1]
+        ret = decl.split(match.group(1))[0].strip()
+        bodies.append(decl + (' {}' if ret == 'void' else ' { return 0; }'))
+
+    source = path.join(tmp, 'stub.c')
+    with open(source, 'w') as f:
+        f.write(vulkan_build.C_HEADERS + types + '\n'.join(bodies))
+
+    lib_dir = path.join(tmp, 'lib')
+    os.mkdir(lib_dir)
+    subprocess.run(['cc', '-shared', '-fPIC', '-O2', source,
+                    '-Wl,-soname,libvulkan.so.1',
+                    '-o', path.join(lib_dir, 'libvulkan.so.1')], check=True)
+    os.symlink('libvulkan.so.1', path.join(lib_dir, 'libvulkan.so'))
+    return lib_dir
+
+
+def reexec_with_stub():
+    """Run the calling script again with the stub as loader
+
+    Returns in the child process, the parent exits with the child status.
+    The package must have been built in place (see vulkan_build.py).
+    """
+    if os.environ.get('VULKAN_STUB_LOADER'):
+        return
+
+    tmp = tempfile.mkdtemp()
+    try:
+        lib_dir = build_stub(tmp)
+        env = dict(os.environ, LD_LIBRARY_PATH=lib_dir,
+                   VULKAN_STUB_LOADER=lib_dir,
+                   PYTHONPATH=path.abspath(ROOT))
+        status = subprocess.call([sys.executable] + sys.argv, env=env)
+    finally:
+        shutil.rmtree(tmp)
+    sys.exit(status)
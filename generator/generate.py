@@ -1,4 +1,5 @@
 from os import path
+import re
 import subprocess
 
 import inflection
@@ -12,6 +13,10 @@ VENDOR_EXTENSIONS = ['KHR', 'EXT', 'NV', 'AMD']
 CUSTOM_FUNCTIONS = ('vkGetInstanceProcAddr', 'vkGetDeviceProcAddr',
                     'vkMapMemory', 'vkGetPipelineCacheData')
 NULL_MEMBERS = ('pNext', 'pAllocator', 'pUserData')
+# Parameter types passed to cffi as is (with enums and bitmasks)
+SCALAR_TYPES = ('int', 'int32_t', 'uint16_t', 'uint32_t', 'uint64_t',
+                'size_t', 'float', 'VkBool32', 'VkDeviceSize',
+                'VkDeviceAddress')
 
 # vulkansc API is not supported
 VKSC_PFN = ('PFN_vkFaultCallbackFunction',)
@@ -26,6 +31,19 @@ def get_handle_names(vk):
             if s.get('@category', None) == 'handle' and not s.get('@alias')}
 
 
+def get_all_handle_names(vk):
+    """Handle names, aliases included"""
+    return {s.get('name', s.get('@name'))
+            for s in vk['registry']['types']['type']
+            if s.get('@category', None) == 'handle'}
+
+
+def get_scalar_names(vk):
+    return set(SCALAR_TYPES) | {
+        s.get('name', s.get('@name')) for s in vk['registry']['types']['type']
+        if s.get('@category', None) in ('enum', 'bitmask')}
+
+
 def get_struct_names(vk):
     return {s['@name'] for s in vk['registry']['types']['type']
             if s.get('@category', None) == 'struct'}
@@ -336,18 +354,32 @@ def model_constructors(vk, model):
 
         return mlen
 
+    def parse_altlen(member, names):
+        """Python expression of a length vk.xml only gives as a formula"""
+        mlen = member.get('@altlen')
+        if not mlen:
+            return None
+
+        return re.sub(r'[A-Za-z_]\w*',
+                      lambda m: 's.' + m.group() if m.group() in names
+                      else m.group(),
+                      mlen).replace('/', '//')
+
     for struct in structs:
         if 'member' not in struct:
             continue
 
         model['constructors'].append({
             'name': struct['@name'],
+            'group': model['groups'].get(struct['@name'], 'other'),
             'members': [
                 {
                     'name': x['name'],
                     'type': x['type'],
                     'default': x.get('@values'),
-                    'len': parse_len(x)
+                    'len': parse_len(x),
+                    'altlen': parse_altlen(
+                        x, {y['name'] for y in struct['member']})
                 }
                 for x in struct['member']
                 if x.get('@api') != 'vulkansc'  # ignore vulkansc api (duplicates the args)
@@ -390,6 +422,26 @@ def model_functions(vk, model):
             return True
         return False
 
+    handle_names = get_all_handle_names(vk)
+    scalar_names = get_scalar_names(vk)
+
+    def member_kind(member):
+        """How the wrapper marshals the parameter
+
+        scalar: passed as is
+        direct: cdata allocated by the wrapper, passed as is
+        handle: None and integers are casted to the handle type
+        pointer: converted by _auto_handle with the type from cffi
+        """
+        text = member.get('#text', '')
+        if '*' in text or '[' in text:
+            return 'pointer'
+        if member['type'] in scalar_names:
+            return 'scalar'
+        if member['type'] in handle_names:
+            return 'handle'
+        return 'pointer'
+
     def format_member(member):
         type_name = member['type']
         if '#text' in member:
@@ -398,6 +450,7 @@ def model_functions(vk, model):
 
         return {'name': member['name'],
                 'type': member['type'],
+                'kind': member_kind(member),
                 'none': member['name'] in NULL_MEMBERS,
                 'force_array': True if '@len' in member else False,
                 'to_create': False,
@@ -478,15 +531,18 @@ def model_functions(vk, model):
             members[-1]['to_create'] = True
         if is_count:
             members[-2]['to_create'] = True
+            members[-2]['kind'] = members[-1]['kind'] = 'direct'
 
         f = {
             'name': fname,
+            'group': model['groups'].get(fname, 'other'),
             'members': members,
             'allocate': is_allocate,
             'count': is_count,
             'return_boolean': True if ftype == 'VkBool32' else False,
             'return_result': True if ftype == 'VkResult' else False,
             'return_member': return_member,
+            'has_pointer': any(m['kind'] == 'pointer' for m in members),
         }
         if fname not in extension_function_names:
             model['functions'].append({**f, 'is_extension': False})
@@ -526,6 +582,36 @@ def model_alias(vk, model):
             model['alias'][c['@name']] = c['@alias']
 
 
+def model_groups(vk, model):
+    """Fill the model with the lazy module of each struct and command
+
+    Core types and commands are grouped by feature, extension ones by
+    vendor. Everything else ends up in the 'other' group.
+
+    model['groups'] = {'name': 'group', ...}
+    """
+    model['groups'] = {}
+
+    def add(requires, group):
+        for req in requires:
+            for key in ('type', 'command'):
+                items = req.get(key, [])
+                if not isinstance(items, list):
+                    items = [items]
+                for item in items:
+                    model['groups'].setdefault(item['@name'], group)
+
+    for feature in vk['registry']['feature']:
+        if 'vulkan' not in feature['@api'].split(','):
+            continue
+        add(feature['require'], feature['@name'][len('VK_VERSION_'):])
+
+    for ext in get_extensions_filtered(vk):
+        vendor = ext['@name'].split('_')[1]
+        add(ext['require'],
+            vendor.lower() if vendor in VENDOR_EXTENSIONS else 'vendor')
+
+
 def init():
     with open(path.join(HERE, 'vk.xml')) as f:
         xml = f.read()
@@ -560,6 +646,7 @@ def generate_py():
     model_macros(vk, model)
     model_funcpointers(vk, model)
     model_exceptions(vk, model)
+    model_groups(vk, model)
     model_constructors(vk, model)
     model_functions(vk, model)
     model_ext_functions(vk, model)
@@ -571,9 +658,35 @@ def generate_py():
         loader=jinja2.FileSystemLoader(HERE)
     )
 
+    groups = {}
+    for c in model['constructors']:
+        groups.setdefault(c['group'], {'constructors': [], 'functions': []})
+        groups[c['group']]['constructors'].append(c)
+    for f in model['functions']:
+        groups.setdefault(f['group'], {'constructors': [], 'functions': []})
+        groups[f['group']]['functions'].append(f)
+
+    lazy_groups = {}
+    for name, group in sorted(groups.items()):
+        lazy_groups[name] = [c['name'] for c in group['constructors']]
+        lazy_groups[name] += [('_wrap_' if f['is_extension'] else '') +
+                              f['name'] for f in group['functions']]
+
+        out_file = path.join(HERE, path.pardir, 'vulkan',
+                             '_vulkan_%s.py' % name)
+        with open(out_file, 'w') as out:
+            out.write(env.get_template('vulkan_group.template.py')
+                      .render(model=group))
+
     out_file = path.join(HERE, path.pardir, 'vulkan', '_vulkan.py')
     with open(out_file, 'w') as out:
-        out.write(env.get_template('vulkan.template.py').render(model=model))
+        out.write(env.get_template('vulkan.template.py')
+                  .render(model=model, lazy_groups=lazy_groups))
+
+    out_file = path.join(HERE, path.pardir, 'vulkan', 'raw.py')
+    with open(out_file, 'w') as out:
+        out.write(env.get_template('vulkan_raw.template.py')
+                  .render(model=model, custom_functions=CUSTOM_FUNCTIONS))
 
 
 def generate_cdef():
@@ -1,11 +1,60 @@
 from collections.abc import Iterable
-import weakref as _weakref
+import importlib as _importlib
+import threading as _threading
 import sys
 
-from vulkan._vulkancache import ffi
+try:
+    # API mode, compiled against the loader (see vulkan_build.ffi_api)
+    from vulkan._vulkancache_api import ffi, lib
+except ImportError:
+    from vulkan._vulkancache import ffi
+    lib = None
 
 
-_weakkey_dict = _weakref.WeakKeyDictionary()
+# cdata can't reference Python objects. A struct or an array pointing to
+# other objects is allocated by _new_owned: its memory is a cdata of ffi.gc
+# whose destructor references them, kept alive by the cdata returned (a
+# struct value included), so each object owns what it points to and frees
+# it with itself, without a shared table.
+
+
+class _OwnerState(_threading.local):
+    # references of the next allocation of _new_owned in this thread
+    refs = None
+
+
+_owner_state = _OwnerState()
+
+
+def _alloc_owner(size):
+    refs = _owner_state.refs
+    _owner_state.refs = None
+    return ffi.gc(ffi.new('char[]', size), lambda _: refs)
+
+
+_new_owner = ffi.new_allocator(alloc=_alloc_owner,
+                               should_clear_after_alloc=False)
+
+
+def _new_owned(ctype, init, refs):
+    """ffi.new(ctype, init) keeping refs alive as long as the result"""
+    _owner_state.refs = refs
+    return _new_owner(ctype, init)
+
+
+def _slice(array, count):
+    """array[0:count] keeping array alive as long as the result"""
+    item = ffi.typeof(array).item
+    return ffi.from_buffer(ffi.getctype(item, '[]'),
+                           ffi.buffer(array, count * ffi.sizeof(item)))
+
+
+class _ArenaState(_threading.local):
+    # vulkan.arena.Arena of the current thread, see Arena.__enter__
+    arena = None
+
+
+_arena_state = _ArenaState()
 PY3 = sys.version_info >= (3, 0)
 
 
@@ -17,14 +66,22 @@ class ExtensionNotSupportedError(Exception):
     pass
 
 
-def _cstr(x):
-    if not isinstance(x, ffi.CData):
-        return x
+# {ctype: kind of the char pointers and arrays, None for other types}
+_string_kinds = {}
+
+
+def _string_kind(ctype):
+    try:
+        return _string_kinds[ctype]
+    except KeyError:
+        kind = None
+        if ctype.kind in ('array', 'pointer') and ctype.item.cname == 'char':
+            kind = ctype.kind
+        _string_kinds[ctype] = kind
+        return kind
 
-    t = ffi.typeof(x)
-    if 'item' not in dir(t) or t.item.cname != 'char':
-        return x
 
+def _decode(x):
     if PY3:
         try:
             return ffi.string(x).decode('ascii')
@@ -34,6 +91,12 @@ def _cstr(x):
         return ffi.string(x)
 
 
+def _cstr(x):
+    if not isinstance(x, ffi.CData) or _string_kind(ffi.typeof(x)) is None:
+        return x
+    return _decode(x)
+
+
 class StrWrap(object):
     """Wrap a FFI Cdata object
 
@@ -41,17 +104,34 @@ class StrWrap(object):
     string. It must be used only on object containing string data.
     Original CFFI string can always be accessed by prefixing the property with
     an underscore.
+    Char arrays are decoded once, changes made to them through the wrapped
+    object afterwards are not seen.
     """
+    __slots__ = ('obj', '_strings')
+
     def __init__(self, obj):
-        self.obj = obj
+        object.__setattr__(self, 'obj', obj)
+        object.__setattr__(self, '_strings', None)
 
     def __setattr__(self, key, value):
-        if key == 'obj':
-            return super(StrWrap, self).__setattr__(key, value)
+        if key in StrWrap.__slots__:
+            if key == 'obj':
+                object.__setattr__(self, '_strings', None)
+            return object.__setattr__(self, key, value)
 
+        if self._strings:
+            self._strings.pop(key, None)
         setattr(self.obj, key, value)
 
     def __getattr__(self, key):
+        if key in StrWrap.__slots__:
+            # slot not set yet, while copying
+            raise AttributeError(key)
+
+        strings = self._strings
+        if strings is not None and key in strings:
+            return strings[key]
+
         try:
             attr = getattr(self.obj, key)
         except AttributeError as origin_exc:
@@ -63,7 +143,64 @@ class StrWrap(object):
                     raise origin_exc
             raise origin_exc
 
-        return _cstr(attr)
+        if not isinstance(attr, ffi.CData):
+            return attr
+        kind = _string_kind(ffi.typeof(attr))
+        if kind is None:
+            return attr
+
+        result = _decode(attr)
+        if kind == 'array':
+            # stored in the struct, the pointed strings can change
+            if strings is None:
+                strings = {}
+                object.__setattr__(self, '_strings', strings)
+            strings[key] = result
+        return result
+
+
+_FLOAT_FORMATS = 'efd'
+_INT_FORMATS = 'bBhHiIlLqQnN?'
+
+
+def _from_buffer(x, _type):
+    """Zero-copy array of a buffer, None if x is not a buffer
+
+    The buffer must be C-contiguous and made of _type items (same size and
+    int or float format) or of raw bytes. char pointers are excluded:
+    strings need the null terminator added by ffi.new.
+    """
+    item = _type.item
+    if item.kind == 'pointer' or item.cname == 'char':
+        return None
+
+    try:
+        view = memoryview(x)
+    except TypeError:
+        return None
+
+    if not view.c_contiguous:
+        raise ValueError('Buffer must be C-contiguous')
+    if item.kind == 'void':
+        return ffi.from_buffer(x)
+
+    size = ffi.sizeof(item)
+    fmt = view.format.lstrip('@=<>!')
+    if view.nbytes % size:
+        raise TypeError('Buffer size %d is not a multiple of sizeof(%s)' %
+                        (view.nbytes, item.cname))
+    if not (view.itemsize == 1 and fmt in ('B', 'b', 'c')):
+        if item.kind == 'primitive' and item.cname in ('float', 'double'):
+            valid = fmt in _FLOAT_FORMATS
+        elif item.kind in ('primitive', 'enum'):
+            valid = fmt in _INT_FORMATS
+        else:
+            valid = True
+        if not valid or view.itemsize != size:
+            raise TypeError('Buffer format %r does not match %s' %
+                            (view.format, item.cname))
+
+    return ffi.from_buffer(item.cname + '[]', x)
 
 
 def _cast_ptr2(x, _type):
@@ -74,13 +211,34 @@ def _cast_ptr2(x, _type):
             return ffi.addressof(x), x
         return x, x
 
+    if not isinstance(x, (list, tuple)):
+        ret = _from_buffer(x, _type)
+        if ret is not None:
+            return ret, ret
+
     if isinstance(x, Iterable):
+        arena = _arena_state.arena
         if _type.item.kind == 'pointer':
             ptrs = [_cast_ptr(i, _type.item) for i in x]
-            ret = ffi.new(_type.item.cname+'[]', [i for i, _ in ptrs])
-            _weakkey_dict[ret] = tuple(i for _, i in ptrs if i != ffi.NULL)
-        else:
+            refs = tuple(i for _, i in ptrs if i != ffi.NULL)
+            if arena is None:
+                ret = _new_owned(_type.item.cname+'[]',
+                                 [i for i, _ in ptrs], refs)
+            else:
+                ret = arena.new_array(_type.item, [i for i, _ in ptrs])
+                arena.keep(refs)
+        elif _type.item.kind in ('struct', 'union'):
+            # structs are copied, what they point to must be kept alive
+            x = tuple(x)
+            if arena is None:
+                ret = _new_owned(_type.item.cname+'[]', x, x)
+            else:
+                ret = arena.new_array(_type.item, x)
+                arena.keep(x)
+        elif arena is None:
             ret = ffi.new(_type.item.cname+'[]', x)
+        else:
+            ret = arena.new_array(_type.item, x)
 
         return ret, ret
 
@@ -99,18 +257,19 @@ def _cast_ptr3(x, _type):
 _cast_ptr = _cast_ptr3 if PY3 else _cast_ptr2
 
 
-# Load SDK
+# Load SDK (ABI mode fallback)
 _lib_names = ('libvulkan.so.1', 'vulkan-1.dll', 'libvulkan.dylib')
-for name in _lib_names:
-    try:
-        lib = ffi.dlopen(name)
-        break
-    except OSError:
-        pass
-else:
-    raise OSError('Cannot find Vulkan SDK version. Please ensure that it is '
-                  'installed and that the <sdk_root>/<version>/lib/ folder is '
-                  'in the library path')
+if lib is None:
+    for name in _lib_names:
+        try:
+            lib = ffi.dlopen(name)
+            break
+        except OSError:
+            pass
+    else:
+        raise OSError('Cannot find Vulkan SDK version. Please ensure that it '
+                      'is installed and that the <sdk_root>/<version>/lib/ '
+                      'folder is in the library path')
 
 
 {# Add enums #}
@@ -206,82 +365,129 @@ def _get_pfn_name(struct_name):
 {% endfor %}
 
 
-def _new(ctype, **kwargs):
-    _type = ffi.typeof(ctype)
+# {struct: {pointer member: member counting its items}} from vk.xml
+_struct_lengths = {
+{% for c in model.constructors %}
+{% set lens = c.members|selectattr('len')|list %}
+{% if lens %}
+    '{{c.name}}': {
+{% for m in lens %}
+        '{{m.name}}': '{{m.len}}',
+{% endfor %}
+    },
+{% endif %}
+{% endfor %}
+}
 
-    # keep only valued kwargs
-    kwargs = {k: kwargs[k] for k in kwargs if kwargs[k]}
 
-    # cast pointer
-    ptrs = {}
-    pfns = {}
-    pcs = {}
-    for k, v in kwargs.items():
-        # convert tuple pair to dict
-        ktype = dict(_type.fields)[k].type
+# {struct: {pointer member: item count computed from the struct}}, for the
+# lengths vk.xml gives as a formula
+_struct_length_formulas = {
+{% for c in model.constructors %}
+{% set lens = c.members|selectattr('altlen')|list %}
+{% if lens %}
+    '{{c.name}}': {
+{% for m in lens %}
+        '{{m.name}}': lambda s: {{m.altlen}},
+{% endfor %}
+    },
+{% endif %}
+{% endfor %}
+}
+
+
+# every VkFormat, aliases included, without the range markers
+_formats = (
+{% for name in model.enums.VkFormat if not name.startswith('VK_FORMAT__') %}
+    {{name}},
+{% endfor %}
+)
 
+
+# {sType value: struct}, to follow pNext chains
+_structure_types = {
+{% for c in model.constructors %}
+{% if c.members[0].name == 'sType' and c.members[0].default %}
+    {{c.members[0].default}}: '{{c.name}}',
+{% endif %}
+{% endfor %}
+}
+
+
+_PCODE = object()
+_PFN = object()
+_struct_fields = {}
+
+
+def _fields(ctype):
+    """Cached (pointer type, {field: conversion}) of a struct
+
+    Only fields needing a conversion are listed: pCode, pfn* callbacks
+    (_PCODE, _PFN) and pointers (their ctype).
+    """
+    try:
+        return _struct_fields[ctype]
+    except KeyError:
+        pass
+
+    _type = ffi.typeof(ctype)
+    fields = {}
+    for k, field in _type.fields:
         if k == 'pCode':
-            pcs[k] = ffi.cast('uint32_t*', ffi.from_buffer(v))
+            fields[k] = _PCODE
         elif k.startswith('pfn'):
+            fields[k] = _PFN
+        elif field.type.kind == 'pointer':
+            fields[k] = field.type
+
+    info = _struct_fields[ctype] = (ffi.typeof(_type.cname + '*'), fields)
+    return info
+
+
+def _new(ctype, **kwargs):
+    ptr_type, fields = _fields(ctype)
+
+    init = {}
+    refs = []
+    for k, v in kwargs.items():
+        # keep only valued kwargs, buffers (numpy arrays) have no truth value
+        if v is None:
+            continue
+
+        ktype = fields.get(k)
+        if ktype is None:
+            init[k] = v
+        elif not isinstance(v, ffi.CData) and hasattr(v, '__len__') and \
+                not len(v):
+            # empty sequence or string, the pointer stays NULL
+            continue
+        elif ktype is _PCODE:
+            init[k] = ffi.cast('uint32_t*', ffi.from_buffer(v))
+            refs.append(init[k])
+        elif ktype is _PFN:
             pfn_name = _get_pfn_name(ctype)
             mod = sys.modules[__name__]
             setattr(mod, '_internal_' + pfn_name, v)
-            pfns[k] = getattr(mod, '_external_' + pfn_name)
-        elif ktype.kind == 'pointer':
-            ptrs[k] = _cast_ptr(v, ktype)
-
-    # init object
-    init = dict(kwargs,  **{k: v for k, (v, _) in ptrs.items()})
-    init.update(pfns)
-    init.update(pcs)
-
-    ret = ffi.new(_type.cname + '*', init)[0]
-
-    # reference created pointer in the object
-    _weakkey_dict[ret] = [v for _, v in ptrs.values() if v != ffi.NULL]
-    if pcs:
-        _weakkey_dict[ret].extend([x for x in pcs.values()])
-
-    return ret
-
-
-
-{# Macro for function parameters #}
-{%- macro constructor_params(c) -%}
-    {%- for m in c.members -%}
-        {%- if m.default -%}
-            {{m.name}}={{m.default}}
-        {%- else -%}
-            {{m.name}}=None
-        {%- endif -%},
-    {%- endfor -%}
-{%- endmacro -%}
-
-{%- macro constructor_params_call(c) -%}
-    {%- for m in c.members -%}
-        {{m.name}}={{m.name}}
-        {%- if not loop.last -%}
-        ,
-        {%- endif -%}
-    {%- endfor -%}
-{%- endmacro -%}
-
-{%- macro constructor_len(c) -%}
-{% for m in c.members %}
-{% if m.len %}
-    if {{m.len}} is None and {{m.name}} is not None:
-        {{m.len}} = len({{m.name}})
-{% endif %}
-{% endfor %}
-{%- endmacro -%}
+            init[k] = getattr(mod, '_external_' + pfn_name)
+        else:
+            # cast pointer
+            init[k], ref = _cast_ptr(v, ktype)
+            if ref != ffi.NULL:
+                refs.append(ref)
 
+    arena = _arena_state.arena
+    if arena is not None:
+        ret = arena.new(ptr_type, init)
+        if refs:
+            arena.keep(refs)
+        return ret
 
-{% for constructor in model.constructors %}
-def {{constructor.name}}({{constructor_params(constructor)}}):
-{{constructor_len(constructor)}}
-    return _new('{{constructor.name}}', {{constructor_params_call(constructor)}})
+    # the created pointers are owned by the object
+    # a tuple of cdata is untracked by the garbage collector, unlike a list
+    if refs:
+        return _new_owned(ptr_type, init, tuple(refs))[0]
+    return ffi.new(ptr_type, init)[0]
 
-{% endfor %}
 
 
 def _auto_handle(x, _type):
@@ -298,153 +504,40 @@ def _callApi(fn, *args):
     return fn(*fn_args)
 
 
-{# Macro for function parameters #}
-{%- macro params_def(f) -%}
-    {% set members = f.members %}
-    {% set optional_members = [] %}
-
-    {% if f.count %}
-        {% set members = f.members[:-2] %}
-    {% elif f.allocate %}
-        {% set members = f.members[:-1] %}
-        {% set optional_members = [f.members[-1]]%}
-    {% endif %}
-
-    {%- for m in members -%}
-        {{m.name}}
-        ,
-    {%- endfor -%}
-    {%- for m in optional_members -%}
-        {{m.name}}=None
-        ,
-    {%- endfor -%}
-{%- endmacro -%}
-
-{%- macro params_call(f) -%}
-    {%- for m in f.members -%}
-        {{m.name}}
-        {%- if not loop.last -%}
-        ,
-        {%- endif -%}
-    {%- endfor -%}
-{%- endmacro -%}
-
-
-{# Macro that write a function #}
-{% macro fun_allocate(f) %}
-{% set fn_call = 'lib.' ~ f.name %}
-{% if f.is_extension %} {% set fn_call = 'fn' %} {% endif %}
-def {{f.name}}({{params_def(f)}}):
-    {% set rmember = f.return_member %}
-
-    custom_return = True
-    if not {{rmember.name}}:
-        {% if rmember.static_count %}
-        {% set sc = rmember.static_count %}
-        {{rmember.name}} = ffi.new('{{rmember.type}}[%d]' % {{sc}})
-        {% else %}
-        {{rmember.name}} = ffi.new('{{rmember.type}}*')
-        {% endif %}
-        custom_return = False
-
-    result = _callApi({{fn_call}}, {{params_call(f)}})
-    {% if f.return_result %}
-    if result != VK_SUCCESS:
-        raise exception_codes[result]
-    {% endif %}
-
-    if custom_return:
-        return {{rmember.name}}
-
-    {% if not rmember.static_count and not rmember.has_str %}
-    return {{rmember.name}}[0]
-    {% elif not rmember.static_count and rmember.has_str %}
-    return StrWrap({{rmember.name}}[0])
-    {% else %}
-    return {{rmember.name}}
-    {% endif %}
-
-{% endmacro %}
-
-{% macro fun_count(f) %}
-{% set fn_call = 'lib.' ~ f.name %}
-{% if f.is_extension %} {% set fn_call = 'fn' %} {% endif %}
-def {{f.name}}({{params_def(f)}}):
-    {% set cmember = f.members[-2] %}
-    {% set amember = f.members[-1] %}
+def _handle(x, _type):
+    if isinstance(x, ffi.CData):
+        return x
+    if x is None:
+        return ffi.NULL
+    return ffi.cast(_type, x)
 
-    {{cmember.name}} = ffi.new('{{cmember.type}}*')
-    {{amember.name}} = ffi.NULL
 
-    result = _callApi({{fn_call}}, {{params_call(f)}})
-    {% if f.return_result %}
-    if result != VK_SUCCESS:
-        raise exception_codes[result]
-    {% endif %}
+_fn_args = {}
 
-    {{amember.name}} = ffi.new('{{amember.type}}[]', {{cmember.name}}[0])
-    result = _callApi({{fn_call}}, {{params_call(f)}})
-    {% if f.return_result %}
-    if result != VK_SUCCESS:
-        raise exception_codes[result]
-    {% endif %}
-
-    {% if amember.has_str %}
-    result = (StrWrap(x) for x in {{amember.name}})
-    _weakkey_dict[result] = {{amember.name}}
-    return result
-    {% else %}
-    return {{amember.name}}
-    {% endif %}
-{% endmacro %}
-
-{% macro fun_noallocate(f) %}
-{% set fn_call = 'lib.' ~ f.name %}
-{% if f.is_extension %} {% set fn_call = 'fn' %} {% endif %}
-def {{f.name}}({{params_def(f)}}):
-    result = _callApi({{fn_call}}, {{params_call(f)}})
-    {% if f.return_result %}
-    if result != VK_SUCCESS:
-        raise exception_codes[result]
-    {% endif %}
-{% endmacro %}
-
-{% macro fun(f) %}
-{% if f.count %}
-{{fun_count(f)}}
-{% elif f.allocate %}
-{{fun_allocate(f)}}
-{% else %}
-{{fun_noallocate(f)}}
-{% endif %}
-{% endmacro %}
 
+def _arg_types(name, fn):
+    """Cached argument types of a command"""
+    try:
+        return _fn_args[name]
+    except KeyError:
+        args = _fn_args[name] = ffi.typeof(fn).args
+        return args
 
-{# Write functions and extensions functions #}
-{% for f in model.functions %}
-{% if f.is_extension %}
-def _wrap_{{f.name}}(fn):
-  {{fun(f)|indent()}}
-    return {{f.name}}
-{% else %}
-{{fun(f)}}
-{% endif %}
-{% endfor %}
 
 _instance_ext_funcs = {
 {% for k, v in model.ext_functions.instance.items() %}
-    '{{k}}':_wrap_{{v}},
+    '{{k}}':'_wrap_{{v}}',
 {% endfor %}
 {# device functions can be accessed with getInstance.. but it's not the best way #}
 {% for k, v in model.ext_functions.device.items() %}
-    '{{k}}':_wrap_{{v}},
+    '{{k}}':'_wrap_{{v}}',
 {% endfor %}
 }
 
 
 _device_ext_funcs = {
 {% for k, v in model.ext_functions.device.items() %}
-    '{{k}}':_wrap_{{v}},
+    '{{k}}':'_wrap_{{v}}',
 {% endfor %}
 }
 
@@ -456,7 +549,7 @@ def vkGetInstanceProcAddr(instance, pName):
     if not pName in _instance_ext_funcs:
         raise ExtensionNotSupportedError()
     fn = ffi.cast('PFN_' + pName, fn)
-    return _instance_ext_funcs[pName](fn)
+    return getattr(sys.modules[__name__], _instance_ext_funcs[pName])(fn)
 
 
 def vkGetDeviceProcAddr(device, pName):
@@ -466,7 +559,7 @@ def vkGetDeviceProcAddr(device, pName):
     if not pName in _device_ext_funcs:
         raise ExtensionNotSupportedError()
     fn = ffi.cast('PFN_'+pName, fn)
-    return _device_ext_funcs[pName](fn)
+    return getattr(sys.modules[__name__], _device_ext_funcs[pName])(fn)
 
 
 def vkMapMemory(device, memory, offset, size, flags):
@@ -479,6 +572,58 @@ def vkMapMemory(device, memory, offset, size, flags):
     return ffi.buffer(ppData[0], size)
 
 
+def vkGetPipelineCacheData(device, pipelineCache):
+    pDataSize = ffi.new('size_t*')
+
+    # the cache can grow between the two calls
+    result = VK_INCOMPLETE
+    while result == VK_INCOMPLETE:
+        result = _callApi(lib.vkGetPipelineCacheData, device, pipelineCache,
+                          pDataSize, ffi.NULL)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        pData = ffi.new('char[]', pDataSize[0])
+        result = _callApi(lib.vkGetPipelineCacheData, device, pipelineCache,
+                          pDataSize, pData)
+        if result not in (VK_SUCCESS, VK_INCOMPLETE):
+            raise exception_codes[result]
+
+    return ffi.buffer(pData, pDataSize[0])
+
+
+{# Structs and functions are defined in submodules loaded on first access #}
+_lazy_groups = {
+{% for group, names in lazy_groups.items() %}
+    '_vulkan_{{group}}': (
+{% for name in names %}
+        '{{name}}',
+{% endfor %}
+    ),
+{% endfor %}
+}
+_lazy_names = {name: module for module, names in _lazy_groups.items()
+               for name in names}
+
+
+def __getattr__(name):
+    try:
+        module_name = _lazy_names[name]
+    except KeyError:
+        raise AttributeError('module %r has no attribute %r' %
+                             (__name__, name))
+
+    module = _importlib.import_module('vulkan.' + module_name)
+    scope = globals()
+    for n in _lazy_groups[module_name]:
+        scope[n] = getattr(module, n)
+    return scope[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names))
+
+
 {# Alias #}
 {% for name, alias in model.alias.items() %}
 #{{name}} = {{alias}}
@@ -0,0 +1,216 @@
+from vulkan._vulkan import *  # noqa
+from vulkan._vulkan import (ffi, lib, _new, _auto_handle, _handle,
+                            _arg_types, _slice)
+
+
+{# Macro for function parameters #}
+{%- macro constructor_params(c) -%}
+    {%- for m in c.members -%}
+        {%- if m.default -%}
+            {{m.name}}={{m.default}}
+        {%- else -%}
+            {{m.name}}=None
+        {%- endif -%},
+    {%- endfor -%}
+{%- endmacro -%}
+
+{%- macro constructor_params_call(c) -%}
+    {%- for m in c.members -%}
+        {{m.name}}={{m.name}}
+        {%- if not loop.last -%}
+        ,
+        {%- endif -%}
+    {%- endfor -%}
+{%- endmacro -%}
+
+{%- macro constructor_len(c) -%}
+{% for m in c.members %}
+{% if m.len %}
+    if {{m.len}} is None and {{m.name}} is not None:
+        {{m.len}} = len({{m.name}})
+{% endif %}
+{% endfor %}
+{%- endmacro -%}
+
+
+{% for constructor in model.constructors %}
+def {{constructor.name}}({{constructor_params(constructor)}}):
+{{constructor_len(constructor)}}
+    return _new('{{constructor.name}}', {{constructor_params_call(constructor)}})
+
+{% endfor %}
+
+
+{# Macro for function parameters #}
+{%- macro params_def(f) -%}
+    {% set members = f.members %}
+    {% set optional_members = [] %}
+
+    {% if f.count %}
+        {% set members = f.members[:-2] %}
+        {% set optional_members = [f.members[-1]] %}
+    {% elif f.allocate %}
+        {% set members = f.members[:-1] %}
+        {% set optional_members = [f.members[-1]]%}
+    {% endif %}
+
+    {%- for m in members -%}
+        {{m.name}}
+        ,
+    {%- endfor -%}
+    {%- for m in optional_members -%}
+        {{m.name}}=None
+        ,
+    {%- endfor -%}
+{%- endmacro -%}
+
+{%- macro params_call(f) -%}
+    {%- for m in f.members -%}
+        {%- if m.kind == 'handle' -%}
+            _handle({{m.name}}, '{{m.type}}')
+        {%- elif m.kind == 'pointer' -%}
+            _auto_handle({{m.name}}, _args[{{loop.index0}}])
+        {%- else -%}
+            {{m.name}}
+        {%- endif -%}
+        {%- if not loop.last -%}
+        ,
+        {%- endif -%}
+    {%- endfor -%}
+{%- endmacro -%}
+
+{# Argument types of pointer parameters, extensions get them in _wrap_ #}
+{% macro fun_args(f) %}
+{% if f.has_pointer and not f.is_extension %}
+    _args = _arg_types('{{f.name}}', lib.{{f.name}})
+{% endif %}
+{% endmacro %}
+
+
+{# Macro that write a function #}
+{% macro fun_allocate(f) %}
+{% set fn_call = 'lib.' ~ f.name %}
+{% if f.is_extension %} {% set fn_call = 'fn' %} {% endif %}
+def {{f.name}}({{params_def(f)}}):
+    {% set rmember = f.return_member %}
+{{fun_args(f)}}
+
+    custom_return = True
+    if not {{rmember.name}}:
+        {% if rmember.static_count %}
+        {% set sc = rmember.static_count %}
+        {{rmember.name}} = ffi.new('{{rmember.type}}[%d]' % {{sc}})
+        {% else %}
+        {{rmember.name}} = ffi.new('{{rmember.type}}*')
+        {% endif %}
+        custom_return = False
+
+    result = {{fn_call}}({{params_call(f)}})
+    {% if f.return_result %}
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+    {% endif %}
+
+    if custom_return:
+        return {{rmember.name}}
+
+    {% if not rmember.static_count and not rmember.has_str %}
+    return {{rmember.name}}[0]
+    {% elif not rmember.static_count and rmember.has_str %}
+    return StrWrap({{rmember.name}}[0])
+    {% else %}
+    return {{rmember.name}}
+    {% endif %}
+
+{% endmacro %}
+
+{% macro fun_count(f) %}
+{% set fn_call = 'lib.' ~ f.name %}
+{% if f.is_extension %} {% set fn_call = 'fn' %} {% endif %}
+def {{f.name}}({{params_def(f)}}):
+    {% set cmember = f.members[-2] %}
+    {% set amember = f.members[-1] %}
+{{fun_args(f)}}
+
+    {{cmember.name}} = ffi.new('{{cmember.type}}*')
+    custom_return = {{amember.name}} is not None
+    _array = {{amember.name}}
+
+    {% if f.return_result %}
+    if custom_return:
+        # the buffer is usually big enough, one call instead of two
+        {{cmember.name}}[0] = len(_array)
+        result = {{fn_call}}({{params_call(f)}})
+    else:
+        result = VK_INCOMPLETE
+
+    # the count can change between the two calls
+    while result == VK_INCOMPLETE:
+        {{amember.name}} = ffi.NULL
+        result = {{fn_call}}({{params_call(f)}})
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if _array is None or len(_array) < {{cmember.name}}[0]:
+            _array = ffi.new('{{amember.type}}[]', {{cmember.name}}[0])
+        {{amember.name}} = _array
+        result = {{fn_call}}({{params_call(f)}})
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+    {% else %}
+    {{amember.name}} = ffi.NULL
+    {{fn_call}}({{params_call(f)}})
+
+    if _array is None or len(_array) < {{cmember.name}}[0]:
+        _array = ffi.new('{{amember.type}}[]', {{cmember.name}}[0])
+    {{amember.name}} = _array
+    {{fn_call}}({{params_call(f)}})
+    {% endif %}
+
+    if {{cmember.name}}[0] != len(_array):
+        {{amember.name}} = _slice(_array, {{cmember.name}}[0])
+
+    {% if amember.has_str %}
+    if not custom_return:
+        # the generator keeps the array alive
+        return (StrWrap(x) for x in {{amember.name}})
+    {% endif %}
+    return {{amember.name}}
+{% endmacro %}
+
+{% macro fun_noallocate(f) %}
+{% set fn_call = 'lib.' ~ f.name %}
+{% if f.is_extension %} {% set fn_call = 'fn' %} {% endif %}
+def {{f.name}}({{params_def(f)}}):
+{{fun_args(f)}}
+    result = {{fn_call}}({{params_call(f)}})
+    {% if f.return_result %}
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+    {% endif %}
+{% endmacro %}
+
+{% macro fun(f) %}
+{% if f.count %}
+{{fun_count(f)}}
+{% elif f.allocate %}
+{{fun_allocate(f)}}
+{% else %}
+{{fun_noallocate(f)}}
+{% endif %}
+{% endmacro %}
+
+
+{# Write functions and extensions functions #}
+{% for f in model.functions %}
+{% if f.is_extension %}
+def _wrap_{{f.name}}(fn):
+{% if f.has_pointer %}
+    _args = ffi.typeof(fn).args
+{% endif %}
+  {{fun(f)|indent()}}
+    return {{f.name}}
+{% else %}
+{{fun(f)}}
+{% endif %}
+{% endfor %}
@@ -0,0 +1,78 @@
+"""Unwrapped Vulkan commands
+
+Core commands are the cffi functions of the loader and extension commands
+are function pointers resolved once per instance or device. Arguments are
+not converted: pass cdata or values cffi accepts, and keep alive whatever
+they point to. VkResult is returned as an int, no exception is raised.
+"""
+from vulkan._vulkan import ffi, lib
+
+
+_commands = frozenset((
+{% for f in model.functions if not f.is_extension %}
+    '{{f.name}}',
+{% endfor %}
+{% for name in custom_functions %}
+    '{{name}}',
+{% endfor %}
+))
+
+_instance_commands = (
+{% for name in model.ext_functions.instance %}
+    '{{name}}',
+{% endfor %}
+{% for name in model.ext_functions.device %}
+    '{{name}}',
+{% endfor %}
+)
+
+_device_commands = (
+{% for name in model.ext_functions.device %}
+    '{{name}}',
+{% endfor %}
+)
+
+
+def __getattr__(name):
+    if name not in _commands:
+        raise AttributeError('module %r has no attribute %r' %
+                             (__name__, name))
+
+    fn = globals()[name] = getattr(lib, name)
+    return fn
+
+
+def __dir__():
+    return sorted(set(globals()) | _commands)
+
+
+class _ProcTable(object):
+    """Extension commands resolved with a vkGet*ProcAddr function
+
+    Each command returned by the driver is set as an attribute holding the
+    typed function pointer, unsupported ones are left out.
+    """
+    def __init__(self, get_proc_addr, handle, names):
+        for name in names:
+            fn = get_proc_addr(handle, name.encode('ascii'))
+            if fn == ffi.NULL:
+                continue
+            try:
+                setattr(self, name, ffi.cast('PFN_' + name, fn))
+            except ffi.error:
+                # not declared in vulkan.cdef.h
+                pass
+
+
+class InstanceProcs(_ProcTable):
+    """Instance extension commands, `names` defaults to all of them"""
+    def __init__(self, instance, names=None):
+        super(InstanceProcs, self).__init__(
+            lib.vkGetInstanceProcAddr, instance, names or _instance_commands)
+
+
+class DeviceProcs(_ProcTable):
+    """Device extension commands, `names` defaults to all of them"""
+    def __init__(self, device, names=None):
+        super(DeviceProcs, self).__init__(
+            lib.vkGetDeviceProcAddr, device, names or _device_commands)
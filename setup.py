@@ -1,6 +1,14 @@
+import os
+
 from setuptools import setup
 
 
+# The API mode extension needs the loader at build time, so it is opt-in
+cffi_modules = ["vulkan/vulkan_build.py:ffi"]
+if os.environ.get('VULKAN_CFFI_API_MODE'):
+    cffi_modules.append("vulkan/vulkan_build.py:ffi_api")
+
+
 with open("README.md") as file:
     long_description = file.read()
 
@@ -15,7 +23,8 @@ setup(
     long_descripiton=long_description,
     long_description_content_type="text/markdown",
     include_package_data=True,
-    install_requires=['cffi>=1.10'],
+    install_requires=['cffi>=1.12'],
+    extras_require={'numpy': ['numpy']},
     setup_requires=['cffi>=1.10'],
     url='https://github.com/realitix/vulkan',
     keywords='Graphics,3D,Vulkan,cffi',
@@ -31,5 +40,5 @@ setup(
         "Topic :: Scientific/Engineering",
         "Topic :: Software Development :: Libraries :: Python Modules",
     ],
-    cffi_modules=["vulkan/vulkan_build.py:ffi"]
+    cffi_modules=cffi_modules
 )
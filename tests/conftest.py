@@ -0,0 +1,256 @@
+"""Fake device for the tests of the memory modules
+
+Host memory stands for device memory: the commands used by vulkan.memory,
+vulkan.allocator, vulkan.ring and vulkan.upload are replaced by Python
+functions recording the calls, so these tests run with any loader (the
+no-op one of benchmark/stub.py included).
+"""
+import pytest
+
+from vulkan import _vulkan, memory, ring
+from vulkan._vulkan import ffi
+from vulkan.query_cache import _address, _cache
+
+
+HOST_VISIBLE = _vulkan.VK_MEMORY_PROPERTY_HOST_VISIBLE_BIT
+HOST_COHERENT = _vulkan.VK_MEMORY_PROPERTY_HOST_COHERENT_BIT
+DEVICE_LOCAL = _vulkan.VK_MEMORY_PROPERTY_DEVICE_LOCAL_BIT
+
+
+def _key(handle):
+    return int(ffi.cast('uintptr_t', handle))
+
+
+class _Lib(object):
+    """Raw commands called through lib by vulkan.memory and vulkan.ring"""
+    def __init__(self, device):
+        self.device = device
+
+    def vkMapMemory(self, device, memory, offset, size, flags, ppData):
+        ppData[0] = self.device.memories[_key(memory)] + offset
+        return _vulkan.VK_SUCCESS
+
+    def vkUnmapMemory(self, device, memory):
+        self.device.unmapped.append(_key(memory))
+
+    def vkFlushMappedMemoryRanges(self, device, count, ranges):
+        self.device.flushed.append(
+            [(_key(r.memory), r.offset, r.size) for r in ranges[0:count]])
+        return _vulkan.VK_SUCCESS
+
+    def vkInvalidateMappedMemoryRanges(self, device, count, ranges):
+        self.device.invalidated.append(
+            [(_key(r.memory), r.offset, r.size) for r in ranges[0:count]])
+        return _vulkan.VK_SUCCESS
+
+    def vkGetFenceStatus(self, device, fence):
+        if _key(fence) in self.device.signaled:
+            return _vulkan.VK_SUCCESS
+        return _vulkan.VK_NOT_READY
+
+    def vkWaitForFences(self, device, count, pFences, waitAll, timeout):
+        self.device.vkWaitForFences(device, count, pFences[0:count],
+                                    waitAll, timeout)
+        return _vulkan.VK_SUCCESS
+
+
+class FakeDevice(object):
+    """Device with memory types of the given property flags
+
+    Fences signal when they are waited for, or with `signal`.
+    """
+    def __init__(self, flags, atom=64, granularity=1, copy_alignment=16,
+                 alignment=256, heap_size=1 << 30):
+        self.flags = flags
+        self.atom = atom
+        self.granularity = granularity
+        self.copy_alignment = copy_alignment
+        self.alignment = alignment
+        self.heap_size = heap_size
+        self.handle = ffi.cast('VkDevice', 0x10)
+        self.physical_device = ffi.cast('VkPhysicalDevice', 0x20)
+        self.lib = _Lib(self)
+
+        self._next = 0x1000
+        # {memory: char[]}, {buffer: size}, {image: size},
+        # {buffer or image: (memory, offset)}
+        self.memories = {}
+        self.buffers = {}
+        self.images = {}
+        self.bound = {}
+        self.freed = []
+        self.unmapped = []
+        # [(memory, offset, size)] per call
+        self.flushed = []
+        self.invalidated = []
+        self.signaled = set()
+        self.waited = []
+        # [(dst, [(srcOffset, dstOffset, bytes)])] and
+        # [(image, layout, [(bufferOffset, y, height, layer)])] submitted
+        self.buffer_copies = []
+        self.image_copies = []
+        self.submits = 0
+        self._recorded = {}
+
+    def _new(self, ctype):
+        self._next += 0x10
+        return ffi.cast(ctype, self._next)
+
+    def signal(self, fence):
+        self.signaled.add(_key(fence))
+
+    def image(self, size):
+        """New VkImage of size bytes"""
+        image = self._new('VkImage')
+        self.images[_key(image)] = size
+        return image
+
+    def install(self, monkeypatch):
+        monkeypatch.setattr(memory, 'lib', self.lib)
+        monkeypatch.setattr(ring, 'lib', self.lib)
+        for name in dir(self):
+            if name.startswith('vk'):
+                # loads the group first, it would replace the fake
+                getattr(_vulkan, name)
+                monkeypatch.setattr(_vulkan, name, getattr(self, name))
+
+    # queries
+
+    def vkGetPhysicalDeviceProperties(self, physicalDevice):
+        properties = ffi.new('VkPhysicalDeviceProperties*')[0]
+        properties.apiVersion = _vulkan.VK_API_VERSION_1_0
+        limits = properties.limits
+        limits.nonCoherentAtomSize = self.atom
+        limits.bufferImageGranularity = self.granularity
+        limits.optimalBufferCopyOffsetAlignment = self.copy_alignment
+        return properties
+
+    def vkGetPhysicalDeviceMemoryProperties(self, physicalDevice):
+        properties = ffi.new('VkPhysicalDeviceMemoryProperties*')[0]
+        properties.memoryTypeCount = len(self.flags)
+        for i, flags in enumerate(self.flags):
+            properties.memoryTypes[i].propertyFlags = flags
+        properties.memoryHeapCount = 1
+        properties.memoryHeaps[0].size = self.heap_size
+        return properties
+
+    def _requirements(self, size):
+        requirements = ffi.new('VkMemoryRequirements*')[0]
+        requirements.size = -(-size // self.alignment) * self.alignment
+        requirements.alignment = self.alignment
+        requirements.memoryTypeBits = (1 << len(self.flags)) - 1
+        return requirements
+
+    def vkGetBufferMemoryRequirements(self, device, buffer):
+        return self._requirements(self.buffers[_key(buffer)])
+
+    def vkGetImageMemoryRequirements(self, device, image):
+        return self._requirements(self.images[_key(image)])
+
+    # memory
+
+    def vkAllocateMemory(self, device, pAllocateInfo, pAllocator):
+        memory = self._new('VkDeviceMemory')
+        self.memories[_key(memory)] = ffi.new('char[]',
+                                              pAllocateInfo.allocationSize)
+        return memory
+
+    def vkFreeMemory(self, device, memory, pAllocator):
+        del self.memories[_key(memory)]
+        self.freed.append(_key(memory))
+
+    def vkCreateBuffer(self, device, pCreateInfo, pAllocator):
+        buffer = self._new('VkBuffer')
+        self.buffers[_key(buffer)] = pCreateInfo.size
+        return buffer
+
+    def vkDestroyBuffer(self, device, buffer, pAllocator):
+        del self.buffers[_key(buffer)]
+
+    def vkBindBufferMemory(self, device, buffer, memory, memoryOffset):
+        self.bound[_key(buffer)] = (_key(memory), memoryOffset)
+
+    def vkBindImageMemory(self, device, image, memory, memoryOffset):
+        self.bound[_key(image)] = (_key(memory), memoryOffset)
+
+    # synchronization
+
+    def vkCreateFence(self, device, pCreateInfo, pAllocator):
+        fence = self._new('VkFence')
+        if pCreateInfo.flags & _vulkan.VK_FENCE_CREATE_SIGNALED_BIT:
+            self.signal(fence)
+        return fence
+
+    def vkDestroyFence(self, device, fence, pAllocator):
+        self.signaled.discard(_key(fence))
+
+    def vkResetFences(self, device, fenceCount, pFences):
+        for fence in pFences:
+            self.signaled.discard(_key(fence))
+
+    def vkWaitForFences(self, device, fenceCount, pFences, waitAll,
+                        timeout):
+        for fence in pFences:
+            self.waited.append(_key(fence))
+            self.signal(fence)
+
+    # commands
+
+    def vkCreateCommandPool(self, device, pCreateInfo, pAllocator):
+        return self._new('VkCommandPool')
+
+    def vkDestroyCommandPool(self, device, commandPool, pAllocator):
+        pass
+
+    def vkAllocateCommandBuffers(self, device, pAllocateInfo):
+        return [self._new('VkCommandBuffer')
+                for _ in range(pAllocateInfo.commandBufferCount)]
+
+    def vkResetCommandBuffer(self, commandBuffer, flags):
+        self._recorded[_key(commandBuffer)] = ([], [])
+
+    def vkBeginCommandBuffer(self, commandBuffer, pBeginInfo):
+        self._recorded.setdefault(_key(commandBuffer), ([], []))
+
+    def vkEndCommandBuffer(self, commandBuffer):
+        pass
+
+    def _staging(self, buffer, offset, size):
+        memory, memory_offset = self.bound[_key(buffer)]
+        start = memory_offset + offset
+        return ffi.buffer(self.memories[memory], start + size)[start:]
+
+    def vkCmdCopyBuffer(self, commandBuffer, srcBuffer, dstBuffer,
+                        regionCount, pRegions):
+        self._recorded[_key(commandBuffer)][0].append((_key(dstBuffer), [
+            (r.srcOffset, r.dstOffset,
+             self._staging(srcBuffer, r.srcOffset, r.size))
+            for r in pRegions[:regionCount]]))
+
+    def vkCmdCopyBufferToImage(self, commandBuffer, srcBuffer, dstImage,
+                               dstImageLayout, regionCount, pRegions):
+        self._recorded[_key(commandBuffer)][1].append(
+            (_key(dstImage), dstImageLayout, [
+                (r.bufferOffset, r.imageOffset.y, r.imageExtent.height,
+                 r.imageSubresource.baseArrayLayer)
+                for r in pRegions[:regionCount]]))
+
+    def vkQueueSubmit(self, queue, submitCount, pSubmits, fence):
+        for submit in pSubmits:
+            for i in range(submit.commandBufferCount):
+                buffers, images = self._recorded.pop(
+                    _key(submit.pCommandBuffers[i]))
+                self.buffer_copies.extend(buffers)
+                self.image_copies.extend(images)
+        self.submits += 1
+
+
+@pytest.fixture
+def fake_device(monkeypatch):
+    """FakeDevice with a DEVICE_LOCAL, a HOST_VISIBLE (not coherent) and a
+    HOST_VISIBLE | HOST_COHERENT memory type"""
+    device = FakeDevice([DEVICE_LOCAL, HOST_VISIBLE,
+                         HOST_VISIBLE | HOST_COHERENT])
+    device.install(monkeypatch)
+    yield device
+    _cache.pop(_address(device.physical_device), None)
@@ -0,0 +1,152 @@
+"""Ranges of vulkan.allocator"""
+import random
+
+import pytest
+
+from conftest import DEVICE_LOCAL, HOST_VISIBLE, HOST_COHERENT, _key
+from vulkan import _vulkan
+from vulkan.allocator import Allocator, _TLSF, _bucket, _search_bucket
+
+
+def test_buckets():
+    sizes = list(range(1, 5000)) + [1 << 20, (1 << 20) + 1, 3 << 30]
+    for size in sizes:
+        assert _bucket(size - 1) <= _bucket(size)
+        # the ranges of the class found for size are all big enough
+        assert _bucket(size - 1) < _search_bucket(size) <= _bucket(size) + 1
+
+
+def test_alloc_free():
+    ranges = _TLSF(1024)
+    allocated = [(ranges.alloc(size), size) for size in (100, 200, 300)]
+    allocated.sort()
+    assert allocated[0][0] >= 0
+    assert all(a + size <= b for (a, size), (b, _) in zip(allocated,
+                                                         allocated[1:]))
+    assert allocated[-1][0] + allocated[-1][1] <= 1024
+    assert ranges.used == 600 and ranges.count == 3
+    assert ranges.alloc(1000) is None
+
+    offset = allocated[1][0]
+    ranges.free(offset)
+    with pytest.raises(ValueError):
+        ranges.free(offset)
+    assert ranges.used == 400 and ranges.count == 2
+    assert ranges.alloc(200) is not None
+
+
+def test_alignment():
+    ranges = _TLSF(1 << 16)
+    ranges.alloc(3)
+    for alignment in (1, 4, 256, 1024, 4096):
+        offset = ranges.alloc(10, alignment)
+        assert offset % alignment == 0
+    assert ranges.alloc(4096, 1 << 16) is None
+
+
+def test_coalescing():
+    ranges = _TLSF(1 << 20)
+    rng = random.Random(7)
+    live = []
+    for _ in range(2000):
+        if live and rng.random() < 0.45:
+            ranges.free(live.pop(rng.randrange(len(live))))
+        else:
+            offset = ranges.alloc(rng.randrange(1, 4096),
+                                  1 << rng.randrange(9))
+            if offset is not None:
+                live.append(offset)
+    for offset in live:
+        ranges.free(offset)
+
+    # back to a single free range
+    assert ranges.free_ranges() == [1 << 20]
+    assert ranges.used == 0 and ranges.count == 0
+    assert ranges.alloc(1 << 20) == 0
+
+
+@pytest.fixture
+def allocator(fake_device):
+    fake_device.granularity = 1024
+    allocator = Allocator(fake_device.handle, fake_device.physical_device,
+                          block_size=1 << 16)
+    yield allocator
+    allocator.destroy()
+
+
+def _buffer(device, size):
+    return _vulkan.vkCreateBuffer(device.handle, _vulkan.VkBufferCreateInfo(
+        size=size), None)
+
+
+def test_bind_buffer(fake_device, allocator):
+    buffers = [_buffer(fake_device, 1000) for _ in range(3)]
+    allocations = [allocator.bind_buffer(b, DEVICE_LOCAL) for b in buffers]
+    assert len({a.memory for a in allocations}) == 1
+    assert len(fake_device.memories) == 1
+    for buffer, allocation in zip(buffers, allocations):
+        assert allocation.memory_type == 0
+        assert allocation.offset % 256 == 0
+        assert fake_device.bound[_key(buffer)] == (
+            _key(allocation.memory), allocation.offset)
+    offsets = sorted(a.offset for a in allocations)
+    assert all(b - a >= 1024 for a, b in zip(offsets, offsets[1:]))
+
+    statistics = allocator.statistics()
+    assert statistics.blocks == 1
+    assert statistics.allocations == 3
+    assert statistics.used_bytes == 3 * 1024
+
+    for allocation in allocations:
+        allocator.free(allocation)
+    # the last block of a memory type is kept
+    assert allocator.statistics().allocations == 0
+    assert allocator.statistics().blocks == 1
+    assert not fake_device.freed
+
+
+def test_linear_and_optimal_blocks(fake_device, allocator):
+    buffer = allocator.bind_buffer(_buffer(fake_device, 100))
+    image = allocator.bind_image(fake_device.image(100))
+    linear_image = allocator.bind_image(fake_device.image(100), linear=True)
+    assert buffer.memory != image.memory
+    assert buffer.memory == linear_image.memory
+
+
+def test_dedicated_blocks(fake_device, allocator):
+    allocation = allocator.bind_buffer(_buffer(fake_device, 40000))
+    assert allocator.statistics().block_bytes == 40192
+    allocator.free(allocation)
+    assert fake_device.freed == [_key(allocation.memory)]
+    assert allocator.statistics().blocks == 0
+
+
+def test_new_blocks(fake_device, allocator):
+    allocations = [allocator.bind_buffer(_buffer(fake_device, 30000))
+                   for _ in range(4)]
+    assert allocator.statistics().blocks == 2
+    for allocation in allocations[:2]:
+        allocator.free(allocation)
+    assert len(fake_device.freed) == 1
+
+
+def test_mapped(fake_device, allocator):
+    a = allocator.bind_buffer(_buffer(fake_device, 100), HOST_VISIBLE,
+                              HOST_COHERENT)
+    b = allocator.bind_buffer(_buffer(fake_device, 100), HOST_VISIBLE,
+                              HOST_COHERENT)
+    assert a.memory_type == 2
+    assert a.mapped() is b.mapped()
+    a.mapped().write(a.offset, b'abc')
+    assert a.mapped().read(a.offset, 3) == b'abc'
+    assert not fake_device.flushed
+
+    allocator.destroy()
+    assert fake_device.unmapped == [_key(a.memory)]
+    assert not fake_device.memories
+
+
+def test_no_memory_type(fake_device, allocator):
+    with pytest.raises(ValueError):
+        allocator.bind_buffer(_buffer(fake_device, 100),
+                              DEVICE_LOCAL | HOST_VISIBLE)
@@ -0,0 +1,44 @@
+"""Lifetime of the structs of vulkan.arena"""
+from vulkan.arena import Arena
+import vulkan as vk
+
+
+def test_reset_on_exit():
+    arena = Arena(256)
+    with arena:
+        vk.VkExtent2D(width=1, height=2)
+        vk.VkExtent2D(width=3, height=4)
+        assert arena.offset == 16
+    assert arena.offset == 0
+
+
+def test_reentry_keeps_outer_structs():
+    arena = Arena(256)
+    with arena:
+        outer = vk.VkExtent2D(width=1, height=2)
+        with arena:
+            inner = vk.VkExtent2D(width=3, height=4)
+        assert (outer.width, outer.height) == (1, 2)
+        assert (inner.width, inner.height) == (3, 4)
+        assert arena.offset == 16
+    assert arena.offset == 0
+
+
+def test_nested_arenas():
+    outer, inner = Arena(256), Arena(256)
+    with outer:
+        vk.VkExtent2D(width=1, height=2)
+        with inner:
+            vk.VkExtent2D(width=3, height=4)
+            assert inner.offset == 8
+        vk.VkExtent2D(width=5, height=6)
+        assert outer.offset == 16
+    assert outer.offset == 0
+
+
+def test_full_block():
+    arena = Arena(16)
+    with arena:
+        extents = [vk.VkExtent2D(width=i, height=i) for i in range(10)]
+        assert [e.width for e in extents] == list(range(10))
+    assert arena.size >= 80
@@ -0,0 +1,67 @@
+"""VK_INCOMPLETE retries and caller arrays of the count commands"""
+import pytest
+
+from vulkan import _vulkan_1_0
+from vulkan._vulkan import ffi
+import vulkan as vk
+
+
+class _Lib(object):
+    """vkEnumerateDeviceLayerProperties whose count grows once"""
+    def __init__(self, counts):
+        self.counts = list(counts)
+        self.calls = []
+
+    def vkEnumerateDeviceLayerProperties(self, physicalDevice,
+                                         pPropertyCount, pProperties):
+        count = self.counts[0] if len(self.counts) == 1 else \
+            self.counts.pop(0)
+        self.calls.append(pProperties == ffi.NULL)
+        if pProperties == ffi.NULL:
+            pPropertyCount[0] = count
+            return vk.VK_SUCCESS
+        written = min(count, pPropertyCount[0])
+        for i in range(written):
+            pProperties[i].layerName = b'layer %d' % i
+        pPropertyCount[0] = written
+        return vk.VK_SUCCESS if written == count else vk.VK_INCOMPLETE
+
+
+@pytest.fixture
+def fake_lib(monkeypatch):
+    def install(*counts):
+        lib = _Lib(counts)
+        monkeypatch.setattr(_vulkan_1_0, 'lib', lib)
+        return lib
+    return install
+
+
+_DEVICE = ffi.cast('VkPhysicalDevice', 0x60)
+
+
+def test_count_grows(fake_lib):
+    # 2 layers when counted, 3 when listed, then 3
+    lib = fake_lib(2, 3, 3, 3)
+    layers = list(_vulkan_1_0.vkEnumerateDeviceLayerProperties(_DEVICE))
+    assert [layer.layerName for layer in layers] == [
+        'layer 0', 'layer 1', 'layer 2']
+    assert lib.calls == [True, False, True, False]
+
+
+def test_caller_array(fake_lib):
+    lib = fake_lib(3)
+    array = ffi.new('VkLayerProperties[]', 4)
+    result = _vulkan_1_0.vkEnumerateDeviceLayerProperties(_DEVICE, array)
+    assert lib.calls == [False]
+    assert len(result) == 3
+    assert ffi.string(result[2].layerName) == b'layer 2'
+    assert ffi.string(array[2].layerName) == b'layer 2'
+
+
+def test_caller_array_too_small(fake_lib):
+    lib = fake_lib(3)
+    array = ffi.new('VkLayerProperties[]', 1)
+    result = _vulkan_1_0.vkEnumerateDeviceLayerProperties(_DEVICE, array)
+    assert lib.calls == [False, True, False]
+    assert len(result) == 3
+    assert ffi.string(result[2].layerName) == b'layer 2'
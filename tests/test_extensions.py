@@ -0,0 +1,47 @@
+"""Decoded strings of StrWrap and vulkan.extensions"""
+import pytest
+
+from vulkan import _vulkan, extensions
+from vulkan._vulkan import ffi, StrWrap
+from vulkan.query_cache import _address, _cache
+
+
+def test_strwrap_decodes_once():
+    properties = ffi.new('VkExtensionProperties*', {
+        'extensionName': b'VK_KHR_swapchain', 'specVersion': 70})[0]
+    wrapped = StrWrap(properties)
+    assert wrapped.extensionName == 'VK_KHR_swapchain'
+    assert wrapped.extensionName is wrapped.extensionName
+    assert wrapped.specVersion == 70
+    assert ffi.string(wrapped._extensionName) == b'VK_KHR_swapchain'
+
+    wrapped.extensionName = b'VK_KHR_maintenance1'
+    assert wrapped.extensionName == 'VK_KHR_maintenance1'
+    with pytest.raises(AttributeError):
+        wrapped.missing
+
+
+_DEVICE = ffi.cast('VkPhysicalDevice', 0x80)
+
+
+def test_device_extension_names(monkeypatch):
+    calls = []
+
+    def vkEnumerateDeviceExtensionProperties(physicalDevice, pLayerName,
+                                             pProperties=None):
+        calls.append(pLayerName)
+        return ffi.new('VkExtensionProperties[]', [
+            {'extensionName': b'VK_KHR_swapchain'},
+            {'extensionName': b'VK_EXT_memory_budget'}])
+
+    # loads the group first, it would replace the fake
+    _vulkan.vkEnumerateDeviceExtensionProperties
+    monkeypatch.setattr(_vulkan, 'vkEnumerateDeviceExtensionProperties',
+                        vkEnumerateDeviceExtensionProperties)
+    try:
+        names = extensions.device_extension_names(_DEVICE)
+        assert names == {'VK_KHR_swapchain', 'VK_EXT_memory_budget'}
+        assert extensions.device_extension_names(_DEVICE) is names
+        assert calls == [None]
+    finally:
+        _cache.pop(_address(_DEVICE), None)
@@ -0,0 +1,81 @@
+"""Queries of vulkan.formats.format_table"""
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from vulkan import formats
+from vulkan._vulkan import ffi
+from vulkan.query_cache import _address, _cache
+import vulkan as vk
+
+
+SAMPLED = vk.VK_FORMAT_FEATURE_SAMPLED_IMAGE_BIT
+RGBA = vk.VK_FORMAT_R8G8B8A8_UNORM
+
+
+class _Lib(object):
+    """Device of apiVersion 1.1 sampling RGBA only, recording the calls"""
+    def __init__(self):
+        self.calls = set()
+
+    def vkGetPhysicalDeviceProperties(self, physicalDevice, pProperties):
+        pProperties.apiVersion = vk.VK_MAKE_VERSION(1, 1, 0)
+
+    def _features(self, format, properties):
+        if format == RGBA:
+            properties.optimalTilingFeatures = SAMPLED
+
+    def vkGetPhysicalDeviceFormatProperties(self, physicalDevice, format,
+                                            pFormatProperties):
+        self.calls.add('vkGetPhysicalDeviceFormatProperties')
+        self._features(format, pFormatProperties)
+
+    def vkGetPhysicalDeviceFormatProperties2(self, physicalDevice, format,
+                                             pFormatProperties):
+        self.calls.add('vkGetPhysicalDeviceFormatProperties2')
+        self._features(format, pFormatProperties.formatProperties)
+
+    def vkGetPhysicalDeviceImageFormatProperties(
+            self, physicalDevice, format, type, tiling, usage, flags,
+            pImageFormatProperties):
+        self.calls.add('vkGetPhysicalDeviceImageFormatProperties')
+        return (vk.VK_SUCCESS if format == RGBA
+                else vk.VK_ERROR_FORMAT_NOT_SUPPORTED)
+
+    def vkGetPhysicalDeviceImageFormatProperties2(
+            self, physicalDevice, pImageFormatInfo, pImageFormatProperties):
+        self.calls.add('vkGetPhysicalDeviceImageFormatProperties2')
+        return (vk.VK_SUCCESS if pImageFormatInfo.format == RGBA
+                else vk.VK_ERROR_FORMAT_NOT_SUPPORTED)
+
+
+@pytest.fixture
+def fake_lib(monkeypatch):
+    lib = _Lib()
+    monkeypatch.setattr(formats, 'lib', lib)
+    yield lib
+    _cache.pop(_address(_DEVICE), None)
+
+
+_DEVICE = ffi.cast('VkPhysicalDevice', 0x30)
+_IMAGES = [(vk.VK_IMAGE_TILING_OPTIMAL, vk.VK_IMAGE_USAGE_SAMPLED_BIT)]
+
+
+def test_table(fake_lib):
+    table = formats.format_table(_DEVICE, _IMAGES)
+    assert table.select(optimal=SAMPLED).tolist() == [RGBA]
+    assert table.select(images=[0]).tolist() == [RGBA]
+    assert table[RGBA]['optimal'] == SAMPLED
+    assert formats.format_table(_DEVICE, _IMAGES) is table
+
+
+def test_instance_version_1_0(fake_lib):
+    formats.format_table(_DEVICE, _IMAGES)
+    assert fake_lib.calls == {'vkGetPhysicalDeviceFormatProperties',
+                              'vkGetPhysicalDeviceImageFormatProperties'}
+
+
+def test_instance_version_1_1(fake_lib):
+    formats.format_table(_DEVICE, _IMAGES, vk.VK_MAKE_VERSION(1, 1, 0))
+    assert fake_lib.calls == {'vkGetPhysicalDeviceFormatProperties2',
+                              'vkGetPhysicalDeviceImageFormatProperties2'}
@@ -0,0 +1,56 @@
+"""Keys of vulkan.hashing.content_hash"""
+from vulkan import hashing
+from vulkan._vulkan import ffi
+import vulkan as vk
+
+
+def test_equal_content():
+    a = vk.VkSamplerCreateInfo(magFilter=vk.VK_FILTER_LINEAR, maxLod=4.)
+    b = vk.VkSamplerCreateInfo(magFilter=vk.VK_FILTER_LINEAR, maxLod=4.)
+    c = vk.VkSamplerCreateInfo(magFilter=vk.VK_FILTER_NEAREST, maxLod=4.)
+    assert hashing.content_hash(a) == hashing.content_hash(b)
+    assert hashing.content_hash(a) != hashing.content_hash(c)
+
+
+def test_union_pointers_not_followed():
+    info = vk.VkDescriptorGetInfoEXT(
+        type=vk.VK_DESCRIPTOR_TYPE_ACCELERATION_STRUCTURE_KHR)
+    info.data.accelerationStructure = 0x10
+    key = hashing.content_hash(info)
+    info.data.accelerationStructure = 0x20
+    assert hashing.content_hash(info) != key
+
+    value = ffi.new('VkPerformanceValueINTEL*')[0]
+    value.type = vk.VK_PERFORMANCE_VALUE_TYPE_UINT64_INTEL
+    value.data.value64 = 0x10
+    hashing.content_hash(value)
+
+
+def test_formula_lengths():
+    keys = set()
+    for mask in ([1, 0], [1, 2], [3, 2]):
+        info = vk.VkPipelineMultisampleStateCreateInfo(
+            rasterizationSamples=64, pSampleMask=mask)
+        keys.add(hashing.content_hash(info))
+    assert len(keys) == 3
+
+    # a single word with 4 samples, the rest of the list is not used
+    a = vk.VkPipelineMultisampleStateCreateInfo(
+        rasterizationSamples=vk.VK_SAMPLE_COUNT_4_BIT, pSampleMask=[1, 2])
+    b = vk.VkPipelineMultisampleStateCreateInfo(
+        rasterizationSamples=vk.VK_SAMPLE_COUNT_4_BIT, pSampleMask=[1, 3])
+    assert hashing.content_hash(a) == hashing.content_hash(b)
+
+
+def test_object_cache():
+    created = []
+
+    def create(info):
+        created.append(info)
+        return len(created)
+
+    cache = hashing.ObjectCache(create)
+    assert cache.get(vk.VkSamplerCreateInfo(maxLod=1.)) == 1
+    assert cache.get(vk.VkSamplerCreateInfo(maxLod=1.)) == 1
+    assert cache.get(vk.VkSamplerCreateInfo(maxLod=2.)) == 2
+    assert len(cache) == 2
@@ -0,0 +1,69 @@
+"""Objects kept alive by the structs and arrays pointing to them"""
+import gc
+import weakref
+
+from vulkan._vulkan import ffi, _new_owned, _slice
+import vulkan as vk
+
+
+class _Ref(object):
+    pass
+
+
+def _render_pass():
+    attachment = vk.VkAttachmentDescription(
+        format=vk.VK_FORMAT_B8G8R8A8_UNORM)
+    color = vk.VkAttachmentReference(attachment=0)
+    return vk.VkRenderPassCreateInfo(
+        pAttachments=[attachment],
+        pSubpasses=[vk.VkSubpassDescription(pColorAttachments=[color])])
+
+
+def test_struct_owns_arrays():
+    info = _render_pass()
+    # freed arrays would be reused by the next structs
+    for _ in range(3):
+        [_render_pass() for _ in range(100)]
+        gc.collect()
+    assert info.pAttachments[0].format == vk.VK_FORMAT_B8G8R8A8_UNORM
+    subpass = info.pSubpasses[0]
+    assert subpass.colorAttachmentCount == 1
+    assert subpass.pColorAttachments[0].attachment == 0
+
+
+def test_pointer_array():
+    names = ['VK_KHR_surface', 'VK_KHR_swapchain']
+    info = vk.VkInstanceCreateInfo(ppEnabledExtensionNames=names)
+    [vk.VkInstanceCreateInfo(ppEnabledExtensionNames=['x' * 14] * 2)
+     for _ in range(100)]
+    gc.collect()
+    assert [ffi.string(info.ppEnabledExtensionNames[i]).decode()
+            for i in range(2)] == names
+
+
+def test_released_with_owner():
+    ref = _Ref()
+    alive = weakref.ref(ref)
+    struct = _new_owned('VkExtent2D*', {'width': 3}, (ref,))[0]
+    del ref
+    gc.collect()
+    assert alive() is not None
+    assert struct.width == 3
+
+    # the owner of the next allocation is not inherited
+    plain = _new_owned('VkExtent2D*', {}, None)[0]
+    del struct
+    gc.collect()
+    assert alive() is None
+    assert plain.width == 0
+
+
+def test_slice():
+    array = ffi.new('VkExtent2D[]', [(i, i + 1) for i in range(4)])
+    view = _slice(array, 2)
+    assert len(view) == 2
+    assert ffi.typeof(view) is ffi.typeof('VkExtent2D[]')
+    del array
+    gc.collect()
+    assert [(e.width, e.height) for e in view] == [(0, 1), (1, 2)]
+    assert len(_slice(ffi.new('VkExtent2D[]', 1), 0)) == 0
@@ -0,0 +1,101 @@
+"""Flushed ranges and memory types of vulkan.memory"""
+import pytest
+
+from conftest import DEVICE_LOCAL, HOST_VISIBLE, HOST_COHERENT, _key
+from vulkan import _vulkan
+from vulkan.memory import (MappedMemory, MappedRanges, memory_types,
+                           _aligned_range, _WHOLE_SIZE)
+
+
+HOST_CACHED = _vulkan.VK_MEMORY_PROPERTY_HOST_CACHED_BIT
+
+
+def test_aligned_range():
+    # mapping [128, 1128) of 4096 bytes, atom of 64
+    assert _aligned_range(130, 140, 64, 128, 1128, 4096) == (128, 64)
+    assert _aligned_range(200, 300, 64, 128, 1128, 4096) == (192, 128)
+    # the mapping ends neither on an atom nor at the end of the memory
+    assert _aligned_range(1100, 1128, 64, 128, 1128, 4096) == (1088, 64)
+    assert _aligned_range(1100, 1128, 64, 128, 1152, 4096) == \
+        (1088, _WHOLE_SIZE)
+    # the memory ends off an atom
+    assert _aligned_range(4000, 4090, 64, 0, 4090, 4090) == \
+        (3968, _WHOLE_SIZE)
+
+
+def test_aligned_range_start_in_mapping():
+    assert _aligned_range(100, 110, 64, 96, 1024, 4096) == (96, 32)
+
+
+def _mapped(device, size=4096, flags=HOST_VISIBLE, **kwargs):
+    memory = _vulkan.vkAllocateMemory(
+        device.handle, _vulkan.VkMemoryAllocateInfo(
+            allocationSize=kwargs.get('allocationSize', size)), None)
+    return MappedMemory(device.handle, memory, size, flags, device.atom,
+                        **kwargs)
+
+
+def test_write_flushes(fake_device):
+    mapped = _mapped(fake_device)
+    mapped.write(100, b'abc')
+    assert mapped.read(100, 3) == b'abc'
+    memory = _key(mapped.memory)
+    assert fake_device.flushed == [[(memory, 64, 64)]]
+    assert fake_device.invalidated == [[(memory, 64, 64)]]
+
+    mapped.flush(4000)
+    assert fake_device.flushed[-1] == [(memory, 3968, _WHOLE_SIZE)]
+
+    coherent = _mapped(fake_device, flags=HOST_VISIBLE | HOST_COHERENT)
+    coherent.write(0, b'abc')
+    assert len(fake_device.flushed) == 2
+
+
+def test_partial_mapping(fake_device):
+    mapped = _mapped(fake_device, 1000, offset=128, allocationSize=4096)
+    memory = _key(mapped.memory)
+    mapped.flush(990, 10)
+    assert fake_device.flushed[-1] == [(memory, 1088, 64)]
+    mapped.flush()
+    assert fake_device.flushed[-1] == [(memory, 128, 1024)]
+
+
+def test_merged_ranges(fake_device):
+    a = _mapped(fake_device)
+    b = _mapped(fake_device, 1000, offset=128, allocationSize=4096)
+    coherent = _mapped(fake_device, flags=HOST_VISIBLE | HOST_COHERENT)
+    ranges = MappedRanges()
+    for offset in (300, 10, 100, 70, 1000, 1063):
+        ranges.add(a, offset, 4)
+    ranges.add(b, 990, 10)
+    ranges.add(b, 0, 1)
+    ranges.add(coherent, 0, 100)
+    assert len(ranges) == 8
+
+    ranges.flush()
+    assert len(ranges) == 0
+    assert len(fake_device.flushed) == 1
+    a, b = _key(a.memory), _key(b.memory)
+    assert sorted(fake_device.flushed[0]) == sorted([
+        (a, 0, 128), (a, 256, 64), (a, 960, 128),
+        (b, 128, 64), (b, 1088, 64)])
+
+    ranges.flush()
+    assert len(fake_device.flushed) == 1
+
+
+def test_memory_types(fake_device):
+    fake_device.flags = [DEVICE_LOCAL, HOST_VISIBLE | HOST_COHERENT,
+                         HOST_VISIBLE | HOST_COHERENT | DEVICE_LOCAL,
+                         HOST_VISIBLE | HOST_COHERENT | HOST_CACHED]
+    types = memory_types(fake_device.physical_device)
+    assert memory_types(fake_device.physical_device) is types
+
+    # the fewest flags not asked for
+    assert types.find(0xf, HOST_VISIBLE) == 1
+    assert types.find(0xf, HOST_VISIBLE, DEVICE_LOCAL) == 2
+    assert types.find(0xf, HOST_VISIBLE, HOST_CACHED) == 3
+    assert types.find(0xd, HOST_VISIBLE) == 2
+    assert types.candidates(0xf, DEVICE_LOCAL) == (0, 2)
+    with pytest.raises(ValueError):
+        types.find(0x1, HOST_VISIBLE)
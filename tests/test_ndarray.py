@@ -0,0 +1,68 @@
+"""Layout of the dtypes of vulkan.ndarray against cffi"""
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from vulkan import ndarray
+from vulkan._vulkan import ffi
+
+
+def _records():
+    typedefs, structs, unions = ffi.list_types()
+    names = ['struct ' + name for name in structs]
+    names += ['union ' + name for name in unions]
+    for name in names:
+        ctype = ffi.typeof(name)
+        try:
+            ffi.sizeof(ctype)
+        except ffi.error:
+            # opaque
+            continue
+        yield ctype
+
+
+def test_layouts():
+    checked = 0
+    for ctype in _records():
+        dtype = ndarray.dtype(ctype)
+        assert dtype.itemsize == ffi.sizeof(ctype), ctype.cname
+        assert dtype.alignment == ffi.alignof(ctype), ctype.cname
+
+        fields = dtype.fields
+        for name, field in ctype.fields:
+            if field.bitsize >= 0:
+                # merged in the field of the storage unit
+                continue
+            assert fields[name][1] == ffi.offsetof(ctype, name), \
+                '%s.%s' % (ctype.cname, name)
+            assert fields[name][0].itemsize == ffi.sizeof(field.type), \
+                '%s.%s' % (ctype.cname, name)
+        checked += 1
+    assert checked > 1000
+
+
+def test_bitfields():
+    ctype = ffi.typeof('VkAccelerationStructureInstanceKHR')
+    dtype = ndarray.dtype(ctype)
+    for name, field in ctype.fields:
+        if field.bitsize >= 0 and field.bitshift == 0:
+            merged = [n for n in dtype.names if n.split('|')[0] == name]
+            assert len(merged) == 1
+            assert dtype.fields[merged[0]][1] == field.offset
+
+
+def test_same_layout_structs():
+    khr = np.zeros(2, ndarray.VkAccelerationStructureVersionInfoKHR)
+    ext = np.zeros(2, ndarray.VkMicromapVersionInfoEXT)
+    assert khr.dtype == ext.dtype
+    assert ffi.typeof(ndarray.as_cdata(khr)) is \
+        ffi.typeof('VkAccelerationStructureVersionInfoKHR[]')
+    assert ffi.typeof(ndarray.as_cdata(ext[1:])) is \
+        ffi.typeof('VkMicromapVersionInfoEXT[]')
+
+
+def test_as_array_keeps_struct_alive():
+    struct = ffi.new('VkViewport*', {'width': 800.})[0]
+    array = ndarray.as_array(struct)
+    del struct
+    assert array['width'][0] == 800.
@@ -0,0 +1,66 @@
+"""Files of vulkan.pipeline_cache.PipelineCacheStore"""
+import pytest
+
+from vulkan import pipeline_cache
+from vulkan._vulkan import ffi
+import vulkan as vk
+
+
+UUID = bytes(range(16))
+
+
+def _properties(physicalDevice):
+    properties = ffi.new('VkPhysicalDeviceProperties*')[0]
+    properties.vendorID = 0x10de
+    properties.deviceID = 0x1234
+    ffi.memmove(properties.pipelineCacheUUID, UUID, 16)
+    return properties
+
+
+def _blob(vendor=0x10de, uuid=UUID, payload=b'pipelines'):
+    header = ffi.new('VkPipelineCacheHeaderVersionOne*', {
+        'headerSize': ffi.sizeof('VkPipelineCacheHeaderVersionOne'),
+        'headerVersion': vk.VK_PIPELINE_CACHE_HEADER_VERSION_ONE,
+        'vendorID': vendor, 'deviceID': 0x1234})
+    ffi.memmove(header.pipelineCacheUUID, uuid, 16)
+    return ffi.buffer(header)[:] + payload
+
+
+@pytest.fixture
+def store(monkeypatch, tmp_path):
+    monkeypatch.setattr(pipeline_cache, 'vkGetPhysicalDeviceProperties',
+                        _properties)
+    return pipeline_cache.PipelineCacheStore(str(tmp_path / 'cache.bin'),
+                                             None)
+
+
+def test_is_valid(store):
+    assert store.is_valid(_blob())
+    assert not store.is_valid(_blob(vendor=0x1002))
+    assert not store.is_valid(_blob(uuid=bytes(16)))
+    assert not store.is_valid(_blob()[:10])
+
+
+def test_save_and_create(store, monkeypatch):
+    created = []
+    monkeypatch.setattr(pipeline_cache, 'vkGetPipelineCacheData',
+                        lambda device, cache: _blob())
+    monkeypatch.setattr(pipeline_cache, 'vkCreatePipelineCache',
+                        lambda device, info, pAllocator: created.append(
+                            ffi.buffer(info.pInitialData,
+                                       info.initialDataSize)[:]))
+    assert store.load() is None
+    store.create(None)
+    assert created == [b'']
+
+    store.save(None, None)
+    assert store.load() == _blob()
+    store.create(None)
+    assert created[-1] == _blob()
+
+
+def test_invalid_data_not_saved(store, monkeypatch):
+    monkeypatch.setattr(pipeline_cache, 'vkGetPipelineCacheData',
+                        lambda device, cache: _blob(vendor=1))
+    store.save(None, None)
+    assert store.load() is None
@@ -0,0 +1,65 @@
+"""Batches of vulkan.pipelines.create_pipelines"""
+import threading
+
+import pytest
+
+from vulkan import pipelines
+from vulkan._vulkan import ffi
+import vulkan as vk
+
+
+class _Lib(object):
+    """vkCreateComputePipelines failing for the create infos with flags"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.created = set()
+        self.destroyed = set()
+        self.next = 0x100
+
+    def vkCreateComputePipelines(self, device, pipelineCache,
+                                 createInfoCount, pCreateInfos, pAllocator,
+                                 pPipelines):
+        if any(info.flags == 1 for info in pCreateInfos[0:createInfoCount]):
+            raise MemoryError()
+        for i in range(createInfoCount):
+            if pCreateInfos[i].flags == 2:
+                continue
+            with self.lock:
+                self.next += 1
+                self.created.add(self.next)
+            pPipelines[i] = ffi.cast('VkPipeline', self.next)
+        return (vk.VK_SUCCESS if all(p != ffi.NULL for p in
+                                     pPipelines[0:createInfoCount])
+                else vk.VK_ERROR_OUT_OF_DEVICE_MEMORY)
+
+    def vkDestroyPipeline(self, device, pipeline, pAllocator):
+        self.destroyed.add(int(ffi.cast('uintptr_t', pipeline)))
+
+
+@pytest.fixture
+def fake_lib(monkeypatch):
+    lib = _Lib()
+    monkeypatch.setattr(pipelines, 'lib', lib)
+    return lib
+
+
+def _infos(flags):
+    return [vk.VkComputePipelineCreateInfo(flags=f) for f in flags]
+
+
+def test_errors(fake_lib):
+    result = pipelines.create_pipelines(None, None, _infos([0, 0, 2, 0, 0]),
+                                        max_workers=2, chunk_size=2)
+    assert [p is None for p in result.pipelines] == [
+        False, False, True, False, False]
+    assert list(result.errors) == [2]
+    assert isinstance(result.errors[2], vk.VkErrorOutOfDeviceMemory)
+    assert not fake_lib.destroyed
+
+
+def test_failed_shard_destroys_the_others(fake_lib):
+    with pytest.raises(MemoryError):
+        pipelines.create_pipelines(None, None, _infos([0] * 7 + [1]),
+                                   max_workers=4, chunk_size=2)
+    assert len(fake_lib.created) == 6
+    assert fake_lib.destroyed == fake_lib.created
@@ -0,0 +1,22 @@
+"""Statistics of vulkan.profiling"""
+from vulkan import profiling
+import vulkan as vk
+
+
+def test_profile():
+    original = vk.vkEnumerateInstanceLayerProperties
+    with profiling.profile() as prof:
+        assert profiling.is_enabled()
+        for _ in range(3):
+            list(vk.vkEnumerateInstanceLayerProperties())
+    assert not profiling.is_enabled()
+    assert vk.vkEnumerateInstanceLayerProperties is original
+
+    stats = prof.stats['vkEnumerateInstanceLayerProperties']
+    assert stats.count == 3
+    assert stats.native_time is not None
+    assert 0 <= stats.native_time <= stats.total_time
+
+    list(vk.vkEnumerateInstanceLayerProperties())
+    assert profiling.snapshot()[
+        'vkEnumerateInstanceLayerProperties'].count == 3
@@ -0,0 +1,43 @@
+"""Struct variants of vulkan.prototype.clone"""
+import gc
+
+from vulkan.prototype import clone
+import vulkan as vk
+
+
+def _base():
+    return vk.VkPipelineVertexInputStateCreateInfo(
+        pVertexBindingDescriptions=[
+            vk.VkVertexInputBindingDescription(binding=0, stride=16)],
+        pVertexAttributeDescriptions=[
+            vk.VkVertexInputAttributeDescription(location=i, offset=4 * i)
+            for i in range(3)])
+
+
+def test_shared_arrays():
+    base = _base()
+    copy = clone(base, flags=0)
+    assert copy.pVertexBindingDescriptions == \
+        base.pVertexBindingDescriptions
+    assert copy.vertexAttributeDescriptionCount == 3
+
+
+def test_replaced_array_count():
+    copy = clone(_base(), pVertexAttributeDescriptions=[
+        vk.VkVertexInputAttributeDescription(location=7)])
+    assert copy.vertexAttributeDescriptionCount == 1
+    assert copy.pVertexAttributeDescriptions[0].location == 7
+    assert copy.vertexBindingDescriptionCount == 1
+
+    copy = clone(_base(), pVertexAttributeDescriptions=None)
+    assert copy.vertexAttributeDescriptionCount == 0
+
+
+def test_keeps_the_prototype_alive():
+    copy = clone(_base(), flags=0)
+    gc.collect()
+    # overwrite freed memory, if any
+    [vk.VkVertexInputAttributeDescription(location=99) for _ in range(100)]
+    assert copy.pVertexBindingDescriptions[0].stride == 16
+    assert [copy.pVertexAttributeDescriptions[i].offset
+            for i in range(3)] == [0, 4, 8]
@@ -0,0 +1,80 @@
+"""Memoized queries of vulkan.query_cache"""
+import pytest
+
+from vulkan import _vulkan, query_cache
+from vulkan._vulkan import ffi
+import vulkan as vk
+
+
+_DEVICE = ffi.cast('VkPhysicalDevice', 0x40)
+_INSTANCE = ffi.cast('VkInstance', 0x50)
+_HOST_IMAGE_COPY = \
+    vk.VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_HOST_IMAGE_COPY_PROPERTIES_EXT
+
+
+@pytest.fixture
+def cache():
+    yield query_cache._cache
+    query_cache.invalidate()
+
+
+def _properties2(calls):
+    def vkGetPhysicalDeviceProperties2(physicalDevice, pProperties=None):
+        calls.append(physicalDevice)
+        pProperties.properties.apiVersion = len(calls)
+        next_ = ffi.cast('VkBaseOutStructure*', pProperties.pNext)
+        if next_ != ffi.NULL and next_.sType == _HOST_IMAGE_COPY:
+            host = ffi.cast('VkPhysicalDeviceHostImageCopyPropertiesEXT*',
+                            next_)
+            host.copySrcLayoutCount = len(calls)
+            if host.pCopySrcLayouts != ffi.NULL:
+                host.pCopySrcLayouts[0] = len(calls)
+        return pProperties
+
+    return vkGetPhysicalDeviceProperties2
+
+
+def _query(calls):
+    return query_cache._memoize(
+        'vkGetPhysicalDeviceProperties2', _properties2(calls),
+        'VkPhysicalDeviceProperties2', False)
+
+
+def test_memoized(cache):
+    calls = []
+    query = _query(calls)
+    assert query(_DEVICE).properties.apiVersion == 1
+    assert query(_DEVICE).properties.apiVersion == 1
+    assert len(calls) == 1
+
+
+def test_pointer_payload_not_cached(cache):
+    calls = []
+    query = _query(calls)
+    for i in range(2):
+        layouts = ffi.new('VkImageLayout[]', 1)
+        host = vk.VkPhysicalDeviceHostImageCopyPropertiesEXT(
+            copySrcLayoutCount=1, pCopySrcLayouts=layouts)
+        query(_DEVICE, vk.VkPhysicalDeviceProperties2(pNext=host))
+        assert layouts[0] == i + 1
+        assert host.pCopySrcLayouts == layouts
+    assert len(calls) == 2
+
+
+def test_instances_before_enable(cache, monkeypatch):
+    destroyed = []
+    for name in ('vkEnumeratePhysicalDevices', 'vkDestroyInstance'):
+        # loads the group first, it would replace the fake
+        getattr(_vulkan, name)
+    monkeypatch.setattr(_vulkan, 'vkEnumeratePhysicalDevices',
+                        lambda instance, pPhysicalDevices=None: [_DEVICE])
+    monkeypatch.setattr(_vulkan, 'vkDestroyInstance',
+                        lambda instance, pAllocator: destroyed.append(1))
+    query_cache.enable([_INSTANCE])
+    try:
+        cache[query_cache._address(_DEVICE)] = {'key': 'value'}
+        _vulkan.vkDestroyInstance(_INSTANCE, None)
+        assert destroyed == [1]
+        assert query_cache._address(_DEVICE) not in cache
+    finally:
+        query_cache.disable()
@@ -0,0 +1,90 @@
+"""Frames of vulkan.ring.RingBuffer"""
+import pytest
+
+from conftest import _key
+from vulkan import _vulkan
+from vulkan.memory import MappedRanges, _WHOLE_SIZE
+from vulkan.ring import RingBuffer
+
+
+@pytest.fixture
+def ring(fake_device):
+    # preferring no flag selects the non coherent memory type
+    ring = RingBuffer(fake_device.handle, fake_device.physical_device, 1024,
+                      _vulkan.VK_BUFFER_USAGE_UNIFORM_BUFFER_BIT,
+                      preferredFlags=0)
+    yield ring
+    ring.destroy()
+
+
+def _fence(device):
+    return _vulkan.vkCreateFence(device.handle, _vulkan.VkFenceCreateInfo(),
+                                 None)
+
+
+def test_write(fake_device, ring):
+    assert ring.mapping.coherent is False
+    assert ring.write(b'abc') == 0
+    assert ring.write(b'def') == 256
+    assert ring.write(b'ghi', alignment=4) == 260
+    assert bytes(ring.view(256, 3)) == b'def'
+    ring.end_frame(_fence(fake_device))
+    memory = _key(ring.memory)
+    assert fake_device.flushed == [[(memory, 0, 320)]]
+
+
+def test_wraparound_waits_for_the_oldest_frame(fake_device, ring):
+    first = _fence(fake_device)
+    assert ring.allocate(512) == 0
+    assert ring.allocate(256) == 512
+    ring.end_frame(first)
+
+    # no room for 512 bytes before the end, the start is still in flight
+    assert ring.allocate(512) == 0
+    assert fake_device.waited == [_key(first)]
+    ring.end_frame(_fence(fake_device))
+
+    # the frame wrapped around, both parts are flushed in one call
+    memory = _key(ring.memory)
+    assert sorted(fake_device.flushed[-1]) == [
+        (memory, 0, 512), (memory, 768, _WHOLE_SIZE)]
+
+
+def test_signaled_fences_are_reused(fake_device, ring):
+    fences = [_fence(fake_device) for _ in range(8)]
+    for fence in fences:
+        ring.write(b'x' * 300)
+        ring.end_frame(fence)
+        fake_device.signal(fence)
+    assert not fake_device.waited
+    ring.release()
+    assert ring._tail == ring._head
+
+
+def test_full_frame(fake_device, ring):
+    ring.allocate(512)
+    with pytest.raises(ValueError):
+        ring.allocate(768)
+    with pytest.raises(ValueError):
+        ring.allocate(2048)
+
+
+def test_ranges_of_the_caller(fake_device, ring):
+    ranges = MappedRanges()
+    ring.write(b'abc')
+    ring.end_frame(_fence(fake_device), ranges)
+    assert not fake_device.flushed
+    assert len(ranges) == 1
+    ranges.flush()
+    assert len(fake_device.flushed) == 1
+
+
+def test_coherent(fake_device):
+    ring = RingBuffer(fake_device.handle, fake_device.physical_device, 1024,
+                      _vulkan.VK_BUFFER_USAGE_UNIFORM_BUFFER_BIT)
+    assert ring.mapping.coherent
+    ring.write(b'abc')
+    ring.end_frame(_fence(fake_device))
+    assert not fake_device.flushed
+    ring.destroy()
+    assert fake_device.freed == [_key(ring.memory)]
@@ -0,0 +1,27 @@
+"""Timelines of vulkan.trace"""
+import json
+
+from vulkan import profiling
+from vulkan.trace import TraceRecorder
+import vulkan as vk
+
+
+def test_trace(tmp_path):
+    recorder = TraceRecorder()
+    with recorder:
+        with recorder.region('frame', index=1):
+            list(vk.vkEnumerateInstanceLayerProperties())
+        recorder.mark('done')
+    assert not profiling.is_enabled()
+
+    path = str(tmp_path / 'trace.json')
+    recorder.save(path)
+    with open(path) as f:
+        events = json.load(f)['traceEvents']
+    by_name = {e['name']: e for e in events}
+    assert by_name['vkEnumerateInstanceLayerProperties']['ph'] == 'X'
+    assert by_name['frame']['args'] == {'index': 1}
+    assert by_name['frame']['dur'] >= \
+        by_name['vkEnumerateInstanceLayerProperties']['dur']
+    assert by_name['done']['ph'] == 'i'
+    assert by_name['thread_name']['ph'] == 'M'
@@ -0,0 +1,98 @@
+"""Chunks of vulkan.upload.FileUploader"""
+import os
+
+import pytest
+
+from conftest import _key
+from vulkan import _vulkan
+from vulkan._vulkan import ffi
+from vulkan.upload import FileUploader
+
+
+SLOT_SIZE = 1024
+
+
+@pytest.fixture
+def uploader(fake_device):
+    uploader = FileUploader(fake_device.handle, fake_device.physical_device,
+                            ffi.cast('VkQueue', 0x70), 0,
+                            slot_size=SLOT_SIZE, slots=2)
+    yield uploader
+    uploader.destroy()
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    data = os.urandom(5000)
+    path = tmp_path / 'data.bin'
+    path.write_bytes(data)
+    return str(path), data
+
+
+def _buffer(device, size):
+    return _vulkan.vkCreateBuffer(device.handle, _vulkan.VkBufferCreateInfo(
+        size=size), None)
+
+
+def test_upload_buffer(fake_device, uploader, data_file):
+    path, data = data_file
+    dst = _buffer(fake_device, 8192)
+    uploader.upload_buffer(path, dst, offset=100)
+    uploader.wait()
+
+    regions = [r for key, rs in fake_device.buffer_copies
+               if key == _key(dst) for r in rs]
+    assert len(regions) > 4
+    copied = bytearray(8192)
+    for src, dst_offset, chunk in regions:
+        assert src % 16 == 0
+        # a chunk never spans two slots
+        assert src // SLOT_SIZE == (src + len(chunk) - 1) // SLOT_SIZE
+        copied[dst_offset:dst_offset + len(chunk)] = chunk
+    assert bytes(copied[100:5100]) == data
+    assert sum(len(chunk) for _, _, chunk in regions) == len(data)
+
+    # each slot was waited for before being filled again
+    assert fake_device.submits == len(regions)
+    assert len(fake_device.waited) >= len(regions) - 2
+
+
+def test_upload_buffer_range(fake_device, uploader, data_file):
+    path, data = data_file
+    dst = _buffer(fake_device, 8192)
+    with open(path, 'rb') as f:
+        uploader.upload_buffer(f, dst, file_offset=10, size=30)
+    uploader.wait()
+    (key, regions), = fake_device.buffer_copies
+    assert [(d, c) for _, d, c in regions] == [(0, data[10:40])]
+
+    with pytest.raises(ValueError):
+        uploader.upload_buffer(path, dst, file_offset=10, size=5000)
+
+
+def test_upload_image(fake_device, uploader, data_file):
+    path, data = data_file
+    image = fake_device.image(4000)
+    # 2 layers of 25 rows of 40 bytes
+    uploader.upload_image(path, image, 10, 25, 4, layers=2)
+    uploader.wait()
+
+    regions = [r for key, layout, rs in fake_device.image_copies
+               for r in rs]
+    for layer in (0, 1):
+        rows = sorted((y, height) for _, y, height, l in regions
+                      if l == layer)
+        assert rows[0][0] == 0
+        assert all(y + h == next_y for (y, h), (next_y, _) in zip(
+            rows, rows[1:]))
+        assert sum(h for _, h in rows) == 25
+    for offset, y, height, layer in regions:
+        assert offset % 16 == 0
+        assert offset // SLOT_SIZE == \
+            (offset + height * 40 - 1) // SLOT_SIZE
+
+
+def test_rows_bigger_than_slots(fake_device, uploader, data_file):
+    path, data = data_file
+    with pytest.raises(ValueError):
+        uploader.upload_image(path, fake_device.image(4000), 500, 2, 4)
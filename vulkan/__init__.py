@@ -1,3 +1,16 @@
+from vulkan import _vulkan
 from vulkan._vulkan import * # noqa
 
 __version__ = '1.3.275.1'
+__all__ = [name for name in dir(_vulkan) if not name.startswith('_')]
+
+
+def __getattr__(name):
+    # structs and functions are loaded on demand by vulkan._vulkan
+    value = getattr(_vulkan, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
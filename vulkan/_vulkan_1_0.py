@@ -0,0 +1,2802 @@
+from vulkan._vulkan import *  # noqa
+from vulkan._vulkan import (ffi, lib, _new, _auto_handle, _handle,
+                            _arg_types, _slice)
+
+
+def VkBaseOutStructure(sType=None,pNext=None,):
+
+    return _new('VkBaseOutStructure', sType=sType,pNext=pNext)
+
+def VkBaseInStructure(sType=None,pNext=None,):
+
+    return _new('VkBaseInStructure', sType=sType,pNext=pNext)
+
+def VkOffset2D(x=None,y=None,):
+
+    return _new('VkOffset2D', x=x,y=y)
+
+def VkOffset3D(x=None,y=None,z=None,):
+
+    return _new('VkOffset3D', x=x,y=y,z=z)
+
+def VkExtent2D(width=None,height=None,):
+
+    return _new('VkExtent2D', width=width,height=height)
+
+def VkExtent3D(width=None,height=None,depth=None,):
+
+    return _new('VkExtent3D', width=width,height=height,depth=depth)
+
+def VkViewport(x=None,y=None,width=None,height=None,minDepth=None,maxDepth=None,):
+
+    return _new('VkViewport', x=x,y=y,width=width,height=height,minDepth=minDepth,maxDepth=maxDepth)
+
+def VkRect2D(offset=None,extent=None,):
+
+    return _new('VkRect2D', offset=offset,extent=extent)
+
+def VkClearRect(rect=None,baseArrayLayer=None,layerCount=None,):
+
+    return _new('VkClearRect', rect=rect,baseArrayLayer=baseArrayLayer,layerCount=layerCount)
+
+def VkComponentMapping(r=None,g=None,b=None,a=None,):
+
+    return _new('VkComponentMapping', r=r,g=g,b=b,a=a)
+
+def VkPhysicalDeviceProperties(apiVersion=None,driverVersion=None,vendorID=None,deviceID=None,deviceType=None,deviceName=None,pipelineCacheUUID=None,limits=None,sparseProperties=None,):
+
+    return _new('VkPhysicalDeviceProperties', apiVersion=apiVersion,driverVersion=driverVersion,vendorID=vendorID,deviceID=deviceID,deviceType=deviceType,deviceName=deviceName,pipelineCacheUUID=pipelineCacheUUID,limits=limits,sparseProperties=sparseProperties)
+
+def VkExtensionProperties(extensionName=None,specVersion=None,):
+
+    return _new('VkExtensionProperties', extensionName=extensionName,specVersion=specVersion)
+
+def VkLayerProperties(layerName=None,specVersion=None,implementationVersion=None,description=None,):
+
+    return _new('VkLayerProperties', layerName=layerName,specVersion=specVersion,implementationVersion=implementationVersion,description=description)
+
+def VkApplicationInfo(sType=VK_STRUCTURE_TYPE_APPLICATION_INFO,pNext=None,pApplicationName=None,applicationVersion=None,pEngineName=None,engineVersion=None,apiVersion=None,):
+
+    return _new('VkApplicationInfo', sType=sType,pNext=pNext,pApplicationName=pApplicationName,applicationVersion=applicationVersion,pEngineName=pEngineName,engineVersion=engineVersion,apiVersion=apiVersion)
+
+def VkAllocationCallbacks(pUserData=None,pfnAllocation=None,pfnReallocation=None,pfnFree=None,pfnInternalAllocation=None,pfnInternalFree=None,):
+
+    return _new('VkAllocationCallbacks', pUserData=pUserData,pfnAllocation=pfnAllocation,pfnReallocation=pfnReallocation,pfnFree=pfnFree,pfnInternalAllocation=pfnInternalAllocation,pfnInternalFree=pfnInternalFree)
+
+def VkDeviceQueueCreateInfo(sType=VK_STRUCTURE_TYPE_DEVICE_QUEUE_CREATE_INFO,pNext=None,flags=None,queueFamilyIndex=None,queueCount=None,pQueuePriorities=None,):
+    if queueCount is None and pQueuePriorities is not None:
+        queueCount = len(pQueuePriorities)
+
+    return _new('VkDeviceQueueCreateInfo', sType=sType,pNext=pNext,flags=flags,queueFamilyIndex=queueFamilyIndex,queueCount=queueCount,pQueuePriorities=pQueuePriorities)
+
+def VkDeviceCreateInfo(sType=VK_STRUCTURE_TYPE_DEVICE_CREATE_INFO,pNext=None,flags=None,queueCreateInfoCount=None,pQueueCreateInfos=None,enabledLayerCount=None,ppEnabledLayerNames=None,enabledExtensionCount=None,ppEnabledExtensionNames=None,pEnabledFeatures=None,):
+    if queueCreateInfoCount is None and pQueueCreateInfos is not None:
+        queueCreateInfoCount = len(pQueueCreateInfos)
+    if enabledLayerCount is None and ppEnabledLayerNames is not None:
+        enabledLayerCount = len(ppEnabledLayerNames)
+    if enabledExtensionCount is None and ppEnabledExtensionNames is not None:
+        enabledExtensionCount = len(ppEnabledExtensionNames)
+
+    return _new('VkDeviceCreateInfo', sType=sType,pNext=pNext,flags=flags,queueCreateInfoCount=queueCreateInfoCount,pQueueCreateInfos=pQueueCreateInfos,enabledLayerCount=enabledLayerCount,ppEnabledLayerNames=ppEnabledLayerNames,enabledExtensionCount=enabledExtensionCount,ppEnabledExtensionNames=ppEnabledExtensionNames,pEnabledFeatures=pEnabledFeatures)
+
+def VkInstanceCreateInfo(sType=VK_STRUCTURE_TYPE_INSTANCE_CREATE_INFO,pNext=None,flags=None,pApplicationInfo=None,enabledLayerCount=None,ppEnabledLayerNames=None,enabledExtensionCount=None,ppEnabledExtensionNames=None,):
+    if enabledLayerCount is None and ppEnabledLayerNames is not None:
+        enabledLayerCount = len(ppEnabledLayerNames)
+    if enabledExtensionCount is None and ppEnabledExtensionNames is not None:
+        enabledExtensionCount = len(ppEnabledExtensionNames)
+
+    return _new('VkInstanceCreateInfo', sType=sType,pNext=pNext,flags=flags,pApplicationInfo=pApplicationInfo,enabledLayerCount=enabledLayerCount,ppEnabledLayerNames=ppEnabledLayerNames,enabledExtensionCount=enabledExtensionCount,ppEnabledExtensionNames=ppEnabledExtensionNames)
+
+def VkQueueFamilyProperties(queueFlags=None,queueCount=None,timestampValidBits=None,minImageTransferGranularity=None,):
+
+    return _new('VkQueueFamilyProperties', queueFlags=queueFlags,queueCount=queueCount,timestampValidBits=timestampValidBits,minImageTransferGranularity=minImageTransferGranularity)
+
+def VkPhysicalDeviceMemoryProperties(memoryTypeCount=None,memoryTypes=None,memoryHeapCount=None,memoryHeaps=None,):
+
+    return _new('VkPhysicalDeviceMemoryProperties', memoryTypeCount=memoryTypeCount,memoryTypes=memoryTypes,memoryHeapCount=memoryHeapCount,memoryHeaps=memoryHeaps)
+
+def VkMemoryAllocateInfo(sType=VK_STRUCTURE_TYPE_MEMORY_ALLOCATE_INFO,pNext=None,allocationSize=None,memoryTypeIndex=None,):
+
+    return _new('VkMemoryAllocateInfo', sType=sType,pNext=pNext,allocationSize=allocationSize,memoryTypeIndex=memoryTypeIndex)
+
+def VkMemoryRequirements(size=None,alignment=None,memoryTypeBits=None,):
+
+    return _new('VkMemoryRequirements', size=size,alignment=alignment,memoryTypeBits=memoryTypeBits)
+
+def VkSparseImageFormatProperties(aspectMask=None,imageGranularity=None,flags=None,):
+
+    return _new('VkSparseImageFormatProperties', aspectMask=aspectMask,imageGranularity=imageGranularity,flags=flags)
+
+def VkSparseImageMemoryRequirements(formatProperties=None,imageMipTailFirstLod=None,imageMipTailSize=None,imageMipTailOffset=None,imageMipTailStride=None,):
+
+    return _new('VkSparseImageMemoryRequirements', formatProperties=formatProperties,imageMipTailFirstLod=imageMipTailFirstLod,imageMipTailSize=imageMipTailSize,imageMipTailOffset=imageMipTailOffset,imageMipTailStride=imageMipTailStride)
+
+def VkMemoryType(propertyFlags=None,heapIndex=None,):
+
+    return _new('VkMemoryType', propertyFlags=propertyFlags,heapIndex=heapIndex)
+
+def VkMemoryHeap(size=None,flags=None,):
+
+    return _new('VkMemoryHeap', size=size,flags=flags)
+
+def VkMappedMemoryRange(sType=VK_STRUCTURE_TYPE_MAPPED_MEMORY_RANGE,pNext=None,memory=None,offset=None,size=None,):
+
+    return _new('VkMappedMemoryRange', sType=sType,pNext=pNext,memory=memory,offset=offset,size=size)
+
+def VkFormatProperties(linearTilingFeatures=None,optimalTilingFeatures=None,bufferFeatures=None,):
+
+    return _new('VkFormatProperties', linearTilingFeatures=linearTilingFeatures,optimalTilingFeatures=optimalTilingFeatures,bufferFeatures=bufferFeatures)
+
+def VkImageFormatProperties(maxExtent=None,maxMipLevels=None,maxArrayLayers=None,sampleCounts=None,maxResourceSize=None,):
+
+    return _new('VkImageFormatProperties', maxExtent=maxExtent,maxMipLevels=maxMipLevels,maxArrayLayers=maxArrayLayers,sampleCounts=sampleCounts,maxResourceSize=maxResourceSize)
+
+def VkDescriptorBufferInfo(buffer=None,offset=None,range=None,):
+
+    return _new('VkDescriptorBufferInfo', buffer=buffer,offset=offset,range=range)
+
+def VkDescriptorImageInfo(sampler=None,imageView=None,imageLayout=None,):
+
+    return _new('VkDescriptorImageInfo', sampler=sampler,imageView=imageView,imageLayout=imageLayout)
+
+def VkWriteDescriptorSet(sType=VK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET,pNext=None,dstSet=None,dstBinding=None,dstArrayElement=None,descriptorCount=None,descriptorType=None,pImageInfo=None,pBufferInfo=None,pTexelBufferView=None,):
+    if descriptorCount is None and pImageInfo is not None:
+        descriptorCount = len(pImageInfo)
+    if descriptorCount is None and pBufferInfo is not None:
+        descriptorCount = len(pBufferInfo)
+    if descriptorCount is None and pTexelBufferView is not None:
+        descriptorCount = len(pTexelBufferView)
+
+    return _new('VkWriteDescriptorSet', sType=sType,pNext=pNext,dstSet=dstSet,dstBinding=dstBinding,dstArrayElement=dstArrayElement,descriptorCount=descriptorCount,descriptorType=descriptorType,pImageInfo=pImageInfo,pBufferInfo=pBufferInfo,pTexelBufferView=pTexelBufferView)
+
+def VkCopyDescriptorSet(sType=VK_STRUCTURE_TYPE_COPY_DESCRIPTOR_SET,pNext=None,srcSet=None,srcBinding=None,srcArrayElement=None,dstSet=None,dstBinding=None,dstArrayElement=None,descriptorCount=None,):
+
+    return _new('VkCopyDescriptorSet', sType=sType,pNext=pNext,srcSet=srcSet,srcBinding=srcBinding,srcArrayElement=srcArrayElement,dstSet=dstSet,dstBinding=dstBinding,dstArrayElement=dstArrayElement,descriptorCount=descriptorCount)
+
+def VkBufferCreateInfo(sType=VK_STRUCTURE_TYPE_BUFFER_CREATE_INFO,pNext=None,flags=None,size=None,usage=None,sharingMode=None,queueFamilyIndexCount=None,pQueueFamilyIndices=None,):
+    if queueFamilyIndexCount is None and pQueueFamilyIndices is not None:
+        queueFamilyIndexCount = len(pQueueFamilyIndices)
+
+    return _new('VkBufferCreateInfo', sType=sType,pNext=pNext,flags=flags,size=size,usage=usage,sharingMode=sharingMode,queueFamilyIndexCount=queueFamilyIndexCount,pQueueFamilyIndices=pQueueFamilyIndices)
+
+def VkBufferViewCreateInfo(sType=VK_STRUCTURE_TYPE_BUFFER_VIEW_CREATE_INFO,pNext=None,flags=None,buffer=None,format=None,offset=None,range=None,):
+
+    return _new('VkBufferViewCreateInfo', sType=sType,pNext=pNext,flags=flags,buffer=buffer,format=format,offset=offset,range=range)
+
+def VkImageSubresource(aspectMask=None,mipLevel=None,arrayLayer=None,):
+
+    return _new('VkImageSubresource', aspectMask=aspectMask,mipLevel=mipLevel,arrayLayer=arrayLayer)
+
+def VkImageSubresourceLayers(aspectMask=None,mipLevel=None,baseArrayLayer=None,layerCount=None,):
+
+    return _new('VkImageSubresourceLayers', aspectMask=aspectMask,mipLevel=mipLevel,baseArrayLayer=baseArrayLayer,layerCount=layerCount)
+
+def VkImageSubresourceRange(aspectMask=None,baseMipLevel=None,levelCount=None,baseArrayLayer=None,layerCount=None,):
+
+    return _new('VkImageSubresourceRange', aspectMask=aspectMask,baseMipLevel=baseMipLevel,levelCount=levelCount,baseArrayLayer=baseArrayLayer,layerCount=layerCount)
+
+def VkMemoryBarrier(sType=VK_STRUCTURE_TYPE_MEMORY_BARRIER,pNext=None,srcAccessMask=None,dstAccessMask=None,):
+
+    return _new('VkMemoryBarrier', sType=sType,pNext=pNext,srcAccessMask=srcAccessMask,dstAccessMask=dstAccessMask)
+
+def VkBufferMemoryBarrier(sType=VK_STRUCTURE_TYPE_BUFFER_MEMORY_BARRIER,pNext=None,srcAccessMask=None,dstAccessMask=None,srcQueueFamilyIndex=None,dstQueueFamilyIndex=None,buffer=None,offset=None,size=None,):
+
+    return _new('VkBufferMemoryBarrier', sType=sType,pNext=pNext,srcAccessMask=srcAccessMask,dstAccessMask=dstAccessMask,srcQueueFamilyIndex=srcQueueFamilyIndex,dstQueueFamilyIndex=dstQueueFamilyIndex,buffer=buffer,offset=offset,size=size)
+
+def VkImageMemoryBarrier(sType=VK_STRUCTURE_TYPE_IMAGE_MEMORY_BARRIER,pNext=None,srcAccessMask=None,dstAccessMask=None,oldLayout=None,newLayout=None,srcQueueFamilyIndex=None,dstQueueFamilyIndex=None,image=None,subresourceRange=None,):
+
+    return _new('VkImageMemoryBarrier', sType=sType,pNext=pNext,srcAccessMask=srcAccessMask,dstAccessMask=dstAccessMask,oldLayout=oldLayout,newLayout=newLayout,srcQueueFamilyIndex=srcQueueFamilyIndex,dstQueueFamilyIndex=dstQueueFamilyIndex,image=image,subresourceRange=subresourceRange)
+
+def VkImageCreateInfo(sType=VK_STRUCTURE_TYPE_IMAGE_CREATE_INFO,pNext=None,flags=None,imageType=None,format=None,extent=None,mipLevels=None,arrayLayers=None,samples=None,tiling=None,usage=None,sharingMode=None,queueFamilyIndexCount=None,pQueueFamilyIndices=None,initialLayout=None,):
+    if queueFamilyIndexCount is None and pQueueFamilyIndices is not None:
+        queueFamilyIndexCount = len(pQueueFamilyIndices)
+
+    return _new('VkImageCreateInfo', sType=sType,pNext=pNext,flags=flags,imageType=imageType,format=format,extent=extent,mipLevels=mipLevels,arrayLayers=arrayLayers,samples=samples,tiling=tiling,usage=usage,sharingMode=sharingMode,queueFamilyIndexCount=queueFamilyIndexCount,pQueueFamilyIndices=pQueueFamilyIndices,initialLayout=initialLayout)
+
+def VkSubresourceLayout(offset=None,size=None,rowPitch=None,arrayPitch=None,depthPitch=None,):
+
+    return _new('VkSubresourceLayout', offset=offset,size=size,rowPitch=rowPitch,arrayPitch=arrayPitch,depthPitch=depthPitch)
+
+def VkImageViewCreateInfo(sType=VK_STRUCTURE_TYPE_IMAGE_VIEW_CREATE_INFO,pNext=None,flags=None,image=None,viewType=None,format=None,components=None,subresourceRange=None,):
+
+    return _new('VkImageViewCreateInfo', sType=sType,pNext=pNext,flags=flags,image=image,viewType=viewType,format=format,components=components,subresourceRange=subresourceRange)
+
+def VkBufferCopy(srcOffset=None,dstOffset=None,size=None,):
+
+    return _new('VkBufferCopy', srcOffset=srcOffset,dstOffset=dstOffset,size=size)
+
+def VkSparseMemoryBind(resourceOffset=None,size=None,memory=None,memoryOffset=None,flags=None,):
+
+    return _new('VkSparseMemoryBind', resourceOffset=resourceOffset,size=size,memory=memory,memoryOffset=memoryOffset,flags=flags)
+
+def VkSparseImageMemoryBind(subresource=None,offset=None,extent=None,memory=None,memoryOffset=None,flags=None,):
+
+    return _new('VkSparseImageMemoryBind', subresource=subresource,offset=offset,extent=extent,memory=memory,memoryOffset=memoryOffset,flags=flags)
+
+def VkSparseBufferMemoryBindInfo(buffer=None,bindCount=None,pBinds=None,):
+    if bindCount is None and pBinds is not None:
+        bindCount = len(pBinds)
+
+    return _new('VkSparseBufferMemoryBindInfo', buffer=buffer,bindCount=bindCount,pBinds=pBinds)
+
+def VkSparseImageOpaqueMemoryBindInfo(image=None,bindCount=None,pBinds=None,):
+    if bindCount is None and pBinds is not None:
+        bindCount = len(pBinds)
+
+    return _new('VkSparseImageOpaqueMemoryBindInfo', image=image,bindCount=bindCount,pBinds=pBinds)
+
+def VkSparseImageMemoryBindInfo(image=None,bindCount=None,pBinds=None,):
+    if bindCount is None and pBinds is not None:
+        bindCount = len(pBinds)
+
+    return _new('VkSparseImageMemoryBindInfo', image=image,bindCount=bindCount,pBinds=pBinds)
+
+def VkBindSparseInfo(sType=VK_STRUCTURE_TYPE_BIND_SPARSE_INFO,pNext=None,waitSemaphoreCount=None,pWaitSemaphores=None,bufferBindCount=None,pBufferBinds=None,imageOpaqueBindCount=None,pImageOpaqueBinds=None,imageBindCount=None,pImageBinds=None,signalSemaphoreCount=None,pSignalSemaphores=None,):
+    if waitSemaphoreCount is None and pWaitSemaphores is not None:
+        waitSemaphoreCount = len(pWaitSemaphores)
+    if bufferBindCount is None and pBufferBinds is not None:
+        bufferBindCount = len(pBufferBinds)
+    if imageOpaqueBindCount is None and pImageOpaqueBinds is not None:
+        imageOpaqueBindCount = len(pImageOpaqueBinds)
+    if imageBindCount is None and pImageBinds is not None:
+        imageBindCount = len(pImageBinds)
+    if signalSemaphoreCount is None and pSignalSemaphores is not None:
+        signalSemaphoreCount = len(pSignalSemaphores)
+
+    return _new('VkBindSparseInfo', sType=sType,pNext=pNext,waitSemaphoreCount=waitSemaphoreCount,pWaitSemaphores=pWaitSemaphores,bufferBindCount=bufferBindCount,pBufferBinds=pBufferBinds,imageOpaqueBindCount=imageOpaqueBindCount,pImageOpaqueBinds=pImageOpaqueBinds,imageBindCount=imageBindCount,pImageBinds=pImageBinds,signalSemaphoreCount=signalSemaphoreCount,pSignalSemaphores=pSignalSemaphores)
+
+def VkImageCopy(srcSubresource=None,srcOffset=None,dstSubresource=None,dstOffset=None,extent=None,):
+
+    return _new('VkImageCopy', srcSubresource=srcSubresource,srcOffset=srcOffset,dstSubresource=dstSubresource,dstOffset=dstOffset,extent=extent)
+
+def VkImageBlit(srcSubresource=None,srcOffsets=None,dstSubresource=None,dstOffsets=None,):
+
+    return _new('VkImageBlit', srcSubresource=srcSubresource,srcOffsets=srcOffsets,dstSubresource=dstSubresource,dstOffsets=dstOffsets)
+
+def VkBufferImageCopy(bufferOffset=None,bufferRowLength=None,bufferImageHeight=None,imageSubresource=None,imageOffset=None,imageExtent=None,):
+
+    return _new('VkBufferImageCopy', bufferOffset=bufferOffset,bufferRowLength=bufferRowLength,bufferImageHeight=bufferImageHeight,imageSubresource=imageSubresource,imageOffset=imageOffset,imageExtent=imageExtent)
+
+def VkImageResolve(srcSubresource=None,srcOffset=None,dstSubresource=None,dstOffset=None,extent=None,):
+
+    return _new('VkImageResolve', srcSubresource=srcSubresource,srcOffset=srcOffset,dstSubresource=dstSubresource,dstOffset=dstOffset,extent=extent)
+
+def VkShaderModuleCreateInfo(sType=VK_STRUCTURE_TYPE_SHADER_MODULE_CREATE_INFO,pNext=None,flags=None,codeSize=None,pCode=None,):
+
+    return _new('VkShaderModuleCreateInfo', sType=sType,pNext=pNext,flags=flags,codeSize=codeSize,pCode=pCode)
+
+def VkDescriptorSetLayoutBinding(binding=None,descriptorType=None,descriptorCount=None,stageFlags=None,pImmutableSamplers=None,):
+    if descriptorCount is None and pImmutableSamplers is not None:
+        descriptorCount = len(pImmutableSamplers)
+
+    return _new('VkDescriptorSetLayoutBinding', binding=binding,descriptorType=descriptorType,descriptorCount=descriptorCount,stageFlags=stageFlags,pImmutableSamplers=pImmutableSamplers)
+
+def VkDescriptorSetLayoutCreateInfo(sType=VK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_CREATE_INFO,pNext=None,flags=None,bindingCount=None,pBindings=None,):
+    if bindingCount is None and pBindings is not None:
+        bindingCount = len(pBindings)
+
+    return _new('VkDescriptorSetLayoutCreateInfo', sType=sType,pNext=pNext,flags=flags,bindingCount=bindingCount,pBindings=pBindings)
+
+def VkDescriptorPoolSize(type=None,descriptorCount=None,):
+
+    return _new('VkDescriptorPoolSize', type=type,descriptorCount=descriptorCount)
+
+def VkDescriptorPoolCreateInfo(sType=VK_STRUCTURE_TYPE_DESCRIPTOR_POOL_CREATE_INFO,pNext=None,flags=None,maxSets=None,poolSizeCount=None,pPoolSizes=None,):
+    if poolSizeCount is None and pPoolSizes is not None:
+        poolSizeCount = len(pPoolSizes)
+
+    return _new('VkDescriptorPoolCreateInfo', sType=sType,pNext=pNext,flags=flags,maxSets=maxSets,poolSizeCount=poolSizeCount,pPoolSizes=pPoolSizes)
+
+def VkDescriptorSetAllocateInfo(sType=VK_STRUCTURE_TYPE_DESCRIPTOR_SET_ALLOCATE_INFO,pNext=None,descriptorPool=None,descriptorSetCount=None,pSetLayouts=None,):
+    if descriptorSetCount is None and pSetLayouts is not None:
+        descriptorSetCount = len(pSetLayouts)
+
+    return _new('VkDescriptorSetAllocateInfo', sType=sType,pNext=pNext,descriptorPool=descriptorPool,descriptorSetCount=descriptorSetCount,pSetLayouts=pSetLayouts)
+
+def VkSpecializationMapEntry(constantID=None,offset=None,size=None,):
+
+    return _new('VkSpecializationMapEntry', constantID=constantID,offset=offset,size=size)
+
+def VkSpecializationInfo(mapEntryCount=None,pMapEntries=None,dataSize=None,pData=None,):
+    if mapEntryCount is None and pMapEntries is not None:
+        mapEntryCount = len(pMapEntries)
+    if dataSize is None and pData is not None:
+        dataSize = len(pData)
+
+    return _new('VkSpecializationInfo', mapEntryCount=mapEntryCount,pMapEntries=pMapEntries,dataSize=dataSize,pData=pData)
+
+def VkPipelineShaderStageCreateInfo(sType=VK_STRUCTURE_TYPE_PIPELINE_SHADER_STAGE_CREATE_INFO,pNext=None,flags=None,stage=None,module=None,pName=None,pSpecializationInfo=None,):
+
+    return _new('VkPipelineShaderStageCreateInfo', sType=sType,pNext=pNext,flags=flags,stage=stage,module=module,pName=pName,pSpecializationInfo=pSpecializationInfo)
+
+def VkComputePipelineCreateInfo(sType=VK_STRUCTURE_TYPE_COMPUTE_PIPELINE_CREATE_INFO,pNext=None,flags=None,stage=None,layout=None,basePipelineHandle=None,basePipelineIndex=None,):
+
+    return _new('VkComputePipelineCreateInfo', sType=sType,pNext=pNext,flags=flags,stage=stage,layout=layout,basePipelineHandle=basePipelineHandle,basePipelineIndex=basePipelineIndex)
+
+def VkVertexInputBindingDescription(binding=None,stride=None,inputRate=None,):
+
+    return _new('VkVertexInputBindingDescription', binding=binding,stride=stride,inputRate=inputRate)
+
+def VkVertexInputAttributeDescription(location=None,binding=None,format=None,offset=None,):
+
+    return _new('VkVertexInputAttributeDescription', location=location,binding=binding,format=format,offset=offset)
+
+def VkPipelineVertexInputStateCreateInfo(sType=VK_STRUCTURE_TYPE_PIPELINE_VERTEX_INPUT_STATE_CREATE_INFO,pNext=None,flags=None,vertexBindingDescriptionCount=None,pVertexBindingDescriptions=None,vertexAttributeDescriptionCount=None,pVertexAttributeDescriptions=None,):
+    if vertexBindingDescriptionCount is None and pVertexBindingDescriptions is not None:
+        vertexBindingDescriptionCount = len(pVertexBindingDescriptions)
+    if vertexAttributeDescriptionCount is None and pVertexAttributeDescriptions is not None:
+        vertexAttributeDescriptionCount = len(pVertexAttributeDescriptions)
+
+    return _new('VkPipelineVertexInputStateCreateInfo', sType=sType,pNext=pNext,flags=flags,vertexBindingDescriptionCount=vertexBindingDescriptionCount,pVertexBindingDescriptions=pVertexBindingDescriptions,vertexAttributeDescriptionCount=vertexAttributeDescriptionCount,pVertexAttributeDescriptions=pVertexAttributeDescriptions)
+
+def VkPipelineInputAssemblyStateCreateInfo(sType=VK_STRUCTURE_TYPE_PIPELINE_INPUT_ASSEMBLY_STATE_CREATE_INFO,pNext=None,flags=None,topology=None,primitiveRestartEnable=None,):
+
+    return _new('VkPipelineInputAssemblyStateCreateInfo', sType=sType,pNext=pNext,flags=flags,topology=topology,primitiveRestartEnable=primitiveRestartEnable)
+
+def VkPipelineTessellationStateCreateInfo(sType=VK_STRUCTURE_TYPE_PIPELINE_TESSELLATION_STATE_CREATE_INFO,pNext=None,flags=None,patchControlPoints=None,):
+
+    return _new('VkPipelineTessellationStateCreateInfo', sType=sType,pNext=pNext,flags=flags,patchControlPoints=patchControlPoints)
+
+def VkPipelineViewportStateCreateInfo(sType=VK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_STATE_CREATE_INFO,pNext=None,flags=None,viewportCount=None,pViewports=None,scissorCount=None,pScissors=None,):
+    if viewportCount is None and pViewports is not None:
+        viewportCount = len(pViewports)
+    if scissorCount is None and pScissors is not None:
+        scissorCount = len(pScissors)
+
+    return _new('VkPipelineViewportStateCreateInfo', sType=sType,pNext=pNext,flags=flags,viewportCount=viewportCount,pViewports=pViewports,scissorCount=scissorCount,pScissors=pScissors)
+
+def VkPipelineRasterizationStateCreateInfo(sType=VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_STATE_CREATE_INFO,pNext=None,flags=None,depthClampEnable=None,rasterizerDiscardEnable=None,polygonMode=None,cullMode=None,frontFace=None,depthBiasEnable=None,depthBiasConstantFactor=None,depthBiasClamp=None,depthBiasSlopeFactor=None,lineWidth=None,):
+
+    return _new('VkPipelineRasterizationStateCreateInfo', sType=sType,pNext=pNext,flags=flags,depthClampEnable=depthClampEnable,rasterizerDiscardEnable=rasterizerDiscardEnable,polygonMode=polygonMode,cullMode=cullMode,frontFace=frontFace,depthBiasEnable=depthBiasEnable,depthBiasConstantFactor=depthBiasConstantFactor,depthBiasClamp=depthBiasClamp,depthBiasSlopeFactor=depthBiasSlopeFactor,lineWidth=lineWidth)
+
+def VkPipelineMultisampleStateCreateInfo(sType=VK_STRUCTURE_TYPE_PIPELINE_MULTISAMPLE_STATE_CREATE_INFO,pNext=None,flags=None,rasterizationSamples=None,sampleShadingEnable=None,minSampleShading=None,pSampleMask=None,alphaToCoverageEnable=None,alphaToOneEnable=None,):
+
+    return _new('VkPipelineMultisampleStateCreateInfo', sType=sType,pNext=pNext,flags=flags,rasterizationSamples=rasterizationSamples,sampleShadingEnable=sampleShadingEnable,minSampleShading=minSampleShading,pSampleMask=pSampleMask,alphaToCoverageEnable=alphaToCoverageEnable,alphaToOneEnable=alphaToOneEnable)
+
+def VkPipelineColorBlendAttachmentState(blendEnable=None,srcColorBlendFactor=None,dstColorBlendFactor=None,colorBlendOp=None,srcAlphaBlendFactor=None,dstAlphaBlendFactor=None,alphaBlendOp=None,colorWriteMask=None,):
+
+    return _new('VkPipelineColorBlendAttachmentState', blendEnable=blendEnable,srcColorBlendFactor=srcColorBlendFactor,dstColorBlendFactor=dstColorBlendFactor,colorBlendOp=colorBlendOp,srcAlphaBlendFactor=srcAlphaBlendFactor,dstAlphaBlendFactor=dstAlphaBlendFactor,alphaBlendOp=alphaBlendOp,colorWriteMask=colorWriteMask)
+
+def VkPipelineColorBlendStateCreateInfo(sType=VK_STRUCTURE_TYPE_PIPELINE_COLOR_BLEND_STATE_CREATE_INFO,pNext=None,flags=None,logicOpEnable=None,logicOp=None,attachmentCount=None,pAttachments=None,blendConstants=None,):
+    if attachmentCount is None and pAttachments is not None:
+        attachmentCount = len(pAttachments)
+
+    return _new('VkPipelineColorBlendStateCreateInfo', sType=sType,pNext=pNext,flags=flags,logicOpEnable=logicOpEnable,logicOp=logicOp,attachmentCount=attachmentCount,pAttachments=pAttachments,blendConstants=blendConstants)
+
+def VkPipelineDynamicStateCreateInfo(sType=VK_STRUCTURE_TYPE_PIPELINE_DYNAMIC_STATE_CREATE_INFO,pNext=None,flags=None,dynamicStateCount=None,pDynamicStates=None,):
+    if dynamicStateCount is None and pDynamicStates is not None:
+        dynamicStateCount = len(pDynamicStates)
+
+    return _new('VkPipelineDynamicStateCreateInfo', sType=sType,pNext=pNext,flags=flags,dynamicStateCount=dynamicStateCount,pDynamicStates=pDynamicStates)
+
+def VkStencilOpState(failOp=None,passOp=None,depthFailOp=None,compareOp=None,compareMask=None,writeMask=None,reference=None,):
+
+    return _new('VkStencilOpState', failOp=failOp,passOp=passOp,depthFailOp=depthFailOp,compareOp=compareOp,compareMask=compareMask,writeMask=writeMask,reference=reference)
+
+def VkPipelineDepthStencilStateCreateInfo(sType=VK_STRUCTURE_TYPE_PIPELINE_DEPTH_STENCIL_STATE_CREATE_INFO,pNext=None,flags=None,depthTestEnable=None,depthWriteEnable=None,depthCompareOp=None,depthBoundsTestEnable=None,stencilTestEnable=None,front=None,back=None,minDepthBounds=None,maxDepthBounds=None,):
+
+    return _new('VkPipelineDepthStencilStateCreateInfo', sType=sType,pNext=pNext,flags=flags,depthTestEnable=depthTestEnable,depthWriteEnable=depthWriteEnable,depthCompareOp=depthCompareOp,depthBoundsTestEnable=depthBoundsTestEnable,stencilTestEnable=stencilTestEnable,front=front,back=back,minDepthBounds=minDepthBounds,maxDepthBounds=maxDepthBounds)
+
+def VkGraphicsPipelineCreateInfo(sType=VK_STRUCTURE_TYPE_GRAPHICS_PIPELINE_CREATE_INFO,pNext=None,flags=None,stageCount=None,pStages=None,pVertexInputState=None,pInputAssemblyState=None,pTessellationState=None,pViewportState=None,pRasterizationState=None,pMultisampleState=None,pDepthStencilState=None,pColorBlendState=None,pDynamicState=None,layout=None,renderPass=None,subpass=None,basePipelineHandle=None,basePipelineIndex=None,):
+    if stageCount is None and pStages is not None:
+        stageCount = len(pStages)
+
+    return _new('VkGraphicsPipelineCreateInfo', sType=sType,pNext=pNext,flags=flags,stageCount=stageCount,pStages=pStages,pVertexInputState=pVertexInputState,pInputAssemblyState=pInputAssemblyState,pTessellationState=pTessellationState,pViewportState=pViewportState,pRasterizationState=pRasterizationState,pMultisampleState=pMultisampleState,pDepthStencilState=pDepthStencilState,pColorBlendState=pColorBlendState,pDynamicState=pDynamicState,layout=layout,renderPass=renderPass,subpass=subpass,basePipelineHandle=basePipelineHandle,basePipelineIndex=basePipelineIndex)
+
+def VkPipelineCacheCreateInfo(sType=VK_STRUCTURE_TYPE_PIPELINE_CACHE_CREATE_INFO,pNext=None,flags=None,initialDataSize=None,pInitialData=None,):
+    if initialDataSize is None and pInitialData is not None:
+        initialDataSize = len(pInitialData)
+
+    return _new('VkPipelineCacheCreateInfo', sType=sType,pNext=pNext,flags=flags,initialDataSize=initialDataSize,pInitialData=pInitialData)
+
+def VkPipelineCacheHeaderVersionOne(headerSize=None,headerVersion=None,vendorID=None,deviceID=None,pipelineCacheUUID=None,):
+
+    return _new('VkPipelineCacheHeaderVersionOne', headerSize=headerSize,headerVersion=headerVersion,vendorID=vendorID,deviceID=deviceID,pipelineCacheUUID=pipelineCacheUUID)
+
+def VkPushConstantRange(stageFlags=None,offset=None,size=None,):
+
+    return _new('VkPushConstantRange', stageFlags=stageFlags,offset=offset,size=size)
+
+def VkPipelineLayoutCreateInfo(sType=VK_STRUCTURE_TYPE_PIPELINE_LAYOUT_CREATE_INFO,pNext=None,flags=None,setLayoutCount=None,pSetLayouts=None,pushConstantRangeCount=None,pPushConstantRanges=None,):
+    if setLayoutCount is None and pSetLayouts is not None:
+        setLayoutCount = len(pSetLayouts)
+    if pushConstantRangeCount is None and pPushConstantRanges is not None:
+        pushConstantRangeCount = len(pPushConstantRanges)
+
+    return _new('VkPipelineLayoutCreateInfo', sType=sType,pNext=pNext,flags=flags,setLayoutCount=setLayoutCount,pSetLayouts=pSetLayouts,pushConstantRangeCount=pushConstantRangeCount,pPushConstantRanges=pPushConstantRanges)
+
+def VkSamplerCreateInfo(sType=VK_STRUCTURE_TYPE_SAMPLER_CREATE_INFO,pNext=None,flags=None,magFilter=None,minFilter=None,mipmapMode=None,addressModeU=None,addressModeV=None,addressModeW=None,mipLodBias=None,anisotropyEnable=None,maxAnisotropy=None,compareEnable=None,compareOp=None,minLod=None,maxLod=None,borderColor=None,unnormalizedCoordinates=None,):
+
+    return _new('VkSamplerCreateInfo', sType=sType,pNext=pNext,flags=flags,magFilter=magFilter,minFilter=minFilter,mipmapMode=mipmapMode,addressModeU=addressModeU,addressModeV=addressModeV,addressModeW=addressModeW,mipLodBias=mipLodBias,anisotropyEnable=anisotropyEnable,maxAnisotropy=maxAnisotropy,compareEnable=compareEnable,compareOp=compareOp,minLod=minLod,maxLod=maxLod,borderColor=borderColor,unnormalizedCoordinates=unnormalizedCoordinates)
+
+def VkCommandPoolCreateInfo(sType=VK_STRUCTURE_TYPE_COMMAND_POOL_CREATE_INFO,pNext=None,flags=None,queueFamilyIndex=None,):
+
+    return _new('VkCommandPoolCreateInfo', sType=sType,pNext=pNext,flags=flags,queueFamilyIndex=queueFamilyIndex)
+
+def VkCommandBufferAllocateInfo(sType=VK_STRUCTURE_TYPE_COMMAND_BUFFER_ALLOCATE_INFO,pNext=None,commandPool=None,level=None,commandBufferCount=None,):
+
+    return _new('VkCommandBufferAllocateInfo', sType=sType,pNext=pNext,commandPool=commandPool,level=level,commandBufferCount=commandBufferCount)
+
+def VkCommandBufferInheritanceInfo(sType=VK_STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_INFO,pNext=None,renderPass=None,subpass=None,framebuffer=None,occlusionQueryEnable=None,queryFlags=None,pipelineStatistics=None,):
+
+    return _new('VkCommandBufferInheritanceInfo', sType=sType,pNext=pNext,renderPass=renderPass,subpass=subpass,framebuffer=framebuffer,occlusionQueryEnable=occlusionQueryEnable,queryFlags=queryFlags,pipelineStatistics=pipelineStatistics)
+
+def VkCommandBufferBeginInfo(sType=VK_STRUCTURE_TYPE_COMMAND_BUFFER_BEGIN_INFO,pNext=None,flags=None,pInheritanceInfo=None,):
+
+    return _new('VkCommandBufferBeginInfo', sType=sType,pNext=pNext,flags=flags,pInheritanceInfo=pInheritanceInfo)
+
+def VkRenderPassBeginInfo(sType=VK_STRUCTURE_TYPE_RENDER_PASS_BEGIN_INFO,pNext=None,renderPass=None,framebuffer=None,renderArea=None,clearValueCount=None,pClearValues=None,):
+    if clearValueCount is None and pClearValues is not None:
+        clearValueCount = len(pClearValues)
+
+    return _new('VkRenderPassBeginInfo', sType=sType,pNext=pNext,renderPass=renderPass,framebuffer=framebuffer,renderArea=renderArea,clearValueCount=clearValueCount,pClearValues=pClearValues)
+
+def VkClearColorValue(float32=None,int32=None,uint32=None,):
+
+    return _new('VkClearColorValue', float32=float32,int32=int32,uint32=uint32)
+
+def VkClearDepthStencilValue(depth=None,stencil=None,):
+
+    return _new('VkClearDepthStencilValue', depth=depth,stencil=stencil)
+
+def VkClearValue(color=None,depthStencil=None,):
+
+    return _new('VkClearValue', color=color,depthStencil=depthStencil)
+
+def VkClearAttachment(aspectMask=None,colorAttachment=None,clearValue=None,):
+
+    return _new('VkClearAttachment', aspectMask=aspectMask,colorAttachment=colorAttachment,clearValue=clearValue)
+
+def VkAttachmentDescription(flags=None,format=None,samples=None,loadOp=None,storeOp=None,stencilLoadOp=None,stencilStoreOp=None,initialLayout=None,finalLayout=None,):
+
+    return _new('VkAttachmentDescription', flags=flags,format=format,samples=samples,loadOp=loadOp,storeOp=storeOp,stencilLoadOp=stencilLoadOp,stencilStoreOp=stencilStoreOp,initialLayout=initialLayout,finalLayout=finalLayout)
+
+def VkAttachmentReference(attachment=None,layout=None,):
+
+    return _new('VkAttachmentReference', attachment=attachment,layout=layout)
+
+def VkSubpassDescription(flags=None,pipelineBindPoint=None,inputAttachmentCount=None,pInputAttachments=None,colorAttachmentCount=None,pColorAttachments=None,pResolveAttachments=None,pDepthStencilAttachment=None,preserveAttachmentCount=None,pPreserveAttachments=None,):
+    if inputAttachmentCount is None and pInputAttachments is not None:
+        inputAttachmentCount = len(pInputAttachments)
+    if colorAttachmentCount is None and pColorAttachments is not None:
+        colorAttachmentCount = len(pColorAttachments)
+    if colorAttachmentCount is None and pResolveAttachments is not None:
+        colorAttachmentCount = len(pResolveAttachments)
+    if preserveAttachmentCount is None and pPreserveAttachments is not None:
+        preserveAttachmentCount = len(pPreserveAttachments)
+
+    return _new('VkSubpassDescription', flags=flags,pipelineBindPoint=pipelineBindPoint,inputAttachmentCount=inputAttachmentCount,pInputAttachments=pInputAttachments,colorAttachmentCount=colorAttachmentCount,pColorAttachments=pColorAttachments,pResolveAttachments=pResolveAttachments,pDepthStencilAttachment=pDepthStencilAttachment,preserveAttachmentCount=preserveAttachmentCount,pPreserveAttachments=pPreserveAttachments)
+
+def VkSubpassDependency(srcSubpass=None,dstSubpass=None,srcStageMask=None,dstStageMask=None,srcAccessMask=None,dstAccessMask=None,dependencyFlags=None,):
+
+    return _new('VkSubpassDependency', srcSubpass=srcSubpass,dstSubpass=dstSubpass,srcStageMask=srcStageMask,dstStageMask=dstStageMask,srcAccessMask=srcAccessMask,dstAccessMask=dstAccessMask,dependencyFlags=dependencyFlags)
+
+def VkRenderPassCreateInfo(sType=VK_STRUCTURE_TYPE_RENDER_PASS_CREATE_INFO,pNext=None,flags=None,attachmentCount=None,pAttachments=None,subpassCount=None,pSubpasses=None,dependencyCount=None,pDependencies=None,):
+    if attachmentCount is None and pAttachments is not None:
+        attachmentCount = len(pAttachments)
+    if subpassCount is None and pSubpasses is not None:
+        subpassCount = len(pSubpasses)
+    if dependencyCount is None and pDependencies is not None:
+        dependencyCount = len(pDependencies)
+
+    return _new('VkRenderPassCreateInfo', sType=sType,pNext=pNext,flags=flags,attachmentCount=attachmentCount,pAttachments=pAttachments,subpassCount=subpassCount,pSubpasses=pSubpasses,dependencyCount=dependencyCount,pDependencies=pDependencies)
+
+def VkEventCreateInfo(sType=VK_STRUCTURE_TYPE_EVENT_CREATE_INFO,pNext=None,flags=None,):
+
+    return _new('VkEventCreateInfo', sType=sType,pNext=pNext,flags=flags)
+
+def VkFenceCreateInfo(sType=VK_STRUCTURE_TYPE_FENCE_CREATE_INFO,pNext=None,flags=None,):
+
+    return _new('VkFenceCreateInfo', sType=sType,pNext=pNext,flags=flags)
+
+def VkPhysicalDeviceFeatures(robustBufferAccess=None,fullDrawIndexUint32=None,imageCubeArray=None,independentBlend=None,geometryShader=None,tessellationShader=None,sampleRateShading=None,dualSrcBlend=None,logicOp=None,multiDrawIndirect=None,drawIndirectFirstInstance=None,depthClamp=None,depthBiasClamp=None,fillModeNonSolid=None,depthBounds=None,wideLines=None,largePoints=None,alphaToOne=None,multiViewport=None,samplerAnisotropy=None,textureCompressionETC2=None,textureCompressionASTC_LDR=None,textureCompressionBC=None,occlusionQueryPrecise=None,pipelineStatisticsQuery=None,vertexPipelineStoresAndAtomics=None,fragmentStoresAndAtomics=None,shaderTessellationAndGeometryPointSize=None,shaderImageGatherExtended=None,shaderStorageImageExtendedFormats=None,shaderStorageImageMultisample=None,shaderStorageImageReadWithoutFormat=None,shaderStorageImageWriteWithoutFormat=None,shaderUniformBufferArrayDynamicIndexing=None,shaderSampledImageArrayDynamicIndexing=None,shaderStorageBufferArrayDynamicIndexing=None,shaderStorageImageArrayDynamicIndexing=None,shaderClipDistance=None,shaderCullDistance=None,shaderFloat64=None,shaderInt64=None,shaderInt16=None,shaderResourceResidency=None,shaderResourceMinLod=None,sparseBinding=None,sparseResidencyBuffer=None,sparseResidencyImage2D=None,sparseResidencyImage3D=None,sparseResidency2Samples=None,sparseResidency4Samples=None,sparseResidency8Samples=None,sparseResidency16Samples=None,sparseResidencyAliased=None,variableMultisampleRate=None,inheritedQueries=None,):
+
+    return _new('VkPhysicalDeviceFeatures', robustBufferAccess=robustBufferAccess,fullDrawIndexUint32=fullDrawIndexUint32,imageCubeArray=imageCubeArray,independentBlend=independentBlend,geometryShader=geometryShader,tessellationShader=tessellationShader,sampleRateShading=sampleRateShading,dualSrcBlend=dualSrcBlend,logicOp=logicOp,multiDrawIndirect=multiDrawIndirect,drawIndirectFirstInstance=drawIndirectFirstInstance,depthClamp=depthClamp,depthBiasClamp=depthBiasClamp,fillModeNonSolid=fillModeNonSolid,depthBounds=depthBounds,wideLines=wideLines,largePoints=largePoints,alphaToOne=alphaToOne,multiViewport=multiViewport,samplerAnisotropy=samplerAnisotropy,textureCompressionETC2=textureCompressionETC2,textureCompressionASTC_LDR=textureCompressionASTC_LDR,textureCompressionBC=textureCompressionBC,occlusionQueryPrecise=occlusionQueryPrecise,pipelineStatisticsQuery=pipelineStatisticsQuery,vertexPipelineStoresAndAtomics=vertexPipelineStoresAndAtomics,fragmentStoresAndAtomics=fragmentStoresAndAtomics,shaderTessellationAndGeometryPointSize=shaderTessellationAndGeometryPointSize,shaderImageGatherExtended=shaderImageGatherExtended,shaderStorageImageExtendedFormats=shaderStorageImageExtendedFormats,shaderStorageImageMultisample=shaderStorageImageMultisample,shaderStorageImageReadWithoutFormat=shaderStorageImageReadWithoutFormat,shaderStorageImageWriteWithoutFormat=shaderStorageImageWriteWithoutFormat,shaderUniformBufferArrayDynamicIndexing=shaderUniformBufferArrayDynamicIndexing,shaderSampledImageArrayDynamicIndexing=shaderSampledImageArrayDynamicIndexing,shaderStorageBufferArrayDynamicIndexing=shaderStorageBufferArrayDynamicIndexing,shaderStorageImageArrayDynamicIndexing=shaderStorageImageArrayDynamicIndexing,shaderClipDistance=shaderClipDistance,shaderCullDistance=shaderCullDistance,shaderFloat64=shaderFloat64,shaderInt64=shaderInt64,shaderInt16=shaderInt16,shaderResourceResidency=shaderResourceResidency,shaderResourceMinLod=shaderResourceMinLod,sparseBinding=sparseBinding,sparseResidencyBuffer=sparseResidencyBuffer,sparseResidencyImage2D=sparseResidencyImage2D,sparseResidencyImage3D=sparseResidencyImage3D,sparseResidency2Samples=sparseResidency2Samples,sparseResidency4Samples=sparseResidency4Samples,sparseResidency8Samples=sparseResidency8Samples,sparseResidency16Samples=sparseResidency16Samples,sparseResidencyAliased=sparseResidencyAliased,variableMultisampleRate=variableMultisampleRate,inheritedQueries=inheritedQueries)
+
+def VkPhysicalDeviceSparseProperties(residencyStandard2DBlockShape=None,residencyStandard2DMultisampleBlockShape=None,residencyStandard3DBlockShape=None,residencyAlignedMipSize=None,residencyNonResidentStrict=None,):
+
+    return _new('VkPhysicalDeviceSparseProperties', residencyStandard2DBlockShape=residencyStandard2DBlockShape,residencyStandard2DMultisampleBlockShape=residencyStandard2DMultisampleBlockShape,residencyStandard3DBlockShape=residencyStandard3DBlockShape,residencyAlignedMipSize=residencyAlignedMipSize,residencyNonResidentStrict=residencyNonResidentStrict)
+
+def VkPhysicalDeviceLimits(maxImageDimension1D=None,maxImageDimension2D=None,maxImageDimension3D=None,maxImageDimensionCube=None,maxImageArrayLayers=None,maxTexelBufferElements=None,maxUniformBufferRange=None,maxStorageBufferRange=None,maxPushConstantsSize=None,maxMemoryAllocationCount=None,maxSamplerAllocationCount=None,bufferImageGranularity=None,sparseAddressSpaceSize=None,maxBoundDescriptorSets=None,maxPerStageDescriptorSamplers=None,maxPerStageDescriptorUniformBuffers=None,maxPerStageDescriptorStorageBuffers=None,maxPerStageDescriptorSampledImages=None,maxPerStageDescriptorStorageImages=None,maxPerStageDescriptorInputAttachments=None,maxPerStageResources=None,maxDescriptorSetSamplers=None,maxDescriptorSetUniformBuffers=None,maxDescriptorSetUniformBuffersDynamic=None,maxDescriptorSetStorageBuffers=None,maxDescriptorSetStorageBuffersDynamic=None,maxDescriptorSetSampledImages=None,maxDescriptorSetStorageImages=None,maxDescriptorSetInputAttachments=None,maxVertexInputAttributes=None,maxVertexInputBindings=None,maxVertexInputAttributeOffset=None,maxVertexInputBindingStride=None,maxVertexOutputComponents=None,maxTessellationGenerationLevel=None,maxTessellationPatchSize=None,maxTessellationControlPerVertexInputComponents=None,maxTessellationControlPerVertexOutputComponents=None,maxTessellationControlPerPatchOutputComponents=None,maxTessellationControlTotalOutputComponents=None,maxTessellationEvaluationInputComponents=None,maxTessellationEvaluationOutputComponents=None,maxGeometryShaderInvocations=None,maxGeometryInputComponents=None,maxGeometryOutputComponents=None,maxGeometryOutputVertices=None,maxGeometryTotalOutputComponents=None,maxFragmentInputComponents=None,maxFragmentOutputAttachments=None,maxFragmentDualSrcAttachments=None,maxFragmentCombinedOutputResources=None,maxComputeSharedMemorySize=None,maxComputeWorkGroupCount=None,maxComputeWorkGroupInvocations=None,maxComputeWorkGroupSize=None,subPixelPrecisionBits=None,subTexelPrecisionBits=None,mipmapPrecisionBits=None,maxDrawIndexedIndexValue=None,maxDrawIndirectCount=None,maxSamplerLodBias=None,maxSamplerAnisotropy=None,maxViewports=None,maxViewportDimensions=None,viewportBoundsRange=None,viewportSubPixelBits=None,minMemoryMapAlignment=None,minTexelBufferOffsetAlignment=None,minUniformBufferOffsetAlignment=None,minStorageBufferOffsetAlignment=None,minTexelOffset=None,maxTexelOffset=None,minTexelGatherOffset=None,maxTexelGatherOffset=None,minInterpolationOffset=None,maxInterpolationOffset=None,subPixelInterpolationOffsetBits=None,maxFramebufferWidth=None,maxFramebufferHeight=None,maxFramebufferLayers=None,framebufferColorSampleCounts=None,framebufferDepthSampleCounts=None,framebufferStencilSampleCounts=None,framebufferNoAttachmentsSampleCounts=None,maxColorAttachments=None,sampledImageColorSampleCounts=None,sampledImageIntegerSampleCounts=None,sampledImageDepthSampleCounts=None,sampledImageStencilSampleCounts=None,storageImageSampleCounts=None,maxSampleMaskWords=None,timestampComputeAndGraphics=None,timestampPeriod=None,maxClipDistances=None,maxCullDistances=None,maxCombinedClipAndCullDistances=None,discreteQueuePriorities=None,pointSizeRange=None,lineWidthRange=None,pointSizeGranularity=None,lineWidthGranularity=None,strictLines=None,standardSampleLocations=None,optimalBufferCopyOffsetAlignment=None,optimalBufferCopyRowPitchAlignment=None,nonCoherentAtomSize=None,):
+
+    return _new('VkPhysicalDeviceLimits', maxImageDimension1D=maxImageDimension1D,maxImageDimension2D=maxImageDimension2D,maxImageDimension3D=maxImageDimension3D,maxImageDimensionCube=maxImageDimensionCube,maxImageArrayLayers=maxImageArrayLayers,maxTexelBufferElements=maxTexelBufferElements,maxUniformBufferRange=maxUniformBufferRange,maxStorageBufferRange=maxStorageBufferRange,maxPushConstantsSize=maxPushConstantsSize,maxMemoryAllocationCount=maxMemoryAllocationCount,maxSamplerAllocationCount=maxSamplerAllocationCount,bufferImageGranularity=bufferImageGranularity,sparseAddressSpaceSize=sparseAddressSpaceSize,maxBoundDescriptorSets=maxBoundDescriptorSets,maxPerStageDescriptorSamplers=maxPerStageDescriptorSamplers,maxPerStageDescriptorUniformBuffers=maxPerStageDescriptorUniformBuffers,maxPerStageDescriptorStorageBuffers=maxPerStageDescriptorStorageBuffers,maxPerStageDescriptorSampledImages=maxPerStageDescriptorSampledImages,maxPerStageDescriptorStorageImages=maxPerStageDescriptorStorageImages,maxPerStageDescriptorInputAttachments=maxPerStageDescriptorInputAttachments,maxPerStageResources=maxPerStageResources,maxDescriptorSetSamplers=maxDescriptorSetSamplers,maxDescriptorSetUniformBuffers=maxDescriptorSetUniformBuffers,maxDescriptorSetUniformBuffersDynamic=maxDescriptorSetUniformBuffersDynamic,maxDescriptorSetStorageBuffers=maxDescriptorSetStorageBuffers,maxDescriptorSetStorageBuffersDynamic=maxDescriptorSetStorageBuffersDynamic,maxDescriptorSetSampledImages=maxDescriptorSetSampledImages,maxDescriptorSetStorageImages=maxDescriptorSetStorageImages,maxDescriptorSetInputAttachments=maxDescriptorSetInputAttachments,maxVertexInputAttributes=maxVertexInputAttributes,maxVertexInputBindings=maxVertexInputBindings,maxVertexInputAttributeOffset=maxVertexInputAttributeOffset,maxVertexInputBindingStride=maxVertexInputBindingStride,maxVertexOutputComponents=maxVertexOutputComponents,maxTessellationGenerationLevel=maxTessellationGenerationLevel,maxTessellationPatchSize=maxTessellationPatchSize,maxTessellationControlPerVertexInputComponents=maxTessellationControlPerVertexInputComponents,maxTessellationControlPerVertexOutputComponents=maxTessellationControlPerVertexOutputComponents,maxTessellationControlPerPatchOutputComponents=maxTessellationControlPerPatchOutputComponents,maxTessellationControlTotalOutputComponents=maxTessellationControlTotalOutputComponents,maxTessellationEvaluationInputComponents=maxTessellationEvaluationInputComponents,maxTessellationEvaluationOutputComponents=maxTessellationEvaluationOutputComponents,maxGeometryShaderInvocations=maxGeometryShaderInvocations,maxGeometryInputComponents=maxGeometryInputComponents,maxGeometryOutputComponents=maxGeometryOutputComponents,maxGeometryOutputVertices=maxGeometryOutputVertices,maxGeometryTotalOutputComponents=maxGeometryTotalOutputComponents,maxFragmentInputComponents=maxFragmentInputComponents,maxFragmentOutputAttachments=maxFragmentOutputAttachments,maxFragmentDualSrcAttachments=maxFragmentDualSrcAttachments,maxFragmentCombinedOutputResources=maxFragmentCombinedOutputResources,maxComputeSharedMemorySize=maxComputeSharedMemorySize,maxComputeWorkGroupCount=maxComputeWorkGroupCount,maxComputeWorkGroupInvocations=maxComputeWorkGroupInvocations,maxComputeWorkGroupSize=maxComputeWorkGroupSize,subPixelPrecisionBits=subPixelPrecisionBits,subTexelPrecisionBits=subTexelPrecisionBits,mipmapPrecisionBits=mipmapPrecisionBits,maxDrawIndexedIndexValue=maxDrawIndexedIndexValue,maxDrawIndirectCount=maxDrawIndirectCount,maxSamplerLodBias=maxSamplerLodBias,maxSamplerAnisotropy=maxSamplerAnisotropy,maxViewports=maxViewports,maxViewportDimensions=maxViewportDimensions,viewportBoundsRange=viewportBoundsRange,viewportSubPixelBits=viewportSubPixelBits,minMemoryMapAlignment=minMemoryMapAlignment,minTexelBufferOffsetAlignment=minTexelBufferOffsetAlignment,minUniformBufferOffsetAlignment=minUniformBufferOffsetAlignment,minStorageBufferOffsetAlignment=minStorageBufferOffsetAlignment,minTexelOffset=minTexelOffset,maxTexelOffset=maxTexelOffset,minTexelGatherOffset=minTexelGatherOffset,maxTexelGatherOffset=maxTexelGatherOffset,minInterpolationOffset=minInterpolationOffset,maxInterpolationOffset=maxInterpolationOffset,subPixelInterpolationOffsetBits=subPixelInterpolationOffsetBits,maxFramebufferWidth=maxFramebufferWidth,maxFramebufferHeight=maxFramebufferHeight,maxFramebufferLayers=maxFramebufferLayers,framebufferColorSampleCounts=framebufferColorSampleCounts,framebufferDepthSampleCounts=framebufferDepthSampleCounts,framebufferStencilSampleCounts=framebufferStencilSampleCounts,framebufferNoAttachmentsSampleCounts=framebufferNoAttachmentsSampleCounts,maxColorAttachments=maxColorAttachments,sampledImageColorSampleCounts=sampledImageColorSampleCounts,sampledImageIntegerSampleCounts=sampledImageIntegerSampleCounts,sampledImageDepthSampleCounts=sampledImageDepthSampleCounts,sampledImageStencilSampleCounts=sampledImageStencilSampleCounts,storageImageSampleCounts=storageImageSampleCounts,maxSampleMaskWords=maxSampleMaskWords,timestampComputeAndGraphics=timestampComputeAndGraphics,timestampPeriod=timestampPeriod,maxClipDistances=maxClipDistances,maxCullDistances=maxCullDistances,maxCombinedClipAndCullDistances=maxCombinedClipAndCullDistances,discreteQueuePriorities=discreteQueuePriorities,pointSizeRange=pointSizeRange,lineWidthRange=lineWidthRange,pointSizeGranularity=pointSizeGranularity,lineWidthGranularity=lineWidthGranularity,strictLines=strictLines,standardSampleLocations=standardSampleLocations,optimalBufferCopyOffsetAlignment=optimalBufferCopyOffsetAlignment,optimalBufferCopyRowPitchAlignment=optimalBufferCopyRowPitchAlignment,nonCoherentAtomSize=nonCoherentAtomSize)
+
+def VkSemaphoreCreateInfo(sType=VK_STRUCTURE_TYPE_SEMAPHORE_CREATE_INFO,pNext=None,flags=None,):
+
+    return _new('VkSemaphoreCreateInfo', sType=sType,pNext=pNext,flags=flags)
+
+def VkQueryPoolCreateInfo(sType=VK_STRUCTURE_TYPE_QUERY_POOL_CREATE_INFO,pNext=None,flags=None,queryType=None,queryCount=None,pipelineStatistics=None,):
+
+    return _new('VkQueryPoolCreateInfo', sType=sType,pNext=pNext,flags=flags,queryType=queryType,queryCount=queryCount,pipelineStatistics=pipelineStatistics)
+
+def VkFramebufferCreateInfo(sType=VK_STRUCTURE_TYPE_FRAMEBUFFER_CREATE_INFO,pNext=None,flags=None,renderPass=None,attachmentCount=None,pAttachments=None,width=None,height=None,layers=None,):
+    if attachmentCount is None and pAttachments is not None:
+        attachmentCount = len(pAttachments)
+
+    return _new('VkFramebufferCreateInfo', sType=sType,pNext=pNext,flags=flags,renderPass=renderPass,attachmentCount=attachmentCount,pAttachments=pAttachments,width=width,height=height,layers=layers)
+
+def VkDrawIndirectCommand(vertexCount=None,instanceCount=None,firstVertex=None,firstInstance=None,):
+
+    return _new('VkDrawIndirectCommand', vertexCount=vertexCount,instanceCount=instanceCount,firstVertex=firstVertex,firstInstance=firstInstance)
+
+def VkDrawIndexedIndirectCommand(indexCount=None,instanceCount=None,firstIndex=None,vertexOffset=None,firstInstance=None,):
+
+    return _new('VkDrawIndexedIndirectCommand', indexCount=indexCount,instanceCount=instanceCount,firstIndex=firstIndex,vertexOffset=vertexOffset,firstInstance=firstInstance)
+
+def VkDispatchIndirectCommand(x=None,y=None,z=None,):
+
+    return _new('VkDispatchIndirectCommand', x=x,y=y,z=z)
+
+def VkSubmitInfo(sType=VK_STRUCTURE_TYPE_SUBMIT_INFO,pNext=None,waitSemaphoreCount=None,pWaitSemaphores=None,pWaitDstStageMask=None,commandBufferCount=None,pCommandBuffers=None,signalSemaphoreCount=None,pSignalSemaphores=None,):
+    if waitSemaphoreCount is None and pWaitSemaphores is not None:
+        waitSemaphoreCount = len(pWaitSemaphores)
+    if waitSemaphoreCount is None and pWaitDstStageMask is not None:
+        waitSemaphoreCount = len(pWaitDstStageMask)
+    if commandBufferCount is None and pCommandBuffers is not None:
+        commandBufferCount = len(pCommandBuffers)
+    if signalSemaphoreCount is None and pSignalSemaphores is not None:
+        signalSemaphoreCount = len(pSignalSemaphores)
+
+    return _new('VkSubmitInfo', sType=sType,pNext=pNext,waitSemaphoreCount=waitSemaphoreCount,pWaitSemaphores=pWaitSemaphores,pWaitDstStageMask=pWaitDstStageMask,commandBufferCount=commandBufferCount,pCommandBuffers=pCommandBuffers,signalSemaphoreCount=signalSemaphoreCount,pSignalSemaphores=pSignalSemaphores)
+
+
+
+
+
+
+
+
+
+
+def vkCreateInstance(
+pCreateInfo
+        ,pAllocator
+        ,pInstance=None
+        ,):
+    _args = _arg_types('vkCreateInstance', lib.vkCreateInstance)
+
+
+    custom_return = True
+    if not pInstance:
+        pInstance = ffi.new('VkInstance*')
+        custom_return = False
+
+    result = lib.vkCreateInstance(_auto_handle(pCreateInfo, _args[0]),_auto_handle(pAllocator, _args[1]),_auto_handle(pInstance, _args[2]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pInstance
+
+    return pInstance[0]
+
+
+
+def vkDestroyInstance(
+instance
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkDestroyInstance', lib.vkDestroyInstance)
+
+    result = lib.vkDestroyInstance(_handle(instance, 'VkInstance'),_auto_handle(pAllocator, _args[1]))
+
+
+def vkEnumeratePhysicalDevices(
+instance
+        ,pPhysicalDevices=None
+        ,):
+
+
+    pPhysicalDeviceCount = ffi.new('uint32_t*')
+    custom_return = pPhysicalDevices is not None
+    _array = pPhysicalDevices
+
+    if custom_return:
+        # the buffer is usually big enough, one call instead of two
+        pPhysicalDeviceCount[0] = len(_array)
+        result = lib.vkEnumeratePhysicalDevices(_handle(instance, 'VkInstance'),pPhysicalDeviceCount,pPhysicalDevices)
+    else:
+        result = VK_INCOMPLETE
+
+    # the count can change between the two calls
+    while result == VK_INCOMPLETE:
+        pPhysicalDevices = ffi.NULL
+        result = lib.vkEnumeratePhysicalDevices(_handle(instance, 'VkInstance'),pPhysicalDeviceCount,pPhysicalDevices)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if _array is None or len(_array) < pPhysicalDeviceCount[0]:
+            _array = ffi.new('VkPhysicalDevice[]', pPhysicalDeviceCount[0])
+        pPhysicalDevices = _array
+        result = lib.vkEnumeratePhysicalDevices(_handle(instance, 'VkInstance'),pPhysicalDeviceCount,pPhysicalDevices)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if pPhysicalDeviceCount[0] != len(_array):
+        pPhysicalDevices = _slice(_array, pPhysicalDeviceCount[0])
+
+    return pPhysicalDevices
+
+
+def vkGetPhysicalDeviceProperties(
+physicalDevice
+        ,pProperties=None
+        ,):
+    _args = _arg_types('vkGetPhysicalDeviceProperties', lib.vkGetPhysicalDeviceProperties)
+
+
+    custom_return = True
+    if not pProperties:
+        pProperties = ffi.new('VkPhysicalDeviceProperties*')
+        custom_return = False
+
+    result = lib.vkGetPhysicalDeviceProperties(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pProperties, _args[1]))
+
+    if custom_return:
+        return pProperties
+
+    return StrWrap(pProperties[0])
+
+
+
+def vkGetPhysicalDeviceQueueFamilyProperties(
+physicalDevice
+        ,pQueueFamilyProperties=None
+        ,):
+
+
+    pQueueFamilyPropertyCount = ffi.new('uint32_t*')
+    custom_return = pQueueFamilyProperties is not None
+    _array = pQueueFamilyProperties
+
+    pQueueFamilyProperties = ffi.NULL
+    lib.vkGetPhysicalDeviceQueueFamilyProperties(_handle(physicalDevice, 'VkPhysicalDevice'),pQueueFamilyPropertyCount,pQueueFamilyProperties)
+
+    if _array is None or len(_array) < pQueueFamilyPropertyCount[0]:
+        _array = ffi.new('VkQueueFamilyProperties[]', pQueueFamilyPropertyCount[0])
+    pQueueFamilyProperties = _array
+    lib.vkGetPhysicalDeviceQueueFamilyProperties(_handle(physicalDevice, 'VkPhysicalDevice'),pQueueFamilyPropertyCount,pQueueFamilyProperties)
+
+    if pQueueFamilyPropertyCount[0] != len(_array):
+        pQueueFamilyProperties = _slice(_array, pQueueFamilyPropertyCount[0])
+
+    return pQueueFamilyProperties
+
+
+def vkGetPhysicalDeviceMemoryProperties(
+physicalDevice
+        ,pMemoryProperties=None
+        ,):
+    _args = _arg_types('vkGetPhysicalDeviceMemoryProperties', lib.vkGetPhysicalDeviceMemoryProperties)
+
+
+    custom_return = True
+    if not pMemoryProperties:
+        pMemoryProperties = ffi.new('VkPhysicalDeviceMemoryProperties*')
+        custom_return = False
+
+    result = lib.vkGetPhysicalDeviceMemoryProperties(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pMemoryProperties, _args[1]))
+
+    if custom_return:
+        return pMemoryProperties
+
+    return pMemoryProperties[0]
+
+
+
+def vkGetPhysicalDeviceFeatures(
+physicalDevice
+        ,pFeatures=None
+        ,):
+    _args = _arg_types('vkGetPhysicalDeviceFeatures', lib.vkGetPhysicalDeviceFeatures)
+
+
+    custom_return = True
+    if not pFeatures:
+        pFeatures = ffi.new('VkPhysicalDeviceFeatures*')
+        custom_return = False
+
+    result = lib.vkGetPhysicalDeviceFeatures(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pFeatures, _args[1]))
+
+    if custom_return:
+        return pFeatures
+
+    return pFeatures[0]
+
+
+
+def vkGetPhysicalDeviceFormatProperties(
+physicalDevice
+        ,format
+        ,pFormatProperties=None
+        ,):
+    _args = _arg_types('vkGetPhysicalDeviceFormatProperties', lib.vkGetPhysicalDeviceFormatProperties)
+
+
+    custom_return = True
+    if not pFormatProperties:
+        pFormatProperties = ffi.new('VkFormatProperties*')
+        custom_return = False
+
+    result = lib.vkGetPhysicalDeviceFormatProperties(_handle(physicalDevice, 'VkPhysicalDevice'),format,_auto_handle(pFormatProperties, _args[2]))
+
+    if custom_return:
+        return pFormatProperties
+
+    return pFormatProperties[0]
+
+
+
+def vkGetPhysicalDeviceImageFormatProperties(
+physicalDevice
+        ,format
+        ,type
+        ,tiling
+        ,usage
+        ,flags
+        ,pImageFormatProperties=None
+        ,):
+    _args = _arg_types('vkGetPhysicalDeviceImageFormatProperties', lib.vkGetPhysicalDeviceImageFormatProperties)
+
+
+    custom_return = True
+    if not pImageFormatProperties:
+        pImageFormatProperties = ffi.new('VkImageFormatProperties*')
+        custom_return = False
+
+    result = lib.vkGetPhysicalDeviceImageFormatProperties(_handle(physicalDevice, 'VkPhysicalDevice'),format,type,tiling,usage,flags,_auto_handle(pImageFormatProperties, _args[6]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pImageFormatProperties
+
+    return pImageFormatProperties[0]
+
+
+
+def vkCreateDevice(
+physicalDevice
+        ,pCreateInfo
+        ,pAllocator
+        ,pDevice=None
+        ,):
+    _args = _arg_types('vkCreateDevice', lib.vkCreateDevice)
+
+
+    custom_return = True
+    if not pDevice:
+        pDevice = ffi.new('VkDevice*')
+        custom_return = False
+
+    result = lib.vkCreateDevice(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pDevice, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pDevice
+
+    return pDevice[0]
+
+
+
+def vkCreateDevice(
+physicalDevice
+        ,pCreateInfo
+        ,pAllocator
+        ,pDevice=None
+        ,):
+    _args = _arg_types('vkCreateDevice', lib.vkCreateDevice)
+
+
+    custom_return = True
+    if not pDevice:
+        pDevice = ffi.new('VkDevice*')
+        custom_return = False
+
+    result = lib.vkCreateDevice(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pDevice, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pDevice
+
+    return pDevice[0]
+
+
+
+def vkDestroyDevice(
+device
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkDestroyDevice', lib.vkDestroyDevice)
+
+    result = lib.vkDestroyDevice(_handle(device, 'VkDevice'),_auto_handle(pAllocator, _args[1]))
+
+
+def vkEnumerateInstanceLayerProperties(
+pProperties=None
+        ,):
+
+
+    pPropertyCount = ffi.new('uint32_t*')
+    custom_return = pProperties is not None
+    _array = pProperties
+
+    if custom_return:
+        # the buffer is usually big enough, one call instead of two
+        pPropertyCount[0] = len(_array)
+        result = lib.vkEnumerateInstanceLayerProperties(pPropertyCount,pProperties)
+    else:
+        result = VK_INCOMPLETE
+
+    # the count can change between the two calls
+    while result == VK_INCOMPLETE:
+        pProperties = ffi.NULL
+        result = lib.vkEnumerateInstanceLayerProperties(pPropertyCount,pProperties)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if _array is None or len(_array) < pPropertyCount[0]:
+            _array = ffi.new('VkLayerProperties[]', pPropertyCount[0])
+        pProperties = _array
+        result = lib.vkEnumerateInstanceLayerProperties(pPropertyCount,pProperties)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if pPropertyCount[0] != len(_array):
+        pProperties = _slice(_array, pPropertyCount[0])
+
+    if not custom_return:
+        # the generator keeps the array alive
+        return (StrWrap(x) for x in pProperties)
+    return pProperties
+
+
+def vkEnumerateInstanceExtensionProperties(
+pLayerName
+        ,pProperties=None
+        ,):
+    _args = _arg_types('vkEnumerateInstanceExtensionProperties', lib.vkEnumerateInstanceExtensionProperties)
+
+
+    pPropertyCount = ffi.new('uint32_t*')
+    custom_return = pProperties is not None
+    _array = pProperties
+
+    if custom_return:
+        # the buffer is usually big enough, one call instead of two
+        pPropertyCount[0] = len(_array)
+        result = lib.vkEnumerateInstanceExtensionProperties(_auto_handle(pLayerName, _args[0]),pPropertyCount,pProperties)
+    else:
+        result = VK_INCOMPLETE
+
+    # the count can change between the two calls
+    while result == VK_INCOMPLETE:
+        pProperties = ffi.NULL
+        result = lib.vkEnumerateInstanceExtensionProperties(_auto_handle(pLayerName, _args[0]),pPropertyCount,pProperties)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if _array is None or len(_array) < pPropertyCount[0]:
+            _array = ffi.new('VkExtensionProperties[]', pPropertyCount[0])
+        pProperties = _array
+        result = lib.vkEnumerateInstanceExtensionProperties(_auto_handle(pLayerName, _args[0]),pPropertyCount,pProperties)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if pPropertyCount[0] != len(_array):
+        pProperties = _slice(_array, pPropertyCount[0])
+
+    if not custom_return:
+        # the generator keeps the array alive
+        return (StrWrap(x) for x in pProperties)
+    return pProperties
+
+
+def vkEnumerateDeviceLayerProperties(
+physicalDevice
+        ,pProperties=None
+        ,):
+
+
+    pPropertyCount = ffi.new('uint32_t*')
+    custom_return = pProperties is not None
+    _array = pProperties
+
+    if custom_return:
+        # the buffer is usually big enough, one call instead of two
+        pPropertyCount[0] = len(_array)
+        result = lib.vkEnumerateDeviceLayerProperties(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+    else:
+        result = VK_INCOMPLETE
+
+    # the count can change between the two calls
+    while result == VK_INCOMPLETE:
+        pProperties = ffi.NULL
+        result = lib.vkEnumerateDeviceLayerProperties(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if _array is None or len(_array) < pPropertyCount[0]:
+            _array = ffi.new('VkLayerProperties[]', pPropertyCount[0])
+        pProperties = _array
+        result = lib.vkEnumerateDeviceLayerProperties(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if pPropertyCount[0] != len(_array):
+        pProperties = _slice(_array, pPropertyCount[0])
+
+    if not custom_return:
+        # the generator keeps the array alive
+        return (StrWrap(x) for x in pProperties)
+    return pProperties
+
+
+def vkEnumerateDeviceLayerProperties(
+physicalDevice
+        ,pProperties=None
+        ,):
+
+
+    pPropertyCount = ffi.new('uint32_t*')
+    custom_return = pProperties is not None
+    _array = pProperties
+
+    if custom_return:
+        # the buffer is usually big enough, one call instead of two
+        pPropertyCount[0] = len(_array)
+        result = lib.vkEnumerateDeviceLayerProperties(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+    else:
+        result = VK_INCOMPLETE
+
+    # the count can change between the two calls
+    while result == VK_INCOMPLETE:
+        pProperties = ffi.NULL
+        result = lib.vkEnumerateDeviceLayerProperties(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if _array is None or len(_array) < pPropertyCount[0]:
+            _array = ffi.new('VkLayerProperties[]', pPropertyCount[0])
+        pProperties = _array
+        result = lib.vkEnumerateDeviceLayerProperties(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if pPropertyCount[0] != len(_array):
+        pProperties = _slice(_array, pPropertyCount[0])
+
+    if not custom_return:
+        # the generator keeps the array alive
+        return (StrWrap(x) for x in pProperties)
+    return pProperties
+
+
+def vkEnumerateDeviceExtensionProperties(
+physicalDevice
+        ,pLayerName
+        ,pProperties=None
+        ,):
+    _args = _arg_types('vkEnumerateDeviceExtensionProperties', lib.vkEnumerateDeviceExtensionProperties)
+
+
+    pPropertyCount = ffi.new('uint32_t*')
+    custom_return = pProperties is not None
+    _array = pProperties
+
+    if custom_return:
+        # the buffer is usually big enough, one call instead of two
+        pPropertyCount[0] = len(_array)
+        result = lib.vkEnumerateDeviceExtensionProperties(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pLayerName, _args[1]),pPropertyCount,pProperties)
+    else:
+        result = VK_INCOMPLETE
+
+    # the count can change between the two calls
+    while result == VK_INCOMPLETE:
+        pProperties = ffi.NULL
+        result = lib.vkEnumerateDeviceExtensionProperties(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pLayerName, _args[1]),pPropertyCount,pProperties)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if _array is None or len(_array) < pPropertyCount[0]:
+            _array = ffi.new('VkExtensionProperties[]', pPropertyCount[0])
+        pProperties = _array
+        result = lib.vkEnumerateDeviceExtensionProperties(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pLayerName, _args[1]),pPropertyCount,pProperties)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if pPropertyCount[0] != len(_array):
+        pProperties = _slice(_array, pPropertyCount[0])
+
+    if not custom_return:
+        # the generator keeps the array alive
+        return (StrWrap(x) for x in pProperties)
+    return pProperties
+
+
+def vkGetDeviceQueue(
+device
+        ,queueFamilyIndex
+        ,queueIndex
+        ,pQueue=None
+        ,):
+    _args = _arg_types('vkGetDeviceQueue', lib.vkGetDeviceQueue)
+
+
+    custom_return = True
+    if not pQueue:
+        pQueue = ffi.new('VkQueue*')
+        custom_return = False
+
+    result = lib.vkGetDeviceQueue(_handle(device, 'VkDevice'),queueFamilyIndex,queueIndex,_auto_handle(pQueue, _args[3]))
+
+    if custom_return:
+        return pQueue
+
+    return pQueue[0]
+
+
+
+def vkQueueSubmit(
+queue
+        ,submitCount
+        ,pSubmits
+        ,fence
+        ,):
+    _args = _arg_types('vkQueueSubmit', lib.vkQueueSubmit)
+
+    result = lib.vkQueueSubmit(_handle(queue, 'VkQueue'),submitCount,_auto_handle(pSubmits, _args[2]),_handle(fence, 'VkFence'))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def vkQueueWaitIdle(
+queue
+        ,):
+
+    result = lib.vkQueueWaitIdle(_handle(queue, 'VkQueue'))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def vkDeviceWaitIdle(
+device
+        ,):
+
+    result = lib.vkDeviceWaitIdle(_handle(device, 'VkDevice'))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def vkAllocateMemory(
+device
+        ,pAllocateInfo
+        ,pAllocator
+        ,pMemory=None
+        ,):
+    _args = _arg_types('vkAllocateMemory', lib.vkAllocateMemory)
+
+
+    custom_return = True
+    if not pMemory:
+        pMemory = ffi.new('VkDeviceMemory*')
+        custom_return = False
+
+    result = lib.vkAllocateMemory(_handle(device, 'VkDevice'),_auto_handle(pAllocateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pMemory, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pMemory
+
+    return pMemory[0]
+
+
+
+def vkFreeMemory(
+device
+        ,memory
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkFreeMemory', lib.vkFreeMemory)
+
+    result = lib.vkFreeMemory(_handle(device, 'VkDevice'),_handle(memory, 'VkDeviceMemory'),_auto_handle(pAllocator, _args[2]))
+
+
+def vkUnmapMemory(
+device
+        ,memory
+        ,):
+
+    result = lib.vkUnmapMemory(_handle(device, 'VkDevice'),_handle(memory, 'VkDeviceMemory'))
+
+
+def vkFlushMappedMemoryRanges(
+device
+        ,memoryRangeCount
+        ,pMemoryRanges
+        ,):
+    _args = _arg_types('vkFlushMappedMemoryRanges', lib.vkFlushMappedMemoryRanges)
+
+    result = lib.vkFlushMappedMemoryRanges(_handle(device, 'VkDevice'),memoryRangeCount,_auto_handle(pMemoryRanges, _args[2]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def vkInvalidateMappedMemoryRanges(
+device
+        ,memoryRangeCount
+        ,pMemoryRanges
+        ,):
+    _args = _arg_types('vkInvalidateMappedMemoryRanges', lib.vkInvalidateMappedMemoryRanges)
+
+    result = lib.vkInvalidateMappedMemoryRanges(_handle(device, 'VkDevice'),memoryRangeCount,_auto_handle(pMemoryRanges, _args[2]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def vkGetDeviceMemoryCommitment(
+device
+        ,memory
+        ,pCommittedMemoryInBytes=None
+        ,):
+    _args = _arg_types('vkGetDeviceMemoryCommitment', lib.vkGetDeviceMemoryCommitment)
+
+
+    custom_return = True
+    if not pCommittedMemoryInBytes:
+        pCommittedMemoryInBytes = ffi.new('VkDeviceSize*')
+        custom_return = False
+
+    result = lib.vkGetDeviceMemoryCommitment(_handle(device, 'VkDevice'),_handle(memory, 'VkDeviceMemory'),_auto_handle(pCommittedMemoryInBytes, _args[2]))
+
+    if custom_return:
+        return pCommittedMemoryInBytes
+
+    return pCommittedMemoryInBytes[0]
+
+
+
+def vkGetBufferMemoryRequirements(
+device
+        ,buffer
+        ,pMemoryRequirements=None
+        ,):
+    _args = _arg_types('vkGetBufferMemoryRequirements', lib.vkGetBufferMemoryRequirements)
+
+
+    custom_return = True
+    if not pMemoryRequirements:
+        pMemoryRequirements = ffi.new('VkMemoryRequirements*')
+        custom_return = False
+
+    result = lib.vkGetBufferMemoryRequirements(_handle(device, 'VkDevice'),_handle(buffer, 'VkBuffer'),_auto_handle(pMemoryRequirements, _args[2]))
+
+    if custom_return:
+        return pMemoryRequirements
+
+    return pMemoryRequirements[0]
+
+
+
+def vkBindBufferMemory(
+device
+        ,buffer
+        ,memory
+        ,memoryOffset
+        ,):
+
+    result = lib.vkBindBufferMemory(_handle(device, 'VkDevice'),_handle(buffer, 'VkBuffer'),_handle(memory, 'VkDeviceMemory'),memoryOffset)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def vkGetImageMemoryRequirements(
+device
+        ,image
+        ,pMemoryRequirements=None
+        ,):
+    _args = _arg_types('vkGetImageMemoryRequirements', lib.vkGetImageMemoryRequirements)
+
+
+    custom_return = True
+    if not pMemoryRequirements:
+        pMemoryRequirements = ffi.new('VkMemoryRequirements*')
+        custom_return = False
+
+    result = lib.vkGetImageMemoryRequirements(_handle(device, 'VkDevice'),_handle(image, 'VkImage'),_auto_handle(pMemoryRequirements, _args[2]))
+
+    if custom_return:
+        return pMemoryRequirements
+
+    return pMemoryRequirements[0]
+
+
+
+def vkBindImageMemory(
+device
+        ,image
+        ,memory
+        ,memoryOffset
+        ,):
+
+    result = lib.vkBindImageMemory(_handle(device, 'VkDevice'),_handle(image, 'VkImage'),_handle(memory, 'VkDeviceMemory'),memoryOffset)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def vkGetImageSparseMemoryRequirements(
+device
+        ,image
+        ,pSparseMemoryRequirements=None
+        ,):
+
+
+    pSparseMemoryRequirementCount = ffi.new('uint32_t*')
+    custom_return = pSparseMemoryRequirements is not None
+    _array = pSparseMemoryRequirements
+
+    pSparseMemoryRequirements = ffi.NULL
+    lib.vkGetImageSparseMemoryRequirements(_handle(device, 'VkDevice'),_handle(image, 'VkImage'),pSparseMemoryRequirementCount,pSparseMemoryRequirements)
+
+    if _array is None or len(_array) < pSparseMemoryRequirementCount[0]:
+        _array = ffi.new('VkSparseImageMemoryRequirements[]', pSparseMemoryRequirementCount[0])
+    pSparseMemoryRequirements = _array
+    lib.vkGetImageSparseMemoryRequirements(_handle(device, 'VkDevice'),_handle(image, 'VkImage'),pSparseMemoryRequirementCount,pSparseMemoryRequirements)
+
+    if pSparseMemoryRequirementCount[0] != len(_array):
+        pSparseMemoryRequirements = _slice(_array, pSparseMemoryRequirementCount[0])
+
+    return pSparseMemoryRequirements
+
+
+def vkGetPhysicalDeviceSparseImageFormatProperties(
+physicalDevice
+        ,format
+        ,type
+        ,samples
+        ,usage
+        ,tiling
+        ,pProperties=None
+        ,):
+
+
+    pPropertyCount = ffi.new('uint32_t*')
+    custom_return = pProperties is not None
+    _array = pProperties
+
+    pProperties = ffi.NULL
+    lib.vkGetPhysicalDeviceSparseImageFormatProperties(_handle(physicalDevice, 'VkPhysicalDevice'),format,type,samples,usage,tiling,pPropertyCount,pProperties)
+
+    if _array is None or len(_array) < pPropertyCount[0]:
+        _array = ffi.new('VkSparseImageFormatProperties[]', pPropertyCount[0])
+    pProperties = _array
+    lib.vkGetPhysicalDeviceSparseImageFormatProperties(_handle(physicalDevice, 'VkPhysicalDevice'),format,type,samples,usage,tiling,pPropertyCount,pProperties)
+
+    if pPropertyCount[0] != len(_array):
+        pProperties = _slice(_array, pPropertyCount[0])
+
+    return pProperties
+
+
+def vkQueueBindSparse(
+queue
+        ,bindInfoCount
+        ,pBindInfo
+        ,fence
+        ,):
+    _args = _arg_types('vkQueueBindSparse', lib.vkQueueBindSparse)
+
+    result = lib.vkQueueBindSparse(_handle(queue, 'VkQueue'),bindInfoCount,_auto_handle(pBindInfo, _args[2]),_handle(fence, 'VkFence'))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def vkCreateFence(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pFence=None
+        ,):
+    _args = _arg_types('vkCreateFence', lib.vkCreateFence)
+
+
+    custom_return = True
+    if not pFence:
+        pFence = ffi.new('VkFence*')
+        custom_return = False
+
+    result = lib.vkCreateFence(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pFence, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pFence
+
+    return pFence[0]
+
+
+
+def vkDestroyFence(
+device
+        ,fence
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkDestroyFence', lib.vkDestroyFence)
+
+    result = lib.vkDestroyFence(_handle(device, 'VkDevice'),_handle(fence, 'VkFence'),_auto_handle(pAllocator, _args[2]))
+
+
+def vkResetFences(
+device
+        ,fenceCount
+        ,pFences
+        ,):
+    _args = _arg_types('vkResetFences', lib.vkResetFences)
+
+    result = lib.vkResetFences(_handle(device, 'VkDevice'),fenceCount,_auto_handle(pFences, _args[2]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def vkGetFenceStatus(
+device
+        ,fence
+        ,):
+
+    result = lib.vkGetFenceStatus(_handle(device, 'VkDevice'),_handle(fence, 'VkFence'))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def vkWaitForFences(
+device
+        ,fenceCount
+        ,pFences
+        ,waitAll
+        ,timeout
+        ,):
+    _args = _arg_types('vkWaitForFences', lib.vkWaitForFences)
+
+    result = lib.vkWaitForFences(_handle(device, 'VkDevice'),fenceCount,_auto_handle(pFences, _args[2]),waitAll,timeout)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def vkCreateSemaphore(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pSemaphore=None
+        ,):
+    _args = _arg_types('vkCreateSemaphore', lib.vkCreateSemaphore)
+
+
+    custom_return = True
+    if not pSemaphore:
+        pSemaphore = ffi.new('VkSemaphore*')
+        custom_return = False
+
+    result = lib.vkCreateSemaphore(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pSemaphore, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pSemaphore
+
+    return pSemaphore[0]
+
+
+
+def vkDestroySemaphore(
+device
+        ,semaphore
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkDestroySemaphore', lib.vkDestroySemaphore)
+
+    result = lib.vkDestroySemaphore(_handle(device, 'VkDevice'),_handle(semaphore, 'VkSemaphore'),_auto_handle(pAllocator, _args[2]))
+
+
+def vkCreateEvent(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pEvent=None
+        ,):
+    _args = _arg_types('vkCreateEvent', lib.vkCreateEvent)
+
+
+    custom_return = True
+    if not pEvent:
+        pEvent = ffi.new('VkEvent*')
+        custom_return = False
+
+    result = lib.vkCreateEvent(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pEvent, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pEvent
+
+    return pEvent[0]
+
+
+
+def vkDestroyEvent(
+device
+        ,event
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkDestroyEvent', lib.vkDestroyEvent)
+
+    result = lib.vkDestroyEvent(_handle(device, 'VkDevice'),_handle(event, 'VkEvent'),_auto_handle(pAllocator, _args[2]))
+
+
+def vkGetEventStatus(
+device
+        ,event
+        ,):
+
+    result = lib.vkGetEventStatus(_handle(device, 'VkDevice'),_handle(event, 'VkEvent'))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def vkSetEvent(
+device
+        ,event
+        ,):
+
+    result = lib.vkSetEvent(_handle(device, 'VkDevice'),_handle(event, 'VkEvent'))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def vkResetEvent(
+device
+        ,event
+        ,):
+
+    result = lib.vkResetEvent(_handle(device, 'VkDevice'),_handle(event, 'VkEvent'))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def vkCreateQueryPool(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pQueryPool=None
+        ,):
+    _args = _arg_types('vkCreateQueryPool', lib.vkCreateQueryPool)
+
+
+    custom_return = True
+    if not pQueryPool:
+        pQueryPool = ffi.new('VkQueryPool*')
+        custom_return = False
+
+    result = lib.vkCreateQueryPool(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pQueryPool, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pQueryPool
+
+    return pQueryPool[0]
+
+
+
+def vkDestroyQueryPool(
+device
+        ,queryPool
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkDestroyQueryPool', lib.vkDestroyQueryPool)
+
+    result = lib.vkDestroyQueryPool(_handle(device, 'VkDevice'),_handle(queryPool, 'VkQueryPool'),_auto_handle(pAllocator, _args[2]))
+
+
+def vkGetQueryPoolResults(
+device
+        ,queryPool
+        ,firstQuery
+        ,queryCount
+        ,dataSize
+        ,pData
+        ,stride
+        ,flags
+        ,):
+    _args = _arg_types('vkGetQueryPoolResults', lib.vkGetQueryPoolResults)
+
+    result = lib.vkGetQueryPoolResults(_handle(device, 'VkDevice'),_handle(queryPool, 'VkQueryPool'),firstQuery,queryCount,dataSize,_auto_handle(pData, _args[5]),stride,flags)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def vkCreateBuffer(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pBuffer=None
+        ,):
+    _args = _arg_types('vkCreateBuffer', lib.vkCreateBuffer)
+
+
+    custom_return = True
+    if not pBuffer:
+        pBuffer = ffi.new('VkBuffer*')
+        custom_return = False
+
+    result = lib.vkCreateBuffer(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pBuffer, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pBuffer
+
+    return pBuffer[0]
+
+
+
+def vkDestroyBuffer(
+device
+        ,buffer
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkDestroyBuffer', lib.vkDestroyBuffer)
+
+    result = lib.vkDestroyBuffer(_handle(device, 'VkDevice'),_handle(buffer, 'VkBuffer'),_auto_handle(pAllocator, _args[2]))
+
+
+def vkCreateBufferView(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pView=None
+        ,):
+    _args = _arg_types('vkCreateBufferView', lib.vkCreateBufferView)
+
+
+    custom_return = True
+    if not pView:
+        pView = ffi.new('VkBufferView*')
+        custom_return = False
+
+    result = lib.vkCreateBufferView(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pView, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pView
+
+    return pView[0]
+
+
+
+def vkDestroyBufferView(
+device
+        ,bufferView
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkDestroyBufferView', lib.vkDestroyBufferView)
+
+    result = lib.vkDestroyBufferView(_handle(device, 'VkDevice'),_handle(bufferView, 'VkBufferView'),_auto_handle(pAllocator, _args[2]))
+
+
+def vkCreateImage(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pImage=None
+        ,):
+    _args = _arg_types('vkCreateImage', lib.vkCreateImage)
+
+
+    custom_return = True
+    if not pImage:
+        pImage = ffi.new('VkImage*')
+        custom_return = False
+
+    result = lib.vkCreateImage(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pImage, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pImage
+
+    return pImage[0]
+
+
+
+def vkDestroyImage(
+device
+        ,image
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkDestroyImage', lib.vkDestroyImage)
+
+    result = lib.vkDestroyImage(_handle(device, 'VkDevice'),_handle(image, 'VkImage'),_auto_handle(pAllocator, _args[2]))
+
+
+def vkGetImageSubresourceLayout(
+device
+        ,image
+        ,pSubresource
+        ,pLayout=None
+        ,):
+    _args = _arg_types('vkGetImageSubresourceLayout', lib.vkGetImageSubresourceLayout)
+
+
+    custom_return = True
+    if not pLayout:
+        pLayout = ffi.new('VkSubresourceLayout*')
+        custom_return = False
+
+    result = lib.vkGetImageSubresourceLayout(_handle(device, 'VkDevice'),_handle(image, 'VkImage'),_auto_handle(pSubresource, _args[2]),_auto_handle(pLayout, _args[3]))
+
+    if custom_return:
+        return pLayout
+
+    return pLayout[0]
+
+
+
+def vkCreateImageView(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pView=None
+        ,):
+    _args = _arg_types('vkCreateImageView', lib.vkCreateImageView)
+
+
+    custom_return = True
+    if not pView:
+        pView = ffi.new('VkImageView*')
+        custom_return = False
+
+    result = lib.vkCreateImageView(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pView, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pView
+
+    return pView[0]
+
+
+
+def vkDestroyImageView(
+device
+        ,imageView
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkDestroyImageView', lib.vkDestroyImageView)
+
+    result = lib.vkDestroyImageView(_handle(device, 'VkDevice'),_handle(imageView, 'VkImageView'),_auto_handle(pAllocator, _args[2]))
+
+
+def vkCreateShaderModule(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pShaderModule=None
+        ,):
+    _args = _arg_types('vkCreateShaderModule', lib.vkCreateShaderModule)
+
+
+    custom_return = True
+    if not pShaderModule:
+        pShaderModule = ffi.new('VkShaderModule*')
+        custom_return = False
+
+    result = lib.vkCreateShaderModule(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pShaderModule, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pShaderModule
+
+    return pShaderModule[0]
+
+
+
+def vkDestroyShaderModule(
+device
+        ,shaderModule
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkDestroyShaderModule', lib.vkDestroyShaderModule)
+
+    result = lib.vkDestroyShaderModule(_handle(device, 'VkDevice'),_handle(shaderModule, 'VkShaderModule'),_auto_handle(pAllocator, _args[2]))
+
+
+def vkCreatePipelineCache(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pPipelineCache=None
+        ,):
+    _args = _arg_types('vkCreatePipelineCache', lib.vkCreatePipelineCache)
+
+
+    custom_return = True
+    if not pPipelineCache:
+        pPipelineCache = ffi.new('VkPipelineCache*')
+        custom_return = False
+
+    result = lib.vkCreatePipelineCache(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pPipelineCache, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pPipelineCache
+
+    return pPipelineCache[0]
+
+
+
+def vkCreatePipelineCache(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pPipelineCache=None
+        ,):
+    _args = _arg_types('vkCreatePipelineCache', lib.vkCreatePipelineCache)
+
+
+    custom_return = True
+    if not pPipelineCache:
+        pPipelineCache = ffi.new('VkPipelineCache*')
+        custom_return = False
+
+    result = lib.vkCreatePipelineCache(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pPipelineCache, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pPipelineCache
+
+    return pPipelineCache[0]
+
+
+
+def vkDestroyPipelineCache(
+device
+        ,pipelineCache
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkDestroyPipelineCache', lib.vkDestroyPipelineCache)
+
+    result = lib.vkDestroyPipelineCache(_handle(device, 'VkDevice'),_handle(pipelineCache, 'VkPipelineCache'),_auto_handle(pAllocator, _args[2]))
+
+
+def vkMergePipelineCaches(
+device
+        ,dstCache
+        ,srcCacheCount
+        ,pSrcCaches
+        ,):
+    _args = _arg_types('vkMergePipelineCaches', lib.vkMergePipelineCaches)
+
+    result = lib.vkMergePipelineCaches(_handle(device, 'VkDevice'),_handle(dstCache, 'VkPipelineCache'),srcCacheCount,_auto_handle(pSrcCaches, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def vkCreateGraphicsPipelines(
+device
+        ,pipelineCache
+        ,createInfoCount
+        ,pCreateInfos
+        ,pAllocator
+        ,pPipelines=None
+        ,):
+    _args = _arg_types('vkCreateGraphicsPipelines', lib.vkCreateGraphicsPipelines)
+
+
+    custom_return = True
+    if not pPipelines:
+        pPipelines = ffi.new('VkPipeline[%d]' % createInfoCount)
+        custom_return = False
+
+    result = lib.vkCreateGraphicsPipelines(_handle(device, 'VkDevice'),_handle(pipelineCache, 'VkPipelineCache'),createInfoCount,_auto_handle(pCreateInfos, _args[3]),_auto_handle(pAllocator, _args[4]),_auto_handle(pPipelines, _args[5]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pPipelines
+
+    return pPipelines
+
+
+
+def vkCreateGraphicsPipelines(
+device
+        ,pipelineCache
+        ,createInfoCount
+        ,pCreateInfos
+        ,pAllocator
+        ,pPipelines=None
+        ,):
+    _args = _arg_types('vkCreateGraphicsPipelines', lib.vkCreateGraphicsPipelines)
+
+
+    custom_return = True
+    if not pPipelines:
+        pPipelines = ffi.new('VkPipeline[%d]' % createInfoCount)
+        custom_return = False
+
+    result = lib.vkCreateGraphicsPipelines(_handle(device, 'VkDevice'),_handle(pipelineCache, 'VkPipelineCache'),createInfoCount,_auto_handle(pCreateInfos, _args[3]),_auto_handle(pAllocator, _args[4]),_auto_handle(pPipelines, _args[5]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pPipelines
+
+    return pPipelines
+
+
+
+def vkCreateComputePipelines(
+device
+        ,pipelineCache
+        ,createInfoCount
+        ,pCreateInfos
+        ,pAllocator
+        ,pPipelines=None
+        ,):
+    _args = _arg_types('vkCreateComputePipelines', lib.vkCreateComputePipelines)
+
+
+    custom_return = True
+    if not pPipelines:
+        pPipelines = ffi.new('VkPipeline[%d]' % createInfoCount)
+        custom_return = False
+
+    result = lib.vkCreateComputePipelines(_handle(device, 'VkDevice'),_handle(pipelineCache, 'VkPipelineCache'),createInfoCount,_auto_handle(pCreateInfos, _args[3]),_auto_handle(pAllocator, _args[4]),_auto_handle(pPipelines, _args[5]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pPipelines
+
+    return pPipelines
+
+
+
+def vkCreateComputePipelines(
+device
+        ,pipelineCache
+        ,createInfoCount
+        ,pCreateInfos
+        ,pAllocator
+        ,pPipelines=None
+        ,):
+    _args = _arg_types('vkCreateComputePipelines', lib.vkCreateComputePipelines)
+
+
+    custom_return = True
+    if not pPipelines:
+        pPipelines = ffi.new('VkPipeline[%d]' % createInfoCount)
+        custom_return = False
+
+    result = lib.vkCreateComputePipelines(_handle(device, 'VkDevice'),_handle(pipelineCache, 'VkPipelineCache'),createInfoCount,_auto_handle(pCreateInfos, _args[3]),_auto_handle(pAllocator, _args[4]),_auto_handle(pPipelines, _args[5]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pPipelines
+
+    return pPipelines
+
+
+
+def vkDestroyPipeline(
+device
+        ,pipeline
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkDestroyPipeline', lib.vkDestroyPipeline)
+
+    result = lib.vkDestroyPipeline(_handle(device, 'VkDevice'),_handle(pipeline, 'VkPipeline'),_auto_handle(pAllocator, _args[2]))
+
+
+def vkCreatePipelineLayout(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pPipelineLayout=None
+        ,):
+    _args = _arg_types('vkCreatePipelineLayout', lib.vkCreatePipelineLayout)
+
+
+    custom_return = True
+    if not pPipelineLayout:
+        pPipelineLayout = ffi.new('VkPipelineLayout*')
+        custom_return = False
+
+    result = lib.vkCreatePipelineLayout(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pPipelineLayout, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pPipelineLayout
+
+    return pPipelineLayout[0]
+
+
+
+def vkDestroyPipelineLayout(
+device
+        ,pipelineLayout
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkDestroyPipelineLayout', lib.vkDestroyPipelineLayout)
+
+    result = lib.vkDestroyPipelineLayout(_handle(device, 'VkDevice'),_handle(pipelineLayout, 'VkPipelineLayout'),_auto_handle(pAllocator, _args[2]))
+
+
+def vkCreateSampler(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pSampler=None
+        ,):
+    _args = _arg_types('vkCreateSampler', lib.vkCreateSampler)
+
+
+    custom_return = True
+    if not pSampler:
+        pSampler = ffi.new('VkSampler*')
+        custom_return = False
+
+    result = lib.vkCreateSampler(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pSampler, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pSampler
+
+    return pSampler[0]
+
+
+
+def vkDestroySampler(
+device
+        ,sampler
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkDestroySampler', lib.vkDestroySampler)
+
+    result = lib.vkDestroySampler(_handle(device, 'VkDevice'),_handle(sampler, 'VkSampler'),_auto_handle(pAllocator, _args[2]))
+
+
+def vkCreateDescriptorSetLayout(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pSetLayout=None
+        ,):
+    _args = _arg_types('vkCreateDescriptorSetLayout', lib.vkCreateDescriptorSetLayout)
+
+
+    custom_return = True
+    if not pSetLayout:
+        pSetLayout = ffi.new('VkDescriptorSetLayout*')
+        custom_return = False
+
+    result = lib.vkCreateDescriptorSetLayout(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pSetLayout, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pSetLayout
+
+    return pSetLayout[0]
+
+
+
+def vkDestroyDescriptorSetLayout(
+device
+        ,descriptorSetLayout
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkDestroyDescriptorSetLayout', lib.vkDestroyDescriptorSetLayout)
+
+    result = lib.vkDestroyDescriptorSetLayout(_handle(device, 'VkDevice'),_handle(descriptorSetLayout, 'VkDescriptorSetLayout'),_auto_handle(pAllocator, _args[2]))
+
+
+def vkCreateDescriptorPool(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pDescriptorPool=None
+        ,):
+    _args = _arg_types('vkCreateDescriptorPool', lib.vkCreateDescriptorPool)
+
+
+    custom_return = True
+    if not pDescriptorPool:
+        pDescriptorPool = ffi.new('VkDescriptorPool*')
+        custom_return = False
+
+    result = lib.vkCreateDescriptorPool(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pDescriptorPool, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pDescriptorPool
+
+    return pDescriptorPool[0]
+
+
+
+def vkDestroyDescriptorPool(
+device
+        ,descriptorPool
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkDestroyDescriptorPool', lib.vkDestroyDescriptorPool)
+
+    result = lib.vkDestroyDescriptorPool(_handle(device, 'VkDevice'),_handle(descriptorPool, 'VkDescriptorPool'),_auto_handle(pAllocator, _args[2]))
+
+
+def vkResetDescriptorPool(
+device
+        ,descriptorPool
+        ,flags
+        ,):
+
+    result = lib.vkResetDescriptorPool(_handle(device, 'VkDevice'),_handle(descriptorPool, 'VkDescriptorPool'),flags)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def vkAllocateDescriptorSets(
+device
+        ,pAllocateInfo
+        ,pDescriptorSets=None
+        ,):
+    _args = _arg_types('vkAllocateDescriptorSets', lib.vkAllocateDescriptorSets)
+
+
+    custom_return = True
+    if not pDescriptorSets:
+        pDescriptorSets = ffi.new('VkDescriptorSet[%d]' % pAllocateInfo.descriptorSetCount)
+        custom_return = False
+
+    result = lib.vkAllocateDescriptorSets(_handle(device, 'VkDevice'),_auto_handle(pAllocateInfo, _args[1]),_auto_handle(pDescriptorSets, _args[2]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pDescriptorSets
+
+    return pDescriptorSets
+
+
+
+def vkFreeDescriptorSets(
+device
+        ,descriptorPool
+        ,descriptorSetCount
+        ,pDescriptorSets
+        ,):
+    _args = _arg_types('vkFreeDescriptorSets', lib.vkFreeDescriptorSets)
+
+    result = lib.vkFreeDescriptorSets(_handle(device, 'VkDevice'),_handle(descriptorPool, 'VkDescriptorPool'),descriptorSetCount,_auto_handle(pDescriptorSets, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def vkUpdateDescriptorSets(
+device
+        ,descriptorWriteCount
+        ,pDescriptorWrites
+        ,descriptorCopyCount
+        ,pDescriptorCopies
+        ,):
+    _args = _arg_types('vkUpdateDescriptorSets', lib.vkUpdateDescriptorSets)
+
+    result = lib.vkUpdateDescriptorSets(_handle(device, 'VkDevice'),descriptorWriteCount,_auto_handle(pDescriptorWrites, _args[2]),descriptorCopyCount,_auto_handle(pDescriptorCopies, _args[4]))
+
+
+def vkCreateFramebuffer(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pFramebuffer=None
+        ,):
+    _args = _arg_types('vkCreateFramebuffer', lib.vkCreateFramebuffer)
+
+
+    custom_return = True
+    if not pFramebuffer:
+        pFramebuffer = ffi.new('VkFramebuffer*')
+        custom_return = False
+
+    result = lib.vkCreateFramebuffer(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pFramebuffer, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pFramebuffer
+
+    return pFramebuffer[0]
+
+
+
+def vkDestroyFramebuffer(
+device
+        ,framebuffer
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkDestroyFramebuffer', lib.vkDestroyFramebuffer)
+
+    result = lib.vkDestroyFramebuffer(_handle(device, 'VkDevice'),_handle(framebuffer, 'VkFramebuffer'),_auto_handle(pAllocator, _args[2]))
+
+
+def vkCreateRenderPass(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pRenderPass=None
+        ,):
+    _args = _arg_types('vkCreateRenderPass', lib.vkCreateRenderPass)
+
+
+    custom_return = True
+    if not pRenderPass:
+        pRenderPass = ffi.new('VkRenderPass*')
+        custom_return = False
+
+    result = lib.vkCreateRenderPass(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pRenderPass, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pRenderPass
+
+    return pRenderPass[0]
+
+
+
+def vkDestroyRenderPass(
+device
+        ,renderPass
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkDestroyRenderPass', lib.vkDestroyRenderPass)
+
+    result = lib.vkDestroyRenderPass(_handle(device, 'VkDevice'),_handle(renderPass, 'VkRenderPass'),_auto_handle(pAllocator, _args[2]))
+
+
+def vkGetRenderAreaGranularity(
+device
+        ,renderPass
+        ,pGranularity=None
+        ,):
+    _args = _arg_types('vkGetRenderAreaGranularity', lib.vkGetRenderAreaGranularity)
+
+
+    custom_return = True
+    if not pGranularity:
+        pGranularity = ffi.new('VkExtent2D*')
+        custom_return = False
+
+    result = lib.vkGetRenderAreaGranularity(_handle(device, 'VkDevice'),_handle(renderPass, 'VkRenderPass'),_auto_handle(pGranularity, _args[2]))
+
+    if custom_return:
+        return pGranularity
+
+    return pGranularity[0]
+
+
+
+def vkCreateCommandPool(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pCommandPool=None
+        ,):
+    _args = _arg_types('vkCreateCommandPool', lib.vkCreateCommandPool)
+
+
+    custom_return = True
+    if not pCommandPool:
+        pCommandPool = ffi.new('VkCommandPool*')
+        custom_return = False
+
+    result = lib.vkCreateCommandPool(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pCommandPool, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pCommandPool
+
+    return pCommandPool[0]
+
+
+
+def vkDestroyCommandPool(
+device
+        ,commandPool
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkDestroyCommandPool', lib.vkDestroyCommandPool)
+
+    result = lib.vkDestroyCommandPool(_handle(device, 'VkDevice'),_handle(commandPool, 'VkCommandPool'),_auto_handle(pAllocator, _args[2]))
+
+
+def vkResetCommandPool(
+device
+        ,commandPool
+        ,flags
+        ,):
+
+    result = lib.vkResetCommandPool(_handle(device, 'VkDevice'),_handle(commandPool, 'VkCommandPool'),flags)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def vkAllocateCommandBuffers(
+device
+        ,pAllocateInfo
+        ,pCommandBuffers=None
+        ,):
+    _args = _arg_types('vkAllocateCommandBuffers', lib.vkAllocateCommandBuffers)
+
+
+    custom_return = True
+    if not pCommandBuffers:
+        pCommandBuffers = ffi.new('VkCommandBuffer[%d]' % pAllocateInfo.commandBufferCount)
+        custom_return = False
+
+    result = lib.vkAllocateCommandBuffers(_handle(device, 'VkDevice'),_auto_handle(pAllocateInfo, _args[1]),_auto_handle(pCommandBuffers, _args[2]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pCommandBuffers
+
+    return pCommandBuffers
+
+
+
+def vkFreeCommandBuffers(
+device
+        ,commandPool
+        ,commandBufferCount
+        ,pCommandBuffers
+        ,):
+    _args = _arg_types('vkFreeCommandBuffers', lib.vkFreeCommandBuffers)
+
+    result = lib.vkFreeCommandBuffers(_handle(device, 'VkDevice'),_handle(commandPool, 'VkCommandPool'),commandBufferCount,_auto_handle(pCommandBuffers, _args[3]))
+
+
+def vkBeginCommandBuffer(
+commandBuffer
+        ,pBeginInfo
+        ,):
+    _args = _arg_types('vkBeginCommandBuffer', lib.vkBeginCommandBuffer)
+
+    result = lib.vkBeginCommandBuffer(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pBeginInfo, _args[1]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def vkEndCommandBuffer(
+commandBuffer
+        ,):
+
+    result = lib.vkEndCommandBuffer(_handle(commandBuffer, 'VkCommandBuffer'))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def vkResetCommandBuffer(
+commandBuffer
+        ,flags
+        ,):
+
+    result = lib.vkResetCommandBuffer(_handle(commandBuffer, 'VkCommandBuffer'),flags)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def vkCmdBindPipeline(
+commandBuffer
+        ,pipelineBindPoint
+        ,pipeline
+        ,):
+
+    result = lib.vkCmdBindPipeline(_handle(commandBuffer, 'VkCommandBuffer'),pipelineBindPoint,_handle(pipeline, 'VkPipeline'))
+
+
+def vkCmdSetViewport(
+commandBuffer
+        ,firstViewport
+        ,viewportCount
+        ,pViewports
+        ,):
+    _args = _arg_types('vkCmdSetViewport', lib.vkCmdSetViewport)
+
+    result = lib.vkCmdSetViewport(_handle(commandBuffer, 'VkCommandBuffer'),firstViewport,viewportCount,_auto_handle(pViewports, _args[3]))
+
+
+def vkCmdSetScissor(
+commandBuffer
+        ,firstScissor
+        ,scissorCount
+        ,pScissors
+        ,):
+    _args = _arg_types('vkCmdSetScissor', lib.vkCmdSetScissor)
+
+    result = lib.vkCmdSetScissor(_handle(commandBuffer, 'VkCommandBuffer'),firstScissor,scissorCount,_auto_handle(pScissors, _args[3]))
+
+
+def vkCmdSetLineWidth(
+commandBuffer
+        ,lineWidth
+        ,):
+
+    result = lib.vkCmdSetLineWidth(_handle(commandBuffer, 'VkCommandBuffer'),lineWidth)
+
+
+def vkCmdSetDepthBias(
+commandBuffer
+        ,depthBiasConstantFactor
+        ,depthBiasClamp
+        ,depthBiasSlopeFactor
+        ,):
+
+    result = lib.vkCmdSetDepthBias(_handle(commandBuffer, 'VkCommandBuffer'),depthBiasConstantFactor,depthBiasClamp,depthBiasSlopeFactor)
+
+
+def vkCmdSetBlendConstants(
+commandBuffer
+        ,blendConstants
+        ,):
+    _args = _arg_types('vkCmdSetBlendConstants', lib.vkCmdSetBlendConstants)
+
+    result = lib.vkCmdSetBlendConstants(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(blendConstants, _args[1]))
+
+
+def vkCmdSetDepthBounds(
+commandBuffer
+        ,minDepthBounds
+        ,maxDepthBounds
+        ,):
+
+    result = lib.vkCmdSetDepthBounds(_handle(commandBuffer, 'VkCommandBuffer'),minDepthBounds,maxDepthBounds)
+
+
+def vkCmdSetStencilCompareMask(
+commandBuffer
+        ,faceMask
+        ,compareMask
+        ,):
+
+    result = lib.vkCmdSetStencilCompareMask(_handle(commandBuffer, 'VkCommandBuffer'),faceMask,compareMask)
+
+
+def vkCmdSetStencilWriteMask(
+commandBuffer
+        ,faceMask
+        ,writeMask
+        ,):
+
+    result = lib.vkCmdSetStencilWriteMask(_handle(commandBuffer, 'VkCommandBuffer'),faceMask,writeMask)
+
+
+def vkCmdSetStencilReference(
+commandBuffer
+        ,faceMask
+        ,reference
+        ,):
+
+    result = lib.vkCmdSetStencilReference(_handle(commandBuffer, 'VkCommandBuffer'),faceMask,reference)
+
+
+def vkCmdBindDescriptorSets(
+commandBuffer
+        ,pipelineBindPoint
+        ,layout
+        ,firstSet
+        ,descriptorSetCount
+        ,pDescriptorSets
+        ,dynamicOffsetCount
+        ,pDynamicOffsets
+        ,):
+    _args = _arg_types('vkCmdBindDescriptorSets', lib.vkCmdBindDescriptorSets)
+
+    result = lib.vkCmdBindDescriptorSets(_handle(commandBuffer, 'VkCommandBuffer'),pipelineBindPoint,_handle(layout, 'VkPipelineLayout'),firstSet,descriptorSetCount,_auto_handle(pDescriptorSets, _args[5]),dynamicOffsetCount,_auto_handle(pDynamicOffsets, _args[7]))
+
+
+def vkCmdBindIndexBuffer(
+commandBuffer
+        ,buffer
+        ,offset
+        ,indexType
+        ,):
+
+    result = lib.vkCmdBindIndexBuffer(_handle(commandBuffer, 'VkCommandBuffer'),_handle(buffer, 'VkBuffer'),offset,indexType)
+
+
+def vkCmdBindVertexBuffers(
+commandBuffer
+        ,firstBinding
+        ,bindingCount
+        ,pBuffers
+        ,pOffsets
+        ,):
+    _args = _arg_types('vkCmdBindVertexBuffers', lib.vkCmdBindVertexBuffers)
+
+    result = lib.vkCmdBindVertexBuffers(_handle(commandBuffer, 'VkCommandBuffer'),firstBinding,bindingCount,_auto_handle(pBuffers, _args[3]),_auto_handle(pOffsets, _args[4]))
+
+
+def vkCmdDraw(
+commandBuffer
+        ,vertexCount
+        ,instanceCount
+        ,firstVertex
+        ,firstInstance
+        ,):
+
+    result = lib.vkCmdDraw(_handle(commandBuffer, 'VkCommandBuffer'),vertexCount,instanceCount,firstVertex,firstInstance)
+
+
+def vkCmdDrawIndexed(
+commandBuffer
+        ,indexCount
+        ,instanceCount
+        ,firstIndex
+        ,vertexOffset
+        ,firstInstance
+        ,):
+
+    result = lib.vkCmdDrawIndexed(_handle(commandBuffer, 'VkCommandBuffer'),indexCount,instanceCount,firstIndex,vertexOffset,firstInstance)
+
+
+def vkCmdDrawIndirect(
+commandBuffer
+        ,buffer
+        ,offset
+        ,drawCount
+        ,stride
+        ,):
+
+    result = lib.vkCmdDrawIndirect(_handle(commandBuffer, 'VkCommandBuffer'),_handle(buffer, 'VkBuffer'),offset,drawCount,stride)
+
+
+def vkCmdDrawIndexedIndirect(
+commandBuffer
+        ,buffer
+        ,offset
+        ,drawCount
+        ,stride
+        ,):
+
+    result = lib.vkCmdDrawIndexedIndirect(_handle(commandBuffer, 'VkCommandBuffer'),_handle(buffer, 'VkBuffer'),offset,drawCount,stride)
+
+
+def vkCmdDispatch(
+commandBuffer
+        ,groupCountX
+        ,groupCountY
+        ,groupCountZ
+        ,):
+
+    result = lib.vkCmdDispatch(_handle(commandBuffer, 'VkCommandBuffer'),groupCountX,groupCountY,groupCountZ)
+
+
+def vkCmdDispatchIndirect(
+commandBuffer
+        ,buffer
+        ,offset
+        ,):
+
+    result = lib.vkCmdDispatchIndirect(_handle(commandBuffer, 'VkCommandBuffer'),_handle(buffer, 'VkBuffer'),offset)
+
+
+def vkCmdCopyBuffer(
+commandBuffer
+        ,srcBuffer
+        ,dstBuffer
+        ,regionCount
+        ,pRegions
+        ,):
+    _args = _arg_types('vkCmdCopyBuffer', lib.vkCmdCopyBuffer)
+
+    result = lib.vkCmdCopyBuffer(_handle(commandBuffer, 'VkCommandBuffer'),_handle(srcBuffer, 'VkBuffer'),_handle(dstBuffer, 'VkBuffer'),regionCount,_auto_handle(pRegions, _args[4]))
+
+
+def vkCmdCopyImage(
+commandBuffer
+        ,srcImage
+        ,srcImageLayout
+        ,dstImage
+        ,dstImageLayout
+        ,regionCount
+        ,pRegions
+        ,):
+    _args = _arg_types('vkCmdCopyImage', lib.vkCmdCopyImage)
+
+    result = lib.vkCmdCopyImage(_handle(commandBuffer, 'VkCommandBuffer'),_handle(srcImage, 'VkImage'),srcImageLayout,_handle(dstImage, 'VkImage'),dstImageLayout,regionCount,_auto_handle(pRegions, _args[6]))
+
+
+def vkCmdBlitImage(
+commandBuffer
+        ,srcImage
+        ,srcImageLayout
+        ,dstImage
+        ,dstImageLayout
+        ,regionCount
+        ,pRegions
+        ,filter
+        ,):
+    _args = _arg_types('vkCmdBlitImage', lib.vkCmdBlitImage)
+
+    result = lib.vkCmdBlitImage(_handle(commandBuffer, 'VkCommandBuffer'),_handle(srcImage, 'VkImage'),srcImageLayout,_handle(dstImage, 'VkImage'),dstImageLayout,regionCount,_auto_handle(pRegions, _args[6]),filter)
+
+
+def vkCmdCopyBufferToImage(
+commandBuffer
+        ,srcBuffer
+        ,dstImage
+        ,dstImageLayout
+        ,regionCount
+        ,pRegions
+        ,):
+    _args = _arg_types('vkCmdCopyBufferToImage', lib.vkCmdCopyBufferToImage)
+
+    result = lib.vkCmdCopyBufferToImage(_handle(commandBuffer, 'VkCommandBuffer'),_handle(srcBuffer, 'VkBuffer'),_handle(dstImage, 'VkImage'),dstImageLayout,regionCount,_auto_handle(pRegions, _args[5]))
+
+
+def vkCmdCopyImageToBuffer(
+commandBuffer
+        ,srcImage
+        ,srcImageLayout
+        ,dstBuffer
+        ,regionCount
+        ,pRegions
+        ,):
+    _args = _arg_types('vkCmdCopyImageToBuffer', lib.vkCmdCopyImageToBuffer)
+
+    result = lib.vkCmdCopyImageToBuffer(_handle(commandBuffer, 'VkCommandBuffer'),_handle(srcImage, 'VkImage'),srcImageLayout,_handle(dstBuffer, 'VkBuffer'),regionCount,_auto_handle(pRegions, _args[5]))
+
+
+def vkCmdUpdateBuffer(
+commandBuffer
+        ,dstBuffer
+        ,dstOffset
+        ,dataSize
+        ,pData
+        ,):
+    _args = _arg_types('vkCmdUpdateBuffer', lib.vkCmdUpdateBuffer)
+
+    result = lib.vkCmdUpdateBuffer(_handle(commandBuffer, 'VkCommandBuffer'),_handle(dstBuffer, 'VkBuffer'),dstOffset,dataSize,_auto_handle(pData, _args[4]))
+
+
+def vkCmdFillBuffer(
+commandBuffer
+        ,dstBuffer
+        ,dstOffset
+        ,size
+        ,data
+        ,):
+
+    result = lib.vkCmdFillBuffer(_handle(commandBuffer, 'VkCommandBuffer'),_handle(dstBuffer, 'VkBuffer'),dstOffset,size,data)
+
+
+def vkCmdClearColorImage(
+commandBuffer
+        ,image
+        ,imageLayout
+        ,pColor
+        ,rangeCount
+        ,pRanges
+        ,):
+    _args = _arg_types('vkCmdClearColorImage', lib.vkCmdClearColorImage)
+
+    result = lib.vkCmdClearColorImage(_handle(commandBuffer, 'VkCommandBuffer'),_handle(image, 'VkImage'),imageLayout,_auto_handle(pColor, _args[3]),rangeCount,_auto_handle(pRanges, _args[5]))
+
+
+def vkCmdClearDepthStencilImage(
+commandBuffer
+        ,image
+        ,imageLayout
+        ,pDepthStencil
+        ,rangeCount
+        ,pRanges
+        ,):
+    _args = _arg_types('vkCmdClearDepthStencilImage', lib.vkCmdClearDepthStencilImage)
+
+    result = lib.vkCmdClearDepthStencilImage(_handle(commandBuffer, 'VkCommandBuffer'),_handle(image, 'VkImage'),imageLayout,_auto_handle(pDepthStencil, _args[3]),rangeCount,_auto_handle(pRanges, _args[5]))
+
+
+def vkCmdClearAttachments(
+commandBuffer
+        ,attachmentCount
+        ,pAttachments
+        ,rectCount
+        ,pRects
+        ,):
+    _args = _arg_types('vkCmdClearAttachments', lib.vkCmdClearAttachments)
+
+    result = lib.vkCmdClearAttachments(_handle(commandBuffer, 'VkCommandBuffer'),attachmentCount,_auto_handle(pAttachments, _args[2]),rectCount,_auto_handle(pRects, _args[4]))
+
+
+def vkCmdResolveImage(
+commandBuffer
+        ,srcImage
+        ,srcImageLayout
+        ,dstImage
+        ,dstImageLayout
+        ,regionCount
+        ,pRegions
+        ,):
+    _args = _arg_types('vkCmdResolveImage', lib.vkCmdResolveImage)
+
+    result = lib.vkCmdResolveImage(_handle(commandBuffer, 'VkCommandBuffer'),_handle(srcImage, 'VkImage'),srcImageLayout,_handle(dstImage, 'VkImage'),dstImageLayout,regionCount,_auto_handle(pRegions, _args[6]))
+
+
+def vkCmdSetEvent(
+commandBuffer
+        ,event
+        ,stageMask
+        ,):
+
+    result = lib.vkCmdSetEvent(_handle(commandBuffer, 'VkCommandBuffer'),_handle(event, 'VkEvent'),stageMask)
+
+
+def vkCmdResetEvent(
+commandBuffer
+        ,event
+        ,stageMask
+        ,):
+
+    result = lib.vkCmdResetEvent(_handle(commandBuffer, 'VkCommandBuffer'),_handle(event, 'VkEvent'),stageMask)
+
+
+def vkCmdWaitEvents(
+commandBuffer
+        ,eventCount
+        ,pEvents
+        ,srcStageMask
+        ,dstStageMask
+        ,memoryBarrierCount
+        ,pMemoryBarriers
+        ,bufferMemoryBarrierCount
+        ,pBufferMemoryBarriers
+        ,imageMemoryBarrierCount
+        ,pImageMemoryBarriers
+        ,):
+    _args = _arg_types('vkCmdWaitEvents', lib.vkCmdWaitEvents)
+
+    result = lib.vkCmdWaitEvents(_handle(commandBuffer, 'VkCommandBuffer'),eventCount,_auto_handle(pEvents, _args[2]),srcStageMask,dstStageMask,memoryBarrierCount,_auto_handle(pMemoryBarriers, _args[6]),bufferMemoryBarrierCount,_auto_handle(pBufferMemoryBarriers, _args[8]),imageMemoryBarrierCount,_auto_handle(pImageMemoryBarriers, _args[10]))
+
+
+def vkCmdPipelineBarrier(
+commandBuffer
+        ,srcStageMask
+        ,dstStageMask
+        ,dependencyFlags
+        ,memoryBarrierCount
+        ,pMemoryBarriers
+        ,bufferMemoryBarrierCount
+        ,pBufferMemoryBarriers
+        ,imageMemoryBarrierCount
+        ,pImageMemoryBarriers
+        ,):
+    _args = _arg_types('vkCmdPipelineBarrier', lib.vkCmdPipelineBarrier)
+
+    result = lib.vkCmdPipelineBarrier(_handle(commandBuffer, 'VkCommandBuffer'),srcStageMask,dstStageMask,dependencyFlags,memoryBarrierCount,_auto_handle(pMemoryBarriers, _args[5]),bufferMemoryBarrierCount,_auto_handle(pBufferMemoryBarriers, _args[7]),imageMemoryBarrierCount,_auto_handle(pImageMemoryBarriers, _args[9]))
+
+
+def vkCmdBeginQuery(
+commandBuffer
+        ,queryPool
+        ,query
+        ,flags
+        ,):
+
+    result = lib.vkCmdBeginQuery(_handle(commandBuffer, 'VkCommandBuffer'),_handle(queryPool, 'VkQueryPool'),query,flags)
+
+
+def vkCmdEndQuery(
+commandBuffer
+        ,queryPool
+        ,query
+        ,):
+
+    result = lib.vkCmdEndQuery(_handle(commandBuffer, 'VkCommandBuffer'),_handle(queryPool, 'VkQueryPool'),query)
+
+
+def vkCmdResetQueryPool(
+commandBuffer
+        ,queryPool
+        ,firstQuery
+        ,queryCount
+        ,):
+
+    result = lib.vkCmdResetQueryPool(_handle(commandBuffer, 'VkCommandBuffer'),_handle(queryPool, 'VkQueryPool'),firstQuery,queryCount)
+
+
+def vkCmdWriteTimestamp(
+commandBuffer
+        ,pipelineStage
+        ,queryPool
+        ,query
+        ,):
+
+    result = lib.vkCmdWriteTimestamp(_handle(commandBuffer, 'VkCommandBuffer'),pipelineStage,_handle(queryPool, 'VkQueryPool'),query)
+
+
+def vkCmdCopyQueryPoolResults(
+commandBuffer
+        ,queryPool
+        ,firstQuery
+        ,queryCount
+        ,dstBuffer
+        ,dstOffset
+        ,stride
+        ,flags
+        ,):
+
+    result = lib.vkCmdCopyQueryPoolResults(_handle(commandBuffer, 'VkCommandBuffer'),_handle(queryPool, 'VkQueryPool'),firstQuery,queryCount,_handle(dstBuffer, 'VkBuffer'),dstOffset,stride,flags)
+
+
+def vkCmdPushConstants(
+commandBuffer
+        ,layout
+        ,stageFlags
+        ,offset
+        ,size
+        ,pValues
+        ,):
+    _args = _arg_types('vkCmdPushConstants', lib.vkCmdPushConstants)
+
+    result = lib.vkCmdPushConstants(_handle(commandBuffer, 'VkCommandBuffer'),_handle(layout, 'VkPipelineLayout'),stageFlags,offset,size,_auto_handle(pValues, _args[5]))
+
+
+def vkCmdBeginRenderPass(
+commandBuffer
+        ,pRenderPassBegin
+        ,contents
+        ,):
+    _args = _arg_types('vkCmdBeginRenderPass', lib.vkCmdBeginRenderPass)
+
+    result = lib.vkCmdBeginRenderPass(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pRenderPassBegin, _args[1]),contents)
+
+
+def vkCmdNextSubpass(
+commandBuffer
+        ,contents
+        ,):
+
+    result = lib.vkCmdNextSubpass(_handle(commandBuffer, 'VkCommandBuffer'),contents)
+
+
+def vkCmdEndRenderPass(
+commandBuffer
+        ,):
+
+    result = lib.vkCmdEndRenderPass(_handle(commandBuffer, 'VkCommandBuffer'))
+
+
+def vkCmdExecuteCommands(
+commandBuffer
+        ,commandBufferCount
+        ,pCommandBuffers
+        ,):
+    _args = _arg_types('vkCmdExecuteCommands', lib.vkCmdExecuteCommands)
+
+    result = lib.vkCmdExecuteCommands(_handle(commandBuffer, 'VkCommandBuffer'),commandBufferCount,_auto_handle(pCommandBuffers, _args[2]))
+
+
@@ -0,0 +1,1434 @@
+from vulkan._vulkan import *  # noqa
+from vulkan._vulkan import (ffi, lib, _new, _auto_handle, _handle,
+                            _arg_types, _slice)
+
+
+def VkPhysicalDeviceFeatures2(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2,pNext=None,features=None,):
+
+    return _new('VkPhysicalDeviceFeatures2', sType=sType,pNext=pNext,features=features)
+
+def VkPhysicalDeviceProperties2(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PROPERTIES_2,pNext=None,properties=None,):
+
+    return _new('VkPhysicalDeviceProperties2', sType=sType,pNext=pNext,properties=properties)
+
+def VkFormatProperties2(sType=VK_STRUCTURE_TYPE_FORMAT_PROPERTIES_2,pNext=None,formatProperties=None,):
+
+    return _new('VkFormatProperties2', sType=sType,pNext=pNext,formatProperties=formatProperties)
+
+def VkImageFormatProperties2(sType=VK_STRUCTURE_TYPE_IMAGE_FORMAT_PROPERTIES_2,pNext=None,imageFormatProperties=None,):
+
+    return _new('VkImageFormatProperties2', sType=sType,pNext=pNext,imageFormatProperties=imageFormatProperties)
+
+def VkPhysicalDeviceImageFormatInfo2(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_FORMAT_INFO_2,pNext=None,format=None,type=None,tiling=None,usage=None,flags=None,):
+
+    return _new('VkPhysicalDeviceImageFormatInfo2', sType=sType,pNext=pNext,format=format,type=type,tiling=tiling,usage=usage,flags=flags)
+
+def VkQueueFamilyProperties2(sType=VK_STRUCTURE_TYPE_QUEUE_FAMILY_PROPERTIES_2,pNext=None,queueFamilyProperties=None,):
+
+    return _new('VkQueueFamilyProperties2', sType=sType,pNext=pNext,queueFamilyProperties=queueFamilyProperties)
+
+def VkPhysicalDeviceMemoryProperties2(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MEMORY_PROPERTIES_2,pNext=None,memoryProperties=None,):
+
+    return _new('VkPhysicalDeviceMemoryProperties2', sType=sType,pNext=pNext,memoryProperties=memoryProperties)
+
+def VkSparseImageFormatProperties2(sType=VK_STRUCTURE_TYPE_SPARSE_IMAGE_FORMAT_PROPERTIES_2,pNext=None,properties=None,):
+
+    return _new('VkSparseImageFormatProperties2', sType=sType,pNext=pNext,properties=properties)
+
+def VkPhysicalDeviceSparseImageFormatInfo2(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SPARSE_IMAGE_FORMAT_INFO_2,pNext=None,format=None,type=None,samples=None,usage=None,tiling=None,):
+
+    return _new('VkPhysicalDeviceSparseImageFormatInfo2', sType=sType,pNext=pNext,format=format,type=type,samples=samples,usage=usage,tiling=tiling)
+
+def VkPhysicalDeviceVariablePointersFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VARIABLE_POINTERS_FEATURES,pNext=None,variablePointersStorageBuffer=None,variablePointers=None,):
+
+    return _new('VkPhysicalDeviceVariablePointersFeatures', sType=sType,pNext=pNext,variablePointersStorageBuffer=variablePointersStorageBuffer,variablePointers=variablePointers)
+
+def VkExternalMemoryProperties(externalMemoryFeatures=None,exportFromImportedHandleTypes=None,compatibleHandleTypes=None,):
+
+    return _new('VkExternalMemoryProperties', externalMemoryFeatures=externalMemoryFeatures,exportFromImportedHandleTypes=exportFromImportedHandleTypes,compatibleHandleTypes=compatibleHandleTypes)
+
+def VkPhysicalDeviceExternalImageFormatInfo(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_IMAGE_FORMAT_INFO,pNext=None,handleType=None,):
+
+    return _new('VkPhysicalDeviceExternalImageFormatInfo', sType=sType,pNext=pNext,handleType=handleType)
+
+def VkExternalImageFormatProperties(sType=VK_STRUCTURE_TYPE_EXTERNAL_IMAGE_FORMAT_PROPERTIES,pNext=None,externalMemoryProperties=None,):
+
+    return _new('VkExternalImageFormatProperties', sType=sType,pNext=pNext,externalMemoryProperties=externalMemoryProperties)
+
+def VkPhysicalDeviceExternalBufferInfo(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_BUFFER_INFO,pNext=None,flags=None,usage=None,handleType=None,):
+
+    return _new('VkPhysicalDeviceExternalBufferInfo', sType=sType,pNext=pNext,flags=flags,usage=usage,handleType=handleType)
+
+def VkExternalBufferProperties(sType=VK_STRUCTURE_TYPE_EXTERNAL_BUFFER_PROPERTIES,pNext=None,externalMemoryProperties=None,):
+
+    return _new('VkExternalBufferProperties', sType=sType,pNext=pNext,externalMemoryProperties=externalMemoryProperties)
+
+def VkPhysicalDeviceIDProperties(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ID_PROPERTIES,pNext=None,deviceUUID=None,driverUUID=None,deviceLUID=None,deviceNodeMask=None,deviceLUIDValid=None,):
+
+    return _new('VkPhysicalDeviceIDProperties', sType=sType,pNext=pNext,deviceUUID=deviceUUID,driverUUID=driverUUID,deviceLUID=deviceLUID,deviceNodeMask=deviceNodeMask,deviceLUIDValid=deviceLUIDValid)
+
+def VkExternalMemoryImageCreateInfo(sType=VK_STRUCTURE_TYPE_EXTERNAL_MEMORY_IMAGE_CREATE_INFO,pNext=None,handleTypes=None,):
+
+    return _new('VkExternalMemoryImageCreateInfo', sType=sType,pNext=pNext,handleTypes=handleTypes)
+
+def VkExternalMemoryBufferCreateInfo(sType=VK_STRUCTURE_TYPE_EXTERNAL_MEMORY_BUFFER_CREATE_INFO,pNext=None,handleTypes=None,):
+
+    return _new('VkExternalMemoryBufferCreateInfo', sType=sType,pNext=pNext,handleTypes=handleTypes)
+
+def VkExportMemoryAllocateInfo(sType=VK_STRUCTURE_TYPE_EXPORT_MEMORY_ALLOCATE_INFO,pNext=None,handleTypes=None,):
+
+    return _new('VkExportMemoryAllocateInfo', sType=sType,pNext=pNext,handleTypes=handleTypes)
+
+def VkPhysicalDeviceExternalSemaphoreInfo(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_SEMAPHORE_INFO,pNext=None,handleType=None,):
+
+    return _new('VkPhysicalDeviceExternalSemaphoreInfo', sType=sType,pNext=pNext,handleType=handleType)
+
+def VkExternalSemaphoreProperties(sType=VK_STRUCTURE_TYPE_EXTERNAL_SEMAPHORE_PROPERTIES,pNext=None,exportFromImportedHandleTypes=None,compatibleHandleTypes=None,externalSemaphoreFeatures=None,):
+
+    return _new('VkExternalSemaphoreProperties', sType=sType,pNext=pNext,exportFromImportedHandleTypes=exportFromImportedHandleTypes,compatibleHandleTypes=compatibleHandleTypes,externalSemaphoreFeatures=externalSemaphoreFeatures)
+
+def VkExportSemaphoreCreateInfo(sType=VK_STRUCTURE_TYPE_EXPORT_SEMAPHORE_CREATE_INFO,pNext=None,handleTypes=None,):
+
+    return _new('VkExportSemaphoreCreateInfo', sType=sType,pNext=pNext,handleTypes=handleTypes)
+
+def VkPhysicalDeviceExternalFenceInfo(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_FENCE_INFO,pNext=None,handleType=None,):
+
+    return _new('VkPhysicalDeviceExternalFenceInfo', sType=sType,pNext=pNext,handleType=handleType)
+
+def VkExternalFenceProperties(sType=VK_STRUCTURE_TYPE_EXTERNAL_FENCE_PROPERTIES,pNext=None,exportFromImportedHandleTypes=None,compatibleHandleTypes=None,externalFenceFeatures=None,):
+
+    return _new('VkExternalFenceProperties', sType=sType,pNext=pNext,exportFromImportedHandleTypes=exportFromImportedHandleTypes,compatibleHandleTypes=compatibleHandleTypes,externalFenceFeatures=externalFenceFeatures)
+
+def VkExportFenceCreateInfo(sType=VK_STRUCTURE_TYPE_EXPORT_FENCE_CREATE_INFO,pNext=None,handleTypes=None,):
+
+    return _new('VkExportFenceCreateInfo', sType=sType,pNext=pNext,handleTypes=handleTypes)
+
+def VkPhysicalDeviceMultiviewFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTIVIEW_FEATURES,pNext=None,multiview=None,multiviewGeometryShader=None,multiviewTessellationShader=None,):
+
+    return _new('VkPhysicalDeviceMultiviewFeatures', sType=sType,pNext=pNext,multiview=multiview,multiviewGeometryShader=multiviewGeometryShader,multiviewTessellationShader=multiviewTessellationShader)
+
+def VkPhysicalDeviceMultiviewProperties(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTIVIEW_PROPERTIES,pNext=None,maxMultiviewViewCount=None,maxMultiviewInstanceIndex=None,):
+
+    return _new('VkPhysicalDeviceMultiviewProperties', sType=sType,pNext=pNext,maxMultiviewViewCount=maxMultiviewViewCount,maxMultiviewInstanceIndex=maxMultiviewInstanceIndex)
+
+def VkRenderPassMultiviewCreateInfo(sType=VK_STRUCTURE_TYPE_RENDER_PASS_MULTIVIEW_CREATE_INFO,pNext=None,subpassCount=None,pViewMasks=None,dependencyCount=None,pViewOffsets=None,correlationMaskCount=None,pCorrelationMasks=None,):
+    if subpassCount is None and pViewMasks is not None:
+        subpassCount = len(pViewMasks)
+    if dependencyCount is None and pViewOffsets is not None:
+        dependencyCount = len(pViewOffsets)
+    if correlationMaskCount is None and pCorrelationMasks is not None:
+        correlationMaskCount = len(pCorrelationMasks)
+
+    return _new('VkRenderPassMultiviewCreateInfo', sType=sType,pNext=pNext,subpassCount=subpassCount,pViewMasks=pViewMasks,dependencyCount=dependencyCount,pViewOffsets=pViewOffsets,correlationMaskCount=correlationMaskCount,pCorrelationMasks=pCorrelationMasks)
+
+def VkPhysicalDeviceGroupProperties(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_GROUP_PROPERTIES,pNext=None,physicalDeviceCount=None,physicalDevices=None,subsetAllocation=None,):
+
+    return _new('VkPhysicalDeviceGroupProperties', sType=sType,pNext=pNext,physicalDeviceCount=physicalDeviceCount,physicalDevices=physicalDevices,subsetAllocation=subsetAllocation)
+
+def VkMemoryAllocateFlagsInfo(sType=VK_STRUCTURE_TYPE_MEMORY_ALLOCATE_FLAGS_INFO,pNext=None,flags=None,deviceMask=None,):
+
+    return _new('VkMemoryAllocateFlagsInfo', sType=sType,pNext=pNext,flags=flags,deviceMask=deviceMask)
+
+def VkBindBufferMemoryInfo(sType=VK_STRUCTURE_TYPE_BIND_BUFFER_MEMORY_INFO,pNext=None,buffer=None,memory=None,memoryOffset=None,):
+
+    return _new('VkBindBufferMemoryInfo', sType=sType,pNext=pNext,buffer=buffer,memory=memory,memoryOffset=memoryOffset)
+
+def VkBindBufferMemoryDeviceGroupInfo(sType=VK_STRUCTURE_TYPE_BIND_BUFFER_MEMORY_DEVICE_GROUP_INFO,pNext=None,deviceIndexCount=None,pDeviceIndices=None,):
+    if deviceIndexCount is None and pDeviceIndices is not None:
+        deviceIndexCount = len(pDeviceIndices)
+
+    return _new('VkBindBufferMemoryDeviceGroupInfo', sType=sType,pNext=pNext,deviceIndexCount=deviceIndexCount,pDeviceIndices=pDeviceIndices)
+
+def VkBindImageMemoryInfo(sType=VK_STRUCTURE_TYPE_BIND_IMAGE_MEMORY_INFO,pNext=None,image=None,memory=None,memoryOffset=None,):
+
+    return _new('VkBindImageMemoryInfo', sType=sType,pNext=pNext,image=image,memory=memory,memoryOffset=memoryOffset)
+
+def VkBindImageMemoryDeviceGroupInfo(sType=VK_STRUCTURE_TYPE_BIND_IMAGE_MEMORY_DEVICE_GROUP_INFO,pNext=None,deviceIndexCount=None,pDeviceIndices=None,splitInstanceBindRegionCount=None,pSplitInstanceBindRegions=None,):
+    if deviceIndexCount is None and pDeviceIndices is not None:
+        deviceIndexCount = len(pDeviceIndices)
+    if splitInstanceBindRegionCount is None and pSplitInstanceBindRegions is not None:
+        splitInstanceBindRegionCount = len(pSplitInstanceBindRegions)
+
+    return _new('VkBindImageMemoryDeviceGroupInfo', sType=sType,pNext=pNext,deviceIndexCount=deviceIndexCount,pDeviceIndices=pDeviceIndices,splitInstanceBindRegionCount=splitInstanceBindRegionCount,pSplitInstanceBindRegions=pSplitInstanceBindRegions)
+
+def VkDeviceGroupRenderPassBeginInfo(sType=VK_STRUCTURE_TYPE_DEVICE_GROUP_RENDER_PASS_BEGIN_INFO,pNext=None,deviceMask=None,deviceRenderAreaCount=None,pDeviceRenderAreas=None,):
+    if deviceRenderAreaCount is None and pDeviceRenderAreas is not None:
+        deviceRenderAreaCount = len(pDeviceRenderAreas)
+
+    return _new('VkDeviceGroupRenderPassBeginInfo', sType=sType,pNext=pNext,deviceMask=deviceMask,deviceRenderAreaCount=deviceRenderAreaCount,pDeviceRenderAreas=pDeviceRenderAreas)
+
+def VkDeviceGroupCommandBufferBeginInfo(sType=VK_STRUCTURE_TYPE_DEVICE_GROUP_COMMAND_BUFFER_BEGIN_INFO,pNext=None,deviceMask=None,):
+
+    return _new('VkDeviceGroupCommandBufferBeginInfo', sType=sType,pNext=pNext,deviceMask=deviceMask)
+
+def VkDeviceGroupSubmitInfo(sType=VK_STRUCTURE_TYPE_DEVICE_GROUP_SUBMIT_INFO,pNext=None,waitSemaphoreCount=None,pWaitSemaphoreDeviceIndices=None,commandBufferCount=None,pCommandBufferDeviceMasks=None,signalSemaphoreCount=None,pSignalSemaphoreDeviceIndices=None,):
+    if waitSemaphoreCount is None and pWaitSemaphoreDeviceIndices is not None:
+        waitSemaphoreCount = len(pWaitSemaphoreDeviceIndices)
+    if commandBufferCount is None and pCommandBufferDeviceMasks is not None:
+        commandBufferCount = len(pCommandBufferDeviceMasks)
+    if signalSemaphoreCount is None and pSignalSemaphoreDeviceIndices is not None:
+        signalSemaphoreCount = len(pSignalSemaphoreDeviceIndices)
+
+    return _new('VkDeviceGroupSubmitInfo', sType=sType,pNext=pNext,waitSemaphoreCount=waitSemaphoreCount,pWaitSemaphoreDeviceIndices=pWaitSemaphoreDeviceIndices,commandBufferCount=commandBufferCount,pCommandBufferDeviceMasks=pCommandBufferDeviceMasks,signalSemaphoreCount=signalSemaphoreCount,pSignalSemaphoreDeviceIndices=pSignalSemaphoreDeviceIndices)
+
+def VkDeviceGroupBindSparseInfo(sType=VK_STRUCTURE_TYPE_DEVICE_GROUP_BIND_SPARSE_INFO,pNext=None,resourceDeviceIndex=None,memoryDeviceIndex=None,):
+
+    return _new('VkDeviceGroupBindSparseInfo', sType=sType,pNext=pNext,resourceDeviceIndex=resourceDeviceIndex,memoryDeviceIndex=memoryDeviceIndex)
+
+def VkDeviceGroupDeviceCreateInfo(sType=VK_STRUCTURE_TYPE_DEVICE_GROUP_DEVICE_CREATE_INFO,pNext=None,physicalDeviceCount=None,pPhysicalDevices=None,):
+    if physicalDeviceCount is None and pPhysicalDevices is not None:
+        physicalDeviceCount = len(pPhysicalDevices)
+
+    return _new('VkDeviceGroupDeviceCreateInfo', sType=sType,pNext=pNext,physicalDeviceCount=physicalDeviceCount,pPhysicalDevices=pPhysicalDevices)
+
+def VkDescriptorUpdateTemplateEntry(dstBinding=None,dstArrayElement=None,descriptorCount=None,descriptorType=None,offset=None,stride=None,):
+
+    return _new('VkDescriptorUpdateTemplateEntry', dstBinding=dstBinding,dstArrayElement=dstArrayElement,descriptorCount=descriptorCount,descriptorType=descriptorType,offset=offset,stride=stride)
+
+def VkDescriptorUpdateTemplateCreateInfo(sType=VK_STRUCTURE_TYPE_DESCRIPTOR_UPDATE_TEMPLATE_CREATE_INFO,pNext=None,flags=None,descriptorUpdateEntryCount=None,pDescriptorUpdateEntries=None,templateType=None,descriptorSetLayout=None,pipelineBindPoint=None,pipelineLayout=None,set=None,):
+    if descriptorUpdateEntryCount is None and pDescriptorUpdateEntries is not None:
+        descriptorUpdateEntryCount = len(pDescriptorUpdateEntries)
+
+    return _new('VkDescriptorUpdateTemplateCreateInfo', sType=sType,pNext=pNext,flags=flags,descriptorUpdateEntryCount=descriptorUpdateEntryCount,pDescriptorUpdateEntries=pDescriptorUpdateEntries,templateType=templateType,descriptorSetLayout=descriptorSetLayout,pipelineBindPoint=pipelineBindPoint,pipelineLayout=pipelineLayout,set=set)
+
+def VkInputAttachmentAspectReference(subpass=None,inputAttachmentIndex=None,aspectMask=None,):
+
+    return _new('VkInputAttachmentAspectReference', subpass=subpass,inputAttachmentIndex=inputAttachmentIndex,aspectMask=aspectMask)
+
+def VkRenderPassInputAttachmentAspectCreateInfo(sType=VK_STRUCTURE_TYPE_RENDER_PASS_INPUT_ATTACHMENT_ASPECT_CREATE_INFO,pNext=None,aspectReferenceCount=None,pAspectReferences=None,):
+    if aspectReferenceCount is None and pAspectReferences is not None:
+        aspectReferenceCount = len(pAspectReferences)
+
+    return _new('VkRenderPassInputAttachmentAspectCreateInfo', sType=sType,pNext=pNext,aspectReferenceCount=aspectReferenceCount,pAspectReferences=pAspectReferences)
+
+def VkPhysicalDevice16BitStorageFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_16BIT_STORAGE_FEATURES,pNext=None,storageBuffer16BitAccess=None,uniformAndStorageBuffer16BitAccess=None,storagePushConstant16=None,storageInputOutput16=None,):
+
+    return _new('VkPhysicalDevice16BitStorageFeatures', sType=sType,pNext=pNext,storageBuffer16BitAccess=storageBuffer16BitAccess,uniformAndStorageBuffer16BitAccess=uniformAndStorageBuffer16BitAccess,storagePushConstant16=storagePushConstant16,storageInputOutput16=storageInputOutput16)
+
+def VkPhysicalDeviceSubgroupProperties(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBGROUP_PROPERTIES,pNext=None,subgroupSize=None,supportedStages=None,supportedOperations=None,quadOperationsInAllStages=None,):
+
+    return _new('VkPhysicalDeviceSubgroupProperties', sType=sType,pNext=pNext,subgroupSize=subgroupSize,supportedStages=supportedStages,supportedOperations=supportedOperations,quadOperationsInAllStages=quadOperationsInAllStages)
+
+def VkBufferMemoryRequirementsInfo2(sType=VK_STRUCTURE_TYPE_BUFFER_MEMORY_REQUIREMENTS_INFO_2,pNext=None,buffer=None,):
+
+    return _new('VkBufferMemoryRequirementsInfo2', sType=sType,pNext=pNext,buffer=buffer)
+
+def VkImageMemoryRequirementsInfo2(sType=VK_STRUCTURE_TYPE_IMAGE_MEMORY_REQUIREMENTS_INFO_2,pNext=None,image=None,):
+
+    return _new('VkImageMemoryRequirementsInfo2', sType=sType,pNext=pNext,image=image)
+
+def VkImageSparseMemoryRequirementsInfo2(sType=VK_STRUCTURE_TYPE_IMAGE_SPARSE_MEMORY_REQUIREMENTS_INFO_2,pNext=None,image=None,):
+
+    return _new('VkImageSparseMemoryRequirementsInfo2', sType=sType,pNext=pNext,image=image)
+
+def VkMemoryRequirements2(sType=VK_STRUCTURE_TYPE_MEMORY_REQUIREMENTS_2,pNext=None,memoryRequirements=None,):
+
+    return _new('VkMemoryRequirements2', sType=sType,pNext=pNext,memoryRequirements=memoryRequirements)
+
+def VkSparseImageMemoryRequirements2(sType=VK_STRUCTURE_TYPE_SPARSE_IMAGE_MEMORY_REQUIREMENTS_2,pNext=None,memoryRequirements=None,):
+
+    return _new('VkSparseImageMemoryRequirements2', sType=sType,pNext=pNext,memoryRequirements=memoryRequirements)
+
+def VkPhysicalDevicePointClippingProperties(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_POINT_CLIPPING_PROPERTIES,pNext=None,pointClippingBehavior=None,):
+
+    return _new('VkPhysicalDevicePointClippingProperties', sType=sType,pNext=pNext,pointClippingBehavior=pointClippingBehavior)
+
+def VkMemoryDedicatedRequirements(sType=VK_STRUCTURE_TYPE_MEMORY_DEDICATED_REQUIREMENTS,pNext=None,prefersDedicatedAllocation=None,requiresDedicatedAllocation=None,):
+
+    return _new('VkMemoryDedicatedRequirements', sType=sType,pNext=pNext,prefersDedicatedAllocation=prefersDedicatedAllocation,requiresDedicatedAllocation=requiresDedicatedAllocation)
+
+def VkMemoryDedicatedAllocateInfo(sType=VK_STRUCTURE_TYPE_MEMORY_DEDICATED_ALLOCATE_INFO,pNext=None,image=None,buffer=None,):
+
+    return _new('VkMemoryDedicatedAllocateInfo', sType=sType,pNext=pNext,image=image,buffer=buffer)
+
+def VkImageViewUsageCreateInfo(sType=VK_STRUCTURE_TYPE_IMAGE_VIEW_USAGE_CREATE_INFO,pNext=None,usage=None,):
+
+    return _new('VkImageViewUsageCreateInfo', sType=sType,pNext=pNext,usage=usage)
+
+def VkPipelineTessellationDomainOriginStateCreateInfo(sType=VK_STRUCTURE_TYPE_PIPELINE_TESSELLATION_DOMAIN_ORIGIN_STATE_CREATE_INFO,pNext=None,domainOrigin=None,):
+
+    return _new('VkPipelineTessellationDomainOriginStateCreateInfo', sType=sType,pNext=pNext,domainOrigin=domainOrigin)
+
+def VkSamplerYcbcrConversionInfo(sType=VK_STRUCTURE_TYPE_SAMPLER_YCBCR_CONVERSION_INFO,pNext=None,conversion=None,):
+
+    return _new('VkSamplerYcbcrConversionInfo', sType=sType,pNext=pNext,conversion=conversion)
+
+def VkSamplerYcbcrConversionCreateInfo(sType=VK_STRUCTURE_TYPE_SAMPLER_YCBCR_CONVERSION_CREATE_INFO,pNext=None,format=None,ycbcrModel=None,ycbcrRange=None,components=None,xChromaOffset=None,yChromaOffset=None,chromaFilter=None,forceExplicitReconstruction=None,):
+
+    return _new('VkSamplerYcbcrConversionCreateInfo', sType=sType,pNext=pNext,format=format,ycbcrModel=ycbcrModel,ycbcrRange=ycbcrRange,components=components,xChromaOffset=xChromaOffset,yChromaOffset=yChromaOffset,chromaFilter=chromaFilter,forceExplicitReconstruction=forceExplicitReconstruction)
+
+def VkBindImagePlaneMemoryInfo(sType=VK_STRUCTURE_TYPE_BIND_IMAGE_PLANE_MEMORY_INFO,pNext=None,planeAspect=None,):
+
+    return _new('VkBindImagePlaneMemoryInfo', sType=sType,pNext=pNext,planeAspect=planeAspect)
+
+def VkImagePlaneMemoryRequirementsInfo(sType=VK_STRUCTURE_TYPE_IMAGE_PLANE_MEMORY_REQUIREMENTS_INFO,pNext=None,planeAspect=None,):
+
+    return _new('VkImagePlaneMemoryRequirementsInfo', sType=sType,pNext=pNext,planeAspect=planeAspect)
+
+def VkPhysicalDeviceSamplerYcbcrConversionFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SAMPLER_YCBCR_CONVERSION_FEATURES,pNext=None,samplerYcbcrConversion=None,):
+
+    return _new('VkPhysicalDeviceSamplerYcbcrConversionFeatures', sType=sType,pNext=pNext,samplerYcbcrConversion=samplerYcbcrConversion)
+
+def VkSamplerYcbcrConversionImageFormatProperties(sType=VK_STRUCTURE_TYPE_SAMPLER_YCBCR_CONVERSION_IMAGE_FORMAT_PROPERTIES,pNext=None,combinedImageSamplerDescriptorCount=None,):
+
+    return _new('VkSamplerYcbcrConversionImageFormatProperties', sType=sType,pNext=pNext,combinedImageSamplerDescriptorCount=combinedImageSamplerDescriptorCount)
+
+def VkProtectedSubmitInfo(sType=VK_STRUCTURE_TYPE_PROTECTED_SUBMIT_INFO,pNext=None,protectedSubmit=None,):
+
+    return _new('VkProtectedSubmitInfo', sType=sType,pNext=pNext,protectedSubmit=protectedSubmit)
+
+def VkPhysicalDeviceProtectedMemoryFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PROTECTED_MEMORY_FEATURES,pNext=None,protectedMemory=None,):
+
+    return _new('VkPhysicalDeviceProtectedMemoryFeatures', sType=sType,pNext=pNext,protectedMemory=protectedMemory)
+
+def VkPhysicalDeviceProtectedMemoryProperties(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PROTECTED_MEMORY_PROPERTIES,pNext=None,protectedNoFault=None,):
+
+    return _new('VkPhysicalDeviceProtectedMemoryProperties', sType=sType,pNext=pNext,protectedNoFault=protectedNoFault)
+
+def VkDeviceQueueInfo2(sType=VK_STRUCTURE_TYPE_DEVICE_QUEUE_INFO_2,pNext=None,flags=None,queueFamilyIndex=None,queueIndex=None,):
+
+    return _new('VkDeviceQueueInfo2', sType=sType,pNext=pNext,flags=flags,queueFamilyIndex=queueFamilyIndex,queueIndex=queueIndex)
+
+def VkPhysicalDeviceMaintenance3Properties(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_3_PROPERTIES,pNext=None,maxPerSetDescriptors=None,maxMemoryAllocationSize=None,):
+
+    return _new('VkPhysicalDeviceMaintenance3Properties', sType=sType,pNext=pNext,maxPerSetDescriptors=maxPerSetDescriptors,maxMemoryAllocationSize=maxMemoryAllocationSize)
+
+def VkDescriptorSetLayoutSupport(sType=VK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_SUPPORT,pNext=None,supported=None,):
+
+    return _new('VkDescriptorSetLayoutSupport', sType=sType,pNext=pNext,supported=supported)
+
+def VkPhysicalDeviceShaderDrawParametersFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_DRAW_PARAMETERS_FEATURES,pNext=None,shaderDrawParameters=None,):
+
+    return _new('VkPhysicalDeviceShaderDrawParametersFeatures', sType=sType,pNext=pNext,shaderDrawParameters=shaderDrawParameters)
+
+
+
+
+
+
+
+
+
+
+def vkEnumerateInstanceVersion(
+pApiVersion=None
+        ,):
+    _args = _arg_types('vkEnumerateInstanceVersion', lib.vkEnumerateInstanceVersion)
+
+
+    custom_return = True
+    if not pApiVersion:
+        pApiVersion = ffi.new('uint32_t*')
+        custom_return = False
+
+    result = lib.vkEnumerateInstanceVersion(_auto_handle(pApiVersion, _args[0]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pApiVersion
+
+    return pApiVersion[0]
+
+
+
+def vkGetPhysicalDeviceFeatures2(
+physicalDevice
+        ,pFeatures=None
+        ,):
+    _args = _arg_types('vkGetPhysicalDeviceFeatures2', lib.vkGetPhysicalDeviceFeatures2)
+
+
+    custom_return = True
+    if not pFeatures:
+        pFeatures = ffi.new('VkPhysicalDeviceFeatures2*')
+        custom_return = False
+
+    result = lib.vkGetPhysicalDeviceFeatures2(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pFeatures, _args[1]))
+
+    if custom_return:
+        return pFeatures
+
+    return pFeatures[0]
+
+
+
+def _wrap_vkGetPhysicalDeviceFeatures2(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceFeatures2(
+    physicalDevice
+            ,pFeatures=None
+            ,):
+
+
+        custom_return = True
+        if not pFeatures:
+            pFeatures = ffi.new('VkPhysicalDeviceFeatures2*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pFeatures, _args[1]))
+
+        if custom_return:
+            return pFeatures
+
+        return pFeatures[0]
+
+
+
+    return vkGetPhysicalDeviceFeatures2
+def vkGetPhysicalDeviceProperties2(
+physicalDevice
+        ,pProperties=None
+        ,):
+    _args = _arg_types('vkGetPhysicalDeviceProperties2', lib.vkGetPhysicalDeviceProperties2)
+
+
+    custom_return = True
+    if not pProperties:
+        pProperties = ffi.new('VkPhysicalDeviceProperties2*')
+        custom_return = False
+
+    result = lib.vkGetPhysicalDeviceProperties2(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pProperties, _args[1]))
+
+    if custom_return:
+        return pProperties
+
+    return pProperties[0]
+
+
+
+def _wrap_vkGetPhysicalDeviceProperties2(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceProperties2(
+    physicalDevice
+            ,pProperties=None
+            ,):
+
+
+        custom_return = True
+        if not pProperties:
+            pProperties = ffi.new('VkPhysicalDeviceProperties2*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pProperties, _args[1]))
+
+        if custom_return:
+            return pProperties
+
+        return pProperties[0]
+
+
+
+    return vkGetPhysicalDeviceProperties2
+def vkGetPhysicalDeviceFormatProperties2(
+physicalDevice
+        ,format
+        ,pFormatProperties=None
+        ,):
+    _args = _arg_types('vkGetPhysicalDeviceFormatProperties2', lib.vkGetPhysicalDeviceFormatProperties2)
+
+
+    custom_return = True
+    if not pFormatProperties:
+        pFormatProperties = ffi.new('VkFormatProperties2*')
+        custom_return = False
+
+    result = lib.vkGetPhysicalDeviceFormatProperties2(_handle(physicalDevice, 'VkPhysicalDevice'),format,_auto_handle(pFormatProperties, _args[2]))
+
+    if custom_return:
+        return pFormatProperties
+
+    return pFormatProperties[0]
+
+
+
+def _wrap_vkGetPhysicalDeviceFormatProperties2(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceFormatProperties2(
+    physicalDevice
+            ,format
+            ,pFormatProperties=None
+            ,):
+
+
+        custom_return = True
+        if not pFormatProperties:
+            pFormatProperties = ffi.new('VkFormatProperties2*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),format,_auto_handle(pFormatProperties, _args[2]))
+
+        if custom_return:
+            return pFormatProperties
+
+        return pFormatProperties[0]
+
+
+
+    return vkGetPhysicalDeviceFormatProperties2
+def vkGetPhysicalDeviceImageFormatProperties2(
+physicalDevice
+        ,pImageFormatInfo
+        ,pImageFormatProperties=None
+        ,):
+    _args = _arg_types('vkGetPhysicalDeviceImageFormatProperties2', lib.vkGetPhysicalDeviceImageFormatProperties2)
+
+
+    custom_return = True
+    if not pImageFormatProperties:
+        pImageFormatProperties = ffi.new('VkImageFormatProperties2*')
+        custom_return = False
+
+    result = lib.vkGetPhysicalDeviceImageFormatProperties2(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pImageFormatInfo, _args[1]),_auto_handle(pImageFormatProperties, _args[2]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pImageFormatProperties
+
+    return pImageFormatProperties[0]
+
+
+
+def _wrap_vkGetPhysicalDeviceImageFormatProperties2(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceImageFormatProperties2(
+    physicalDevice
+            ,pImageFormatInfo
+            ,pImageFormatProperties=None
+            ,):
+
+
+        custom_return = True
+        if not pImageFormatProperties:
+            pImageFormatProperties = ffi.new('VkImageFormatProperties2*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pImageFormatInfo, _args[1]),_auto_handle(pImageFormatProperties, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pImageFormatProperties
+
+        return pImageFormatProperties[0]
+
+
+
+    return vkGetPhysicalDeviceImageFormatProperties2
+def vkGetPhysicalDeviceQueueFamilyProperties2(
+physicalDevice
+        ,pQueueFamilyProperties=None
+        ,):
+
+
+    pQueueFamilyPropertyCount = ffi.new('uint32_t*')
+    custom_return = pQueueFamilyProperties is not None
+    _array = pQueueFamilyProperties
+
+    pQueueFamilyProperties = ffi.NULL
+    lib.vkGetPhysicalDeviceQueueFamilyProperties2(_handle(physicalDevice, 'VkPhysicalDevice'),pQueueFamilyPropertyCount,pQueueFamilyProperties)
+
+    if _array is None or len(_array) < pQueueFamilyPropertyCount[0]:
+        _array = ffi.new('VkQueueFamilyProperties2[]', pQueueFamilyPropertyCount[0])
+    pQueueFamilyProperties = _array
+    lib.vkGetPhysicalDeviceQueueFamilyProperties2(_handle(physicalDevice, 'VkPhysicalDevice'),pQueueFamilyPropertyCount,pQueueFamilyProperties)
+
+    if pQueueFamilyPropertyCount[0] != len(_array):
+        pQueueFamilyProperties = _slice(_array, pQueueFamilyPropertyCount[0])
+
+    return pQueueFamilyProperties
+
+
+def _wrap_vkGetPhysicalDeviceQueueFamilyProperties2(fn):
+    def vkGetPhysicalDeviceQueueFamilyProperties2(
+    physicalDevice
+            ,pQueueFamilyProperties=None
+            ,):
+
+
+        pQueueFamilyPropertyCount = ffi.new('uint32_t*')
+        custom_return = pQueueFamilyProperties is not None
+        _array = pQueueFamilyProperties
+
+        pQueueFamilyProperties = ffi.NULL
+        fn(_handle(physicalDevice, 'VkPhysicalDevice'),pQueueFamilyPropertyCount,pQueueFamilyProperties)
+
+        if _array is None or len(_array) < pQueueFamilyPropertyCount[0]:
+            _array = ffi.new('VkQueueFamilyProperties2[]', pQueueFamilyPropertyCount[0])
+        pQueueFamilyProperties = _array
+        fn(_handle(physicalDevice, 'VkPhysicalDevice'),pQueueFamilyPropertyCount,pQueueFamilyProperties)
+
+        if pQueueFamilyPropertyCount[0] != len(_array):
+            pQueueFamilyProperties = _slice(_array, pQueueFamilyPropertyCount[0])
+
+        return pQueueFamilyProperties
+
+
+    return vkGetPhysicalDeviceQueueFamilyProperties2
+def vkGetPhysicalDeviceMemoryProperties2(
+physicalDevice
+        ,pMemoryProperties=None
+        ,):
+    _args = _arg_types('vkGetPhysicalDeviceMemoryProperties2', lib.vkGetPhysicalDeviceMemoryProperties2)
+
+
+    custom_return = True
+    if not pMemoryProperties:
+        pMemoryProperties = ffi.new('VkPhysicalDeviceMemoryProperties2*')
+        custom_return = False
+
+    result = lib.vkGetPhysicalDeviceMemoryProperties2(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pMemoryProperties, _args[1]))
+
+    if custom_return:
+        return pMemoryProperties
+
+    return pMemoryProperties[0]
+
+
+
+def _wrap_vkGetPhysicalDeviceMemoryProperties2(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceMemoryProperties2(
+    physicalDevice
+            ,pMemoryProperties=None
+            ,):
+
+
+        custom_return = True
+        if not pMemoryProperties:
+            pMemoryProperties = ffi.new('VkPhysicalDeviceMemoryProperties2*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pMemoryProperties, _args[1]))
+
+        if custom_return:
+            return pMemoryProperties
+
+        return pMemoryProperties[0]
+
+
+
+    return vkGetPhysicalDeviceMemoryProperties2
+def vkGetPhysicalDeviceSparseImageFormatProperties2(
+physicalDevice
+        ,pFormatInfo
+        ,pProperties=None
+        ,):
+    _args = _arg_types('vkGetPhysicalDeviceSparseImageFormatProperties2', lib.vkGetPhysicalDeviceSparseImageFormatProperties2)
+
+
+    pPropertyCount = ffi.new('uint32_t*')
+    custom_return = pProperties is not None
+    _array = pProperties
+
+    pProperties = ffi.NULL
+    lib.vkGetPhysicalDeviceSparseImageFormatProperties2(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pFormatInfo, _args[1]),pPropertyCount,pProperties)
+
+    if _array is None or len(_array) < pPropertyCount[0]:
+        _array = ffi.new('VkSparseImageFormatProperties2[]', pPropertyCount[0])
+    pProperties = _array
+    lib.vkGetPhysicalDeviceSparseImageFormatProperties2(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pFormatInfo, _args[1]),pPropertyCount,pProperties)
+
+    if pPropertyCount[0] != len(_array):
+        pProperties = _slice(_array, pPropertyCount[0])
+
+    return pProperties
+
+
+def _wrap_vkGetPhysicalDeviceSparseImageFormatProperties2(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceSparseImageFormatProperties2(
+    physicalDevice
+            ,pFormatInfo
+            ,pProperties=None
+            ,):
+
+
+        pPropertyCount = ffi.new('uint32_t*')
+        custom_return = pProperties is not None
+        _array = pProperties
+
+        pProperties = ffi.NULL
+        fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pFormatInfo, _args[1]),pPropertyCount,pProperties)
+
+        if _array is None or len(_array) < pPropertyCount[0]:
+            _array = ffi.new('VkSparseImageFormatProperties2[]', pPropertyCount[0])
+        pProperties = _array
+        fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pFormatInfo, _args[1]),pPropertyCount,pProperties)
+
+        if pPropertyCount[0] != len(_array):
+            pProperties = _slice(_array, pPropertyCount[0])
+
+        return pProperties
+
+
+    return vkGetPhysicalDeviceSparseImageFormatProperties2
+def vkTrimCommandPool(
+device
+        ,commandPool
+        ,flags
+        ,):
+
+    result = lib.vkTrimCommandPool(_handle(device, 'VkDevice'),_handle(commandPool, 'VkCommandPool'),flags)
+
+
+def _wrap_vkTrimCommandPool(fn):
+    def vkTrimCommandPool(
+    device
+            ,commandPool
+            ,flags
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(commandPool, 'VkCommandPool'),flags)
+
+
+    return vkTrimCommandPool
+def vkGetPhysicalDeviceExternalBufferProperties(
+physicalDevice
+        ,pExternalBufferInfo
+        ,pExternalBufferProperties=None
+        ,):
+    _args = _arg_types('vkGetPhysicalDeviceExternalBufferProperties', lib.vkGetPhysicalDeviceExternalBufferProperties)
+
+
+    custom_return = True
+    if not pExternalBufferProperties:
+        pExternalBufferProperties = ffi.new('VkExternalBufferProperties*')
+        custom_return = False
+
+    result = lib.vkGetPhysicalDeviceExternalBufferProperties(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pExternalBufferInfo, _args[1]),_auto_handle(pExternalBufferProperties, _args[2]))
+
+    if custom_return:
+        return pExternalBufferProperties
+
+    return pExternalBufferProperties[0]
+
+
+
+def _wrap_vkGetPhysicalDeviceExternalBufferProperties(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceExternalBufferProperties(
+    physicalDevice
+            ,pExternalBufferInfo
+            ,pExternalBufferProperties=None
+            ,):
+
+
+        custom_return = True
+        if not pExternalBufferProperties:
+            pExternalBufferProperties = ffi.new('VkExternalBufferProperties*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pExternalBufferInfo, _args[1]),_auto_handle(pExternalBufferProperties, _args[2]))
+
+        if custom_return:
+            return pExternalBufferProperties
+
+        return pExternalBufferProperties[0]
+
+
+
+    return vkGetPhysicalDeviceExternalBufferProperties
+def vkGetPhysicalDeviceExternalSemaphoreProperties(
+physicalDevice
+        ,pExternalSemaphoreInfo
+        ,pExternalSemaphoreProperties=None
+        ,):
+    _args = _arg_types('vkGetPhysicalDeviceExternalSemaphoreProperties', lib.vkGetPhysicalDeviceExternalSemaphoreProperties)
+
+
+    custom_return = True
+    if not pExternalSemaphoreProperties:
+        pExternalSemaphoreProperties = ffi.new('VkExternalSemaphoreProperties*')
+        custom_return = False
+
+    result = lib.vkGetPhysicalDeviceExternalSemaphoreProperties(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pExternalSemaphoreInfo, _args[1]),_auto_handle(pExternalSemaphoreProperties, _args[2]))
+
+    if custom_return:
+        return pExternalSemaphoreProperties
+
+    return pExternalSemaphoreProperties[0]
+
+
+
+def _wrap_vkGetPhysicalDeviceExternalSemaphoreProperties(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceExternalSemaphoreProperties(
+    physicalDevice
+            ,pExternalSemaphoreInfo
+            ,pExternalSemaphoreProperties=None
+            ,):
+
+
+        custom_return = True
+        if not pExternalSemaphoreProperties:
+            pExternalSemaphoreProperties = ffi.new('VkExternalSemaphoreProperties*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pExternalSemaphoreInfo, _args[1]),_auto_handle(pExternalSemaphoreProperties, _args[2]))
+
+        if custom_return:
+            return pExternalSemaphoreProperties
+
+        return pExternalSemaphoreProperties[0]
+
+
+
+    return vkGetPhysicalDeviceExternalSemaphoreProperties
+def vkGetPhysicalDeviceExternalFenceProperties(
+physicalDevice
+        ,pExternalFenceInfo
+        ,pExternalFenceProperties=None
+        ,):
+    _args = _arg_types('vkGetPhysicalDeviceExternalFenceProperties', lib.vkGetPhysicalDeviceExternalFenceProperties)
+
+
+    custom_return = True
+    if not pExternalFenceProperties:
+        pExternalFenceProperties = ffi.new('VkExternalFenceProperties*')
+        custom_return = False
+
+    result = lib.vkGetPhysicalDeviceExternalFenceProperties(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pExternalFenceInfo, _args[1]),_auto_handle(pExternalFenceProperties, _args[2]))
+
+    if custom_return:
+        return pExternalFenceProperties
+
+    return pExternalFenceProperties[0]
+
+
+
+def _wrap_vkGetPhysicalDeviceExternalFenceProperties(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceExternalFenceProperties(
+    physicalDevice
+            ,pExternalFenceInfo
+            ,pExternalFenceProperties=None
+            ,):
+
+
+        custom_return = True
+        if not pExternalFenceProperties:
+            pExternalFenceProperties = ffi.new('VkExternalFenceProperties*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pExternalFenceInfo, _args[1]),_auto_handle(pExternalFenceProperties, _args[2]))
+
+        if custom_return:
+            return pExternalFenceProperties
+
+        return pExternalFenceProperties[0]
+
+
+
+    return vkGetPhysicalDeviceExternalFenceProperties
+def vkEnumeratePhysicalDeviceGroups(
+instance
+        ,pPhysicalDeviceGroupProperties=None
+        ,):
+
+
+    pPhysicalDeviceGroupCount = ffi.new('uint32_t*')
+    custom_return = pPhysicalDeviceGroupProperties is not None
+    _array = pPhysicalDeviceGroupProperties
+
+    if custom_return:
+        # the buffer is usually big enough, one call instead of two
+        pPhysicalDeviceGroupCount[0] = len(_array)
+        result = lib.vkEnumeratePhysicalDeviceGroups(_handle(instance, 'VkInstance'),pPhysicalDeviceGroupCount,pPhysicalDeviceGroupProperties)
+    else:
+        result = VK_INCOMPLETE
+
+    # the count can change between the two calls
+    while result == VK_INCOMPLETE:
+        pPhysicalDeviceGroupProperties = ffi.NULL
+        result = lib.vkEnumeratePhysicalDeviceGroups(_handle(instance, 'VkInstance'),pPhysicalDeviceGroupCount,pPhysicalDeviceGroupProperties)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if _array is None or len(_array) < pPhysicalDeviceGroupCount[0]:
+            _array = ffi.new('VkPhysicalDeviceGroupProperties[]', pPhysicalDeviceGroupCount[0])
+        pPhysicalDeviceGroupProperties = _array
+        result = lib.vkEnumeratePhysicalDeviceGroups(_handle(instance, 'VkInstance'),pPhysicalDeviceGroupCount,pPhysicalDeviceGroupProperties)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if pPhysicalDeviceGroupCount[0] != len(_array):
+        pPhysicalDeviceGroupProperties = _slice(_array, pPhysicalDeviceGroupCount[0])
+
+    return pPhysicalDeviceGroupProperties
+
+
+def _wrap_vkEnumeratePhysicalDeviceGroups(fn):
+    def vkEnumeratePhysicalDeviceGroups(
+    instance
+            ,pPhysicalDeviceGroupProperties=None
+            ,):
+
+
+        pPhysicalDeviceGroupCount = ffi.new('uint32_t*')
+        custom_return = pPhysicalDeviceGroupProperties is not None
+        _array = pPhysicalDeviceGroupProperties
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pPhysicalDeviceGroupCount[0] = len(_array)
+            result = fn(_handle(instance, 'VkInstance'),pPhysicalDeviceGroupCount,pPhysicalDeviceGroupProperties)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pPhysicalDeviceGroupProperties = ffi.NULL
+            result = fn(_handle(instance, 'VkInstance'),pPhysicalDeviceGroupCount,pPhysicalDeviceGroupProperties)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pPhysicalDeviceGroupCount[0]:
+                _array = ffi.new('VkPhysicalDeviceGroupProperties[]', pPhysicalDeviceGroupCount[0])
+            pPhysicalDeviceGroupProperties = _array
+            result = fn(_handle(instance, 'VkInstance'),pPhysicalDeviceGroupCount,pPhysicalDeviceGroupProperties)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pPhysicalDeviceGroupCount[0] != len(_array):
+            pPhysicalDeviceGroupProperties = _slice(_array, pPhysicalDeviceGroupCount[0])
+
+        return pPhysicalDeviceGroupProperties
+
+
+    return vkEnumeratePhysicalDeviceGroups
+def vkGetDeviceGroupPeerMemoryFeatures(
+device
+        ,heapIndex
+        ,localDeviceIndex
+        ,remoteDeviceIndex
+        ,pPeerMemoryFeatures=None
+        ,):
+    _args = _arg_types('vkGetDeviceGroupPeerMemoryFeatures', lib.vkGetDeviceGroupPeerMemoryFeatures)
+
+
+    custom_return = True
+    if not pPeerMemoryFeatures:
+        pPeerMemoryFeatures = ffi.new('VkPeerMemoryFeatureFlags*')
+        custom_return = False
+
+    result = lib.vkGetDeviceGroupPeerMemoryFeatures(_handle(device, 'VkDevice'),heapIndex,localDeviceIndex,remoteDeviceIndex,_auto_handle(pPeerMemoryFeatures, _args[4]))
+
+    if custom_return:
+        return pPeerMemoryFeatures
+
+    return pPeerMemoryFeatures[0]
+
+
+
+def _wrap_vkGetDeviceGroupPeerMemoryFeatures(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetDeviceGroupPeerMemoryFeatures(
+    device
+            ,heapIndex
+            ,localDeviceIndex
+            ,remoteDeviceIndex
+            ,pPeerMemoryFeatures=None
+            ,):
+
+
+        custom_return = True
+        if not pPeerMemoryFeatures:
+            pPeerMemoryFeatures = ffi.new('VkPeerMemoryFeatureFlags*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),heapIndex,localDeviceIndex,remoteDeviceIndex,_auto_handle(pPeerMemoryFeatures, _args[4]))
+
+        if custom_return:
+            return pPeerMemoryFeatures
+
+        return pPeerMemoryFeatures[0]
+
+
+
+    return vkGetDeviceGroupPeerMemoryFeatures
+def vkBindBufferMemory2(
+device
+        ,bindInfoCount
+        ,pBindInfos
+        ,):
+    _args = _arg_types('vkBindBufferMemory2', lib.vkBindBufferMemory2)
+
+    result = lib.vkBindBufferMemory2(_handle(device, 'VkDevice'),bindInfoCount,_auto_handle(pBindInfos, _args[2]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def _wrap_vkBindBufferMemory2(fn):
+    _args = ffi.typeof(fn).args
+    def vkBindBufferMemory2(
+    device
+            ,bindInfoCount
+            ,pBindInfos
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),bindInfoCount,_auto_handle(pBindInfos, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkBindBufferMemory2
+def vkBindImageMemory2(
+device
+        ,bindInfoCount
+        ,pBindInfos
+        ,):
+    _args = _arg_types('vkBindImageMemory2', lib.vkBindImageMemory2)
+
+    result = lib.vkBindImageMemory2(_handle(device, 'VkDevice'),bindInfoCount,_auto_handle(pBindInfos, _args[2]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def _wrap_vkBindImageMemory2(fn):
+    _args = ffi.typeof(fn).args
+    def vkBindImageMemory2(
+    device
+            ,bindInfoCount
+            ,pBindInfos
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),bindInfoCount,_auto_handle(pBindInfos, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkBindImageMemory2
+def vkCmdSetDeviceMask(
+commandBuffer
+        ,deviceMask
+        ,):
+
+    result = lib.vkCmdSetDeviceMask(_handle(commandBuffer, 'VkCommandBuffer'),deviceMask)
+
+
+def _wrap_vkCmdSetDeviceMask(fn):
+    def vkCmdSetDeviceMask(
+    commandBuffer
+            ,deviceMask
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),deviceMask)
+
+
+    return vkCmdSetDeviceMask
+def vkCmdDispatchBase(
+commandBuffer
+        ,baseGroupX
+        ,baseGroupY
+        ,baseGroupZ
+        ,groupCountX
+        ,groupCountY
+        ,groupCountZ
+        ,):
+
+    result = lib.vkCmdDispatchBase(_handle(commandBuffer, 'VkCommandBuffer'),baseGroupX,baseGroupY,baseGroupZ,groupCountX,groupCountY,groupCountZ)
+
+
+def _wrap_vkCmdDispatchBase(fn):
+    def vkCmdDispatchBase(
+    commandBuffer
+            ,baseGroupX
+            ,baseGroupY
+            ,baseGroupZ
+            ,groupCountX
+            ,groupCountY
+            ,groupCountZ
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),baseGroupX,baseGroupY,baseGroupZ,groupCountX,groupCountY,groupCountZ)
+
+
+    return vkCmdDispatchBase
+def vkCreateDescriptorUpdateTemplate(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pDescriptorUpdateTemplate=None
+        ,):
+    _args = _arg_types('vkCreateDescriptorUpdateTemplate', lib.vkCreateDescriptorUpdateTemplate)
+
+
+    custom_return = True
+    if not pDescriptorUpdateTemplate:
+        pDescriptorUpdateTemplate = ffi.new('VkDescriptorUpdateTemplate*')
+        custom_return = False
+
+    result = lib.vkCreateDescriptorUpdateTemplate(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pDescriptorUpdateTemplate, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pDescriptorUpdateTemplate
+
+    return pDescriptorUpdateTemplate[0]
+
+
+
+def _wrap_vkCreateDescriptorUpdateTemplate(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateDescriptorUpdateTemplate(
+    device
+            ,pCreateInfo
+            ,pAllocator
+            ,pDescriptorUpdateTemplate=None
+            ,):
+
+
+        custom_return = True
+        if not pDescriptorUpdateTemplate:
+            pDescriptorUpdateTemplate = ffi.new('VkDescriptorUpdateTemplate*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pDescriptorUpdateTemplate, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pDescriptorUpdateTemplate
+
+        return pDescriptorUpdateTemplate[0]
+
+
+
+    return vkCreateDescriptorUpdateTemplate
+def vkDestroyDescriptorUpdateTemplate(
+device
+        ,descriptorUpdateTemplate
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkDestroyDescriptorUpdateTemplate', lib.vkDestroyDescriptorUpdateTemplate)
+
+    result = lib.vkDestroyDescriptorUpdateTemplate(_handle(device, 'VkDevice'),_handle(descriptorUpdateTemplate, 'VkDescriptorUpdateTemplate'),_auto_handle(pAllocator, _args[2]))
+
+
+def _wrap_vkDestroyDescriptorUpdateTemplate(fn):
+    _args = ffi.typeof(fn).args
+    def vkDestroyDescriptorUpdateTemplate(
+    device
+            ,descriptorUpdateTemplate
+            ,pAllocator
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(descriptorUpdateTemplate, 'VkDescriptorUpdateTemplate'),_auto_handle(pAllocator, _args[2]))
+
+
+    return vkDestroyDescriptorUpdateTemplate
+def vkUpdateDescriptorSetWithTemplate(
+device
+        ,descriptorSet
+        ,descriptorUpdateTemplate
+        ,pData
+        ,):
+    _args = _arg_types('vkUpdateDescriptorSetWithTemplate', lib.vkUpdateDescriptorSetWithTemplate)
+
+    result = lib.vkUpdateDescriptorSetWithTemplate(_handle(device, 'VkDevice'),_handle(descriptorSet, 'VkDescriptorSet'),_handle(descriptorUpdateTemplate, 'VkDescriptorUpdateTemplate'),_auto_handle(pData, _args[3]))
+
+
+def _wrap_vkUpdateDescriptorSetWithTemplate(fn):
+    _args = ffi.typeof(fn).args
+    def vkUpdateDescriptorSetWithTemplate(
+    device
+            ,descriptorSet
+            ,descriptorUpdateTemplate
+            ,pData
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(descriptorSet, 'VkDescriptorSet'),_handle(descriptorUpdateTemplate, 'VkDescriptorUpdateTemplate'),_auto_handle(pData, _args[3]))
+
+
+    return vkUpdateDescriptorSetWithTemplate
+def vkGetBufferMemoryRequirements2(
+device
+        ,pInfo
+        ,pMemoryRequirements=None
+        ,):
+    _args = _arg_types('vkGetBufferMemoryRequirements2', lib.vkGetBufferMemoryRequirements2)
+
+
+    custom_return = True
+    if not pMemoryRequirements:
+        pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
+        custom_return = False
+
+    result = lib.vkGetBufferMemoryRequirements2(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),_auto_handle(pMemoryRequirements, _args[2]))
+
+    if custom_return:
+        return pMemoryRequirements
+
+    return pMemoryRequirements[0]
+
+
+
+def _wrap_vkGetBufferMemoryRequirements2(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetBufferMemoryRequirements2(
+    device
+            ,pInfo
+            ,pMemoryRequirements=None
+            ,):
+
+
+        custom_return = True
+        if not pMemoryRequirements:
+            pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),_auto_handle(pMemoryRequirements, _args[2]))
+
+        if custom_return:
+            return pMemoryRequirements
+
+        return pMemoryRequirements[0]
+
+
+
+    return vkGetBufferMemoryRequirements2
+def vkGetImageMemoryRequirements2(
+device
+        ,pInfo
+        ,pMemoryRequirements=None
+        ,):
+    _args = _arg_types('vkGetImageMemoryRequirements2', lib.vkGetImageMemoryRequirements2)
+
+
+    custom_return = True
+    if not pMemoryRequirements:
+        pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
+        custom_return = False
+
+    result = lib.vkGetImageMemoryRequirements2(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),_auto_handle(pMemoryRequirements, _args[2]))
+
+    if custom_return:
+        return pMemoryRequirements
+
+    return pMemoryRequirements[0]
+
+
+
+def _wrap_vkGetImageMemoryRequirements2(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetImageMemoryRequirements2(
+    device
+            ,pInfo
+            ,pMemoryRequirements=None
+            ,):
+
+
+        custom_return = True
+        if not pMemoryRequirements:
+            pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),_auto_handle(pMemoryRequirements, _args[2]))
+
+        if custom_return:
+            return pMemoryRequirements
+
+        return pMemoryRequirements[0]
+
+
+
+    return vkGetImageMemoryRequirements2
+def vkGetImageSparseMemoryRequirements2(
+device
+        ,pInfo
+        ,pSparseMemoryRequirements=None
+        ,):
+    _args = _arg_types('vkGetImageSparseMemoryRequirements2', lib.vkGetImageSparseMemoryRequirements2)
+
+
+    pSparseMemoryRequirementCount = ffi.new('uint32_t*')
+    custom_return = pSparseMemoryRequirements is not None
+    _array = pSparseMemoryRequirements
+
+    pSparseMemoryRequirements = ffi.NULL
+    lib.vkGetImageSparseMemoryRequirements2(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),pSparseMemoryRequirementCount,pSparseMemoryRequirements)
+
+    if _array is None or len(_array) < pSparseMemoryRequirementCount[0]:
+        _array = ffi.new('VkSparseImageMemoryRequirements2[]', pSparseMemoryRequirementCount[0])
+    pSparseMemoryRequirements = _array
+    lib.vkGetImageSparseMemoryRequirements2(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),pSparseMemoryRequirementCount,pSparseMemoryRequirements)
+
+    if pSparseMemoryRequirementCount[0] != len(_array):
+        pSparseMemoryRequirements = _slice(_array, pSparseMemoryRequirementCount[0])
+
+    return pSparseMemoryRequirements
+
+
+def _wrap_vkGetImageSparseMemoryRequirements2(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetImageSparseMemoryRequirements2(
+    device
+            ,pInfo
+            ,pSparseMemoryRequirements=None
+            ,):
+
+
+        pSparseMemoryRequirementCount = ffi.new('uint32_t*')
+        custom_return = pSparseMemoryRequirements is not None
+        _array = pSparseMemoryRequirements
+
+        pSparseMemoryRequirements = ffi.NULL
+        fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),pSparseMemoryRequirementCount,pSparseMemoryRequirements)
+
+        if _array is None or len(_array) < pSparseMemoryRequirementCount[0]:
+            _array = ffi.new('VkSparseImageMemoryRequirements2[]', pSparseMemoryRequirementCount[0])
+        pSparseMemoryRequirements = _array
+        fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),pSparseMemoryRequirementCount,pSparseMemoryRequirements)
+
+        if pSparseMemoryRequirementCount[0] != len(_array):
+            pSparseMemoryRequirements = _slice(_array, pSparseMemoryRequirementCount[0])
+
+        return pSparseMemoryRequirements
+
+
+    return vkGetImageSparseMemoryRequirements2
+def vkCreateSamplerYcbcrConversion(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pYcbcrConversion=None
+        ,):
+    _args = _arg_types('vkCreateSamplerYcbcrConversion', lib.vkCreateSamplerYcbcrConversion)
+
+
+    custom_return = True
+    if not pYcbcrConversion:
+        pYcbcrConversion = ffi.new('VkSamplerYcbcrConversion*')
+        custom_return = False
+
+    result = lib.vkCreateSamplerYcbcrConversion(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pYcbcrConversion, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pYcbcrConversion
+
+    return pYcbcrConversion[0]
+
+
+
+def _wrap_vkCreateSamplerYcbcrConversion(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateSamplerYcbcrConversion(
+    device
+            ,pCreateInfo
+            ,pAllocator
+            ,pYcbcrConversion=None
+            ,):
+
+
+        custom_return = True
+        if not pYcbcrConversion:
+            pYcbcrConversion = ffi.new('VkSamplerYcbcrConversion*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pYcbcrConversion, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pYcbcrConversion
+
+        return pYcbcrConversion[0]
+
+
+
+    return vkCreateSamplerYcbcrConversion
+def vkDestroySamplerYcbcrConversion(
+device
+        ,ycbcrConversion
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkDestroySamplerYcbcrConversion', lib.vkDestroySamplerYcbcrConversion)
+
+    result = lib.vkDestroySamplerYcbcrConversion(_handle(device, 'VkDevice'),_handle(ycbcrConversion, 'VkSamplerYcbcrConversion'),_auto_handle(pAllocator, _args[2]))
+
+
+def _wrap_vkDestroySamplerYcbcrConversion(fn):
+    _args = ffi.typeof(fn).args
+    def vkDestroySamplerYcbcrConversion(
+    device
+            ,ycbcrConversion
+            ,pAllocator
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(ycbcrConversion, 'VkSamplerYcbcrConversion'),_auto_handle(pAllocator, _args[2]))
+
+
+    return vkDestroySamplerYcbcrConversion
+def vkGetDeviceQueue2(
+device
+        ,pQueueInfo
+        ,pQueue=None
+        ,):
+    _args = _arg_types('vkGetDeviceQueue2', lib.vkGetDeviceQueue2)
+
+
+    custom_return = True
+    if not pQueue:
+        pQueue = ffi.new('VkQueue*')
+        custom_return = False
+
+    result = lib.vkGetDeviceQueue2(_handle(device, 'VkDevice'),_auto_handle(pQueueInfo, _args[1]),_auto_handle(pQueue, _args[2]))
+
+    if custom_return:
+        return pQueue
+
+    return pQueue[0]
+
+
+
+def vkGetDescriptorSetLayoutSupport(
+device
+        ,pCreateInfo
+        ,pSupport=None
+        ,):
+    _args = _arg_types('vkGetDescriptorSetLayoutSupport', lib.vkGetDescriptorSetLayoutSupport)
+
+
+    custom_return = True
+    if not pSupport:
+        pSupport = ffi.new('VkDescriptorSetLayoutSupport*')
+        custom_return = False
+
+    result = lib.vkGetDescriptorSetLayoutSupport(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pSupport, _args[2]))
+
+    if custom_return:
+        return pSupport
+
+    return pSupport[0]
+
+
+
+def _wrap_vkGetDescriptorSetLayoutSupport(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetDescriptorSetLayoutSupport(
+    device
+            ,pCreateInfo
+            ,pSupport=None
+            ,):
+
+
+        custom_return = True
+        if not pSupport:
+            pSupport = ffi.new('VkDescriptorSetLayoutSupport*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pSupport, _args[2]))
+
+        if custom_return:
+            return pSupport
+
+        return pSupport[0]
+
+
+
+    return vkGetDescriptorSetLayoutSupport
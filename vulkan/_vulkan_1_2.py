@@ -0,0 +1,680 @@
+from vulkan._vulkan import *  # noqa
+from vulkan._vulkan import (ffi, lib, _new, _auto_handle, _handle,
+                            _arg_types, _slice)
+
+
+def VkConformanceVersion(major=None,minor=None,subminor=None,patch=None,):
+
+    return _new('VkConformanceVersion', major=major,minor=minor,subminor=subminor,patch=patch)
+
+def VkPhysicalDeviceDriverProperties(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DRIVER_PROPERTIES,pNext=None,driverID=None,driverName=None,driverInfo=None,conformanceVersion=None,):
+
+    return _new('VkPhysicalDeviceDriverProperties', sType=sType,pNext=pNext,driverID=driverID,driverName=driverName,driverInfo=driverInfo,conformanceVersion=conformanceVersion)
+
+def VkPhysicalDeviceShaderSubgroupExtendedTypesFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_SUBGROUP_EXTENDED_TYPES_FEATURES,pNext=None,shaderSubgroupExtendedTypes=None,):
+
+    return _new('VkPhysicalDeviceShaderSubgroupExtendedTypesFeatures', sType=sType,pNext=pNext,shaderSubgroupExtendedTypes=shaderSubgroupExtendedTypes)
+
+def VkPhysicalDeviceSamplerFilterMinmaxProperties(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SAMPLER_FILTER_MINMAX_PROPERTIES,pNext=None,filterMinmaxSingleComponentFormats=None,filterMinmaxImageComponentMapping=None,):
+
+    return _new('VkPhysicalDeviceSamplerFilterMinmaxProperties', sType=sType,pNext=pNext,filterMinmaxSingleComponentFormats=filterMinmaxSingleComponentFormats,filterMinmaxImageComponentMapping=filterMinmaxImageComponentMapping)
+
+def VkSamplerReductionModeCreateInfo(sType=VK_STRUCTURE_TYPE_SAMPLER_REDUCTION_MODE_CREATE_INFO,pNext=None,reductionMode=None,):
+
+    return _new('VkSamplerReductionModeCreateInfo', sType=sType,pNext=pNext,reductionMode=reductionMode)
+
+def VkImageFormatListCreateInfo(sType=VK_STRUCTURE_TYPE_IMAGE_FORMAT_LIST_CREATE_INFO,pNext=None,viewFormatCount=None,pViewFormats=None,):
+    if viewFormatCount is None and pViewFormats is not None:
+        viewFormatCount = len(pViewFormats)
+
+    return _new('VkImageFormatListCreateInfo', sType=sType,pNext=pNext,viewFormatCount=viewFormatCount,pViewFormats=pViewFormats)
+
+def VkPhysicalDeviceShaderFloat16Int8Features(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_FLOAT16_INT8_FEATURES,pNext=None,shaderFloat16=None,shaderInt8=None,):
+
+    return _new('VkPhysicalDeviceShaderFloat16Int8Features', sType=sType,pNext=pNext,shaderFloat16=shaderFloat16,shaderInt8=shaderInt8)
+
+def VkPhysicalDeviceFloatControlsProperties(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FLOAT_CONTROLS_PROPERTIES,pNext=None,denormBehaviorIndependence=None,roundingModeIndependence=None,shaderSignedZeroInfNanPreserveFloat16=None,shaderSignedZeroInfNanPreserveFloat32=None,shaderSignedZeroInfNanPreserveFloat64=None,shaderDenormPreserveFloat16=None,shaderDenormPreserveFloat32=None,shaderDenormPreserveFloat64=None,shaderDenormFlushToZeroFloat16=None,shaderDenormFlushToZeroFloat32=None,shaderDenormFlushToZeroFloat64=None,shaderRoundingModeRTEFloat16=None,shaderRoundingModeRTEFloat32=None,shaderRoundingModeRTEFloat64=None,shaderRoundingModeRTZFloat16=None,shaderRoundingModeRTZFloat32=None,shaderRoundingModeRTZFloat64=None,):
+
+    return _new('VkPhysicalDeviceFloatControlsProperties', sType=sType,pNext=pNext,denormBehaviorIndependence=denormBehaviorIndependence,roundingModeIndependence=roundingModeIndependence,shaderSignedZeroInfNanPreserveFloat16=shaderSignedZeroInfNanPreserveFloat16,shaderSignedZeroInfNanPreserveFloat32=shaderSignedZeroInfNanPreserveFloat32,shaderSignedZeroInfNanPreserveFloat64=shaderSignedZeroInfNanPreserveFloat64,shaderDenormPreserveFloat16=shaderDenormPreserveFloat16,shaderDenormPreserveFloat32=shaderDenormPreserveFloat32,shaderDenormPreserveFloat64=shaderDenormPreserveFloat64,shaderDenormFlushToZeroFloat16=shaderDenormFlushToZeroFloat16,shaderDenormFlushToZeroFloat32=shaderDenormFlushToZeroFloat32,shaderDenormFlushToZeroFloat64=shaderDenormFlushToZeroFloat64,shaderRoundingModeRTEFloat16=shaderRoundingModeRTEFloat16,shaderRoundingModeRTEFloat32=shaderRoundingModeRTEFloat32,shaderRoundingModeRTEFloat64=shaderRoundingModeRTEFloat64,shaderRoundingModeRTZFloat16=shaderRoundingModeRTZFloat16,shaderRoundingModeRTZFloat32=shaderRoundingModeRTZFloat32,shaderRoundingModeRTZFloat64=shaderRoundingModeRTZFloat64)
+
+def VkPhysicalDeviceHostQueryResetFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_HOST_QUERY_RESET_FEATURES,pNext=None,hostQueryReset=None,):
+
+    return _new('VkPhysicalDeviceHostQueryResetFeatures', sType=sType,pNext=pNext,hostQueryReset=hostQueryReset)
+
+def VkPhysicalDeviceDescriptorIndexingFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_INDEXING_FEATURES,pNext=None,shaderInputAttachmentArrayDynamicIndexing=None,shaderUniformTexelBufferArrayDynamicIndexing=None,shaderStorageTexelBufferArrayDynamicIndexing=None,shaderUniformBufferArrayNonUniformIndexing=None,shaderSampledImageArrayNonUniformIndexing=None,shaderStorageBufferArrayNonUniformIndexing=None,shaderStorageImageArrayNonUniformIndexing=None,shaderInputAttachmentArrayNonUniformIndexing=None,shaderUniformTexelBufferArrayNonUniformIndexing=None,shaderStorageTexelBufferArrayNonUniformIndexing=None,descriptorBindingUniformBufferUpdateAfterBind=None,descriptorBindingSampledImageUpdateAfterBind=None,descriptorBindingStorageImageUpdateAfterBind=None,descriptorBindingStorageBufferUpdateAfterBind=None,descriptorBindingUniformTexelBufferUpdateAfterBind=None,descriptorBindingStorageTexelBufferUpdateAfterBind=None,descriptorBindingUpdateUnusedWhilePending=None,descriptorBindingPartiallyBound=None,descriptorBindingVariableDescriptorCount=None,runtimeDescriptorArray=None,):
+
+    return _new('VkPhysicalDeviceDescriptorIndexingFeatures', sType=sType,pNext=pNext,shaderInputAttachmentArrayDynamicIndexing=shaderInputAttachmentArrayDynamicIndexing,shaderUniformTexelBufferArrayDynamicIndexing=shaderUniformTexelBufferArrayDynamicIndexing,shaderStorageTexelBufferArrayDynamicIndexing=shaderStorageTexelBufferArrayDynamicIndexing,shaderUniformBufferArrayNonUniformIndexing=shaderUniformBufferArrayNonUniformIndexing,shaderSampledImageArrayNonUniformIndexing=shaderSampledImageArrayNonUniformIndexing,shaderStorageBufferArrayNonUniformIndexing=shaderStorageBufferArrayNonUniformIndexing,shaderStorageImageArrayNonUniformIndexing=shaderStorageImageArrayNonUniformIndexing,shaderInputAttachmentArrayNonUniformIndexing=shaderInputAttachmentArrayNonUniformIndexing,shaderUniformTexelBufferArrayNonUniformIndexing=shaderUniformTexelBufferArrayNonUniformIndexing,shaderStorageTexelBufferArrayNonUniformIndexing=shaderStorageTexelBufferArrayNonUniformIndexing,descriptorBindingUniformBufferUpdateAfterBind=descriptorBindingUniformBufferUpdateAfterBind,descriptorBindingSampledImageUpdateAfterBind=descriptorBindingSampledImageUpdateAfterBind,descriptorBindingStorageImageUpdateAfterBind=descriptorBindingStorageImageUpdateAfterBind,descriptorBindingStorageBufferUpdateAfterBind=descriptorBindingStorageBufferUpdateAfterBind,descriptorBindingUniformTexelBufferUpdateAfterBind=descriptorBindingUniformTexelBufferUpdateAfterBind,descriptorBindingStorageTexelBufferUpdateAfterBind=descriptorBindingStorageTexelBufferUpdateAfterBind,descriptorBindingUpdateUnusedWhilePending=descriptorBindingUpdateUnusedWhilePending,descriptorBindingPartiallyBound=descriptorBindingPartiallyBound,descriptorBindingVariableDescriptorCount=descriptorBindingVariableDescriptorCount,runtimeDescriptorArray=runtimeDescriptorArray)
+
+def VkPhysicalDeviceDescriptorIndexingProperties(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_INDEXING_PROPERTIES,pNext=None,maxUpdateAfterBindDescriptorsInAllPools=None,shaderUniformBufferArrayNonUniformIndexingNative=None,shaderSampledImageArrayNonUniformIndexingNative=None,shaderStorageBufferArrayNonUniformIndexingNative=None,shaderStorageImageArrayNonUniformIndexingNative=None,shaderInputAttachmentArrayNonUniformIndexingNative=None,robustBufferAccessUpdateAfterBind=None,quadDivergentImplicitLod=None,maxPerStageDescriptorUpdateAfterBindSamplers=None,maxPerStageDescriptorUpdateAfterBindUniformBuffers=None,maxPerStageDescriptorUpdateAfterBindStorageBuffers=None,maxPerStageDescriptorUpdateAfterBindSampledImages=None,maxPerStageDescriptorUpdateAfterBindStorageImages=None,maxPerStageDescriptorUpdateAfterBindInputAttachments=None,maxPerStageUpdateAfterBindResources=None,maxDescriptorSetUpdateAfterBindSamplers=None,maxDescriptorSetUpdateAfterBindUniformBuffers=None,maxDescriptorSetUpdateAfterBindUniformBuffersDynamic=None,maxDescriptorSetUpdateAfterBindStorageBuffers=None,maxDescriptorSetUpdateAfterBindStorageBuffersDynamic=None,maxDescriptorSetUpdateAfterBindSampledImages=None,maxDescriptorSetUpdateAfterBindStorageImages=None,maxDescriptorSetUpdateAfterBindInputAttachments=None,):
+
+    return _new('VkPhysicalDeviceDescriptorIndexingProperties', sType=sType,pNext=pNext,maxUpdateAfterBindDescriptorsInAllPools=maxUpdateAfterBindDescriptorsInAllPools,shaderUniformBufferArrayNonUniformIndexingNative=shaderUniformBufferArrayNonUniformIndexingNative,shaderSampledImageArrayNonUniformIndexingNative=shaderSampledImageArrayNonUniformIndexingNative,shaderStorageBufferArrayNonUniformIndexingNative=shaderStorageBufferArrayNonUniformIndexingNative,shaderStorageImageArrayNonUniformIndexingNative=shaderStorageImageArrayNonUniformIndexingNative,shaderInputAttachmentArrayNonUniformIndexingNative=shaderInputAttachmentArrayNonUniformIndexingNative,robustBufferAccessUpdateAfterBind=robustBufferAccessUpdateAfterBind,quadDivergentImplicitLod=quadDivergentImplicitLod,maxPerStageDescriptorUpdateAfterBindSamplers=maxPerStageDescriptorUpdateAfterBindSamplers,maxPerStageDescriptorUpdateAfterBindUniformBuffers=maxPerStageDescriptorUpdateAfterBindUniformBuffers,maxPerStageDescriptorUpdateAfterBindStorageBuffers=maxPerStageDescriptorUpdateAfterBindStorageBuffers,maxPerStageDescriptorUpdateAfterBindSampledImages=maxPerStageDescriptorUpdateAfterBindSampledImages,maxPerStageDescriptorUpdateAfterBindStorageImages=maxPerStageDescriptorUpdateAfterBindStorageImages,maxPerStageDescriptorUpdateAfterBindInputAttachments=maxPerStageDescriptorUpdateAfterBindInputAttachments,maxPerStageUpdateAfterBindResources=maxPerStageUpdateAfterBindResources,maxDescriptorSetUpdateAfterBindSamplers=maxDescriptorSetUpdateAfterBindSamplers,maxDescriptorSetUpdateAfterBindUniformBuffers=maxDescriptorSetUpdateAfterBindUniformBuffers,maxDescriptorSetUpdateAfterBindUniformBuffersDynamic=maxDescriptorSetUpdateAfterBindUniformBuffersDynamic,maxDescriptorSetUpdateAfterBindStorageBuffers=maxDescriptorSetUpdateAfterBindStorageBuffers,maxDescriptorSetUpdateAfterBindStorageBuffersDynamic=maxDescriptorSetUpdateAfterBindStorageBuffersDynamic,maxDescriptorSetUpdateAfterBindSampledImages=maxDescriptorSetUpdateAfterBindSampledImages,maxDescriptorSetUpdateAfterBindStorageImages=maxDescriptorSetUpdateAfterBindStorageImages,maxDescriptorSetUpdateAfterBindInputAttachments=maxDescriptorSetUpdateAfterBindInputAttachments)
+
+def VkDescriptorSetLayoutBindingFlagsCreateInfo(sType=VK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_BINDING_FLAGS_CREATE_INFO,pNext=None,bindingCount=None,pBindingFlags=None,):
+    if bindingCount is None and pBindingFlags is not None:
+        bindingCount = len(pBindingFlags)
+
+    return _new('VkDescriptorSetLayoutBindingFlagsCreateInfo', sType=sType,pNext=pNext,bindingCount=bindingCount,pBindingFlags=pBindingFlags)
+
+def VkDescriptorSetVariableDescriptorCountAllocateInfo(sType=VK_STRUCTURE_TYPE_DESCRIPTOR_SET_VARIABLE_DESCRIPTOR_COUNT_ALLOCATE_INFO,pNext=None,descriptorSetCount=None,pDescriptorCounts=None,):
+    if descriptorSetCount is None and pDescriptorCounts is not None:
+        descriptorSetCount = len(pDescriptorCounts)
+
+    return _new('VkDescriptorSetVariableDescriptorCountAllocateInfo', sType=sType,pNext=pNext,descriptorSetCount=descriptorSetCount,pDescriptorCounts=pDescriptorCounts)
+
+def VkDescriptorSetVariableDescriptorCountLayoutSupport(sType=VK_STRUCTURE_TYPE_DESCRIPTOR_SET_VARIABLE_DESCRIPTOR_COUNT_LAYOUT_SUPPORT,pNext=None,maxVariableDescriptorCount=None,):
+
+    return _new('VkDescriptorSetVariableDescriptorCountLayoutSupport', sType=sType,pNext=pNext,maxVariableDescriptorCount=maxVariableDescriptorCount)
+
+def VkAttachmentDescription2(sType=VK_STRUCTURE_TYPE_ATTACHMENT_DESCRIPTION_2,pNext=None,flags=None,format=None,samples=None,loadOp=None,storeOp=None,stencilLoadOp=None,stencilStoreOp=None,initialLayout=None,finalLayout=None,):
+
+    return _new('VkAttachmentDescription2', sType=sType,pNext=pNext,flags=flags,format=format,samples=samples,loadOp=loadOp,storeOp=storeOp,stencilLoadOp=stencilLoadOp,stencilStoreOp=stencilStoreOp,initialLayout=initialLayout,finalLayout=finalLayout)
+
+def VkAttachmentReference2(sType=VK_STRUCTURE_TYPE_ATTACHMENT_REFERENCE_2,pNext=None,attachment=None,layout=None,aspectMask=None,):
+
+    return _new('VkAttachmentReference2', sType=sType,pNext=pNext,attachment=attachment,layout=layout,aspectMask=aspectMask)
+
+def VkSubpassDescription2(sType=VK_STRUCTURE_TYPE_SUBPASS_DESCRIPTION_2,pNext=None,flags=None,pipelineBindPoint=None,viewMask=None,inputAttachmentCount=None,pInputAttachments=None,colorAttachmentCount=None,pColorAttachments=None,pResolveAttachments=None,pDepthStencilAttachment=None,preserveAttachmentCount=None,pPreserveAttachments=None,):
+    if inputAttachmentCount is None and pInputAttachments is not None:
+        inputAttachmentCount = len(pInputAttachments)
+    if colorAttachmentCount is None and pColorAttachments is not None:
+        colorAttachmentCount = len(pColorAttachments)
+    if colorAttachmentCount is None and pResolveAttachments is not None:
+        colorAttachmentCount = len(pResolveAttachments)
+    if preserveAttachmentCount is None and pPreserveAttachments is not None:
+        preserveAttachmentCount = len(pPreserveAttachments)
+
+    return _new('VkSubpassDescription2', sType=sType,pNext=pNext,flags=flags,pipelineBindPoint=pipelineBindPoint,viewMask=viewMask,inputAttachmentCount=inputAttachmentCount,pInputAttachments=pInputAttachments,colorAttachmentCount=colorAttachmentCount,pColorAttachments=pColorAttachments,pResolveAttachments=pResolveAttachments,pDepthStencilAttachment=pDepthStencilAttachment,preserveAttachmentCount=preserveAttachmentCount,pPreserveAttachments=pPreserveAttachments)
+
+def VkSubpassDependency2(sType=VK_STRUCTURE_TYPE_SUBPASS_DEPENDENCY_2,pNext=None,srcSubpass=None,dstSubpass=None,srcStageMask=None,dstStageMask=None,srcAccessMask=None,dstAccessMask=None,dependencyFlags=None,viewOffset=None,):
+
+    return _new('VkSubpassDependency2', sType=sType,pNext=pNext,srcSubpass=srcSubpass,dstSubpass=dstSubpass,srcStageMask=srcStageMask,dstStageMask=dstStageMask,srcAccessMask=srcAccessMask,dstAccessMask=dstAccessMask,dependencyFlags=dependencyFlags,viewOffset=viewOffset)
+
+def VkRenderPassCreateInfo2(sType=VK_STRUCTURE_TYPE_RENDER_PASS_CREATE_INFO_2,pNext=None,flags=None,attachmentCount=None,pAttachments=None,subpassCount=None,pSubpasses=None,dependencyCount=None,pDependencies=None,correlatedViewMaskCount=None,pCorrelatedViewMasks=None,):
+    if attachmentCount is None and pAttachments is not None:
+        attachmentCount = len(pAttachments)
+    if subpassCount is None and pSubpasses is not None:
+        subpassCount = len(pSubpasses)
+    if dependencyCount is None and pDependencies is not None:
+        dependencyCount = len(pDependencies)
+    if correlatedViewMaskCount is None and pCorrelatedViewMasks is not None:
+        correlatedViewMaskCount = len(pCorrelatedViewMasks)
+
+    return _new('VkRenderPassCreateInfo2', sType=sType,pNext=pNext,flags=flags,attachmentCount=attachmentCount,pAttachments=pAttachments,subpassCount=subpassCount,pSubpasses=pSubpasses,dependencyCount=dependencyCount,pDependencies=pDependencies,correlatedViewMaskCount=correlatedViewMaskCount,pCorrelatedViewMasks=pCorrelatedViewMasks)
+
+def VkSubpassBeginInfo(sType=VK_STRUCTURE_TYPE_SUBPASS_BEGIN_INFO,pNext=None,contents=None,):
+
+    return _new('VkSubpassBeginInfo', sType=sType,pNext=pNext,contents=contents)
+
+def VkSubpassEndInfo(sType=VK_STRUCTURE_TYPE_SUBPASS_END_INFO,pNext=None,):
+
+    return _new('VkSubpassEndInfo', sType=sType,pNext=pNext)
+
+def VkPhysicalDeviceTimelineSemaphoreFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TIMELINE_SEMAPHORE_FEATURES,pNext=None,timelineSemaphore=None,):
+
+    return _new('VkPhysicalDeviceTimelineSemaphoreFeatures', sType=sType,pNext=pNext,timelineSemaphore=timelineSemaphore)
+
+def VkPhysicalDeviceTimelineSemaphoreProperties(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TIMELINE_SEMAPHORE_PROPERTIES,pNext=None,maxTimelineSemaphoreValueDifference=None,):
+
+    return _new('VkPhysicalDeviceTimelineSemaphoreProperties', sType=sType,pNext=pNext,maxTimelineSemaphoreValueDifference=maxTimelineSemaphoreValueDifference)
+
+def VkSemaphoreTypeCreateInfo(sType=VK_STRUCTURE_TYPE_SEMAPHORE_TYPE_CREATE_INFO,pNext=None,semaphoreType=None,initialValue=None,):
+
+    return _new('VkSemaphoreTypeCreateInfo', sType=sType,pNext=pNext,semaphoreType=semaphoreType,initialValue=initialValue)
+
+def VkTimelineSemaphoreSubmitInfo(sType=VK_STRUCTURE_TYPE_TIMELINE_SEMAPHORE_SUBMIT_INFO,pNext=None,waitSemaphoreValueCount=None,pWaitSemaphoreValues=None,signalSemaphoreValueCount=None,pSignalSemaphoreValues=None,):
+    if waitSemaphoreValueCount is None and pWaitSemaphoreValues is not None:
+        waitSemaphoreValueCount = len(pWaitSemaphoreValues)
+    if signalSemaphoreValueCount is None and pSignalSemaphoreValues is not None:
+        signalSemaphoreValueCount = len(pSignalSemaphoreValues)
+
+    return _new('VkTimelineSemaphoreSubmitInfo', sType=sType,pNext=pNext,waitSemaphoreValueCount=waitSemaphoreValueCount,pWaitSemaphoreValues=pWaitSemaphoreValues,signalSemaphoreValueCount=signalSemaphoreValueCount,pSignalSemaphoreValues=pSignalSemaphoreValues)
+
+def VkSemaphoreWaitInfo(sType=VK_STRUCTURE_TYPE_SEMAPHORE_WAIT_INFO,pNext=None,flags=None,semaphoreCount=None,pSemaphores=None,pValues=None,):
+    if semaphoreCount is None and pSemaphores is not None:
+        semaphoreCount = len(pSemaphores)
+    if semaphoreCount is None and pValues is not None:
+        semaphoreCount = len(pValues)
+
+    return _new('VkSemaphoreWaitInfo', sType=sType,pNext=pNext,flags=flags,semaphoreCount=semaphoreCount,pSemaphores=pSemaphores,pValues=pValues)
+
+def VkSemaphoreSignalInfo(sType=VK_STRUCTURE_TYPE_SEMAPHORE_SIGNAL_INFO,pNext=None,semaphore=None,value=None,):
+
+    return _new('VkSemaphoreSignalInfo', sType=sType,pNext=pNext,semaphore=semaphore,value=value)
+
+def VkPhysicalDevice8BitStorageFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_8BIT_STORAGE_FEATURES,pNext=None,storageBuffer8BitAccess=None,uniformAndStorageBuffer8BitAccess=None,storagePushConstant8=None,):
+
+    return _new('VkPhysicalDevice8BitStorageFeatures', sType=sType,pNext=pNext,storageBuffer8BitAccess=storageBuffer8BitAccess,uniformAndStorageBuffer8BitAccess=uniformAndStorageBuffer8BitAccess,storagePushConstant8=storagePushConstant8)
+
+def VkPhysicalDeviceVulkanMemoryModelFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_MEMORY_MODEL_FEATURES,pNext=None,vulkanMemoryModel=None,vulkanMemoryModelDeviceScope=None,vulkanMemoryModelAvailabilityVisibilityChains=None,):
+
+    return _new('VkPhysicalDeviceVulkanMemoryModelFeatures', sType=sType,pNext=pNext,vulkanMemoryModel=vulkanMemoryModel,vulkanMemoryModelDeviceScope=vulkanMemoryModelDeviceScope,vulkanMemoryModelAvailabilityVisibilityChains=vulkanMemoryModelAvailabilityVisibilityChains)
+
+def VkPhysicalDeviceShaderAtomicInt64Features(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_ATOMIC_INT64_FEATURES,pNext=None,shaderBufferInt64Atomics=None,shaderSharedInt64Atomics=None,):
+
+    return _new('VkPhysicalDeviceShaderAtomicInt64Features', sType=sType,pNext=pNext,shaderBufferInt64Atomics=shaderBufferInt64Atomics,shaderSharedInt64Atomics=shaderSharedInt64Atomics)
+
+def VkPhysicalDeviceDepthStencilResolveProperties(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEPTH_STENCIL_RESOLVE_PROPERTIES,pNext=None,supportedDepthResolveModes=None,supportedStencilResolveModes=None,independentResolveNone=None,independentResolve=None,):
+
+    return _new('VkPhysicalDeviceDepthStencilResolveProperties', sType=sType,pNext=pNext,supportedDepthResolveModes=supportedDepthResolveModes,supportedStencilResolveModes=supportedStencilResolveModes,independentResolveNone=independentResolveNone,independentResolve=independentResolve)
+
+def VkSubpassDescriptionDepthStencilResolve(sType=VK_STRUCTURE_TYPE_SUBPASS_DESCRIPTION_DEPTH_STENCIL_RESOLVE,pNext=None,depthResolveMode=None,stencilResolveMode=None,pDepthStencilResolveAttachment=None,):
+
+    return _new('VkSubpassDescriptionDepthStencilResolve', sType=sType,pNext=pNext,depthResolveMode=depthResolveMode,stencilResolveMode=stencilResolveMode,pDepthStencilResolveAttachment=pDepthStencilResolveAttachment)
+
+def VkImageStencilUsageCreateInfo(sType=VK_STRUCTURE_TYPE_IMAGE_STENCIL_USAGE_CREATE_INFO,pNext=None,stencilUsage=None,):
+
+    return _new('VkImageStencilUsageCreateInfo', sType=sType,pNext=pNext,stencilUsage=stencilUsage)
+
+def VkPhysicalDeviceScalarBlockLayoutFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SCALAR_BLOCK_LAYOUT_FEATURES,pNext=None,scalarBlockLayout=None,):
+
+    return _new('VkPhysicalDeviceScalarBlockLayoutFeatures', sType=sType,pNext=pNext,scalarBlockLayout=scalarBlockLayout)
+
+def VkPhysicalDeviceUniformBufferStandardLayoutFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_UNIFORM_BUFFER_STANDARD_LAYOUT_FEATURES,pNext=None,uniformBufferStandardLayout=None,):
+
+    return _new('VkPhysicalDeviceUniformBufferStandardLayoutFeatures', sType=sType,pNext=pNext,uniformBufferStandardLayout=uniformBufferStandardLayout)
+
+def VkPhysicalDeviceBufferDeviceAddressFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_BUFFER_DEVICE_ADDRESS_FEATURES,pNext=None,bufferDeviceAddress=None,bufferDeviceAddressCaptureReplay=None,bufferDeviceAddressMultiDevice=None,):
+
+    return _new('VkPhysicalDeviceBufferDeviceAddressFeatures', sType=sType,pNext=pNext,bufferDeviceAddress=bufferDeviceAddress,bufferDeviceAddressCaptureReplay=bufferDeviceAddressCaptureReplay,bufferDeviceAddressMultiDevice=bufferDeviceAddressMultiDevice)
+
+def VkBufferDeviceAddressInfo(sType=VK_STRUCTURE_TYPE_BUFFER_DEVICE_ADDRESS_INFO,pNext=None,buffer=None,):
+
+    return _new('VkBufferDeviceAddressInfo', sType=sType,pNext=pNext,buffer=buffer)
+
+def VkBufferOpaqueCaptureAddressCreateInfo(sType=VK_STRUCTURE_TYPE_BUFFER_OPAQUE_CAPTURE_ADDRESS_CREATE_INFO,pNext=None,opaqueCaptureAddress=None,):
+
+    return _new('VkBufferOpaqueCaptureAddressCreateInfo', sType=sType,pNext=pNext,opaqueCaptureAddress=opaqueCaptureAddress)
+
+def VkPhysicalDeviceImagelessFramebufferFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGELESS_FRAMEBUFFER_FEATURES,pNext=None,imagelessFramebuffer=None,):
+
+    return _new('VkPhysicalDeviceImagelessFramebufferFeatures', sType=sType,pNext=pNext,imagelessFramebuffer=imagelessFramebuffer)
+
+def VkFramebufferAttachmentsCreateInfo(sType=VK_STRUCTURE_TYPE_FRAMEBUFFER_ATTACHMENTS_CREATE_INFO,pNext=None,attachmentImageInfoCount=None,pAttachmentImageInfos=None,):
+    if attachmentImageInfoCount is None and pAttachmentImageInfos is not None:
+        attachmentImageInfoCount = len(pAttachmentImageInfos)
+
+    return _new('VkFramebufferAttachmentsCreateInfo', sType=sType,pNext=pNext,attachmentImageInfoCount=attachmentImageInfoCount,pAttachmentImageInfos=pAttachmentImageInfos)
+
+def VkFramebufferAttachmentImageInfo(sType=VK_STRUCTURE_TYPE_FRAMEBUFFER_ATTACHMENT_IMAGE_INFO,pNext=None,flags=None,usage=None,width=None,height=None,layerCount=None,viewFormatCount=None,pViewFormats=None,):
+    if viewFormatCount is None and pViewFormats is not None:
+        viewFormatCount = len(pViewFormats)
+
+    return _new('VkFramebufferAttachmentImageInfo', sType=sType,pNext=pNext,flags=flags,usage=usage,width=width,height=height,layerCount=layerCount,viewFormatCount=viewFormatCount,pViewFormats=pViewFormats)
+
+def VkRenderPassAttachmentBeginInfo(sType=VK_STRUCTURE_TYPE_RENDER_PASS_ATTACHMENT_BEGIN_INFO,pNext=None,attachmentCount=None,pAttachments=None,):
+    if attachmentCount is None and pAttachments is not None:
+        attachmentCount = len(pAttachments)
+
+    return _new('VkRenderPassAttachmentBeginInfo', sType=sType,pNext=pNext,attachmentCount=attachmentCount,pAttachments=pAttachments)
+
+def VkPhysicalDeviceSeparateDepthStencilLayoutsFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SEPARATE_DEPTH_STENCIL_LAYOUTS_FEATURES,pNext=None,separateDepthStencilLayouts=None,):
+
+    return _new('VkPhysicalDeviceSeparateDepthStencilLayoutsFeatures', sType=sType,pNext=pNext,separateDepthStencilLayouts=separateDepthStencilLayouts)
+
+def VkAttachmentReferenceStencilLayout(sType=VK_STRUCTURE_TYPE_ATTACHMENT_REFERENCE_STENCIL_LAYOUT,pNext=None,stencilLayout=None,):
+
+    return _new('VkAttachmentReferenceStencilLayout', sType=sType,pNext=pNext,stencilLayout=stencilLayout)
+
+def VkAttachmentDescriptionStencilLayout(sType=VK_STRUCTURE_TYPE_ATTACHMENT_DESCRIPTION_STENCIL_LAYOUT,pNext=None,stencilInitialLayout=None,stencilFinalLayout=None,):
+
+    return _new('VkAttachmentDescriptionStencilLayout', sType=sType,pNext=pNext,stencilInitialLayout=stencilInitialLayout,stencilFinalLayout=stencilFinalLayout)
+
+def VkMemoryOpaqueCaptureAddressAllocateInfo(sType=VK_STRUCTURE_TYPE_MEMORY_OPAQUE_CAPTURE_ADDRESS_ALLOCATE_INFO,pNext=None,opaqueCaptureAddress=None,):
+
+    return _new('VkMemoryOpaqueCaptureAddressAllocateInfo', sType=sType,pNext=pNext,opaqueCaptureAddress=opaqueCaptureAddress)
+
+def VkDeviceMemoryOpaqueCaptureAddressInfo(sType=VK_STRUCTURE_TYPE_DEVICE_MEMORY_OPAQUE_CAPTURE_ADDRESS_INFO,pNext=None,memory=None,):
+
+    return _new('VkDeviceMemoryOpaqueCaptureAddressInfo', sType=sType,pNext=pNext,memory=memory)
+
+def VkPhysicalDeviceVulkan11Features(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_1_FEATURES,pNext=None,storageBuffer16BitAccess=None,uniformAndStorageBuffer16BitAccess=None,storagePushConstant16=None,storageInputOutput16=None,multiview=None,multiviewGeometryShader=None,multiviewTessellationShader=None,variablePointersStorageBuffer=None,variablePointers=None,protectedMemory=None,samplerYcbcrConversion=None,shaderDrawParameters=None,):
+
+    return _new('VkPhysicalDeviceVulkan11Features', sType=sType,pNext=pNext,storageBuffer16BitAccess=storageBuffer16BitAccess,uniformAndStorageBuffer16BitAccess=uniformAndStorageBuffer16BitAccess,storagePushConstant16=storagePushConstant16,storageInputOutput16=storageInputOutput16,multiview=multiview,multiviewGeometryShader=multiviewGeometryShader,multiviewTessellationShader=multiviewTessellationShader,variablePointersStorageBuffer=variablePointersStorageBuffer,variablePointers=variablePointers,protectedMemory=protectedMemory,samplerYcbcrConversion=samplerYcbcrConversion,shaderDrawParameters=shaderDrawParameters)
+
+def VkPhysicalDeviceVulkan11Properties(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_1_PROPERTIES,pNext=None,deviceUUID=None,driverUUID=None,deviceLUID=None,deviceNodeMask=None,deviceLUIDValid=None,subgroupSize=None,subgroupSupportedStages=None,subgroupSupportedOperations=None,subgroupQuadOperationsInAllStages=None,pointClippingBehavior=None,maxMultiviewViewCount=None,maxMultiviewInstanceIndex=None,protectedNoFault=None,maxPerSetDescriptors=None,maxMemoryAllocationSize=None,):
+
+    return _new('VkPhysicalDeviceVulkan11Properties', sType=sType,pNext=pNext,deviceUUID=deviceUUID,driverUUID=driverUUID,deviceLUID=deviceLUID,deviceNodeMask=deviceNodeMask,deviceLUIDValid=deviceLUIDValid,subgroupSize=subgroupSize,subgroupSupportedStages=subgroupSupportedStages,subgroupSupportedOperations=subgroupSupportedOperations,subgroupQuadOperationsInAllStages=subgroupQuadOperationsInAllStages,pointClippingBehavior=pointClippingBehavior,maxMultiviewViewCount=maxMultiviewViewCount,maxMultiviewInstanceIndex=maxMultiviewInstanceIndex,protectedNoFault=protectedNoFault,maxPerSetDescriptors=maxPerSetDescriptors,maxMemoryAllocationSize=maxMemoryAllocationSize)
+
+def VkPhysicalDeviceVulkan12Features(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_2_FEATURES,pNext=None,samplerMirrorClampToEdge=None,drawIndirectCount=None,storageBuffer8BitAccess=None,uniformAndStorageBuffer8BitAccess=None,storagePushConstant8=None,shaderBufferInt64Atomics=None,shaderSharedInt64Atomics=None,shaderFloat16=None,shaderInt8=None,descriptorIndexing=None,shaderInputAttachmentArrayDynamicIndexing=None,shaderUniformTexelBufferArrayDynamicIndexing=None,shaderStorageTexelBufferArrayDynamicIndexing=None,shaderUniformBufferArrayNonUniformIndexing=None,shaderSampledImageArrayNonUniformIndexing=None,shaderStorageBufferArrayNonUniformIndexing=None,shaderStorageImageArrayNonUniformIndexing=None,shaderInputAttachmentArrayNonUniformIndexing=None,shaderUniformTexelBufferArrayNonUniformIndexing=None,shaderStorageTexelBufferArrayNonUniformIndexing=None,descriptorBindingUniformBufferUpdateAfterBind=None,descriptorBindingSampledImageUpdateAfterBind=None,descriptorBindingStorageImageUpdateAfterBind=None,descriptorBindingStorageBufferUpdateAfterBind=None,descriptorBindingUniformTexelBufferUpdateAfterBind=None,descriptorBindingStorageTexelBufferUpdateAfterBind=None,descriptorBindingUpdateUnusedWhilePending=None,descriptorBindingPartiallyBound=None,descriptorBindingVariableDescriptorCount=None,runtimeDescriptorArray=None,samplerFilterMinmax=None,scalarBlockLayout=None,imagelessFramebuffer=None,uniformBufferStandardLayout=None,shaderSubgroupExtendedTypes=None,separateDepthStencilLayouts=None,hostQueryReset=None,timelineSemaphore=None,bufferDeviceAddress=None,bufferDeviceAddressCaptureReplay=None,bufferDeviceAddressMultiDevice=None,vulkanMemoryModel=None,vulkanMemoryModelDeviceScope=None,vulkanMemoryModelAvailabilityVisibilityChains=None,shaderOutputViewportIndex=None,shaderOutputLayer=None,subgroupBroadcastDynamicId=None,):
+
+    return _new('VkPhysicalDeviceVulkan12Features', sType=sType,pNext=pNext,samplerMirrorClampToEdge=samplerMirrorClampToEdge,drawIndirectCount=drawIndirectCount,storageBuffer8BitAccess=storageBuffer8BitAccess,uniformAndStorageBuffer8BitAccess=uniformAndStorageBuffer8BitAccess,storagePushConstant8=storagePushConstant8,shaderBufferInt64Atomics=shaderBufferInt64Atomics,shaderSharedInt64Atomics=shaderSharedInt64Atomics,shaderFloat16=shaderFloat16,shaderInt8=shaderInt8,descriptorIndexing=descriptorIndexing,shaderInputAttachmentArrayDynamicIndexing=shaderInputAttachmentArrayDynamicIndexing,shaderUniformTexelBufferArrayDynamicIndexing=shaderUniformTexelBufferArrayDynamicIndexing,shaderStorageTexelBufferArrayDynamicIndexing=shaderStorageTexelBufferArrayDynamicIndexing,shaderUniformBufferArrayNonUniformIndexing=shaderUniformBufferArrayNonUniformIndexing,shaderSampledImageArrayNonUniformIndexing=shaderSampledImageArrayNonUniformIndexing,shaderStorageBufferArrayNonUniformIndexing=shaderStorageBufferArrayNonUniformIndexing,shaderStorageImageArrayNonUniformIndexing=shaderStorageImageArrayNonUniformIndexing,shaderInputAttachmentArrayNonUniformIndexing=shaderInputAttachmentArrayNonUniformIndexing,shaderUniformTexelBufferArrayNonUniformIndexing=shaderUniformTexelBufferArrayNonUniformIndexing,shaderStorageTexelBufferArrayNonUniformIndexing=shaderStorageTexelBufferArrayNonUniformIndexing,descriptorBindingUniformBufferUpdateAfterBind=descriptorBindingUniformBufferUpdateAfterBind,descriptorBindingSampledImageUpdateAfterBind=descriptorBindingSampledImageUpdateAfterBind,descriptorBindingStorageImageUpdateAfterBind=descriptorBindingStorageImageUpdateAfterBind,descriptorBindingStorageBufferUpdateAfterBind=descriptorBindingStorageBufferUpdateAfterBind,descriptorBindingUniformTexelBufferUpdateAfterBind=descriptorBindingUniformTexelBufferUpdateAfterBind,descriptorBindingStorageTexelBufferUpdateAfterBind=descriptorBindingStorageTexelBufferUpdateAfterBind,descriptorBindingUpdateUnusedWhilePending=descriptorBindingUpdateUnusedWhilePending,descriptorBindingPartiallyBound=descriptorBindingPartiallyBound,descriptorBindingVariableDescriptorCount=descriptorBindingVariableDescriptorCount,runtimeDescriptorArray=runtimeDescriptorArray,samplerFilterMinmax=samplerFilterMinmax,scalarBlockLayout=scalarBlockLayout,imagelessFramebuffer=imagelessFramebuffer,uniformBufferStandardLayout=uniformBufferStandardLayout,shaderSubgroupExtendedTypes=shaderSubgroupExtendedTypes,separateDepthStencilLayouts=separateDepthStencilLayouts,hostQueryReset=hostQueryReset,timelineSemaphore=timelineSemaphore,bufferDeviceAddress=bufferDeviceAddress,bufferDeviceAddressCaptureReplay=bufferDeviceAddressCaptureReplay,bufferDeviceAddressMultiDevice=bufferDeviceAddressMultiDevice,vulkanMemoryModel=vulkanMemoryModel,vulkanMemoryModelDeviceScope=vulkanMemoryModelDeviceScope,vulkanMemoryModelAvailabilityVisibilityChains=vulkanMemoryModelAvailabilityVisibilityChains,shaderOutputViewportIndex=shaderOutputViewportIndex,shaderOutputLayer=shaderOutputLayer,subgroupBroadcastDynamicId=subgroupBroadcastDynamicId)
+
+def VkPhysicalDeviceVulkan12Properties(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_2_PROPERTIES,pNext=None,driverID=None,driverName=None,driverInfo=None,conformanceVersion=None,denormBehaviorIndependence=None,roundingModeIndependence=None,shaderSignedZeroInfNanPreserveFloat16=None,shaderSignedZeroInfNanPreserveFloat32=None,shaderSignedZeroInfNanPreserveFloat64=None,shaderDenormPreserveFloat16=None,shaderDenormPreserveFloat32=None,shaderDenormPreserveFloat64=None,shaderDenormFlushToZeroFloat16=None,shaderDenormFlushToZeroFloat32=None,shaderDenormFlushToZeroFloat64=None,shaderRoundingModeRTEFloat16=None,shaderRoundingModeRTEFloat32=None,shaderRoundingModeRTEFloat64=None,shaderRoundingModeRTZFloat16=None,shaderRoundingModeRTZFloat32=None,shaderRoundingModeRTZFloat64=None,maxUpdateAfterBindDescriptorsInAllPools=None,shaderUniformBufferArrayNonUniformIndexingNative=None,shaderSampledImageArrayNonUniformIndexingNative=None,shaderStorageBufferArrayNonUniformIndexingNative=None,shaderStorageImageArrayNonUniformIndexingNative=None,shaderInputAttachmentArrayNonUniformIndexingNative=None,robustBufferAccessUpdateAfterBind=None,quadDivergentImplicitLod=None,maxPerStageDescriptorUpdateAfterBindSamplers=None,maxPerStageDescriptorUpdateAfterBindUniformBuffers=None,maxPerStageDescriptorUpdateAfterBindStorageBuffers=None,maxPerStageDescriptorUpdateAfterBindSampledImages=None,maxPerStageDescriptorUpdateAfterBindStorageImages=None,maxPerStageDescriptorUpdateAfterBindInputAttachments=None,maxPerStageUpdateAfterBindResources=None,maxDescriptorSetUpdateAfterBindSamplers=None,maxDescriptorSetUpdateAfterBindUniformBuffers=None,maxDescriptorSetUpdateAfterBindUniformBuffersDynamic=None,maxDescriptorSetUpdateAfterBindStorageBuffers=None,maxDescriptorSetUpdateAfterBindStorageBuffersDynamic=None,maxDescriptorSetUpdateAfterBindSampledImages=None,maxDescriptorSetUpdateAfterBindStorageImages=None,maxDescriptorSetUpdateAfterBindInputAttachments=None,supportedDepthResolveModes=None,supportedStencilResolveModes=None,independentResolveNone=None,independentResolve=None,filterMinmaxSingleComponentFormats=None,filterMinmaxImageComponentMapping=None,maxTimelineSemaphoreValueDifference=None,framebufferIntegerColorSampleCounts=None,):
+
+    return _new('VkPhysicalDeviceVulkan12Properties', sType=sType,pNext=pNext,driverID=driverID,driverName=driverName,driverInfo=driverInfo,conformanceVersion=conformanceVersion,denormBehaviorIndependence=denormBehaviorIndependence,roundingModeIndependence=roundingModeIndependence,shaderSignedZeroInfNanPreserveFloat16=shaderSignedZeroInfNanPreserveFloat16,shaderSignedZeroInfNanPreserveFloat32=shaderSignedZeroInfNanPreserveFloat32,shaderSignedZeroInfNanPreserveFloat64=shaderSignedZeroInfNanPreserveFloat64,shaderDenormPreserveFloat16=shaderDenormPreserveFloat16,shaderDenormPreserveFloat32=shaderDenormPreserveFloat32,shaderDenormPreserveFloat64=shaderDenormPreserveFloat64,shaderDenormFlushToZeroFloat16=shaderDenormFlushToZeroFloat16,shaderDenormFlushToZeroFloat32=shaderDenormFlushToZeroFloat32,shaderDenormFlushToZeroFloat64=shaderDenormFlushToZeroFloat64,shaderRoundingModeRTEFloat16=shaderRoundingModeRTEFloat16,shaderRoundingModeRTEFloat32=shaderRoundingModeRTEFloat32,shaderRoundingModeRTEFloat64=shaderRoundingModeRTEFloat64,shaderRoundingModeRTZFloat16=shaderRoundingModeRTZFloat16,shaderRoundingModeRTZFloat32=shaderRoundingModeRTZFloat32,shaderRoundingModeRTZFloat64=shaderRoundingModeRTZFloat64,maxUpdateAfterBindDescriptorsInAllPools=maxUpdateAfterBindDescriptorsInAllPools,shaderUniformBufferArrayNonUniformIndexingNative=shaderUniformBufferArrayNonUniformIndexingNative,shaderSampledImageArrayNonUniformIndexingNative=shaderSampledImageArrayNonUniformIndexingNative,shaderStorageBufferArrayNonUniformIndexingNative=shaderStorageBufferArrayNonUniformIndexingNative,shaderStorageImageArrayNonUniformIndexingNative=shaderStorageImageArrayNonUniformIndexingNative,shaderInputAttachmentArrayNonUniformIndexingNative=shaderInputAttachmentArrayNonUniformIndexingNative,robustBufferAccessUpdateAfterBind=robustBufferAccessUpdateAfterBind,quadDivergentImplicitLod=quadDivergentImplicitLod,maxPerStageDescriptorUpdateAfterBindSamplers=maxPerStageDescriptorUpdateAfterBindSamplers,maxPerStageDescriptorUpdateAfterBindUniformBuffers=maxPerStageDescriptorUpdateAfterBindUniformBuffers,maxPerStageDescriptorUpdateAfterBindStorageBuffers=maxPerStageDescriptorUpdateAfterBindStorageBuffers,maxPerStageDescriptorUpdateAfterBindSampledImages=maxPerStageDescriptorUpdateAfterBindSampledImages,maxPerStageDescriptorUpdateAfterBindStorageImages=maxPerStageDescriptorUpdateAfterBindStorageImages,maxPerStageDescriptorUpdateAfterBindInputAttachments=maxPerStageDescriptorUpdateAfterBindInputAttachments,maxPerStageUpdateAfterBindResources=maxPerStageUpdateAfterBindResources,maxDescriptorSetUpdateAfterBindSamplers=maxDescriptorSetUpdateAfterBindSamplers,maxDescriptorSetUpdateAfterBindUniformBuffers=maxDescriptorSetUpdateAfterBindUniformBuffers,maxDescriptorSetUpdateAfterBindUniformBuffersDynamic=maxDescriptorSetUpdateAfterBindUniformBuffersDynamic,maxDescriptorSetUpdateAfterBindStorageBuffers=maxDescriptorSetUpdateAfterBindStorageBuffers,maxDescriptorSetUpdateAfterBindStorageBuffersDynamic=maxDescriptorSetUpdateAfterBindStorageBuffersDynamic,maxDescriptorSetUpdateAfterBindSampledImages=maxDescriptorSetUpdateAfterBindSampledImages,maxDescriptorSetUpdateAfterBindStorageImages=maxDescriptorSetUpdateAfterBindStorageImages,maxDescriptorSetUpdateAfterBindInputAttachments=maxDescriptorSetUpdateAfterBindInputAttachments,supportedDepthResolveModes=supportedDepthResolveModes,supportedStencilResolveModes=supportedStencilResolveModes,independentResolveNone=independentResolveNone,independentResolve=independentResolve,filterMinmaxSingleComponentFormats=filterMinmaxSingleComponentFormats,filterMinmaxImageComponentMapping=filterMinmaxImageComponentMapping,maxTimelineSemaphoreValueDifference=maxTimelineSemaphoreValueDifference,framebufferIntegerColorSampleCounts=framebufferIntegerColorSampleCounts)
+
+
+
+
+
+
+
+
+
+
+def vkResetQueryPool(
+device
+        ,queryPool
+        ,firstQuery
+        ,queryCount
+        ,):
+
+    result = lib.vkResetQueryPool(_handle(device, 'VkDevice'),_handle(queryPool, 'VkQueryPool'),firstQuery,queryCount)
+
+
+def _wrap_vkResetQueryPool(fn):
+    def vkResetQueryPool(
+    device
+            ,queryPool
+            ,firstQuery
+            ,queryCount
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(queryPool, 'VkQueryPool'),firstQuery,queryCount)
+
+
+    return vkResetQueryPool
+def vkCreateRenderPass2(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pRenderPass=None
+        ,):
+    _args = _arg_types('vkCreateRenderPass2', lib.vkCreateRenderPass2)
+
+
+    custom_return = True
+    if not pRenderPass:
+        pRenderPass = ffi.new('VkRenderPass*')
+        custom_return = False
+
+    result = lib.vkCreateRenderPass2(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pRenderPass, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pRenderPass
+
+    return pRenderPass[0]
+
+
+
+def _wrap_vkCreateRenderPass2(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateRenderPass2(
+    device
+            ,pCreateInfo
+            ,pAllocator
+            ,pRenderPass=None
+            ,):
+
+
+        custom_return = True
+        if not pRenderPass:
+            pRenderPass = ffi.new('VkRenderPass*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pRenderPass, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pRenderPass
+
+        return pRenderPass[0]
+
+
+
+    return vkCreateRenderPass2
+def vkCmdBeginRenderPass2(
+commandBuffer
+        ,pRenderPassBegin
+        ,pSubpassBeginInfo
+        ,):
+    _args = _arg_types('vkCmdBeginRenderPass2', lib.vkCmdBeginRenderPass2)
+
+    result = lib.vkCmdBeginRenderPass2(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pRenderPassBegin, _args[1]),_auto_handle(pSubpassBeginInfo, _args[2]))
+
+
+def _wrap_vkCmdBeginRenderPass2(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdBeginRenderPass2(
+    commandBuffer
+            ,pRenderPassBegin
+            ,pSubpassBeginInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pRenderPassBegin, _args[1]),_auto_handle(pSubpassBeginInfo, _args[2]))
+
+
+    return vkCmdBeginRenderPass2
+def vkCmdNextSubpass2(
+commandBuffer
+        ,pSubpassBeginInfo
+        ,pSubpassEndInfo
+        ,):
+    _args = _arg_types('vkCmdNextSubpass2', lib.vkCmdNextSubpass2)
+
+    result = lib.vkCmdNextSubpass2(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pSubpassBeginInfo, _args[1]),_auto_handle(pSubpassEndInfo, _args[2]))
+
+
+def _wrap_vkCmdNextSubpass2(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdNextSubpass2(
+    commandBuffer
+            ,pSubpassBeginInfo
+            ,pSubpassEndInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pSubpassBeginInfo, _args[1]),_auto_handle(pSubpassEndInfo, _args[2]))
+
+
+    return vkCmdNextSubpass2
+def vkCmdEndRenderPass2(
+commandBuffer
+        ,pSubpassEndInfo
+        ,):
+    _args = _arg_types('vkCmdEndRenderPass2', lib.vkCmdEndRenderPass2)
+
+    result = lib.vkCmdEndRenderPass2(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pSubpassEndInfo, _args[1]))
+
+
+def _wrap_vkCmdEndRenderPass2(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdEndRenderPass2(
+    commandBuffer
+            ,pSubpassEndInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pSubpassEndInfo, _args[1]))
+
+
+    return vkCmdEndRenderPass2
+def vkGetSemaphoreCounterValue(
+device
+        ,semaphore
+        ,pValue=None
+        ,):
+    _args = _arg_types('vkGetSemaphoreCounterValue', lib.vkGetSemaphoreCounterValue)
+
+
+    custom_return = True
+    if not pValue:
+        pValue = ffi.new('uint64_t*')
+        custom_return = False
+
+    result = lib.vkGetSemaphoreCounterValue(_handle(device, 'VkDevice'),_handle(semaphore, 'VkSemaphore'),_auto_handle(pValue, _args[2]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pValue
+
+    return pValue[0]
+
+
+
+def _wrap_vkGetSemaphoreCounterValue(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetSemaphoreCounterValue(
+    device
+            ,semaphore
+            ,pValue=None
+            ,):
+
+
+        custom_return = True
+        if not pValue:
+            pValue = ffi.new('uint64_t*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(semaphore, 'VkSemaphore'),_auto_handle(pValue, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pValue
+
+        return pValue[0]
+
+
+
+    return vkGetSemaphoreCounterValue
+def vkWaitSemaphores(
+device
+        ,pWaitInfo
+        ,timeout
+        ,):
+    _args = _arg_types('vkWaitSemaphores', lib.vkWaitSemaphores)
+
+    result = lib.vkWaitSemaphores(_handle(device, 'VkDevice'),_auto_handle(pWaitInfo, _args[1]),timeout)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def _wrap_vkWaitSemaphores(fn):
+    _args = ffi.typeof(fn).args
+    def vkWaitSemaphores(
+    device
+            ,pWaitInfo
+            ,timeout
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pWaitInfo, _args[1]),timeout)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkWaitSemaphores
+def vkSignalSemaphore(
+device
+        ,pSignalInfo
+        ,):
+    _args = _arg_types('vkSignalSemaphore', lib.vkSignalSemaphore)
+
+    result = lib.vkSignalSemaphore(_handle(device, 'VkDevice'),_auto_handle(pSignalInfo, _args[1]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def _wrap_vkSignalSemaphore(fn):
+    _args = ffi.typeof(fn).args
+    def vkSignalSemaphore(
+    device
+            ,pSignalInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pSignalInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkSignalSemaphore
+def vkCmdDrawIndirectCount(
+commandBuffer
+        ,buffer
+        ,offset
+        ,countBuffer
+        ,countBufferOffset
+        ,maxDrawCount
+        ,stride
+        ,):
+
+    result = lib.vkCmdDrawIndirectCount(_handle(commandBuffer, 'VkCommandBuffer'),_handle(buffer, 'VkBuffer'),offset,_handle(countBuffer, 'VkBuffer'),countBufferOffset,maxDrawCount,stride)
+
+
+def _wrap_vkCmdDrawIndirectCount(fn):
+    def vkCmdDrawIndirectCount(
+    commandBuffer
+            ,buffer
+            ,offset
+            ,countBuffer
+            ,countBufferOffset
+            ,maxDrawCount
+            ,stride
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_handle(buffer, 'VkBuffer'),offset,_handle(countBuffer, 'VkBuffer'),countBufferOffset,maxDrawCount,stride)
+
+
+    return vkCmdDrawIndirectCount
+def vkCmdDrawIndexedIndirectCount(
+commandBuffer
+        ,buffer
+        ,offset
+        ,countBuffer
+        ,countBufferOffset
+        ,maxDrawCount
+        ,stride
+        ,):
+
+    result = lib.vkCmdDrawIndexedIndirectCount(_handle(commandBuffer, 'VkCommandBuffer'),_handle(buffer, 'VkBuffer'),offset,_handle(countBuffer, 'VkBuffer'),countBufferOffset,maxDrawCount,stride)
+
+
+def _wrap_vkCmdDrawIndexedIndirectCount(fn):
+    def vkCmdDrawIndexedIndirectCount(
+    commandBuffer
+            ,buffer
+            ,offset
+            ,countBuffer
+            ,countBufferOffset
+            ,maxDrawCount
+            ,stride
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_handle(buffer, 'VkBuffer'),offset,_handle(countBuffer, 'VkBuffer'),countBufferOffset,maxDrawCount,stride)
+
+
+    return vkCmdDrawIndexedIndirectCount
+def vkGetBufferOpaqueCaptureAddress(
+device
+        ,pInfo=None
+        ,):
+    _args = _arg_types('vkGetBufferOpaqueCaptureAddress', lib.vkGetBufferOpaqueCaptureAddress)
+
+
+    custom_return = True
+    if not pInfo:
+        pInfo = ffi.new('VkBufferDeviceAddressInfo*')
+        custom_return = False
+
+    result = lib.vkGetBufferOpaqueCaptureAddress(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]))
+
+    if custom_return:
+        return pInfo
+
+    return pInfo[0]
+
+
+
+def _wrap_vkGetBufferOpaqueCaptureAddress(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetBufferOpaqueCaptureAddress(
+    device
+            ,pInfo=None
+            ,):
+
+
+        custom_return = True
+        if not pInfo:
+            pInfo = ffi.new('VkBufferDeviceAddressInfo*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]))
+
+        if custom_return:
+            return pInfo
+
+        return pInfo[0]
+
+
+
+    return vkGetBufferOpaqueCaptureAddress
+def vkGetBufferDeviceAddress(
+device
+        ,pInfo=None
+        ,):
+    _args = _arg_types('vkGetBufferDeviceAddress', lib.vkGetBufferDeviceAddress)
+
+
+    custom_return = True
+    if not pInfo:
+        pInfo = ffi.new('VkBufferDeviceAddressInfo*')
+        custom_return = False
+
+    result = lib.vkGetBufferDeviceAddress(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]))
+
+    if custom_return:
+        return pInfo
+
+    return pInfo[0]
+
+
+
+def _wrap_vkGetBufferDeviceAddress(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetBufferDeviceAddress(
+    device
+            ,pInfo=None
+            ,):
+
+
+        custom_return = True
+        if not pInfo:
+            pInfo = ffi.new('VkBufferDeviceAddressInfo*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]))
+
+        if custom_return:
+            return pInfo
+
+        return pInfo[0]
+
+
+
+    return vkGetBufferDeviceAddress
+def vkGetDeviceMemoryOpaqueCaptureAddress(
+device
+        ,pInfo=None
+        ,):
+    _args = _arg_types('vkGetDeviceMemoryOpaqueCaptureAddress', lib.vkGetDeviceMemoryOpaqueCaptureAddress)
+
+
+    custom_return = True
+    if not pInfo:
+        pInfo = ffi.new('VkDeviceMemoryOpaqueCaptureAddressInfo*')
+        custom_return = False
+
+    result = lib.vkGetDeviceMemoryOpaqueCaptureAddress(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]))
+
+    if custom_return:
+        return pInfo
+
+    return pInfo[0]
+
+
+
+def _wrap_vkGetDeviceMemoryOpaqueCaptureAddress(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetDeviceMemoryOpaqueCaptureAddress(
+    device
+            ,pInfo=None
+            ,):
+
+
+        custom_return = True
+        if not pInfo:
+            pInfo = ffi.new('VkDeviceMemoryOpaqueCaptureAddressInfo*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]))
+
+        if custom_return:
+            return pInfo
+
+        return pInfo[0]
+
+
+
+    return vkGetDeviceMemoryOpaqueCaptureAddress
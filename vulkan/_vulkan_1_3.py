@@ -0,0 +1,1230 @@
+from vulkan._vulkan import *  # noqa
+from vulkan._vulkan import (ffi, lib, _new, _auto_handle, _handle,
+                            _arg_types, _slice)
+
+
+def VkDevicePrivateDataCreateInfo(sType=VK_STRUCTURE_TYPE_DEVICE_PRIVATE_DATA_CREATE_INFO,pNext=None,privateDataSlotRequestCount=None,):
+
+    return _new('VkDevicePrivateDataCreateInfo', sType=sType,pNext=pNext,privateDataSlotRequestCount=privateDataSlotRequestCount)
+
+def VkPrivateDataSlotCreateInfo(sType=VK_STRUCTURE_TYPE_PRIVATE_DATA_SLOT_CREATE_INFO,pNext=None,flags=None,):
+
+    return _new('VkPrivateDataSlotCreateInfo', sType=sType,pNext=pNext,flags=flags)
+
+def VkPhysicalDevicePrivateDataFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PRIVATE_DATA_FEATURES,pNext=None,privateData=None,):
+
+    return _new('VkPhysicalDevicePrivateDataFeatures', sType=sType,pNext=pNext,privateData=privateData)
+
+def VkDeviceBufferMemoryRequirements(sType=VK_STRUCTURE_TYPE_DEVICE_BUFFER_MEMORY_REQUIREMENTS,pNext=None,pCreateInfo=None,):
+
+    return _new('VkDeviceBufferMemoryRequirements', sType=sType,pNext=pNext,pCreateInfo=pCreateInfo)
+
+def VkDeviceImageMemoryRequirements(sType=VK_STRUCTURE_TYPE_DEVICE_IMAGE_MEMORY_REQUIREMENTS,pNext=None,pCreateInfo=None,planeAspect=None,):
+
+    return _new('VkDeviceImageMemoryRequirements', sType=sType,pNext=pNext,pCreateInfo=pCreateInfo,planeAspect=planeAspect)
+
+def VkPhysicalDeviceInlineUniformBlockFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_INLINE_UNIFORM_BLOCK_FEATURES,pNext=None,inlineUniformBlock=None,descriptorBindingInlineUniformBlockUpdateAfterBind=None,):
+
+    return _new('VkPhysicalDeviceInlineUniformBlockFeatures', sType=sType,pNext=pNext,inlineUniformBlock=inlineUniformBlock,descriptorBindingInlineUniformBlockUpdateAfterBind=descriptorBindingInlineUniformBlockUpdateAfterBind)
+
+def VkPhysicalDeviceInlineUniformBlockProperties(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_INLINE_UNIFORM_BLOCK_PROPERTIES,pNext=None,maxInlineUniformBlockSize=None,maxPerStageDescriptorInlineUniformBlocks=None,maxPerStageDescriptorUpdateAfterBindInlineUniformBlocks=None,maxDescriptorSetInlineUniformBlocks=None,maxDescriptorSetUpdateAfterBindInlineUniformBlocks=None,):
+
+    return _new('VkPhysicalDeviceInlineUniformBlockProperties', sType=sType,pNext=pNext,maxInlineUniformBlockSize=maxInlineUniformBlockSize,maxPerStageDescriptorInlineUniformBlocks=maxPerStageDescriptorInlineUniformBlocks,maxPerStageDescriptorUpdateAfterBindInlineUniformBlocks=maxPerStageDescriptorUpdateAfterBindInlineUniformBlocks,maxDescriptorSetInlineUniformBlocks=maxDescriptorSetInlineUniformBlocks,maxDescriptorSetUpdateAfterBindInlineUniformBlocks=maxDescriptorSetUpdateAfterBindInlineUniformBlocks)
+
+def VkWriteDescriptorSetInlineUniformBlock(sType=VK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET_INLINE_UNIFORM_BLOCK,pNext=None,dataSize=None,pData=None,):
+    if dataSize is None and pData is not None:
+        dataSize = len(pData)
+
+    return _new('VkWriteDescriptorSetInlineUniformBlock', sType=sType,pNext=pNext,dataSize=dataSize,pData=pData)
+
+def VkDescriptorPoolInlineUniformBlockCreateInfo(sType=VK_STRUCTURE_TYPE_DESCRIPTOR_POOL_INLINE_UNIFORM_BLOCK_CREATE_INFO,pNext=None,maxInlineUniformBlockBindings=None,):
+
+    return _new('VkDescriptorPoolInlineUniformBlockCreateInfo', sType=sType,pNext=pNext,maxInlineUniformBlockBindings=maxInlineUniformBlockBindings)
+
+def VkPhysicalDeviceMaintenance4Features(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_4_FEATURES,pNext=None,maintenance4=None,):
+
+    return _new('VkPhysicalDeviceMaintenance4Features', sType=sType,pNext=pNext,maintenance4=maintenance4)
+
+def VkPhysicalDeviceMaintenance4Properties(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_4_PROPERTIES,pNext=None,maxBufferSize=None,):
+
+    return _new('VkPhysicalDeviceMaintenance4Properties', sType=sType,pNext=pNext,maxBufferSize=maxBufferSize)
+
+def VkPhysicalDeviceTextureCompressionASTCHDRFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TEXTURE_COMPRESSION_ASTC_HDR_FEATURES,pNext=None,textureCompressionASTC_HDR=None,):
+
+    return _new('VkPhysicalDeviceTextureCompressionASTCHDRFeatures', sType=sType,pNext=pNext,textureCompressionASTC_HDR=textureCompressionASTC_HDR)
+
+def VkPipelineCreationFeedback(flags=None,duration=None,):
+
+    return _new('VkPipelineCreationFeedback', flags=flags,duration=duration)
+
+def VkPipelineCreationFeedbackCreateInfo(sType=VK_STRUCTURE_TYPE_PIPELINE_CREATION_FEEDBACK_CREATE_INFO,pNext=None,pPipelineCreationFeedback=None,pipelineStageCreationFeedbackCount=None,pPipelineStageCreationFeedbacks=None,):
+    if pipelineStageCreationFeedbackCount is None and pPipelineStageCreationFeedbacks is not None:
+        pipelineStageCreationFeedbackCount = len(pPipelineStageCreationFeedbacks)
+
+    return _new('VkPipelineCreationFeedbackCreateInfo', sType=sType,pNext=pNext,pPipelineCreationFeedback=pPipelineCreationFeedback,pipelineStageCreationFeedbackCount=pipelineStageCreationFeedbackCount,pPipelineStageCreationFeedbacks=pPipelineStageCreationFeedbacks)
+
+def VkPhysicalDeviceShaderDemoteToHelperInvocationFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_DEMOTE_TO_HELPER_INVOCATION_FEATURES,pNext=None,shaderDemoteToHelperInvocation=None,):
+
+    return _new('VkPhysicalDeviceShaderDemoteToHelperInvocationFeatures', sType=sType,pNext=pNext,shaderDemoteToHelperInvocation=shaderDemoteToHelperInvocation)
+
+def VkPhysicalDeviceTexelBufferAlignmentProperties(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TEXEL_BUFFER_ALIGNMENT_PROPERTIES,pNext=None,storageTexelBufferOffsetAlignmentBytes=None,storageTexelBufferOffsetSingleTexelAlignment=None,uniformTexelBufferOffsetAlignmentBytes=None,uniformTexelBufferOffsetSingleTexelAlignment=None,):
+
+    return _new('VkPhysicalDeviceTexelBufferAlignmentProperties', sType=sType,pNext=pNext,storageTexelBufferOffsetAlignmentBytes=storageTexelBufferOffsetAlignmentBytes,storageTexelBufferOffsetSingleTexelAlignment=storageTexelBufferOffsetSingleTexelAlignment,uniformTexelBufferOffsetAlignmentBytes=uniformTexelBufferOffsetAlignmentBytes,uniformTexelBufferOffsetSingleTexelAlignment=uniformTexelBufferOffsetSingleTexelAlignment)
+
+def VkPhysicalDeviceSubgroupSizeControlFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBGROUP_SIZE_CONTROL_FEATURES,pNext=None,subgroupSizeControl=None,computeFullSubgroups=None,):
+
+    return _new('VkPhysicalDeviceSubgroupSizeControlFeatures', sType=sType,pNext=pNext,subgroupSizeControl=subgroupSizeControl,computeFullSubgroups=computeFullSubgroups)
+
+def VkPhysicalDeviceSubgroupSizeControlProperties(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBGROUP_SIZE_CONTROL_PROPERTIES,pNext=None,minSubgroupSize=None,maxSubgroupSize=None,maxComputeWorkgroupSubgroups=None,requiredSubgroupSizeStages=None,):
+
+    return _new('VkPhysicalDeviceSubgroupSizeControlProperties', sType=sType,pNext=pNext,minSubgroupSize=minSubgroupSize,maxSubgroupSize=maxSubgroupSize,maxComputeWorkgroupSubgroups=maxComputeWorkgroupSubgroups,requiredSubgroupSizeStages=requiredSubgroupSizeStages)
+
+def VkPipelineShaderStageRequiredSubgroupSizeCreateInfo(sType=VK_STRUCTURE_TYPE_PIPELINE_SHADER_STAGE_REQUIRED_SUBGROUP_SIZE_CREATE_INFO,pNext=None,requiredSubgroupSize=None,):
+
+    return _new('VkPipelineShaderStageRequiredSubgroupSizeCreateInfo', sType=sType,pNext=pNext,requiredSubgroupSize=requiredSubgroupSize)
+
+def VkPhysicalDevicePipelineCreationCacheControlFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PIPELINE_CREATION_CACHE_CONTROL_FEATURES,pNext=None,pipelineCreationCacheControl=None,):
+
+    return _new('VkPhysicalDevicePipelineCreationCacheControlFeatures', sType=sType,pNext=pNext,pipelineCreationCacheControl=pipelineCreationCacheControl)
+
+def VkPhysicalDeviceVulkan13Features(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_3_FEATURES,pNext=None,robustImageAccess=None,inlineUniformBlock=None,descriptorBindingInlineUniformBlockUpdateAfterBind=None,pipelineCreationCacheControl=None,privateData=None,shaderDemoteToHelperInvocation=None,shaderTerminateInvocation=None,subgroupSizeControl=None,computeFullSubgroups=None,synchronization2=None,textureCompressionASTC_HDR=None,shaderZeroInitializeWorkgroupMemory=None,dynamicRendering=None,shaderIntegerDotProduct=None,maintenance4=None,):
+
+    return _new('VkPhysicalDeviceVulkan13Features', sType=sType,pNext=pNext,robustImageAccess=robustImageAccess,inlineUniformBlock=inlineUniformBlock,descriptorBindingInlineUniformBlockUpdateAfterBind=descriptorBindingInlineUniformBlockUpdateAfterBind,pipelineCreationCacheControl=pipelineCreationCacheControl,privateData=privateData,shaderDemoteToHelperInvocation=shaderDemoteToHelperInvocation,shaderTerminateInvocation=shaderTerminateInvocation,subgroupSizeControl=subgroupSizeControl,computeFullSubgroups=computeFullSubgroups,synchronization2=synchronization2,textureCompressionASTC_HDR=textureCompressionASTC_HDR,shaderZeroInitializeWorkgroupMemory=shaderZeroInitializeWorkgroupMemory,dynamicRendering=dynamicRendering,shaderIntegerDotProduct=shaderIntegerDotProduct,maintenance4=maintenance4)
+
+def VkPhysicalDeviceVulkan13Properties(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_3_PROPERTIES,pNext=None,minSubgroupSize=None,maxSubgroupSize=None,maxComputeWorkgroupSubgroups=None,requiredSubgroupSizeStages=None,maxInlineUniformBlockSize=None,maxPerStageDescriptorInlineUniformBlocks=None,maxPerStageDescriptorUpdateAfterBindInlineUniformBlocks=None,maxDescriptorSetInlineUniformBlocks=None,maxDescriptorSetUpdateAfterBindInlineUniformBlocks=None,maxInlineUniformTotalSize=None,integerDotProduct8BitUnsignedAccelerated=None,integerDotProduct8BitSignedAccelerated=None,integerDotProduct8BitMixedSignednessAccelerated=None,integerDotProduct4x8BitPackedUnsignedAccelerated=None,integerDotProduct4x8BitPackedSignedAccelerated=None,integerDotProduct4x8BitPackedMixedSignednessAccelerated=None,integerDotProduct16BitUnsignedAccelerated=None,integerDotProduct16BitSignedAccelerated=None,integerDotProduct16BitMixedSignednessAccelerated=None,integerDotProduct32BitUnsignedAccelerated=None,integerDotProduct32BitSignedAccelerated=None,integerDotProduct32BitMixedSignednessAccelerated=None,integerDotProduct64BitUnsignedAccelerated=None,integerDotProduct64BitSignedAccelerated=None,integerDotProduct64BitMixedSignednessAccelerated=None,integerDotProductAccumulatingSaturating8BitUnsignedAccelerated=None,integerDotProductAccumulatingSaturating8BitSignedAccelerated=None,integerDotProductAccumulatingSaturating8BitMixedSignednessAccelerated=None,integerDotProductAccumulatingSaturating4x8BitPackedUnsignedAccelerated=None,integerDotProductAccumulatingSaturating4x8BitPackedSignedAccelerated=None,integerDotProductAccumulatingSaturating4x8BitPackedMixedSignednessAccelerated=None,integerDotProductAccumulatingSaturating16BitUnsignedAccelerated=None,integerDotProductAccumulatingSaturating16BitSignedAccelerated=None,integerDotProductAccumulatingSaturating16BitMixedSignednessAccelerated=None,integerDotProductAccumulatingSaturating32BitUnsignedAccelerated=None,integerDotProductAccumulatingSaturating32BitSignedAccelerated=None,integerDotProductAccumulatingSaturating32BitMixedSignednessAccelerated=None,integerDotProductAccumulatingSaturating64BitUnsignedAccelerated=None,integerDotProductAccumulatingSaturating64BitSignedAccelerated=None,integerDotProductAccumulatingSaturating64BitMixedSignednessAccelerated=None,storageTexelBufferOffsetAlignmentBytes=None,storageTexelBufferOffsetSingleTexelAlignment=None,uniformTexelBufferOffsetAlignmentBytes=None,uniformTexelBufferOffsetSingleTexelAlignment=None,maxBufferSize=None,):
+
+    return _new('VkPhysicalDeviceVulkan13Properties', sType=sType,pNext=pNext,minSubgroupSize=minSubgroupSize,maxSubgroupSize=maxSubgroupSize,maxComputeWorkgroupSubgroups=maxComputeWorkgroupSubgroups,requiredSubgroupSizeStages=requiredSubgroupSizeStages,maxInlineUniformBlockSize=maxInlineUniformBlockSize,maxPerStageDescriptorInlineUniformBlocks=maxPerStageDescriptorInlineUniformBlocks,maxPerStageDescriptorUpdateAfterBindInlineUniformBlocks=maxPerStageDescriptorUpdateAfterBindInlineUniformBlocks,maxDescriptorSetInlineUniformBlocks=maxDescriptorSetInlineUniformBlocks,maxDescriptorSetUpdateAfterBindInlineUniformBlocks=maxDescriptorSetUpdateAfterBindInlineUniformBlocks,maxInlineUniformTotalSize=maxInlineUniformTotalSize,integerDotProduct8BitUnsignedAccelerated=integerDotProduct8BitUnsignedAccelerated,integerDotProduct8BitSignedAccelerated=integerDotProduct8BitSignedAccelerated,integerDotProduct8BitMixedSignednessAccelerated=integerDotProduct8BitMixedSignednessAccelerated,integerDotProduct4x8BitPackedUnsignedAccelerated=integerDotProduct4x8BitPackedUnsignedAccelerated,integerDotProduct4x8BitPackedSignedAccelerated=integerDotProduct4x8BitPackedSignedAccelerated,integerDotProduct4x8BitPackedMixedSignednessAccelerated=integerDotProduct4x8BitPackedMixedSignednessAccelerated,integerDotProduct16BitUnsignedAccelerated=integerDotProduct16BitUnsignedAccelerated,integerDotProduct16BitSignedAccelerated=integerDotProduct16BitSignedAccelerated,integerDotProduct16BitMixedSignednessAccelerated=integerDotProduct16BitMixedSignednessAccelerated,integerDotProduct32BitUnsignedAccelerated=integerDotProduct32BitUnsignedAccelerated,integerDotProduct32BitSignedAccelerated=integerDotProduct32BitSignedAccelerated,integerDotProduct32BitMixedSignednessAccelerated=integerDotProduct32BitMixedSignednessAccelerated,integerDotProduct64BitUnsignedAccelerated=integerDotProduct64BitUnsignedAccelerated,integerDotProduct64BitSignedAccelerated=integerDotProduct64BitSignedAccelerated,integerDotProduct64BitMixedSignednessAccelerated=integerDotProduct64BitMixedSignednessAccelerated,integerDotProductAccumulatingSaturating8BitUnsignedAccelerated=integerDotProductAccumulatingSaturating8BitUnsignedAccelerated,integerDotProductAccumulatingSaturating8BitSignedAccelerated=integerDotProductAccumulatingSaturating8BitSignedAccelerated,integerDotProductAccumulatingSaturating8BitMixedSignednessAccelerated=integerDotProductAccumulatingSaturating8BitMixedSignednessAccelerated,integerDotProductAccumulatingSaturating4x8BitPackedUnsignedAccelerated=integerDotProductAccumulatingSaturating4x8BitPackedUnsignedAccelerated,integerDotProductAccumulatingSaturating4x8BitPackedSignedAccelerated=integerDotProductAccumulatingSaturating4x8BitPackedSignedAccelerated,integerDotProductAccumulatingSaturating4x8BitPackedMixedSignednessAccelerated=integerDotProductAccumulatingSaturating4x8BitPackedMixedSignednessAccelerated,integerDotProductAccumulatingSaturating16BitUnsignedAccelerated=integerDotProductAccumulatingSaturating16BitUnsignedAccelerated,integerDotProductAccumulatingSaturating16BitSignedAccelerated=integerDotProductAccumulatingSaturating16BitSignedAccelerated,integerDotProductAccumulatingSaturating16BitMixedSignednessAccelerated=integerDotProductAccumulatingSaturating16BitMixedSignednessAccelerated,integerDotProductAccumulatingSaturating32BitUnsignedAccelerated=integerDotProductAccumulatingSaturating32BitUnsignedAccelerated,integerDotProductAccumulatingSaturating32BitSignedAccelerated=integerDotProductAccumulatingSaturating32BitSignedAccelerated,integerDotProductAccumulatingSaturating32BitMixedSignednessAccelerated=integerDotProductAccumulatingSaturating32BitMixedSignednessAccelerated,integerDotProductAccumulatingSaturating64BitUnsignedAccelerated=integerDotProductAccumulatingSaturating64BitUnsignedAccelerated,integerDotProductAccumulatingSaturating64BitSignedAccelerated=integerDotProductAccumulatingSaturating64BitSignedAccelerated,integerDotProductAccumulatingSaturating64BitMixedSignednessAccelerated=integerDotProductAccumulatingSaturating64BitMixedSignednessAccelerated,storageTexelBufferOffsetAlignmentBytes=storageTexelBufferOffsetAlignmentBytes,storageTexelBufferOffsetSingleTexelAlignment=storageTexelBufferOffsetSingleTexelAlignment,uniformTexelBufferOffsetAlignmentBytes=uniformTexelBufferOffsetAlignmentBytes,uniformTexelBufferOffsetSingleTexelAlignment=uniformTexelBufferOffsetSingleTexelAlignment,maxBufferSize=maxBufferSize)
+
+def VkPhysicalDeviceToolProperties(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TOOL_PROPERTIES,pNext=None,name=None,version=None,purposes=None,description=None,layer=None,):
+
+    return _new('VkPhysicalDeviceToolProperties', sType=sType,pNext=pNext,name=name,version=version,purposes=purposes,description=description,layer=layer)
+
+def VkPhysicalDeviceZeroInitializeWorkgroupMemoryFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ZERO_INITIALIZE_WORKGROUP_MEMORY_FEATURES,pNext=None,shaderZeroInitializeWorkgroupMemory=None,):
+
+    return _new('VkPhysicalDeviceZeroInitializeWorkgroupMemoryFeatures', sType=sType,pNext=pNext,shaderZeroInitializeWorkgroupMemory=shaderZeroInitializeWorkgroupMemory)
+
+def VkPhysicalDeviceImageRobustnessFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_ROBUSTNESS_FEATURES,pNext=None,robustImageAccess=None,):
+
+    return _new('VkPhysicalDeviceImageRobustnessFeatures', sType=sType,pNext=pNext,robustImageAccess=robustImageAccess)
+
+def VkBufferCopy2(sType=VK_STRUCTURE_TYPE_BUFFER_COPY_2,pNext=None,srcOffset=None,dstOffset=None,size=None,):
+
+    return _new('VkBufferCopy2', sType=sType,pNext=pNext,srcOffset=srcOffset,dstOffset=dstOffset,size=size)
+
+def VkImageCopy2(sType=VK_STRUCTURE_TYPE_IMAGE_COPY_2,pNext=None,srcSubresource=None,srcOffset=None,dstSubresource=None,dstOffset=None,extent=None,):
+
+    return _new('VkImageCopy2', sType=sType,pNext=pNext,srcSubresource=srcSubresource,srcOffset=srcOffset,dstSubresource=dstSubresource,dstOffset=dstOffset,extent=extent)
+
+def VkImageBlit2(sType=VK_STRUCTURE_TYPE_IMAGE_BLIT_2,pNext=None,srcSubresource=None,srcOffsets=None,dstSubresource=None,dstOffsets=None,):
+
+    return _new('VkImageBlit2', sType=sType,pNext=pNext,srcSubresource=srcSubresource,srcOffsets=srcOffsets,dstSubresource=dstSubresource,dstOffsets=dstOffsets)
+
+def VkBufferImageCopy2(sType=VK_STRUCTURE_TYPE_BUFFER_IMAGE_COPY_2,pNext=None,bufferOffset=None,bufferRowLength=None,bufferImageHeight=None,imageSubresource=None,imageOffset=None,imageExtent=None,):
+
+    return _new('VkBufferImageCopy2', sType=sType,pNext=pNext,bufferOffset=bufferOffset,bufferRowLength=bufferRowLength,bufferImageHeight=bufferImageHeight,imageSubresource=imageSubresource,imageOffset=imageOffset,imageExtent=imageExtent)
+
+def VkImageResolve2(sType=VK_STRUCTURE_TYPE_IMAGE_RESOLVE_2,pNext=None,srcSubresource=None,srcOffset=None,dstSubresource=None,dstOffset=None,extent=None,):
+
+    return _new('VkImageResolve2', sType=sType,pNext=pNext,srcSubresource=srcSubresource,srcOffset=srcOffset,dstSubresource=dstSubresource,dstOffset=dstOffset,extent=extent)
+
+def VkCopyBufferInfo2(sType=VK_STRUCTURE_TYPE_COPY_BUFFER_INFO_2,pNext=None,srcBuffer=None,dstBuffer=None,regionCount=None,pRegions=None,):
+    if regionCount is None and pRegions is not None:
+        regionCount = len(pRegions)
+
+    return _new('VkCopyBufferInfo2', sType=sType,pNext=pNext,srcBuffer=srcBuffer,dstBuffer=dstBuffer,regionCount=regionCount,pRegions=pRegions)
+
+def VkCopyImageInfo2(sType=VK_STRUCTURE_TYPE_COPY_IMAGE_INFO_2,pNext=None,srcImage=None,srcImageLayout=None,dstImage=None,dstImageLayout=None,regionCount=None,pRegions=None,):
+    if regionCount is None and pRegions is not None:
+        regionCount = len(pRegions)
+
+    return _new('VkCopyImageInfo2', sType=sType,pNext=pNext,srcImage=srcImage,srcImageLayout=srcImageLayout,dstImage=dstImage,dstImageLayout=dstImageLayout,regionCount=regionCount,pRegions=pRegions)
+
+def VkBlitImageInfo2(sType=VK_STRUCTURE_TYPE_BLIT_IMAGE_INFO_2,pNext=None,srcImage=None,srcImageLayout=None,dstImage=None,dstImageLayout=None,regionCount=None,pRegions=None,filter=None,):
+    if regionCount is None and pRegions is not None:
+        regionCount = len(pRegions)
+
+    return _new('VkBlitImageInfo2', sType=sType,pNext=pNext,srcImage=srcImage,srcImageLayout=srcImageLayout,dstImage=dstImage,dstImageLayout=dstImageLayout,regionCount=regionCount,pRegions=pRegions,filter=filter)
+
+def VkCopyBufferToImageInfo2(sType=VK_STRUCTURE_TYPE_COPY_BUFFER_TO_IMAGE_INFO_2,pNext=None,srcBuffer=None,dstImage=None,dstImageLayout=None,regionCount=None,pRegions=None,):
+    if regionCount is None and pRegions is not None:
+        regionCount = len(pRegions)
+
+    return _new('VkCopyBufferToImageInfo2', sType=sType,pNext=pNext,srcBuffer=srcBuffer,dstImage=dstImage,dstImageLayout=dstImageLayout,regionCount=regionCount,pRegions=pRegions)
+
+def VkCopyImageToBufferInfo2(sType=VK_STRUCTURE_TYPE_COPY_IMAGE_TO_BUFFER_INFO_2,pNext=None,srcImage=None,srcImageLayout=None,dstBuffer=None,regionCount=None,pRegions=None,):
+    if regionCount is None and pRegions is not None:
+        regionCount = len(pRegions)
+
+    return _new('VkCopyImageToBufferInfo2', sType=sType,pNext=pNext,srcImage=srcImage,srcImageLayout=srcImageLayout,dstBuffer=dstBuffer,regionCount=regionCount,pRegions=pRegions)
+
+def VkResolveImageInfo2(sType=VK_STRUCTURE_TYPE_RESOLVE_IMAGE_INFO_2,pNext=None,srcImage=None,srcImageLayout=None,dstImage=None,dstImageLayout=None,regionCount=None,pRegions=None,):
+    if regionCount is None and pRegions is not None:
+        regionCount = len(pRegions)
+
+    return _new('VkResolveImageInfo2', sType=sType,pNext=pNext,srcImage=srcImage,srcImageLayout=srcImageLayout,dstImage=dstImage,dstImageLayout=dstImageLayout,regionCount=regionCount,pRegions=pRegions)
+
+def VkPhysicalDeviceShaderTerminateInvocationFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_TERMINATE_INVOCATION_FEATURES,pNext=None,shaderTerminateInvocation=None,):
+
+    return _new('VkPhysicalDeviceShaderTerminateInvocationFeatures', sType=sType,pNext=pNext,shaderTerminateInvocation=shaderTerminateInvocation)
+
+def VkMemoryBarrier2(sType=VK_STRUCTURE_TYPE_MEMORY_BARRIER_2,pNext=None,srcStageMask=None,srcAccessMask=None,dstStageMask=None,dstAccessMask=None,):
+
+    return _new('VkMemoryBarrier2', sType=sType,pNext=pNext,srcStageMask=srcStageMask,srcAccessMask=srcAccessMask,dstStageMask=dstStageMask,dstAccessMask=dstAccessMask)
+
+def VkImageMemoryBarrier2(sType=VK_STRUCTURE_TYPE_IMAGE_MEMORY_BARRIER_2,pNext=None,srcStageMask=None,srcAccessMask=None,dstStageMask=None,dstAccessMask=None,oldLayout=None,newLayout=None,srcQueueFamilyIndex=None,dstQueueFamilyIndex=None,image=None,subresourceRange=None,):
+
+    return _new('VkImageMemoryBarrier2', sType=sType,pNext=pNext,srcStageMask=srcStageMask,srcAccessMask=srcAccessMask,dstStageMask=dstStageMask,dstAccessMask=dstAccessMask,oldLayout=oldLayout,newLayout=newLayout,srcQueueFamilyIndex=srcQueueFamilyIndex,dstQueueFamilyIndex=dstQueueFamilyIndex,image=image,subresourceRange=subresourceRange)
+
+def VkBufferMemoryBarrier2(sType=VK_STRUCTURE_TYPE_BUFFER_MEMORY_BARRIER_2,pNext=None,srcStageMask=None,srcAccessMask=None,dstStageMask=None,dstAccessMask=None,srcQueueFamilyIndex=None,dstQueueFamilyIndex=None,buffer=None,offset=None,size=None,):
+
+    return _new('VkBufferMemoryBarrier2', sType=sType,pNext=pNext,srcStageMask=srcStageMask,srcAccessMask=srcAccessMask,dstStageMask=dstStageMask,dstAccessMask=dstAccessMask,srcQueueFamilyIndex=srcQueueFamilyIndex,dstQueueFamilyIndex=dstQueueFamilyIndex,buffer=buffer,offset=offset,size=size)
+
+def VkDependencyInfo(sType=VK_STRUCTURE_TYPE_DEPENDENCY_INFO,pNext=None,dependencyFlags=None,memoryBarrierCount=None,pMemoryBarriers=None,bufferMemoryBarrierCount=None,pBufferMemoryBarriers=None,imageMemoryBarrierCount=None,pImageMemoryBarriers=None,):
+    if memoryBarrierCount is None and pMemoryBarriers is not None:
+        memoryBarrierCount = len(pMemoryBarriers)
+    if bufferMemoryBarrierCount is None and pBufferMemoryBarriers is not None:
+        bufferMemoryBarrierCount = len(pBufferMemoryBarriers)
+    if imageMemoryBarrierCount is None and pImageMemoryBarriers is not None:
+        imageMemoryBarrierCount = len(pImageMemoryBarriers)
+
+    return _new('VkDependencyInfo', sType=sType,pNext=pNext,dependencyFlags=dependencyFlags,memoryBarrierCount=memoryBarrierCount,pMemoryBarriers=pMemoryBarriers,bufferMemoryBarrierCount=bufferMemoryBarrierCount,pBufferMemoryBarriers=pBufferMemoryBarriers,imageMemoryBarrierCount=imageMemoryBarrierCount,pImageMemoryBarriers=pImageMemoryBarriers)
+
+def VkSemaphoreSubmitInfo(sType=VK_STRUCTURE_TYPE_SEMAPHORE_SUBMIT_INFO,pNext=None,semaphore=None,value=None,stageMask=None,deviceIndex=None,):
+
+    return _new('VkSemaphoreSubmitInfo', sType=sType,pNext=pNext,semaphore=semaphore,value=value,stageMask=stageMask,deviceIndex=deviceIndex)
+
+def VkCommandBufferSubmitInfo(sType=VK_STRUCTURE_TYPE_COMMAND_BUFFER_SUBMIT_INFO,pNext=None,commandBuffer=None,deviceMask=None,):
+
+    return _new('VkCommandBufferSubmitInfo', sType=sType,pNext=pNext,commandBuffer=commandBuffer,deviceMask=deviceMask)
+
+def VkSubmitInfo2(sType=VK_STRUCTURE_TYPE_SUBMIT_INFO_2,pNext=None,flags=None,waitSemaphoreInfoCount=None,pWaitSemaphoreInfos=None,commandBufferInfoCount=None,pCommandBufferInfos=None,signalSemaphoreInfoCount=None,pSignalSemaphoreInfos=None,):
+    if waitSemaphoreInfoCount is None and pWaitSemaphoreInfos is not None:
+        waitSemaphoreInfoCount = len(pWaitSemaphoreInfos)
+    if commandBufferInfoCount is None and pCommandBufferInfos is not None:
+        commandBufferInfoCount = len(pCommandBufferInfos)
+    if signalSemaphoreInfoCount is None and pSignalSemaphoreInfos is not None:
+        signalSemaphoreInfoCount = len(pSignalSemaphoreInfos)
+
+    return _new('VkSubmitInfo2', sType=sType,pNext=pNext,flags=flags,waitSemaphoreInfoCount=waitSemaphoreInfoCount,pWaitSemaphoreInfos=pWaitSemaphoreInfos,commandBufferInfoCount=commandBufferInfoCount,pCommandBufferInfos=pCommandBufferInfos,signalSemaphoreInfoCount=signalSemaphoreInfoCount,pSignalSemaphoreInfos=pSignalSemaphoreInfos)
+
+def VkPhysicalDeviceSynchronization2Features(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SYNCHRONIZATION_2_FEATURES,pNext=None,synchronization2=None,):
+
+    return _new('VkPhysicalDeviceSynchronization2Features', sType=sType,pNext=pNext,synchronization2=synchronization2)
+
+def VkPhysicalDeviceShaderIntegerDotProductFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_INTEGER_DOT_PRODUCT_FEATURES,pNext=None,shaderIntegerDotProduct=None,):
+
+    return _new('VkPhysicalDeviceShaderIntegerDotProductFeatures', sType=sType,pNext=pNext,shaderIntegerDotProduct=shaderIntegerDotProduct)
+
+def VkPhysicalDeviceShaderIntegerDotProductProperties(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_INTEGER_DOT_PRODUCT_PROPERTIES,pNext=None,integerDotProduct8BitUnsignedAccelerated=None,integerDotProduct8BitSignedAccelerated=None,integerDotProduct8BitMixedSignednessAccelerated=None,integerDotProduct4x8BitPackedUnsignedAccelerated=None,integerDotProduct4x8BitPackedSignedAccelerated=None,integerDotProduct4x8BitPackedMixedSignednessAccelerated=None,integerDotProduct16BitUnsignedAccelerated=None,integerDotProduct16BitSignedAccelerated=None,integerDotProduct16BitMixedSignednessAccelerated=None,integerDotProduct32BitUnsignedAccelerated=None,integerDotProduct32BitSignedAccelerated=None,integerDotProduct32BitMixedSignednessAccelerated=None,integerDotProduct64BitUnsignedAccelerated=None,integerDotProduct64BitSignedAccelerated=None,integerDotProduct64BitMixedSignednessAccelerated=None,integerDotProductAccumulatingSaturating8BitUnsignedAccelerated=None,integerDotProductAccumulatingSaturating8BitSignedAccelerated=None,integerDotProductAccumulatingSaturating8BitMixedSignednessAccelerated=None,integerDotProductAccumulatingSaturating4x8BitPackedUnsignedAccelerated=None,integerDotProductAccumulatingSaturating4x8BitPackedSignedAccelerated=None,integerDotProductAccumulatingSaturating4x8BitPackedMixedSignednessAccelerated=None,integerDotProductAccumulatingSaturating16BitUnsignedAccelerated=None,integerDotProductAccumulatingSaturating16BitSignedAccelerated=None,integerDotProductAccumulatingSaturating16BitMixedSignednessAccelerated=None,integerDotProductAccumulatingSaturating32BitUnsignedAccelerated=None,integerDotProductAccumulatingSaturating32BitSignedAccelerated=None,integerDotProductAccumulatingSaturating32BitMixedSignednessAccelerated=None,integerDotProductAccumulatingSaturating64BitUnsignedAccelerated=None,integerDotProductAccumulatingSaturating64BitSignedAccelerated=None,integerDotProductAccumulatingSaturating64BitMixedSignednessAccelerated=None,):
+
+    return _new('VkPhysicalDeviceShaderIntegerDotProductProperties', sType=sType,pNext=pNext,integerDotProduct8BitUnsignedAccelerated=integerDotProduct8BitUnsignedAccelerated,integerDotProduct8BitSignedAccelerated=integerDotProduct8BitSignedAccelerated,integerDotProduct8BitMixedSignednessAccelerated=integerDotProduct8BitMixedSignednessAccelerated,integerDotProduct4x8BitPackedUnsignedAccelerated=integerDotProduct4x8BitPackedUnsignedAccelerated,integerDotProduct4x8BitPackedSignedAccelerated=integerDotProduct4x8BitPackedSignedAccelerated,integerDotProduct4x8BitPackedMixedSignednessAccelerated=integerDotProduct4x8BitPackedMixedSignednessAccelerated,integerDotProduct16BitUnsignedAccelerated=integerDotProduct16BitUnsignedAccelerated,integerDotProduct16BitSignedAccelerated=integerDotProduct16BitSignedAccelerated,integerDotProduct16BitMixedSignednessAccelerated=integerDotProduct16BitMixedSignednessAccelerated,integerDotProduct32BitUnsignedAccelerated=integerDotProduct32BitUnsignedAccelerated,integerDotProduct32BitSignedAccelerated=integerDotProduct32BitSignedAccelerated,integerDotProduct32BitMixedSignednessAccelerated=integerDotProduct32BitMixedSignednessAccelerated,integerDotProduct64BitUnsignedAccelerated=integerDotProduct64BitUnsignedAccelerated,integerDotProduct64BitSignedAccelerated=integerDotProduct64BitSignedAccelerated,integerDotProduct64BitMixedSignednessAccelerated=integerDotProduct64BitMixedSignednessAccelerated,integerDotProductAccumulatingSaturating8BitUnsignedAccelerated=integerDotProductAccumulatingSaturating8BitUnsignedAccelerated,integerDotProductAccumulatingSaturating8BitSignedAccelerated=integerDotProductAccumulatingSaturating8BitSignedAccelerated,integerDotProductAccumulatingSaturating8BitMixedSignednessAccelerated=integerDotProductAccumulatingSaturating8BitMixedSignednessAccelerated,integerDotProductAccumulatingSaturating4x8BitPackedUnsignedAccelerated=integerDotProductAccumulatingSaturating4x8BitPackedUnsignedAccelerated,integerDotProductAccumulatingSaturating4x8BitPackedSignedAccelerated=integerDotProductAccumulatingSaturating4x8BitPackedSignedAccelerated,integerDotProductAccumulatingSaturating4x8BitPackedMixedSignednessAccelerated=integerDotProductAccumulatingSaturating4x8BitPackedMixedSignednessAccelerated,integerDotProductAccumulatingSaturating16BitUnsignedAccelerated=integerDotProductAccumulatingSaturating16BitUnsignedAccelerated,integerDotProductAccumulatingSaturating16BitSignedAccelerated=integerDotProductAccumulatingSaturating16BitSignedAccelerated,integerDotProductAccumulatingSaturating16BitMixedSignednessAccelerated=integerDotProductAccumulatingSaturating16BitMixedSignednessAccelerated,integerDotProductAccumulatingSaturating32BitUnsignedAccelerated=integerDotProductAccumulatingSaturating32BitUnsignedAccelerated,integerDotProductAccumulatingSaturating32BitSignedAccelerated=integerDotProductAccumulatingSaturating32BitSignedAccelerated,integerDotProductAccumulatingSaturating32BitMixedSignednessAccelerated=integerDotProductAccumulatingSaturating32BitMixedSignednessAccelerated,integerDotProductAccumulatingSaturating64BitUnsignedAccelerated=integerDotProductAccumulatingSaturating64BitUnsignedAccelerated,integerDotProductAccumulatingSaturating64BitSignedAccelerated=integerDotProductAccumulatingSaturating64BitSignedAccelerated,integerDotProductAccumulatingSaturating64BitMixedSignednessAccelerated=integerDotProductAccumulatingSaturating64BitMixedSignednessAccelerated)
+
+def VkFormatProperties3(sType=VK_STRUCTURE_TYPE_FORMAT_PROPERTIES_3,pNext=None,linearTilingFeatures=None,optimalTilingFeatures=None,bufferFeatures=None,):
+
+    return _new('VkFormatProperties3', sType=sType,pNext=pNext,linearTilingFeatures=linearTilingFeatures,optimalTilingFeatures=optimalTilingFeatures,bufferFeatures=bufferFeatures)
+
+def VkPipelineRenderingCreateInfo(sType=VK_STRUCTURE_TYPE_PIPELINE_RENDERING_CREATE_INFO,pNext=None,viewMask=None,colorAttachmentCount=None,pColorAttachmentFormats=None,depthAttachmentFormat=None,stencilAttachmentFormat=None,):
+    if colorAttachmentCount is None and pColorAttachmentFormats is not None:
+        colorAttachmentCount = len(pColorAttachmentFormats)
+
+    return _new('VkPipelineRenderingCreateInfo', sType=sType,pNext=pNext,viewMask=viewMask,colorAttachmentCount=colorAttachmentCount,pColorAttachmentFormats=pColorAttachmentFormats,depthAttachmentFormat=depthAttachmentFormat,stencilAttachmentFormat=stencilAttachmentFormat)
+
+def VkRenderingInfo(sType=VK_STRUCTURE_TYPE_RENDERING_INFO,pNext=None,flags=None,renderArea=None,layerCount=None,viewMask=None,colorAttachmentCount=None,pColorAttachments=None,pDepthAttachment=None,pStencilAttachment=None,):
+    if colorAttachmentCount is None and pColorAttachments is not None:
+        colorAttachmentCount = len(pColorAttachments)
+
+    return _new('VkRenderingInfo', sType=sType,pNext=pNext,flags=flags,renderArea=renderArea,layerCount=layerCount,viewMask=viewMask,colorAttachmentCount=colorAttachmentCount,pColorAttachments=pColorAttachments,pDepthAttachment=pDepthAttachment,pStencilAttachment=pStencilAttachment)
+
+def VkRenderingAttachmentInfo(sType=VK_STRUCTURE_TYPE_RENDERING_ATTACHMENT_INFO,pNext=None,imageView=None,imageLayout=None,resolveMode=None,resolveImageView=None,resolveImageLayout=None,loadOp=None,storeOp=None,clearValue=None,):
+
+    return _new('VkRenderingAttachmentInfo', sType=sType,pNext=pNext,imageView=imageView,imageLayout=imageLayout,resolveMode=resolveMode,resolveImageView=resolveImageView,resolveImageLayout=resolveImageLayout,loadOp=loadOp,storeOp=storeOp,clearValue=clearValue)
+
+def VkPhysicalDeviceDynamicRenderingFeatures(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DYNAMIC_RENDERING_FEATURES,pNext=None,dynamicRendering=None,):
+
+    return _new('VkPhysicalDeviceDynamicRenderingFeatures', sType=sType,pNext=pNext,dynamicRendering=dynamicRendering)
+
+def VkCommandBufferInheritanceRenderingInfo(sType=VK_STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_RENDERING_INFO,pNext=None,flags=None,viewMask=None,colorAttachmentCount=None,pColorAttachmentFormats=None,depthAttachmentFormat=None,stencilAttachmentFormat=None,rasterizationSamples=None,):
+    if colorAttachmentCount is None and pColorAttachmentFormats is not None:
+        colorAttachmentCount = len(pColorAttachmentFormats)
+
+    return _new('VkCommandBufferInheritanceRenderingInfo', sType=sType,pNext=pNext,flags=flags,viewMask=viewMask,colorAttachmentCount=colorAttachmentCount,pColorAttachmentFormats=pColorAttachmentFormats,depthAttachmentFormat=depthAttachmentFormat,stencilAttachmentFormat=stencilAttachmentFormat,rasterizationSamples=rasterizationSamples)
+
+
+
+
+
+
+
+
+
+
+def vkGetDeviceBufferMemoryRequirements(
+device
+        ,pInfo
+        ,pMemoryRequirements=None
+        ,):
+    _args = _arg_types('vkGetDeviceBufferMemoryRequirements', lib.vkGetDeviceBufferMemoryRequirements)
+
+
+    custom_return = True
+    if not pMemoryRequirements:
+        pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
+        custom_return = False
+
+    result = lib.vkGetDeviceBufferMemoryRequirements(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),_auto_handle(pMemoryRequirements, _args[2]))
+
+    if custom_return:
+        return pMemoryRequirements
+
+    return pMemoryRequirements[0]
+
+
+
+def _wrap_vkGetDeviceBufferMemoryRequirements(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetDeviceBufferMemoryRequirements(
+    device
+            ,pInfo
+            ,pMemoryRequirements=None
+            ,):
+
+
+        custom_return = True
+        if not pMemoryRequirements:
+            pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),_auto_handle(pMemoryRequirements, _args[2]))
+
+        if custom_return:
+            return pMemoryRequirements
+
+        return pMemoryRequirements[0]
+
+
+
+    return vkGetDeviceBufferMemoryRequirements
+def vkGetDeviceImageMemoryRequirements(
+device
+        ,pInfo
+        ,pMemoryRequirements=None
+        ,):
+    _args = _arg_types('vkGetDeviceImageMemoryRequirements', lib.vkGetDeviceImageMemoryRequirements)
+
+
+    custom_return = True
+    if not pMemoryRequirements:
+        pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
+        custom_return = False
+
+    result = lib.vkGetDeviceImageMemoryRequirements(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),_auto_handle(pMemoryRequirements, _args[2]))
+
+    if custom_return:
+        return pMemoryRequirements
+
+    return pMemoryRequirements[0]
+
+
+
+def _wrap_vkGetDeviceImageMemoryRequirements(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetDeviceImageMemoryRequirements(
+    device
+            ,pInfo
+            ,pMemoryRequirements=None
+            ,):
+
+
+        custom_return = True
+        if not pMemoryRequirements:
+            pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),_auto_handle(pMemoryRequirements, _args[2]))
+
+        if custom_return:
+            return pMemoryRequirements
+
+        return pMemoryRequirements[0]
+
+
+
+    return vkGetDeviceImageMemoryRequirements
+def vkGetDeviceImageSparseMemoryRequirements(
+device
+        ,pInfo
+        ,pSparseMemoryRequirements=None
+        ,):
+    _args = _arg_types('vkGetDeviceImageSparseMemoryRequirements', lib.vkGetDeviceImageSparseMemoryRequirements)
+
+
+    pSparseMemoryRequirementCount = ffi.new('uint32_t*')
+    custom_return = pSparseMemoryRequirements is not None
+    _array = pSparseMemoryRequirements
+
+    pSparseMemoryRequirements = ffi.NULL
+    lib.vkGetDeviceImageSparseMemoryRequirements(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),pSparseMemoryRequirementCount,pSparseMemoryRequirements)
+
+    if _array is None or len(_array) < pSparseMemoryRequirementCount[0]:
+        _array = ffi.new('VkSparseImageMemoryRequirements2[]', pSparseMemoryRequirementCount[0])
+    pSparseMemoryRequirements = _array
+    lib.vkGetDeviceImageSparseMemoryRequirements(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),pSparseMemoryRequirementCount,pSparseMemoryRequirements)
+
+    if pSparseMemoryRequirementCount[0] != len(_array):
+        pSparseMemoryRequirements = _slice(_array, pSparseMemoryRequirementCount[0])
+
+    return pSparseMemoryRequirements
+
+
+def _wrap_vkGetDeviceImageSparseMemoryRequirements(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetDeviceImageSparseMemoryRequirements(
+    device
+            ,pInfo
+            ,pSparseMemoryRequirements=None
+            ,):
+
+
+        pSparseMemoryRequirementCount = ffi.new('uint32_t*')
+        custom_return = pSparseMemoryRequirements is not None
+        _array = pSparseMemoryRequirements
+
+        pSparseMemoryRequirements = ffi.NULL
+        fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),pSparseMemoryRequirementCount,pSparseMemoryRequirements)
+
+        if _array is None or len(_array) < pSparseMemoryRequirementCount[0]:
+            _array = ffi.new('VkSparseImageMemoryRequirements2[]', pSparseMemoryRequirementCount[0])
+        pSparseMemoryRequirements = _array
+        fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),pSparseMemoryRequirementCount,pSparseMemoryRequirements)
+
+        if pSparseMemoryRequirementCount[0] != len(_array):
+            pSparseMemoryRequirements = _slice(_array, pSparseMemoryRequirementCount[0])
+
+        return pSparseMemoryRequirements
+
+
+    return vkGetDeviceImageSparseMemoryRequirements
+def vkGetPhysicalDeviceToolProperties(
+physicalDevice
+        ,pToolProperties=None
+        ,):
+
+
+    pToolCount = ffi.new('uint32_t*')
+    custom_return = pToolProperties is not None
+    _array = pToolProperties
+
+    if custom_return:
+        # the buffer is usually big enough, one call instead of two
+        pToolCount[0] = len(_array)
+        result = lib.vkGetPhysicalDeviceToolProperties(_handle(physicalDevice, 'VkPhysicalDevice'),pToolCount,pToolProperties)
+    else:
+        result = VK_INCOMPLETE
+
+    # the count can change between the two calls
+    while result == VK_INCOMPLETE:
+        pToolProperties = ffi.NULL
+        result = lib.vkGetPhysicalDeviceToolProperties(_handle(physicalDevice, 'VkPhysicalDevice'),pToolCount,pToolProperties)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if _array is None or len(_array) < pToolCount[0]:
+            _array = ffi.new('VkPhysicalDeviceToolProperties[]', pToolCount[0])
+        pToolProperties = _array
+        result = lib.vkGetPhysicalDeviceToolProperties(_handle(physicalDevice, 'VkPhysicalDevice'),pToolCount,pToolProperties)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if pToolCount[0] != len(_array):
+        pToolProperties = _slice(_array, pToolCount[0])
+
+    if not custom_return:
+        # the generator keeps the array alive
+        return (StrWrap(x) for x in pToolProperties)
+    return pToolProperties
+
+
+def _wrap_vkGetPhysicalDeviceToolProperties(fn):
+    def vkGetPhysicalDeviceToolProperties(
+    physicalDevice
+            ,pToolProperties=None
+            ,):
+
+
+        pToolCount = ffi.new('uint32_t*')
+        custom_return = pToolProperties is not None
+        _array = pToolProperties
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pToolCount[0] = len(_array)
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pToolCount,pToolProperties)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pToolProperties = ffi.NULL
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pToolCount,pToolProperties)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pToolCount[0]:
+                _array = ffi.new('VkPhysicalDeviceToolProperties[]', pToolCount[0])
+            pToolProperties = _array
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pToolCount,pToolProperties)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pToolCount[0] != len(_array):
+            pToolProperties = _slice(_array, pToolCount[0])
+
+        if not custom_return:
+            # the generator keeps the array alive
+            return (StrWrap(x) for x in pToolProperties)
+        return pToolProperties
+
+
+    return vkGetPhysicalDeviceToolProperties
+def vkCmdSetCullMode(
+commandBuffer
+        ,cullMode
+        ,):
+
+    result = lib.vkCmdSetCullMode(_handle(commandBuffer, 'VkCommandBuffer'),cullMode)
+
+
+def _wrap_vkCmdSetCullMode(fn):
+    def vkCmdSetCullMode(
+    commandBuffer
+            ,cullMode
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),cullMode)
+
+
+    return vkCmdSetCullMode
+def vkCmdSetFrontFace(
+commandBuffer
+        ,frontFace
+        ,):
+
+    result = lib.vkCmdSetFrontFace(_handle(commandBuffer, 'VkCommandBuffer'),frontFace)
+
+
+def _wrap_vkCmdSetFrontFace(fn):
+    def vkCmdSetFrontFace(
+    commandBuffer
+            ,frontFace
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),frontFace)
+
+
+    return vkCmdSetFrontFace
+def vkCmdSetPrimitiveTopology(
+commandBuffer
+        ,primitiveTopology
+        ,):
+
+    result = lib.vkCmdSetPrimitiveTopology(_handle(commandBuffer, 'VkCommandBuffer'),primitiveTopology)
+
+
+def _wrap_vkCmdSetPrimitiveTopology(fn):
+    def vkCmdSetPrimitiveTopology(
+    commandBuffer
+            ,primitiveTopology
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),primitiveTopology)
+
+
+    return vkCmdSetPrimitiveTopology
+def vkCmdSetViewportWithCount(
+commandBuffer
+        ,viewportCount
+        ,pViewports
+        ,):
+    _args = _arg_types('vkCmdSetViewportWithCount', lib.vkCmdSetViewportWithCount)
+
+    result = lib.vkCmdSetViewportWithCount(_handle(commandBuffer, 'VkCommandBuffer'),viewportCount,_auto_handle(pViewports, _args[2]))
+
+
+def _wrap_vkCmdSetViewportWithCount(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetViewportWithCount(
+    commandBuffer
+            ,viewportCount
+            ,pViewports
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),viewportCount,_auto_handle(pViewports, _args[2]))
+
+
+    return vkCmdSetViewportWithCount
+def vkCmdSetScissorWithCount(
+commandBuffer
+        ,scissorCount
+        ,pScissors
+        ,):
+    _args = _arg_types('vkCmdSetScissorWithCount', lib.vkCmdSetScissorWithCount)
+
+    result = lib.vkCmdSetScissorWithCount(_handle(commandBuffer, 'VkCommandBuffer'),scissorCount,_auto_handle(pScissors, _args[2]))
+
+
+def _wrap_vkCmdSetScissorWithCount(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetScissorWithCount(
+    commandBuffer
+            ,scissorCount
+            ,pScissors
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),scissorCount,_auto_handle(pScissors, _args[2]))
+
+
+    return vkCmdSetScissorWithCount
+def vkCmdBindVertexBuffers2(
+commandBuffer
+        ,firstBinding
+        ,bindingCount
+        ,pBuffers
+        ,pOffsets
+        ,pSizes
+        ,pStrides
+        ,):
+    _args = _arg_types('vkCmdBindVertexBuffers2', lib.vkCmdBindVertexBuffers2)
+
+    result = lib.vkCmdBindVertexBuffers2(_handle(commandBuffer, 'VkCommandBuffer'),firstBinding,bindingCount,_auto_handle(pBuffers, _args[3]),_auto_handle(pOffsets, _args[4]),_auto_handle(pSizes, _args[5]),_auto_handle(pStrides, _args[6]))
+
+
+def _wrap_vkCmdBindVertexBuffers2(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdBindVertexBuffers2(
+    commandBuffer
+            ,firstBinding
+            ,bindingCount
+            ,pBuffers
+            ,pOffsets
+            ,pSizes
+            ,pStrides
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),firstBinding,bindingCount,_auto_handle(pBuffers, _args[3]),_auto_handle(pOffsets, _args[4]),_auto_handle(pSizes, _args[5]),_auto_handle(pStrides, _args[6]))
+
+
+    return vkCmdBindVertexBuffers2
+def vkCmdSetDepthTestEnable(
+commandBuffer
+        ,depthTestEnable
+        ,):
+
+    result = lib.vkCmdSetDepthTestEnable(_handle(commandBuffer, 'VkCommandBuffer'),depthTestEnable)
+
+
+def _wrap_vkCmdSetDepthTestEnable(fn):
+    def vkCmdSetDepthTestEnable(
+    commandBuffer
+            ,depthTestEnable
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),depthTestEnable)
+
+
+    return vkCmdSetDepthTestEnable
+def vkCmdSetDepthWriteEnable(
+commandBuffer
+        ,depthWriteEnable
+        ,):
+
+    result = lib.vkCmdSetDepthWriteEnable(_handle(commandBuffer, 'VkCommandBuffer'),depthWriteEnable)
+
+
+def _wrap_vkCmdSetDepthWriteEnable(fn):
+    def vkCmdSetDepthWriteEnable(
+    commandBuffer
+            ,depthWriteEnable
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),depthWriteEnable)
+
+
+    return vkCmdSetDepthWriteEnable
+def vkCmdSetDepthCompareOp(
+commandBuffer
+        ,depthCompareOp
+        ,):
+
+    result = lib.vkCmdSetDepthCompareOp(_handle(commandBuffer, 'VkCommandBuffer'),depthCompareOp)
+
+
+def _wrap_vkCmdSetDepthCompareOp(fn):
+    def vkCmdSetDepthCompareOp(
+    commandBuffer
+            ,depthCompareOp
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),depthCompareOp)
+
+
+    return vkCmdSetDepthCompareOp
+def vkCmdSetDepthBoundsTestEnable(
+commandBuffer
+        ,depthBoundsTestEnable
+        ,):
+
+    result = lib.vkCmdSetDepthBoundsTestEnable(_handle(commandBuffer, 'VkCommandBuffer'),depthBoundsTestEnable)
+
+
+def _wrap_vkCmdSetDepthBoundsTestEnable(fn):
+    def vkCmdSetDepthBoundsTestEnable(
+    commandBuffer
+            ,depthBoundsTestEnable
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),depthBoundsTestEnable)
+
+
+    return vkCmdSetDepthBoundsTestEnable
+def vkCmdSetStencilTestEnable(
+commandBuffer
+        ,stencilTestEnable
+        ,):
+
+    result = lib.vkCmdSetStencilTestEnable(_handle(commandBuffer, 'VkCommandBuffer'),stencilTestEnable)
+
+
+def _wrap_vkCmdSetStencilTestEnable(fn):
+    def vkCmdSetStencilTestEnable(
+    commandBuffer
+            ,stencilTestEnable
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),stencilTestEnable)
+
+
+    return vkCmdSetStencilTestEnable
+def vkCmdSetStencilOp(
+commandBuffer
+        ,faceMask
+        ,failOp
+        ,passOp
+        ,depthFailOp
+        ,compareOp
+        ,):
+
+    result = lib.vkCmdSetStencilOp(_handle(commandBuffer, 'VkCommandBuffer'),faceMask,failOp,passOp,depthFailOp,compareOp)
+
+
+def _wrap_vkCmdSetStencilOp(fn):
+    def vkCmdSetStencilOp(
+    commandBuffer
+            ,faceMask
+            ,failOp
+            ,passOp
+            ,depthFailOp
+            ,compareOp
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),faceMask,failOp,passOp,depthFailOp,compareOp)
+
+
+    return vkCmdSetStencilOp
+def vkCmdSetRasterizerDiscardEnable(
+commandBuffer
+        ,rasterizerDiscardEnable
+        ,):
+
+    result = lib.vkCmdSetRasterizerDiscardEnable(_handle(commandBuffer, 'VkCommandBuffer'),rasterizerDiscardEnable)
+
+
+def _wrap_vkCmdSetRasterizerDiscardEnable(fn):
+    def vkCmdSetRasterizerDiscardEnable(
+    commandBuffer
+            ,rasterizerDiscardEnable
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),rasterizerDiscardEnable)
+
+
+    return vkCmdSetRasterizerDiscardEnable
+def vkCmdSetDepthBiasEnable(
+commandBuffer
+        ,depthBiasEnable
+        ,):
+
+    result = lib.vkCmdSetDepthBiasEnable(_handle(commandBuffer, 'VkCommandBuffer'),depthBiasEnable)
+
+
+def _wrap_vkCmdSetDepthBiasEnable(fn):
+    def vkCmdSetDepthBiasEnable(
+    commandBuffer
+            ,depthBiasEnable
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),depthBiasEnable)
+
+
+    return vkCmdSetDepthBiasEnable
+def vkCmdSetPrimitiveRestartEnable(
+commandBuffer
+        ,primitiveRestartEnable
+        ,):
+
+    result = lib.vkCmdSetPrimitiveRestartEnable(_handle(commandBuffer, 'VkCommandBuffer'),primitiveRestartEnable)
+
+
+def _wrap_vkCmdSetPrimitiveRestartEnable(fn):
+    def vkCmdSetPrimitiveRestartEnable(
+    commandBuffer
+            ,primitiveRestartEnable
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),primitiveRestartEnable)
+
+
+    return vkCmdSetPrimitiveRestartEnable
+def vkCreatePrivateDataSlot(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pPrivateDataSlot=None
+        ,):
+    _args = _arg_types('vkCreatePrivateDataSlot', lib.vkCreatePrivateDataSlot)
+
+
+    custom_return = True
+    if not pPrivateDataSlot:
+        pPrivateDataSlot = ffi.new('VkPrivateDataSlot*')
+        custom_return = False
+
+    result = lib.vkCreatePrivateDataSlot(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pPrivateDataSlot, _args[3]))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if custom_return:
+        return pPrivateDataSlot
+
+    return pPrivateDataSlot[0]
+
+
+
+def _wrap_vkCreatePrivateDataSlot(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreatePrivateDataSlot(
+    device
+            ,pCreateInfo
+            ,pAllocator
+            ,pPrivateDataSlot=None
+            ,):
+
+
+        custom_return = True
+        if not pPrivateDataSlot:
+            pPrivateDataSlot = ffi.new('VkPrivateDataSlot*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pPrivateDataSlot, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pPrivateDataSlot
+
+        return pPrivateDataSlot[0]
+
+
+
+    return vkCreatePrivateDataSlot
+def vkDestroyPrivateDataSlot(
+device
+        ,privateDataSlot
+        ,pAllocator
+        ,):
+    _args = _arg_types('vkDestroyPrivateDataSlot', lib.vkDestroyPrivateDataSlot)
+
+    result = lib.vkDestroyPrivateDataSlot(_handle(device, 'VkDevice'),_handle(privateDataSlot, 'VkPrivateDataSlot'),_auto_handle(pAllocator, _args[2]))
+
+
+def _wrap_vkDestroyPrivateDataSlot(fn):
+    _args = ffi.typeof(fn).args
+    def vkDestroyPrivateDataSlot(
+    device
+            ,privateDataSlot
+            ,pAllocator
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(privateDataSlot, 'VkPrivateDataSlot'),_auto_handle(pAllocator, _args[2]))
+
+
+    return vkDestroyPrivateDataSlot
+def vkSetPrivateData(
+device
+        ,objectType
+        ,objectHandle
+        ,privateDataSlot
+        ,data
+        ,):
+
+    result = lib.vkSetPrivateData(_handle(device, 'VkDevice'),objectType,objectHandle,_handle(privateDataSlot, 'VkPrivateDataSlot'),data)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def _wrap_vkSetPrivateData(fn):
+    def vkSetPrivateData(
+    device
+            ,objectType
+            ,objectHandle
+            ,privateDataSlot
+            ,data
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),objectType,objectHandle,_handle(privateDataSlot, 'VkPrivateDataSlot'),data)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkSetPrivateData
+def vkGetPrivateData(
+device
+        ,objectType
+        ,objectHandle
+        ,privateDataSlot
+        ,pData=None
+        ,):
+    _args = _arg_types('vkGetPrivateData', lib.vkGetPrivateData)
+
+
+    custom_return = True
+    if not pData:
+        pData = ffi.new('uint64_t*')
+        custom_return = False
+
+    result = lib.vkGetPrivateData(_handle(device, 'VkDevice'),objectType,objectHandle,_handle(privateDataSlot, 'VkPrivateDataSlot'),_auto_handle(pData, _args[4]))
+
+    if custom_return:
+        return pData
+
+    return pData[0]
+
+
+
+def _wrap_vkGetPrivateData(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPrivateData(
+    device
+            ,objectType
+            ,objectHandle
+            ,privateDataSlot
+            ,pData=None
+            ,):
+
+
+        custom_return = True
+        if not pData:
+            pData = ffi.new('uint64_t*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),objectType,objectHandle,_handle(privateDataSlot, 'VkPrivateDataSlot'),_auto_handle(pData, _args[4]))
+
+        if custom_return:
+            return pData
+
+        return pData[0]
+
+
+
+    return vkGetPrivateData
+def vkCmdCopyBuffer2(
+commandBuffer
+        ,pCopyBufferInfo
+        ,):
+    _args = _arg_types('vkCmdCopyBuffer2', lib.vkCmdCopyBuffer2)
+
+    result = lib.vkCmdCopyBuffer2(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pCopyBufferInfo, _args[1]))
+
+
+def _wrap_vkCmdCopyBuffer2(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdCopyBuffer2(
+    commandBuffer
+            ,pCopyBufferInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pCopyBufferInfo, _args[1]))
+
+
+    return vkCmdCopyBuffer2
+def vkCmdCopyImage2(
+commandBuffer
+        ,pCopyImageInfo
+        ,):
+    _args = _arg_types('vkCmdCopyImage2', lib.vkCmdCopyImage2)
+
+    result = lib.vkCmdCopyImage2(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pCopyImageInfo, _args[1]))
+
+
+def _wrap_vkCmdCopyImage2(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdCopyImage2(
+    commandBuffer
+            ,pCopyImageInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pCopyImageInfo, _args[1]))
+
+
+    return vkCmdCopyImage2
+def vkCmdBlitImage2(
+commandBuffer
+        ,pBlitImageInfo
+        ,):
+    _args = _arg_types('vkCmdBlitImage2', lib.vkCmdBlitImage2)
+
+    result = lib.vkCmdBlitImage2(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pBlitImageInfo, _args[1]))
+
+
+def _wrap_vkCmdBlitImage2(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdBlitImage2(
+    commandBuffer
+            ,pBlitImageInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pBlitImageInfo, _args[1]))
+
+
+    return vkCmdBlitImage2
+def vkCmdCopyBufferToImage2(
+commandBuffer
+        ,pCopyBufferToImageInfo
+        ,):
+    _args = _arg_types('vkCmdCopyBufferToImage2', lib.vkCmdCopyBufferToImage2)
+
+    result = lib.vkCmdCopyBufferToImage2(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pCopyBufferToImageInfo, _args[1]))
+
+
+def _wrap_vkCmdCopyBufferToImage2(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdCopyBufferToImage2(
+    commandBuffer
+            ,pCopyBufferToImageInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pCopyBufferToImageInfo, _args[1]))
+
+
+    return vkCmdCopyBufferToImage2
+def vkCmdCopyImageToBuffer2(
+commandBuffer
+        ,pCopyImageToBufferInfo
+        ,):
+    _args = _arg_types('vkCmdCopyImageToBuffer2', lib.vkCmdCopyImageToBuffer2)
+
+    result = lib.vkCmdCopyImageToBuffer2(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pCopyImageToBufferInfo, _args[1]))
+
+
+def _wrap_vkCmdCopyImageToBuffer2(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdCopyImageToBuffer2(
+    commandBuffer
+            ,pCopyImageToBufferInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pCopyImageToBufferInfo, _args[1]))
+
+
+    return vkCmdCopyImageToBuffer2
+def vkCmdResolveImage2(
+commandBuffer
+        ,pResolveImageInfo
+        ,):
+    _args = _arg_types('vkCmdResolveImage2', lib.vkCmdResolveImage2)
+
+    result = lib.vkCmdResolveImage2(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pResolveImageInfo, _args[1]))
+
+
+def _wrap_vkCmdResolveImage2(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdResolveImage2(
+    commandBuffer
+            ,pResolveImageInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pResolveImageInfo, _args[1]))
+
+
+    return vkCmdResolveImage2
+def vkCmdSetEvent2(
+commandBuffer
+        ,event
+        ,pDependencyInfo
+        ,):
+    _args = _arg_types('vkCmdSetEvent2', lib.vkCmdSetEvent2)
+
+    result = lib.vkCmdSetEvent2(_handle(commandBuffer, 'VkCommandBuffer'),_handle(event, 'VkEvent'),_auto_handle(pDependencyInfo, _args[2]))
+
+
+def _wrap_vkCmdSetEvent2(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetEvent2(
+    commandBuffer
+            ,event
+            ,pDependencyInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_handle(event, 'VkEvent'),_auto_handle(pDependencyInfo, _args[2]))
+
+
+    return vkCmdSetEvent2
+def vkCmdResetEvent2(
+commandBuffer
+        ,event
+        ,stageMask
+        ,):
+
+    result = lib.vkCmdResetEvent2(_handle(commandBuffer, 'VkCommandBuffer'),_handle(event, 'VkEvent'),stageMask)
+
+
+def _wrap_vkCmdResetEvent2(fn):
+    def vkCmdResetEvent2(
+    commandBuffer
+            ,event
+            ,stageMask
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_handle(event, 'VkEvent'),stageMask)
+
+
+    return vkCmdResetEvent2
+def vkCmdWaitEvents2(
+commandBuffer
+        ,eventCount
+        ,pEvents
+        ,pDependencyInfos
+        ,):
+    _args = _arg_types('vkCmdWaitEvents2', lib.vkCmdWaitEvents2)
+
+    result = lib.vkCmdWaitEvents2(_handle(commandBuffer, 'VkCommandBuffer'),eventCount,_auto_handle(pEvents, _args[2]),_auto_handle(pDependencyInfos, _args[3]))
+
+
+def _wrap_vkCmdWaitEvents2(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdWaitEvents2(
+    commandBuffer
+            ,eventCount
+            ,pEvents
+            ,pDependencyInfos
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),eventCount,_auto_handle(pEvents, _args[2]),_auto_handle(pDependencyInfos, _args[3]))
+
+
+    return vkCmdWaitEvents2
+def vkCmdPipelineBarrier2(
+commandBuffer
+        ,pDependencyInfo
+        ,):
+    _args = _arg_types('vkCmdPipelineBarrier2', lib.vkCmdPipelineBarrier2)
+
+    result = lib.vkCmdPipelineBarrier2(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pDependencyInfo, _args[1]))
+
+
+def _wrap_vkCmdPipelineBarrier2(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdPipelineBarrier2(
+    commandBuffer
+            ,pDependencyInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pDependencyInfo, _args[1]))
+
+
+    return vkCmdPipelineBarrier2
+def vkQueueSubmit2(
+queue
+        ,submitCount
+        ,pSubmits
+        ,fence
+        ,):
+    _args = _arg_types('vkQueueSubmit2', lib.vkQueueSubmit2)
+
+    result = lib.vkQueueSubmit2(_handle(queue, 'VkQueue'),submitCount,_auto_handle(pSubmits, _args[2]),_handle(fence, 'VkFence'))
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+
+def _wrap_vkQueueSubmit2(fn):
+    _args = ffi.typeof(fn).args
+    def vkQueueSubmit2(
+    queue
+            ,submitCount
+            ,pSubmits
+            ,fence
+            ,):
+
+        result = fn(_handle(queue, 'VkQueue'),submitCount,_auto_handle(pSubmits, _args[2]),_handle(fence, 'VkFence'))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkQueueSubmit2
+def vkCmdWriteTimestamp2(
+commandBuffer
+        ,stage
+        ,queryPool
+        ,query
+        ,):
+
+    result = lib.vkCmdWriteTimestamp2(_handle(commandBuffer, 'VkCommandBuffer'),stage,_handle(queryPool, 'VkQueryPool'),query)
+
+
+def _wrap_vkCmdWriteTimestamp2(fn):
+    def vkCmdWriteTimestamp2(
+    commandBuffer
+            ,stage
+            ,queryPool
+            ,query
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),stage,_handle(queryPool, 'VkQueryPool'),query)
+
+
+    return vkCmdWriteTimestamp2
+def vkCmdBeginRendering(
+commandBuffer
+        ,pRenderingInfo
+        ,):
+    _args = _arg_types('vkCmdBeginRendering', lib.vkCmdBeginRendering)
+
+    result = lib.vkCmdBeginRendering(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pRenderingInfo, _args[1]))
+
+
+def _wrap_vkCmdBeginRendering(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdBeginRendering(
+    commandBuffer
+            ,pRenderingInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pRenderingInfo, _args[1]))
+
+
+    return vkCmdBeginRendering
+def vkCmdEndRendering(
+commandBuffer
+        ,):
+
+    result = lib.vkCmdEndRendering(_handle(commandBuffer, 'VkCommandBuffer'))
+
+
+def _wrap_vkCmdEndRendering(fn):
+    def vkCmdEndRendering(
+    commandBuffer
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'))
+
+
+    return vkCmdEndRendering
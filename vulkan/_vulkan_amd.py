@@ -0,0 +1,115 @@
+from vulkan._vulkan import *  # noqa
+from vulkan._vulkan import (ffi, lib, _new, _auto_handle, _handle,
+                            _arg_types, _slice)
+
+
+def VkPipelineRasterizationStateRasterizationOrderAMD(sType=VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_STATE_RASTERIZATION_ORDER_AMD,pNext=None,rasterizationOrder=None,):
+
+    return _new('VkPipelineRasterizationStateRasterizationOrderAMD', sType=sType,pNext=pNext,rasterizationOrder=rasterizationOrder)
+
+def VkDisplayNativeHdrSurfaceCapabilitiesAMD(sType=VK_STRUCTURE_TYPE_DISPLAY_NATIVE_HDR_SURFACE_CAPABILITIES_AMD,pNext=None,localDimmingSupport=None,):
+
+    return _new('VkDisplayNativeHdrSurfaceCapabilitiesAMD', sType=sType,pNext=pNext,localDimmingSupport=localDimmingSupport)
+
+def VkSwapchainDisplayNativeHdrCreateInfoAMD(sType=VK_STRUCTURE_TYPE_SWAPCHAIN_DISPLAY_NATIVE_HDR_CREATE_INFO_AMD,pNext=None,localDimmingEnable=None,):
+
+    return _new('VkSwapchainDisplayNativeHdrCreateInfoAMD', sType=sType,pNext=pNext,localDimmingEnable=localDimmingEnable)
+
+def VkTextureLODGatherFormatPropertiesAMD(sType=VK_STRUCTURE_TYPE_TEXTURE_LOD_GATHER_FORMAT_PROPERTIES_AMD,pNext=None,supportsTextureGatherLODBiasAMD=None,):
+
+    return _new('VkTextureLODGatherFormatPropertiesAMD', sType=sType,pNext=pNext,supportsTextureGatherLODBiasAMD=supportsTextureGatherLODBiasAMD)
+
+def VkShaderResourceUsageAMD(numUsedVgprs=None,numUsedSgprs=None,ldsSizePerLocalWorkGroup=None,ldsUsageSizeInBytes=None,scratchMemUsageInBytes=None,):
+
+    return _new('VkShaderResourceUsageAMD', numUsedVgprs=numUsedVgprs,numUsedSgprs=numUsedSgprs,ldsSizePerLocalWorkGroup=ldsSizePerLocalWorkGroup,ldsUsageSizeInBytes=ldsUsageSizeInBytes,scratchMemUsageInBytes=scratchMemUsageInBytes)
+
+def VkShaderStatisticsInfoAMD(shaderStageMask=None,resourceUsage=None,numPhysicalVgprs=None,numPhysicalSgprs=None,numAvailableVgprs=None,numAvailableSgprs=None,computeWorkGroupSize=None,):
+
+    return _new('VkShaderStatisticsInfoAMD', shaderStageMask=shaderStageMask,resourceUsage=resourceUsage,numPhysicalVgprs=numPhysicalVgprs,numPhysicalSgprs=numPhysicalSgprs,numAvailableVgprs=numAvailableVgprs,numAvailableSgprs=numAvailableSgprs,computeWorkGroupSize=computeWorkGroupSize)
+
+def VkPhysicalDeviceShaderCorePropertiesAMD(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_CORE_PROPERTIES_AMD,pNext=None,shaderEngineCount=None,shaderArraysPerEngineCount=None,computeUnitsPerShaderArray=None,simdPerComputeUnit=None,wavefrontsPerSimd=None,wavefrontSize=None,sgprsPerSimd=None,minSgprAllocation=None,maxSgprAllocation=None,sgprAllocationGranularity=None,vgprsPerSimd=None,minVgprAllocation=None,maxVgprAllocation=None,vgprAllocationGranularity=None,):
+
+    return _new('VkPhysicalDeviceShaderCorePropertiesAMD', sType=sType,pNext=pNext,shaderEngineCount=shaderEngineCount,shaderArraysPerEngineCount=shaderArraysPerEngineCount,computeUnitsPerShaderArray=computeUnitsPerShaderArray,simdPerComputeUnit=simdPerComputeUnit,wavefrontsPerSimd=wavefrontsPerSimd,wavefrontSize=wavefrontSize,sgprsPerSimd=sgprsPerSimd,minSgprAllocation=minSgprAllocation,maxSgprAllocation=maxSgprAllocation,sgprAllocationGranularity=sgprAllocationGranularity,vgprsPerSimd=vgprsPerSimd,minVgprAllocation=minVgprAllocation,maxVgprAllocation=maxVgprAllocation,vgprAllocationGranularity=vgprAllocationGranularity)
+
+def VkPhysicalDeviceShaderCoreProperties2AMD(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_CORE_PROPERTIES_2_AMD,pNext=None,shaderCoreFeatures=None,activeComputeUnitCount=None,):
+
+    return _new('VkPhysicalDeviceShaderCoreProperties2AMD', sType=sType,pNext=pNext,shaderCoreFeatures=shaderCoreFeatures,activeComputeUnitCount=activeComputeUnitCount)
+
+def VkDeviceMemoryOverallocationCreateInfoAMD(sType=VK_STRUCTURE_TYPE_DEVICE_MEMORY_OVERALLOCATION_CREATE_INFO_AMD,pNext=None,overallocationBehavior=None,):
+
+    return _new('VkDeviceMemoryOverallocationCreateInfoAMD', sType=sType,pNext=pNext,overallocationBehavior=overallocationBehavior)
+
+def VkPipelineCompilerControlCreateInfoAMD(sType=VK_STRUCTURE_TYPE_PIPELINE_COMPILER_CONTROL_CREATE_INFO_AMD,pNext=None,compilerControlFlags=None,):
+
+    return _new('VkPipelineCompilerControlCreateInfoAMD', sType=sType,pNext=pNext,compilerControlFlags=compilerControlFlags)
+
+def VkPhysicalDeviceCoherentMemoryFeaturesAMD(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COHERENT_MEMORY_FEATURES_AMD,pNext=None,deviceCoherentMemory=None,):
+
+    return _new('VkPhysicalDeviceCoherentMemoryFeaturesAMD', sType=sType,pNext=pNext,deviceCoherentMemory=deviceCoherentMemory)
+
+def VkPhysicalDeviceShaderEarlyAndLateFragmentTestsFeaturesAMD(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_EARLY_AND_LATE_FRAGMENT_TESTS_FEATURES_AMD,pNext=None,shaderEarlyAndLateFragmentTests=None,):
+
+    return _new('VkPhysicalDeviceShaderEarlyAndLateFragmentTestsFeaturesAMD', sType=sType,pNext=pNext,shaderEarlyAndLateFragmentTests=shaderEarlyAndLateFragmentTests)
+
+
+
+
+
+
+
+
+
+
+def _wrap_vkGetShaderInfoAMD(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetShaderInfoAMD(
+    device
+            ,pipeline
+            ,shaderStage
+            ,infoType
+            ,pInfoSize
+            ,pInfo=None
+            ,):
+
+
+        custom_return = True
+        if not pInfo:
+            pInfo = ffi.new('void[%d]' % pInfoSize)
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(pipeline, 'VkPipeline'),shaderStage,infoType,_auto_handle(pInfoSize, _args[4]),_auto_handle(pInfo, _args[5]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pInfo
+
+        return pInfo
+
+
+
+    return vkGetShaderInfoAMD
+def _wrap_vkSetLocalDimmingAMD(fn):
+    def vkSetLocalDimmingAMD(
+    device
+            ,swapChain
+            ,localDimmingEnable
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(swapChain, 'VkSwapchainKHR'),localDimmingEnable)
+
+
+    return vkSetLocalDimmingAMD
+def _wrap_vkCmdWriteBufferMarkerAMD(fn):
+    def vkCmdWriteBufferMarkerAMD(
+    commandBuffer
+            ,pipelineStage
+            ,dstBuffer
+            ,dstOffset
+            ,marker
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),pipelineStage,_handle(dstBuffer, 'VkBuffer'),dstOffset,marker)
+
+
+    return vkCmdWriteBufferMarkerAMD
@@ -0,0 +1,3295 @@
+from vulkan._vulkan import *  # noqa
+from vulkan._vulkan import (ffi, lib, _new, _auto_handle, _handle,
+                            _arg_types, _slice)
+
+
+def VkMultiDrawInfoEXT(firstVertex=None,vertexCount=None,):
+
+    return _new('VkMultiDrawInfoEXT', firstVertex=firstVertex,vertexCount=vertexCount)
+
+def VkMultiDrawIndexedInfoEXT(firstIndex=None,indexCount=None,vertexOffset=None,):
+
+    return _new('VkMultiDrawIndexedInfoEXT', firstIndex=firstIndex,indexCount=indexCount,vertexOffset=vertexOffset)
+
+def VkDirectFBSurfaceCreateInfoEXT(sType=VK_STRUCTURE_TYPE_DIRECTFB_SURFACE_CREATE_INFO_EXT,pNext=None,flags=None,dfb=None,surface=None,):
+
+    return _new('VkDirectFBSurfaceCreateInfoEXT', sType=sType,pNext=pNext,flags=flags,dfb=dfb,surface=surface)
+
+def VkDebugReportCallbackCreateInfoEXT(sType=VK_STRUCTURE_TYPE_DEBUG_REPORT_CALLBACK_CREATE_INFO_EXT,pNext=None,flags=None,pfnCallback=None,pUserData=None,):
+
+    return _new('VkDebugReportCallbackCreateInfoEXT', sType=sType,pNext=pNext,flags=flags,pfnCallback=pfnCallback,pUserData=pUserData)
+
+def VkValidationFlagsEXT(sType=VK_STRUCTURE_TYPE_VALIDATION_FLAGS_EXT,pNext=None,disabledValidationCheckCount=None,pDisabledValidationChecks=None,):
+    if disabledValidationCheckCount is None and pDisabledValidationChecks is not None:
+        disabledValidationCheckCount = len(pDisabledValidationChecks)
+
+    return _new('VkValidationFlagsEXT', sType=sType,pNext=pNext,disabledValidationCheckCount=disabledValidationCheckCount,pDisabledValidationChecks=pDisabledValidationChecks)
+
+def VkValidationFeaturesEXT(sType=VK_STRUCTURE_TYPE_VALIDATION_FEATURES_EXT,pNext=None,enabledValidationFeatureCount=None,pEnabledValidationFeatures=None,disabledValidationFeatureCount=None,pDisabledValidationFeatures=None,):
+    if enabledValidationFeatureCount is None and pEnabledValidationFeatures is not None:
+        enabledValidationFeatureCount = len(pEnabledValidationFeatures)
+    if disabledValidationFeatureCount is None and pDisabledValidationFeatures is not None:
+        disabledValidationFeatureCount = len(pDisabledValidationFeatures)
+
+    return _new('VkValidationFeaturesEXT', sType=sType,pNext=pNext,enabledValidationFeatureCount=enabledValidationFeatureCount,pEnabledValidationFeatures=pEnabledValidationFeatures,disabledValidationFeatureCount=disabledValidationFeatureCount,pDisabledValidationFeatures=pDisabledValidationFeatures)
+
+def VkLayerSettingsCreateInfoEXT(sType=VK_STRUCTURE_TYPE_LAYER_SETTINGS_CREATE_INFO_EXT,pNext=None,settingCount=None,pSettings=None,):
+    if settingCount is None and pSettings is not None:
+        settingCount = len(pSettings)
+
+    return _new('VkLayerSettingsCreateInfoEXT', sType=sType,pNext=pNext,settingCount=settingCount,pSettings=pSettings)
+
+def VkLayerSettingEXT(pLayerName=None,pSettingName=None,type=None,valueCount=None,pValues=None,):
+    if valueCount is None and pValues is not None:
+        valueCount = len(pValues)
+
+    return _new('VkLayerSettingEXT', pLayerName=pLayerName,pSettingName=pSettingName,type=type,valueCount=valueCount,pValues=pValues)
+
+def VkApplicationParametersEXT(sType=VK_STRUCTURE_TYPE_APPLICATION_PARAMETERS_EXT,pNext=None,vendorID=None,deviceID=None,key=None,value=None,):
+
+    return _new('VkApplicationParametersEXT', sType=sType,pNext=pNext,vendorID=vendorID,deviceID=deviceID,key=key,value=value)
+
+def VkDebugMarkerObjectNameInfoEXT(sType=VK_STRUCTURE_TYPE_DEBUG_MARKER_OBJECT_NAME_INFO_EXT,pNext=None,objectType=None,object=None,pObjectName=None,):
+
+    return _new('VkDebugMarkerObjectNameInfoEXT', sType=sType,pNext=pNext,objectType=objectType,object=object,pObjectName=pObjectName)
+
+def VkDebugMarkerObjectTagInfoEXT(sType=VK_STRUCTURE_TYPE_DEBUG_MARKER_OBJECT_TAG_INFO_EXT,pNext=None,objectType=None,object=None,tagName=None,tagSize=None,pTag=None,):
+    if tagSize is None and pTag is not None:
+        tagSize = len(pTag)
+
+    return _new('VkDebugMarkerObjectTagInfoEXT', sType=sType,pNext=pNext,objectType=objectType,object=object,tagName=tagName,tagSize=tagSize,pTag=pTag)
+
+def VkDebugMarkerMarkerInfoEXT(sType=VK_STRUCTURE_TYPE_DEBUG_MARKER_MARKER_INFO_EXT,pNext=None,pMarkerName=None,color=None,):
+
+    return _new('VkDebugMarkerMarkerInfoEXT', sType=sType,pNext=pNext,pMarkerName=pMarkerName,color=color)
+
+def VkPhysicalDeviceMultiDrawPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTI_DRAW_PROPERTIES_EXT,pNext=None,maxMultiDrawCount=None,):
+
+    return _new('VkPhysicalDeviceMultiDrawPropertiesEXT', sType=sType,pNext=pNext,maxMultiDrawCount=maxMultiDrawCount)
+
+def VkSurfaceCapabilities2EXT(sType=VK_STRUCTURE_TYPE_SURFACE_CAPABILITIES_2_EXT,pNext=None,minImageCount=None,maxImageCount=None,currentExtent=None,minImageExtent=None,maxImageExtent=None,maxImageArrayLayers=None,supportedTransforms=None,currentTransform=None,supportedCompositeAlpha=None,supportedUsageFlags=None,supportedSurfaceCounters=None,):
+
+    return _new('VkSurfaceCapabilities2EXT', sType=sType,pNext=pNext,minImageCount=minImageCount,maxImageCount=maxImageCount,currentExtent=currentExtent,minImageExtent=minImageExtent,maxImageExtent=maxImageExtent,maxImageArrayLayers=maxImageArrayLayers,supportedTransforms=supportedTransforms,currentTransform=currentTransform,supportedCompositeAlpha=supportedCompositeAlpha,supportedUsageFlags=supportedUsageFlags,supportedSurfaceCounters=supportedSurfaceCounters)
+
+def VkDisplayPowerInfoEXT(sType=VK_STRUCTURE_TYPE_DISPLAY_POWER_INFO_EXT,pNext=None,powerState=None,):
+
+    return _new('VkDisplayPowerInfoEXT', sType=sType,pNext=pNext,powerState=powerState)
+
+def VkDeviceEventInfoEXT(sType=VK_STRUCTURE_TYPE_DEVICE_EVENT_INFO_EXT,pNext=None,deviceEvent=None,):
+
+    return _new('VkDeviceEventInfoEXT', sType=sType,pNext=pNext,deviceEvent=deviceEvent)
+
+def VkDisplayEventInfoEXT(sType=VK_STRUCTURE_TYPE_DISPLAY_EVENT_INFO_EXT,pNext=None,displayEvent=None,):
+
+    return _new('VkDisplayEventInfoEXT', sType=sType,pNext=pNext,displayEvent=displayEvent)
+
+def VkSwapchainCounterCreateInfoEXT(sType=VK_STRUCTURE_TYPE_SWAPCHAIN_COUNTER_CREATE_INFO_EXT,pNext=None,surfaceCounters=None,):
+
+    return _new('VkSwapchainCounterCreateInfoEXT', sType=sType,pNext=pNext,surfaceCounters=surfaceCounters)
+
+def VkXYColorEXT(x=None,y=None,):
+
+    return _new('VkXYColorEXT', x=x,y=y)
+
+def VkHdrMetadataEXT(sType=VK_STRUCTURE_TYPE_HDR_METADATA_EXT,pNext=None,displayPrimaryRed=None,displayPrimaryGreen=None,displayPrimaryBlue=None,whitePoint=None,maxLuminance=None,minLuminance=None,maxContentLightLevel=None,maxFrameAverageLightLevel=None,):
+
+    return _new('VkHdrMetadataEXT', sType=sType,pNext=pNext,displayPrimaryRed=displayPrimaryRed,displayPrimaryGreen=displayPrimaryGreen,displayPrimaryBlue=displayPrimaryBlue,whitePoint=whitePoint,maxLuminance=maxLuminance,minLuminance=minLuminance,maxContentLightLevel=maxContentLightLevel,maxFrameAverageLightLevel=maxFrameAverageLightLevel)
+
+def VkMetalSurfaceCreateInfoEXT(sType=VK_STRUCTURE_TYPE_METAL_SURFACE_CREATE_INFO_EXT,pNext=None,flags=None,pLayer=None,):
+
+    return _new('VkMetalSurfaceCreateInfoEXT', sType=sType,pNext=pNext,flags=flags,pLayer=pLayer)
+
+def VkPhysicalDeviceDiscardRectanglePropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DISCARD_RECTANGLE_PROPERTIES_EXT,pNext=None,maxDiscardRectangles=None,):
+
+    return _new('VkPhysicalDeviceDiscardRectanglePropertiesEXT', sType=sType,pNext=pNext,maxDiscardRectangles=maxDiscardRectangles)
+
+def VkPipelineDiscardRectangleStateCreateInfoEXT(sType=VK_STRUCTURE_TYPE_PIPELINE_DISCARD_RECTANGLE_STATE_CREATE_INFO_EXT,pNext=None,flags=None,discardRectangleMode=None,discardRectangleCount=None,pDiscardRectangles=None,):
+    if discardRectangleCount is None and pDiscardRectangles is not None:
+        discardRectangleCount = len(pDiscardRectangles)
+
+    return _new('VkPipelineDiscardRectangleStateCreateInfoEXT', sType=sType,pNext=pNext,flags=flags,discardRectangleMode=discardRectangleMode,discardRectangleCount=discardRectangleCount,pDiscardRectangles=pDiscardRectangles)
+
+def VkImageViewSlicedCreateInfoEXT(sType=VK_STRUCTURE_TYPE_IMAGE_VIEW_SLICED_CREATE_INFO_EXT,pNext=None,sliceOffset=None,sliceCount=None,):
+
+    return _new('VkImageViewSlicedCreateInfoEXT', sType=sType,pNext=pNext,sliceOffset=sliceOffset,sliceCount=sliceCount)
+
+def VkConditionalRenderingBeginInfoEXT(sType=VK_STRUCTURE_TYPE_CONDITIONAL_RENDERING_BEGIN_INFO_EXT,pNext=None,buffer=None,offset=None,flags=None,):
+
+    return _new('VkConditionalRenderingBeginInfoEXT', sType=sType,pNext=pNext,buffer=buffer,offset=offset,flags=flags)
+
+def VkSampleLocationEXT(x=None,y=None,):
+
+    return _new('VkSampleLocationEXT', x=x,y=y)
+
+def VkSampleLocationsInfoEXT(sType=VK_STRUCTURE_TYPE_SAMPLE_LOCATIONS_INFO_EXT,pNext=None,sampleLocationsPerPixel=None,sampleLocationGridSize=None,sampleLocationsCount=None,pSampleLocations=None,):
+    if sampleLocationsCount is None and pSampleLocations is not None:
+        sampleLocationsCount = len(pSampleLocations)
+
+    return _new('VkSampleLocationsInfoEXT', sType=sType,pNext=pNext,sampleLocationsPerPixel=sampleLocationsPerPixel,sampleLocationGridSize=sampleLocationGridSize,sampleLocationsCount=sampleLocationsCount,pSampleLocations=pSampleLocations)
+
+def VkAttachmentSampleLocationsEXT(attachmentIndex=None,sampleLocationsInfo=None,):
+
+    return _new('VkAttachmentSampleLocationsEXT', attachmentIndex=attachmentIndex,sampleLocationsInfo=sampleLocationsInfo)
+
+def VkSubpassSampleLocationsEXT(subpassIndex=None,sampleLocationsInfo=None,):
+
+    return _new('VkSubpassSampleLocationsEXT', subpassIndex=subpassIndex,sampleLocationsInfo=sampleLocationsInfo)
+
+def VkRenderPassSampleLocationsBeginInfoEXT(sType=VK_STRUCTURE_TYPE_RENDER_PASS_SAMPLE_LOCATIONS_BEGIN_INFO_EXT,pNext=None,attachmentInitialSampleLocationsCount=None,pAttachmentInitialSampleLocations=None,postSubpassSampleLocationsCount=None,pPostSubpassSampleLocations=None,):
+    if attachmentInitialSampleLocationsCount is None and pAttachmentInitialSampleLocations is not None:
+        attachmentInitialSampleLocationsCount = len(pAttachmentInitialSampleLocations)
+    if postSubpassSampleLocationsCount is None and pPostSubpassSampleLocations is not None:
+        postSubpassSampleLocationsCount = len(pPostSubpassSampleLocations)
+
+    return _new('VkRenderPassSampleLocationsBeginInfoEXT', sType=sType,pNext=pNext,attachmentInitialSampleLocationsCount=attachmentInitialSampleLocationsCount,pAttachmentInitialSampleLocations=pAttachmentInitialSampleLocations,postSubpassSampleLocationsCount=postSubpassSampleLocationsCount,pPostSubpassSampleLocations=pPostSubpassSampleLocations)
+
+def VkPipelineSampleLocationsStateCreateInfoEXT(sType=VK_STRUCTURE_TYPE_PIPELINE_SAMPLE_LOCATIONS_STATE_CREATE_INFO_EXT,pNext=None,sampleLocationsEnable=None,sampleLocationsInfo=None,):
+
+    return _new('VkPipelineSampleLocationsStateCreateInfoEXT', sType=sType,pNext=pNext,sampleLocationsEnable=sampleLocationsEnable,sampleLocationsInfo=sampleLocationsInfo)
+
+def VkPhysicalDeviceSampleLocationsPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SAMPLE_LOCATIONS_PROPERTIES_EXT,pNext=None,sampleLocationSampleCounts=None,maxSampleLocationGridSize=None,sampleLocationCoordinateRange=None,sampleLocationSubPixelBits=None,variableSampleLocations=None,):
+
+    return _new('VkPhysicalDeviceSampleLocationsPropertiesEXT', sType=sType,pNext=pNext,sampleLocationSampleCounts=sampleLocationSampleCounts,maxSampleLocationGridSize=maxSampleLocationGridSize,sampleLocationCoordinateRange=sampleLocationCoordinateRange,sampleLocationSubPixelBits=sampleLocationSubPixelBits,variableSampleLocations=variableSampleLocations)
+
+def VkMultisamplePropertiesEXT(sType=VK_STRUCTURE_TYPE_MULTISAMPLE_PROPERTIES_EXT,pNext=None,maxSampleLocationGridSize=None,):
+
+    return _new('VkMultisamplePropertiesEXT', sType=sType,pNext=pNext,maxSampleLocationGridSize=maxSampleLocationGridSize)
+
+def VkPhysicalDeviceBlendOperationAdvancedFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_BLEND_OPERATION_ADVANCED_FEATURES_EXT,pNext=None,advancedBlendCoherentOperations=None,):
+
+    return _new('VkPhysicalDeviceBlendOperationAdvancedFeaturesEXT', sType=sType,pNext=pNext,advancedBlendCoherentOperations=advancedBlendCoherentOperations)
+
+def VkPhysicalDeviceMultiDrawFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTI_DRAW_FEATURES_EXT,pNext=None,multiDraw=None,):
+
+    return _new('VkPhysicalDeviceMultiDrawFeaturesEXT', sType=sType,pNext=pNext,multiDraw=multiDraw)
+
+def VkPhysicalDeviceBlendOperationAdvancedPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_BLEND_OPERATION_ADVANCED_PROPERTIES_EXT,pNext=None,advancedBlendMaxColorAttachments=None,advancedBlendIndependentBlend=None,advancedBlendNonPremultipliedSrcColor=None,advancedBlendNonPremultipliedDstColor=None,advancedBlendCorrelatedOverlap=None,advancedBlendAllOperations=None,):
+
+    return _new('VkPhysicalDeviceBlendOperationAdvancedPropertiesEXT', sType=sType,pNext=pNext,advancedBlendMaxColorAttachments=advancedBlendMaxColorAttachments,advancedBlendIndependentBlend=advancedBlendIndependentBlend,advancedBlendNonPremultipliedSrcColor=advancedBlendNonPremultipliedSrcColor,advancedBlendNonPremultipliedDstColor=advancedBlendNonPremultipliedDstColor,advancedBlendCorrelatedOverlap=advancedBlendCorrelatedOverlap,advancedBlendAllOperations=advancedBlendAllOperations)
+
+def VkPipelineColorBlendAdvancedStateCreateInfoEXT(sType=VK_STRUCTURE_TYPE_PIPELINE_COLOR_BLEND_ADVANCED_STATE_CREATE_INFO_EXT,pNext=None,srcPremultiplied=None,dstPremultiplied=None,blendOverlap=None,):
+
+    return _new('VkPipelineColorBlendAdvancedStateCreateInfoEXT', sType=sType,pNext=pNext,srcPremultiplied=srcPremultiplied,dstPremultiplied=dstPremultiplied,blendOverlap=blendOverlap)
+
+def VkValidationCacheCreateInfoEXT(sType=VK_STRUCTURE_TYPE_VALIDATION_CACHE_CREATE_INFO_EXT,pNext=None,flags=None,initialDataSize=None,pInitialData=None,):
+    if initialDataSize is None and pInitialData is not None:
+        initialDataSize = len(pInitialData)
+
+    return _new('VkValidationCacheCreateInfoEXT', sType=sType,pNext=pNext,flags=flags,initialDataSize=initialDataSize,pInitialData=pInitialData)
+
+def VkShaderModuleValidationCacheCreateInfoEXT(sType=VK_STRUCTURE_TYPE_SHADER_MODULE_VALIDATION_CACHE_CREATE_INFO_EXT,pNext=None,validationCache=None,):
+
+    return _new('VkShaderModuleValidationCacheCreateInfoEXT', sType=sType,pNext=pNext,validationCache=validationCache)
+
+def VkDebugUtilsObjectNameInfoEXT(sType=VK_STRUCTURE_TYPE_DEBUG_UTILS_OBJECT_NAME_INFO_EXT,pNext=None,objectType=None,objectHandle=None,pObjectName=None,):
+
+    return _new('VkDebugUtilsObjectNameInfoEXT', sType=sType,pNext=pNext,objectType=objectType,objectHandle=objectHandle,pObjectName=pObjectName)
+
+def VkDebugUtilsObjectTagInfoEXT(sType=VK_STRUCTURE_TYPE_DEBUG_UTILS_OBJECT_TAG_INFO_EXT,pNext=None,objectType=None,objectHandle=None,tagName=None,tagSize=None,pTag=None,):
+    if tagSize is None and pTag is not None:
+        tagSize = len(pTag)
+
+    return _new('VkDebugUtilsObjectTagInfoEXT', sType=sType,pNext=pNext,objectType=objectType,objectHandle=objectHandle,tagName=tagName,tagSize=tagSize,pTag=pTag)
+
+def VkDebugUtilsLabelEXT(sType=VK_STRUCTURE_TYPE_DEBUG_UTILS_LABEL_EXT,pNext=None,pLabelName=None,color=None,):
+
+    return _new('VkDebugUtilsLabelEXT', sType=sType,pNext=pNext,pLabelName=pLabelName,color=color)
+
+def VkDebugUtilsMessengerCreateInfoEXT(sType=VK_STRUCTURE_TYPE_DEBUG_UTILS_MESSENGER_CREATE_INFO_EXT,pNext=None,flags=None,messageSeverity=None,messageType=None,pfnUserCallback=None,pUserData=None,):
+
+    return _new('VkDebugUtilsMessengerCreateInfoEXT', sType=sType,pNext=pNext,flags=flags,messageSeverity=messageSeverity,messageType=messageType,pfnUserCallback=pfnUserCallback,pUserData=pUserData)
+
+def VkDebugUtilsMessengerCallbackDataEXT(sType=VK_STRUCTURE_TYPE_DEBUG_UTILS_MESSENGER_CALLBACK_DATA_EXT,pNext=None,flags=None,pMessageIdName=None,messageIdNumber=None,pMessage=None,queueLabelCount=None,pQueueLabels=None,cmdBufLabelCount=None,pCmdBufLabels=None,objectCount=None,pObjects=None,):
+    if queueLabelCount is None and pQueueLabels is not None:
+        queueLabelCount = len(pQueueLabels)
+    if cmdBufLabelCount is None and pCmdBufLabels is not None:
+        cmdBufLabelCount = len(pCmdBufLabels)
+    if objectCount is None and pObjects is not None:
+        objectCount = len(pObjects)
+
+    return _new('VkDebugUtilsMessengerCallbackDataEXT', sType=sType,pNext=pNext,flags=flags,pMessageIdName=pMessageIdName,messageIdNumber=messageIdNumber,pMessage=pMessage,queueLabelCount=queueLabelCount,pQueueLabels=pQueueLabels,cmdBufLabelCount=cmdBufLabelCount,pCmdBufLabels=pCmdBufLabels,objectCount=objectCount,pObjects=pObjects)
+
+def VkPhysicalDeviceDeviceMemoryReportFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEVICE_MEMORY_REPORT_FEATURES_EXT,pNext=None,deviceMemoryReport=None,):
+
+    return _new('VkPhysicalDeviceDeviceMemoryReportFeaturesEXT', sType=sType,pNext=pNext,deviceMemoryReport=deviceMemoryReport)
+
+def VkDeviceDeviceMemoryReportCreateInfoEXT(sType=VK_STRUCTURE_TYPE_DEVICE_DEVICE_MEMORY_REPORT_CREATE_INFO_EXT,pNext=None,flags=None,pfnUserCallback=None,pUserData=None,):
+
+    return _new('VkDeviceDeviceMemoryReportCreateInfoEXT', sType=sType,pNext=pNext,flags=flags,pfnUserCallback=pfnUserCallback,pUserData=pUserData)
+
+def VkDeviceMemoryReportCallbackDataEXT(sType=VK_STRUCTURE_TYPE_DEVICE_MEMORY_REPORT_CALLBACK_DATA_EXT,pNext=None,flags=None,type=None,memoryObjectId=None,size=None,objectType=None,objectHandle=None,heapIndex=None,):
+
+    return _new('VkDeviceMemoryReportCallbackDataEXT', sType=sType,pNext=pNext,flags=flags,type=type,memoryObjectId=memoryObjectId,size=size,objectType=objectType,objectHandle=objectHandle,heapIndex=heapIndex)
+
+def VkImportMemoryHostPointerInfoEXT(sType=VK_STRUCTURE_TYPE_IMPORT_MEMORY_HOST_POINTER_INFO_EXT,pNext=None,handleType=None,pHostPointer=None,):
+
+    return _new('VkImportMemoryHostPointerInfoEXT', sType=sType,pNext=pNext,handleType=handleType,pHostPointer=pHostPointer)
+
+def VkMemoryHostPointerPropertiesEXT(sType=VK_STRUCTURE_TYPE_MEMORY_HOST_POINTER_PROPERTIES_EXT,pNext=None,memoryTypeBits=None,):
+
+    return _new('VkMemoryHostPointerPropertiesEXT', sType=sType,pNext=pNext,memoryTypeBits=memoryTypeBits)
+
+def VkPhysicalDeviceExternalMemoryHostPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_MEMORY_HOST_PROPERTIES_EXT,pNext=None,minImportedHostPointerAlignment=None,):
+
+    return _new('VkPhysicalDeviceExternalMemoryHostPropertiesEXT', sType=sType,pNext=pNext,minImportedHostPointerAlignment=minImportedHostPointerAlignment)
+
+def VkPhysicalDeviceConservativeRasterizationPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CONSERVATIVE_RASTERIZATION_PROPERTIES_EXT,pNext=None,primitiveOverestimationSize=None,maxExtraPrimitiveOverestimationSize=None,extraPrimitiveOverestimationSizeGranularity=None,primitiveUnderestimation=None,conservativePointAndLineRasterization=None,degenerateTrianglesRasterized=None,degenerateLinesRasterized=None,fullyCoveredFragmentShaderInputVariable=None,conservativeRasterizationPostDepthCoverage=None,):
+
+    return _new('VkPhysicalDeviceConservativeRasterizationPropertiesEXT', sType=sType,pNext=pNext,primitiveOverestimationSize=primitiveOverestimationSize,maxExtraPrimitiveOverestimationSize=maxExtraPrimitiveOverestimationSize,extraPrimitiveOverestimationSizeGranularity=extraPrimitiveOverestimationSizeGranularity,primitiveUnderestimation=primitiveUnderestimation,conservativePointAndLineRasterization=conservativePointAndLineRasterization,degenerateTrianglesRasterized=degenerateTrianglesRasterized,degenerateLinesRasterized=degenerateLinesRasterized,fullyCoveredFragmentShaderInputVariable=fullyCoveredFragmentShaderInputVariable,conservativeRasterizationPostDepthCoverage=conservativeRasterizationPostDepthCoverage)
+
+def VkPipelineRasterizationConservativeStateCreateInfoEXT(sType=VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_CONSERVATIVE_STATE_CREATE_INFO_EXT,pNext=None,flags=None,conservativeRasterizationMode=None,extraPrimitiveOverestimationSize=None,):
+
+    return _new('VkPipelineRasterizationConservativeStateCreateInfoEXT', sType=sType,pNext=pNext,flags=flags,conservativeRasterizationMode=conservativeRasterizationMode,extraPrimitiveOverestimationSize=extraPrimitiveOverestimationSize)
+
+def VkPhysicalDeviceVertexAttributeDivisorPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_PROPERTIES_EXT,pNext=None,maxVertexAttribDivisor=None,):
+
+    return _new('VkPhysicalDeviceVertexAttributeDivisorPropertiesEXT', sType=sType,pNext=pNext,maxVertexAttribDivisor=maxVertexAttribDivisor)
+
+def VkPhysicalDevicePCIBusInfoPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PCI_BUS_INFO_PROPERTIES_EXT,pNext=None,pciDomain=None,pciBus=None,pciDevice=None,pciFunction=None,):
+
+    return _new('VkPhysicalDevicePCIBusInfoPropertiesEXT', sType=sType,pNext=pNext,pciDomain=pciDomain,pciBus=pciBus,pciDevice=pciDevice,pciFunction=pciFunction)
+
+def VkCommandBufferInheritanceConditionalRenderingInfoEXT(sType=VK_STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_CONDITIONAL_RENDERING_INFO_EXT,pNext=None,conditionalRenderingEnable=None,):
+
+    return _new('VkCommandBufferInheritanceConditionalRenderingInfoEXT', sType=sType,pNext=pNext,conditionalRenderingEnable=conditionalRenderingEnable)
+
+def VkPhysicalDeviceConditionalRenderingFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CONDITIONAL_RENDERING_FEATURES_EXT,pNext=None,conditionalRendering=None,inheritedConditionalRendering=None,):
+
+    return _new('VkPhysicalDeviceConditionalRenderingFeaturesEXT', sType=sType,pNext=pNext,conditionalRendering=conditionalRendering,inheritedConditionalRendering=inheritedConditionalRendering)
+
+def VkPhysicalDeviceShaderAtomicFloatFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_ATOMIC_FLOAT_FEATURES_EXT,pNext=None,shaderBufferFloat32Atomics=None,shaderBufferFloat32AtomicAdd=None,shaderBufferFloat64Atomics=None,shaderBufferFloat64AtomicAdd=None,shaderSharedFloat32Atomics=None,shaderSharedFloat32AtomicAdd=None,shaderSharedFloat64Atomics=None,shaderSharedFloat64AtomicAdd=None,shaderImageFloat32Atomics=None,shaderImageFloat32AtomicAdd=None,sparseImageFloat32Atomics=None,sparseImageFloat32AtomicAdd=None,):
+
+    return _new('VkPhysicalDeviceShaderAtomicFloatFeaturesEXT', sType=sType,pNext=pNext,shaderBufferFloat32Atomics=shaderBufferFloat32Atomics,shaderBufferFloat32AtomicAdd=shaderBufferFloat32AtomicAdd,shaderBufferFloat64Atomics=shaderBufferFloat64Atomics,shaderBufferFloat64AtomicAdd=shaderBufferFloat64AtomicAdd,shaderSharedFloat32Atomics=shaderSharedFloat32Atomics,shaderSharedFloat32AtomicAdd=shaderSharedFloat32AtomicAdd,shaderSharedFloat64Atomics=shaderSharedFloat64Atomics,shaderSharedFloat64AtomicAdd=shaderSharedFloat64AtomicAdd,shaderImageFloat32Atomics=shaderImageFloat32Atomics,shaderImageFloat32AtomicAdd=shaderImageFloat32AtomicAdd,sparseImageFloat32Atomics=sparseImageFloat32Atomics,sparseImageFloat32AtomicAdd=sparseImageFloat32AtomicAdd)
+
+def VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_ATOMIC_FLOAT_2_FEATURES_EXT,pNext=None,shaderBufferFloat16Atomics=None,shaderBufferFloat16AtomicAdd=None,shaderBufferFloat16AtomicMinMax=None,shaderBufferFloat32AtomicMinMax=None,shaderBufferFloat64AtomicMinMax=None,shaderSharedFloat16Atomics=None,shaderSharedFloat16AtomicAdd=None,shaderSharedFloat16AtomicMinMax=None,shaderSharedFloat32AtomicMinMax=None,shaderSharedFloat64AtomicMinMax=None,shaderImageFloat32AtomicMinMax=None,sparseImageFloat32AtomicMinMax=None,):
+
+    return _new('VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT', sType=sType,pNext=pNext,shaderBufferFloat16Atomics=shaderBufferFloat16Atomics,shaderBufferFloat16AtomicAdd=shaderBufferFloat16AtomicAdd,shaderBufferFloat16AtomicMinMax=shaderBufferFloat16AtomicMinMax,shaderBufferFloat32AtomicMinMax=shaderBufferFloat32AtomicMinMax,shaderBufferFloat64AtomicMinMax=shaderBufferFloat64AtomicMinMax,shaderSharedFloat16Atomics=shaderSharedFloat16Atomics,shaderSharedFloat16AtomicAdd=shaderSharedFloat16AtomicAdd,shaderSharedFloat16AtomicMinMax=shaderSharedFloat16AtomicMinMax,shaderSharedFloat32AtomicMinMax=shaderSharedFloat32AtomicMinMax,shaderSharedFloat64AtomicMinMax=shaderSharedFloat64AtomicMinMax,shaderImageFloat32AtomicMinMax=shaderImageFloat32AtomicMinMax,sparseImageFloat32AtomicMinMax=sparseImageFloat32AtomicMinMax)
+
+def VkImageViewASTCDecodeModeEXT(sType=VK_STRUCTURE_TYPE_IMAGE_VIEW_ASTC_DECODE_MODE_EXT,pNext=None,decodeMode=None,):
+
+    return _new('VkImageViewASTCDecodeModeEXT', sType=sType,pNext=pNext,decodeMode=decodeMode)
+
+def VkPhysicalDeviceASTCDecodeFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ASTC_DECODE_FEATURES_EXT,pNext=None,decodeModeSharedExponent=None,):
+
+    return _new('VkPhysicalDeviceASTCDecodeFeaturesEXT', sType=sType,pNext=pNext,decodeModeSharedExponent=decodeModeSharedExponent)
+
+def VkPhysicalDeviceTransformFeedbackFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TRANSFORM_FEEDBACK_FEATURES_EXT,pNext=None,transformFeedback=None,geometryStreams=None,):
+
+    return _new('VkPhysicalDeviceTransformFeedbackFeaturesEXT', sType=sType,pNext=pNext,transformFeedback=transformFeedback,geometryStreams=geometryStreams)
+
+def VkPhysicalDeviceTransformFeedbackPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TRANSFORM_FEEDBACK_PROPERTIES_EXT,pNext=None,maxTransformFeedbackStreams=None,maxTransformFeedbackBuffers=None,maxTransformFeedbackBufferSize=None,maxTransformFeedbackStreamDataSize=None,maxTransformFeedbackBufferDataSize=None,maxTransformFeedbackBufferDataStride=None,transformFeedbackQueries=None,transformFeedbackStreamsLinesTriangles=None,transformFeedbackRasterizationStreamSelect=None,transformFeedbackDraw=None,):
+
+    return _new('VkPhysicalDeviceTransformFeedbackPropertiesEXT', sType=sType,pNext=pNext,maxTransformFeedbackStreams=maxTransformFeedbackStreams,maxTransformFeedbackBuffers=maxTransformFeedbackBuffers,maxTransformFeedbackBufferSize=maxTransformFeedbackBufferSize,maxTransformFeedbackStreamDataSize=maxTransformFeedbackStreamDataSize,maxTransformFeedbackBufferDataSize=maxTransformFeedbackBufferDataSize,maxTransformFeedbackBufferDataStride=maxTransformFeedbackBufferDataStride,transformFeedbackQueries=transformFeedbackQueries,transformFeedbackStreamsLinesTriangles=transformFeedbackStreamsLinesTriangles,transformFeedbackRasterizationStreamSelect=transformFeedbackRasterizationStreamSelect,transformFeedbackDraw=transformFeedbackDraw)
+
+def VkPipelineRasterizationStateStreamCreateInfoEXT(sType=VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_STATE_STREAM_CREATE_INFO_EXT,pNext=None,flags=None,rasterizationStream=None,):
+
+    return _new('VkPipelineRasterizationStateStreamCreateInfoEXT', sType=sType,pNext=pNext,flags=flags,rasterizationStream=rasterizationStream)
+
+def VkPhysicalDeviceMeshShaderFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MESH_SHADER_FEATURES_EXT,pNext=None,taskShader=None,meshShader=None,multiviewMeshShader=None,primitiveFragmentShadingRateMeshShader=None,meshShaderQueries=None,):
+
+    return _new('VkPhysicalDeviceMeshShaderFeaturesEXT', sType=sType,pNext=pNext,taskShader=taskShader,meshShader=meshShader,multiviewMeshShader=multiviewMeshShader,primitiveFragmentShadingRateMeshShader=primitiveFragmentShadingRateMeshShader,meshShaderQueries=meshShaderQueries)
+
+def VkPhysicalDeviceMeshShaderPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MESH_SHADER_PROPERTIES_EXT,pNext=None,maxTaskWorkGroupTotalCount=None,maxTaskWorkGroupCount=None,maxTaskWorkGroupInvocations=None,maxTaskWorkGroupSize=None,maxTaskPayloadSize=None,maxTaskSharedMemorySize=None,maxTaskPayloadAndSharedMemorySize=None,maxMeshWorkGroupTotalCount=None,maxMeshWorkGroupCount=None,maxMeshWorkGroupInvocations=None,maxMeshWorkGroupSize=None,maxMeshSharedMemorySize=None,maxMeshPayloadAndSharedMemorySize=None,maxMeshOutputMemorySize=None,maxMeshPayloadAndOutputMemorySize=None,maxMeshOutputComponents=None,maxMeshOutputVertices=None,maxMeshOutputPrimitives=None,maxMeshOutputLayers=None,maxMeshMultiviewViewCount=None,meshOutputPerVertexGranularity=None,meshOutputPerPrimitiveGranularity=None,maxPreferredTaskWorkGroupInvocations=None,maxPreferredMeshWorkGroupInvocations=None,prefersLocalInvocationVertexOutput=None,prefersLocalInvocationPrimitiveOutput=None,prefersCompactVertexOutput=None,prefersCompactPrimitiveOutput=None,):
+
+    return _new('VkPhysicalDeviceMeshShaderPropertiesEXT', sType=sType,pNext=pNext,maxTaskWorkGroupTotalCount=maxTaskWorkGroupTotalCount,maxTaskWorkGroupCount=maxTaskWorkGroupCount,maxTaskWorkGroupInvocations=maxTaskWorkGroupInvocations,maxTaskWorkGroupSize=maxTaskWorkGroupSize,maxTaskPayloadSize=maxTaskPayloadSize,maxTaskSharedMemorySize=maxTaskSharedMemorySize,maxTaskPayloadAndSharedMemorySize=maxTaskPayloadAndSharedMemorySize,maxMeshWorkGroupTotalCount=maxMeshWorkGroupTotalCount,maxMeshWorkGroupCount=maxMeshWorkGroupCount,maxMeshWorkGroupInvocations=maxMeshWorkGroupInvocations,maxMeshWorkGroupSize=maxMeshWorkGroupSize,maxMeshSharedMemorySize=maxMeshSharedMemorySize,maxMeshPayloadAndSharedMemorySize=maxMeshPayloadAndSharedMemorySize,maxMeshOutputMemorySize=maxMeshOutputMemorySize,maxMeshPayloadAndOutputMemorySize=maxMeshPayloadAndOutputMemorySize,maxMeshOutputComponents=maxMeshOutputComponents,maxMeshOutputVertices=maxMeshOutputVertices,maxMeshOutputPrimitives=maxMeshOutputPrimitives,maxMeshOutputLayers=maxMeshOutputLayers,maxMeshMultiviewViewCount=maxMeshMultiviewViewCount,meshOutputPerVertexGranularity=meshOutputPerVertexGranularity,meshOutputPerPrimitiveGranularity=meshOutputPerPrimitiveGranularity,maxPreferredTaskWorkGroupInvocations=maxPreferredTaskWorkGroupInvocations,maxPreferredMeshWorkGroupInvocations=maxPreferredMeshWorkGroupInvocations,prefersLocalInvocationVertexOutput=prefersLocalInvocationVertexOutput,prefersLocalInvocationPrimitiveOutput=prefersLocalInvocationPrimitiveOutput,prefersCompactVertexOutput=prefersCompactVertexOutput,prefersCompactPrimitiveOutput=prefersCompactPrimitiveOutput)
+
+def VkDrawMeshTasksIndirectCommandEXT(groupCountX=None,groupCountY=None,groupCountZ=None,):
+
+    return _new('VkDrawMeshTasksIndirectCommandEXT', groupCountX=groupCountX,groupCountY=groupCountY,groupCountZ=groupCountZ)
+
+def VkDrmFormatModifierPropertiesListEXT(sType=VK_STRUCTURE_TYPE_DRM_FORMAT_MODIFIER_PROPERTIES_LIST_EXT,pNext=None,drmFormatModifierCount=None,pDrmFormatModifierProperties=None,):
+    if drmFormatModifierCount is None and pDrmFormatModifierProperties is not None:
+        drmFormatModifierCount = len(pDrmFormatModifierProperties)
+
+    return _new('VkDrmFormatModifierPropertiesListEXT', sType=sType,pNext=pNext,drmFormatModifierCount=drmFormatModifierCount,pDrmFormatModifierProperties=pDrmFormatModifierProperties)
+
+def VkDrmFormatModifierPropertiesEXT(drmFormatModifier=None,drmFormatModifierPlaneCount=None,drmFormatModifierTilingFeatures=None,):
+
+    return _new('VkDrmFormatModifierPropertiesEXT', drmFormatModifier=drmFormatModifier,drmFormatModifierPlaneCount=drmFormatModifierPlaneCount,drmFormatModifierTilingFeatures=drmFormatModifierTilingFeatures)
+
+def VkPhysicalDeviceImageDrmFormatModifierInfoEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_DRM_FORMAT_MODIFIER_INFO_EXT,pNext=None,drmFormatModifier=None,sharingMode=None,queueFamilyIndexCount=None,pQueueFamilyIndices=None,):
+    if queueFamilyIndexCount is None and pQueueFamilyIndices is not None:
+        queueFamilyIndexCount = len(pQueueFamilyIndices)
+
+    return _new('VkPhysicalDeviceImageDrmFormatModifierInfoEXT', sType=sType,pNext=pNext,drmFormatModifier=drmFormatModifier,sharingMode=sharingMode,queueFamilyIndexCount=queueFamilyIndexCount,pQueueFamilyIndices=pQueueFamilyIndices)
+
+def VkImageDrmFormatModifierListCreateInfoEXT(sType=VK_STRUCTURE_TYPE_IMAGE_DRM_FORMAT_MODIFIER_LIST_CREATE_INFO_EXT,pNext=None,drmFormatModifierCount=None,pDrmFormatModifiers=None,):
+    if drmFormatModifierCount is None and pDrmFormatModifiers is not None:
+        drmFormatModifierCount = len(pDrmFormatModifiers)
+
+    return _new('VkImageDrmFormatModifierListCreateInfoEXT', sType=sType,pNext=pNext,drmFormatModifierCount=drmFormatModifierCount,pDrmFormatModifiers=pDrmFormatModifiers)
+
+def VkImageDrmFormatModifierExplicitCreateInfoEXT(sType=VK_STRUCTURE_TYPE_IMAGE_DRM_FORMAT_MODIFIER_EXPLICIT_CREATE_INFO_EXT,pNext=None,drmFormatModifier=None,drmFormatModifierPlaneCount=None,pPlaneLayouts=None,):
+    if drmFormatModifierPlaneCount is None and pPlaneLayouts is not None:
+        drmFormatModifierPlaneCount = len(pPlaneLayouts)
+
+    return _new('VkImageDrmFormatModifierExplicitCreateInfoEXT', sType=sType,pNext=pNext,drmFormatModifier=drmFormatModifier,drmFormatModifierPlaneCount=drmFormatModifierPlaneCount,pPlaneLayouts=pPlaneLayouts)
+
+def VkImageDrmFormatModifierPropertiesEXT(sType=VK_STRUCTURE_TYPE_IMAGE_DRM_FORMAT_MODIFIER_PROPERTIES_EXT,pNext=None,drmFormatModifier=None,):
+
+    return _new('VkImageDrmFormatModifierPropertiesEXT', sType=sType,pNext=pNext,drmFormatModifier=drmFormatModifier)
+
+def VkPhysicalDeviceFragmentDensityMapFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_FEATURES_EXT,pNext=None,fragmentDensityMap=None,fragmentDensityMapDynamic=None,fragmentDensityMapNonSubsampledImages=None,):
+
+    return _new('VkPhysicalDeviceFragmentDensityMapFeaturesEXT', sType=sType,pNext=pNext,fragmentDensityMap=fragmentDensityMap,fragmentDensityMapDynamic=fragmentDensityMapDynamic,fragmentDensityMapNonSubsampledImages=fragmentDensityMapNonSubsampledImages)
+
+def VkPhysicalDeviceFragmentDensityMap2FeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_2_FEATURES_EXT,pNext=None,fragmentDensityMapDeferred=None,):
+
+    return _new('VkPhysicalDeviceFragmentDensityMap2FeaturesEXT', sType=sType,pNext=pNext,fragmentDensityMapDeferred=fragmentDensityMapDeferred)
+
+def VkPhysicalDeviceFragmentDensityMapPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_PROPERTIES_EXT,pNext=None,minFragmentDensityTexelSize=None,maxFragmentDensityTexelSize=None,fragmentDensityInvocations=None,):
+
+    return _new('VkPhysicalDeviceFragmentDensityMapPropertiesEXT', sType=sType,pNext=pNext,minFragmentDensityTexelSize=minFragmentDensityTexelSize,maxFragmentDensityTexelSize=maxFragmentDensityTexelSize,fragmentDensityInvocations=fragmentDensityInvocations)
+
+def VkPhysicalDeviceFragmentDensityMap2PropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_2_PROPERTIES_EXT,pNext=None,subsampledLoads=None,subsampledCoarseReconstructionEarlyAccess=None,maxSubsampledArrayLayers=None,maxDescriptorSetSubsampledSamplers=None,):
+
+    return _new('VkPhysicalDeviceFragmentDensityMap2PropertiesEXT', sType=sType,pNext=pNext,subsampledLoads=subsampledLoads,subsampledCoarseReconstructionEarlyAccess=subsampledCoarseReconstructionEarlyAccess,maxSubsampledArrayLayers=maxSubsampledArrayLayers,maxDescriptorSetSubsampledSamplers=maxDescriptorSetSubsampledSamplers)
+
+def VkRenderPassFragmentDensityMapCreateInfoEXT(sType=VK_STRUCTURE_TYPE_RENDER_PASS_FRAGMENT_DENSITY_MAP_CREATE_INFO_EXT,pNext=None,fragmentDensityMapAttachment=None,):
+
+    return _new('VkRenderPassFragmentDensityMapCreateInfoEXT', sType=sType,pNext=pNext,fragmentDensityMapAttachment=fragmentDensityMapAttachment)
+
+def VkPhysicalDeviceDepthClipEnableFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEPTH_CLIP_ENABLE_FEATURES_EXT,pNext=None,depthClipEnable=None,):
+
+    return _new('VkPhysicalDeviceDepthClipEnableFeaturesEXT', sType=sType,pNext=pNext,depthClipEnable=depthClipEnable)
+
+def VkPipelineRasterizationDepthClipStateCreateInfoEXT(sType=VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_DEPTH_CLIP_STATE_CREATE_INFO_EXT,pNext=None,flags=None,depthClipEnable=None,):
+
+    return _new('VkPipelineRasterizationDepthClipStateCreateInfoEXT', sType=sType,pNext=pNext,flags=flags,depthClipEnable=depthClipEnable)
+
+def VkPhysicalDeviceMemoryBudgetPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MEMORY_BUDGET_PROPERTIES_EXT,pNext=None,heapBudget=None,heapUsage=None,):
+
+    return _new('VkPhysicalDeviceMemoryBudgetPropertiesEXT', sType=sType,pNext=pNext,heapBudget=heapBudget,heapUsage=heapUsage)
+
+def VkPhysicalDeviceMemoryPriorityFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MEMORY_PRIORITY_FEATURES_EXT,pNext=None,memoryPriority=None,):
+
+    return _new('VkPhysicalDeviceMemoryPriorityFeaturesEXT', sType=sType,pNext=pNext,memoryPriority=memoryPriority)
+
+def VkMemoryPriorityAllocateInfoEXT(sType=VK_STRUCTURE_TYPE_MEMORY_PRIORITY_ALLOCATE_INFO_EXT,pNext=None,priority=None,):
+
+    return _new('VkMemoryPriorityAllocateInfoEXT', sType=sType,pNext=pNext,priority=priority)
+
+def VkPhysicalDevicePageableDeviceLocalMemoryFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PAGEABLE_DEVICE_LOCAL_MEMORY_FEATURES_EXT,pNext=None,pageableDeviceLocalMemory=None,):
+
+    return _new('VkPhysicalDevicePageableDeviceLocalMemoryFeaturesEXT', sType=sType,pNext=pNext,pageableDeviceLocalMemory=pageableDeviceLocalMemory)
+
+def VkPhysicalDeviceBufferDeviceAddressFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_BUFFER_DEVICE_ADDRESS_FEATURES_EXT,pNext=None,bufferDeviceAddress=None,bufferDeviceAddressCaptureReplay=None,bufferDeviceAddressMultiDevice=None,):
+
+    return _new('VkPhysicalDeviceBufferDeviceAddressFeaturesEXT', sType=sType,pNext=pNext,bufferDeviceAddress=bufferDeviceAddress,bufferDeviceAddressCaptureReplay=bufferDeviceAddressCaptureReplay,bufferDeviceAddressMultiDevice=bufferDeviceAddressMultiDevice)
+
+def VkBufferDeviceAddressCreateInfoEXT(sType=VK_STRUCTURE_TYPE_BUFFER_DEVICE_ADDRESS_CREATE_INFO_EXT,pNext=None,deviceAddress=None,):
+
+    return _new('VkBufferDeviceAddressCreateInfoEXT', sType=sType,pNext=pNext,deviceAddress=deviceAddress)
+
+def VkPhysicalDeviceImageViewImageFormatInfoEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_VIEW_IMAGE_FORMAT_INFO_EXT,pNext=None,imageViewType=None,):
+
+    return _new('VkPhysicalDeviceImageViewImageFormatInfoEXT', sType=sType,pNext=pNext,imageViewType=imageViewType)
+
+def VkFilterCubicImageViewImageFormatPropertiesEXT(sType=VK_STRUCTURE_TYPE_FILTER_CUBIC_IMAGE_VIEW_IMAGE_FORMAT_PROPERTIES_EXT,pNext=None,filterCubic=None,filterCubicMinmax=None,):
+
+    return _new('VkFilterCubicImageViewImageFormatPropertiesEXT', sType=sType,pNext=pNext,filterCubic=filterCubic,filterCubicMinmax=filterCubicMinmax)
+
+def VkPhysicalDeviceYcbcrImageArraysFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_YCBCR_IMAGE_ARRAYS_FEATURES_EXT,pNext=None,ycbcrImageArrays=None,):
+
+    return _new('VkPhysicalDeviceYcbcrImageArraysFeaturesEXT', sType=sType,pNext=pNext,ycbcrImageArrays=ycbcrImageArrays)
+
+def VkSurfaceFullScreenExclusiveInfoEXT(sType=VK_STRUCTURE_TYPE_SURFACE_FULL_SCREEN_EXCLUSIVE_INFO_EXT,pNext=None,fullScreenExclusive=None,):
+
+    return _new('VkSurfaceFullScreenExclusiveInfoEXT', sType=sType,pNext=pNext,fullScreenExclusive=fullScreenExclusive)
+
+def VkSurfaceFullScreenExclusiveWin32InfoEXT(sType=VK_STRUCTURE_TYPE_SURFACE_FULL_SCREEN_EXCLUSIVE_WIN32_INFO_EXT,pNext=None,hmonitor=None,):
+
+    return _new('VkSurfaceFullScreenExclusiveWin32InfoEXT', sType=sType,pNext=pNext,hmonitor=hmonitor)
+
+def VkSurfaceCapabilitiesFullScreenExclusiveEXT(sType=VK_STRUCTURE_TYPE_SURFACE_CAPABILITIES_FULL_SCREEN_EXCLUSIVE_EXT,pNext=None,fullScreenExclusiveSupported=None,):
+
+    return _new('VkSurfaceCapabilitiesFullScreenExclusiveEXT', sType=sType,pNext=pNext,fullScreenExclusiveSupported=fullScreenExclusiveSupported)
+
+def VkHeadlessSurfaceCreateInfoEXT(sType=VK_STRUCTURE_TYPE_HEADLESS_SURFACE_CREATE_INFO_EXT,pNext=None,flags=None,):
+
+    return _new('VkHeadlessSurfaceCreateInfoEXT', sType=sType,pNext=pNext,flags=flags)
+
+def VkPhysicalDeviceIndexTypeUint8FeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_INDEX_TYPE_UINT8_FEATURES_EXT,pNext=None,indexTypeUint8=None,):
+
+    return _new('VkPhysicalDeviceIndexTypeUint8FeaturesEXT', sType=sType,pNext=pNext,indexTypeUint8=indexTypeUint8)
+
+def VkPhysicalDeviceFragmentShaderInterlockFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADER_INTERLOCK_FEATURES_EXT,pNext=None,fragmentShaderSampleInterlock=None,fragmentShaderPixelInterlock=None,fragmentShaderShadingRateInterlock=None,):
+
+    return _new('VkPhysicalDeviceFragmentShaderInterlockFeaturesEXT', sType=sType,pNext=pNext,fragmentShaderSampleInterlock=fragmentShaderSampleInterlock,fragmentShaderPixelInterlock=fragmentShaderPixelInterlock,fragmentShaderShadingRateInterlock=fragmentShaderShadingRateInterlock)
+
+def VkPhysicalDevicePrimitiveTopologyListRestartFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PRIMITIVE_TOPOLOGY_LIST_RESTART_FEATURES_EXT,pNext=None,primitiveTopologyListRestart=None,primitiveTopologyPatchListRestart=None,):
+
+    return _new('VkPhysicalDevicePrimitiveTopologyListRestartFeaturesEXT', sType=sType,pNext=pNext,primitiveTopologyListRestart=primitiveTopologyListRestart,primitiveTopologyPatchListRestart=primitiveTopologyPatchListRestart)
+
+def VkPhysicalDeviceTexelBufferAlignmentFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TEXEL_BUFFER_ALIGNMENT_FEATURES_EXT,pNext=None,texelBufferAlignment=None,):
+
+    return _new('VkPhysicalDeviceTexelBufferAlignmentFeaturesEXT', sType=sType,pNext=pNext,texelBufferAlignment=texelBufferAlignment)
+
+def VkPhysicalDeviceLineRasterizationFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_LINE_RASTERIZATION_FEATURES_EXT,pNext=None,rectangularLines=None,bresenhamLines=None,smoothLines=None,stippledRectangularLines=None,stippledBresenhamLines=None,stippledSmoothLines=None,):
+
+    return _new('VkPhysicalDeviceLineRasterizationFeaturesEXT', sType=sType,pNext=pNext,rectangularLines=rectangularLines,bresenhamLines=bresenhamLines,smoothLines=smoothLines,stippledRectangularLines=stippledRectangularLines,stippledBresenhamLines=stippledBresenhamLines,stippledSmoothLines=stippledSmoothLines)
+
+def VkPhysicalDeviceLineRasterizationPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_LINE_RASTERIZATION_PROPERTIES_EXT,pNext=None,lineSubPixelPrecisionBits=None,):
+
+    return _new('VkPhysicalDeviceLineRasterizationPropertiesEXT', sType=sType,pNext=pNext,lineSubPixelPrecisionBits=lineSubPixelPrecisionBits)
+
+def VkPipelineRasterizationLineStateCreateInfoEXT(sType=VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_LINE_STATE_CREATE_INFO_EXT,pNext=None,lineRasterizationMode=None,stippledLineEnable=None,lineStippleFactor=None,lineStipplePattern=None,):
+
+    return _new('VkPipelineRasterizationLineStateCreateInfoEXT', sType=sType,pNext=pNext,lineRasterizationMode=lineRasterizationMode,stippledLineEnable=stippledLineEnable,lineStippleFactor=lineStippleFactor,lineStipplePattern=lineStipplePattern)
+
+def VkSamplerCustomBorderColorCreateInfoEXT(sType=VK_STRUCTURE_TYPE_SAMPLER_CUSTOM_BORDER_COLOR_CREATE_INFO_EXT,pNext=None,customBorderColor=None,format=None,):
+
+    return _new('VkSamplerCustomBorderColorCreateInfoEXT', sType=sType,pNext=pNext,customBorderColor=customBorderColor,format=format)
+
+def VkPhysicalDeviceCustomBorderColorPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CUSTOM_BORDER_COLOR_PROPERTIES_EXT,pNext=None,maxCustomBorderColorSamplers=None,):
+
+    return _new('VkPhysicalDeviceCustomBorderColorPropertiesEXT', sType=sType,pNext=pNext,maxCustomBorderColorSamplers=maxCustomBorderColorSamplers)
+
+def VkPhysicalDeviceCustomBorderColorFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CUSTOM_BORDER_COLOR_FEATURES_EXT,pNext=None,customBorderColors=None,customBorderColorWithoutFormat=None,):
+
+    return _new('VkPhysicalDeviceCustomBorderColorFeaturesEXT', sType=sType,pNext=pNext,customBorderColors=customBorderColors,customBorderColorWithoutFormat=customBorderColorWithoutFormat)
+
+def VkSamplerBorderColorComponentMappingCreateInfoEXT(sType=VK_STRUCTURE_TYPE_SAMPLER_BORDER_COLOR_COMPONENT_MAPPING_CREATE_INFO_EXT,pNext=None,components=None,srgb=None,):
+
+    return _new('VkSamplerBorderColorComponentMappingCreateInfoEXT', sType=sType,pNext=pNext,components=components,srgb=srgb)
+
+def VkPhysicalDeviceBorderColorSwizzleFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_BORDER_COLOR_SWIZZLE_FEATURES_EXT,pNext=None,borderColorSwizzle=None,borderColorSwizzleFromImage=None,):
+
+    return _new('VkPhysicalDeviceBorderColorSwizzleFeaturesEXT', sType=sType,pNext=pNext,borderColorSwizzle=borderColorSwizzle,borderColorSwizzleFromImage=borderColorSwizzleFromImage)
+
+def VkPhysicalDeviceExtendedDynamicStateFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_FEATURES_EXT,pNext=None,extendedDynamicState=None,):
+
+    return _new('VkPhysicalDeviceExtendedDynamicStateFeaturesEXT', sType=sType,pNext=pNext,extendedDynamicState=extendedDynamicState)
+
+def VkPhysicalDeviceExtendedDynamicState2FeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_2_FEATURES_EXT,pNext=None,extendedDynamicState2=None,extendedDynamicState2LogicOp=None,extendedDynamicState2PatchControlPoints=None,):
+
+    return _new('VkPhysicalDeviceExtendedDynamicState2FeaturesEXT', sType=sType,pNext=pNext,extendedDynamicState2=extendedDynamicState2,extendedDynamicState2LogicOp=extendedDynamicState2LogicOp,extendedDynamicState2PatchControlPoints=extendedDynamicState2PatchControlPoints)
+
+def VkPhysicalDeviceExtendedDynamicState3FeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_3_FEATURES_EXT,pNext=None,extendedDynamicState3TessellationDomainOrigin=None,extendedDynamicState3DepthClampEnable=None,extendedDynamicState3PolygonMode=None,extendedDynamicState3RasterizationSamples=None,extendedDynamicState3SampleMask=None,extendedDynamicState3AlphaToCoverageEnable=None,extendedDynamicState3AlphaToOneEnable=None,extendedDynamicState3LogicOpEnable=None,extendedDynamicState3ColorBlendEnable=None,extendedDynamicState3ColorBlendEquation=None,extendedDynamicState3ColorWriteMask=None,extendedDynamicState3RasterizationStream=None,extendedDynamicState3ConservativeRasterizationMode=None,extendedDynamicState3ExtraPrimitiveOverestimationSize=None,extendedDynamicState3DepthClipEnable=None,extendedDynamicState3SampleLocationsEnable=None,extendedDynamicState3ColorBlendAdvanced=None,extendedDynamicState3ProvokingVertexMode=None,extendedDynamicState3LineRasterizationMode=None,extendedDynamicState3LineStippleEnable=None,extendedDynamicState3DepthClipNegativeOneToOne=None,extendedDynamicState3ViewportWScalingEnable=None,extendedDynamicState3ViewportSwizzle=None,extendedDynamicState3CoverageToColorEnable=None,extendedDynamicState3CoverageToColorLocation=None,extendedDynamicState3CoverageModulationMode=None,extendedDynamicState3CoverageModulationTableEnable=None,extendedDynamicState3CoverageModulationTable=None,extendedDynamicState3CoverageReductionMode=None,extendedDynamicState3RepresentativeFragmentTestEnable=None,extendedDynamicState3ShadingRateImageEnable=None,):
+
+    return _new('VkPhysicalDeviceExtendedDynamicState3FeaturesEXT', sType=sType,pNext=pNext,extendedDynamicState3TessellationDomainOrigin=extendedDynamicState3TessellationDomainOrigin,extendedDynamicState3DepthClampEnable=extendedDynamicState3DepthClampEnable,extendedDynamicState3PolygonMode=extendedDynamicState3PolygonMode,extendedDynamicState3RasterizationSamples=extendedDynamicState3RasterizationSamples,extendedDynamicState3SampleMask=extendedDynamicState3SampleMask,extendedDynamicState3AlphaToCoverageEnable=extendedDynamicState3AlphaToCoverageEnable,extendedDynamicState3AlphaToOneEnable=extendedDynamicState3AlphaToOneEnable,extendedDynamicState3LogicOpEnable=extendedDynamicState3LogicOpEnable,extendedDynamicState3ColorBlendEnable=extendedDynamicState3ColorBlendEnable,extendedDynamicState3ColorBlendEquation=extendedDynamicState3ColorBlendEquation,extendedDynamicState3ColorWriteMask=extendedDynamicState3ColorWriteMask,extendedDynamicState3RasterizationStream=extendedDynamicState3RasterizationStream,extendedDynamicState3ConservativeRasterizationMode=extendedDynamicState3ConservativeRasterizationMode,extendedDynamicState3ExtraPrimitiveOverestimationSize=extendedDynamicState3ExtraPrimitiveOverestimationSize,extendedDynamicState3DepthClipEnable=extendedDynamicState3DepthClipEnable,extendedDynamicState3SampleLocationsEnable=extendedDynamicState3SampleLocationsEnable,extendedDynamicState3ColorBlendAdvanced=extendedDynamicState3ColorBlendAdvanced,extendedDynamicState3ProvokingVertexMode=extendedDynamicState3ProvokingVertexMode,extendedDynamicState3LineRasterizationMode=extendedDynamicState3LineRasterizationMode,extendedDynamicState3LineStippleEnable=extendedDynamicState3LineStippleEnable,extendedDynamicState3DepthClipNegativeOneToOne=extendedDynamicState3DepthClipNegativeOneToOne,extendedDynamicState3ViewportWScalingEnable=extendedDynamicState3ViewportWScalingEnable,extendedDynamicState3ViewportSwizzle=extendedDynamicState3ViewportSwizzle,extendedDynamicState3CoverageToColorEnable=extendedDynamicState3CoverageToColorEnable,extendedDynamicState3CoverageToColorLocation=extendedDynamicState3CoverageToColorLocation,extendedDynamicState3CoverageModulationMode=extendedDynamicState3CoverageModulationMode,extendedDynamicState3CoverageModulationTableEnable=extendedDynamicState3CoverageModulationTableEnable,extendedDynamicState3CoverageModulationTable=extendedDynamicState3CoverageModulationTable,extendedDynamicState3CoverageReductionMode=extendedDynamicState3CoverageReductionMode,extendedDynamicState3RepresentativeFragmentTestEnable=extendedDynamicState3RepresentativeFragmentTestEnable,extendedDynamicState3ShadingRateImageEnable=extendedDynamicState3ShadingRateImageEnable)
+
+def VkPhysicalDeviceExtendedDynamicState3PropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_3_PROPERTIES_EXT,pNext=None,dynamicPrimitiveTopologyUnrestricted=None,):
+
+    return _new('VkPhysicalDeviceExtendedDynamicState3PropertiesEXT', sType=sType,pNext=pNext,dynamicPrimitiveTopologyUnrestricted=dynamicPrimitiveTopologyUnrestricted)
+
+def VkColorBlendEquationEXT(srcColorBlendFactor=None,dstColorBlendFactor=None,colorBlendOp=None,srcAlphaBlendFactor=None,dstAlphaBlendFactor=None,alphaBlendOp=None,):
+
+    return _new('VkColorBlendEquationEXT', srcColorBlendFactor=srcColorBlendFactor,dstColorBlendFactor=dstColorBlendFactor,colorBlendOp=colorBlendOp,srcAlphaBlendFactor=srcAlphaBlendFactor,dstAlphaBlendFactor=dstAlphaBlendFactor,alphaBlendOp=alphaBlendOp)
+
+def VkColorBlendAdvancedEXT(advancedBlendOp=None,srcPremultiplied=None,dstPremultiplied=None,blendOverlap=None,clampResults=None,):
+
+    return _new('VkColorBlendAdvancedEXT', advancedBlendOp=advancedBlendOp,srcPremultiplied=srcPremultiplied,dstPremultiplied=dstPremultiplied,blendOverlap=blendOverlap,clampResults=clampResults)
+
+def VkPhysicalDeviceRobustness2FeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ROBUSTNESS_2_FEATURES_EXT,pNext=None,robustBufferAccess2=None,robustImageAccess2=None,nullDescriptor=None,):
+
+    return _new('VkPhysicalDeviceRobustness2FeaturesEXT', sType=sType,pNext=pNext,robustBufferAccess2=robustBufferAccess2,robustImageAccess2=robustImageAccess2,nullDescriptor=nullDescriptor)
+
+def VkPhysicalDeviceRobustness2PropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ROBUSTNESS_2_PROPERTIES_EXT,pNext=None,robustStorageBufferAccessSizeAlignment=None,robustUniformBufferAccessSizeAlignment=None,):
+
+    return _new('VkPhysicalDeviceRobustness2PropertiesEXT', sType=sType,pNext=pNext,robustStorageBufferAccessSizeAlignment=robustStorageBufferAccessSizeAlignment,robustUniformBufferAccessSizeAlignment=robustUniformBufferAccessSizeAlignment)
+
+def VkPhysicalDevice4444FormatsFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_4444_FORMATS_FEATURES_EXT,pNext=None,formatA4R4G4B4=None,formatA4B4G4R4=None,):
+
+    return _new('VkPhysicalDevice4444FormatsFeaturesEXT', sType=sType,pNext=pNext,formatA4R4G4B4=formatA4R4G4B4,formatA4B4G4R4=formatA4B4G4R4)
+
+def VkPhysicalDeviceShaderImageAtomicInt64FeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_IMAGE_ATOMIC_INT64_FEATURES_EXT,pNext=None,shaderImageInt64Atomics=None,sparseImageInt64Atomics=None,):
+
+    return _new('VkPhysicalDeviceShaderImageAtomicInt64FeaturesEXT', sType=sType,pNext=pNext,shaderImageInt64Atomics=shaderImageInt64Atomics,sparseImageInt64Atomics=sparseImageInt64Atomics)
+
+def VkPhysicalDeviceImage2DViewOf3DFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_2D_VIEW_OF_3D_FEATURES_EXT,pNext=None,image2DViewOf3D=None,sampler2DViewOf3D=None,):
+
+    return _new('VkPhysicalDeviceImage2DViewOf3DFeaturesEXT', sType=sType,pNext=pNext,image2DViewOf3D=image2DViewOf3D,sampler2DViewOf3D=sampler2DViewOf3D)
+
+def VkPhysicalDeviceImageSlicedViewOf3DFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_SLICED_VIEW_OF_3D_FEATURES_EXT,pNext=None,imageSlicedViewOf3D=None,):
+
+    return _new('VkPhysicalDeviceImageSlicedViewOf3DFeaturesEXT', sType=sType,pNext=pNext,imageSlicedViewOf3D=imageSlicedViewOf3D)
+
+def VkPhysicalDeviceAttachmentFeedbackLoopDynamicStateFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ATTACHMENT_FEEDBACK_LOOP_DYNAMIC_STATE_FEATURES_EXT,pNext=None,attachmentFeedbackLoopDynamicState=None,):
+
+    return _new('VkPhysicalDeviceAttachmentFeedbackLoopDynamicStateFeaturesEXT', sType=sType,pNext=pNext,attachmentFeedbackLoopDynamicState=attachmentFeedbackLoopDynamicState)
+
+def VkPhysicalDeviceMutableDescriptorTypeFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MUTABLE_DESCRIPTOR_TYPE_FEATURES_EXT,pNext=None,mutableDescriptorType=None,):
+
+    return _new('VkPhysicalDeviceMutableDescriptorTypeFeaturesEXT', sType=sType,pNext=pNext,mutableDescriptorType=mutableDescriptorType)
+
+def VkMutableDescriptorTypeListEXT(descriptorTypeCount=None,pDescriptorTypes=None,):
+    if descriptorTypeCount is None and pDescriptorTypes is not None:
+        descriptorTypeCount = len(pDescriptorTypes)
+
+    return _new('VkMutableDescriptorTypeListEXT', descriptorTypeCount=descriptorTypeCount,pDescriptorTypes=pDescriptorTypes)
+
+def VkMutableDescriptorTypeCreateInfoEXT(sType=VK_STRUCTURE_TYPE_MUTABLE_DESCRIPTOR_TYPE_CREATE_INFO_EXT,pNext=None,mutableDescriptorTypeListCount=None,pMutableDescriptorTypeLists=None,):
+    if mutableDescriptorTypeListCount is None and pMutableDescriptorTypeLists is not None:
+        mutableDescriptorTypeListCount = len(pMutableDescriptorTypeLists)
+
+    return _new('VkMutableDescriptorTypeCreateInfoEXT', sType=sType,pNext=pNext,mutableDescriptorTypeListCount=mutableDescriptorTypeListCount,pMutableDescriptorTypeLists=pMutableDescriptorTypeLists)
+
+def VkPhysicalDeviceDepthClipControlFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEPTH_CLIP_CONTROL_FEATURES_EXT,pNext=None,depthClipControl=None,):
+
+    return _new('VkPhysicalDeviceDepthClipControlFeaturesEXT', sType=sType,pNext=pNext,depthClipControl=depthClipControl)
+
+def VkPipelineViewportDepthClipControlCreateInfoEXT(sType=VK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_DEPTH_CLIP_CONTROL_CREATE_INFO_EXT,pNext=None,negativeOneToOne=None,):
+
+    return _new('VkPipelineViewportDepthClipControlCreateInfoEXT', sType=sType,pNext=pNext,negativeOneToOne=negativeOneToOne)
+
+def VkPhysicalDeviceVertexInputDynamicStateFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VERTEX_INPUT_DYNAMIC_STATE_FEATURES_EXT,pNext=None,vertexInputDynamicState=None,):
+
+    return _new('VkPhysicalDeviceVertexInputDynamicStateFeaturesEXT', sType=sType,pNext=pNext,vertexInputDynamicState=vertexInputDynamicState)
+
+def VkVertexInputBindingDescription2EXT(sType=VK_STRUCTURE_TYPE_VERTEX_INPUT_BINDING_DESCRIPTION_2_EXT,pNext=None,binding=None,stride=None,inputRate=None,divisor=None,):
+
+    return _new('VkVertexInputBindingDescription2EXT', sType=sType,pNext=pNext,binding=binding,stride=stride,inputRate=inputRate,divisor=divisor)
+
+def VkVertexInputAttributeDescription2EXT(sType=VK_STRUCTURE_TYPE_VERTEX_INPUT_ATTRIBUTE_DESCRIPTION_2_EXT,pNext=None,location=None,binding=None,format=None,offset=None,):
+
+    return _new('VkVertexInputAttributeDescription2EXT', sType=sType,pNext=pNext,location=location,binding=binding,format=format,offset=offset)
+
+def VkPhysicalDeviceColorWriteEnableFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COLOR_WRITE_ENABLE_FEATURES_EXT,pNext=None,colorWriteEnable=None,):
+
+    return _new('VkPhysicalDeviceColorWriteEnableFeaturesEXT', sType=sType,pNext=pNext,colorWriteEnable=colorWriteEnable)
+
+def VkPipelineColorWriteCreateInfoEXT(sType=VK_STRUCTURE_TYPE_PIPELINE_COLOR_WRITE_CREATE_INFO_EXT,pNext=None,attachmentCount=None,pColorWriteEnables=None,):
+    if attachmentCount is None and pColorWriteEnables is not None:
+        attachmentCount = len(pColorWriteEnables)
+
+    return _new('VkPipelineColorWriteCreateInfoEXT', sType=sType,pNext=pNext,attachmentCount=attachmentCount,pColorWriteEnables=pColorWriteEnables)
+
+def VkPhysicalDeviceHostImageCopyFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_HOST_IMAGE_COPY_FEATURES_EXT,pNext=None,hostImageCopy=None,):
+
+    return _new('VkPhysicalDeviceHostImageCopyFeaturesEXT', sType=sType,pNext=pNext,hostImageCopy=hostImageCopy)
+
+def VkPhysicalDeviceHostImageCopyPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_HOST_IMAGE_COPY_PROPERTIES_EXT,pNext=None,copySrcLayoutCount=None,pCopySrcLayouts=None,copyDstLayoutCount=None,pCopyDstLayouts=None,optimalTilingLayoutUUID=None,identicalMemoryTypeRequirements=None,):
+    if copySrcLayoutCount is None and pCopySrcLayouts is not None:
+        copySrcLayoutCount = len(pCopySrcLayouts)
+    if copyDstLayoutCount is None and pCopyDstLayouts is not None:
+        copyDstLayoutCount = len(pCopyDstLayouts)
+
+    return _new('VkPhysicalDeviceHostImageCopyPropertiesEXT', sType=sType,pNext=pNext,copySrcLayoutCount=copySrcLayoutCount,pCopySrcLayouts=pCopySrcLayouts,copyDstLayoutCount=copyDstLayoutCount,pCopyDstLayouts=pCopyDstLayouts,optimalTilingLayoutUUID=optimalTilingLayoutUUID,identicalMemoryTypeRequirements=identicalMemoryTypeRequirements)
+
+def VkMemoryToImageCopyEXT(sType=VK_STRUCTURE_TYPE_MEMORY_TO_IMAGE_COPY_EXT,pNext=None,pHostPointer=None,memoryRowLength=None,memoryImageHeight=None,imageSubresource=None,imageOffset=None,imageExtent=None,):
+
+    return _new('VkMemoryToImageCopyEXT', sType=sType,pNext=pNext,pHostPointer=pHostPointer,memoryRowLength=memoryRowLength,memoryImageHeight=memoryImageHeight,imageSubresource=imageSubresource,imageOffset=imageOffset,imageExtent=imageExtent)
+
+def VkImageToMemoryCopyEXT(sType=VK_STRUCTURE_TYPE_IMAGE_TO_MEMORY_COPY_EXT,pNext=None,pHostPointer=None,memoryRowLength=None,memoryImageHeight=None,imageSubresource=None,imageOffset=None,imageExtent=None,):
+
+    return _new('VkImageToMemoryCopyEXT', sType=sType,pNext=pNext,pHostPointer=pHostPointer,memoryRowLength=memoryRowLength,memoryImageHeight=memoryImageHeight,imageSubresource=imageSubresource,imageOffset=imageOffset,imageExtent=imageExtent)
+
+def VkCopyMemoryToImageInfoEXT(sType=VK_STRUCTURE_TYPE_COPY_MEMORY_TO_IMAGE_INFO_EXT,pNext=None,flags=None,dstImage=None,dstImageLayout=None,regionCount=None,pRegions=None,):
+    if regionCount is None and pRegions is not None:
+        regionCount = len(pRegions)
+
+    return _new('VkCopyMemoryToImageInfoEXT', sType=sType,pNext=pNext,flags=flags,dstImage=dstImage,dstImageLayout=dstImageLayout,regionCount=regionCount,pRegions=pRegions)
+
+def VkCopyImageToMemoryInfoEXT(sType=VK_STRUCTURE_TYPE_COPY_IMAGE_TO_MEMORY_INFO_EXT,pNext=None,flags=None,srcImage=None,srcImageLayout=None,regionCount=None,pRegions=None,):
+    if regionCount is None and pRegions is not None:
+        regionCount = len(pRegions)
+
+    return _new('VkCopyImageToMemoryInfoEXT', sType=sType,pNext=pNext,flags=flags,srcImage=srcImage,srcImageLayout=srcImageLayout,regionCount=regionCount,pRegions=pRegions)
+
+def VkCopyImageToImageInfoEXT(sType=VK_STRUCTURE_TYPE_COPY_IMAGE_TO_IMAGE_INFO_EXT,pNext=None,flags=None,srcImage=None,srcImageLayout=None,dstImage=None,dstImageLayout=None,regionCount=None,pRegions=None,):
+    if regionCount is None and pRegions is not None:
+        regionCount = len(pRegions)
+
+    return _new('VkCopyImageToImageInfoEXT', sType=sType,pNext=pNext,flags=flags,srcImage=srcImage,srcImageLayout=srcImageLayout,dstImage=dstImage,dstImageLayout=dstImageLayout,regionCount=regionCount,pRegions=pRegions)
+
+def VkHostImageLayoutTransitionInfoEXT(sType=VK_STRUCTURE_TYPE_HOST_IMAGE_LAYOUT_TRANSITION_INFO_EXT,pNext=None,image=None,oldLayout=None,newLayout=None,subresourceRange=None,):
+
+    return _new('VkHostImageLayoutTransitionInfoEXT', sType=sType,pNext=pNext,image=image,oldLayout=oldLayout,newLayout=newLayout,subresourceRange=subresourceRange)
+
+def VkSubresourceHostMemcpySizeEXT(sType=VK_STRUCTURE_TYPE_SUBRESOURCE_HOST_MEMCPY_SIZE_EXT,pNext=None,size=None,):
+
+    return _new('VkSubresourceHostMemcpySizeEXT', sType=sType,pNext=pNext,size=size)
+
+def VkHostImageCopyDevicePerformanceQueryEXT(sType=VK_STRUCTURE_TYPE_HOST_IMAGE_COPY_DEVICE_PERFORMANCE_QUERY_EXT,pNext=None,optimalDeviceAccess=None,identicalMemoryLayout=None,):
+
+    return _new('VkHostImageCopyDevicePerformanceQueryEXT', sType=sType,pNext=pNext,optimalDeviceAccess=optimalDeviceAccess,identicalMemoryLayout=identicalMemoryLayout)
+
+def VkPhysicalDevicePrimitivesGeneratedQueryFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PRIMITIVES_GENERATED_QUERY_FEATURES_EXT,pNext=None,primitivesGeneratedQuery=None,primitivesGeneratedQueryWithRasterizerDiscard=None,primitivesGeneratedQueryWithNonZeroStreams=None,):
+
+    return _new('VkPhysicalDevicePrimitivesGeneratedQueryFeaturesEXT', sType=sType,pNext=pNext,primitivesGeneratedQuery=primitivesGeneratedQuery,primitivesGeneratedQueryWithRasterizerDiscard=primitivesGeneratedQueryWithRasterizerDiscard,primitivesGeneratedQueryWithNonZeroStreams=primitivesGeneratedQueryWithNonZeroStreams)
+
+def VkPhysicalDeviceLegacyDitheringFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_LEGACY_DITHERING_FEATURES_EXT,pNext=None,legacyDithering=None,):
+
+    return _new('VkPhysicalDeviceLegacyDitheringFeaturesEXT', sType=sType,pNext=pNext,legacyDithering=legacyDithering)
+
+def VkPhysicalDeviceMultisampledRenderToSingleSampledFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTISAMPLED_RENDER_TO_SINGLE_SAMPLED_FEATURES_EXT,pNext=None,multisampledRenderToSingleSampled=None,):
+
+    return _new('VkPhysicalDeviceMultisampledRenderToSingleSampledFeaturesEXT', sType=sType,pNext=pNext,multisampledRenderToSingleSampled=multisampledRenderToSingleSampled)
+
+def VkSubpassResolvePerformanceQueryEXT(sType=VK_STRUCTURE_TYPE_SUBPASS_RESOLVE_PERFORMANCE_QUERY_EXT,pNext=None,optimal=None,):
+
+    return _new('VkSubpassResolvePerformanceQueryEXT', sType=sType,pNext=pNext,optimal=optimal)
+
+def VkMultisampledRenderToSingleSampledInfoEXT(sType=VK_STRUCTURE_TYPE_MULTISAMPLED_RENDER_TO_SINGLE_SAMPLED_INFO_EXT,pNext=None,multisampledRenderToSingleSampledEnable=None,rasterizationSamples=None,):
+
+    return _new('VkMultisampledRenderToSingleSampledInfoEXT', sType=sType,pNext=pNext,multisampledRenderToSingleSampledEnable=multisampledRenderToSingleSampledEnable,rasterizationSamples=rasterizationSamples)
+
+def VkPhysicalDevicePipelineProtectedAccessFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PIPELINE_PROTECTED_ACCESS_FEATURES_EXT,pNext=None,pipelineProtectedAccess=None,):
+
+    return _new('VkPhysicalDevicePipelineProtectedAccessFeaturesEXT', sType=sType,pNext=pNext,pipelineProtectedAccess=pipelineProtectedAccess)
+
+def VkPhysicalDeviceYcbcr2Plane444FormatsFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_YCBCR_2_PLANE_444_FORMATS_FEATURES_EXT,pNext=None,ycbcr2plane444Formats=None,):
+
+    return _new('VkPhysicalDeviceYcbcr2Plane444FormatsFeaturesEXT', sType=sType,pNext=pNext,ycbcr2plane444Formats=ycbcr2plane444Formats)
+
+def VkPhysicalDeviceProvokingVertexFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PROVOKING_VERTEX_FEATURES_EXT,pNext=None,provokingVertexLast=None,transformFeedbackPreservesProvokingVertex=None,):
+
+    return _new('VkPhysicalDeviceProvokingVertexFeaturesEXT', sType=sType,pNext=pNext,provokingVertexLast=provokingVertexLast,transformFeedbackPreservesProvokingVertex=transformFeedbackPreservesProvokingVertex)
+
+def VkPhysicalDeviceProvokingVertexPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PROVOKING_VERTEX_PROPERTIES_EXT,pNext=None,provokingVertexModePerPipeline=None,transformFeedbackPreservesTriangleFanProvokingVertex=None,):
+
+    return _new('VkPhysicalDeviceProvokingVertexPropertiesEXT', sType=sType,pNext=pNext,provokingVertexModePerPipeline=provokingVertexModePerPipeline,transformFeedbackPreservesTriangleFanProvokingVertex=transformFeedbackPreservesTriangleFanProvokingVertex)
+
+def VkPipelineRasterizationProvokingVertexStateCreateInfoEXT(sType=VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_PROVOKING_VERTEX_STATE_CREATE_INFO_EXT,pNext=None,provokingVertexMode=None,):
+
+    return _new('VkPipelineRasterizationProvokingVertexStateCreateInfoEXT', sType=sType,pNext=pNext,provokingVertexMode=provokingVertexMode)
+
+def VkPhysicalDeviceDescriptorBufferFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_FEATURES_EXT,pNext=None,descriptorBuffer=None,descriptorBufferCaptureReplay=None,descriptorBufferImageLayoutIgnored=None,descriptorBufferPushDescriptors=None,):
+
+    return _new('VkPhysicalDeviceDescriptorBufferFeaturesEXT', sType=sType,pNext=pNext,descriptorBuffer=descriptorBuffer,descriptorBufferCaptureReplay=descriptorBufferCaptureReplay,descriptorBufferImageLayoutIgnored=descriptorBufferImageLayoutIgnored,descriptorBufferPushDescriptors=descriptorBufferPushDescriptors)
+
+def VkPhysicalDeviceDescriptorBufferPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_PROPERTIES_EXT,pNext=None,combinedImageSamplerDescriptorSingleArray=None,bufferlessPushDescriptors=None,allowSamplerImageViewPostSubmitCreation=None,descriptorBufferOffsetAlignment=None,maxDescriptorBufferBindings=None,maxResourceDescriptorBufferBindings=None,maxSamplerDescriptorBufferBindings=None,maxEmbeddedImmutableSamplerBindings=None,maxEmbeddedImmutableSamplers=None,bufferCaptureReplayDescriptorDataSize=None,imageCaptureReplayDescriptorDataSize=None,imageViewCaptureReplayDescriptorDataSize=None,samplerCaptureReplayDescriptorDataSize=None,accelerationStructureCaptureReplayDescriptorDataSize=None,samplerDescriptorSize=None,combinedImageSamplerDescriptorSize=None,sampledImageDescriptorSize=None,storageImageDescriptorSize=None,uniformTexelBufferDescriptorSize=None,robustUniformTexelBufferDescriptorSize=None,storageTexelBufferDescriptorSize=None,robustStorageTexelBufferDescriptorSize=None,uniformBufferDescriptorSize=None,robustUniformBufferDescriptorSize=None,storageBufferDescriptorSize=None,robustStorageBufferDescriptorSize=None,inputAttachmentDescriptorSize=None,accelerationStructureDescriptorSize=None,maxSamplerDescriptorBufferRange=None,maxResourceDescriptorBufferRange=None,samplerDescriptorBufferAddressSpaceSize=None,resourceDescriptorBufferAddressSpaceSize=None,descriptorBufferAddressSpaceSize=None,):
+
+    return _new('VkPhysicalDeviceDescriptorBufferPropertiesEXT', sType=sType,pNext=pNext,combinedImageSamplerDescriptorSingleArray=combinedImageSamplerDescriptorSingleArray,bufferlessPushDescriptors=bufferlessPushDescriptors,allowSamplerImageViewPostSubmitCreation=allowSamplerImageViewPostSubmitCreation,descriptorBufferOffsetAlignment=descriptorBufferOffsetAlignment,maxDescriptorBufferBindings=maxDescriptorBufferBindings,maxResourceDescriptorBufferBindings=maxResourceDescriptorBufferBindings,maxSamplerDescriptorBufferBindings=maxSamplerDescriptorBufferBindings,maxEmbeddedImmutableSamplerBindings=maxEmbeddedImmutableSamplerBindings,maxEmbeddedImmutableSamplers=maxEmbeddedImmutableSamplers,bufferCaptureReplayDescriptorDataSize=bufferCaptureReplayDescriptorDataSize,imageCaptureReplayDescriptorDataSize=imageCaptureReplayDescriptorDataSize,imageViewCaptureReplayDescriptorDataSize=imageViewCaptureReplayDescriptorDataSize,samplerCaptureReplayDescriptorDataSize=samplerCaptureReplayDescriptorDataSize,accelerationStructureCaptureReplayDescriptorDataSize=accelerationStructureCaptureReplayDescriptorDataSize,samplerDescriptorSize=samplerDescriptorSize,combinedImageSamplerDescriptorSize=combinedImageSamplerDescriptorSize,sampledImageDescriptorSize=sampledImageDescriptorSize,storageImageDescriptorSize=storageImageDescriptorSize,uniformTexelBufferDescriptorSize=uniformTexelBufferDescriptorSize,robustUniformTexelBufferDescriptorSize=robustUniformTexelBufferDescriptorSize,storageTexelBufferDescriptorSize=storageTexelBufferDescriptorSize,robustStorageTexelBufferDescriptorSize=robustStorageTexelBufferDescriptorSize,uniformBufferDescriptorSize=uniformBufferDescriptorSize,robustUniformBufferDescriptorSize=robustUniformBufferDescriptorSize,storageBufferDescriptorSize=storageBufferDescriptorSize,robustStorageBufferDescriptorSize=robustStorageBufferDescriptorSize,inputAttachmentDescriptorSize=inputAttachmentDescriptorSize,accelerationStructureDescriptorSize=accelerationStructureDescriptorSize,maxSamplerDescriptorBufferRange=maxSamplerDescriptorBufferRange,maxResourceDescriptorBufferRange=maxResourceDescriptorBufferRange,samplerDescriptorBufferAddressSpaceSize=samplerDescriptorBufferAddressSpaceSize,resourceDescriptorBufferAddressSpaceSize=resourceDescriptorBufferAddressSpaceSize,descriptorBufferAddressSpaceSize=descriptorBufferAddressSpaceSize)
+
+def VkPhysicalDeviceDescriptorBufferDensityMapPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_DENSITY_MAP_PROPERTIES_EXT,pNext=None,combinedImageSamplerDensityMapDescriptorSize=None,):
+
+    return _new('VkPhysicalDeviceDescriptorBufferDensityMapPropertiesEXT', sType=sType,pNext=pNext,combinedImageSamplerDensityMapDescriptorSize=combinedImageSamplerDensityMapDescriptorSize)
+
+def VkDescriptorAddressInfoEXT(sType=VK_STRUCTURE_TYPE_DESCRIPTOR_ADDRESS_INFO_EXT,pNext=None,address=None,range=None,format=None,):
+
+    return _new('VkDescriptorAddressInfoEXT', sType=sType,pNext=pNext,address=address,range=range,format=format)
+
+def VkDescriptorBufferBindingInfoEXT(sType=VK_STRUCTURE_TYPE_DESCRIPTOR_BUFFER_BINDING_INFO_EXT,pNext=None,address=None,usage=None,):
+
+    return _new('VkDescriptorBufferBindingInfoEXT', sType=sType,pNext=pNext,address=address,usage=usage)
+
+def VkDescriptorBufferBindingPushDescriptorBufferHandleEXT(sType=VK_STRUCTURE_TYPE_DESCRIPTOR_BUFFER_BINDING_PUSH_DESCRIPTOR_BUFFER_HANDLE_EXT,pNext=None,buffer=None,):
+
+    return _new('VkDescriptorBufferBindingPushDescriptorBufferHandleEXT', sType=sType,pNext=pNext,buffer=buffer)
+
+def VkDescriptorDataEXT(pSampler=None,pCombinedImageSampler=None,pInputAttachmentImage=None,pSampledImage=None,pStorageImage=None,pUniformTexelBuffer=None,pStorageTexelBuffer=None,pUniformBuffer=None,pStorageBuffer=None,accelerationStructure=None,):
+
+    return _new('VkDescriptorDataEXT', pSampler=pSampler,pCombinedImageSampler=pCombinedImageSampler,pInputAttachmentImage=pInputAttachmentImage,pSampledImage=pSampledImage,pStorageImage=pStorageImage,pUniformTexelBuffer=pUniformTexelBuffer,pStorageTexelBuffer=pStorageTexelBuffer,pUniformBuffer=pUniformBuffer,pStorageBuffer=pStorageBuffer,accelerationStructure=accelerationStructure)
+
+def VkDescriptorGetInfoEXT(sType=VK_STRUCTURE_TYPE_DESCRIPTOR_GET_INFO_EXT,pNext=None,type=None,data=None,):
+
+    return _new('VkDescriptorGetInfoEXT', sType=sType,pNext=pNext,type=type,data=data)
+
+def VkBufferCaptureDescriptorDataInfoEXT(sType=VK_STRUCTURE_TYPE_BUFFER_CAPTURE_DESCRIPTOR_DATA_INFO_EXT,pNext=None,buffer=None,):
+
+    return _new('VkBufferCaptureDescriptorDataInfoEXT', sType=sType,pNext=pNext,buffer=buffer)
+
+def VkImageCaptureDescriptorDataInfoEXT(sType=VK_STRUCTURE_TYPE_IMAGE_CAPTURE_DESCRIPTOR_DATA_INFO_EXT,pNext=None,image=None,):
+
+    return _new('VkImageCaptureDescriptorDataInfoEXT', sType=sType,pNext=pNext,image=image)
+
+def VkImageViewCaptureDescriptorDataInfoEXT(sType=VK_STRUCTURE_TYPE_IMAGE_VIEW_CAPTURE_DESCRIPTOR_DATA_INFO_EXT,pNext=None,imageView=None,):
+
+    return _new('VkImageViewCaptureDescriptorDataInfoEXT', sType=sType,pNext=pNext,imageView=imageView)
+
+def VkSamplerCaptureDescriptorDataInfoEXT(sType=VK_STRUCTURE_TYPE_SAMPLER_CAPTURE_DESCRIPTOR_DATA_INFO_EXT,pNext=None,sampler=None,):
+
+    return _new('VkSamplerCaptureDescriptorDataInfoEXT', sType=sType,pNext=pNext,sampler=sampler)
+
+def VkAccelerationStructureCaptureDescriptorDataInfoEXT(sType=VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_CAPTURE_DESCRIPTOR_DATA_INFO_EXT,pNext=None,accelerationStructure=None,accelerationStructureNV=None,):
+
+    return _new('VkAccelerationStructureCaptureDescriptorDataInfoEXT', sType=sType,pNext=pNext,accelerationStructure=accelerationStructure,accelerationStructureNV=accelerationStructureNV)
+
+def VkOpaqueCaptureDescriptorDataCreateInfoEXT(sType=VK_STRUCTURE_TYPE_OPAQUE_CAPTURE_DESCRIPTOR_DATA_CREATE_INFO_EXT,pNext=None,opaqueCaptureDescriptorData=None,):
+
+    return _new('VkOpaqueCaptureDescriptorDataCreateInfoEXT', sType=sType,pNext=pNext,opaqueCaptureDescriptorData=opaqueCaptureDescriptorData)
+
+def VkPhysicalDeviceDrmPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DRM_PROPERTIES_EXT,pNext=None,hasPrimary=None,hasRender=None,primaryMajor=None,primaryMinor=None,renderMajor=None,renderMinor=None,):
+
+    return _new('VkPhysicalDeviceDrmPropertiesEXT', sType=sType,pNext=pNext,hasPrimary=hasPrimary,hasRender=hasRender,primaryMajor=primaryMajor,primaryMinor=primaryMinor,renderMajor=renderMajor,renderMinor=renderMinor)
+
+def VkPhysicalDeviceRGBA10X6FormatsFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RGBA10X6_FORMATS_FEATURES_EXT,pNext=None,formatRgba10x6WithoutYCbCrSampler=None,):
+
+    return _new('VkPhysicalDeviceRGBA10X6FormatsFeaturesEXT', sType=sType,pNext=pNext,formatRgba10x6WithoutYCbCrSampler=formatRgba10x6WithoutYCbCrSampler)
+
+def VkDrmFormatModifierPropertiesList2EXT(sType=VK_STRUCTURE_TYPE_DRM_FORMAT_MODIFIER_PROPERTIES_LIST_2_EXT,pNext=None,drmFormatModifierCount=None,pDrmFormatModifierProperties=None,):
+    if drmFormatModifierCount is None and pDrmFormatModifierProperties is not None:
+        drmFormatModifierCount = len(pDrmFormatModifierProperties)
+
+    return _new('VkDrmFormatModifierPropertiesList2EXT', sType=sType,pNext=pNext,drmFormatModifierCount=drmFormatModifierCount,pDrmFormatModifierProperties=pDrmFormatModifierProperties)
+
+def VkDrmFormatModifierProperties2EXT(drmFormatModifier=None,drmFormatModifierPlaneCount=None,drmFormatModifierTilingFeatures=None,):
+
+    return _new('VkDrmFormatModifierProperties2EXT', drmFormatModifier=drmFormatModifier,drmFormatModifierPlaneCount=drmFormatModifierPlaneCount,drmFormatModifierTilingFeatures=drmFormatModifierTilingFeatures)
+
+def VkPhysicalDeviceImageViewMinLodFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_VIEW_MIN_LOD_FEATURES_EXT,pNext=None,minLod=None,):
+
+    return _new('VkPhysicalDeviceImageViewMinLodFeaturesEXT', sType=sType,pNext=pNext,minLod=minLod)
+
+def VkImageViewMinLodCreateInfoEXT(sType=VK_STRUCTURE_TYPE_IMAGE_VIEW_MIN_LOD_CREATE_INFO_EXT,pNext=None,minLod=None,):
+
+    return _new('VkImageViewMinLodCreateInfoEXT', sType=sType,pNext=pNext,minLod=minLod)
+
+def VkPhysicalDeviceRasterizationOrderAttachmentAccessFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RASTERIZATION_ORDER_ATTACHMENT_ACCESS_FEATURES_EXT,pNext=None,rasterizationOrderColorAttachmentAccess=None,rasterizationOrderDepthAttachmentAccess=None,rasterizationOrderStencilAttachmentAccess=None,):
+
+    return _new('VkPhysicalDeviceRasterizationOrderAttachmentAccessFeaturesEXT', sType=sType,pNext=pNext,rasterizationOrderColorAttachmentAccess=rasterizationOrderColorAttachmentAccess,rasterizationOrderDepthAttachmentAccess=rasterizationOrderDepthAttachmentAccess,rasterizationOrderStencilAttachmentAccess=rasterizationOrderStencilAttachmentAccess)
+
+def VkPhysicalDeviceGraphicsPipelineLibraryFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_GRAPHICS_PIPELINE_LIBRARY_FEATURES_EXT,pNext=None,graphicsPipelineLibrary=None,):
+
+    return _new('VkPhysicalDeviceGraphicsPipelineLibraryFeaturesEXT', sType=sType,pNext=pNext,graphicsPipelineLibrary=graphicsPipelineLibrary)
+
+def VkPhysicalDeviceGraphicsPipelineLibraryPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_GRAPHICS_PIPELINE_LIBRARY_PROPERTIES_EXT,pNext=None,graphicsPipelineLibraryFastLinking=None,graphicsPipelineLibraryIndependentInterpolationDecoration=None,):
+
+    return _new('VkPhysicalDeviceGraphicsPipelineLibraryPropertiesEXT', sType=sType,pNext=pNext,graphicsPipelineLibraryFastLinking=graphicsPipelineLibraryFastLinking,graphicsPipelineLibraryIndependentInterpolationDecoration=graphicsPipelineLibraryIndependentInterpolationDecoration)
+
+def VkGraphicsPipelineLibraryCreateInfoEXT(sType=VK_STRUCTURE_TYPE_GRAPHICS_PIPELINE_LIBRARY_CREATE_INFO_EXT,pNext=None,flags=None,):
+
+    return _new('VkGraphicsPipelineLibraryCreateInfoEXT', sType=sType,pNext=pNext,flags=flags)
+
+def VkPhysicalDeviceNestedCommandBufferFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_NESTED_COMMAND_BUFFER_FEATURES_EXT,pNext=None,nestedCommandBuffer=None,nestedCommandBufferRendering=None,nestedCommandBufferSimultaneousUse=None,):
+
+    return _new('VkPhysicalDeviceNestedCommandBufferFeaturesEXT', sType=sType,pNext=pNext,nestedCommandBuffer=nestedCommandBuffer,nestedCommandBufferRendering=nestedCommandBufferRendering,nestedCommandBufferSimultaneousUse=nestedCommandBufferSimultaneousUse)
+
+def VkPhysicalDeviceNestedCommandBufferPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_NESTED_COMMAND_BUFFER_PROPERTIES_EXT,pNext=None,maxCommandBufferNestingLevel=None,):
+
+    return _new('VkPhysicalDeviceNestedCommandBufferPropertiesEXT', sType=sType,pNext=pNext,maxCommandBufferNestingLevel=maxCommandBufferNestingLevel)
+
+def VkPhysicalDeviceShaderModuleIdentifierFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_MODULE_IDENTIFIER_FEATURES_EXT,pNext=None,shaderModuleIdentifier=None,):
+
+    return _new('VkPhysicalDeviceShaderModuleIdentifierFeaturesEXT', sType=sType,pNext=pNext,shaderModuleIdentifier=shaderModuleIdentifier)
+
+def VkPhysicalDeviceShaderModuleIdentifierPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_MODULE_IDENTIFIER_PROPERTIES_EXT,pNext=None,shaderModuleIdentifierAlgorithmUUID=None,):
+
+    return _new('VkPhysicalDeviceShaderModuleIdentifierPropertiesEXT', sType=sType,pNext=pNext,shaderModuleIdentifierAlgorithmUUID=shaderModuleIdentifierAlgorithmUUID)
+
+def VkPipelineShaderStageModuleIdentifierCreateInfoEXT(sType=VK_STRUCTURE_TYPE_PIPELINE_SHADER_STAGE_MODULE_IDENTIFIER_CREATE_INFO_EXT,pNext=None,identifierSize=None,pIdentifier=None,):
+    if identifierSize is None and pIdentifier is not None:
+        identifierSize = len(pIdentifier)
+
+    return _new('VkPipelineShaderStageModuleIdentifierCreateInfoEXT', sType=sType,pNext=pNext,identifierSize=identifierSize,pIdentifier=pIdentifier)
+
+def VkShaderModuleIdentifierEXT(sType=VK_STRUCTURE_TYPE_SHADER_MODULE_IDENTIFIER_EXT,pNext=None,identifierSize=None,identifier=None,):
+
+    return _new('VkShaderModuleIdentifierEXT', sType=sType,pNext=pNext,identifierSize=identifierSize,identifier=identifier)
+
+def VkImageCompressionControlEXT(sType=VK_STRUCTURE_TYPE_IMAGE_COMPRESSION_CONTROL_EXT,pNext=None,flags=None,compressionControlPlaneCount=None,pFixedRateFlags=None,):
+    if compressionControlPlaneCount is None and pFixedRateFlags is not None:
+        compressionControlPlaneCount = len(pFixedRateFlags)
+
+    return _new('VkImageCompressionControlEXT', sType=sType,pNext=pNext,flags=flags,compressionControlPlaneCount=compressionControlPlaneCount,pFixedRateFlags=pFixedRateFlags)
+
+def VkPhysicalDeviceImageCompressionControlFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_COMPRESSION_CONTROL_FEATURES_EXT,pNext=None,imageCompressionControl=None,):
+
+    return _new('VkPhysicalDeviceImageCompressionControlFeaturesEXT', sType=sType,pNext=pNext,imageCompressionControl=imageCompressionControl)
+
+def VkImageCompressionPropertiesEXT(sType=VK_STRUCTURE_TYPE_IMAGE_COMPRESSION_PROPERTIES_EXT,pNext=None,imageCompressionFlags=None,imageCompressionFixedRateFlags=None,):
+
+    return _new('VkImageCompressionPropertiesEXT', sType=sType,pNext=pNext,imageCompressionFlags=imageCompressionFlags,imageCompressionFixedRateFlags=imageCompressionFixedRateFlags)
+
+def VkPhysicalDeviceImageCompressionControlSwapchainFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_COMPRESSION_CONTROL_SWAPCHAIN_FEATURES_EXT,pNext=None,imageCompressionControlSwapchain=None,):
+
+    return _new('VkPhysicalDeviceImageCompressionControlSwapchainFeaturesEXT', sType=sType,pNext=pNext,imageCompressionControlSwapchain=imageCompressionControlSwapchain)
+
+def VkRenderPassCreationControlEXT(sType=VK_STRUCTURE_TYPE_RENDER_PASS_CREATION_CONTROL_EXT,pNext=None,disallowMerging=None,):
+
+    return _new('VkRenderPassCreationControlEXT', sType=sType,pNext=pNext,disallowMerging=disallowMerging)
+
+def VkRenderPassCreationFeedbackInfoEXT(postMergeSubpassCount=None,):
+
+    return _new('VkRenderPassCreationFeedbackInfoEXT', postMergeSubpassCount=postMergeSubpassCount)
+
+def VkRenderPassCreationFeedbackCreateInfoEXT(sType=VK_STRUCTURE_TYPE_RENDER_PASS_CREATION_FEEDBACK_CREATE_INFO_EXT,pNext=None,pRenderPassFeedback=None,):
+
+    return _new('VkRenderPassCreationFeedbackCreateInfoEXT', sType=sType,pNext=pNext,pRenderPassFeedback=pRenderPassFeedback)
+
+def VkRenderPassSubpassFeedbackInfoEXT(subpassMergeStatus=None,description=None,postMergeIndex=None,):
+
+    return _new('VkRenderPassSubpassFeedbackInfoEXT', subpassMergeStatus=subpassMergeStatus,description=description,postMergeIndex=postMergeIndex)
+
+def VkRenderPassSubpassFeedbackCreateInfoEXT(sType=VK_STRUCTURE_TYPE_RENDER_PASS_SUBPASS_FEEDBACK_CREATE_INFO_EXT,pNext=None,pSubpassFeedback=None,):
+
+    return _new('VkRenderPassSubpassFeedbackCreateInfoEXT', sType=sType,pNext=pNext,pSubpassFeedback=pSubpassFeedback)
+
+def VkPhysicalDeviceSubpassMergeFeedbackFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBPASS_MERGE_FEEDBACK_FEATURES_EXT,pNext=None,subpassMergeFeedback=None,):
+
+    return _new('VkPhysicalDeviceSubpassMergeFeedbackFeaturesEXT', sType=sType,pNext=pNext,subpassMergeFeedback=subpassMergeFeedback)
+
+def VkMicromapBuildInfoEXT(sType=VK_STRUCTURE_TYPE_MICROMAP_BUILD_INFO_EXT,pNext=None,type=None,flags=None,mode=None,dstMicromap=None,usageCountsCount=None,pUsageCounts=None,ppUsageCounts=None,data=None,scratchData=None,triangleArray=None,triangleArrayStride=None,):
+    if usageCountsCount is None and pUsageCounts is not None:
+        usageCountsCount = len(pUsageCounts)
+    if usageCountsCount is None and ppUsageCounts is not None:
+        usageCountsCount = len(ppUsageCounts)
+
+    return _new('VkMicromapBuildInfoEXT', sType=sType,pNext=pNext,type=type,flags=flags,mode=mode,dstMicromap=dstMicromap,usageCountsCount=usageCountsCount,pUsageCounts=pUsageCounts,ppUsageCounts=ppUsageCounts,data=data,scratchData=scratchData,triangleArray=triangleArray,triangleArrayStride=triangleArrayStride)
+
+def VkMicromapCreateInfoEXT(sType=VK_STRUCTURE_TYPE_MICROMAP_CREATE_INFO_EXT,pNext=None,createFlags=None,buffer=None,offset=None,size=None,type=None,deviceAddress=None,):
+
+    return _new('VkMicromapCreateInfoEXT', sType=sType,pNext=pNext,createFlags=createFlags,buffer=buffer,offset=offset,size=size,type=type,deviceAddress=deviceAddress)
+
+def VkMicromapVersionInfoEXT(sType=VK_STRUCTURE_TYPE_MICROMAP_VERSION_INFO_EXT,pNext=None,pVersionData=None,):
+
+    return _new('VkMicromapVersionInfoEXT', sType=sType,pNext=pNext,pVersionData=pVersionData)
+
+def VkCopyMicromapInfoEXT(sType=VK_STRUCTURE_TYPE_COPY_MICROMAP_INFO_EXT,pNext=None,src=None,dst=None,mode=None,):
+
+    return _new('VkCopyMicromapInfoEXT', sType=sType,pNext=pNext,src=src,dst=dst,mode=mode)
+
+def VkCopyMicromapToMemoryInfoEXT(sType=VK_STRUCTURE_TYPE_COPY_MICROMAP_TO_MEMORY_INFO_EXT,pNext=None,src=None,dst=None,mode=None,):
+
+    return _new('VkCopyMicromapToMemoryInfoEXT', sType=sType,pNext=pNext,src=src,dst=dst,mode=mode)
+
+def VkCopyMemoryToMicromapInfoEXT(sType=VK_STRUCTURE_TYPE_COPY_MEMORY_TO_MICROMAP_INFO_EXT,pNext=None,src=None,dst=None,mode=None,):
+
+    return _new('VkCopyMemoryToMicromapInfoEXT', sType=sType,pNext=pNext,src=src,dst=dst,mode=mode)
+
+def VkMicromapBuildSizesInfoEXT(sType=VK_STRUCTURE_TYPE_MICROMAP_BUILD_SIZES_INFO_EXT,pNext=None,micromapSize=None,buildScratchSize=None,discardable=None,):
+
+    return _new('VkMicromapBuildSizesInfoEXT', sType=sType,pNext=pNext,micromapSize=micromapSize,buildScratchSize=buildScratchSize,discardable=discardable)
+
+def VkMicromapUsageEXT(count=None,subdivisionLevel=None,format=None,):
+
+    return _new('VkMicromapUsageEXT', count=count,subdivisionLevel=subdivisionLevel,format=format)
+
+def VkMicromapTriangleEXT(dataOffset=None,subdivisionLevel=None,format=None,):
+
+    return _new('VkMicromapTriangleEXT', dataOffset=dataOffset,subdivisionLevel=subdivisionLevel,format=format)
+
+def VkPhysicalDeviceOpacityMicromapFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_OPACITY_MICROMAP_FEATURES_EXT,pNext=None,micromap=None,micromapCaptureReplay=None,micromapHostCommands=None,):
+
+    return _new('VkPhysicalDeviceOpacityMicromapFeaturesEXT', sType=sType,pNext=pNext,micromap=micromap,micromapCaptureReplay=micromapCaptureReplay,micromapHostCommands=micromapHostCommands)
+
+def VkPhysicalDeviceOpacityMicromapPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_OPACITY_MICROMAP_PROPERTIES_EXT,pNext=None,maxOpacity2StateSubdivisionLevel=None,maxOpacity4StateSubdivisionLevel=None,):
+
+    return _new('VkPhysicalDeviceOpacityMicromapPropertiesEXT', sType=sType,pNext=pNext,maxOpacity2StateSubdivisionLevel=maxOpacity2StateSubdivisionLevel,maxOpacity4StateSubdivisionLevel=maxOpacity4StateSubdivisionLevel)
+
+def VkAccelerationStructureTrianglesOpacityMicromapEXT(sType=VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_TRIANGLES_OPACITY_MICROMAP_EXT,pNext=None,indexType=None,indexBuffer=None,indexStride=None,baseTriangle=None,usageCountsCount=None,pUsageCounts=None,ppUsageCounts=None,micromap=None,):
+    if usageCountsCount is None and pUsageCounts is not None:
+        usageCountsCount = len(pUsageCounts)
+    if usageCountsCount is None and ppUsageCounts is not None:
+        usageCountsCount = len(ppUsageCounts)
+
+    return _new('VkAccelerationStructureTrianglesOpacityMicromapEXT', sType=sType,pNext=pNext,indexType=indexType,indexBuffer=indexBuffer,indexStride=indexStride,baseTriangle=baseTriangle,usageCountsCount=usageCountsCount,pUsageCounts=pUsageCounts,ppUsageCounts=ppUsageCounts,micromap=micromap)
+
+def VkPipelinePropertiesIdentifierEXT(sType=VK_STRUCTURE_TYPE_PIPELINE_PROPERTIES_IDENTIFIER_EXT,pNext=None,pipelineIdentifier=None,):
+
+    return _new('VkPipelinePropertiesIdentifierEXT', sType=sType,pNext=pNext,pipelineIdentifier=pipelineIdentifier)
+
+def VkPhysicalDevicePipelinePropertiesFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PIPELINE_PROPERTIES_FEATURES_EXT,pNext=None,pipelinePropertiesIdentifier=None,):
+
+    return _new('VkPhysicalDevicePipelinePropertiesFeaturesEXT', sType=sType,pNext=pNext,pipelinePropertiesIdentifier=pipelinePropertiesIdentifier)
+
+def VkExternalMemoryAcquireUnmodifiedEXT(sType=VK_STRUCTURE_TYPE_EXTERNAL_MEMORY_ACQUIRE_UNMODIFIED_EXT,pNext=None,acquireUnmodifiedMemory=None,):
+
+    return _new('VkExternalMemoryAcquireUnmodifiedEXT', sType=sType,pNext=pNext,acquireUnmodifiedMemory=acquireUnmodifiedMemory)
+
+def VkExportMetalObjectCreateInfoEXT(sType=VK_STRUCTURE_TYPE_EXPORT_METAL_OBJECT_CREATE_INFO_EXT,pNext=None,exportObjectType=None,):
+
+    return _new('VkExportMetalObjectCreateInfoEXT', sType=sType,pNext=pNext,exportObjectType=exportObjectType)
+
+def VkExportMetalObjectsInfoEXT(sType=VK_STRUCTURE_TYPE_EXPORT_METAL_OBJECTS_INFO_EXT,pNext=None,):
+
+    return _new('VkExportMetalObjectsInfoEXT', sType=sType,pNext=pNext)
+
+def VkExportMetalDeviceInfoEXT(sType=VK_STRUCTURE_TYPE_EXPORT_METAL_DEVICE_INFO_EXT,pNext=None,mtlDevice=None,):
+
+    return _new('VkExportMetalDeviceInfoEXT', sType=sType,pNext=pNext,mtlDevice=mtlDevice)
+
+def VkExportMetalCommandQueueInfoEXT(sType=VK_STRUCTURE_TYPE_EXPORT_METAL_COMMAND_QUEUE_INFO_EXT,pNext=None,queue=None,mtlCommandQueue=None,):
+
+    return _new('VkExportMetalCommandQueueInfoEXT', sType=sType,pNext=pNext,queue=queue,mtlCommandQueue=mtlCommandQueue)
+
+def VkExportMetalBufferInfoEXT(sType=VK_STRUCTURE_TYPE_EXPORT_METAL_BUFFER_INFO_EXT,pNext=None,memory=None,mtlBuffer=None,):
+
+    return _new('VkExportMetalBufferInfoEXT', sType=sType,pNext=pNext,memory=memory,mtlBuffer=mtlBuffer)
+
+def VkImportMetalBufferInfoEXT(sType=VK_STRUCTURE_TYPE_IMPORT_METAL_BUFFER_INFO_EXT,pNext=None,mtlBuffer=None,):
+
+    return _new('VkImportMetalBufferInfoEXT', sType=sType,pNext=pNext,mtlBuffer=mtlBuffer)
+
+def VkExportMetalTextureInfoEXT(sType=VK_STRUCTURE_TYPE_EXPORT_METAL_TEXTURE_INFO_EXT,pNext=None,image=None,imageView=None,bufferView=None,plane=None,mtlTexture=None,):
+
+    return _new('VkExportMetalTextureInfoEXT', sType=sType,pNext=pNext,image=image,imageView=imageView,bufferView=bufferView,plane=plane,mtlTexture=mtlTexture)
+
+def VkImportMetalTextureInfoEXT(sType=VK_STRUCTURE_TYPE_IMPORT_METAL_TEXTURE_INFO_EXT,pNext=None,plane=None,mtlTexture=None,):
+
+    return _new('VkImportMetalTextureInfoEXT', sType=sType,pNext=pNext,plane=plane,mtlTexture=mtlTexture)
+
+def VkExportMetalIOSurfaceInfoEXT(sType=VK_STRUCTURE_TYPE_EXPORT_METAL_IO_SURFACE_INFO_EXT,pNext=None,image=None,ioSurface=None,):
+
+    return _new('VkExportMetalIOSurfaceInfoEXT', sType=sType,pNext=pNext,image=image,ioSurface=ioSurface)
+
+def VkImportMetalIOSurfaceInfoEXT(sType=VK_STRUCTURE_TYPE_IMPORT_METAL_IO_SURFACE_INFO_EXT,pNext=None,ioSurface=None,):
+
+    return _new('VkImportMetalIOSurfaceInfoEXT', sType=sType,pNext=pNext,ioSurface=ioSurface)
+
+def VkExportMetalSharedEventInfoEXT(sType=VK_STRUCTURE_TYPE_EXPORT_METAL_SHARED_EVENT_INFO_EXT,pNext=None,semaphore=None,event=None,mtlSharedEvent=None,):
+
+    return _new('VkExportMetalSharedEventInfoEXT', sType=sType,pNext=pNext,semaphore=semaphore,event=event,mtlSharedEvent=mtlSharedEvent)
+
+def VkImportMetalSharedEventInfoEXT(sType=VK_STRUCTURE_TYPE_IMPORT_METAL_SHARED_EVENT_INFO_EXT,pNext=None,mtlSharedEvent=None,):
+
+    return _new('VkImportMetalSharedEventInfoEXT', sType=sType,pNext=pNext,mtlSharedEvent=mtlSharedEvent)
+
+def VkPhysicalDeviceNonSeamlessCubeMapFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_NON_SEAMLESS_CUBE_MAP_FEATURES_EXT,pNext=None,nonSeamlessCubeMap=None,):
+
+    return _new('VkPhysicalDeviceNonSeamlessCubeMapFeaturesEXT', sType=sType,pNext=pNext,nonSeamlessCubeMap=nonSeamlessCubeMap)
+
+def VkPhysicalDevicePipelineRobustnessFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PIPELINE_ROBUSTNESS_FEATURES_EXT,pNext=None,pipelineRobustness=None,):
+
+    return _new('VkPhysicalDevicePipelineRobustnessFeaturesEXT', sType=sType,pNext=pNext,pipelineRobustness=pipelineRobustness)
+
+def VkPipelineRobustnessCreateInfoEXT(sType=VK_STRUCTURE_TYPE_PIPELINE_ROBUSTNESS_CREATE_INFO_EXT,pNext=None,storageBuffers=None,uniformBuffers=None,vertexInputs=None,images=None,):
+
+    return _new('VkPipelineRobustnessCreateInfoEXT', sType=sType,pNext=pNext,storageBuffers=storageBuffers,uniformBuffers=uniformBuffers,vertexInputs=vertexInputs,images=images)
+
+def VkPhysicalDevicePipelineRobustnessPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PIPELINE_ROBUSTNESS_PROPERTIES_EXT,pNext=None,defaultRobustnessStorageBuffers=None,defaultRobustnessUniformBuffers=None,defaultRobustnessVertexInputs=None,defaultRobustnessImages=None,):
+
+    return _new('VkPhysicalDevicePipelineRobustnessPropertiesEXT', sType=sType,pNext=pNext,defaultRobustnessStorageBuffers=defaultRobustnessStorageBuffers,defaultRobustnessUniformBuffers=defaultRobustnessUniformBuffers,defaultRobustnessVertexInputs=defaultRobustnessVertexInputs,defaultRobustnessImages=defaultRobustnessImages)
+
+def VkPhysicalDeviceAttachmentFeedbackLoopLayoutFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ATTACHMENT_FEEDBACK_LOOP_LAYOUT_FEATURES_EXT,pNext=None,attachmentFeedbackLoopLayout=None,):
+
+    return _new('VkPhysicalDeviceAttachmentFeedbackLoopLayoutFeaturesEXT', sType=sType,pNext=pNext,attachmentFeedbackLoopLayout=attachmentFeedbackLoopLayout)
+
+def VkPhysicalDeviceDepthClampZeroOneFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEPTH_CLAMP_ZERO_ONE_FEATURES_EXT,pNext=None,depthClampZeroOne=None,):
+
+    return _new('VkPhysicalDeviceDepthClampZeroOneFeaturesEXT', sType=sType,pNext=pNext,depthClampZeroOne=depthClampZeroOne)
+
+def VkPhysicalDeviceAddressBindingReportFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ADDRESS_BINDING_REPORT_FEATURES_EXT,pNext=None,reportAddressBinding=None,):
+
+    return _new('VkPhysicalDeviceAddressBindingReportFeaturesEXT', sType=sType,pNext=pNext,reportAddressBinding=reportAddressBinding)
+
+def VkDeviceAddressBindingCallbackDataEXT(sType=VK_STRUCTURE_TYPE_DEVICE_ADDRESS_BINDING_CALLBACK_DATA_EXT,pNext=None,flags=None,baseAddress=None,size=None,bindingType=None,):
+
+    return _new('VkDeviceAddressBindingCallbackDataEXT', sType=sType,pNext=pNext,flags=flags,baseAddress=baseAddress,size=size,bindingType=bindingType)
+
+def VkPhysicalDeviceFaultFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FAULT_FEATURES_EXT,pNext=None,deviceFault=None,deviceFaultVendorBinary=None,):
+
+    return _new('VkPhysicalDeviceFaultFeaturesEXT', sType=sType,pNext=pNext,deviceFault=deviceFault,deviceFaultVendorBinary=deviceFaultVendorBinary)
+
+def VkDeviceFaultAddressInfoEXT(addressType=None,reportedAddress=None,addressPrecision=None,):
+
+    return _new('VkDeviceFaultAddressInfoEXT', addressType=addressType,reportedAddress=reportedAddress,addressPrecision=addressPrecision)
+
+def VkDeviceFaultVendorInfoEXT(description=None,vendorFaultCode=None,vendorFaultData=None,):
+
+    return _new('VkDeviceFaultVendorInfoEXT', description=description,vendorFaultCode=vendorFaultCode,vendorFaultData=vendorFaultData)
+
+def VkDeviceFaultCountsEXT(sType=VK_STRUCTURE_TYPE_DEVICE_FAULT_COUNTS_EXT,pNext=None,addressInfoCount=None,vendorInfoCount=None,vendorBinarySize=None,):
+
+    return _new('VkDeviceFaultCountsEXT', sType=sType,pNext=pNext,addressInfoCount=addressInfoCount,vendorInfoCount=vendorInfoCount,vendorBinarySize=vendorBinarySize)
+
+def VkDeviceFaultInfoEXT(sType=VK_STRUCTURE_TYPE_DEVICE_FAULT_INFO_EXT,pNext=None,description=None,pAddressInfos=None,pVendorInfos=None,pVendorBinaryData=None,):
+
+    return _new('VkDeviceFaultInfoEXT', sType=sType,pNext=pNext,description=description,pAddressInfos=pAddressInfos,pVendorInfos=pVendorInfos,pVendorBinaryData=pVendorBinaryData)
+
+def VkDeviceFaultVendorBinaryHeaderVersionOneEXT(headerSize=None,headerVersion=None,vendorID=None,deviceID=None,driverVersion=None,pipelineCacheUUID=None,applicationNameOffset=None,applicationVersion=None,engineNameOffset=None,engineVersion=None,apiVersion=None,):
+
+    return _new('VkDeviceFaultVendorBinaryHeaderVersionOneEXT', headerSize=headerSize,headerVersion=headerVersion,vendorID=vendorID,deviceID=deviceID,driverVersion=driverVersion,pipelineCacheUUID=pipelineCacheUUID,applicationNameOffset=applicationNameOffset,applicationVersion=applicationVersion,engineNameOffset=engineNameOffset,engineVersion=engineVersion,apiVersion=apiVersion)
+
+def VkPhysicalDevicePipelineLibraryGroupHandlesFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PIPELINE_LIBRARY_GROUP_HANDLES_FEATURES_EXT,pNext=None,pipelineLibraryGroupHandles=None,):
+
+    return _new('VkPhysicalDevicePipelineLibraryGroupHandlesFeaturesEXT', sType=sType,pNext=pNext,pipelineLibraryGroupHandles=pipelineLibraryGroupHandles)
+
+def VkDepthBiasInfoEXT(sType=VK_STRUCTURE_TYPE_DEPTH_BIAS_INFO_EXT,pNext=None,depthBiasConstantFactor=None,depthBiasClamp=None,depthBiasSlopeFactor=None,):
+
+    return _new('VkDepthBiasInfoEXT', sType=sType,pNext=pNext,depthBiasConstantFactor=depthBiasConstantFactor,depthBiasClamp=depthBiasClamp,depthBiasSlopeFactor=depthBiasSlopeFactor)
+
+def VkDepthBiasRepresentationInfoEXT(sType=VK_STRUCTURE_TYPE_DEPTH_BIAS_REPRESENTATION_INFO_EXT,pNext=None,depthBiasRepresentation=None,depthBiasExact=None,):
+
+    return _new('VkDepthBiasRepresentationInfoEXT', sType=sType,pNext=pNext,depthBiasRepresentation=depthBiasRepresentation,depthBiasExact=depthBiasExact)
+
+def VkFrameBoundaryEXT(sType=VK_STRUCTURE_TYPE_FRAME_BOUNDARY_EXT,pNext=None,flags=None,frameID=None,imageCount=None,pImages=None,bufferCount=None,pBuffers=None,tagName=None,tagSize=None,pTag=None,):
+    if imageCount is None and pImages is not None:
+        imageCount = len(pImages)
+    if bufferCount is None and pBuffers is not None:
+        bufferCount = len(pBuffers)
+    if tagSize is None and pTag is not None:
+        tagSize = len(pTag)
+
+    return _new('VkFrameBoundaryEXT', sType=sType,pNext=pNext,flags=flags,frameID=frameID,imageCount=imageCount,pImages=pImages,bufferCount=bufferCount,pBuffers=pBuffers,tagName=tagName,tagSize=tagSize,pTag=pTag)
+
+def VkPhysicalDeviceFrameBoundaryFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAME_BOUNDARY_FEATURES_EXT,pNext=None,frameBoundary=None,):
+
+    return _new('VkPhysicalDeviceFrameBoundaryFeaturesEXT', sType=sType,pNext=pNext,frameBoundary=frameBoundary)
+
+def VkPhysicalDeviceDynamicRenderingUnusedAttachmentsFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DYNAMIC_RENDERING_UNUSED_ATTACHMENTS_FEATURES_EXT,pNext=None,dynamicRenderingUnusedAttachments=None,):
+
+    return _new('VkPhysicalDeviceDynamicRenderingUnusedAttachmentsFeaturesEXT', sType=sType,pNext=pNext,dynamicRenderingUnusedAttachments=dynamicRenderingUnusedAttachments)
+
+def VkSurfacePresentModeEXT(sType=VK_STRUCTURE_TYPE_SURFACE_PRESENT_MODE_EXT,pNext=None,presentMode=None,):
+
+    return _new('VkSurfacePresentModeEXT', sType=sType,pNext=pNext,presentMode=presentMode)
+
+def VkSurfacePresentScalingCapabilitiesEXT(sType=VK_STRUCTURE_TYPE_SURFACE_PRESENT_SCALING_CAPABILITIES_EXT,pNext=None,supportedPresentScaling=None,supportedPresentGravityX=None,supportedPresentGravityY=None,minScaledImageExtent=None,maxScaledImageExtent=None,):
+
+    return _new('VkSurfacePresentScalingCapabilitiesEXT', sType=sType,pNext=pNext,supportedPresentScaling=supportedPresentScaling,supportedPresentGravityX=supportedPresentGravityX,supportedPresentGravityY=supportedPresentGravityY,minScaledImageExtent=minScaledImageExtent,maxScaledImageExtent=maxScaledImageExtent)
+
+def VkSurfacePresentModeCompatibilityEXT(sType=VK_STRUCTURE_TYPE_SURFACE_PRESENT_MODE_COMPATIBILITY_EXT,pNext=None,presentModeCount=None,pPresentModes=None,):
+    if presentModeCount is None and pPresentModes is not None:
+        presentModeCount = len(pPresentModes)
+
+    return _new('VkSurfacePresentModeCompatibilityEXT', sType=sType,pNext=pNext,presentModeCount=presentModeCount,pPresentModes=pPresentModes)
+
+def VkPhysicalDeviceSwapchainMaintenance1FeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SWAPCHAIN_MAINTENANCE_1_FEATURES_EXT,pNext=None,swapchainMaintenance1=None,):
+
+    return _new('VkPhysicalDeviceSwapchainMaintenance1FeaturesEXT', sType=sType,pNext=pNext,swapchainMaintenance1=swapchainMaintenance1)
+
+def VkSwapchainPresentFenceInfoEXT(sType=VK_STRUCTURE_TYPE_SWAPCHAIN_PRESENT_FENCE_INFO_EXT,pNext=None,swapchainCount=None,pFences=None,):
+    if swapchainCount is None and pFences is not None:
+        swapchainCount = len(pFences)
+
+    return _new('VkSwapchainPresentFenceInfoEXT', sType=sType,pNext=pNext,swapchainCount=swapchainCount,pFences=pFences)
+
+def VkSwapchainPresentModesCreateInfoEXT(sType=VK_STRUCTURE_TYPE_SWAPCHAIN_PRESENT_MODES_CREATE_INFO_EXT,pNext=None,presentModeCount=None,pPresentModes=None,):
+    if presentModeCount is None and pPresentModes is not None:
+        presentModeCount = len(pPresentModes)
+
+    return _new('VkSwapchainPresentModesCreateInfoEXT', sType=sType,pNext=pNext,presentModeCount=presentModeCount,pPresentModes=pPresentModes)
+
+def VkSwapchainPresentModeInfoEXT(sType=VK_STRUCTURE_TYPE_SWAPCHAIN_PRESENT_MODE_INFO_EXT,pNext=None,swapchainCount=None,pPresentModes=None,):
+    if swapchainCount is None and pPresentModes is not None:
+        swapchainCount = len(pPresentModes)
+
+    return _new('VkSwapchainPresentModeInfoEXT', sType=sType,pNext=pNext,swapchainCount=swapchainCount,pPresentModes=pPresentModes)
+
+def VkSwapchainPresentScalingCreateInfoEXT(sType=VK_STRUCTURE_TYPE_SWAPCHAIN_PRESENT_SCALING_CREATE_INFO_EXT,pNext=None,scalingBehavior=None,presentGravityX=None,presentGravityY=None,):
+
+    return _new('VkSwapchainPresentScalingCreateInfoEXT', sType=sType,pNext=pNext,scalingBehavior=scalingBehavior,presentGravityX=presentGravityX,presentGravityY=presentGravityY)
+
+def VkReleaseSwapchainImagesInfoEXT(sType=VK_STRUCTURE_TYPE_RELEASE_SWAPCHAIN_IMAGES_INFO_EXT,pNext=None,swapchain=None,imageIndexCount=None,pImageIndices=None,):
+    if imageIndexCount is None and pImageIndices is not None:
+        imageIndexCount = len(pImageIndices)
+
+    return _new('VkReleaseSwapchainImagesInfoEXT', sType=sType,pNext=pNext,swapchain=swapchain,imageIndexCount=imageIndexCount,pImageIndices=pImageIndices)
+
+def VkPhysicalDeviceDepthBiasControlFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEPTH_BIAS_CONTROL_FEATURES_EXT,pNext=None,depthBiasControl=None,leastRepresentableValueForceUnormRepresentation=None,floatRepresentation=None,depthBiasExact=None,):
+
+    return _new('VkPhysicalDeviceDepthBiasControlFeaturesEXT', sType=sType,pNext=pNext,depthBiasControl=depthBiasControl,leastRepresentableValueForceUnormRepresentation=leastRepresentableValueForceUnormRepresentation,floatRepresentation=floatRepresentation,depthBiasExact=depthBiasExact)
+
+def VkPhysicalDeviceShaderObjectFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_OBJECT_FEATURES_EXT,pNext=None,shaderObject=None,):
+
+    return _new('VkPhysicalDeviceShaderObjectFeaturesEXT', sType=sType,pNext=pNext,shaderObject=shaderObject)
+
+def VkPhysicalDeviceShaderObjectPropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_OBJECT_PROPERTIES_EXT,pNext=None,shaderBinaryUUID=None,shaderBinaryVersion=None,):
+
+    return _new('VkPhysicalDeviceShaderObjectPropertiesEXT', sType=sType,pNext=pNext,shaderBinaryUUID=shaderBinaryUUID,shaderBinaryVersion=shaderBinaryVersion)
+
+def VkShaderCreateInfoEXT(sType=VK_STRUCTURE_TYPE_SHADER_CREATE_INFO_EXT,pNext=None,flags=None,stage=None,nextStage=None,codeType=None,codeSize=None,pCode=None,pName=None,setLayoutCount=None,pSetLayouts=None,pushConstantRangeCount=None,pPushConstantRanges=None,pSpecializationInfo=None,):
+    if codeSize is None and pCode is not None:
+        codeSize = len(pCode)
+    if setLayoutCount is None and pSetLayouts is not None:
+        setLayoutCount = len(pSetLayouts)
+    if pushConstantRangeCount is None and pPushConstantRanges is not None:
+        pushConstantRangeCount = len(pPushConstantRanges)
+
+    return _new('VkShaderCreateInfoEXT', sType=sType,pNext=pNext,flags=flags,stage=stage,nextStage=nextStage,codeType=codeType,codeSize=codeSize,pCode=pCode,pName=pName,setLayoutCount=setLayoutCount,pSetLayouts=pSetLayouts,pushConstantRangeCount=pushConstantRangeCount,pPushConstantRanges=pPushConstantRanges,pSpecializationInfo=pSpecializationInfo)
+
+def VkPhysicalDeviceShaderTileImageFeaturesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_TILE_IMAGE_FEATURES_EXT,pNext=None,shaderTileImageColorReadAccess=None,shaderTileImageDepthReadAccess=None,shaderTileImageStencilReadAccess=None,):
+
+    return _new('VkPhysicalDeviceShaderTileImageFeaturesEXT', sType=sType,pNext=pNext,shaderTileImageColorReadAccess=shaderTileImageColorReadAccess,shaderTileImageDepthReadAccess=shaderTileImageDepthReadAccess,shaderTileImageStencilReadAccess=shaderTileImageStencilReadAccess)
+
+def VkPhysicalDeviceShaderTileImagePropertiesEXT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_TILE_IMAGE_PROPERTIES_EXT,pNext=None,shaderTileImageCoherentReadAccelerated=None,shaderTileImageReadSampleFromPixelRateInvocation=None,shaderTileImageReadFromHelperInvocation=None,):
+
+    return _new('VkPhysicalDeviceShaderTileImagePropertiesEXT', sType=sType,pNext=pNext,shaderTileImageCoherentReadAccelerated=shaderTileImageCoherentReadAccelerated,shaderTileImageReadSampleFromPixelRateInvocation=shaderTileImageReadSampleFromPixelRateInvocation,shaderTileImageReadFromHelperInvocation=shaderTileImageReadFromHelperInvocation)
+
+
+
+
+
+
+
+
+
+
+def _wrap_vkCmdSetAttachmentFeedbackLoopEnableEXT(fn):
+    def vkCmdSetAttachmentFeedbackLoopEnableEXT(
+    commandBuffer
+            ,aspectMask
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),aspectMask)
+
+
+    return vkCmdSetAttachmentFeedbackLoopEnableEXT
+def _wrap_vkCmdDrawMultiEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdDrawMultiEXT(
+    commandBuffer
+            ,drawCount
+            ,pVertexInfo
+            ,instanceCount
+            ,firstInstance
+            ,stride
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),drawCount,_auto_handle(pVertexInfo, _args[2]),instanceCount,firstInstance,stride)
+
+
+    return vkCmdDrawMultiEXT
+def _wrap_vkCmdDrawMultiIndexedEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdDrawMultiIndexedEXT(
+    commandBuffer
+            ,drawCount
+            ,pIndexInfo
+            ,instanceCount
+            ,firstInstance
+            ,stride
+            ,pVertexOffset
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),drawCount,_auto_handle(pIndexInfo, _args[2]),instanceCount,firstInstance,stride,_auto_handle(pVertexOffset, _args[6]))
+
+
+    return vkCmdDrawMultiIndexedEXT
+def _wrap_vkCmdBeginConditionalRenderingEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdBeginConditionalRenderingEXT(
+    commandBuffer
+            ,pConditionalRenderingBegin
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pConditionalRenderingBegin, _args[1]))
+
+
+    return vkCmdBeginConditionalRenderingEXT
+def _wrap_vkCmdEndConditionalRenderingEXT(fn):
+    def vkCmdEndConditionalRenderingEXT(
+    commandBuffer
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'))
+
+
+    return vkCmdEndConditionalRenderingEXT
+def _wrap_vkCreateDirectFBSurfaceEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateDirectFBSurfaceEXT(
+    instance
+            ,pCreateInfo
+            ,pAllocator
+            ,pSurface=None
+            ,):
+
+
+        custom_return = True
+        if not pSurface:
+            pSurface = ffi.new('VkSurfaceKHR*')
+            custom_return = False
+
+        result = fn(_handle(instance, 'VkInstance'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pSurface, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSurface
+
+        return pSurface[0]
+
+
+
+    return vkCreateDirectFBSurfaceEXT
+def _wrap_vkGetPhysicalDeviceDirectFBPresentationSupportEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceDirectFBPresentationSupportEXT(
+    physicalDevice
+            ,queueFamilyIndex
+            ,dfb
+            ,):
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),queueFamilyIndex,_auto_handle(dfb, _args[2]))
+
+
+    return vkGetPhysicalDeviceDirectFBPresentationSupportEXT
+def _wrap_vkCreateDebugReportCallbackEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateDebugReportCallbackEXT(
+    instance
+            ,pCreateInfo
+            ,pAllocator
+            ,pCallback=None
+            ,):
+
+
+        custom_return = True
+        if not pCallback:
+            pCallback = ffi.new('VkDebugReportCallbackEXT*')
+            custom_return = False
+
+        result = fn(_handle(instance, 'VkInstance'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pCallback, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pCallback
+
+        return pCallback[0]
+
+
+
+    return vkCreateDebugReportCallbackEXT
+def _wrap_vkDestroyDebugReportCallbackEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkDestroyDebugReportCallbackEXT(
+    instance
+            ,callback
+            ,pAllocator
+            ,):
+
+        result = fn(_handle(instance, 'VkInstance'),_handle(callback, 'VkDebugReportCallbackEXT'),_auto_handle(pAllocator, _args[2]))
+
+
+    return vkDestroyDebugReportCallbackEXT
+def _wrap_vkDebugReportMessageEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkDebugReportMessageEXT(
+    instance
+            ,flags
+            ,objectType
+            ,object
+            ,location
+            ,messageCode
+            ,pLayerPrefix
+            ,pMessage
+            ,):
+
+        result = fn(_handle(instance, 'VkInstance'),flags,objectType,object,location,messageCode,_auto_handle(pLayerPrefix, _args[6]),_auto_handle(pMessage, _args[7]))
+
+
+    return vkDebugReportMessageEXT
+def _wrap_vkDebugMarkerSetObjectNameEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkDebugMarkerSetObjectNameEXT(
+    device
+            ,pNameInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pNameInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkDebugMarkerSetObjectNameEXT
+def _wrap_vkDebugMarkerSetObjectTagEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkDebugMarkerSetObjectTagEXT(
+    device
+            ,pTagInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pTagInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkDebugMarkerSetObjectTagEXT
+def _wrap_vkCmdDebugMarkerBeginEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdDebugMarkerBeginEXT(
+    commandBuffer
+            ,pMarkerInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pMarkerInfo, _args[1]))
+
+
+    return vkCmdDebugMarkerBeginEXT
+def _wrap_vkCmdDebugMarkerEndEXT(fn):
+    def vkCmdDebugMarkerEndEXT(
+    commandBuffer
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'))
+
+
+    return vkCmdDebugMarkerEndEXT
+def _wrap_vkCmdDebugMarkerInsertEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdDebugMarkerInsertEXT(
+    commandBuffer
+            ,pMarkerInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pMarkerInfo, _args[1]))
+
+
+    return vkCmdDebugMarkerInsertEXT
+def _wrap_vkReleaseDisplayEXT(fn):
+    def vkReleaseDisplayEXT(
+    physicalDevice
+            ,display
+            ,):
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_handle(display, 'VkDisplayKHR'))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkReleaseDisplayEXT
+def _wrap_vkAcquireXlibDisplayEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkAcquireXlibDisplayEXT(
+    physicalDevice
+            ,dpy
+            ,display=None
+            ,):
+
+
+        custom_return = True
+        if not display:
+            display = ffi.new('VkDisplayKHR*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(dpy, _args[1]),_handle(display, 'VkDisplayKHR'))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return display
+
+        return display[0]
+
+
+
+    return vkAcquireXlibDisplayEXT
+def _wrap_vkGetRandROutputDisplayEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetRandROutputDisplayEXT(
+    physicalDevice
+            ,dpy
+            ,rrOutput
+            ,pDisplay=None
+            ,):
+
+
+        custom_return = True
+        if not pDisplay:
+            pDisplay = ffi.new('VkDisplayKHR*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(dpy, _args[1]),_auto_handle(rrOutput, _args[2]),_auto_handle(pDisplay, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pDisplay
+
+        return pDisplay[0]
+
+
+
+    return vkGetRandROutputDisplayEXT
+def _wrap_vkDisplayPowerControlEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkDisplayPowerControlEXT(
+    device
+            ,display
+            ,pDisplayPowerInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(display, 'VkDisplayKHR'),_auto_handle(pDisplayPowerInfo, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkDisplayPowerControlEXT
+def _wrap_vkRegisterDeviceEventEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkRegisterDeviceEventEXT(
+    device
+            ,pDeviceEventInfo
+            ,pAllocator
+            ,pFence
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pDeviceEventInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pFence, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkRegisterDeviceEventEXT
+def _wrap_vkRegisterDisplayEventEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkRegisterDisplayEventEXT(
+    device
+            ,display
+            ,pDisplayEventInfo
+            ,pAllocator
+            ,pFence
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(display, 'VkDisplayKHR'),_auto_handle(pDisplayEventInfo, _args[2]),_auto_handle(pAllocator, _args[3]),_auto_handle(pFence, _args[4]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkRegisterDisplayEventEXT
+def _wrap_vkGetSwapchainCounterEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetSwapchainCounterEXT(
+    device
+            ,swapchain
+            ,counter
+            ,pCounterValue=None
+            ,):
+
+
+        custom_return = True
+        if not pCounterValue:
+            pCounterValue = ffi.new('uint64_t*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(swapchain, 'VkSwapchainKHR'),counter,_auto_handle(pCounterValue, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pCounterValue
+
+        return pCounterValue[0]
+
+
+
+    return vkGetSwapchainCounterEXT
+def _wrap_vkGetPhysicalDeviceSurfaceCapabilities2EXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceSurfaceCapabilities2EXT(
+    physicalDevice
+            ,surface
+            ,pSurfaceCapabilities=None
+            ,):
+
+
+        custom_return = True
+        if not pSurfaceCapabilities:
+            pSurfaceCapabilities = ffi.new('VkSurfaceCapabilities2EXT*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_handle(surface, 'VkSurfaceKHR'),_auto_handle(pSurfaceCapabilities, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSurfaceCapabilities
+
+        return pSurfaceCapabilities[0]
+
+
+
+    return vkGetPhysicalDeviceSurfaceCapabilities2EXT
+def _wrap_vkSetHdrMetadataEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkSetHdrMetadataEXT(
+    device
+            ,swapchainCount
+            ,pSwapchains
+            ,pMetadata
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),swapchainCount,_auto_handle(pSwapchains, _args[2]),_auto_handle(pMetadata, _args[3]))
+
+
+    return vkSetHdrMetadataEXT
+def _wrap_vkCreateMetalSurfaceEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateMetalSurfaceEXT(
+    instance
+            ,pCreateInfo
+            ,pAllocator
+            ,pSurface=None
+            ,):
+
+
+        custom_return = True
+        if not pSurface:
+            pSurface = ffi.new('VkSurfaceKHR*')
+            custom_return = False
+
+        result = fn(_handle(instance, 'VkInstance'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pSurface, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSurface
+
+        return pSurface[0]
+
+
+
+    return vkCreateMetalSurfaceEXT
+def _wrap_vkCmdSetDiscardRectangleEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetDiscardRectangleEXT(
+    commandBuffer
+            ,firstDiscardRectangle
+            ,discardRectangleCount
+            ,pDiscardRectangles
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),firstDiscardRectangle,discardRectangleCount,_auto_handle(pDiscardRectangles, _args[3]))
+
+
+    return vkCmdSetDiscardRectangleEXT
+def _wrap_vkCmdSetDiscardRectangleEnableEXT(fn):
+    def vkCmdSetDiscardRectangleEnableEXT(
+    commandBuffer
+            ,discardRectangleEnable
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),discardRectangleEnable)
+
+
+    return vkCmdSetDiscardRectangleEnableEXT
+def _wrap_vkCmdSetDiscardRectangleModeEXT(fn):
+    def vkCmdSetDiscardRectangleModeEXT(
+    commandBuffer
+            ,discardRectangleMode
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),discardRectangleMode)
+
+
+    return vkCmdSetDiscardRectangleModeEXT
+def _wrap_vkCmdSetSampleLocationsEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetSampleLocationsEXT(
+    commandBuffer
+            ,pSampleLocationsInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pSampleLocationsInfo, _args[1]))
+
+
+    return vkCmdSetSampleLocationsEXT
+def _wrap_vkGetPhysicalDeviceMultisamplePropertiesEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceMultisamplePropertiesEXT(
+    physicalDevice
+            ,samples
+            ,pMultisampleProperties=None
+            ,):
+
+
+        custom_return = True
+        if not pMultisampleProperties:
+            pMultisampleProperties = ffi.new('VkMultisamplePropertiesEXT*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),samples,_auto_handle(pMultisampleProperties, _args[2]))
+
+        if custom_return:
+            return pMultisampleProperties
+
+        return pMultisampleProperties[0]
+
+
+
+    return vkGetPhysicalDeviceMultisamplePropertiesEXT
+def _wrap_vkCreateValidationCacheEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateValidationCacheEXT(
+    device
+            ,pCreateInfo
+            ,pAllocator
+            ,pValidationCache=None
+            ,):
+
+
+        custom_return = True
+        if not pValidationCache:
+            pValidationCache = ffi.new('VkValidationCacheEXT*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pValidationCache, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pValidationCache
+
+        return pValidationCache[0]
+
+
+
+    return vkCreateValidationCacheEXT
+def _wrap_vkDestroyValidationCacheEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkDestroyValidationCacheEXT(
+    device
+            ,validationCache
+            ,pAllocator
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(validationCache, 'VkValidationCacheEXT'),_auto_handle(pAllocator, _args[2]))
+
+
+    return vkDestroyValidationCacheEXT
+def _wrap_vkGetValidationCacheDataEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetValidationCacheDataEXT(
+    device
+            ,validationCache
+            ,pDataSize
+            ,pData=None
+            ,):
+
+
+        custom_return = True
+        if not pData:
+            pData = ffi.new('void[%d]' % pDataSize)
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(validationCache, 'VkValidationCacheEXT'),_auto_handle(pDataSize, _args[2]),_auto_handle(pData, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pData
+
+        return pData
+
+
+
+    return vkGetValidationCacheDataEXT
+def _wrap_vkMergeValidationCachesEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkMergeValidationCachesEXT(
+    device
+            ,dstCache
+            ,srcCacheCount
+            ,pSrcCaches
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(dstCache, 'VkValidationCacheEXT'),srcCacheCount,_auto_handle(pSrcCaches, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkMergeValidationCachesEXT
+def _wrap_vkSetDebugUtilsObjectNameEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkSetDebugUtilsObjectNameEXT(
+    device
+            ,pNameInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pNameInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkSetDebugUtilsObjectNameEXT
+def _wrap_vkSetDebugUtilsObjectTagEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkSetDebugUtilsObjectTagEXT(
+    device
+            ,pTagInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pTagInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkSetDebugUtilsObjectTagEXT
+def _wrap_vkQueueBeginDebugUtilsLabelEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkQueueBeginDebugUtilsLabelEXT(
+    queue
+            ,pLabelInfo
+            ,):
+
+        result = fn(_handle(queue, 'VkQueue'),_auto_handle(pLabelInfo, _args[1]))
+
+
+    return vkQueueBeginDebugUtilsLabelEXT
+def _wrap_vkQueueEndDebugUtilsLabelEXT(fn):
+    def vkQueueEndDebugUtilsLabelEXT(
+    queue
+            ,):
+
+        result = fn(_handle(queue, 'VkQueue'))
+
+
+    return vkQueueEndDebugUtilsLabelEXT
+def _wrap_vkQueueInsertDebugUtilsLabelEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkQueueInsertDebugUtilsLabelEXT(
+    queue
+            ,pLabelInfo
+            ,):
+
+        result = fn(_handle(queue, 'VkQueue'),_auto_handle(pLabelInfo, _args[1]))
+
+
+    return vkQueueInsertDebugUtilsLabelEXT
+def _wrap_vkCmdBeginDebugUtilsLabelEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdBeginDebugUtilsLabelEXT(
+    commandBuffer
+            ,pLabelInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pLabelInfo, _args[1]))
+
+
+    return vkCmdBeginDebugUtilsLabelEXT
+def _wrap_vkCmdEndDebugUtilsLabelEXT(fn):
+    def vkCmdEndDebugUtilsLabelEXT(
+    commandBuffer
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'))
+
+
+    return vkCmdEndDebugUtilsLabelEXT
+def _wrap_vkCmdInsertDebugUtilsLabelEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdInsertDebugUtilsLabelEXT(
+    commandBuffer
+            ,pLabelInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pLabelInfo, _args[1]))
+
+
+    return vkCmdInsertDebugUtilsLabelEXT
+def _wrap_vkCreateDebugUtilsMessengerEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateDebugUtilsMessengerEXT(
+    instance
+            ,pCreateInfo
+            ,pAllocator
+            ,pMessenger=None
+            ,):
+
+
+        custom_return = True
+        if not pMessenger:
+            pMessenger = ffi.new('VkDebugUtilsMessengerEXT*')
+            custom_return = False
+
+        result = fn(_handle(instance, 'VkInstance'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pMessenger, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pMessenger
+
+        return pMessenger[0]
+
+
+
+    return vkCreateDebugUtilsMessengerEXT
+def _wrap_vkDestroyDebugUtilsMessengerEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkDestroyDebugUtilsMessengerEXT(
+    instance
+            ,messenger
+            ,pAllocator
+            ,):
+
+        result = fn(_handle(instance, 'VkInstance'),_handle(messenger, 'VkDebugUtilsMessengerEXT'),_auto_handle(pAllocator, _args[2]))
+
+
+    return vkDestroyDebugUtilsMessengerEXT
+def _wrap_vkSubmitDebugUtilsMessageEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkSubmitDebugUtilsMessageEXT(
+    instance
+            ,messageSeverity
+            ,messageTypes
+            ,pCallbackData
+            ,):
+
+        result = fn(_handle(instance, 'VkInstance'),messageSeverity,messageTypes,_auto_handle(pCallbackData, _args[3]))
+
+
+    return vkSubmitDebugUtilsMessageEXT
+def _wrap_vkGetMemoryHostPointerPropertiesEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetMemoryHostPointerPropertiesEXT(
+    device
+            ,handleType
+            ,pHostPointer
+            ,pMemoryHostPointerProperties=None
+            ,):
+
+
+        custom_return = True
+        if not pMemoryHostPointerProperties:
+            pMemoryHostPointerProperties = ffi.new('VkMemoryHostPointerPropertiesEXT*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),handleType,_auto_handle(pHostPointer, _args[2]),_auto_handle(pMemoryHostPointerProperties, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pMemoryHostPointerProperties
+
+        return pMemoryHostPointerProperties[0]
+
+
+
+    return vkGetMemoryHostPointerPropertiesEXT
+def _wrap_vkCmdBindTransformFeedbackBuffersEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdBindTransformFeedbackBuffersEXT(
+    commandBuffer
+            ,firstBinding
+            ,bindingCount
+            ,pBuffers
+            ,pOffsets
+            ,pSizes
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),firstBinding,bindingCount,_auto_handle(pBuffers, _args[3]),_auto_handle(pOffsets, _args[4]),_auto_handle(pSizes, _args[5]))
+
+
+    return vkCmdBindTransformFeedbackBuffersEXT
+def _wrap_vkCmdBeginTransformFeedbackEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdBeginTransformFeedbackEXT(
+    commandBuffer
+            ,firstCounterBuffer
+            ,counterBufferCount
+            ,pCounterBuffers
+            ,pCounterBufferOffsets
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),firstCounterBuffer,counterBufferCount,_auto_handle(pCounterBuffers, _args[3]),_auto_handle(pCounterBufferOffsets, _args[4]))
+
+
+    return vkCmdBeginTransformFeedbackEXT
+def _wrap_vkCmdEndTransformFeedbackEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdEndTransformFeedbackEXT(
+    commandBuffer
+            ,firstCounterBuffer
+            ,counterBufferCount
+            ,pCounterBuffers
+            ,pCounterBufferOffsets
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),firstCounterBuffer,counterBufferCount,_auto_handle(pCounterBuffers, _args[3]),_auto_handle(pCounterBufferOffsets, _args[4]))
+
+
+    return vkCmdEndTransformFeedbackEXT
+def _wrap_vkCmdBeginQueryIndexedEXT(fn):
+    def vkCmdBeginQueryIndexedEXT(
+    commandBuffer
+            ,queryPool
+            ,query
+            ,flags
+            ,index
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_handle(queryPool, 'VkQueryPool'),query,flags,index)
+
+
+    return vkCmdBeginQueryIndexedEXT
+def _wrap_vkCmdEndQueryIndexedEXT(fn):
+    def vkCmdEndQueryIndexedEXT(
+    commandBuffer
+            ,queryPool
+            ,query
+            ,index
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_handle(queryPool, 'VkQueryPool'),query,index)
+
+
+    return vkCmdEndQueryIndexedEXT
+def _wrap_vkCmdDrawIndirectByteCountEXT(fn):
+    def vkCmdDrawIndirectByteCountEXT(
+    commandBuffer
+            ,instanceCount
+            ,firstInstance
+            ,counterBuffer
+            ,counterBufferOffset
+            ,counterOffset
+            ,vertexStride
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),instanceCount,firstInstance,_handle(counterBuffer, 'VkBuffer'),counterBufferOffset,counterOffset,vertexStride)
+
+
+    return vkCmdDrawIndirectByteCountEXT
+def _wrap_vkCmdDrawMeshTasksEXT(fn):
+    def vkCmdDrawMeshTasksEXT(
+    commandBuffer
+            ,groupCountX
+            ,groupCountY
+            ,groupCountZ
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),groupCountX,groupCountY,groupCountZ)
+
+
+    return vkCmdDrawMeshTasksEXT
+def _wrap_vkCmdDrawMeshTasksIndirectEXT(fn):
+    def vkCmdDrawMeshTasksIndirectEXT(
+    commandBuffer
+            ,buffer
+            ,offset
+            ,drawCount
+            ,stride
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_handle(buffer, 'VkBuffer'),offset,drawCount,stride)
+
+
+    return vkCmdDrawMeshTasksIndirectEXT
+def _wrap_vkCmdDrawMeshTasksIndirectCountEXT(fn):
+    def vkCmdDrawMeshTasksIndirectCountEXT(
+    commandBuffer
+            ,buffer
+            ,offset
+            ,countBuffer
+            ,countBufferOffset
+            ,maxDrawCount
+            ,stride
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_handle(buffer, 'VkBuffer'),offset,_handle(countBuffer, 'VkBuffer'),countBufferOffset,maxDrawCount,stride)
+
+
+    return vkCmdDrawMeshTasksIndirectCountEXT
+def _wrap_vkGetPhysicalDeviceSurfacePresentModes2EXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceSurfacePresentModes2EXT(
+    physicalDevice
+            ,pSurfaceInfo
+            ,pPresentModes=None
+            ,):
+
+
+        pPresentModeCount = ffi.new('uint32_t*')
+        custom_return = pPresentModes is not None
+        _array = pPresentModes
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pPresentModeCount[0] = len(_array)
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pSurfaceInfo, _args[1]),pPresentModeCount,pPresentModes)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pPresentModes = ffi.NULL
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pSurfaceInfo, _args[1]),pPresentModeCount,pPresentModes)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pPresentModeCount[0]:
+                _array = ffi.new('VkPresentModeKHR[]', pPresentModeCount[0])
+            pPresentModes = _array
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pSurfaceInfo, _args[1]),pPresentModeCount,pPresentModes)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pPresentModeCount[0] != len(_array):
+            pPresentModes = _slice(_array, pPresentModeCount[0])
+
+        return pPresentModes
+
+
+    return vkGetPhysicalDeviceSurfacePresentModes2EXT
+def _wrap_vkGetDeviceGroupSurfacePresentModes2EXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetDeviceGroupSurfacePresentModes2EXT(
+    device
+            ,pSurfaceInfo
+            ,pModes=None
+            ,):
+
+
+        custom_return = True
+        if not pModes:
+            pModes = ffi.new('VkDeviceGroupPresentModeFlagsKHR*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pSurfaceInfo, _args[1]),_auto_handle(pModes, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pModes
+
+        return pModes[0]
+
+
+
+    return vkGetDeviceGroupSurfacePresentModes2EXT
+def _wrap_vkAcquireFullScreenExclusiveModeEXT(fn):
+    def vkAcquireFullScreenExclusiveModeEXT(
+    device
+            ,swapchain=None
+            ,):
+
+
+        custom_return = True
+        if not swapchain:
+            swapchain = ffi.new('VkSwapchainKHR*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(swapchain, 'VkSwapchainKHR'))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return swapchain
+
+        return swapchain[0]
+
+
+
+    return vkAcquireFullScreenExclusiveModeEXT
+def _wrap_vkReleaseFullScreenExclusiveModeEXT(fn):
+    def vkReleaseFullScreenExclusiveModeEXT(
+    device
+            ,swapchain
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(swapchain, 'VkSwapchainKHR'))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkReleaseFullScreenExclusiveModeEXT
+def _wrap_vkGetImageDrmFormatModifierPropertiesEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetImageDrmFormatModifierPropertiesEXT(
+    device
+            ,image
+            ,pProperties=None
+            ,):
+
+
+        custom_return = True
+        if not pProperties:
+            pProperties = ffi.new('VkImageDrmFormatModifierPropertiesEXT*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(image, 'VkImage'),_auto_handle(pProperties, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pProperties
+
+        return pProperties[0]
+
+
+
+    return vkGetImageDrmFormatModifierPropertiesEXT
+def _wrap_vkCreateHeadlessSurfaceEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateHeadlessSurfaceEXT(
+    instance
+            ,pCreateInfo
+            ,pAllocator
+            ,pSurface=None
+            ,):
+
+
+        custom_return = True
+        if not pSurface:
+            pSurface = ffi.new('VkSurfaceKHR*')
+            custom_return = False
+
+        result = fn(_handle(instance, 'VkInstance'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pSurface, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSurface
+
+        return pSurface[0]
+
+
+
+    return vkCreateHeadlessSurfaceEXT
+def _wrap_vkCmdSetLineStippleEXT(fn):
+    def vkCmdSetLineStippleEXT(
+    commandBuffer
+            ,lineStippleFactor
+            ,lineStipplePattern
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),lineStippleFactor,lineStipplePattern)
+
+
+    return vkCmdSetLineStippleEXT
+def _wrap_vkCmdSetPatchControlPointsEXT(fn):
+    def vkCmdSetPatchControlPointsEXT(
+    commandBuffer
+            ,patchControlPoints
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),patchControlPoints)
+
+
+    return vkCmdSetPatchControlPointsEXT
+def _wrap_vkCmdSetLogicOpEXT(fn):
+    def vkCmdSetLogicOpEXT(
+    commandBuffer
+            ,logicOp
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),logicOp)
+
+
+    return vkCmdSetLogicOpEXT
+def _wrap_vkCmdSetTessellationDomainOriginEXT(fn):
+    def vkCmdSetTessellationDomainOriginEXT(
+    commandBuffer
+            ,domainOrigin
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),domainOrigin)
+
+
+    return vkCmdSetTessellationDomainOriginEXT
+def _wrap_vkCmdSetDepthClampEnableEXT(fn):
+    def vkCmdSetDepthClampEnableEXT(
+    commandBuffer
+            ,depthClampEnable
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),depthClampEnable)
+
+
+    return vkCmdSetDepthClampEnableEXT
+def _wrap_vkCmdSetPolygonModeEXT(fn):
+    def vkCmdSetPolygonModeEXT(
+    commandBuffer
+            ,polygonMode
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),polygonMode)
+
+
+    return vkCmdSetPolygonModeEXT
+def _wrap_vkCmdSetRasterizationSamplesEXT(fn):
+    def vkCmdSetRasterizationSamplesEXT(
+    commandBuffer
+            ,rasterizationSamples
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),rasterizationSamples)
+
+
+    return vkCmdSetRasterizationSamplesEXT
+def _wrap_vkCmdSetSampleMaskEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetSampleMaskEXT(
+    commandBuffer
+            ,samples
+            ,pSampleMask
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),samples,_auto_handle(pSampleMask, _args[2]))
+
+
+    return vkCmdSetSampleMaskEXT
+def _wrap_vkCmdSetAlphaToCoverageEnableEXT(fn):
+    def vkCmdSetAlphaToCoverageEnableEXT(
+    commandBuffer
+            ,alphaToCoverageEnable
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),alphaToCoverageEnable)
+
+
+    return vkCmdSetAlphaToCoverageEnableEXT
+def _wrap_vkCmdSetAlphaToOneEnableEXT(fn):
+    def vkCmdSetAlphaToOneEnableEXT(
+    commandBuffer
+            ,alphaToOneEnable
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),alphaToOneEnable)
+
+
+    return vkCmdSetAlphaToOneEnableEXT
+def _wrap_vkCmdSetLogicOpEnableEXT(fn):
+    def vkCmdSetLogicOpEnableEXT(
+    commandBuffer
+            ,logicOpEnable
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),logicOpEnable)
+
+
+    return vkCmdSetLogicOpEnableEXT
+def _wrap_vkCmdSetColorBlendEnableEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetColorBlendEnableEXT(
+    commandBuffer
+            ,firstAttachment
+            ,attachmentCount
+            ,pColorBlendEnables
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),firstAttachment,attachmentCount,_auto_handle(pColorBlendEnables, _args[3]))
+
+
+    return vkCmdSetColorBlendEnableEXT
+def _wrap_vkCmdSetColorBlendEquationEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetColorBlendEquationEXT(
+    commandBuffer
+            ,firstAttachment
+            ,attachmentCount
+            ,pColorBlendEquations
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),firstAttachment,attachmentCount,_auto_handle(pColorBlendEquations, _args[3]))
+
+
+    return vkCmdSetColorBlendEquationEXT
+def _wrap_vkCmdSetColorWriteMaskEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetColorWriteMaskEXT(
+    commandBuffer
+            ,firstAttachment
+            ,attachmentCount
+            ,pColorWriteMasks
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),firstAttachment,attachmentCount,_auto_handle(pColorWriteMasks, _args[3]))
+
+
+    return vkCmdSetColorWriteMaskEXT
+def _wrap_vkCmdSetRasterizationStreamEXT(fn):
+    def vkCmdSetRasterizationStreamEXT(
+    commandBuffer
+            ,rasterizationStream
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),rasterizationStream)
+
+
+    return vkCmdSetRasterizationStreamEXT
+def _wrap_vkCmdSetConservativeRasterizationModeEXT(fn):
+    def vkCmdSetConservativeRasterizationModeEXT(
+    commandBuffer
+            ,conservativeRasterizationMode
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),conservativeRasterizationMode)
+
+
+    return vkCmdSetConservativeRasterizationModeEXT
+def _wrap_vkCmdSetExtraPrimitiveOverestimationSizeEXT(fn):
+    def vkCmdSetExtraPrimitiveOverestimationSizeEXT(
+    commandBuffer
+            ,extraPrimitiveOverestimationSize
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),extraPrimitiveOverestimationSize)
+
+
+    return vkCmdSetExtraPrimitiveOverestimationSizeEXT
+def _wrap_vkCmdSetDepthClipEnableEXT(fn):
+    def vkCmdSetDepthClipEnableEXT(
+    commandBuffer
+            ,depthClipEnable
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),depthClipEnable)
+
+
+    return vkCmdSetDepthClipEnableEXT
+def _wrap_vkCmdSetSampleLocationsEnableEXT(fn):
+    def vkCmdSetSampleLocationsEnableEXT(
+    commandBuffer
+            ,sampleLocationsEnable
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),sampleLocationsEnable)
+
+
+    return vkCmdSetSampleLocationsEnableEXT
+def _wrap_vkCmdSetColorBlendAdvancedEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetColorBlendAdvancedEXT(
+    commandBuffer
+            ,firstAttachment
+            ,attachmentCount
+            ,pColorBlendAdvanced
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),firstAttachment,attachmentCount,_auto_handle(pColorBlendAdvanced, _args[3]))
+
+
+    return vkCmdSetColorBlendAdvancedEXT
+def _wrap_vkCmdSetProvokingVertexModeEXT(fn):
+    def vkCmdSetProvokingVertexModeEXT(
+    commandBuffer
+            ,provokingVertexMode
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),provokingVertexMode)
+
+
+    return vkCmdSetProvokingVertexModeEXT
+def _wrap_vkCmdSetLineRasterizationModeEXT(fn):
+    def vkCmdSetLineRasterizationModeEXT(
+    commandBuffer
+            ,lineRasterizationMode
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),lineRasterizationMode)
+
+
+    return vkCmdSetLineRasterizationModeEXT
+def _wrap_vkCmdSetLineStippleEnableEXT(fn):
+    def vkCmdSetLineStippleEnableEXT(
+    commandBuffer
+            ,stippledLineEnable
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),stippledLineEnable)
+
+
+    return vkCmdSetLineStippleEnableEXT
+def _wrap_vkCmdSetDepthClipNegativeOneToOneEXT(fn):
+    def vkCmdSetDepthClipNegativeOneToOneEXT(
+    commandBuffer
+            ,negativeOneToOne
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),negativeOneToOne)
+
+
+    return vkCmdSetDepthClipNegativeOneToOneEXT
+def _wrap_vkCmdSetViewportWScalingEnableNV(fn):
+    def vkCmdSetViewportWScalingEnableNV(
+    commandBuffer
+            ,viewportWScalingEnable
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),viewportWScalingEnable)
+
+
+    return vkCmdSetViewportWScalingEnableNV
+def _wrap_vkCmdSetViewportSwizzleNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetViewportSwizzleNV(
+    commandBuffer
+            ,firstViewport
+            ,viewportCount
+            ,pViewportSwizzles
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),firstViewport,viewportCount,_auto_handle(pViewportSwizzles, _args[3]))
+
+
+    return vkCmdSetViewportSwizzleNV
+def _wrap_vkCmdSetCoverageToColorEnableNV(fn):
+    def vkCmdSetCoverageToColorEnableNV(
+    commandBuffer
+            ,coverageToColorEnable
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),coverageToColorEnable)
+
+
+    return vkCmdSetCoverageToColorEnableNV
+def _wrap_vkCmdSetCoverageToColorLocationNV(fn):
+    def vkCmdSetCoverageToColorLocationNV(
+    commandBuffer
+            ,coverageToColorLocation
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),coverageToColorLocation)
+
+
+    return vkCmdSetCoverageToColorLocationNV
+def _wrap_vkCmdSetCoverageModulationModeNV(fn):
+    def vkCmdSetCoverageModulationModeNV(
+    commandBuffer
+            ,coverageModulationMode
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),coverageModulationMode)
+
+
+    return vkCmdSetCoverageModulationModeNV
+def _wrap_vkCmdSetCoverageModulationTableEnableNV(fn):
+    def vkCmdSetCoverageModulationTableEnableNV(
+    commandBuffer
+            ,coverageModulationTableEnable
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),coverageModulationTableEnable)
+
+
+    return vkCmdSetCoverageModulationTableEnableNV
+def _wrap_vkCmdSetCoverageModulationTableNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetCoverageModulationTableNV(
+    commandBuffer
+            ,coverageModulationTableCount
+            ,pCoverageModulationTable
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),coverageModulationTableCount,_auto_handle(pCoverageModulationTable, _args[2]))
+
+
+    return vkCmdSetCoverageModulationTableNV
+def _wrap_vkCmdSetShadingRateImageEnableNV(fn):
+    def vkCmdSetShadingRateImageEnableNV(
+    commandBuffer
+            ,shadingRateImageEnable
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),shadingRateImageEnable)
+
+
+    return vkCmdSetShadingRateImageEnableNV
+def _wrap_vkCmdSetCoverageReductionModeNV(fn):
+    def vkCmdSetCoverageReductionModeNV(
+    commandBuffer
+            ,coverageReductionMode
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),coverageReductionMode)
+
+
+    return vkCmdSetCoverageReductionModeNV
+def _wrap_vkCmdSetRepresentativeFragmentTestEnableNV(fn):
+    def vkCmdSetRepresentativeFragmentTestEnableNV(
+    commandBuffer
+            ,representativeFragmentTestEnable
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),representativeFragmentTestEnable)
+
+
+    return vkCmdSetRepresentativeFragmentTestEnableNV
+def _wrap_vkCmdSetVertexInputEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetVertexInputEXT(
+    commandBuffer
+            ,vertexBindingDescriptionCount
+            ,pVertexBindingDescriptions
+            ,vertexAttributeDescriptionCount
+            ,pVertexAttributeDescriptions
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),vertexBindingDescriptionCount,_auto_handle(pVertexBindingDescriptions, _args[2]),vertexAttributeDescriptionCount,_auto_handle(pVertexAttributeDescriptions, _args[4]))
+
+
+    return vkCmdSetVertexInputEXT
+def _wrap_vkCmdSetColorWriteEnableEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetColorWriteEnableEXT(
+    commandBuffer
+            ,attachmentCount
+            ,pColorWriteEnables
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),attachmentCount,_auto_handle(pColorWriteEnables, _args[2]))
+
+
+    return vkCmdSetColorWriteEnableEXT
+def _wrap_vkCopyMemoryToImageEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCopyMemoryToImageEXT(
+    device
+            ,pCopyMemoryToImageInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCopyMemoryToImageInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkCopyMemoryToImageEXT
+def _wrap_vkCopyImageToMemoryEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCopyImageToMemoryEXT(
+    device
+            ,pCopyImageToMemoryInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCopyImageToMemoryInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkCopyImageToMemoryEXT
+def _wrap_vkCopyImageToImageEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCopyImageToImageEXT(
+    device
+            ,pCopyImageToImageInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCopyImageToImageInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkCopyImageToImageEXT
+def _wrap_vkTransitionImageLayoutEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkTransitionImageLayoutEXT(
+    device
+            ,transitionCount
+            ,pTransitions
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),transitionCount,_auto_handle(pTransitions, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkTransitionImageLayoutEXT
+def _wrap_vkGetDescriptorSetLayoutSizeEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetDescriptorSetLayoutSizeEXT(
+    device
+            ,layout
+            ,pLayoutSizeInBytes=None
+            ,):
+
+
+        custom_return = True
+        if not pLayoutSizeInBytes:
+            pLayoutSizeInBytes = ffi.new('VkDeviceSize*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(layout, 'VkDescriptorSetLayout'),_auto_handle(pLayoutSizeInBytes, _args[2]))
+
+        if custom_return:
+            return pLayoutSizeInBytes
+
+        return pLayoutSizeInBytes[0]
+
+
+
+    return vkGetDescriptorSetLayoutSizeEXT
+def _wrap_vkGetDescriptorSetLayoutBindingOffsetEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetDescriptorSetLayoutBindingOffsetEXT(
+    device
+            ,layout
+            ,binding
+            ,pOffset=None
+            ,):
+
+
+        custom_return = True
+        if not pOffset:
+            pOffset = ffi.new('VkDeviceSize*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(layout, 'VkDescriptorSetLayout'),binding,_auto_handle(pOffset, _args[3]))
+
+        if custom_return:
+            return pOffset
+
+        return pOffset[0]
+
+
+
+    return vkGetDescriptorSetLayoutBindingOffsetEXT
+def _wrap_vkGetDescriptorEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetDescriptorEXT(
+    device
+            ,pDescriptorInfo
+            ,dataSize
+            ,pDescriptor=None
+            ,):
+
+
+        custom_return = True
+        if not pDescriptor:
+            pDescriptor = ffi.new('uint64_t[%d]' % dataSize)
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pDescriptorInfo, _args[1]),dataSize,_auto_handle(pDescriptor, _args[3]))
+
+        if custom_return:
+            return pDescriptor
+
+        return pDescriptor
+
+
+
+    return vkGetDescriptorEXT
+def _wrap_vkCmdBindDescriptorBuffersEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdBindDescriptorBuffersEXT(
+    commandBuffer
+            ,bufferCount
+            ,pBindingInfos
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),bufferCount,_auto_handle(pBindingInfos, _args[2]))
+
+
+    return vkCmdBindDescriptorBuffersEXT
+def _wrap_vkCmdSetDescriptorBufferOffsetsEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetDescriptorBufferOffsetsEXT(
+    commandBuffer
+            ,pipelineBindPoint
+            ,layout
+            ,firstSet
+            ,setCount
+            ,pBufferIndices
+            ,pOffsets
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),pipelineBindPoint,_handle(layout, 'VkPipelineLayout'),firstSet,setCount,_auto_handle(pBufferIndices, _args[5]),_auto_handle(pOffsets, _args[6]))
+
+
+    return vkCmdSetDescriptorBufferOffsetsEXT
+def _wrap_vkCmdBindDescriptorBufferEmbeddedSamplersEXT(fn):
+    def vkCmdBindDescriptorBufferEmbeddedSamplersEXT(
+    commandBuffer
+            ,pipelineBindPoint
+            ,layout
+            ,set
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),pipelineBindPoint,_handle(layout, 'VkPipelineLayout'),set)
+
+
+    return vkCmdBindDescriptorBufferEmbeddedSamplersEXT
+def _wrap_vkGetBufferOpaqueCaptureDescriptorDataEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetBufferOpaqueCaptureDescriptorDataEXT(
+    device
+            ,pInfo
+            ,pData=None
+            ,):
+
+
+        custom_return = True
+        if not pData:
+            pData = ffi.new('void*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),_auto_handle(pData, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pData
+
+        return pData[0]
+
+
+
+    return vkGetBufferOpaqueCaptureDescriptorDataEXT
+def _wrap_vkGetImageOpaqueCaptureDescriptorDataEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetImageOpaqueCaptureDescriptorDataEXT(
+    device
+            ,pInfo
+            ,pData=None
+            ,):
+
+
+        custom_return = True
+        if not pData:
+            pData = ffi.new('void*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),_auto_handle(pData, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pData
+
+        return pData[0]
+
+
+
+    return vkGetImageOpaqueCaptureDescriptorDataEXT
+def _wrap_vkGetImageViewOpaqueCaptureDescriptorDataEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetImageViewOpaqueCaptureDescriptorDataEXT(
+    device
+            ,pInfo
+            ,pData=None
+            ,):
+
+
+        custom_return = True
+        if not pData:
+            pData = ffi.new('void*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),_auto_handle(pData, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pData
+
+        return pData[0]
+
+
+
+    return vkGetImageViewOpaqueCaptureDescriptorDataEXT
+def _wrap_vkGetSamplerOpaqueCaptureDescriptorDataEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetSamplerOpaqueCaptureDescriptorDataEXT(
+    device
+            ,pInfo
+            ,pData=None
+            ,):
+
+
+        custom_return = True
+        if not pData:
+            pData = ffi.new('void*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),_auto_handle(pData, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pData
+
+        return pData[0]
+
+
+
+    return vkGetSamplerOpaqueCaptureDescriptorDataEXT
+def _wrap_vkGetAccelerationStructureOpaqueCaptureDescriptorDataEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetAccelerationStructureOpaqueCaptureDescriptorDataEXT(
+    device
+            ,pInfo
+            ,pData=None
+            ,):
+
+
+        custom_return = True
+        if not pData:
+            pData = ffi.new('void*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),_auto_handle(pData, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pData
+
+        return pData[0]
+
+
+
+    return vkGetAccelerationStructureOpaqueCaptureDescriptorDataEXT
+def _wrap_vkSetDeviceMemoryPriorityEXT(fn):
+    def vkSetDeviceMemoryPriorityEXT(
+    device
+            ,memory
+            ,priority
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(memory, 'VkDeviceMemory'),priority)
+
+
+    return vkSetDeviceMemoryPriorityEXT
+def _wrap_vkAcquireDrmDisplayEXT(fn):
+    def vkAcquireDrmDisplayEXT(
+    physicalDevice
+            ,drmFd
+            ,display=None
+            ,):
+
+
+        custom_return = True
+        if not display:
+            display = ffi.new('VkDisplayKHR*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),drmFd,_handle(display, 'VkDisplayKHR'))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return display
+
+        return display[0]
+
+
+
+    return vkAcquireDrmDisplayEXT
+def _wrap_vkGetDrmDisplayEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetDrmDisplayEXT(
+    physicalDevice
+            ,drmFd
+            ,connectorId
+            ,display=None
+            ,):
+
+
+        custom_return = True
+        if not display:
+            display = ffi.new('VkDisplayKHR*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),drmFd,connectorId,_auto_handle(display, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return display
+
+        return display[0]
+
+
+
+    return vkGetDrmDisplayEXT
+def _wrap_vkCreateMicromapEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateMicromapEXT(
+    device
+            ,pCreateInfo
+            ,pAllocator
+            ,pMicromap=None
+            ,):
+
+
+        custom_return = True
+        if not pMicromap:
+            pMicromap = ffi.new('VkMicromapEXT*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pMicromap, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pMicromap
+
+        return pMicromap[0]
+
+
+
+    return vkCreateMicromapEXT
+def _wrap_vkCmdBuildMicromapsEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdBuildMicromapsEXT(
+    commandBuffer
+            ,infoCount
+            ,pInfos
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),infoCount,_auto_handle(pInfos, _args[2]))
+
+
+    return vkCmdBuildMicromapsEXT
+def _wrap_vkBuildMicromapsEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkBuildMicromapsEXT(
+    device
+            ,deferredOperation
+            ,infoCount
+            ,pInfos
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(deferredOperation, 'VkDeferredOperationKHR'),infoCount,_auto_handle(pInfos, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkBuildMicromapsEXT
+def _wrap_vkDestroyMicromapEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkDestroyMicromapEXT(
+    device
+            ,micromap
+            ,pAllocator
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(micromap, 'VkMicromapEXT'),_auto_handle(pAllocator, _args[2]))
+
+
+    return vkDestroyMicromapEXT
+def _wrap_vkCmdCopyMicromapEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdCopyMicromapEXT(
+    commandBuffer
+            ,pInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pInfo, _args[1]))
+
+
+    return vkCmdCopyMicromapEXT
+def _wrap_vkCopyMicromapEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCopyMicromapEXT(
+    device
+            ,deferredOperation
+            ,pInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(deferredOperation, 'VkDeferredOperationKHR'),_auto_handle(pInfo, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkCopyMicromapEXT
+def _wrap_vkCmdCopyMicromapToMemoryEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdCopyMicromapToMemoryEXT(
+    commandBuffer
+            ,pInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pInfo, _args[1]))
+
+
+    return vkCmdCopyMicromapToMemoryEXT
+def _wrap_vkCopyMicromapToMemoryEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCopyMicromapToMemoryEXT(
+    device
+            ,deferredOperation
+            ,pInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(deferredOperation, 'VkDeferredOperationKHR'),_auto_handle(pInfo, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkCopyMicromapToMemoryEXT
+def _wrap_vkCmdCopyMemoryToMicromapEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdCopyMemoryToMicromapEXT(
+    commandBuffer
+            ,pInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pInfo, _args[1]))
+
+
+    return vkCmdCopyMemoryToMicromapEXT
+def _wrap_vkCopyMemoryToMicromapEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCopyMemoryToMicromapEXT(
+    device
+            ,deferredOperation
+            ,pInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(deferredOperation, 'VkDeferredOperationKHR'),_auto_handle(pInfo, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkCopyMemoryToMicromapEXT
+def _wrap_vkCmdWriteMicromapsPropertiesEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdWriteMicromapsPropertiesEXT(
+    commandBuffer
+            ,micromapCount
+            ,pMicromaps
+            ,queryType
+            ,queryPool
+            ,firstQuery
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),micromapCount,_auto_handle(pMicromaps, _args[2]),queryType,_handle(queryPool, 'VkQueryPool'),firstQuery)
+
+
+    return vkCmdWriteMicromapsPropertiesEXT
+def _wrap_vkWriteMicromapsPropertiesEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkWriteMicromapsPropertiesEXT(
+    device
+            ,micromapCount
+            ,pMicromaps
+            ,queryType
+            ,dataSize
+            ,pData
+            ,stride
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),micromapCount,_auto_handle(pMicromaps, _args[2]),queryType,dataSize,_auto_handle(pData, _args[5]),stride)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkWriteMicromapsPropertiesEXT
+def _wrap_vkGetDeviceMicromapCompatibilityEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetDeviceMicromapCompatibilityEXT(
+    device
+            ,pVersionInfo
+            ,pCompatibility=None
+            ,):
+
+
+        custom_return = True
+        if not pCompatibility:
+            pCompatibility = ffi.new('VkAccelerationStructureCompatibilityKHR*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pVersionInfo, _args[1]),_auto_handle(pCompatibility, _args[2]))
+
+        if custom_return:
+            return pCompatibility
+
+        return pCompatibility[0]
+
+
+
+    return vkGetDeviceMicromapCompatibilityEXT
+def _wrap_vkGetMicromapBuildSizesEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetMicromapBuildSizesEXT(
+    device
+            ,buildType
+            ,pBuildInfo
+            ,pSizeInfo=None
+            ,):
+
+
+        custom_return = True
+        if not pSizeInfo:
+            pSizeInfo = ffi.new('VkMicromapBuildSizesInfoEXT*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),buildType,_auto_handle(pBuildInfo, _args[2]),_auto_handle(pSizeInfo, _args[3]))
+
+        if custom_return:
+            return pSizeInfo
+
+        return pSizeInfo[0]
+
+
+
+    return vkGetMicromapBuildSizesEXT
+def _wrap_vkGetShaderModuleIdentifierEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetShaderModuleIdentifierEXT(
+    device
+            ,shaderModule
+            ,pIdentifier=None
+            ,):
+
+
+        custom_return = True
+        if not pIdentifier:
+            pIdentifier = ffi.new('VkShaderModuleIdentifierEXT*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(shaderModule, 'VkShaderModule'),_auto_handle(pIdentifier, _args[2]))
+
+        if custom_return:
+            return pIdentifier
+
+        return pIdentifier[0]
+
+
+
+    return vkGetShaderModuleIdentifierEXT
+def _wrap_vkGetShaderModuleCreateInfoIdentifierEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetShaderModuleCreateInfoIdentifierEXT(
+    device
+            ,pCreateInfo
+            ,pIdentifier=None
+            ,):
+
+
+        custom_return = True
+        if not pIdentifier:
+            pIdentifier = ffi.new('VkShaderModuleIdentifierEXT*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pIdentifier, _args[2]))
+
+        if custom_return:
+            return pIdentifier
+
+        return pIdentifier[0]
+
+
+
+    return vkGetShaderModuleCreateInfoIdentifierEXT
+def _wrap_vkGetPipelinePropertiesEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPipelinePropertiesEXT(
+    device
+            ,pPipelineInfo
+            ,pPipelineProperties=None
+            ,):
+
+
+        custom_return = True
+        if not pPipelineProperties:
+            pPipelineProperties = ffi.new('VkBaseOutStructure*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pPipelineInfo, _args[1]),_auto_handle(pPipelineProperties, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pPipelineProperties
+
+        return pPipelineProperties[0]
+
+
+
+    return vkGetPipelinePropertiesEXT
+def _wrap_vkExportMetalObjectsEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkExportMetalObjectsEXT(
+    device
+            ,pMetalObjectsInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pMetalObjectsInfo, _args[1]))
+
+
+    return vkExportMetalObjectsEXT
+def _wrap_vkGetDeviceFaultInfoEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetDeviceFaultInfoEXT(
+    device
+            ,pFaultCounts
+            ,pFaultInfo=None
+            ,):
+
+
+        custom_return = True
+        if not pFaultInfo:
+            pFaultInfo = ffi.new('VkDeviceFaultInfoEXT*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pFaultCounts, _args[1]),_auto_handle(pFaultInfo, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pFaultInfo
+
+        return StrWrap(pFaultInfo[0])
+
+
+
+    return vkGetDeviceFaultInfoEXT
+def _wrap_vkCmdSetDepthBias2EXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetDepthBias2EXT(
+    commandBuffer
+            ,pDepthBiasInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pDepthBiasInfo, _args[1]))
+
+
+    return vkCmdSetDepthBias2EXT
+def _wrap_vkReleaseSwapchainImagesEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkReleaseSwapchainImagesEXT(
+    device
+            ,pReleaseInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pReleaseInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkReleaseSwapchainImagesEXT
+def _wrap_vkCreateShadersEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateShadersEXT(
+    device
+            ,createInfoCount
+            ,pCreateInfos
+            ,pAllocator
+            ,pShaders=None
+            ,):
+
+
+        custom_return = True
+        if not pShaders:
+            pShaders = ffi.new('VkShaderEXT[%d]' % createInfoCount)
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),createInfoCount,_auto_handle(pCreateInfos, _args[2]),_auto_handle(pAllocator, _args[3]),_auto_handle(pShaders, _args[4]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pShaders
+
+        return pShaders
+
+
+
+    return vkCreateShadersEXT
+def _wrap_vkDestroyShaderEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkDestroyShaderEXT(
+    device
+            ,shader
+            ,pAllocator
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(shader, 'VkShaderEXT'),_auto_handle(pAllocator, _args[2]))
+
+
+    return vkDestroyShaderEXT
+def _wrap_vkGetShaderBinaryDataEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetShaderBinaryDataEXT(
+    device
+            ,shader
+            ,pDataSize
+            ,pData=None
+            ,):
+
+
+        custom_return = True
+        if not pData:
+            pData = ffi.new('void[%d]' % pDataSize)
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(shader, 'VkShaderEXT'),_auto_handle(pDataSize, _args[2]),_auto_handle(pData, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pData
+
+        return pData
+
+
+
+    return vkGetShaderBinaryDataEXT
+def _wrap_vkCmdBindShadersEXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdBindShadersEXT(
+    commandBuffer
+            ,stageCount
+            ,pStages
+            ,pShaders
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),stageCount,_auto_handle(pStages, _args[2]),_auto_handle(pShaders, _args[3]))
+
+
+    return vkCmdBindShadersEXT
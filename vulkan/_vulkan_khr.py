@@ -0,0 +1,4005 @@
+from vulkan._vulkan import *  # noqa
+from vulkan._vulkan import (ffi, lib, _new, _auto_handle, _handle,
+                            _arg_types, _slice)
+
+
+def VkBufferUsageFlags2CreateInfoKHR(sType=VK_STRUCTURE_TYPE_BUFFER_USAGE_FLAGS_2_CREATE_INFO_KHR,pNext=None,usage=None,):
+
+    return _new('VkBufferUsageFlags2CreateInfoKHR', sType=sType,pNext=pNext,usage=usage)
+
+def VkPipelineCreateFlags2CreateInfoKHR(sType=VK_STRUCTURE_TYPE_PIPELINE_CREATE_FLAGS_2_CREATE_INFO_KHR,pNext=None,flags=None,):
+
+    return _new('VkPipelineCreateFlags2CreateInfoKHR', sType=sType,pNext=pNext,flags=flags)
+
+def VkDisplayPropertiesKHR(display=None,displayName=None,physicalDimensions=None,physicalResolution=None,supportedTransforms=None,planeReorderPossible=None,persistentContent=None,):
+
+    return _new('VkDisplayPropertiesKHR', display=display,displayName=displayName,physicalDimensions=physicalDimensions,physicalResolution=physicalResolution,supportedTransforms=supportedTransforms,planeReorderPossible=planeReorderPossible,persistentContent=persistentContent)
+
+def VkDisplayPlanePropertiesKHR(currentDisplay=None,currentStackIndex=None,):
+
+    return _new('VkDisplayPlanePropertiesKHR', currentDisplay=currentDisplay,currentStackIndex=currentStackIndex)
+
+def VkDisplayModeParametersKHR(visibleRegion=None,refreshRate=None,):
+
+    return _new('VkDisplayModeParametersKHR', visibleRegion=visibleRegion,refreshRate=refreshRate)
+
+def VkDisplayModePropertiesKHR(displayMode=None,parameters=None,):
+
+    return _new('VkDisplayModePropertiesKHR', displayMode=displayMode,parameters=parameters)
+
+def VkDisplayModeCreateInfoKHR(sType=VK_STRUCTURE_TYPE_DISPLAY_MODE_CREATE_INFO_KHR,pNext=None,flags=None,parameters=None,):
+
+    return _new('VkDisplayModeCreateInfoKHR', sType=sType,pNext=pNext,flags=flags,parameters=parameters)
+
+def VkDisplayPlaneCapabilitiesKHR(supportedAlpha=None,minSrcPosition=None,maxSrcPosition=None,minSrcExtent=None,maxSrcExtent=None,minDstPosition=None,maxDstPosition=None,minDstExtent=None,maxDstExtent=None,):
+
+    return _new('VkDisplayPlaneCapabilitiesKHR', supportedAlpha=supportedAlpha,minSrcPosition=minSrcPosition,maxSrcPosition=maxSrcPosition,minSrcExtent=minSrcExtent,maxSrcExtent=maxSrcExtent,minDstPosition=minDstPosition,maxDstPosition=maxDstPosition,minDstExtent=minDstExtent,maxDstExtent=maxDstExtent)
+
+def VkDisplaySurfaceCreateInfoKHR(sType=VK_STRUCTURE_TYPE_DISPLAY_SURFACE_CREATE_INFO_KHR,pNext=None,flags=None,displayMode=None,planeIndex=None,planeStackIndex=None,transform=None,globalAlpha=None,alphaMode=None,imageExtent=None,):
+
+    return _new('VkDisplaySurfaceCreateInfoKHR', sType=sType,pNext=pNext,flags=flags,displayMode=displayMode,planeIndex=planeIndex,planeStackIndex=planeStackIndex,transform=transform,globalAlpha=globalAlpha,alphaMode=alphaMode,imageExtent=imageExtent)
+
+def VkDisplayPresentInfoKHR(sType=VK_STRUCTURE_TYPE_DISPLAY_PRESENT_INFO_KHR,pNext=None,srcRect=None,dstRect=None,persistent=None,):
+
+    return _new('VkDisplayPresentInfoKHR', sType=sType,pNext=pNext,srcRect=srcRect,dstRect=dstRect,persistent=persistent)
+
+def VkSurfaceCapabilitiesKHR(minImageCount=None,maxImageCount=None,currentExtent=None,minImageExtent=None,maxImageExtent=None,maxImageArrayLayers=None,supportedTransforms=None,currentTransform=None,supportedCompositeAlpha=None,supportedUsageFlags=None,):
+
+    return _new('VkSurfaceCapabilitiesKHR', minImageCount=minImageCount,maxImageCount=maxImageCount,currentExtent=currentExtent,minImageExtent=minImageExtent,maxImageExtent=maxImageExtent,maxImageArrayLayers=maxImageArrayLayers,supportedTransforms=supportedTransforms,currentTransform=currentTransform,supportedCompositeAlpha=supportedCompositeAlpha,supportedUsageFlags=supportedUsageFlags)
+
+def VkAndroidSurfaceCreateInfoKHR(sType=VK_STRUCTURE_TYPE_ANDROID_SURFACE_CREATE_INFO_KHR,pNext=None,flags=None,window=None,):
+
+    return _new('VkAndroidSurfaceCreateInfoKHR', sType=sType,pNext=pNext,flags=flags,window=window)
+
+def VkWaylandSurfaceCreateInfoKHR(sType=VK_STRUCTURE_TYPE_WAYLAND_SURFACE_CREATE_INFO_KHR,pNext=None,flags=None,display=None,surface=None,):
+
+    return _new('VkWaylandSurfaceCreateInfoKHR', sType=sType,pNext=pNext,flags=flags,display=display,surface=surface)
+
+def VkWin32SurfaceCreateInfoKHR(sType=VK_STRUCTURE_TYPE_WIN32_SURFACE_CREATE_INFO_KHR,pNext=None,flags=None,hinstance=None,hwnd=None,):
+
+    return _new('VkWin32SurfaceCreateInfoKHR', sType=sType,pNext=pNext,flags=flags,hinstance=hinstance,hwnd=hwnd)
+
+def VkXlibSurfaceCreateInfoKHR(sType=VK_STRUCTURE_TYPE_XLIB_SURFACE_CREATE_INFO_KHR,pNext=None,flags=None,dpy=None,window=None,):
+
+    return _new('VkXlibSurfaceCreateInfoKHR', sType=sType,pNext=pNext,flags=flags,dpy=dpy,window=window)
+
+def VkXcbSurfaceCreateInfoKHR(sType=VK_STRUCTURE_TYPE_XCB_SURFACE_CREATE_INFO_KHR,pNext=None,flags=None,connection=None,window=None,):
+
+    return _new('VkXcbSurfaceCreateInfoKHR', sType=sType,pNext=pNext,flags=flags,connection=connection,window=window)
+
+def VkSurfaceFormatKHR(format=None,colorSpace=None,):
+
+    return _new('VkSurfaceFormatKHR', format=format,colorSpace=colorSpace)
+
+def VkSwapchainCreateInfoKHR(sType=VK_STRUCTURE_TYPE_SWAPCHAIN_CREATE_INFO_KHR,pNext=None,flags=None,surface=None,minImageCount=None,imageFormat=None,imageColorSpace=None,imageExtent=None,imageArrayLayers=None,imageUsage=None,imageSharingMode=None,queueFamilyIndexCount=None,pQueueFamilyIndices=None,preTransform=None,compositeAlpha=None,presentMode=None,clipped=None,oldSwapchain=None,):
+    if queueFamilyIndexCount is None and pQueueFamilyIndices is not None:
+        queueFamilyIndexCount = len(pQueueFamilyIndices)
+
+    return _new('VkSwapchainCreateInfoKHR', sType=sType,pNext=pNext,flags=flags,surface=surface,minImageCount=minImageCount,imageFormat=imageFormat,imageColorSpace=imageColorSpace,imageExtent=imageExtent,imageArrayLayers=imageArrayLayers,imageUsage=imageUsage,imageSharingMode=imageSharingMode,queueFamilyIndexCount=queueFamilyIndexCount,pQueueFamilyIndices=pQueueFamilyIndices,preTransform=preTransform,compositeAlpha=compositeAlpha,presentMode=presentMode,clipped=clipped,oldSwapchain=oldSwapchain)
+
+def VkPresentInfoKHR(sType=VK_STRUCTURE_TYPE_PRESENT_INFO_KHR,pNext=None,waitSemaphoreCount=None,pWaitSemaphores=None,swapchainCount=None,pSwapchains=None,pImageIndices=None,pResults=None,):
+    if waitSemaphoreCount is None and pWaitSemaphores is not None:
+        waitSemaphoreCount = len(pWaitSemaphores)
+    if swapchainCount is None and pSwapchains is not None:
+        swapchainCount = len(pSwapchains)
+    if swapchainCount is None and pImageIndices is not None:
+        swapchainCount = len(pImageIndices)
+    if swapchainCount is None and pResults is not None:
+        swapchainCount = len(pResults)
+
+    return _new('VkPresentInfoKHR', sType=sType,pNext=pNext,waitSemaphoreCount=waitSemaphoreCount,pWaitSemaphores=pWaitSemaphores,swapchainCount=swapchainCount,pSwapchains=pSwapchains,pImageIndices=pImageIndices,pResults=pResults)
+
+def VkPhysicalDevicePushDescriptorPropertiesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PUSH_DESCRIPTOR_PROPERTIES_KHR,pNext=None,maxPushDescriptors=None,):
+
+    return _new('VkPhysicalDevicePushDescriptorPropertiesKHR', sType=sType,pNext=pNext,maxPushDescriptors=maxPushDescriptors)
+
+def VkPresentRegionsKHR(sType=VK_STRUCTURE_TYPE_PRESENT_REGIONS_KHR,pNext=None,swapchainCount=None,pRegions=None,):
+    if swapchainCount is None and pRegions is not None:
+        swapchainCount = len(pRegions)
+
+    return _new('VkPresentRegionsKHR', sType=sType,pNext=pNext,swapchainCount=swapchainCount,pRegions=pRegions)
+
+def VkPresentRegionKHR(rectangleCount=None,pRectangles=None,):
+    if rectangleCount is None and pRectangles is not None:
+        rectangleCount = len(pRectangles)
+
+    return _new('VkPresentRegionKHR', rectangleCount=rectangleCount,pRectangles=pRectangles)
+
+def VkRectLayerKHR(offset=None,extent=None,layer=None,):
+
+    return _new('VkRectLayerKHR', offset=offset,extent=extent,layer=layer)
+
+def VkImportMemoryWin32HandleInfoKHR(sType=VK_STRUCTURE_TYPE_IMPORT_MEMORY_WIN32_HANDLE_INFO_KHR,pNext=None,handleType=None,handle=None,name=None,):
+
+    return _new('VkImportMemoryWin32HandleInfoKHR', sType=sType,pNext=pNext,handleType=handleType,handle=handle,name=name)
+
+def VkExportMemoryWin32HandleInfoKHR(sType=VK_STRUCTURE_TYPE_EXPORT_MEMORY_WIN32_HANDLE_INFO_KHR,pNext=None,pAttributes=None,dwAccess=None,name=None,):
+
+    return _new('VkExportMemoryWin32HandleInfoKHR', sType=sType,pNext=pNext,pAttributes=pAttributes,dwAccess=dwAccess,name=name)
+
+def VkMemoryWin32HandlePropertiesKHR(sType=VK_STRUCTURE_TYPE_MEMORY_WIN32_HANDLE_PROPERTIES_KHR,pNext=None,memoryTypeBits=None,):
+
+    return _new('VkMemoryWin32HandlePropertiesKHR', sType=sType,pNext=pNext,memoryTypeBits=memoryTypeBits)
+
+def VkMemoryGetWin32HandleInfoKHR(sType=VK_STRUCTURE_TYPE_MEMORY_GET_WIN32_HANDLE_INFO_KHR,pNext=None,memory=None,handleType=None,):
+
+    return _new('VkMemoryGetWin32HandleInfoKHR', sType=sType,pNext=pNext,memory=memory,handleType=handleType)
+
+def VkImportMemoryFdInfoKHR(sType=VK_STRUCTURE_TYPE_IMPORT_MEMORY_FD_INFO_KHR,pNext=None,handleType=None,fd=None,):
+
+    return _new('VkImportMemoryFdInfoKHR', sType=sType,pNext=pNext,handleType=handleType,fd=fd)
+
+def VkMemoryFdPropertiesKHR(sType=VK_STRUCTURE_TYPE_MEMORY_FD_PROPERTIES_KHR,pNext=None,memoryTypeBits=None,):
+
+    return _new('VkMemoryFdPropertiesKHR', sType=sType,pNext=pNext,memoryTypeBits=memoryTypeBits)
+
+def VkMemoryGetFdInfoKHR(sType=VK_STRUCTURE_TYPE_MEMORY_GET_FD_INFO_KHR,pNext=None,memory=None,handleType=None,):
+
+    return _new('VkMemoryGetFdInfoKHR', sType=sType,pNext=pNext,memory=memory,handleType=handleType)
+
+def VkWin32KeyedMutexAcquireReleaseInfoKHR(sType=VK_STRUCTURE_TYPE_WIN32_KEYED_MUTEX_ACQUIRE_RELEASE_INFO_KHR,pNext=None,acquireCount=None,pAcquireSyncs=None,pAcquireKeys=None,pAcquireTimeouts=None,releaseCount=None,pReleaseSyncs=None,pReleaseKeys=None,):
+    if acquireCount is None and pAcquireSyncs is not None:
+        acquireCount = len(pAcquireSyncs)
+    if acquireCount is None and pAcquireKeys is not None:
+        acquireCount = len(pAcquireKeys)
+    if acquireCount is None and pAcquireTimeouts is not None:
+        acquireCount = len(pAcquireTimeouts)
+    if releaseCount is None and pReleaseSyncs is not None:
+        releaseCount = len(pReleaseSyncs)
+    if releaseCount is None and pReleaseKeys is not None:
+        releaseCount = len(pReleaseKeys)
+
+    return _new('VkWin32KeyedMutexAcquireReleaseInfoKHR', sType=sType,pNext=pNext,acquireCount=acquireCount,pAcquireSyncs=pAcquireSyncs,pAcquireKeys=pAcquireKeys,pAcquireTimeouts=pAcquireTimeouts,releaseCount=releaseCount,pReleaseSyncs=pReleaseSyncs,pReleaseKeys=pReleaseKeys)
+
+def VkImportSemaphoreWin32HandleInfoKHR(sType=VK_STRUCTURE_TYPE_IMPORT_SEMAPHORE_WIN32_HANDLE_INFO_KHR,pNext=None,semaphore=None,flags=None,handleType=None,handle=None,name=None,):
+
+    return _new('VkImportSemaphoreWin32HandleInfoKHR', sType=sType,pNext=pNext,semaphore=semaphore,flags=flags,handleType=handleType,handle=handle,name=name)
+
+def VkExportSemaphoreWin32HandleInfoKHR(sType=VK_STRUCTURE_TYPE_EXPORT_SEMAPHORE_WIN32_HANDLE_INFO_KHR,pNext=None,pAttributes=None,dwAccess=None,name=None,):
+
+    return _new('VkExportSemaphoreWin32HandleInfoKHR', sType=sType,pNext=pNext,pAttributes=pAttributes,dwAccess=dwAccess,name=name)
+
+def VkD3D12FenceSubmitInfoKHR(sType=VK_STRUCTURE_TYPE_D3D12_FENCE_SUBMIT_INFO_KHR,pNext=None,waitSemaphoreValuesCount=None,pWaitSemaphoreValues=None,signalSemaphoreValuesCount=None,pSignalSemaphoreValues=None,):
+    if waitSemaphoreValuesCount is None and pWaitSemaphoreValues is not None:
+        waitSemaphoreValuesCount = len(pWaitSemaphoreValues)
+    if signalSemaphoreValuesCount is None and pSignalSemaphoreValues is not None:
+        signalSemaphoreValuesCount = len(pSignalSemaphoreValues)
+
+    return _new('VkD3D12FenceSubmitInfoKHR', sType=sType,pNext=pNext,waitSemaphoreValuesCount=waitSemaphoreValuesCount,pWaitSemaphoreValues=pWaitSemaphoreValues,signalSemaphoreValuesCount=signalSemaphoreValuesCount,pSignalSemaphoreValues=pSignalSemaphoreValues)
+
+def VkSemaphoreGetWin32HandleInfoKHR(sType=VK_STRUCTURE_TYPE_SEMAPHORE_GET_WIN32_HANDLE_INFO_KHR,pNext=None,semaphore=None,handleType=None,):
+
+    return _new('VkSemaphoreGetWin32HandleInfoKHR', sType=sType,pNext=pNext,semaphore=semaphore,handleType=handleType)
+
+def VkImportSemaphoreFdInfoKHR(sType=VK_STRUCTURE_TYPE_IMPORT_SEMAPHORE_FD_INFO_KHR,pNext=None,semaphore=None,flags=None,handleType=None,fd=None,):
+
+    return _new('VkImportSemaphoreFdInfoKHR', sType=sType,pNext=pNext,semaphore=semaphore,flags=flags,handleType=handleType,fd=fd)
+
+def VkSemaphoreGetFdInfoKHR(sType=VK_STRUCTURE_TYPE_SEMAPHORE_GET_FD_INFO_KHR,pNext=None,semaphore=None,handleType=None,):
+
+    return _new('VkSemaphoreGetFdInfoKHR', sType=sType,pNext=pNext,semaphore=semaphore,handleType=handleType)
+
+def VkImportFenceWin32HandleInfoKHR(sType=VK_STRUCTURE_TYPE_IMPORT_FENCE_WIN32_HANDLE_INFO_KHR,pNext=None,fence=None,flags=None,handleType=None,handle=None,name=None,):
+
+    return _new('VkImportFenceWin32HandleInfoKHR', sType=sType,pNext=pNext,fence=fence,flags=flags,handleType=handleType,handle=handle,name=name)
+
+def VkExportFenceWin32HandleInfoKHR(sType=VK_STRUCTURE_TYPE_EXPORT_FENCE_WIN32_HANDLE_INFO_KHR,pNext=None,pAttributes=None,dwAccess=None,name=None,):
+
+    return _new('VkExportFenceWin32HandleInfoKHR', sType=sType,pNext=pNext,pAttributes=pAttributes,dwAccess=dwAccess,name=name)
+
+def VkFenceGetWin32HandleInfoKHR(sType=VK_STRUCTURE_TYPE_FENCE_GET_WIN32_HANDLE_INFO_KHR,pNext=None,fence=None,handleType=None,):
+
+    return _new('VkFenceGetWin32HandleInfoKHR', sType=sType,pNext=pNext,fence=fence,handleType=handleType)
+
+def VkImportFenceFdInfoKHR(sType=VK_STRUCTURE_TYPE_IMPORT_FENCE_FD_INFO_KHR,pNext=None,fence=None,flags=None,handleType=None,fd=None,):
+
+    return _new('VkImportFenceFdInfoKHR', sType=sType,pNext=pNext,fence=fence,flags=flags,handleType=handleType,fd=fd)
+
+def VkFenceGetFdInfoKHR(sType=VK_STRUCTURE_TYPE_FENCE_GET_FD_INFO_KHR,pNext=None,fence=None,handleType=None,):
+
+    return _new('VkFenceGetFdInfoKHR', sType=sType,pNext=pNext,fence=fence,handleType=handleType)
+
+def VkDeviceGroupPresentCapabilitiesKHR(sType=VK_STRUCTURE_TYPE_DEVICE_GROUP_PRESENT_CAPABILITIES_KHR,pNext=None,presentMask=None,modes=None,):
+
+    return _new('VkDeviceGroupPresentCapabilitiesKHR', sType=sType,pNext=pNext,presentMask=presentMask,modes=modes)
+
+def VkImageSwapchainCreateInfoKHR(sType=VK_STRUCTURE_TYPE_IMAGE_SWAPCHAIN_CREATE_INFO_KHR,pNext=None,swapchain=None,):
+
+    return _new('VkImageSwapchainCreateInfoKHR', sType=sType,pNext=pNext,swapchain=swapchain)
+
+def VkBindImageMemorySwapchainInfoKHR(sType=VK_STRUCTURE_TYPE_BIND_IMAGE_MEMORY_SWAPCHAIN_INFO_KHR,pNext=None,swapchain=None,imageIndex=None,):
+
+    return _new('VkBindImageMemorySwapchainInfoKHR', sType=sType,pNext=pNext,swapchain=swapchain,imageIndex=imageIndex)
+
+def VkAcquireNextImageInfoKHR(sType=VK_STRUCTURE_TYPE_ACQUIRE_NEXT_IMAGE_INFO_KHR,pNext=None,swapchain=None,timeout=None,semaphore=None,fence=None,deviceMask=None,):
+
+    return _new('VkAcquireNextImageInfoKHR', sType=sType,pNext=pNext,swapchain=swapchain,timeout=timeout,semaphore=semaphore,fence=fence,deviceMask=deviceMask)
+
+def VkDeviceGroupPresentInfoKHR(sType=VK_STRUCTURE_TYPE_DEVICE_GROUP_PRESENT_INFO_KHR,pNext=None,swapchainCount=None,pDeviceMasks=None,mode=None,):
+    if swapchainCount is None and pDeviceMasks is not None:
+        swapchainCount = len(pDeviceMasks)
+
+    return _new('VkDeviceGroupPresentInfoKHR', sType=sType,pNext=pNext,swapchainCount=swapchainCount,pDeviceMasks=pDeviceMasks,mode=mode)
+
+def VkDeviceGroupSwapchainCreateInfoKHR(sType=VK_STRUCTURE_TYPE_DEVICE_GROUP_SWAPCHAIN_CREATE_INFO_KHR,pNext=None,modes=None,):
+
+    return _new('VkDeviceGroupSwapchainCreateInfoKHR', sType=sType,pNext=pNext,modes=modes)
+
+def VkPhysicalDevicePresentIdFeaturesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PRESENT_ID_FEATURES_KHR,pNext=None,presentId=None,):
+
+    return _new('VkPhysicalDevicePresentIdFeaturesKHR', sType=sType,pNext=pNext,presentId=presentId)
+
+def VkPresentIdKHR(sType=VK_STRUCTURE_TYPE_PRESENT_ID_KHR,pNext=None,swapchainCount=None,pPresentIds=None,):
+    if swapchainCount is None and pPresentIds is not None:
+        swapchainCount = len(pPresentIds)
+
+    return _new('VkPresentIdKHR', sType=sType,pNext=pNext,swapchainCount=swapchainCount,pPresentIds=pPresentIds)
+
+def VkPhysicalDevicePresentWaitFeaturesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PRESENT_WAIT_FEATURES_KHR,pNext=None,presentWait=None,):
+
+    return _new('VkPhysicalDevicePresentWaitFeaturesKHR', sType=sType,pNext=pNext,presentWait=presentWait)
+
+def VkPhysicalDeviceSurfaceInfo2KHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SURFACE_INFO_2_KHR,pNext=None,surface=None,):
+
+    return _new('VkPhysicalDeviceSurfaceInfo2KHR', sType=sType,pNext=pNext,surface=surface)
+
+def VkSurfaceCapabilities2KHR(sType=VK_STRUCTURE_TYPE_SURFACE_CAPABILITIES_2_KHR,pNext=None,surfaceCapabilities=None,):
+
+    return _new('VkSurfaceCapabilities2KHR', sType=sType,pNext=pNext,surfaceCapabilities=surfaceCapabilities)
+
+def VkSurfaceFormat2KHR(sType=VK_STRUCTURE_TYPE_SURFACE_FORMAT_2_KHR,pNext=None,surfaceFormat=None,):
+
+    return _new('VkSurfaceFormat2KHR', sType=sType,pNext=pNext,surfaceFormat=surfaceFormat)
+
+def VkDisplayProperties2KHR(sType=VK_STRUCTURE_TYPE_DISPLAY_PROPERTIES_2_KHR,pNext=None,displayProperties=None,):
+
+    return _new('VkDisplayProperties2KHR', sType=sType,pNext=pNext,displayProperties=displayProperties)
+
+def VkDisplayPlaneProperties2KHR(sType=VK_STRUCTURE_TYPE_DISPLAY_PLANE_PROPERTIES_2_KHR,pNext=None,displayPlaneProperties=None,):
+
+    return _new('VkDisplayPlaneProperties2KHR', sType=sType,pNext=pNext,displayPlaneProperties=displayPlaneProperties)
+
+def VkDisplayModeProperties2KHR(sType=VK_STRUCTURE_TYPE_DISPLAY_MODE_PROPERTIES_2_KHR,pNext=None,displayModeProperties=None,):
+
+    return _new('VkDisplayModeProperties2KHR', sType=sType,pNext=pNext,displayModeProperties=displayModeProperties)
+
+def VkDisplayPlaneInfo2KHR(sType=VK_STRUCTURE_TYPE_DISPLAY_PLANE_INFO_2_KHR,pNext=None,mode=None,planeIndex=None,):
+
+    return _new('VkDisplayPlaneInfo2KHR', sType=sType,pNext=pNext,mode=mode,planeIndex=planeIndex)
+
+def VkDisplayPlaneCapabilities2KHR(sType=VK_STRUCTURE_TYPE_DISPLAY_PLANE_CAPABILITIES_2_KHR,pNext=None,capabilities=None,):
+
+    return _new('VkDisplayPlaneCapabilities2KHR', sType=sType,pNext=pNext,capabilities=capabilities)
+
+def VkSharedPresentSurfaceCapabilitiesKHR(sType=VK_STRUCTURE_TYPE_SHARED_PRESENT_SURFACE_CAPABILITIES_KHR,pNext=None,sharedPresentSupportedUsageFlags=None,):
+
+    return _new('VkSharedPresentSurfaceCapabilitiesKHR', sType=sType,pNext=pNext,sharedPresentSupportedUsageFlags=sharedPresentSupportedUsageFlags)
+
+def VkPhysicalDeviceMaintenance5FeaturesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_5_FEATURES_KHR,pNext=None,maintenance5=None,):
+
+    return _new('VkPhysicalDeviceMaintenance5FeaturesKHR', sType=sType,pNext=pNext,maintenance5=maintenance5)
+
+def VkPhysicalDeviceMaintenance5PropertiesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_5_PROPERTIES_KHR,pNext=None,earlyFragmentMultisampleCoverageAfterSampleCounting=None,earlyFragmentSampleMaskTestBeforeSampleCounting=None,depthStencilSwizzleOneSupport=None,polygonModePointSize=None,nonStrictSinglePixelWideLinesUseParallelogram=None,nonStrictWideLinesUseParallelogram=None,):
+
+    return _new('VkPhysicalDeviceMaintenance5PropertiesKHR', sType=sType,pNext=pNext,earlyFragmentMultisampleCoverageAfterSampleCounting=earlyFragmentMultisampleCoverageAfterSampleCounting,earlyFragmentSampleMaskTestBeforeSampleCounting=earlyFragmentSampleMaskTestBeforeSampleCounting,depthStencilSwizzleOneSupport=depthStencilSwizzleOneSupport,polygonModePointSize=polygonModePointSize,nonStrictSinglePixelWideLinesUseParallelogram=nonStrictSinglePixelWideLinesUseParallelogram,nonStrictWideLinesUseParallelogram=nonStrictWideLinesUseParallelogram)
+
+def VkPhysicalDeviceMaintenance6FeaturesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_6_FEATURES_KHR,pNext=None,maintenance6=None,):
+
+    return _new('VkPhysicalDeviceMaintenance6FeaturesKHR', sType=sType,pNext=pNext,maintenance6=maintenance6)
+
+def VkPhysicalDeviceMaintenance6PropertiesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_6_PROPERTIES_KHR,pNext=None,blockTexelViewCompatibleMultipleLayers=None,maxCombinedImageSamplerDescriptorCount=None,fragmentShadingRateClampCombinerInputs=None,):
+
+    return _new('VkPhysicalDeviceMaintenance6PropertiesKHR', sType=sType,pNext=pNext,blockTexelViewCompatibleMultipleLayers=blockTexelViewCompatibleMultipleLayers,maxCombinedImageSamplerDescriptorCount=maxCombinedImageSamplerDescriptorCount,fragmentShadingRateClampCombinerInputs=fragmentShadingRateClampCombinerInputs)
+
+def VkRenderingAreaInfoKHR(sType=VK_STRUCTURE_TYPE_RENDERING_AREA_INFO_KHR,pNext=None,viewMask=None,colorAttachmentCount=None,pColorAttachmentFormats=None,depthAttachmentFormat=None,stencilAttachmentFormat=None,):
+    if colorAttachmentCount is None and pColorAttachmentFormats is not None:
+        colorAttachmentCount = len(pColorAttachmentFormats)
+
+    return _new('VkRenderingAreaInfoKHR', sType=sType,pNext=pNext,viewMask=viewMask,colorAttachmentCount=colorAttachmentCount,pColorAttachmentFormats=pColorAttachmentFormats,depthAttachmentFormat=depthAttachmentFormat,stencilAttachmentFormat=stencilAttachmentFormat)
+
+def VkDeviceQueueGlobalPriorityCreateInfoKHR(sType=VK_STRUCTURE_TYPE_DEVICE_QUEUE_GLOBAL_PRIORITY_CREATE_INFO_KHR,pNext=None,globalPriority=None,):
+
+    return _new('VkDeviceQueueGlobalPriorityCreateInfoKHR', sType=sType,pNext=pNext,globalPriority=globalPriority)
+
+def VkPhysicalDeviceGlobalPriorityQueryFeaturesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_GLOBAL_PRIORITY_QUERY_FEATURES_KHR,pNext=None,globalPriorityQuery=None,):
+
+    return _new('VkPhysicalDeviceGlobalPriorityQueryFeaturesKHR', sType=sType,pNext=pNext,globalPriorityQuery=globalPriorityQuery)
+
+def VkQueueFamilyGlobalPriorityPropertiesKHR(sType=VK_STRUCTURE_TYPE_QUEUE_FAMILY_GLOBAL_PRIORITY_PROPERTIES_KHR,pNext=None,priorityCount=None,priorities=None,):
+
+    return _new('VkQueueFamilyGlobalPriorityPropertiesKHR', sType=sType,pNext=pNext,priorityCount=priorityCount,priorities=priorities)
+
+def VkCalibratedTimestampInfoKHR(sType=VK_STRUCTURE_TYPE_CALIBRATED_TIMESTAMP_INFO_KHR,pNext=None,timeDomain=None,):
+
+    return _new('VkCalibratedTimestampInfoKHR', sType=sType,pNext=pNext,timeDomain=timeDomain)
+
+def VkVertexInputBindingDivisorDescriptionKHR(binding=None,divisor=None,):
+
+    return _new('VkVertexInputBindingDivisorDescriptionKHR', binding=binding,divisor=divisor)
+
+def VkPipelineVertexInputDivisorStateCreateInfoKHR(sType=VK_STRUCTURE_TYPE_PIPELINE_VERTEX_INPUT_DIVISOR_STATE_CREATE_INFO_KHR,pNext=None,vertexBindingDivisorCount=None,pVertexBindingDivisors=None,):
+    if vertexBindingDivisorCount is None and pVertexBindingDivisors is not None:
+        vertexBindingDivisorCount = len(pVertexBindingDivisors)
+
+    return _new('VkPipelineVertexInputDivisorStateCreateInfoKHR', sType=sType,pNext=pNext,vertexBindingDivisorCount=vertexBindingDivisorCount,pVertexBindingDivisors=pVertexBindingDivisors)
+
+def VkPhysicalDeviceVertexAttributeDivisorPropertiesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_PROPERTIES_KHR,pNext=None,maxVertexAttribDivisor=None,supportsNonZeroFirstInstance=None,):
+
+    return _new('VkPhysicalDeviceVertexAttributeDivisorPropertiesKHR', sType=sType,pNext=pNext,maxVertexAttribDivisor=maxVertexAttribDivisor,supportsNonZeroFirstInstance=supportsNonZeroFirstInstance)
+
+def VkPhysicalDeviceVertexAttributeDivisorFeaturesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_FEATURES_KHR,pNext=None,vertexAttributeInstanceRateDivisor=None,vertexAttributeInstanceRateZeroDivisor=None,):
+
+    return _new('VkPhysicalDeviceVertexAttributeDivisorFeaturesKHR', sType=sType,pNext=pNext,vertexAttributeInstanceRateDivisor=vertexAttributeInstanceRateDivisor,vertexAttributeInstanceRateZeroDivisor=vertexAttributeInstanceRateZeroDivisor)
+
+def VkRayTracingShaderGroupCreateInfoKHR(sType=VK_STRUCTURE_TYPE_RAY_TRACING_SHADER_GROUP_CREATE_INFO_KHR,pNext=None,type=None,generalShader=None,closestHitShader=None,anyHitShader=None,intersectionShader=None,pShaderGroupCaptureReplayHandle=None,):
+
+    return _new('VkRayTracingShaderGroupCreateInfoKHR', sType=sType,pNext=pNext,type=type,generalShader=generalShader,closestHitShader=closestHitShader,anyHitShader=anyHitShader,intersectionShader=intersectionShader,pShaderGroupCaptureReplayHandle=pShaderGroupCaptureReplayHandle)
+
+def VkRayTracingPipelineCreateInfoKHR(sType=VK_STRUCTURE_TYPE_RAY_TRACING_PIPELINE_CREATE_INFO_KHR,pNext=None,flags=None,stageCount=None,pStages=None,groupCount=None,pGroups=None,maxPipelineRayRecursionDepth=None,pLibraryInfo=None,pLibraryInterface=None,pDynamicState=None,layout=None,basePipelineHandle=None,basePipelineIndex=None,):
+    if stageCount is None and pStages is not None:
+        stageCount = len(pStages)
+    if groupCount is None and pGroups is not None:
+        groupCount = len(pGroups)
+
+    return _new('VkRayTracingPipelineCreateInfoKHR', sType=sType,pNext=pNext,flags=flags,stageCount=stageCount,pStages=pStages,groupCount=groupCount,pGroups=pGroups,maxPipelineRayRecursionDepth=maxPipelineRayRecursionDepth,pLibraryInfo=pLibraryInfo,pLibraryInterface=pLibraryInterface,pDynamicState=pDynamicState,layout=layout,basePipelineHandle=basePipelineHandle,basePipelineIndex=basePipelineIndex)
+
+def VkWriteDescriptorSetAccelerationStructureKHR(sType=VK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET_ACCELERATION_STRUCTURE_KHR,pNext=None,accelerationStructureCount=None,pAccelerationStructures=None,):
+    if accelerationStructureCount is None and pAccelerationStructures is not None:
+        accelerationStructureCount = len(pAccelerationStructures)
+
+    return _new('VkWriteDescriptorSetAccelerationStructureKHR', sType=sType,pNext=pNext,accelerationStructureCount=accelerationStructureCount,pAccelerationStructures=pAccelerationStructures)
+
+def VkPhysicalDeviceAccelerationStructureFeaturesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ACCELERATION_STRUCTURE_FEATURES_KHR,pNext=None,accelerationStructure=None,accelerationStructureCaptureReplay=None,accelerationStructureIndirectBuild=None,accelerationStructureHostCommands=None,descriptorBindingAccelerationStructureUpdateAfterBind=None,):
+
+    return _new('VkPhysicalDeviceAccelerationStructureFeaturesKHR', sType=sType,pNext=pNext,accelerationStructure=accelerationStructure,accelerationStructureCaptureReplay=accelerationStructureCaptureReplay,accelerationStructureIndirectBuild=accelerationStructureIndirectBuild,accelerationStructureHostCommands=accelerationStructureHostCommands,descriptorBindingAccelerationStructureUpdateAfterBind=descriptorBindingAccelerationStructureUpdateAfterBind)
+
+def VkPhysicalDeviceRayTracingPipelineFeaturesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_PIPELINE_FEATURES_KHR,pNext=None,rayTracingPipeline=None,rayTracingPipelineShaderGroupHandleCaptureReplay=None,rayTracingPipelineShaderGroupHandleCaptureReplayMixed=None,rayTracingPipelineTraceRaysIndirect=None,rayTraversalPrimitiveCulling=None,):
+
+    return _new('VkPhysicalDeviceRayTracingPipelineFeaturesKHR', sType=sType,pNext=pNext,rayTracingPipeline=rayTracingPipeline,rayTracingPipelineShaderGroupHandleCaptureReplay=rayTracingPipelineShaderGroupHandleCaptureReplay,rayTracingPipelineShaderGroupHandleCaptureReplayMixed=rayTracingPipelineShaderGroupHandleCaptureReplayMixed,rayTracingPipelineTraceRaysIndirect=rayTracingPipelineTraceRaysIndirect,rayTraversalPrimitiveCulling=rayTraversalPrimitiveCulling)
+
+def VkPhysicalDeviceRayQueryFeaturesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_QUERY_FEATURES_KHR,pNext=None,rayQuery=None,):
+
+    return _new('VkPhysicalDeviceRayQueryFeaturesKHR', sType=sType,pNext=pNext,rayQuery=rayQuery)
+
+def VkPhysicalDeviceAccelerationStructurePropertiesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ACCELERATION_STRUCTURE_PROPERTIES_KHR,pNext=None,maxGeometryCount=None,maxInstanceCount=None,maxPrimitiveCount=None,maxPerStageDescriptorAccelerationStructures=None,maxPerStageDescriptorUpdateAfterBindAccelerationStructures=None,maxDescriptorSetAccelerationStructures=None,maxDescriptorSetUpdateAfterBindAccelerationStructures=None,minAccelerationStructureScratchOffsetAlignment=None,):
+
+    return _new('VkPhysicalDeviceAccelerationStructurePropertiesKHR', sType=sType,pNext=pNext,maxGeometryCount=maxGeometryCount,maxInstanceCount=maxInstanceCount,maxPrimitiveCount=maxPrimitiveCount,maxPerStageDescriptorAccelerationStructures=maxPerStageDescriptorAccelerationStructures,maxPerStageDescriptorUpdateAfterBindAccelerationStructures=maxPerStageDescriptorUpdateAfterBindAccelerationStructures,maxDescriptorSetAccelerationStructures=maxDescriptorSetAccelerationStructures,maxDescriptorSetUpdateAfterBindAccelerationStructures=maxDescriptorSetUpdateAfterBindAccelerationStructures,minAccelerationStructureScratchOffsetAlignment=minAccelerationStructureScratchOffsetAlignment)
+
+def VkPhysicalDeviceRayTracingPipelinePropertiesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_PIPELINE_PROPERTIES_KHR,pNext=None,shaderGroupHandleSize=None,maxRayRecursionDepth=None,maxShaderGroupStride=None,shaderGroupBaseAlignment=None,shaderGroupHandleCaptureReplaySize=None,maxRayDispatchInvocationCount=None,shaderGroupHandleAlignment=None,maxRayHitAttributeSize=None,):
+
+    return _new('VkPhysicalDeviceRayTracingPipelinePropertiesKHR', sType=sType,pNext=pNext,shaderGroupHandleSize=shaderGroupHandleSize,maxRayRecursionDepth=maxRayRecursionDepth,maxShaderGroupStride=maxShaderGroupStride,shaderGroupBaseAlignment=shaderGroupBaseAlignment,shaderGroupHandleCaptureReplaySize=shaderGroupHandleCaptureReplaySize,maxRayDispatchInvocationCount=maxRayDispatchInvocationCount,shaderGroupHandleAlignment=shaderGroupHandleAlignment,maxRayHitAttributeSize=maxRayHitAttributeSize)
+
+def VkStridedDeviceAddressRegionKHR(deviceAddress=None,stride=None,size=None,):
+
+    return _new('VkStridedDeviceAddressRegionKHR', deviceAddress=deviceAddress,stride=stride,size=size)
+
+def VkTraceRaysIndirectCommandKHR(width=None,height=None,depth=None,):
+
+    return _new('VkTraceRaysIndirectCommandKHR', width=width,height=height,depth=depth)
+
+def VkTraceRaysIndirectCommand2KHR(raygenShaderRecordAddress=None,raygenShaderRecordSize=None,missShaderBindingTableAddress=None,missShaderBindingTableSize=None,missShaderBindingTableStride=None,hitShaderBindingTableAddress=None,hitShaderBindingTableSize=None,hitShaderBindingTableStride=None,callableShaderBindingTableAddress=None,callableShaderBindingTableSize=None,callableShaderBindingTableStride=None,width=None,height=None,depth=None,):
+
+    return _new('VkTraceRaysIndirectCommand2KHR', raygenShaderRecordAddress=raygenShaderRecordAddress,raygenShaderRecordSize=raygenShaderRecordSize,missShaderBindingTableAddress=missShaderBindingTableAddress,missShaderBindingTableSize=missShaderBindingTableSize,missShaderBindingTableStride=missShaderBindingTableStride,hitShaderBindingTableAddress=hitShaderBindingTableAddress,hitShaderBindingTableSize=hitShaderBindingTableSize,hitShaderBindingTableStride=hitShaderBindingTableStride,callableShaderBindingTableAddress=callableShaderBindingTableAddress,callableShaderBindingTableSize=callableShaderBindingTableSize,callableShaderBindingTableStride=callableShaderBindingTableStride,width=width,height=height,depth=depth)
+
+def VkPhysicalDeviceRayTracingMaintenance1FeaturesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_MAINTENANCE_1_FEATURES_KHR,pNext=None,rayTracingMaintenance1=None,rayTracingPipelineTraceRaysIndirect2=None,):
+
+    return _new('VkPhysicalDeviceRayTracingMaintenance1FeaturesKHR', sType=sType,pNext=pNext,rayTracingMaintenance1=rayTracingMaintenance1,rayTracingPipelineTraceRaysIndirect2=rayTracingPipelineTraceRaysIndirect2)
+
+def VkSurfaceProtectedCapabilitiesKHR(sType=VK_STRUCTURE_TYPE_SURFACE_PROTECTED_CAPABILITIES_KHR,pNext=None,supportsProtected=None,):
+
+    return _new('VkSurfaceProtectedCapabilitiesKHR', sType=sType,pNext=pNext,supportsProtected=supportsProtected)
+
+def VkPhysicalDevicePerformanceQueryFeaturesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PERFORMANCE_QUERY_FEATURES_KHR,pNext=None,performanceCounterQueryPools=None,performanceCounterMultipleQueryPools=None,):
+
+    return _new('VkPhysicalDevicePerformanceQueryFeaturesKHR', sType=sType,pNext=pNext,performanceCounterQueryPools=performanceCounterQueryPools,performanceCounterMultipleQueryPools=performanceCounterMultipleQueryPools)
+
+def VkPhysicalDevicePerformanceQueryPropertiesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PERFORMANCE_QUERY_PROPERTIES_KHR,pNext=None,allowCommandBufferQueryCopies=None,):
+
+    return _new('VkPhysicalDevicePerformanceQueryPropertiesKHR', sType=sType,pNext=pNext,allowCommandBufferQueryCopies=allowCommandBufferQueryCopies)
+
+def VkPerformanceCounterKHR(sType=VK_STRUCTURE_TYPE_PERFORMANCE_COUNTER_KHR,pNext=None,unit=None,scope=None,storage=None,uuid=None,):
+
+    return _new('VkPerformanceCounterKHR', sType=sType,pNext=pNext,unit=unit,scope=scope,storage=storage,uuid=uuid)
+
+def VkPerformanceCounterDescriptionKHR(sType=VK_STRUCTURE_TYPE_PERFORMANCE_COUNTER_DESCRIPTION_KHR,pNext=None,flags=None,name=None,category=None,description=None,):
+
+    return _new('VkPerformanceCounterDescriptionKHR', sType=sType,pNext=pNext,flags=flags,name=name,category=category,description=description)
+
+def VkQueryPoolPerformanceCreateInfoKHR(sType=VK_STRUCTURE_TYPE_QUERY_POOL_PERFORMANCE_CREATE_INFO_KHR,pNext=None,queueFamilyIndex=None,counterIndexCount=None,pCounterIndices=None,):
+    if counterIndexCount is None and pCounterIndices is not None:
+        counterIndexCount = len(pCounterIndices)
+
+    return _new('VkQueryPoolPerformanceCreateInfoKHR', sType=sType,pNext=pNext,queueFamilyIndex=queueFamilyIndex,counterIndexCount=counterIndexCount,pCounterIndices=pCounterIndices)
+
+def VkPerformanceCounterResultKHR(int32=None,int64=None,uint32=None,uint64=None,float32=None,float64=None,):
+
+    return _new('VkPerformanceCounterResultKHR', int32=int32,int64=int64,uint32=uint32,uint64=uint64,float32=float32,float64=float64)
+
+def VkAcquireProfilingLockInfoKHR(sType=VK_STRUCTURE_TYPE_ACQUIRE_PROFILING_LOCK_INFO_KHR,pNext=None,flags=None,timeout=None,):
+
+    return _new('VkAcquireProfilingLockInfoKHR', sType=sType,pNext=pNext,flags=flags,timeout=timeout)
+
+def VkPerformanceQuerySubmitInfoKHR(sType=VK_STRUCTURE_TYPE_PERFORMANCE_QUERY_SUBMIT_INFO_KHR,pNext=None,counterPassIndex=None,):
+
+    return _new('VkPerformanceQuerySubmitInfoKHR', sType=sType,pNext=pNext,counterPassIndex=counterPassIndex)
+
+def VkPerformanceQueryReservationInfoKHR(sType=VK_STRUCTURE_TYPE_PERFORMANCE_QUERY_RESERVATION_INFO_KHR,pNext=None,maxPerformanceQueriesPerPool=None,):
+
+    return _new('VkPerformanceQueryReservationInfoKHR', sType=sType,pNext=pNext,maxPerformanceQueriesPerPool=maxPerformanceQueriesPerPool)
+
+def VkPhysicalDeviceShaderClockFeaturesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_CLOCK_FEATURES_KHR,pNext=None,shaderSubgroupClock=None,shaderDeviceClock=None,):
+
+    return _new('VkPhysicalDeviceShaderClockFeaturesKHR', sType=sType,pNext=pNext,shaderSubgroupClock=shaderSubgroupClock,shaderDeviceClock=shaderDeviceClock)
+
+def VkPhysicalDevicePipelineExecutablePropertiesFeaturesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PIPELINE_EXECUTABLE_PROPERTIES_FEATURES_KHR,pNext=None,pipelineExecutableInfo=None,):
+
+    return _new('VkPhysicalDevicePipelineExecutablePropertiesFeaturesKHR', sType=sType,pNext=pNext,pipelineExecutableInfo=pipelineExecutableInfo)
+
+def VkPipelineInfoKHR(sType=VK_STRUCTURE_TYPE_PIPELINE_INFO_KHR,pNext=None,pipeline=None,):
+
+    return _new('VkPipelineInfoKHR', sType=sType,pNext=pNext,pipeline=pipeline)
+
+def VkPipelineExecutablePropertiesKHR(sType=VK_STRUCTURE_TYPE_PIPELINE_EXECUTABLE_PROPERTIES_KHR,pNext=None,stages=None,name=None,description=None,subgroupSize=None,):
+
+    return _new('VkPipelineExecutablePropertiesKHR', sType=sType,pNext=pNext,stages=stages,name=name,description=description,subgroupSize=subgroupSize)
+
+def VkPipelineExecutableInfoKHR(sType=VK_STRUCTURE_TYPE_PIPELINE_EXECUTABLE_INFO_KHR,pNext=None,pipeline=None,executableIndex=None,):
+
+    return _new('VkPipelineExecutableInfoKHR', sType=sType,pNext=pNext,pipeline=pipeline,executableIndex=executableIndex)
+
+def VkPipelineExecutableStatisticValueKHR(b32=None,i64=None,u64=None,f64=None,):
+
+    return _new('VkPipelineExecutableStatisticValueKHR', b32=b32,i64=i64,u64=u64,f64=f64)
+
+def VkPipelineExecutableStatisticKHR(sType=VK_STRUCTURE_TYPE_PIPELINE_EXECUTABLE_STATISTIC_KHR,pNext=None,name=None,description=None,format=None,value=None,):
+
+    return _new('VkPipelineExecutableStatisticKHR', sType=sType,pNext=pNext,name=name,description=description,format=format,value=value)
+
+def VkPipelineExecutableInternalRepresentationKHR(sType=VK_STRUCTURE_TYPE_PIPELINE_EXECUTABLE_INTERNAL_REPRESENTATION_KHR,pNext=None,name=None,description=None,isText=None,dataSize=None,pData=None,):
+    if dataSize is None and pData is not None:
+        dataSize = len(pData)
+
+    return _new('VkPipelineExecutableInternalRepresentationKHR', sType=sType,pNext=pNext,name=name,description=description,isText=isText,dataSize=dataSize,pData=pData)
+
+def VkDeviceOrHostAddressKHR(deviceAddress=None,hostAddress=None,):
+
+    return _new('VkDeviceOrHostAddressKHR', deviceAddress=deviceAddress,hostAddress=hostAddress)
+
+def VkDeviceOrHostAddressConstKHR(deviceAddress=None,hostAddress=None,):
+
+    return _new('VkDeviceOrHostAddressConstKHR', deviceAddress=deviceAddress,hostAddress=hostAddress)
+
+def VkAccelerationStructureGeometryTrianglesDataKHR(sType=VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_GEOMETRY_TRIANGLES_DATA_KHR,pNext=None,vertexFormat=None,vertexData=None,vertexStride=None,maxVertex=None,indexType=None,indexData=None,transformData=None,):
+
+    return _new('VkAccelerationStructureGeometryTrianglesDataKHR', sType=sType,pNext=pNext,vertexFormat=vertexFormat,vertexData=vertexData,vertexStride=vertexStride,maxVertex=maxVertex,indexType=indexType,indexData=indexData,transformData=transformData)
+
+def VkAccelerationStructureGeometryAabbsDataKHR(sType=VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_GEOMETRY_AABBS_DATA_KHR,pNext=None,data=None,stride=None,):
+
+    return _new('VkAccelerationStructureGeometryAabbsDataKHR', sType=sType,pNext=pNext,data=data,stride=stride)
+
+def VkAccelerationStructureGeometryInstancesDataKHR(sType=VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_GEOMETRY_INSTANCES_DATA_KHR,pNext=None,arrayOfPointers=None,data=None,):
+
+    return _new('VkAccelerationStructureGeometryInstancesDataKHR', sType=sType,pNext=pNext,arrayOfPointers=arrayOfPointers,data=data)
+
+def VkAccelerationStructureGeometryDataKHR(triangles=None,aabbs=None,instances=None,):
+
+    return _new('VkAccelerationStructureGeometryDataKHR', triangles=triangles,aabbs=aabbs,instances=instances)
+
+def VkAccelerationStructureGeometryKHR(sType=VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_GEOMETRY_KHR,pNext=None,geometryType=None,geometry=None,flags=None,):
+
+    return _new('VkAccelerationStructureGeometryKHR', sType=sType,pNext=pNext,geometryType=geometryType,geometry=geometry,flags=flags)
+
+def VkAccelerationStructureBuildGeometryInfoKHR(sType=VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_BUILD_GEOMETRY_INFO_KHR,pNext=None,type=None,flags=None,mode=None,srcAccelerationStructure=None,dstAccelerationStructure=None,geometryCount=None,pGeometries=None,ppGeometries=None,scratchData=None,):
+    if geometryCount is None and pGeometries is not None:
+        geometryCount = len(pGeometries)
+    if geometryCount is None and ppGeometries is not None:
+        geometryCount = len(ppGeometries)
+
+    return _new('VkAccelerationStructureBuildGeometryInfoKHR', sType=sType,pNext=pNext,type=type,flags=flags,mode=mode,srcAccelerationStructure=srcAccelerationStructure,dstAccelerationStructure=dstAccelerationStructure,geometryCount=geometryCount,pGeometries=pGeometries,ppGeometries=ppGeometries,scratchData=scratchData)
+
+def VkAccelerationStructureBuildRangeInfoKHR(primitiveCount=None,primitiveOffset=None,firstVertex=None,transformOffset=None,):
+
+    return _new('VkAccelerationStructureBuildRangeInfoKHR', primitiveCount=primitiveCount,primitiveOffset=primitiveOffset,firstVertex=firstVertex,transformOffset=transformOffset)
+
+def VkAccelerationStructureCreateInfoKHR(sType=VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_CREATE_INFO_KHR,pNext=None,createFlags=None,buffer=None,offset=None,size=None,type=None,deviceAddress=None,):
+
+    return _new('VkAccelerationStructureCreateInfoKHR', sType=sType,pNext=pNext,createFlags=createFlags,buffer=buffer,offset=offset,size=size,type=type,deviceAddress=deviceAddress)
+
+def VkAabbPositionsKHR(minX=None,minY=None,minZ=None,maxX=None,maxY=None,maxZ=None,):
+
+    return _new('VkAabbPositionsKHR', minX=minX,minY=minY,minZ=minZ,maxX=maxX,maxY=maxY,maxZ=maxZ)
+
+def VkTransformMatrixKHR(matrix=None,):
+
+    return _new('VkTransformMatrixKHR', matrix=matrix)
+
+def VkAccelerationStructureInstanceKHR(transform=None,instanceCustomIndex=None,mask=None,instanceShaderBindingTableRecordOffset=None,flags=None,accelerationStructureReference=None,):
+
+    return _new('VkAccelerationStructureInstanceKHR', transform=transform,instanceCustomIndex=instanceCustomIndex,mask=mask,instanceShaderBindingTableRecordOffset=instanceShaderBindingTableRecordOffset,flags=flags,accelerationStructureReference=accelerationStructureReference)
+
+def VkAccelerationStructureDeviceAddressInfoKHR(sType=VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_DEVICE_ADDRESS_INFO_KHR,pNext=None,accelerationStructure=None,):
+
+    return _new('VkAccelerationStructureDeviceAddressInfoKHR', sType=sType,pNext=pNext,accelerationStructure=accelerationStructure)
+
+def VkAccelerationStructureVersionInfoKHR(sType=VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_VERSION_INFO_KHR,pNext=None,pVersionData=None,):
+
+    return _new('VkAccelerationStructureVersionInfoKHR', sType=sType,pNext=pNext,pVersionData=pVersionData)
+
+def VkCopyAccelerationStructureInfoKHR(sType=VK_STRUCTURE_TYPE_COPY_ACCELERATION_STRUCTURE_INFO_KHR,pNext=None,src=None,dst=None,mode=None,):
+
+    return _new('VkCopyAccelerationStructureInfoKHR', sType=sType,pNext=pNext,src=src,dst=dst,mode=mode)
+
+def VkCopyAccelerationStructureToMemoryInfoKHR(sType=VK_STRUCTURE_TYPE_COPY_ACCELERATION_STRUCTURE_TO_MEMORY_INFO_KHR,pNext=None,src=None,dst=None,mode=None,):
+
+    return _new('VkCopyAccelerationStructureToMemoryInfoKHR', sType=sType,pNext=pNext,src=src,dst=dst,mode=mode)
+
+def VkCopyMemoryToAccelerationStructureInfoKHR(sType=VK_STRUCTURE_TYPE_COPY_MEMORY_TO_ACCELERATION_STRUCTURE_INFO_KHR,pNext=None,src=None,dst=None,mode=None,):
+
+    return _new('VkCopyMemoryToAccelerationStructureInfoKHR', sType=sType,pNext=pNext,src=src,dst=dst,mode=mode)
+
+def VkRayTracingPipelineInterfaceCreateInfoKHR(sType=VK_STRUCTURE_TYPE_RAY_TRACING_PIPELINE_INTERFACE_CREATE_INFO_KHR,pNext=None,maxPipelineRayPayloadSize=None,maxPipelineRayHitAttributeSize=None,):
+
+    return _new('VkRayTracingPipelineInterfaceCreateInfoKHR', sType=sType,pNext=pNext,maxPipelineRayPayloadSize=maxPipelineRayPayloadSize,maxPipelineRayHitAttributeSize=maxPipelineRayHitAttributeSize)
+
+def VkPipelineLibraryCreateInfoKHR(sType=VK_STRUCTURE_TYPE_PIPELINE_LIBRARY_CREATE_INFO_KHR,pNext=None,libraryCount=None,pLibraries=None,):
+    if libraryCount is None and pLibraries is not None:
+        libraryCount = len(pLibraries)
+
+    return _new('VkPipelineLibraryCreateInfoKHR', sType=sType,pNext=pNext,libraryCount=libraryCount,pLibraries=pLibraries)
+
+def VkRefreshObjectKHR(objectType=None,objectHandle=None,flags=None,):
+
+    return _new('VkRefreshObjectKHR', objectType=objectType,objectHandle=objectHandle,flags=flags)
+
+def VkRefreshObjectListKHR(sType=VK_STRUCTURE_TYPE_REFRESH_OBJECT_LIST_KHR,pNext=None,objectCount=None,pObjects=None,):
+    if objectCount is None and pObjects is not None:
+        objectCount = len(pObjects)
+
+    return _new('VkRefreshObjectListKHR', sType=sType,pNext=pNext,objectCount=objectCount,pObjects=pObjects)
+
+def VkPhysicalDeviceShaderSubgroupUniformControlFlowFeaturesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_SUBGROUP_UNIFORM_CONTROL_FLOW_FEATURES_KHR,pNext=None,shaderSubgroupUniformControlFlow=None,):
+
+    return _new('VkPhysicalDeviceShaderSubgroupUniformControlFlowFeaturesKHR', sType=sType,pNext=pNext,shaderSubgroupUniformControlFlow=shaderSubgroupUniformControlFlow)
+
+def VkPhysicalDeviceWorkgroupMemoryExplicitLayoutFeaturesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_WORKGROUP_MEMORY_EXPLICIT_LAYOUT_FEATURES_KHR,pNext=None,workgroupMemoryExplicitLayout=None,workgroupMemoryExplicitLayoutScalarBlockLayout=None,workgroupMemoryExplicitLayout8BitAccess=None,workgroupMemoryExplicitLayout16BitAccess=None,):
+
+    return _new('VkPhysicalDeviceWorkgroupMemoryExplicitLayoutFeaturesKHR', sType=sType,pNext=pNext,workgroupMemoryExplicitLayout=workgroupMemoryExplicitLayout,workgroupMemoryExplicitLayoutScalarBlockLayout=workgroupMemoryExplicitLayoutScalarBlockLayout,workgroupMemoryExplicitLayout8BitAccess=workgroupMemoryExplicitLayout8BitAccess,workgroupMemoryExplicitLayout16BitAccess=workgroupMemoryExplicitLayout16BitAccess)
+
+def VkPhysicalDevicePortabilitySubsetFeaturesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PORTABILITY_SUBSET_FEATURES_KHR,pNext=None,constantAlphaColorBlendFactors=None,events=None,imageViewFormatReinterpretation=None,imageViewFormatSwizzle=None,imageView2DOn3DImage=None,multisampleArrayImage=None,mutableComparisonSamplers=None,pointPolygons=None,samplerMipLodBias=None,separateStencilMaskRef=None,shaderSampleRateInterpolationFunctions=None,tessellationIsolines=None,tessellationPointMode=None,triangleFans=None,vertexAttributeAccessBeyondStride=None,):
+
+    return _new('VkPhysicalDevicePortabilitySubsetFeaturesKHR', sType=sType,pNext=pNext,constantAlphaColorBlendFactors=constantAlphaColorBlendFactors,events=events,imageViewFormatReinterpretation=imageViewFormatReinterpretation,imageViewFormatSwizzle=imageViewFormatSwizzle,imageView2DOn3DImage=imageView2DOn3DImage,multisampleArrayImage=multisampleArrayImage,mutableComparisonSamplers=mutableComparisonSamplers,pointPolygons=pointPolygons,samplerMipLodBias=samplerMipLodBias,separateStencilMaskRef=separateStencilMaskRef,shaderSampleRateInterpolationFunctions=shaderSampleRateInterpolationFunctions,tessellationIsolines=tessellationIsolines,tessellationPointMode=tessellationPointMode,triangleFans=triangleFans,vertexAttributeAccessBeyondStride=vertexAttributeAccessBeyondStride)
+
+def VkPhysicalDevicePortabilitySubsetPropertiesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PORTABILITY_SUBSET_PROPERTIES_KHR,pNext=None,minVertexInputBindingStrideAlignment=None,):
+
+    return _new('VkPhysicalDevicePortabilitySubsetPropertiesKHR', sType=sType,pNext=pNext,minVertexInputBindingStrideAlignment=minVertexInputBindingStrideAlignment)
+
+def VkFragmentShadingRateAttachmentInfoKHR(sType=VK_STRUCTURE_TYPE_FRAGMENT_SHADING_RATE_ATTACHMENT_INFO_KHR,pNext=None,pFragmentShadingRateAttachment=None,shadingRateAttachmentTexelSize=None,):
+
+    return _new('VkFragmentShadingRateAttachmentInfoKHR', sType=sType,pNext=pNext,pFragmentShadingRateAttachment=pFragmentShadingRateAttachment,shadingRateAttachmentTexelSize=shadingRateAttachmentTexelSize)
+
+def VkPipelineFragmentShadingRateStateCreateInfoKHR(sType=VK_STRUCTURE_TYPE_PIPELINE_FRAGMENT_SHADING_RATE_STATE_CREATE_INFO_KHR,pNext=None,fragmentSize=None,combinerOps=None,):
+
+    return _new('VkPipelineFragmentShadingRateStateCreateInfoKHR', sType=sType,pNext=pNext,fragmentSize=fragmentSize,combinerOps=combinerOps)
+
+def VkPhysicalDeviceFragmentShadingRateFeaturesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_FEATURES_KHR,pNext=None,pipelineFragmentShadingRate=None,primitiveFragmentShadingRate=None,attachmentFragmentShadingRate=None,):
+
+    return _new('VkPhysicalDeviceFragmentShadingRateFeaturesKHR', sType=sType,pNext=pNext,pipelineFragmentShadingRate=pipelineFragmentShadingRate,primitiveFragmentShadingRate=primitiveFragmentShadingRate,attachmentFragmentShadingRate=attachmentFragmentShadingRate)
+
+def VkPhysicalDeviceFragmentShadingRatePropertiesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_PROPERTIES_KHR,pNext=None,minFragmentShadingRateAttachmentTexelSize=None,maxFragmentShadingRateAttachmentTexelSize=None,maxFragmentShadingRateAttachmentTexelSizeAspectRatio=None,primitiveFragmentShadingRateWithMultipleViewports=None,layeredShadingRateAttachments=None,fragmentShadingRateNonTrivialCombinerOps=None,maxFragmentSize=None,maxFragmentSizeAspectRatio=None,maxFragmentShadingRateCoverageSamples=None,maxFragmentShadingRateRasterizationSamples=None,fragmentShadingRateWithShaderDepthStencilWrites=None,fragmentShadingRateWithSampleMask=None,fragmentShadingRateWithShaderSampleMask=None,fragmentShadingRateWithConservativeRasterization=None,fragmentShadingRateWithFragmentShaderInterlock=None,fragmentShadingRateWithCustomSampleLocations=None,fragmentShadingRateStrictMultiplyCombiner=None,):
+
+    return _new('VkPhysicalDeviceFragmentShadingRatePropertiesKHR', sType=sType,pNext=pNext,minFragmentShadingRateAttachmentTexelSize=minFragmentShadingRateAttachmentTexelSize,maxFragmentShadingRateAttachmentTexelSize=maxFragmentShadingRateAttachmentTexelSize,maxFragmentShadingRateAttachmentTexelSizeAspectRatio=maxFragmentShadingRateAttachmentTexelSizeAspectRatio,primitiveFragmentShadingRateWithMultipleViewports=primitiveFragmentShadingRateWithMultipleViewports,layeredShadingRateAttachments=layeredShadingRateAttachments,fragmentShadingRateNonTrivialCombinerOps=fragmentShadingRateNonTrivialCombinerOps,maxFragmentSize=maxFragmentSize,maxFragmentSizeAspectRatio=maxFragmentSizeAspectRatio,maxFragmentShadingRateCoverageSamples=maxFragmentShadingRateCoverageSamples,maxFragmentShadingRateRasterizationSamples=maxFragmentShadingRateRasterizationSamples,fragmentShadingRateWithShaderDepthStencilWrites=fragmentShadingRateWithShaderDepthStencilWrites,fragmentShadingRateWithSampleMask=fragmentShadingRateWithSampleMask,fragmentShadingRateWithShaderSampleMask=fragmentShadingRateWithShaderSampleMask,fragmentShadingRateWithConservativeRasterization=fragmentShadingRateWithConservativeRasterization,fragmentShadingRateWithFragmentShaderInterlock=fragmentShadingRateWithFragmentShaderInterlock,fragmentShadingRateWithCustomSampleLocations=fragmentShadingRateWithCustomSampleLocations,fragmentShadingRateStrictMultiplyCombiner=fragmentShadingRateStrictMultiplyCombiner)
+
+def VkPhysicalDeviceFragmentShadingRateKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_KHR,pNext=None,sampleCounts=None,fragmentSize=None,):
+
+    return _new('VkPhysicalDeviceFragmentShadingRateKHR', sType=sType,pNext=pNext,sampleCounts=sampleCounts,fragmentSize=fragmentSize)
+
+def VkAccelerationStructureBuildSizesInfoKHR(sType=VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_BUILD_SIZES_INFO_KHR,pNext=None,accelerationStructureSize=None,updateScratchSize=None,buildScratchSize=None,):
+
+    return _new('VkAccelerationStructureBuildSizesInfoKHR', sType=sType,pNext=pNext,accelerationStructureSize=accelerationStructureSize,updateScratchSize=updateScratchSize,buildScratchSize=buildScratchSize)
+
+def VkQueueFamilyCheckpointProperties2NV(sType=VK_STRUCTURE_TYPE_QUEUE_FAMILY_CHECKPOINT_PROPERTIES_2_NV,pNext=None,checkpointExecutionStageMask=None,):
+
+    return _new('VkQueueFamilyCheckpointProperties2NV', sType=sType,pNext=pNext,checkpointExecutionStageMask=checkpointExecutionStageMask)
+
+def VkCheckpointData2NV(sType=VK_STRUCTURE_TYPE_CHECKPOINT_DATA_2_NV,pNext=None,stage=None,pCheckpointMarker=None,):
+
+    return _new('VkCheckpointData2NV', sType=sType,pNext=pNext,stage=stage,pCheckpointMarker=pCheckpointMarker)
+
+def VkQueueFamilyVideoPropertiesKHR(sType=VK_STRUCTURE_TYPE_QUEUE_FAMILY_VIDEO_PROPERTIES_KHR,pNext=None,videoCodecOperations=None,):
+
+    return _new('VkQueueFamilyVideoPropertiesKHR', sType=sType,pNext=pNext,videoCodecOperations=videoCodecOperations)
+
+def VkQueueFamilyQueryResultStatusPropertiesKHR(sType=VK_STRUCTURE_TYPE_QUEUE_FAMILY_QUERY_RESULT_STATUS_PROPERTIES_KHR,pNext=None,queryResultStatusSupport=None,):
+
+    return _new('VkQueueFamilyQueryResultStatusPropertiesKHR', sType=sType,pNext=pNext,queryResultStatusSupport=queryResultStatusSupport)
+
+def VkVideoProfileListInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_PROFILE_LIST_INFO_KHR,pNext=None,profileCount=None,pProfiles=None,):
+    if profileCount is None and pProfiles is not None:
+        profileCount = len(pProfiles)
+
+    return _new('VkVideoProfileListInfoKHR', sType=sType,pNext=pNext,profileCount=profileCount,pProfiles=pProfiles)
+
+def VkPhysicalDeviceVideoFormatInfoKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VIDEO_FORMAT_INFO_KHR,pNext=None,imageUsage=None,):
+
+    return _new('VkPhysicalDeviceVideoFormatInfoKHR', sType=sType,pNext=pNext,imageUsage=imageUsage)
+
+def VkVideoFormatPropertiesKHR(sType=VK_STRUCTURE_TYPE_VIDEO_FORMAT_PROPERTIES_KHR,pNext=None,format=None,componentMapping=None,imageCreateFlags=None,imageType=None,imageTiling=None,imageUsageFlags=None,):
+
+    return _new('VkVideoFormatPropertiesKHR', sType=sType,pNext=pNext,format=format,componentMapping=componentMapping,imageCreateFlags=imageCreateFlags,imageType=imageType,imageTiling=imageTiling,imageUsageFlags=imageUsageFlags)
+
+def VkVideoProfileInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_PROFILE_INFO_KHR,pNext=None,videoCodecOperation=None,chromaSubsampling=None,lumaBitDepth=None,chromaBitDepth=None,):
+
+    return _new('VkVideoProfileInfoKHR', sType=sType,pNext=pNext,videoCodecOperation=videoCodecOperation,chromaSubsampling=chromaSubsampling,lumaBitDepth=lumaBitDepth,chromaBitDepth=chromaBitDepth)
+
+def VkVideoCapabilitiesKHR(sType=VK_STRUCTURE_TYPE_VIDEO_CAPABILITIES_KHR,pNext=None,flags=None,minBitstreamBufferOffsetAlignment=None,minBitstreamBufferSizeAlignment=None,pictureAccessGranularity=None,minCodedExtent=None,maxCodedExtent=None,maxDpbSlots=None,maxActiveReferencePictures=None,stdHeaderVersion=None,):
+
+    return _new('VkVideoCapabilitiesKHR', sType=sType,pNext=pNext,flags=flags,minBitstreamBufferOffsetAlignment=minBitstreamBufferOffsetAlignment,minBitstreamBufferSizeAlignment=minBitstreamBufferSizeAlignment,pictureAccessGranularity=pictureAccessGranularity,minCodedExtent=minCodedExtent,maxCodedExtent=maxCodedExtent,maxDpbSlots=maxDpbSlots,maxActiveReferencePictures=maxActiveReferencePictures,stdHeaderVersion=stdHeaderVersion)
+
+def VkVideoSessionMemoryRequirementsKHR(sType=VK_STRUCTURE_TYPE_VIDEO_SESSION_MEMORY_REQUIREMENTS_KHR,pNext=None,memoryBindIndex=None,memoryRequirements=None,):
+
+    return _new('VkVideoSessionMemoryRequirementsKHR', sType=sType,pNext=pNext,memoryBindIndex=memoryBindIndex,memoryRequirements=memoryRequirements)
+
+def VkBindVideoSessionMemoryInfoKHR(sType=VK_STRUCTURE_TYPE_BIND_VIDEO_SESSION_MEMORY_INFO_KHR,pNext=None,memoryBindIndex=None,memory=None,memoryOffset=None,memorySize=None,):
+
+    return _new('VkBindVideoSessionMemoryInfoKHR', sType=sType,pNext=pNext,memoryBindIndex=memoryBindIndex,memory=memory,memoryOffset=memoryOffset,memorySize=memorySize)
+
+def VkVideoPictureResourceInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_PICTURE_RESOURCE_INFO_KHR,pNext=None,codedOffset=None,codedExtent=None,baseArrayLayer=None,imageViewBinding=None,):
+
+    return _new('VkVideoPictureResourceInfoKHR', sType=sType,pNext=pNext,codedOffset=codedOffset,codedExtent=codedExtent,baseArrayLayer=baseArrayLayer,imageViewBinding=imageViewBinding)
+
+def VkVideoReferenceSlotInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_REFERENCE_SLOT_INFO_KHR,pNext=None,slotIndex=None,pPictureResource=None,):
+
+    return _new('VkVideoReferenceSlotInfoKHR', sType=sType,pNext=pNext,slotIndex=slotIndex,pPictureResource=pPictureResource)
+
+def VkVideoDecodeCapabilitiesKHR(sType=VK_STRUCTURE_TYPE_VIDEO_DECODE_CAPABILITIES_KHR,pNext=None,flags=None,):
+
+    return _new('VkVideoDecodeCapabilitiesKHR', sType=sType,pNext=pNext,flags=flags)
+
+def VkVideoDecodeUsageInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_DECODE_USAGE_INFO_KHR,pNext=None,videoUsageHints=None,):
+
+    return _new('VkVideoDecodeUsageInfoKHR', sType=sType,pNext=pNext,videoUsageHints=videoUsageHints)
+
+def VkVideoDecodeInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_DECODE_INFO_KHR,pNext=None,flags=None,srcBuffer=None,srcBufferOffset=None,srcBufferRange=None,dstPictureResource=None,pSetupReferenceSlot=None,referenceSlotCount=None,pReferenceSlots=None,):
+    if referenceSlotCount is None and pReferenceSlots is not None:
+        referenceSlotCount = len(pReferenceSlots)
+
+    return _new('VkVideoDecodeInfoKHR', sType=sType,pNext=pNext,flags=flags,srcBuffer=srcBuffer,srcBufferOffset=srcBufferOffset,srcBufferRange=srcBufferRange,dstPictureResource=dstPictureResource,pSetupReferenceSlot=pSetupReferenceSlot,referenceSlotCount=referenceSlotCount,pReferenceSlots=pReferenceSlots)
+
+def VkPhysicalDeviceVideoMaintenance1FeaturesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VIDEO_MAINTENANCE_1_FEATURES_KHR,pNext=None,videoMaintenance1=None,):
+
+    return _new('VkPhysicalDeviceVideoMaintenance1FeaturesKHR', sType=sType,pNext=pNext,videoMaintenance1=videoMaintenance1)
+
+def VkVideoInlineQueryInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_INLINE_QUERY_INFO_KHR,pNext=None,queryPool=None,firstQuery=None,queryCount=None,):
+
+    return _new('VkVideoInlineQueryInfoKHR', sType=sType,pNext=pNext,queryPool=queryPool,firstQuery=firstQuery,queryCount=queryCount)
+
+def VkVideoDecodeH264ProfileInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_DECODE_H264_PROFILE_INFO_KHR,pNext=None,stdProfileIdc=None,pictureLayout=None,):
+
+    return _new('VkVideoDecodeH264ProfileInfoKHR', sType=sType,pNext=pNext,stdProfileIdc=stdProfileIdc,pictureLayout=pictureLayout)
+
+def VkVideoDecodeH264CapabilitiesKHR(sType=VK_STRUCTURE_TYPE_VIDEO_DECODE_H264_CAPABILITIES_KHR,pNext=None,maxLevelIdc=None,fieldOffsetGranularity=None,):
+
+    return _new('VkVideoDecodeH264CapabilitiesKHR', sType=sType,pNext=pNext,maxLevelIdc=maxLevelIdc,fieldOffsetGranularity=fieldOffsetGranularity)
+
+def VkVideoDecodeH264SessionParametersAddInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_DECODE_H264_SESSION_PARAMETERS_ADD_INFO_KHR,pNext=None,stdSPSCount=None,pStdSPSs=None,stdPPSCount=None,pStdPPSs=None,):
+    if stdSPSCount is None and pStdSPSs is not None:
+        stdSPSCount = len(pStdSPSs)
+    if stdPPSCount is None and pStdPPSs is not None:
+        stdPPSCount = len(pStdPPSs)
+
+    return _new('VkVideoDecodeH264SessionParametersAddInfoKHR', sType=sType,pNext=pNext,stdSPSCount=stdSPSCount,pStdSPSs=pStdSPSs,stdPPSCount=stdPPSCount,pStdPPSs=pStdPPSs)
+
+def VkVideoDecodeH264SessionParametersCreateInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_DECODE_H264_SESSION_PARAMETERS_CREATE_INFO_KHR,pNext=None,maxStdSPSCount=None,maxStdPPSCount=None,pParametersAddInfo=None,):
+
+    return _new('VkVideoDecodeH264SessionParametersCreateInfoKHR', sType=sType,pNext=pNext,maxStdSPSCount=maxStdSPSCount,maxStdPPSCount=maxStdPPSCount,pParametersAddInfo=pParametersAddInfo)
+
+def VkVideoDecodeH264PictureInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_DECODE_H264_PICTURE_INFO_KHR,pNext=None,pStdPictureInfo=None,sliceCount=None,pSliceOffsets=None,):
+    if sliceCount is None and pSliceOffsets is not None:
+        sliceCount = len(pSliceOffsets)
+
+    return _new('VkVideoDecodeH264PictureInfoKHR', sType=sType,pNext=pNext,pStdPictureInfo=pStdPictureInfo,sliceCount=sliceCount,pSliceOffsets=pSliceOffsets)
+
+def VkVideoDecodeH264DpbSlotInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_DECODE_H264_DPB_SLOT_INFO_KHR,pNext=None,pStdReferenceInfo=None,):
+
+    return _new('VkVideoDecodeH264DpbSlotInfoKHR', sType=sType,pNext=pNext,pStdReferenceInfo=pStdReferenceInfo)
+
+def VkVideoDecodeH265ProfileInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_DECODE_H265_PROFILE_INFO_KHR,pNext=None,stdProfileIdc=None,):
+
+    return _new('VkVideoDecodeH265ProfileInfoKHR', sType=sType,pNext=pNext,stdProfileIdc=stdProfileIdc)
+
+def VkVideoDecodeH265CapabilitiesKHR(sType=VK_STRUCTURE_TYPE_VIDEO_DECODE_H265_CAPABILITIES_KHR,pNext=None,maxLevelIdc=None,):
+
+    return _new('VkVideoDecodeH265CapabilitiesKHR', sType=sType,pNext=pNext,maxLevelIdc=maxLevelIdc)
+
+def VkVideoDecodeH265SessionParametersAddInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_DECODE_H265_SESSION_PARAMETERS_ADD_INFO_KHR,pNext=None,stdVPSCount=None,pStdVPSs=None,stdSPSCount=None,pStdSPSs=None,stdPPSCount=None,pStdPPSs=None,):
+    if stdVPSCount is None and pStdVPSs is not None:
+        stdVPSCount = len(pStdVPSs)
+    if stdSPSCount is None and pStdSPSs is not None:
+        stdSPSCount = len(pStdSPSs)
+    if stdPPSCount is None and pStdPPSs is not None:
+        stdPPSCount = len(pStdPPSs)
+
+    return _new('VkVideoDecodeH265SessionParametersAddInfoKHR', sType=sType,pNext=pNext,stdVPSCount=stdVPSCount,pStdVPSs=pStdVPSs,stdSPSCount=stdSPSCount,pStdSPSs=pStdSPSs,stdPPSCount=stdPPSCount,pStdPPSs=pStdPPSs)
+
+def VkVideoDecodeH265SessionParametersCreateInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_DECODE_H265_SESSION_PARAMETERS_CREATE_INFO_KHR,pNext=None,maxStdVPSCount=None,maxStdSPSCount=None,maxStdPPSCount=None,pParametersAddInfo=None,):
+
+    return _new('VkVideoDecodeH265SessionParametersCreateInfoKHR', sType=sType,pNext=pNext,maxStdVPSCount=maxStdVPSCount,maxStdSPSCount=maxStdSPSCount,maxStdPPSCount=maxStdPPSCount,pParametersAddInfo=pParametersAddInfo)
+
+def VkVideoDecodeH265PictureInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_DECODE_H265_PICTURE_INFO_KHR,pNext=None,pStdPictureInfo=None,sliceSegmentCount=None,pSliceSegmentOffsets=None,):
+    if sliceSegmentCount is None and pSliceSegmentOffsets is not None:
+        sliceSegmentCount = len(pSliceSegmentOffsets)
+
+    return _new('VkVideoDecodeH265PictureInfoKHR', sType=sType,pNext=pNext,pStdPictureInfo=pStdPictureInfo,sliceSegmentCount=sliceSegmentCount,pSliceSegmentOffsets=pSliceSegmentOffsets)
+
+def VkVideoDecodeH265DpbSlotInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_DECODE_H265_DPB_SLOT_INFO_KHR,pNext=None,pStdReferenceInfo=None,):
+
+    return _new('VkVideoDecodeH265DpbSlotInfoKHR', sType=sType,pNext=pNext,pStdReferenceInfo=pStdReferenceInfo)
+
+def VkVideoSessionCreateInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_SESSION_CREATE_INFO_KHR,pNext=None,queueFamilyIndex=None,flags=None,pVideoProfile=None,pictureFormat=None,maxCodedExtent=None,referencePictureFormat=None,maxDpbSlots=None,maxActiveReferencePictures=None,pStdHeaderVersion=None,):
+
+    return _new('VkVideoSessionCreateInfoKHR', sType=sType,pNext=pNext,queueFamilyIndex=queueFamilyIndex,flags=flags,pVideoProfile=pVideoProfile,pictureFormat=pictureFormat,maxCodedExtent=maxCodedExtent,referencePictureFormat=referencePictureFormat,maxDpbSlots=maxDpbSlots,maxActiveReferencePictures=maxActiveReferencePictures,pStdHeaderVersion=pStdHeaderVersion)
+
+def VkVideoSessionParametersCreateInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_SESSION_PARAMETERS_CREATE_INFO_KHR,pNext=None,flags=None,videoSessionParametersTemplate=None,videoSession=None,):
+
+    return _new('VkVideoSessionParametersCreateInfoKHR', sType=sType,pNext=pNext,flags=flags,videoSessionParametersTemplate=videoSessionParametersTemplate,videoSession=videoSession)
+
+def VkVideoSessionParametersUpdateInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_SESSION_PARAMETERS_UPDATE_INFO_KHR,pNext=None,updateSequenceCount=None,):
+
+    return _new('VkVideoSessionParametersUpdateInfoKHR', sType=sType,pNext=pNext,updateSequenceCount=updateSequenceCount)
+
+def VkVideoEncodeSessionParametersGetInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_SESSION_PARAMETERS_GET_INFO_KHR,pNext=None,videoSessionParameters=None,):
+
+    return _new('VkVideoEncodeSessionParametersGetInfoKHR', sType=sType,pNext=pNext,videoSessionParameters=videoSessionParameters)
+
+def VkVideoEncodeSessionParametersFeedbackInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_SESSION_PARAMETERS_FEEDBACK_INFO_KHR,pNext=None,hasOverrides=None,):
+
+    return _new('VkVideoEncodeSessionParametersFeedbackInfoKHR', sType=sType,pNext=pNext,hasOverrides=hasOverrides)
+
+def VkVideoBeginCodingInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_BEGIN_CODING_INFO_KHR,pNext=None,flags=None,videoSession=None,videoSessionParameters=None,referenceSlotCount=None,pReferenceSlots=None,):
+    if referenceSlotCount is None and pReferenceSlots is not None:
+        referenceSlotCount = len(pReferenceSlots)
+
+    return _new('VkVideoBeginCodingInfoKHR', sType=sType,pNext=pNext,flags=flags,videoSession=videoSession,videoSessionParameters=videoSessionParameters,referenceSlotCount=referenceSlotCount,pReferenceSlots=pReferenceSlots)
+
+def VkVideoEndCodingInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_END_CODING_INFO_KHR,pNext=None,flags=None,):
+
+    return _new('VkVideoEndCodingInfoKHR', sType=sType,pNext=pNext,flags=flags)
+
+def VkVideoCodingControlInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_CODING_CONTROL_INFO_KHR,pNext=None,flags=None,):
+
+    return _new('VkVideoCodingControlInfoKHR', sType=sType,pNext=pNext,flags=flags)
+
+def VkVideoEncodeUsageInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_USAGE_INFO_KHR,pNext=None,videoUsageHints=None,videoContentHints=None,tuningMode=None,):
+
+    return _new('VkVideoEncodeUsageInfoKHR', sType=sType,pNext=pNext,videoUsageHints=videoUsageHints,videoContentHints=videoContentHints,tuningMode=tuningMode)
+
+def VkVideoEncodeInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_INFO_KHR,pNext=None,flags=None,dstBuffer=None,dstBufferOffset=None,dstBufferRange=None,srcPictureResource=None,pSetupReferenceSlot=None,referenceSlotCount=None,pReferenceSlots=None,precedingExternallyEncodedBytes=None,):
+    if referenceSlotCount is None and pReferenceSlots is not None:
+        referenceSlotCount = len(pReferenceSlots)
+
+    return _new('VkVideoEncodeInfoKHR', sType=sType,pNext=pNext,flags=flags,dstBuffer=dstBuffer,dstBufferOffset=dstBufferOffset,dstBufferRange=dstBufferRange,srcPictureResource=srcPictureResource,pSetupReferenceSlot=pSetupReferenceSlot,referenceSlotCount=referenceSlotCount,pReferenceSlots=pReferenceSlots,precedingExternallyEncodedBytes=precedingExternallyEncodedBytes)
+
+def VkQueryPoolVideoEncodeFeedbackCreateInfoKHR(sType=VK_STRUCTURE_TYPE_QUERY_POOL_VIDEO_ENCODE_FEEDBACK_CREATE_INFO_KHR,pNext=None,encodeFeedbackFlags=None,):
+
+    return _new('VkQueryPoolVideoEncodeFeedbackCreateInfoKHR', sType=sType,pNext=pNext,encodeFeedbackFlags=encodeFeedbackFlags)
+
+def VkVideoEncodeQualityLevelInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_QUALITY_LEVEL_INFO_KHR,pNext=None,qualityLevel=None,):
+
+    return _new('VkVideoEncodeQualityLevelInfoKHR', sType=sType,pNext=pNext,qualityLevel=qualityLevel)
+
+def VkPhysicalDeviceVideoEncodeQualityLevelInfoKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VIDEO_ENCODE_QUALITY_LEVEL_INFO_KHR,pNext=None,pVideoProfile=None,qualityLevel=None,):
+
+    return _new('VkPhysicalDeviceVideoEncodeQualityLevelInfoKHR', sType=sType,pNext=pNext,pVideoProfile=pVideoProfile,qualityLevel=qualityLevel)
+
+def VkVideoEncodeQualityLevelPropertiesKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_QUALITY_LEVEL_PROPERTIES_KHR,pNext=None,preferredRateControlMode=None,preferredRateControlLayerCount=None,):
+
+    return _new('VkVideoEncodeQualityLevelPropertiesKHR', sType=sType,pNext=pNext,preferredRateControlMode=preferredRateControlMode,preferredRateControlLayerCount=preferredRateControlLayerCount)
+
+def VkVideoEncodeRateControlInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_RATE_CONTROL_INFO_KHR,pNext=None,flags=None,rateControlMode=None,layerCount=None,pLayers=None,virtualBufferSizeInMs=None,initialVirtualBufferSizeInMs=None,):
+    if layerCount is None and pLayers is not None:
+        layerCount = len(pLayers)
+
+    return _new('VkVideoEncodeRateControlInfoKHR', sType=sType,pNext=pNext,flags=flags,rateControlMode=rateControlMode,layerCount=layerCount,pLayers=pLayers,virtualBufferSizeInMs=virtualBufferSizeInMs,initialVirtualBufferSizeInMs=initialVirtualBufferSizeInMs)
+
+def VkVideoEncodeRateControlLayerInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_RATE_CONTROL_LAYER_INFO_KHR,pNext=None,averageBitrate=None,maxBitrate=None,frameRateNumerator=None,frameRateDenominator=None,):
+
+    return _new('VkVideoEncodeRateControlLayerInfoKHR', sType=sType,pNext=pNext,averageBitrate=averageBitrate,maxBitrate=maxBitrate,frameRateNumerator=frameRateNumerator,frameRateDenominator=frameRateDenominator)
+
+def VkVideoEncodeCapabilitiesKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_CAPABILITIES_KHR,pNext=None,flags=None,rateControlModes=None,maxRateControlLayers=None,maxBitrate=None,maxQualityLevels=None,encodeInputPictureGranularity=None,supportedEncodeFeedbackFlags=None,):
+
+    return _new('VkVideoEncodeCapabilitiesKHR', sType=sType,pNext=pNext,flags=flags,rateControlModes=rateControlModes,maxRateControlLayers=maxRateControlLayers,maxBitrate=maxBitrate,maxQualityLevels=maxQualityLevels,encodeInputPictureGranularity=encodeInputPictureGranularity,supportedEncodeFeedbackFlags=supportedEncodeFeedbackFlags)
+
+def VkVideoEncodeH264CapabilitiesKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_CAPABILITIES_KHR,pNext=None,flags=None,maxLevelIdc=None,maxSliceCount=None,maxPPictureL0ReferenceCount=None,maxBPictureL0ReferenceCount=None,maxL1ReferenceCount=None,maxTemporalLayerCount=None,expectDyadicTemporalLayerPattern=None,minQp=None,maxQp=None,prefersGopRemainingFrames=None,requiresGopRemainingFrames=None,stdSyntaxFlags=None,):
+
+    return _new('VkVideoEncodeH264CapabilitiesKHR', sType=sType,pNext=pNext,flags=flags,maxLevelIdc=maxLevelIdc,maxSliceCount=maxSliceCount,maxPPictureL0ReferenceCount=maxPPictureL0ReferenceCount,maxBPictureL0ReferenceCount=maxBPictureL0ReferenceCount,maxL1ReferenceCount=maxL1ReferenceCount,maxTemporalLayerCount=maxTemporalLayerCount,expectDyadicTemporalLayerPattern=expectDyadicTemporalLayerPattern,minQp=minQp,maxQp=maxQp,prefersGopRemainingFrames=prefersGopRemainingFrames,requiresGopRemainingFrames=requiresGopRemainingFrames,stdSyntaxFlags=stdSyntaxFlags)
+
+def VkVideoEncodeH264QualityLevelPropertiesKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_QUALITY_LEVEL_PROPERTIES_KHR,pNext=None,preferredRateControlFlags=None,preferredGopFrameCount=None,preferredIdrPeriod=None,preferredConsecutiveBFrameCount=None,preferredTemporalLayerCount=None,preferredConstantQp=None,preferredMaxL0ReferenceCount=None,preferredMaxL1ReferenceCount=None,preferredStdEntropyCodingModeFlag=None,):
+
+    return _new('VkVideoEncodeH264QualityLevelPropertiesKHR', sType=sType,pNext=pNext,preferredRateControlFlags=preferredRateControlFlags,preferredGopFrameCount=preferredGopFrameCount,preferredIdrPeriod=preferredIdrPeriod,preferredConsecutiveBFrameCount=preferredConsecutiveBFrameCount,preferredTemporalLayerCount=preferredTemporalLayerCount,preferredConstantQp=preferredConstantQp,preferredMaxL0ReferenceCount=preferredMaxL0ReferenceCount,preferredMaxL1ReferenceCount=preferredMaxL1ReferenceCount,preferredStdEntropyCodingModeFlag=preferredStdEntropyCodingModeFlag)
+
+def VkVideoEncodeH264SessionCreateInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_SESSION_CREATE_INFO_KHR,pNext=None,useMaxLevelIdc=None,maxLevelIdc=None,):
+
+    return _new('VkVideoEncodeH264SessionCreateInfoKHR', sType=sType,pNext=pNext,useMaxLevelIdc=useMaxLevelIdc,maxLevelIdc=maxLevelIdc)
+
+def VkVideoEncodeH264SessionParametersAddInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_SESSION_PARAMETERS_ADD_INFO_KHR,pNext=None,stdSPSCount=None,pStdSPSs=None,stdPPSCount=None,pStdPPSs=None,):
+    if stdSPSCount is None and pStdSPSs is not None:
+        stdSPSCount = len(pStdSPSs)
+    if stdPPSCount is None and pStdPPSs is not None:
+        stdPPSCount = len(pStdPPSs)
+
+    return _new('VkVideoEncodeH264SessionParametersAddInfoKHR', sType=sType,pNext=pNext,stdSPSCount=stdSPSCount,pStdSPSs=pStdSPSs,stdPPSCount=stdPPSCount,pStdPPSs=pStdPPSs)
+
+def VkVideoEncodeH264SessionParametersCreateInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_SESSION_PARAMETERS_CREATE_INFO_KHR,pNext=None,maxStdSPSCount=None,maxStdPPSCount=None,pParametersAddInfo=None,):
+
+    return _new('VkVideoEncodeH264SessionParametersCreateInfoKHR', sType=sType,pNext=pNext,maxStdSPSCount=maxStdSPSCount,maxStdPPSCount=maxStdPPSCount,pParametersAddInfo=pParametersAddInfo)
+
+def VkVideoEncodeH264SessionParametersGetInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_SESSION_PARAMETERS_GET_INFO_KHR,pNext=None,writeStdSPS=None,writeStdPPS=None,stdSPSId=None,stdPPSId=None,):
+
+    return _new('VkVideoEncodeH264SessionParametersGetInfoKHR', sType=sType,pNext=pNext,writeStdSPS=writeStdSPS,writeStdPPS=writeStdPPS,stdSPSId=stdSPSId,stdPPSId=stdPPSId)
+
+def VkVideoEncodeH264SessionParametersFeedbackInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_SESSION_PARAMETERS_FEEDBACK_INFO_KHR,pNext=None,hasStdSPSOverrides=None,hasStdPPSOverrides=None,):
+
+    return _new('VkVideoEncodeH264SessionParametersFeedbackInfoKHR', sType=sType,pNext=pNext,hasStdSPSOverrides=hasStdSPSOverrides,hasStdPPSOverrides=hasStdPPSOverrides)
+
+def VkVideoEncodeH264DpbSlotInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_DPB_SLOT_INFO_KHR,pNext=None,pStdReferenceInfo=None,):
+
+    return _new('VkVideoEncodeH264DpbSlotInfoKHR', sType=sType,pNext=pNext,pStdReferenceInfo=pStdReferenceInfo)
+
+def VkVideoEncodeH264PictureInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_PICTURE_INFO_KHR,pNext=None,naluSliceEntryCount=None,pNaluSliceEntries=None,pStdPictureInfo=None,generatePrefixNalu=None,):
+    if naluSliceEntryCount is None and pNaluSliceEntries is not None:
+        naluSliceEntryCount = len(pNaluSliceEntries)
+
+    return _new('VkVideoEncodeH264PictureInfoKHR', sType=sType,pNext=pNext,naluSliceEntryCount=naluSliceEntryCount,pNaluSliceEntries=pNaluSliceEntries,pStdPictureInfo=pStdPictureInfo,generatePrefixNalu=generatePrefixNalu)
+
+def VkVideoEncodeH264ProfileInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_PROFILE_INFO_KHR,pNext=None,stdProfileIdc=None,):
+
+    return _new('VkVideoEncodeH264ProfileInfoKHR', sType=sType,pNext=pNext,stdProfileIdc=stdProfileIdc)
+
+def VkVideoEncodeH264NaluSliceInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_NALU_SLICE_INFO_KHR,pNext=None,constantQp=None,pStdSliceHeader=None,):
+
+    return _new('VkVideoEncodeH264NaluSliceInfoKHR', sType=sType,pNext=pNext,constantQp=constantQp,pStdSliceHeader=pStdSliceHeader)
+
+def VkVideoEncodeH264RateControlInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_RATE_CONTROL_INFO_KHR,pNext=None,flags=None,gopFrameCount=None,idrPeriod=None,consecutiveBFrameCount=None,temporalLayerCount=None,):
+
+    return _new('VkVideoEncodeH264RateControlInfoKHR', sType=sType,pNext=pNext,flags=flags,gopFrameCount=gopFrameCount,idrPeriod=idrPeriod,consecutiveBFrameCount=consecutiveBFrameCount,temporalLayerCount=temporalLayerCount)
+
+def VkVideoEncodeH264QpKHR(qpI=None,qpP=None,qpB=None,):
+
+    return _new('VkVideoEncodeH264QpKHR', qpI=qpI,qpP=qpP,qpB=qpB)
+
+def VkVideoEncodeH264FrameSizeKHR(frameISize=None,framePSize=None,frameBSize=None,):
+
+    return _new('VkVideoEncodeH264FrameSizeKHR', frameISize=frameISize,framePSize=framePSize,frameBSize=frameBSize)
+
+def VkVideoEncodeH264GopRemainingFrameInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_GOP_REMAINING_FRAME_INFO_KHR,pNext=None,useGopRemainingFrames=None,gopRemainingI=None,gopRemainingP=None,gopRemainingB=None,):
+
+    return _new('VkVideoEncodeH264GopRemainingFrameInfoKHR', sType=sType,pNext=pNext,useGopRemainingFrames=useGopRemainingFrames,gopRemainingI=gopRemainingI,gopRemainingP=gopRemainingP,gopRemainingB=gopRemainingB)
+
+def VkVideoEncodeH264RateControlLayerInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_RATE_CONTROL_LAYER_INFO_KHR,pNext=None,useMinQp=None,minQp=None,useMaxQp=None,maxQp=None,useMaxFrameSize=None,maxFrameSize=None,):
+
+    return _new('VkVideoEncodeH264RateControlLayerInfoKHR', sType=sType,pNext=pNext,useMinQp=useMinQp,minQp=minQp,useMaxQp=useMaxQp,maxQp=maxQp,useMaxFrameSize=useMaxFrameSize,maxFrameSize=maxFrameSize)
+
+def VkVideoEncodeH265CapabilitiesKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_CAPABILITIES_KHR,pNext=None,flags=None,maxLevelIdc=None,maxSliceSegmentCount=None,maxTiles=None,ctbSizes=None,transformBlockSizes=None,maxPPictureL0ReferenceCount=None,maxBPictureL0ReferenceCount=None,maxL1ReferenceCount=None,maxSubLayerCount=None,expectDyadicTemporalSubLayerPattern=None,minQp=None,maxQp=None,prefersGopRemainingFrames=None,requiresGopRemainingFrames=None,stdSyntaxFlags=None,):
+
+    return _new('VkVideoEncodeH265CapabilitiesKHR', sType=sType,pNext=pNext,flags=flags,maxLevelIdc=maxLevelIdc,maxSliceSegmentCount=maxSliceSegmentCount,maxTiles=maxTiles,ctbSizes=ctbSizes,transformBlockSizes=transformBlockSizes,maxPPictureL0ReferenceCount=maxPPictureL0ReferenceCount,maxBPictureL0ReferenceCount=maxBPictureL0ReferenceCount,maxL1ReferenceCount=maxL1ReferenceCount,maxSubLayerCount=maxSubLayerCount,expectDyadicTemporalSubLayerPattern=expectDyadicTemporalSubLayerPattern,minQp=minQp,maxQp=maxQp,prefersGopRemainingFrames=prefersGopRemainingFrames,requiresGopRemainingFrames=requiresGopRemainingFrames,stdSyntaxFlags=stdSyntaxFlags)
+
+def VkVideoEncodeH265QualityLevelPropertiesKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_QUALITY_LEVEL_PROPERTIES_KHR,pNext=None,preferredRateControlFlags=None,preferredGopFrameCount=None,preferredIdrPeriod=None,preferredConsecutiveBFrameCount=None,preferredSubLayerCount=None,preferredConstantQp=None,preferredMaxL0ReferenceCount=None,preferredMaxL1ReferenceCount=None,):
+
+    return _new('VkVideoEncodeH265QualityLevelPropertiesKHR', sType=sType,pNext=pNext,preferredRateControlFlags=preferredRateControlFlags,preferredGopFrameCount=preferredGopFrameCount,preferredIdrPeriod=preferredIdrPeriod,preferredConsecutiveBFrameCount=preferredConsecutiveBFrameCount,preferredSubLayerCount=preferredSubLayerCount,preferredConstantQp=preferredConstantQp,preferredMaxL0ReferenceCount=preferredMaxL0ReferenceCount,preferredMaxL1ReferenceCount=preferredMaxL1ReferenceCount)
+
+def VkVideoEncodeH265SessionCreateInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_SESSION_CREATE_INFO_KHR,pNext=None,useMaxLevelIdc=None,maxLevelIdc=None,):
+
+    return _new('VkVideoEncodeH265SessionCreateInfoKHR', sType=sType,pNext=pNext,useMaxLevelIdc=useMaxLevelIdc,maxLevelIdc=maxLevelIdc)
+
+def VkVideoEncodeH265SessionParametersAddInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_SESSION_PARAMETERS_ADD_INFO_KHR,pNext=None,stdVPSCount=None,pStdVPSs=None,stdSPSCount=None,pStdSPSs=None,stdPPSCount=None,pStdPPSs=None,):
+    if stdVPSCount is None and pStdVPSs is not None:
+        stdVPSCount = len(pStdVPSs)
+    if stdSPSCount is None and pStdSPSs is not None:
+        stdSPSCount = len(pStdSPSs)
+    if stdPPSCount is None and pStdPPSs is not None:
+        stdPPSCount = len(pStdPPSs)
+
+    return _new('VkVideoEncodeH265SessionParametersAddInfoKHR', sType=sType,pNext=pNext,stdVPSCount=stdVPSCount,pStdVPSs=pStdVPSs,stdSPSCount=stdSPSCount,pStdSPSs=pStdSPSs,stdPPSCount=stdPPSCount,pStdPPSs=pStdPPSs)
+
+def VkVideoEncodeH265SessionParametersCreateInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_SESSION_PARAMETERS_CREATE_INFO_KHR,pNext=None,maxStdVPSCount=None,maxStdSPSCount=None,maxStdPPSCount=None,pParametersAddInfo=None,):
+
+    return _new('VkVideoEncodeH265SessionParametersCreateInfoKHR', sType=sType,pNext=pNext,maxStdVPSCount=maxStdVPSCount,maxStdSPSCount=maxStdSPSCount,maxStdPPSCount=maxStdPPSCount,pParametersAddInfo=pParametersAddInfo)
+
+def VkVideoEncodeH265SessionParametersGetInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_SESSION_PARAMETERS_GET_INFO_KHR,pNext=None,writeStdVPS=None,writeStdSPS=None,writeStdPPS=None,stdVPSId=None,stdSPSId=None,stdPPSId=None,):
+
+    return _new('VkVideoEncodeH265SessionParametersGetInfoKHR', sType=sType,pNext=pNext,writeStdVPS=writeStdVPS,writeStdSPS=writeStdSPS,writeStdPPS=writeStdPPS,stdVPSId=stdVPSId,stdSPSId=stdSPSId,stdPPSId=stdPPSId)
+
+def VkVideoEncodeH265SessionParametersFeedbackInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_SESSION_PARAMETERS_FEEDBACK_INFO_KHR,pNext=None,hasStdVPSOverrides=None,hasStdSPSOverrides=None,hasStdPPSOverrides=None,):
+
+    return _new('VkVideoEncodeH265SessionParametersFeedbackInfoKHR', sType=sType,pNext=pNext,hasStdVPSOverrides=hasStdVPSOverrides,hasStdSPSOverrides=hasStdSPSOverrides,hasStdPPSOverrides=hasStdPPSOverrides)
+
+def VkVideoEncodeH265PictureInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_PICTURE_INFO_KHR,pNext=None,naluSliceSegmentEntryCount=None,pNaluSliceSegmentEntries=None,pStdPictureInfo=None,):
+    if naluSliceSegmentEntryCount is None and pNaluSliceSegmentEntries is not None:
+        naluSliceSegmentEntryCount = len(pNaluSliceSegmentEntries)
+
+    return _new('VkVideoEncodeH265PictureInfoKHR', sType=sType,pNext=pNext,naluSliceSegmentEntryCount=naluSliceSegmentEntryCount,pNaluSliceSegmentEntries=pNaluSliceSegmentEntries,pStdPictureInfo=pStdPictureInfo)
+
+def VkVideoEncodeH265NaluSliceSegmentInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_NALU_SLICE_SEGMENT_INFO_KHR,pNext=None,constantQp=None,pStdSliceSegmentHeader=None,):
+
+    return _new('VkVideoEncodeH265NaluSliceSegmentInfoKHR', sType=sType,pNext=pNext,constantQp=constantQp,pStdSliceSegmentHeader=pStdSliceSegmentHeader)
+
+def VkVideoEncodeH265RateControlInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_RATE_CONTROL_INFO_KHR,pNext=None,flags=None,gopFrameCount=None,idrPeriod=None,consecutiveBFrameCount=None,subLayerCount=None,):
+
+    return _new('VkVideoEncodeH265RateControlInfoKHR', sType=sType,pNext=pNext,flags=flags,gopFrameCount=gopFrameCount,idrPeriod=idrPeriod,consecutiveBFrameCount=consecutiveBFrameCount,subLayerCount=subLayerCount)
+
+def VkVideoEncodeH265QpKHR(qpI=None,qpP=None,qpB=None,):
+
+    return _new('VkVideoEncodeH265QpKHR', qpI=qpI,qpP=qpP,qpB=qpB)
+
+def VkVideoEncodeH265FrameSizeKHR(frameISize=None,framePSize=None,frameBSize=None,):
+
+    return _new('VkVideoEncodeH265FrameSizeKHR', frameISize=frameISize,framePSize=framePSize,frameBSize=frameBSize)
+
+def VkVideoEncodeH265GopRemainingFrameInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_GOP_REMAINING_FRAME_INFO_KHR,pNext=None,useGopRemainingFrames=None,gopRemainingI=None,gopRemainingP=None,gopRemainingB=None,):
+
+    return _new('VkVideoEncodeH265GopRemainingFrameInfoKHR', sType=sType,pNext=pNext,useGopRemainingFrames=useGopRemainingFrames,gopRemainingI=gopRemainingI,gopRemainingP=gopRemainingP,gopRemainingB=gopRemainingB)
+
+def VkVideoEncodeH265RateControlLayerInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_RATE_CONTROL_LAYER_INFO_KHR,pNext=None,useMinQp=None,minQp=None,useMaxQp=None,maxQp=None,useMaxFrameSize=None,maxFrameSize=None,):
+
+    return _new('VkVideoEncodeH265RateControlLayerInfoKHR', sType=sType,pNext=pNext,useMinQp=useMinQp,minQp=minQp,useMaxQp=useMaxQp,maxQp=maxQp,useMaxFrameSize=useMaxFrameSize,maxFrameSize=maxFrameSize)
+
+def VkVideoEncodeH265ProfileInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_PROFILE_INFO_KHR,pNext=None,stdProfileIdc=None,):
+
+    return _new('VkVideoEncodeH265ProfileInfoKHR', sType=sType,pNext=pNext,stdProfileIdc=stdProfileIdc)
+
+def VkVideoEncodeH265DpbSlotInfoKHR(sType=VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_DPB_SLOT_INFO_KHR,pNext=None,pStdReferenceInfo=None,):
+
+    return _new('VkVideoEncodeH265DpbSlotInfoKHR', sType=sType,pNext=pNext,pStdReferenceInfo=pStdReferenceInfo)
+
+def VkPhysicalDeviceFragmentShaderBarycentricFeaturesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADER_BARYCENTRIC_FEATURES_KHR,pNext=None,fragmentShaderBarycentric=None,):
+
+    return _new('VkPhysicalDeviceFragmentShaderBarycentricFeaturesKHR', sType=sType,pNext=pNext,fragmentShaderBarycentric=fragmentShaderBarycentric)
+
+def VkPhysicalDeviceFragmentShaderBarycentricPropertiesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADER_BARYCENTRIC_PROPERTIES_KHR,pNext=None,triStripVertexOrderIndependentOfProvokingVertex=None,):
+
+    return _new('VkPhysicalDeviceFragmentShaderBarycentricPropertiesKHR', sType=sType,pNext=pNext,triStripVertexOrderIndependentOfProvokingVertex=triStripVertexOrderIndependentOfProvokingVertex)
+
+def VkRenderingFragmentShadingRateAttachmentInfoKHR(sType=VK_STRUCTURE_TYPE_RENDERING_FRAGMENT_SHADING_RATE_ATTACHMENT_INFO_KHR,pNext=None,imageView=None,imageLayout=None,shadingRateAttachmentTexelSize=None,):
+
+    return _new('VkRenderingFragmentShadingRateAttachmentInfoKHR', sType=sType,pNext=pNext,imageView=imageView,imageLayout=imageLayout,shadingRateAttachmentTexelSize=shadingRateAttachmentTexelSize)
+
+def VkRenderingFragmentDensityMapAttachmentInfoEXT(sType=VK_STRUCTURE_TYPE_RENDERING_FRAGMENT_DENSITY_MAP_ATTACHMENT_INFO_EXT,pNext=None,imageView=None,imageLayout=None,):
+
+    return _new('VkRenderingFragmentDensityMapAttachmentInfoEXT', sType=sType,pNext=pNext,imageView=imageView,imageLayout=imageLayout)
+
+def VkAttachmentSampleCountInfoAMD(sType=VK_STRUCTURE_TYPE_ATTACHMENT_SAMPLE_COUNT_INFO_AMD,pNext=None,colorAttachmentCount=None,pColorAttachmentSamples=None,depthStencilAttachmentSamples=None,):
+    if colorAttachmentCount is None and pColorAttachmentSamples is not None:
+        colorAttachmentCount = len(pColorAttachmentSamples)
+
+    return _new('VkAttachmentSampleCountInfoAMD', sType=sType,pNext=pNext,colorAttachmentCount=colorAttachmentCount,pColorAttachmentSamples=pColorAttachmentSamples,depthStencilAttachmentSamples=depthStencilAttachmentSamples)
+
+def VkMultiviewPerViewAttributesInfoNVX(sType=VK_STRUCTURE_TYPE_MULTIVIEW_PER_VIEW_ATTRIBUTES_INFO_NVX,pNext=None,perViewAttributes=None,perViewAttributesPositionXOnly=None,):
+
+    return _new('VkMultiviewPerViewAttributesInfoNVX', sType=sType,pNext=pNext,perViewAttributes=perViewAttributes,perViewAttributesPositionXOnly=perViewAttributesPositionXOnly)
+
+def VkImageSubresource2KHR(sType=VK_STRUCTURE_TYPE_IMAGE_SUBRESOURCE_2_KHR,pNext=None,imageSubresource=None,):
+
+    return _new('VkImageSubresource2KHR', sType=sType,pNext=pNext,imageSubresource=imageSubresource)
+
+def VkSubresourceLayout2KHR(sType=VK_STRUCTURE_TYPE_SUBRESOURCE_LAYOUT_2_KHR,pNext=None,subresourceLayout=None,):
+
+    return _new('VkSubresourceLayout2KHR', sType=sType,pNext=pNext,subresourceLayout=subresourceLayout)
+
+def VkPhysicalDeviceRayTracingPositionFetchFeaturesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_POSITION_FETCH_FEATURES_KHR,pNext=None,rayTracingPositionFetch=None,):
+
+    return _new('VkPhysicalDeviceRayTracingPositionFetchFeaturesKHR', sType=sType,pNext=pNext,rayTracingPositionFetch=rayTracingPositionFetch)
+
+def VkDeviceImageSubresourceInfoKHR(sType=VK_STRUCTURE_TYPE_DEVICE_IMAGE_SUBRESOURCE_INFO_KHR,pNext=None,pCreateInfo=None,pSubresource=None,):
+
+    return _new('VkDeviceImageSubresourceInfoKHR', sType=sType,pNext=pNext,pCreateInfo=pCreateInfo,pSubresource=pSubresource)
+
+def VkMemoryMapInfoKHR(sType=VK_STRUCTURE_TYPE_MEMORY_MAP_INFO_KHR,pNext=None,flags=None,memory=None,offset=None,size=None,):
+
+    return _new('VkMemoryMapInfoKHR', sType=sType,pNext=pNext,flags=flags,memory=memory,offset=offset,size=size)
+
+def VkMemoryUnmapInfoKHR(sType=VK_STRUCTURE_TYPE_MEMORY_UNMAP_INFO_KHR,pNext=None,flags=None,memory=None,):
+
+    return _new('VkMemoryUnmapInfoKHR', sType=sType,pNext=pNext,flags=flags,memory=memory)
+
+def VkPhysicalDeviceCooperativeMatrixFeaturesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COOPERATIVE_MATRIX_FEATURES_KHR,pNext=None,cooperativeMatrix=None,cooperativeMatrixRobustBufferAccess=None,):
+
+    return _new('VkPhysicalDeviceCooperativeMatrixFeaturesKHR', sType=sType,pNext=pNext,cooperativeMatrix=cooperativeMatrix,cooperativeMatrixRobustBufferAccess=cooperativeMatrixRobustBufferAccess)
+
+def VkCooperativeMatrixPropertiesKHR(sType=VK_STRUCTURE_TYPE_COOPERATIVE_MATRIX_PROPERTIES_KHR,pNext=None,MSize=None,NSize=None,KSize=None,AType=None,BType=None,CType=None,ResultType=None,saturatingAccumulation=None,scope=None,):
+
+    return _new('VkCooperativeMatrixPropertiesKHR', sType=sType,pNext=pNext,MSize=MSize,NSize=NSize,KSize=KSize,AType=AType,BType=BType,CType=CType,ResultType=ResultType,saturatingAccumulation=saturatingAccumulation,scope=scope)
+
+def VkPhysicalDeviceCooperativeMatrixPropertiesKHR(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COOPERATIVE_MATRIX_PROPERTIES_KHR,pNext=None,cooperativeMatrixSupportedStages=None,):
+
+    return _new('VkPhysicalDeviceCooperativeMatrixPropertiesKHR', sType=sType,pNext=pNext,cooperativeMatrixSupportedStages=cooperativeMatrixSupportedStages)
+
+def VkBindMemoryStatusKHR(sType=VK_STRUCTURE_TYPE_BIND_MEMORY_STATUS_KHR,pNext=None,pResult=None,):
+
+    return _new('VkBindMemoryStatusKHR', sType=sType,pNext=pNext,pResult=pResult)
+
+def VkBindDescriptorSetsInfoKHR(sType=VK_STRUCTURE_TYPE_BIND_DESCRIPTOR_SETS_INFO_KHR,pNext=None,stageFlags=None,layout=None,firstSet=None,descriptorSetCount=None,pDescriptorSets=None,dynamicOffsetCount=None,pDynamicOffsets=None,):
+    if descriptorSetCount is None and pDescriptorSets is not None:
+        descriptorSetCount = len(pDescriptorSets)
+    if dynamicOffsetCount is None and pDynamicOffsets is not None:
+        dynamicOffsetCount = len(pDynamicOffsets)
+
+    return _new('VkBindDescriptorSetsInfoKHR', sType=sType,pNext=pNext,stageFlags=stageFlags,layout=layout,firstSet=firstSet,descriptorSetCount=descriptorSetCount,pDescriptorSets=pDescriptorSets,dynamicOffsetCount=dynamicOffsetCount,pDynamicOffsets=pDynamicOffsets)
+
+def VkPushConstantsInfoKHR(sType=VK_STRUCTURE_TYPE_PUSH_CONSTANTS_INFO_KHR,pNext=None,layout=None,stageFlags=None,offset=None,size=None,pValues=None,):
+    if size is None and pValues is not None:
+        size = len(pValues)
+
+    return _new('VkPushConstantsInfoKHR', sType=sType,pNext=pNext,layout=layout,stageFlags=stageFlags,offset=offset,size=size,pValues=pValues)
+
+def VkPushDescriptorSetInfoKHR(sType=VK_STRUCTURE_TYPE_PUSH_DESCRIPTOR_SET_INFO_KHR,pNext=None,stageFlags=None,layout=None,set=None,descriptorWriteCount=None,pDescriptorWrites=None,):
+    if descriptorWriteCount is None and pDescriptorWrites is not None:
+        descriptorWriteCount = len(pDescriptorWrites)
+
+    return _new('VkPushDescriptorSetInfoKHR', sType=sType,pNext=pNext,stageFlags=stageFlags,layout=layout,set=set,descriptorWriteCount=descriptorWriteCount,pDescriptorWrites=pDescriptorWrites)
+
+def VkPushDescriptorSetWithTemplateInfoKHR(sType=VK_STRUCTURE_TYPE_PUSH_DESCRIPTOR_SET_WITH_TEMPLATE_INFO_KHR,pNext=None,descriptorUpdateTemplate=None,layout=None,set=None,pData=None,):
+
+    return _new('VkPushDescriptorSetWithTemplateInfoKHR', sType=sType,pNext=pNext,descriptorUpdateTemplate=descriptorUpdateTemplate,layout=layout,set=set,pData=pData)
+
+def VkSetDescriptorBufferOffsetsInfoEXT(sType=VK_STRUCTURE_TYPE_SET_DESCRIPTOR_BUFFER_OFFSETS_INFO_EXT,pNext=None,stageFlags=None,layout=None,firstSet=None,setCount=None,pBufferIndices=None,pOffsets=None,):
+    if setCount is None and pBufferIndices is not None:
+        setCount = len(pBufferIndices)
+    if setCount is None and pOffsets is not None:
+        setCount = len(pOffsets)
+
+    return _new('VkSetDescriptorBufferOffsetsInfoEXT', sType=sType,pNext=pNext,stageFlags=stageFlags,layout=layout,firstSet=firstSet,setCount=setCount,pBufferIndices=pBufferIndices,pOffsets=pOffsets)
+
+def VkBindDescriptorBufferEmbeddedSamplersInfoEXT(sType=VK_STRUCTURE_TYPE_BIND_DESCRIPTOR_BUFFER_EMBEDDED_SAMPLERS_INFO_EXT,pNext=None,stageFlags=None,layout=None,set=None,):
+
+    return _new('VkBindDescriptorBufferEmbeddedSamplersInfoEXT', sType=sType,pNext=pNext,stageFlags=stageFlags,layout=layout,set=set)
+
+
+
+
+
+
+
+
+
+
+def _wrap_vkGetRenderingAreaGranularityKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetRenderingAreaGranularityKHR(
+    device
+            ,pRenderingAreaInfo
+            ,pGranularity=None
+            ,):
+
+
+        custom_return = True
+        if not pGranularity:
+            pGranularity = ffi.new('VkExtent2D*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pRenderingAreaInfo, _args[1]),_auto_handle(pGranularity, _args[2]))
+
+        if custom_return:
+            return pGranularity
+
+        return pGranularity[0]
+
+
+
+    return vkGetRenderingAreaGranularityKHR
+def _wrap_vkCreateAndroidSurfaceKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateAndroidSurfaceKHR(
+    instance
+            ,pCreateInfo
+            ,pAllocator
+            ,pSurface=None
+            ,):
+
+
+        custom_return = True
+        if not pSurface:
+            pSurface = ffi.new('VkSurfaceKHR*')
+            custom_return = False
+
+        result = fn(_handle(instance, 'VkInstance'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pSurface, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSurface
+
+        return pSurface[0]
+
+
+
+    return vkCreateAndroidSurfaceKHR
+def _wrap_vkGetPhysicalDeviceDisplayPropertiesKHR(fn):
+    def vkGetPhysicalDeviceDisplayPropertiesKHR(
+    physicalDevice
+            ,pProperties=None
+            ,):
+
+
+        pPropertyCount = ffi.new('uint32_t*')
+        custom_return = pProperties is not None
+        _array = pProperties
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pPropertyCount[0] = len(_array)
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pProperties = ffi.NULL
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pPropertyCount[0]:
+                _array = ffi.new('VkDisplayPropertiesKHR[]', pPropertyCount[0])
+            pProperties = _array
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pPropertyCount[0] != len(_array):
+            pProperties = _slice(_array, pPropertyCount[0])
+
+        if not custom_return:
+            # the generator keeps the array alive
+            return (StrWrap(x) for x in pProperties)
+        return pProperties
+
+
+    return vkGetPhysicalDeviceDisplayPropertiesKHR
+def _wrap_vkGetPhysicalDeviceDisplayPlanePropertiesKHR(fn):
+    def vkGetPhysicalDeviceDisplayPlanePropertiesKHR(
+    physicalDevice
+            ,pProperties=None
+            ,):
+
+
+        pPropertyCount = ffi.new('uint32_t*')
+        custom_return = pProperties is not None
+        _array = pProperties
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pPropertyCount[0] = len(_array)
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pProperties = ffi.NULL
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pPropertyCount[0]:
+                _array = ffi.new('VkDisplayPlanePropertiesKHR[]', pPropertyCount[0])
+            pProperties = _array
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pPropertyCount[0] != len(_array):
+            pProperties = _slice(_array, pPropertyCount[0])
+
+        return pProperties
+
+
+    return vkGetPhysicalDeviceDisplayPlanePropertiesKHR
+def _wrap_vkGetDisplayPlaneSupportedDisplaysKHR(fn):
+    def vkGetDisplayPlaneSupportedDisplaysKHR(
+    physicalDevice
+            ,planeIndex
+            ,pDisplays=None
+            ,):
+
+
+        pDisplayCount = ffi.new('uint32_t*')
+        custom_return = pDisplays is not None
+        _array = pDisplays
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pDisplayCount[0] = len(_array)
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),planeIndex,pDisplayCount,pDisplays)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pDisplays = ffi.NULL
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),planeIndex,pDisplayCount,pDisplays)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pDisplayCount[0]:
+                _array = ffi.new('VkDisplayKHR[]', pDisplayCount[0])
+            pDisplays = _array
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),planeIndex,pDisplayCount,pDisplays)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pDisplayCount[0] != len(_array):
+            pDisplays = _slice(_array, pDisplayCount[0])
+
+        return pDisplays
+
+
+    return vkGetDisplayPlaneSupportedDisplaysKHR
+def _wrap_vkGetDisplayModePropertiesKHR(fn):
+    def vkGetDisplayModePropertiesKHR(
+    physicalDevice
+            ,display
+            ,pProperties=None
+            ,):
+
+
+        pPropertyCount = ffi.new('uint32_t*')
+        custom_return = pProperties is not None
+        _array = pProperties
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pPropertyCount[0] = len(_array)
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_handle(display, 'VkDisplayKHR'),pPropertyCount,pProperties)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pProperties = ffi.NULL
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_handle(display, 'VkDisplayKHR'),pPropertyCount,pProperties)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pPropertyCount[0]:
+                _array = ffi.new('VkDisplayModePropertiesKHR[]', pPropertyCount[0])
+            pProperties = _array
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_handle(display, 'VkDisplayKHR'),pPropertyCount,pProperties)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pPropertyCount[0] != len(_array):
+            pProperties = _slice(_array, pPropertyCount[0])
+
+        return pProperties
+
+
+    return vkGetDisplayModePropertiesKHR
+def _wrap_vkCreateDisplayModeKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateDisplayModeKHR(
+    physicalDevice
+            ,display
+            ,pCreateInfo
+            ,pAllocator
+            ,pMode=None
+            ,):
+
+
+        custom_return = True
+        if not pMode:
+            pMode = ffi.new('VkDisplayModeKHR*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_handle(display, 'VkDisplayKHR'),_auto_handle(pCreateInfo, _args[2]),_auto_handle(pAllocator, _args[3]),_auto_handle(pMode, _args[4]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pMode
+
+        return pMode[0]
+
+
+
+    return vkCreateDisplayModeKHR
+def _wrap_vkGetDisplayPlaneCapabilitiesKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetDisplayPlaneCapabilitiesKHR(
+    physicalDevice
+            ,mode
+            ,planeIndex
+            ,pCapabilities=None
+            ,):
+
+
+        custom_return = True
+        if not pCapabilities:
+            pCapabilities = ffi.new('VkDisplayPlaneCapabilitiesKHR*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_handle(mode, 'VkDisplayModeKHR'),planeIndex,_auto_handle(pCapabilities, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pCapabilities
+
+        return pCapabilities[0]
+
+
+
+    return vkGetDisplayPlaneCapabilitiesKHR
+def _wrap_vkCreateDisplayPlaneSurfaceKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateDisplayPlaneSurfaceKHR(
+    instance
+            ,pCreateInfo
+            ,pAllocator
+            ,pSurface=None
+            ,):
+
+
+        custom_return = True
+        if not pSurface:
+            pSurface = ffi.new('VkSurfaceKHR*')
+            custom_return = False
+
+        result = fn(_handle(instance, 'VkInstance'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pSurface, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSurface
+
+        return pSurface[0]
+
+
+
+    return vkCreateDisplayPlaneSurfaceKHR
+def _wrap_vkCreateSharedSwapchainsKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateSharedSwapchainsKHR(
+    device
+            ,swapchainCount
+            ,pCreateInfos
+            ,pAllocator
+            ,pSwapchains=None
+            ,):
+
+
+        custom_return = True
+        if not pSwapchains:
+            pSwapchains = ffi.new('VkSwapchainKHR[%d]' % swapchainCount)
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),swapchainCount,_auto_handle(pCreateInfos, _args[2]),_auto_handle(pAllocator, _args[3]),_auto_handle(pSwapchains, _args[4]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSwapchains
+
+        return pSwapchains
+
+
+
+    return vkCreateSharedSwapchainsKHR
+def _wrap_vkDestroySurfaceKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkDestroySurfaceKHR(
+    instance
+            ,surface
+            ,pAllocator
+            ,):
+
+        result = fn(_handle(instance, 'VkInstance'),_handle(surface, 'VkSurfaceKHR'),_auto_handle(pAllocator, _args[2]))
+
+
+    return vkDestroySurfaceKHR
+def _wrap_vkGetPhysicalDeviceSurfaceSupportKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceSurfaceSupportKHR(
+    physicalDevice
+            ,queueFamilyIndex
+            ,surface
+            ,pSupported=None
+            ,):
+
+
+        custom_return = True
+        if not pSupported:
+            pSupported = ffi.new('VkBool32*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),queueFamilyIndex,_handle(surface, 'VkSurfaceKHR'),_auto_handle(pSupported, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSupported
+
+        return pSupported[0]
+
+
+
+    return vkGetPhysicalDeviceSurfaceSupportKHR
+def _wrap_vkGetPhysicalDeviceSurfaceCapabilitiesKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceSurfaceCapabilitiesKHR(
+    physicalDevice
+            ,surface
+            ,pSurfaceCapabilities=None
+            ,):
+
+
+        custom_return = True
+        if not pSurfaceCapabilities:
+            pSurfaceCapabilities = ffi.new('VkSurfaceCapabilitiesKHR*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_handle(surface, 'VkSurfaceKHR'),_auto_handle(pSurfaceCapabilities, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSurfaceCapabilities
+
+        return pSurfaceCapabilities[0]
+
+
+
+    return vkGetPhysicalDeviceSurfaceCapabilitiesKHR
+def _wrap_vkGetPhysicalDeviceSurfaceFormatsKHR(fn):
+    def vkGetPhysicalDeviceSurfaceFormatsKHR(
+    physicalDevice
+            ,surface
+            ,pSurfaceFormats=None
+            ,):
+
+
+        pSurfaceFormatCount = ffi.new('uint32_t*')
+        custom_return = pSurfaceFormats is not None
+        _array = pSurfaceFormats
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pSurfaceFormatCount[0] = len(_array)
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_handle(surface, 'VkSurfaceKHR'),pSurfaceFormatCount,pSurfaceFormats)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pSurfaceFormats = ffi.NULL
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_handle(surface, 'VkSurfaceKHR'),pSurfaceFormatCount,pSurfaceFormats)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pSurfaceFormatCount[0]:
+                _array = ffi.new('VkSurfaceFormatKHR[]', pSurfaceFormatCount[0])
+            pSurfaceFormats = _array
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_handle(surface, 'VkSurfaceKHR'),pSurfaceFormatCount,pSurfaceFormats)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pSurfaceFormatCount[0] != len(_array):
+            pSurfaceFormats = _slice(_array, pSurfaceFormatCount[0])
+
+        return pSurfaceFormats
+
+
+    return vkGetPhysicalDeviceSurfaceFormatsKHR
+def _wrap_vkGetPhysicalDeviceSurfacePresentModesKHR(fn):
+    def vkGetPhysicalDeviceSurfacePresentModesKHR(
+    physicalDevice
+            ,surface
+            ,pPresentModes=None
+            ,):
+
+
+        pPresentModeCount = ffi.new('uint32_t*')
+        custom_return = pPresentModes is not None
+        _array = pPresentModes
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pPresentModeCount[0] = len(_array)
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_handle(surface, 'VkSurfaceKHR'),pPresentModeCount,pPresentModes)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pPresentModes = ffi.NULL
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_handle(surface, 'VkSurfaceKHR'),pPresentModeCount,pPresentModes)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pPresentModeCount[0]:
+                _array = ffi.new('VkPresentModeKHR[]', pPresentModeCount[0])
+            pPresentModes = _array
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_handle(surface, 'VkSurfaceKHR'),pPresentModeCount,pPresentModes)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pPresentModeCount[0] != len(_array):
+            pPresentModes = _slice(_array, pPresentModeCount[0])
+
+        return pPresentModes
+
+
+    return vkGetPhysicalDeviceSurfacePresentModesKHR
+def _wrap_vkCreateSwapchainKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateSwapchainKHR(
+    device
+            ,pCreateInfo
+            ,pAllocator
+            ,pSwapchain=None
+            ,):
+
+
+        custom_return = True
+        if not pSwapchain:
+            pSwapchain = ffi.new('VkSwapchainKHR*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pSwapchain, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSwapchain
+
+        return pSwapchain[0]
+
+
+
+    return vkCreateSwapchainKHR
+def _wrap_vkDestroySwapchainKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkDestroySwapchainKHR(
+    device
+            ,swapchain
+            ,pAllocator
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(swapchain, 'VkSwapchainKHR'),_auto_handle(pAllocator, _args[2]))
+
+
+    return vkDestroySwapchainKHR
+def _wrap_vkGetSwapchainImagesKHR(fn):
+    def vkGetSwapchainImagesKHR(
+    device
+            ,swapchain
+            ,pSwapchainImages=None
+            ,):
+
+
+        pSwapchainImageCount = ffi.new('uint32_t*')
+        custom_return = pSwapchainImages is not None
+        _array = pSwapchainImages
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pSwapchainImageCount[0] = len(_array)
+            result = fn(_handle(device, 'VkDevice'),_handle(swapchain, 'VkSwapchainKHR'),pSwapchainImageCount,pSwapchainImages)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pSwapchainImages = ffi.NULL
+            result = fn(_handle(device, 'VkDevice'),_handle(swapchain, 'VkSwapchainKHR'),pSwapchainImageCount,pSwapchainImages)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pSwapchainImageCount[0]:
+                _array = ffi.new('VkImage[]', pSwapchainImageCount[0])
+            pSwapchainImages = _array
+            result = fn(_handle(device, 'VkDevice'),_handle(swapchain, 'VkSwapchainKHR'),pSwapchainImageCount,pSwapchainImages)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pSwapchainImageCount[0] != len(_array):
+            pSwapchainImages = _slice(_array, pSwapchainImageCount[0])
+
+        return pSwapchainImages
+
+
+    return vkGetSwapchainImagesKHR
+def _wrap_vkAcquireNextImageKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkAcquireNextImageKHR(
+    device
+            ,swapchain
+            ,timeout
+            ,semaphore
+            ,fence
+            ,pImageIndex=None
+            ,):
+
+
+        custom_return = True
+        if not pImageIndex:
+            pImageIndex = ffi.new('uint32_t*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(swapchain, 'VkSwapchainKHR'),timeout,_handle(semaphore, 'VkSemaphore'),_handle(fence, 'VkFence'),_auto_handle(pImageIndex, _args[5]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pImageIndex
+
+        return pImageIndex[0]
+
+
+
+    return vkAcquireNextImageKHR
+def _wrap_vkQueuePresentKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkQueuePresentKHR(
+    queue
+            ,pPresentInfo
+            ,):
+
+        result = fn(_handle(queue, 'VkQueue'),_auto_handle(pPresentInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkQueuePresentKHR
+def _wrap_vkCreateWaylandSurfaceKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateWaylandSurfaceKHR(
+    instance
+            ,pCreateInfo
+            ,pAllocator
+            ,pSurface=None
+            ,):
+
+
+        custom_return = True
+        if not pSurface:
+            pSurface = ffi.new('VkSurfaceKHR*')
+            custom_return = False
+
+        result = fn(_handle(instance, 'VkInstance'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pSurface, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSurface
+
+        return pSurface[0]
+
+
+
+    return vkCreateWaylandSurfaceKHR
+def _wrap_vkGetPhysicalDeviceWaylandPresentationSupportKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceWaylandPresentationSupportKHR(
+    physicalDevice
+            ,queueFamilyIndex
+            ,display
+            ,):
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),queueFamilyIndex,_auto_handle(display, _args[2]))
+
+
+    return vkGetPhysicalDeviceWaylandPresentationSupportKHR
+def _wrap_vkCreateWin32SurfaceKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateWin32SurfaceKHR(
+    instance
+            ,pCreateInfo
+            ,pAllocator
+            ,pSurface=None
+            ,):
+
+
+        custom_return = True
+        if not pSurface:
+            pSurface = ffi.new('VkSurfaceKHR*')
+            custom_return = False
+
+        result = fn(_handle(instance, 'VkInstance'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pSurface, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSurface
+
+        return pSurface[0]
+
+
+
+    return vkCreateWin32SurfaceKHR
+def _wrap_vkGetPhysicalDeviceWin32PresentationSupportKHR(fn):
+    def vkGetPhysicalDeviceWin32PresentationSupportKHR(
+    physicalDevice
+            ,queueFamilyIndex
+            ,):
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),queueFamilyIndex)
+
+
+    return vkGetPhysicalDeviceWin32PresentationSupportKHR
+def _wrap_vkCreateXlibSurfaceKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateXlibSurfaceKHR(
+    instance
+            ,pCreateInfo
+            ,pAllocator
+            ,pSurface=None
+            ,):
+
+
+        custom_return = True
+        if not pSurface:
+            pSurface = ffi.new('VkSurfaceKHR*')
+            custom_return = False
+
+        result = fn(_handle(instance, 'VkInstance'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pSurface, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSurface
+
+        return pSurface[0]
+
+
+
+    return vkCreateXlibSurfaceKHR
+def _wrap_vkGetPhysicalDeviceXlibPresentationSupportKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceXlibPresentationSupportKHR(
+    physicalDevice
+            ,queueFamilyIndex
+            ,dpy
+            ,visualID
+            ,):
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),queueFamilyIndex,_auto_handle(dpy, _args[2]),_auto_handle(visualID, _args[3]))
+
+
+    return vkGetPhysicalDeviceXlibPresentationSupportKHR
+def _wrap_vkCreateXcbSurfaceKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateXcbSurfaceKHR(
+    instance
+            ,pCreateInfo
+            ,pAllocator
+            ,pSurface=None
+            ,):
+
+
+        custom_return = True
+        if not pSurface:
+            pSurface = ffi.new('VkSurfaceKHR*')
+            custom_return = False
+
+        result = fn(_handle(instance, 'VkInstance'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pSurface, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSurface
+
+        return pSurface[0]
+
+
+
+    return vkCreateXcbSurfaceKHR
+def _wrap_vkGetPhysicalDeviceXcbPresentationSupportKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceXcbPresentationSupportKHR(
+    physicalDevice
+            ,queueFamilyIndex
+            ,connection
+            ,visual_id
+            ,):
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),queueFamilyIndex,_auto_handle(connection, _args[2]),_auto_handle(visual_id, _args[3]))
+
+
+    return vkGetPhysicalDeviceXcbPresentationSupportKHR
+def _wrap_vkCmdPushDescriptorSetKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdPushDescriptorSetKHR(
+    commandBuffer
+            ,pipelineBindPoint
+            ,layout
+            ,set
+            ,descriptorWriteCount
+            ,pDescriptorWrites
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),pipelineBindPoint,_handle(layout, 'VkPipelineLayout'),set,descriptorWriteCount,_auto_handle(pDescriptorWrites, _args[5]))
+
+
+    return vkCmdPushDescriptorSetKHR
+def _wrap_vkGetMemoryWin32HandleKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetMemoryWin32HandleKHR(
+    device
+            ,pGetWin32HandleInfo
+            ,pHandle=None
+            ,):
+
+
+        custom_return = True
+        if not pHandle:
+            pHandle = ffi.new('HANDLE*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pGetWin32HandleInfo, _args[1]),_auto_handle(pHandle, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pHandle
+
+        return pHandle[0]
+
+
+
+    return vkGetMemoryWin32HandleKHR
+def _wrap_vkGetMemoryWin32HandlePropertiesKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetMemoryWin32HandlePropertiesKHR(
+    device
+            ,handleType
+            ,handle
+            ,pMemoryWin32HandleProperties=None
+            ,):
+
+
+        custom_return = True
+        if not pMemoryWin32HandleProperties:
+            pMemoryWin32HandleProperties = ffi.new('VkMemoryWin32HandlePropertiesKHR*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),handleType,_auto_handle(handle, _args[2]),_auto_handle(pMemoryWin32HandleProperties, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pMemoryWin32HandleProperties
+
+        return pMemoryWin32HandleProperties[0]
+
+
+
+    return vkGetMemoryWin32HandlePropertiesKHR
+def _wrap_vkGetMemoryFdKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetMemoryFdKHR(
+    device
+            ,pGetFdInfo
+            ,pFd=None
+            ,):
+
+
+        custom_return = True
+        if not pFd:
+            pFd = ffi.new('int*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pGetFdInfo, _args[1]),_auto_handle(pFd, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pFd
+
+        return pFd[0]
+
+
+
+    return vkGetMemoryFdKHR
+def _wrap_vkGetMemoryFdPropertiesKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetMemoryFdPropertiesKHR(
+    device
+            ,handleType
+            ,fd
+            ,pMemoryFdProperties=None
+            ,):
+
+
+        custom_return = True
+        if not pMemoryFdProperties:
+            pMemoryFdProperties = ffi.new('VkMemoryFdPropertiesKHR*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),handleType,fd,_auto_handle(pMemoryFdProperties, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pMemoryFdProperties
+
+        return pMemoryFdProperties[0]
+
+
+
+    return vkGetMemoryFdPropertiesKHR
+def _wrap_vkGetSemaphoreWin32HandleKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetSemaphoreWin32HandleKHR(
+    device
+            ,pGetWin32HandleInfo
+            ,pHandle=None
+            ,):
+
+
+        custom_return = True
+        if not pHandle:
+            pHandle = ffi.new('HANDLE*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pGetWin32HandleInfo, _args[1]),_auto_handle(pHandle, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pHandle
+
+        return pHandle[0]
+
+
+
+    return vkGetSemaphoreWin32HandleKHR
+def _wrap_vkImportSemaphoreWin32HandleKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkImportSemaphoreWin32HandleKHR(
+    device
+            ,pImportSemaphoreWin32HandleInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pImportSemaphoreWin32HandleInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkImportSemaphoreWin32HandleKHR
+def _wrap_vkGetSemaphoreFdKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetSemaphoreFdKHR(
+    device
+            ,pGetFdInfo
+            ,pFd=None
+            ,):
+
+
+        custom_return = True
+        if not pFd:
+            pFd = ffi.new('int*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pGetFdInfo, _args[1]),_auto_handle(pFd, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pFd
+
+        return pFd[0]
+
+
+
+    return vkGetSemaphoreFdKHR
+def _wrap_vkImportSemaphoreFdKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkImportSemaphoreFdKHR(
+    device
+            ,pImportSemaphoreFdInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pImportSemaphoreFdInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkImportSemaphoreFdKHR
+def _wrap_vkGetFenceWin32HandleKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetFenceWin32HandleKHR(
+    device
+            ,pGetWin32HandleInfo
+            ,pHandle=None
+            ,):
+
+
+        custom_return = True
+        if not pHandle:
+            pHandle = ffi.new('HANDLE*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pGetWin32HandleInfo, _args[1]),_auto_handle(pHandle, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pHandle
+
+        return pHandle[0]
+
+
+
+    return vkGetFenceWin32HandleKHR
+def _wrap_vkImportFenceWin32HandleKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkImportFenceWin32HandleKHR(
+    device
+            ,pImportFenceWin32HandleInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pImportFenceWin32HandleInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkImportFenceWin32HandleKHR
+def _wrap_vkGetFenceFdKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetFenceFdKHR(
+    device
+            ,pGetFdInfo
+            ,pFd=None
+            ,):
+
+
+        custom_return = True
+        if not pFd:
+            pFd = ffi.new('int*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pGetFdInfo, _args[1]),_auto_handle(pFd, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pFd
+
+        return pFd[0]
+
+
+
+    return vkGetFenceFdKHR
+def _wrap_vkImportFenceFdKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkImportFenceFdKHR(
+    device
+            ,pImportFenceFdInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pImportFenceFdInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkImportFenceFdKHR
+def _wrap_vkGetDeviceGroupPresentCapabilitiesKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetDeviceGroupPresentCapabilitiesKHR(
+    device
+            ,pDeviceGroupPresentCapabilities=None
+            ,):
+
+
+        custom_return = True
+        if not pDeviceGroupPresentCapabilities:
+            pDeviceGroupPresentCapabilities = ffi.new('VkDeviceGroupPresentCapabilitiesKHR*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pDeviceGroupPresentCapabilities, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pDeviceGroupPresentCapabilities
+
+        return pDeviceGroupPresentCapabilities[0]
+
+
+
+    return vkGetDeviceGroupPresentCapabilitiesKHR
+def _wrap_vkGetDeviceGroupSurfacePresentModesKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetDeviceGroupSurfacePresentModesKHR(
+    device
+            ,surface
+            ,pModes=None
+            ,):
+
+
+        custom_return = True
+        if not pModes:
+            pModes = ffi.new('VkDeviceGroupPresentModeFlagsKHR*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(surface, 'VkSurfaceKHR'),_auto_handle(pModes, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pModes
+
+        return pModes[0]
+
+
+
+    return vkGetDeviceGroupSurfacePresentModesKHR
+def _wrap_vkAcquireNextImage2KHR(fn):
+    def vkAcquireNextImage2KHR(
+    device
+            ,pImageIndex=None
+            ,):
+
+
+        pAcquireInfo = ffi.new('VkAcquireNextImageInfoKHR*')
+        custom_return = pImageIndex is not None
+        _array = pImageIndex
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pAcquireInfo[0] = len(_array)
+            result = fn(_handle(device, 'VkDevice'),pAcquireInfo,pImageIndex)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pImageIndex = ffi.NULL
+            result = fn(_handle(device, 'VkDevice'),pAcquireInfo,pImageIndex)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pAcquireInfo[0]:
+                _array = ffi.new('uint32_t[]', pAcquireInfo[0])
+            pImageIndex = _array
+            result = fn(_handle(device, 'VkDevice'),pAcquireInfo,pImageIndex)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pAcquireInfo[0] != len(_array):
+            pImageIndex = _slice(_array, pAcquireInfo[0])
+
+        return pImageIndex
+
+
+    return vkAcquireNextImage2KHR
+def _wrap_vkGetPhysicalDevicePresentRectanglesKHR(fn):
+    def vkGetPhysicalDevicePresentRectanglesKHR(
+    physicalDevice
+            ,surface
+            ,pRects=None
+            ,):
+
+
+        pRectCount = ffi.new('uint32_t*')
+        custom_return = pRects is not None
+        _array = pRects
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pRectCount[0] = len(_array)
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_handle(surface, 'VkSurfaceKHR'),pRectCount,pRects)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pRects = ffi.NULL
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_handle(surface, 'VkSurfaceKHR'),pRectCount,pRects)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pRectCount[0]:
+                _array = ffi.new('VkRect2D[]', pRectCount[0])
+            pRects = _array
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_handle(surface, 'VkSurfaceKHR'),pRectCount,pRects)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pRectCount[0] != len(_array):
+            pRects = _slice(_array, pRectCount[0])
+
+        return pRects
+
+
+    return vkGetPhysicalDevicePresentRectanglesKHR
+def _wrap_vkCmdPushDescriptorSetWithTemplateKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdPushDescriptorSetWithTemplateKHR(
+    commandBuffer
+            ,descriptorUpdateTemplate
+            ,layout
+            ,set
+            ,pData
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_handle(descriptorUpdateTemplate, 'VkDescriptorUpdateTemplate'),_handle(layout, 'VkPipelineLayout'),set,_auto_handle(pData, _args[4]))
+
+
+    return vkCmdPushDescriptorSetWithTemplateKHR
+def _wrap_vkGetSwapchainStatusKHR(fn):
+    def vkGetSwapchainStatusKHR(
+    device
+            ,swapchain=None
+            ,):
+
+
+        custom_return = True
+        if not swapchain:
+            swapchain = ffi.new('VkSwapchainKHR*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(swapchain, 'VkSwapchainKHR'))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return swapchain
+
+        return swapchain[0]
+
+
+
+    return vkGetSwapchainStatusKHR
+def _wrap_vkGetPhysicalDeviceSurfaceCapabilities2KHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceSurfaceCapabilities2KHR(
+    physicalDevice
+            ,pSurfaceInfo
+            ,pSurfaceCapabilities=None
+            ,):
+
+
+        custom_return = True
+        if not pSurfaceCapabilities:
+            pSurfaceCapabilities = ffi.new('VkSurfaceCapabilities2KHR*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pSurfaceInfo, _args[1]),_auto_handle(pSurfaceCapabilities, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSurfaceCapabilities
+
+        return pSurfaceCapabilities[0]
+
+
+
+    return vkGetPhysicalDeviceSurfaceCapabilities2KHR
+def _wrap_vkGetPhysicalDeviceSurfaceFormats2KHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceSurfaceFormats2KHR(
+    physicalDevice
+            ,pSurfaceInfo
+            ,pSurfaceFormats=None
+            ,):
+
+
+        pSurfaceFormatCount = ffi.new('uint32_t*')
+        custom_return = pSurfaceFormats is not None
+        _array = pSurfaceFormats
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pSurfaceFormatCount[0] = len(_array)
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pSurfaceInfo, _args[1]),pSurfaceFormatCount,pSurfaceFormats)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pSurfaceFormats = ffi.NULL
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pSurfaceInfo, _args[1]),pSurfaceFormatCount,pSurfaceFormats)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pSurfaceFormatCount[0]:
+                _array = ffi.new('VkSurfaceFormat2KHR[]', pSurfaceFormatCount[0])
+            pSurfaceFormats = _array
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pSurfaceInfo, _args[1]),pSurfaceFormatCount,pSurfaceFormats)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pSurfaceFormatCount[0] != len(_array):
+            pSurfaceFormats = _slice(_array, pSurfaceFormatCount[0])
+
+        return pSurfaceFormats
+
+
+    return vkGetPhysicalDeviceSurfaceFormats2KHR
+def _wrap_vkGetPhysicalDeviceDisplayProperties2KHR(fn):
+    def vkGetPhysicalDeviceDisplayProperties2KHR(
+    physicalDevice
+            ,pProperties=None
+            ,):
+
+
+        pPropertyCount = ffi.new('uint32_t*')
+        custom_return = pProperties is not None
+        _array = pProperties
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pPropertyCount[0] = len(_array)
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pProperties = ffi.NULL
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pPropertyCount[0]:
+                _array = ffi.new('VkDisplayProperties2KHR[]', pPropertyCount[0])
+            pProperties = _array
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pPropertyCount[0] != len(_array):
+            pProperties = _slice(_array, pPropertyCount[0])
+
+        return pProperties
+
+
+    return vkGetPhysicalDeviceDisplayProperties2KHR
+def _wrap_vkGetPhysicalDeviceDisplayPlaneProperties2KHR(fn):
+    def vkGetPhysicalDeviceDisplayPlaneProperties2KHR(
+    physicalDevice
+            ,pProperties=None
+            ,):
+
+
+        pPropertyCount = ffi.new('uint32_t*')
+        custom_return = pProperties is not None
+        _array = pProperties
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pPropertyCount[0] = len(_array)
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pProperties = ffi.NULL
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pPropertyCount[0]:
+                _array = ffi.new('VkDisplayPlaneProperties2KHR[]', pPropertyCount[0])
+            pProperties = _array
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pPropertyCount[0] != len(_array):
+            pProperties = _slice(_array, pPropertyCount[0])
+
+        return pProperties
+
+
+    return vkGetPhysicalDeviceDisplayPlaneProperties2KHR
+def _wrap_vkGetDisplayModeProperties2KHR(fn):
+    def vkGetDisplayModeProperties2KHR(
+    physicalDevice
+            ,display
+            ,pProperties=None
+            ,):
+
+
+        pPropertyCount = ffi.new('uint32_t*')
+        custom_return = pProperties is not None
+        _array = pProperties
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pPropertyCount[0] = len(_array)
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_handle(display, 'VkDisplayKHR'),pPropertyCount,pProperties)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pProperties = ffi.NULL
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_handle(display, 'VkDisplayKHR'),pPropertyCount,pProperties)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pPropertyCount[0]:
+                _array = ffi.new('VkDisplayModeProperties2KHR[]', pPropertyCount[0])
+            pProperties = _array
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_handle(display, 'VkDisplayKHR'),pPropertyCount,pProperties)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pPropertyCount[0] != len(_array):
+            pProperties = _slice(_array, pPropertyCount[0])
+
+        return pProperties
+
+
+    return vkGetDisplayModeProperties2KHR
+def _wrap_vkGetDisplayPlaneCapabilities2KHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetDisplayPlaneCapabilities2KHR(
+    physicalDevice
+            ,pDisplayPlaneInfo
+            ,pCapabilities=None
+            ,):
+
+
+        custom_return = True
+        if not pCapabilities:
+            pCapabilities = ffi.new('VkDisplayPlaneCapabilities2KHR*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pDisplayPlaneInfo, _args[1]),_auto_handle(pCapabilities, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pCapabilities
+
+        return pCapabilities[0]
+
+
+
+    return vkGetDisplayPlaneCapabilities2KHR
+def _wrap_vkGetPhysicalDeviceCalibrateableTimeDomainsKHR(fn):
+    def vkGetPhysicalDeviceCalibrateableTimeDomainsKHR(
+    physicalDevice
+            ,pTimeDomains=None
+            ,):
+
+
+        pTimeDomainCount = ffi.new('uint32_t*')
+        custom_return = pTimeDomains is not None
+        _array = pTimeDomains
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pTimeDomainCount[0] = len(_array)
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pTimeDomainCount,pTimeDomains)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pTimeDomains = ffi.NULL
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pTimeDomainCount,pTimeDomains)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pTimeDomainCount[0]:
+                _array = ffi.new('VkTimeDomainKHR[]', pTimeDomainCount[0])
+            pTimeDomains = _array
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pTimeDomainCount,pTimeDomains)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pTimeDomainCount[0] != len(_array):
+            pTimeDomains = _slice(_array, pTimeDomainCount[0])
+
+        return pTimeDomains
+
+
+    return vkGetPhysicalDeviceCalibrateableTimeDomainsKHR
+def _wrap_vkGetCalibratedTimestampsKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetCalibratedTimestampsKHR(
+    device
+            ,timestampCount
+            ,pTimestampInfos
+            ,pTimestamps
+            ,pMaxDeviation=None
+            ,):
+
+
+        custom_return = True
+        if not pMaxDeviation:
+            pMaxDeviation = ffi.new('uint64_t*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),timestampCount,_auto_handle(pTimestampInfos, _args[2]),_auto_handle(pTimestamps, _args[3]),_auto_handle(pMaxDeviation, _args[4]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pMaxDeviation
+
+        return pMaxDeviation[0]
+
+
+
+    return vkGetCalibratedTimestampsKHR
+def _wrap_vkDestroyAccelerationStructureKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkDestroyAccelerationStructureKHR(
+    device
+            ,accelerationStructure
+            ,pAllocator
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(accelerationStructure, 'VkAccelerationStructureKHR'),_auto_handle(pAllocator, _args[2]))
+
+
+    return vkDestroyAccelerationStructureKHR
+def _wrap_vkCmdCopyAccelerationStructureKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdCopyAccelerationStructureKHR(
+    commandBuffer
+            ,pInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pInfo, _args[1]))
+
+
+    return vkCmdCopyAccelerationStructureKHR
+def _wrap_vkCopyAccelerationStructureKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCopyAccelerationStructureKHR(
+    device
+            ,deferredOperation
+            ,pInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(deferredOperation, 'VkDeferredOperationKHR'),_auto_handle(pInfo, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkCopyAccelerationStructureKHR
+def _wrap_vkCmdCopyAccelerationStructureToMemoryKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdCopyAccelerationStructureToMemoryKHR(
+    commandBuffer
+            ,pInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pInfo, _args[1]))
+
+
+    return vkCmdCopyAccelerationStructureToMemoryKHR
+def _wrap_vkCopyAccelerationStructureToMemoryKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCopyAccelerationStructureToMemoryKHR(
+    device
+            ,deferredOperation
+            ,pInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(deferredOperation, 'VkDeferredOperationKHR'),_auto_handle(pInfo, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkCopyAccelerationStructureToMemoryKHR
+def _wrap_vkCmdCopyMemoryToAccelerationStructureKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdCopyMemoryToAccelerationStructureKHR(
+    commandBuffer
+            ,pInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pInfo, _args[1]))
+
+
+    return vkCmdCopyMemoryToAccelerationStructureKHR
+def _wrap_vkCopyMemoryToAccelerationStructureKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCopyMemoryToAccelerationStructureKHR(
+    device
+            ,deferredOperation
+            ,pInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(deferredOperation, 'VkDeferredOperationKHR'),_auto_handle(pInfo, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkCopyMemoryToAccelerationStructureKHR
+def _wrap_vkCmdWriteAccelerationStructuresPropertiesKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdWriteAccelerationStructuresPropertiesKHR(
+    commandBuffer
+            ,accelerationStructureCount
+            ,pAccelerationStructures
+            ,queryType
+            ,queryPool
+            ,firstQuery
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),accelerationStructureCount,_auto_handle(pAccelerationStructures, _args[2]),queryType,_handle(queryPool, 'VkQueryPool'),firstQuery)
+
+
+    return vkCmdWriteAccelerationStructuresPropertiesKHR
+def _wrap_vkWriteAccelerationStructuresPropertiesKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkWriteAccelerationStructuresPropertiesKHR(
+    device
+            ,accelerationStructureCount
+            ,pAccelerationStructures
+            ,queryType
+            ,dataSize
+            ,pData
+            ,stride
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),accelerationStructureCount,_auto_handle(pAccelerationStructures, _args[2]),queryType,dataSize,_auto_handle(pData, _args[5]),stride)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkWriteAccelerationStructuresPropertiesKHR
+def _wrap_vkCmdTraceRaysKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdTraceRaysKHR(
+    commandBuffer
+            ,pRaygenShaderBindingTable
+            ,pMissShaderBindingTable
+            ,pHitShaderBindingTable
+            ,pCallableShaderBindingTable
+            ,width
+            ,height
+            ,depth
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pRaygenShaderBindingTable, _args[1]),_auto_handle(pMissShaderBindingTable, _args[2]),_auto_handle(pHitShaderBindingTable, _args[3]),_auto_handle(pCallableShaderBindingTable, _args[4]),width,height,depth)
+
+
+    return vkCmdTraceRaysKHR
+def _wrap_vkGetRayTracingShaderGroupHandlesKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetRayTracingShaderGroupHandlesKHR(
+    device
+            ,pipeline
+            ,firstGroup
+            ,groupCount
+            ,dataSize
+            ,pData=None
+            ,):
+
+
+        custom_return = True
+        if not pData:
+            pData = ffi.new('uint64_t[%d]' % dataSize)
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(pipeline, 'VkPipeline'),firstGroup,groupCount,dataSize,_auto_handle(pData, _args[5]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pData
+
+        return pData
+
+
+
+    return vkGetRayTracingShaderGroupHandlesKHR
+def _wrap_vkGetRayTracingCaptureReplayShaderGroupHandlesKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetRayTracingCaptureReplayShaderGroupHandlesKHR(
+    device
+            ,pipeline
+            ,firstGroup
+            ,groupCount
+            ,dataSize
+            ,pData=None
+            ,):
+
+
+        custom_return = True
+        if not pData:
+            pData = ffi.new('uint64_t[%d]' % dataSize)
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(pipeline, 'VkPipeline'),firstGroup,groupCount,dataSize,_auto_handle(pData, _args[5]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pData
+
+        return pData
+
+
+
+    return vkGetRayTracingCaptureReplayShaderGroupHandlesKHR
+def _wrap_vkCreateRayTracingPipelinesKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateRayTracingPipelinesKHR(
+    device
+            ,deferredOperation
+            ,pipelineCache
+            ,createInfoCount
+            ,pCreateInfos
+            ,pAllocator
+            ,pPipelines=None
+            ,):
+
+
+        custom_return = True
+        if not pPipelines:
+            pPipelines = ffi.new('VkPipeline[%d]' % createInfoCount)
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(deferredOperation, 'VkDeferredOperationKHR'),_handle(pipelineCache, 'VkPipelineCache'),createInfoCount,_auto_handle(pCreateInfos, _args[4]),_auto_handle(pAllocator, _args[5]),_auto_handle(pPipelines, _args[6]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pPipelines
+
+        return pPipelines
+
+
+
+    return vkCreateRayTracingPipelinesKHR
+def _wrap_vkCreateRayTracingPipelinesKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateRayTracingPipelinesKHR(
+    device
+            ,deferredOperation
+            ,pipelineCache
+            ,createInfoCount
+            ,pCreateInfos
+            ,pAllocator
+            ,pPipelines=None
+            ,):
+
+
+        custom_return = True
+        if not pPipelines:
+            pPipelines = ffi.new('VkPipeline[%d]' % createInfoCount)
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(deferredOperation, 'VkDeferredOperationKHR'),_handle(pipelineCache, 'VkPipelineCache'),createInfoCount,_auto_handle(pCreateInfos, _args[4]),_auto_handle(pAllocator, _args[5]),_auto_handle(pPipelines, _args[6]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pPipelines
+
+        return pPipelines
+
+
+
+    return vkCreateRayTracingPipelinesKHR
+def _wrap_vkCmdTraceRaysIndirectKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdTraceRaysIndirectKHR(
+    commandBuffer
+            ,pRaygenShaderBindingTable
+            ,pMissShaderBindingTable
+            ,pHitShaderBindingTable
+            ,pCallableShaderBindingTable
+            ,indirectDeviceAddress
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pRaygenShaderBindingTable, _args[1]),_auto_handle(pMissShaderBindingTable, _args[2]),_auto_handle(pHitShaderBindingTable, _args[3]),_auto_handle(pCallableShaderBindingTable, _args[4]),indirectDeviceAddress)
+
+
+    return vkCmdTraceRaysIndirectKHR
+def _wrap_vkCmdTraceRaysIndirect2KHR(fn):
+    def vkCmdTraceRaysIndirect2KHR(
+    commandBuffer
+            ,indirectDeviceAddress
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),indirectDeviceAddress)
+
+
+    return vkCmdTraceRaysIndirect2KHR
+def _wrap_vkGetDeviceAccelerationStructureCompatibilityKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetDeviceAccelerationStructureCompatibilityKHR(
+    device
+            ,pVersionInfo
+            ,pCompatibility=None
+            ,):
+
+
+        custom_return = True
+        if not pCompatibility:
+            pCompatibility = ffi.new('VkAccelerationStructureCompatibilityKHR*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pVersionInfo, _args[1]),_auto_handle(pCompatibility, _args[2]))
+
+        if custom_return:
+            return pCompatibility
+
+        return pCompatibility[0]
+
+
+
+    return vkGetDeviceAccelerationStructureCompatibilityKHR
+def _wrap_vkGetRayTracingShaderGroupStackSizeKHR(fn):
+    def vkGetRayTracingShaderGroupStackSizeKHR(
+    device
+            ,pipeline
+            ,group
+            ,groupShader=None
+            ,):
+
+
+        custom_return = True
+        if not groupShader:
+            groupShader = ffi.new('VkShaderGroupShaderKHR*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(pipeline, 'VkPipeline'),group,groupShader)
+
+        if custom_return:
+            return groupShader
+
+        return groupShader[0]
+
+
+
+    return vkGetRayTracingShaderGroupStackSizeKHR
+def _wrap_vkCmdSetRayTracingPipelineStackSizeKHR(fn):
+    def vkCmdSetRayTracingPipelineStackSizeKHR(
+    commandBuffer
+            ,pipelineStackSize
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),pipelineStackSize)
+
+
+    return vkCmdSetRayTracingPipelineStackSizeKHR
+def _wrap_vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR(
+    physicalDevice
+            ,queueFamilyIndex
+            ,pCounterCount
+            ,pCounterDescriptions=None
+            ,):
+
+
+        pCounters = ffi.new('VkPerformanceCounterKHR*')
+        custom_return = pCounterDescriptions is not None
+        _array = pCounterDescriptions
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pCounters[0] = len(_array)
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),queueFamilyIndex,_auto_handle(pCounterCount, _args[2]),pCounters,pCounterDescriptions)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pCounterDescriptions = ffi.NULL
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),queueFamilyIndex,_auto_handle(pCounterCount, _args[2]),pCounters,pCounterDescriptions)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pCounters[0]:
+                _array = ffi.new('VkPerformanceCounterDescriptionKHR[]', pCounters[0])
+            pCounterDescriptions = _array
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),queueFamilyIndex,_auto_handle(pCounterCount, _args[2]),pCounters,pCounterDescriptions)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pCounters[0] != len(_array):
+            pCounterDescriptions = _slice(_array, pCounters[0])
+
+        if not custom_return:
+            # the generator keeps the array alive
+            return (StrWrap(x) for x in pCounterDescriptions)
+        return pCounterDescriptions
+
+
+    return vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR
+def _wrap_vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR(fn):
+    def vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR(
+    physicalDevice
+            ,pNumPasses=None
+            ,):
+
+
+        pPerformanceQueryCreateInfo = ffi.new('VkQueryPoolPerformanceCreateInfoKHR*')
+        custom_return = pNumPasses is not None
+        _array = pNumPasses
+
+        pNumPasses = ffi.NULL
+        fn(_handle(physicalDevice, 'VkPhysicalDevice'),pPerformanceQueryCreateInfo,pNumPasses)
+
+        if _array is None or len(_array) < pPerformanceQueryCreateInfo[0]:
+            _array = ffi.new('uint32_t[]', pPerformanceQueryCreateInfo[0])
+        pNumPasses = _array
+        fn(_handle(physicalDevice, 'VkPhysicalDevice'),pPerformanceQueryCreateInfo,pNumPasses)
+
+        if pPerformanceQueryCreateInfo[0] != len(_array):
+            pNumPasses = _slice(_array, pPerformanceQueryCreateInfo[0])
+
+        return pNumPasses
+
+
+    return vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR
+def _wrap_vkAcquireProfilingLockKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkAcquireProfilingLockKHR(
+    device
+            ,pInfo=None
+            ,):
+
+
+        custom_return = True
+        if not pInfo:
+            pInfo = ffi.new('VkAcquireProfilingLockInfoKHR*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pInfo
+
+        return pInfo[0]
+
+
+
+    return vkAcquireProfilingLockKHR
+def _wrap_vkReleaseProfilingLockKHR(fn):
+    def vkReleaseProfilingLockKHR(
+    device
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'))
+
+
+    return vkReleaseProfilingLockKHR
+def _wrap_vkGetPipelineExecutablePropertiesKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPipelineExecutablePropertiesKHR(
+    device
+            ,pPipelineInfo
+            ,pProperties=None
+            ,):
+
+
+        pExecutableCount = ffi.new('uint32_t*')
+        custom_return = pProperties is not None
+        _array = pProperties
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pExecutableCount[0] = len(_array)
+            result = fn(_handle(device, 'VkDevice'),_auto_handle(pPipelineInfo, _args[1]),pExecutableCount,pProperties)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pProperties = ffi.NULL
+            result = fn(_handle(device, 'VkDevice'),_auto_handle(pPipelineInfo, _args[1]),pExecutableCount,pProperties)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pExecutableCount[0]:
+                _array = ffi.new('VkPipelineExecutablePropertiesKHR[]', pExecutableCount[0])
+            pProperties = _array
+            result = fn(_handle(device, 'VkDevice'),_auto_handle(pPipelineInfo, _args[1]),pExecutableCount,pProperties)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pExecutableCount[0] != len(_array):
+            pProperties = _slice(_array, pExecutableCount[0])
+
+        if not custom_return:
+            # the generator keeps the array alive
+            return (StrWrap(x) for x in pProperties)
+        return pProperties
+
+
+    return vkGetPipelineExecutablePropertiesKHR
+def _wrap_vkGetPipelineExecutableStatisticsKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPipelineExecutableStatisticsKHR(
+    device
+            ,pExecutableInfo
+            ,pStatistics=None
+            ,):
+
+
+        pStatisticCount = ffi.new('uint32_t*')
+        custom_return = pStatistics is not None
+        _array = pStatistics
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pStatisticCount[0] = len(_array)
+            result = fn(_handle(device, 'VkDevice'),_auto_handle(pExecutableInfo, _args[1]),pStatisticCount,pStatistics)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pStatistics = ffi.NULL
+            result = fn(_handle(device, 'VkDevice'),_auto_handle(pExecutableInfo, _args[1]),pStatisticCount,pStatistics)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pStatisticCount[0]:
+                _array = ffi.new('VkPipelineExecutableStatisticKHR[]', pStatisticCount[0])
+            pStatistics = _array
+            result = fn(_handle(device, 'VkDevice'),_auto_handle(pExecutableInfo, _args[1]),pStatisticCount,pStatistics)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pStatisticCount[0] != len(_array):
+            pStatistics = _slice(_array, pStatisticCount[0])
+
+        if not custom_return:
+            # the generator keeps the array alive
+            return (StrWrap(x) for x in pStatistics)
+        return pStatistics
+
+
+    return vkGetPipelineExecutableStatisticsKHR
+def _wrap_vkGetPipelineExecutableInternalRepresentationsKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPipelineExecutableInternalRepresentationsKHR(
+    device
+            ,pExecutableInfo
+            ,pInternalRepresentations=None
+            ,):
+
+
+        pInternalRepresentationCount = ffi.new('uint32_t*')
+        custom_return = pInternalRepresentations is not None
+        _array = pInternalRepresentations
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pInternalRepresentationCount[0] = len(_array)
+            result = fn(_handle(device, 'VkDevice'),_auto_handle(pExecutableInfo, _args[1]),pInternalRepresentationCount,pInternalRepresentations)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pInternalRepresentations = ffi.NULL
+            result = fn(_handle(device, 'VkDevice'),_auto_handle(pExecutableInfo, _args[1]),pInternalRepresentationCount,pInternalRepresentations)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pInternalRepresentationCount[0]:
+                _array = ffi.new('VkPipelineExecutableInternalRepresentationKHR[]', pInternalRepresentationCount[0])
+            pInternalRepresentations = _array
+            result = fn(_handle(device, 'VkDevice'),_auto_handle(pExecutableInfo, _args[1]),pInternalRepresentationCount,pInternalRepresentations)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pInternalRepresentationCount[0] != len(_array):
+            pInternalRepresentations = _slice(_array, pInternalRepresentationCount[0])
+
+        if not custom_return:
+            # the generator keeps the array alive
+            return (StrWrap(x) for x in pInternalRepresentations)
+        return pInternalRepresentations
+
+
+    return vkGetPipelineExecutableInternalRepresentationsKHR
+def _wrap_vkCreateAccelerationStructureKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateAccelerationStructureKHR(
+    device
+            ,pCreateInfo
+            ,pAllocator
+            ,pAccelerationStructure=None
+            ,):
+
+
+        custom_return = True
+        if not pAccelerationStructure:
+            pAccelerationStructure = ffi.new('VkAccelerationStructureKHR*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pAccelerationStructure, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pAccelerationStructure
+
+        return pAccelerationStructure[0]
+
+
+
+    return vkCreateAccelerationStructureKHR
+def _wrap_vkCmdBuildAccelerationStructuresKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdBuildAccelerationStructuresKHR(
+    commandBuffer
+            ,infoCount
+            ,pInfos
+            ,ppBuildRangeInfos
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),infoCount,_auto_handle(pInfos, _args[2]),_auto_handle(ppBuildRangeInfos, _args[3]))
+
+
+    return vkCmdBuildAccelerationStructuresKHR
+def _wrap_vkCmdBuildAccelerationStructuresIndirectKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdBuildAccelerationStructuresIndirectKHR(
+    commandBuffer
+            ,infoCount
+            ,pInfos
+            ,pIndirectDeviceAddresses
+            ,pIndirectStrides
+            ,ppMaxPrimitiveCounts
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),infoCount,_auto_handle(pInfos, _args[2]),_auto_handle(pIndirectDeviceAddresses, _args[3]),_auto_handle(pIndirectStrides, _args[4]),_auto_handle(ppMaxPrimitiveCounts, _args[5]))
+
+
+    return vkCmdBuildAccelerationStructuresIndirectKHR
+def _wrap_vkBuildAccelerationStructuresKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkBuildAccelerationStructuresKHR(
+    device
+            ,deferredOperation
+            ,infoCount
+            ,pInfos
+            ,ppBuildRangeInfos
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(deferredOperation, 'VkDeferredOperationKHR'),infoCount,_auto_handle(pInfos, _args[3]),_auto_handle(ppBuildRangeInfos, _args[4]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkBuildAccelerationStructuresKHR
+def _wrap_vkGetAccelerationStructureDeviceAddressKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetAccelerationStructureDeviceAddressKHR(
+    device
+            ,pInfo=None
+            ,):
+
+
+        custom_return = True
+        if not pInfo:
+            pInfo = ffi.new('VkAccelerationStructureDeviceAddressInfoKHR*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]))
+
+        if custom_return:
+            return pInfo
+
+        return pInfo[0]
+
+
+
+    return vkGetAccelerationStructureDeviceAddressKHR
+def _wrap_vkCreateDeferredOperationKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateDeferredOperationKHR(
+    device
+            ,pAllocator
+            ,pDeferredOperation=None
+            ,):
+
+
+        custom_return = True
+        if not pDeferredOperation:
+            pDeferredOperation = ffi.new('VkDeferredOperationKHR*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pAllocator, _args[1]),_auto_handle(pDeferredOperation, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pDeferredOperation
+
+        return pDeferredOperation[0]
+
+
+
+    return vkCreateDeferredOperationKHR
+def _wrap_vkDestroyDeferredOperationKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkDestroyDeferredOperationKHR(
+    device
+            ,operation
+            ,pAllocator
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(operation, 'VkDeferredOperationKHR'),_auto_handle(pAllocator, _args[2]))
+
+
+    return vkDestroyDeferredOperationKHR
+def _wrap_vkGetDeferredOperationMaxConcurrencyKHR(fn):
+    def vkGetDeferredOperationMaxConcurrencyKHR(
+    device
+            ,operation=None
+            ,):
+
+
+        custom_return = True
+        if not operation:
+            operation = ffi.new('VkDeferredOperationKHR*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(operation, 'VkDeferredOperationKHR'))
+
+        if custom_return:
+            return operation
+
+        return operation[0]
+
+
+
+    return vkGetDeferredOperationMaxConcurrencyKHR
+def _wrap_vkGetDeferredOperationResultKHR(fn):
+    def vkGetDeferredOperationResultKHR(
+    device
+            ,operation=None
+            ,):
+
+
+        custom_return = True
+        if not operation:
+            operation = ffi.new('VkDeferredOperationKHR*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(operation, 'VkDeferredOperationKHR'))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return operation
+
+        return operation[0]
+
+
+
+    return vkGetDeferredOperationResultKHR
+def _wrap_vkDeferredOperationJoinKHR(fn):
+    def vkDeferredOperationJoinKHR(
+    device
+            ,operation
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(operation, 'VkDeferredOperationKHR'))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkDeferredOperationJoinKHR
+def _wrap_vkCmdBindIndexBuffer2KHR(fn):
+    def vkCmdBindIndexBuffer2KHR(
+    commandBuffer
+            ,buffer
+            ,offset
+            ,size
+            ,indexType
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_handle(buffer, 'VkBuffer'),offset,size,indexType)
+
+
+    return vkCmdBindIndexBuffer2KHR
+def _wrap_vkCmdRefreshObjectsKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdRefreshObjectsKHR(
+    commandBuffer
+            ,pRefreshObjects
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pRefreshObjects, _args[1]))
+
+
+    return vkCmdRefreshObjectsKHR
+def _wrap_vkGetPhysicalDeviceRefreshableObjectTypesKHR(fn):
+    def vkGetPhysicalDeviceRefreshableObjectTypesKHR(
+    physicalDevice
+            ,pRefreshableObjectTypes=None
+            ,):
+
+
+        pRefreshableObjectTypeCount = ffi.new('uint32_t*')
+        custom_return = pRefreshableObjectTypes is not None
+        _array = pRefreshableObjectTypes
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pRefreshableObjectTypeCount[0] = len(_array)
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pRefreshableObjectTypeCount,pRefreshableObjectTypes)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pRefreshableObjectTypes = ffi.NULL
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pRefreshableObjectTypeCount,pRefreshableObjectTypes)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pRefreshableObjectTypeCount[0]:
+                _array = ffi.new('VkObjectType[]', pRefreshableObjectTypeCount[0])
+            pRefreshableObjectTypes = _array
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pRefreshableObjectTypeCount,pRefreshableObjectTypes)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pRefreshableObjectTypeCount[0] != len(_array):
+            pRefreshableObjectTypes = _slice(_array, pRefreshableObjectTypeCount[0])
+
+        return pRefreshableObjectTypes
+
+
+    return vkGetPhysicalDeviceRefreshableObjectTypesKHR
+def _wrap_vkCmdSetFragmentShadingRateKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetFragmentShadingRateKHR(
+    commandBuffer
+            ,pFragmentSize
+            ,combinerOps
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pFragmentSize, _args[1]),_auto_handle(combinerOps, _args[2]))
+
+
+    return vkCmdSetFragmentShadingRateKHR
+def _wrap_vkGetPhysicalDeviceFragmentShadingRatesKHR(fn):
+    def vkGetPhysicalDeviceFragmentShadingRatesKHR(
+    physicalDevice
+            ,pFragmentShadingRates=None
+            ,):
+
+
+        pFragmentShadingRateCount = ffi.new('uint32_t*')
+        custom_return = pFragmentShadingRates is not None
+        _array = pFragmentShadingRates
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pFragmentShadingRateCount[0] = len(_array)
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pFragmentShadingRateCount,pFragmentShadingRates)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pFragmentShadingRates = ffi.NULL
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pFragmentShadingRateCount,pFragmentShadingRates)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pFragmentShadingRateCount[0]:
+                _array = ffi.new('VkPhysicalDeviceFragmentShadingRateKHR[]', pFragmentShadingRateCount[0])
+            pFragmentShadingRates = _array
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pFragmentShadingRateCount,pFragmentShadingRates)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pFragmentShadingRateCount[0] != len(_array):
+            pFragmentShadingRates = _slice(_array, pFragmentShadingRateCount[0])
+
+        return pFragmentShadingRates
+
+
+    return vkGetPhysicalDeviceFragmentShadingRatesKHR
+def _wrap_vkGetAccelerationStructureBuildSizesKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetAccelerationStructureBuildSizesKHR(
+    device
+            ,buildType
+            ,pBuildInfo
+            ,pMaxPrimitiveCounts
+            ,pSizeInfo=None
+            ,):
+
+
+        custom_return = True
+        if not pSizeInfo:
+            pSizeInfo = ffi.new('VkAccelerationStructureBuildSizesInfoKHR*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),buildType,_auto_handle(pBuildInfo, _args[2]),_auto_handle(pMaxPrimitiveCounts, _args[3]),_auto_handle(pSizeInfo, _args[4]))
+
+        if custom_return:
+            return pSizeInfo
+
+        return pSizeInfo[0]
+
+
+
+    return vkGetAccelerationStructureBuildSizesKHR
+def _wrap_vkCmdWriteBufferMarker2AMD(fn):
+    def vkCmdWriteBufferMarker2AMD(
+    commandBuffer
+            ,stage
+            ,dstBuffer
+            ,dstOffset
+            ,marker
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),stage,_handle(dstBuffer, 'VkBuffer'),dstOffset,marker)
+
+
+    return vkCmdWriteBufferMarker2AMD
+def _wrap_vkGetQueueCheckpointData2NV(fn):
+    def vkGetQueueCheckpointData2NV(
+    queue
+            ,pCheckpointData=None
+            ,):
+
+
+        pCheckpointDataCount = ffi.new('uint32_t*')
+        custom_return = pCheckpointData is not None
+        _array = pCheckpointData
+
+        pCheckpointData = ffi.NULL
+        fn(_handle(queue, 'VkQueue'),pCheckpointDataCount,pCheckpointData)
+
+        if _array is None or len(_array) < pCheckpointDataCount[0]:
+            _array = ffi.new('VkCheckpointData2NV[]', pCheckpointDataCount[0])
+        pCheckpointData = _array
+        fn(_handle(queue, 'VkQueue'),pCheckpointDataCount,pCheckpointData)
+
+        if pCheckpointDataCount[0] != len(_array):
+            pCheckpointData = _slice(_array, pCheckpointDataCount[0])
+
+        return pCheckpointData
+
+
+    return vkGetQueueCheckpointData2NV
+def _wrap_vkGetPhysicalDeviceVideoCapabilitiesKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceVideoCapabilitiesKHR(
+    physicalDevice
+            ,pVideoProfile
+            ,pCapabilities=None
+            ,):
+
+
+        custom_return = True
+        if not pCapabilities:
+            pCapabilities = ffi.new('VkVideoCapabilitiesKHR*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pVideoProfile, _args[1]),_auto_handle(pCapabilities, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pCapabilities
+
+        return pCapabilities[0]
+
+
+
+    return vkGetPhysicalDeviceVideoCapabilitiesKHR
+def _wrap_vkGetPhysicalDeviceVideoFormatPropertiesKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceVideoFormatPropertiesKHR(
+    physicalDevice
+            ,pVideoFormatInfo
+            ,pVideoFormatProperties=None
+            ,):
+
+
+        pVideoFormatPropertyCount = ffi.new('uint32_t*')
+        custom_return = pVideoFormatProperties is not None
+        _array = pVideoFormatProperties
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pVideoFormatPropertyCount[0] = len(_array)
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pVideoFormatInfo, _args[1]),pVideoFormatPropertyCount,pVideoFormatProperties)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pVideoFormatProperties = ffi.NULL
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pVideoFormatInfo, _args[1]),pVideoFormatPropertyCount,pVideoFormatProperties)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pVideoFormatPropertyCount[0]:
+                _array = ffi.new('VkVideoFormatPropertiesKHR[]', pVideoFormatPropertyCount[0])
+            pVideoFormatProperties = _array
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pVideoFormatInfo, _args[1]),pVideoFormatPropertyCount,pVideoFormatProperties)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pVideoFormatPropertyCount[0] != len(_array):
+            pVideoFormatProperties = _slice(_array, pVideoFormatPropertyCount[0])
+
+        return pVideoFormatProperties
+
+
+    return vkGetPhysicalDeviceVideoFormatPropertiesKHR
+def _wrap_vkGetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR(
+    physicalDevice
+            ,pQualityLevelInfo
+            ,pQualityLevelProperties=None
+            ,):
+
+
+        custom_return = True
+        if not pQualityLevelProperties:
+            pQualityLevelProperties = ffi.new('VkVideoEncodeQualityLevelPropertiesKHR*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pQualityLevelInfo, _args[1]),_auto_handle(pQualityLevelProperties, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pQualityLevelProperties
+
+        return pQualityLevelProperties[0]
+
+
+
+    return vkGetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR
+def _wrap_vkCreateVideoSessionKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateVideoSessionKHR(
+    device
+            ,pCreateInfo
+            ,pAllocator
+            ,pVideoSession=None
+            ,):
+
+
+        custom_return = True
+        if not pVideoSession:
+            pVideoSession = ffi.new('VkVideoSessionKHR*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pVideoSession, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pVideoSession
+
+        return pVideoSession[0]
+
+
+
+    return vkCreateVideoSessionKHR
+def _wrap_vkDestroyVideoSessionKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkDestroyVideoSessionKHR(
+    device
+            ,videoSession
+            ,pAllocator
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(videoSession, 'VkVideoSessionKHR'),_auto_handle(pAllocator, _args[2]))
+
+
+    return vkDestroyVideoSessionKHR
+def _wrap_vkCreateVideoSessionParametersKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateVideoSessionParametersKHR(
+    device
+            ,pCreateInfo
+            ,pAllocator
+            ,pVideoSessionParameters=None
+            ,):
+
+
+        custom_return = True
+        if not pVideoSessionParameters:
+            pVideoSessionParameters = ffi.new('VkVideoSessionParametersKHR*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pVideoSessionParameters, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pVideoSessionParameters
+
+        return pVideoSessionParameters[0]
+
+
+
+    return vkCreateVideoSessionParametersKHR
+def _wrap_vkUpdateVideoSessionParametersKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkUpdateVideoSessionParametersKHR(
+    device
+            ,videoSessionParameters
+            ,pUpdateInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(videoSessionParameters, 'VkVideoSessionParametersKHR'),_auto_handle(pUpdateInfo, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkUpdateVideoSessionParametersKHR
+def _wrap_vkGetEncodedVideoSessionParametersKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetEncodedVideoSessionParametersKHR(
+    device
+            ,pVideoSessionParametersInfo
+            ,pFeedbackInfo
+            ,pDataSize
+            ,pData=None
+            ,):
+
+
+        custom_return = True
+        if not pData:
+            pData = ffi.new('void[%d]' % pDataSize)
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pVideoSessionParametersInfo, _args[1]),_auto_handle(pFeedbackInfo, _args[2]),_auto_handle(pDataSize, _args[3]),_auto_handle(pData, _args[4]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pData
+
+        return pData
+
+
+
+    return vkGetEncodedVideoSessionParametersKHR
+def _wrap_vkDestroyVideoSessionParametersKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkDestroyVideoSessionParametersKHR(
+    device
+            ,videoSessionParameters
+            ,pAllocator
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(videoSessionParameters, 'VkVideoSessionParametersKHR'),_auto_handle(pAllocator, _args[2]))
+
+
+    return vkDestroyVideoSessionParametersKHR
+def _wrap_vkGetVideoSessionMemoryRequirementsKHR(fn):
+    def vkGetVideoSessionMemoryRequirementsKHR(
+    device
+            ,videoSession
+            ,pMemoryRequirements=None
+            ,):
+
+
+        pMemoryRequirementsCount = ffi.new('uint32_t*')
+        custom_return = pMemoryRequirements is not None
+        _array = pMemoryRequirements
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pMemoryRequirementsCount[0] = len(_array)
+            result = fn(_handle(device, 'VkDevice'),_handle(videoSession, 'VkVideoSessionKHR'),pMemoryRequirementsCount,pMemoryRequirements)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pMemoryRequirements = ffi.NULL
+            result = fn(_handle(device, 'VkDevice'),_handle(videoSession, 'VkVideoSessionKHR'),pMemoryRequirementsCount,pMemoryRequirements)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pMemoryRequirementsCount[0]:
+                _array = ffi.new('VkVideoSessionMemoryRequirementsKHR[]', pMemoryRequirementsCount[0])
+            pMemoryRequirements = _array
+            result = fn(_handle(device, 'VkDevice'),_handle(videoSession, 'VkVideoSessionKHR'),pMemoryRequirementsCount,pMemoryRequirements)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pMemoryRequirementsCount[0] != len(_array):
+            pMemoryRequirements = _slice(_array, pMemoryRequirementsCount[0])
+
+        return pMemoryRequirements
+
+
+    return vkGetVideoSessionMemoryRequirementsKHR
+def _wrap_vkBindVideoSessionMemoryKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkBindVideoSessionMemoryKHR(
+    device
+            ,videoSession
+            ,bindSessionMemoryInfoCount
+            ,pBindSessionMemoryInfos
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(videoSession, 'VkVideoSessionKHR'),bindSessionMemoryInfoCount,_auto_handle(pBindSessionMemoryInfos, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkBindVideoSessionMemoryKHR
+def _wrap_vkCmdDecodeVideoKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdDecodeVideoKHR(
+    commandBuffer
+            ,pDecodeInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pDecodeInfo, _args[1]))
+
+
+    return vkCmdDecodeVideoKHR
+def _wrap_vkCmdBeginVideoCodingKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdBeginVideoCodingKHR(
+    commandBuffer
+            ,pBeginInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pBeginInfo, _args[1]))
+
+
+    return vkCmdBeginVideoCodingKHR
+def _wrap_vkCmdControlVideoCodingKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdControlVideoCodingKHR(
+    commandBuffer
+            ,pCodingControlInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pCodingControlInfo, _args[1]))
+
+
+    return vkCmdControlVideoCodingKHR
+def _wrap_vkCmdEndVideoCodingKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdEndVideoCodingKHR(
+    commandBuffer
+            ,pEndCodingInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pEndCodingInfo, _args[1]))
+
+
+    return vkCmdEndVideoCodingKHR
+def _wrap_vkCmdEncodeVideoKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdEncodeVideoKHR(
+    commandBuffer
+            ,pEncodeInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pEncodeInfo, _args[1]))
+
+
+    return vkCmdEncodeVideoKHR
+def _wrap_vkWaitForPresentKHR(fn):
+    def vkWaitForPresentKHR(
+    device
+            ,swapchain
+            ,presentId
+            ,timeout
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(swapchain, 'VkSwapchainKHR'),presentId,timeout)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkWaitForPresentKHR
+def _wrap_vkGetImageSubresourceLayout2KHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetImageSubresourceLayout2KHR(
+    device
+            ,image
+            ,pSubresource
+            ,pLayout=None
+            ,):
+
+
+        custom_return = True
+        if not pLayout:
+            pLayout = ffi.new('VkSubresourceLayout2KHR*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(image, 'VkImage'),_auto_handle(pSubresource, _args[2]),_auto_handle(pLayout, _args[3]))
+
+        if custom_return:
+            return pLayout
+
+        return pLayout[0]
+
+
+
+    return vkGetImageSubresourceLayout2KHR
+def _wrap_vkGetDeviceImageSubresourceLayoutKHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetDeviceImageSubresourceLayoutKHR(
+    device
+            ,pInfo
+            ,pLayout=None
+            ,):
+
+
+        custom_return = True
+        if not pLayout:
+            pLayout = ffi.new('VkSubresourceLayout2KHR*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),_auto_handle(pLayout, _args[2]))
+
+        if custom_return:
+            return pLayout
+
+        return pLayout[0]
+
+
+
+    return vkGetDeviceImageSubresourceLayoutKHR
+def _wrap_vkMapMemory2KHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkMapMemory2KHR(
+    device
+            ,pMemoryMapInfo
+            ,ppData=None
+            ,):
+
+
+        custom_return = True
+        if not ppData:
+            ppData = ffi.new('void*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pMemoryMapInfo, _args[1]),_auto_handle(ppData, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return ppData
+
+        return ppData[0]
+
+
+
+    return vkMapMemory2KHR
+def _wrap_vkUnmapMemory2KHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkUnmapMemory2KHR(
+    device
+            ,pMemoryUnmapInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pMemoryUnmapInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkUnmapMemory2KHR
+def _wrap_vkGetPhysicalDeviceCooperativeMatrixPropertiesKHR(fn):
+    def vkGetPhysicalDeviceCooperativeMatrixPropertiesKHR(
+    physicalDevice
+            ,pProperties=None
+            ,):
+
+
+        pPropertyCount = ffi.new('uint32_t*')
+        custom_return = pProperties is not None
+        _array = pProperties
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pPropertyCount[0] = len(_array)
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pProperties = ffi.NULL
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pPropertyCount[0]:
+                _array = ffi.new('VkCooperativeMatrixPropertiesKHR[]', pPropertyCount[0])
+            pProperties = _array
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pPropertyCount[0] != len(_array):
+            pProperties = _slice(_array, pPropertyCount[0])
+
+        return pProperties
+
+
+    return vkGetPhysicalDeviceCooperativeMatrixPropertiesKHR
+def _wrap_vkCmdBindDescriptorSets2KHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdBindDescriptorSets2KHR(
+    commandBuffer
+            ,pBindDescriptorSetsInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pBindDescriptorSetsInfo, _args[1]))
+
+
+    return vkCmdBindDescriptorSets2KHR
+def _wrap_vkCmdPushConstants2KHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdPushConstants2KHR(
+    commandBuffer
+            ,pPushConstantsInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pPushConstantsInfo, _args[1]))
+
+
+    return vkCmdPushConstants2KHR
+def _wrap_vkCmdPushDescriptorSet2KHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdPushDescriptorSet2KHR(
+    commandBuffer
+            ,pPushDescriptorSetInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pPushDescriptorSetInfo, _args[1]))
+
+
+    return vkCmdPushDescriptorSet2KHR
+def _wrap_vkCmdPushDescriptorSetWithTemplate2KHR(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdPushDescriptorSetWithTemplate2KHR(
+    commandBuffer
+            ,pPushDescriptorSetWithTemplateInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pPushDescriptorSetWithTemplateInfo, _args[1]))
+
+
+    return vkCmdPushDescriptorSetWithTemplate2KHR
+def _wrap_vkCmdSetDescriptorBufferOffsets2EXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetDescriptorBufferOffsets2EXT(
+    commandBuffer
+            ,pSetDescriptorBufferOffsetsInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pSetDescriptorBufferOffsetsInfo, _args[1]))
+
+
+    return vkCmdSetDescriptorBufferOffsets2EXT
+def _wrap_vkCmdBindDescriptorBufferEmbeddedSamplers2EXT(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdBindDescriptorBufferEmbeddedSamplers2EXT(
+    commandBuffer
+            ,pBindDescriptorBufferEmbeddedSamplersInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pBindDescriptorBufferEmbeddedSamplersInfo, _args[1]))
+
+
+    return vkCmdBindDescriptorBufferEmbeddedSamplers2EXT
@@ -0,0 +1,2059 @@
+from vulkan._vulkan import *  # noqa
+from vulkan._vulkan import (ffi, lib, _new, _auto_handle, _handle,
+                            _arg_types, _slice)
+
+
+def VkCopyMemoryIndirectCommandNV(srcAddress=None,dstAddress=None,size=None,):
+
+    return _new('VkCopyMemoryIndirectCommandNV', srcAddress=srcAddress,dstAddress=dstAddress,size=size)
+
+def VkCopyMemoryToImageIndirectCommandNV(srcAddress=None,bufferRowLength=None,bufferImageHeight=None,imageSubresource=None,imageOffset=None,imageExtent=None,):
+
+    return _new('VkCopyMemoryToImageIndirectCommandNV', srcAddress=srcAddress,bufferRowLength=bufferRowLength,bufferImageHeight=bufferImageHeight,imageSubresource=imageSubresource,imageOffset=imageOffset,imageExtent=imageExtent)
+
+def VkComputePipelineIndirectBufferInfoNV(sType=VK_STRUCTURE_TYPE_COMPUTE_PIPELINE_INDIRECT_BUFFER_INFO_NV,pNext=None,deviceAddress=None,size=None,pipelineDeviceAddressCaptureReplay=None,):
+
+    return _new('VkComputePipelineIndirectBufferInfoNV', sType=sType,pNext=pNext,deviceAddress=deviceAddress,size=size,pipelineDeviceAddressCaptureReplay=pipelineDeviceAddressCaptureReplay)
+
+def VkDedicatedAllocationImageCreateInfoNV(sType=VK_STRUCTURE_TYPE_DEDICATED_ALLOCATION_IMAGE_CREATE_INFO_NV,pNext=None,dedicatedAllocation=None,):
+
+    return _new('VkDedicatedAllocationImageCreateInfoNV', sType=sType,pNext=pNext,dedicatedAllocation=dedicatedAllocation)
+
+def VkDedicatedAllocationBufferCreateInfoNV(sType=VK_STRUCTURE_TYPE_DEDICATED_ALLOCATION_BUFFER_CREATE_INFO_NV,pNext=None,dedicatedAllocation=None,):
+
+    return _new('VkDedicatedAllocationBufferCreateInfoNV', sType=sType,pNext=pNext,dedicatedAllocation=dedicatedAllocation)
+
+def VkDedicatedAllocationMemoryAllocateInfoNV(sType=VK_STRUCTURE_TYPE_DEDICATED_ALLOCATION_MEMORY_ALLOCATE_INFO_NV,pNext=None,image=None,buffer=None,):
+
+    return _new('VkDedicatedAllocationMemoryAllocateInfoNV', sType=sType,pNext=pNext,image=image,buffer=buffer)
+
+def VkExternalImageFormatPropertiesNV(imageFormatProperties=None,externalMemoryFeatures=None,exportFromImportedHandleTypes=None,compatibleHandleTypes=None,):
+
+    return _new('VkExternalImageFormatPropertiesNV', imageFormatProperties=imageFormatProperties,externalMemoryFeatures=externalMemoryFeatures,exportFromImportedHandleTypes=exportFromImportedHandleTypes,compatibleHandleTypes=compatibleHandleTypes)
+
+def VkExternalMemoryImageCreateInfoNV(sType=VK_STRUCTURE_TYPE_EXTERNAL_MEMORY_IMAGE_CREATE_INFO_NV,pNext=None,handleTypes=None,):
+
+    return _new('VkExternalMemoryImageCreateInfoNV', sType=sType,pNext=pNext,handleTypes=handleTypes)
+
+def VkExportMemoryAllocateInfoNV(sType=VK_STRUCTURE_TYPE_EXPORT_MEMORY_ALLOCATE_INFO_NV,pNext=None,handleTypes=None,):
+
+    return _new('VkExportMemoryAllocateInfoNV', sType=sType,pNext=pNext,handleTypes=handleTypes)
+
+def VkImportMemoryWin32HandleInfoNV(sType=VK_STRUCTURE_TYPE_IMPORT_MEMORY_WIN32_HANDLE_INFO_NV,pNext=None,handleType=None,handle=None,):
+
+    return _new('VkImportMemoryWin32HandleInfoNV', sType=sType,pNext=pNext,handleType=handleType,handle=handle)
+
+def VkExportMemoryWin32HandleInfoNV(sType=VK_STRUCTURE_TYPE_EXPORT_MEMORY_WIN32_HANDLE_INFO_NV,pNext=None,pAttributes=None,dwAccess=None,):
+
+    return _new('VkExportMemoryWin32HandleInfoNV', sType=sType,pNext=pNext,pAttributes=pAttributes,dwAccess=dwAccess)
+
+def VkExportMemorySciBufInfoNV(sType=VK_STRUCTURE_TYPE_EXPORT_MEMORY_SCI_BUF_INFO_NV,pNext=None,pAttributes=None,):
+
+    return _new('VkExportMemorySciBufInfoNV', sType=sType,pNext=pNext,pAttributes=pAttributes)
+
+def VkImportMemorySciBufInfoNV(sType=VK_STRUCTURE_TYPE_IMPORT_MEMORY_SCI_BUF_INFO_NV,pNext=None,handleType=None,handle=None,):
+
+    return _new('VkImportMemorySciBufInfoNV', sType=sType,pNext=pNext,handleType=handleType,handle=handle)
+
+def VkMemoryGetSciBufInfoNV(sType=VK_STRUCTURE_TYPE_MEMORY_GET_SCI_BUF_INFO_NV,pNext=None,memory=None,handleType=None,):
+
+    return _new('VkMemoryGetSciBufInfoNV', sType=sType,pNext=pNext,memory=memory,handleType=handleType)
+
+def VkMemorySciBufPropertiesNV(sType=VK_STRUCTURE_TYPE_MEMORY_SCI_BUF_PROPERTIES_NV,pNext=None,memoryTypeBits=None,):
+
+    return _new('VkMemorySciBufPropertiesNV', sType=sType,pNext=pNext,memoryTypeBits=memoryTypeBits)
+
+def VkPhysicalDeviceExternalMemorySciBufFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_MEMORY_SCI_BUF_FEATURES_NV,pNext=None,sciBufImport=None,sciBufExport=None,):
+
+    return _new('VkPhysicalDeviceExternalMemorySciBufFeaturesNV', sType=sType,pNext=pNext,sciBufImport=sciBufImport,sciBufExport=sciBufExport)
+
+def VkWin32KeyedMutexAcquireReleaseInfoNV(sType=VK_STRUCTURE_TYPE_WIN32_KEYED_MUTEX_ACQUIRE_RELEASE_INFO_NV,pNext=None,acquireCount=None,pAcquireSyncs=None,pAcquireKeys=None,pAcquireTimeoutMilliseconds=None,releaseCount=None,pReleaseSyncs=None,pReleaseKeys=None,):
+    if acquireCount is None and pAcquireSyncs is not None:
+        acquireCount = len(pAcquireSyncs)
+    if acquireCount is None and pAcquireKeys is not None:
+        acquireCount = len(pAcquireKeys)
+    if acquireCount is None and pAcquireTimeoutMilliseconds is not None:
+        acquireCount = len(pAcquireTimeoutMilliseconds)
+    if releaseCount is None and pReleaseSyncs is not None:
+        releaseCount = len(pReleaseSyncs)
+    if releaseCount is None and pReleaseKeys is not None:
+        releaseCount = len(pReleaseKeys)
+
+    return _new('VkWin32KeyedMutexAcquireReleaseInfoNV', sType=sType,pNext=pNext,acquireCount=acquireCount,pAcquireSyncs=pAcquireSyncs,pAcquireKeys=pAcquireKeys,pAcquireTimeoutMilliseconds=pAcquireTimeoutMilliseconds,releaseCount=releaseCount,pReleaseSyncs=pReleaseSyncs,pReleaseKeys=pReleaseKeys)
+
+def VkPhysicalDeviceDeviceGeneratedCommandsFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_FEATURES_NV,pNext=None,deviceGeneratedCommands=None,):
+
+    return _new('VkPhysicalDeviceDeviceGeneratedCommandsFeaturesNV', sType=sType,pNext=pNext,deviceGeneratedCommands=deviceGeneratedCommands)
+
+def VkPhysicalDeviceDeviceGeneratedCommandsComputeFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_COMPUTE_FEATURES_NV,pNext=None,deviceGeneratedCompute=None,deviceGeneratedComputePipelines=None,deviceGeneratedComputeCaptureReplay=None,):
+
+    return _new('VkPhysicalDeviceDeviceGeneratedCommandsComputeFeaturesNV', sType=sType,pNext=pNext,deviceGeneratedCompute=deviceGeneratedCompute,deviceGeneratedComputePipelines=deviceGeneratedComputePipelines,deviceGeneratedComputeCaptureReplay=deviceGeneratedComputeCaptureReplay)
+
+def VkPhysicalDeviceDeviceGeneratedCommandsPropertiesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_PROPERTIES_NV,pNext=None,maxGraphicsShaderGroupCount=None,maxIndirectSequenceCount=None,maxIndirectCommandsTokenCount=None,maxIndirectCommandsStreamCount=None,maxIndirectCommandsTokenOffset=None,maxIndirectCommandsStreamStride=None,minSequencesCountBufferOffsetAlignment=None,minSequencesIndexBufferOffsetAlignment=None,minIndirectCommandsBufferOffsetAlignment=None,):
+
+    return _new('VkPhysicalDeviceDeviceGeneratedCommandsPropertiesNV', sType=sType,pNext=pNext,maxGraphicsShaderGroupCount=maxGraphicsShaderGroupCount,maxIndirectSequenceCount=maxIndirectSequenceCount,maxIndirectCommandsTokenCount=maxIndirectCommandsTokenCount,maxIndirectCommandsStreamCount=maxIndirectCommandsStreamCount,maxIndirectCommandsTokenOffset=maxIndirectCommandsTokenOffset,maxIndirectCommandsStreamStride=maxIndirectCommandsStreamStride,minSequencesCountBufferOffsetAlignment=minSequencesCountBufferOffsetAlignment,minSequencesIndexBufferOffsetAlignment=minSequencesIndexBufferOffsetAlignment,minIndirectCommandsBufferOffsetAlignment=minIndirectCommandsBufferOffsetAlignment)
+
+def VkGraphicsShaderGroupCreateInfoNV(sType=VK_STRUCTURE_TYPE_GRAPHICS_SHADER_GROUP_CREATE_INFO_NV,pNext=None,stageCount=None,pStages=None,pVertexInputState=None,pTessellationState=None,):
+    if stageCount is None and pStages is not None:
+        stageCount = len(pStages)
+
+    return _new('VkGraphicsShaderGroupCreateInfoNV', sType=sType,pNext=pNext,stageCount=stageCount,pStages=pStages,pVertexInputState=pVertexInputState,pTessellationState=pTessellationState)
+
+def VkGraphicsPipelineShaderGroupsCreateInfoNV(sType=VK_STRUCTURE_TYPE_GRAPHICS_PIPELINE_SHADER_GROUPS_CREATE_INFO_NV,pNext=None,groupCount=None,pGroups=None,pipelineCount=None,pPipelines=None,):
+    if groupCount is None and pGroups is not None:
+        groupCount = len(pGroups)
+    if pipelineCount is None and pPipelines is not None:
+        pipelineCount = len(pPipelines)
+
+    return _new('VkGraphicsPipelineShaderGroupsCreateInfoNV', sType=sType,pNext=pNext,groupCount=groupCount,pGroups=pGroups,pipelineCount=pipelineCount,pPipelines=pPipelines)
+
+def VkBindShaderGroupIndirectCommandNV(groupIndex=None,):
+
+    return _new('VkBindShaderGroupIndirectCommandNV', groupIndex=groupIndex)
+
+def VkBindIndexBufferIndirectCommandNV(bufferAddress=None,size=None,indexType=None,):
+
+    return _new('VkBindIndexBufferIndirectCommandNV', bufferAddress=bufferAddress,size=size,indexType=indexType)
+
+def VkBindVertexBufferIndirectCommandNV(bufferAddress=None,size=None,stride=None,):
+
+    return _new('VkBindVertexBufferIndirectCommandNV', bufferAddress=bufferAddress,size=size,stride=stride)
+
+def VkSetStateFlagsIndirectCommandNV(data=None,):
+
+    return _new('VkSetStateFlagsIndirectCommandNV', data=data)
+
+def VkIndirectCommandsStreamNV(buffer=None,offset=None,):
+
+    return _new('VkIndirectCommandsStreamNV', buffer=buffer,offset=offset)
+
+def VkIndirectCommandsLayoutTokenNV(sType=VK_STRUCTURE_TYPE_INDIRECT_COMMANDS_LAYOUT_TOKEN_NV,pNext=None,tokenType=None,stream=None,offset=None,vertexBindingUnit=None,vertexDynamicStride=None,pushconstantPipelineLayout=None,pushconstantShaderStageFlags=None,pushconstantOffset=None,pushconstantSize=None,indirectStateFlags=None,indexTypeCount=None,pIndexTypes=None,pIndexTypeValues=None,):
+    if indexTypeCount is None and pIndexTypes is not None:
+        indexTypeCount = len(pIndexTypes)
+    if indexTypeCount is None and pIndexTypeValues is not None:
+        indexTypeCount = len(pIndexTypeValues)
+
+    return _new('VkIndirectCommandsLayoutTokenNV', sType=sType,pNext=pNext,tokenType=tokenType,stream=stream,offset=offset,vertexBindingUnit=vertexBindingUnit,vertexDynamicStride=vertexDynamicStride,pushconstantPipelineLayout=pushconstantPipelineLayout,pushconstantShaderStageFlags=pushconstantShaderStageFlags,pushconstantOffset=pushconstantOffset,pushconstantSize=pushconstantSize,indirectStateFlags=indirectStateFlags,indexTypeCount=indexTypeCount,pIndexTypes=pIndexTypes,pIndexTypeValues=pIndexTypeValues)
+
+def VkIndirectCommandsLayoutCreateInfoNV(sType=VK_STRUCTURE_TYPE_INDIRECT_COMMANDS_LAYOUT_CREATE_INFO_NV,pNext=None,flags=None,pipelineBindPoint=None,tokenCount=None,pTokens=None,streamCount=None,pStreamStrides=None,):
+    if tokenCount is None and pTokens is not None:
+        tokenCount = len(pTokens)
+    if streamCount is None and pStreamStrides is not None:
+        streamCount = len(pStreamStrides)
+
+    return _new('VkIndirectCommandsLayoutCreateInfoNV', sType=sType,pNext=pNext,flags=flags,pipelineBindPoint=pipelineBindPoint,tokenCount=tokenCount,pTokens=pTokens,streamCount=streamCount,pStreamStrides=pStreamStrides)
+
+def VkGeneratedCommandsInfoNV(sType=VK_STRUCTURE_TYPE_GENERATED_COMMANDS_INFO_NV,pNext=None,pipelineBindPoint=None,pipeline=None,indirectCommandsLayout=None,streamCount=None,pStreams=None,sequencesCount=None,preprocessBuffer=None,preprocessOffset=None,preprocessSize=None,sequencesCountBuffer=None,sequencesCountOffset=None,sequencesIndexBuffer=None,sequencesIndexOffset=None,):
+    if streamCount is None and pStreams is not None:
+        streamCount = len(pStreams)
+
+    return _new('VkGeneratedCommandsInfoNV', sType=sType,pNext=pNext,pipelineBindPoint=pipelineBindPoint,pipeline=pipeline,indirectCommandsLayout=indirectCommandsLayout,streamCount=streamCount,pStreams=pStreams,sequencesCount=sequencesCount,preprocessBuffer=preprocessBuffer,preprocessOffset=preprocessOffset,preprocessSize=preprocessSize,sequencesCountBuffer=sequencesCountBuffer,sequencesCountOffset=sequencesCountOffset,sequencesIndexBuffer=sequencesIndexBuffer,sequencesIndexOffset=sequencesIndexOffset)
+
+def VkGeneratedCommandsMemoryRequirementsInfoNV(sType=VK_STRUCTURE_TYPE_GENERATED_COMMANDS_MEMORY_REQUIREMENTS_INFO_NV,pNext=None,pipelineBindPoint=None,pipeline=None,indirectCommandsLayout=None,maxSequencesCount=None,):
+
+    return _new('VkGeneratedCommandsMemoryRequirementsInfoNV', sType=sType,pNext=pNext,pipelineBindPoint=pipelineBindPoint,pipeline=pipeline,indirectCommandsLayout=indirectCommandsLayout,maxSequencesCount=maxSequencesCount)
+
+def VkPipelineIndirectDeviceAddressInfoNV(sType=VK_STRUCTURE_TYPE_PIPELINE_INDIRECT_DEVICE_ADDRESS_INFO_NV,pNext=None,pipelineBindPoint=None,pipeline=None,):
+
+    return _new('VkPipelineIndirectDeviceAddressInfoNV', sType=sType,pNext=pNext,pipelineBindPoint=pipelineBindPoint,pipeline=pipeline)
+
+def VkBindPipelineIndirectCommandNV(pipelineAddress=None,):
+
+    return _new('VkBindPipelineIndirectCommandNV', pipelineAddress=pipelineAddress)
+
+def VkExportFenceSciSyncInfoNV(sType=VK_STRUCTURE_TYPE_EXPORT_FENCE_SCI_SYNC_INFO_NV,pNext=None,pAttributes=None,):
+
+    return _new('VkExportFenceSciSyncInfoNV', sType=sType,pNext=pNext,pAttributes=pAttributes)
+
+def VkImportFenceSciSyncInfoNV(sType=VK_STRUCTURE_TYPE_IMPORT_FENCE_SCI_SYNC_INFO_NV,pNext=None,fence=None,handleType=None,handle=None,):
+
+    return _new('VkImportFenceSciSyncInfoNV', sType=sType,pNext=pNext,fence=fence,handleType=handleType,handle=handle)
+
+def VkFenceGetSciSyncInfoNV(sType=VK_STRUCTURE_TYPE_FENCE_GET_SCI_SYNC_INFO_NV,pNext=None,fence=None,handleType=None,):
+
+    return _new('VkFenceGetSciSyncInfoNV', sType=sType,pNext=pNext,fence=fence,handleType=handleType)
+
+def VkExportSemaphoreSciSyncInfoNV(sType=VK_STRUCTURE_TYPE_EXPORT_SEMAPHORE_SCI_SYNC_INFO_NV,pNext=None,pAttributes=None,):
+
+    return _new('VkExportSemaphoreSciSyncInfoNV', sType=sType,pNext=pNext,pAttributes=pAttributes)
+
+def VkImportSemaphoreSciSyncInfoNV(sType=VK_STRUCTURE_TYPE_IMPORT_SEMAPHORE_SCI_SYNC_INFO_NV,pNext=None,semaphore=None,handleType=None,handle=None,):
+
+    return _new('VkImportSemaphoreSciSyncInfoNV', sType=sType,pNext=pNext,semaphore=semaphore,handleType=handleType,handle=handle)
+
+def VkSemaphoreGetSciSyncInfoNV(sType=VK_STRUCTURE_TYPE_SEMAPHORE_GET_SCI_SYNC_INFO_NV,pNext=None,semaphore=None,handleType=None,):
+
+    return _new('VkSemaphoreGetSciSyncInfoNV', sType=sType,pNext=pNext,semaphore=semaphore,handleType=handleType)
+
+def VkSciSyncAttributesInfoNV(sType=VK_STRUCTURE_TYPE_SCI_SYNC_ATTRIBUTES_INFO_NV,pNext=None,clientType=None,primitiveType=None,):
+
+    return _new('VkSciSyncAttributesInfoNV', sType=sType,pNext=pNext,clientType=clientType,primitiveType=primitiveType)
+
+def VkPhysicalDeviceExternalSciSyncFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_SCI_SYNC_FEATURES_NV,pNext=None,sciSyncFence=None,sciSyncSemaphore=None,sciSyncImport=None,sciSyncExport=None,):
+
+    return _new('VkPhysicalDeviceExternalSciSyncFeaturesNV', sType=sType,pNext=pNext,sciSyncFence=sciSyncFence,sciSyncSemaphore=sciSyncSemaphore,sciSyncImport=sciSyncImport,sciSyncExport=sciSyncExport)
+
+def VkPhysicalDeviceExternalSciSync2FeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_SCI_SYNC_2_FEATURES_NV,pNext=None,sciSyncFence=None,sciSyncSemaphore2=None,sciSyncImport=None,sciSyncExport=None,):
+
+    return _new('VkPhysicalDeviceExternalSciSync2FeaturesNV', sType=sType,pNext=pNext,sciSyncFence=sciSyncFence,sciSyncSemaphore2=sciSyncSemaphore2,sciSyncImport=sciSyncImport,sciSyncExport=sciSyncExport)
+
+def VkSemaphoreSciSyncPoolCreateInfoNV(sType=VK_STRUCTURE_TYPE_SEMAPHORE_SCI_SYNC_POOL_CREATE_INFO_NV,pNext=None,handle=None,):
+
+    return _new('VkSemaphoreSciSyncPoolCreateInfoNV', sType=sType,pNext=pNext,handle=handle)
+
+def VkSemaphoreSciSyncCreateInfoNV(sType=VK_STRUCTURE_TYPE_SEMAPHORE_SCI_SYNC_CREATE_INFO_NV,pNext=None,semaphorePool=None,pFence=None,):
+
+    return _new('VkSemaphoreSciSyncCreateInfoNV', sType=sType,pNext=pNext,semaphorePool=semaphorePool,pFence=pFence)
+
+def VkDeviceSemaphoreSciSyncPoolReservationCreateInfoNV(sType=VK_STRUCTURE_TYPE_DEVICE_SEMAPHORE_SCI_SYNC_POOL_RESERVATION_CREATE_INFO_NV,pNext=None,semaphoreSciSyncPoolRequestCount=None,):
+
+    return _new('VkDeviceSemaphoreSciSyncPoolReservationCreateInfoNV', sType=sType,pNext=pNext,semaphoreSciSyncPoolRequestCount=semaphoreSciSyncPoolRequestCount)
+
+def VkViewportWScalingNV(xcoeff=None,ycoeff=None,):
+
+    return _new('VkViewportWScalingNV', xcoeff=xcoeff,ycoeff=ycoeff)
+
+def VkPipelineViewportWScalingStateCreateInfoNV(sType=VK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_W_SCALING_STATE_CREATE_INFO_NV,pNext=None,viewportWScalingEnable=None,viewportCount=None,pViewportWScalings=None,):
+    if viewportCount is None and pViewportWScalings is not None:
+        viewportCount = len(pViewportWScalings)
+
+    return _new('VkPipelineViewportWScalingStateCreateInfoNV', sType=sType,pNext=pNext,viewportWScalingEnable=viewportWScalingEnable,viewportCount=viewportCount,pViewportWScalings=pViewportWScalings)
+
+def VkViewportSwizzleNV(x=None,y=None,z=None,w=None,):
+
+    return _new('VkViewportSwizzleNV', x=x,y=y,z=z,w=w)
+
+def VkPipelineViewportSwizzleStateCreateInfoNV(sType=VK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_SWIZZLE_STATE_CREATE_INFO_NV,pNext=None,flags=None,viewportCount=None,pViewportSwizzles=None,):
+    if viewportCount is None and pViewportSwizzles is not None:
+        viewportCount = len(pViewportSwizzles)
+
+    return _new('VkPipelineViewportSwizzleStateCreateInfoNV', sType=sType,pNext=pNext,flags=flags,viewportCount=viewportCount,pViewportSwizzles=pViewportSwizzles)
+
+def VkPipelineCoverageToColorStateCreateInfoNV(sType=VK_STRUCTURE_TYPE_PIPELINE_COVERAGE_TO_COLOR_STATE_CREATE_INFO_NV,pNext=None,flags=None,coverageToColorEnable=None,coverageToColorLocation=None,):
+
+    return _new('VkPipelineCoverageToColorStateCreateInfoNV', sType=sType,pNext=pNext,flags=flags,coverageToColorEnable=coverageToColorEnable,coverageToColorLocation=coverageToColorLocation)
+
+def VkPipelineCoverageModulationStateCreateInfoNV(sType=VK_STRUCTURE_TYPE_PIPELINE_COVERAGE_MODULATION_STATE_CREATE_INFO_NV,pNext=None,flags=None,coverageModulationMode=None,coverageModulationTableEnable=None,coverageModulationTableCount=None,pCoverageModulationTable=None,):
+    if coverageModulationTableCount is None and pCoverageModulationTable is not None:
+        coverageModulationTableCount = len(pCoverageModulationTable)
+
+    return _new('VkPipelineCoverageModulationStateCreateInfoNV', sType=sType,pNext=pNext,flags=flags,coverageModulationMode=coverageModulationMode,coverageModulationTableEnable=coverageModulationTableEnable,coverageModulationTableCount=coverageModulationTableCount,pCoverageModulationTable=pCoverageModulationTable)
+
+def VkQueueFamilyCheckpointPropertiesNV(sType=VK_STRUCTURE_TYPE_QUEUE_FAMILY_CHECKPOINT_PROPERTIES_NV,pNext=None,checkpointExecutionStageMask=None,):
+
+    return _new('VkQueueFamilyCheckpointPropertiesNV', sType=sType,pNext=pNext,checkpointExecutionStageMask=checkpointExecutionStageMask)
+
+def VkCheckpointDataNV(sType=VK_STRUCTURE_TYPE_CHECKPOINT_DATA_NV,pNext=None,stage=None,pCheckpointMarker=None,):
+
+    return _new('VkCheckpointDataNV', sType=sType,pNext=pNext,stage=stage,pCheckpointMarker=pCheckpointMarker)
+
+def VkPhysicalDeviceRepresentativeFragmentTestFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_REPRESENTATIVE_FRAGMENT_TEST_FEATURES_NV,pNext=None,representativeFragmentTest=None,):
+
+    return _new('VkPhysicalDeviceRepresentativeFragmentTestFeaturesNV', sType=sType,pNext=pNext,representativeFragmentTest=representativeFragmentTest)
+
+def VkPipelineRepresentativeFragmentTestStateCreateInfoNV(sType=VK_STRUCTURE_TYPE_PIPELINE_REPRESENTATIVE_FRAGMENT_TEST_STATE_CREATE_INFO_NV,pNext=None,representativeFragmentTestEnable=None,):
+
+    return _new('VkPipelineRepresentativeFragmentTestStateCreateInfoNV', sType=sType,pNext=pNext,representativeFragmentTestEnable=representativeFragmentTestEnable)
+
+def VkPhysicalDeviceExclusiveScissorFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXCLUSIVE_SCISSOR_FEATURES_NV,pNext=None,exclusiveScissor=None,):
+
+    return _new('VkPhysicalDeviceExclusiveScissorFeaturesNV', sType=sType,pNext=pNext,exclusiveScissor=exclusiveScissor)
+
+def VkPipelineViewportExclusiveScissorStateCreateInfoNV(sType=VK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_EXCLUSIVE_SCISSOR_STATE_CREATE_INFO_NV,pNext=None,exclusiveScissorCount=None,pExclusiveScissors=None,):
+    if exclusiveScissorCount is None and pExclusiveScissors is not None:
+        exclusiveScissorCount = len(pExclusiveScissors)
+
+    return _new('VkPipelineViewportExclusiveScissorStateCreateInfoNV', sType=sType,pNext=pNext,exclusiveScissorCount=exclusiveScissorCount,pExclusiveScissors=pExclusiveScissors)
+
+def VkPhysicalDeviceCornerSampledImageFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CORNER_SAMPLED_IMAGE_FEATURES_NV,pNext=None,cornerSampledImage=None,):
+
+    return _new('VkPhysicalDeviceCornerSampledImageFeaturesNV', sType=sType,pNext=pNext,cornerSampledImage=cornerSampledImage)
+
+def VkPhysicalDeviceComputeShaderDerivativesFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COMPUTE_SHADER_DERIVATIVES_FEATURES_NV,pNext=None,computeDerivativeGroupQuads=None,computeDerivativeGroupLinear=None,):
+
+    return _new('VkPhysicalDeviceComputeShaderDerivativesFeaturesNV', sType=sType,pNext=pNext,computeDerivativeGroupQuads=computeDerivativeGroupQuads,computeDerivativeGroupLinear=computeDerivativeGroupLinear)
+
+def VkPhysicalDeviceShaderImageFootprintFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_IMAGE_FOOTPRINT_FEATURES_NV,pNext=None,imageFootprint=None,):
+
+    return _new('VkPhysicalDeviceShaderImageFootprintFeaturesNV', sType=sType,pNext=pNext,imageFootprint=imageFootprint)
+
+def VkPhysicalDeviceDedicatedAllocationImageAliasingFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEDICATED_ALLOCATION_IMAGE_ALIASING_FEATURES_NV,pNext=None,dedicatedAllocationImageAliasing=None,):
+
+    return _new('VkPhysicalDeviceDedicatedAllocationImageAliasingFeaturesNV', sType=sType,pNext=pNext,dedicatedAllocationImageAliasing=dedicatedAllocationImageAliasing)
+
+def VkPhysicalDeviceCopyMemoryIndirectFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COPY_MEMORY_INDIRECT_FEATURES_NV,pNext=None,indirectCopy=None,):
+
+    return _new('VkPhysicalDeviceCopyMemoryIndirectFeaturesNV', sType=sType,pNext=pNext,indirectCopy=indirectCopy)
+
+def VkPhysicalDeviceCopyMemoryIndirectPropertiesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COPY_MEMORY_INDIRECT_PROPERTIES_NV,pNext=None,supportedQueues=None,):
+
+    return _new('VkPhysicalDeviceCopyMemoryIndirectPropertiesNV', sType=sType,pNext=pNext,supportedQueues=supportedQueues)
+
+def VkPhysicalDeviceMemoryDecompressionFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MEMORY_DECOMPRESSION_FEATURES_NV,pNext=None,memoryDecompression=None,):
+
+    return _new('VkPhysicalDeviceMemoryDecompressionFeaturesNV', sType=sType,pNext=pNext,memoryDecompression=memoryDecompression)
+
+def VkPhysicalDeviceMemoryDecompressionPropertiesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MEMORY_DECOMPRESSION_PROPERTIES_NV,pNext=None,decompressionMethods=None,maxDecompressionIndirectCount=None,):
+
+    return _new('VkPhysicalDeviceMemoryDecompressionPropertiesNV', sType=sType,pNext=pNext,decompressionMethods=decompressionMethods,maxDecompressionIndirectCount=maxDecompressionIndirectCount)
+
+def VkShadingRatePaletteNV(shadingRatePaletteEntryCount=None,pShadingRatePaletteEntries=None,):
+    if shadingRatePaletteEntryCount is None and pShadingRatePaletteEntries is not None:
+        shadingRatePaletteEntryCount = len(pShadingRatePaletteEntries)
+
+    return _new('VkShadingRatePaletteNV', shadingRatePaletteEntryCount=shadingRatePaletteEntryCount,pShadingRatePaletteEntries=pShadingRatePaletteEntries)
+
+def VkPipelineViewportShadingRateImageStateCreateInfoNV(sType=VK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_SHADING_RATE_IMAGE_STATE_CREATE_INFO_NV,pNext=None,shadingRateImageEnable=None,viewportCount=None,pShadingRatePalettes=None,):
+    if viewportCount is None and pShadingRatePalettes is not None:
+        viewportCount = len(pShadingRatePalettes)
+
+    return _new('VkPipelineViewportShadingRateImageStateCreateInfoNV', sType=sType,pNext=pNext,shadingRateImageEnable=shadingRateImageEnable,viewportCount=viewportCount,pShadingRatePalettes=pShadingRatePalettes)
+
+def VkPhysicalDeviceShadingRateImageFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADING_RATE_IMAGE_FEATURES_NV,pNext=None,shadingRateImage=None,shadingRateCoarseSampleOrder=None,):
+
+    return _new('VkPhysicalDeviceShadingRateImageFeaturesNV', sType=sType,pNext=pNext,shadingRateImage=shadingRateImage,shadingRateCoarseSampleOrder=shadingRateCoarseSampleOrder)
+
+def VkPhysicalDeviceShadingRateImagePropertiesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADING_RATE_IMAGE_PROPERTIES_NV,pNext=None,shadingRateTexelSize=None,shadingRatePaletteSize=None,shadingRateMaxCoarseSamples=None,):
+
+    return _new('VkPhysicalDeviceShadingRateImagePropertiesNV', sType=sType,pNext=pNext,shadingRateTexelSize=shadingRateTexelSize,shadingRatePaletteSize=shadingRatePaletteSize,shadingRateMaxCoarseSamples=shadingRateMaxCoarseSamples)
+
+def VkCoarseSampleLocationNV(pixelX=None,pixelY=None,sample=None,):
+
+    return _new('VkCoarseSampleLocationNV', pixelX=pixelX,pixelY=pixelY,sample=sample)
+
+def VkCoarseSampleOrderCustomNV(shadingRate=None,sampleCount=None,sampleLocationCount=None,pSampleLocations=None,):
+    if sampleLocationCount is None and pSampleLocations is not None:
+        sampleLocationCount = len(pSampleLocations)
+
+    return _new('VkCoarseSampleOrderCustomNV', shadingRate=shadingRate,sampleCount=sampleCount,sampleLocationCount=sampleLocationCount,pSampleLocations=pSampleLocations)
+
+def VkPipelineViewportCoarseSampleOrderStateCreateInfoNV(sType=VK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_COARSE_SAMPLE_ORDER_STATE_CREATE_INFO_NV,pNext=None,sampleOrderType=None,customSampleOrderCount=None,pCustomSampleOrders=None,):
+    if customSampleOrderCount is None and pCustomSampleOrders is not None:
+        customSampleOrderCount = len(pCustomSampleOrders)
+
+    return _new('VkPipelineViewportCoarseSampleOrderStateCreateInfoNV', sType=sType,pNext=pNext,sampleOrderType=sampleOrderType,customSampleOrderCount=customSampleOrderCount,pCustomSampleOrders=pCustomSampleOrders)
+
+def VkPhysicalDeviceMeshShaderFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MESH_SHADER_FEATURES_NV,pNext=None,taskShader=None,meshShader=None,):
+
+    return _new('VkPhysicalDeviceMeshShaderFeaturesNV', sType=sType,pNext=pNext,taskShader=taskShader,meshShader=meshShader)
+
+def VkPhysicalDeviceMeshShaderPropertiesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MESH_SHADER_PROPERTIES_NV,pNext=None,maxDrawMeshTasksCount=None,maxTaskWorkGroupInvocations=None,maxTaskWorkGroupSize=None,maxTaskTotalMemorySize=None,maxTaskOutputCount=None,maxMeshWorkGroupInvocations=None,maxMeshWorkGroupSize=None,maxMeshTotalMemorySize=None,maxMeshOutputVertices=None,maxMeshOutputPrimitives=None,maxMeshMultiviewViewCount=None,meshOutputPerVertexGranularity=None,meshOutputPerPrimitiveGranularity=None,):
+
+    return _new('VkPhysicalDeviceMeshShaderPropertiesNV', sType=sType,pNext=pNext,maxDrawMeshTasksCount=maxDrawMeshTasksCount,maxTaskWorkGroupInvocations=maxTaskWorkGroupInvocations,maxTaskWorkGroupSize=maxTaskWorkGroupSize,maxTaskTotalMemorySize=maxTaskTotalMemorySize,maxTaskOutputCount=maxTaskOutputCount,maxMeshWorkGroupInvocations=maxMeshWorkGroupInvocations,maxMeshWorkGroupSize=maxMeshWorkGroupSize,maxMeshTotalMemorySize=maxMeshTotalMemorySize,maxMeshOutputVertices=maxMeshOutputVertices,maxMeshOutputPrimitives=maxMeshOutputPrimitives,maxMeshMultiviewViewCount=maxMeshMultiviewViewCount,meshOutputPerVertexGranularity=meshOutputPerVertexGranularity,meshOutputPerPrimitiveGranularity=meshOutputPerPrimitiveGranularity)
+
+def VkDrawMeshTasksIndirectCommandNV(taskCount=None,firstTask=None,):
+
+    return _new('VkDrawMeshTasksIndirectCommandNV', taskCount=taskCount,firstTask=firstTask)
+
+def VkRayTracingShaderGroupCreateInfoNV(sType=VK_STRUCTURE_TYPE_RAY_TRACING_SHADER_GROUP_CREATE_INFO_NV,pNext=None,type=None,generalShader=None,closestHitShader=None,anyHitShader=None,intersectionShader=None,):
+
+    return _new('VkRayTracingShaderGroupCreateInfoNV', sType=sType,pNext=pNext,type=type,generalShader=generalShader,closestHitShader=closestHitShader,anyHitShader=anyHitShader,intersectionShader=intersectionShader)
+
+def VkRayTracingPipelineCreateInfoNV(sType=VK_STRUCTURE_TYPE_RAY_TRACING_PIPELINE_CREATE_INFO_NV,pNext=None,flags=None,stageCount=None,pStages=None,groupCount=None,pGroups=None,maxRecursionDepth=None,layout=None,basePipelineHandle=None,basePipelineIndex=None,):
+    if stageCount is None and pStages is not None:
+        stageCount = len(pStages)
+    if groupCount is None and pGroups is not None:
+        groupCount = len(pGroups)
+
+    return _new('VkRayTracingPipelineCreateInfoNV', sType=sType,pNext=pNext,flags=flags,stageCount=stageCount,pStages=pStages,groupCount=groupCount,pGroups=pGroups,maxRecursionDepth=maxRecursionDepth,layout=layout,basePipelineHandle=basePipelineHandle,basePipelineIndex=basePipelineIndex)
+
+def VkGeometryTrianglesNV(sType=VK_STRUCTURE_TYPE_GEOMETRY_TRIANGLES_NV,pNext=None,vertexData=None,vertexOffset=None,vertexCount=None,vertexStride=None,vertexFormat=None,indexData=None,indexOffset=None,indexCount=None,indexType=None,transformData=None,transformOffset=None,):
+
+    return _new('VkGeometryTrianglesNV', sType=sType,pNext=pNext,vertexData=vertexData,vertexOffset=vertexOffset,vertexCount=vertexCount,vertexStride=vertexStride,vertexFormat=vertexFormat,indexData=indexData,indexOffset=indexOffset,indexCount=indexCount,indexType=indexType,transformData=transformData,transformOffset=transformOffset)
+
+def VkGeometryAABBNV(sType=VK_STRUCTURE_TYPE_GEOMETRY_AABB_NV,pNext=None,aabbData=None,numAABBs=None,stride=None,offset=None,):
+
+    return _new('VkGeometryAABBNV', sType=sType,pNext=pNext,aabbData=aabbData,numAABBs=numAABBs,stride=stride,offset=offset)
+
+def VkGeometryDataNV(triangles=None,aabbs=None,):
+
+    return _new('VkGeometryDataNV', triangles=triangles,aabbs=aabbs)
+
+def VkGeometryNV(sType=VK_STRUCTURE_TYPE_GEOMETRY_NV,pNext=None,geometryType=None,geometry=None,flags=None,):
+
+    return _new('VkGeometryNV', sType=sType,pNext=pNext,geometryType=geometryType,geometry=geometry,flags=flags)
+
+def VkAccelerationStructureInfoNV(sType=VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_INFO_NV,pNext=None,type=None,flags=None,instanceCount=None,geometryCount=None,pGeometries=None,):
+    if geometryCount is None and pGeometries is not None:
+        geometryCount = len(pGeometries)
+
+    return _new('VkAccelerationStructureInfoNV', sType=sType,pNext=pNext,type=type,flags=flags,instanceCount=instanceCount,geometryCount=geometryCount,pGeometries=pGeometries)
+
+def VkAccelerationStructureCreateInfoNV(sType=VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_CREATE_INFO_NV,pNext=None,compactedSize=None,info=None,):
+
+    return _new('VkAccelerationStructureCreateInfoNV', sType=sType,pNext=pNext,compactedSize=compactedSize,info=info)
+
+def VkBindAccelerationStructureMemoryInfoNV(sType=VK_STRUCTURE_TYPE_BIND_ACCELERATION_STRUCTURE_MEMORY_INFO_NV,pNext=None,accelerationStructure=None,memory=None,memoryOffset=None,deviceIndexCount=None,pDeviceIndices=None,):
+    if deviceIndexCount is None and pDeviceIndices is not None:
+        deviceIndexCount = len(pDeviceIndices)
+
+    return _new('VkBindAccelerationStructureMemoryInfoNV', sType=sType,pNext=pNext,accelerationStructure=accelerationStructure,memory=memory,memoryOffset=memoryOffset,deviceIndexCount=deviceIndexCount,pDeviceIndices=pDeviceIndices)
+
+def VkWriteDescriptorSetAccelerationStructureNV(sType=VK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET_ACCELERATION_STRUCTURE_NV,pNext=None,accelerationStructureCount=None,pAccelerationStructures=None,):
+    if accelerationStructureCount is None and pAccelerationStructures is not None:
+        accelerationStructureCount = len(pAccelerationStructures)
+
+    return _new('VkWriteDescriptorSetAccelerationStructureNV', sType=sType,pNext=pNext,accelerationStructureCount=accelerationStructureCount,pAccelerationStructures=pAccelerationStructures)
+
+def VkAccelerationStructureMemoryRequirementsInfoNV(sType=VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_MEMORY_REQUIREMENTS_INFO_NV,pNext=None,type=None,accelerationStructure=None,):
+
+    return _new('VkAccelerationStructureMemoryRequirementsInfoNV', sType=sType,pNext=pNext,type=type,accelerationStructure=accelerationStructure)
+
+def VkPhysicalDeviceRayTracingPropertiesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_PROPERTIES_NV,pNext=None,shaderGroupHandleSize=None,maxRecursionDepth=None,maxShaderGroupStride=None,shaderGroupBaseAlignment=None,maxGeometryCount=None,maxInstanceCount=None,maxTriangleCount=None,maxDescriptorSetAccelerationStructures=None,):
+
+    return _new('VkPhysicalDeviceRayTracingPropertiesNV', sType=sType,pNext=pNext,shaderGroupHandleSize=shaderGroupHandleSize,maxRecursionDepth=maxRecursionDepth,maxShaderGroupStride=maxShaderGroupStride,shaderGroupBaseAlignment=shaderGroupBaseAlignment,maxGeometryCount=maxGeometryCount,maxInstanceCount=maxInstanceCount,maxTriangleCount=maxTriangleCount,maxDescriptorSetAccelerationStructures=maxDescriptorSetAccelerationStructures)
+
+def VkPhysicalDeviceCooperativeMatrixFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COOPERATIVE_MATRIX_FEATURES_NV,pNext=None,cooperativeMatrix=None,cooperativeMatrixRobustBufferAccess=None,):
+
+    return _new('VkPhysicalDeviceCooperativeMatrixFeaturesNV', sType=sType,pNext=pNext,cooperativeMatrix=cooperativeMatrix,cooperativeMatrixRobustBufferAccess=cooperativeMatrixRobustBufferAccess)
+
+def VkPhysicalDeviceCooperativeMatrixPropertiesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COOPERATIVE_MATRIX_PROPERTIES_NV,pNext=None,cooperativeMatrixSupportedStages=None,):
+
+    return _new('VkPhysicalDeviceCooperativeMatrixPropertiesNV', sType=sType,pNext=pNext,cooperativeMatrixSupportedStages=cooperativeMatrixSupportedStages)
+
+def VkCooperativeMatrixPropertiesNV(sType=VK_STRUCTURE_TYPE_COOPERATIVE_MATRIX_PROPERTIES_NV,pNext=None,MSize=None,NSize=None,KSize=None,AType=None,BType=None,CType=None,DType=None,scope=None,):
+
+    return _new('VkCooperativeMatrixPropertiesNV', sType=sType,pNext=pNext,MSize=MSize,NSize=NSize,KSize=KSize,AType=AType,BType=BType,CType=CType,DType=DType,scope=scope)
+
+def VkPhysicalDevicePresentBarrierFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PRESENT_BARRIER_FEATURES_NV,pNext=None,presentBarrier=None,):
+
+    return _new('VkPhysicalDevicePresentBarrierFeaturesNV', sType=sType,pNext=pNext,presentBarrier=presentBarrier)
+
+def VkSurfaceCapabilitiesPresentBarrierNV(sType=VK_STRUCTURE_TYPE_SURFACE_CAPABILITIES_PRESENT_BARRIER_NV,pNext=None,presentBarrierSupported=None,):
+
+    return _new('VkSurfaceCapabilitiesPresentBarrierNV', sType=sType,pNext=pNext,presentBarrierSupported=presentBarrierSupported)
+
+def VkSwapchainPresentBarrierCreateInfoNV(sType=VK_STRUCTURE_TYPE_SWAPCHAIN_PRESENT_BARRIER_CREATE_INFO_NV,pNext=None,presentBarrierEnable=None,):
+
+    return _new('VkSwapchainPresentBarrierCreateInfoNV', sType=sType,pNext=pNext,presentBarrierEnable=presentBarrierEnable)
+
+def VkPhysicalDeviceCoverageReductionModeFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COVERAGE_REDUCTION_MODE_FEATURES_NV,pNext=None,coverageReductionMode=None,):
+
+    return _new('VkPhysicalDeviceCoverageReductionModeFeaturesNV', sType=sType,pNext=pNext,coverageReductionMode=coverageReductionMode)
+
+def VkPipelineCoverageReductionStateCreateInfoNV(sType=VK_STRUCTURE_TYPE_PIPELINE_COVERAGE_REDUCTION_STATE_CREATE_INFO_NV,pNext=None,flags=None,coverageReductionMode=None,):
+
+    return _new('VkPipelineCoverageReductionStateCreateInfoNV', sType=sType,pNext=pNext,flags=flags,coverageReductionMode=coverageReductionMode)
+
+def VkFramebufferMixedSamplesCombinationNV(sType=VK_STRUCTURE_TYPE_FRAMEBUFFER_MIXED_SAMPLES_COMBINATION_NV,pNext=None,coverageReductionMode=None,rasterizationSamples=None,depthStencilSamples=None,colorSamples=None,):
+
+    return _new('VkFramebufferMixedSamplesCombinationNV', sType=sType,pNext=pNext,coverageReductionMode=coverageReductionMode,rasterizationSamples=rasterizationSamples,depthStencilSamples=depthStencilSamples,colorSamples=colorSamples)
+
+def VkPhysicalDeviceShaderSMBuiltinsPropertiesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_SM_BUILTINS_PROPERTIES_NV,pNext=None,shaderSMCount=None,shaderWarpsPerSM=None,):
+
+    return _new('VkPhysicalDeviceShaderSMBuiltinsPropertiesNV', sType=sType,pNext=pNext,shaderSMCount=shaderSMCount,shaderWarpsPerSM=shaderWarpsPerSM)
+
+def VkPhysicalDeviceShaderSMBuiltinsFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_SM_BUILTINS_FEATURES_NV,pNext=None,shaderSMBuiltins=None,):
+
+    return _new('VkPhysicalDeviceShaderSMBuiltinsFeaturesNV', sType=sType,pNext=pNext,shaderSMBuiltins=shaderSMBuiltins)
+
+def VkPhysicalDeviceDiagnosticsConfigFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DIAGNOSTICS_CONFIG_FEATURES_NV,pNext=None,diagnosticsConfig=None,):
+
+    return _new('VkPhysicalDeviceDiagnosticsConfigFeaturesNV', sType=sType,pNext=pNext,diagnosticsConfig=diagnosticsConfig)
+
+def VkDeviceDiagnosticsConfigCreateInfoNV(sType=VK_STRUCTURE_TYPE_DEVICE_DIAGNOSTICS_CONFIG_CREATE_INFO_NV,pNext=None,flags=None,):
+
+    return _new('VkDeviceDiagnosticsConfigCreateInfoNV', sType=sType,pNext=pNext,flags=flags)
+
+def VkPhysicalDeviceFragmentShadingRateEnumsFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_ENUMS_FEATURES_NV,pNext=None,fragmentShadingRateEnums=None,supersampleFragmentShadingRates=None,noInvocationFragmentShadingRates=None,):
+
+    return _new('VkPhysicalDeviceFragmentShadingRateEnumsFeaturesNV', sType=sType,pNext=pNext,fragmentShadingRateEnums=fragmentShadingRateEnums,supersampleFragmentShadingRates=supersampleFragmentShadingRates,noInvocationFragmentShadingRates=noInvocationFragmentShadingRates)
+
+def VkPhysicalDeviceFragmentShadingRateEnumsPropertiesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_ENUMS_PROPERTIES_NV,pNext=None,maxFragmentShadingRateInvocationCount=None,):
+
+    return _new('VkPhysicalDeviceFragmentShadingRateEnumsPropertiesNV', sType=sType,pNext=pNext,maxFragmentShadingRateInvocationCount=maxFragmentShadingRateInvocationCount)
+
+def VkPipelineFragmentShadingRateEnumStateCreateInfoNV(sType=VK_STRUCTURE_TYPE_PIPELINE_FRAGMENT_SHADING_RATE_ENUM_STATE_CREATE_INFO_NV,pNext=None,shadingRateType=None,shadingRate=None,combinerOps=None,):
+
+    return _new('VkPipelineFragmentShadingRateEnumStateCreateInfoNV', sType=sType,pNext=pNext,shadingRateType=shadingRateType,shadingRate=shadingRate,combinerOps=combinerOps)
+
+def VkPhysicalDeviceExternalMemoryRDMAFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_MEMORY_RDMA_FEATURES_NV,pNext=None,externalMemoryRDMA=None,):
+
+    return _new('VkPhysicalDeviceExternalMemoryRDMAFeaturesNV', sType=sType,pNext=pNext,externalMemoryRDMA=externalMemoryRDMA)
+
+def VkPhysicalDeviceInheritedViewportScissorFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_INHERITED_VIEWPORT_SCISSOR_FEATURES_NV,pNext=None,inheritedViewportScissor2D=None,):
+
+    return _new('VkPhysicalDeviceInheritedViewportScissorFeaturesNV', sType=sType,pNext=pNext,inheritedViewportScissor2D=inheritedViewportScissor2D)
+
+def VkCommandBufferInheritanceViewportScissorInfoNV(sType=VK_STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_VIEWPORT_SCISSOR_INFO_NV,pNext=None,viewportScissor2D=None,viewportDepthCount=None,pViewportDepths=None,):
+
+    return _new('VkCommandBufferInheritanceViewportScissorInfoNV', sType=sType,pNext=pNext,viewportScissor2D=viewportScissor2D,viewportDepthCount=viewportDepthCount,pViewportDepths=pViewportDepths)
+
+def VkPhysicalDeviceRayTracingMotionBlurFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_MOTION_BLUR_FEATURES_NV,pNext=None,rayTracingMotionBlur=None,rayTracingMotionBlurPipelineTraceRaysIndirect=None,):
+
+    return _new('VkPhysicalDeviceRayTracingMotionBlurFeaturesNV', sType=sType,pNext=pNext,rayTracingMotionBlur=rayTracingMotionBlur,rayTracingMotionBlurPipelineTraceRaysIndirect=rayTracingMotionBlurPipelineTraceRaysIndirect)
+
+def VkAccelerationStructureGeometryMotionTrianglesDataNV(sType=VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_GEOMETRY_MOTION_TRIANGLES_DATA_NV,pNext=None,vertexData=None,):
+
+    return _new('VkAccelerationStructureGeometryMotionTrianglesDataNV', sType=sType,pNext=pNext,vertexData=vertexData)
+
+def VkAccelerationStructureMotionInfoNV(sType=VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_MOTION_INFO_NV,pNext=None,maxInstances=None,flags=None,):
+
+    return _new('VkAccelerationStructureMotionInfoNV', sType=sType,pNext=pNext,maxInstances=maxInstances,flags=flags)
+
+def VkSRTDataNV(sx=None,a=None,b=None,pvx=None,sy=None,c=None,pvy=None,sz=None,pvz=None,qx=None,qy=None,qz=None,qw=None,tx=None,ty=None,tz=None,):
+
+    return _new('VkSRTDataNV', sx=sx,a=a,b=b,pvx=pvx,sy=sy,c=c,pvy=pvy,sz=sz,pvz=pvz,qx=qx,qy=qy,qz=qz,qw=qw,tx=tx,ty=ty,tz=tz)
+
+def VkAccelerationStructureSRTMotionInstanceNV(transformT0=None,transformT1=None,instanceCustomIndex=None,mask=None,instanceShaderBindingTableRecordOffset=None,flags=None,accelerationStructureReference=None,):
+
+    return _new('VkAccelerationStructureSRTMotionInstanceNV', transformT0=transformT0,transformT1=transformT1,instanceCustomIndex=instanceCustomIndex,mask=mask,instanceShaderBindingTableRecordOffset=instanceShaderBindingTableRecordOffset,flags=flags,accelerationStructureReference=accelerationStructureReference)
+
+def VkAccelerationStructureMatrixMotionInstanceNV(transformT0=None,transformT1=None,instanceCustomIndex=None,mask=None,instanceShaderBindingTableRecordOffset=None,flags=None,accelerationStructureReference=None,):
+
+    return _new('VkAccelerationStructureMatrixMotionInstanceNV', transformT0=transformT0,transformT1=transformT1,instanceCustomIndex=instanceCustomIndex,mask=mask,instanceShaderBindingTableRecordOffset=instanceShaderBindingTableRecordOffset,flags=flags,accelerationStructureReference=accelerationStructureReference)
+
+def VkAccelerationStructureMotionInstanceDataNV(staticInstance=None,matrixMotionInstance=None,srtMotionInstance=None,):
+
+    return _new('VkAccelerationStructureMotionInstanceDataNV', staticInstance=staticInstance,matrixMotionInstance=matrixMotionInstance,srtMotionInstance=srtMotionInstance)
+
+def VkAccelerationStructureMotionInstanceNV(type=None,flags=None,data=None,):
+
+    return _new('VkAccelerationStructureMotionInstanceNV', type=type,flags=flags,data=data)
+
+def VkMemoryGetRemoteAddressInfoNV(sType=VK_STRUCTURE_TYPE_MEMORY_GET_REMOTE_ADDRESS_INFO_NV,pNext=None,memory=None,handleType=None,):
+
+    return _new('VkMemoryGetRemoteAddressInfoNV', sType=sType,pNext=pNext,memory=memory,handleType=handleType)
+
+def VkCudaModuleCreateInfoNV(sType=VK_STRUCTURE_TYPE_CUDA_MODULE_CREATE_INFO_NV,pNext=None,dataSize=None,pData=None,):
+    if dataSize is None and pData is not None:
+        dataSize = len(pData)
+
+    return _new('VkCudaModuleCreateInfoNV', sType=sType,pNext=pNext,dataSize=dataSize,pData=pData)
+
+def VkCudaFunctionCreateInfoNV(sType=VK_STRUCTURE_TYPE_CUDA_FUNCTION_CREATE_INFO_NV,pNext=None,module=None,pName=None,):
+
+    return _new('VkCudaFunctionCreateInfoNV', sType=sType,pNext=pNext,module=module,pName=pName)
+
+def VkCudaLaunchInfoNV(sType=VK_STRUCTURE_TYPE_CUDA_LAUNCH_INFO_NV,pNext=None,function=None,gridDimX=None,gridDimY=None,gridDimZ=None,blockDimX=None,blockDimY=None,blockDimZ=None,sharedMemBytes=None,paramCount=None,pParams=None,extraCount=None,pExtras=None,):
+    if paramCount is None and pParams is not None:
+        paramCount = len(pParams)
+    if extraCount is None and pExtras is not None:
+        extraCount = len(pExtras)
+
+    return _new('VkCudaLaunchInfoNV', sType=sType,pNext=pNext,function=function,gridDimX=gridDimX,gridDimY=gridDimY,gridDimZ=gridDimZ,blockDimX=blockDimX,blockDimY=blockDimY,blockDimZ=blockDimZ,sharedMemBytes=sharedMemBytes,paramCount=paramCount,pParams=pParams,extraCount=extraCount,pExtras=pExtras)
+
+def VkPhysicalDeviceLinearColorAttachmentFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_LINEAR_COLOR_ATTACHMENT_FEATURES_NV,pNext=None,linearColorAttachment=None,):
+
+    return _new('VkPhysicalDeviceLinearColorAttachmentFeaturesNV', sType=sType,pNext=pNext,linearColorAttachment=linearColorAttachment)
+
+def VkPhysicalDeviceDisplacementMicromapFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DISPLACEMENT_MICROMAP_FEATURES_NV,pNext=None,displacementMicromap=None,):
+
+    return _new('VkPhysicalDeviceDisplacementMicromapFeaturesNV', sType=sType,pNext=pNext,displacementMicromap=displacementMicromap)
+
+def VkPhysicalDeviceDisplacementMicromapPropertiesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DISPLACEMENT_MICROMAP_PROPERTIES_NV,pNext=None,maxDisplacementMicromapSubdivisionLevel=None,):
+
+    return _new('VkPhysicalDeviceDisplacementMicromapPropertiesNV', sType=sType,pNext=pNext,maxDisplacementMicromapSubdivisionLevel=maxDisplacementMicromapSubdivisionLevel)
+
+def VkAccelerationStructureTrianglesDisplacementMicromapNV(sType=VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_TRIANGLES_DISPLACEMENT_MICROMAP_NV,pNext=None,displacementBiasAndScaleFormat=None,displacementVectorFormat=None,displacementBiasAndScaleBuffer=None,displacementBiasAndScaleStride=None,displacementVectorBuffer=None,displacementVectorStride=None,displacedMicromapPrimitiveFlags=None,displacedMicromapPrimitiveFlagsStride=None,indexType=None,indexBuffer=None,indexStride=None,baseTriangle=None,usageCountsCount=None,pUsageCounts=None,ppUsageCounts=None,micromap=None,):
+    if usageCountsCount is None and pUsageCounts is not None:
+        usageCountsCount = len(pUsageCounts)
+    if usageCountsCount is None and ppUsageCounts is not None:
+        usageCountsCount = len(ppUsageCounts)
+
+    return _new('VkAccelerationStructureTrianglesDisplacementMicromapNV', sType=sType,pNext=pNext,displacementBiasAndScaleFormat=displacementBiasAndScaleFormat,displacementVectorFormat=displacementVectorFormat,displacementBiasAndScaleBuffer=displacementBiasAndScaleBuffer,displacementBiasAndScaleStride=displacementBiasAndScaleStride,displacementVectorBuffer=displacementVectorBuffer,displacementVectorStride=displacementVectorStride,displacedMicromapPrimitiveFlags=displacedMicromapPrimitiveFlags,displacedMicromapPrimitiveFlagsStride=displacedMicromapPrimitiveFlagsStride,indexType=indexType,indexBuffer=indexBuffer,indexStride=indexStride,baseTriangle=baseTriangle,usageCountsCount=usageCountsCount,pUsageCounts=pUsageCounts,ppUsageCounts=ppUsageCounts,micromap=micromap)
+
+def VkPhysicalDeviceOpticalFlowFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_OPTICAL_FLOW_FEATURES_NV,pNext=None,opticalFlow=None,):
+
+    return _new('VkPhysicalDeviceOpticalFlowFeaturesNV', sType=sType,pNext=pNext,opticalFlow=opticalFlow)
+
+def VkPhysicalDeviceOpticalFlowPropertiesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_OPTICAL_FLOW_PROPERTIES_NV,pNext=None,supportedOutputGridSizes=None,supportedHintGridSizes=None,hintSupported=None,costSupported=None,bidirectionalFlowSupported=None,globalFlowSupported=None,minWidth=None,minHeight=None,maxWidth=None,maxHeight=None,maxNumRegionsOfInterest=None,):
+
+    return _new('VkPhysicalDeviceOpticalFlowPropertiesNV', sType=sType,pNext=pNext,supportedOutputGridSizes=supportedOutputGridSizes,supportedHintGridSizes=supportedHintGridSizes,hintSupported=hintSupported,costSupported=costSupported,bidirectionalFlowSupported=bidirectionalFlowSupported,globalFlowSupported=globalFlowSupported,minWidth=minWidth,minHeight=minHeight,maxWidth=maxWidth,maxHeight=maxHeight,maxNumRegionsOfInterest=maxNumRegionsOfInterest)
+
+def VkOpticalFlowImageFormatInfoNV(sType=VK_STRUCTURE_TYPE_OPTICAL_FLOW_IMAGE_FORMAT_INFO_NV,pNext=None,usage=None,):
+
+    return _new('VkOpticalFlowImageFormatInfoNV', sType=sType,pNext=pNext,usage=usage)
+
+def VkOpticalFlowImageFormatPropertiesNV(sType=VK_STRUCTURE_TYPE_OPTICAL_FLOW_IMAGE_FORMAT_PROPERTIES_NV,pNext=None,format=None,):
+
+    return _new('VkOpticalFlowImageFormatPropertiesNV', sType=sType,pNext=pNext,format=format)
+
+def VkOpticalFlowSessionCreateInfoNV(sType=VK_STRUCTURE_TYPE_OPTICAL_FLOW_SESSION_CREATE_INFO_NV,pNext=None,width=None,height=None,imageFormat=None,flowVectorFormat=None,costFormat=None,outputGridSize=None,hintGridSize=None,performanceLevel=None,flags=None,):
+
+    return _new('VkOpticalFlowSessionCreateInfoNV', sType=sType,pNext=pNext,width=width,height=height,imageFormat=imageFormat,flowVectorFormat=flowVectorFormat,costFormat=costFormat,outputGridSize=outputGridSize,hintGridSize=hintGridSize,performanceLevel=performanceLevel,flags=flags)
+
+def VkOpticalFlowSessionCreatePrivateDataInfoNV(sType=VK_STRUCTURE_TYPE_OPTICAL_FLOW_SESSION_CREATE_PRIVATE_DATA_INFO_NV,pNext=None,id=None,size=None,pPrivateData=None,):
+
+    return _new('VkOpticalFlowSessionCreatePrivateDataInfoNV', sType=sType,pNext=pNext,id=id,size=size,pPrivateData=pPrivateData)
+
+def VkOpticalFlowExecuteInfoNV(sType=VK_STRUCTURE_TYPE_OPTICAL_FLOW_EXECUTE_INFO_NV,pNext=None,flags=None,regionCount=None,pRegions=None,):
+    if regionCount is None and pRegions is not None:
+        regionCount = len(pRegions)
+
+    return _new('VkOpticalFlowExecuteInfoNV', sType=sType,pNext=pNext,flags=flags,regionCount=regionCount,pRegions=pRegions)
+
+def VkDecompressMemoryRegionNV(srcAddress=None,dstAddress=None,compressedSize=None,decompressedSize=None,decompressionMethod=None,):
+
+    return _new('VkDecompressMemoryRegionNV', srcAddress=srcAddress,dstAddress=dstAddress,compressedSize=compressedSize,decompressedSize=decompressedSize,decompressionMethod=decompressionMethod)
+
+def VkPhysicalDeviceRayTracingInvocationReorderFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_INVOCATION_REORDER_FEATURES_NV,pNext=None,rayTracingInvocationReorder=None,):
+
+    return _new('VkPhysicalDeviceRayTracingInvocationReorderFeaturesNV', sType=sType,pNext=pNext,rayTracingInvocationReorder=rayTracingInvocationReorder)
+
+def VkPhysicalDeviceRayTracingInvocationReorderPropertiesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_INVOCATION_REORDER_PROPERTIES_NV,pNext=None,rayTracingInvocationReorderReorderingHint=None,):
+
+    return _new('VkPhysicalDeviceRayTracingInvocationReorderPropertiesNV', sType=sType,pNext=pNext,rayTracingInvocationReorderReorderingHint=rayTracingInvocationReorderReorderingHint)
+
+def VkPhysicalDeviceExtendedSparseAddressSpaceFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTENDED_SPARSE_ADDRESS_SPACE_FEATURES_NV,pNext=None,extendedSparseAddressSpace=None,):
+
+    return _new('VkPhysicalDeviceExtendedSparseAddressSpaceFeaturesNV', sType=sType,pNext=pNext,extendedSparseAddressSpace=extendedSparseAddressSpace)
+
+def VkPhysicalDeviceExtendedSparseAddressSpacePropertiesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTENDED_SPARSE_ADDRESS_SPACE_PROPERTIES_NV,pNext=None,extendedSparseAddressSpaceSize=None,extendedSparseImageUsageFlags=None,extendedSparseBufferUsageFlags=None,):
+
+    return _new('VkPhysicalDeviceExtendedSparseAddressSpacePropertiesNV', sType=sType,pNext=pNext,extendedSparseAddressSpaceSize=extendedSparseAddressSpaceSize,extendedSparseImageUsageFlags=extendedSparseImageUsageFlags,extendedSparseBufferUsageFlags=extendedSparseBufferUsageFlags)
+
+def VkQueryLowLatencySupportNV(sType=VK_STRUCTURE_TYPE_QUERY_LOW_LATENCY_SUPPORT_NV,pNext=None,pQueriedLowLatencyData=None,):
+
+    return _new('VkQueryLowLatencySupportNV', sType=sType,pNext=pNext,pQueriedLowLatencyData=pQueriedLowLatencyData)
+
+def VkPhysicalDeviceDescriptorPoolOverallocationFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_POOL_OVERALLOCATION_FEATURES_NV,pNext=None,descriptorPoolOverallocation=None,):
+
+    return _new('VkPhysicalDeviceDescriptorPoolOverallocationFeaturesNV', sType=sType,pNext=pNext,descriptorPoolOverallocation=descriptorPoolOverallocation)
+
+def VkPhysicalDevicePerStageDescriptorSetFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PER_STAGE_DESCRIPTOR_SET_FEATURES_NV,pNext=None,perStageDescriptorSet=None,dynamicPipelineLayout=None,):
+
+    return _new('VkPhysicalDevicePerStageDescriptorSetFeaturesNV', sType=sType,pNext=pNext,perStageDescriptorSet=perStageDescriptorSet,dynamicPipelineLayout=dynamicPipelineLayout)
+
+def VkLatencySleepModeInfoNV(sType=VK_STRUCTURE_TYPE_LATENCY_SLEEP_MODE_INFO_NV,pNext=None,lowLatencyMode=None,lowLatencyBoost=None,minimumIntervalUs=None,):
+
+    return _new('VkLatencySleepModeInfoNV', sType=sType,pNext=pNext,lowLatencyMode=lowLatencyMode,lowLatencyBoost=lowLatencyBoost,minimumIntervalUs=minimumIntervalUs)
+
+def VkLatencySleepInfoNV(sType=VK_STRUCTURE_TYPE_LATENCY_SLEEP_INFO_NV,pNext=None,signalSemaphore=None,value=None,):
+
+    return _new('VkLatencySleepInfoNV', sType=sType,pNext=pNext,signalSemaphore=signalSemaphore,value=value)
+
+def VkSetLatencyMarkerInfoNV(sType=VK_STRUCTURE_TYPE_SET_LATENCY_MARKER_INFO_NV,pNext=None,presentID=None,marker=None,):
+
+    return _new('VkSetLatencyMarkerInfoNV', sType=sType,pNext=pNext,presentID=presentID,marker=marker)
+
+def VkGetLatencyMarkerInfoNV(sType=VK_STRUCTURE_TYPE_GET_LATENCY_MARKER_INFO_NV,pNext=None,timingCount=None,pTimings=None,):
+    if timingCount is None and pTimings is not None:
+        timingCount = len(pTimings)
+
+    return _new('VkGetLatencyMarkerInfoNV', sType=sType,pNext=pNext,timingCount=timingCount,pTimings=pTimings)
+
+def VkLatencyTimingsFrameReportNV(sType=VK_STRUCTURE_TYPE_LATENCY_TIMINGS_FRAME_REPORT_NV,pNext=None,presentID=None,inputSampleTimeUs=None,simStartTimeUs=None,simEndTimeUs=None,renderSubmitStartTimeUs=None,renderSubmitEndTimeUs=None,presentStartTimeUs=None,presentEndTimeUs=None,driverStartTimeUs=None,driverEndTimeUs=None,osRenderQueueStartTimeUs=None,osRenderQueueEndTimeUs=None,gpuRenderStartTimeUs=None,gpuRenderEndTimeUs=None,):
+
+    return _new('VkLatencyTimingsFrameReportNV', sType=sType,pNext=pNext,presentID=presentID,inputSampleTimeUs=inputSampleTimeUs,simStartTimeUs=simStartTimeUs,simEndTimeUs=simEndTimeUs,renderSubmitStartTimeUs=renderSubmitStartTimeUs,renderSubmitEndTimeUs=renderSubmitEndTimeUs,presentStartTimeUs=presentStartTimeUs,presentEndTimeUs=presentEndTimeUs,driverStartTimeUs=driverStartTimeUs,driverEndTimeUs=driverEndTimeUs,osRenderQueueStartTimeUs=osRenderQueueStartTimeUs,osRenderQueueEndTimeUs=osRenderQueueEndTimeUs,gpuRenderStartTimeUs=gpuRenderStartTimeUs,gpuRenderEndTimeUs=gpuRenderEndTimeUs)
+
+def VkOutOfBandQueueTypeInfoNV(sType=VK_STRUCTURE_TYPE_OUT_OF_BAND_QUEUE_TYPE_INFO_NV,pNext=None,queueType=None,):
+
+    return _new('VkOutOfBandQueueTypeInfoNV', sType=sType,pNext=pNext,queueType=queueType)
+
+def VkLatencySubmissionPresentIdNV(sType=VK_STRUCTURE_TYPE_LATENCY_SUBMISSION_PRESENT_ID_NV,pNext=None,presentID=None,):
+
+    return _new('VkLatencySubmissionPresentIdNV', sType=sType,pNext=pNext,presentID=presentID)
+
+def VkSwapchainLatencyCreateInfoNV(sType=VK_STRUCTURE_TYPE_SWAPCHAIN_LATENCY_CREATE_INFO_NV,pNext=None,latencyModeEnable=None,):
+
+    return _new('VkSwapchainLatencyCreateInfoNV', sType=sType,pNext=pNext,latencyModeEnable=latencyModeEnable)
+
+def VkLatencySurfaceCapabilitiesNV(sType=VK_STRUCTURE_TYPE_LATENCY_SURFACE_CAPABILITIES_NV,pNext=None,presentModeCount=None,pPresentModes=None,):
+    if presentModeCount is None and pPresentModes is not None:
+        presentModeCount = len(pPresentModes)
+
+    return _new('VkLatencySurfaceCapabilitiesNV', sType=sType,pNext=pNext,presentModeCount=presentModeCount,pPresentModes=pPresentModes)
+
+def VkPhysicalDeviceCudaKernelLaunchFeaturesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CUDA_KERNEL_LAUNCH_FEATURES_NV,pNext=None,cudaKernelLaunchFeatures=None,):
+
+    return _new('VkPhysicalDeviceCudaKernelLaunchFeaturesNV', sType=sType,pNext=pNext,cudaKernelLaunchFeatures=cudaKernelLaunchFeatures)
+
+def VkPhysicalDeviceCudaKernelLaunchPropertiesNV(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CUDA_KERNEL_LAUNCH_PROPERTIES_NV,pNext=None,computeCapabilityMinor=None,computeCapabilityMajor=None,):
+
+    return _new('VkPhysicalDeviceCudaKernelLaunchPropertiesNV', sType=sType,pNext=pNext,computeCapabilityMinor=computeCapabilityMinor,computeCapabilityMajor=computeCapabilityMajor)
+
+
+
+
+
+
+
+
+
+
+def _wrap_vkCmdUpdatePipelineIndirectBufferNV(fn):
+    def vkCmdUpdatePipelineIndirectBufferNV(
+    commandBuffer
+            ,pipelineBindPoint
+            ,pipeline
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),pipelineBindPoint,_handle(pipeline, 'VkPipeline'))
+
+
+    return vkCmdUpdatePipelineIndirectBufferNV
+def _wrap_vkCmdCopyMemoryIndirectNV(fn):
+    def vkCmdCopyMemoryIndirectNV(
+    commandBuffer
+            ,copyBufferAddress
+            ,copyCount
+            ,stride
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),copyBufferAddress,copyCount,stride)
+
+
+    return vkCmdCopyMemoryIndirectNV
+def _wrap_vkCmdCopyMemoryToImageIndirectNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdCopyMemoryToImageIndirectNV(
+    commandBuffer
+            ,copyBufferAddress
+            ,copyCount
+            ,stride
+            ,dstImage
+            ,dstImageLayout
+            ,pImageSubresources
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),copyBufferAddress,copyCount,stride,_handle(dstImage, 'VkImage'),dstImageLayout,_auto_handle(pImageSubresources, _args[6]))
+
+
+    return vkCmdCopyMemoryToImageIndirectNV
+def _wrap_vkGetPhysicalDeviceExternalImageFormatPropertiesNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceExternalImageFormatPropertiesNV(
+    physicalDevice
+            ,format
+            ,type
+            ,tiling
+            ,usage
+            ,flags
+            ,externalHandleType
+            ,pExternalImageFormatProperties=None
+            ,):
+
+
+        custom_return = True
+        if not pExternalImageFormatProperties:
+            pExternalImageFormatProperties = ffi.new('VkExternalImageFormatPropertiesNV*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),format,type,tiling,usage,flags,externalHandleType,_auto_handle(pExternalImageFormatProperties, _args[7]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pExternalImageFormatProperties
+
+        return pExternalImageFormatProperties[0]
+
+
+
+    return vkGetPhysicalDeviceExternalImageFormatPropertiesNV
+def _wrap_vkGetMemoryWin32HandleNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetMemoryWin32HandleNV(
+    device
+            ,memory
+            ,handleType
+            ,pHandle=None
+            ,):
+
+
+        custom_return = True
+        if not pHandle:
+            pHandle = ffi.new('HANDLE*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(memory, 'VkDeviceMemory'),handleType,_auto_handle(pHandle, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pHandle
+
+        return pHandle[0]
+
+
+
+    return vkGetMemoryWin32HandleNV
+def _wrap_vkCmdExecuteGeneratedCommandsNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdExecuteGeneratedCommandsNV(
+    commandBuffer
+            ,isPreprocessed
+            ,pGeneratedCommandsInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),isPreprocessed,_auto_handle(pGeneratedCommandsInfo, _args[2]))
+
+
+    return vkCmdExecuteGeneratedCommandsNV
+def _wrap_vkCmdPreprocessGeneratedCommandsNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdPreprocessGeneratedCommandsNV(
+    commandBuffer
+            ,pGeneratedCommandsInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pGeneratedCommandsInfo, _args[1]))
+
+
+    return vkCmdPreprocessGeneratedCommandsNV
+def _wrap_vkCmdBindPipelineShaderGroupNV(fn):
+    def vkCmdBindPipelineShaderGroupNV(
+    commandBuffer
+            ,pipelineBindPoint
+            ,pipeline
+            ,groupIndex
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),pipelineBindPoint,_handle(pipeline, 'VkPipeline'),groupIndex)
+
+
+    return vkCmdBindPipelineShaderGroupNV
+def _wrap_vkGetGeneratedCommandsMemoryRequirementsNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetGeneratedCommandsMemoryRequirementsNV(
+    device
+            ,pInfo
+            ,pMemoryRequirements=None
+            ,):
+
+
+        custom_return = True
+        if not pMemoryRequirements:
+            pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),_auto_handle(pMemoryRequirements, _args[2]))
+
+        if custom_return:
+            return pMemoryRequirements
+
+        return pMemoryRequirements[0]
+
+
+
+    return vkGetGeneratedCommandsMemoryRequirementsNV
+def _wrap_vkCreateIndirectCommandsLayoutNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateIndirectCommandsLayoutNV(
+    device
+            ,pCreateInfo
+            ,pAllocator
+            ,pIndirectCommandsLayout=None
+            ,):
+
+
+        custom_return = True
+        if not pIndirectCommandsLayout:
+            pIndirectCommandsLayout = ffi.new('VkIndirectCommandsLayoutNV*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pIndirectCommandsLayout, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pIndirectCommandsLayout
+
+        return pIndirectCommandsLayout[0]
+
+
+
+    return vkCreateIndirectCommandsLayoutNV
+def _wrap_vkDestroyIndirectCommandsLayoutNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkDestroyIndirectCommandsLayoutNV(
+    device
+            ,indirectCommandsLayout
+            ,pAllocator
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(indirectCommandsLayout, 'VkIndirectCommandsLayoutNV'),_auto_handle(pAllocator, _args[2]))
+
+
+    return vkDestroyIndirectCommandsLayoutNV
+def _wrap_vkGetMemoryRemoteAddressNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetMemoryRemoteAddressNV(
+    device
+            ,pMemoryGetRemoteAddressInfo
+            ,pAddress=None
+            ,):
+
+
+        custom_return = True
+        if not pAddress:
+            pAddress = ffi.new('VkRemoteAddressNV*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pMemoryGetRemoteAddressInfo, _args[1]),_auto_handle(pAddress, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pAddress
+
+        return pAddress[0]
+
+
+
+    return vkGetMemoryRemoteAddressNV
+def _wrap_vkGetMemorySciBufNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetMemorySciBufNV(
+    device
+            ,pGetSciBufInfo
+            ,pHandle=None
+            ,):
+
+
+        custom_return = True
+        if not pHandle:
+            pHandle = ffi.new('NvSciBufObj*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pGetSciBufInfo, _args[1]),_auto_handle(pHandle, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pHandle
+
+        return pHandle[0]
+
+
+
+    return vkGetMemorySciBufNV
+def _wrap_vkGetPhysicalDeviceExternalMemorySciBufPropertiesNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceExternalMemorySciBufPropertiesNV(
+    physicalDevice
+            ,handleType
+            ,handle
+            ,pMemorySciBufProperties=None
+            ,):
+
+
+        custom_return = True
+        if not pMemorySciBufProperties:
+            pMemorySciBufProperties = ffi.new('VkMemorySciBufPropertiesNV*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),handleType,_auto_handle(handle, _args[2]),_auto_handle(pMemorySciBufProperties, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pMemorySciBufProperties
+
+        return pMemorySciBufProperties[0]
+
+
+
+    return vkGetPhysicalDeviceExternalMemorySciBufPropertiesNV
+def _wrap_vkGetPhysicalDeviceSciBufAttributesNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceSciBufAttributesNV(
+    physicalDevice
+            ,pAttributes=None
+            ,):
+
+
+        custom_return = True
+        if not pAttributes:
+            pAttributes = ffi.new('NvSciBufAttrList*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pAttributes, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pAttributes
+
+        return pAttributes[0]
+
+
+
+    return vkGetPhysicalDeviceSciBufAttributesNV
+def _wrap_vkGetFenceSciSyncFenceNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetFenceSciSyncFenceNV(
+    device
+            ,pGetSciSyncHandleInfo
+            ,pHandle=None
+            ,):
+
+
+        custom_return = True
+        if not pHandle:
+            pHandle = ffi.new('void*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pGetSciSyncHandleInfo, _args[1]),_auto_handle(pHandle, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pHandle
+
+        return pHandle[0]
+
+
+
+    return vkGetFenceSciSyncFenceNV
+def _wrap_vkGetFenceSciSyncObjNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetFenceSciSyncObjNV(
+    device
+            ,pGetSciSyncHandleInfo
+            ,pHandle=None
+            ,):
+
+
+        custom_return = True
+        if not pHandle:
+            pHandle = ffi.new('void*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pGetSciSyncHandleInfo, _args[1]),_auto_handle(pHandle, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pHandle
+
+        return pHandle[0]
+
+
+
+    return vkGetFenceSciSyncObjNV
+def _wrap_vkImportFenceSciSyncFenceNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkImportFenceSciSyncFenceNV(
+    device
+            ,pImportFenceSciSyncInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pImportFenceSciSyncInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkImportFenceSciSyncFenceNV
+def _wrap_vkImportFenceSciSyncObjNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkImportFenceSciSyncObjNV(
+    device
+            ,pImportFenceSciSyncInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pImportFenceSciSyncInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkImportFenceSciSyncObjNV
+def _wrap_vkGetSemaphoreSciSyncObjNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetSemaphoreSciSyncObjNV(
+    device
+            ,pGetSciSyncInfo
+            ,pHandle=None
+            ,):
+
+
+        custom_return = True
+        if not pHandle:
+            pHandle = ffi.new('void*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pGetSciSyncInfo, _args[1]),_auto_handle(pHandle, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pHandle
+
+        return pHandle[0]
+
+
+
+    return vkGetSemaphoreSciSyncObjNV
+def _wrap_vkImportSemaphoreSciSyncObjNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkImportSemaphoreSciSyncObjNV(
+    device
+            ,pImportSemaphoreSciSyncInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pImportSemaphoreSciSyncInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkImportSemaphoreSciSyncObjNV
+def _wrap_vkGetPhysicalDeviceSciSyncAttributesNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceSciSyncAttributesNV(
+    physicalDevice
+            ,pSciSyncAttributesInfo
+            ,pAttributes=None
+            ,):
+
+
+        custom_return = True
+        if not pAttributes:
+            pAttributes = ffi.new('NvSciSyncAttrList*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pSciSyncAttributesInfo, _args[1]),_auto_handle(pAttributes, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pAttributes
+
+        return pAttributes[0]
+
+
+
+    return vkGetPhysicalDeviceSciSyncAttributesNV
+def _wrap_vkCreateSemaphoreSciSyncPoolNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateSemaphoreSciSyncPoolNV(
+    device
+            ,pCreateInfo
+            ,pAllocator
+            ,pSemaphorePool=None
+            ,):
+
+
+        custom_return = True
+        if not pSemaphorePool:
+            pSemaphorePool = ffi.new('VkSemaphoreSciSyncPoolNV*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pSemaphorePool, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSemaphorePool
+
+        return pSemaphorePool[0]
+
+
+
+    return vkCreateSemaphoreSciSyncPoolNV
+def _wrap_vkDestroySemaphoreSciSyncPoolNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkDestroySemaphoreSciSyncPoolNV(
+    device
+            ,semaphorePool
+            ,pAllocator
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(semaphorePool, 'VkSemaphoreSciSyncPoolNV'),_auto_handle(pAllocator, _args[2]))
+
+
+    return vkDestroySemaphoreSciSyncPoolNV
+def _wrap_vkAcquireWinrtDisplayNV(fn):
+    def vkAcquireWinrtDisplayNV(
+    physicalDevice
+            ,display=None
+            ,):
+
+
+        custom_return = True
+        if not display:
+            display = ffi.new('VkDisplayKHR*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_handle(display, 'VkDisplayKHR'))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return display
+
+        return display[0]
+
+
+
+    return vkAcquireWinrtDisplayNV
+def _wrap_vkGetWinrtDisplayNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetWinrtDisplayNV(
+    physicalDevice
+            ,deviceRelativeId
+            ,pDisplay=None
+            ,):
+
+
+        custom_return = True
+        if not pDisplay:
+            pDisplay = ffi.new('VkDisplayKHR*')
+            custom_return = False
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),deviceRelativeId,_auto_handle(pDisplay, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pDisplay
+
+        return pDisplay[0]
+
+
+
+    return vkGetWinrtDisplayNV
+def _wrap_vkCmdSetViewportWScalingNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetViewportWScalingNV(
+    commandBuffer
+            ,firstViewport
+            ,viewportCount
+            ,pViewportWScalings
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),firstViewport,viewportCount,_auto_handle(pViewportWScalings, _args[3]))
+
+
+    return vkCmdSetViewportWScalingNV
+def _wrap_vkCmdSetCheckpointNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetCheckpointNV(
+    commandBuffer
+            ,pCheckpointMarker
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pCheckpointMarker, _args[1]))
+
+
+    return vkCmdSetCheckpointNV
+def _wrap_vkGetQueueCheckpointDataNV(fn):
+    def vkGetQueueCheckpointDataNV(
+    queue
+            ,pCheckpointData=None
+            ,):
+
+
+        pCheckpointDataCount = ffi.new('uint32_t*')
+        custom_return = pCheckpointData is not None
+        _array = pCheckpointData
+
+        pCheckpointData = ffi.NULL
+        fn(_handle(queue, 'VkQueue'),pCheckpointDataCount,pCheckpointData)
+
+        if _array is None or len(_array) < pCheckpointDataCount[0]:
+            _array = ffi.new('VkCheckpointDataNV[]', pCheckpointDataCount[0])
+        pCheckpointData = _array
+        fn(_handle(queue, 'VkQueue'),pCheckpointDataCount,pCheckpointData)
+
+        if pCheckpointDataCount[0] != len(_array):
+            pCheckpointData = _slice(_array, pCheckpointDataCount[0])
+
+        return pCheckpointData
+
+
+    return vkGetQueueCheckpointDataNV
+def _wrap_vkCmdSetExclusiveScissorNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetExclusiveScissorNV(
+    commandBuffer
+            ,firstExclusiveScissor
+            ,exclusiveScissorCount
+            ,pExclusiveScissors
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),firstExclusiveScissor,exclusiveScissorCount,_auto_handle(pExclusiveScissors, _args[3]))
+
+
+    return vkCmdSetExclusiveScissorNV
+def _wrap_vkCmdSetExclusiveScissorEnableNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetExclusiveScissorEnableNV(
+    commandBuffer
+            ,firstExclusiveScissor
+            ,exclusiveScissorCount
+            ,pExclusiveScissorEnables
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),firstExclusiveScissor,exclusiveScissorCount,_auto_handle(pExclusiveScissorEnables, _args[3]))
+
+
+    return vkCmdSetExclusiveScissorEnableNV
+def _wrap_vkCmdBindShadingRateImageNV(fn):
+    def vkCmdBindShadingRateImageNV(
+    commandBuffer
+            ,imageView
+            ,imageLayout
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_handle(imageView, 'VkImageView'),imageLayout)
+
+
+    return vkCmdBindShadingRateImageNV
+def _wrap_vkCmdSetViewportShadingRatePaletteNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetViewportShadingRatePaletteNV(
+    commandBuffer
+            ,firstViewport
+            ,viewportCount
+            ,pShadingRatePalettes
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),firstViewport,viewportCount,_auto_handle(pShadingRatePalettes, _args[3]))
+
+
+    return vkCmdSetViewportShadingRatePaletteNV
+def _wrap_vkCmdSetCoarseSampleOrderNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetCoarseSampleOrderNV(
+    commandBuffer
+            ,sampleOrderType
+            ,customSampleOrderCount
+            ,pCustomSampleOrders
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),sampleOrderType,customSampleOrderCount,_auto_handle(pCustomSampleOrders, _args[3]))
+
+
+    return vkCmdSetCoarseSampleOrderNV
+def _wrap_vkCmdDrawMeshTasksNV(fn):
+    def vkCmdDrawMeshTasksNV(
+    commandBuffer
+            ,taskCount
+            ,firstTask
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),taskCount,firstTask)
+
+
+    return vkCmdDrawMeshTasksNV
+def _wrap_vkCmdDrawMeshTasksIndirectNV(fn):
+    def vkCmdDrawMeshTasksIndirectNV(
+    commandBuffer
+            ,buffer
+            ,offset
+            ,drawCount
+            ,stride
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_handle(buffer, 'VkBuffer'),offset,drawCount,stride)
+
+
+    return vkCmdDrawMeshTasksIndirectNV
+def _wrap_vkCmdDrawMeshTasksIndirectCountNV(fn):
+    def vkCmdDrawMeshTasksIndirectCountNV(
+    commandBuffer
+            ,buffer
+            ,offset
+            ,countBuffer
+            ,countBufferOffset
+            ,maxDrawCount
+            ,stride
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_handle(buffer, 'VkBuffer'),offset,_handle(countBuffer, 'VkBuffer'),countBufferOffset,maxDrawCount,stride)
+
+
+    return vkCmdDrawMeshTasksIndirectCountNV
+def _wrap_vkCompileDeferredNV(fn):
+    def vkCompileDeferredNV(
+    device
+            ,pipeline
+            ,shader
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(pipeline, 'VkPipeline'),shader)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkCompileDeferredNV
+def _wrap_vkCreateAccelerationStructureNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateAccelerationStructureNV(
+    device
+            ,pCreateInfo
+            ,pAllocator
+            ,pAccelerationStructure=None
+            ,):
+
+
+        custom_return = True
+        if not pAccelerationStructure:
+            pAccelerationStructure = ffi.new('VkAccelerationStructureNV*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pAccelerationStructure, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pAccelerationStructure
+
+        return pAccelerationStructure[0]
+
+
+
+    return vkCreateAccelerationStructureNV
+def _wrap_vkDestroyAccelerationStructureNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkDestroyAccelerationStructureNV(
+    device
+            ,accelerationStructure
+            ,pAllocator
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(accelerationStructure, 'VkAccelerationStructureNV'),_auto_handle(pAllocator, _args[2]))
+
+
+    return vkDestroyAccelerationStructureNV
+def _wrap_vkGetAccelerationStructureMemoryRequirementsNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetAccelerationStructureMemoryRequirementsNV(
+    device
+            ,pInfo
+            ,pMemoryRequirements=None
+            ,):
+
+
+        custom_return = True
+        if not pMemoryRequirements:
+            pMemoryRequirements = ffi.new('VkMemoryRequirements2KHR*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),_auto_handle(pMemoryRequirements, _args[2]))
+
+        if custom_return:
+            return pMemoryRequirements
+
+        return pMemoryRequirements[0]
+
+
+
+    return vkGetAccelerationStructureMemoryRequirementsNV
+def _wrap_vkBindAccelerationStructureMemoryNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkBindAccelerationStructureMemoryNV(
+    device
+            ,bindInfoCount
+            ,pBindInfos
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),bindInfoCount,_auto_handle(pBindInfos, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkBindAccelerationStructureMemoryNV
+def _wrap_vkCmdCopyAccelerationStructureNV(fn):
+    def vkCmdCopyAccelerationStructureNV(
+    commandBuffer
+            ,dst
+            ,src
+            ,mode
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_handle(dst, 'VkAccelerationStructureNV'),_handle(src, 'VkAccelerationStructureNV'),mode)
+
+
+    return vkCmdCopyAccelerationStructureNV
+def _wrap_vkCmdWriteAccelerationStructuresPropertiesNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdWriteAccelerationStructuresPropertiesNV(
+    commandBuffer
+            ,accelerationStructureCount
+            ,pAccelerationStructures
+            ,queryType
+            ,queryPool
+            ,firstQuery
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),accelerationStructureCount,_auto_handle(pAccelerationStructures, _args[2]),queryType,_handle(queryPool, 'VkQueryPool'),firstQuery)
+
+
+    return vkCmdWriteAccelerationStructuresPropertiesNV
+def _wrap_vkCmdBuildAccelerationStructureNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdBuildAccelerationStructureNV(
+    commandBuffer
+            ,pInfo
+            ,instanceData
+            ,instanceOffset
+            ,update
+            ,dst
+            ,src
+            ,scratch
+            ,scratchOffset
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pInfo, _args[1]),_handle(instanceData, 'VkBuffer'),instanceOffset,update,_handle(dst, 'VkAccelerationStructureNV'),_handle(src, 'VkAccelerationStructureNV'),_handle(scratch, 'VkBuffer'),scratchOffset)
+
+
+    return vkCmdBuildAccelerationStructureNV
+def _wrap_vkCmdTraceRaysNV(fn):
+    def vkCmdTraceRaysNV(
+    commandBuffer
+            ,raygenShaderBindingTableBuffer
+            ,raygenShaderBindingOffset
+            ,missShaderBindingTableBuffer
+            ,missShaderBindingOffset
+            ,missShaderBindingStride
+            ,hitShaderBindingTableBuffer
+            ,hitShaderBindingOffset
+            ,hitShaderBindingStride
+            ,callableShaderBindingTableBuffer
+            ,callableShaderBindingOffset
+            ,callableShaderBindingStride
+            ,width
+            ,height
+            ,depth
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_handle(raygenShaderBindingTableBuffer, 'VkBuffer'),raygenShaderBindingOffset,_handle(missShaderBindingTableBuffer, 'VkBuffer'),missShaderBindingOffset,missShaderBindingStride,_handle(hitShaderBindingTableBuffer, 'VkBuffer'),hitShaderBindingOffset,hitShaderBindingStride,_handle(callableShaderBindingTableBuffer, 'VkBuffer'),callableShaderBindingOffset,callableShaderBindingStride,width,height,depth)
+
+
+    return vkCmdTraceRaysNV
+def _wrap_vkGetAccelerationStructureHandleNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetAccelerationStructureHandleNV(
+    device
+            ,accelerationStructure
+            ,dataSize
+            ,pData=None
+            ,):
+
+
+        custom_return = True
+        if not pData:
+            pData = ffi.new('uint64_t[%d]' % dataSize)
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(accelerationStructure, 'VkAccelerationStructureNV'),dataSize,_auto_handle(pData, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pData
+
+        return pData
+
+
+
+    return vkGetAccelerationStructureHandleNV
+def _wrap_vkCreateRayTracingPipelinesNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateRayTracingPipelinesNV(
+    device
+            ,pipelineCache
+            ,createInfoCount
+            ,pCreateInfos
+            ,pAllocator
+            ,pPipelines=None
+            ,):
+
+
+        custom_return = True
+        if not pPipelines:
+            pPipelines = ffi.new('VkPipeline[%d]' % createInfoCount)
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(pipelineCache, 'VkPipelineCache'),createInfoCount,_auto_handle(pCreateInfos, _args[3]),_auto_handle(pAllocator, _args[4]),_auto_handle(pPipelines, _args[5]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pPipelines
+
+        return pPipelines
+
+
+
+    return vkCreateRayTracingPipelinesNV
+def _wrap_vkCreateRayTracingPipelinesNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateRayTracingPipelinesNV(
+    device
+            ,pipelineCache
+            ,createInfoCount
+            ,pCreateInfos
+            ,pAllocator
+            ,pPipelines=None
+            ,):
+
+
+        custom_return = True
+        if not pPipelines:
+            pPipelines = ffi.new('VkPipeline[%d]' % createInfoCount)
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(pipelineCache, 'VkPipelineCache'),createInfoCount,_auto_handle(pCreateInfos, _args[3]),_auto_handle(pAllocator, _args[4]),_auto_handle(pPipelines, _args[5]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pPipelines
+
+        return pPipelines
+
+
+
+    return vkCreateRayTracingPipelinesNV
+def _wrap_vkGetPhysicalDeviceCooperativeMatrixPropertiesNV(fn):
+    def vkGetPhysicalDeviceCooperativeMatrixPropertiesNV(
+    physicalDevice
+            ,pProperties=None
+            ,):
+
+
+        pPropertyCount = ffi.new('uint32_t*')
+        custom_return = pProperties is not None
+        _array = pProperties
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pPropertyCount[0] = len(_array)
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pProperties = ffi.NULL
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pPropertyCount[0]:
+                _array = ffi.new('VkCooperativeMatrixPropertiesNV[]', pPropertyCount[0])
+            pProperties = _array
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pPropertyCount,pProperties)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pPropertyCount[0] != len(_array):
+            pProperties = _slice(_array, pPropertyCount[0])
+
+        return pProperties
+
+
+    return vkGetPhysicalDeviceCooperativeMatrixPropertiesNV
+def _wrap_vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV(fn):
+    def vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV(
+    physicalDevice
+            ,pCombinations=None
+            ,):
+
+
+        pCombinationCount = ffi.new('uint32_t*')
+        custom_return = pCombinations is not None
+        _array = pCombinations
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pCombinationCount[0] = len(_array)
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pCombinationCount,pCombinations)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pCombinations = ffi.NULL
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pCombinationCount,pCombinations)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pCombinationCount[0]:
+                _array = ffi.new('VkFramebufferMixedSamplesCombinationNV[]', pCombinationCount[0])
+            pCombinations = _array
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),pCombinationCount,pCombinations)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pCombinationCount[0] != len(_array):
+            pCombinations = _slice(_array, pCombinationCount[0])
+
+        return pCombinations
+
+
+    return vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV
+def _wrap_vkGetPipelineIndirectMemoryRequirementsNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPipelineIndirectMemoryRequirementsNV(
+    device
+            ,pCreateInfo
+            ,pMemoryRequirements=None
+            ,):
+
+
+        custom_return = True
+        if not pMemoryRequirements:
+            pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pMemoryRequirements, _args[2]))
+
+        if custom_return:
+            return pMemoryRequirements
+
+        return pMemoryRequirements[0]
+
+
+
+    return vkGetPipelineIndirectMemoryRequirementsNV
+def _wrap_vkGetPipelineIndirectDeviceAddressNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPipelineIndirectDeviceAddressNV(
+    device
+            ,pInfo=None
+            ,):
+
+
+        custom_return = True
+        if not pInfo:
+            pInfo = ffi.new('VkPipelineIndirectDeviceAddressInfoNV*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]))
+
+        if custom_return:
+            return pInfo
+
+        return pInfo[0]
+
+
+
+    return vkGetPipelineIndirectDeviceAddressNV
+def _wrap_vkCmdSetFragmentShadingRateEnumNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetFragmentShadingRateEnumNV(
+    commandBuffer
+            ,shadingRate
+            ,combinerOps
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),shadingRate,_auto_handle(combinerOps, _args[2]))
+
+
+    return vkCmdSetFragmentShadingRateEnumNV
+def _wrap_vkCmdDecompressMemoryNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdDecompressMemoryNV(
+    commandBuffer
+            ,decompressRegionCount
+            ,pDecompressMemoryRegions
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),decompressRegionCount,_auto_handle(pDecompressMemoryRegions, _args[2]))
+
+
+    return vkCmdDecompressMemoryNV
+def _wrap_vkCmdDecompressMemoryIndirectCountNV(fn):
+    def vkCmdDecompressMemoryIndirectCountNV(
+    commandBuffer
+            ,indirectCommandsAddress
+            ,indirectCommandsCountAddress
+            ,stride
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),indirectCommandsAddress,indirectCommandsCountAddress,stride)
+
+
+    return vkCmdDecompressMemoryIndirectCountNV
+def _wrap_vkCreateCudaModuleNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateCudaModuleNV(
+    device
+            ,pCreateInfo
+            ,pAllocator
+            ,pModule=None
+            ,):
+
+
+        custom_return = True
+        if not pModule:
+            pModule = ffi.new('VkCudaModuleNV*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pModule, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pModule
+
+        return pModule[0]
+
+
+
+    return vkCreateCudaModuleNV
+def _wrap_vkGetCudaModuleCacheNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetCudaModuleCacheNV(
+    device
+            ,module
+            ,pCacheSize
+            ,pCacheData=None
+            ,):
+
+
+        custom_return = True
+        if not pCacheData:
+            pCacheData = ffi.new('void[%d]' % pCacheSize)
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(module, 'VkCudaModuleNV'),_auto_handle(pCacheSize, _args[2]),_auto_handle(pCacheData, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pCacheData
+
+        return pCacheData
+
+
+
+    return vkGetCudaModuleCacheNV
+def _wrap_vkCreateCudaFunctionNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateCudaFunctionNV(
+    device
+            ,pCreateInfo
+            ,pAllocator
+            ,pFunction=None
+            ,):
+
+
+        custom_return = True
+        if not pFunction:
+            pFunction = ffi.new('VkCudaFunctionNV*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pFunction, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pFunction
+
+        return pFunction[0]
+
+
+
+    return vkCreateCudaFunctionNV
+def _wrap_vkDestroyCudaModuleNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkDestroyCudaModuleNV(
+    device
+            ,module
+            ,pAllocator
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(module, 'VkCudaModuleNV'),_auto_handle(pAllocator, _args[2]))
+
+
+    return vkDestroyCudaModuleNV
+def _wrap_vkDestroyCudaFunctionNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkDestroyCudaFunctionNV(
+    device
+            ,function
+            ,pAllocator
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(function, 'VkCudaFunctionNV'),_auto_handle(pAllocator, _args[2]))
+
+
+    return vkDestroyCudaFunctionNV
+def _wrap_vkCmdCudaLaunchKernelNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdCudaLaunchKernelNV(
+    commandBuffer
+            ,pLaunchInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pLaunchInfo, _args[1]))
+
+
+    return vkCmdCudaLaunchKernelNV
+def _wrap_vkGetPhysicalDeviceOpticalFlowImageFormatsNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceOpticalFlowImageFormatsNV(
+    physicalDevice
+            ,pOpticalFlowImageFormatInfo
+            ,pImageFormatProperties=None
+            ,):
+
+
+        pFormatCount = ffi.new('uint32_t*')
+        custom_return = pImageFormatProperties is not None
+        _array = pImageFormatProperties
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pFormatCount[0] = len(_array)
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pOpticalFlowImageFormatInfo, _args[1]),pFormatCount,pImageFormatProperties)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pImageFormatProperties = ffi.NULL
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pOpticalFlowImageFormatInfo, _args[1]),pFormatCount,pImageFormatProperties)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pFormatCount[0]:
+                _array = ffi.new('VkOpticalFlowImageFormatPropertiesNV[]', pFormatCount[0])
+            pImageFormatProperties = _array
+            result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),_auto_handle(pOpticalFlowImageFormatInfo, _args[1]),pFormatCount,pImageFormatProperties)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pFormatCount[0] != len(_array):
+            pImageFormatProperties = _slice(_array, pFormatCount[0])
+
+        return pImageFormatProperties
+
+
+    return vkGetPhysicalDeviceOpticalFlowImageFormatsNV
+def _wrap_vkCreateOpticalFlowSessionNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateOpticalFlowSessionNV(
+    device
+            ,pCreateInfo
+            ,pAllocator
+            ,pSession=None
+            ,):
+
+
+        custom_return = True
+        if not pSession:
+            pSession = ffi.new('VkOpticalFlowSessionNV*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pSession, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSession
+
+        return pSession[0]
+
+
+
+    return vkCreateOpticalFlowSessionNV
+def _wrap_vkDestroyOpticalFlowSessionNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkDestroyOpticalFlowSessionNV(
+    device
+            ,session
+            ,pAllocator
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(session, 'VkOpticalFlowSessionNV'),_auto_handle(pAllocator, _args[2]))
+
+
+    return vkDestroyOpticalFlowSessionNV
+def _wrap_vkBindOpticalFlowSessionImageNV(fn):
+    def vkBindOpticalFlowSessionImageNV(
+    device
+            ,session
+            ,bindingPoint
+            ,view
+            ,layout
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(session, 'VkOpticalFlowSessionNV'),bindingPoint,_handle(view, 'VkImageView'),layout)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkBindOpticalFlowSessionImageNV
+def _wrap_vkCmdOpticalFlowExecuteNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdOpticalFlowExecuteNV(
+    commandBuffer
+            ,session
+            ,pExecuteInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_handle(session, 'VkOpticalFlowSessionNV'),_auto_handle(pExecuteInfo, _args[2]))
+
+
+    return vkCmdOpticalFlowExecuteNV
+def _wrap_vkSetLatencySleepModeNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkSetLatencySleepModeNV(
+    device
+            ,swapchain
+            ,pSleepModeInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(swapchain, 'VkSwapchainKHR'),_auto_handle(pSleepModeInfo, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkSetLatencySleepModeNV
+def _wrap_vkLatencySleepNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkLatencySleepNV(
+    device
+            ,swapchain
+            ,pSleepInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(swapchain, 'VkSwapchainKHR'),_auto_handle(pSleepInfo, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkLatencySleepNV
+def _wrap_vkSetLatencyMarkerNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkSetLatencyMarkerNV(
+    device
+            ,swapchain
+            ,pLatencyMarkerInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(swapchain, 'VkSwapchainKHR'),_auto_handle(pLatencyMarkerInfo, _args[2]))
+
+
+    return vkSetLatencyMarkerNV
+def _wrap_vkGetLatencyTimingsNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetLatencyTimingsNV(
+    device
+            ,swapchain
+            ,pLatencyMarkerInfo=None
+            ,):
+
+
+        custom_return = True
+        if not pLatencyMarkerInfo:
+            pLatencyMarkerInfo = ffi.new('VkGetLatencyMarkerInfoNV*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(swapchain, 'VkSwapchainKHR'),_auto_handle(pLatencyMarkerInfo, _args[2]))
+
+        if custom_return:
+            return pLatencyMarkerInfo
+
+        return pLatencyMarkerInfo[0]
+
+
+
+    return vkGetLatencyTimingsNV
+def _wrap_vkQueueNotifyOutOfBandNV(fn):
+    _args = ffi.typeof(fn).args
+    def vkQueueNotifyOutOfBandNV(
+    queue
+            ,pQueueTypeInfo
+            ,):
+
+        result = fn(_handle(queue, 'VkQueue'),_auto_handle(pQueueTypeInfo, _args[1]))
+
+
+    return vkQueueNotifyOutOfBandNV
@@ -0,0 +1,131 @@
+from vulkan._vulkan import *  # noqa
+from vulkan._vulkan import (ffi, lib, _new, _auto_handle, _handle,
+                            _arg_types, _slice)
+
+
+def VkPipelineCacheStageValidationIndexEntry(codeSize=None,codeOffset=None,):
+
+    return _new('VkPipelineCacheStageValidationIndexEntry', codeSize=codeSize,codeOffset=codeOffset)
+
+def VkPipelineCacheSafetyCriticalIndexEntry(pipelineIdentifier=None,pipelineMemorySize=None,jsonSize=None,jsonOffset=None,stageIndexCount=None,stageIndexStride=None,stageIndexOffset=None,):
+
+    return _new('VkPipelineCacheSafetyCriticalIndexEntry', pipelineIdentifier=pipelineIdentifier,pipelineMemorySize=pipelineMemorySize,jsonSize=jsonSize,jsonOffset=jsonOffset,stageIndexCount=stageIndexCount,stageIndexStride=stageIndexStride,stageIndexOffset=stageIndexOffset)
+
+def VkPipelineCacheHeaderVersionSafetyCriticalOne(headerVersionOne=None,validationVersion=None,implementationData=None,pipelineIndexCount=None,pipelineIndexStride=None,pipelineIndexOffset=None,):
+
+    return _new('VkPipelineCacheHeaderVersionSafetyCriticalOne', headerVersionOne=headerVersionOne,validationVersion=validationVersion,implementationData=implementationData,pipelineIndexCount=pipelineIndexCount,pipelineIndexStride=pipelineIndexStride,pipelineIndexOffset=pipelineIndexOffset)
+
+def VkFaultData(sType=VK_STRUCTURE_TYPE_FAULT_DATA,pNext=None,faultLevel=None,faultType=None,):
+
+    return _new('VkFaultData', sType=sType,pNext=pNext,faultLevel=faultLevel,faultType=faultType)
+
+def VkFaultCallbackInfo(sType=VK_STRUCTURE_TYPE_FAULT_CALLBACK_INFO,pNext=None,faultCount=None,pFaults=None,pfnFaultCallback=None,):
+    if faultCount is None and pFaults is not None:
+        faultCount = len(pFaults)
+
+    return _new('VkFaultCallbackInfo', sType=sType,pNext=pNext,faultCount=faultCount,pFaults=pFaults,pfnFaultCallback=pfnFaultCallback)
+
+def VkPipelineOfflineCreateInfo(sType=VK_STRUCTURE_TYPE_PIPELINE_OFFLINE_CREATE_INFO,pNext=None,pipelineIdentifier=None,matchControl=None,poolEntrySize=None,):
+
+    return _new('VkPipelineOfflineCreateInfo', sType=sType,pNext=pNext,pipelineIdentifier=pipelineIdentifier,matchControl=matchControl,poolEntrySize=poolEntrySize)
+
+def VkPhysicalDeviceVulkanSC10Properties(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_SC_1_0_PROPERTIES,pNext=None,deviceNoDynamicHostAllocations=None,deviceDestroyFreesMemory=None,commandPoolMultipleCommandBuffersRecording=None,commandPoolResetCommandBuffer=None,commandBufferSimultaneousUse=None,secondaryCommandBufferNullOrImagelessFramebuffer=None,recycleDescriptorSetMemory=None,recyclePipelineMemory=None,maxRenderPassSubpasses=None,maxRenderPassDependencies=None,maxSubpassInputAttachments=None,maxSubpassPreserveAttachments=None,maxFramebufferAttachments=None,maxDescriptorSetLayoutBindings=None,maxQueryFaultCount=None,maxCallbackFaultCount=None,maxCommandPoolCommandBuffers=None,maxCommandBufferSize=None,):
+
+    return _new('VkPhysicalDeviceVulkanSC10Properties', sType=sType,pNext=pNext,deviceNoDynamicHostAllocations=deviceNoDynamicHostAllocations,deviceDestroyFreesMemory=deviceDestroyFreesMemory,commandPoolMultipleCommandBuffersRecording=commandPoolMultipleCommandBuffersRecording,commandPoolResetCommandBuffer=commandPoolResetCommandBuffer,commandBufferSimultaneousUse=commandBufferSimultaneousUse,secondaryCommandBufferNullOrImagelessFramebuffer=secondaryCommandBufferNullOrImagelessFramebuffer,recycleDescriptorSetMemory=recycleDescriptorSetMemory,recyclePipelineMemory=recyclePipelineMemory,maxRenderPassSubpasses=maxRenderPassSubpasses,maxRenderPassDependencies=maxRenderPassDependencies,maxSubpassInputAttachments=maxSubpassInputAttachments,maxSubpassPreserveAttachments=maxSubpassPreserveAttachments,maxFramebufferAttachments=maxFramebufferAttachments,maxDescriptorSetLayoutBindings=maxDescriptorSetLayoutBindings,maxQueryFaultCount=maxQueryFaultCount,maxCallbackFaultCount=maxCallbackFaultCount,maxCommandPoolCommandBuffers=maxCommandPoolCommandBuffers,maxCommandBufferSize=maxCommandBufferSize)
+
+def VkPipelinePoolSize(sType=VK_STRUCTURE_TYPE_PIPELINE_POOL_SIZE,pNext=None,poolEntrySize=None,poolEntryCount=None,):
+
+    return _new('VkPipelinePoolSize', sType=sType,pNext=pNext,poolEntrySize=poolEntrySize,poolEntryCount=poolEntryCount)
+
+def VkDeviceObjectReservationCreateInfo(sType=VK_STRUCTURE_TYPE_DEVICE_OBJECT_RESERVATION_CREATE_INFO,pNext=None,pipelineCacheCreateInfoCount=None,pPipelineCacheCreateInfos=None,pipelinePoolSizeCount=None,pPipelinePoolSizes=None,semaphoreRequestCount=None,commandBufferRequestCount=None,fenceRequestCount=None,deviceMemoryRequestCount=None,bufferRequestCount=None,imageRequestCount=None,eventRequestCount=None,queryPoolRequestCount=None,bufferViewRequestCount=None,imageViewRequestCount=None,layeredImageViewRequestCount=None,pipelineCacheRequestCount=None,pipelineLayoutRequestCount=None,renderPassRequestCount=None,graphicsPipelineRequestCount=None,computePipelineRequestCount=None,descriptorSetLayoutRequestCount=None,samplerRequestCount=None,descriptorPoolRequestCount=None,descriptorSetRequestCount=None,framebufferRequestCount=None,commandPoolRequestCount=None,samplerYcbcrConversionRequestCount=None,surfaceRequestCount=None,swapchainRequestCount=None,displayModeRequestCount=None,subpassDescriptionRequestCount=None,attachmentDescriptionRequestCount=None,descriptorSetLayoutBindingRequestCount=None,descriptorSetLayoutBindingLimit=None,maxImageViewMipLevels=None,maxImageViewArrayLayers=None,maxLayeredImageViewMipLevels=None,maxOcclusionQueriesPerPool=None,maxPipelineStatisticsQueriesPerPool=None,maxTimestampQueriesPerPool=None,maxImmutableSamplersPerDescriptorSetLayout=None,):
+    if pipelineCacheCreateInfoCount is None and pPipelineCacheCreateInfos is not None:
+        pipelineCacheCreateInfoCount = len(pPipelineCacheCreateInfos)
+    if pipelinePoolSizeCount is None and pPipelinePoolSizes is not None:
+        pipelinePoolSizeCount = len(pPipelinePoolSizes)
+
+    return _new('VkDeviceObjectReservationCreateInfo', sType=sType,pNext=pNext,pipelineCacheCreateInfoCount=pipelineCacheCreateInfoCount,pPipelineCacheCreateInfos=pPipelineCacheCreateInfos,pipelinePoolSizeCount=pipelinePoolSizeCount,pPipelinePoolSizes=pPipelinePoolSizes,semaphoreRequestCount=semaphoreRequestCount,commandBufferRequestCount=commandBufferRequestCount,fenceRequestCount=fenceRequestCount,deviceMemoryRequestCount=deviceMemoryRequestCount,bufferRequestCount=bufferRequestCount,imageRequestCount=imageRequestCount,eventRequestCount=eventRequestCount,queryPoolRequestCount=queryPoolRequestCount,bufferViewRequestCount=bufferViewRequestCount,imageViewRequestCount=imageViewRequestCount,layeredImageViewRequestCount=layeredImageViewRequestCount,pipelineCacheRequestCount=pipelineCacheRequestCount,pipelineLayoutRequestCount=pipelineLayoutRequestCount,renderPassRequestCount=renderPassRequestCount,graphicsPipelineRequestCount=graphicsPipelineRequestCount,computePipelineRequestCount=computePipelineRequestCount,descriptorSetLayoutRequestCount=descriptorSetLayoutRequestCount,samplerRequestCount=samplerRequestCount,descriptorPoolRequestCount=descriptorPoolRequestCount,descriptorSetRequestCount=descriptorSetRequestCount,framebufferRequestCount=framebufferRequestCount,commandPoolRequestCount=commandPoolRequestCount,samplerYcbcrConversionRequestCount=samplerYcbcrConversionRequestCount,surfaceRequestCount=surfaceRequestCount,swapchainRequestCount=swapchainRequestCount,displayModeRequestCount=displayModeRequestCount,subpassDescriptionRequestCount=subpassDescriptionRequestCount,attachmentDescriptionRequestCount=attachmentDescriptionRequestCount,descriptorSetLayoutBindingRequestCount=descriptorSetLayoutBindingRequestCount,descriptorSetLayoutBindingLimit=descriptorSetLayoutBindingLimit,maxImageViewMipLevels=maxImageViewMipLevels,maxImageViewArrayLayers=maxImageViewArrayLayers,maxLayeredImageViewMipLevels=maxLayeredImageViewMipLevels,maxOcclusionQueriesPerPool=maxOcclusionQueriesPerPool,maxPipelineStatisticsQueriesPerPool=maxPipelineStatisticsQueriesPerPool,maxTimestampQueriesPerPool=maxTimestampQueriesPerPool,maxImmutableSamplersPerDescriptorSetLayout=maxImmutableSamplersPerDescriptorSetLayout)
+
+def VkCommandPoolMemoryReservationCreateInfo(sType=VK_STRUCTURE_TYPE_COMMAND_POOL_MEMORY_RESERVATION_CREATE_INFO,pNext=None,commandPoolReservedSize=None,commandPoolMaxCommandBuffers=None,):
+
+    return _new('VkCommandPoolMemoryReservationCreateInfo', sType=sType,pNext=pNext,commandPoolReservedSize=commandPoolReservedSize,commandPoolMaxCommandBuffers=commandPoolMaxCommandBuffers)
+
+def VkCommandPoolMemoryConsumption(sType=VK_STRUCTURE_TYPE_COMMAND_POOL_MEMORY_CONSUMPTION,pNext=None,commandPoolAllocated=None,commandPoolReservedSize=None,commandBufferAllocated=None,):
+
+    return _new('VkCommandPoolMemoryConsumption', sType=sType,pNext=pNext,commandPoolAllocated=commandPoolAllocated,commandPoolReservedSize=commandPoolReservedSize,commandBufferAllocated=commandBufferAllocated)
+
+def VkPhysicalDeviceVulkanSC10Features(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_SC_1_0_FEATURES,pNext=None,shaderAtomicInstructions=None,):
+
+    return _new('VkPhysicalDeviceVulkanSC10Features', sType=sType,pNext=pNext,shaderAtomicInstructions=shaderAtomicInstructions)
+
+
+
+
+
+
+
+
+
+
+def vkGetFaultData(
+device
+        ,faultQueryBehavior
+        ,pUnrecordedFaults
+        ,pFaults=None
+        ,):
+    _args = _arg_types('vkGetFaultData', lib.vkGetFaultData)
+
+
+    pFaultCount = ffi.new('uint32_t*')
+    custom_return = pFaults is not None
+    _array = pFaults
+
+    if custom_return:
+        # the buffer is usually big enough, one call instead of two
+        pFaultCount[0] = len(_array)
+        result = lib.vkGetFaultData(_handle(device, 'VkDevice'),faultQueryBehavior,_auto_handle(pUnrecordedFaults, _args[2]),pFaultCount,pFaults)
+    else:
+        result = VK_INCOMPLETE
+
+    # the count can change between the two calls
+    while result == VK_INCOMPLETE:
+        pFaults = ffi.NULL
+        result = lib.vkGetFaultData(_handle(device, 'VkDevice'),faultQueryBehavior,_auto_handle(pUnrecordedFaults, _args[2]),pFaultCount,pFaults)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if _array is None or len(_array) < pFaultCount[0]:
+            _array = ffi.new('VkFaultData[]', pFaultCount[0])
+        pFaults = _array
+        result = lib.vkGetFaultData(_handle(device, 'VkDevice'),faultQueryBehavior,_auto_handle(pUnrecordedFaults, _args[2]),pFaultCount,pFaults)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
+
+    if pFaultCount[0] != len(_array):
+        pFaults = _slice(_array, pFaultCount[0])
+
+    return pFaults
+
+
+def vkGetCommandPoolMemoryConsumption(
+device
+        ,commandPool
+        ,commandBuffer
+        ,pConsumption=None
+        ,):
+    _args = _arg_types('vkGetCommandPoolMemoryConsumption', lib.vkGetCommandPoolMemoryConsumption)
+
+
+    custom_return = True
+    if not pConsumption:
+        pConsumption = ffi.new('VkCommandPoolMemoryConsumption*')
+        custom_return = False
+
+    result = lib.vkGetCommandPoolMemoryConsumption(_handle(device, 'VkDevice'),_handle(commandPool, 'VkCommandPool'),_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pConsumption, _args[3]))
+
+    if custom_return:
+        return pConsumption
+
+    return pConsumption[0]
+
+
+
@@ -0,0 +1,1710 @@
+from vulkan._vulkan import *  # noqa
+from vulkan._vulkan import (ffi, lib, _new, _auto_handle, _handle,
+                            _arg_types, _slice)
+
+
+def VkViSurfaceCreateInfoNN(sType=VK_STRUCTURE_TYPE_VI_SURFACE_CREATE_INFO_NN,pNext=None,flags=None,window=None,):
+
+    return _new('VkViSurfaceCreateInfoNN', sType=sType,pNext=pNext,flags=flags,window=window)
+
+def VkImagePipeSurfaceCreateInfoFUCHSIA(sType=VK_STRUCTURE_TYPE_IMAGEPIPE_SURFACE_CREATE_INFO_FUCHSIA,pNext=None,flags=None,imagePipeHandle=None,):
+
+    return _new('VkImagePipeSurfaceCreateInfoFUCHSIA', sType=sType,pNext=pNext,flags=flags,imagePipeHandle=imagePipeHandle)
+
+def VkStreamDescriptorSurfaceCreateInfoGGP(sType=VK_STRUCTURE_TYPE_STREAM_DESCRIPTOR_SURFACE_CREATE_INFO_GGP,pNext=None,flags=None,streamDescriptor=None,):
+
+    return _new('VkStreamDescriptorSurfaceCreateInfoGGP', sType=sType,pNext=pNext,flags=flags,streamDescriptor=streamDescriptor)
+
+def VkScreenSurfaceCreateInfoQNX(sType=VK_STRUCTURE_TYPE_SCREEN_SURFACE_CREATE_INFO_QNX,pNext=None,flags=None,context=None,window=None,):
+
+    return _new('VkScreenSurfaceCreateInfoQNX', sType=sType,pNext=pNext,flags=flags,context=context,window=window)
+
+def VkImportMemoryZirconHandleInfoFUCHSIA(sType=VK_STRUCTURE_TYPE_IMPORT_MEMORY_ZIRCON_HANDLE_INFO_FUCHSIA,pNext=None,handleType=None,handle=None,):
+
+    return _new('VkImportMemoryZirconHandleInfoFUCHSIA', sType=sType,pNext=pNext,handleType=handleType,handle=handle)
+
+def VkMemoryZirconHandlePropertiesFUCHSIA(sType=VK_STRUCTURE_TYPE_MEMORY_ZIRCON_HANDLE_PROPERTIES_FUCHSIA,pNext=None,memoryTypeBits=None,):
+
+    return _new('VkMemoryZirconHandlePropertiesFUCHSIA', sType=sType,pNext=pNext,memoryTypeBits=memoryTypeBits)
+
+def VkMemoryGetZirconHandleInfoFUCHSIA(sType=VK_STRUCTURE_TYPE_MEMORY_GET_ZIRCON_HANDLE_INFO_FUCHSIA,pNext=None,memory=None,handleType=None,):
+
+    return _new('VkMemoryGetZirconHandleInfoFUCHSIA', sType=sType,pNext=pNext,memory=memory,handleType=handleType)
+
+def VkImportSemaphoreZirconHandleInfoFUCHSIA(sType=VK_STRUCTURE_TYPE_IMPORT_SEMAPHORE_ZIRCON_HANDLE_INFO_FUCHSIA,pNext=None,semaphore=None,flags=None,handleType=None,zirconHandle=None,):
+
+    return _new('VkImportSemaphoreZirconHandleInfoFUCHSIA', sType=sType,pNext=pNext,semaphore=semaphore,flags=flags,handleType=handleType,zirconHandle=zirconHandle)
+
+def VkSemaphoreGetZirconHandleInfoFUCHSIA(sType=VK_STRUCTURE_TYPE_SEMAPHORE_GET_ZIRCON_HANDLE_INFO_FUCHSIA,pNext=None,semaphore=None,handleType=None,):
+
+    return _new('VkSemaphoreGetZirconHandleInfoFUCHSIA', sType=sType,pNext=pNext,semaphore=semaphore,handleType=handleType)
+
+def VkRefreshCycleDurationGOOGLE(refreshDuration=None,):
+
+    return _new('VkRefreshCycleDurationGOOGLE', refreshDuration=refreshDuration)
+
+def VkPastPresentationTimingGOOGLE(presentID=None,desiredPresentTime=None,actualPresentTime=None,earliestPresentTime=None,presentMargin=None,):
+
+    return _new('VkPastPresentationTimingGOOGLE', presentID=presentID,desiredPresentTime=desiredPresentTime,actualPresentTime=actualPresentTime,earliestPresentTime=earliestPresentTime,presentMargin=presentMargin)
+
+def VkPresentTimesInfoGOOGLE(sType=VK_STRUCTURE_TYPE_PRESENT_TIMES_INFO_GOOGLE,pNext=None,swapchainCount=None,pTimes=None,):
+    if swapchainCount is None and pTimes is not None:
+        swapchainCount = len(pTimes)
+
+    return _new('VkPresentTimesInfoGOOGLE', sType=sType,pNext=pNext,swapchainCount=swapchainCount,pTimes=pTimes)
+
+def VkPresentTimeGOOGLE(presentID=None,desiredPresentTime=None,):
+
+    return _new('VkPresentTimeGOOGLE', presentID=presentID,desiredPresentTime=desiredPresentTime)
+
+def VkIOSSurfaceCreateInfoMVK(sType=VK_STRUCTURE_TYPE_IOS_SURFACE_CREATE_INFO_MVK,pNext=None,flags=None,pView=None,):
+
+    return _new('VkIOSSurfaceCreateInfoMVK', sType=sType,pNext=pNext,flags=flags,pView=pView)
+
+def VkMacOSSurfaceCreateInfoMVK(sType=VK_STRUCTURE_TYPE_MACOS_SURFACE_CREATE_INFO_MVK,pNext=None,flags=None,pView=None,):
+
+    return _new('VkMacOSSurfaceCreateInfoMVK', sType=sType,pNext=pNext,flags=flags,pView=pView)
+
+def VkPhysicalDeviceMultiviewPerViewAttributesPropertiesNVX(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTIVIEW_PER_VIEW_ATTRIBUTES_PROPERTIES_NVX,pNext=None,perViewPositionAllComponents=None,):
+
+    return _new('VkPhysicalDeviceMultiviewPerViewAttributesPropertiesNVX', sType=sType,pNext=pNext,perViewPositionAllComponents=perViewPositionAllComponents)
+
+def VkNativeBufferUsage2ANDROID(consumer=None,producer=None,):
+
+    return _new('VkNativeBufferUsage2ANDROID', consumer=consumer,producer=producer)
+
+def VkNativeBufferANDROID(sType=VK_STRUCTURE_TYPE_NATIVE_BUFFER_ANDROID,pNext=None,handle=None,stride=None,format=None,usage=None,usage2=None,):
+
+    return _new('VkNativeBufferANDROID', sType=sType,pNext=pNext,handle=handle,stride=stride,format=format,usage=usage,usage2=usage2)
+
+def VkSwapchainImageCreateInfoANDROID(sType=VK_STRUCTURE_TYPE_SWAPCHAIN_IMAGE_CREATE_INFO_ANDROID,pNext=None,usage=None,):
+
+    return _new('VkSwapchainImageCreateInfoANDROID', sType=sType,pNext=pNext,usage=usage)
+
+def VkPhysicalDevicePresentationPropertiesANDROID(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PRESENTATION_PROPERTIES_ANDROID,pNext=None,sharedImage=None,):
+
+    return _new('VkPhysicalDevicePresentationPropertiesANDROID', sType=sType,pNext=pNext,sharedImage=sharedImage)
+
+def VkImportAndroidHardwareBufferInfoANDROID(sType=VK_STRUCTURE_TYPE_IMPORT_ANDROID_HARDWARE_BUFFER_INFO_ANDROID,pNext=None,buffer=None,):
+
+    return _new('VkImportAndroidHardwareBufferInfoANDROID', sType=sType,pNext=pNext,buffer=buffer)
+
+def VkAndroidHardwareBufferUsageANDROID(sType=VK_STRUCTURE_TYPE_ANDROID_HARDWARE_BUFFER_USAGE_ANDROID,pNext=None,androidHardwareBufferUsage=None,):
+
+    return _new('VkAndroidHardwareBufferUsageANDROID', sType=sType,pNext=pNext,androidHardwareBufferUsage=androidHardwareBufferUsage)
+
+def VkAndroidHardwareBufferPropertiesANDROID(sType=VK_STRUCTURE_TYPE_ANDROID_HARDWARE_BUFFER_PROPERTIES_ANDROID,pNext=None,allocationSize=None,memoryTypeBits=None,):
+
+    return _new('VkAndroidHardwareBufferPropertiesANDROID', sType=sType,pNext=pNext,allocationSize=allocationSize,memoryTypeBits=memoryTypeBits)
+
+def VkMemoryGetAndroidHardwareBufferInfoANDROID(sType=VK_STRUCTURE_TYPE_MEMORY_GET_ANDROID_HARDWARE_BUFFER_INFO_ANDROID,pNext=None,memory=None,):
+
+    return _new('VkMemoryGetAndroidHardwareBufferInfoANDROID', sType=sType,pNext=pNext,memory=memory)
+
+def VkAndroidHardwareBufferFormatPropertiesANDROID(sType=VK_STRUCTURE_TYPE_ANDROID_HARDWARE_BUFFER_FORMAT_PROPERTIES_ANDROID,pNext=None,format=None,externalFormat=None,formatFeatures=None,samplerYcbcrConversionComponents=None,suggestedYcbcrModel=None,suggestedYcbcrRange=None,suggestedXChromaOffset=None,suggestedYChromaOffset=None,):
+
+    return _new('VkAndroidHardwareBufferFormatPropertiesANDROID', sType=sType,pNext=pNext,format=format,externalFormat=externalFormat,formatFeatures=formatFeatures,samplerYcbcrConversionComponents=samplerYcbcrConversionComponents,suggestedYcbcrModel=suggestedYcbcrModel,suggestedYcbcrRange=suggestedYcbcrRange,suggestedXChromaOffset=suggestedXChromaOffset,suggestedYChromaOffset=suggestedYChromaOffset)
+
+def VkExternalFormatANDROID(sType=VK_STRUCTURE_TYPE_EXTERNAL_FORMAT_ANDROID,pNext=None,externalFormat=None,):
+
+    return _new('VkExternalFormatANDROID', sType=sType,pNext=pNext,externalFormat=externalFormat)
+
+def VkPhysicalDeviceInvocationMaskFeaturesHUAWEI(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_INVOCATION_MASK_FEATURES_HUAWEI,pNext=None,invocationMask=None,):
+
+    return _new('VkPhysicalDeviceInvocationMaskFeaturesHUAWEI', sType=sType,pNext=pNext,invocationMask=invocationMask)
+
+def VkPhysicalDeviceFragmentDensityMapOffsetFeaturesQCOM(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_OFFSET_FEATURES_QCOM,pNext=None,fragmentDensityMapOffset=None,):
+
+    return _new('VkPhysicalDeviceFragmentDensityMapOffsetFeaturesQCOM', sType=sType,pNext=pNext,fragmentDensityMapOffset=fragmentDensityMapOffset)
+
+def VkPhysicalDeviceFragmentDensityMapOffsetPropertiesQCOM(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_OFFSET_PROPERTIES_QCOM,pNext=None,fragmentDensityOffsetGranularity=None,):
+
+    return _new('VkPhysicalDeviceFragmentDensityMapOffsetPropertiesQCOM', sType=sType,pNext=pNext,fragmentDensityOffsetGranularity=fragmentDensityOffsetGranularity)
+
+def VkSubpassFragmentDensityMapOffsetEndInfoQCOM(sType=VK_STRUCTURE_TYPE_SUBPASS_FRAGMENT_DENSITY_MAP_OFFSET_END_INFO_QCOM,pNext=None,fragmentDensityOffsetCount=None,pFragmentDensityOffsets=None,):
+    if fragmentDensityOffsetCount is None and pFragmentDensityOffsets is not None:
+        fragmentDensityOffsetCount = len(pFragmentDensityOffsets)
+
+    return _new('VkSubpassFragmentDensityMapOffsetEndInfoQCOM', sType=sType,pNext=pNext,fragmentDensityOffsetCount=fragmentDensityOffsetCount,pFragmentDensityOffsets=pFragmentDensityOffsets)
+
+def VkImageViewHandleInfoNVX(sType=VK_STRUCTURE_TYPE_IMAGE_VIEW_HANDLE_INFO_NVX,pNext=None,imageView=None,descriptorType=None,sampler=None,):
+
+    return _new('VkImageViewHandleInfoNVX', sType=sType,pNext=pNext,imageView=imageView,descriptorType=descriptorType,sampler=sampler)
+
+def VkImageViewAddressPropertiesNVX(sType=VK_STRUCTURE_TYPE_IMAGE_VIEW_ADDRESS_PROPERTIES_NVX,pNext=None,deviceAddress=None,size=None,):
+
+    return _new('VkImageViewAddressPropertiesNVX', sType=sType,pNext=pNext,deviceAddress=deviceAddress,size=size)
+
+def VkPresentFrameTokenGGP(sType=VK_STRUCTURE_TYPE_PRESENT_FRAME_TOKEN_GGP,pNext=None,frameToken=None,):
+
+    return _new('VkPresentFrameTokenGGP', sType=sType,pNext=pNext,frameToken=frameToken)
+
+def VkPhysicalDeviceShaderIntegerFunctions2FeaturesINTEL(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_INTEGER_FUNCTIONS_2_FEATURES_INTEL,pNext=None,shaderIntegerFunctions2=None,):
+
+    return _new('VkPhysicalDeviceShaderIntegerFunctions2FeaturesINTEL', sType=sType,pNext=pNext,shaderIntegerFunctions2=shaderIntegerFunctions2)
+
+def VkPerformanceValueDataINTEL(value32=None,value64=None,valueFloat=None,valueBool=None,valueString=None,):
+
+    return _new('VkPerformanceValueDataINTEL', value32=value32,value64=value64,valueFloat=valueFloat,valueBool=valueBool,valueString=valueString)
+
+def VkPerformanceValueINTEL(type=None,data=None,):
+
+    return _new('VkPerformanceValueINTEL', type=type,data=data)
+
+def VkInitializePerformanceApiInfoINTEL(sType=VK_STRUCTURE_TYPE_INITIALIZE_PERFORMANCE_API_INFO_INTEL,pNext=None,pUserData=None,):
+
+    return _new('VkInitializePerformanceApiInfoINTEL', sType=sType,pNext=pNext,pUserData=pUserData)
+
+def VkQueryPoolPerformanceQueryCreateInfoINTEL(sType=VK_STRUCTURE_TYPE_QUERY_POOL_PERFORMANCE_QUERY_CREATE_INFO_INTEL,pNext=None,performanceCountersSampling=None,):
+
+    return _new('VkQueryPoolPerformanceQueryCreateInfoINTEL', sType=sType,pNext=pNext,performanceCountersSampling=performanceCountersSampling)
+
+def VkPerformanceMarkerInfoINTEL(sType=VK_STRUCTURE_TYPE_PERFORMANCE_MARKER_INFO_INTEL,pNext=None,marker=None,):
+
+    return _new('VkPerformanceMarkerInfoINTEL', sType=sType,pNext=pNext,marker=marker)
+
+def VkPerformanceStreamMarkerInfoINTEL(sType=VK_STRUCTURE_TYPE_PERFORMANCE_STREAM_MARKER_INFO_INTEL,pNext=None,marker=None,):
+
+    return _new('VkPerformanceStreamMarkerInfoINTEL', sType=sType,pNext=pNext,marker=marker)
+
+def VkPerformanceOverrideInfoINTEL(sType=VK_STRUCTURE_TYPE_PERFORMANCE_OVERRIDE_INFO_INTEL,pNext=None,type=None,enable=None,parameter=None,):
+
+    return _new('VkPerformanceOverrideInfoINTEL', sType=sType,pNext=pNext,type=type,enable=enable,parameter=parameter)
+
+def VkPerformanceConfigurationAcquireInfoINTEL(sType=VK_STRUCTURE_TYPE_PERFORMANCE_CONFIGURATION_ACQUIRE_INFO_INTEL,pNext=None,type=None,):
+
+    return _new('VkPerformanceConfigurationAcquireInfoINTEL', sType=sType,pNext=pNext,type=type)
+
+def VkSubpassShadingPipelineCreateInfoHUAWEI(sType=VK_STRUCTURE_TYPE_SUBPASS_SHADING_PIPELINE_CREATE_INFO_HUAWEI,pNext=None,renderPass=None,subpass=None,):
+
+    return _new('VkSubpassShadingPipelineCreateInfoHUAWEI', sType=sType,pNext=pNext,renderPass=renderPass,subpass=subpass)
+
+def VkPhysicalDeviceSubpassShadingPropertiesHUAWEI(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBPASS_SHADING_PROPERTIES_HUAWEI,pNext=None,maxSubpassShadingWorkgroupSizeAspectRatio=None,):
+
+    return _new('VkPhysicalDeviceSubpassShadingPropertiesHUAWEI', sType=sType,pNext=pNext,maxSubpassShadingWorkgroupSizeAspectRatio=maxSubpassShadingWorkgroupSizeAspectRatio)
+
+def VkPhysicalDeviceClusterCullingShaderPropertiesHUAWEI(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CLUSTER_CULLING_SHADER_PROPERTIES_HUAWEI,pNext=None,maxWorkGroupCount=None,maxWorkGroupSize=None,maxOutputClusterCount=None,indirectBufferOffsetAlignment=None,):
+
+    return _new('VkPhysicalDeviceClusterCullingShaderPropertiesHUAWEI', sType=sType,pNext=pNext,maxWorkGroupCount=maxWorkGroupCount,maxWorkGroupSize=maxWorkGroupSize,maxOutputClusterCount=maxOutputClusterCount,indirectBufferOffsetAlignment=indirectBufferOffsetAlignment)
+
+def VkDeviceOrHostAddressConstAMDX(deviceAddress=None,hostAddress=None,):
+
+    return _new('VkDeviceOrHostAddressConstAMDX', deviceAddress=deviceAddress,hostAddress=hostAddress)
+
+def VkRenderPassTransformBeginInfoQCOM(sType=VK_STRUCTURE_TYPE_RENDER_PASS_TRANSFORM_BEGIN_INFO_QCOM,pNext=None,transform=None,):
+
+    return _new('VkRenderPassTransformBeginInfoQCOM', sType=sType,pNext=pNext,transform=transform)
+
+def VkCopyCommandTransformInfoQCOM(sType=VK_STRUCTURE_TYPE_COPY_COMMAND_TRANSFORM_INFO_QCOM,pNext=None,transform=None,):
+
+    return _new('VkCopyCommandTransformInfoQCOM', sType=sType,pNext=pNext,transform=transform)
+
+def VkCommandBufferInheritanceRenderPassTransformInfoQCOM(sType=VK_STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_RENDER_PASS_TRANSFORM_INFO_QCOM,pNext=None,transform=None,renderArea=None,):
+
+    return _new('VkCommandBufferInheritanceRenderPassTransformInfoQCOM', sType=sType,pNext=pNext,transform=transform,renderArea=renderArea)
+
+def VkPhysicalDeviceSubpassShadingFeaturesHUAWEI(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBPASS_SHADING_FEATURES_HUAWEI,pNext=None,subpassShading=None,):
+
+    return _new('VkPhysicalDeviceSubpassShadingFeaturesHUAWEI', sType=sType,pNext=pNext,subpassShading=subpassShading)
+
+def VkPhysicalDeviceClusterCullingShaderFeaturesHUAWEI(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CLUSTER_CULLING_SHADER_FEATURES_HUAWEI,pNext=None,clustercullingShader=None,multiviewClusterCullingShader=None,):
+
+    return _new('VkPhysicalDeviceClusterCullingShaderFeaturesHUAWEI', sType=sType,pNext=pNext,clustercullingShader=clustercullingShader,multiviewClusterCullingShader=multiviewClusterCullingShader)
+
+def VkPhysicalDeviceClusterCullingShaderVrsFeaturesHUAWEI(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CLUSTER_CULLING_SHADER_VRS_FEATURES_HUAWEI,pNext=None,clusterShadingRate=None,):
+
+    return _new('VkPhysicalDeviceClusterCullingShaderVrsFeaturesHUAWEI', sType=sType,pNext=pNext,clusterShadingRate=clusterShadingRate)
+
+def VkCuModuleCreateInfoNVX(sType=VK_STRUCTURE_TYPE_CU_MODULE_CREATE_INFO_NVX,pNext=None,dataSize=None,pData=None,):
+    if dataSize is None and pData is not None:
+        dataSize = len(pData)
+
+    return _new('VkCuModuleCreateInfoNVX', sType=sType,pNext=pNext,dataSize=dataSize,pData=pData)
+
+def VkCuFunctionCreateInfoNVX(sType=VK_STRUCTURE_TYPE_CU_FUNCTION_CREATE_INFO_NVX,pNext=None,module=None,pName=None,):
+
+    return _new('VkCuFunctionCreateInfoNVX', sType=sType,pNext=pNext,module=module,pName=pName)
+
+def VkCuLaunchInfoNVX(sType=VK_STRUCTURE_TYPE_CU_LAUNCH_INFO_NVX,pNext=None,function=None,gridDimX=None,gridDimY=None,gridDimZ=None,blockDimX=None,blockDimY=None,blockDimZ=None,sharedMemBytes=None,paramCount=None,pParams=None,extraCount=None,pExtras=None,):
+    if paramCount is None and pParams is not None:
+        paramCount = len(pParams)
+    if extraCount is None and pExtras is not None:
+        extraCount = len(pExtras)
+
+    return _new('VkCuLaunchInfoNVX', sType=sType,pNext=pNext,function=function,gridDimX=gridDimX,gridDimY=gridDimY,gridDimZ=gridDimZ,blockDimX=blockDimX,blockDimY=blockDimY,blockDimZ=blockDimZ,sharedMemBytes=sharedMemBytes,paramCount=paramCount,pParams=pParams,extraCount=extraCount,pExtras=pExtras)
+
+def VkImportMemoryBufferCollectionFUCHSIA(sType=VK_STRUCTURE_TYPE_IMPORT_MEMORY_BUFFER_COLLECTION_FUCHSIA,pNext=None,collection=None,index=None,):
+
+    return _new('VkImportMemoryBufferCollectionFUCHSIA', sType=sType,pNext=pNext,collection=collection,index=index)
+
+def VkBufferCollectionImageCreateInfoFUCHSIA(sType=VK_STRUCTURE_TYPE_BUFFER_COLLECTION_IMAGE_CREATE_INFO_FUCHSIA,pNext=None,collection=None,index=None,):
+
+    return _new('VkBufferCollectionImageCreateInfoFUCHSIA', sType=sType,pNext=pNext,collection=collection,index=index)
+
+def VkBufferCollectionBufferCreateInfoFUCHSIA(sType=VK_STRUCTURE_TYPE_BUFFER_COLLECTION_BUFFER_CREATE_INFO_FUCHSIA,pNext=None,collection=None,index=None,):
+
+    return _new('VkBufferCollectionBufferCreateInfoFUCHSIA', sType=sType,pNext=pNext,collection=collection,index=index)
+
+def VkBufferCollectionCreateInfoFUCHSIA(sType=VK_STRUCTURE_TYPE_BUFFER_COLLECTION_CREATE_INFO_FUCHSIA,pNext=None,collectionToken=None,):
+
+    return _new('VkBufferCollectionCreateInfoFUCHSIA', sType=sType,pNext=pNext,collectionToken=collectionToken)
+
+def VkBufferCollectionPropertiesFUCHSIA(sType=VK_STRUCTURE_TYPE_BUFFER_COLLECTION_PROPERTIES_FUCHSIA,pNext=None,memoryTypeBits=None,bufferCount=None,createInfoIndex=None,sysmemPixelFormat=None,formatFeatures=None,sysmemColorSpaceIndex=None,samplerYcbcrConversionComponents=None,suggestedYcbcrModel=None,suggestedYcbcrRange=None,suggestedXChromaOffset=None,suggestedYChromaOffset=None,):
+
+    return _new('VkBufferCollectionPropertiesFUCHSIA', sType=sType,pNext=pNext,memoryTypeBits=memoryTypeBits,bufferCount=bufferCount,createInfoIndex=createInfoIndex,sysmemPixelFormat=sysmemPixelFormat,formatFeatures=formatFeatures,sysmemColorSpaceIndex=sysmemColorSpaceIndex,samplerYcbcrConversionComponents=samplerYcbcrConversionComponents,suggestedYcbcrModel=suggestedYcbcrModel,suggestedYcbcrRange=suggestedYcbcrRange,suggestedXChromaOffset=suggestedXChromaOffset,suggestedYChromaOffset=suggestedYChromaOffset)
+
+def VkBufferConstraintsInfoFUCHSIA(sType=VK_STRUCTURE_TYPE_BUFFER_CONSTRAINTS_INFO_FUCHSIA,pNext=None,createInfo=None,requiredFormatFeatures=None,bufferCollectionConstraints=None,):
+
+    return _new('VkBufferConstraintsInfoFUCHSIA', sType=sType,pNext=pNext,createInfo=createInfo,requiredFormatFeatures=requiredFormatFeatures,bufferCollectionConstraints=bufferCollectionConstraints)
+
+def VkSysmemColorSpaceFUCHSIA(sType=VK_STRUCTURE_TYPE_SYSMEM_COLOR_SPACE_FUCHSIA,pNext=None,colorSpace=None,):
+
+    return _new('VkSysmemColorSpaceFUCHSIA', sType=sType,pNext=pNext,colorSpace=colorSpace)
+
+def VkImageFormatConstraintsInfoFUCHSIA(sType=VK_STRUCTURE_TYPE_IMAGE_FORMAT_CONSTRAINTS_INFO_FUCHSIA,pNext=None,imageCreateInfo=None,requiredFormatFeatures=None,flags=None,sysmemPixelFormat=None,colorSpaceCount=None,pColorSpaces=None,):
+    if colorSpaceCount is None and pColorSpaces is not None:
+        colorSpaceCount = len(pColorSpaces)
+
+    return _new('VkImageFormatConstraintsInfoFUCHSIA', sType=sType,pNext=pNext,imageCreateInfo=imageCreateInfo,requiredFormatFeatures=requiredFormatFeatures,flags=flags,sysmemPixelFormat=sysmemPixelFormat,colorSpaceCount=colorSpaceCount,pColorSpaces=pColorSpaces)
+
+def VkImageConstraintsInfoFUCHSIA(sType=VK_STRUCTURE_TYPE_IMAGE_CONSTRAINTS_INFO_FUCHSIA,pNext=None,formatConstraintsCount=None,pFormatConstraints=None,bufferCollectionConstraints=None,flags=None,):
+    if formatConstraintsCount is None and pFormatConstraints is not None:
+        formatConstraintsCount = len(pFormatConstraints)
+
+    return _new('VkImageConstraintsInfoFUCHSIA', sType=sType,pNext=pNext,formatConstraintsCount=formatConstraintsCount,pFormatConstraints=pFormatConstraints,bufferCollectionConstraints=bufferCollectionConstraints,flags=flags)
+
+def VkBufferCollectionConstraintsInfoFUCHSIA(sType=VK_STRUCTURE_TYPE_BUFFER_COLLECTION_CONSTRAINTS_INFO_FUCHSIA,pNext=None,minBufferCount=None,maxBufferCount=None,minBufferCountForCamping=None,minBufferCountForDedicatedSlack=None,minBufferCountForSharedSlack=None,):
+
+    return _new('VkBufferCollectionConstraintsInfoFUCHSIA', sType=sType,pNext=pNext,minBufferCount=minBufferCount,maxBufferCount=maxBufferCount,minBufferCountForCamping=minBufferCountForCamping,minBufferCountForDedicatedSlack=minBufferCountForDedicatedSlack,minBufferCountForSharedSlack=minBufferCountForSharedSlack)
+
+def VkAndroidHardwareBufferFormatProperties2ANDROID(sType=VK_STRUCTURE_TYPE_ANDROID_HARDWARE_BUFFER_FORMAT_PROPERTIES_2_ANDROID,pNext=None,format=None,externalFormat=None,formatFeatures=None,samplerYcbcrConversionComponents=None,suggestedYcbcrModel=None,suggestedYcbcrRange=None,suggestedXChromaOffset=None,suggestedYChromaOffset=None,):
+
+    return _new('VkAndroidHardwareBufferFormatProperties2ANDROID', sType=sType,pNext=pNext,format=format,externalFormat=externalFormat,formatFeatures=formatFeatures,samplerYcbcrConversionComponents=samplerYcbcrConversionComponents,suggestedYcbcrModel=suggestedYcbcrModel,suggestedYcbcrRange=suggestedYcbcrRange,suggestedXChromaOffset=suggestedXChromaOffset,suggestedYChromaOffset=suggestedYChromaOffset)
+
+def VkPhysicalDeviceDescriptorSetHostMappingFeaturesVALVE(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_SET_HOST_MAPPING_FEATURES_VALVE,pNext=None,descriptorSetHostMapping=None,):
+
+    return _new('VkPhysicalDeviceDescriptorSetHostMappingFeaturesVALVE', sType=sType,pNext=pNext,descriptorSetHostMapping=descriptorSetHostMapping)
+
+def VkDescriptorSetBindingReferenceVALVE(sType=VK_STRUCTURE_TYPE_DESCRIPTOR_SET_BINDING_REFERENCE_VALVE,pNext=None,descriptorSetLayout=None,binding=None,):
+
+    return _new('VkDescriptorSetBindingReferenceVALVE', sType=sType,pNext=pNext,descriptorSetLayout=descriptorSetLayout,binding=binding)
+
+def VkDescriptorSetLayoutHostMappingInfoVALVE(sType=VK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_HOST_MAPPING_INFO_VALVE,pNext=None,descriptorOffset=None,descriptorSize=None,):
+
+    return _new('VkDescriptorSetLayoutHostMappingInfoVALVE', sType=sType,pNext=pNext,descriptorOffset=descriptorOffset,descriptorSize=descriptorSize)
+
+def VkImageViewSampleWeightCreateInfoQCOM(sType=VK_STRUCTURE_TYPE_IMAGE_VIEW_SAMPLE_WEIGHT_CREATE_INFO_QCOM,pNext=None,filterCenter=None,filterSize=None,numPhases=None,):
+
+    return _new('VkImageViewSampleWeightCreateInfoQCOM', sType=sType,pNext=pNext,filterCenter=filterCenter,filterSize=filterSize,numPhases=numPhases)
+
+def VkPhysicalDeviceImageProcessingFeaturesQCOM(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_PROCESSING_FEATURES_QCOM,pNext=None,textureSampleWeighted=None,textureBoxFilter=None,textureBlockMatch=None,):
+
+    return _new('VkPhysicalDeviceImageProcessingFeaturesQCOM', sType=sType,pNext=pNext,textureSampleWeighted=textureSampleWeighted,textureBoxFilter=textureBoxFilter,textureBlockMatch=textureBlockMatch)
+
+def VkPhysicalDeviceImageProcessingPropertiesQCOM(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_PROCESSING_PROPERTIES_QCOM,pNext=None,maxWeightFilterPhases=None,maxWeightFilterDimension=None,maxBlockMatchRegion=None,maxBoxFilterBlockSize=None,):
+
+    return _new('VkPhysicalDeviceImageProcessingPropertiesQCOM', sType=sType,pNext=pNext,maxWeightFilterPhases=maxWeightFilterPhases,maxWeightFilterDimension=maxWeightFilterDimension,maxBlockMatchRegion=maxBlockMatchRegion,maxBoxFilterBlockSize=maxBoxFilterBlockSize)
+
+def VkPhysicalDeviceTilePropertiesFeaturesQCOM(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TILE_PROPERTIES_FEATURES_QCOM,pNext=None,tileProperties=None,):
+
+    return _new('VkPhysicalDeviceTilePropertiesFeaturesQCOM', sType=sType,pNext=pNext,tileProperties=tileProperties)
+
+def VkTilePropertiesQCOM(sType=VK_STRUCTURE_TYPE_TILE_PROPERTIES_QCOM,pNext=None,tileSize=None,apronSize=None,origin=None,):
+
+    return _new('VkTilePropertiesQCOM', sType=sType,pNext=pNext,tileSize=tileSize,apronSize=apronSize,origin=origin)
+
+def VkPhysicalDeviceAmigoProfilingFeaturesSEC(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_AMIGO_PROFILING_FEATURES_SEC,pNext=None,amigoProfiling=None,):
+
+    return _new('VkPhysicalDeviceAmigoProfilingFeaturesSEC', sType=sType,pNext=pNext,amigoProfiling=amigoProfiling)
+
+def VkAmigoProfilingSubmitInfoSEC(sType=VK_STRUCTURE_TYPE_AMIGO_PROFILING_SUBMIT_INFO_SEC,pNext=None,firstDrawTimestamp=None,swapBufferTimestamp=None,):
+
+    return _new('VkAmigoProfilingSubmitInfoSEC', sType=sType,pNext=pNext,firstDrawTimestamp=firstDrawTimestamp,swapBufferTimestamp=swapBufferTimestamp)
+
+def VkPhysicalDeviceShaderCoreBuiltinsPropertiesARM(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_CORE_BUILTINS_PROPERTIES_ARM,pNext=None,shaderCoreMask=None,shaderCoreCount=None,shaderWarpsPerCore=None,):
+
+    return _new('VkPhysicalDeviceShaderCoreBuiltinsPropertiesARM', sType=sType,pNext=pNext,shaderCoreMask=shaderCoreMask,shaderCoreCount=shaderCoreCount,shaderWarpsPerCore=shaderWarpsPerCore)
+
+def VkPhysicalDeviceShaderCoreBuiltinsFeaturesARM(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_CORE_BUILTINS_FEATURES_ARM,pNext=None,shaderCoreBuiltins=None,):
+
+    return _new('VkPhysicalDeviceShaderCoreBuiltinsFeaturesARM', sType=sType,pNext=pNext,shaderCoreBuiltins=shaderCoreBuiltins)
+
+def VkDirectDriverLoadingInfoLUNARG(sType=VK_STRUCTURE_TYPE_DIRECT_DRIVER_LOADING_INFO_LUNARG,pNext=None,flags=None,pfnGetInstanceProcAddr=None,):
+
+    return _new('VkDirectDriverLoadingInfoLUNARG', sType=sType,pNext=pNext,flags=flags,pfnGetInstanceProcAddr=pfnGetInstanceProcAddr)
+
+def VkDirectDriverLoadingListLUNARG(sType=VK_STRUCTURE_TYPE_DIRECT_DRIVER_LOADING_LIST_LUNARG,pNext=None,mode=None,driverCount=None,pDrivers=None,):
+    if driverCount is None and pDrivers is not None:
+        driverCount = len(pDrivers)
+
+    return _new('VkDirectDriverLoadingListLUNARG', sType=sType,pNext=pNext,mode=mode,driverCount=driverCount,pDrivers=pDrivers)
+
+def VkPhysicalDeviceMultiviewPerViewViewportsFeaturesQCOM(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTIVIEW_PER_VIEW_VIEWPORTS_FEATURES_QCOM,pNext=None,multiviewPerViewViewports=None,):
+
+    return _new('VkPhysicalDeviceMultiviewPerViewViewportsFeaturesQCOM', sType=sType,pNext=pNext,multiviewPerViewViewports=multiviewPerViewViewports)
+
+def VkPhysicalDeviceShaderCorePropertiesARM(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_CORE_PROPERTIES_ARM,pNext=None,pixelRate=None,texelRate=None,fmaRate=None,):
+
+    return _new('VkPhysicalDeviceShaderCorePropertiesARM', sType=sType,pNext=pNext,pixelRate=pixelRate,texelRate=texelRate,fmaRate=fmaRate)
+
+def VkPhysicalDeviceMultiviewPerViewRenderAreasFeaturesQCOM(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTIVIEW_PER_VIEW_RENDER_AREAS_FEATURES_QCOM,pNext=None,multiviewPerViewRenderAreas=None,):
+
+    return _new('VkPhysicalDeviceMultiviewPerViewRenderAreasFeaturesQCOM', sType=sType,pNext=pNext,multiviewPerViewRenderAreas=multiviewPerViewRenderAreas)
+
+def VkMultiviewPerViewRenderAreasRenderPassBeginInfoQCOM(sType=VK_STRUCTURE_TYPE_MULTIVIEW_PER_VIEW_RENDER_AREAS_RENDER_PASS_BEGIN_INFO_QCOM,pNext=None,perViewRenderAreaCount=None,pPerViewRenderAreas=None,):
+    if perViewRenderAreaCount is None and pPerViewRenderAreas is not None:
+        perViewRenderAreaCount = len(pPerViewRenderAreas)
+
+    return _new('VkMultiviewPerViewRenderAreasRenderPassBeginInfoQCOM', sType=sType,pNext=pNext,perViewRenderAreaCount=perViewRenderAreaCount,pPerViewRenderAreas=pPerViewRenderAreas)
+
+def VkImportScreenBufferInfoQNX(sType=VK_STRUCTURE_TYPE_IMPORT_SCREEN_BUFFER_INFO_QNX,pNext=None,buffer=None,):
+
+    return _new('VkImportScreenBufferInfoQNX', sType=sType,pNext=pNext,buffer=buffer)
+
+def VkScreenBufferPropertiesQNX(sType=VK_STRUCTURE_TYPE_SCREEN_BUFFER_PROPERTIES_QNX,pNext=None,allocationSize=None,memoryTypeBits=None,):
+
+    return _new('VkScreenBufferPropertiesQNX', sType=sType,pNext=pNext,allocationSize=allocationSize,memoryTypeBits=memoryTypeBits)
+
+def VkScreenBufferFormatPropertiesQNX(sType=VK_STRUCTURE_TYPE_SCREEN_BUFFER_FORMAT_PROPERTIES_QNX,pNext=None,format=None,externalFormat=None,screenUsage=None,formatFeatures=None,samplerYcbcrConversionComponents=None,suggestedYcbcrModel=None,suggestedYcbcrRange=None,suggestedXChromaOffset=None,suggestedYChromaOffset=None,):
+
+    return _new('VkScreenBufferFormatPropertiesQNX', sType=sType,pNext=pNext,format=format,externalFormat=externalFormat,screenUsage=screenUsage,formatFeatures=formatFeatures,samplerYcbcrConversionComponents=samplerYcbcrConversionComponents,suggestedYcbcrModel=suggestedYcbcrModel,suggestedYcbcrRange=suggestedYcbcrRange,suggestedXChromaOffset=suggestedXChromaOffset,suggestedYChromaOffset=suggestedYChromaOffset)
+
+def VkExternalFormatQNX(sType=VK_STRUCTURE_TYPE_EXTERNAL_FORMAT_QNX,pNext=None,externalFormat=None,):
+
+    return _new('VkExternalFormatQNX', sType=sType,pNext=pNext,externalFormat=externalFormat)
+
+def VkPhysicalDeviceExternalMemoryScreenBufferFeaturesQNX(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_MEMORY_SCREEN_BUFFER_FEATURES_QNX,pNext=None,screenBufferImport=None,):
+
+    return _new('VkPhysicalDeviceExternalMemoryScreenBufferFeaturesQNX', sType=sType,pNext=pNext,screenBufferImport=screenBufferImport)
+
+def VkPhysicalDeviceShaderEnqueuePropertiesAMDX(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_ENQUEUE_PROPERTIES_AMDX,pNext=None,maxExecutionGraphDepth=None,maxExecutionGraphShaderOutputNodes=None,maxExecutionGraphShaderPayloadSize=None,maxExecutionGraphShaderPayloadCount=None,executionGraphDispatchAddressAlignment=None,):
+
+    return _new('VkPhysicalDeviceShaderEnqueuePropertiesAMDX', sType=sType,pNext=pNext,maxExecutionGraphDepth=maxExecutionGraphDepth,maxExecutionGraphShaderOutputNodes=maxExecutionGraphShaderOutputNodes,maxExecutionGraphShaderPayloadSize=maxExecutionGraphShaderPayloadSize,maxExecutionGraphShaderPayloadCount=maxExecutionGraphShaderPayloadCount,executionGraphDispatchAddressAlignment=executionGraphDispatchAddressAlignment)
+
+def VkPhysicalDeviceShaderEnqueueFeaturesAMDX(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_ENQUEUE_FEATURES_AMDX,pNext=None,shaderEnqueue=None,):
+
+    return _new('VkPhysicalDeviceShaderEnqueueFeaturesAMDX', sType=sType,pNext=pNext,shaderEnqueue=shaderEnqueue)
+
+def VkExecutionGraphPipelineCreateInfoAMDX(sType=VK_STRUCTURE_TYPE_EXECUTION_GRAPH_PIPELINE_CREATE_INFO_AMDX,pNext=None,flags=None,stageCount=None,pStages=None,pLibraryInfo=None,layout=None,basePipelineHandle=None,basePipelineIndex=None,):
+    if stageCount is None and pStages is not None:
+        stageCount = len(pStages)
+
+    return _new('VkExecutionGraphPipelineCreateInfoAMDX', sType=sType,pNext=pNext,flags=flags,stageCount=stageCount,pStages=pStages,pLibraryInfo=pLibraryInfo,layout=layout,basePipelineHandle=basePipelineHandle,basePipelineIndex=basePipelineIndex)
+
+def VkPipelineShaderStageNodeCreateInfoAMDX(sType=VK_STRUCTURE_TYPE_PIPELINE_SHADER_STAGE_NODE_CREATE_INFO_AMDX,pNext=None,pName=None,index=None,):
+
+    return _new('VkPipelineShaderStageNodeCreateInfoAMDX', sType=sType,pNext=pNext,pName=pName,index=index)
+
+def VkExecutionGraphPipelineScratchSizeAMDX(sType=VK_STRUCTURE_TYPE_EXECUTION_GRAPH_PIPELINE_SCRATCH_SIZE_AMDX,pNext=None,size=None,):
+
+    return _new('VkExecutionGraphPipelineScratchSizeAMDX', sType=sType,pNext=pNext,size=size)
+
+def VkDispatchGraphInfoAMDX(nodeIndex=None,payloadCount=None,payloads=None,payloadStride=None,):
+
+    return _new('VkDispatchGraphInfoAMDX', nodeIndex=nodeIndex,payloadCount=payloadCount,payloads=payloads,payloadStride=payloadStride)
+
+def VkDispatchGraphCountInfoAMDX(count=None,infos=None,stride=None,):
+
+    return _new('VkDispatchGraphCountInfoAMDX', count=count,infos=infos,stride=stride)
+
+def VkPhysicalDeviceCubicClampFeaturesQCOM(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CUBIC_CLAMP_FEATURES_QCOM,pNext=None,cubicRangeClamp=None,):
+
+    return _new('VkPhysicalDeviceCubicClampFeaturesQCOM', sType=sType,pNext=pNext,cubicRangeClamp=cubicRangeClamp)
+
+def VkPhysicalDeviceYcbcrDegammaFeaturesQCOM(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_YCBCR_DEGAMMA_FEATURES_QCOM,pNext=None,ycbcrDegamma=None,):
+
+    return _new('VkPhysicalDeviceYcbcrDegammaFeaturesQCOM', sType=sType,pNext=pNext,ycbcrDegamma=ycbcrDegamma)
+
+def VkSamplerYcbcrConversionYcbcrDegammaCreateInfoQCOM(sType=VK_STRUCTURE_TYPE_SAMPLER_YCBCR_CONVERSION_YCBCR_DEGAMMA_CREATE_INFO_QCOM,pNext=None,enableYDegamma=None,enableCbCrDegamma=None,):
+
+    return _new('VkSamplerYcbcrConversionYcbcrDegammaCreateInfoQCOM', sType=sType,pNext=pNext,enableYDegamma=enableYDegamma,enableCbCrDegamma=enableCbCrDegamma)
+
+def VkPhysicalDeviceCubicWeightsFeaturesQCOM(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CUBIC_WEIGHTS_FEATURES_QCOM,pNext=None,selectableCubicWeights=None,):
+
+    return _new('VkPhysicalDeviceCubicWeightsFeaturesQCOM', sType=sType,pNext=pNext,selectableCubicWeights=selectableCubicWeights)
+
+def VkSamplerCubicWeightsCreateInfoQCOM(sType=VK_STRUCTURE_TYPE_SAMPLER_CUBIC_WEIGHTS_CREATE_INFO_QCOM,pNext=None,cubicWeights=None,):
+
+    return _new('VkSamplerCubicWeightsCreateInfoQCOM', sType=sType,pNext=pNext,cubicWeights=cubicWeights)
+
+def VkBlitImageCubicWeightsInfoQCOM(sType=VK_STRUCTURE_TYPE_BLIT_IMAGE_CUBIC_WEIGHTS_INFO_QCOM,pNext=None,cubicWeights=None,):
+
+    return _new('VkBlitImageCubicWeightsInfoQCOM', sType=sType,pNext=pNext,cubicWeights=cubicWeights)
+
+def VkPhysicalDeviceImageProcessing2FeaturesQCOM(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_PROCESSING_2_FEATURES_QCOM,pNext=None,textureBlockMatch2=None,):
+
+    return _new('VkPhysicalDeviceImageProcessing2FeaturesQCOM', sType=sType,pNext=pNext,textureBlockMatch2=textureBlockMatch2)
+
+def VkPhysicalDeviceImageProcessing2PropertiesQCOM(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_PROCESSING_2_PROPERTIES_QCOM,pNext=None,maxBlockMatchWindow=None,):
+
+    return _new('VkPhysicalDeviceImageProcessing2PropertiesQCOM', sType=sType,pNext=pNext,maxBlockMatchWindow=maxBlockMatchWindow)
+
+def VkSamplerBlockMatchWindowCreateInfoQCOM(sType=VK_STRUCTURE_TYPE_SAMPLER_BLOCK_MATCH_WINDOW_CREATE_INFO_QCOM,pNext=None,windowExtent=None,windowCompareMode=None,):
+
+    return _new('VkSamplerBlockMatchWindowCreateInfoQCOM', sType=sType,pNext=pNext,windowExtent=windowExtent,windowCompareMode=windowCompareMode)
+
+def VkPhysicalDeviceLayeredDriverPropertiesMSFT(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_LAYERED_DRIVER_PROPERTIES_MSFT,pNext=None,underlyingAPI=None,):
+
+    return _new('VkPhysicalDeviceLayeredDriverPropertiesMSFT', sType=sType,pNext=pNext,underlyingAPI=underlyingAPI)
+
+def VkPhysicalDeviceExternalFormatResolveFeaturesANDROID(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_FORMAT_RESOLVE_FEATURES_ANDROID,pNext=None,externalFormatResolve=None,):
+
+    return _new('VkPhysicalDeviceExternalFormatResolveFeaturesANDROID', sType=sType,pNext=pNext,externalFormatResolve=externalFormatResolve)
+
+def VkPhysicalDeviceExternalFormatResolvePropertiesANDROID(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_FORMAT_RESOLVE_PROPERTIES_ANDROID,pNext=None,nullColorAttachmentWithExternalFormatResolve=None,externalFormatResolveChromaOffsetX=None,externalFormatResolveChromaOffsetY=None,):
+
+    return _new('VkPhysicalDeviceExternalFormatResolvePropertiesANDROID', sType=sType,pNext=pNext,nullColorAttachmentWithExternalFormatResolve=nullColorAttachmentWithExternalFormatResolve,externalFormatResolveChromaOffsetX=externalFormatResolveChromaOffsetX,externalFormatResolveChromaOffsetY=externalFormatResolveChromaOffsetY)
+
+def VkAndroidHardwareBufferFormatResolvePropertiesANDROID(sType=VK_STRUCTURE_TYPE_ANDROID_HARDWARE_BUFFER_FORMAT_RESOLVE_PROPERTIES_ANDROID,pNext=None,colorAttachmentFormat=None,):
+
+    return _new('VkAndroidHardwareBufferFormatResolvePropertiesANDROID', sType=sType,pNext=pNext,colorAttachmentFormat=colorAttachmentFormat)
+
+def VkDeviceQueueShaderCoreControlCreateInfoARM(sType=VK_STRUCTURE_TYPE_DEVICE_QUEUE_SHADER_CORE_CONTROL_CREATE_INFO_ARM,pNext=None,shaderCoreCount=None,):
+
+    return _new('VkDeviceQueueShaderCoreControlCreateInfoARM', sType=sType,pNext=pNext,shaderCoreCount=shaderCoreCount)
+
+def VkPhysicalDeviceSchedulingControlsFeaturesARM(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SCHEDULING_CONTROLS_FEATURES_ARM,pNext=None,schedulingControls=None,):
+
+    return _new('VkPhysicalDeviceSchedulingControlsFeaturesARM', sType=sType,pNext=pNext,schedulingControls=schedulingControls)
+
+def VkPhysicalDeviceSchedulingControlsPropertiesARM(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SCHEDULING_CONTROLS_PROPERTIES_ARM,pNext=None,schedulingControlsFlags=None,):
+
+    return _new('VkPhysicalDeviceSchedulingControlsPropertiesARM', sType=sType,pNext=pNext,schedulingControlsFlags=schedulingControlsFlags)
+
+def VkPhysicalDeviceRelaxedLineRasterizationFeaturesIMG(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RELAXED_LINE_RASTERIZATION_FEATURES_IMG,pNext=None,relaxedLineRasterization=None,):
+
+    return _new('VkPhysicalDeviceRelaxedLineRasterizationFeaturesIMG', sType=sType,pNext=pNext,relaxedLineRasterization=relaxedLineRasterization)
+
+def VkPhysicalDeviceRenderPassStripedFeaturesARM(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RENDER_PASS_STRIPED_FEATURES_ARM,pNext=None,renderPassStriped=None,):
+
+    return _new('VkPhysicalDeviceRenderPassStripedFeaturesARM', sType=sType,pNext=pNext,renderPassStriped=renderPassStriped)
+
+def VkPhysicalDeviceRenderPassStripedPropertiesARM(sType=VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RENDER_PASS_STRIPED_PROPERTIES_ARM,pNext=None,renderPassStripeGranularity=None,maxRenderPassStripes=None,):
+
+    return _new('VkPhysicalDeviceRenderPassStripedPropertiesARM', sType=sType,pNext=pNext,renderPassStripeGranularity=renderPassStripeGranularity,maxRenderPassStripes=maxRenderPassStripes)
+
+def VkRenderPassStripeInfoARM(sType=VK_STRUCTURE_TYPE_RENDER_PASS_STRIPE_INFO_ARM,pNext=None,stripeArea=None,):
+
+    return _new('VkRenderPassStripeInfoARM', sType=sType,pNext=pNext,stripeArea=stripeArea)
+
+def VkRenderPassStripeBeginInfoARM(sType=VK_STRUCTURE_TYPE_RENDER_PASS_STRIPE_BEGIN_INFO_ARM,pNext=None,stripeInfoCount=None,pStripeInfos=None,):
+    if stripeInfoCount is None and pStripeInfos is not None:
+        stripeInfoCount = len(pStripeInfos)
+
+    return _new('VkRenderPassStripeBeginInfoARM', sType=sType,pNext=pNext,stripeInfoCount=stripeInfoCount,pStripeInfos=pStripeInfos)
+
+def VkRenderPassStripeSubmitInfoARM(sType=VK_STRUCTURE_TYPE_RENDER_PASS_STRIPE_SUBMIT_INFO_ARM,pNext=None,stripeSemaphoreInfoCount=None,pStripeSemaphoreInfos=None,):
+    if stripeSemaphoreInfoCount is None and pStripeSemaphoreInfos is not None:
+        stripeSemaphoreInfoCount = len(pStripeSemaphoreInfos)
+
+    return _new('VkRenderPassStripeSubmitInfoARM', sType=sType,pNext=pNext,stripeSemaphoreInfoCount=stripeSemaphoreInfoCount,pStripeSemaphoreInfos=pStripeSemaphoreInfos)
+
+
+
+
+
+
+
+
+
+
+def _wrap_vkGetDeviceSubpassShadingMaxWorkgroupSizeHUAWEI(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetDeviceSubpassShadingMaxWorkgroupSizeHUAWEI(
+    device
+            ,renderpass
+            ,pMaxWorkgroupSize=None
+            ,):
+
+
+        custom_return = True
+        if not pMaxWorkgroupSize:
+            pMaxWorkgroupSize = ffi.new('VkExtent2D*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(renderpass, 'VkRenderPass'),_auto_handle(pMaxWorkgroupSize, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pMaxWorkgroupSize
+
+        return pMaxWorkgroupSize[0]
+
+
+
+    return vkGetDeviceSubpassShadingMaxWorkgroupSizeHUAWEI
+def _wrap_vkCmdSubpassShadingHUAWEI(fn):
+    def vkCmdSubpassShadingHUAWEI(
+    commandBuffer
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'))
+
+
+    return vkCmdSubpassShadingHUAWEI
+def _wrap_vkCmdDrawClusterHUAWEI(fn):
+    def vkCmdDrawClusterHUAWEI(
+    commandBuffer
+            ,groupCountX
+            ,groupCountY
+            ,groupCountZ
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),groupCountX,groupCountY,groupCountZ)
+
+
+    return vkCmdDrawClusterHUAWEI
+def _wrap_vkCmdDrawClusterIndirectHUAWEI(fn):
+    def vkCmdDrawClusterIndirectHUAWEI(
+    commandBuffer
+            ,buffer
+            ,offset
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_handle(buffer, 'VkBuffer'),offset)
+
+
+    return vkCmdDrawClusterIndirectHUAWEI
+def _wrap_vkCreateViSurfaceNN(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateViSurfaceNN(
+    instance
+            ,pCreateInfo
+            ,pAllocator
+            ,pSurface=None
+            ,):
+
+
+        custom_return = True
+        if not pSurface:
+            pSurface = ffi.new('VkSurfaceKHR*')
+            custom_return = False
+
+        result = fn(_handle(instance, 'VkInstance'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pSurface, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSurface
+
+        return pSurface[0]
+
+
+
+    return vkCreateViSurfaceNN
+def _wrap_vkCreateImagePipeSurfaceFUCHSIA(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateImagePipeSurfaceFUCHSIA(
+    instance
+            ,pCreateInfo
+            ,pAllocator
+            ,pSurface=None
+            ,):
+
+
+        custom_return = True
+        if not pSurface:
+            pSurface = ffi.new('VkSurfaceKHR*')
+            custom_return = False
+
+        result = fn(_handle(instance, 'VkInstance'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pSurface, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSurface
+
+        return pSurface[0]
+
+
+
+    return vkCreateImagePipeSurfaceFUCHSIA
+def _wrap_vkCreateStreamDescriptorSurfaceGGP(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateStreamDescriptorSurfaceGGP(
+    instance
+            ,pCreateInfo
+            ,pAllocator
+            ,pSurface=None
+            ,):
+
+
+        custom_return = True
+        if not pSurface:
+            pSurface = ffi.new('VkSurfaceKHR*')
+            custom_return = False
+
+        result = fn(_handle(instance, 'VkInstance'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pSurface, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSurface
+
+        return pSurface[0]
+
+
+
+    return vkCreateStreamDescriptorSurfaceGGP
+def _wrap_vkCreateScreenSurfaceQNX(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateScreenSurfaceQNX(
+    instance
+            ,pCreateInfo
+            ,pAllocator
+            ,pSurface=None
+            ,):
+
+
+        custom_return = True
+        if not pSurface:
+            pSurface = ffi.new('VkSurfaceKHR*')
+            custom_return = False
+
+        result = fn(_handle(instance, 'VkInstance'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pSurface, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSurface
+
+        return pSurface[0]
+
+
+
+    return vkCreateScreenSurfaceQNX
+def _wrap_vkGetPhysicalDeviceScreenPresentationSupportQNX(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPhysicalDeviceScreenPresentationSupportQNX(
+    physicalDevice
+            ,queueFamilyIndex
+            ,window
+            ,):
+
+        result = fn(_handle(physicalDevice, 'VkPhysicalDevice'),queueFamilyIndex,_auto_handle(window, _args[2]))
+
+
+    return vkGetPhysicalDeviceScreenPresentationSupportQNX
+def _wrap_vkGetMemoryZirconHandleFUCHSIA(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetMemoryZirconHandleFUCHSIA(
+    device
+            ,pGetZirconHandleInfo
+            ,pZirconHandle=None
+            ,):
+
+
+        custom_return = True
+        if not pZirconHandle:
+            pZirconHandle = ffi.new('zx_handle_t*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pGetZirconHandleInfo, _args[1]),_auto_handle(pZirconHandle, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pZirconHandle
+
+        return pZirconHandle[0]
+
+
+
+    return vkGetMemoryZirconHandleFUCHSIA
+def _wrap_vkGetMemoryZirconHandlePropertiesFUCHSIA(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetMemoryZirconHandlePropertiesFUCHSIA(
+    device
+            ,handleType
+            ,zirconHandle
+            ,pMemoryZirconHandleProperties=None
+            ,):
+
+
+        custom_return = True
+        if not pMemoryZirconHandleProperties:
+            pMemoryZirconHandleProperties = ffi.new('VkMemoryZirconHandlePropertiesFUCHSIA*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),handleType,_auto_handle(zirconHandle, _args[2]),_auto_handle(pMemoryZirconHandleProperties, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pMemoryZirconHandleProperties
+
+        return pMemoryZirconHandleProperties[0]
+
+
+
+    return vkGetMemoryZirconHandlePropertiesFUCHSIA
+def _wrap_vkGetSemaphoreZirconHandleFUCHSIA(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetSemaphoreZirconHandleFUCHSIA(
+    device
+            ,pGetZirconHandleInfo
+            ,pZirconHandle=None
+            ,):
+
+
+        custom_return = True
+        if not pZirconHandle:
+            pZirconHandle = ffi.new('zx_handle_t*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pGetZirconHandleInfo, _args[1]),_auto_handle(pZirconHandle, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pZirconHandle
+
+        return pZirconHandle[0]
+
+
+
+    return vkGetSemaphoreZirconHandleFUCHSIA
+def _wrap_vkImportSemaphoreZirconHandleFUCHSIA(fn):
+    _args = ffi.typeof(fn).args
+    def vkImportSemaphoreZirconHandleFUCHSIA(
+    device
+            ,pImportSemaphoreZirconHandleInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pImportSemaphoreZirconHandleInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkImportSemaphoreZirconHandleFUCHSIA
+def _wrap_vkGetRefreshCycleDurationGOOGLE(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetRefreshCycleDurationGOOGLE(
+    device
+            ,swapchain
+            ,pDisplayTimingProperties=None
+            ,):
+
+
+        custom_return = True
+        if not pDisplayTimingProperties:
+            pDisplayTimingProperties = ffi.new('VkRefreshCycleDurationGOOGLE*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(swapchain, 'VkSwapchainKHR'),_auto_handle(pDisplayTimingProperties, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pDisplayTimingProperties
+
+        return pDisplayTimingProperties[0]
+
+
+
+    return vkGetRefreshCycleDurationGOOGLE
+def _wrap_vkGetPastPresentationTimingGOOGLE(fn):
+    def vkGetPastPresentationTimingGOOGLE(
+    device
+            ,swapchain
+            ,pPresentationTimings=None
+            ,):
+
+
+        pPresentationTimingCount = ffi.new('uint32_t*')
+        custom_return = pPresentationTimings is not None
+        _array = pPresentationTimings
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pPresentationTimingCount[0] = len(_array)
+            result = fn(_handle(device, 'VkDevice'),_handle(swapchain, 'VkSwapchainKHR'),pPresentationTimingCount,pPresentationTimings)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pPresentationTimings = ffi.NULL
+            result = fn(_handle(device, 'VkDevice'),_handle(swapchain, 'VkSwapchainKHR'),pPresentationTimingCount,pPresentationTimings)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pPresentationTimingCount[0]:
+                _array = ffi.new('VkPastPresentationTimingGOOGLE[]', pPresentationTimingCount[0])
+            pPresentationTimings = _array
+            result = fn(_handle(device, 'VkDevice'),_handle(swapchain, 'VkSwapchainKHR'),pPresentationTimingCount,pPresentationTimings)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pPresentationTimingCount[0] != len(_array):
+            pPresentationTimings = _slice(_array, pPresentationTimingCount[0])
+
+        return pPresentationTimings
+
+
+    return vkGetPastPresentationTimingGOOGLE
+def _wrap_vkCreateIOSSurfaceMVK(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateIOSSurfaceMVK(
+    instance
+            ,pCreateInfo
+            ,pAllocator
+            ,pSurface=None
+            ,):
+
+
+        custom_return = True
+        if not pSurface:
+            pSurface = ffi.new('VkSurfaceKHR*')
+            custom_return = False
+
+        result = fn(_handle(instance, 'VkInstance'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pSurface, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSurface
+
+        return pSurface[0]
+
+
+
+    return vkCreateIOSSurfaceMVK
+def _wrap_vkCreateMacOSSurfaceMVK(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateMacOSSurfaceMVK(
+    instance
+            ,pCreateInfo
+            ,pAllocator
+            ,pSurface=None
+            ,):
+
+
+        custom_return = True
+        if not pSurface:
+            pSurface = ffi.new('VkSurfaceKHR*')
+            custom_return = False
+
+        result = fn(_handle(instance, 'VkInstance'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pSurface, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSurface
+
+        return pSurface[0]
+
+
+
+    return vkCreateMacOSSurfaceMVK
+def _wrap_vkGetSwapchainGrallocUsageANDROID(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetSwapchainGrallocUsageANDROID(
+    device
+            ,format
+            ,imageUsage
+            ,grallocUsage=None
+            ,):
+
+
+        custom_return = True
+        if not grallocUsage:
+            grallocUsage = ffi.new('int*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),format,imageUsage,_auto_handle(grallocUsage, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return grallocUsage
+
+        return grallocUsage[0]
+
+
+
+    return vkGetSwapchainGrallocUsageANDROID
+def _wrap_vkGetSwapchainGrallocUsage2ANDROID(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetSwapchainGrallocUsage2ANDROID(
+    device
+            ,format
+            ,imageUsage
+            ,swapchainImageUsage
+            ,grallocConsumerUsage
+            ,grallocProducerUsage=None
+            ,):
+
+
+        custom_return = True
+        if not grallocProducerUsage:
+            grallocProducerUsage = ffi.new('uint64_t*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),format,imageUsage,swapchainImageUsage,_auto_handle(grallocConsumerUsage, _args[4]),_auto_handle(grallocProducerUsage, _args[5]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return grallocProducerUsage
+
+        return grallocProducerUsage[0]
+
+
+
+    return vkGetSwapchainGrallocUsage2ANDROID
+def _wrap_vkAcquireImageANDROID(fn):
+    def vkAcquireImageANDROID(
+    device
+            ,image
+            ,nativeFenceFd
+            ,semaphore
+            ,fence=None
+            ,):
+
+
+        custom_return = True
+        if not fence:
+            fence = ffi.new('VkFence*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(image, 'VkImage'),nativeFenceFd,_handle(semaphore, 'VkSemaphore'),_handle(fence, 'VkFence'))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return fence
+
+        return fence[0]
+
+
+
+    return vkAcquireImageANDROID
+def _wrap_vkQueueSignalReleaseImageANDROID(fn):
+    _args = ffi.typeof(fn).args
+    def vkQueueSignalReleaseImageANDROID(
+    queue
+            ,waitSemaphoreCount
+            ,pWaitSemaphores
+            ,image
+            ,pNativeFenceFd
+            ,):
+
+        result = fn(_handle(queue, 'VkQueue'),waitSemaphoreCount,_auto_handle(pWaitSemaphores, _args[2]),_handle(image, 'VkImage'),_auto_handle(pNativeFenceFd, _args[4]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkQueueSignalReleaseImageANDROID
+def _wrap_vkGetAndroidHardwareBufferPropertiesANDROID(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetAndroidHardwareBufferPropertiesANDROID(
+    device
+            ,buffer
+            ,pProperties=None
+            ,):
+
+
+        custom_return = True
+        if not pProperties:
+            pProperties = ffi.new('VkAndroidHardwareBufferPropertiesANDROID*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(buffer, _args[1]),_auto_handle(pProperties, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pProperties
+
+        return pProperties[0]
+
+
+
+    return vkGetAndroidHardwareBufferPropertiesANDROID
+def _wrap_vkGetMemoryAndroidHardwareBufferANDROID(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetMemoryAndroidHardwareBufferANDROID(
+    device
+            ,pInfo
+            ,pBuffer=None
+            ,):
+
+
+        custom_return = True
+        if not pBuffer:
+            pBuffer = ffi.new('AHardwareBuffer*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]),_auto_handle(pBuffer, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pBuffer
+
+        return pBuffer[0]
+
+
+
+    return vkGetMemoryAndroidHardwareBufferANDROID
+def _wrap_vkCmdBindInvocationMaskHUAWEI(fn):
+    def vkCmdBindInvocationMaskHUAWEI(
+    commandBuffer
+            ,imageView
+            ,imageLayout
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_handle(imageView, 'VkImageView'),imageLayout)
+
+
+    return vkCmdBindInvocationMaskHUAWEI
+def _wrap_vkGetImageViewHandleNVX(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetImageViewHandleNVX(
+    device
+            ,pInfo=None
+            ,):
+
+
+        custom_return = True
+        if not pInfo:
+            pInfo = ffi.new('VkImageViewHandleInfoNVX*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pInfo, _args[1]))
+
+        if custom_return:
+            return pInfo
+
+        return pInfo[0]
+
+
+
+    return vkGetImageViewHandleNVX
+def _wrap_vkGetImageViewAddressNVX(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetImageViewAddressNVX(
+    device
+            ,imageView
+            ,pProperties=None
+            ,):
+
+
+        custom_return = True
+        if not pProperties:
+            pProperties = ffi.new('VkImageViewAddressPropertiesNVX*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(imageView, 'VkImageView'),_auto_handle(pProperties, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pProperties
+
+        return pProperties[0]
+
+
+
+    return vkGetImageViewAddressNVX
+def _wrap_vkInitializePerformanceApiINTEL(fn):
+    _args = ffi.typeof(fn).args
+    def vkInitializePerformanceApiINTEL(
+    device
+            ,pInitializeInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pInitializeInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkInitializePerformanceApiINTEL
+def _wrap_vkUninitializePerformanceApiINTEL(fn):
+    def vkUninitializePerformanceApiINTEL(
+    device
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'))
+
+
+    return vkUninitializePerformanceApiINTEL
+def _wrap_vkCmdSetPerformanceMarkerINTEL(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetPerformanceMarkerINTEL(
+    commandBuffer
+            ,pMarkerInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pMarkerInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkCmdSetPerformanceMarkerINTEL
+def _wrap_vkCmdSetPerformanceStreamMarkerINTEL(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetPerformanceStreamMarkerINTEL(
+    commandBuffer
+            ,pMarkerInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pMarkerInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkCmdSetPerformanceStreamMarkerINTEL
+def _wrap_vkCmdSetPerformanceOverrideINTEL(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdSetPerformanceOverrideINTEL(
+    commandBuffer
+            ,pOverrideInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pOverrideInfo, _args[1]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkCmdSetPerformanceOverrideINTEL
+def _wrap_vkAcquirePerformanceConfigurationINTEL(fn):
+    _args = ffi.typeof(fn).args
+    def vkAcquirePerformanceConfigurationINTEL(
+    device
+            ,pAcquireInfo
+            ,pConfiguration=None
+            ,):
+
+
+        custom_return = True
+        if not pConfiguration:
+            pConfiguration = ffi.new('VkPerformanceConfigurationINTEL*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pAcquireInfo, _args[1]),_auto_handle(pConfiguration, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pConfiguration
+
+        return pConfiguration[0]
+
+
+
+    return vkAcquirePerformanceConfigurationINTEL
+def _wrap_vkReleasePerformanceConfigurationINTEL(fn):
+    def vkReleasePerformanceConfigurationINTEL(
+    device
+            ,configuration
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(configuration, 'VkPerformanceConfigurationINTEL'))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkReleasePerformanceConfigurationINTEL
+def _wrap_vkQueueSetPerformanceConfigurationINTEL(fn):
+    def vkQueueSetPerformanceConfigurationINTEL(
+    queue
+            ,configuration
+            ,):
+
+        result = fn(_handle(queue, 'VkQueue'),_handle(configuration, 'VkPerformanceConfigurationINTEL'))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkQueueSetPerformanceConfigurationINTEL
+def _wrap_vkGetPerformanceParameterINTEL(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetPerformanceParameterINTEL(
+    device
+            ,parameter
+            ,pValue=None
+            ,):
+
+
+        custom_return = True
+        if not pValue:
+            pValue = ffi.new('VkPerformanceValueINTEL*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),parameter,_auto_handle(pValue, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pValue
+
+        return pValue[0]
+
+
+
+    return vkGetPerformanceParameterINTEL
+def _wrap_vkCreateCuModuleNVX(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateCuModuleNVX(
+    device
+            ,pCreateInfo
+            ,pAllocator
+            ,pModule=None
+            ,):
+
+
+        custom_return = True
+        if not pModule:
+            pModule = ffi.new('VkCuModuleNVX*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pModule, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pModule
+
+        return pModule[0]
+
+
+
+    return vkCreateCuModuleNVX
+def _wrap_vkCreateCuFunctionNVX(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateCuFunctionNVX(
+    device
+            ,pCreateInfo
+            ,pAllocator
+            ,pFunction=None
+            ,):
+
+
+        custom_return = True
+        if not pFunction:
+            pFunction = ffi.new('VkCuFunctionNVX*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pFunction, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pFunction
+
+        return pFunction[0]
+
+
+
+    return vkCreateCuFunctionNVX
+def _wrap_vkDestroyCuModuleNVX(fn):
+    _args = ffi.typeof(fn).args
+    def vkDestroyCuModuleNVX(
+    device
+            ,module
+            ,pAllocator
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(module, 'VkCuModuleNVX'),_auto_handle(pAllocator, _args[2]))
+
+
+    return vkDestroyCuModuleNVX
+def _wrap_vkDestroyCuFunctionNVX(fn):
+    _args = ffi.typeof(fn).args
+    def vkDestroyCuFunctionNVX(
+    device
+            ,function
+            ,pAllocator
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(function, 'VkCuFunctionNVX'),_auto_handle(pAllocator, _args[2]))
+
+
+    return vkDestroyCuFunctionNVX
+def _wrap_vkCmdCuLaunchKernelNVX(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdCuLaunchKernelNVX(
+    commandBuffer
+            ,pLaunchInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),_auto_handle(pLaunchInfo, _args[1]))
+
+
+    return vkCmdCuLaunchKernelNVX
+def _wrap_vkCreateBufferCollectionFUCHSIA(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateBufferCollectionFUCHSIA(
+    device
+            ,pCreateInfo
+            ,pAllocator
+            ,pCollection=None
+            ,):
+
+
+        custom_return = True
+        if not pCollection:
+            pCollection = ffi.new('VkBufferCollectionFUCHSIA*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pCreateInfo, _args[1]),_auto_handle(pAllocator, _args[2]),_auto_handle(pCollection, _args[3]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pCollection
+
+        return pCollection[0]
+
+
+
+    return vkCreateBufferCollectionFUCHSIA
+def _wrap_vkSetBufferCollectionBufferConstraintsFUCHSIA(fn):
+    _args = ffi.typeof(fn).args
+    def vkSetBufferCollectionBufferConstraintsFUCHSIA(
+    device
+            ,collection
+            ,pBufferConstraintsInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(collection, 'VkBufferCollectionFUCHSIA'),_auto_handle(pBufferConstraintsInfo, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkSetBufferCollectionBufferConstraintsFUCHSIA
+def _wrap_vkSetBufferCollectionImageConstraintsFUCHSIA(fn):
+    _args = ffi.typeof(fn).args
+    def vkSetBufferCollectionImageConstraintsFUCHSIA(
+    device
+            ,collection
+            ,pImageConstraintsInfo
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(collection, 'VkBufferCollectionFUCHSIA'),_auto_handle(pImageConstraintsInfo, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+
+    return vkSetBufferCollectionImageConstraintsFUCHSIA
+def _wrap_vkDestroyBufferCollectionFUCHSIA(fn):
+    _args = ffi.typeof(fn).args
+    def vkDestroyBufferCollectionFUCHSIA(
+    device
+            ,collection
+            ,pAllocator
+            ,):
+
+        result = fn(_handle(device, 'VkDevice'),_handle(collection, 'VkBufferCollectionFUCHSIA'),_auto_handle(pAllocator, _args[2]))
+
+
+    return vkDestroyBufferCollectionFUCHSIA
+def _wrap_vkGetBufferCollectionPropertiesFUCHSIA(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetBufferCollectionPropertiesFUCHSIA(
+    device
+            ,collection
+            ,pProperties=None
+            ,):
+
+
+        custom_return = True
+        if not pProperties:
+            pProperties = ffi.new('VkBufferCollectionPropertiesFUCHSIA*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(collection, 'VkBufferCollectionFUCHSIA'),_auto_handle(pProperties, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pProperties
+
+        return pProperties[0]
+
+
+
+    return vkGetBufferCollectionPropertiesFUCHSIA
+def _wrap_vkGetDescriptorSetLayoutHostMappingInfoVALVE(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetDescriptorSetLayoutHostMappingInfoVALVE(
+    device
+            ,pBindingReference
+            ,pHostMapping=None
+            ,):
+
+
+        custom_return = True
+        if not pHostMapping:
+            pHostMapping = ffi.new('VkDescriptorSetLayoutHostMappingInfoVALVE*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pBindingReference, _args[1]),_auto_handle(pHostMapping, _args[2]))
+
+        if custom_return:
+            return pHostMapping
+
+        return pHostMapping[0]
+
+
+
+    return vkGetDescriptorSetLayoutHostMappingInfoVALVE
+def _wrap_vkGetDescriptorSetHostMappingVALVE(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetDescriptorSetHostMappingVALVE(
+    device
+            ,descriptorSet
+            ,ppData=None
+            ,):
+
+
+        custom_return = True
+        if not ppData:
+            ppData = ffi.new('void*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(descriptorSet, 'VkDescriptorSet'),_auto_handle(ppData, _args[2]))
+
+        if custom_return:
+            return ppData
+
+        return ppData[0]
+
+
+
+    return vkGetDescriptorSetHostMappingVALVE
+def _wrap_vkGetFramebufferTilePropertiesQCOM(fn):
+    def vkGetFramebufferTilePropertiesQCOM(
+    device
+            ,framebuffer
+            ,pProperties=None
+            ,):
+
+
+        pPropertiesCount = ffi.new('uint32_t*')
+        custom_return = pProperties is not None
+        _array = pProperties
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pPropertiesCount[0] = len(_array)
+            result = fn(_handle(device, 'VkDevice'),_handle(framebuffer, 'VkFramebuffer'),pPropertiesCount,pProperties)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pProperties = ffi.NULL
+            result = fn(_handle(device, 'VkDevice'),_handle(framebuffer, 'VkFramebuffer'),pPropertiesCount,pProperties)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pPropertiesCount[0]:
+                _array = ffi.new('VkTilePropertiesQCOM[]', pPropertiesCount[0])
+            pProperties = _array
+            result = fn(_handle(device, 'VkDevice'),_handle(framebuffer, 'VkFramebuffer'),pPropertiesCount,pProperties)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pPropertiesCount[0] != len(_array):
+            pProperties = _slice(_array, pPropertiesCount[0])
+
+        return pProperties
+
+
+    return vkGetFramebufferTilePropertiesQCOM
+def _wrap_vkGetDynamicRenderingTilePropertiesQCOM(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetDynamicRenderingTilePropertiesQCOM(
+    device
+            ,pRenderingInfo
+            ,pProperties=None
+            ,):
+
+
+        custom_return = True
+        if not pProperties:
+            pProperties = ffi.new('VkTilePropertiesQCOM*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(pRenderingInfo, _args[1]),_auto_handle(pProperties, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pProperties
+
+        return pProperties[0]
+
+
+
+    return vkGetDynamicRenderingTilePropertiesQCOM
+def _wrap_vkGetScreenBufferPropertiesQNX(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetScreenBufferPropertiesQNX(
+    device
+            ,buffer
+            ,pProperties=None
+            ,):
+
+
+        custom_return = True
+        if not pProperties:
+            pProperties = ffi.new('VkScreenBufferPropertiesQNX*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_auto_handle(buffer, _args[1]),_auto_handle(pProperties, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pProperties
+
+        return pProperties[0]
+
+
+
+    return vkGetScreenBufferPropertiesQNX
+def _wrap_vkGetExecutionGraphPipelineScratchSizeAMDX(fn):
+    _args = ffi.typeof(fn).args
+    def vkGetExecutionGraphPipelineScratchSizeAMDX(
+    device
+            ,executionGraph
+            ,pSizeInfo=None
+            ,):
+
+
+        custom_return = True
+        if not pSizeInfo:
+            pSizeInfo = ffi.new('VkExecutionGraphPipelineScratchSizeAMDX*')
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(executionGraph, 'VkPipeline'),_auto_handle(pSizeInfo, _args[2]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pSizeInfo
+
+        return pSizeInfo[0]
+
+
+
+    return vkGetExecutionGraphPipelineScratchSizeAMDX
+def _wrap_vkGetExecutionGraphPipelineNodeIndexAMDX(fn):
+    def vkGetExecutionGraphPipelineNodeIndexAMDX(
+    device
+            ,executionGraph
+            ,pNodeIndex=None
+            ,):
+
+
+        pNodeInfo = ffi.new('VkPipelineShaderStageNodeCreateInfoAMDX*')
+        custom_return = pNodeIndex is not None
+        _array = pNodeIndex
+
+        if custom_return:
+            # the buffer is usually big enough, one call instead of two
+            pNodeInfo[0] = len(_array)
+            result = fn(_handle(device, 'VkDevice'),_handle(executionGraph, 'VkPipeline'),pNodeInfo,pNodeIndex)
+        else:
+            result = VK_INCOMPLETE
+
+        # the count can change between the two calls
+        while result == VK_INCOMPLETE:
+            pNodeIndex = ffi.NULL
+            result = fn(_handle(device, 'VkDevice'),_handle(executionGraph, 'VkPipeline'),pNodeInfo,pNodeIndex)
+            if result != VK_SUCCESS:
+                raise exception_codes[result]
+
+            if _array is None or len(_array) < pNodeInfo[0]:
+                _array = ffi.new('uint32_t[]', pNodeInfo[0])
+            pNodeIndex = _array
+            result = fn(_handle(device, 'VkDevice'),_handle(executionGraph, 'VkPipeline'),pNodeInfo,pNodeIndex)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if pNodeInfo[0] != len(_array):
+            pNodeIndex = _slice(_array, pNodeInfo[0])
+
+        return pNodeIndex
+
+
+    return vkGetExecutionGraphPipelineNodeIndexAMDX
+def _wrap_vkCreateExecutionGraphPipelinesAMDX(fn):
+    _args = ffi.typeof(fn).args
+    def vkCreateExecutionGraphPipelinesAMDX(
+    device
+            ,pipelineCache
+            ,createInfoCount
+            ,pCreateInfos
+            ,pAllocator
+            ,pPipelines=None
+            ,):
+
+
+        custom_return = True
+        if not pPipelines:
+            pPipelines = ffi.new('VkPipeline[%d]' % createInfoCount)
+            custom_return = False
+
+        result = fn(_handle(device, 'VkDevice'),_handle(pipelineCache, 'VkPipelineCache'),createInfoCount,_auto_handle(pCreateInfos, _args[3]),_auto_handle(pAllocator, _args[4]),_auto_handle(pPipelines, _args[5]))
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
+
+        if custom_return:
+            return pPipelines
+
+        return pPipelines
+
+
+
+    return vkCreateExecutionGraphPipelinesAMDX
+def _wrap_vkCmdInitializeGraphScratchMemoryAMDX(fn):
+    def vkCmdInitializeGraphScratchMemoryAMDX(
+    commandBuffer
+            ,scratch
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),scratch)
+
+
+    return vkCmdInitializeGraphScratchMemoryAMDX
+def _wrap_vkCmdDispatchGraphAMDX(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdDispatchGraphAMDX(
+    commandBuffer
+            ,scratch
+            ,pCountInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),scratch,_auto_handle(pCountInfo, _args[2]))
+
+
+    return vkCmdDispatchGraphAMDX
+def _wrap_vkCmdDispatchGraphIndirectAMDX(fn):
+    _args = ffi.typeof(fn).args
+    def vkCmdDispatchGraphIndirectAMDX(
+    commandBuffer
+            ,scratch
+            ,pCountInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),scratch,_auto_handle(pCountInfo, _args[2]))
+
+
+    return vkCmdDispatchGraphIndirectAMDX
+def _wrap_vkCmdDispatchGraphIndirectCountAMDX(fn):
+    def vkCmdDispatchGraphIndirectCountAMDX(
+    commandBuffer
+            ,scratch
+            ,countInfo
+            ,):
+
+        result = fn(_handle(commandBuffer, 'VkCommandBuffer'),scratch,countInfo)
+
+
+    return vkCmdDispatchGraphIndirectCountAMDX
@@ -0,0 +1,11 @@
+# auto-generated file
+import _cffi_backend
+
+ffi = _cffi_backend.FFI('vulkan._vulkancache',
+    _version = 0x2601,
+    _types = b'\x00\x10\x36\x0D\x00\x0D\x2B\x03\x00\x0B\x7D\x03\x00\x03\x86\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x11\x47\x03\x00\x00\x1F\x03\x00\x0C\x9F\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x11\x6A\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x0B\x11\x00\x0B\xDA\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x0B\x11\x00\x0D\x8C\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x0B\x11\x00\x0D\x8D\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x0B\x11\x00\x0D\x90\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x11\x7A\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0B\x5E\x03\x00\x12\xF4\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0B\x61\x03\x00\x00\x02\x11\x00\x08\xFE\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0B\x62\x03\x00\x00\x02\x11\x00\x01\xF6\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0B\x7A\x03\x00\x00\x07\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0B\x7C\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x00\x02\x11\x00\x02\x0D\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0B\xB1\x03\x00\x00\x27\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0B\xB6\x03\x00\x00\x02\x11\x00\x01\xFC\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0B\xC3\x03\x00\x00\x02\x11\x00\x09\x08\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0B\xD9\x03\x00\x00\x0B\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0B\xE7\x03\x00\x00\x02\x11\x00\x02\x02\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0B\xFC\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0B\xFD\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0C\x01\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0C\x06\x03\x00\x00\x02\x11\x00\x09\x27\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0C\x08\x03\x00\x00\x02\x11\x00\x09\x2C\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0C\x0A\x03\x00\x00\x02\x11\x00\x09\x31\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0C\x0C\x03\x00\x00\x02\x11\x00\x02\x07\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0C\x10\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0C\x11\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0C\x18\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0C\x19\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0C\x2F\x03\x00\x00\x02\x11\x00\x02\x45\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0C\x33\x03\x00\x09\x55\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0C\x39\x03\x00\x00\x02\x11\x00\x09\x45\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0C\x40\x03\x00\x00\x02\x11\x00\x06\xC8\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0C\x4C\x03\x00\x00\x02\x11\x00\x02\x6E\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0C\x51\x03\x00\x0C\x52\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0C\x5A\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0C\x95\x03\x00\x00\x02\x11\x00\x02\x6A\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x00\x5F\x0B\x00\x00\x07\x01\x00\x0D\x42\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x00\xC1\x11\x00\x00\x27\x11\x00\x0D\x59\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x00\xC1\x11\x00\x12\xF4\x03\x00\x0D\x4B\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0C\xB5\x03\x00\x00\x02\x11\x00\x00\xAE\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0C\xB6\x03\x00\x00\xC2\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0C\xB7\x03\x00\x00\x27\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0C\xCA\x03\x00\x00\x02\x11\x00\x02\x72\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0C\xE7\x03\x00\x00\x27\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0C\xF0\x03\x00\x00\x02\x11\x00\x02\x7D\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0D\x0C\x03\x00\x00\x27\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0D\x0E\x03\x00\x00\x02\x11\x00\x02\x78\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0D\x16\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0D\x17\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0D\x1C\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0D\x1D\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0D\x1F\x03\x00\x00\x02\x11\x00\x09\xA8\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0D\x27\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0D\x3C\x03\x00\x00\x02\x11\x00\x01\xFD\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0D\x43\x03\x00\x11\x63\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0D\x44\x03\x00\x00\xDA\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0D\x45\x03\x00\x00\xDF\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0D\x46\x03\x00\x00\xDF\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0D\x4C\x03\x00\x00\xDF\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0D\x58\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0D\x5D\x03\x00\x00\x02\x11\x00\x09\xAD\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x00\x8F\x0B\x00\x00\x18\x01\x00\x11\x91\x03\x00\x00\x18\x01\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0D\x7C\x03\x00\x00\x02\x11\x00\x02\x88\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0D\x83\x03\x00\x02\x8F\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x00\xA0\x0B\x00\x0D\x92\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0E\x8E\x03\x00\x00\x07\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0E\xB1\x03\x00\x00\x02\x11\x00\x02\x30\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0E\xCC\x03\x00\x00\x07\x11\x00\x0E\xCD\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x01\x64\x11\x00\x00\x07\x11\x00\x0E\xD0\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0E\xD5\x03\x00\x0B\x99\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x01\x70\x11\x00\x00\x07\x11\x00\x0E\xCE\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0E\xD9\x03\x00\x00\x02\x11\x00\x05\xB5\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0F\x0D\x03\x00\x00\x02\x11\x00\x01\x44\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0F\x17\x03\x00\x00\x02\x11\x00\x02\xCC\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0F\x38\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0F\x3D\x03\x00\x00\x02\x11\x00\x02\xD6\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0F\x3C\x03\x00\x00\x02\x11\x00\x01\x93\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x0F\x54\x03\x00\x10\xB6\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x10\x3F\x03\x00\x00\x27\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x10\x41\x03\x00\x00\x02\x11\x00\x09\xE5\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x10\x47\x03\x00\x00\x02\x11\x00\x09\xE0\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x10\x4E\x03\x00\x00\x02\x11\x00\x02\xDB\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x10\x4F\x03\x00\x00\xDA\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x10\x50\x03\x00\x00\xDF\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x10\x52\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x10\x58\x03\x00\x00\x18\x01\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x10\x61\x03\x00\x00\x02\x11\x00\x09\xF4\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x10\xAD\x03\x00\x00\x02\x11\x00\x02\xEB\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x10\xBD\x03\x00\x00\x02\x11\x00\x03\x1E\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x25\x03\x00\x11\x24\x03\x00\x01\xF7\x03\x00\x00\x27\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x33\x03\x00\x00\x02\x11\x00\x03\x2A\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x35\x03\x00\x00\x02\x11\x00\x03\x36\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x64\x03\x00\x0B\x82\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x66\x03\x00\x00\x1C\x01\x00\x00\x27\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x69\x03\x00\x11\x79\x03\x00\x00\x18\x01\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x6B\x03\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x6F\x03\x00\x01\xE0\x11\x00\x00\x27\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x72\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\x0D\x11\x00\x0B\xF4\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\x0D\x11\x00\x0B\xF5\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\x0D\x11\x00\x0B\xFF\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\x0D\x11\x00\x0C\x02\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\x0D\x11\x00\x0C\x03\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\x0D\x11\x00\x0C\x05\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\x0D\x11\x00\x11\x8D\x03\x00\x00\x16\x01\x00\x0F\x2B\x03\x00\x00\x02\x11\x00\x02\xB7\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\x0D\x11\x00\x00\x16\x01\x00\x0B\x5A\x03\x00\x0B\x5B\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\x0D\x11\x00\x00\x16\x01\x00\x0D\x5A\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x73\x03\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\x45\x11\x00\x00\x16\x01\x00\x09\x55\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x01\xFD\x11\x00\x00\x16\x01\x00\x00\xDF\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x01\xFD\x11\x00\x00\x18\x01\x00\x00\x18\x01\x00\x00\x16\x01\x00\x00\xDF\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x7B\x03\x00\x0C\x74\x03\x00\x00\x02\x11\x00\x00\xAE\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\x5E\x11\x00\x0C\x81\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x7D\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x7E\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x7F\x03\x00\x00\x07\x11\x00\x01\x9E\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x81\x03\x00\x0D\x0B\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x83\x03\x00\x0C\xF3\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\x7D\x11\x00\x01\xFD\x11\x00\x00\x18\x01\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x87\x03\x00\x00\x95\x0B\x00\x02\x78\x11\x00\x00\x78\x0B\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x88\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\x30\x11\x00\x01\xE0\x11\x00\x00\x27\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\x30\x11\x00\x00\x16\x01\x00\x0B\xED\x03\x00\x00\x02\x11\x00\x02\x34\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\x30\x11\x00\x00\x16\x01\x00\x0C\xD8\x03\x00\x00\x02\x11\x00\x02\x34\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\x30\x11\x00\x00\x16\x01\x00\x0F\x2C\x03\x00\x00\x02\x11\x00\x02\x34\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\x30\x11\x00\x00\x16\x01\x00\x02\x30\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x90\x03\x00\x00\xD8\x0B\x00\x00\xD7\x0B\x00\x01\xE0\x11\x00\x00\x27\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\xB7\x11\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\xB7\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x1C\x01\x00\x00\x27\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x92\x03\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x1C\x01\x00\x00\x27\x11\x00\x00\x18\x01\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x94\x03\x00\x0C\xA0\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x99\x03\x00\x01\x43\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x9A\x03\x00\x01\xE0\x11\x00\x00\x27\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x9C\x03\x00\x00\x07\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x9D\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\xEB\x11\x00\x0D\x2D\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\xEB\x11\x00\x0D\x2E\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\xEB\x11\x00\x0F\x37\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\xEB\x11\x00\x00\xE5\x0B\x00\x02\xDC\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\xEB\x11\x00\x00\x07\x11\x00\x0D\x81\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\xEB\x11\x00\x00\x07\x11\x00\x00\xF0\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\xEB\x11\x00\x00\x18\x01\x00\x02\xDB\x11\x00\x02\x6E\x11\x00\x00\x07\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x02\xEB\x11\x00\x00\x18\x01\x00\x00\x18\x01\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x9E\x03\x00\x01\xE0\x11\x00\x00\x27\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x03\x1E\x11\x00\x00\x16\x01\x00\x03\x1E\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\x9F\x03\x00\x00\x07\x11\x00\x11\x34\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x03\x2A\x11\x00\x00\x16\x01\x00\x0B\xA9\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x11\xA0\x03\x00\x11\x36\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x00\x16\x01\x00\x0B\x9A\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x00\x16\x01\x00\x0B\x9C\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x00\x16\x01\x00\x0B\xA0\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x00\x16\x01\x00\x0B\xC8\x03\x00\x02\xDC\x11\x00\x02\xDC\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x00\x16\x01\x00\x0C\xE2\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x00\x16\x01\x00\x0D\x39\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x00\x16\x01\x00\x10\x5F\x03\x00\x00\x02\x11\x00\x02\xE0\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x00\x16\x01\x00\x01\xD2\x11\x00\x00\x02\x11\x00\x01\xD4\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x00\x16\x01\x00\x08\xFE\x03\x00\x00\xBD\x0B\x00\x00\x1C\x01\x00\x00\x27\x11\x00\x00\x1C\x01\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x00\x16\x01\x00\x02\x6E\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x00\x16\x01\x00\x03\x73\x11\x00\x00\x16\x01\x00\x00\x18\x01\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x22\x11\x00\x00\x16\x01\x00\x09\xAD\x03\x00\x03\x6B\x11\x00\x00\x1C\x01\x00\x00\x27\x11\x00\x00\x1C\x01\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x11\x85\x03\x00\x0B\x84\x03\x00\x00\x02\x11\x00\x02\xE6\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\x86\x11\x00\x0C\x12\x03\x00\x00\x02\x11\x00\x0A\x45\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\x86\x11\x00\x0C\x17\x03\x00\x00\x02\x11\x00\x0A\x4A\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\x86\x11\x00\x0C\x86\x03\x00\x00\x02\x11\x00\x03\x89\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\x86\x11\x00\x0C\xDF\x03\x00\x00\x02\x11\x00\x03\x89\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\x86\x11\x00\x11\x3B\x03\x00\x00\x02\x11\x00\x03\x89\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\x86\x11\x00\x11\x3E\x03\x00\x00\x02\x11\x00\x03\x89\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\x86\x11\x00\x11\x44\x03\x00\x00\x02\x11\x00\x03\x89\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\x86\x11\x00\x11\x45\x03\x00\x00\x02\x11\x00\x03\x89\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\x86\x11\x00\x00\x07\x11\x00\x0D\xF6\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\x86\x11\x00\x00\x07\x11\x00\x03\xC6\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x11\x8C\x03\x00\x0C\x48\x03\x00\x00\x02\x11\x00\x00\x22\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x0C\x7E\x03\x00\x0C\x7C\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x00\x66\x0B\x00\x00\x7A\x0B\x00\x00\x79\x0B\x00\x00\x16\x01\x00\x00\x16\x01\x00\x0C\xF6\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x03\xD2\x11\x00\x03\xD3\x11\x00\x03\xD4\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x0C\xA8\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x0D\x78\x03\x00\x00\x07\x11\x00\x0D\x79\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x0D\xFF\x03\x00\x0C\xF5\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x01\x59\x11\x00\x10\x9E\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x01\x59\x11\x00\x00\x07\x11\x00\x0F\x05\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x01\x59\x11\x00\x00\x07\x11\x00\x10\xA2\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x0E\xA1\x03\x00\x11\x1F\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x0E\xA2\x03\x00\x00\x07\x11\x00\x11\x2A\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x11\x2E\x03\x00\x10\xD2\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x00\x06\x11\x00\x00\x07\x11\x00\x00\x08\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x00\x15\x01\x00\x02\x5E\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x00\x15\x01\x00\x00\x16\x01\x00\x02\x5E\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x02\x5E\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x02\x5E\x11\x00\x0C\x76\x03\x00\x00\x02\x11\x00\x04\x39\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x02\x5E\x11\x00\x00\x07\x11\x00\x0C\x78\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x02\x5E\x11\x00\x00\x07\x11\x00\x0C\x79\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x11\x7C\x03\x00\x00\x16\x01\x00\x0C\x7D\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x02\xE6\x11\x00\x10\x9D\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x02\xE6\x11\x00\x10\xA0\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x02\xE6\x11\x00\x00\x07\x11\x00\x03\xF7\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x02\xE6\x11\x00\x00\x07\x11\x00\x0F\x34\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x02\xE6\x11\x00\x00\x07\x11\x00\x10\xA3\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x00\x07\x11\x00\x0B\xF2\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x00\x07\x11\x00\x0B\xF3\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x00\x07\x11\x00\x0C\x7F\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x00\x07\x11\x00\x0C\x80\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x00\x07\x11\x00\x0C\x84\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x00\x07\x11\x00\x0C\x85\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x00\x07\x11\x00\x0C\xCB\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x00\x07\x11\x00\x0D\x33\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x00\x07\x11\x00\x0D\xF0\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x00\x07\x11\x00\x0E\x97\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x00\x07\x11\x00\x10\xB7\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x00\x16\x01\x00\x04\x1E\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x00\x16\x01\x00\x02\xE6\x11\x00\x00\x07\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x00\x16\x01\x00\x00\x07\x11\x00\x0D\x87\x03\x00\x0D\x86\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x03\xC6\x11\x00\x00\x16\x01\x00\x00\x07\x11\x00\x04\x1E\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x11\x93\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x04\xA9\x11\x00\x0F\x03\x03\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x04\xA9\x11\x00\x02\x8F\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x04\xA9\x11\x00\x00\x16\x01\x00\x0B\xA7\x03\x00\x02\x6E\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x04\xA9\x11\x00\x00\x16\x01\x00\x10\x86\x03\x00\x02\x6E\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x04\xA9\x11\x00\x00\x16\x01\x00\x10\x85\x03\x00\x02\x6E\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x07\x11\x00\x00\x00\x0F\x00\x10\x36\x0D\x00\x00\x07\x11\x00\x04\x7F\x11\x00\x00\x00\x0F\x00\x00\x1F\x0D\x00\x00\x41\x0B\x00\x00\x16\x01\x00\x0C\x16\x03\x00\x00\x27\x11\x00\x00\x00\x0F\x00\x00\x1F\x0D\x00\x00\x22\x11\x00\x0D\x0F\x03\x00\x00\x00\x0F\x00\x00\x1F\x0D\x00\x00\x22\x11\x00\x02\x0D\x11\x00\x00\x00\x0F\x00\x00\x1F\x0D\x00\x03\xC6\x11\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x00\x1F\x0D\x00\x03\xC6\x11\x00\x00\x16\x01\x00\x0A\xDC\x03\x00\x00\x0A\x01\x00\x00\x00\x0F\x00\x00\x1F\x0D\x00\x03\xC6\x11\x00\x00\x16\x01\x00\x11\xA1\x03\x00\x00\x00\x0F\x00\x00\x1F\x0D\x00\x03\xC6\x11\x00\x00\x16\x01\x00\x12\xF7\x03\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x00\x1F\x0D\x00\x00\x16\x01\x00\x00\x40\x0B\x00\x00\x18\x01\x00\x00\x1C\x01\x00\x00\x15\x01\x00\x00\x06\x11\x00\x00\x06\x11\x00\x00\x27\x11\x00\x00\x00\x0F\x00\x01\x43\x0D\x00\x00\x22\x11\x00\x0B\x63\x03\x00\x00\x00\x0F\x00\x01\x43\x0D\x00\x00\x22\x11\x00\x0B\xB8\x03\x00\x00\x00\x0F\x00\x01\x43\x0D\x00\x00\x22\x11\x00\x0C\x62\x03\x00\x00\x00\x0F\x00\x01\x43\x0D\x00\x00\x22\x11\x00\x0E\xD4\x03\x00\x00\x00\x0F\x00\x01\x43\x0D\x00\x00\x22\x11\x00\x02\xB7\x11\x00\x00\x16\x01\x00\x00\xD6\x0B\x00\x00\x00\x0F\x00\x00\x27\x0D\x00\x00\x27\x11\x00\x00\x1C\x01\x00\x00\x1C\x01\x00\x00\xE8\x0B\x00\x00\x00\x0F\x00\x00\x27\x0D\x00\x00\x27\x11\x00\x00\x27\x11\x00\x00\x1C\x01\x00\x00\x1C\x01\x00\x05\x13\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x0C\x64\x03\x00\x00\x27\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x0B\x6C\x03\x00\x01\xFC\x11\x00\x00\x18\x01\x00\x00\x16\x01\x00\x01\xF6\x11\x00\x01\xF6\x11\x00\x01\xFC\x11\x00\x00\x18\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x0B\x9D\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x0B\x9E\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x0B\xAE\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x2B\x0B\x00\x00\x16\x01\x00\x0B\xD4\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x33\x0B\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x0B\xEF\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x38\x0B\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x02\x12\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x02\x17\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x0B\xF6\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x0B\xF7\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x0B\xFA\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x0B\xFB\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x02\x1C\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x02\x21\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x02\x26\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x02\x2B\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x3B\x0B\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x3C\x0B\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x0C\x07\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x0C\x0B\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x0C\x0F\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x0C\x14\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x0C\x1F\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x0C\x20\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x54\x0B\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x0C\xA0\x03\x00\x0C\xC0\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x69\x0B\x00\x05\x9B\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x6D\x0B\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x0C\xCD\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x87\x0B\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x88\x0B\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\xA3\x0B\x00\x11\x8E\x03\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x05\xB4\x11\x00\x05\xB5\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x11\x3F\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x05\xB4\x11\x00\x05\xB5\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x02\x4C\x11\x00\x00\x16\x01\x00\x00\x1F\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x05\xB4\x11\x00\x05\xB5\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x05\xC8\x11\x00\x01\x43\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x05\xB4\x11\x00\x02\xB7\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x05\xB4\x11\x00\x02\xB7\x11\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\xB0\x0B\x00\x01\xFC\x11\x00\x00\x18\x01\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x05\xE0\x11\x00\x02\xCC\x11\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\xB2\x0B\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\xB6\x0B\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\xB7\x0B\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x0F\x11\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x0F\x12\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x0F\x13\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x0F\x3A\x03\x00\x10\x87\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x06\x05\x11\x00\x00\xE2\x0B\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x01\x9D\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x0F\x55\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\xC7\x0B\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x06\x17\x11\x00\x05\xC8\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x10\x3B\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x10\x59\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x10\x81\x03\x00\x06\x28\x11\x00\x06\x28\x11\x00\x06\x28\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x06\x28\x11\x00\x06\x28\x11\x00\x06\x28\x11\x00\x06\x28\x11\x00\x00\x18\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x06\x06\x11\x00\x10\x92\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x06\x0B\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x06\x3B\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\xE9\x0B\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x10\xD1\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x10\xD7\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x10\xEA\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x11\x1D\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x11\x29\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x06\x63\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x0D\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x0D\x01\x00\x00\x0D\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x0D\x01\x00\x00\x0D\x01\x00\x00\x0D\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x01\xF6\x11\x00\x01\xF6\x11\x00\x00\x39\x0B\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x01\xFC\x11\x00\x01\xFC\x11\x00\x00\x16\x01\x00\x0B\xB4\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x01\xFC\x11\x00\x02\x7D\x11\x00\x02\x8B\x11\x00\x00\x16\x01\x00\x0B\xBB\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x01\xFC\x11\x00\x00\x18\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x01\xFC\x11\x00\x00\x18\x01\x00\x00\x7E\x0B\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x01\xFC\x11\x00\x00\x18\x01\x00\x01\xFC\x11\x00\x00\x18\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x01\xFC\x11\x00\x00\x18\x01\x00\x01\xFC\x11\x00\x00\x18\x01\x00\x00\x18\x01\x00\x01\xFC\x11\x00\x00\x18\x01\x00\x00\x18\x01\x00\x01\xFC\x11\x00\x00\x18\x01\x00\x00\x18\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x01\xFC\x11\x00\x00\x18\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x01\xFC\x11\x00\x00\x18\x01\x00\x00\x18\x01\x00\x06\x8E\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x01\xFC\x11\x00\x00\x18\x01\x00\x00\x18\x01\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x01\xFC\x11\x00\x00\x18\x01\x00\x00\x18\x01\x00\x00\xCE\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x11\x77\x03\x00\x05\xB5\x11\x00\x00\x16\x01\x00\x00\xCE\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x02\x6A\x11\x00\x05\x8E\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x02\x6A\x11\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x02\x6A\x11\x00\x00\x18\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x02\x78\x11\x00\x02\x8B\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x02\x7D\x11\x00\x02\x8B\x11\x00\x0B\xCD\x03\x00\x00\x16\x01\x00\x0D\x05\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x02\x7D\x11\x00\x02\x8B\x11\x00\x0B\xCE\x03\x00\x00\x16\x01\x00\x06\xE7\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x02\x7D\x11\x00\x02\x8B\x11\x00\x01\xFC\x11\x00\x00\x16\x01\x00\x06\x83\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x02\x7D\x11\x00\x02\x8B\x11\x00\x02\x7D\x11\x00\x02\x8B\x11\x00\x00\x16\x01\x00\x0C\xE6\x03\x00\x00\x65\x0B\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x02\x7D\x11\x00\x02\x8B\x11\x00\x02\x7D\x11\x00\x02\x8B\x11\x00\x00\x16\x01\x00\x0C\xEE\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x02\x7D\x11\x00\x02\x8B\x11\x00\x02\x7D\x11\x00\x02\x8B\x11\x00\x00\x16\x01\x00\x0C\xFF\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x02\x88\x11\x00\x0D\x76\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x05\xB5\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\xCE\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x02\xCC\x11\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x02\xCC\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x02\xCC\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x01\xFC\x11\x00\x00\x18\x01\x00\x00\x18\x01\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x02\xCC\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x02\x3A\x11\x00\x02\x3B\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x02\x3A\x11\x00\x05\xD1\x11\x00\x05\xC8\x11\x00\x05\xC8\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x0B\xCC\x03\x00\x00\x16\x01\x00\x0B\xCF\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x0C\x1A\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x0C\x26\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x05\xA8\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x02\x41\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x0D\x64\x03\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x04\x17\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x0D\x65\x03\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x0F\x34\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x02\xB8\x03\x00\x02\xE0\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x00\xDE\x0B\x00\x07\x8A\x11\x00\x07\x8A\x11\x00\x05\x42\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x10\xCC\x03\x00\x00\x16\x01\x00\x10\xC9\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x11\x37\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x06\x5F\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x03\x6A\x11\x00\x03\x6B\x11\x00\x02\xCC\x11\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x01\xF6\x03\x00\x03\x6B\x11\x00\x02\xCC\x11\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x00\x0B\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x02\x6A\x03\x00\x05\x8E\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x07\xB8\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x0D\x3F\x03\x00\x00\x16\x01\x00\x0B\xBE\x03\x00\x00\x16\x01\x00\x0C\xFA\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x03\x7F\x11\x00\x03\x6B\x11\x00\x02\xCC\x11\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x00\x14\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x05\xC8\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x0B\xD5\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x0B\xD6\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x07\x7F\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x10\x68\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x07\x99\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x11\x39\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x11\x3A\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x01\xFC\x03\x00\x05\xD1\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x08\x0D\x11\x00\x05\xD1\x11\x00\x05\xD1\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x08\x0D\x11\x00\x05\xD1\x11\x00\x05\xD1\x11\x00\x05\xD1\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x01\xFC\x11\x00\x00\x18\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x05\xC8\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x15\x01\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x07\xC2\x11\x00\x00\x16\x01\x00\x07\xC4\x11\x00\x00\x16\x01\x00\x07\xC6\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x18\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x18\x01\x00\x01\xFC\x11\x00\x00\x18\x01\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x18\x01\x00\x02\xCC\x11\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x18\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x18\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x02\x7D\x11\x00\x02\x8B\x11\x00\x0D\x04\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\x18\x01\x00\x00\x18\x01\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x0B\x11\x00\x00\xCE\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x00\x14\x0B\x00\x02\x3A\x11\x00\x05\xC8\x11\x00\x0B\x5D\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x08\x89\x11\x00\x02\x41\x11\x00\x0D\x5B\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x0B\x6F\x03\x00\x0D\x51\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x0B\x78\x03\x00\x0B\x5F\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x0B\xBF\x03\x00\x08\x97\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\x9B\x11\x00\x08\x97\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x0C\x2B\x03\x00\x00\x1C\x01\x00\x00\x27\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x0C\x34\x03\x00\x0C\x3A\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x00\xA0\x11\x00\x0C\x3B\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x0C\x47\x03\x00\x08\x97\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x0C\x60\x03\x00\x08\x97\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x08\xC3\x11\x00\x00\x07\x11\x00\x10\x74\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x0C\x61\x03\x00\x10\x9B\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x0C\x6D\x03\x00\x04\xA9\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x0C\xCE\x03\x00\x08\x97\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x0C\xFB\x03\x00\x08\x97\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x0D\x00\x03\x00\x00\x07\x11\x00\x08\xCA\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x0D\x63\x03\x00\x08\x9C\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x01\x42\x11\x00\x00\x18\x01\x00\x01\x44\x11\x00\x02\xDC\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x0F\x4E\x03\x00\x02\xD7\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x01\xCC\x11\x00\x10\x62\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x11\x65\x03\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x01\xF6\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x11\x68\x03\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x01\xFC\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x01\xFC\x11\x00\x0D\x52\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\x02\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\x02\x11\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\x02\x11\x00\x00\x16\x01\x00\x07\xB3\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x11\x6C\x03\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x11\x6D\x03\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x11\x6E\x03\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\x07\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\x0D\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\x45\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x11\x75\x03\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x09\x45\x11\x00\x00\x16\x01\x00\x02\xDC\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x09\x45\x11\x00\x02\xDC\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x11\x76\x03\x00\x06\xC8\x11\x00\x00\xCE\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x09\x55\x11\x00\x00\xDF\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x06\xC8\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x01\xFD\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x01\xFD\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x01\xFD\x11\x00\x00\x0D\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x01\xFD\x11\x00\x02\xDC\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\x6A\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\x6E\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\x72\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\x78\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\x7D\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\x7D\x11\x00\x0D\x03\x03\x00\x10\x9C\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\x7D\x11\x00\x0D\x02\x03\x00\x08\xCF\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\x7D\x11\x00\x09\x13\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\x7D\x11\x00\x00\x07\x11\x00\x10\x75\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x11\x84\x03\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x11\x86\x03\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\x88\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\x30\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x05\xB5\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\xB7\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x01\x44\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\xCC\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\xCC\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\xD6\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\xD6\x11\x00\x02\xD7\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x11\x95\x03\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x11\x97\x03\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\xDB\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\xE0\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x11\x9B\x03\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x09\xF4\x11\x00\x08\xFA\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\xEB\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\xEB\x11\x00\x0C\xD7\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\xEB\x11\x00\x10\x5A\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x02\xEB\x11\x00\x00\x16\x01\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x03\x1E\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x03\x2A\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x03\x36\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x00\x16\x01\x00\x05\xBE\x11\x00\x00\x16\x01\x00\x0B\xF9\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x00\x16\x01\x00\x02\xEB\x03\x00\x0C\xDE\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x08\xD4\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x22\x11\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x16\x01\x00\x00\x07\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x03\x86\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x03\x86\x11\x00\x04\xCD\x11\x00\x00\x16\x01\x00\x04\xCF\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x03\x86\x11\x00\x11\x70\x03\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x03\x86\x11\x00\x11\x71\x03\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x03\x86\x11\x00\x02\xE6\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x03\x86\x11\x00\x00\x16\x01\x00\x04\xF1\x11\x00\x00\x18\x01\x00\x00\x1C\x01\x00\x00\x15\x01\x00\x00\x06\x11\x00\x00\x06\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x03\xC6\x11\x00\x03\xD2\x11\x00\x0C\xBE\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x03\xC6\x11\x00\x03\xD2\x11\x00\x0C\xBC\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x03\xC6\x11\x00\x03\xD2\x11\x00\x03\xD3\x11\x00\x06\x17\x11\x00\x00\x16\x01\x00\x03\xD4\x11\x00\x00\x07\x11\x00\x10\x6F\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x03\xC6\x11\x00\x0D\xD7\x03\x00\x0C\xA2\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x03\xC6\x11\x00\x0D\xD8\x03\x00\x0C\xA5\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x03\xC6\x11\x00\x0D\xDE\x03\x00\x0C\xB3\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x03\xC6\x11\x00\x0D\xE2\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x03\xC6\x11\x00\x0D\xE1\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x03\xC6\x11\x00\x0E\x20\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x03\xC6\x11\x00\x0E\x1F\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x03\xC6\x11\x00\x0E\x49\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x03\xC6\x11\x00\x0E\x48\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x03\xC6\x11\x00\x0E\x86\x03\x00\x00\x07\x11\x00\x10\x6E\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x03\xC6\x11\x00\x0F\x18\x03\x00\x00\x07\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x03\xC6\x11\x00\x06\x17\x11\x00\x0D\x66\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x03\xC6\x11\x00\x00\x07\x11\x00\x0F\x22\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x03\xC6\x11\x00\x00\x07\x11\x00\x0F\x21\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x04\xA9\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x04\xA9\x11\x00\x05\x8A\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x04\xA9\x11\x00\x0D\x7F\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x04\xA9\x11\x00\x00\x07\x11\x00\x0B\xC9\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x04\xA9\x11\x00\x00\x07\x11\x00\x0B\xCA\x03\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x27\x11\x00\x00\x1C\x01\x00\x00\x83\x0B\x00\x05\x13\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x27\x11\x00\x00\x27\x11\x00\x00\x00\x0F\x00\x12\xF4\x0D\x00\x00\x00\x0F\x00\x12\xF3\x0D\x00\x00\x22\x11\x00\x00\x06\x11\x00\x00\x00\x0F\x00\x12\xF3\x0D\x00\x03\x86\x11\x00\x00\x06\x11\x00\x00\x00\x0F\x00\x0A\xDB\x03\x00\x00\x01\x09\x00\x00\x02\x09\x00\x00\x03\x09\x00\x00\x04\x09\x00\x00\x05\x09\x00\x00\x06\x09\x00\x00\x07\x09\x00\x00\x08\x09\x00\x00\x09\x09\x00\x00\x0A\x09\x00\x00\x0B\x09\x00\x0A\xE8\x03\x00\x0A\xE8\x03\x00\x04\x3D\x09\x00\x00\x00\x0B\x00\x0A\xEB\x03\x00\x00\x0C\x09\x00\x00\x0D\x09\x00\x0A\xEE\x03\x00\x00\x0E\x09\x00\x00\x0F\x09\x00\x0A\xF1\x03\x00\x00\x10\x09\x00\x00\x11\x09\x00\x0A\xF4\x03\x00\x00\x12\x09\x00\x00\x13\x09\x00\x0A\xF7\x03\x00\x00\x14\x09\x00\x00\x15\x09\x00\x0A\xFA\x03\x00\x00\x16\x09\x00\x0A\xFC\x03\x00\x00\x17\x09\x00\x0A\xFE\x03\x00\x00\x18\x09\x00\x00\x19\x09\x00\x0B\x01\x03\x00\x00\x1A\x09\x00\x00\x1B\x09\x00\x0B\x04\x03\x00\x00\x1C\x09\x00\x00\x1D\x09\x00\x0B\x07\x03\x00\x00\x1E\x09\x00\x00\x1F\x09\x00\x0B\x0A\x03\x00\x00\x20\x09\x00\x0B\x0C\x03\x00\x00\x21\x09\x00\x00\x22\x09\x00\x0B\x0F\x03\x00\x00\x23\x09\x00\x00\x24\x09\x00\x0B\x12\x03\x00\x00\x25\x09\x00\x00\x26\x09\x00\x0B\x15\x03\x00\x00\x27\x09\x00\x00\x28\x09\x00\x0B\x18\x03\x00\x00\x29\x09\x00\x00\x2A\x09\x00\x00\x01\x0B\x00\x00\x02\x0B\x00\x00\x03\x0B\x00\x00\x04\x0B\x00\x0B\x1F\x03\x00\x00\x2B\x09\x00\x00\x05\x0B\x00\x00\x06\x0B\x00\x00\x07\x0B\x00\x00\x08\x0B\x00\x0B\x25\x03\x00\x00\x2C\x09\x00\x00\x09\x0B\x00\x00\x0A\x0B\x00\x00\x2D\x09\x00\x00\x0B\x0B\x00\x0B\x2B\x03\x00\x00\x2E\x09\x00\x0B\x2D\x03\x00\x00\x2F\x09\x00\x0B\x2F\x03\x00\x00\x30\x09\x00\x00\x0C\x0B\x00\x00\x31\x09\x00\x00\x32\x09\x00\x00\x0D\x0B\x00\x00\x0E\x0B\x00\x00\x0F\x0B\x00\x0B\x37\x03\x00\x00\x33\x09\x00\x00\x34\x09\x00\x0B\x3A\x03\x00\x00\x35\x09\x00\x00\x10\x0B\x00\x0B\x3D\x03\x00\x00\x36\x09\x00\x0B\x3F\x03\x00\x00\x37\x09\x00\x00\x11\x0B\x00\x00\x38\x09\x00\x0B\x43\x03\x00\x00\x39\x09\x00\x00\x12\x0B\x00\x0B\x46\x03\x00\x00\x3A\x09\x00\x00\x3B\x09\x00\x0B\x49\x03\x00\x00\x3C\x09\x00\x0B\x4B\x03\x00\x00\x3D\x09\x00\x0B\x4D\x03\x00\x00\x3E\x09\x00\x0B\x4F\x03\x00\x00\x3F\x09\x00\x00\x40\x09\x00\x00\x13\x0B\x00\x00\x41\x09\x00\x00\x42\x09\x00\x0B\x55\x03\x00\x00\x43\x09\x00\x0B\x57\x03\x00\x00\x44\x09\x00\x00\x45\x09\x00\x00\x46\x09\x00\x00\x47\x09\x00\x0B\x5C\x03\x00\x00\x48\x09\x00\x00\x49\x09\x00\x00\x4A\x09\x00\x00\x15\x0B\x00\x00\x16\x0B\x00\x00\x4B\x09\x00\x00\x4C\x09\x00\x00\x4D\x09\x00\x00\x4E\x09\x00\x00\x4F\x09\x00\x00\x50\x09\x00\x0B\x68\x03\x00\x0B\x69\x03\x00\x00\x51\x09\x00\x00\x52\x09\x00\x00\x53\x09\x00\x00\x54\x09\x00\x00\x55\x09\x00\x00\x57\x09\x00\x00\x58\x09\x00\x00\x17\x0B\x00\x00\x59\x09\x00\x00\x5A\x09\x00\x00\x5B\x09\x00\x00\x18\x0B\x00\x00\x5D\x09\x00\x00\x5E\x09\x00\x00\x19\x0B\x00\x00\x5F\x09\x00\x00\x1A\x0B\x00\x00\x60\x09\x00\x00\x1B\x0B\x00\x00\x61\x09\x00\x00\x62\x09\x00\x00\x63\x09\x00\x00\x64\x09\x00\x00\x65\x09\x00\x00\x66\x09\x00\x00\x67\x09\x00\x00\x68\x09\x00\x00\x69\x09\x00\x0B\x86\x03\x00\x00\x6A\x09\x00\x0B\x8A\x03\x00\x0B\x89\x03\x00\x00\x6C\x09\x00\x00\x6B\x09\x00\x00\x1C\x0B\x00\x00\x6D\x09\x00\x00\x1D\x0B\x00\x0B\x91\x03\x00\x0B\x90\x03\x00\x00\x6F\x09\x00\x00\x6E\x09\x00\x00\x70\x09\x00\x00\x71\x09\x00\x0B\x95\x03\x00\x00\x72\x09\x00\x00\x1E\x0B\x00\x0B\x98\x03\x00\x00\x73\x09\x00\x00\x74\x09\x00\x00\x75\x09\x00\x00\x76\x09\x00\x00\x77\x09\x00\x00\x78\x09\x00\x00\x79\x09\x00\x00\x7A\x09\x00\x00\x7B\x09\x00\x00\x7C\x09\x00\x00\x7D\x09\x00\x00\x7E\x09\x00\x00\x7F\x09\x00\x00\x80\x09\x00\x00\x81\x09\x00\x00\x82\x09\x00\x00\x83\x09\x00\x00\x84\x09\x00\x00\x1F\x0B\x00\x00\x20\x0B\x00\x00\x21\x0B\x00\x00\x85\x09\x00\x00\x86\x09\x00\x00\x22\x0B\x00\x00\x23\x0B\x00\x00\x87\x09\x00\x0B\xB3\x03\x00\x00\x89\x09\x00\x00\x88\x09\x00\x00\x24\x0B\x00\x00\x8A\x09\x00\x00\x8B\x09\x00\x00\x8C\x09\x00\x0B\xBA\x03\x00\x00\x8E\x09\x00\x00\x8D\x09\x00\x0B\xBD\x03\x00\x00\x90\x09\x00\x00\x8F\x09\x00\x00\x91\x09\x00\x00\x92\x09\x00\x00\x25\x0B\x00\x00\x93\x09\x00\x00\x94\x09\x00\x00\x26\x0B\x00\x00\x27\x0B\x00\x00\x28\x0B\x00\x00\x29\x0B\x00\x00\x97\x09\x00\x00\x98\x09\x00\x00\x99\x09\x00\x00\x2A\x0B\x00\x00\x9A\x09\x00\x00\x9B\x09\x00\x00\x9C\x09\x00\x00\x9D\x09\x00\x0B\xD1\x03\x00\x00\x9E\x09\x00\x0B\xD3\x03\x00\x00\x9F\x09\x00\x00\xA0\x09\x00\x00\xA1\x09\x00\x00\xA2\x09\x00\x00\x2C\x0B\x00\x00\x2D\x0B\x00\x00\xA3\x09\x00\x00\xA4\x09\x00\x00\xA5\x09\x00\x0B\xDD\x03\x00\x00\xA6\x09\x00\x00\xA7\x09\x00\x00\xA8\x09\x00\x00\xA9\x09\x00\x00\x2E\x0B\x00\x00\x2F\x0B\x00\x0B\xE4\x03\x00\x00\xAA\x09\x00\x00\x30\x0B\x00\x00\x31\x0B\x00\x00\xAC\x09\x00\x00\x32\x0B\x00\x00\xAE\x09\x00\x00\x34\x0B\x00\x00\x35\x0B\x00\x00\x36\x0B\x00\x00\xAF\x09\x00\x00\xB0\x09\x00\x00\xB1\x09\x00\x00\x37\x0B\x00\x00\xB2\x09\x00\x00\xB3\x09\x00\x00\xB4\x09\x00\x00\xB5\x09\x00\x00\xB6\x09\x00\x00\xB7\x09\x00\x00\xB8\x09\x00\x00\xB9\x09\x00\x00\xBA\x09\x00\x00\xBB\x09\x00\x00\xBC\x09\x00\x00\xBD\x09\x00\x00\xBE\x09\x00\x00\xBF\x09\x00\x00\xC0\x09\x00\x00\xC1\x09\x00\x00\xC2\x09\x00\x00\xC3\x09\x00\x00\xC4\x09\x00\x00\x3A\x0B\x00\x00\xC5\x09\x00\x00\xC6\x09\x00\x00\xC8\x09\x00\x00\xC9\x09\x00\x00\x3D\x0B\x00\x00\xCB\x09\x00\x00\xCD\x09\x00\x00\xCE\x09\x00\x00\x3E\x0B\x00\x00\xD0\x09\x00\x00\xD1\x09\x00\x00\xD2\x09\x00\x00\xD3\x09\x00\x00\xD4\x09\x00\x00\x3F\x0B\x00\x00\xD6\x09\x00\x00\x42\x0B\x00\x00\xD7\x09\x00\x00\xD8\x09\x00\x00\xDA\x09\x00\x00\xDB\x09\x00\x00\xDC\x09\x00\x00\xDD\x09\x00\x00\xDE\x09\x00\x00\xDF\x09\x00\x00\x43\x0B\x00\x00\xE1\x09\x00\x00\xE2\x09\x00\x00\x44\x0B\x00\x00\xE3\x09\x00\x0C\x24\x03\x00\x00\xE4\x09\x00\x00\x45\x0B\x00\x00\xE5\x09\x00\x00\xE6\x09\x00\x0C\x29\x03\x00\x00\xE7\x09\x00\x00\xE8\x09\x00\x00\xE9\x09\x00\x0C\x2D\x03\x00\x00\xEA\x09\x00\x00\x46\x0B\x00\x00\xEB\x09\x00\x00\xEC\x09\x00\x0C\x32\x03\x00\x00\xED\x09\x00\x00\xEF\x09\x00\x00\xF0\x09\x00\x0C\x36\x03\x00\x00\xF1\x09\x00\x00\xF2\x09\x00\x00\x47\x0B\x00\x00\xF3\x09\x00\x00\xF4\x09\x00\x00\xF5\x09\x00\x00\xF7\x09\x00\x00\xF8\x09\x00\x0C\x3F\x03\x00\x00\x48\x0B\x00\x00\xFA\x09\x00\x0C\x42\x03\x00\x00\xFB\x09\x00\x00\x49\x0B\x00\x00\xFD\x09\x00\x00\x4A\x0B\x00\x00\x4B\x0B\x00\x00\xFE\x09\x00\x00\xFF\x09\x00\x01\x00\x09\x00\x01\x01\x09\x00\x00\x4C\x0B\x00\x01\x02\x09\x00\x00\x4D\x0B\x00\x0C\x4F\x03\x00\x01\x03\x09\x00\x00\x4E\x0B\x00\x01\x04\x09\x00\x01\x05\x09\x00\x00\x4F\x0B\x00\x01\x06\x09\x00\x0C\x56\x03\x00\x01\x07\x09\x00\x01\x08\x09\x00\x01\x09\x09\x00\x01\x0A\x09\x00\x01\x0B\x09\x00\x01\x0C\x09\x00\x00\x50\x0B\x00\x01\x0D\x09\x00\x01\x0E\x09\x00\x01\x0F\x09\x00\x01\x10\x09\x00\x01\x11\x09\x00\x01\x12\x09\x00\x01\x13\x09\x00\x01\x14\x09\x00\x00\x51\x0B\x00\x01\x16\x09\x00\x01\x17\x09\x00\x01\x18\x09\x00\x00\x52\x0B\x00\x0C\x6B\x03\x00\x01\x19\x09\x00\x01\x1A\x09\x00\x01\x1B\x09\x00\x01\x1C\x09\x00\x0C\x70\x03\x00\x01\x1E\x09\x00\x01\x1F\x09\x00\x00\x53\x0B\x00\x01\x20\x09\x00\x01\x21\x09\x00\x00\x55\x0B\x00\x01\x23\x09\x00\x01\x25\x09\x00\x01\x26\x09\x00\x01\x27\x09\x00\x01\x28\x09\x00\x00\x56\x0B\x00\x01\x29\x09\x00\x01\x2A\x09\x00\x01\x2B\x09\x00\x01\x2C\x09\x00\x01\x2D\x09\x00\x01\x2E\x09\x00\x00\x57\x0B\x00\x01\x2F\x09\x00\x01\x30\x09\x00\x01\x31\x09\x00\x01\x32\x09\x00\x01\x33\x09\x00\x01\x34\x09\x00\x01\x35\x09\x00\x01\x36\x09\x00\x00\x58\x0B\x00\x0C\x8D\x03\x00\x01\x37\x09\x00\x0C\x8F\x03\x00\x01\x38\x09\x00\x01\x39\x09\x00\x01\x3A\x09\x00\x0C\x93\x03\x00\x00\x59\x0B\x00\x00\x5A\x0B\x00\x01\x3B\x09\x00\x01\x3D\x09\x00\x01\x3E\x09\x00\x01\x3F\x09\x00\x01\x40\x09\x00\x01\x41\x09\x00\x01\x42\x09\x00\x01\x43\x09\x00\x01\x44\x09\x00\x0C\x9F\x03\x00\x01\x45\x09\x00\x01\x46\x09\x00\x01\x47\x09\x00\x01\x48\x09\x00\x00\x5B\x0B\x00\x00\x5C\x0B\x00\x01\x49\x09\x00\x01\x4A\x09\x00\x01\x4B\x09\x00\x01\x4C\x09\x00\x01\x4D\x09\x00\x01\x4E\x09\x00\x00\x5D\x0B\x00\x00\x5E\x0B\x00\x00\x60\x0B\x00\x01\x4F\x09\x00\x01\x50\x09\x00\x01\x51\x09\x00\x00\x61\x0B\x00\x00\x62\x0B\x00\x01\x52\x09\x00\x00\x63\x0B\x00\x01\x53\x09\x00\x01\x54\x09\x00\x01\x55\x09\x00\x00\x64\x0B\x00\x01\x57\x09\x00\x03\xD2\x03\x00\x00\x67\x0B\x00\x01\x59\x09\x00\x01\x5A\x09\x00\x01\x58\x09\x00\x01\x5B\x09\x00\x00\x68\x0B\x00\x0C\xC0\x05\x00\x00\x00\x02\x00\x00\x6A\x0B\x00\x01\x5C\x09\x00\x00\x6B\x0B\x00\x0C\xC7\x03\x00\x01\x5D\x09\x00\x01\x5E\x09\x00\x00\x6C\x0B\x00\x01\x5F\x09\x00\x01\x60\x09\x00\x00\x6E\x0B\x00\x01\x62\x09\x00\x01\x63\x09\x00\x01\x64\x09\x00\x01\x65\x09\x00\x00\x6F\x0B\x00\x00\x70\x0B\x00\x0C\xD4\x03\x00\x01\x66\x09\x00\x01\x67\x09\x00\x00\x71\x0B\x00\x01\x68\x09\x00\x01\x69\x09\x00\x01\x6A\x09\x00\x00\x72\x0B\x00\x01\x6B\x09\x00\x0C\xDD\x03\x00\x01\x6C\x09\x00\x01\x6D\x09\x00\x01\x6E\x09\x00\x01\x6F\x09\x00\x00\x73\x0B\x00\x01\x70\x09\x00\x00\x74\x0B\x00\x0C\xE5\x03\x00\x01\x72\x09\x00\x01\x71\x09\x00\x01\x73\x09\x00\x01\x74\x09\x00\x00\x75\x0B\x00\x00\x76\x0B\x00\x01\x75\x09\x00\x0C\xED\x03\x00\x01\x77\x09\x00\x01\x76\x09\x00\x00\x77\x0B\x00\x01\x78\x09\x00\x01\x79\x09\x00\x01\x7A\x09\x00\x01\x7B\x09\x00\x01\x7C\x09\x00\x01\x7E\x09\x00\x01\x7D\x09\x00\x02\x8B\x03\x00\x0C\xF9\x03\x00\x01\x80\x09\x00\x01\x7F\x09\x00\x01\x81\x09\x00\x01\x82\x09\x00\x0C\xFE\x03\x00\x01\x84\x09\x00\x01\x83\x09\x00\x01\x85\x09\x00\x01\x86\x09\x00\x01\x88\x09\x00\x01\x87\x09\x00\x01\x89\x09\x00\x01\x8A\x09\x00\x01\x8B\x09\x00\x0D\x08\x03\x00\x01\x8C\x09\x00\x00\x7B\x0B\x00\x01\x8D\x09\x00\x01\x8E\x09\x00\x01\x8F\x09\x00\x00\x7C\x0B\x00\x01\x90\x09\x00\x01\x91\x09\x00\x01\x92\x09\x00\x01\x93\x09\x00\x01\x94\x09\x00\x00\x7D\x0B\x00\x01\x95\x09\x00\x01\x98\x09\x00\x01\x99\x09\x00\x01\x9A\x09\x00\x01\x9B\x09\x00\x01\x9C\x09\x00\x01\x9D\x09\x00\x01\x9E\x09\x00\x01\x9F\x09\x00\x01\xA0\x09\x00\x06\x8E\x03\x00\x01\xA1\x09\x00\x0D\x21\x03\x00\x01\xA3\x09\x00\x00\x7F\x0B\x00\x0D\x24\x03\x00\x01\xA4\x09\x00\x00\x80\x0B\x00\x00\x81\x0B\x00\x01\xA5\x09\x00\x0D\x29\x03\x00\x01\xA6\x09\x00\x00\x82\x0B\x00\x01\xA7\x09\x00\x00\x84\x0B\x00\x01\xA9\x09\x00\x01\xAA\x09\x00\x01\xAB\x09\x00\x01\xAC\x09\x00\x0D\x32\x03\x00\x01\xAD\x09\x00\x01\xAE\x09\x00\x0D\x35\x03\x00\x01\xAF\x09\x00\x00\x85\x0B\x00\x01\xB0\x09\x00\x00\x86\x0B\x00\x01\xB1\x09\x00\x00\x89\x0B\x00\x01\xB2\x09\x00\x01\xB3\x09\x00\x0D\x3E\x03\x00\x01\xB5\x09\x00\x01\xB4\x09\x00\x01\xB6\x09\x00\x01\xB7\x09\x00\x01\xB8\x09\x00\x01\xB9\x09\x00\x01\xBA\x09\x00\x01\xBB\x09\x00\x01\xBC\x09\x00\x01\xBD\x09\x00\x00\x8A\x0B\x00\x0D\x47\x05\x00\x00\x00\x10\x00\x01\xBE\x09\x00\x01\xBF\x09\x00\x01\xC0\x09\x00\x00\x8B\x0B\x00\x01\xC1\x09\x00\x00\x8C\x0B\x00\x01\xC3\x09\x00\x01\xC2\x09\x00\x0D\x54\x03\x00\x01\xC4\x09\x00\x01\xC5\x09\x00\x0D\x55\x05\x00\x00\x00\x20\x00\x01\xC6\x09\x00\x01\xC7\x09\x00\x01\xC8\x09\x00\x01\xC9\x09\x00\x00\x8D\x0B\x00\x01\xCA\x09\x00\x01\xCC\x09\x00\x00\x8E\x0B\x00\x0D\x61\x03\x00\x0D\x62\x03\x00\x01\xCD\x09\x00\x01\xCE\x09\x00\x01\xCF\x09\x00\x01\xD0\x09\x00\x01\xD1\x09\x00\x01\xD2\x09\x00\x01\xD3\x09\x00\x01\xD4\x09\x00\x01\xD5\x09\x00\x0D\x6C\x03\x00\x01\xD6\x09\x00\x0D\x6E\x03\x00\x01\xD7\x09\x00\x01\xD8\x09\x00\x0D\x6F\x05\x00\x00\x00\x02\x00\x00\x90\x0B\x00\x00\x91\x0B\x00\x01\xD9\x09\x00\x00\x92\x0B\x00\x01\xDA\x09\x00\x00\x93\x0B\x00\x01\xDB\x09\x00\x01\xDC\x09\x00\x00\x94\x0B\x00\x00\x96\x0B\x00\x01\xDD\x09\x00\x01\xDE\x09\x00\x00\x97\x0B\x00\x01\xE0\x09\x00\x00\x98\x0B\x00\x01\xE1\x09\x00\x00\x99\x0B\x00\x01\xE2\x09\x00\x00\x9A\x0B\x00\x00\x9B\x0B\x00\x01\xE4\x09\x00\x01\xE5\x09\x00\x01\xE6\x09\x00\x00\x9C\x0B\x00\x00\x9D\x0B\x00\x00\x9E\x0B\x00\x01\xE7\x09\x00\x01\xE8\x09\x00\x00\x9F\x0B\x00\x01\xE9\x09\x00\x01\xEA\x09\x00\x01\xEB\x09\x00\x01\xEC\x09\x00\x00\xA1\x0B\x00\x01\xED\x09\x00\x01\xEE\x09\x00\x01\xEF\x09\x00\x01\xF0\x09\x00\x01\xF1\x09\x00\x01\xF2\x09\x00\x01\xF3\x09\x00\x01\xF4\x09\x00\x01\xF5\x09\x00\x01\xF6\x09\x00\x01\xF7\x09\x00\x01\xF8\x09\x00\x01\xF9\x09\x00\x01\xFA\x09\x00\x01\xFB\x09\x00\x01\xFC\x09\x00\x01\xFD\x09\x00\x01\xFE\x09\x00\x01\xFF\x09\x00\x02\x00\x09\x00\x02\x01\x09\x00\x02\x02\x09\x00\x02\x03\x09\x00\x02\x04\x09\x00\x02\x05\x09\x00\x02\x06\x09\x00\x02\x07\x09\x00\x02\x08\x09\x00\x02\x09\x09\x00\x02\x0A\x09\x00\x02\x0B\x09\x00\x02\x0C\x09\x00\x02\x0D\x09\x00\x02\x0E\x09\x00\x02\x0F\x09\x00\x02\x10\x09\x00\x02\x11\x09\x00\x02\x12\x09\x00\x02\x13\x09\x00\x02\x14\x09\x00\x02\x15\x09\x00\x02\x16\x09\x00\x02\x17\x09\x00\x02\x18\x09\x00\x02\x19\x09\x00\x02\x1A\x09\x00\x02\x1B\x09\x00\x02\x1C\x09\x00\x02\x1D\x09\x00\x02\x1E\x09\x00\x02\x1F\x09\x00\x02\x20\x09\x00\x02\x21\x09\x00\x02\x22\x09\x00\x02\x23\x09\x00\x02\x24\x09\x00\x02\x25\x09\x00\x02\x26\x09\x00\x02\x27\x09\x00\x02\x28\x09\x00\x02\x29\x09\x00\x02\x2A\x09\x00\x02\x2B\x09\x00\x02\x2C\x09\x00\x02\x2D\x09\x00\x02\x2E\x09\x00\x02\x2F\x09\x00\x02\x30\x09\x00\x02\x31\x09\x00\x02\x32\x09\x00\x02\x33\x09\x00\x02\x34\x09\x00\x02\x35\x09\x00\x02\x36\x09\x00\x02\x37\x09\x00\x02\x38\x09\x00\x0D\xE2\x03\x00\x02\x3A\x09\x00\x02\x39\x09\x00\x02\x3B\x09\x00\x02\x3C\x09\x00\x02\x3D\x09\x00\x02\x3E\x09\x00\x02\x3F\x09\x00\x02\x40\x09\x00\x02\x41\x09\x00\x02\x42\x09\x00\x02\x43\x09\x00\x02\x44\x09\x00\x02\x45\x09\x00\x02\x46\x09\x00\x02\x47\x09\x00\x02\x48\x09\x00\x02\x49\x09\x00\x02\x4A\x09\x00\x02\x4B\x09\x00\x02\x4C\x09\x00\x02\x4D\x09\x00\x02\x4E\x09\x00\x02\x4F\x09\x00\x02\x50\x09\x00\x02\x51\x09\x00\x02\x52\x09\x00\x02\x53\x09\x00\x02\x54\x09\x00\x02\x55\x09\x00\x02\x56\x09\x00\x02\x57\x09\x00\x02\x58\x09\x00\x02\x59\x09\x00\x02\x5A\x09\x00\x02\x5B\x09\x00\x02\x5C\x09\x00\x02\x5D\x09\x00\x02\x5E\x09\x00\x02\x5F\x09\x00\x02\x60\x09\x00\x02\x61\x09\x00\x02\x62\x09\x00\x02\x63\x09\x00\x02\x64\x09\x00\x02\x65\x09\x00\x02\x66\x09\x00\x02\x67\x09\x00\x02\x68\x09\x00\x02\x69\x09\x00\x02\x6A\x09\x00\x02\x6B\x09\x00\x02\x6C\x09\x00\x02\x6D\x09\x00\x02\x6E\x09\x00\x02\x6F\x09\x00\x02\x70\x09\x00\x02\x71\x09\x00\x02\x72\x09\x00\x02\x73\x09\x00\x02\x74\x09\x00\x02\x75\x09\x00\x02\x76\x09\x00\x02\x78\x09\x00\x02\x77\x09\x00\x02\x79\x09\x00\x02\x7A\x09\x00\x02\x7B\x09\x00\x02\x7C\x09\x00\x02\x7D\x09\x00\x02\x7E\x09\x00\x02\x7F\x09\x00\x02\x80\x09\x00\x02\x81\x09\x00\x02\x82\x09\x00\x02\x83\x09\x00\x02\x84\x09\x00\x02\x85\x09\x00\x02\x86\x09\x00\x02\x87\x09\x00\x02\x88\x09\x00\x02\x89\x09\x00\x02\x8A\x09\x00\x02\x8B\x09\x00\x02\x8C\x09\x00\x02\x8D\x09\x00\x02\x8E\x09\x00\x02\x8F\x09\x00\x02\x90\x09\x00\x02\x91\x09\x00\x02\x92\x09\x00\x02\x93\x09\x00\x02\x94\x09\x00\x02\x95\x09\x00\x02\x96\x09\x00\x02\x97\x09\x00\x02\x98\x09\x00\x02\x99\x09\x00\x02\x9A\x09\x00\x02\x9B\x09\x00\x02\x9C\x09\x00\x02\x9D\x09\x00\x02\x9E\x09\x00\x02\x9F\x09\x00\x02\xA1\x09\x00\x02\xA0\x09\x00\x02\xA2\x09\x00\x02\xA3\x09\x00\x02\xA4\x09\x00\x02\xA5\x09\x00\x02\xA6\x09\x00\x02\xA7\x09\x00\x02\xA8\x09\x00\x02\xA9\x09\x00\x02\xAA\x09\x00\x02\xAB\x09\x00\x02\xAC\x09\x00\x02\xAD\x09\x00\x02\xAE\x09\x00\x02\xAF\x09\x00\x02\xB0\x09\x00\x02\xB1\x09\x00\x02\xB2\x09\x00\x02\xB3\x09\x00\x02\xB4\x09\x00\x02\xB5\x09\x00\x02\xB6\x09\x00\x02\xB7\x09\x00\x02\xB8\x09\x00\x02\xB9\x09\x00\x02\xBA\x09\x00\x02\xBB\x09\x00\x02\xBC\x09\x00\x02\xBD\x09\x00\x02\xBE\x09\x00\x02\xBF\x09\x00\x02\xC0\x09\x00\x02\xC1\x09\x00\x02\xC2\x09\x00\x02\xC3\x09\x00\x02\xC4\x09\x00\x02\xC5\x09\x00\x02\xC6\x09\x00\x02\xC7\x09\x00\x02\xC8\x09\x00\x02\xC9\x09\x00\x02\xCA\x09\x00\x02\xCB\x09\x00\x02\xCC\x09\x00\x02\xCD\x09\x00\x02\xCE\x09\x00\x02\xCF\x09\x00\x02\xD0\x09\x00\x02\xD1\x09\x00\x02\xD2\x09\x00\x02\xD3\x09\x00\x02\xD4\x09\x00\x02\xD5\x09\x00\x02\xD6\x09\x00\x02\xD7\x09\x00\x02\xD8\x09\x00\x02\xD9\x09\x00\x02\xDA\x09\x00\x02\xDB\x09\x00\x02\xDC\x09\x00\x02\xDD\x09\x00\x02\xDE\x09\x00\x02\xDF\x09\x00\x02\xE0\x09\x00\x02\xE1\x09\x00\x02\xE2\x09\x00\x02\xE3\x09\x00\x02\xE4\x09\x00\x02\xE5\x09\x00\x02\xE6\x09\x00\x02\xE7\x09\x00\x02\xE8\x09\x00\x02\xE9\x09\x00\x02\xEA\x09\x00\x02\xEB\x09\x00\x02\xEC\x09\x00\x02\xED\x09\x00\x02\xEE\x09\x00\x02\xEF\x09\x00\x02\xF0\x09\x00\x02\xF1\x09\x00\x00\xA2\x0B\x00\x02\xF2\x09\x00\x02\xF3\x09\x00\x02\xF4\x09\x00\x02\xF5\x09\x00\x02\xF6\x09\x00\x02\xF7\x09\x00\x02\xF8\x09\x00\x02\xF9\x09\x00\x02\xFA\x09\x00\x02\xFB\x09\x00\x02\xFC\x09\x00\x02\xFD\x09\x00\x02\xFE\x09\x00\x02\xFF\x09\x00\x03\x00\x09\x00\x03\x01\x09\x00\x03\x02\x09\x00\x03\x03\x09\x00\x03\x04\x09\x00\x03\x05\x09\x00\x03\x06\x09\x00\x00\xA4\x0B\x00\x03\x08\x09\x00\x00\xA5\x0B\x00\x03\x09\x09\x00\x03\x0B\x09\x00\x0E\xB6\x03\x00\x03\x0C\x09\x00\x00\xA6\x0B\x00\x0E\xB9\x03\x00\x03\x0D\x09\x00\x03\x0E\x09\x00\x03\x0F\x09\x00\x00\xA7\x0B\x00\x03\x10\x09\x00\x03\x11\x09\x00\x03\x12\x09\x00\x00\xA8\x0B\x00\x03\x13\x09\x00\x0E\xC3\x03\x00\x03\x14\x09\x00\x03\x15\x09\x00\x00\xA9\x0B\x00\x00\xAA\x0B\x00\x0E\xC8\x03\x00\x03\x16\x09\x00\x03\x17\x09\x00\x0E\xCB\x03\x00\x03\x18\x09\x00\x03\x19\x09\x00\x03\x1A\x09\x00\x03\x1B\x09\x00\x00\xAB\x0B\x00\x03\x1C\x09\x00\x03\x1D\x09\x00\x03\x1E\x09\x00\x03\x1F\x09\x00\x03\x20\x09\x00\x03\x21\x09\x00\x0E\xD7\x03\x00\x03\x22\x09\x00\x00\xAC\x0B\x00\x03\x23\x09\x00\x0E\xDB\x03\x00\x03\x25\x09\x00\x0E\xDD\x03\x00\x03\x26\x09\x00\x03\x27\x09\x00\x03\x28\x09\x00\x03\x29\x09\x00\x03\x2A\x09\x00\x03\x2B\x09\x00\x0E\xE4\x03\x00\x03\x2C\x09\x00\x03\x2D\x09\x00\x03\x2E\x09\x00\x03\x2F\x09\x00\x03\x30\x09\x00\x00\xAD\x0B\x00\x03\x31\x09\x00\x00\xAE\x0B\x00\x03\x32\x09\x00\x00\xAF\x0B\x00\x0E\xEF\x03\x00\x03\x33\x09\x00\x03\x34\x09\x00\x03\x35\x09\x00\x03\x36\x09\x00\x0E\xF4\x03\x00\x03\x37\x09\x00\x03\x38\x09\x00\x0E\xF7\x03\x00\x03\x39\x09\x00\x03\x3A\x09\x00\x03\x3B\x09\x00\x03\x3C\x09\x00\x03\x3D\x09\x00\x0E\xFD\x03\x00\x03\x3E\x09\x00\x03\x3F\x09\x00\x03\x40\x09\x00\x00\xB1\x0B\x00\x00\xB3\x0B\x00\x03\x42\x09\x00\x03\x43\x09\x00\x0F\x05\x03\x00\x00\xB4\x0B\x00\x0F\x07\x03\x00\x03\x44\x09\x00\x03\x45\x09\x00\x00\xB5\x0B\x00\x0F\x0B\x03\x00\x03\x46\x09\x00\x03\x47\x09\x00\x03\x48\x09\x00\x03\x4A\x09\x00\x0F\x10\x03\x00\x03\x4B\x09\x00\x03\x4C\x09\x00\x03\x4D\x09\x00\x03\x4E\x09\x00\x00\xB8\x0B\x00\x03\x4F\x09\x00\x00\xB9\x0B\x00\x03\x50\x09\x00\x03\x51\x09\x00\x03\x52\x09\x00\x00\xBA\x0B\x00\x03\x53\x09\x00\x00\xBB\x0B\x00\x00\xBC\x0B\x00\x03\x55\x09\x00\x03\x56\x09\x00\x03\x57\x09\x00\x03\x59\x09\x00\x03\x58\x09\x00\x03\x5A\x09\x00\x03\x5B\x09\x00\x00\xBE\x0B\x00\x00\xBF\x0B\x00\x0F\x26\x05\x00\x00\x00\x10\x00\x00\xC0\x0B\x00\x00\xC1\x0B\x00\x03\x5D\x09\x00\x03\x5E\x09\x00\x0F\x2E\x03\x00\x03\x5F\x09\x00\x0F\x30\x03\x00\x03\x60\x09\x00\x0F\x32\x03\x00\x03\x61\x09\x00\x00\xC2\x0B\x00\x03\x62\x09\x00\x0F\x36\x03\x00\x03\x63\x09\x00\x03\x64\x09\x00\x03\x65\x09\x00\x03\x66\x09\x00\x03\x67\x09\x00\x00\xC3\x0B\x00\x03\x69\x09\x00\x03\x68\x09\x00\x03\x6A\x09\x00\x03\x6B\x09\x00\x0F\x41\x03\x00\x03\x6C\x09\x00\x03\x6D\x09\x00\x03\x6E\x09\x00\x03\x6F\x09\x00\x03\x70\x09\x00\x03\x71\x09\x00\x0F\x48\x03\x00\x03\x72\x09\x00\x03\x73\x09\x00\x03\x74\x09\x00\x0F\x4C\x03\x00\x03\x75\x09\x00\x03\x76\x09\x00\x03\x78\x09\x00\x0F\x50\x03\x00\x03\x79\x09\x00\x00\xC4\x0B\x00\x03\x7A\x09\x00\x03\x7B\x09\x00\x03\x7C\x09\x00\x03\x7D\x09\x00\x00\xC5\x0B\x00\x10\x36\x03\x00\x00\x00\x03\x00\x00\x05\x03\x00\x00\x0A\x03\x00\x00\x0D\x03\x00\x00\x11\x03\x00\x00\x15\x03\x00\x00\x19\x03\x00\x00\x1D\x03\x00\x00\x21\x03\x00\x00\x24\x03\x00\x00\x29\x03\x00\x00\x2F\x03\x00\x00\x35\x03\x00\x00\x3A\x03\x00\x00\x3E\x03\x00\x00\x43\x03\x00\x00\x48\x03\x00\x00\x4E\x03\x00\x00\x54\x03\x00\x00\x59\x03\x00\x00\x5F\x03\x00\x00\x63\x03\x00\x00\x67\x03\x00\x00\x6B\x03\x00\x00\x71\x03\x00\x00\x77\x03\x00\x00\x7D\x03\x00\x00\x83\x03\x00\x00\x87\x03\x00\x00\x8B\x03\x00\x00\x8F\x03\x00\x00\x93\x03\x00\x00\x99\x03\x00\x00\x9E\x03\x00\x00\xA4\x03\x00\x00\xAA\x03\x00\x00\xB0\x03\x00\x00\xB5\x03\x00\x00\xB9\x03\x00\x00\xBF\x03\x00\x00\xC5\x03\x00\x00\xCB\x03\x00\x00\xD1\x03\x00\x00\xD7\x03\x00\x00\xDC\x03\x00\x00\xE1\x03\x00\x00\xE7\x03\x00\x00\xEC\x03\x00\x00\xF2\x03\x00\x00\xF7\x03\x00\x00\xFD\x03\x00\x01\x01\x03\x00\x01\x05\x03\x00\x01\x09\x03\x00\x01\x0D\x03\x00\x01\x13\x03\x00\x01\x17\x03\x00\x01\x1D\x03\x00\x01\x22\x03\x00\x01\x27\x03\x00\x01\x2C\x03\x00\x01\x31\x03\x00\x01\x36\x03\x00\x01\x3A\x03\x00\x01\x40\x03\x00\x01\x47\x03\x00\x01\x4D\x03\x00\x01\x52\x03\x00\x01\x57\x03\x00\x01\x5C\x03\x00\x01\x62\x03\x00\x01\x68\x03\x00\x01\x6E\x03\x00\x01\x73\x03\x00\x01\x79\x03\x00\x01\x7F\x03\x00\x01\x85\x03\x00\x01\x8B\x03\x00\x01\x8F\x03\x00\x01\x95\x03\x00\x01\x9B\x03\x00\x01\xA0\x03\x00\x01\xA5\x03\x00\x01\xAB\x03\x00\x01\xB1\x03\x00\x01\xB7\x03\x00\x01\xBC\x03\x00\x01\xC1\x03\x00\x01\xC5\x03\x00\x01\xCA\x03\x00\x01\xD0\x03\x00\x01\xD6\x03\x00\x01\xDC\x03\x00\x01\xE3\x03\x00\x01\xE9\x03\x00\x01\xEF\x03\x00\x01\xF4\x03\x00\x01\xFA\x03\x00\x02\x00\x03\x00\x02\x05\x03\x00\x02\x0B\x03\x00\x02\x0F\x03\x00\x02\x14\x03\x00\x02\x19\x03\x00\x02\x1E\x03\x00\x02\x23\x03\x00\x02\x28\x03\x00\x02\x2D\x03\x00\x02\x36\x03\x00\x02\x3D\x03\x00\x02\x43\x03\x00\x02\x48\x03\x00\x02\x4E\x03\x00\x02\x54\x03\x00\x02\x5C\x03\x00\x02\x63\x03\x00\x02\x68\x03\x00\x02\x6C\x03\x00\x02\x70\x03\x00\x02\x76\x03\x00\x02\x7B\x03\x00\x02\x80\x03\x00\x02\x86\x03\x00\x02\x8D\x03\x00\x02\x91\x03\x00\x02\x97\x03\x00\x02\x9F\x03\x00\x02\xA7\x03\x00\x02\xAF\x03\x00\x02\xB5\x03\x00\x02\xBD\x03\x00\x02\xC2\x03\x00\x02\xCA\x03\x00\x02\xD4\x03\x00\x02\xD9\x03\x00\x02\xDE\x03\x00\x02\xE4\x03\x00\x02\xE9\x03\x00\x02\xED\x03\x00\x02\xF2\x03\x00\x02\xF7\x03\x00\x02\xFC\x03\x00\x03\x02\x03\x00\x03\x08\x03\x00\x03\x0E\x03\x00\x03\x16\x03\x00\x03\x1C\x03\x00\x03\x22\x03\x00\x03\x28\x03\x00\x03\x2E\x03\x00\x03\x34\x03\x00\x03\x39\x03\x00\x03\x3E\x03\x00\x03\x43\x03\x00\x03\x48\x03\x00\x03\x4F\x03\x00\x03\x54\x03\x00\x03\x59\x03\x00\x03\x60\x03\x00\x03\x67\x03\x00\x03\x70\x03\x00\x03\x75\x03\x00\x03\x7C\x03\x00\x03\x85\x03\x00\x03\x8B\x03\x00\x03\x91\x03\x00\x03\x97\x03\x00\x03\x9D\x03\x00\x03\xA3\x03\x00\x03\xA9\x03\x00\x03\xAF\x03\x00\x03\xB5\x03\x00\x03\xBB\x03\x00\x03\xC0\x03\x00\x03\xC5\x03\x00\x03\xCB\x03\x00\x03\xD0\x03\x00\x03\xD9\x03\x00\x03\xE3\x03\x00\x03\xE9\x03\x00\x03\xEE\x03\x00\x03\xF3\x03\x00\x03\xF9\x03\x00\x03\xFF\x03\x00\x04\x04\x03\x00\x04\x0A\x03\x00\x04\x0F\x03\x00\x04\x15\x03\x00\x04\x1A\x03\x00\x04\x20\x03\x00\x04\x24\x03\x00\x04\x2B\x03\x00\x04\x31\x03\x00\x04\x37\x03\x00\x04\x3D\x03\x00\x04\x42\x03\x00\x04\x47\x03\x00\x04\x4D\x03\x00\x04\x53\x03\x00\x04\x59\x03\x00\x04\x5E\x03\x00\x04\x63\x03\x00\x04\x68\x03\x00\x04\x6D\x03\x00\x04\x72\x03\x00\x04\x77\x03\x00\x04\x7C\x03\x00\x04\x81\x03\x00\x04\x86\x03\x00\x04\x8B\x03\x00\x04\x90\x03\x00\x04\x95\x03\x00\x04\x9B\x03\x00\x04\xA2\x03\x00\x04\xA8\x03\x00\x04\xAB\x03\x00\x04\xAF\x03\x00\x04\xB3\x03\x00\x04\xB9\x03\x00\x04\xBF\x03\x00\x04\xC5\x03\x00\x04\xC8\x03\x00\x00\xC6\x0B\x00\x03\x7E\x09\x00\x06\x17\x03\x00\x10\x3A\x03\x00\x03\x7F\x09\x00\x03\x80\x09\x00\x00\xC8\x0B\x00\x03\x81\x09\x00\x03\x82\x09\x00\x03\x83\x09\x00\x00\xC9\x0B\x00\x03\x84\x09\x00\x03\x85\x09\x00\x03\x86\x09\x00\x00\xCA\x0B\x00\x00\xCB\x0B\x00\x03\x87\x09\x00\x03\x88\x09\x00\x03\x89\x09\x00\x03\x8A\x09\x00\x03\x8B\x09\x00\x00\xCC\x0B\x00\x00\xCD\x0B\x00\x00\xCE\x0B\x00\x03\x8E\x09\x00\x03\x8F\x09\x00\x03\x90\x09\x00\x00\xCF\x0B\x00\x03\x91\x09\x00\x10\x54\x03\x00\x03\x92\x09\x00\x00\xD0\x0B\x00\x03\x93\x09\x00\x00\xD1\x0B\x00\x03\x94\x09\x00\x03\x96\x09\x00\x03\x97\x09\x00\x03\x98\x09\x00\x00\xD2\x0B\x00\x00\xD3\x0B\x00\x00\xD4\x0B\x00\x03\x99\x09\x00\x00\xD5\x0B\x00\x03\x9B\x09\x00\x03\x9C\x09\x00\x03\x9D\x09\x00\x03\x9F\x09\x00\x03\xA0\x09\x00\x10\x67\x03\x00\x00\xD9\x0B\x00\x03\xA1\x09\x00\x03\xA2\x09\x00\x00\xDA\x0B\x00\x10\x6C\x03\x00\x03\xA3\x09\x00\x00\xDB\x0B\x00\x03\xA5\x09\x00\x03\xA4\x09\x00\x10\x71\x03\x00\x03\xA6\x09\x00\x10\x73\x03\x00\x03\xA7\x09\x00\x03\xA9\x09\x00\x03\xA8\x09\x00\x10\x77\x03\x00\x03\xAA\x09\x00\x10\x79\x03\x00\x03\xAB\x09\x00\x00\xDC\x0B\x00\x10\x7C\x03\x00\x03\xAC\x09\x00\x10\x7E\x03\x00\x03\xAD\x09\x00\x00\xDD\x0B\x00\x03\xAE\x09\x00\x03\xAF\x09\x00\x00\xDF\x0B\x00\x00\xE0\x0B\x00\x00\xE1\x0B\x00\x03\xB1\x09\x00\x03\xB0\x09\x00\x03\xB2\x09\x00\x10\x8B\x03\x00\x10\x8A\x03\x00\x03\xB4\x09\x00\x03\xB3\x09\x00\x10\x8F\x03\x00\x10\x8E\x03\x00\x03\xB6\x09\x00\x03\xB5\x09\x00\x03\xB7\x09\x00\x00\xE3\x0B\x00\x03\xB8\x09\x00\x03\xB9\x09\x00\x00\xE4\x0B\x00\x03\xBA\x09\x00\x10\x97\x03\x00\x03\xBB\x09\x00\x03\xBC\x09\x00\x03\xBD\x09\x00\x10\x9C\x03\x00\x03\xBF\x09\x00\x03\xBE\x09\x00\x03\xC0\x09\x00\x03\xC1\x09\x00\x03\xC2\x09\x00\x03\xC3\x09\x00\x03\xC4\x09\x00\x03\xC5\x09\x00\x03\xC6\x09\x00\x03\xC7\x09\x00\x03\xC8\x09\x00\x03\xCA\x09\x00\x03\xCB\x09\x00\x03\xCC\x09\x00\x03\xCD\x09\x00\x00\xE6\x0B\x00\x03\xCE\x09\x00\x00\xE7\x0B\x00\x03\xCF\x09\x00\x03\xD0\x09\x00\x03\xD2\x09\x00\x03\xD3\x09\x00\x03\xD4\x09\x00\x03\xD5\x09\x00\x03\xD6\x09\x00\x03\xD7\x09\x00\x03\xD8\x09\x00\x03\xD9\x09\x00\x00\xEA\x0B\x00\x03\xDA\x09\x00\x00\xEB\x0B\x00\x03\xDB\x09\x00\x03\xDC\x09\x00\x03\xDD\x09\x00\x03\xDE\x09\x00\x00\xEC\x0B\x00\x10\xC0\x03\x00\x00\xED\x0B\x00\x10\xC2\x03\x00\x00\xEE\x0B\x00\x10\xC4\x03\x00\x00\xEF\x0B\x00\x03\xE0\x09\x00\x03\xE1\x09\x00\x00\xF0\x0B\x00\x10\xCA\x03\x00\x03\xE3\x09\x00\x03\xE2\x09\x00\x10\xCD\x03\x00\x03\xE5\x09\x00\x03\xE4\x09\x00\x10\xCF\x03\x00\x03\xE6\x09\x00\x00\xF1\x0B\x00\x03\xE7\x09\x00\x03\xE8\x09\x00\x00\xF2\x0B\x00\x00\xF3\x0B\x00\x00\xF4\x0B\x00\x00\xF5\x0B\x00\x03\xE9\x09\x00\x00\xF6\x0B\x00\x03\xEA\x09\x00\x00\xF7\x0B\x00\x03\xEB\x09\x00\x03\xEC\x09\x00\x03\xED\x09\x00\x00\xF8\x0B\x00\x03\xEE\x09\x00\x10\xE1\x03\x00\x03\xEF\x09\x00\x03\xF0\x09\x00\x03\xF1\x09\x00\x03\xF2\x09\x00\x03\xF3\x09\x00\x03\xF4\x09\x00\x10\xE8\x03\x00\x03\xF5\x09\x00\x03\xF6\x09\x00\x03\xF7\x09\x00\x00\xF9\x0B\x00\x03\xF8\x09\x00\x03\xF9\x09\x00\x00\xFA\x0B\x00\x00\xFB\x0B\x00\x00\xFC\x0B\x00\x03\xFA\x09\x00\x00\xFD\x0B\x00\x03\xFB\x09\x00\x03\xFC\x09\x00\x03\xFD\x09\x00\x10\xF7\x03\x00\x03\xFE\x09\x00\x03\xFF\x09\x00\x04\x00\x09\x00\x04\x01\x09\x00\x04\x02\x09\x00\x00\xFE\x0B\x00\x04\x03\x09\x00\x04\x04\x09\x00\x04\x05\x09\x00\x11\x01\x03\x00\x04\x06\x09\x00\x04\x07\x09\x00\x04\x08\x09\x00\x04\x09\x09\x00\x00\xFF\x0B\x00\x04\x0A\x09\x00\x01\x00\x0B\x00\x01\x01\x0B\x00\x04\x0B\x09\x00\x04\x0C\x09\x00\x04\x0D\x09\x00\x11\x0D\x03\x00\x04\x0E\x09\x00\x04\x0F\x09\x00\x04\x10\x09\x00\x04\x11\x09\x00\x04\x12\x09\x00\x01\x02\x0B\x00\x04\x13\x09\x00\x04\x14\x09\x00\x04\x15\x09\x00\x11\x17\x03\x00\x04\x16\x09\x00\x04\x17\x09\x00\x04\x18\x09\x00\x04\x19\x09\x00\x01\x03\x0B\x00\x01\x04\x0B\x00\x04\x1A\x09\x00\x04\x1B\x09\x00\x04\x1C\x09\x00\x04\x1D\x09\x00\x11\x22\x03\x00\x04\x1E\x09\x00\x01\x05\x0B\x00\x04\x1F\x09\x00\x04\x20\x09\x00\x01\x06\x0B\x00\x01\x07\x0B\x00\x04\x21\x09\x00\x04\x22\x09\x00\x04\x23\x09\x00\x04\x24\x09\x00\x11\x2D\x03\x00\x04\x25\x09\x00\x04\x26\x09\x00\x04\x27\x09\x00\x11\x31\x03\x00\x04\x28\x09\x00\x01\x08\x0B\x00\x04\x29\x09\x00\x04\x2B\x09\x00\x04\x2C\x09\x00\x04\x2E\x09\x00\x04\x2F\x09\x00\x01\x09\x0B\x00\x04\x30\x09\x00\x04\x31\x09\x00\x04\x32\x09\x00\x04\x33\x09\x00\x04\x34\x09\x00\x04\x35\x09\x00\x04\x36\x09\x00\x04\x37\x09\x00\x04\x38\x09\x00\x04\x39\x09\x00\x04\x3A\x09\x00\x04\x3B\x09\x00\x04\x3C\x09\x00\x00\x06\x03\x00\x00\x02\x01\x00\x11\x47\x05\x00\x00\x01\x00\x00\x00\x0E\x01\x00\x06\x63\x05\x00\x00\x00\x02\x00\x11\x4F\x05\x00\x00\x00\x03\x00\x06\x63\x05\x00\x00\x00\x04\x00\x04\x17\x05\x00\x00\x00\x02\x00\x04\x17\x05\x00\x00\x00\x04\x00\x00\x17\x01\x00\x00\x11\x01\x00\x11\x56\x05\x00\x00\x00\x0F\x00\x11\x5B\x05\x00\x00\x00\x0F\x00\x11\x56\x05\x00\x00\x00\x02\x00\x11\x56\x05\x00\x00\x00\x20\x00\x11\x5B\x05\x00\x00\x00\x20\x00\x11\x56\x05\x00\x00\x00\x06\x00\x11\x64\x03\x00\x00\x00\x09\x00\x00\x56\x09\x00\x00\x5C\x09\x00\x09\x08\x03\x00\x00\x95\x09\x00\x00\x96\x09\x00\x00\xAB\x09\x00\x00\xAD\x09\x00\x00\xC7\x09\x00\x00\xCA\x09\x00\x00\xCC\x09\x00\x00\xCF\x09\x00\x00\xD5\x09\x00\x00\xD9\x09\x00\x00\xE0\x09\x00\x00\xEE\x09\x00\x09\x45\x03\x00\x00\xF6\x09\x00\x00\xF9\x09\x00\x00\xFC\x09\x00\x01\xFD\x03\x00\x01\x15\x09\x00\x01\x1D\x09\x00\x01\x22\x09\x00\x01\x24\x09\x00\x01\x3C\x09\x00\x01\x56\x09\x00\x01\x61\x09\x00\x02\x78\x03\x00\x01\x96\x09\x00\x02\x7D\x03\x00\x01\x97\x09\x00\x01\xA2\x09\x00\x01\xA8\x09\x00\x01\xCB\x09\x00\x01\xDF\x09\x00\x01\xE3\x09\x00\x03\xC6\x03\x00\x03\xC6\x05\x00\x00\x00\x20\x00\x03\x07\x09\x00\x03\x0A\x09\x00\x03\x24\x09\x00\x02\xB7\x03\x00\x03\x41\x09\x00\x03\x49\x09\x00\x03\x54\x09\x00\x03\x5C\x09\x00\x03\x77\x09\x00\x03\x8C\x09\x00\x09\xE5\x03\x00\x03\x8D\x09\x00\x02\xDB\x03\x00\x03\x95\x09\x00\x03\x9A\x09\x00\x03\x9E\x09\x00\x03\xC9\x09\x00\x03\xD1\x09\x00\x03\xDF\x09\x00\x04\x2A\x09\x00\x04\x2D\x09\x00\x04\x3E\x09\x00\x11\xA3\x03\x00\x04\x3F\x09\x00\x07\xD3\x05\x00\x00\x00\x80\x00\x07\xD3\x05\x00\x00\x00\x10\x00\x07\xD3\x05\x00\x00\x00\x13\x00\x07\xD3\x05\x00\x00\x00\x15\x00\x07\xD3\x05\x00\x00\x00\x03\x00\x11\xA4\x05\x00\x00\x00\x03\x00\x07\xD3\x05\x00\x00\x00\x07\x00\x04\xCC\x03\x00\x04\xD2\x03\x00\x04\xD6\x03\x00\x04\xDA\x03\x00\x04\xDE\x03\x00\x04\xE4\x03\x00\x04\xE9\x03\x00\x04\xEF\x03\x00\x00\x1F\x05\x00\x00\x00\x02\x00\x00\x1F\x05\x00\x00\x00\x20\x00\x00\x1F\x05\x00\x00\x00\x03\x00\x00\x1F\x05\x00\x00\x00\x04\x00\x00\x1F\x05\x00\x00\x00\x07\x00\x04\xF9\x03\x00\x04\xFD\x03\x00\x05\x01\x03\x00\x05\x05\x03\x00\x05\x09\x03\x00\x01\x43\x05\x00\x00\x00\x10\x00\x11\xCC\x03\x00\x00\x12\x01\x00\x11\xCC\x05\x00\x00\x00\x0F\x00\x11\xCC\x05\x00\x00\x00\x10\x00\x11\xCC\x05\x00\x00\x00\x02\x00\x11\xDB\x05\x00\x00\x00\x02\x00\x11\xCC\x05\x00\x00\x00\x20\x00\x11\xCC\x05\x00\x00\x00\x03\x00\x11\xCC\x05\x00\x00\x00\x30\x00\x11\xCC\x05\x00\x00\x00\x40\x00\x11\xCC\x05\x00\x00\x00\x06\x00\x11\xCF\x05\x00\x00\x00\x06\x00\x11\xDB\x05\x00\x00\x00\x06\x00\x11\xCC\x05\x00\x00\x00\x07\x00\x11\xCC\x05\x00\x00\x00\x08\x00\x05\x0F\x03\x00\x05\x15\x03\x00\x00\xCE\x03\x00\x0A\xD2\x03\x00\x0A\xD6\x03\x00\x05\x1C\x03\x00\x05\x20\x03\x00\x05\x23\x03\x00\x05\x2E\x03\x00\x05\x32\x03\x00\x05\x36\x03\x00\x05\x3A\x03\x00\x05\x40\x03\x00\x05\x44\x03\x00\x05\x48\x03\x00\x05\x4C\x03\x00\x05\x50\x03\x00\x05\x54\x03\x00\x05\x58\x03\x00\x05\x5C\x03\x00\x05\x60\x03\x00\x05\x64\x03\x00\x05\x68\x03\x00\x05\x6C\x03\x00\x05\x70\x03\x00\x05\x74\x03\x00\x05\x78\x03\x00\x05\x7C\x03\x00\x05\x80\x03\x00\x05\x84\x03\x00\x05\x88\x03\x00\x05\x8C\x03\x00\x05\x90\x03\x00\x05\x94\x03\x00\x05\x98\x03\x00\x05\x9D\x03\x00\x05\xA2\x03\x00\x05\xA6\x03\x00\x05\xAA\x03\x00\x05\xAE\x03\x00\x05\xB2\x03\x00\x05\xB8\x03\x00\x05\xC0\x03\x00\x05\xCA\x03\x00\x05\xD3\x03\x00\x05\xD8\x03\x00\x05\xDE\x03\x00\x05\xE5\x03\x00\x05\xEB\x03\x00\x05\xEF\x03\x00\x05\xF3\x03\x00\x05\xF7\x03\x00\x05\xFB\x03\x00\x05\xFF\x03\x00\x06\x03\x03\x00\x06\x08\x03\x00\x06\x0D\x03\x00\x06\x11\x03\x00\x06\x15\x03\x00\x06\x19\x03\x00\x06\x1E\x03\x00\x06\x22\x03\x00\x06\x26\x03\x00\x06\x30\x03\x00\x06\x38\x03\x00\x06\x3D\x03\x00\x06\x41\x03\x00\x06\x45\x03\x00\x06\x49\x03\x00\x06\x4D\x03\x00\x06\x51\x03\x00\x06\x55\x03\x00\x06\x59\x03\x00\x06\x5D\x03\x00\x06\x61\x03\x00\x06\x65\x03\x00\x06\x6A\x03\x00\x06\x70\x03\x00\x06\x76\x03\x00\x06\x7D\x03\x00\x06\x85\x03\x00\x06\x8A\x03\x00\x06\x90\x03\x00\x06\x99\x03\x00\x06\xAA\x03\x00\x06\xB1\x03\x00\x06\xB8\x03\x00\x06\xBF\x03\x00\x06\xC6\x03\x00\x06\xCD\x03\x00\x06\xD2\x03\x00\x06\xD7\x03\x00\x06\xDC\x03\x00\x06\xE1\x03\x00\x06\xE9\x03\x00\x06\xF1\x03\x00\x06\xF9\x03\x00\x07\x03\x03\x00\x07\x0C\x03\x00\x07\x15\x03\x00\x07\x1A\x03\x00\x07\x22\x03\x00\x07\x27\x03\x00\x07\x2D\x03\x00\x07\x37\x03\x00\x07\x3E\x03\x00\x07\x42\x03\x00\x07\x48\x03\x00\x07\x50\x03\x00\x07\x57\x03\x00\x07\x5C\x03\x00\x07\x61\x03\x00\x07\x66\x03\x00\x07\x6B\x03\x00\x07\x74\x03\x00\x07\x7C\x03\x00\x07\x81\x03\x00\x07\x87\x03\x00\x07\x8F\x03\x00\x07\x96\x03\x00\x07\x9B\x03\x00\x07\xA0\x03\x00\x07\xA8\x03\x00\x07\xB0\x03\x00\x07\xB5\x03\x00\x07\xBB\x03\x00\x07\xC8\x03\x00\x07\xD0\x03\x00\x07\xD5\x03\x00\x07\xDA\x03\x00\x07\xDF\x03\x00\x07\xE5\x03\x00\x07\xEB\x03\x00\x07\xF1\x03\x00\x07\xF7\x03\x00\x07\xFD\x03\x00\x08\x03\x03\x00\x08\x09\x03\x00\x08\x10\x03\x00\x08\x18\x03\x00\x08\x21\x03\x00\x08\x2A\x03\x00\x08\x30\x03\x00\x08\x36\x03\x00\x08\x3E\x03\x00\x08\x45\x03\x00\x08\x51\x03\x00\x08\x5A\x03\x00\x08\x5E\x03\x00\x08\x65\x03\x00\x08\x6B\x03\x00\x08\x71\x03\x00\x08\x7A\x03\x00\x08\x80\x03\x00\x08\x84\x03\x00\x08\x87\x03\x00\x08\x8E\x03\x00\x08\x94\x03\x00\x08\x99\x03\x00\x08\x9E\x03\x00\x08\xA2\x03\x00\x08\xA7\x03\x00\x08\xAC\x03\x00\x08\xB2\x03\x00\x08\xB7\x03\x00\x08\xBC\x03\x00\x08\xC1\x03\x00\x08\xC6\x03\x00\x08\xCC\x03\x00\x08\xD1\x03\x00\x08\xD6\x03\x00\x08\xDB\x03\x00\x08\xE0\x03\x00\x08\xE6\x03\x00\x08\xEB\x03\x00\x08\xF2\x03\x00\x08\xF7\x03\x00\x08\xFC\x03\x00\x09\x01\x03\x00\x09\x06\x03\x00\x09\x0B\x03\x00\x09\x10\x03\x00\x09\x15\x03\x00\x09\x1A\x03\x00\x09\x1F\x03\x00\x09\x25\x03\x00\x09\x2A\x03\x00\x09\x2F\x03\x00\x09\x34\x03\x00\x09\x39\x03\x00\x09\x3E\x03\x00\x09\x43\x03\x00\x09\x48\x03\x00\x09\x4E\x03\x00\x09\x53\x03\x00\x09\x59\x03\x00\x09\x5E\x03\x00\x09\x63\x03\x00\x09\x67\x03\x00\x09\x6C\x03\x00\x09\x71\x03\x00\x09\x76\x03\x00\x09\x7B\x03\x00\x09\x80\x03\x00\x09\x85\x03\x00\x09\x8A\x03\x00\x09\x8F\x03\x00\x09\x95\x03\x00\x09\x9B\x03\x00\x09\xA0\x03\x00\x09\xA6\x03\x00\x09\xAB\x03\x00\x09\xB0\x03\x00\x09\xB5\x03\x00\x09\xBA\x03\x00\x09\xBF\x03\x00\x09\xC4\x03\x00\x09\xC9\x03\x00\x09\xCE\x03\x00\x09\xD4\x03\x00\x09\xD9\x03\x00\x09\xDE\x03\x00\x09\xE3\x03\x00\x09\xE8\x03\x00\x09\xED\x03\x00\x09\xF2\x03\x00\x09\xF7\x03\x00\x09\xFC\x03\x00\x0A\x01\x03\x00\x0A\x06\x03\x00\x0A\x0B\x03\x00\x0A\x10\x03\x00\x0A\x15\x03\x00\x0A\x1A\x03\x00\x0A\x1F\x03\x00\x0A\x26\x03\x00\x0A\x2C\x03\x00\x0A\x32\x03\x00\x0A\x39\x03\x00\x0A\x3D\x03\x00\x0A\x43\x03\x00\x0A\x48\x03\x00\x0A\x4D\x03\x00\x0A\x52\x03\x00\x0A\x5C\x03\x00\x0A\x61\x03\x00\x0A\x66\x03\x00\x0A\x70\x03\x00\x0A\x75\x03\x00\x0A\x7A\x03\x00\x0A\x7F\x03\x00\x0A\x83\x03\x00\x0A\x87\x03\x00\x0A\x8B\x03\x00\x0A\x8F\x03\x00\x0A\x93\x03\x00\x0A\x97\x03\x00\x0A\x9D\x03\x00\x0A\xA2\x03\x00\x0A\xA7\x03\x00\x0A\xAC\x03\x00\x0A\xB1\x03\x00\x0A\xB4\x03\x00\x0A\xB8\x03\x00\x0A\xBC\x03\x00\x0A\xC1\x03\x00\x0A\xC6\x03\x00\x0A\xCC\x03\x00\x0A\xD0\x03\x00\x00\x00\x01\x00\x12\xF6\x03\x00\x00\x10\x01\x00\x04\x40\x09',
+    _globals = (b'\xFF\xFF\xFF\x0BSTD_VIDEO_DECODE_H264_FIELD_ORDER_COUNT_BOTTOM',1,b'\xFF\xFF\xFF\x0BSTD_VIDEO_DECODE_H264_FIELD_ORDER_COUNT_INVALID',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_DECODE_H264_FIELD_ORDER_COUNT_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_DECODE_H264_FIELD_ORDER_COUNT_TOP',0,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_ASPECT_RATIO_IDC_10_11',3,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_ASPECT_RATIO_IDC_12_11',2,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_ASPECT_RATIO_IDC_15_11',11,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_ASPECT_RATIO_IDC_160_99',13,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_ASPECT_RATIO_IDC_16_11',4,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_ASPECT_RATIO_IDC_18_11',10,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_ASPECT_RATIO_IDC_20_11',7,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_ASPECT_RATIO_IDC_24_11',6,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_ASPECT_RATIO_IDC_2_1',16,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_ASPECT_RATIO_IDC_32_11',8,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_ASPECT_RATIO_IDC_3_2',15,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_ASPECT_RATIO_IDC_40_33',5,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_ASPECT_RATIO_IDC_4_3',14,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_ASPECT_RATIO_IDC_64_33',12,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_ASPECT_RATIO_IDC_80_33',9,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_ASPECT_RATIO_IDC_EXTENDED_SAR',255,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_ASPECT_RATIO_IDC_INVALID',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_ASPECT_RATIO_IDC_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_ASPECT_RATIO_IDC_SQUARE',1,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_ASPECT_RATIO_IDC_UNSPECIFIED',0,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_CABAC_INIT_IDC_0',0,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_CABAC_INIT_IDC_1',1,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_CABAC_INIT_IDC_2',2,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_CABAC_INIT_IDC_INVALID',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_CABAC_INIT_IDC_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_CHROMA_FORMAT_IDC_420',1,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_CHROMA_FORMAT_IDC_422',2,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_CHROMA_FORMAT_IDC_444',3,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_CHROMA_FORMAT_IDC_INVALID',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_CHROMA_FORMAT_IDC_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_CHROMA_FORMAT_IDC_MONOCHROME',0,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_DISABLE_DEBLOCKING_FILTER_IDC_DISABLED',0,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_DISABLE_DEBLOCKING_FILTER_IDC_ENABLED',1,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_DISABLE_DEBLOCKING_FILTER_IDC_INVALID',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_DISABLE_DEBLOCKING_FILTER_IDC_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_DISABLE_DEBLOCKING_FILTER_IDC_PARTIAL',2,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_LEVEL_IDC_1_0',0,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_LEVEL_IDC_1_1',1,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_LEVEL_IDC_1_2',2,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_LEVEL_IDC_1_3',3,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_LEVEL_IDC_2_0',4,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_LEVEL_IDC_2_1',5,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_LEVEL_IDC_2_2',6,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_LEVEL_IDC_3_0',7,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_LEVEL_IDC_3_1',8,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_LEVEL_IDC_3_2',9,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_LEVEL_IDC_4_0',10,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_LEVEL_IDC_4_1',11,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_LEVEL_IDC_4_2',12,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_LEVEL_IDC_5_0',13,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_LEVEL_IDC_5_1',14,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_LEVEL_IDC_5_2',15,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_LEVEL_IDC_6_0',16,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_LEVEL_IDC_6_1',17,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_LEVEL_IDC_6_2',18,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_LEVEL_IDC_INVALID',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_LEVEL_IDC_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_MEM_MGMT_CONTROL_OP_END',0,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_MEM_MGMT_CONTROL_OP_INVALID',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_MEM_MGMT_CONTROL_OP_MARK_CURRENT_AS_LONG_TERM',6,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_MEM_MGMT_CONTROL_OP_MARK_LONG_TERM',3,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_MEM_MGMT_CONTROL_OP_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_MEM_MGMT_CONTROL_OP_SET_MAX_LONG_TERM_INDEX',4,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_MEM_MGMT_CONTROL_OP_UNMARK_ALL',5,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_MEM_MGMT_CONTROL_OP_UNMARK_LONG_TERM',2,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_MEM_MGMT_CONTROL_OP_UNMARK_SHORT_TERM',1,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_MODIFICATION_OF_PIC_NUMS_IDC_END',3,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_MODIFICATION_OF_PIC_NUMS_IDC_INVALID',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_MODIFICATION_OF_PIC_NUMS_IDC_LONG_TERM',2,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_MODIFICATION_OF_PIC_NUMS_IDC_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_MODIFICATION_OF_PIC_NUMS_IDC_SHORT_TERM_ADD',1,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_MODIFICATION_OF_PIC_NUMS_IDC_SHORT_TERM_SUBTRACT',0,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_NON_VCL_NALU_TYPE_AUD',2,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_NON_VCL_NALU_TYPE_END_OF_SEQUENCE',4,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_NON_VCL_NALU_TYPE_END_OF_STREAM',5,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_NON_VCL_NALU_TYPE_INVALID',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_NON_VCL_NALU_TYPE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_NON_VCL_NALU_TYPE_PPS',1,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_NON_VCL_NALU_TYPE_PRECODED',6,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_NON_VCL_NALU_TYPE_PREFIX',3,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_NON_VCL_NALU_TYPE_SPS',0,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_PICTURE_TYPE_B',1,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_PICTURE_TYPE_I',2,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_PICTURE_TYPE_IDR',5,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_PICTURE_TYPE_INVALID',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_PICTURE_TYPE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_PICTURE_TYPE_P',0,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_POC_TYPE_0',0,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_POC_TYPE_1',1,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_POC_TYPE_2',2,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_POC_TYPE_INVALID',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_POC_TYPE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_PROFILE_IDC_BASELINE',66,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_PROFILE_IDC_HIGH',100,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_PROFILE_IDC_HIGH_444_PREDICTIVE',244,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_PROFILE_IDC_INVALID',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_PROFILE_IDC_MAIN',77,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_PROFILE_IDC_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_SLICE_TYPE_B',1,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_SLICE_TYPE_I',2,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_SLICE_TYPE_INVALID',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_SLICE_TYPE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_SLICE_TYPE_P',0,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_WEIGHTED_BIPRED_IDC_DEFAULT',0,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_WEIGHTED_BIPRED_IDC_EXPLICIT',1,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_WEIGHTED_BIPRED_IDC_IMPLICIT',2,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_WEIGHTED_BIPRED_IDC_INVALID',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H264_WEIGHTED_BIPRED_IDC_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_ASPECT_RATIO_IDC_10_11',3,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_ASPECT_RATIO_IDC_12_11',2,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_ASPECT_RATIO_IDC_15_11',11,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_ASPECT_RATIO_IDC_160_99',13,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_ASPECT_RATIO_IDC_16_11',4,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_ASPECT_RATIO_IDC_18_11',10,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_ASPECT_RATIO_IDC_20_11',7,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_ASPECT_RATIO_IDC_24_11',6,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_ASPECT_RATIO_IDC_2_1',16,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_ASPECT_RATIO_IDC_32_11',8,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_ASPECT_RATIO_IDC_3_2',15,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_ASPECT_RATIO_IDC_40_33',5,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_ASPECT_RATIO_IDC_4_3',14,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_ASPECT_RATIO_IDC_64_33',12,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_ASPECT_RATIO_IDC_80_33',9,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_ASPECT_RATIO_IDC_EXTENDED_SAR',255,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_ASPECT_RATIO_IDC_INVALID',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_ASPECT_RATIO_IDC_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_ASPECT_RATIO_IDC_SQUARE',1,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_ASPECT_RATIO_IDC_UNSPECIFIED',0,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_CHROMA_FORMAT_IDC_420',1,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_CHROMA_FORMAT_IDC_422',2,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_CHROMA_FORMAT_IDC_444',3,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_CHROMA_FORMAT_IDC_INVALID',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_CHROMA_FORMAT_IDC_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_CHROMA_FORMAT_IDC_MONOCHROME',0,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_LEVEL_IDC_1_0',0,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_LEVEL_IDC_2_0',1,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_LEVEL_IDC_2_1',2,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_LEVEL_IDC_3_0',3,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_LEVEL_IDC_3_1',4,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_LEVEL_IDC_4_0',5,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_LEVEL_IDC_4_1',6,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_LEVEL_IDC_5_0',7,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_LEVEL_IDC_5_1',8,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_LEVEL_IDC_5_2',9,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_LEVEL_IDC_6_0',10,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_LEVEL_IDC_6_1',11,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_LEVEL_IDC_6_2',12,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_LEVEL_IDC_INVALID',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_LEVEL_IDC_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_PICTURE_TYPE_B',1,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_PICTURE_TYPE_I',2,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_PICTURE_TYPE_IDR',3,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_PICTURE_TYPE_INVALID',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_PICTURE_TYPE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_PICTURE_TYPE_P',0,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_PROFILE_IDC_FORMAT_RANGE_EXTENSIONS',4,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_PROFILE_IDC_INVALID',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_PROFILE_IDC_MAIN',1,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_PROFILE_IDC_MAIN_10',2,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_PROFILE_IDC_MAIN_STILL_PICTURE',3,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_PROFILE_IDC_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_PROFILE_IDC_SCC_EXTENSIONS',9,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_SLICE_TYPE_B',0,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_SLICE_TYPE_I',2,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_SLICE_TYPE_INVALID',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_SLICE_TYPE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BSTD_VIDEO_H265_SLICE_TYPE_P',1,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_BUILD_TYPE_DEVICE_KHR',1,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_BUILD_TYPE_HOST_KHR',0,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_BUILD_TYPE_HOST_OR_DEVICE_KHR',2,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_BUILD_TYPE_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_COMPATIBILITY_COMPATIBLE_KHR',0,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_COMPATIBILITY_INCOMPATIBLE_KHR',1,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_COMPATIBILITY_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_CREATE_DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT',8,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_CREATE_DEVICE_ADDRESS_CAPTURE_REPLAY_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_CREATE_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_CREATE_MOTION_BIT_NV',4,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_MEMORY_REQUIREMENTS_TYPE_BUILD_SCRATCH_NV',1,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_MEMORY_REQUIREMENTS_TYPE_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_MEMORY_REQUIREMENTS_TYPE_OBJECT_NV',0,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_MEMORY_REQUIREMENTS_TYPE_UPDATE_SCRATCH_NV',2,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_MOTION_INSTANCE_TYPE_MATRIX_MOTION_NV',1,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_MOTION_INSTANCE_TYPE_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_MOTION_INSTANCE_TYPE_SRT_MOTION_NV',2,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_MOTION_INSTANCE_TYPE_STATIC_NV',0,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_TYPE_BOTTOM_LEVEL_KHR',1,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_TYPE_BOTTOM_LEVEL_NV',1,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_TYPE_GENERIC_KHR',2,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_TYPE_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_TYPE_TOP_LEVEL_KHR',0,b'\xFF\xFF\xFF\x0BVK_ACCELERATION_STRUCTURE_TYPE_TOP_LEVEL_NV',0,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_ACCELERATION_STRUCTURE_READ_BIT_KHR',2097152,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_ACCELERATION_STRUCTURE_READ_BIT_NV',2097152,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_ACCELERATION_STRUCTURE_WRITE_BIT_KHR',4194304,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_ACCELERATION_STRUCTURE_WRITE_BIT_NV',4194304,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_COLOR_ATTACHMENT_READ_BIT',128,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_COLOR_ATTACHMENT_READ_BIT_KHR',128,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_COLOR_ATTACHMENT_READ_NONCOHERENT_BIT_EXT',524288,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_COLOR_ATTACHMENT_WRITE_BIT',256,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_COLOR_ATTACHMENT_WRITE_BIT_KHR',256,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_COMMAND_PREPROCESS_READ_BIT_NV',131072,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_COMMAND_PREPROCESS_WRITE_BIT_NV',262144,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_CONDITIONAL_RENDERING_READ_BIT_EXT',1048576,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_DEPTH_STENCIL_ATTACHMENT_READ_BIT',512,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_DEPTH_STENCIL_ATTACHMENT_READ_BIT_KHR',512,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_DEPTH_STENCIL_ATTACHMENT_WRITE_BIT',1024,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_DEPTH_STENCIL_ATTACHMENT_WRITE_BIT_KHR',1024,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_DESCRIPTOR_BUFFER_READ_BIT_EXT',2199023255552,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_FRAGMENT_DENSITY_MAP_READ_BIT_EXT',16777216,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_FRAGMENT_SHADING_RATE_ATTACHMENT_READ_BIT_KHR',8388608,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_HOST_READ_BIT',8192,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_HOST_READ_BIT_KHR',8192,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_HOST_WRITE_BIT',16384,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_HOST_WRITE_BIT_KHR',16384,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_INDEX_READ_BIT',2,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_INDEX_READ_BIT_KHR',2,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_INDIRECT_COMMAND_READ_BIT',1,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_INDIRECT_COMMAND_READ_BIT_KHR',1,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_INPUT_ATTACHMENT_READ_BIT',16,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_INPUT_ATTACHMENT_READ_BIT_KHR',16,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_INVOCATION_MASK_READ_BIT_HUAWEI',549755813888,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_MEMORY_READ_BIT',32768,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_MEMORY_READ_BIT_KHR',32768,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_MEMORY_WRITE_BIT',65536,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_MEMORY_WRITE_BIT_KHR',65536,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_MICROMAP_READ_BIT_EXT',17592186044416,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_MICROMAP_WRITE_BIT_EXT',35184372088832,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_NONE',0,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_NONE_KHR',0,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_OPTICAL_FLOW_READ_BIT_NV',4398046511104,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_OPTICAL_FLOW_WRITE_BIT_NV',8796093022208,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_SHADER_BINDING_TABLE_READ_BIT_KHR',1099511627776,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_SHADER_READ_BIT',32,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_SHADER_READ_BIT_KHR',32,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_SHADER_SAMPLED_READ_BIT',4294967296,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_SHADER_SAMPLED_READ_BIT_KHR',4294967296,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_SHADER_STORAGE_READ_BIT',8589934592,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_SHADER_STORAGE_READ_BIT_KHR',8589934592,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_SHADER_STORAGE_WRITE_BIT',17179869184,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_SHADER_STORAGE_WRITE_BIT_KHR',17179869184,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_SHADER_WRITE_BIT',64,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_SHADER_WRITE_BIT_KHR',64,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_SHADING_RATE_IMAGE_READ_BIT_NV',8388608,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_TRANSFER_READ_BIT',2048,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_TRANSFER_READ_BIT_KHR',2048,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_TRANSFER_WRITE_BIT',4096,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_TRANSFER_WRITE_BIT_KHR',4096,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_TRANSFORM_FEEDBACK_COUNTER_READ_BIT_EXT',67108864,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_TRANSFORM_FEEDBACK_COUNTER_WRITE_BIT_EXT',134217728,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_TRANSFORM_FEEDBACK_WRITE_BIT_EXT',33554432,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_UNIFORM_READ_BIT',8,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_UNIFORM_READ_BIT_KHR',8,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_VERTEX_ATTRIBUTE_READ_BIT',4,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_VERTEX_ATTRIBUTE_READ_BIT_KHR',4,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_VIDEO_DECODE_READ_BIT_KHR',34359738368,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_VIDEO_DECODE_WRITE_BIT_KHR',68719476736,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_VIDEO_ENCODE_READ_BIT_KHR',137438953472,b'\xFF\xFF\xFF\x1FVK_ACCESS_2_VIDEO_ENCODE_WRITE_BIT_KHR',274877906944,b'\xFF\xFF\xFF\x0BVK_ACCESS_ACCELERATION_STRUCTURE_READ_BIT_KHR',2097152,b'\xFF\xFF\xFF\x0BVK_ACCESS_ACCELERATION_STRUCTURE_READ_BIT_NV',2097152,b'\xFF\xFF\xFF\x0BVK_ACCESS_ACCELERATION_STRUCTURE_WRITE_BIT_KHR',4194304,b'\xFF\xFF\xFF\x0BVK_ACCESS_ACCELERATION_STRUCTURE_WRITE_BIT_NV',4194304,b'\xFF\xFF\xFF\x0BVK_ACCESS_COLOR_ATTACHMENT_READ_BIT',128,b'\xFF\xFF\xFF\x0BVK_ACCESS_COLOR_ATTACHMENT_READ_NONCOHERENT_BIT_EXT',524288,b'\xFF\xFF\xFF\x0BVK_ACCESS_COLOR_ATTACHMENT_WRITE_BIT',256,b'\xFF\xFF\xFF\x0BVK_ACCESS_COMMAND_PREPROCESS_READ_BIT_NV',131072,b'\xFF\xFF\xFF\x0BVK_ACCESS_COMMAND_PREPROCESS_WRITE_BIT_NV',262144,b'\xFF\xFF\xFF\x0BVK_ACCESS_CONDITIONAL_RENDERING_READ_BIT_EXT',1048576,b'\xFF\xFF\xFF\x0BVK_ACCESS_DEPTH_STENCIL_ATTACHMENT_READ_BIT',512,b'\xFF\xFF\xFF\x0BVK_ACCESS_DEPTH_STENCIL_ATTACHMENT_WRITE_BIT',1024,b'\xFF\xFF\xFF\x0BVK_ACCESS_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_ACCESS_FRAGMENT_DENSITY_MAP_READ_BIT_EXT',16777216,b'\xFF\xFF\xFF\x0BVK_ACCESS_FRAGMENT_SHADING_RATE_ATTACHMENT_READ_BIT_KHR',8388608,b'\xFF\xFF\xFF\x0BVK_ACCESS_HOST_READ_BIT',8192,b'\xFF\xFF\xFF\x0BVK_ACCESS_HOST_WRITE_BIT',16384,b'\xFF\xFF\xFF\x0BVK_ACCESS_INDEX_READ_BIT',2,b'\xFF\xFF\xFF\x0BVK_ACCESS_INDIRECT_COMMAND_READ_BIT',1,b'\xFF\xFF\xFF\x0BVK_ACCESS_INPUT_ATTACHMENT_READ_BIT',16,b'\xFF\xFF\xFF\x0BVK_ACCESS_MEMORY_READ_BIT',32768,b'\xFF\xFF\xFF\x0BVK_ACCESS_MEMORY_WRITE_BIT',65536,b'\xFF\xFF\xFF\x0BVK_ACCESS_NONE',0,b'\xFF\xFF\xFF\x0BVK_ACCESS_NONE_KHR',0,b'\xFF\xFF\xFF\x0BVK_ACCESS_SHADER_READ_BIT',32,b'\xFF\xFF\xFF\x0BVK_ACCESS_SHADER_WRITE_BIT',64,b'\xFF\xFF\xFF\x0BVK_ACCESS_SHADING_RATE_IMAGE_READ_BIT_NV',8388608,b'\xFF\xFF\xFF\x0BVK_ACCESS_TRANSFER_READ_BIT',2048,b'\xFF\xFF\xFF\x0BVK_ACCESS_TRANSFER_WRITE_BIT',4096,b'\xFF\xFF\xFF\x0BVK_ACCESS_TRANSFORM_FEEDBACK_COUNTER_READ_BIT_EXT',67108864,b'\xFF\xFF\xFF\x0BVK_ACCESS_TRANSFORM_FEEDBACK_COUNTER_WRITE_BIT_EXT',134217728,b'\xFF\xFF\xFF\x0BVK_ACCESS_TRANSFORM_FEEDBACK_WRITE_BIT_EXT',33554432,b'\xFF\xFF\xFF\x0BVK_ACCESS_UNIFORM_READ_BIT',8,b'\xFF\xFF\xFF\x0BVK_ACCESS_VERTEX_ATTRIBUTE_READ_BIT',4,b'\xFF\xFF\xFF\x0BVK_ACQUIRE_PROFILING_LOCK_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_ATTACHMENT_DESCRIPTION_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_ATTACHMENT_DESCRIPTION_MAY_ALIAS_BIT',1,b'\xFF\xFF\xFF\x0BVK_ATTACHMENT_LOAD_OP_CLEAR',1,b'\xFF\xFF\xFF\x0BVK_ATTACHMENT_LOAD_OP_DONT_CARE',2,b'\xFF\xFF\xFF\x0BVK_ATTACHMENT_LOAD_OP_LOAD',0,b'\xFF\xFF\xFF\x0BVK_ATTACHMENT_LOAD_OP_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_ATTACHMENT_LOAD_OP_NONE_EXT',1000400000,b'\xFF\xFF\xFF\x0BVK_ATTACHMENT_STORE_OP_DONT_CARE',1,b'\xFF\xFF\xFF\x0BVK_ATTACHMENT_STORE_OP_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_ATTACHMENT_STORE_OP_NONE',1000301000,b'\xFF\xFF\xFF\x0BVK_ATTACHMENT_STORE_OP_NONE_EXT',1000301000,b'\xFF\xFF\xFF\x0BVK_ATTACHMENT_STORE_OP_NONE_KHR',1000301000,b'\xFF\xFF\xFF\x0BVK_ATTACHMENT_STORE_OP_NONE_QCOM',1000301000,b'\xFF\xFF\xFF\x0BVK_ATTACHMENT_STORE_OP_STORE',0,b'\xFF\xFF\xFF\x0BVK_BLEND_FACTOR_CONSTANT_ALPHA',12,b'\xFF\xFF\xFF\x0BVK_BLEND_FACTOR_CONSTANT_COLOR',10,b'\xFF\xFF\xFF\x0BVK_BLEND_FACTOR_DST_ALPHA',8,b'\xFF\xFF\xFF\x0BVK_BLEND_FACTOR_DST_COLOR',4,b'\xFF\xFF\xFF\x0BVK_BLEND_FACTOR_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_BLEND_FACTOR_ONE',1,b'\xFF\xFF\xFF\x0BVK_BLEND_FACTOR_ONE_MINUS_CONSTANT_ALPHA',13,b'\xFF\xFF\xFF\x0BVK_BLEND_FACTOR_ONE_MINUS_CONSTANT_COLOR',11,b'\xFF\xFF\xFF\x0BVK_BLEND_FACTOR_ONE_MINUS_DST_ALPHA',9,b'\xFF\xFF\xFF\x0BVK_BLEND_FACTOR_ONE_MINUS_DST_COLOR',5,b'\xFF\xFF\xFF\x0BVK_BLEND_FACTOR_ONE_MINUS_SRC1_ALPHA',18,b'\xFF\xFF\xFF\x0BVK_BLEND_FACTOR_ONE_MINUS_SRC1_COLOR',16,b'\xFF\xFF\xFF\x0BVK_BLEND_FACTOR_ONE_MINUS_SRC_ALPHA',7,b'\xFF\xFF\xFF\x0BVK_BLEND_FACTOR_ONE_MINUS_SRC_COLOR',3,b'\xFF\xFF\xFF\x0BVK_BLEND_FACTOR_SRC1_ALPHA',17,b'\xFF\xFF\xFF\x0BVK_BLEND_FACTOR_SRC1_COLOR',15,b'\xFF\xFF\xFF\x0BVK_BLEND_FACTOR_SRC_ALPHA',6,b'\xFF\xFF\xFF\x0BVK_BLEND_FACTOR_SRC_ALPHA_SATURATE',14,b'\xFF\xFF\xFF\x0BVK_BLEND_FACTOR_SRC_COLOR',2,b'\xFF\xFF\xFF\x0BVK_BLEND_FACTOR_ZERO',0,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_ADD',0,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_BLUE_EXT',1000148045,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_COLORBURN_EXT',1000148018,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_COLORDODGE_EXT',1000148017,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_CONTRAST_EXT',1000148041,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_DARKEN_EXT',1000148015,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_DIFFERENCE_EXT',1000148021,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_DST_ATOP_EXT',1000148010,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_DST_EXT',1000148002,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_DST_IN_EXT',1000148006,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_DST_OUT_EXT',1000148008,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_DST_OVER_EXT',1000148004,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_EXCLUSION_EXT',1000148022,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_GREEN_EXT',1000148044,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_HARDLIGHT_EXT',1000148019,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_HARDMIX_EXT',1000148030,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_HSL_COLOR_EXT',1000148033,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_HSL_HUE_EXT',1000148031,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_HSL_LUMINOSITY_EXT',1000148034,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_HSL_SATURATION_EXT',1000148032,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_INVERT_EXT',1000148023,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_INVERT_OVG_EXT',1000148042,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_INVERT_RGB_EXT',1000148024,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_LIGHTEN_EXT',1000148016,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_LINEARBURN_EXT',1000148026,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_LINEARDODGE_EXT',1000148025,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_LINEARLIGHT_EXT',1000148028,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_MAX',4,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_MIN',3,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_MINUS_CLAMPED_EXT',1000148040,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_MINUS_EXT',1000148039,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_MULTIPLY_EXT',1000148012,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_OVERLAY_EXT',1000148014,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_PINLIGHT_EXT',1000148029,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_PLUS_CLAMPED_ALPHA_EXT',1000148037,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_PLUS_CLAMPED_EXT',1000148036,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_PLUS_DARKER_EXT',1000148038,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_PLUS_EXT',1000148035,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_RED_EXT',1000148043,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_REVERSE_SUBTRACT',2,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_SCREEN_EXT',1000148013,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_SOFTLIGHT_EXT',1000148020,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_SRC_ATOP_EXT',1000148009,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_SRC_EXT',1000148001,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_SRC_IN_EXT',1000148005,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_SRC_OUT_EXT',1000148007,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_SRC_OVER_EXT',1000148003,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_SUBTRACT',1,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_VIVIDLIGHT_EXT',1000148027,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_XOR_EXT',1000148011,b'\xFF\xFF\xFF\x0BVK_BLEND_OP_ZERO_EXT',1000148000,b'\xFF\xFF\xFF\x0BVK_BLEND_OVERLAP_CONJOINT_EXT',2,b'\xFF\xFF\xFF\x0BVK_BLEND_OVERLAP_DISJOINT_EXT',1,b'\xFF\xFF\xFF\x0BVK_BLEND_OVERLAP_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_BLEND_OVERLAP_UNCORRELATED_EXT',0,b'\xFF\xFF\xFF\x0BVK_BLOCK_MATCH_WINDOW_COMPARE_MODE_MAX_ENUM_QCOM',2147483647,b'\xFF\xFF\xFF\x0BVK_BLOCK_MATCH_WINDOW_COMPARE_MODE_MAX_QCOM',1,b'\xFF\xFF\xFF\x0BVK_BLOCK_MATCH_WINDOW_COMPARE_MODE_MIN_QCOM',0,b'\xFF\xFF\xFF\x0BVK_BORDER_COLOR_FLOAT_CUSTOM_EXT',1000287003,b'\xFF\xFF\xFF\x0BVK_BORDER_COLOR_FLOAT_OPAQUE_BLACK',2,b'\xFF\xFF\xFF\x0BVK_BORDER_COLOR_FLOAT_OPAQUE_WHITE',4,b'\xFF\xFF\xFF\x0BVK_BORDER_COLOR_FLOAT_TRANSPARENT_BLACK',0,b'\xFF\xFF\xFF\x0BVK_BORDER_COLOR_INT_CUSTOM_EXT',1000287004,b'\xFF\xFF\xFF\x0BVK_BORDER_COLOR_INT_OPAQUE_BLACK',3,b'\xFF\xFF\xFF\x0BVK_BORDER_COLOR_INT_OPAQUE_WHITE',5,b'\xFF\xFF\xFF\x0BVK_BORDER_COLOR_INT_TRANSPARENT_BLACK',1,b'\xFF\xFF\xFF\x0BVK_BORDER_COLOR_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_BUFFER_CREATE_DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT',32,b'\xFF\xFF\xFF\x0BVK_BUFFER_CREATE_DEVICE_ADDRESS_CAPTURE_REPLAY_BIT',16,b'\xFF\xFF\xFF\x0BVK_BUFFER_CREATE_DEVICE_ADDRESS_CAPTURE_REPLAY_BIT_EXT',16,b'\xFF\xFF\xFF\x0BVK_BUFFER_CREATE_DEVICE_ADDRESS_CAPTURE_REPLAY_BIT_KHR',16,b'\xFF\xFF\xFF\x0BVK_BUFFER_CREATE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_BUFFER_CREATE_PROTECTED_BIT',8,b'\xFF\xFF\xFF\x0BVK_BUFFER_CREATE_SPARSE_ALIASED_BIT',4,b'\xFF\xFF\xFF\x0BVK_BUFFER_CREATE_SPARSE_BINDING_BIT',1,b'\xFF\xFF\xFF\x0BVK_BUFFER_CREATE_SPARSE_RESIDENCY_BIT',2,b'\xFF\xFF\xFF\x0BVK_BUFFER_CREATE_VIDEO_PROFILE_INDEPENDENT_BIT_KHR',64,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_ACCELERATION_STRUCTURE_BUILD_INPUT_READ_ONLY_BIT_KHR',524288,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_ACCELERATION_STRUCTURE_STORAGE_BIT_KHR',1048576,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_CONDITIONAL_RENDERING_BIT_EXT',512,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_EXECUTION_GRAPH_SCRATCH_BIT_AMDX',33554432,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_INDEX_BUFFER_BIT_KHR',64,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_INDIRECT_BUFFER_BIT_KHR',256,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_MICROMAP_BUILD_INPUT_READ_ONLY_BIT_EXT',8388608,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_MICROMAP_STORAGE_BIT_EXT',16777216,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_PUSH_DESCRIPTORS_DESCRIPTOR_BUFFER_BIT_EXT',67108864,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_RAY_TRACING_BIT_NV',1024,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_RESOURCE_DESCRIPTOR_BUFFER_BIT_EXT',4194304,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_SAMPLER_DESCRIPTOR_BUFFER_BIT_EXT',2097152,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_SHADER_BINDING_TABLE_BIT_KHR',1024,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_SHADER_DEVICE_ADDRESS_BIT_KHR',131072,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_STORAGE_BUFFER_BIT_KHR',32,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_STORAGE_TEXEL_BUFFER_BIT_KHR',8,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_TRANSFER_DST_BIT_KHR',2,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_TRANSFER_SRC_BIT_KHR',1,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_TRANSFORM_FEEDBACK_BUFFER_BIT_EXT',2048,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_TRANSFORM_FEEDBACK_COUNTER_BUFFER_BIT_EXT',4096,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_UNIFORM_BUFFER_BIT_KHR',16,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_UNIFORM_TEXEL_BUFFER_BIT_KHR',4,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_VERTEX_BUFFER_BIT_KHR',128,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_VIDEO_DECODE_DST_BIT_KHR',16384,b'\xFF\xFF\xFF\x1FVK_BUFFER_USAGE_2_VIDEO_DECODE_SRC_BIT_KHR',8192,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_ACCELERATION_STRUCTURE_BUILD_INPUT_READ_ONLY_BIT_KHR',524288,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_ACCELERATION_STRUCTURE_STORAGE_BIT_KHR',1048576,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_CONDITIONAL_RENDERING_BIT_EXT',512,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_INDEX_BUFFER_BIT',64,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_INDIRECT_BUFFER_BIT',256,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_MICROMAP_BUILD_INPUT_READ_ONLY_BIT_EXT',8388608,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_MICROMAP_STORAGE_BIT_EXT',16777216,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_PUSH_DESCRIPTORS_DESCRIPTOR_BUFFER_BIT_EXT',67108864,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_RAY_TRACING_BIT_NV',1024,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_RESOURCE_DESCRIPTOR_BUFFER_BIT_EXT',4194304,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_SAMPLER_DESCRIPTOR_BUFFER_BIT_EXT',2097152,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_SHADER_BINDING_TABLE_BIT_KHR',1024,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_SHADER_DEVICE_ADDRESS_BIT',131072,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_SHADER_DEVICE_ADDRESS_BIT_EXT',131072,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_SHADER_DEVICE_ADDRESS_BIT_KHR',131072,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_STORAGE_BUFFER_BIT',32,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_STORAGE_TEXEL_BUFFER_BIT',8,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_TRANSFER_DST_BIT',2,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_TRANSFER_SRC_BIT',1,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_TRANSFORM_FEEDBACK_BUFFER_BIT_EXT',2048,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_TRANSFORM_FEEDBACK_COUNTER_BUFFER_BIT_EXT',4096,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_UNIFORM_BUFFER_BIT',16,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_UNIFORM_TEXEL_BUFFER_BIT',4,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_VERTEX_BUFFER_BIT',128,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_VIDEO_DECODE_DST_BIT_KHR',16384,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_VIDEO_DECODE_SRC_BIT_KHR',8192,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_VIDEO_ENCODE_DST_BIT_KHR',32768,b'\xFF\xFF\xFF\x0BVK_BUFFER_USAGE_VIDEO_ENCODE_SRC_BIT_KHR',65536,b'\xFF\xFF\xFF\x0BVK_BUILD_ACCELERATION_STRUCTURE_ALLOW_COMPACTION_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_BUILD_ACCELERATION_STRUCTURE_ALLOW_COMPACTION_BIT_NV',2,b'\xFF\xFF\xFF\x0BVK_BUILD_ACCELERATION_STRUCTURE_ALLOW_DATA_ACCESS_KHR',2048,b'\xFF\xFF\xFF\x0BVK_BUILD_ACCELERATION_STRUCTURE_ALLOW_DISABLE_OPACITY_MICROMAPS_EXT',128,b'\xFF\xFF\xFF\x0BVK_BUILD_ACCELERATION_STRUCTURE_ALLOW_OPACITY_MICROMAP_DATA_UPDATE_EXT',256,b'\xFF\xFF\xFF\x0BVK_BUILD_ACCELERATION_STRUCTURE_ALLOW_OPACITY_MICROMAP_UPDATE_EXT',64,b'\xFF\xFF\xFF\x0BVK_BUILD_ACCELERATION_STRUCTURE_ALLOW_UPDATE_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_BUILD_ACCELERATION_STRUCTURE_ALLOW_UPDATE_BIT_NV',1,b'\xFF\xFF\xFF\x0BVK_BUILD_ACCELERATION_STRUCTURE_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_BUILD_ACCELERATION_STRUCTURE_LOW_MEMORY_BIT_KHR',16,b'\xFF\xFF\xFF\x0BVK_BUILD_ACCELERATION_STRUCTURE_LOW_MEMORY_BIT_NV',16,b'\xFF\xFF\xFF\x0BVK_BUILD_ACCELERATION_STRUCTURE_MODE_BUILD_KHR',0,b'\xFF\xFF\xFF\x0BVK_BUILD_ACCELERATION_STRUCTURE_MODE_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_BUILD_ACCELERATION_STRUCTURE_MODE_UPDATE_KHR',1,b'\xFF\xFF\xFF\x0BVK_BUILD_ACCELERATION_STRUCTURE_MOTION_BIT_NV',32,b'\xFF\xFF\xFF\x0BVK_BUILD_ACCELERATION_STRUCTURE_PREFER_FAST_BUILD_BIT_KHR',8,b'\xFF\xFF\xFF\x0BVK_BUILD_ACCELERATION_STRUCTURE_PREFER_FAST_BUILD_BIT_NV',8,b'\xFF\xFF\xFF\x0BVK_BUILD_ACCELERATION_STRUCTURE_PREFER_FAST_TRACE_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_BUILD_ACCELERATION_STRUCTURE_PREFER_FAST_TRACE_BIT_NV',4,b'\xFF\xFF\xFF\x0BVK_BUILD_MICROMAP_ALLOW_COMPACTION_BIT_EXT',4,b'\xFF\xFF\xFF\x0BVK_BUILD_MICROMAP_FLAG_BITS_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_BUILD_MICROMAP_MODE_BUILD_EXT',0,b'\xFF\xFF\xFF\x0BVK_BUILD_MICROMAP_MODE_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_BUILD_MICROMAP_PREFER_FAST_BUILD_BIT_EXT',2,b'\xFF\xFF\xFF\x0BVK_BUILD_MICROMAP_PREFER_FAST_TRACE_BIT_EXT',1,b'\xFF\xFF\xFF\x0BVK_CHROMA_LOCATION_COSITED_EVEN',0,b'\xFF\xFF\xFF\x0BVK_CHROMA_LOCATION_COSITED_EVEN_KHR',0,b'\xFF\xFF\xFF\x0BVK_CHROMA_LOCATION_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_CHROMA_LOCATION_MIDPOINT',1,b'\xFF\xFF\xFF\x0BVK_CHROMA_LOCATION_MIDPOINT_KHR',1,b'\xFF\xFF\xFF\x0BVK_COARSE_SAMPLE_ORDER_TYPE_CUSTOM_NV',1,b'\xFF\xFF\xFF\x0BVK_COARSE_SAMPLE_ORDER_TYPE_DEFAULT_NV',0,b'\xFF\xFF\xFF\x0BVK_COARSE_SAMPLE_ORDER_TYPE_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_COARSE_SAMPLE_ORDER_TYPE_PIXEL_MAJOR_NV',2,b'\xFF\xFF\xFF\x0BVK_COARSE_SAMPLE_ORDER_TYPE_SAMPLE_MAJOR_NV',3,b'\xFF\xFF\xFF\x0BVK_COLORSPACE_SRGB_NONLINEAR_KHR',0,b'\xFF\xFF\xFF\x0BVK_COLOR_COMPONENT_A_BIT',8,b'\xFF\xFF\xFF\x0BVK_COLOR_COMPONENT_B_BIT',4,b'\xFF\xFF\xFF\x0BVK_COLOR_COMPONENT_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_COLOR_COMPONENT_G_BIT',2,b'\xFF\xFF\xFF\x0BVK_COLOR_COMPONENT_R_BIT',1,b'\xFF\xFF\xFF\x0BVK_COLOR_SPACE_ADOBERGB_LINEAR_EXT',1000104011,b'\xFF\xFF\xFF\x0BVK_COLOR_SPACE_ADOBERGB_NONLINEAR_EXT',1000104012,b'\xFF\xFF\xFF\x0BVK_COLOR_SPACE_BT2020_LINEAR_EXT',1000104007,b'\xFF\xFF\xFF\x0BVK_COLOR_SPACE_BT709_LINEAR_EXT',1000104005,b'\xFF\xFF\xFF\x0BVK_COLOR_SPACE_BT709_NONLINEAR_EXT',1000104006,b'\xFF\xFF\xFF\x0BVK_COLOR_SPACE_DCI_P3_LINEAR_EXT',1000104003,b'\xFF\xFF\xFF\x0BVK_COLOR_SPACE_DCI_P3_NONLINEAR_EXT',1000104004,b'\xFF\xFF\xFF\x0BVK_COLOR_SPACE_DISPLAY_NATIVE_AMD',1000213000,b'\xFF\xFF\xFF\x0BVK_COLOR_SPACE_DISPLAY_P3_LINEAR_EXT',1000104003,b'\xFF\xFF\xFF\x0BVK_COLOR_SPACE_DISPLAY_P3_NONLINEAR_EXT',1000104001,b'\xFF\xFF\xFF\x0BVK_COLOR_SPACE_DOLBYVISION_EXT',1000104009,b'\xFF\xFF\xFF\x0BVK_COLOR_SPACE_EXTENDED_SRGB_LINEAR_EXT',1000104002,b'\xFF\xFF\xFF\x0BVK_COLOR_SPACE_EXTENDED_SRGB_NONLINEAR_EXT',1000104014,b'\xFF\xFF\xFF\x0BVK_COLOR_SPACE_HDR10_HLG_EXT',1000104010,b'\xFF\xFF\xFF\x0BVK_COLOR_SPACE_HDR10_ST2084_EXT',1000104008,b'\xFF\xFF\xFF\x0BVK_COLOR_SPACE_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_COLOR_SPACE_PASS_THROUGH_EXT',1000104013,b'\xFF\xFF\xFF\x0BVK_COLOR_SPACE_SRGB_NONLINEAR_KHR',0,b'\xFF\xFF\xFF\x0BVK_COMMAND_BUFFER_LEVEL_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_COMMAND_BUFFER_LEVEL_PRIMARY',0,b'\xFF\xFF\xFF\x0BVK_COMMAND_BUFFER_LEVEL_SECONDARY',1,b'\xFF\xFF\xFF\x0BVK_COMMAND_BUFFER_RESET_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_COMMAND_BUFFER_RESET_RELEASE_RESOURCES_BIT',1,b'\xFF\xFF\xFF\x0BVK_COMMAND_BUFFER_USAGE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_COMMAND_BUFFER_USAGE_ONE_TIME_SUBMIT_BIT',1,b'\xFF\xFF\xFF\x0BVK_COMMAND_BUFFER_USAGE_RENDER_PASS_CONTINUE_BIT',2,b'\xFF\xFF\xFF\x0BVK_COMMAND_BUFFER_USAGE_SIMULTANEOUS_USE_BIT',4,b'\xFF\xFF\xFF\x0BVK_COMMAND_POOL_CREATE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_COMMAND_POOL_CREATE_PROTECTED_BIT',4,b'\xFF\xFF\xFF\x0BVK_COMMAND_POOL_CREATE_RESET_COMMAND_BUFFER_BIT',2,b'\xFF\xFF\xFF\x0BVK_COMMAND_POOL_CREATE_TRANSIENT_BIT',1,b'\xFF\xFF\xFF\x0BVK_COMMAND_POOL_RESET_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_COMMAND_POOL_RESET_RELEASE_RESOURCES_BIT',1,b'\xFF\xFF\xFF\x0BVK_COMPARE_OP_ALWAYS',7,b'\xFF\xFF\xFF\x0BVK_COMPARE_OP_EQUAL',2,b'\xFF\xFF\xFF\x0BVK_COMPARE_OP_GREATER',4,b'\xFF\xFF\xFF\x0BVK_COMPARE_OP_GREATER_OR_EQUAL',6,b'\xFF\xFF\xFF\x0BVK_COMPARE_OP_LESS',1,b'\xFF\xFF\xFF\x0BVK_COMPARE_OP_LESS_OR_EQUAL',3,b'\xFF\xFF\xFF\x0BVK_COMPARE_OP_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_COMPARE_OP_NEVER',0,b'\xFF\xFF\xFF\x0BVK_COMPARE_OP_NOT_EQUAL',5,b'\xFF\xFF\xFF\x0BVK_COMPONENT_SWIZZLE_A',6,b'\xFF\xFF\xFF\x0BVK_COMPONENT_SWIZZLE_B',5,b'\xFF\xFF\xFF\x0BVK_COMPONENT_SWIZZLE_G',4,b'\xFF\xFF\xFF\x0BVK_COMPONENT_SWIZZLE_IDENTITY',0,b'\xFF\xFF\xFF\x0BVK_COMPONENT_SWIZZLE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_COMPONENT_SWIZZLE_ONE',2,b'\xFF\xFF\xFF\x0BVK_COMPONENT_SWIZZLE_R',3,b'\xFF\xFF\xFF\x0BVK_COMPONENT_SWIZZLE_ZERO',1,b'\xFF\xFF\xFF\x0BVK_COMPONENT_TYPE_FLOAT16_KHR',0,b'\xFF\xFF\xFF\x0BVK_COMPONENT_TYPE_FLOAT16_NV',0,b'\xFF\xFF\xFF\x0BVK_COMPONENT_TYPE_FLOAT32_KHR',1,b'\xFF\xFF\xFF\x0BVK_COMPONENT_TYPE_FLOAT32_NV',1,b'\xFF\xFF\xFF\x0BVK_COMPONENT_TYPE_FLOAT64_KHR',2,b'\xFF\xFF\xFF\x0BVK_COMPONENT_TYPE_FLOAT64_NV',2,b'\xFF\xFF\xFF\x0BVK_COMPONENT_TYPE_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_COMPONENT_TYPE_SINT16_KHR',4,b'\xFF\xFF\xFF\x0BVK_COMPONENT_TYPE_SINT16_NV',4,b'\xFF\xFF\xFF\x0BVK_COMPONENT_TYPE_SINT32_KHR',5,b'\xFF\xFF\xFF\x0BVK_COMPONENT_TYPE_SINT32_NV',5,b'\xFF\xFF\xFF\x0BVK_COMPONENT_TYPE_SINT64_KHR',6,b'\xFF\xFF\xFF\x0BVK_COMPONENT_TYPE_SINT64_NV',6,b'\xFF\xFF\xFF\x0BVK_COMPONENT_TYPE_SINT8_KHR',3,b'\xFF\xFF\xFF\x0BVK_COMPONENT_TYPE_SINT8_NV',3,b'\xFF\xFF\xFF\x0BVK_COMPONENT_TYPE_UINT16_KHR',8,b'\xFF\xFF\xFF\x0BVK_COMPONENT_TYPE_UINT16_NV',8,b'\xFF\xFF\xFF\x0BVK_COMPONENT_TYPE_UINT32_KHR',9,b'\xFF\xFF\xFF\x0BVK_COMPONENT_TYPE_UINT32_NV',9,b'\xFF\xFF\xFF\x0BVK_COMPONENT_TYPE_UINT64_KHR',10,b'\xFF\xFF\xFF\x0BVK_COMPONENT_TYPE_UINT64_NV',10,b'\xFF\xFF\xFF\x0BVK_COMPONENT_TYPE_UINT8_KHR',7,b'\xFF\xFF\xFF\x0BVK_COMPONENT_TYPE_UINT8_NV',7,b'\xFF\xFF\xFF\x0BVK_COMPOSITE_ALPHA_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_COMPOSITE_ALPHA_INHERIT_BIT_KHR',8,b'\xFF\xFF\xFF\x0BVK_COMPOSITE_ALPHA_OPAQUE_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_COMPOSITE_ALPHA_POST_MULTIPLIED_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_COMPOSITE_ALPHA_PRE_MULTIPLIED_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_CONDITIONAL_RENDERING_FLAG_BITS_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_CONDITIONAL_RENDERING_INVERTED_BIT_EXT',1,b'\xFF\xFF\xFF\x0BVK_CONSERVATIVE_RASTERIZATION_MODE_DISABLED_EXT',0,b'\xFF\xFF\xFF\x0BVK_CONSERVATIVE_RASTERIZATION_MODE_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_CONSERVATIVE_RASTERIZATION_MODE_OVERESTIMATE_EXT',1,b'\xFF\xFF\xFF\x0BVK_CONSERVATIVE_RASTERIZATION_MODE_UNDERESTIMATE_EXT',2,b'\xFF\xFF\xFF\x0BVK_COPY_ACCELERATION_STRUCTURE_MODE_CLONE_KHR',0,b'\xFF\xFF\xFF\x0BVK_COPY_ACCELERATION_STRUCTURE_MODE_CLONE_NV',0,b'\xFF\xFF\xFF\x0BVK_COPY_ACCELERATION_STRUCTURE_MODE_COMPACT_KHR',1,b'\xFF\xFF\xFF\x0BVK_COPY_ACCELERATION_STRUCTURE_MODE_COMPACT_NV',1,b'\xFF\xFF\xFF\x0BVK_COPY_ACCELERATION_STRUCTURE_MODE_DESERIALIZE_KHR',3,b'\xFF\xFF\xFF\x0BVK_COPY_ACCELERATION_STRUCTURE_MODE_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_COPY_ACCELERATION_STRUCTURE_MODE_SERIALIZE_KHR',2,b'\xFF\xFF\xFF\x0BVK_COPY_MICROMAP_MODE_CLONE_EXT',0,b'\xFF\xFF\xFF\x0BVK_COPY_MICROMAP_MODE_COMPACT_EXT',3,b'\xFF\xFF\xFF\x0BVK_COPY_MICROMAP_MODE_DESERIALIZE_EXT',2,b'\xFF\xFF\xFF\x0BVK_COPY_MICROMAP_MODE_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_COPY_MICROMAP_MODE_SERIALIZE_EXT',1,b'\xFF\xFF\xFF\x0BVK_COVERAGE_MODULATION_MODE_ALPHA_NV',2,b'\xFF\xFF\xFF\x0BVK_COVERAGE_MODULATION_MODE_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_COVERAGE_MODULATION_MODE_NONE_NV',0,b'\xFF\xFF\xFF\x0BVK_COVERAGE_MODULATION_MODE_RGBA_NV',3,b'\xFF\xFF\xFF\x0BVK_COVERAGE_MODULATION_MODE_RGB_NV',1,b'\xFF\xFF\xFF\x0BVK_COVERAGE_REDUCTION_MODE_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_COVERAGE_REDUCTION_MODE_MERGE_NV',0,b'\xFF\xFF\xFF\x0BVK_COVERAGE_REDUCTION_MODE_TRUNCATE_NV',1,b'\xFF\xFF\xFF\x0BVK_CUBIC_FILTER_WEIGHTS_B_SPLINE_QCOM',2,b'\xFF\xFF\xFF\x0BVK_CUBIC_FILTER_WEIGHTS_CATMULL_ROM_QCOM',0,b'\xFF\xFF\xFF\x0BVK_CUBIC_FILTER_WEIGHTS_MAX_ENUM_QCOM',2147483647,b'\xFF\xFF\xFF\x0BVK_CUBIC_FILTER_WEIGHTS_MITCHELL_NETRAVALI_QCOM',3,b'\xFF\xFF\xFF\x0BVK_CUBIC_FILTER_WEIGHTS_ZERO_TANGENT_CARDINAL_QCOM',1,b'\xFF\xFF\xFF\x0BVK_CULL_MODE_BACK_BIT',2,b'\xFF\xFF\xFF\x0BVK_CULL_MODE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_CULL_MODE_FRONT_AND_BACK',3,b'\xFF\xFF\xFF\x0BVK_CULL_MODE_FRONT_BIT',1,b'\xFF\xFF\xFF\x0BVK_CULL_MODE_NONE',0,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_DEBUG_BIT_EXT',16,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_ERROR_BIT_EXT',8,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_FLAG_BITS_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_INFORMATION_BIT_EXT',1,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_ACCELERATION_STRUCTURE_KHR_EXT',1000150000,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_ACCELERATION_STRUCTURE_NV_EXT',1000165000,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_COLLECTION_FUCHSIA_EXT',1000366000,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_EXT',9,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_VIEW_EXT',13,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_BUFFER_EXT',6,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_POOL_EXT',25,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_CUDA_FUNCTION_NV_EXT',1000307001,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_CUDA_MODULE_NV_EXT',1000307000,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_CU_FUNCTION_NVX_EXT',1000029001,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_CU_MODULE_NVX_EXT',1000029000,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_DEBUG_REPORT_CALLBACK_EXT_EXT',28,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_DEBUG_REPORT_EXT',28,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_POOL_EXT',22,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_EXT',23,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT_EXT',20,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_UPDATE_TEMPLATE_EXT',1000085000,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_UPDATE_TEMPLATE_KHR_EXT',1000085000,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_EXT',3,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_MEMORY_EXT',8,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_KHR_EXT',29,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_MODE_KHR_EXT',30,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_EVENT_EXT',11,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_FENCE_EXT',7,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_FRAMEBUFFER_EXT',24,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_EXT',10,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_VIEW_EXT',14,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_INSTANCE_EXT',1,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_PHYSICAL_DEVICE_EXT',2,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_CACHE_EXT',16,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_EXT',19,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_LAYOUT_EXT',17,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_QUERY_POOL_EXT',12,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_QUEUE_EXT',4,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_RENDER_PASS_EXT',18,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_SAMPLER_EXT',21,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_SAMPLER_YCBCR_CONVERSION_EXT',1000156000,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_SAMPLER_YCBCR_CONVERSION_KHR_EXT',1000156000,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_SEMAPHORE_EXT',5,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_SHADER_MODULE_EXT',15,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_SURFACE_KHR_EXT',26,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_SWAPCHAIN_KHR_EXT',27,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT',0,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_VALIDATION_CACHE_EXT',33,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_OBJECT_TYPE_VALIDATION_CACHE_EXT_EXT',33,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_PERFORMANCE_WARNING_BIT_EXT',4,b'\xFF\xFF\xFF\x0BVK_DEBUG_REPORT_WARNING_BIT_EXT',2,b'\xFF\xFF\xFF\x0BVK_DEBUG_UTILS_MESSAGE_SEVERITY_ERROR_BIT_EXT',4096,b'\xFF\xFF\xFF\x0BVK_DEBUG_UTILS_MESSAGE_SEVERITY_FLAG_BITS_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_DEBUG_UTILS_MESSAGE_SEVERITY_INFO_BIT_EXT',16,b'\xFF\xFF\xFF\x0BVK_DEBUG_UTILS_MESSAGE_SEVERITY_VERBOSE_BIT_EXT',1,b'\xFF\xFF\xFF\x0BVK_DEBUG_UTILS_MESSAGE_SEVERITY_WARNING_BIT_EXT',256,b'\xFF\xFF\xFF\x0BVK_DEBUG_UTILS_MESSAGE_TYPE_DEVICE_ADDRESS_BINDING_BIT_EXT',8,b'\xFF\xFF\xFF\x0BVK_DEBUG_UTILS_MESSAGE_TYPE_FLAG_BITS_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_DEBUG_UTILS_MESSAGE_TYPE_GENERAL_BIT_EXT',1,b'\xFF\xFF\xFF\x0BVK_DEBUG_UTILS_MESSAGE_TYPE_PERFORMANCE_BIT_EXT',4,b'\xFF\xFF\xFF\x0BVK_DEBUG_UTILS_MESSAGE_TYPE_VALIDATION_BIT_EXT',2,b'\xFF\xFF\xFF\x0BVK_DEPENDENCY_BY_REGION_BIT',1,b'\xFF\xFF\xFF\x0BVK_DEPENDENCY_DEVICE_GROUP_BIT',4,b'\xFF\xFF\xFF\x0BVK_DEPENDENCY_DEVICE_GROUP_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_DEPENDENCY_FEEDBACK_LOOP_BIT_EXT',8,b'\xFF\xFF\xFF\x0BVK_DEPENDENCY_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_DEPENDENCY_VIEW_LOCAL_BIT',2,b'\xFF\xFF\xFF\x0BVK_DEPENDENCY_VIEW_LOCAL_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_DEPTH_BIAS_REPRESENTATION_FLOAT_EXT',2,b'\xFF\xFF\xFF\x0BVK_DEPTH_BIAS_REPRESENTATION_LEAST_REPRESENTABLE_VALUE_FORCE_UNORM_EXT',1,b'\xFF\xFF\xFF\x0BVK_DEPTH_BIAS_REPRESENTATION_LEAST_REPRESENTABLE_VALUE_FORMAT_EXT',0,b'\xFF\xFF\xFF\x0BVK_DEPTH_BIAS_REPRESENTATION_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_BINDING_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_BINDING_PARTIALLY_BOUND_BIT',4,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_BINDING_PARTIALLY_BOUND_BIT_EXT',4,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_BINDING_UPDATE_AFTER_BIND_BIT',1,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_BINDING_UPDATE_AFTER_BIND_BIT_EXT',1,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_BINDING_UPDATE_UNUSED_WHILE_PENDING_BIT',2,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_BINDING_UPDATE_UNUSED_WHILE_PENDING_BIT_EXT',2,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_BINDING_VARIABLE_DESCRIPTOR_COUNT_BIT',8,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_BINDING_VARIABLE_DESCRIPTOR_COUNT_BIT_EXT',8,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_POOL_CREATE_ALLOW_OVERALLOCATION_POOLS_BIT_NV',16,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_POOL_CREATE_ALLOW_OVERALLOCATION_SETS_BIT_NV',8,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_POOL_CREATE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_POOL_CREATE_FREE_DESCRIPTOR_SET_BIT',1,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_POOL_CREATE_HOST_ONLY_BIT_EXT',4,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_POOL_CREATE_HOST_ONLY_BIT_VALVE',4,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_POOL_CREATE_UPDATE_AFTER_BIND_BIT',2,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_POOL_CREATE_UPDATE_AFTER_BIND_BIT_EXT',2,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_SET_LAYOUT_CREATE_DESCRIPTOR_BUFFER_BIT_EXT',16,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_SET_LAYOUT_CREATE_EMBEDDED_IMMUTABLE_SAMPLERS_BIT_EXT',32,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_SET_LAYOUT_CREATE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_SET_LAYOUT_CREATE_HOST_ONLY_POOL_BIT_EXT',4,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_SET_LAYOUT_CREATE_HOST_ONLY_POOL_BIT_VALVE',4,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_SET_LAYOUT_CREATE_INDIRECT_BINDABLE_BIT_NV',128,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_SET_LAYOUT_CREATE_PER_STAGE_BIT_NV',64,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_SET_LAYOUT_CREATE_PUSH_DESCRIPTOR_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_SET_LAYOUT_CREATE_UPDATE_AFTER_BIND_POOL_BIT',2,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_SET_LAYOUT_CREATE_UPDATE_AFTER_BIND_POOL_BIT_EXT',2,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_TYPE_ACCELERATION_STRUCTURE_KHR',1000150000,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_TYPE_ACCELERATION_STRUCTURE_NV',1000165000,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_TYPE_BLOCK_MATCH_IMAGE_QCOM',1000440001,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_TYPE_COMBINED_IMAGE_SAMPLER',1,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_TYPE_INLINE_UNIFORM_BLOCK',1000138000,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_TYPE_INLINE_UNIFORM_BLOCK_EXT',1000138000,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_TYPE_INPUT_ATTACHMENT',10,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_TYPE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_TYPE_MUTABLE_EXT',1000351000,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_TYPE_MUTABLE_VALVE',1000351000,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_TYPE_SAMPLED_IMAGE',2,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_TYPE_SAMPLER',0,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_TYPE_SAMPLE_WEIGHT_IMAGE_QCOM',1000440000,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_TYPE_STORAGE_BUFFER',7,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_TYPE_STORAGE_BUFFER_DYNAMIC',9,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_TYPE_STORAGE_IMAGE',3,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_TYPE_STORAGE_TEXEL_BUFFER',5,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_TYPE_UNIFORM_BUFFER',6,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_TYPE_UNIFORM_BUFFER_DYNAMIC',8,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_TYPE_UNIFORM_TEXEL_BUFFER',4,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_UPDATE_TEMPLATE_TYPE_DESCRIPTOR_SET',0,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_UPDATE_TEMPLATE_TYPE_DESCRIPTOR_SET_KHR',0,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_UPDATE_TEMPLATE_TYPE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_DESCRIPTOR_UPDATE_TEMPLATE_TYPE_PUSH_DESCRIPTORS_KHR',1,b'\xFF\xFF\xFF\x0BVK_DEVICE_ADDRESS_BINDING_FLAG_BITS_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_DEVICE_ADDRESS_BINDING_INTERNAL_OBJECT_BIT_EXT',1,b'\xFF\xFF\xFF\x0BVK_DEVICE_ADDRESS_BINDING_TYPE_BIND_EXT',0,b'\xFF\xFF\xFF\x0BVK_DEVICE_ADDRESS_BINDING_TYPE_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_DEVICE_ADDRESS_BINDING_TYPE_UNBIND_EXT',1,b'\xFF\xFF\xFF\x0BVK_DEVICE_DIAGNOSTICS_CONFIG_ENABLE_AUTOMATIC_CHECKPOINTS_BIT_NV',4,b'\xFF\xFF\xFF\x0BVK_DEVICE_DIAGNOSTICS_CONFIG_ENABLE_RESOURCE_TRACKING_BIT_NV',2,b'\xFF\xFF\xFF\x0BVK_DEVICE_DIAGNOSTICS_CONFIG_ENABLE_SHADER_DEBUG_INFO_BIT_NV',1,b'\xFF\xFF\xFF\x0BVK_DEVICE_DIAGNOSTICS_CONFIG_ENABLE_SHADER_ERROR_REPORTING_BIT_NV',8,b'\xFF\xFF\xFF\x0BVK_DEVICE_DIAGNOSTICS_CONFIG_FLAG_BITS_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_DEVICE_EVENT_TYPE_DISPLAY_HOTPLUG_EXT',0,b'\xFF\xFF\xFF\x0BVK_DEVICE_EVENT_TYPE_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_DEVICE_FAULT_ADDRESS_TYPE_EXECUTE_INVALID_EXT',3,b'\xFF\xFF\xFF\x0BVK_DEVICE_FAULT_ADDRESS_TYPE_INSTRUCTION_POINTER_FAULT_EXT',6,b'\xFF\xFF\xFF\x0BVK_DEVICE_FAULT_ADDRESS_TYPE_INSTRUCTION_POINTER_INVALID_EXT',5,b'\xFF\xFF\xFF\x0BVK_DEVICE_FAULT_ADDRESS_TYPE_INSTRUCTION_POINTER_UNKNOWN_EXT',4,b'\xFF\xFF\xFF\x0BVK_DEVICE_FAULT_ADDRESS_TYPE_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_DEVICE_FAULT_ADDRESS_TYPE_NONE_EXT',0,b'\xFF\xFF\xFF\x0BVK_DEVICE_FAULT_ADDRESS_TYPE_READ_INVALID_EXT',1,b'\xFF\xFF\xFF\x0BVK_DEVICE_FAULT_ADDRESS_TYPE_WRITE_INVALID_EXT',2,b'\xFF\xFF\xFF\x0BVK_DEVICE_FAULT_VENDOR_BINARY_HEADER_VERSION_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_DEVICE_FAULT_VENDOR_BINARY_HEADER_VERSION_ONE_EXT',1,b'\xFF\xFF\xFF\x0BVK_DEVICE_GROUP_PRESENT_MODE_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_DEVICE_GROUP_PRESENT_MODE_LOCAL_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_DEVICE_GROUP_PRESENT_MODE_LOCAL_MULTI_DEVICE_BIT_KHR',8,b'\xFF\xFF\xFF\x0BVK_DEVICE_GROUP_PRESENT_MODE_REMOTE_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_DEVICE_GROUP_PRESENT_MODE_SUM_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_DEVICE_MEMORY_REPORT_EVENT_TYPE_ALLOCATE_EXT',0,b'\xFF\xFF\xFF\x0BVK_DEVICE_MEMORY_REPORT_EVENT_TYPE_ALLOCATION_FAILED_EXT',4,b'\xFF\xFF\xFF\x0BVK_DEVICE_MEMORY_REPORT_EVENT_TYPE_FREE_EXT',1,b'\xFF\xFF\xFF\x0BVK_DEVICE_MEMORY_REPORT_EVENT_TYPE_IMPORT_EXT',2,b'\xFF\xFF\xFF\x0BVK_DEVICE_MEMORY_REPORT_EVENT_TYPE_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_DEVICE_MEMORY_REPORT_EVENT_TYPE_UNIMPORT_EXT',3,b'\xFF\xFF\xFF\x0BVK_DEVICE_QUEUE_CREATE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_DEVICE_QUEUE_CREATE_PROTECTED_BIT',1,b'\xFF\xFF\xFF\x0BVK_DIRECT_DRIVER_LOADING_MODE_EXCLUSIVE_LUNARG',0,b'\xFF\xFF\xFF\x0BVK_DIRECT_DRIVER_LOADING_MODE_INCLUSIVE_LUNARG',1,b'\xFF\xFF\xFF\x0BVK_DIRECT_DRIVER_LOADING_MODE_MAX_ENUM_LUNARG',2147483647,b'\xFF\xFF\xFF\x0BVK_DISCARD_RECTANGLE_MODE_EXCLUSIVE_EXT',1,b'\xFF\xFF\xFF\x0BVK_DISCARD_RECTANGLE_MODE_INCLUSIVE_EXT',0,b'\xFF\xFF\xFF\x0BVK_DISCARD_RECTANGLE_MODE_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_DISPLAY_EVENT_TYPE_FIRST_PIXEL_OUT_EXT',0,b'\xFF\xFF\xFF\x0BVK_DISPLAY_EVENT_TYPE_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_DISPLAY_PLANE_ALPHA_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_DISPLAY_PLANE_ALPHA_GLOBAL_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_DISPLAY_PLANE_ALPHA_OPAQUE_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_DISPLAY_PLANE_ALPHA_PER_PIXEL_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_DISPLAY_PLANE_ALPHA_PER_PIXEL_PREMULTIPLIED_BIT_KHR',8,b'\xFF\xFF\xFF\x0BVK_DISPLAY_POWER_STATE_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_DISPLAY_POWER_STATE_OFF_EXT',0,b'\xFF\xFF\xFF\x0BVK_DISPLAY_POWER_STATE_ON_EXT',2,b'\xFF\xFF\xFF\x0BVK_DISPLAY_POWER_STATE_SUSPEND_EXT',1,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_AMD_OPEN_SOURCE',2,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_AMD_OPEN_SOURCE_KHR',2,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_AMD_PROPRIETARY',1,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_AMD_PROPRIETARY_KHR',1,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_ARM_PROPRIETARY',9,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_ARM_PROPRIETARY_KHR',9,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_BROADCOM_PROPRIETARY',12,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_BROADCOM_PROPRIETARY_KHR',12,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_COREAVI_PROPRIETARY',15,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_GGP_PROPRIETARY',11,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_GGP_PROPRIETARY_KHR',11,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_GOOGLE_SWIFTSHADER',10,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_GOOGLE_SWIFTSHADER_KHR',10,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_IMAGINATION_OPEN_SOURCE_MESA',25,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_IMAGINATION_PROPRIETARY',7,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_IMAGINATION_PROPRIETARY_KHR',7,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_INTEL_OPEN_SOURCE_MESA',6,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_INTEL_OPEN_SOURCE_MESA_KHR',6,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_INTEL_PROPRIETARY_WINDOWS',5,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_INTEL_PROPRIETARY_WINDOWS_KHR',5,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_JUICE_PROPRIETARY',16,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_MESA_AGXV',26,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_MESA_DOZEN',23,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_MESA_LLVMPIPE',13,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_MESA_NVK',24,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_MESA_PANVK',20,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_MESA_RADV',3,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_MESA_RADV_KHR',3,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_MESA_TURNIP',18,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_MESA_V3DV',19,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_MESA_VENUS',22,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_MOLTENVK',14,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_NVIDIA_PROPRIETARY',4,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_NVIDIA_PROPRIETARY_KHR',4,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_QUALCOMM_PROPRIETARY',8,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_QUALCOMM_PROPRIETARY_KHR',8,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_SAMSUNG_PROPRIETARY',21,b'\xFF\xFF\xFF\x0BVK_DRIVER_ID_VERISILICON_PROPRIETARY',17,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_ALPHA_TO_COVERAGE_ENABLE_EXT',1000455007,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_ALPHA_TO_ONE_ENABLE_EXT',1000455008,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_ATTACHMENT_FEEDBACK_LOOP_ENABLE_EXT',1000524000,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_BLEND_CONSTANTS',4,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_COLOR_BLEND_ADVANCED_EXT',1000455018,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_COLOR_BLEND_ENABLE_EXT',1000455010,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_COLOR_BLEND_EQUATION_EXT',1000455011,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_COLOR_WRITE_ENABLE_EXT',1000381000,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_COLOR_WRITE_MASK_EXT',1000455012,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_CONSERVATIVE_RASTERIZATION_MODE_EXT',1000455014,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_COVERAGE_MODULATION_MODE_NV',1000455027,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_COVERAGE_MODULATION_TABLE_ENABLE_NV',1000455028,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_COVERAGE_MODULATION_TABLE_NV',1000455029,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_COVERAGE_REDUCTION_MODE_NV',1000455032,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_COVERAGE_TO_COLOR_ENABLE_NV',1000455025,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_COVERAGE_TO_COLOR_LOCATION_NV',1000455026,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_CULL_MODE',1000267000,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_CULL_MODE_EXT',1000267000,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_DEPTH_BIAS',3,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_DEPTH_BIAS_ENABLE',1000377002,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_DEPTH_BIAS_ENABLE_EXT',1000377002,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_DEPTH_BOUNDS',5,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_DEPTH_BOUNDS_TEST_ENABLE',1000267009,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_DEPTH_BOUNDS_TEST_ENABLE_EXT',1000267009,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_DEPTH_CLAMP_ENABLE_EXT',1000455003,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_DEPTH_CLIP_ENABLE_EXT',1000455016,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_DEPTH_CLIP_NEGATIVE_ONE_TO_ONE_EXT',1000455022,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_DEPTH_COMPARE_OP',1000267008,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_DEPTH_COMPARE_OP_EXT',1000267008,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_DEPTH_TEST_ENABLE',1000267006,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_DEPTH_TEST_ENABLE_EXT',1000267006,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_DEPTH_WRITE_ENABLE',1000267007,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_DEPTH_WRITE_ENABLE_EXT',1000267007,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_DISCARD_RECTANGLE_ENABLE_EXT',1000099001,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_DISCARD_RECTANGLE_EXT',1000099000,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_DISCARD_RECTANGLE_MODE_EXT',1000099002,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_EXCLUSIVE_SCISSOR_ENABLE_NV',1000205000,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_EXCLUSIVE_SCISSOR_NV',1000205001,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_EXTRA_PRIMITIVE_OVERESTIMATION_SIZE_EXT',1000455015,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_FRAGMENT_SHADING_RATE_KHR',1000226000,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_FRONT_FACE',1000267001,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_FRONT_FACE_EXT',1000267001,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_LINE_RASTERIZATION_MODE_EXT',1000455020,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_LINE_STIPPLE_ENABLE_EXT',1000455021,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_LINE_STIPPLE_EXT',1000259000,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_LINE_WIDTH',2,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_LOGIC_OP_ENABLE_EXT',1000455009,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_LOGIC_OP_EXT',1000377003,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_PATCH_CONTROL_POINTS_EXT',1000377000,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_POLYGON_MODE_EXT',1000455004,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_PRIMITIVE_RESTART_ENABLE',1000377004,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_PRIMITIVE_RESTART_ENABLE_EXT',1000377004,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_PRIMITIVE_TOPOLOGY',1000267002,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_PRIMITIVE_TOPOLOGY_EXT',1000267002,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_PROVOKING_VERTEX_MODE_EXT',1000455019,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_RASTERIZATION_SAMPLES_EXT',1000455005,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_RASTERIZATION_STREAM_EXT',1000455013,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_RASTERIZER_DISCARD_ENABLE',1000377001,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_RASTERIZER_DISCARD_ENABLE_EXT',1000377001,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_RAY_TRACING_PIPELINE_STACK_SIZE_KHR',1000347000,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_REPRESENTATIVE_FRAGMENT_TEST_ENABLE_NV',1000455031,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_SAMPLE_LOCATIONS_ENABLE_EXT',1000455017,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_SAMPLE_LOCATIONS_EXT',1000143000,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_SAMPLE_MASK_EXT',1000455006,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_SCISSOR',1,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_SCISSOR_WITH_COUNT',1000267004,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_SCISSOR_WITH_COUNT_EXT',1000267004,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_SHADING_RATE_IMAGE_ENABLE_NV',1000455030,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_STENCIL_COMPARE_MASK',6,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_STENCIL_OP',1000267011,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_STENCIL_OP_EXT',1000267011,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_STENCIL_REFERENCE',8,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_STENCIL_TEST_ENABLE',1000267010,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_STENCIL_TEST_ENABLE_EXT',1000267010,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_STENCIL_WRITE_MASK',7,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_TESSELLATION_DOMAIN_ORIGIN_EXT',1000455002,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_VERTEX_INPUT_BINDING_STRIDE',1000267005,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_VERTEX_INPUT_BINDING_STRIDE_EXT',1000267005,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_VERTEX_INPUT_EXT',1000352000,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_VIEWPORT',0,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_VIEWPORT_COARSE_SAMPLE_ORDER_NV',1000164006,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_VIEWPORT_SHADING_RATE_PALETTE_NV',1000164004,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_VIEWPORT_SWIZZLE_NV',1000455024,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_VIEWPORT_WITH_COUNT',1000267003,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_VIEWPORT_WITH_COUNT_EXT',1000267003,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_VIEWPORT_W_SCALING_ENABLE_NV',1000455023,b'\xFF\xFF\xFF\x0BVK_DYNAMIC_STATE_VIEWPORT_W_SCALING_NV',1000087000,b'\xFF\xFF\xFF\x0BVK_ERROR_COMPRESSION_EXHAUSTED_EXT',-1000338000,b'\xFF\xFF\xFF\x0BVK_ERROR_DEVICE_LOST',-4,b'\xFF\xFF\xFF\x0BVK_ERROR_EXTENSION_NOT_PRESENT',-7,b'\xFF\xFF\xFF\x0BVK_ERROR_FEATURE_NOT_PRESENT',-8,b'\xFF\xFF\xFF\x0BVK_ERROR_FORMAT_NOT_SUPPORTED',-11,b'\xFF\xFF\xFF\x0BVK_ERROR_FRAGMENTATION',-1000161000,b'\xFF\xFF\xFF\x0BVK_ERROR_FRAGMENTATION_EXT',-1000161000,b'\xFF\xFF\xFF\x0BVK_ERROR_FRAGMENTED_POOL',-12,b'\xFF\xFF\xFF\x0BVK_ERROR_FULL_SCREEN_EXCLUSIVE_MODE_LOST_EXT',-1000255000,b'\xFF\xFF\xFF\x0BVK_ERROR_IMAGE_USAGE_NOT_SUPPORTED_KHR',-1000023000,b'\xFF\xFF\xFF\x0BVK_ERROR_INCOMPATIBLE_DISPLAY_KHR',-1000003001,b'\xFF\xFF\xFF\x0BVK_ERROR_INCOMPATIBLE_DRIVER',-9,b'\xFF\xFF\xFF\x0BVK_ERROR_INCOMPATIBLE_SHADER_BINARY_EXT',1000482000,b'\xFF\xFF\xFF\x0BVK_ERROR_INITIALIZATION_FAILED',-3,b'\xFF\xFF\xFF\x0BVK_ERROR_INVALID_DEVICE_ADDRESS_EXT',-1000257000,b'\xFF\xFF\xFF\x0BVK_ERROR_INVALID_DRM_FORMAT_MODIFIER_PLANE_LAYOUT_EXT',-1000158000,b'\xFF\xFF\xFF\x0BVK_ERROR_INVALID_EXTERNAL_HANDLE',-1000072003,b'\xFF\xFF\xFF\x0BVK_ERROR_INVALID_EXTERNAL_HANDLE_KHR',-1000072003,b'\xFF\xFF\xFF\x0BVK_ERROR_INVALID_OPAQUE_CAPTURE_ADDRESS',-1000257000,b'\xFF\xFF\xFF\x0BVK_ERROR_INVALID_OPAQUE_CAPTURE_ADDRESS_KHR',-1000257000,b'\xFF\xFF\xFF\x0BVK_ERROR_INVALID_SHADER_NV',-1000012000,b'\xFF\xFF\xFF\x0BVK_ERROR_INVALID_VIDEO_STD_PARAMETERS_KHR',-1000299000,b'\xFF\xFF\xFF\x0BVK_ERROR_LAYER_NOT_PRESENT',-6,b'\xFF\xFF\xFF\x0BVK_ERROR_MEMORY_MAP_FAILED',-5,b'\xFF\xFF\xFF\x0BVK_ERROR_NATIVE_WINDOW_IN_USE_KHR',-1000000001,b'\xFF\xFF\xFF\x0BVK_ERROR_NOT_PERMITTED_EXT',-1000174001,b'\xFF\xFF\xFF\x0BVK_ERROR_NOT_PERMITTED_KHR',-1000174001,b'\xFF\xFF\xFF\x0BVK_ERROR_OUT_OF_DATE_KHR',-1000001004,b'\xFF\xFF\xFF\x0BVK_ERROR_OUT_OF_DEVICE_MEMORY',-2,b'\xFF\xFF\xFF\x0BVK_ERROR_OUT_OF_HOST_MEMORY',-1,b'\xFF\xFF\xFF\x0BVK_ERROR_OUT_OF_POOL_MEMORY',-1000069000,b'\xFF\xFF\xFF\x0BVK_ERROR_OUT_OF_POOL_MEMORY_KHR',-1000069000,b'\xFF\xFF\xFF\x0BVK_ERROR_PIPELINE_COMPILE_REQUIRED_EXT',1000297000,b'\xFF\xFF\xFF\x0BVK_ERROR_SURFACE_LOST_KHR',-1000000000,b'\xFF\xFF\xFF\x0BVK_ERROR_TOO_MANY_OBJECTS',-10,b'\xFF\xFF\xFF\x0BVK_ERROR_UNKNOWN',-13,b'\xFF\xFF\xFF\x0BVK_ERROR_VALIDATION_FAILED_EXT',-1000011001,b'\xFF\xFF\xFF\x0BVK_ERROR_VIDEO_PICTURE_LAYOUT_NOT_SUPPORTED_KHR',-1000023001,b'\xFF\xFF\xFF\x0BVK_ERROR_VIDEO_PROFILE_CODEC_NOT_SUPPORTED_KHR',-1000023004,b'\xFF\xFF\xFF\x0BVK_ERROR_VIDEO_PROFILE_FORMAT_NOT_SUPPORTED_KHR',-1000023003,b'\xFF\xFF\xFF\x0BVK_ERROR_VIDEO_PROFILE_OPERATION_NOT_SUPPORTED_KHR',-1000023002,b'\xFF\xFF\xFF\x0BVK_ERROR_VIDEO_STD_VERSION_NOT_SUPPORTED_KHR',-1000023005,b'\xFF\xFF\xFF\x0BVK_EVENT_CREATE_DEVICE_ONLY_BIT',1,b'\xFF\xFF\xFF\x0BVK_EVENT_CREATE_DEVICE_ONLY_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_EVENT_CREATE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_EVENT_RESET',4,b'\xFF\xFF\xFF\x0BVK_EVENT_SET',3,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_FENCE_FEATURE_EXPORTABLE_BIT',1,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_FENCE_FEATURE_EXPORTABLE_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_FENCE_FEATURE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_FENCE_FEATURE_IMPORTABLE_BIT',2,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_FENCE_FEATURE_IMPORTABLE_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_FENCE_HANDLE_TYPE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_FD_BIT',1,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_FD_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_WIN32_BIT',2,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_WIN32_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT',4,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_FENCE_HANDLE_TYPE_SYNC_FD_BIT',8,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_FENCE_HANDLE_TYPE_SYNC_FD_BIT_KHR',8,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_FEATURE_DEDICATED_ONLY_BIT',1,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_FEATURE_DEDICATED_ONLY_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_FEATURE_DEDICATED_ONLY_BIT_NV',1,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_FEATURE_EXPORTABLE_BIT',2,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_FEATURE_EXPORTABLE_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_FEATURE_EXPORTABLE_BIT_NV',2,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_FEATURE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_FEATURE_FLAG_BITS_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_FEATURE_IMPORTABLE_BIT',4,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_FEATURE_IMPORTABLE_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_FEATURE_IMPORTABLE_BIT_NV',4,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_ANDROID_HARDWARE_BUFFER_BIT_ANDROID',1024,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_IMAGE_BIT_NV',4,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_IMAGE_KMT_BIT_NV',8,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_TEXTURE_BIT',8,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_TEXTURE_BIT_KHR',8,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_TEXTURE_KMT_BIT',16,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_TEXTURE_KMT_BIT_KHR',16,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D12_HEAP_BIT',32,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D12_HEAP_BIT_KHR',32,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D12_RESOURCE_BIT',64,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D12_RESOURCE_BIT_KHR',64,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_DMA_BUF_BIT_EXT',512,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_FLAG_BITS_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_HOST_ALLOCATION_BIT_EXT',128,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_HOST_MAPPED_FOREIGN_MEMORY_BIT_EXT',256,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_FD_BIT',1,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_FD_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_BIT',2,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_BIT_NV',1,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT',4,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT_NV',2,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_RDMA_ADDRESS_BIT_NV',4096,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_SCREEN_BUFFER_BIT_QNX',16384,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_MEMORY_HANDLE_TYPE_ZIRCON_VMO_BIT_FUCHSIA',2048,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_SEMAPHORE_FEATURE_EXPORTABLE_BIT',1,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_SEMAPHORE_FEATURE_EXPORTABLE_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_SEMAPHORE_FEATURE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_SEMAPHORE_FEATURE_IMPORTABLE_BIT',2,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_SEMAPHORE_FEATURE_IMPORTABLE_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_D3D11_FENCE_BIT',8,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_D3D12_FENCE_BIT',8,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_D3D12_FENCE_BIT_KHR',8,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_FD_BIT',1,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_FD_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_WIN32_BIT',2,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_WIN32_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT',4,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_SYNC_FD_BIT',16,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_SYNC_FD_BIT_KHR',16,b'\xFF\xFF\xFF\x0BVK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_ZIRCON_EVENT_BIT_FUCHSIA',128,b'\xFF\xFF\xFF\x0BVK_FENCE_CREATE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_FENCE_CREATE_SIGNALED_BIT',1,b'\xFF\xFF\xFF\x0BVK_FENCE_IMPORT_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_FENCE_IMPORT_TEMPORARY_BIT',1,b'\xFF\xFF\xFF\x0BVK_FENCE_IMPORT_TEMPORARY_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_FILTER_CUBIC_EXT',1000015000,b'\xFF\xFF\xFF\x0BVK_FILTER_CUBIC_IMG',1000015000,b'\xFF\xFF\xFF\x0BVK_FILTER_LINEAR',1,b'\xFF\xFF\xFF\x0BVK_FILTER_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_FILTER_NEAREST',0,b'\xFF\xFF\xFF\x0BVK_FORMAT_A1B5G5R5_UNORM_PACK16_KHR',1000470000,b'\xFF\xFF\xFF\x0BVK_FORMAT_A1R5G5B5_UNORM_PACK16',8,b'\xFF\xFF\xFF\x0BVK_FORMAT_A2B10G10R10_SINT_PACK32',69,b'\xFF\xFF\xFF\x0BVK_FORMAT_A2B10G10R10_SNORM_PACK32',65,b'\xFF\xFF\xFF\x0BVK_FORMAT_A2B10G10R10_SSCALED_PACK32',67,b'\xFF\xFF\xFF\x0BVK_FORMAT_A2B10G10R10_UINT_PACK32',68,b'\xFF\xFF\xFF\x0BVK_FORMAT_A2B10G10R10_UNORM_PACK32',64,b'\xFF\xFF\xFF\x0BVK_FORMAT_A2B10G10R10_USCALED_PACK32',66,b'\xFF\xFF\xFF\x0BVK_FORMAT_A2R10G10B10_SINT_PACK32',63,b'\xFF\xFF\xFF\x0BVK_FORMAT_A2R10G10B10_SNORM_PACK32',59,b'\xFF\xFF\xFF\x0BVK_FORMAT_A2R10G10B10_SSCALED_PACK32',61,b'\xFF\xFF\xFF\x0BVK_FORMAT_A2R10G10B10_UINT_PACK32',62,b'\xFF\xFF\xFF\x0BVK_FORMAT_A2R10G10B10_UNORM_PACK32',58,b'\xFF\xFF\xFF\x0BVK_FORMAT_A2R10G10B10_USCALED_PACK32',60,b'\xFF\xFF\xFF\x0BVK_FORMAT_A4B4G4R4_UNORM_PACK16',1000340001,b'\xFF\xFF\xFF\x0BVK_FORMAT_A4B4G4R4_UNORM_PACK16_EXT',1000340001,b'\xFF\xFF\xFF\x0BVK_FORMAT_A4R4G4B4_UNORM_PACK16',1000340000,b'\xFF\xFF\xFF\x0BVK_FORMAT_A4R4G4B4_UNORM_PACK16_EXT',1000340000,b'\xFF\xFF\xFF\x0BVK_FORMAT_A8B8G8R8_SINT_PACK32',56,b'\xFF\xFF\xFF\x0BVK_FORMAT_A8B8G8R8_SNORM_PACK32',52,b'\xFF\xFF\xFF\x0BVK_FORMAT_A8B8G8R8_SRGB_PACK32',57,b'\xFF\xFF\xFF\x0BVK_FORMAT_A8B8G8R8_SSCALED_PACK32',54,b'\xFF\xFF\xFF\x0BVK_FORMAT_A8B8G8R8_UINT_PACK32',55,b'\xFF\xFF\xFF\x0BVK_FORMAT_A8B8G8R8_UNORM_PACK32',51,b'\xFF\xFF\xFF\x0BVK_FORMAT_A8B8G8R8_USCALED_PACK32',53,b'\xFF\xFF\xFF\x0BVK_FORMAT_A8_UNORM_KHR',1000470001,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_10x10_SFLOAT_BLOCK',1000066011,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_10x10_SFLOAT_BLOCK_EXT',1000066011,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_10x10_SRGB_BLOCK',180,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_10x10_UNORM_BLOCK',179,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_10x5_SFLOAT_BLOCK',1000066008,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_10x5_SFLOAT_BLOCK_EXT',1000066008,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_10x5_SRGB_BLOCK',174,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_10x5_UNORM_BLOCK',173,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_10x6_SFLOAT_BLOCK',1000066009,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_10x6_SFLOAT_BLOCK_EXT',1000066009,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_10x6_SRGB_BLOCK',176,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_10x6_UNORM_BLOCK',175,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_10x8_SFLOAT_BLOCK',1000066010,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_10x8_SFLOAT_BLOCK_EXT',1000066010,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_10x8_SRGB_BLOCK',178,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_10x8_UNORM_BLOCK',177,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_12x10_SFLOAT_BLOCK',1000066012,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_12x10_SFLOAT_BLOCK_EXT',1000066012,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_12x10_SRGB_BLOCK',182,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_12x10_UNORM_BLOCK',181,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_12x12_SFLOAT_BLOCK',1000066013,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_12x12_SFLOAT_BLOCK_EXT',1000066013,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_12x12_SRGB_BLOCK',184,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_12x12_UNORM_BLOCK',183,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_4x4_SFLOAT_BLOCK',1000066000,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_4x4_SFLOAT_BLOCK_EXT',1000066000,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_4x4_SRGB_BLOCK',158,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_4x4_UNORM_BLOCK',157,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_5x4_SFLOAT_BLOCK',1000066001,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_5x4_SFLOAT_BLOCK_EXT',1000066001,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_5x4_SRGB_BLOCK',160,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_5x4_UNORM_BLOCK',159,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_5x5_SFLOAT_BLOCK',1000066002,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_5x5_SFLOAT_BLOCK_EXT',1000066002,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_5x5_SRGB_BLOCK',162,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_5x5_UNORM_BLOCK',161,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_6x5_SFLOAT_BLOCK',1000066003,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_6x5_SFLOAT_BLOCK_EXT',1000066003,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_6x5_SRGB_BLOCK',164,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_6x5_UNORM_BLOCK',163,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_6x6_SFLOAT_BLOCK',1000066004,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_6x6_SFLOAT_BLOCK_EXT',1000066004,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_6x6_SRGB_BLOCK',166,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_6x6_UNORM_BLOCK',165,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_8x5_SFLOAT_BLOCK',1000066005,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_8x5_SFLOAT_BLOCK_EXT',1000066005,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_8x5_SRGB_BLOCK',168,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_8x5_UNORM_BLOCK',167,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_8x6_SFLOAT_BLOCK',1000066006,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_8x6_SFLOAT_BLOCK_EXT',1000066006,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_8x6_SRGB_BLOCK',170,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_8x6_UNORM_BLOCK',169,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_8x8_SFLOAT_BLOCK',1000066007,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_8x8_SFLOAT_BLOCK_EXT',1000066007,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_8x8_SRGB_BLOCK',172,b'\xFF\xFF\xFF\x0BVK_FORMAT_ASTC_8x8_UNORM_BLOCK',171,b'\xFF\xFF\xFF\x0BVK_FORMAT_B10G11R11_UFLOAT_PACK32',122,b'\xFF\xFF\xFF\x0BVK_FORMAT_B10X6G10X6R10X6G10X6_422_UNORM_4PACK16',1000156011,b'\xFF\xFF\xFF\x0BVK_FORMAT_B10X6G10X6R10X6G10X6_422_UNORM_4PACK16_KHR',1000156011,b'\xFF\xFF\xFF\x0BVK_FORMAT_B12X4G12X4R12X4G12X4_422_UNORM_4PACK16',1000156021,b'\xFF\xFF\xFF\x0BVK_FORMAT_B12X4G12X4R12X4G12X4_422_UNORM_4PACK16_KHR',1000156021,b'\xFF\xFF\xFF\x0BVK_FORMAT_B16G16R16G16_422_UNORM',1000156028,b'\xFF\xFF\xFF\x0BVK_FORMAT_B16G16R16G16_422_UNORM_KHR',1000156028,b'\xFF\xFF\xFF\x0BVK_FORMAT_B4G4R4A4_UNORM_PACK16',3,b'\xFF\xFF\xFF\x0BVK_FORMAT_B5G5R5A1_UNORM_PACK16',7,b'\xFF\xFF\xFF\x0BVK_FORMAT_B5G6R5_UNORM_PACK16',5,b'\xFF\xFF\xFF\x0BVK_FORMAT_B8G8R8A8_SINT',49,b'\xFF\xFF\xFF\x0BVK_FORMAT_B8G8R8A8_SNORM',45,b'\xFF\xFF\xFF\x0BVK_FORMAT_B8G8R8A8_SRGB',50,b'\xFF\xFF\xFF\x0BVK_FORMAT_B8G8R8A8_SSCALED',47,b'\xFF\xFF\xFF\x0BVK_FORMAT_B8G8R8A8_UINT',48,b'\xFF\xFF\xFF\x0BVK_FORMAT_B8G8R8A8_UNORM',44,b'\xFF\xFF\xFF\x0BVK_FORMAT_B8G8R8A8_USCALED',46,b'\xFF\xFF\xFF\x0BVK_FORMAT_B8G8R8G8_422_UNORM',1000156001,b'\xFF\xFF\xFF\x0BVK_FORMAT_B8G8R8G8_422_UNORM_KHR',1000156001,b'\xFF\xFF\xFF\x0BVK_FORMAT_B8G8R8_SINT',35,b'\xFF\xFF\xFF\x0BVK_FORMAT_B8G8R8_SNORM',31,b'\xFF\xFF\xFF\x0BVK_FORMAT_B8G8R8_SRGB',36,b'\xFF\xFF\xFF\x0BVK_FORMAT_B8G8R8_SSCALED',33,b'\xFF\xFF\xFF\x0BVK_FORMAT_B8G8R8_UINT',34,b'\xFF\xFF\xFF\x0BVK_FORMAT_B8G8R8_UNORM',30,b'\xFF\xFF\xFF\x0BVK_FORMAT_B8G8R8_USCALED',32,b'\xFF\xFF\xFF\x0BVK_FORMAT_BC1_RGBA_SRGB_BLOCK',134,b'\xFF\xFF\xFF\x0BVK_FORMAT_BC1_RGBA_UNORM_BLOCK',133,b'\xFF\xFF\xFF\x0BVK_FORMAT_BC1_RGB_SRGB_BLOCK',132,b'\xFF\xFF\xFF\x0BVK_FORMAT_BC1_RGB_UNORM_BLOCK',131,b'\xFF\xFF\xFF\x0BVK_FORMAT_BC2_SRGB_BLOCK',136,b'\xFF\xFF\xFF\x0BVK_FORMAT_BC2_UNORM_BLOCK',135,b'\xFF\xFF\xFF\x0BVK_FORMAT_BC3_SRGB_BLOCK',138,b'\xFF\xFF\xFF\x0BVK_FORMAT_BC3_UNORM_BLOCK',137,b'\xFF\xFF\xFF\x0BVK_FORMAT_BC4_SNORM_BLOCK',140,b'\xFF\xFF\xFF\x0BVK_FORMAT_BC4_UNORM_BLOCK',139,b'\xFF\xFF\xFF\x0BVK_FORMAT_BC5_SNORM_BLOCK',142,b'\xFF\xFF\xFF\x0BVK_FORMAT_BC5_UNORM_BLOCK',141,b'\xFF\xFF\xFF\x0BVK_FORMAT_BC6H_SFLOAT_BLOCK',144,b'\xFF\xFF\xFF\x0BVK_FORMAT_BC6H_UFLOAT_BLOCK',143,b'\xFF\xFF\xFF\x0BVK_FORMAT_BC7_SRGB_BLOCK',146,b'\xFF\xFF\xFF\x0BVK_FORMAT_BC7_UNORM_BLOCK',145,b'\xFF\xFF\xFF\x0BVK_FORMAT_D16_UNORM',124,b'\xFF\xFF\xFF\x0BVK_FORMAT_D16_UNORM_S8_UINT',128,b'\xFF\xFF\xFF\x0BVK_FORMAT_D24_UNORM_S8_UINT',129,b'\xFF\xFF\xFF\x0BVK_FORMAT_D32_SFLOAT',126,b'\xFF\xFF\xFF\x0BVK_FORMAT_D32_SFLOAT_S8_UINT',130,b'\xFF\xFF\xFF\x0BVK_FORMAT_E5B9G9R9_UFLOAT_PACK32',123,b'\xFF\xFF\xFF\x0BVK_FORMAT_EAC_R11G11_SNORM_BLOCK',156,b'\xFF\xFF\xFF\x0BVK_FORMAT_EAC_R11G11_UNORM_BLOCK',155,b'\xFF\xFF\xFF\x0BVK_FORMAT_EAC_R11_SNORM_BLOCK',154,b'\xFF\xFF\xFF\x0BVK_FORMAT_EAC_R11_UNORM_BLOCK',153,b'\xFF\xFF\xFF\x0BVK_FORMAT_ETC2_R8G8B8A1_SRGB_BLOCK',150,b'\xFF\xFF\xFF\x0BVK_FORMAT_ETC2_R8G8B8A1_UNORM_BLOCK',149,b'\xFF\xFF\xFF\x0BVK_FORMAT_ETC2_R8G8B8A8_SRGB_BLOCK',152,b'\xFF\xFF\xFF\x0BVK_FORMAT_ETC2_R8G8B8A8_UNORM_BLOCK',151,b'\xFF\xFF\xFF\x0BVK_FORMAT_ETC2_R8G8B8_SRGB_BLOCK',148,b'\xFF\xFF\xFF\x0BVK_FORMAT_ETC2_R8G8B8_UNORM_BLOCK',147,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_ACCELERATION_STRUCTURE_VERTEX_BUFFER_BIT_KHR',536870912,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_BLIT_DST_BIT',2048,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_BLIT_DST_BIT_KHR',2048,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_BLIT_SRC_BIT',1024,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_BLIT_SRC_BIT_KHR',1024,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_BLOCK_MATCHING_BIT_QCOM',68719476736,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_BOX_FILTER_SAMPLED_BIT_QCOM',137438953472,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_COLOR_ATTACHMENT_BIT',128,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_COLOR_ATTACHMENT_BIT_KHR',128,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_COLOR_ATTACHMENT_BLEND_BIT',256,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_COLOR_ATTACHMENT_BLEND_BIT_KHR',256,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_COSITED_CHROMA_SAMPLES_BIT',8388608,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_COSITED_CHROMA_SAMPLES_BIT_KHR',8388608,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_DEPTH_STENCIL_ATTACHMENT_BIT',512,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_DEPTH_STENCIL_ATTACHMENT_BIT_KHR',512,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_DISJOINT_BIT',4194304,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_DISJOINT_BIT_KHR',4194304,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_FRAGMENT_DENSITY_MAP_BIT_EXT',16777216,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR',1073741824,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_HOST_IMAGE_TRANSFER_BIT_EXT',70368744177664,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_LINEAR_COLOR_ATTACHMENT_BIT_NV',274877906944,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_MIDPOINT_CHROMA_SAMPLES_BIT',131072,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_MIDPOINT_CHROMA_SAMPLES_BIT_KHR',131072,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_OPTICAL_FLOW_COST_BIT_NV',4398046511104,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_OPTICAL_FLOW_IMAGE_BIT_NV',1099511627776,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_OPTICAL_FLOW_VECTOR_BIT_NV',2199023255552,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_SAMPLED_IMAGE_BIT',1,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_SAMPLED_IMAGE_BIT_KHR',1,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_SAMPLED_IMAGE_DEPTH_COMPARISON_BIT',8589934592,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_SAMPLED_IMAGE_DEPTH_COMPARISON_BIT_KHR',8589934592,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_SAMPLED_IMAGE_FILTER_CUBIC_BIT',8192,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_SAMPLED_IMAGE_FILTER_CUBIC_BIT_EXT',8192,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_SAMPLED_IMAGE_FILTER_LINEAR_BIT',4096,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_SAMPLED_IMAGE_FILTER_LINEAR_BIT_KHR',4096,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_SAMPLED_IMAGE_FILTER_MINMAX_BIT',65536,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_SAMPLED_IMAGE_FILTER_MINMAX_BIT_KHR',65536,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT_BIT',1048576,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT_BIT_KHR',1048576,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT_FORCEABLE_BIT',2097152,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT_FORCEABLE_BIT_KHR',2097152,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_SAMPLED_IMAGE_YCBCR_CONVERSION_LINEAR_FILTER_BIT',262144,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_SAMPLED_IMAGE_YCBCR_CONVERSION_LINEAR_FILTER_BIT_KHR',262144,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_SAMPLED_IMAGE_YCBCR_CONVERSION_SEPARATE_RECONSTRUCTION_FILTER_BIT',524288,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_SAMPLED_IMAGE_YCBCR_CONVERSION_SEPARATE_RECONSTRUCTION_FILTER_BIT_KHR',524288,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_STORAGE_IMAGE_ATOMIC_BIT',4,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_STORAGE_IMAGE_ATOMIC_BIT_KHR',4,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_STORAGE_IMAGE_BIT',2,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_STORAGE_IMAGE_BIT_KHR',2,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_STORAGE_READ_WITHOUT_FORMAT_BIT',2147483648,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_STORAGE_READ_WITHOUT_FORMAT_BIT_KHR',2147483648,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_STORAGE_TEXEL_BUFFER_ATOMIC_BIT',32,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_STORAGE_TEXEL_BUFFER_ATOMIC_BIT_KHR',32,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_STORAGE_TEXEL_BUFFER_BIT',16,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_STORAGE_TEXEL_BUFFER_BIT_KHR',16,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_STORAGE_WRITE_WITHOUT_FORMAT_BIT',4294967296,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_STORAGE_WRITE_WITHOUT_FORMAT_BIT_KHR',4294967296,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_TRANSFER_DST_BIT',32768,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_TRANSFER_DST_BIT_KHR',32768,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_TRANSFER_SRC_BIT',16384,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_TRANSFER_SRC_BIT_KHR',16384,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_UNIFORM_TEXEL_BUFFER_BIT',8,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_UNIFORM_TEXEL_BUFFER_BIT_KHR',8,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_VERTEX_BUFFER_BIT',64,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_VERTEX_BUFFER_BIT_KHR',64,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_VIDEO_DECODE_DPB_BIT_KHR',67108864,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_VIDEO_DECODE_OUTPUT_BIT_KHR',33554432,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_VIDEO_ENCODE_DPB_BIT_KHR',268435456,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_VIDEO_ENCODE_INPUT_BIT_KHR',134217728,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_WEIGHT_IMAGE_BIT_QCOM',17179869184,b'\xFF\xFF\xFF\x1FVK_FORMAT_FEATURE_2_WEIGHT_SAMPLED_IMAGE_BIT_QCOM',34359738368,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_ACCELERATION_STRUCTURE_VERTEX_BUFFER_BIT_KHR',536870912,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_BLIT_DST_BIT',2048,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_BLIT_SRC_BIT',1024,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_COLOR_ATTACHMENT_BIT',128,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_COLOR_ATTACHMENT_BLEND_BIT',256,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_COSITED_CHROMA_SAMPLES_BIT',8388608,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_COSITED_CHROMA_SAMPLES_BIT_KHR',8388608,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_DEPTH_STENCIL_ATTACHMENT_BIT',512,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_DISJOINT_BIT',4194304,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_DISJOINT_BIT_KHR',4194304,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_FRAGMENT_DENSITY_MAP_BIT_EXT',16777216,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR',1073741824,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_MIDPOINT_CHROMA_SAMPLES_BIT',131072,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_MIDPOINT_CHROMA_SAMPLES_BIT_KHR',131072,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_SAMPLED_IMAGE_BIT',1,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_CUBIC_BIT_EXT',8192,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_CUBIC_BIT_IMG',8192,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_LINEAR_BIT',4096,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_MINMAX_BIT',65536,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_MINMAX_BIT_EXT',65536,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT_BIT',1048576,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT_BIT_KHR',1048576,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT_FORCEABLE_BIT',2097152,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT_FORCEABLE_BIT_KHR',2097152,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_LINEAR_FILTER_BIT',262144,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_LINEAR_FILTER_BIT_KHR',262144,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_SEPARATE_RECONSTRUCTION_FILTER_BIT',524288,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_SEPARATE_RECONSTRUCTION_FILTER_BIT_KHR',524288,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_STORAGE_IMAGE_ATOMIC_BIT',4,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_STORAGE_IMAGE_BIT',2,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_STORAGE_TEXEL_BUFFER_ATOMIC_BIT',32,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_STORAGE_TEXEL_BUFFER_BIT',16,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_TRANSFER_DST_BIT',32768,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_TRANSFER_DST_BIT_KHR',32768,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_TRANSFER_SRC_BIT',16384,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_TRANSFER_SRC_BIT_KHR',16384,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_UNIFORM_TEXEL_BUFFER_BIT',8,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_VERTEX_BUFFER_BIT',64,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_VIDEO_DECODE_DPB_BIT_KHR',67108864,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_VIDEO_DECODE_OUTPUT_BIT_KHR',33554432,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_VIDEO_ENCODE_DPB_BIT_KHR',268435456,b'\xFF\xFF\xFF\x0BVK_FORMAT_FEATURE_VIDEO_ENCODE_INPUT_BIT_KHR',134217728,b'\xFF\xFF\xFF\x0BVK_FORMAT_G10X6B10X6G10X6R10X6_422_UNORM_4PACK16',1000156010,b'\xFF\xFF\xFF\x0BVK_FORMAT_G10X6B10X6G10X6R10X6_422_UNORM_4PACK16_KHR',1000156010,b'\xFF\xFF\xFF\x0BVK_FORMAT_G10X6_B10X6R10X6_2PLANE_420_UNORM_3PACK16',1000156013,b'\xFF\xFF\xFF\x0BVK_FORMAT_G10X6_B10X6R10X6_2PLANE_420_UNORM_3PACK16_KHR',1000156013,b'\xFF\xFF\xFF\x0BVK_FORMAT_G10X6_B10X6R10X6_2PLANE_422_UNORM_3PACK16',1000156015,b'\xFF\xFF\xFF\x0BVK_FORMAT_G10X6_B10X6R10X6_2PLANE_422_UNORM_3PACK16_KHR',1000156015,b'\xFF\xFF\xFF\x0BVK_FORMAT_G10X6_B10X6R10X6_2PLANE_444_UNORM_3PACK16',1000330001,b'\xFF\xFF\xFF\x0BVK_FORMAT_G10X6_B10X6R10X6_2PLANE_444_UNORM_3PACK16_EXT',1000330001,b'\xFF\xFF\xFF\x0BVK_FORMAT_G10X6_B10X6_R10X6_3PLANE_420_UNORM_3PACK16',1000156012,b'\xFF\xFF\xFF\x0BVK_FORMAT_G10X6_B10X6_R10X6_3PLANE_420_UNORM_3PACK16_KHR',1000156012,b'\xFF\xFF\xFF\x0BVK_FORMAT_G10X6_B10X6_R10X6_3PLANE_422_UNORM_3PACK16',1000156014,b'\xFF\xFF\xFF\x0BVK_FORMAT_G10X6_B10X6_R10X6_3PLANE_422_UNORM_3PACK16_KHR',1000156014,b'\xFF\xFF\xFF\x0BVK_FORMAT_G10X6_B10X6_R10X6_3PLANE_444_UNORM_3PACK16',1000156016,b'\xFF\xFF\xFF\x0BVK_FORMAT_G10X6_B10X6_R10X6_3PLANE_444_UNORM_3PACK16_KHR',1000156016,b'\xFF\xFF\xFF\x0BVK_FORMAT_G12X4B12X4G12X4R12X4_422_UNORM_4PACK16',1000156020,b'\xFF\xFF\xFF\x0BVK_FORMAT_G12X4B12X4G12X4R12X4_422_UNORM_4PACK16_KHR',1000156020,b'\xFF\xFF\xFF\x0BVK_FORMAT_G12X4_B12X4R12X4_2PLANE_420_UNORM_3PACK16',1000156023,b'\xFF\xFF\xFF\x0BVK_FORMAT_G12X4_B12X4R12X4_2PLANE_420_UNORM_3PACK16_KHR',1000156023,b'\xFF\xFF\xFF\x0BVK_FORMAT_G12X4_B12X4R12X4_2PLANE_422_UNORM_3PACK16',1000156025,b'\xFF\xFF\xFF\x0BVK_FORMAT_G12X4_B12X4R12X4_2PLANE_422_UNORM_3PACK16_KHR',1000156025,b'\xFF\xFF\xFF\x0BVK_FORMAT_G12X4_B12X4R12X4_2PLANE_444_UNORM_3PACK16',1000330002,b'\xFF\xFF\xFF\x0BVK_FORMAT_G12X4_B12X4R12X4_2PLANE_444_UNORM_3PACK16_EXT',1000330002,b'\xFF\xFF\xFF\x0BVK_FORMAT_G12X4_B12X4_R12X4_3PLANE_420_UNORM_3PACK16',1000156022,b'\xFF\xFF\xFF\x0BVK_FORMAT_G12X4_B12X4_R12X4_3PLANE_420_UNORM_3PACK16_KHR',1000156022,b'\xFF\xFF\xFF\x0BVK_FORMAT_G12X4_B12X4_R12X4_3PLANE_422_UNORM_3PACK16',1000156024,b'\xFF\xFF\xFF\x0BVK_FORMAT_G12X4_B12X4_R12X4_3PLANE_422_UNORM_3PACK16_KHR',1000156024,b'\xFF\xFF\xFF\x0BVK_FORMAT_G12X4_B12X4_R12X4_3PLANE_444_UNORM_3PACK16',1000156026,b'\xFF\xFF\xFF\x0BVK_FORMAT_G12X4_B12X4_R12X4_3PLANE_444_UNORM_3PACK16_KHR',1000156026,b'\xFF\xFF\xFF\x0BVK_FORMAT_G16B16G16R16_422_UNORM',1000156027,b'\xFF\xFF\xFF\x0BVK_FORMAT_G16B16G16R16_422_UNORM_KHR',1000156027,b'\xFF\xFF\xFF\x0BVK_FORMAT_G16_B16R16_2PLANE_420_UNORM',1000156030,b'\xFF\xFF\xFF\x0BVK_FORMAT_G16_B16R16_2PLANE_420_UNORM_KHR',1000156030,b'\xFF\xFF\xFF\x0BVK_FORMAT_G16_B16R16_2PLANE_422_UNORM',1000156032,b'\xFF\xFF\xFF\x0BVK_FORMAT_G16_B16R16_2PLANE_422_UNORM_KHR',1000156032,b'\xFF\xFF\xFF\x0BVK_FORMAT_G16_B16R16_2PLANE_444_UNORM',1000330003,b'\xFF\xFF\xFF\x0BVK_FORMAT_G16_B16R16_2PLANE_444_UNORM_EXT',1000330003,b'\xFF\xFF\xFF\x0BVK_FORMAT_G16_B16_R16_3PLANE_420_UNORM',1000156029,b'\xFF\xFF\xFF\x0BVK_FORMAT_G16_B16_R16_3PLANE_420_UNORM_KHR',1000156029,b'\xFF\xFF\xFF\x0BVK_FORMAT_G16_B16_R16_3PLANE_422_UNORM',1000156031,b'\xFF\xFF\xFF\x0BVK_FORMAT_G16_B16_R16_3PLANE_422_UNORM_KHR',1000156031,b'\xFF\xFF\xFF\x0BVK_FORMAT_G16_B16_R16_3PLANE_444_UNORM',1000156033,b'\xFF\xFF\xFF\x0BVK_FORMAT_G16_B16_R16_3PLANE_444_UNORM_KHR',1000156033,b'\xFF\xFF\xFF\x0BVK_FORMAT_G8B8G8R8_422_UNORM',1000156000,b'\xFF\xFF\xFF\x0BVK_FORMAT_G8B8G8R8_422_UNORM_KHR',1000156000,b'\xFF\xFF\xFF\x0BVK_FORMAT_G8_B8R8_2PLANE_420_UNORM',1000156003,b'\xFF\xFF\xFF\x0BVK_FORMAT_G8_B8R8_2PLANE_420_UNORM_KHR',1000156003,b'\xFF\xFF\xFF\x0BVK_FORMAT_G8_B8R8_2PLANE_422_UNORM',1000156005,b'\xFF\xFF\xFF\x0BVK_FORMAT_G8_B8R8_2PLANE_422_UNORM_KHR',1000156005,b'\xFF\xFF\xFF\x0BVK_FORMAT_G8_B8R8_2PLANE_444_UNORM',1000330000,b'\xFF\xFF\xFF\x0BVK_FORMAT_G8_B8R8_2PLANE_444_UNORM_EXT',1000330000,b'\xFF\xFF\xFF\x0BVK_FORMAT_G8_B8_R8_3PLANE_420_UNORM',1000156002,b'\xFF\xFF\xFF\x0BVK_FORMAT_G8_B8_R8_3PLANE_420_UNORM_KHR',1000156002,b'\xFF\xFF\xFF\x0BVK_FORMAT_G8_B8_R8_3PLANE_422_UNORM',1000156004,b'\xFF\xFF\xFF\x0BVK_FORMAT_G8_B8_R8_3PLANE_422_UNORM_KHR',1000156004,b'\xFF\xFF\xFF\x0BVK_FORMAT_G8_B8_R8_3PLANE_444_UNORM',1000156006,b'\xFF\xFF\xFF\x0BVK_FORMAT_G8_B8_R8_3PLANE_444_UNORM_KHR',1000156006,b'\xFF\xFF\xFF\x0BVK_FORMAT_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_FORMAT_PVRTC1_2BPP_SRGB_BLOCK_IMG',1000054004,b'\xFF\xFF\xFF\x0BVK_FORMAT_PVRTC1_2BPP_UNORM_BLOCK_IMG',1000054000,b'\xFF\xFF\xFF\x0BVK_FORMAT_PVRTC1_4BPP_SRGB_BLOCK_IMG',1000054005,b'\xFF\xFF\xFF\x0BVK_FORMAT_PVRTC1_4BPP_UNORM_BLOCK_IMG',1000054001,b'\xFF\xFF\xFF\x0BVK_FORMAT_PVRTC2_2BPP_SRGB_BLOCK_IMG',1000054006,b'\xFF\xFF\xFF\x0BVK_FORMAT_PVRTC2_2BPP_UNORM_BLOCK_IMG',1000054002,b'\xFF\xFF\xFF\x0BVK_FORMAT_PVRTC2_4BPP_SRGB_BLOCK_IMG',1000054007,b'\xFF\xFF\xFF\x0BVK_FORMAT_PVRTC2_4BPP_UNORM_BLOCK_IMG',1000054003,b'\xFF\xFF\xFF\x0BVK_FORMAT_R10X6G10X6B10X6A10X6_UNORM_4PACK16',1000156009,b'\xFF\xFF\xFF\x0BVK_FORMAT_R10X6G10X6B10X6A10X6_UNORM_4PACK16_KHR',1000156009,b'\xFF\xFF\xFF\x0BVK_FORMAT_R10X6G10X6_UNORM_2PACK16',1000156008,b'\xFF\xFF\xFF\x0BVK_FORMAT_R10X6G10X6_UNORM_2PACK16_KHR',1000156008,b'\xFF\xFF\xFF\x0BVK_FORMAT_R10X6_UNORM_PACK16',1000156007,b'\xFF\xFF\xFF\x0BVK_FORMAT_R10X6_UNORM_PACK16_KHR',1000156007,b'\xFF\xFF\xFF\x0BVK_FORMAT_R12X4G12X4B12X4A12X4_UNORM_4PACK16',1000156019,b'\xFF\xFF\xFF\x0BVK_FORMAT_R12X4G12X4B12X4A12X4_UNORM_4PACK16_KHR',1000156019,b'\xFF\xFF\xFF\x0BVK_FORMAT_R12X4G12X4_UNORM_2PACK16',1000156018,b'\xFF\xFF\xFF\x0BVK_FORMAT_R12X4G12X4_UNORM_2PACK16_KHR',1000156018,b'\xFF\xFF\xFF\x0BVK_FORMAT_R12X4_UNORM_PACK16',1000156017,b'\xFF\xFF\xFF\x0BVK_FORMAT_R12X4_UNORM_PACK16_KHR',1000156017,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16G16B16A16_SFLOAT',97,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16G16B16A16_SINT',96,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16G16B16A16_SNORM',92,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16G16B16A16_SSCALED',94,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16G16B16A16_UINT',95,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16G16B16A16_UNORM',91,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16G16B16A16_USCALED',93,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16G16B16_SFLOAT',90,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16G16B16_SINT',89,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16G16B16_SNORM',85,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16G16B16_SSCALED',87,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16G16B16_UINT',88,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16G16B16_UNORM',84,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16G16B16_USCALED',86,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16G16_S10_5_NV',1000464000,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16G16_SFLOAT',83,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16G16_SINT',82,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16G16_SNORM',78,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16G16_SSCALED',80,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16G16_UINT',81,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16G16_UNORM',77,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16G16_USCALED',79,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16_SFLOAT',76,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16_SINT',75,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16_SNORM',71,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16_SSCALED',73,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16_UINT',74,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16_UNORM',70,b'\xFF\xFF\xFF\x0BVK_FORMAT_R16_USCALED',72,b'\xFF\xFF\xFF\x0BVK_FORMAT_R32G32B32A32_SFLOAT',109,b'\xFF\xFF\xFF\x0BVK_FORMAT_R32G32B32A32_SINT',108,b'\xFF\xFF\xFF\x0BVK_FORMAT_R32G32B32A32_UINT',107,b'\xFF\xFF\xFF\x0BVK_FORMAT_R32G32B32_SFLOAT',106,b'\xFF\xFF\xFF\x0BVK_FORMAT_R32G32B32_SINT',105,b'\xFF\xFF\xFF\x0BVK_FORMAT_R32G32B32_UINT',104,b'\xFF\xFF\xFF\x0BVK_FORMAT_R32G32_SFLOAT',103,b'\xFF\xFF\xFF\x0BVK_FORMAT_R32G32_SINT',102,b'\xFF\xFF\xFF\x0BVK_FORMAT_R32G32_UINT',101,b'\xFF\xFF\xFF\x0BVK_FORMAT_R32_SFLOAT',100,b'\xFF\xFF\xFF\x0BVK_FORMAT_R32_SINT',99,b'\xFF\xFF\xFF\x0BVK_FORMAT_R32_UINT',98,b'\xFF\xFF\xFF\x0BVK_FORMAT_R4G4B4A4_UNORM_PACK16',2,b'\xFF\xFF\xFF\x0BVK_FORMAT_R4G4_UNORM_PACK8',1,b'\xFF\xFF\xFF\x0BVK_FORMAT_R5G5B5A1_UNORM_PACK16',6,b'\xFF\xFF\xFF\x0BVK_FORMAT_R5G6B5_UNORM_PACK16',4,b'\xFF\xFF\xFF\x0BVK_FORMAT_R64G64B64A64_SFLOAT',121,b'\xFF\xFF\xFF\x0BVK_FORMAT_R64G64B64A64_SINT',120,b'\xFF\xFF\xFF\x0BVK_FORMAT_R64G64B64A64_UINT',119,b'\xFF\xFF\xFF\x0BVK_FORMAT_R64G64B64_SFLOAT',118,b'\xFF\xFF\xFF\x0BVK_FORMAT_R64G64B64_SINT',117,b'\xFF\xFF\xFF\x0BVK_FORMAT_R64G64B64_UINT',116,b'\xFF\xFF\xFF\x0BVK_FORMAT_R64G64_SFLOAT',115,b'\xFF\xFF\xFF\x0BVK_FORMAT_R64G64_SINT',114,b'\xFF\xFF\xFF\x0BVK_FORMAT_R64G64_UINT',113,b'\xFF\xFF\xFF\x0BVK_FORMAT_R64_SFLOAT',112,b'\xFF\xFF\xFF\x0BVK_FORMAT_R64_SINT',111,b'\xFF\xFF\xFF\x0BVK_FORMAT_R64_UINT',110,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8G8B8A8_SINT',42,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8G8B8A8_SNORM',38,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8G8B8A8_SRGB',43,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8G8B8A8_SSCALED',40,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8G8B8A8_UINT',41,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8G8B8A8_UNORM',37,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8G8B8A8_USCALED',39,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8G8B8_SINT',28,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8G8B8_SNORM',24,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8G8B8_SRGB',29,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8G8B8_SSCALED',26,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8G8B8_UINT',27,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8G8B8_UNORM',23,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8G8B8_USCALED',25,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8G8_SINT',21,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8G8_SNORM',17,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8G8_SRGB',22,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8G8_SSCALED',19,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8G8_UINT',20,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8G8_UNORM',16,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8G8_USCALED',18,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8_SINT',14,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8_SNORM',10,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8_SRGB',15,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8_SSCALED',12,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8_UINT',13,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8_UNORM',9,b'\xFF\xFF\xFF\x0BVK_FORMAT_R8_USCALED',11,b'\xFF\xFF\xFF\x0BVK_FORMAT_S8_UINT',127,b'\xFF\xFF\xFF\x0BVK_FORMAT_UNDEFINED',0,b'\xFF\xFF\xFF\x0BVK_FORMAT_X8_D24_UNORM_PACK32',125,b'\xFF\xFF\xFF\x0BVK_FRAGMENT_SHADING_RATE_16_INVOCATIONS_PER_PIXEL_NV',14,b'\xFF\xFF\xFF\x0BVK_FRAGMENT_SHADING_RATE_1_INVOCATION_PER_1X2_PIXELS_NV',1,b'\xFF\xFF\xFF\x0BVK_FRAGMENT_SHADING_RATE_1_INVOCATION_PER_2X1_PIXELS_NV',4,b'\xFF\xFF\xFF\x0BVK_FRAGMENT_SHADING_RATE_1_INVOCATION_PER_2X2_PIXELS_NV',5,b'\xFF\xFF\xFF\x0BVK_FRAGMENT_SHADING_RATE_1_INVOCATION_PER_2X4_PIXELS_NV',6,b'\xFF\xFF\xFF\x0BVK_FRAGMENT_SHADING_RATE_1_INVOCATION_PER_4X2_PIXELS_NV',9,b'\xFF\xFF\xFF\x0BVK_FRAGMENT_SHADING_RATE_1_INVOCATION_PER_4X4_PIXELS_NV',10,b'\xFF\xFF\xFF\x0BVK_FRAGMENT_SHADING_RATE_1_INVOCATION_PER_PIXEL_NV',0,b'\xFF\xFF\xFF\x0BVK_FRAGMENT_SHADING_RATE_2_INVOCATIONS_PER_PIXEL_NV',11,b'\xFF\xFF\xFF\x0BVK_FRAGMENT_SHADING_RATE_4_INVOCATIONS_PER_PIXEL_NV',12,b'\xFF\xFF\xFF\x0BVK_FRAGMENT_SHADING_RATE_8_INVOCATIONS_PER_PIXEL_NV',13,b'\xFF\xFF\xFF\x0BVK_FRAGMENT_SHADING_RATE_COMBINER_OP_KEEP_KHR',0,b'\xFF\xFF\xFF\x0BVK_FRAGMENT_SHADING_RATE_COMBINER_OP_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_FRAGMENT_SHADING_RATE_COMBINER_OP_MAX_KHR',3,b'\xFF\xFF\xFF\x0BVK_FRAGMENT_SHADING_RATE_COMBINER_OP_MIN_KHR',2,b'\xFF\xFF\xFF\x0BVK_FRAGMENT_SHADING_RATE_COMBINER_OP_MUL_KHR',4,b'\xFF\xFF\xFF\x0BVK_FRAGMENT_SHADING_RATE_COMBINER_OP_REPLACE_KHR',1,b'\xFF\xFF\xFF\x0BVK_FRAGMENT_SHADING_RATE_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_FRAGMENT_SHADING_RATE_NO_INVOCATIONS_NV',15,b'\xFF\xFF\xFF\x0BVK_FRAGMENT_SHADING_RATE_TYPE_ENUMS_NV',1,b'\xFF\xFF\xFF\x0BVK_FRAGMENT_SHADING_RATE_TYPE_FRAGMENT_SIZE_NV',0,b'\xFF\xFF\xFF\x0BVK_FRAGMENT_SHADING_RATE_TYPE_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_FRAMEBUFFER_CREATE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_FRAMEBUFFER_CREATE_IMAGELESS_BIT',1,b'\xFF\xFF\xFF\x0BVK_FRAMEBUFFER_CREATE_IMAGELESS_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_FRAME_BOUNDARY_FLAG_BITS_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_FRAME_BOUNDARY_FRAME_END_BIT_EXT',1,b'\xFF\xFF\xFF\x0BVK_FRONT_FACE_CLOCKWISE',1,b'\xFF\xFF\xFF\x0BVK_FRONT_FACE_COUNTER_CLOCKWISE',0,b'\xFF\xFF\xFF\x0BVK_FRONT_FACE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_FULL_SCREEN_EXCLUSIVE_ALLOWED_EXT',1,b'\xFF\xFF\xFF\x0BVK_FULL_SCREEN_EXCLUSIVE_APPLICATION_CONTROLLED_EXT',3,b'\xFF\xFF\xFF\x0BVK_FULL_SCREEN_EXCLUSIVE_DEFAULT_EXT',0,b'\xFF\xFF\xFF\x0BVK_FULL_SCREEN_EXCLUSIVE_DISALLOWED_EXT',2,b'\xFF\xFF\xFF\x0BVK_FULL_SCREEN_EXCLUSIVE_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_GEOMETRY_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_GEOMETRY_INSTANCE_DISABLE_OPACITY_MICROMAPS_EXT',32,b'\xFF\xFF\xFF\x0BVK_GEOMETRY_INSTANCE_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_GEOMETRY_INSTANCE_FORCE_NO_OPAQUE_BIT_KHR',8,b'\xFF\xFF\xFF\x0BVK_GEOMETRY_INSTANCE_FORCE_NO_OPAQUE_BIT_NV',8,b'\xFF\xFF\xFF\x0BVK_GEOMETRY_INSTANCE_FORCE_OPACITY_MICROMAP_2_STATE_EXT',16,b'\xFF\xFF\xFF\x0BVK_GEOMETRY_INSTANCE_FORCE_OPAQUE_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_GEOMETRY_INSTANCE_FORCE_OPAQUE_BIT_NV',4,b'\xFF\xFF\xFF\x0BVK_GEOMETRY_INSTANCE_TRIANGLE_CULL_DISABLE_BIT_NV',1,b'\xFF\xFF\xFF\x0BVK_GEOMETRY_INSTANCE_TRIANGLE_FACING_CULL_DISABLE_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_GEOMETRY_INSTANCE_TRIANGLE_FLIP_FACING_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_GEOMETRY_INSTANCE_TRIANGLE_FRONT_COUNTERCLOCKWISE_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_GEOMETRY_INSTANCE_TRIANGLE_FRONT_COUNTERCLOCKWISE_BIT_NV',2,b'\xFF\xFF\xFF\x0BVK_GEOMETRY_NO_DUPLICATE_ANY_HIT_INVOCATION_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_GEOMETRY_NO_DUPLICATE_ANY_HIT_INVOCATION_BIT_NV',2,b'\xFF\xFF\xFF\x0BVK_GEOMETRY_OPAQUE_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_GEOMETRY_OPAQUE_BIT_NV',1,b'\xFF\xFF\xFF\x0BVK_GEOMETRY_TYPE_AABBS_KHR',1,b'\xFF\xFF\xFF\x0BVK_GEOMETRY_TYPE_AABBS_NV',1,b'\xFF\xFF\xFF\x0BVK_GEOMETRY_TYPE_INSTANCES_KHR',2,b'\xFF\xFF\xFF\x0BVK_GEOMETRY_TYPE_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_GEOMETRY_TYPE_TRIANGLES_KHR',0,b'\xFF\xFF\xFF\x0BVK_GEOMETRY_TYPE_TRIANGLES_NV',0,b'\xFF\xFF\xFF\x0BVK_GRAPHICS_PIPELINE_LIBRARY_FLAG_BITS_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_GRAPHICS_PIPELINE_LIBRARY_FRAGMENT_OUTPUT_INTERFACE_BIT_EXT',8,b'\xFF\xFF\xFF\x0BVK_GRAPHICS_PIPELINE_LIBRARY_FRAGMENT_SHADER_BIT_EXT',4,b'\xFF\xFF\xFF\x0BVK_GRAPHICS_PIPELINE_LIBRARY_PRE_RASTERIZATION_SHADERS_BIT_EXT',2,b'\xFF\xFF\xFF\x0BVK_GRAPHICS_PIPELINE_LIBRARY_VERTEX_INPUT_INTERFACE_BIT_EXT',1,b'\xFF\xFF\xFF\x0BVK_HOST_IMAGE_COPY_FLAG_BITS_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_HOST_IMAGE_COPY_MEMCPY_EXT',1,b'\xFF\xFF\xFF\x0BVK_IMAGE_ASPECT_COLOR_BIT',1,b'\xFF\xFF\xFF\x0BVK_IMAGE_ASPECT_DEPTH_BIT',2,b'\xFF\xFF\xFF\x0BVK_IMAGE_ASPECT_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_IMAGE_ASPECT_MEMORY_PLANE_0_BIT_EXT',128,b'\xFF\xFF\xFF\x0BVK_IMAGE_ASPECT_MEMORY_PLANE_1_BIT_EXT',256,b'\xFF\xFF\xFF\x0BVK_IMAGE_ASPECT_MEMORY_PLANE_2_BIT_EXT',512,b'\xFF\xFF\xFF\x0BVK_IMAGE_ASPECT_MEMORY_PLANE_3_BIT_EXT',1024,b'\xFF\xFF\xFF\x0BVK_IMAGE_ASPECT_METADATA_BIT',8,b'\xFF\xFF\xFF\x0BVK_IMAGE_ASPECT_NONE',0,b'\xFF\xFF\xFF\x0BVK_IMAGE_ASPECT_NONE_KHR',0,b'\xFF\xFF\xFF\x0BVK_IMAGE_ASPECT_PLANE_0_BIT',16,b'\xFF\xFF\xFF\x0BVK_IMAGE_ASPECT_PLANE_0_BIT_KHR',16,b'\xFF\xFF\xFF\x0BVK_IMAGE_ASPECT_PLANE_1_BIT',32,b'\xFF\xFF\xFF\x0BVK_IMAGE_ASPECT_PLANE_1_BIT_KHR',32,b'\xFF\xFF\xFF\x0BVK_IMAGE_ASPECT_PLANE_2_BIT',64,b'\xFF\xFF\xFF\x0BVK_IMAGE_ASPECT_PLANE_2_BIT_KHR',64,b'\xFF\xFF\xFF\x0BVK_IMAGE_ASPECT_STENCIL_BIT',4,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_DEFAULT_EXT',0,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_DISABLED_EXT',4,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_10BPC_BIT_EXT',512,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_11BPC_BIT_EXT',1024,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_12BPC_BIT_EXT',2048,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_13BPC_BIT_EXT',4096,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_14BPC_BIT_EXT',8192,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_15BPC_BIT_EXT',16384,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_16BPC_BIT_EXT',32768,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_17BPC_BIT_EXT',65536,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_18BPC_BIT_EXT',131072,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_19BPC_BIT_EXT',262144,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_1BPC_BIT_EXT',1,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_20BPC_BIT_EXT',524288,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_21BPC_BIT_EXT',1048576,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_22BPC_BIT_EXT',2097152,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_23BPC_BIT_EXT',4194304,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_24BPC_BIT_EXT',8388608,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_2BPC_BIT_EXT',2,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_3BPC_BIT_EXT',4,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_4BPC_BIT_EXT',8,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_5BPC_BIT_EXT',16,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_6BPC_BIT_EXT',32,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_7BPC_BIT_EXT',64,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_8BPC_BIT_EXT',128,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_9BPC_BIT_EXT',256,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_DEFAULT_EXT',1,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_EXPLICIT_EXT',2,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_FLAG_BITS_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FIXED_RATE_NONE_EXT',0,b'\xFF\xFF\xFF\x0BVK_IMAGE_COMPRESSION_FLAG_BITS_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_2D_ARRAY_COMPATIBLE_BIT',32,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_2D_ARRAY_COMPATIBLE_BIT_KHR',32,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_2D_VIEW_COMPATIBLE_BIT_EXT',131072,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_ALIAS_BIT',1024,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_ALIAS_BIT_KHR',1024,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_BLOCK_TEXEL_VIEW_COMPATIBLE_BIT',128,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_BLOCK_TEXEL_VIEW_COMPATIBLE_BIT_KHR',128,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_CORNER_SAMPLED_BIT_NV',8192,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_CUBE_COMPATIBLE_BIT',16,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT',65536,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_DISJOINT_BIT',512,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_DISJOINT_BIT_KHR',512,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_EXTENDED_USAGE_BIT',256,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_EXTENDED_USAGE_BIT_KHR',256,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_FRAGMENT_DENSITY_MAP_OFFSET_BIT_QCOM',32768,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_MULTISAMPLED_RENDER_TO_SINGLE_SAMPLED_BIT_EXT',262144,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_MUTABLE_FORMAT_BIT',8,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_PROTECTED_BIT',2048,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_SAMPLE_LOCATIONS_COMPATIBLE_DEPTH_BIT_EXT',4096,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_SPARSE_ALIASED_BIT',4,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_SPARSE_BINDING_BIT',1,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_SPARSE_RESIDENCY_BIT',2,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_SPLIT_INSTANCE_BIND_REGIONS_BIT',64,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_SPLIT_INSTANCE_BIND_REGIONS_BIT_KHR',64,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_SUBSAMPLED_BIT_EXT',16384,b'\xFF\xFF\xFF\x0BVK_IMAGE_CREATE_VIDEO_PROFILE_INDEPENDENT_BIT_KHR',1048576,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_ATTACHMENT_FEEDBACK_LOOP_OPTIMAL_EXT',1000339000,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_ATTACHMENT_OPTIMAL',1000314001,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_ATTACHMENT_OPTIMAL_KHR',1000314001,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_COLOR_ATTACHMENT_OPTIMAL',2,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_DEPTH_ATTACHMENT_OPTIMAL',1000241000,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_DEPTH_ATTACHMENT_OPTIMAL_KHR',1000241000,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_DEPTH_ATTACHMENT_STENCIL_READ_ONLY_OPTIMAL',1000117001,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_DEPTH_ATTACHMENT_STENCIL_READ_ONLY_OPTIMAL_KHR',1000117001,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_DEPTH_READ_ONLY_OPTIMAL',1000241001,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_DEPTH_READ_ONLY_OPTIMAL_KHR',1000241001,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_DEPTH_READ_ONLY_STENCIL_ATTACHMENT_OPTIMAL',1000117000,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_DEPTH_READ_ONLY_STENCIL_ATTACHMENT_OPTIMAL_KHR',1000117000,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_DEPTH_STENCIL_ATTACHMENT_OPTIMAL',3,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_DEPTH_STENCIL_READ_ONLY_OPTIMAL',4,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_FRAGMENT_DENSITY_MAP_OPTIMAL_EXT',1000218000,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_FRAGMENT_SHADING_RATE_ATTACHMENT_OPTIMAL_KHR',1000164003,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_GENERAL',1,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_PREINITIALIZED',8,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_PRESENT_SRC_KHR',1000001002,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_READ_ONLY_OPTIMAL',1000314000,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_READ_ONLY_OPTIMAL_KHR',1000314000,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_SHADER_READ_ONLY_OPTIMAL',5,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_SHADING_RATE_OPTIMAL_NV',1000164003,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_SHARED_PRESENT_KHR',1000111000,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_STENCIL_ATTACHMENT_OPTIMAL',1000241002,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_STENCIL_ATTACHMENT_OPTIMAL_KHR',1000241002,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_STENCIL_READ_ONLY_OPTIMAL',1000241003,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_STENCIL_READ_ONLY_OPTIMAL_KHR',1000241003,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_TRANSFER_DST_OPTIMAL',7,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_TRANSFER_SRC_OPTIMAL',6,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_UNDEFINED',0,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_VIDEO_DECODE_DPB_KHR',1000024002,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_VIDEO_DECODE_DST_KHR',1000024000,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_VIDEO_DECODE_SRC_KHR',1000024001,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_VIDEO_ENCODE_DPB_KHR',1000299002,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_VIDEO_ENCODE_DST_KHR',1000299000,b'\xFF\xFF\xFF\x0BVK_IMAGE_LAYOUT_VIDEO_ENCODE_SRC_KHR',1000299001,b'\xFF\xFF\xFF\x0BVK_IMAGE_TILING_DRM_FORMAT_MODIFIER_EXT',1000158000,b'\xFF\xFF\xFF\x0BVK_IMAGE_TILING_LINEAR',1,b'\xFF\xFF\xFF\x0BVK_IMAGE_TILING_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_IMAGE_TILING_OPTIMAL',0,b'\xFF\xFF\xFF\x0BVK_IMAGE_TYPE_1D',0,b'\xFF\xFF\xFF\x0BVK_IMAGE_TYPE_2D',1,b'\xFF\xFF\xFF\x0BVK_IMAGE_TYPE_3D',2,b'\xFF\xFF\xFF\x0BVK_IMAGE_TYPE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_IMAGE_USAGE_ATTACHMENT_FEEDBACK_LOOP_BIT_EXT',524288,b'\xFF\xFF\xFF\x0BVK_IMAGE_USAGE_COLOR_ATTACHMENT_BIT',16,b'\xFF\xFF\xFF\x0BVK_IMAGE_USAGE_DEPTH_STENCIL_ATTACHMENT_BIT',32,b'\xFF\xFF\xFF\x0BVK_IMAGE_USAGE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_IMAGE_USAGE_FRAGMENT_DENSITY_MAP_BIT_EXT',512,b'\xFF\xFF\xFF\x0BVK_IMAGE_USAGE_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR',256,b'\xFF\xFF\xFF\x0BVK_IMAGE_USAGE_HOST_TRANSFER_BIT_EXT',4194304,b'\xFF\xFF\xFF\x0BVK_IMAGE_USAGE_INPUT_ATTACHMENT_BIT',128,b'\xFF\xFF\xFF\x0BVK_IMAGE_USAGE_INVOCATION_MASK_BIT_HUAWEI',262144,b'\xFF\xFF\xFF\x0BVK_IMAGE_USAGE_SAMPLED_BIT',4,b'\xFF\xFF\xFF\x0BVK_IMAGE_USAGE_SAMPLE_BLOCK_MATCH_BIT_QCOM',2097152,b'\xFF\xFF\xFF\x0BVK_IMAGE_USAGE_SAMPLE_WEIGHT_BIT_QCOM',1048576,b'\xFF\xFF\xFF\x0BVK_IMAGE_USAGE_SHADING_RATE_IMAGE_BIT_NV',256,b'\xFF\xFF\xFF\x0BVK_IMAGE_USAGE_STORAGE_BIT',8,b'\xFF\xFF\xFF\x0BVK_IMAGE_USAGE_TRANSFER_DST_BIT',2,b'\xFF\xFF\xFF\x0BVK_IMAGE_USAGE_TRANSFER_SRC_BIT',1,b'\xFF\xFF\xFF\x0BVK_IMAGE_USAGE_TRANSIENT_ATTACHMENT_BIT',64,b'\xFF\xFF\xFF\x0BVK_IMAGE_USAGE_VIDEO_DECODE_DPB_BIT_KHR',4096,b'\xFF\xFF\xFF\x0BVK_IMAGE_USAGE_VIDEO_DECODE_DST_BIT_KHR',1024,b'\xFF\xFF\xFF\x0BVK_IMAGE_USAGE_VIDEO_DECODE_SRC_BIT_KHR',2048,b'\xFF\xFF\xFF\x0BVK_IMAGE_USAGE_VIDEO_ENCODE_DPB_BIT_KHR',32768,b'\xFF\xFF\xFF\x0BVK_IMAGE_USAGE_VIDEO_ENCODE_DST_BIT_KHR',8192,b'\xFF\xFF\xFF\x0BVK_IMAGE_USAGE_VIDEO_ENCODE_SRC_BIT_KHR',16384,b'\xFF\xFF\xFF\x0BVK_IMAGE_VIEW_CREATE_DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT',4,b'\xFF\xFF\xFF\x0BVK_IMAGE_VIEW_CREATE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_IMAGE_VIEW_CREATE_FRAGMENT_DENSITY_MAP_DEFERRED_BIT_EXT',2,b'\xFF\xFF\xFF\x0BVK_IMAGE_VIEW_CREATE_FRAGMENT_DENSITY_MAP_DYNAMIC_BIT_EXT',1,b'\xFF\xFF\xFF\x0BVK_IMAGE_VIEW_TYPE_1D',0,b'\xFF\xFF\xFF\x0BVK_IMAGE_VIEW_TYPE_1D_ARRAY',4,b'\xFF\xFF\xFF\x0BVK_IMAGE_VIEW_TYPE_2D',1,b'\xFF\xFF\xFF\x0BVK_IMAGE_VIEW_TYPE_2D_ARRAY',5,b'\xFF\xFF\xFF\x0BVK_IMAGE_VIEW_TYPE_3D',2,b'\xFF\xFF\xFF\x0BVK_IMAGE_VIEW_TYPE_CUBE',3,b'\xFF\xFF\xFF\x0BVK_IMAGE_VIEW_TYPE_CUBE_ARRAY',6,b'\xFF\xFF\xFF\x0BVK_IMAGE_VIEW_TYPE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_INCOMPLETE',5,b'\xFF\xFF\xFF\x0BVK_INDEX_TYPE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_INDEX_TYPE_NONE_KHR',1000165000,b'\xFF\xFF\xFF\x0BVK_INDEX_TYPE_NONE_NV',1000165000,b'\xFF\xFF\xFF\x0BVK_INDEX_TYPE_UINT16',0,b'\xFF\xFF\xFF\x0BVK_INDEX_TYPE_UINT32',1,b'\xFF\xFF\xFF\x0BVK_INDEX_TYPE_UINT8_EXT',1000265000,b'\xFF\xFF\xFF\x0BVK_INDIRECT_COMMANDS_LAYOUT_USAGE_EXPLICIT_PREPROCESS_BIT_NV',1,b'\xFF\xFF\xFF\x0BVK_INDIRECT_COMMANDS_LAYOUT_USAGE_FLAG_BITS_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_INDIRECT_COMMANDS_LAYOUT_USAGE_INDEXED_SEQUENCES_BIT_NV',2,b'\xFF\xFF\xFF\x0BVK_INDIRECT_COMMANDS_LAYOUT_USAGE_UNORDERED_SEQUENCES_BIT_NV',4,b'\xFF\xFF\xFF\x0BVK_INDIRECT_COMMANDS_TOKEN_TYPE_DISPATCH_NV',1000428004,b'\xFF\xFF\xFF\x0BVK_INDIRECT_COMMANDS_TOKEN_TYPE_DRAW_INDEXED_NV',5,b'\xFF\xFF\xFF\x0BVK_INDIRECT_COMMANDS_TOKEN_TYPE_DRAW_MESH_TASKS_NV',1000328000,b'\xFF\xFF\xFF\x0BVK_INDIRECT_COMMANDS_TOKEN_TYPE_DRAW_NV',6,b'\xFF\xFF\xFF\x0BVK_INDIRECT_COMMANDS_TOKEN_TYPE_DRAW_TASKS_NV',7,b'\xFF\xFF\xFF\x0BVK_INDIRECT_COMMANDS_TOKEN_TYPE_INDEX_BUFFER_NV',2,b'\xFF\xFF\xFF\x0BVK_INDIRECT_COMMANDS_TOKEN_TYPE_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_INDIRECT_COMMANDS_TOKEN_TYPE_PIPELINE_NV',1000428003,b'\xFF\xFF\xFF\x0BVK_INDIRECT_COMMANDS_TOKEN_TYPE_PUSH_CONSTANT_NV',4,b'\xFF\xFF\xFF\x0BVK_INDIRECT_COMMANDS_TOKEN_TYPE_SHADER_GROUP_NV',0,b'\xFF\xFF\xFF\x0BVK_INDIRECT_COMMANDS_TOKEN_TYPE_STATE_FLAGS_NV',1,b'\xFF\xFF\xFF\x0BVK_INDIRECT_COMMANDS_TOKEN_TYPE_VERTEX_BUFFER_NV',3,b'\xFF\xFF\xFF\x0BVK_INDIRECT_STATE_FLAG_BITS_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_INDIRECT_STATE_FLAG_FRONTFACE_BIT_NV',1,b'\xFF\xFF\xFF\x0BVK_INSTANCE_CREATE_ENUMERATE_PORTABILITY_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_INSTANCE_CREATE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_INTERNAL_ALLOCATION_TYPE_EXECUTABLE',0,b'\xFF\xFF\xFF\x0BVK_INTERNAL_ALLOCATION_TYPE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_LATENCY_MARKER_INPUT_SAMPLE_NV',6,b'\xFF\xFF\xFF\x0BVK_LATENCY_MARKER_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_LATENCY_MARKER_OUT_OF_BAND_PRESENT_END_NV',11,b'\xFF\xFF\xFF\x0BVK_LATENCY_MARKER_OUT_OF_BAND_PRESENT_START_NV',10,b'\xFF\xFF\xFF\x0BVK_LATENCY_MARKER_OUT_OF_BAND_RENDERSUBMIT_END_NV',9,b'\xFF\xFF\xFF\x0BVK_LATENCY_MARKER_OUT_OF_BAND_RENDERSUBMIT_START_NV',8,b'\xFF\xFF\xFF\x0BVK_LATENCY_MARKER_PRESENT_END_NV',5,b'\xFF\xFF\xFF\x0BVK_LATENCY_MARKER_PRESENT_START_NV',4,b'\xFF\xFF\xFF\x0BVK_LATENCY_MARKER_RENDERSUBMIT_END_NV',3,b'\xFF\xFF\xFF\x0BVK_LATENCY_MARKER_RENDERSUBMIT_START_NV',2,b'\xFF\xFF\xFF\x0BVK_LATENCY_MARKER_SIMULATION_END_NV',1,b'\xFF\xFF\xFF\x0BVK_LATENCY_MARKER_SIMULATION_START_NV',0,b'\xFF\xFF\xFF\x0BVK_LATENCY_MARKER_TRIGGER_FLASH_NV',7,b'\xFF\xFF\xFF\x0BVK_LAYERED_DRIVER_UNDERLYING_API_D3D12_MSFT',1,b'\xFF\xFF\xFF\x0BVK_LAYERED_DRIVER_UNDERLYING_API_MAX_ENUM_MSFT',2147483647,b'\xFF\xFF\xFF\x0BVK_LAYERED_DRIVER_UNDERLYING_API_NONE_MSFT',0,b'\xFF\xFF\xFF\x0BVK_LAYER_SETTING_TYPE_BOOL32_EXT',0,b'\xFF\xFF\xFF\x0BVK_LAYER_SETTING_TYPE_FLOAT32_EXT',5,b'\xFF\xFF\xFF\x0BVK_LAYER_SETTING_TYPE_FLOAT64_EXT',6,b'\xFF\xFF\xFF\x0BVK_LAYER_SETTING_TYPE_INT32_EXT',1,b'\xFF\xFF\xFF\x0BVK_LAYER_SETTING_TYPE_INT64_EXT',2,b'\xFF\xFF\xFF\x0BVK_LAYER_SETTING_TYPE_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_LAYER_SETTING_TYPE_STRING_EXT',7,b'\xFF\xFF\xFF\x0BVK_LAYER_SETTING_TYPE_UINT32_EXT',3,b'\xFF\xFF\xFF\x0BVK_LAYER_SETTING_TYPE_UINT64_EXT',4,b'\xFF\xFF\xFF\x0BVK_LINE_RASTERIZATION_MODE_BRESENHAM_EXT',2,b'\xFF\xFF\xFF\x0BVK_LINE_RASTERIZATION_MODE_DEFAULT_EXT',0,b'\xFF\xFF\xFF\x0BVK_LINE_RASTERIZATION_MODE_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_LINE_RASTERIZATION_MODE_RECTANGULAR_EXT',1,b'\xFF\xFF\xFF\x0BVK_LINE_RASTERIZATION_MODE_RECTANGULAR_SMOOTH_EXT',3,b'\xFF\xFF\xFF\x0BVK_LOGIC_OP_AND',1,b'\xFF\xFF\xFF\x0BVK_LOGIC_OP_AND_INVERTED',4,b'\xFF\xFF\xFF\x0BVK_LOGIC_OP_AND_REVERSE',2,b'\xFF\xFF\xFF\x0BVK_LOGIC_OP_CLEAR',0,b'\xFF\xFF\xFF\x0BVK_LOGIC_OP_COPY',3,b'\xFF\xFF\xFF\x0BVK_LOGIC_OP_COPY_INVERTED',12,b'\xFF\xFF\xFF\x0BVK_LOGIC_OP_EQUIVALENT',9,b'\xFF\xFF\xFF\x0BVK_LOGIC_OP_INVERT',10,b'\xFF\xFF\xFF\x0BVK_LOGIC_OP_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_LOGIC_OP_NAND',14,b'\xFF\xFF\xFF\x0BVK_LOGIC_OP_NOR',8,b'\xFF\xFF\xFF\x0BVK_LOGIC_OP_NO_OP',5,b'\xFF\xFF\xFF\x0BVK_LOGIC_OP_OR',7,b'\xFF\xFF\xFF\x0BVK_LOGIC_OP_OR_INVERTED',13,b'\xFF\xFF\xFF\x0BVK_LOGIC_OP_OR_REVERSE',11,b'\xFF\xFF\xFF\x0BVK_LOGIC_OP_SET',15,b'\xFF\xFF\xFF\x0BVK_LOGIC_OP_XOR',6,b'\xFF\xFF\xFF\x0BVK_MEMORY_ALLOCATE_DEVICE_ADDRESS_BIT',2,b'\xFF\xFF\xFF\x0BVK_MEMORY_ALLOCATE_DEVICE_ADDRESS_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_MEMORY_ALLOCATE_DEVICE_ADDRESS_CAPTURE_REPLAY_BIT',4,b'\xFF\xFF\xFF\x0BVK_MEMORY_ALLOCATE_DEVICE_ADDRESS_CAPTURE_REPLAY_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_MEMORY_ALLOCATE_DEVICE_MASK_BIT',1,b'\xFF\xFF\xFF\x0BVK_MEMORY_ALLOCATE_DEVICE_MASK_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_MEMORY_ALLOCATE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x1FVK_MEMORY_DECOMPRESSION_METHOD_GDEFLATE_1_0_BIT_NV',1,b'\xFF\xFF\xFF\x0BVK_MEMORY_HEAP_DEVICE_LOCAL_BIT',1,b'\xFF\xFF\xFF\x0BVK_MEMORY_HEAP_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_MEMORY_HEAP_MULTI_INSTANCE_BIT',2,b'\xFF\xFF\xFF\x0BVK_MEMORY_HEAP_MULTI_INSTANCE_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_MEMORY_OVERALLOCATION_BEHAVIOR_ALLOWED_AMD',1,b'\xFF\xFF\xFF\x0BVK_MEMORY_OVERALLOCATION_BEHAVIOR_DEFAULT_AMD',0,b'\xFF\xFF\xFF\x0BVK_MEMORY_OVERALLOCATION_BEHAVIOR_DISALLOWED_AMD',2,b'\xFF\xFF\xFF\x0BVK_MEMORY_OVERALLOCATION_BEHAVIOR_MAX_ENUM_AMD',2147483647,b'\xFF\xFF\xFF\x0BVK_MEMORY_PROPERTY_DEVICE_COHERENT_BIT_AMD',64,b'\xFF\xFF\xFF\x0BVK_MEMORY_PROPERTY_DEVICE_LOCAL_BIT',1,b'\xFF\xFF\xFF\x0BVK_MEMORY_PROPERTY_DEVICE_UNCACHED_BIT_AMD',128,b'\xFF\xFF\xFF\x0BVK_MEMORY_PROPERTY_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_MEMORY_PROPERTY_HOST_CACHED_BIT',8,b'\xFF\xFF\xFF\x0BVK_MEMORY_PROPERTY_HOST_COHERENT_BIT',4,b'\xFF\xFF\xFF\x0BVK_MEMORY_PROPERTY_HOST_VISIBLE_BIT',2,b'\xFF\xFF\xFF\x0BVK_MEMORY_PROPERTY_LAZILY_ALLOCATED_BIT',16,b'\xFF\xFF\xFF\x0BVK_MEMORY_PROPERTY_PROTECTED_BIT',32,b'\xFF\xFF\xFF\x0BVK_MEMORY_PROPERTY_RDMA_CAPABLE_BIT_NV',256,b'\xFF\xFF\xFF\x0BVK_MICROMAP_CREATE_DEVICE_ADDRESS_CAPTURE_REPLAY_BIT_EXT',1,b'\xFF\xFF\xFF\x0BVK_MICROMAP_CREATE_FLAG_BITS_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_MICROMAP_TYPE_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_MICROMAP_TYPE_OPACITY_MICROMAP_EXT',0,b'\xFF\xFF\xFF\x0BVK_NOT_READY',1,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_ACCELERATION_STRUCTURE_KHR',1000150000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_ACCELERATION_STRUCTURE_NV',1000165000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_BUFFER',9,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_BUFFER_COLLECTION_FUCHSIA',1000366000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_BUFFER_VIEW',13,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_COMMAND_BUFFER',6,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_COMMAND_POOL',25,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_CUDA_FUNCTION_NV',1000307001,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_CUDA_MODULE_NV',1000307000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_CU_FUNCTION_NVX',1000029001,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_CU_MODULE_NVX',1000029000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_DEBUG_REPORT_CALLBACK_EXT',1000011000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_DEBUG_UTILS_MESSENGER_EXT',1000128000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_DEFERRED_OPERATION_KHR',1000268000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_DESCRIPTOR_POOL',22,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_DESCRIPTOR_SET',23,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT',20,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_DESCRIPTOR_UPDATE_TEMPLATE',1000085000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_DESCRIPTOR_UPDATE_TEMPLATE_KHR',1000085000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_DEVICE',3,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_DEVICE_MEMORY',8,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_DISPLAY_KHR',1000002000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_DISPLAY_MODE_KHR',1000002001,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_EVENT',11,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_FENCE',7,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_FRAMEBUFFER',24,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_IMAGE',10,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_IMAGE_VIEW',14,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_INDIRECT_COMMANDS_LAYOUT_NV',1000277000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_INSTANCE',1,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_MICROMAP_EXT',1000396000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_OPTICAL_FLOW_SESSION_NV',1000464000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_PERFORMANCE_CONFIGURATION_INTEL',1000210000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_PHYSICAL_DEVICE',2,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_PIPELINE',19,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_PIPELINE_CACHE',16,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_PIPELINE_LAYOUT',17,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_PRIVATE_DATA_SLOT',1000295000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_PRIVATE_DATA_SLOT_EXT',1000295000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_QUERY_POOL',12,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_QUEUE',4,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_RENDER_PASS',18,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_SAMPLER',21,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_SAMPLER_YCBCR_CONVERSION',1000156000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_SAMPLER_YCBCR_CONVERSION_KHR',1000156000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_SEMAPHORE',5,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_SHADER_EXT',1000482000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_SHADER_MODULE',15,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_SURFACE_KHR',1000000000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_SWAPCHAIN_KHR',1000001000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_UNKNOWN',0,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_VALIDATION_CACHE_EXT',1000160000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_VIDEO_SESSION_KHR',1000023000,b'\xFF\xFF\xFF\x0BVK_OBJECT_TYPE_VIDEO_SESSION_PARAMETERS_KHR',1000023001,b'\xFF\xFF\xFF\x0BVK_OPACITY_MICROMAP_FORMAT_2_STATE_EXT',1,b'\xFF\xFF\xFF\x0BVK_OPACITY_MICROMAP_FORMAT_4_STATE_EXT',2,b'\xFF\xFF\xFF\x0BVK_OPACITY_MICROMAP_FORMAT_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_OPACITY_MICROMAP_SPECIAL_INDEX_FULLY_OPAQUE_EXT',-2,b'\xFF\xFF\xFF\x0BVK_OPACITY_MICROMAP_SPECIAL_INDEX_FULLY_TRANSPARENT_EXT',-1,b'\xFF\xFF\xFF\x0BVK_OPACITY_MICROMAP_SPECIAL_INDEX_FULLY_UNKNOWN_OPAQUE_EXT',-4,b'\xFF\xFF\xFF\x0BVK_OPACITY_MICROMAP_SPECIAL_INDEX_FULLY_UNKNOWN_TRANSPARENT_EXT',-3,b'\xFF\xFF\xFF\x0BVK_OPACITY_MICROMAP_SPECIAL_INDEX_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_OPERATION_DEFERRED_KHR',1000268002,b'\xFF\xFF\xFF\x0BVK_OPERATION_NOT_DEFERRED_KHR',1000268003,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_EXECUTE_DISABLE_TEMPORAL_HINTS_BIT_NV',1,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_EXECUTE_FLAG_BITS_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_GRID_SIZE_1X1_BIT_NV',1,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_GRID_SIZE_2X2_BIT_NV',2,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_GRID_SIZE_4X4_BIT_NV',4,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_GRID_SIZE_8X8_BIT_NV',8,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_GRID_SIZE_FLAG_BITS_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_GRID_SIZE_UNKNOWN_NV',0,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_PERFORMANCE_LEVEL_FAST_NV',3,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_PERFORMANCE_LEVEL_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_PERFORMANCE_LEVEL_MEDIUM_NV',2,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_PERFORMANCE_LEVEL_SLOW_NV',1,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_PERFORMANCE_LEVEL_UNKNOWN_NV',0,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_SESSION_BINDING_POINT_BACKWARD_COST_NV',7,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_SESSION_BINDING_POINT_BACKWARD_FLOW_VECTOR_NV',5,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_SESSION_BINDING_POINT_COST_NV',6,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_SESSION_BINDING_POINT_FLOW_VECTOR_NV',4,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_SESSION_BINDING_POINT_GLOBAL_FLOW_NV',8,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_SESSION_BINDING_POINT_HINT_NV',3,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_SESSION_BINDING_POINT_INPUT_NV',1,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_SESSION_BINDING_POINT_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_SESSION_BINDING_POINT_REFERENCE_NV',2,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_SESSION_BINDING_POINT_UNKNOWN_NV',0,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_SESSION_CREATE_ALLOW_REGIONS_BIT_NV',8,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_SESSION_CREATE_BOTH_DIRECTIONS_BIT_NV',16,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_SESSION_CREATE_ENABLE_COST_BIT_NV',2,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_SESSION_CREATE_ENABLE_GLOBAL_FLOW_BIT_NV',4,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_SESSION_CREATE_ENABLE_HINT_BIT_NV',1,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_SESSION_CREATE_FLAG_BITS_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_USAGE_COST_BIT_NV',8,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_USAGE_FLAG_BITS_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_USAGE_GLOBAL_FLOW_BIT_NV',16,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_USAGE_HINT_BIT_NV',4,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_USAGE_INPUT_BIT_NV',1,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_USAGE_OUTPUT_BIT_NV',2,b'\xFF\xFF\xFF\x0BVK_OPTICAL_FLOW_USAGE_UNKNOWN_NV',0,b'\xFF\xFF\xFF\x0BVK_OUT_OF_BAND_QUEUE_TYPE_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_OUT_OF_BAND_QUEUE_TYPE_PRESENT_NV',1,b'\xFF\xFF\xFF\x0BVK_OUT_OF_BAND_QUEUE_TYPE_RENDER_NV',0,b'\xFF\xFF\xFF\x0BVK_PEER_MEMORY_FEATURE_COPY_DST_BIT',2,b'\xFF\xFF\xFF\x0BVK_PEER_MEMORY_FEATURE_COPY_DST_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_PEER_MEMORY_FEATURE_COPY_SRC_BIT',1,b'\xFF\xFF\xFF\x0BVK_PEER_MEMORY_FEATURE_COPY_SRC_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_PEER_MEMORY_FEATURE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_PEER_MEMORY_FEATURE_GENERIC_DST_BIT',8,b'\xFF\xFF\xFF\x0BVK_PEER_MEMORY_FEATURE_GENERIC_DST_BIT_KHR',8,b'\xFF\xFF\xFF\x0BVK_PEER_MEMORY_FEATURE_GENERIC_SRC_BIT',4,b'\xFF\xFF\xFF\x0BVK_PEER_MEMORY_FEATURE_GENERIC_SRC_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_CONFIGURATION_TYPE_COMMAND_QUEUE_METRICS_DISCOVERY_ACTIVATED_INTEL',0,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_CONFIGURATION_TYPE_MAX_ENUM_INTEL',2147483647,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_DESCRIPTION_CONCURRENTLY_IMPACTED_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_DESCRIPTION_CONCURRENTLY_IMPACTED_KHR',2,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_DESCRIPTION_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_DESCRIPTION_PERFORMANCE_IMPACTING_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_DESCRIPTION_PERFORMANCE_IMPACTING_KHR',1,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_SCOPE_COMMAND_BUFFER_KHR',0,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_SCOPE_COMMAND_KHR',2,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_SCOPE_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_SCOPE_RENDER_PASS_KHR',1,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_STORAGE_FLOAT32_KHR',4,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_STORAGE_FLOAT64_KHR',5,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_STORAGE_INT32_KHR',0,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_STORAGE_INT64_KHR',1,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_STORAGE_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_STORAGE_UINT32_KHR',2,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_STORAGE_UINT64_KHR',3,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_UNIT_AMPS_KHR',8,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_UNIT_BYTES_KHR',3,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_UNIT_BYTES_PER_SECOND_KHR',4,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_UNIT_CYCLES_KHR',10,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_UNIT_GENERIC_KHR',0,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_UNIT_HERTZ_KHR',9,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_UNIT_KELVIN_KHR',5,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_UNIT_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_UNIT_NANOSECONDS_KHR',2,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_UNIT_PERCENTAGE_KHR',1,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_UNIT_VOLTS_KHR',7,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_COUNTER_UNIT_WATTS_KHR',6,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_OVERRIDE_TYPE_FLUSH_GPU_CACHES_INTEL',1,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_OVERRIDE_TYPE_MAX_ENUM_INTEL',2147483647,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_OVERRIDE_TYPE_NULL_HARDWARE_INTEL',0,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_PARAMETER_TYPE_HW_COUNTERS_SUPPORTED_INTEL',0,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_PARAMETER_TYPE_MAX_ENUM_INTEL',2147483647,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_PARAMETER_TYPE_STREAM_MARKER_VALID_BITS_INTEL',1,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_VALUE_TYPE_BOOL_INTEL',3,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_VALUE_TYPE_FLOAT_INTEL',2,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_VALUE_TYPE_MAX_ENUM_INTEL',2147483647,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_VALUE_TYPE_STRING_INTEL',4,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_VALUE_TYPE_UINT32_INTEL',0,b'\xFF\xFF\xFF\x0BVK_PERFORMANCE_VALUE_TYPE_UINT64_INTEL',1,b'\xFF\xFF\xFF\x1FVK_PHYSICAL_DEVICE_SCHEDULING_CONTROLS_SHADER_CORE_COUNT_ARM',1,b'\xFF\xFF\xFF\x0BVK_PHYSICAL_DEVICE_TYPE_CPU',4,b'\xFF\xFF\xFF\x0BVK_PHYSICAL_DEVICE_TYPE_DISCRETE_GPU',2,b'\xFF\xFF\xFF\x0BVK_PHYSICAL_DEVICE_TYPE_INTEGRATED_GPU',1,b'\xFF\xFF\xFF\x0BVK_PHYSICAL_DEVICE_TYPE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_PHYSICAL_DEVICE_TYPE_OTHER',0,b'\xFF\xFF\xFF\x0BVK_PHYSICAL_DEVICE_TYPE_VIRTUAL_GPU',3,b'\xFF\xFF\xFF\x0BVK_PIPELINE_BIND_POINT_COMPUTE',1,b'\xFF\xFF\xFF\x0BVK_PIPELINE_BIND_POINT_GRAPHICS',0,b'\xFF\xFF\xFF\x0BVK_PIPELINE_BIND_POINT_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_PIPELINE_BIND_POINT_RAY_TRACING_KHR',1000165000,b'\xFF\xFF\xFF\x0BVK_PIPELINE_BIND_POINT_RAY_TRACING_NV',1000165000,b'\xFF\xFF\xFF\x0BVK_PIPELINE_BIND_POINT_SUBPASS_SHADING_HUAWEI',1000369003,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CACHE_CREATE_EXTERNALLY_SYNCHRONIZED_BIT',1,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CACHE_CREATE_EXTERNALLY_SYNCHRONIZED_BIT_EXT',1,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CACHE_CREATE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CACHE_HEADER_VERSION_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CACHE_HEADER_VERSION_ONE',1,b'\xFF\xFF\xFF\x0BVK_PIPELINE_COLOR_BLEND_STATE_CREATE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_PIPELINE_COLOR_BLEND_STATE_CREATE_RASTERIZATION_ORDER_ATTACHMENT_ACCESS_BIT_ARM',1,b'\xFF\xFF\xFF\x0BVK_PIPELINE_COLOR_BLEND_STATE_CREATE_RASTERIZATION_ORDER_ATTACHMENT_ACCESS_BIT_EXT',1,b'\xFF\xFF\xFF\x0BVK_PIPELINE_COMPILER_CONTROL_FLAG_BITS_MAX_ENUM_AMD',2147483647,b'\xFF\xFF\xFF\x0BVK_PIPELINE_COMPILE_REQUIRED',1000297000,b'\xFF\xFF\xFF\x0BVK_PIPELINE_COMPILE_REQUIRED_EXT',1000297000,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_ALLOW_DERIVATIVES_BIT_KHR',2,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_CAPTURE_INTERNAL_REPRESENTATIONS_BIT_KHR',128,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_CAPTURE_STATISTICS_BIT_KHR',64,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_COLOR_ATTACHMENT_FEEDBACK_LOOP_BIT_EXT',33554432,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_DEFER_COMPILE_BIT_NV',32,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_DEPTH_STENCIL_ATTACHMENT_FEEDBACK_LOOP_BIT_EXT',67108864,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_DERIVATIVE_BIT_KHR',4,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_DESCRIPTOR_BUFFER_BIT_EXT',536870912,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_DISABLE_OPTIMIZATION_BIT_KHR',1,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_DISPATCH_BASE_BIT_KHR',16,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_EARLY_RETURN_ON_FAILURE_BIT_KHR',512,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_FAIL_ON_PIPELINE_COMPILE_REQUIRED_BIT_KHR',256,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_INDIRECT_BINDABLE_BIT_NV',262144,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_LIBRARY_BIT_KHR',2048,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_LINK_TIME_OPTIMIZATION_BIT_EXT',1024,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_NO_PROTECTED_ACCESS_BIT_EXT',134217728,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_PROTECTED_ACCESS_ONLY_BIT_EXT',1073741824,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_RAY_TRACING_ALLOW_MOTION_BIT_NV',1048576,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_RAY_TRACING_DISPLACEMENT_MICROMAP_BIT_NV',268435456,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_RAY_TRACING_NO_NULL_ANY_HIT_SHADERS_BIT_KHR',16384,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_RAY_TRACING_NO_NULL_CLOSEST_HIT_SHADERS_BIT_KHR',32768,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_RAY_TRACING_NO_NULL_INTERSECTION_SHADERS_BIT_KHR',131072,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_RAY_TRACING_NO_NULL_MISS_SHADERS_BIT_KHR',65536,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_RAY_TRACING_OPACITY_MICROMAP_BIT_EXT',16777216,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_RAY_TRACING_SHADER_GROUP_HANDLE_CAPTURE_REPLAY_BIT_KHR',524288,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_RAY_TRACING_SKIP_AABBS_BIT_KHR',8192,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_RAY_TRACING_SKIP_TRIANGLES_BIT_KHR',4096,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_RENDERING_FRAGMENT_DENSITY_MAP_ATTACHMENT_BIT_EXT',4194304,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_RENDERING_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR',2097152,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_RETAIN_LINK_TIME_OPTIMIZATION_INFO_BIT_EXT',8388608,b'\xFF\xFF\xFF\x1FVK_PIPELINE_CREATE_2_VIEW_INDEX_FROM_DEVICE_INDEX_BIT_KHR',8,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_ALLOW_DERIVATIVES_BIT',2,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_CAPTURE_INTERNAL_REPRESENTATIONS_BIT_KHR',128,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_CAPTURE_STATISTICS_BIT_KHR',64,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_COLOR_ATTACHMENT_FEEDBACK_LOOP_BIT_EXT',33554432,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_DEFER_COMPILE_BIT_NV',32,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_DEPTH_STENCIL_ATTACHMENT_FEEDBACK_LOOP_BIT_EXT',67108864,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_DERIVATIVE_BIT',4,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_DESCRIPTOR_BUFFER_BIT_EXT',536870912,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_DISABLE_OPTIMIZATION_BIT',1,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_DISPATCH_BASE',16,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_DISPATCH_BASE_BIT',16,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_DISPATCH_BASE_KHR',16,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_EARLY_RETURN_ON_FAILURE_BIT',512,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_EARLY_RETURN_ON_FAILURE_BIT_EXT',512,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_FAIL_ON_PIPELINE_COMPILE_REQUIRED_BIT',256,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_FAIL_ON_PIPELINE_COMPILE_REQUIRED_BIT_EXT',256,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_INDIRECT_BINDABLE_BIT_NV',262144,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_LIBRARY_BIT_KHR',2048,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_LINK_TIME_OPTIMIZATION_BIT_EXT',1024,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_NO_PROTECTED_ACCESS_BIT_EXT',134217728,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_PROTECTED_ACCESS_ONLY_BIT_EXT',1073741824,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_RAY_TRACING_ALLOW_MOTION_BIT_NV',1048576,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_RAY_TRACING_NO_NULL_ANY_HIT_SHADERS_BIT_KHR',16384,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_RAY_TRACING_NO_NULL_CLOSEST_HIT_SHADERS_BIT_KHR',32768,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_RAY_TRACING_NO_NULL_INTERSECTION_SHADERS_BIT_KHR',131072,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_RAY_TRACING_NO_NULL_MISS_SHADERS_BIT_KHR',65536,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_RAY_TRACING_OPACITY_MICROMAP_BIT_EXT',16777216,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_RAY_TRACING_SHADER_GROUP_HANDLE_CAPTURE_REPLAY_BIT_KHR',524288,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_RAY_TRACING_SKIP_AABBS_BIT_KHR',8192,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_RAY_TRACING_SKIP_TRIANGLES_BIT_KHR',4096,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_RENDERING_FRAGMENT_DENSITY_MAP_ATTACHMENT_BIT_EXT',4194304,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_RENDERING_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR',2097152,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_RETAIN_LINK_TIME_OPTIMIZATION_INFO_BIT_EXT',8388608,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_VIEW_INDEX_FROM_DEVICE_INDEX_BIT',8,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATE_VIEW_INDEX_FROM_DEVICE_INDEX_BIT_KHR',8,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATION_FEEDBACK_APPLICATION_PIPELINE_CACHE_HIT_BIT',2,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATION_FEEDBACK_APPLICATION_PIPELINE_CACHE_HIT_BIT_EXT',2,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATION_FEEDBACK_BASE_PIPELINE_ACCELERATION_BIT',4,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATION_FEEDBACK_BASE_PIPELINE_ACCELERATION_BIT_EXT',4,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATION_FEEDBACK_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATION_FEEDBACK_VALID_BIT',1,b'\xFF\xFF\xFF\x0BVK_PIPELINE_CREATION_FEEDBACK_VALID_BIT_EXT',1,b'\xFF\xFF\xFF\x0BVK_PIPELINE_DEPTH_STENCIL_STATE_CREATE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_PIPELINE_DEPTH_STENCIL_STATE_CREATE_RASTERIZATION_ORDER_ATTACHMENT_DEPTH_ACCESS_BIT_ARM',1,b'\xFF\xFF\xFF\x0BVK_PIPELINE_DEPTH_STENCIL_STATE_CREATE_RASTERIZATION_ORDER_ATTACHMENT_DEPTH_ACCESS_BIT_EXT',1,b'\xFF\xFF\xFF\x0BVK_PIPELINE_DEPTH_STENCIL_STATE_CREATE_RASTERIZATION_ORDER_ATTACHMENT_STENCIL_ACCESS_BIT_ARM',2,b'\xFF\xFF\xFF\x0BVK_PIPELINE_DEPTH_STENCIL_STATE_CREATE_RASTERIZATION_ORDER_ATTACHMENT_STENCIL_ACCESS_BIT_EXT',2,b'\xFF\xFF\xFF\x0BVK_PIPELINE_EXECUTABLE_STATISTIC_FORMAT_BOOL32_KHR',0,b'\xFF\xFF\xFF\x0BVK_PIPELINE_EXECUTABLE_STATISTIC_FORMAT_FLOAT64_KHR',3,b'\xFF\xFF\xFF\x0BVK_PIPELINE_EXECUTABLE_STATISTIC_FORMAT_INT64_KHR',1,b'\xFF\xFF\xFF\x0BVK_PIPELINE_EXECUTABLE_STATISTIC_FORMAT_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_PIPELINE_EXECUTABLE_STATISTIC_FORMAT_UINT64_KHR',2,b'\xFF\xFF\xFF\x0BVK_PIPELINE_LAYOUT_CREATE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_PIPELINE_LAYOUT_CREATE_INDEPENDENT_SETS_BIT_EXT',2,b'\xFF\xFF\xFF\x0BVK_PIPELINE_RASTERIZATION_STATE_CREATE_FRAGMENT_DENSITY_MAP_ATTACHMENT_BIT_EXT',4194304,b'\xFF\xFF\xFF\x0BVK_PIPELINE_RASTERIZATION_STATE_CREATE_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR',2097152,b'\xFF\xFF\xFF\x0BVK_PIPELINE_ROBUSTNESS_BUFFER_BEHAVIOR_DEVICE_DEFAULT_EXT',0,b'\xFF\xFF\xFF\x0BVK_PIPELINE_ROBUSTNESS_BUFFER_BEHAVIOR_DISABLED_EXT',1,b'\xFF\xFF\xFF\x0BVK_PIPELINE_ROBUSTNESS_BUFFER_BEHAVIOR_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_PIPELINE_ROBUSTNESS_BUFFER_BEHAVIOR_ROBUST_BUFFER_ACCESS_2_EXT',3,b'\xFF\xFF\xFF\x0BVK_PIPELINE_ROBUSTNESS_BUFFER_BEHAVIOR_ROBUST_BUFFER_ACCESS_EXT',2,b'\xFF\xFF\xFF\x0BVK_PIPELINE_ROBUSTNESS_IMAGE_BEHAVIOR_DEVICE_DEFAULT_EXT',0,b'\xFF\xFF\xFF\x0BVK_PIPELINE_ROBUSTNESS_IMAGE_BEHAVIOR_DISABLED_EXT',1,b'\xFF\xFF\xFF\x0BVK_PIPELINE_ROBUSTNESS_IMAGE_BEHAVIOR_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_PIPELINE_ROBUSTNESS_IMAGE_BEHAVIOR_ROBUST_IMAGE_ACCESS_2_EXT',3,b'\xFF\xFF\xFF\x0BVK_PIPELINE_ROBUSTNESS_IMAGE_BEHAVIOR_ROBUST_IMAGE_ACCESS_EXT',2,b'\xFF\xFF\xFF\x0BVK_PIPELINE_SHADER_STAGE_CREATE_ALLOW_VARYING_SUBGROUP_SIZE_BIT',1,b'\xFF\xFF\xFF\x0BVK_PIPELINE_SHADER_STAGE_CREATE_ALLOW_VARYING_SUBGROUP_SIZE_BIT_EXT',1,b'\xFF\xFF\xFF\x0BVK_PIPELINE_SHADER_STAGE_CREATE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_PIPELINE_SHADER_STAGE_CREATE_REQUIRE_FULL_SUBGROUPS_BIT',2,b'\xFF\xFF\xFF\x0BVK_PIPELINE_SHADER_STAGE_CREATE_REQUIRE_FULL_SUBGROUPS_BIT_EXT',2,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_BUILD_BIT_KHR',33554432,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_BUILD_BIT_NV',33554432,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_ACCELERATION_STRUCTURE_COPY_BIT_KHR',268435456,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_ALL_COMMANDS_BIT',65536,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_ALL_COMMANDS_BIT_KHR',65536,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_ALL_GRAPHICS_BIT',32768,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_ALL_GRAPHICS_BIT_KHR',32768,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_ALL_TRANSFER_BIT',4096,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_ALL_TRANSFER_BIT_KHR',4096,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_BLIT_BIT',17179869184,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_BLIT_BIT_KHR',17179869184,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT',8192,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_BOTTOM_OF_PIPE_BIT_KHR',8192,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_CLEAR_BIT',34359738368,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_CLEAR_BIT_KHR',34359738368,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_CLUSTER_CULLING_SHADER_BIT_HUAWEI',2199023255552,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT',1024,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_COLOR_ATTACHMENT_OUTPUT_BIT_KHR',1024,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_COMMAND_PREPROCESS_BIT_NV',131072,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_COMPUTE_SHADER_BIT',2048,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_COMPUTE_SHADER_BIT_KHR',2048,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_CONDITIONAL_RENDERING_BIT_EXT',262144,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_COPY_BIT',4294967296,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_COPY_BIT_KHR',4294967296,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT',2,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_DRAW_INDIRECT_BIT_KHR',2,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_EARLY_FRAGMENT_TESTS_BIT',256,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_EARLY_FRAGMENT_TESTS_BIT_KHR',256,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_FRAGMENT_DENSITY_PROCESS_BIT_EXT',8388608,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_FRAGMENT_SHADER_BIT',128,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_FRAGMENT_SHADER_BIT_KHR',128,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR',4194304,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_GEOMETRY_SHADER_BIT',64,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_GEOMETRY_SHADER_BIT_KHR',64,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_HOST_BIT',16384,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_HOST_BIT_KHR',16384,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_INDEX_INPUT_BIT',68719476736,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_INDEX_INPUT_BIT_KHR',68719476736,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_INVOCATION_MASK_BIT_HUAWEI',1099511627776,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT',512,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_LATE_FRAGMENT_TESTS_BIT_KHR',512,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_MESH_SHADER_BIT_EXT',1048576,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_MESH_SHADER_BIT_NV',1048576,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_MICROMAP_BUILD_BIT_EXT',1073741824,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_NONE',0,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_NONE_KHR',0,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_OPTICAL_FLOW_BIT_NV',536870912,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_PRE_RASTERIZATION_SHADERS_BIT',274877906944,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_PRE_RASTERIZATION_SHADERS_BIT_KHR',274877906944,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_RAY_TRACING_SHADER_BIT_KHR',2097152,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_RAY_TRACING_SHADER_BIT_NV',2097152,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_RESOLVE_BIT',8589934592,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_RESOLVE_BIT_KHR',8589934592,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_SHADING_RATE_IMAGE_BIT_NV',4194304,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_SUBPASS_SHADER_BIT_HUAWEI',549755813888,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_SUBPASS_SHADING_BIT_HUAWEI',549755813888,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_TASK_SHADER_BIT_EXT',524288,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_TASK_SHADER_BIT_NV',524288,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_TESSELLATION_CONTROL_SHADER_BIT',16,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_TESSELLATION_CONTROL_SHADER_BIT_KHR',16,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_TESSELLATION_EVALUATION_SHADER_BIT',32,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_TESSELLATION_EVALUATION_SHADER_BIT_KHR',32,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT',1,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT_KHR',1,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_TRANSFER_BIT',4096,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_TRANSFER_BIT_KHR',4096,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_TRANSFORM_FEEDBACK_BIT_EXT',16777216,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_VERTEX_ATTRIBUTE_INPUT_BIT',137438953472,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_VERTEX_ATTRIBUTE_INPUT_BIT_KHR',137438953472,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_VERTEX_INPUT_BIT',4,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_VERTEX_INPUT_BIT_KHR',4,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_VERTEX_SHADER_BIT',8,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_VERTEX_SHADER_BIT_KHR',8,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_VIDEO_DECODE_BIT_KHR',67108864,b'\xFF\xFF\xFF\x1FVK_PIPELINE_STAGE_2_VIDEO_ENCODE_BIT_KHR',134217728,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_ACCELERATION_STRUCTURE_BUILD_BIT_KHR',33554432,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_ACCELERATION_STRUCTURE_BUILD_BIT_NV',33554432,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_ALL_COMMANDS_BIT',65536,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_ALL_GRAPHICS_BIT',32768,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_BOTTOM_OF_PIPE_BIT',8192,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_COLOR_ATTACHMENT_OUTPUT_BIT',1024,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_COMMAND_PREPROCESS_BIT_NV',131072,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_COMPUTE_SHADER_BIT',2048,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_CONDITIONAL_RENDERING_BIT_EXT',262144,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_DRAW_INDIRECT_BIT',2,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_EARLY_FRAGMENT_TESTS_BIT',256,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_FRAGMENT_DENSITY_PROCESS_BIT_EXT',8388608,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_FRAGMENT_SHADER_BIT',128,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR',4194304,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_GEOMETRY_SHADER_BIT',64,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_HOST_BIT',16384,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_LATE_FRAGMENT_TESTS_BIT',512,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_MESH_SHADER_BIT_EXT',1048576,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_MESH_SHADER_BIT_NV',1048576,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_NONE',0,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_NONE_KHR',0,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_RAY_TRACING_SHADER_BIT_KHR',2097152,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_RAY_TRACING_SHADER_BIT_NV',2097152,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_SHADING_RATE_IMAGE_BIT_NV',4194304,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_TASK_SHADER_BIT_EXT',524288,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_TASK_SHADER_BIT_NV',524288,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_TESSELLATION_CONTROL_SHADER_BIT',16,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_TESSELLATION_EVALUATION_SHADER_BIT',32,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_TOP_OF_PIPE_BIT',1,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_TRANSFER_BIT',4096,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_TRANSFORM_FEEDBACK_BIT_EXT',16777216,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_VERTEX_INPUT_BIT',4,b'\xFF\xFF\xFF\x0BVK_PIPELINE_STAGE_VERTEX_SHADER_BIT',8,b'\xFF\xFF\xFF\x0BVK_POINT_CLIPPING_BEHAVIOR_ALL_CLIP_PLANES',0,b'\xFF\xFF\xFF\x0BVK_POINT_CLIPPING_BEHAVIOR_ALL_CLIP_PLANES_KHR',0,b'\xFF\xFF\xFF\x0BVK_POINT_CLIPPING_BEHAVIOR_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_POINT_CLIPPING_BEHAVIOR_USER_CLIP_PLANES_ONLY',1,b'\xFF\xFF\xFF\x0BVK_POINT_CLIPPING_BEHAVIOR_USER_CLIP_PLANES_ONLY_KHR',1,b'\xFF\xFF\xFF\x0BVK_POLYGON_MODE_FILL',0,b'\xFF\xFF\xFF\x0BVK_POLYGON_MODE_FILL_RECTANGLE_NV',1000153000,b'\xFF\xFF\xFF\x0BVK_POLYGON_MODE_LINE',1,b'\xFF\xFF\xFF\x0BVK_POLYGON_MODE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_POLYGON_MODE_POINT',2,b'\xFF\xFF\xFF\x0BVK_PRESENT_GRAVITY_CENTERED_BIT_EXT',4,b'\xFF\xFF\xFF\x0BVK_PRESENT_GRAVITY_FLAG_BITS_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_PRESENT_GRAVITY_MAX_BIT_EXT',2,b'\xFF\xFF\xFF\x0BVK_PRESENT_GRAVITY_MIN_BIT_EXT',1,b'\xFF\xFF\xFF\x0BVK_PRESENT_MODE_FIFO_KHR',2,b'\xFF\xFF\xFF\x0BVK_PRESENT_MODE_FIFO_RELAXED_KHR',3,b'\xFF\xFF\xFF\x0BVK_PRESENT_MODE_IMMEDIATE_KHR',0,b'\xFF\xFF\xFF\x0BVK_PRESENT_MODE_MAILBOX_KHR',1,b'\xFF\xFF\xFF\x0BVK_PRESENT_MODE_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_PRESENT_MODE_SHARED_CONTINUOUS_REFRESH_KHR',1000111001,b'\xFF\xFF\xFF\x0BVK_PRESENT_MODE_SHARED_DEMAND_REFRESH_KHR',1000111000,b'\xFF\xFF\xFF\x0BVK_PRESENT_SCALING_ASPECT_RATIO_STRETCH_BIT_EXT',2,b'\xFF\xFF\xFF\x0BVK_PRESENT_SCALING_FLAG_BITS_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_PRESENT_SCALING_ONE_TO_ONE_BIT_EXT',1,b'\xFF\xFF\xFF\x0BVK_PRESENT_SCALING_STRETCH_BIT_EXT',4,b'\xFF\xFF\xFF\x0BVK_PRIMITIVE_TOPOLOGY_LINE_LIST',1,b'\xFF\xFF\xFF\x0BVK_PRIMITIVE_TOPOLOGY_LINE_LIST_WITH_ADJACENCY',6,b'\xFF\xFF\xFF\x0BVK_PRIMITIVE_TOPOLOGY_LINE_STRIP',2,b'\xFF\xFF\xFF\x0BVK_PRIMITIVE_TOPOLOGY_LINE_STRIP_WITH_ADJACENCY',7,b'\xFF\xFF\xFF\x0BVK_PRIMITIVE_TOPOLOGY_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_PRIMITIVE_TOPOLOGY_PATCH_LIST',10,b'\xFF\xFF\xFF\x0BVK_PRIMITIVE_TOPOLOGY_POINT_LIST',0,b'\xFF\xFF\xFF\x0BVK_PRIMITIVE_TOPOLOGY_TRIANGLE_FAN',5,b'\xFF\xFF\xFF\x0BVK_PRIMITIVE_TOPOLOGY_TRIANGLE_LIST',3,b'\xFF\xFF\xFF\x0BVK_PRIMITIVE_TOPOLOGY_TRIANGLE_LIST_WITH_ADJACENCY',8,b'\xFF\xFF\xFF\x0BVK_PRIMITIVE_TOPOLOGY_TRIANGLE_STRIP',4,b'\xFF\xFF\xFF\x0BVK_PRIMITIVE_TOPOLOGY_TRIANGLE_STRIP_WITH_ADJACENCY',9,b'\xFF\xFF\xFF\x0BVK_PROVOKING_VERTEX_MODE_FIRST_VERTEX_EXT',0,b'\xFF\xFF\xFF\x0BVK_PROVOKING_VERTEX_MODE_LAST_VERTEX_EXT',1,b'\xFF\xFF\xFF\x0BVK_PROVOKING_VERTEX_MODE_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_QUERY_CONTROL_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_QUERY_CONTROL_PRECISE_BIT',1,b'\xFF\xFF\xFF\x0BVK_QUERY_PIPELINE_STATISTIC_CLIPPING_INVOCATIONS_BIT',32,b'\xFF\xFF\xFF\x0BVK_QUERY_PIPELINE_STATISTIC_CLIPPING_PRIMITIVES_BIT',64,b'\xFF\xFF\xFF\x0BVK_QUERY_PIPELINE_STATISTIC_CLUSTER_CULLING_SHADER_INVOCATIONS_BIT_HUAWEI',8192,b'\xFF\xFF\xFF\x0BVK_QUERY_PIPELINE_STATISTIC_COMPUTE_SHADER_INVOCATIONS_BIT',1024,b'\xFF\xFF\xFF\x0BVK_QUERY_PIPELINE_STATISTIC_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_QUERY_PIPELINE_STATISTIC_FRAGMENT_SHADER_INVOCATIONS_BIT',128,b'\xFF\xFF\xFF\x0BVK_QUERY_PIPELINE_STATISTIC_GEOMETRY_SHADER_INVOCATIONS_BIT',8,b'\xFF\xFF\xFF\x0BVK_QUERY_PIPELINE_STATISTIC_GEOMETRY_SHADER_PRIMITIVES_BIT',16,b'\xFF\xFF\xFF\x0BVK_QUERY_PIPELINE_STATISTIC_INPUT_ASSEMBLY_PRIMITIVES_BIT',2,b'\xFF\xFF\xFF\x0BVK_QUERY_PIPELINE_STATISTIC_INPUT_ASSEMBLY_VERTICES_BIT',1,b'\xFF\xFF\xFF\x0BVK_QUERY_PIPELINE_STATISTIC_MESH_SHADER_INVOCATIONS_BIT_EXT',4096,b'\xFF\xFF\xFF\x0BVK_QUERY_PIPELINE_STATISTIC_TASK_SHADER_INVOCATIONS_BIT_EXT',2048,b'\xFF\xFF\xFF\x0BVK_QUERY_PIPELINE_STATISTIC_TESSELLATION_CONTROL_SHADER_PATCHES_BIT',256,b'\xFF\xFF\xFF\x0BVK_QUERY_PIPELINE_STATISTIC_TESSELLATION_EVALUATION_SHADER_INVOCATIONS_BIT',512,b'\xFF\xFF\xFF\x0BVK_QUERY_PIPELINE_STATISTIC_VERTEX_SHADER_INVOCATIONS_BIT',4,b'\xFF\xFF\xFF\x0BVK_QUERY_POOL_SAMPLING_MODE_MANUAL_INTEL',0,b'\xFF\xFF\xFF\x0BVK_QUERY_POOL_SAMPLING_MODE_MAX_ENUM_INTEL',2147483647,b'\xFF\xFF\xFF\x0BVK_QUERY_RESULT_64_BIT',1,b'\xFF\xFF\xFF\x0BVK_QUERY_RESULT_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_QUERY_RESULT_PARTIAL_BIT',8,b'\xFF\xFF\xFF\x0BVK_QUERY_RESULT_STATUS_COMPLETE_KHR',1,b'\xFF\xFF\xFF\x0BVK_QUERY_RESULT_STATUS_ERROR_KHR',-1,b'\xFF\xFF\xFF\x0BVK_QUERY_RESULT_STATUS_INSUFFICIENT_BITSTREAM_BUFFER_RANGE_KHR',-1000299000,b'\xFF\xFF\xFF\x0BVK_QUERY_RESULT_STATUS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_QUERY_RESULT_STATUS_NOT_READY_KHR',0,b'\xFF\xFF\xFF\x0BVK_QUERY_RESULT_WAIT_BIT',2,b'\xFF\xFF\xFF\x0BVK_QUERY_RESULT_WITH_AVAILABILITY_BIT',4,b'\xFF\xFF\xFF\x0BVK_QUERY_RESULT_WITH_STATUS_BIT_KHR',16,b'\xFF\xFF\xFF\x0BVK_QUERY_SCOPE_COMMAND_BUFFER_KHR',0,b'\xFF\xFF\xFF\x0BVK_QUERY_SCOPE_COMMAND_KHR',2,b'\xFF\xFF\xFF\x0BVK_QUERY_SCOPE_RENDER_PASS_KHR',1,b'\xFF\xFF\xFF\x0BVK_QUERY_TYPE_ACCELERATION_STRUCTURE_COMPACTED_SIZE_KHR',1000150000,b'\xFF\xFF\xFF\x0BVK_QUERY_TYPE_ACCELERATION_STRUCTURE_COMPACTED_SIZE_NV',1000165000,b'\xFF\xFF\xFF\x0BVK_QUERY_TYPE_ACCELERATION_STRUCTURE_SERIALIZATION_BOTTOM_LEVEL_POINTERS_KHR',1000386000,b'\xFF\xFF\xFF\x0BVK_QUERY_TYPE_ACCELERATION_STRUCTURE_SERIALIZATION_SIZE_KHR',1000150001,b'\xFF\xFF\xFF\x0BVK_QUERY_TYPE_ACCELERATION_STRUCTURE_SIZE_KHR',1000386001,b'\xFF\xFF\xFF\x0BVK_QUERY_TYPE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_QUERY_TYPE_MESH_PRIMITIVES_GENERATED_EXT',1000328000,b'\xFF\xFF\xFF\x0BVK_QUERY_TYPE_MICROMAP_COMPACTED_SIZE_EXT',1000396001,b'\xFF\xFF\xFF\x0BVK_QUERY_TYPE_MICROMAP_SERIALIZATION_SIZE_EXT',1000396000,b'\xFF\xFF\xFF\x0BVK_QUERY_TYPE_OCCLUSION',0,b'\xFF\xFF\xFF\x0BVK_QUERY_TYPE_PERFORMANCE_QUERY_INTEL',1000210000,b'\xFF\xFF\xFF\x0BVK_QUERY_TYPE_PERFORMANCE_QUERY_KHR',1000116000,b'\xFF\xFF\xFF\x0BVK_QUERY_TYPE_PIPELINE_STATISTICS',1,b'\xFF\xFF\xFF\x0BVK_QUERY_TYPE_PRIMITIVES_GENERATED_EXT',1000382000,b'\xFF\xFF\xFF\x0BVK_QUERY_TYPE_RESULT_STATUS_ONLY_KHR',1000023000,b'\xFF\xFF\xFF\x0BVK_QUERY_TYPE_TIMESTAMP',2,b'\xFF\xFF\xFF\x0BVK_QUERY_TYPE_TRANSFORM_FEEDBACK_STREAM_EXT',1000028004,b'\xFF\xFF\xFF\x0BVK_QUERY_TYPE_VIDEO_ENCODE_FEEDBACK_KHR',1000299000,b'\xFF\xFF\xFF\x0BVK_QUEUE_COMPUTE_BIT',2,b'\xFF\xFF\xFF\x0BVK_QUEUE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_QUEUE_GLOBAL_PRIORITY_HIGH_EXT',512,b'\xFF\xFF\xFF\x0BVK_QUEUE_GLOBAL_PRIORITY_HIGH_KHR',512,b'\xFF\xFF\xFF\x0BVK_QUEUE_GLOBAL_PRIORITY_LOW_EXT',128,b'\xFF\xFF\xFF\x0BVK_QUEUE_GLOBAL_PRIORITY_LOW_KHR',128,b'\xFF\xFF\xFF\x0BVK_QUEUE_GLOBAL_PRIORITY_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_QUEUE_GLOBAL_PRIORITY_MEDIUM_EXT',256,b'\xFF\xFF\xFF\x0BVK_QUEUE_GLOBAL_PRIORITY_MEDIUM_KHR',256,b'\xFF\xFF\xFF\x0BVK_QUEUE_GLOBAL_PRIORITY_REALTIME_EXT',1024,b'\xFF\xFF\xFF\x0BVK_QUEUE_GLOBAL_PRIORITY_REALTIME_KHR',1024,b'\xFF\xFF\xFF\x0BVK_QUEUE_GRAPHICS_BIT',1,b'\xFF\xFF\xFF\x0BVK_QUEUE_OPTICAL_FLOW_BIT_NV',256,b'\xFF\xFF\xFF\x0BVK_QUEUE_PROTECTED_BIT',16,b'\xFF\xFF\xFF\x0BVK_QUEUE_SPARSE_BINDING_BIT',8,b'\xFF\xFF\xFF\x0BVK_QUEUE_TRANSFER_BIT',4,b'\xFF\xFF\xFF\x0BVK_QUEUE_VIDEO_DECODE_BIT_KHR',32,b'\xFF\xFF\xFF\x0BVK_QUEUE_VIDEO_ENCODE_BIT_KHR',64,b'\xFF\xFF\xFF\x0BVK_RASTERIZATION_ORDER_MAX_ENUM_AMD',2147483647,b'\xFF\xFF\xFF\x0BVK_RASTERIZATION_ORDER_RELAXED_AMD',1,b'\xFF\xFF\xFF\x0BVK_RASTERIZATION_ORDER_STRICT_AMD',0,b'\xFF\xFF\xFF\x0BVK_RAY_TRACING_INVOCATION_REORDER_MODE_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_RAY_TRACING_INVOCATION_REORDER_MODE_NONE_NV',0,b'\xFF\xFF\xFF\x0BVK_RAY_TRACING_INVOCATION_REORDER_MODE_REORDER_NV',1,b'\xFF\xFF\xFF\x0BVK_RAY_TRACING_SHADER_GROUP_TYPE_GENERAL_KHR',0,b'\xFF\xFF\xFF\x0BVK_RAY_TRACING_SHADER_GROUP_TYPE_GENERAL_NV',0,b'\xFF\xFF\xFF\x0BVK_RAY_TRACING_SHADER_GROUP_TYPE_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_RAY_TRACING_SHADER_GROUP_TYPE_PROCEDURAL_HIT_GROUP_KHR',2,b'\xFF\xFF\xFF\x0BVK_RAY_TRACING_SHADER_GROUP_TYPE_PROCEDURAL_HIT_GROUP_NV',2,b'\xFF\xFF\xFF\x0BVK_RAY_TRACING_SHADER_GROUP_TYPE_TRIANGLES_HIT_GROUP_KHR',1,b'\xFF\xFF\xFF\x0BVK_RAY_TRACING_SHADER_GROUP_TYPE_TRIANGLES_HIT_GROUP_NV',1,b'\xFF\xFF\xFF\x0BVK_RENDERING_CONTENTS_INLINE_BIT_EXT',16,b'\xFF\xFF\xFF\x0BVK_RENDERING_CONTENTS_SECONDARY_COMMAND_BUFFERS_BIT',1,b'\xFF\xFF\xFF\x0BVK_RENDERING_CONTENTS_SECONDARY_COMMAND_BUFFERS_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_RENDERING_ENABLE_LEGACY_DITHERING_BIT_EXT',8,b'\xFF\xFF\xFF\x0BVK_RENDERING_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_RENDERING_RESUMING_BIT',4,b'\xFF\xFF\xFF\x0BVK_RENDERING_RESUMING_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_RENDERING_SUSPENDING_BIT',2,b'\xFF\xFF\xFF\x0BVK_RENDERING_SUSPENDING_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_RENDER_PASS_CREATE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_RENDER_PASS_CREATE_TRANSFORM_BIT_QCOM',2,b'\xFF\xFF\xFF\x0BVK_RESOLVE_MODE_AVERAGE_BIT',2,b'\xFF\xFF\xFF\x0BVK_RESOLVE_MODE_AVERAGE_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_RESOLVE_MODE_EXTERNAL_FORMAT_DOWNSAMPLE_ANDROID',16,b'\xFF\xFF\xFF\x0BVK_RESOLVE_MODE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_RESOLVE_MODE_MAX_BIT',8,b'\xFF\xFF\xFF\x0BVK_RESOLVE_MODE_MAX_BIT_KHR',8,b'\xFF\xFF\xFF\x0BVK_RESOLVE_MODE_MIN_BIT',4,b'\xFF\xFF\xFF\x0BVK_RESOLVE_MODE_MIN_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_RESOLVE_MODE_NONE',0,b'\xFF\xFF\xFF\x0BVK_RESOLVE_MODE_NONE_KHR',0,b'\xFF\xFF\xFF\x0BVK_RESOLVE_MODE_SAMPLE_ZERO_BIT',1,b'\xFF\xFF\xFF\x0BVK_RESOLVE_MODE_SAMPLE_ZERO_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_RESULT_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_SAMPLER_ADDRESS_MODE_CLAMP_TO_BORDER',3,b'\xFF\xFF\xFF\x0BVK_SAMPLER_ADDRESS_MODE_CLAMP_TO_EDGE',2,b'\xFF\xFF\xFF\x0BVK_SAMPLER_ADDRESS_MODE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_SAMPLER_ADDRESS_MODE_MIRRORED_REPEAT',1,b'\xFF\xFF\xFF\x0BVK_SAMPLER_ADDRESS_MODE_MIRROR_CLAMP_TO_EDGE',4,b'\xFF\xFF\xFF\x0BVK_SAMPLER_ADDRESS_MODE_MIRROR_CLAMP_TO_EDGE_KHR',4,b'\xFF\xFF\xFF\x0BVK_SAMPLER_ADDRESS_MODE_REPEAT',0,b'\xFF\xFF\xFF\x0BVK_SAMPLER_CREATE_DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT',8,b'\xFF\xFF\xFF\x0BVK_SAMPLER_CREATE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_SAMPLER_CREATE_IMAGE_PROCESSING_BIT_QCOM',16,b'\xFF\xFF\xFF\x0BVK_SAMPLER_CREATE_NON_SEAMLESS_CUBE_MAP_BIT_EXT',4,b'\xFF\xFF\xFF\x0BVK_SAMPLER_CREATE_SUBSAMPLED_BIT_EXT',1,b'\xFF\xFF\xFF\x0BVK_SAMPLER_CREATE_SUBSAMPLED_COARSE_RECONSTRUCTION_BIT_EXT',2,b'\xFF\xFF\xFF\x0BVK_SAMPLER_MIPMAP_MODE_LINEAR',1,b'\xFF\xFF\xFF\x0BVK_SAMPLER_MIPMAP_MODE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_SAMPLER_MIPMAP_MODE_NEAREST',0,b'\xFF\xFF\xFF\x0BVK_SAMPLER_REDUCTION_MODE_MAX',2,b'\xFF\xFF\xFF\x0BVK_SAMPLER_REDUCTION_MODE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_SAMPLER_REDUCTION_MODE_MAX_EXT',2,b'\xFF\xFF\xFF\x0BVK_SAMPLER_REDUCTION_MODE_MIN',1,b'\xFF\xFF\xFF\x0BVK_SAMPLER_REDUCTION_MODE_MIN_EXT',1,b'\xFF\xFF\xFF\x0BVK_SAMPLER_REDUCTION_MODE_WEIGHTED_AVERAGE',0,b'\xFF\xFF\xFF\x0BVK_SAMPLER_REDUCTION_MODE_WEIGHTED_AVERAGE_EXT',0,b'\xFF\xFF\xFF\x0BVK_SAMPLER_REDUCTION_MODE_WEIGHTED_AVERAGE_RANGECLAMP_QCOM',1000521000,b'\xFF\xFF\xFF\x0BVK_SAMPLER_YCBCR_MODEL_CONVERSION_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_SAMPLER_YCBCR_MODEL_CONVERSION_RGB_IDENTITY',0,b'\xFF\xFF\xFF\x0BVK_SAMPLER_YCBCR_MODEL_CONVERSION_RGB_IDENTITY_KHR',0,b'\xFF\xFF\xFF\x0BVK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_2020',4,b'\xFF\xFF\xFF\x0BVK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_2020_KHR',4,b'\xFF\xFF\xFF\x0BVK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_601',3,b'\xFF\xFF\xFF\x0BVK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_601_KHR',3,b'\xFF\xFF\xFF\x0BVK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_709',2,b'\xFF\xFF\xFF\x0BVK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_709_KHR',2,b'\xFF\xFF\xFF\x0BVK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_IDENTITY',1,b'\xFF\xFF\xFF\x0BVK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_IDENTITY_KHR',1,b'\xFF\xFF\xFF\x0BVK_SAMPLER_YCBCR_RANGE_ITU_FULL',0,b'\xFF\xFF\xFF\x0BVK_SAMPLER_YCBCR_RANGE_ITU_FULL_KHR',0,b'\xFF\xFF\xFF\x0BVK_SAMPLER_YCBCR_RANGE_ITU_NARROW',1,b'\xFF\xFF\xFF\x0BVK_SAMPLER_YCBCR_RANGE_ITU_NARROW_KHR',1,b'\xFF\xFF\xFF\x0BVK_SAMPLER_YCBCR_RANGE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_SAMPLE_COUNT_16_BIT',16,b'\xFF\xFF\xFF\x0BVK_SAMPLE_COUNT_1_BIT',1,b'\xFF\xFF\xFF\x0BVK_SAMPLE_COUNT_2_BIT',2,b'\xFF\xFF\xFF\x0BVK_SAMPLE_COUNT_32_BIT',32,b'\xFF\xFF\xFF\x0BVK_SAMPLE_COUNT_4_BIT',4,b'\xFF\xFF\xFF\x0BVK_SAMPLE_COUNT_64_BIT',64,b'\xFF\xFF\xFF\x0BVK_SAMPLE_COUNT_8_BIT',8,b'\xFF\xFF\xFF\x0BVK_SAMPLE_COUNT_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_SCOPE_DEVICE_KHR',1,b'\xFF\xFF\xFF\x0BVK_SCOPE_DEVICE_NV',1,b'\xFF\xFF\xFF\x0BVK_SCOPE_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_SCOPE_QUEUE_FAMILY_KHR',5,b'\xFF\xFF\xFF\x0BVK_SCOPE_QUEUE_FAMILY_NV',5,b'\xFF\xFF\xFF\x0BVK_SCOPE_SUBGROUP_KHR',3,b'\xFF\xFF\xFF\x0BVK_SCOPE_SUBGROUP_NV',3,b'\xFF\xFF\xFF\x0BVK_SCOPE_WORKGROUP_KHR',2,b'\xFF\xFF\xFF\x0BVK_SCOPE_WORKGROUP_NV',2,b'\xFF\xFF\xFF\x0BVK_SEMAPHORE_IMPORT_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_SEMAPHORE_IMPORT_TEMPORARY_BIT',1,b'\xFF\xFF\xFF\x0BVK_SEMAPHORE_IMPORT_TEMPORARY_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_SEMAPHORE_TYPE_BINARY',0,b'\xFF\xFF\xFF\x0BVK_SEMAPHORE_TYPE_BINARY_KHR',0,b'\xFF\xFF\xFF\x0BVK_SEMAPHORE_TYPE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_SEMAPHORE_TYPE_TIMELINE',1,b'\xFF\xFF\xFF\x0BVK_SEMAPHORE_TYPE_TIMELINE_KHR',1,b'\xFF\xFF\xFF\x0BVK_SEMAPHORE_WAIT_ANY_BIT',1,b'\xFF\xFF\xFF\x0BVK_SEMAPHORE_WAIT_ANY_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_SEMAPHORE_WAIT_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_SHADER_CODE_TYPE_BINARY_EXT',0,b'\xFF\xFF\xFF\x0BVK_SHADER_CODE_TYPE_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_SHADER_CODE_TYPE_SPIRV_EXT',1,b'\xFF\xFF\xFF\x0BVK_SHADER_CORE_PROPERTIES_FLAG_BITS_MAX_ENUM_AMD',2147483647,b'\xFF\xFF\xFF\x0BVK_SHADER_CREATE_ALLOW_VARYING_SUBGROUP_SIZE_BIT_EXT',2,b'\xFF\xFF\xFF\x0BVK_SHADER_CREATE_DISPATCH_BASE_BIT_EXT',16,b'\xFF\xFF\xFF\x0BVK_SHADER_CREATE_FLAG_BITS_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_SHADER_CREATE_FRAGMENT_DENSITY_MAP_ATTACHMENT_BIT_EXT',64,b'\xFF\xFF\xFF\x0BVK_SHADER_CREATE_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_EXT',32,b'\xFF\xFF\xFF\x0BVK_SHADER_CREATE_LINK_STAGE_BIT_EXT',1,b'\xFF\xFF\xFF\x0BVK_SHADER_CREATE_NO_TASK_SHADER_BIT_EXT',8,b'\xFF\xFF\xFF\x0BVK_SHADER_CREATE_REQUIRE_FULL_SUBGROUPS_BIT_EXT',4,b'\xFF\xFF\xFF\x0BVK_SHADER_FLOAT_CONTROLS_INDEPENDENCE_32_BIT_ONLY',0,b'\xFF\xFF\xFF\x0BVK_SHADER_FLOAT_CONTROLS_INDEPENDENCE_32_BIT_ONLY_KHR',0,b'\xFF\xFF\xFF\x0BVK_SHADER_FLOAT_CONTROLS_INDEPENDENCE_ALL',1,b'\xFF\xFF\xFF\x0BVK_SHADER_FLOAT_CONTROLS_INDEPENDENCE_ALL_KHR',1,b'\xFF\xFF\xFF\x0BVK_SHADER_FLOAT_CONTROLS_INDEPENDENCE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_SHADER_FLOAT_CONTROLS_INDEPENDENCE_NONE',2,b'\xFF\xFF\xFF\x0BVK_SHADER_FLOAT_CONTROLS_INDEPENDENCE_NONE_KHR',2,b'\xFF\xFF\xFF\x0BVK_SHADER_GROUP_SHADER_ANY_HIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_SHADER_GROUP_SHADER_CLOSEST_HIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_SHADER_GROUP_SHADER_GENERAL_KHR',0,b'\xFF\xFF\xFF\x0BVK_SHADER_GROUP_SHADER_INTERSECTION_KHR',3,b'\xFF\xFF\xFF\x0BVK_SHADER_GROUP_SHADER_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_SHADER_INFO_TYPE_BINARY_AMD',1,b'\xFF\xFF\xFF\x0BVK_SHADER_INFO_TYPE_DISASSEMBLY_AMD',2,b'\xFF\xFF\xFF\x0BVK_SHADER_INFO_TYPE_MAX_ENUM_AMD',2147483647,b'\xFF\xFF\xFF\x0BVK_SHADER_INFO_TYPE_STATISTICS_AMD',0,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_ALL',2147483647,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_ALL_GRAPHICS',31,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_ANY_HIT_BIT_KHR',512,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_ANY_HIT_BIT_NV',512,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_CALLABLE_BIT_KHR',8192,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_CALLABLE_BIT_NV',8192,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_CLOSEST_HIT_BIT_KHR',1024,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_CLOSEST_HIT_BIT_NV',1024,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_CLUSTER_CULLING_BIT_HUAWEI',524288,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_COMPUTE_BIT',32,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_FRAGMENT_BIT',16,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_GEOMETRY_BIT',8,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_INTERSECTION_BIT_KHR',4096,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_INTERSECTION_BIT_NV',4096,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_MESH_BIT_EXT',128,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_MESH_BIT_NV',128,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_MISS_BIT_KHR',2048,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_MISS_BIT_NV',2048,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_RAYGEN_BIT_KHR',256,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_RAYGEN_BIT_NV',256,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_SUBPASS_SHADING_BIT_HUAWEI',16384,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_TASK_BIT_EXT',64,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_TASK_BIT_NV',64,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_TESSELLATION_CONTROL_BIT',2,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_TESSELLATION_EVALUATION_BIT',4,b'\xFF\xFF\xFF\x0BVK_SHADER_STAGE_VERTEX_BIT',1,b'\xFF\xFF\xFF\x0BVK_SHADING_RATE_PALETTE_ENTRY_16_INVOCATIONS_PER_PIXEL_NV',1,b'\xFF\xFF\xFF\x0BVK_SHADING_RATE_PALETTE_ENTRY_1_INVOCATION_PER_1X2_PIXELS_NV',7,b'\xFF\xFF\xFF\x0BVK_SHADING_RATE_PALETTE_ENTRY_1_INVOCATION_PER_2X1_PIXELS_NV',6,b'\xFF\xFF\xFF\x0BVK_SHADING_RATE_PALETTE_ENTRY_1_INVOCATION_PER_2X2_PIXELS_NV',8,b'\xFF\xFF\xFF\x0BVK_SHADING_RATE_PALETTE_ENTRY_1_INVOCATION_PER_2X4_PIXELS_NV',10,b'\xFF\xFF\xFF\x0BVK_SHADING_RATE_PALETTE_ENTRY_1_INVOCATION_PER_4X2_PIXELS_NV',9,b'\xFF\xFF\xFF\x0BVK_SHADING_RATE_PALETTE_ENTRY_1_INVOCATION_PER_4X4_PIXELS_NV',11,b'\xFF\xFF\xFF\x0BVK_SHADING_RATE_PALETTE_ENTRY_1_INVOCATION_PER_PIXEL_NV',5,b'\xFF\xFF\xFF\x0BVK_SHADING_RATE_PALETTE_ENTRY_2_INVOCATIONS_PER_PIXEL_NV',4,b'\xFF\xFF\xFF\x0BVK_SHADING_RATE_PALETTE_ENTRY_4_INVOCATIONS_PER_PIXEL_NV',3,b'\xFF\xFF\xFF\x0BVK_SHADING_RATE_PALETTE_ENTRY_8_INVOCATIONS_PER_PIXEL_NV',2,b'\xFF\xFF\xFF\x0BVK_SHADING_RATE_PALETTE_ENTRY_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_SHADING_RATE_PALETTE_ENTRY_NO_INVOCATIONS_NV',0,b'\xFF\xFF\xFF\x0BVK_SHARING_MODE_CONCURRENT',1,b'\xFF\xFF\xFF\x0BVK_SHARING_MODE_EXCLUSIVE',0,b'\xFF\xFF\xFF\x0BVK_SHARING_MODE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_SPARSE_IMAGE_FORMAT_ALIGNED_MIP_SIZE_BIT',2,b'\xFF\xFF\xFF\x0BVK_SPARSE_IMAGE_FORMAT_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_SPARSE_IMAGE_FORMAT_NONSTANDARD_BLOCK_SIZE_BIT',4,b'\xFF\xFF\xFF\x0BVK_SPARSE_IMAGE_FORMAT_SINGLE_MIPTAIL_BIT',1,b'\xFF\xFF\xFF\x0BVK_SPARSE_MEMORY_BIND_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_SPARSE_MEMORY_BIND_METADATA_BIT',1,b'\xFF\xFF\xFF\x0BVK_STENCIL_FACE_BACK_BIT',2,b'\xFF\xFF\xFF\x0BVK_STENCIL_FACE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_STENCIL_FACE_FRONT_AND_BACK',3,b'\xFF\xFF\xFF\x0BVK_STENCIL_FACE_FRONT_BIT',1,b'\xFF\xFF\xFF\x0BVK_STENCIL_FRONT_AND_BACK',3,b'\xFF\xFF\xFF\x0BVK_STENCIL_OP_DECREMENT_AND_CLAMP',4,b'\xFF\xFF\xFF\x0BVK_STENCIL_OP_DECREMENT_AND_WRAP',7,b'\xFF\xFF\xFF\x0BVK_STENCIL_OP_INCREMENT_AND_CLAMP',3,b'\xFF\xFF\xFF\x0BVK_STENCIL_OP_INCREMENT_AND_WRAP',6,b'\xFF\xFF\xFF\x0BVK_STENCIL_OP_INVERT',5,b'\xFF\xFF\xFF\x0BVK_STENCIL_OP_KEEP',0,b'\xFF\xFF\xFF\x0BVK_STENCIL_OP_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_STENCIL_OP_REPLACE',2,b'\xFF\xFF\xFF\x0BVK_STENCIL_OP_ZERO',1,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_BUILD_GEOMETRY_INFO_KHR',1000150000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_BUILD_SIZES_INFO_KHR',1000150020,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_CAPTURE_DESCRIPTOR_DATA_INFO_EXT',1000316009,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_CREATE_INFO_KHR',1000150017,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_CREATE_INFO_NV',1000165001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_DEVICE_ADDRESS_INFO_KHR',1000150002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_GEOMETRY_AABBS_DATA_KHR',1000150003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_GEOMETRY_INSTANCES_DATA_KHR',1000150004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_GEOMETRY_KHR',1000150006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_GEOMETRY_MOTION_TRIANGLES_DATA_NV',1000327000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_GEOMETRY_TRIANGLES_DATA_KHR',1000150005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_INFO_NV',1000165012,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_MEMORY_REQUIREMENTS_INFO_NV',1000165008,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_MOTION_INFO_NV',1000327002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_TRIANGLES_OPACITY_MICROMAP_EXT',1000396009,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_VERSION_INFO_KHR',1000150009,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ACQUIRE_NEXT_IMAGE_INFO_KHR',1000060010,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ACQUIRE_PROFILING_LOCK_INFO_KHR',1000116004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_AMIGO_PROFILING_SUBMIT_INFO_SEC',1000485001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ANDROID_HARDWARE_BUFFER_FORMAT_PROPERTIES_2_ANDROID',1000129006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ANDROID_HARDWARE_BUFFER_FORMAT_PROPERTIES_ANDROID',1000129002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ANDROID_HARDWARE_BUFFER_FORMAT_RESOLVE_PROPERTIES_ANDROID',1000468002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ANDROID_HARDWARE_BUFFER_PROPERTIES_ANDROID',1000129001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ANDROID_HARDWARE_BUFFER_USAGE_ANDROID',1000129000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ANDROID_SURFACE_CREATE_INFO_KHR',1000008000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_APPLICATION_INFO',0,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ATTACHMENT_DESCRIPTION_2',1000109000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ATTACHMENT_DESCRIPTION_2_KHR',1000109000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ATTACHMENT_DESCRIPTION_STENCIL_LAYOUT',1000241002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ATTACHMENT_DESCRIPTION_STENCIL_LAYOUT_KHR',1000241002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ATTACHMENT_REFERENCE_2',1000109001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ATTACHMENT_REFERENCE_2_KHR',1000109001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ATTACHMENT_REFERENCE_STENCIL_LAYOUT',1000241001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ATTACHMENT_REFERENCE_STENCIL_LAYOUT_KHR',1000241001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ATTACHMENT_SAMPLE_COUNT_INFO_AMD',1000044008,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_ATTACHMENT_SAMPLE_COUNT_INFO_NV',1000044008,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BIND_ACCELERATION_STRUCTURE_MEMORY_INFO_NV',1000165006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BIND_BUFFER_MEMORY_DEVICE_GROUP_INFO',1000060013,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BIND_BUFFER_MEMORY_DEVICE_GROUP_INFO_KHR',1000060013,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BIND_BUFFER_MEMORY_INFO',1000157000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BIND_BUFFER_MEMORY_INFO_KHR',1000157000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BIND_DESCRIPTOR_BUFFER_EMBEDDED_SAMPLERS_INFO_EXT',1000545008,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BIND_DESCRIPTOR_SETS_INFO_KHR',1000545003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BIND_IMAGE_MEMORY_DEVICE_GROUP_INFO',1000060014,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BIND_IMAGE_MEMORY_DEVICE_GROUP_INFO_KHR',1000060014,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BIND_IMAGE_MEMORY_INFO',1000157001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BIND_IMAGE_MEMORY_INFO_KHR',1000157001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BIND_IMAGE_MEMORY_SWAPCHAIN_INFO_KHR',1000060009,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BIND_IMAGE_PLANE_MEMORY_INFO',1000156002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BIND_IMAGE_PLANE_MEMORY_INFO_KHR',1000156002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BIND_MEMORY_STATUS_KHR',1000545002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BIND_SPARSE_INFO',7,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BIND_VIDEO_SESSION_MEMORY_INFO_KHR',1000023004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BLIT_IMAGE_CUBIC_WEIGHTS_INFO_QCOM',1000519002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BLIT_IMAGE_INFO_2',1000337004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BLIT_IMAGE_INFO_2_KHR',1000337004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_CAPTURE_DESCRIPTOR_DATA_INFO_EXT',1000316005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_COLLECTION_BUFFER_CREATE_INFO_FUCHSIA',1000366005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_COLLECTION_CONSTRAINTS_INFO_FUCHSIA',1000366009,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_COLLECTION_CREATE_INFO_FUCHSIA',1000366000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_COLLECTION_IMAGE_CREATE_INFO_FUCHSIA',1000366002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_COLLECTION_PROPERTIES_FUCHSIA',1000366003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_CONSTRAINTS_INFO_FUCHSIA',1000366004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_COPY_2',1000337006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_COPY_2_KHR',1000337006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_CREATE_INFO',12,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_DEVICE_ADDRESS_CREATE_INFO_EXT',1000244002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_DEVICE_ADDRESS_INFO',1000244001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_DEVICE_ADDRESS_INFO_EXT',1000244001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_DEVICE_ADDRESS_INFO_KHR',1000244001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_IMAGE_COPY_2',1000337009,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_IMAGE_COPY_2_KHR',1000337009,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_MEMORY_BARRIER',44,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_MEMORY_BARRIER_2',1000314001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_MEMORY_BARRIER_2_KHR',1000314001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_MEMORY_REQUIREMENTS_INFO_2',1000146000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_MEMORY_REQUIREMENTS_INFO_2_KHR',1000146000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_OPAQUE_CAPTURE_ADDRESS_CREATE_INFO',1000257002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_OPAQUE_CAPTURE_ADDRESS_CREATE_INFO_KHR',1000257002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_USAGE_FLAGS_2_CREATE_INFO_KHR',1000470006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_BUFFER_VIEW_CREATE_INFO',13,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_CALIBRATED_TIMESTAMP_INFO_EXT',1000184000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_CALIBRATED_TIMESTAMP_INFO_KHR',1000184000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_CHECKPOINT_DATA_2_NV',1000314009,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_CHECKPOINT_DATA_NV',1000206000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COMMAND_BUFFER_ALLOCATE_INFO',40,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COMMAND_BUFFER_BEGIN_INFO',42,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_CONDITIONAL_RENDERING_INFO_EXT',1000081000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_INFO',41,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_RENDERING_INFO',1000044004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_RENDERING_INFO_KHR',1000044004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_RENDER_PASS_TRANSFORM_INFO_QCOM',1000282000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_VIEWPORT_SCISSOR_INFO_NV',1000278001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COMMAND_BUFFER_SUBMIT_INFO',1000314006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COMMAND_BUFFER_SUBMIT_INFO_KHR',1000314006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COMMAND_POOL_CREATE_INFO',39,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COMPUTE_PIPELINE_CREATE_INFO',29,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COMPUTE_PIPELINE_INDIRECT_BUFFER_INFO_NV',1000428001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_CONDITIONAL_RENDERING_BEGIN_INFO_EXT',1000081002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COOPERATIVE_MATRIX_PROPERTIES_KHR',1000506001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COOPERATIVE_MATRIX_PROPERTIES_NV',1000249001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COPY_ACCELERATION_STRUCTURE_INFO_KHR',1000150010,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COPY_ACCELERATION_STRUCTURE_TO_MEMORY_INFO_KHR',1000150011,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COPY_BUFFER_INFO_2',1000337000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COPY_BUFFER_INFO_2_KHR',1000337000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COPY_BUFFER_TO_IMAGE_INFO_2',1000337002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COPY_BUFFER_TO_IMAGE_INFO_2_KHR',1000337002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COPY_COMMAND_TRANSFORM_INFO_QCOM',1000333000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COPY_DESCRIPTOR_SET',36,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COPY_IMAGE_INFO_2',1000337001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COPY_IMAGE_INFO_2_KHR',1000337001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COPY_IMAGE_TO_BUFFER_INFO_2',1000337003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COPY_IMAGE_TO_BUFFER_INFO_2_KHR',1000337003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COPY_IMAGE_TO_IMAGE_INFO_EXT',1000270007,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COPY_IMAGE_TO_MEMORY_INFO_EXT',1000270004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COPY_MEMORY_TO_ACCELERATION_STRUCTURE_INFO_KHR',1000150012,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COPY_MEMORY_TO_IMAGE_INFO_EXT',1000270005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COPY_MEMORY_TO_MICROMAP_INFO_EXT',1000396004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COPY_MICROMAP_INFO_EXT',1000396002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_COPY_MICROMAP_TO_MEMORY_INFO_EXT',1000396003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_CUDA_FUNCTION_CREATE_INFO_NV',1000307001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_CUDA_LAUNCH_INFO_NV',1000307002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_CUDA_MODULE_CREATE_INFO_NV',1000307000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_CU_FUNCTION_CREATE_INFO_NVX',1000029001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_CU_LAUNCH_INFO_NVX',1000029002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_CU_MODULE_CREATE_INFO_NVX',1000029000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_D3D12_FENCE_SUBMIT_INFO_KHR',1000078002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEBUG_MARKER_MARKER_INFO_EXT',1000022002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEBUG_MARKER_OBJECT_NAME_INFO_EXT',1000022000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEBUG_MARKER_OBJECT_TAG_INFO_EXT',1000022001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEBUG_REPORT_CALLBACK_CREATE_INFO_EXT',1000011000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEBUG_REPORT_CREATE_INFO_EXT',1000011000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEBUG_UTILS_LABEL_EXT',1000128002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEBUG_UTILS_MESSENGER_CALLBACK_DATA_EXT',1000128003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEBUG_UTILS_MESSENGER_CREATE_INFO_EXT',1000128004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEBUG_UTILS_OBJECT_NAME_INFO_EXT',1000128000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEBUG_UTILS_OBJECT_TAG_INFO_EXT',1000128001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEDICATED_ALLOCATION_BUFFER_CREATE_INFO_NV',1000026001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEDICATED_ALLOCATION_IMAGE_CREATE_INFO_NV',1000026000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEDICATED_ALLOCATION_MEMORY_ALLOCATE_INFO_NV',1000026002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEPENDENCY_INFO',1000314003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEPENDENCY_INFO_KHR',1000314003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEPTH_BIAS_INFO_EXT',1000283001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEPTH_BIAS_REPRESENTATION_INFO_EXT',1000283002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DESCRIPTOR_ADDRESS_INFO_EXT',1000316003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DESCRIPTOR_BUFFER_BINDING_INFO_EXT',1000316011,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DESCRIPTOR_BUFFER_BINDING_PUSH_DESCRIPTOR_BUFFER_HANDLE_EXT',1000316012,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DESCRIPTOR_GET_INFO_EXT',1000316004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DESCRIPTOR_POOL_CREATE_INFO',33,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DESCRIPTOR_POOL_INLINE_UNIFORM_BLOCK_CREATE_INFO',1000138003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DESCRIPTOR_POOL_INLINE_UNIFORM_BLOCK_CREATE_INFO_EXT',1000138003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DESCRIPTOR_SET_ALLOCATE_INFO',34,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DESCRIPTOR_SET_BINDING_REFERENCE_VALVE',1000420001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_BINDING_FLAGS_CREATE_INFO',1000161000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_BINDING_FLAGS_CREATE_INFO_EXT',1000161000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_CREATE_INFO',32,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_HOST_MAPPING_INFO_VALVE',1000420002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_SUPPORT',1000168001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_SUPPORT_KHR',1000168001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DESCRIPTOR_SET_VARIABLE_DESCRIPTOR_COUNT_ALLOCATE_INFO',1000161003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DESCRIPTOR_SET_VARIABLE_DESCRIPTOR_COUNT_ALLOCATE_INFO_EXT',1000161003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DESCRIPTOR_SET_VARIABLE_DESCRIPTOR_COUNT_LAYOUT_SUPPORT',1000161004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DESCRIPTOR_SET_VARIABLE_DESCRIPTOR_COUNT_LAYOUT_SUPPORT_EXT',1000161004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DESCRIPTOR_UPDATE_TEMPLATE_CREATE_INFO',1000085000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DESCRIPTOR_UPDATE_TEMPLATE_CREATE_INFO_KHR',1000085000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_ADDRESS_BINDING_CALLBACK_DATA_EXT',1000354001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_BUFFER_MEMORY_REQUIREMENTS',1000413002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_BUFFER_MEMORY_REQUIREMENTS_KHR',1000413002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_CREATE_INFO',3,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_DEVICE_MEMORY_REPORT_CREATE_INFO_EXT',1000284001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_DIAGNOSTICS_CONFIG_CREATE_INFO_NV',1000300001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_EVENT_INFO_EXT',1000091001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_FAULT_COUNTS_EXT',1000341001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_FAULT_INFO_EXT',1000341002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_GROUP_BIND_SPARSE_INFO',1000060006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_GROUP_BIND_SPARSE_INFO_KHR',1000060006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_GROUP_COMMAND_BUFFER_BEGIN_INFO',1000060004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_GROUP_COMMAND_BUFFER_BEGIN_INFO_KHR',1000060004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_GROUP_DEVICE_CREATE_INFO',1000070001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_GROUP_DEVICE_CREATE_INFO_KHR',1000070001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_GROUP_PRESENT_CAPABILITIES_KHR',1000060007,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_GROUP_PRESENT_INFO_KHR',1000060011,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_GROUP_RENDER_PASS_BEGIN_INFO',1000060003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_GROUP_RENDER_PASS_BEGIN_INFO_KHR',1000060003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_GROUP_SUBMIT_INFO',1000060005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_GROUP_SUBMIT_INFO_KHR',1000060005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_GROUP_SWAPCHAIN_CREATE_INFO_KHR',1000060012,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_IMAGE_MEMORY_REQUIREMENTS',1000413003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_IMAGE_MEMORY_REQUIREMENTS_KHR',1000413003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_IMAGE_SUBRESOURCE_INFO_KHR',1000470004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_MEMORY_OPAQUE_CAPTURE_ADDRESS_INFO',1000257004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_MEMORY_OPAQUE_CAPTURE_ADDRESS_INFO_KHR',1000257004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_MEMORY_OVERALLOCATION_CREATE_INFO_AMD',1000189000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_MEMORY_REPORT_CALLBACK_DATA_EXT',1000284002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_PRIVATE_DATA_CREATE_INFO',1000295001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_PRIVATE_DATA_CREATE_INFO_EXT',1000295001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_QUEUE_CREATE_INFO',2,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_QUEUE_GLOBAL_PRIORITY_CREATE_INFO_EXT',1000174000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_QUEUE_GLOBAL_PRIORITY_CREATE_INFO_KHR',1000174000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_QUEUE_INFO_2',1000145003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DEVICE_QUEUE_SHADER_CORE_CONTROL_CREATE_INFO_ARM',1000417000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DIRECTFB_SURFACE_CREATE_INFO_EXT',1000346000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DIRECT_DRIVER_LOADING_INFO_LUNARG',1000459000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DIRECT_DRIVER_LOADING_LIST_LUNARG',1000459001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DISPLAY_EVENT_INFO_EXT',1000091002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DISPLAY_MODE_CREATE_INFO_KHR',1000002000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DISPLAY_MODE_PROPERTIES_2_KHR',1000121002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DISPLAY_NATIVE_HDR_SURFACE_CAPABILITIES_AMD',1000213000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DISPLAY_PLANE_CAPABILITIES_2_KHR',1000121004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DISPLAY_PLANE_INFO_2_KHR',1000121003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DISPLAY_PLANE_PROPERTIES_2_KHR',1000121001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DISPLAY_POWER_INFO_EXT',1000091000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DISPLAY_PRESENT_INFO_KHR',1000003000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DISPLAY_PROPERTIES_2_KHR',1000121000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DISPLAY_SURFACE_CREATE_INFO_KHR',1000002001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DRM_FORMAT_MODIFIER_PROPERTIES_LIST_2_EXT',1000158006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_DRM_FORMAT_MODIFIER_PROPERTIES_LIST_EXT',1000158000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EVENT_CREATE_INFO',10,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXPORT_FENCE_CREATE_INFO',1000113000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXPORT_FENCE_CREATE_INFO_KHR',1000113000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXPORT_FENCE_WIN32_HANDLE_INFO_KHR',1000114001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXPORT_MEMORY_ALLOCATE_INFO',1000072002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXPORT_MEMORY_ALLOCATE_INFO_KHR',1000072002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXPORT_MEMORY_ALLOCATE_INFO_NV',1000056001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXPORT_MEMORY_WIN32_HANDLE_INFO_KHR',1000073001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXPORT_MEMORY_WIN32_HANDLE_INFO_NV',1000057001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXPORT_METAL_BUFFER_INFO_EXT',1000311004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXPORT_METAL_COMMAND_QUEUE_INFO_EXT',1000311003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXPORT_METAL_DEVICE_INFO_EXT',1000311002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXPORT_METAL_IO_SURFACE_INFO_EXT',1000311008,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXPORT_METAL_OBJECTS_INFO_EXT',1000311001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXPORT_METAL_OBJECT_CREATE_INFO_EXT',1000311000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXPORT_METAL_SHARED_EVENT_INFO_EXT',1000311010,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXPORT_METAL_TEXTURE_INFO_EXT',1000311006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXPORT_SEMAPHORE_CREATE_INFO',1000077000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXPORT_SEMAPHORE_CREATE_INFO_KHR',1000077000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXPORT_SEMAPHORE_WIN32_HANDLE_INFO_KHR',1000078001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXTERNAL_BUFFER_PROPERTIES',1000071003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXTERNAL_BUFFER_PROPERTIES_KHR',1000071003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXTERNAL_FENCE_PROPERTIES',1000112001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXTERNAL_FENCE_PROPERTIES_KHR',1000112001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXTERNAL_FORMAT_ANDROID',1000129005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXTERNAL_FORMAT_QNX',1000529003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXTERNAL_IMAGE_FORMAT_PROPERTIES',1000071001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXTERNAL_IMAGE_FORMAT_PROPERTIES_KHR',1000071001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXTERNAL_MEMORY_ACQUIRE_UNMODIFIED_EXT',1000453000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXTERNAL_MEMORY_BUFFER_CREATE_INFO',1000072000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXTERNAL_MEMORY_BUFFER_CREATE_INFO_KHR',1000072000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXTERNAL_MEMORY_IMAGE_CREATE_INFO',1000072001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXTERNAL_MEMORY_IMAGE_CREATE_INFO_KHR',1000072001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXTERNAL_MEMORY_IMAGE_CREATE_INFO_NV',1000056000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXTERNAL_SEMAPHORE_PROPERTIES',1000076001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_EXTERNAL_SEMAPHORE_PROPERTIES_KHR',1000076001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_FENCE_CREATE_INFO',8,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_FENCE_GET_FD_INFO_KHR',1000115001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_FENCE_GET_WIN32_HANDLE_INFO_KHR',1000114002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_FILTER_CUBIC_IMAGE_VIEW_IMAGE_FORMAT_PROPERTIES_EXT',1000170001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_FORMAT_PROPERTIES_2',1000059002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_FORMAT_PROPERTIES_2_KHR',1000059002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_FORMAT_PROPERTIES_3',1000360000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_FORMAT_PROPERTIES_3_KHR',1000360000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_FRAGMENT_SHADING_RATE_ATTACHMENT_INFO_KHR',1000226000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_FRAMEBUFFER_ATTACHMENTS_CREATE_INFO',1000108001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_FRAMEBUFFER_ATTACHMENTS_CREATE_INFO_KHR',1000108001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_FRAMEBUFFER_ATTACHMENT_IMAGE_INFO',1000108002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_FRAMEBUFFER_ATTACHMENT_IMAGE_INFO_KHR',1000108002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_FRAMEBUFFER_CREATE_INFO',37,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_FRAMEBUFFER_MIXED_SAMPLES_COMBINATION_NV',1000250002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_FRAME_BOUNDARY_EXT',1000375001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_GENERATED_COMMANDS_INFO_NV',1000277005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_GENERATED_COMMANDS_MEMORY_REQUIREMENTS_INFO_NV',1000277006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_GEOMETRY_AABB_NV',1000165005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_GEOMETRY_NV',1000165003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_GEOMETRY_TRIANGLES_NV',1000165004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_GET_LATENCY_MARKER_INFO_NV',1000505003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_GRAPHICS_PIPELINE_CREATE_INFO',28,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_GRAPHICS_PIPELINE_LIBRARY_CREATE_INFO_EXT',1000320002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_GRAPHICS_PIPELINE_SHADER_GROUPS_CREATE_INFO_NV',1000277002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_GRAPHICS_SHADER_GROUP_CREATE_INFO_NV',1000277001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_HDR_METADATA_EXT',1000105000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_HEADLESS_SURFACE_CREATE_INFO_EXT',1000256000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_HOST_IMAGE_COPY_DEVICE_PERFORMANCE_QUERY_EXT',1000270009,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_HOST_IMAGE_LAYOUT_TRANSITION_INFO_EXT',1000270006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGEPIPE_SURFACE_CREATE_INFO_FUCHSIA',1000214000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_BLIT_2',1000337008,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_BLIT_2_KHR',1000337008,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_CAPTURE_DESCRIPTOR_DATA_INFO_EXT',1000316006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_COMPRESSION_CONTROL_EXT',1000338001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_COMPRESSION_PROPERTIES_EXT',1000338004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_CONSTRAINTS_INFO_FUCHSIA',1000366006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_COPY_2',1000337007,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_COPY_2_KHR',1000337007,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_CREATE_INFO',14,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_DRM_FORMAT_MODIFIER_EXPLICIT_CREATE_INFO_EXT',1000158004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_DRM_FORMAT_MODIFIER_LIST_CREATE_INFO_EXT',1000158003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_DRM_FORMAT_MODIFIER_PROPERTIES_EXT',1000158005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_FORMAT_CONSTRAINTS_INFO_FUCHSIA',1000366007,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_FORMAT_LIST_CREATE_INFO',1000147000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_FORMAT_LIST_CREATE_INFO_KHR',1000147000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_FORMAT_PROPERTIES_2',1000059003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_FORMAT_PROPERTIES_2_KHR',1000059003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_MEMORY_BARRIER',45,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_MEMORY_BARRIER_2',1000314002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_MEMORY_BARRIER_2_KHR',1000314002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_MEMORY_REQUIREMENTS_INFO_2',1000146001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_MEMORY_REQUIREMENTS_INFO_2_KHR',1000146001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_PLANE_MEMORY_REQUIREMENTS_INFO',1000156003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_PLANE_MEMORY_REQUIREMENTS_INFO_KHR',1000156003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_RESOLVE_2',1000337010,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_RESOLVE_2_KHR',1000337010,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_SPARSE_MEMORY_REQUIREMENTS_INFO_2',1000146002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_SPARSE_MEMORY_REQUIREMENTS_INFO_2_KHR',1000146002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_STENCIL_USAGE_CREATE_INFO',1000246000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_STENCIL_USAGE_CREATE_INFO_EXT',1000246000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_SUBRESOURCE_2_EXT',1000338003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_SUBRESOURCE_2_KHR',1000338003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_SWAPCHAIN_CREATE_INFO_KHR',1000060008,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_TO_MEMORY_COPY_EXT',1000270003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_VIEW_ADDRESS_PROPERTIES_NVX',1000030001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_VIEW_ASTC_DECODE_MODE_EXT',1000067000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_VIEW_CAPTURE_DESCRIPTOR_DATA_INFO_EXT',1000316007,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_VIEW_CREATE_INFO',15,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_VIEW_HANDLE_INFO_NVX',1000030000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_VIEW_MIN_LOD_CREATE_INFO_EXT',1000391001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_VIEW_SAMPLE_WEIGHT_CREATE_INFO_QCOM',1000440002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_VIEW_SLICED_CREATE_INFO_EXT',1000418001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_VIEW_USAGE_CREATE_INFO',1000117002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMAGE_VIEW_USAGE_CREATE_INFO_KHR',1000117002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMPORT_ANDROID_HARDWARE_BUFFER_INFO_ANDROID',1000129003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMPORT_FENCE_FD_INFO_KHR',1000115000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMPORT_FENCE_WIN32_HANDLE_INFO_KHR',1000114000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMPORT_MEMORY_BUFFER_COLLECTION_FUCHSIA',1000366001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMPORT_MEMORY_FD_INFO_KHR',1000074000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMPORT_MEMORY_HOST_POINTER_INFO_EXT',1000178000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMPORT_MEMORY_WIN32_HANDLE_INFO_KHR',1000073000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMPORT_MEMORY_WIN32_HANDLE_INFO_NV',1000057000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMPORT_MEMORY_ZIRCON_HANDLE_INFO_FUCHSIA',1000364000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMPORT_METAL_BUFFER_INFO_EXT',1000311005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMPORT_METAL_IO_SURFACE_INFO_EXT',1000311009,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMPORT_METAL_SHARED_EVENT_INFO_EXT',1000311011,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMPORT_METAL_TEXTURE_INFO_EXT',1000311007,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMPORT_SCREEN_BUFFER_INFO_QNX',1000529002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMPORT_SEMAPHORE_FD_INFO_KHR',1000079000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMPORT_SEMAPHORE_WIN32_HANDLE_INFO_KHR',1000078000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IMPORT_SEMAPHORE_ZIRCON_HANDLE_INFO_FUCHSIA',1000365000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_INDIRECT_COMMANDS_LAYOUT_CREATE_INFO_NV',1000277004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_INDIRECT_COMMANDS_LAYOUT_TOKEN_NV',1000277003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_INITIALIZE_PERFORMANCE_API_INFO_INTEL',1000210001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_INSTANCE_CREATE_INFO',1,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_IOS_SURFACE_CREATE_INFO_MVK',1000122000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_LATENCY_SLEEP_INFO_NV',1000505001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_LATENCY_SLEEP_MODE_INFO_NV',1000505000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_LATENCY_SUBMISSION_PRESENT_ID_NV',1000505005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_LATENCY_SURFACE_CAPABILITIES_NV',1000505008,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_LATENCY_TIMINGS_FRAME_REPORT_NV',1000505004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_LAYER_SETTINGS_CREATE_INFO_EXT',1000496000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_LOADER_DEVICE_CREATE_INFO',48,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_LOADER_INSTANCE_CREATE_INFO',47,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MACOS_SURFACE_CREATE_INFO_MVK',1000123000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MAPPED_MEMORY_RANGE',6,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_ALLOCATE_FLAGS_INFO',1000060000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_ALLOCATE_FLAGS_INFO_KHR',1000060000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_ALLOCATE_INFO',5,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_BARRIER',46,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_BARRIER_2',1000314000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_BARRIER_2_KHR',1000314000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_DEDICATED_ALLOCATE_INFO',1000127001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_DEDICATED_ALLOCATE_INFO_KHR',1000127001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_DEDICATED_REQUIREMENTS',1000127000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_DEDICATED_REQUIREMENTS_KHR',1000127000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_FD_PROPERTIES_KHR',1000074001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_GET_ANDROID_HARDWARE_BUFFER_INFO_ANDROID',1000129004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_GET_FD_INFO_KHR',1000074002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_GET_REMOTE_ADDRESS_INFO_NV',1000371000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_GET_WIN32_HANDLE_INFO_KHR',1000073003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_GET_ZIRCON_HANDLE_INFO_FUCHSIA',1000364002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_HOST_POINTER_PROPERTIES_EXT',1000178001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_MAP_INFO_KHR',1000271000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_OPAQUE_CAPTURE_ADDRESS_ALLOCATE_INFO',1000257003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_OPAQUE_CAPTURE_ADDRESS_ALLOCATE_INFO_KHR',1000257003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_PRIORITY_ALLOCATE_INFO_EXT',1000238001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_REQUIREMENTS_2',1000146003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_REQUIREMENTS_2_KHR',1000146003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_TO_IMAGE_COPY_EXT',1000270002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_UNMAP_INFO_KHR',1000271001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_WIN32_HANDLE_PROPERTIES_KHR',1000073002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MEMORY_ZIRCON_HANDLE_PROPERTIES_FUCHSIA',1000364001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_METAL_SURFACE_CREATE_INFO_EXT',1000217000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MICROMAP_BUILD_INFO_EXT',1000396000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MICROMAP_BUILD_SIZES_INFO_EXT',1000396008,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MICROMAP_CREATE_INFO_EXT',1000396007,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MICROMAP_VERSION_INFO_EXT',1000396001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MULTISAMPLED_RENDER_TO_SINGLE_SAMPLED_INFO_EXT',1000376002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MULTISAMPLE_PROPERTIES_EXT',1000143004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MULTIVIEW_PER_VIEW_ATTRIBUTES_INFO_NVX',1000044009,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MULTIVIEW_PER_VIEW_RENDER_AREAS_RENDER_PASS_BEGIN_INFO_QCOM',1000510001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MUTABLE_DESCRIPTOR_TYPE_CREATE_INFO_EXT',1000351002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_MUTABLE_DESCRIPTOR_TYPE_CREATE_INFO_VALVE',1000351002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_OPAQUE_CAPTURE_DESCRIPTOR_DATA_CREATE_INFO_EXT',1000316010,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_OPTICAL_FLOW_EXECUTE_INFO_NV',1000464005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_OPTICAL_FLOW_IMAGE_FORMAT_INFO_NV',1000464002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_OPTICAL_FLOW_IMAGE_FORMAT_PROPERTIES_NV',1000464003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_OPTICAL_FLOW_SESSION_CREATE_INFO_NV',1000464004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_OPTICAL_FLOW_SESSION_CREATE_PRIVATE_DATA_INFO_NV',1000464010,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_OUT_OF_BAND_QUEUE_TYPE_INFO_NV',1000505006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PERFORMANCE_CONFIGURATION_ACQUIRE_INFO_INTEL',1000210005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PERFORMANCE_COUNTER_DESCRIPTION_KHR',1000116006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PERFORMANCE_COUNTER_KHR',1000116005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PERFORMANCE_MARKER_INFO_INTEL',1000210002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PERFORMANCE_OVERRIDE_INFO_INTEL',1000210004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PERFORMANCE_QUERY_SUBMIT_INFO_KHR',1000116003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PERFORMANCE_STREAM_MARKER_INFO_INTEL',1000210003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_16BIT_STORAGE_FEATURES',1000083000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_16BIT_STORAGE_FEATURES_KHR',1000083000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_4444_FORMATS_FEATURES_EXT',1000340000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_8BIT_STORAGE_FEATURES',1000177000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_8BIT_STORAGE_FEATURES_KHR',1000177000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ACCELERATION_STRUCTURE_FEATURES_KHR',1000150013,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ACCELERATION_STRUCTURE_PROPERTIES_KHR',1000150014,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ADDRESS_BINDING_REPORT_FEATURES_EXT',1000354000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_AMIGO_PROFILING_FEATURES_SEC',1000485000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ASTC_DECODE_FEATURES_EXT',1000067001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ATTACHMENT_FEEDBACK_LOOP_DYNAMIC_STATE_FEATURES_EXT',1000524000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ATTACHMENT_FEEDBACK_LOOP_LAYOUT_FEATURES_EXT',1000339000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_BLEND_OPERATION_ADVANCED_FEATURES_EXT',1000148000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_BLEND_OPERATION_ADVANCED_PROPERTIES_EXT',1000148001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_BORDER_COLOR_SWIZZLE_FEATURES_EXT',1000411000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_BUFFER_ADDRESS_FEATURES_EXT',1000244000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_BUFFER_DEVICE_ADDRESS_FEATURES',1000257000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_BUFFER_DEVICE_ADDRESS_FEATURES_EXT',1000244000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_BUFFER_DEVICE_ADDRESS_FEATURES_KHR',1000257000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CLUSTER_CULLING_SHADER_FEATURES_HUAWEI',1000404000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CLUSTER_CULLING_SHADER_PROPERTIES_HUAWEI',1000404001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CLUSTER_CULLING_SHADER_VRS_FEATURES_HUAWEI',1000404002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COHERENT_MEMORY_FEATURES_AMD',1000229000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COLOR_WRITE_ENABLE_FEATURES_EXT',1000381000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COMPUTE_SHADER_DERIVATIVES_FEATURES_NV',1000201000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CONDITIONAL_RENDERING_FEATURES_EXT',1000081001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CONSERVATIVE_RASTERIZATION_PROPERTIES_EXT',1000101000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COOPERATIVE_MATRIX_FEATURES_KHR',1000506000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COOPERATIVE_MATRIX_FEATURES_NV',1000249000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COOPERATIVE_MATRIX_PROPERTIES_KHR',1000506002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COOPERATIVE_MATRIX_PROPERTIES_NV',1000249002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COPY_MEMORY_INDIRECT_FEATURES_NV',1000426000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COPY_MEMORY_INDIRECT_PROPERTIES_NV',1000426001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CORNER_SAMPLED_IMAGE_FEATURES_NV',1000050000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COVERAGE_REDUCTION_MODE_FEATURES_NV',1000250000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CUBIC_CLAMP_FEATURES_QCOM',1000521000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CUBIC_WEIGHTS_FEATURES_QCOM',1000519001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CUDA_KERNEL_LAUNCH_FEATURES_NV',1000307003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CUDA_KERNEL_LAUNCH_PROPERTIES_NV',1000307004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CUSTOM_BORDER_COLOR_FEATURES_EXT',1000287002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CUSTOM_BORDER_COLOR_PROPERTIES_EXT',1000287001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEDICATED_ALLOCATION_IMAGE_ALIASING_FEATURES_NV',1000240000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEPTH_BIAS_CONTROL_FEATURES_EXT',1000283000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEPTH_CLAMP_ZERO_ONE_FEATURES_EXT',1000421000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEPTH_CLIP_CONTROL_FEATURES_EXT',1000355000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEPTH_CLIP_ENABLE_FEATURES_EXT',1000102000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEPTH_STENCIL_RESOLVE_PROPERTIES',1000199000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEPTH_STENCIL_RESOLVE_PROPERTIES_KHR',1000199000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_DENSITY_MAP_PROPERTIES_EXT',1000316001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_FEATURES_EXT',1000316002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_PROPERTIES_EXT',1000316000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_INDEXING_FEATURES',1000161001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_INDEXING_FEATURES_EXT',1000161001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_INDEXING_PROPERTIES',1000161002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_INDEXING_PROPERTIES_EXT',1000161002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_POOL_OVERALLOCATION_FEATURES_NV',1000546000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_SET_HOST_MAPPING_FEATURES_VALVE',1000420000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_COMPUTE_FEATURES_NV',1000428000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_FEATURES_NV',1000277007,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_PROPERTIES_NV',1000277000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEVICE_MEMORY_REPORT_FEATURES_EXT',1000284000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DIAGNOSTICS_CONFIG_FEATURES_NV',1000300000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DISCARD_RECTANGLE_PROPERTIES_EXT',1000099000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DRIVER_PROPERTIES',1000196000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DRIVER_PROPERTIES_KHR',1000196000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DRM_PROPERTIES_EXT',1000353000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DYNAMIC_RENDERING_FEATURES',1000044003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DYNAMIC_RENDERING_FEATURES_KHR',1000044003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DYNAMIC_RENDERING_UNUSED_ATTACHMENTS_FEATURES_EXT',1000499000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXCLUSIVE_SCISSOR_FEATURES_NV',1000205002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_2_FEATURES_EXT',1000377000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_3_FEATURES_EXT',1000455000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_3_PROPERTIES_EXT',1000455001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_FEATURES_EXT',1000267000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTENDED_SPARSE_ADDRESS_SPACE_FEATURES_NV',1000492000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTENDED_SPARSE_ADDRESS_SPACE_PROPERTIES_NV',1000492001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_BUFFER_INFO',1000071002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_BUFFER_INFO_KHR',1000071002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_FENCE_INFO',1000112000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_FENCE_INFO_KHR',1000112000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_FORMAT_RESOLVE_FEATURES_ANDROID',1000468000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_FORMAT_RESOLVE_PROPERTIES_ANDROID',1000468001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_IMAGE_FORMAT_INFO',1000071000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_IMAGE_FORMAT_INFO_KHR',1000071000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_MEMORY_HOST_PROPERTIES_EXT',1000178002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_MEMORY_RDMA_FEATURES_NV',1000371001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_MEMORY_SCREEN_BUFFER_FEATURES_QNX',1000529004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_SEMAPHORE_INFO',1000076000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_SEMAPHORE_INFO_KHR',1000076000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FAULT_FEATURES_EXT',1000341000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2',1000059000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2_KHR',1000059000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FLOAT16_INT8_FEATURES_KHR',1000082000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FLOAT_CONTROLS_PROPERTIES',1000197000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FLOAT_CONTROLS_PROPERTIES_KHR',1000197000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_2_FEATURES_EXT',1000332000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_2_PROPERTIES_EXT',1000332001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_FEATURES_EXT',1000218000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_OFFSET_FEATURES_QCOM',1000425000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_OFFSET_PROPERTIES_QCOM',1000425001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_PROPERTIES_EXT',1000218001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADER_BARYCENTRIC_FEATURES_KHR',1000203000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADER_BARYCENTRIC_FEATURES_NV',1000203000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADER_BARYCENTRIC_PROPERTIES_KHR',1000322000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADER_INTERLOCK_FEATURES_EXT',1000251000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_ENUMS_FEATURES_NV',1000326001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_ENUMS_PROPERTIES_NV',1000326000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_FEATURES_KHR',1000226003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_KHR',1000226004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_PROPERTIES_KHR',1000226002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAME_BOUNDARY_FEATURES_EXT',1000375000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_GLOBAL_PRIORITY_QUERY_FEATURES_EXT',1000388000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_GLOBAL_PRIORITY_QUERY_FEATURES_KHR',1000388000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_GRAPHICS_PIPELINE_LIBRARY_FEATURES_EXT',1000320000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_GRAPHICS_PIPELINE_LIBRARY_PROPERTIES_EXT',1000320001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_GROUP_PROPERTIES',1000070000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_GROUP_PROPERTIES_KHR',1000070000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_HOST_IMAGE_COPY_FEATURES_EXT',1000270000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_HOST_IMAGE_COPY_PROPERTIES_EXT',1000270001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_HOST_QUERY_RESET_FEATURES',1000261000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_HOST_QUERY_RESET_FEATURES_EXT',1000261000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ID_PROPERTIES',1000071004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ID_PROPERTIES_KHR',1000071004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGELESS_FRAMEBUFFER_FEATURES',1000108000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGELESS_FRAMEBUFFER_FEATURES_KHR',1000108000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_2D_VIEW_OF_3D_FEATURES_EXT',1000393000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_COMPRESSION_CONTROL_FEATURES_EXT',1000338000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_COMPRESSION_CONTROL_SWAPCHAIN_FEATURES_EXT',1000437000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_DRM_FORMAT_MODIFIER_INFO_EXT',1000158002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_FORMAT_INFO_2',1000059004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_FORMAT_INFO_2_KHR',1000059004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_PROCESSING_2_FEATURES_QCOM',1000518000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_PROCESSING_2_PROPERTIES_QCOM',1000518001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_PROCESSING_FEATURES_QCOM',1000440000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_PROCESSING_PROPERTIES_QCOM',1000440001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_ROBUSTNESS_FEATURES',1000335000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_ROBUSTNESS_FEATURES_EXT',1000335000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_SLICED_VIEW_OF_3D_FEATURES_EXT',1000418000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_VIEW_IMAGE_FORMAT_INFO_EXT',1000170000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_VIEW_MIN_LOD_FEATURES_EXT',1000391000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_INDEX_TYPE_UINT8_FEATURES_EXT',1000265000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_INHERITED_VIEWPORT_SCISSOR_FEATURES_NV',1000278000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_INLINE_UNIFORM_BLOCK_FEATURES',1000138000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_INLINE_UNIFORM_BLOCK_FEATURES_EXT',1000138000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_INLINE_UNIFORM_BLOCK_PROPERTIES',1000138001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_INLINE_UNIFORM_BLOCK_PROPERTIES_EXT',1000138001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_INVOCATION_MASK_FEATURES_HUAWEI',1000370000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_LAYERED_DRIVER_PROPERTIES_MSFT',1000530000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_LEGACY_DITHERING_FEATURES_EXT',1000465000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_LINEAR_COLOR_ATTACHMENT_FEATURES_NV',1000430000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_LINE_RASTERIZATION_FEATURES_EXT',1000259000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_LINE_RASTERIZATION_PROPERTIES_EXT',1000259002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_3_PROPERTIES',1000168000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_3_PROPERTIES_KHR',1000168000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_4_FEATURES',1000413000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_4_FEATURES_KHR',1000413000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_4_PROPERTIES',1000413001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_4_PROPERTIES_KHR',1000413001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_5_FEATURES_KHR',1000470000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_5_PROPERTIES_KHR',1000470001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_6_FEATURES_KHR',1000545000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_6_PROPERTIES_KHR',1000545001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MEMORY_BUDGET_PROPERTIES_EXT',1000237000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MEMORY_DECOMPRESSION_FEATURES_NV',1000427000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MEMORY_DECOMPRESSION_PROPERTIES_NV',1000427001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MEMORY_PRIORITY_FEATURES_EXT',1000238000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MEMORY_PROPERTIES_2',1000059006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MEMORY_PROPERTIES_2_KHR',1000059006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MESH_SHADER_FEATURES_EXT',1000328000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MESH_SHADER_FEATURES_NV',1000202000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MESH_SHADER_PROPERTIES_EXT',1000328001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MESH_SHADER_PROPERTIES_NV',1000202001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTISAMPLED_RENDER_TO_SINGLE_SAMPLED_FEATURES_EXT',1000376000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTIVIEW_FEATURES',1000053001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTIVIEW_FEATURES_KHR',1000053001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTIVIEW_PER_VIEW_ATTRIBUTES_PROPERTIES_NVX',1000097000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTIVIEW_PER_VIEW_RENDER_AREAS_FEATURES_QCOM',1000510000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTIVIEW_PER_VIEW_VIEWPORTS_FEATURES_QCOM',1000488000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTIVIEW_PROPERTIES',1000053002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTIVIEW_PROPERTIES_KHR',1000053002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTI_DRAW_FEATURES_EXT',1000392000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTI_DRAW_PROPERTIES_EXT',1000392001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MUTABLE_DESCRIPTOR_TYPE_FEATURES_EXT',1000351000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MUTABLE_DESCRIPTOR_TYPE_FEATURES_VALVE',1000351000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_NESTED_COMMAND_BUFFER_FEATURES_EXT',1000451000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_NESTED_COMMAND_BUFFER_PROPERTIES_EXT',1000451001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_NON_SEAMLESS_CUBE_MAP_FEATURES_EXT',1000422000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_OPACITY_MICROMAP_FEATURES_EXT',1000396005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_OPACITY_MICROMAP_PROPERTIES_EXT',1000396006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_OPTICAL_FLOW_FEATURES_NV',1000464000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_OPTICAL_FLOW_PROPERTIES_NV',1000464001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PAGEABLE_DEVICE_LOCAL_MEMORY_FEATURES_EXT',1000412000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PCI_BUS_INFO_PROPERTIES_EXT',1000212000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PERFORMANCE_QUERY_FEATURES_KHR',1000116000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PERFORMANCE_QUERY_PROPERTIES_KHR',1000116001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PER_STAGE_DESCRIPTOR_SET_FEATURES_NV',1000516000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PIPELINE_CREATION_CACHE_CONTROL_FEATURES',1000297000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PIPELINE_CREATION_CACHE_CONTROL_FEATURES_EXT',1000297000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PIPELINE_EXECUTABLE_PROPERTIES_FEATURES_KHR',1000269000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PIPELINE_LIBRARY_GROUP_HANDLES_FEATURES_EXT',1000498000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PIPELINE_PROPERTIES_FEATURES_EXT',1000372001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PIPELINE_PROTECTED_ACCESS_FEATURES_EXT',1000466000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PIPELINE_ROBUSTNESS_FEATURES_EXT',1000068001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PIPELINE_ROBUSTNESS_PROPERTIES_EXT',1000068002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_POINT_CLIPPING_PROPERTIES',1000117000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_POINT_CLIPPING_PROPERTIES_KHR',1000117000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PRESENT_BARRIER_FEATURES_NV',1000292000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PRESENT_ID_FEATURES_KHR',1000294001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PRESENT_WAIT_FEATURES_KHR',1000248000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PRIMITIVES_GENERATED_QUERY_FEATURES_EXT',1000382000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PRIMITIVE_TOPOLOGY_LIST_RESTART_FEATURES_EXT',1000356000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PRIVATE_DATA_FEATURES',1000295000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PRIVATE_DATA_FEATURES_EXT',1000295000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PROPERTIES_2',1000059001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PROPERTIES_2_KHR',1000059001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PROTECTED_MEMORY_FEATURES',1000145001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PROTECTED_MEMORY_PROPERTIES',1000145002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PROVOKING_VERTEX_FEATURES_EXT',1000254000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PROVOKING_VERTEX_PROPERTIES_EXT',1000254002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PUSH_DESCRIPTOR_PROPERTIES_KHR',1000080000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RASTERIZATION_ORDER_ATTACHMENT_ACCESS_FEATURES_ARM',1000342000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RASTERIZATION_ORDER_ATTACHMENT_ACCESS_FEATURES_EXT',1000342000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_QUERY_FEATURES_KHR',1000348013,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_INVOCATION_REORDER_FEATURES_NV',1000490000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_INVOCATION_REORDER_PROPERTIES_NV',1000490001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_MAINTENANCE_1_FEATURES_KHR',1000386000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_MOTION_BLUR_FEATURES_NV',1000327001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_PIPELINE_FEATURES_KHR',1000347000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_PIPELINE_PROPERTIES_KHR',1000347001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_POSITION_FETCH_FEATURES_KHR',1000481000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_PROPERTIES_NV',1000165009,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RELAXED_LINE_RASTERIZATION_FEATURES_IMG',1000110000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RENDER_PASS_STRIPED_FEATURES_ARM',1000424000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RENDER_PASS_STRIPED_PROPERTIES_ARM',1000424001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_REPRESENTATIVE_FRAGMENT_TEST_FEATURES_NV',1000166000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RGBA10X6_FORMATS_FEATURES_EXT',1000344000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ROBUSTNESS_2_FEATURES_EXT',1000286000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ROBUSTNESS_2_PROPERTIES_EXT',1000286001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SAMPLER_FILTER_MINMAX_PROPERTIES',1000130000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SAMPLER_FILTER_MINMAX_PROPERTIES_EXT',1000130000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SAMPLER_YCBCR_CONVERSION_FEATURES',1000156004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SAMPLER_YCBCR_CONVERSION_FEATURES_KHR',1000156004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SAMPLE_LOCATIONS_PROPERTIES_EXT',1000143003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SCALAR_BLOCK_LAYOUT_FEATURES',1000221000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SCALAR_BLOCK_LAYOUT_FEATURES_EXT',1000221000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SCHEDULING_CONTROLS_FEATURES_ARM',1000417001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SCHEDULING_CONTROLS_PROPERTIES_ARM',1000417002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SEPARATE_DEPTH_STENCIL_LAYOUTS_FEATURES',1000241000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SEPARATE_DEPTH_STENCIL_LAYOUTS_FEATURES_KHR',1000241000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_ATOMIC_FLOAT_2_FEATURES_EXT',1000273000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_ATOMIC_FLOAT_FEATURES_EXT',1000260000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_ATOMIC_INT64_FEATURES',1000180000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_ATOMIC_INT64_FEATURES_KHR',1000180000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_CLOCK_FEATURES_KHR',1000181000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_CORE_BUILTINS_FEATURES_ARM',1000497000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_CORE_BUILTINS_PROPERTIES_ARM',1000497001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_CORE_PROPERTIES_2_AMD',1000227000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_CORE_PROPERTIES_AMD',1000185000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_CORE_PROPERTIES_ARM',1000415000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_DEMOTE_TO_HELPER_INVOCATION_FEATURES',1000276000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_DEMOTE_TO_HELPER_INVOCATION_FEATURES_EXT',1000276000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_DRAW_PARAMETERS_FEATURES',1000063000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_DRAW_PARAMETER_FEATURES',1000063000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_EARLY_AND_LATE_FRAGMENT_TESTS_FEATURES_AMD',1000321000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_FLOAT16_INT8_FEATURES',1000082000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_FLOAT16_INT8_FEATURES_KHR',1000082000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_IMAGE_ATOMIC_INT64_FEATURES_EXT',1000234000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_IMAGE_FOOTPRINT_FEATURES_NV',1000204000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_INTEGER_DOT_PRODUCT_FEATURES',1000280000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_INTEGER_DOT_PRODUCT_FEATURES_KHR',1000280000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_INTEGER_DOT_PRODUCT_PROPERTIES',1000280001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_INTEGER_DOT_PRODUCT_PROPERTIES_KHR',1000280001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_INTEGER_FUNCTIONS_2_FEATURES_INTEL',1000209000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_MODULE_IDENTIFIER_FEATURES_EXT',1000462000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_MODULE_IDENTIFIER_PROPERTIES_EXT',1000462001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_OBJECT_FEATURES_EXT',1000482000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_OBJECT_PROPERTIES_EXT',1000482001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_SM_BUILTINS_FEATURES_NV',1000154000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_SM_BUILTINS_PROPERTIES_NV',1000154001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_SUBGROUP_EXTENDED_TYPES_FEATURES',1000175000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_SUBGROUP_EXTENDED_TYPES_FEATURES_KHR',1000175000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_SUBGROUP_UNIFORM_CONTROL_FLOW_FEATURES_KHR',1000323000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_TERMINATE_INVOCATION_FEATURES',1000215000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_TERMINATE_INVOCATION_FEATURES_KHR',1000215000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_TILE_IMAGE_FEATURES_EXT',1000395000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_TILE_IMAGE_PROPERTIES_EXT',1000395001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADING_RATE_IMAGE_FEATURES_NV',1000164001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADING_RATE_IMAGE_PROPERTIES_NV',1000164002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SPARSE_IMAGE_FORMAT_INFO_2',1000059008,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SPARSE_IMAGE_FORMAT_INFO_2_KHR',1000059008,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBGROUP_PROPERTIES',1000094000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBGROUP_SIZE_CONTROL_FEATURES',1000225002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBGROUP_SIZE_CONTROL_FEATURES_EXT',1000225002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBGROUP_SIZE_CONTROL_PROPERTIES',1000225000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBGROUP_SIZE_CONTROL_PROPERTIES_EXT',1000225000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBPASS_MERGE_FEEDBACK_FEATURES_EXT',1000458000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBPASS_SHADING_FEATURES_HUAWEI',1000369001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBPASS_SHADING_PROPERTIES_HUAWEI',1000369002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SURFACE_INFO_2_KHR',1000119000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SWAPCHAIN_MAINTENANCE_1_FEATURES_EXT',1000275000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SYNCHRONIZATION_2_FEATURES',1000314007,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SYNCHRONIZATION_2_FEATURES_KHR',1000314007,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TEXEL_BUFFER_ALIGNMENT_FEATURES_EXT',1000281000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TEXEL_BUFFER_ALIGNMENT_PROPERTIES',1000281001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TEXEL_BUFFER_ALIGNMENT_PROPERTIES_EXT',1000281001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TEXTURE_COMPRESSION_ASTC_HDR_FEATURES',1000066000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TEXTURE_COMPRESSION_ASTC_HDR_FEATURES_EXT',1000066000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TILE_PROPERTIES_FEATURES_QCOM',1000484000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TIMELINE_SEMAPHORE_FEATURES',1000207000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TIMELINE_SEMAPHORE_FEATURES_KHR',1000207000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TIMELINE_SEMAPHORE_PROPERTIES',1000207001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TIMELINE_SEMAPHORE_PROPERTIES_KHR',1000207001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TOOL_PROPERTIES',1000245000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TOOL_PROPERTIES_EXT',1000245000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TRANSFORM_FEEDBACK_FEATURES_EXT',1000028000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TRANSFORM_FEEDBACK_PROPERTIES_EXT',1000028001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_UNIFORM_BUFFER_STANDARD_LAYOUT_FEATURES',1000253000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_UNIFORM_BUFFER_STANDARD_LAYOUT_FEATURES_KHR',1000253000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VARIABLE_POINTERS_FEATURES',1000120000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VARIABLE_POINTERS_FEATURES_KHR',1000120000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VARIABLE_POINTER_FEATURES',1000120000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VARIABLE_POINTER_FEATURES_KHR',1000120000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_FEATURES_EXT',1000190002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_FEATURES_KHR',1000190002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_PROPERTIES_EXT',1000190000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_PROPERTIES_KHR',1000525000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VERTEX_INPUT_DYNAMIC_STATE_FEATURES_EXT',1000352000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VIDEO_ENCODE_QUALITY_LEVEL_INFO_KHR',1000299006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VIDEO_FORMAT_INFO_KHR',1000023014,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VIDEO_MAINTENANCE_1_FEATURES_KHR',1000515000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_1_FEATURES',49,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_1_PROPERTIES',50,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_2_FEATURES',51,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_2_PROPERTIES',52,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_3_FEATURES',53,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_3_PROPERTIES',54,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_MEMORY_MODEL_FEATURES',1000211000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_MEMORY_MODEL_FEATURES_KHR',1000211000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_WORKGROUP_MEMORY_EXPLICIT_LAYOUT_FEATURES_KHR',1000336000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_YCBCR_2_PLANE_444_FORMATS_FEATURES_EXT',1000330000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_YCBCR_DEGAMMA_FEATURES_QCOM',1000520000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_YCBCR_IMAGE_ARRAYS_FEATURES_EXT',1000252000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ZERO_INITIALIZE_WORKGROUP_MEMORY_FEATURES',1000325000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ZERO_INITIALIZE_WORKGROUP_MEMORY_FEATURES_KHR',1000325000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_CACHE_CREATE_INFO',17,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_COLOR_BLEND_ADVANCED_STATE_CREATE_INFO_EXT',1000148002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_COLOR_BLEND_STATE_CREATE_INFO',26,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_COLOR_WRITE_CREATE_INFO_EXT',1000381001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_COMPILER_CONTROL_CREATE_INFO_AMD',1000183000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_COVERAGE_MODULATION_STATE_CREATE_INFO_NV',1000152000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_COVERAGE_REDUCTION_STATE_CREATE_INFO_NV',1000250001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_COVERAGE_TO_COLOR_STATE_CREATE_INFO_NV',1000149000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_CREATE_FLAGS_2_CREATE_INFO_KHR',1000470005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_CREATION_FEEDBACK_CREATE_INFO',1000192000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_CREATION_FEEDBACK_CREATE_INFO_EXT',1000192000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_DEPTH_STENCIL_STATE_CREATE_INFO',25,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_DISCARD_RECTANGLE_STATE_CREATE_INFO_EXT',1000099001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_DYNAMIC_STATE_CREATE_INFO',27,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_EXECUTABLE_INFO_KHR',1000269003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_EXECUTABLE_INTERNAL_REPRESENTATION_KHR',1000269005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_EXECUTABLE_PROPERTIES_KHR',1000269002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_EXECUTABLE_STATISTIC_KHR',1000269004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_FRAGMENT_SHADING_RATE_ENUM_STATE_CREATE_INFO_NV',1000326002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_FRAGMENT_SHADING_RATE_STATE_CREATE_INFO_KHR',1000226001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_INDIRECT_DEVICE_ADDRESS_INFO_NV',1000428002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_INFO_EXT',1000269001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_INFO_KHR',1000269001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_INPUT_ASSEMBLY_STATE_CREATE_INFO',20,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_LAYOUT_CREATE_INFO',30,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_LIBRARY_CREATE_INFO_KHR',1000290000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_MULTISAMPLE_STATE_CREATE_INFO',24,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_PROPERTIES_IDENTIFIER_EXT',1000372000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_CONSERVATIVE_STATE_CREATE_INFO_EXT',1000101001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_DEPTH_CLIP_STATE_CREATE_INFO_EXT',1000102001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_LINE_STATE_CREATE_INFO_EXT',1000259001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_PROVOKING_VERTEX_STATE_CREATE_INFO_EXT',1000254001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_STATE_CREATE_INFO',23,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_STATE_RASTERIZATION_ORDER_AMD',1000018000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_STATE_STREAM_CREATE_INFO_EXT',1000028002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_RENDERING_CREATE_INFO',1000044002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_RENDERING_CREATE_INFO_KHR',1000044002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_REPRESENTATIVE_FRAGMENT_TEST_STATE_CREATE_INFO_NV',1000166001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_ROBUSTNESS_CREATE_INFO_EXT',1000068000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_SAMPLE_LOCATIONS_STATE_CREATE_INFO_EXT',1000143002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_SHADER_STAGE_CREATE_INFO',18,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_SHADER_STAGE_MODULE_IDENTIFIER_CREATE_INFO_EXT',1000462002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_SHADER_STAGE_REQUIRED_SUBGROUP_SIZE_CREATE_INFO',1000225001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_SHADER_STAGE_REQUIRED_SUBGROUP_SIZE_CREATE_INFO_EXT',1000225001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_TESSELLATION_DOMAIN_ORIGIN_STATE_CREATE_INFO',1000117003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_TESSELLATION_DOMAIN_ORIGIN_STATE_CREATE_INFO_KHR',1000117003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_TESSELLATION_STATE_CREATE_INFO',21,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_VERTEX_INPUT_DIVISOR_STATE_CREATE_INFO_EXT',1000190001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_VERTEX_INPUT_DIVISOR_STATE_CREATE_INFO_KHR',1000190001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_VERTEX_INPUT_STATE_CREATE_INFO',19,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_COARSE_SAMPLE_ORDER_STATE_CREATE_INFO_NV',1000164005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_DEPTH_CLIP_CONTROL_CREATE_INFO_EXT',1000355001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_EXCLUSIVE_SCISSOR_STATE_CREATE_INFO_NV',1000205000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_SHADING_RATE_IMAGE_STATE_CREATE_INFO_NV',1000164000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_STATE_CREATE_INFO',22,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_SWIZZLE_STATE_CREATE_INFO_NV',1000098000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_W_SCALING_STATE_CREATE_INFO_NV',1000087000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PRESENT_FRAME_TOKEN_GGP',1000191000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PRESENT_ID_KHR',1000294000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PRESENT_INFO_KHR',1000001001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PRESENT_REGIONS_KHR',1000084000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PRESENT_TIMES_INFO_GOOGLE',1000092000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PRIVATE_DATA_SLOT_CREATE_INFO',1000295002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PRIVATE_DATA_SLOT_CREATE_INFO_EXT',1000295002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PROTECTED_SUBMIT_INFO',1000145000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PUSH_CONSTANTS_INFO_KHR',1000545004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PUSH_DESCRIPTOR_SET_INFO_KHR',1000545005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_PUSH_DESCRIPTOR_SET_WITH_TEMPLATE_INFO_KHR',1000545006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_QUERY_LOW_LATENCY_SUPPORT_NV',1000310000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_QUERY_POOL_CREATE_INFO',11,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_QUERY_POOL_CREATE_INFO_INTEL',1000210000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_QUERY_POOL_PERFORMANCE_CREATE_INFO_KHR',1000116002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_QUERY_POOL_PERFORMANCE_QUERY_CREATE_INFO_INTEL',1000210000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_QUERY_POOL_VIDEO_ENCODE_FEEDBACK_CREATE_INFO_KHR',1000299005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_QUEUE_FAMILY_CHECKPOINT_PROPERTIES_2_NV',1000314008,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_QUEUE_FAMILY_CHECKPOINT_PROPERTIES_NV',1000206001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_QUEUE_FAMILY_GLOBAL_PRIORITY_PROPERTIES_EXT',1000388001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_QUEUE_FAMILY_GLOBAL_PRIORITY_PROPERTIES_KHR',1000388001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_QUEUE_FAMILY_PROPERTIES_2',1000059005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_QUEUE_FAMILY_PROPERTIES_2_KHR',1000059005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_QUEUE_FAMILY_QUERY_RESULT_STATUS_PROPERTIES_KHR',1000023016,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_QUEUE_FAMILY_VIDEO_PROPERTIES_KHR',1000023012,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RAY_TRACING_PIPELINE_CREATE_INFO_KHR',1000150015,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RAY_TRACING_PIPELINE_CREATE_INFO_NV',1000165000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RAY_TRACING_PIPELINE_INTERFACE_CREATE_INFO_KHR',1000150018,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RAY_TRACING_SHADER_GROUP_CREATE_INFO_KHR',1000150016,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RAY_TRACING_SHADER_GROUP_CREATE_INFO_NV',1000165011,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RELEASE_SWAPCHAIN_IMAGES_INFO_EXT',1000275005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDERING_AREA_INFO_KHR',1000470003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDERING_ATTACHMENT_INFO',1000044001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDERING_ATTACHMENT_INFO_KHR',1000044001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDERING_FRAGMENT_DENSITY_MAP_ATTACHMENT_INFO_EXT',1000044007,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDERING_FRAGMENT_SHADING_RATE_ATTACHMENT_INFO_KHR',1000044006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDERING_INFO',1000044000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDERING_INFO_KHR',1000044000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDER_PASS_ATTACHMENT_BEGIN_INFO',1000108003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDER_PASS_ATTACHMENT_BEGIN_INFO_KHR',1000108003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDER_PASS_BEGIN_INFO',43,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDER_PASS_CREATE_INFO',38,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDER_PASS_CREATE_INFO_2',1000109004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDER_PASS_CREATE_INFO_2_KHR',1000109004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDER_PASS_CREATION_CONTROL_EXT',1000458001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDER_PASS_CREATION_FEEDBACK_CREATE_INFO_EXT',1000458002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDER_PASS_FRAGMENT_DENSITY_MAP_CREATE_INFO_EXT',1000218002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDER_PASS_INPUT_ATTACHMENT_ASPECT_CREATE_INFO',1000117001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDER_PASS_INPUT_ATTACHMENT_ASPECT_CREATE_INFO_KHR',1000117001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDER_PASS_MULTIVIEW_CREATE_INFO',1000053000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDER_PASS_MULTIVIEW_CREATE_INFO_KHR',1000053000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDER_PASS_SAMPLE_LOCATIONS_BEGIN_INFO_EXT',1000143001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDER_PASS_STRIPE_BEGIN_INFO_ARM',1000424002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDER_PASS_STRIPE_INFO_ARM',1000424003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDER_PASS_STRIPE_SUBMIT_INFO_ARM',1000424004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDER_PASS_SUBPASS_FEEDBACK_CREATE_INFO_EXT',1000458003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RENDER_PASS_TRANSFORM_BEGIN_INFO_QCOM',1000282001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RESOLVE_IMAGE_INFO_2',1000337005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_RESOLVE_IMAGE_INFO_2_KHR',1000337005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SAMPLER_BLOCK_MATCH_WINDOW_CREATE_INFO_QCOM',1000518002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SAMPLER_BORDER_COLOR_COMPONENT_MAPPING_CREATE_INFO_EXT',1000411001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SAMPLER_CAPTURE_DESCRIPTOR_DATA_INFO_EXT',1000316008,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SAMPLER_CREATE_INFO',31,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SAMPLER_CUBIC_WEIGHTS_CREATE_INFO_QCOM',1000519000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SAMPLER_CUSTOM_BORDER_COLOR_CREATE_INFO_EXT',1000287000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SAMPLER_REDUCTION_MODE_CREATE_INFO',1000130001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SAMPLER_REDUCTION_MODE_CREATE_INFO_EXT',1000130001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SAMPLER_YCBCR_CONVERSION_CREATE_INFO',1000156000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SAMPLER_YCBCR_CONVERSION_CREATE_INFO_KHR',1000156000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SAMPLER_YCBCR_CONVERSION_IMAGE_FORMAT_PROPERTIES',1000156005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SAMPLER_YCBCR_CONVERSION_IMAGE_FORMAT_PROPERTIES_KHR',1000156005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SAMPLER_YCBCR_CONVERSION_INFO',1000156001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SAMPLER_YCBCR_CONVERSION_INFO_KHR',1000156001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SAMPLER_YCBCR_CONVERSION_YCBCR_DEGAMMA_CREATE_INFO_QCOM',1000520001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SAMPLE_LOCATIONS_INFO_EXT',1000143000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SCREEN_BUFFER_FORMAT_PROPERTIES_QNX',1000529001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SCREEN_BUFFER_PROPERTIES_QNX',1000529000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SCREEN_SURFACE_CREATE_INFO_QNX',1000378000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SEMAPHORE_CREATE_INFO',9,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SEMAPHORE_GET_FD_INFO_KHR',1000079001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SEMAPHORE_GET_WIN32_HANDLE_INFO_KHR',1000078003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SEMAPHORE_GET_ZIRCON_HANDLE_INFO_FUCHSIA',1000365001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SEMAPHORE_SIGNAL_INFO',1000207005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SEMAPHORE_SIGNAL_INFO_KHR',1000207005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SEMAPHORE_SUBMIT_INFO',1000314005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SEMAPHORE_SUBMIT_INFO_KHR',1000314005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SEMAPHORE_TYPE_CREATE_INFO',1000207002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SEMAPHORE_TYPE_CREATE_INFO_KHR',1000207002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SEMAPHORE_WAIT_INFO',1000207004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SEMAPHORE_WAIT_INFO_KHR',1000207004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SET_DESCRIPTOR_BUFFER_OFFSETS_INFO_EXT',1000545007,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SET_LATENCY_MARKER_INFO_NV',1000505002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SHADER_CREATE_INFO_EXT',1000482002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SHADER_MODULE_CREATE_INFO',16,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SHADER_MODULE_IDENTIFIER_EXT',1000462003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SHADER_MODULE_VALIDATION_CACHE_CREATE_INFO_EXT',1000160001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SHADER_REQUIRED_SUBGROUP_SIZE_CREATE_INFO_EXT',1000225001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SHARED_PRESENT_SURFACE_CAPABILITIES_KHR',1000111000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SPARSE_IMAGE_FORMAT_PROPERTIES_2',1000059007,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SPARSE_IMAGE_FORMAT_PROPERTIES_2_KHR',1000059007,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SPARSE_IMAGE_MEMORY_REQUIREMENTS_2',1000146004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SPARSE_IMAGE_MEMORY_REQUIREMENTS_2_KHR',1000146004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_STREAM_DESCRIPTOR_SURFACE_CREATE_INFO_GGP',1000049000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SUBMIT_INFO',4,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SUBMIT_INFO_2',1000314004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SUBMIT_INFO_2_KHR',1000314004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SUBPASS_BEGIN_INFO',1000109005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SUBPASS_BEGIN_INFO_KHR',1000109005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SUBPASS_DEPENDENCY_2',1000109003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SUBPASS_DEPENDENCY_2_KHR',1000109003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SUBPASS_DESCRIPTION_2',1000109002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SUBPASS_DESCRIPTION_2_KHR',1000109002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SUBPASS_DESCRIPTION_DEPTH_STENCIL_RESOLVE',1000199001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SUBPASS_DESCRIPTION_DEPTH_STENCIL_RESOLVE_KHR',1000199001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SUBPASS_END_INFO',1000109006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SUBPASS_END_INFO_KHR',1000109006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SUBPASS_FRAGMENT_DENSITY_MAP_OFFSET_END_INFO_QCOM',1000425002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SUBPASS_RESOLVE_PERFORMANCE_QUERY_EXT',1000376001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SUBPASS_SHADING_PIPELINE_CREATE_INFO_HUAWEI',1000369000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SUBRESOURCE_HOST_MEMCPY_SIZE_EXT',1000270008,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SUBRESOURCE_LAYOUT_2_EXT',1000338002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SUBRESOURCE_LAYOUT_2_KHR',1000338002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SURFACE_CAPABILITIES2_EXT',1000090000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SURFACE_CAPABILITIES_2_EXT',1000090000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SURFACE_CAPABILITIES_2_KHR',1000119001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SURFACE_CAPABILITIES_FULL_SCREEN_EXCLUSIVE_EXT',1000255002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SURFACE_CAPABILITIES_PRESENT_BARRIER_NV',1000292001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SURFACE_FORMAT_2_KHR',1000119002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SURFACE_FULL_SCREEN_EXCLUSIVE_INFO_EXT',1000255000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SURFACE_FULL_SCREEN_EXCLUSIVE_WIN32_INFO_EXT',1000255001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SURFACE_PRESENT_MODE_COMPATIBILITY_EXT',1000274002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SURFACE_PRESENT_MODE_EXT',1000274000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SURFACE_PRESENT_SCALING_CAPABILITIES_EXT',1000274001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SURFACE_PROTECTED_CAPABILITIES_KHR',1000239000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SWAPCHAIN_COUNTER_CREATE_INFO_EXT',1000091003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SWAPCHAIN_CREATE_INFO_KHR',1000001000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SWAPCHAIN_DISPLAY_NATIVE_HDR_CREATE_INFO_AMD',1000213001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SWAPCHAIN_LATENCY_CREATE_INFO_NV',1000505007,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SWAPCHAIN_PRESENT_BARRIER_CREATE_INFO_NV',1000292002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SWAPCHAIN_PRESENT_FENCE_INFO_EXT',1000275001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SWAPCHAIN_PRESENT_MODES_CREATE_INFO_EXT',1000275002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SWAPCHAIN_PRESENT_MODE_INFO_EXT',1000275003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SWAPCHAIN_PRESENT_SCALING_CREATE_INFO_EXT',1000275004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_SYSMEM_COLOR_SPACE_FUCHSIA',1000366008,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_TEXTURE_LOD_GATHER_FORMAT_PROPERTIES_AMD',1000041000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_TILE_PROPERTIES_QCOM',1000484001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_TIMELINE_SEMAPHORE_SUBMIT_INFO',1000207003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_TIMELINE_SEMAPHORE_SUBMIT_INFO_KHR',1000207003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VALIDATION_CACHE_CREATE_INFO_EXT',1000160000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VALIDATION_FEATURES_EXT',1000247000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VALIDATION_FLAGS_EXT',1000061000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VERTEX_INPUT_ATTRIBUTE_DESCRIPTION_2_EXT',1000352002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VERTEX_INPUT_BINDING_DESCRIPTION_2_EXT',1000352001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_BEGIN_CODING_INFO_KHR',1000023008,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_CAPABILITIES_KHR',1000023001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_CODING_CONTROL_INFO_KHR',1000023010,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_DECODE_CAPABILITIES_KHR',1000024001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_DECODE_H264_CAPABILITIES_KHR',1000040000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_DECODE_H264_DPB_SLOT_INFO_KHR',1000040006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_DECODE_H264_PICTURE_INFO_KHR',1000040001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_DECODE_H264_PROFILE_INFO_KHR',1000040003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_DECODE_H264_SESSION_PARAMETERS_ADD_INFO_KHR',1000040005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_DECODE_H264_SESSION_PARAMETERS_CREATE_INFO_KHR',1000040004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_DECODE_H265_CAPABILITIES_KHR',1000187000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_DECODE_H265_DPB_SLOT_INFO_KHR',1000187005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_DECODE_H265_PICTURE_INFO_KHR',1000187004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_DECODE_H265_PROFILE_INFO_KHR',1000187003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_DECODE_H265_SESSION_PARAMETERS_ADD_INFO_KHR',1000187002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_DECODE_H265_SESSION_PARAMETERS_CREATE_INFO_KHR',1000187001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_DECODE_INFO_KHR',1000024000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_DECODE_USAGE_INFO_KHR',1000024002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_CAPABILITIES_KHR',1000299003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_CAPABILITIES_KHR',1000038000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_DPB_SLOT_INFO_KHR',1000038004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_GOP_REMAINING_FRAME_INFO_KHR',1000038006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_NALU_SLICE_INFO_KHR',1000038005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_PICTURE_INFO_KHR',1000038003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_PROFILE_INFO_KHR',1000038007,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_QUALITY_LEVEL_PROPERTIES_KHR',1000038011,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_RATE_CONTROL_INFO_KHR',1000038008,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_RATE_CONTROL_LAYER_INFO_KHR',1000038009,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_SESSION_CREATE_INFO_KHR',1000038010,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_SESSION_PARAMETERS_ADD_INFO_KHR',1000038002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_SESSION_PARAMETERS_CREATE_INFO_KHR',1000038001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_SESSION_PARAMETERS_FEEDBACK_INFO_KHR',1000038013,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_SESSION_PARAMETERS_GET_INFO_KHR',1000038012,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_CAPABILITIES_KHR',1000039000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_DPB_SLOT_INFO_KHR',1000039004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_GOP_REMAINING_FRAME_INFO_KHR',1000039006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_NALU_SLICE_SEGMENT_INFO_KHR',1000039005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_PICTURE_INFO_KHR',1000039003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_PROFILE_INFO_KHR',1000039007,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_QUALITY_LEVEL_PROPERTIES_KHR',1000039012,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_RATE_CONTROL_INFO_KHR',1000039009,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_RATE_CONTROL_LAYER_INFO_KHR',1000039010,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_SESSION_CREATE_INFO_KHR',1000039011,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_SESSION_PARAMETERS_ADD_INFO_KHR',1000039002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_SESSION_PARAMETERS_CREATE_INFO_KHR',1000039001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_SESSION_PARAMETERS_FEEDBACK_INFO_KHR',1000039014,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_SESSION_PARAMETERS_GET_INFO_KHR',1000039013,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_INFO_KHR',1000299000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_QUALITY_LEVEL_INFO_KHR',1000299008,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_QUALITY_LEVEL_PROPERTIES_KHR',1000299007,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_RATE_CONTROL_INFO_KHR',1000299001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_RATE_CONTROL_LAYER_INFO_KHR',1000299002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_SESSION_PARAMETERS_FEEDBACK_INFO_KHR',1000299010,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_SESSION_PARAMETERS_GET_INFO_KHR',1000299009,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_ENCODE_USAGE_INFO_KHR',1000299004,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_END_CODING_INFO_KHR',1000023009,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_FORMAT_PROPERTIES_KHR',1000023015,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_INLINE_QUERY_INFO_KHR',1000515001,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_PICTURE_RESOURCE_INFO_KHR',1000023002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_PROFILE_INFO_KHR',1000023000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_PROFILE_LIST_INFO_KHR',1000023013,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_REFERENCE_SLOT_INFO_KHR',1000023011,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_SESSION_CREATE_INFO_KHR',1000023005,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_SESSION_MEMORY_REQUIREMENTS_KHR',1000023003,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_SESSION_PARAMETERS_CREATE_INFO_KHR',1000023006,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VIDEO_SESSION_PARAMETERS_UPDATE_INFO_KHR',1000023007,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_VI_SURFACE_CREATE_INFO_NN',1000062000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_WAYLAND_SURFACE_CREATE_INFO_KHR',1000006000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_WIN32_KEYED_MUTEX_ACQUIRE_RELEASE_INFO_KHR',1000075000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_WIN32_KEYED_MUTEX_ACQUIRE_RELEASE_INFO_NV',1000058000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_WIN32_SURFACE_CREATE_INFO_KHR',1000009000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET',35,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET_ACCELERATION_STRUCTURE_KHR',1000150007,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET_ACCELERATION_STRUCTURE_NV',1000165007,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET_INLINE_UNIFORM_BLOCK',1000138002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET_INLINE_UNIFORM_BLOCK_EXT',1000138002,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_XCB_SURFACE_CREATE_INFO_KHR',1000005000,b'\xFF\xFF\xFF\x0BVK_STRUCTURE_TYPE_XLIB_SURFACE_CREATE_INFO_KHR',1000004000,b'\xFF\xFF\xFF\x0BVK_SUBGROUP_FEATURE_ARITHMETIC_BIT',4,b'\xFF\xFF\xFF\x0BVK_SUBGROUP_FEATURE_BALLOT_BIT',8,b'\xFF\xFF\xFF\x0BVK_SUBGROUP_FEATURE_BASIC_BIT',1,b'\xFF\xFF\xFF\x0BVK_SUBGROUP_FEATURE_CLUSTERED_BIT',64,b'\xFF\xFF\xFF\x0BVK_SUBGROUP_FEATURE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_SUBGROUP_FEATURE_PARTITIONED_BIT_NV',256,b'\xFF\xFF\xFF\x0BVK_SUBGROUP_FEATURE_QUAD_BIT',128,b'\xFF\xFF\xFF\x0BVK_SUBGROUP_FEATURE_SHUFFLE_BIT',16,b'\xFF\xFF\xFF\x0BVK_SUBGROUP_FEATURE_SHUFFLE_RELATIVE_BIT',32,b'\xFF\xFF\xFF\x0BVK_SUBGROUP_FEATURE_VOTE_BIT',2,b'\xFF\xFF\xFF\x0BVK_SUBMIT_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_SUBMIT_PROTECTED_BIT',1,b'\xFF\xFF\xFF\x0BVK_SUBMIT_PROTECTED_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_SUBOPTIMAL_KHR',1000001003,b'\xFF\xFF\xFF\x0BVK_SUBPASS_CONTENTS_INLINE',0,b'\xFF\xFF\xFF\x0BVK_SUBPASS_CONTENTS_INLINE_AND_SECONDARY_COMMAND_BUFFERS_EXT',1000451000,b'\xFF\xFF\xFF\x0BVK_SUBPASS_CONTENTS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_SUBPASS_CONTENTS_SECONDARY_COMMAND_BUFFERS',1,b'\xFF\xFF\xFF\x0BVK_SUBPASS_DESCRIPTION_ENABLE_LEGACY_DITHERING_BIT_EXT',128,b'\xFF\xFF\xFF\x0BVK_SUBPASS_DESCRIPTION_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_SUBPASS_DESCRIPTION_FRAGMENT_REGION_BIT_QCOM',4,b'\xFF\xFF\xFF\x0BVK_SUBPASS_DESCRIPTION_PER_VIEW_ATTRIBUTES_BIT_NVX',1,b'\xFF\xFF\xFF\x0BVK_SUBPASS_DESCRIPTION_PER_VIEW_POSITION_X_ONLY_BIT_NVX',2,b'\xFF\xFF\xFF\x0BVK_SUBPASS_DESCRIPTION_RASTERIZATION_ORDER_ATTACHMENT_COLOR_ACCESS_BIT_ARM',16,b'\xFF\xFF\xFF\x0BVK_SUBPASS_DESCRIPTION_RASTERIZATION_ORDER_ATTACHMENT_COLOR_ACCESS_BIT_EXT',16,b'\xFF\xFF\xFF\x0BVK_SUBPASS_DESCRIPTION_RASTERIZATION_ORDER_ATTACHMENT_DEPTH_ACCESS_BIT_ARM',32,b'\xFF\xFF\xFF\x0BVK_SUBPASS_DESCRIPTION_RASTERIZATION_ORDER_ATTACHMENT_DEPTH_ACCESS_BIT_EXT',32,b'\xFF\xFF\xFF\x0BVK_SUBPASS_DESCRIPTION_RASTERIZATION_ORDER_ATTACHMENT_STENCIL_ACCESS_BIT_ARM',64,b'\xFF\xFF\xFF\x0BVK_SUBPASS_DESCRIPTION_RASTERIZATION_ORDER_ATTACHMENT_STENCIL_ACCESS_BIT_EXT',64,b'\xFF\xFF\xFF\x0BVK_SUBPASS_DESCRIPTION_SHADER_RESOLVE_BIT_QCOM',8,b'\xFF\xFF\xFF\x0BVK_SUBPASS_MERGE_STATUS_DISALLOWED_EXT',1,b'\xFF\xFF\xFF\x0BVK_SUBPASS_MERGE_STATUS_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_SUBPASS_MERGE_STATUS_MERGED_EXT',0,b'\xFF\xFF\xFF\x0BVK_SUBPASS_MERGE_STATUS_NOT_MERGED_ALIASING_EXT',5,b'\xFF\xFF\xFF\x0BVK_SUBPASS_MERGE_STATUS_NOT_MERGED_DEPENDENCIES_EXT',6,b'\xFF\xFF\xFF\x0BVK_SUBPASS_MERGE_STATUS_NOT_MERGED_DEPTH_STENCIL_COUNT_EXT',10,b'\xFF\xFF\xFF\x0BVK_SUBPASS_MERGE_STATUS_NOT_MERGED_INCOMPATIBLE_INPUT_ATTACHMENT_EXT',7,b'\xFF\xFF\xFF\x0BVK_SUBPASS_MERGE_STATUS_NOT_MERGED_INSUFFICIENT_STORAGE_EXT',9,b'\xFF\xFF\xFF\x0BVK_SUBPASS_MERGE_STATUS_NOT_MERGED_RESOLVE_ATTACHMENT_REUSE_EXT',11,b'\xFF\xFF\xFF\x0BVK_SUBPASS_MERGE_STATUS_NOT_MERGED_SAMPLES_MISMATCH_EXT',3,b'\xFF\xFF\xFF\x0BVK_SUBPASS_MERGE_STATUS_NOT_MERGED_SIDE_EFFECTS_EXT',2,b'\xFF\xFF\xFF\x0BVK_SUBPASS_MERGE_STATUS_NOT_MERGED_SINGLE_SUBPASS_EXT',12,b'\xFF\xFF\xFF\x0BVK_SUBPASS_MERGE_STATUS_NOT_MERGED_TOO_MANY_ATTACHMENTS_EXT',8,b'\xFF\xFF\xFF\x0BVK_SUBPASS_MERGE_STATUS_NOT_MERGED_UNSPECIFIED_EXT',13,b'\xFF\xFF\xFF\x0BVK_SUBPASS_MERGE_STATUS_NOT_MERGED_VIEWS_MISMATCH_EXT',4,b'\xFF\xFF\xFF\x0BVK_SUCCESS',0,b'\xFF\xFF\xFF\x0BVK_SURFACE_COUNTER_FLAG_BITS_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_SURFACE_COUNTER_VBLANK_BIT_EXT',1,b'\xFF\xFF\xFF\x0BVK_SURFACE_COUNTER_VBLANK_EXT',1,b'\xFF\xFF\xFF\x0BVK_SURFACE_TRANSFORM_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_BIT_KHR',16,b'\xFF\xFF\xFF\x0BVK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_ROTATE_180_BIT_KHR',64,b'\xFF\xFF\xFF\x0BVK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_ROTATE_270_BIT_KHR',128,b'\xFF\xFF\xFF\x0BVK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_ROTATE_90_BIT_KHR',32,b'\xFF\xFF\xFF\x0BVK_SURFACE_TRANSFORM_IDENTITY_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_SURFACE_TRANSFORM_INHERIT_BIT_KHR',256,b'\xFF\xFF\xFF\x0BVK_SURFACE_TRANSFORM_ROTATE_180_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_SURFACE_TRANSFORM_ROTATE_270_BIT_KHR',8,b'\xFF\xFF\xFF\x0BVK_SURFACE_TRANSFORM_ROTATE_90_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_SWAPCHAIN_CREATE_DEFERRED_MEMORY_ALLOCATION_BIT_EXT',8,b'\xFF\xFF\xFF\x0BVK_SWAPCHAIN_CREATE_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_SWAPCHAIN_CREATE_MUTABLE_FORMAT_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_SWAPCHAIN_CREATE_PROTECTED_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_SWAPCHAIN_CREATE_SPLIT_INSTANCE_BIND_REGIONS_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_SYSTEM_ALLOCATION_SCOPE_CACHE',2,b'\xFF\xFF\xFF\x0BVK_SYSTEM_ALLOCATION_SCOPE_COMMAND',0,b'\xFF\xFF\xFF\x0BVK_SYSTEM_ALLOCATION_SCOPE_DEVICE',3,b'\xFF\xFF\xFF\x0BVK_SYSTEM_ALLOCATION_SCOPE_INSTANCE',4,b'\xFF\xFF\xFF\x0BVK_SYSTEM_ALLOCATION_SCOPE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_SYSTEM_ALLOCATION_SCOPE_OBJECT',1,b'\xFF\xFF\xFF\x0BVK_TESSELLATION_DOMAIN_ORIGIN_LOWER_LEFT',1,b'\xFF\xFF\xFF\x0BVK_TESSELLATION_DOMAIN_ORIGIN_LOWER_LEFT_KHR',1,b'\xFF\xFF\xFF\x0BVK_TESSELLATION_DOMAIN_ORIGIN_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_TESSELLATION_DOMAIN_ORIGIN_UPPER_LEFT',0,b'\xFF\xFF\xFF\x0BVK_TESSELLATION_DOMAIN_ORIGIN_UPPER_LEFT_KHR',0,b'\xFF\xFF\xFF\x0BVK_THREAD_DONE_KHR',1000268001,b'\xFF\xFF\xFF\x0BVK_THREAD_IDLE_KHR',1000268000,b'\xFF\xFF\xFF\x0BVK_TIMEOUT',2,b'\xFF\xFF\xFF\x0BVK_TIME_DOMAIN_CLOCK_MONOTONIC_EXT',1,b'\xFF\xFF\xFF\x0BVK_TIME_DOMAIN_CLOCK_MONOTONIC_KHR',1,b'\xFF\xFF\xFF\x0BVK_TIME_DOMAIN_CLOCK_MONOTONIC_RAW_EXT',2,b'\xFF\xFF\xFF\x0BVK_TIME_DOMAIN_CLOCK_MONOTONIC_RAW_KHR',2,b'\xFF\xFF\xFF\x0BVK_TIME_DOMAIN_DEVICE_EXT',0,b'\xFF\xFF\xFF\x0BVK_TIME_DOMAIN_DEVICE_KHR',0,b'\xFF\xFF\xFF\x0BVK_TIME_DOMAIN_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_TIME_DOMAIN_QUERY_PERFORMANCE_COUNTER_EXT',3,b'\xFF\xFF\xFF\x0BVK_TIME_DOMAIN_QUERY_PERFORMANCE_COUNTER_KHR',3,b'\xFF\xFF\xFF\x0BVK_TOOL_PURPOSE_ADDITIONAL_FEATURES_BIT',8,b'\xFF\xFF\xFF\x0BVK_TOOL_PURPOSE_ADDITIONAL_FEATURES_BIT_EXT',8,b'\xFF\xFF\xFF\x0BVK_TOOL_PURPOSE_DEBUG_MARKERS_BIT_EXT',64,b'\xFF\xFF\xFF\x0BVK_TOOL_PURPOSE_DEBUG_REPORTING_BIT_EXT',32,b'\xFF\xFF\xFF\x0BVK_TOOL_PURPOSE_FLAG_BITS_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_TOOL_PURPOSE_MODIFYING_FEATURES_BIT',16,b'\xFF\xFF\xFF\x0BVK_TOOL_PURPOSE_MODIFYING_FEATURES_BIT_EXT',16,b'\xFF\xFF\xFF\x0BVK_TOOL_PURPOSE_PROFILING_BIT',2,b'\xFF\xFF\xFF\x0BVK_TOOL_PURPOSE_PROFILING_BIT_EXT',2,b'\xFF\xFF\xFF\x0BVK_TOOL_PURPOSE_TRACING_BIT',4,b'\xFF\xFF\xFF\x0BVK_TOOL_PURPOSE_TRACING_BIT_EXT',4,b'\xFF\xFF\xFF\x0BVK_TOOL_PURPOSE_VALIDATION_BIT',1,b'\xFF\xFF\xFF\x0BVK_TOOL_PURPOSE_VALIDATION_BIT_EXT',1,b'\xFF\xFF\xFF\x0BVK_VALIDATION_CACHE_HEADER_VERSION_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_VALIDATION_CACHE_HEADER_VERSION_ONE_EXT',1,b'\xFF\xFF\xFF\x0BVK_VALIDATION_CHECK_ALL_EXT',0,b'\xFF\xFF\xFF\x0BVK_VALIDATION_CHECK_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_VALIDATION_CHECK_SHADERS_EXT',1,b'\xFF\xFF\xFF\x0BVK_VALIDATION_FEATURE_DISABLE_ALL_EXT',0,b'\xFF\xFF\xFF\x0BVK_VALIDATION_FEATURE_DISABLE_API_PARAMETERS_EXT',3,b'\xFF\xFF\xFF\x0BVK_VALIDATION_FEATURE_DISABLE_CORE_CHECKS_EXT',5,b'\xFF\xFF\xFF\x0BVK_VALIDATION_FEATURE_DISABLE_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_VALIDATION_FEATURE_DISABLE_OBJECT_LIFETIMES_EXT',4,b'\xFF\xFF\xFF\x0BVK_VALIDATION_FEATURE_DISABLE_SHADERS_EXT',1,b'\xFF\xFF\xFF\x0BVK_VALIDATION_FEATURE_DISABLE_SHADER_VALIDATION_CACHE_EXT',7,b'\xFF\xFF\xFF\x0BVK_VALIDATION_FEATURE_DISABLE_THREAD_SAFETY_EXT',2,b'\xFF\xFF\xFF\x0BVK_VALIDATION_FEATURE_DISABLE_UNIQUE_HANDLES_EXT',6,b'\xFF\xFF\xFF\x0BVK_VALIDATION_FEATURE_ENABLE_BEST_PRACTICES_EXT',2,b'\xFF\xFF\xFF\x0BVK_VALIDATION_FEATURE_ENABLE_DEBUG_PRINTF_EXT',3,b'\xFF\xFF\xFF\x0BVK_VALIDATION_FEATURE_ENABLE_GPU_ASSISTED_EXT',0,b'\xFF\xFF\xFF\x0BVK_VALIDATION_FEATURE_ENABLE_GPU_ASSISTED_RESERVE_BINDING_SLOT_EXT',1,b'\xFF\xFF\xFF\x0BVK_VALIDATION_FEATURE_ENABLE_MAX_ENUM_EXT',2147483647,b'\xFF\xFF\xFF\x0BVK_VALIDATION_FEATURE_ENABLE_SYNCHRONIZATION_VALIDATION_EXT',4,b'\xFF\xFF\xFF\x0BVK_VENDOR_ID_CODEPLAY',65540,b'\xFF\xFF\xFF\x0BVK_VENDOR_ID_KAZAN',65539,b'\xFF\xFF\xFF\x0BVK_VENDOR_ID_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_VENDOR_ID_MESA',65541,b'\xFF\xFF\xFF\x0BVK_VENDOR_ID_MOBILEYE',65543,b'\xFF\xFF\xFF\x0BVK_VENDOR_ID_POCL',65542,b'\xFF\xFF\xFF\x0BVK_VENDOR_ID_VIV',65537,b'\xFF\xFF\xFF\x0BVK_VENDOR_ID_VSI',65538,b'\xFF\xFF\xFF\x0BVK_VERTEX_INPUT_RATE_INSTANCE',1,b'\xFF\xFF\xFF\x0BVK_VERTEX_INPUT_RATE_MAX_ENUM',2147483647,b'\xFF\xFF\xFF\x0BVK_VERTEX_INPUT_RATE_VERTEX',0,b'\xFF\xFF\xFF\x0BVK_VIDEO_CAPABILITY_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_VIDEO_CAPABILITY_PROTECTED_CONTENT_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_VIDEO_CAPABILITY_SEPARATE_REFERENCE_IMAGES_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_VIDEO_CHROMA_SUBSAMPLING_420_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_VIDEO_CHROMA_SUBSAMPLING_422_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_VIDEO_CHROMA_SUBSAMPLING_444_BIT_KHR',8,b'\xFF\xFF\xFF\x0BVK_VIDEO_CHROMA_SUBSAMPLING_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_VIDEO_CHROMA_SUBSAMPLING_INVALID_KHR',0,b'\xFF\xFF\xFF\x0BVK_VIDEO_CHROMA_SUBSAMPLING_MONOCHROME_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_VIDEO_CODEC_OPERATION_DECODE_H264_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_VIDEO_CODEC_OPERATION_DECODE_H265_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_VIDEO_CODEC_OPERATION_ENCODE_H264_BIT_KHR',65536,b'\xFF\xFF\xFF\x0BVK_VIDEO_CODEC_OPERATION_ENCODE_H265_BIT_KHR',131072,b'\xFF\xFF\xFF\x0BVK_VIDEO_CODEC_OPERATION_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_VIDEO_CODEC_OPERATION_NONE_KHR',0,b'\xFF\xFF\xFF\x0BVK_VIDEO_CODING_CONTROL_ENCODE_QUALITY_LEVEL_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_VIDEO_CODING_CONTROL_ENCODE_RATE_CONTROL_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_VIDEO_CODING_CONTROL_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_VIDEO_CODING_CONTROL_RESET_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_VIDEO_COMPONENT_BIT_DEPTH_10_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_VIDEO_COMPONENT_BIT_DEPTH_12_BIT_KHR',16,b'\xFF\xFF\xFF\x0BVK_VIDEO_COMPONENT_BIT_DEPTH_8_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_VIDEO_COMPONENT_BIT_DEPTH_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_VIDEO_COMPONENT_BIT_DEPTH_INVALID_KHR',0,b'\xFF\xFF\xFF\x0BVK_VIDEO_DECODE_CAPABILITY_DPB_AND_OUTPUT_COINCIDE_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_VIDEO_DECODE_CAPABILITY_DPB_AND_OUTPUT_DISTINCT_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_VIDEO_DECODE_CAPABILITY_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_VIDEO_DECODE_H264_PICTURE_LAYOUT_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_VIDEO_DECODE_H264_PICTURE_LAYOUT_INTERLACED_INTERLEAVED_LINES_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_VIDEO_DECODE_H264_PICTURE_LAYOUT_INTERLACED_SEPARATE_PLANES_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_VIDEO_DECODE_H264_PICTURE_LAYOUT_PROGRESSIVE_KHR',0,b'\xFF\xFF\xFF\x0BVK_VIDEO_DECODE_USAGE_DEFAULT_KHR',0,b'\xFF\xFF\xFF\x0BVK_VIDEO_DECODE_USAGE_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_VIDEO_DECODE_USAGE_OFFLINE_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_VIDEO_DECODE_USAGE_STREAMING_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_VIDEO_DECODE_USAGE_TRANSCODING_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_CAPABILITY_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_CAPABILITY_INSUFFICIENT_BITSTREAM_BUFFER_RANGE_DETECTION_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_CAPABILITY_PRECEDING_EXTERNALLY_ENCODED_BYTES_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_CONTENT_CAMERA_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_CONTENT_DEFAULT_KHR',0,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_CONTENT_DESKTOP_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_CONTENT_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_CONTENT_RENDERED_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_FEEDBACK_BITSTREAM_BUFFER_OFFSET_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_FEEDBACK_BITSTREAM_BYTES_WRITTEN_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_FEEDBACK_BITSTREAM_HAS_OVERRIDES_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_FEEDBACK_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_CAPABILITY_B_FRAME_IN_L0_LIST_BIT_KHR',16,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_CAPABILITY_B_FRAME_IN_L1_LIST_BIT_KHR',32,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_CAPABILITY_DIFFERENT_SLICE_TYPE_BIT_KHR',8,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_CAPABILITY_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_CAPABILITY_GENERATE_PREFIX_NALU_BIT_KHR',256,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_CAPABILITY_HRD_COMPLIANCE_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_CAPABILITY_PER_PICTURE_TYPE_MIN_MAX_QP_BIT_KHR',64,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_CAPABILITY_PER_SLICE_CONSTANT_QP_BIT_KHR',128,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_CAPABILITY_PREDICTION_WEIGHT_TABLE_GENERATED_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_CAPABILITY_ROW_UNALIGNED_SLICE_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_RATE_CONTROL_ATTEMPT_HRD_COMPLIANCE_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_RATE_CONTROL_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_RATE_CONTROL_REFERENCE_PATTERN_DYADIC_BIT_KHR',8,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_RATE_CONTROL_REFERENCE_PATTERN_FLAT_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_RATE_CONTROL_REGULAR_GOP_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_RATE_CONTROL_TEMPORAL_LAYER_PATTERN_DYADIC_BIT_KHR',16,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_STD_CHROMA_QP_INDEX_OFFSET_BIT_KHR',8,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_STD_CONSTRAINED_INTRA_PRED_FLAG_SET_BIT_KHR',16384,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_STD_DEBLOCKING_FILTER_DISABLED_BIT_KHR',32768,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_STD_DEBLOCKING_FILTER_ENABLED_BIT_KHR',65536,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_STD_DEBLOCKING_FILTER_PARTIAL_BIT_KHR',131072,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_STD_DIFFERENT_SLICE_QP_DELTA_BIT_KHR',1048576,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_STD_DIRECT_8X8_INFERENCE_FLAG_UNSET_BIT_KHR',8192,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_STD_DIRECT_SPATIAL_MV_PRED_FLAG_UNSET_BIT_KHR',1024,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_STD_ENTROPY_CODING_MODE_FLAG_SET_BIT_KHR',4096,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_STD_ENTROPY_CODING_MODE_FLAG_UNSET_BIT_KHR',2048,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_STD_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_STD_PIC_INIT_QP_MINUS26_BIT_KHR',32,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_STD_QPPRIME_Y_ZERO_TRANSFORM_BYPASS_FLAG_SET_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_STD_SCALING_MATRIX_PRESENT_FLAG_SET_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_STD_SECOND_CHROMA_QP_INDEX_OFFSET_BIT_KHR',16,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_STD_SEPARATE_COLOR_PLANE_FLAG_SET_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_STD_SLICE_QP_DELTA_BIT_KHR',524288,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_STD_TRANSFORM_8X8_MODE_FLAG_SET_BIT_KHR',512,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_STD_WEIGHTED_BIPRED_IDC_EXPLICIT_BIT_KHR',128,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_STD_WEIGHTED_BIPRED_IDC_IMPLICIT_BIT_KHR',256,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H264_STD_WEIGHTED_PRED_FLAG_SET_BIT_KHR',64,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_CAPABILITY_B_FRAME_IN_L0_LIST_BIT_KHR',16,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_CAPABILITY_B_FRAME_IN_L1_LIST_BIT_KHR',32,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_CAPABILITY_DIFFERENT_SLICE_SEGMENT_TYPE_BIT_KHR',8,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_CAPABILITY_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_CAPABILITY_HRD_COMPLIANCE_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_CAPABILITY_MULTIPLE_SLICE_SEGMENTS_PER_TILE_BIT_KHR',512,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_CAPABILITY_MULTIPLE_TILES_PER_SLICE_SEGMENT_BIT_KHR',256,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_CAPABILITY_PER_PICTURE_TYPE_MIN_MAX_QP_BIT_KHR',64,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_CAPABILITY_PER_SLICE_SEGMENT_CONSTANT_QP_BIT_KHR',128,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_CAPABILITY_PREDICTION_WEIGHT_TABLE_GENERATED_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_CAPABILITY_ROW_UNALIGNED_SLICE_SEGMENT_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_CTB_SIZE_16_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_CTB_SIZE_32_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_CTB_SIZE_64_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_CTB_SIZE_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_RATE_CONTROL_ATTEMPT_HRD_COMPLIANCE_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_RATE_CONTROL_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_RATE_CONTROL_REFERENCE_PATTERN_DYADIC_BIT_KHR',8,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_RATE_CONTROL_REFERENCE_PATTERN_FLAT_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_RATE_CONTROL_REGULAR_GOP_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_RATE_CONTROL_TEMPORAL_SUB_LAYER_PATTERN_DYADIC_BIT_KHR',16,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_STD_CONSTRAINED_INTRA_PRED_FLAG_SET_BIT_KHR',16384,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_STD_DEBLOCKING_FILTER_OVERRIDE_ENABLED_FLAG_SET_BIT_KHR',65536,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_STD_DEPENDENT_SLICE_SEGMENTS_ENABLED_FLAG_SET_BIT_KHR',131072,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_STD_DEPENDENT_SLICE_SEGMENT_FLAG_SET_BIT_KHR',262144,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_STD_DIFFERENT_SLICE_QP_DELTA_BIT_KHR',1048576,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_STD_ENTROPY_CODING_SYNC_ENABLED_FLAG_SET_BIT_KHR',32768,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_STD_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_STD_INIT_QP_MINUS26_BIT_KHR',32,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_STD_LOG2_PARALLEL_MERGE_LEVEL_MINUS2_BIT_KHR',256,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_STD_PCM_ENABLED_FLAG_SET_BIT_KHR',8,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_STD_PPS_SLICE_CHROMA_QP_OFFSETS_PRESENT_FLAG_SET_BIT_KHR',4096,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_STD_SAMPLE_ADAPTIVE_OFFSET_ENABLED_FLAG_SET_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_STD_SCALING_LIST_DATA_PRESENT_FLAG_SET_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_STD_SEPARATE_COLOR_PLANE_FLAG_SET_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_STD_SIGN_DATA_HIDING_ENABLED_FLAG_SET_BIT_KHR',512,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_STD_SLICE_QP_DELTA_BIT_KHR',524288,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_STD_SPS_TEMPORAL_MVP_ENABLED_FLAG_SET_BIT_KHR',16,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_STD_TRANSFORM_SKIP_ENABLED_FLAG_SET_BIT_KHR',1024,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_STD_TRANSFORM_SKIP_ENABLED_FLAG_UNSET_BIT_KHR',2048,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_STD_TRANSQUANT_BYPASS_ENABLED_FLAG_SET_BIT_KHR',8192,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_STD_WEIGHTED_BIPRED_FLAG_SET_BIT_KHR',128,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_STD_WEIGHTED_PRED_FLAG_SET_BIT_KHR',64,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_TRANSFORM_BLOCK_SIZE_16_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_TRANSFORM_BLOCK_SIZE_32_BIT_KHR',8,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_TRANSFORM_BLOCK_SIZE_4_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_TRANSFORM_BLOCK_SIZE_8_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_H265_TRANSFORM_BLOCK_SIZE_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_RATE_CONTROL_MODE_CBR_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_RATE_CONTROL_MODE_DEFAULT_KHR',0,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_RATE_CONTROL_MODE_DISABLED_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_RATE_CONTROL_MODE_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_RATE_CONTROL_MODE_VBR_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_TUNING_MODE_DEFAULT_KHR',0,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_TUNING_MODE_HIGH_QUALITY_KHR',1,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_TUNING_MODE_LOSSLESS_KHR',4,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_TUNING_MODE_LOW_LATENCY_KHR',2,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_TUNING_MODE_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_TUNING_MODE_ULTRA_LOW_LATENCY_KHR',3,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_USAGE_CONFERENCING_BIT_KHR',8,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_USAGE_DEFAULT_KHR',0,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_USAGE_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_USAGE_RECORDING_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_USAGE_STREAMING_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_VIDEO_ENCODE_USAGE_TRANSCODING_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_VIDEO_SESSION_CREATE_ALLOW_ENCODE_PARAMETER_OPTIMIZATIONS_BIT_KHR',2,b'\xFF\xFF\xFF\x0BVK_VIDEO_SESSION_CREATE_FLAG_BITS_MAX_ENUM_KHR',2147483647,b'\xFF\xFF\xFF\x0BVK_VIDEO_SESSION_CREATE_INLINE_QUERIES_BIT_KHR',4,b'\xFF\xFF\xFF\x0BVK_VIDEO_SESSION_CREATE_PROTECTED_CONTENT_BIT_KHR',1,b'\xFF\xFF\xFF\x0BVK_VIEWPORT_COORDINATE_SWIZZLE_MAX_ENUM_NV',2147483647,b'\xFF\xFF\xFF\x0BVK_VIEWPORT_COORDINATE_SWIZZLE_NEGATIVE_W_NV',7,b'\xFF\xFF\xFF\x0BVK_VIEWPORT_COORDINATE_SWIZZLE_NEGATIVE_X_NV',1,b'\xFF\xFF\xFF\x0BVK_VIEWPORT_COORDINATE_SWIZZLE_NEGATIVE_Y_NV',3,b'\xFF\xFF\xFF\x0BVK_VIEWPORT_COORDINATE_SWIZZLE_NEGATIVE_Z_NV',5,b'\xFF\xFF\xFF\x0BVK_VIEWPORT_COORDINATE_SWIZZLE_POSITIVE_W_NV',6,b'\xFF\xFF\xFF\x0BVK_VIEWPORT_COORDINATE_SWIZZLE_POSITIVE_X_NV',0,b'\xFF\xFF\xFF\x0BVK_VIEWPORT_COORDINATE_SWIZZLE_POSITIVE_Y_NV',2,b'\xFF\xFF\xFF\x0BVK_VIEWPORT_COORDINATE_SWIZZLE_POSITIVE_Z_NV',4,b'\x00\x04\x15\x23vkAcquireDrmDisplayEXT',0,b'\x00\x02\xE9\x23vkAcquireFullScreenExclusiveModeEXT',0,b'\x00\x00\x35\x23vkAcquireNextImage2KHR',0,b'\x00\x03\x0E\x23vkAcquireNextImageKHR',0,b'\x00\x01\x4D\x23vkAcquirePerformanceConfigurationINTEL',0,b'\x00\x00\x3A\x23vkAcquireProfilingLockKHR',0,b'\x00\x04\x20\x23vkAcquireWinrtDisplayNV',0,b'\x00\x00\x54\x23vkAllocateCommandBuffers',0,b'\x00\x00\x99\x23vkAllocateDescriptorSets',0,b'\x00\x01\x17\x23vkAllocateMemory',0,b'\x00\x00\x0D\x23vkBeginCommandBuffer',0,b'\x00\x03\x39\x23vkBindAccelerationStructureMemoryNV',0,b'\x00\x01\xFA\x23vkBindBufferMemory',0,b'\x00\x03\x3E\x23vkBindBufferMemory2',0,b'\x00\x03\x3E\x23vkBindBufferMemory2KHR',0,b'\x00\x02\x80\x23vkBindImageMemory',0,b'\x00\x03\x43\x23vkBindImageMemory2',0,b'\x00\x03\x43\x23vkBindImageMemory2KHR',0,b'\x00\x02\x86\x23vkBindOpticalFlowSessionImageNV',0,b'\x00\x03\x2E\x23vkBindVideoSessionMemoryKHR',0,b'\x00\x02\x36\x23vkBuildAccelerationStructuresKHR',0,b'\x00\x02\x3D\x23vkBuildMicromapsEXT',0,b'\x00\x05\x44\x23vkCmdBeginConditionalRenderingEXT',0,b'\x00\x05\x88\x23vkCmdBeginDebugUtilsLabelEXT',0,b'\x00\x07\x27\x23vkCmdBeginQuery',0,b'\x00\x07\x37\x23vkCmdBeginQueryIndexedEXT',0,b'\x00\x06\x08\x23vkCmdBeginRenderPass',0,b'\x00\x06\x03\x23vkCmdBeginRenderPass2',0,b'\x00\x06\x03\x23vkCmdBeginRenderPass2KHR',0,b'\x00\x06\x0D\x23vkCmdBeginRendering',0,b'\x00\x06\x0D\x23vkCmdBeginRenderingKHR',0,b'\x00\x08\x09\x23vkCmdBeginTransformFeedbackEXT',0,b'\x00\x06\x49\x23vkCmdBeginVideoCodingKHR',0,b'\x00\x05\x2E\x23vkCmdBindDescriptorBufferEmbeddedSamplers2EXT',0,b'\x00\x05\xB2\x23vkCmdBindDescriptorBufferEmbeddedSamplersEXT',0,b'\x00\x07\x5C\x23vkCmdBindDescriptorBuffersEXT',0,b'\x00\x05\xC0\x23vkCmdBindDescriptorSets',0,b'\x00\x05\x32\x23vkCmdBindDescriptorSets2KHR',0,b'\x00\x06\x8A\x23vkCmdBindIndexBuffer',0,b'\x00\x06\xB1\x23vkCmdBindIndexBuffer2KHR',0,b'\x00\x06\xDC\x23vkCmdBindInvocationMaskHUAWEI',0,b'\x00\x05\xD3\x23vkCmdBindPipeline',0,b'\x00\x05\xD8\x23vkCmdBindPipelineShaderGroupNV',0,b'\x00\x07\x81\x23vkCmdBindShadersEXT',0,b'\x00\x06\xDC\x23vkCmdBindShadingRateImageNV',0,b'\x00\x08\x10\x23vkCmdBindTransformFeedbackBuffersEXT',0,b'\x00\x08\x09\x23vkCmdBindVertexBuffers',0,b'\x00\x08\x18\x23vkCmdBindVertexBuffers2',0,b'\x00\x08\x18\x23vkCmdBindVertexBuffers2EXT',0,b'\x00\x06\xF9\x23vkCmdBlitImage',0,b'\x00\x05\x36\x23vkCmdBlitImage2',0,b'\x00\x05\x36\x23vkCmdBlitImage2KHR',0,b'\x00\x05\x23\x23vkCmdBuildAccelerationStructureNV',0,b'\x00\x07\x48\x23vkCmdBuildAccelerationStructuresIndirectKHR',0,b'\x00\x07\x42\x23vkCmdBuildAccelerationStructuresKHR',0,b'\x00\x07\x66\x23vkCmdBuildMicromapsEXT',0,b'\x00\x07\x50\x23vkCmdClearAttachments',0,b'\x00\x06\xE1\x23vkCmdClearColorImage',0,b'\x00\x06\xE9\x23vkCmdClearDepthStencilImage',0,b'\x00\x06\x4D\x23vkCmdControlVideoCodingKHR',0,b'\x00\x05\x4C\x23vkCmdCopyAccelerationStructureKHR',0,b'\x00\x06\x70\x23vkCmdCopyAccelerationStructureNV',0,b'\x00\x05\x50\x23vkCmdCopyAccelerationStructureToMemoryKHR',0,b'\x00\x06\x76\x23vkCmdCopyBuffer',0,b'\x00\x05\x54\x23vkCmdCopyBuffer2',0,b'\x00\x05\x54\x23vkCmdCopyBuffer2KHR',0,b'\x00\x06\x7D\x23vkCmdCopyBufferToImage',0,b'\x00\x05\x58\x23vkCmdCopyBufferToImage2',0,b'\x00\x05\x58\x23vkCmdCopyBufferToImage2KHR',0,b'\x00\x07\x03\x23vkCmdCopyImage',0,b'\x00\x05\x5C\x23vkCmdCopyImage2',0,b'\x00\x05\x5C\x23vkCmdCopyImage2KHR',0,b'\x00\x06\xF1\x23vkCmdCopyImageToBuffer',0,b'\x00\x05\x60\x23vkCmdCopyImageToBuffer2',0,b'\x00\x05\x60\x23vkCmdCopyImageToBuffer2KHR',0,b'\x00\x08\x6B\x23vkCmdCopyMemoryIndirectNV',0,b'\x00\x05\x64\x23vkCmdCopyMemoryToAccelerationStructureKHR',0,b'\x00\x08\x71\x23vkCmdCopyMemoryToImageIndirectNV',0,b'\x00\x05\x68\x23vkCmdCopyMemoryToMicromapEXT',0,b'\x00\x05\x6C\x23vkCmdCopyMicromapEXT',0,b'\x00\x05\x70\x23vkCmdCopyMicromapToMemoryEXT',0,b'\x00\x07\x2D\x23vkCmdCopyQueryPoolResults',0,b'\x00\x05\x7C\x23vkCmdCuLaunchKernelNVX',0,b'\x00\x05\x80\x23vkCmdCudaLaunchKernelNV',0,b'\x00\x05\x84\x23vkCmdDebugMarkerBeginEXT',0,b'\x00\x05\x20\x23vkCmdDebugMarkerEndEXT',0,b'\x00\x05\x84\x23vkCmdDebugMarkerInsertEXT',0,b'\x00\x06\x51\x23vkCmdDecodeVideoKHR',0,b'\x00\x08\x7A\x23vkCmdDecompressMemoryIndirectCountNV',0,b'\x00\x07\x57\x23vkCmdDecompressMemoryNV',0,b'\x00\x08\x30\x23vkCmdDispatch',0,b'\x00\x08\x51\x23vkCmdDispatchBase',0,b'\x00\x08\x51\x23vkCmdDispatchBaseKHR',0,b'\x00\x06\x85\x23vkCmdDispatchIndirect',0,b'\x00\x08\x3E\x23vkCmdDraw',0,b'\x00\x08\x30\x23vkCmdDrawClusterHUAWEI',0,b'\x00\x06\x85\x23vkCmdDrawClusterIndirectHUAWEI',0,b'\x00\x08\x36\x23vkCmdDrawIndexed',0,b'\x00\x06\xAA\x23vkCmdDrawIndexedIndirect',0,b'\x00\x06\x90\x23vkCmdDrawIndexedIndirectCount',0,b'\x00\x06\x90\x23vkCmdDrawIndexedIndirectCountAMD',0,b'\x00\x06\x90\x23vkCmdDrawIndexedIndirectCountKHR',0,b'\x00\x06\xAA\x23vkCmdDrawIndirect',0,b'\x00\x08\x21\x23vkCmdDrawIndirectByteCountEXT',0,b'\x00\x06\x90\x23vkCmdDrawIndirectCount',0,b'\x00\x06\x90\x23vkCmdDrawIndirectCountAMD',0,b'\x00\x06\x90\x23vkCmdDrawIndirectCountKHR',0,b'\x00\x08\x30\x23vkCmdDrawMeshTasksEXT',0,b'\x00\x06\x90\x23vkCmdDrawMeshTasksIndirectCountEXT',0,b'\x00\x06\x90\x23vkCmdDrawMeshTasksIndirectCountNV',0,b'\x00\x06\xAA\x23vkCmdDrawMeshTasksIndirectEXT',0,b'\x00\x06\xAA\x23vkCmdDrawMeshTasksIndirectNV',0,b'\x00\x07\xDA\x23vkCmdDrawMeshTasksNV',0,b'\x00\x07\x74\x23vkCmdDrawMultiEXT',0,b'\x00\x07\x6B\x23vkCmdDrawMultiIndexedEXT',0,b'\x00\x06\x55\x23vkCmdEncodeVideoKHR',0,b'\x00\x05\x20\x23vkCmdEndConditionalRenderingEXT',0,b'\x00\x05\x20\x23vkCmdEndDebugUtilsLabelEXT',0,b'\x00\x07\x22\x23vkCmdEndQuery',0,b'\x00\x07\x27\x23vkCmdEndQueryIndexedEXT',0,b'\x00\x05\x20\x23vkCmdEndRenderPass',0,b'\x00\x06\x41\x23vkCmdEndRenderPass2',0,b'\x00\x06\x41\x23vkCmdEndRenderPass2KHR',0,b'\x00\x05\x20\x23vkCmdEndRendering',0,b'\x00\x05\x20\x23vkCmdEndRenderingKHR',0,b'\x00\x08\x09\x23vkCmdEndTransformFeedbackEXT',0,b'\x00\x06\x59\x23vkCmdEndVideoCodingKHR',0,b'\x00\x07\xB0\x23vkCmdExecuteCommands',0,b'\x00\x07\x61\x23vkCmdExecuteGeneratedCommandsNV',0,b'\x00\x06\xB8\x23vkCmdFillBuffer',0,b'\x00\x05\x88\x23vkCmdInsertDebugUtilsLabelEXT',0,b'\x00\x06\x3D\x23vkCmdNextSubpass',0,b'\x00\x06\x38\x23vkCmdNextSubpass2',0,b'\x00\x06\x38\x23vkCmdNextSubpass2KHR',0,b'\x00\x07\x15\x23vkCmdOpticalFlowExecuteNV',0,b'\x00\x08\x45\x23vkCmdPipelineBarrier',0,b'\x00\x05\x8C\x23vkCmdPipelineBarrier2',0,b'\x00\x05\x8C\x23vkCmdPipelineBarrier2KHR',0,b'\x00\x05\xA6\x23vkCmdPreprocessGeneratedCommandsNV',0,b'\x00\x07\x1A\x23vkCmdPushConstants',0,b'\x00\x05\xF7\x23vkCmdPushConstants2KHR',0,b'\x00\x05\xFB\x23vkCmdPushDescriptorSet2KHR',0,b'\x00\x05\xB8\x23vkCmdPushDescriptorSetKHR',0,b'\x00\x05\xFF\x23vkCmdPushDescriptorSetWithTemplate2KHR',0,b'\x00\x06\xC6\x23vkCmdPushDescriptorSetWithTemplateKHR',0,b'\x00\x06\xD2\x23vkCmdResetEvent',0,b'\x00\x06\xD7\x23vkCmdResetEvent2',0,b'\x00\x06\xD7\x23vkCmdResetEvent2KHR',0,b'\x00\x07\x27\x23vkCmdResetQueryPool',0,b'\x00\x07\x0C\x23vkCmdResolveImage',0,b'\x00\x06\x11\x23vkCmdResolveImage2',0,b'\x00\x06\x11\x23vkCmdResolveImage2KHR',0,b'\x00\x07\x3E\x23vkCmdSetAlphaToCoverageEnableEXT',0,b'\x00\x07\x3E\x23vkCmdSetAlphaToOneEnableEXT',0,b'\x00\x07\x3E\x23vkCmdSetAttachmentFeedbackLoopEnableEXT',0,b'\x00\x06\x5D\x23vkCmdSetBlendConstants',0,b'\x00\x08\x80\x23vkCmdSetCheckpointNV',0,b'\x00\x05\x3A\x23vkCmdSetCoarseSampleOrderNV',0,b'\x00\x07\xDF\x23vkCmdSetColorBlendAdvancedEXT',0,b'\x00\x08\x2A\x23vkCmdSetColorBlendEnableEXT',0,b'\x00\x07\xE5\x23vkCmdSetColorBlendEquationEXT',0,b'\x00\x07\xD5\x23vkCmdSetColorWriteEnableEXT',0,b'\x00\x08\x2A\x23vkCmdSetColorWriteMaskEXT',0,b'\x00\x05\x48\x23vkCmdSetConservativeRasterizationModeEXT',0,b'\x00\x05\x74\x23vkCmdSetCoverageModulationModeNV',0,b'\x00\x07\x3E\x23vkCmdSetCoverageModulationTableEnableNV',0,b'\x00\x07\x9B\x23vkCmdSetCoverageModulationTableNV',0,b'\x00\x05\x78\x23vkCmdSetCoverageReductionModeNV',0,b'\x00\x07\x3E\x23vkCmdSetCoverageToColorEnableNV',0,b'\x00\x07\x3E\x23vkCmdSetCoverageToColorLocationNV',0,b'\x00\x07\x3E\x23vkCmdSetCullMode',0,b'\x00\x07\x3E\x23vkCmdSetCullModeEXT',0,b'\x00\x06\x6A\x23vkCmdSetDepthBias',0,b'\x00\x05\x90\x23vkCmdSetDepthBias2EXT',0,b'\x00\x07\x3E\x23vkCmdSetDepthBiasEnable',0,b'\x00\x07\x3E\x23vkCmdSetDepthBiasEnableEXT',0,b'\x00\x06\x65\x23vkCmdSetDepthBounds',0,b'\x00\x07\x3E\x23vkCmdSetDepthBoundsTestEnable',0,b'\x00\x07\x3E\x23vkCmdSetDepthBoundsTestEnableEXT',0,b'\x00\x07\x3E\x23vkCmdSetDepthClampEnableEXT',0,b'\x00\x07\x3E\x23vkCmdSetDepthClipEnableEXT',0,b'\x00\x07\x3E\x23vkCmdSetDepthClipNegativeOneToOneEXT',0,b'\x00\x05\x40\x23vkCmdSetDepthCompareOp',0,b'\x00\x05\x40\x23vkCmdSetDepthCompareOpEXT',0,b'\x00\x07\x3E\x23vkCmdSetDepthTestEnable',0,b'\x00\x07\x3E\x23vkCmdSetDepthTestEnableEXT',0,b'\x00\x07\x3E\x23vkCmdSetDepthWriteEnable',0,b'\x00\x07\x3E\x23vkCmdSetDepthWriteEnableEXT',0,b'\x00\x06\x22\x23vkCmdSetDescriptorBufferOffsets2EXT',0,b'\x00\x05\xCA\x23vkCmdSetDescriptorBufferOffsetsEXT',0,b'\x00\x07\x3E\x23vkCmdSetDeviceMask',0,b'\x00\x07\x3E\x23vkCmdSetDeviceMaskKHR',0,b'\x00\x07\xEB\x23vkCmdSetDiscardRectangleEXT',0,b'\x00\x07\x3E\x23vkCmdSetDiscardRectangleEnableEXT',0,b'\x00\x05\x94\x23vkCmdSetDiscardRectangleModeEXT',0,b'\x00\x06\xD2\x23vkCmdSetEvent',0,b'\x00\x06\xCD\x23vkCmdSetEvent2',0,b'\x00\x06\xCD\x23vkCmdSetEvent2KHR',0,b'\x00\x08\x2A\x23vkCmdSetExclusiveScissorEnableNV',0,b'\x00\x07\xEB\x23vkCmdSetExclusiveScissorNV',0,b'\x00\x06\x61\x23vkCmdSetExtraPrimitiveOverestimationSizeEXT',0,b'\x00\x05\x9D\x23vkCmdSetFragmentShadingRateEnumNV',0,b'\x00\x05\x98\x23vkCmdSetFragmentShadingRateKHR',0,b'\x00\x05\xA2\x23vkCmdSetFrontFace',0,b'\x00\x05\xA2\x23vkCmdSetFrontFaceEXT',0,b'\x00\x05\xAA\x23vkCmdSetLineRasterizationModeEXT',0,b'\x00\x07\xD0\x23vkCmdSetLineStippleEXT',0,b'\x00\x07\x3E\x23vkCmdSetLineStippleEnableEXT',0,b'\x00\x06\x61\x23vkCmdSetLineWidth',0,b'\x00\x05\xAE\x23vkCmdSetLogicOpEXT',0,b'\x00\x07\x3E\x23vkCmdSetLogicOpEnableEXT',0,b'\x00\x07\x3E\x23vkCmdSetPatchControlPointsEXT',0,b'\x00\x00\x11\x23vkCmdSetPerformanceMarkerINTEL',0,b'\x00\x00\x15\x23vkCmdSetPerformanceOverrideINTEL',0,b'\x00\x00\x19\x23vkCmdSetPerformanceStreamMarkerINTEL',0,b'\x00\x05\xEB\x23vkCmdSetPolygonModeEXT',0,b'\x00\x07\x3E\x23vkCmdSetPrimitiveRestartEnable',0,b'\x00\x07\x3E\x23vkCmdSetPrimitiveRestartEnableEXT',0,b'\x00\x05\xEF\x23vkCmdSetPrimitiveTopology',0,b'\x00\x05\xEF\x23vkCmdSetPrimitiveTopologyEXT',0,b'\x00\x05\xF3\x23vkCmdSetProvokingVertexModeEXT',0,b'\x00\x06\x15\x23vkCmdSetRasterizationSamplesEXT',0,b'\x00\x07\x3E\x23vkCmdSetRasterizationStreamEXT',0,b'\x00\x07\x3E\x23vkCmdSetRasterizerDiscardEnable',0,b'\x00\x07\x3E\x23vkCmdSetRasterizerDiscardEnableEXT',0,b'\x00\x07\x3E\x23vkCmdSetRayTracingPipelineStackSizeKHR',0,b'\x00\x07\x3E\x23vkCmdSetRepresentativeFragmentTestEnableNV',0,b'\x00\x06\x1E\x23vkCmdSetSampleLocationsEXT',0,b'\x00\x07\x3E\x23vkCmdSetSampleLocationsEnableEXT',0,b'\x00\x06\x19\x23vkCmdSetSampleMaskEXT',0,b'\x00\x07\xEB\x23vkCmdSetScissor',0,b'\x00\x07\x7C\x23vkCmdSetScissorWithCount',0,b'\x00\x07\x7C\x23vkCmdSetScissorWithCountEXT',0,b'\x00\x07\x3E\x23vkCmdSetShadingRateImageEnableNV',0,b'\x00\x07\xDA\x23vkCmdSetStencilCompareMask',0,b'\x00\x07\x87\x23vkCmdSetStencilOp',0,b'\x00\x07\x87\x23vkCmdSetStencilOpEXT',0,b'\x00\x07\xDA\x23vkCmdSetStencilReference',0,b'\x00\x07\x3E\x23vkCmdSetStencilTestEnable',0,b'\x00\x07\x3E\x23vkCmdSetStencilTestEnableEXT',0,b'\x00\x07\xDA\x23vkCmdSetStencilWriteMask',0,b'\x00\x06\x45\x23vkCmdSetTessellationDomainOriginEXT',0,b'\x00\x07\x8F\x23vkCmdSetVertexInputEXT',0,b'\x00\x07\xF7\x23vkCmdSetViewport',0,b'\x00\x07\xF1\x23vkCmdSetViewportShadingRatePaletteNV',0,b'\x00\x07\xFD\x23vkCmdSetViewportSwizzleNV',0,b'\x00\x07\x3E\x23vkCmdSetViewportWScalingEnableNV',0,b'\x00\x08\x03\x23vkCmdSetViewportWScalingNV',0,b'\x00\x07\x96\x23vkCmdSetViewportWithCount',0,b'\x00\x07\x96\x23vkCmdSetViewportWithCountEXT',0,b'\x00\x05\x20\x23vkCmdSubpassShadingHUAWEI',0,b'\x00\x08\x5A\x23vkCmdTraceRaysIndirect2KHR',0,b'\x00\x06\x30\x23vkCmdTraceRaysIndirectKHR',0,b'\x00\x06\x26\x23vkCmdTraceRaysKHR',0,b'\x00\x06\x99\x23vkCmdTraceRaysNV',0,b'\x00\x06\xBF\x23vkCmdUpdateBuffer',0,b'\x00\x05\xD3\x23vkCmdUpdatePipelineIndirectBufferNV',0,b'\x00\x07\xBB\x23vkCmdWaitEvents',0,b'\x00\x07\xB5\x23vkCmdWaitEvents2',0,b'\x00\x07\xB5\x23vkCmdWaitEvents2KHR',0,b'\x00\x07\xA0\x23vkCmdWriteAccelerationStructuresPropertiesKHR',0,b'\x00\x07\xA8\x23vkCmdWriteAccelerationStructuresPropertiesNV',0,b'\x00\x08\x5E\x23vkCmdWriteBufferMarker2AMD',0,b'\x00\x05\xDE\x23vkCmdWriteBufferMarkerAMD',0,b'\x00\x07\xC8\x23vkCmdWriteMicromapsPropertiesEXT',0,b'\x00\x05\xE5\x23vkCmdWriteTimestamp',0,b'\x00\x08\x65\x23vkCmdWriteTimestamp2',0,b'\x00\x08\x65\x23vkCmdWriteTimestamp2KHR',0,b'\x00\x02\xBD\x23vkCompileDeferredNV',0,b'\x00\x02\x0F\x23vkCopyAccelerationStructureKHR',0,b'\x00\x02\x14\x23vkCopyAccelerationStructureToMemoryKHR',0,b'\x00\x00\x5F\x23vkCopyImageToImageEXT',0,b'\x00\x00\x63\x23vkCopyImageToMemoryEXT',0,b'\x00\x02\x19\x23vkCopyMemoryToAccelerationStructureKHR',0,b'\x00\x00\x67\x23vkCopyMemoryToImageEXT',0,b'\x00\x02\x1E\x23vkCopyMemoryToMicromapEXT',0,b'\x00\x02\x23\x23vkCopyMicromapEXT',0,b'\x00\x02\x28\x23vkCopyMicromapToMemoryEXT',0,b'\x00\x00\x29\x23vkCreateAccelerationStructureKHR',0,b'\x00\x00\x2F\x23vkCreateAccelerationStructureNV',0,b'\x00\x03\x85\x23vkCreateAndroidSurfaceKHR',0,b'\x00\x00\x48\x23vkCreateBuffer',0,b'\x00\x00\x4E\x23vkCreateBufferView',0,b'\x00\x00\x59\x23vkCreateCommandPool',0,b'\x00\x02\x97\x23vkCreateComputePipelines',0,b'\x00\x00\x6B\x23vkCreateCuFunctionNVX',0,b'\x00\x00\x71\x23vkCreateCuModuleNVX',0,b'\x00\x00\x77\x23vkCreateCudaFunctionNV',0,b'\x00\x00\x7D\x23vkCreateCudaModuleNV',0,b'\x00\x03\x8B\x23vkCreateDebugReportCallbackEXT',0,b'\x00\x03\x91\x23vkCreateDebugUtilsMessengerEXT',0,b'\x00\x00\x3E\x23vkCreateDeferredOperationKHR',0,b'\x00\x00\x93\x23vkCreateDescriptorPool',0,b'\x00\x00\x9E\x23vkCreateDescriptorSetLayout',0,b'\x00\x00\xA4\x23vkCreateDescriptorUpdateTemplate',0,b'\x00\x00\xA4\x23vkCreateDescriptorUpdateTemplateKHR',0,b'\x00\x03\xC5\x23vkCreateDevice',0,b'\x00\x04\x24\x23vkCreateDisplayModeKHR',0,b'\x00\x03\x97\x23vkCreateDisplayPlaneSurfaceKHR',0,b'\x00\x00\xB9\x23vkCreateEvent',0,b'\x00\x00\xD1\x23vkCreateFence',0,b'\x00\x00\xE1\x23vkCreateFramebuffer',0,b'\x00\x02\x9F\x23vkCreateGraphicsPipelines',0,b'\x00\x03\x9D\x23vkCreateHeadlessSurfaceEXT',0,b'\x00\x00\xEC\x23vkCreateImage',0,b'\x00\x00\xF7\x23vkCreateImageView',0,b'\x00\x01\x0D\x23vkCreateIndirectCommandsLayoutNV',0,b'\x00\x00\x00\x23vkCreateInstance',0,b'\x00\x01\x3A\x23vkCreateMicromapEXT',0,b'\x00\x01\x47\x23vkCreateOpticalFlowSessionNV',0,b'\x00\x01\x5C\x23vkCreatePipelineCache',0,b'\x00\x01\x79\x23vkCreatePipelineLayout',0,b'\x00\x01\x7F\x23vkCreatePrivateDataSlot',0,b'\x00\x01\x7F\x23vkCreatePrivateDataSlotEXT',0,b'\x00\x01\x85\x23vkCreateQueryPool',0,b'\x00\x02\x2D\x23vkCreateRayTracingPipelinesKHR',0,b'\x00\x02\xA7\x23vkCreateRayTracingPipelinesNV',0,b'\x00\x01\x8F\x23vkCreateRenderPass',0,b'\x00\x01\x95\x23vkCreateRenderPass2',0,b'\x00\x01\x95\x23vkCreateRenderPass2KHR',0,b'\x00\x01\xA5\x23vkCreateSampler',0,b'\x00\x01\xAB\x23vkCreateSamplerYcbcrConversion',0,b'\x00\x01\xAB\x23vkCreateSamplerYcbcrConversionKHR',0,b'\x00\x01\xB1\x23vkCreateSemaphore',0,b'\x00\x01\xCA\x23vkCreateShaderModule',0,b'\x00\x03\x59\x23vkCreateShadersEXT',0,b'\x00\x03\x60\x23vkCreateSharedSwapchainsKHR',0,b'\x00\x01\xD0\x23vkCreateSwapchainKHR',0,b'\x00\x01\xD6\x23vkCreateValidationCacheEXT',0,b'\x00\x01\xE3\x23vkCreateVideoSessionKHR',0,b'\x00\x01\xE9\x23vkCreateVideoSessionParametersKHR',0,b'\x00\x03\xA3\x23vkCreateWaylandSurfaceKHR',0,b'\x00\x03\xA9\x23vkCreateWin32SurfaceKHR',0,b'\x00\x03\xAF\x23vkCreateXcbSurfaceKHR',0,b'\x00\x03\xB5\x23vkCreateXlibSurfaceKHR',0,b'\x00\x00\x83\x23vkDebugMarkerSetObjectNameEXT',0,b'\x00\x00\x87\x23vkDebugMarkerSetObjectTagEXT',0,b'\x00\x0A\x52\x23vkDebugReportMessageEXT',0,b'\x00\x02\x0B\x23vkDeferredOperationJoinKHR',0,b'\x00\x08\xFC\x23vkDestroyAccelerationStructureKHR',0,b'\x00\x09\x01\x23vkDestroyAccelerationStructureNV',0,b'\x00\x09\x0B\x23vkDestroyBuffer',0,b'\x00\x09\x06\x23vkDestroyBufferView',0,b'\x00\x09\x15\x23vkDestroyCommandPool',0,b'\x00\x09\x25\x23vkDestroyCuFunctionNVX',0,b'\x00\x09\x2A\x23vkDestroyCuModuleNVX',0,b'\x00\x09\x2F\x23vkDestroyCudaFunctionNV',0,b'\x00\x09\x34\x23vkDestroyCudaModuleNV',0,b'\x00\x0A\x43\x23vkDestroyDebugReportCallbackEXT',0,b'\x00\x0A\x48\x23vkDestroyDebugUtilsMessengerEXT',0,b'\x00\x09\x39\x23vkDestroyDeferredOperationKHR',0,b'\x00\x09\x3E\x23vkDestroyDescriptorPool',0,b'\x00\x09\x43\x23vkDestroyDescriptorSetLayout',0,b'\x00\x09\x5E\x23vkDestroyDescriptorUpdateTemplate',0,b'\x00\x09\x5E\x23vkDestroyDescriptorUpdateTemplateKHR',0,b'\x00\x08\x9E\x23vkDestroyDevice',0,b'\x00\x09\x76\x23vkDestroyEvent',0,b'\x00\x09\x7B\x23vkDestroyFence',0,b'\x00\x09\x80\x23vkDestroyFramebuffer',0,b'\x00\x09\x8A\x23vkDestroyImage',0,b'\x00\x09\x85\x23vkDestroyImageView',0,b'\x00\x09\xA6\x23vkDestroyIndirectCommandsLayoutNV',0,b'\x00\x0A\x39\x23vkDestroyInstance',0,b'\x00\x09\xAB\x23vkDestroyMicromapEXT',0,b'\x00\x09\xB0\x23vkDestroyOpticalFlowSessionNV',0,b'\x00\x09\xBF\x23vkDestroyPipeline',0,b'\x00\x09\xB5\x23vkDestroyPipelineCache',0,b'\x00\x09\xBA\x23vkDestroyPipelineLayout',0,b'\x00\x09\xC4\x23vkDestroyPrivateDataSlot',0,b'\x00\x09\xC4\x23vkDestroyPrivateDataSlotEXT',0,b'\x00\x09\xC9\x23vkDestroyQueryPool',0,b'\x00\x09\xD4\x23vkDestroyRenderPass',0,b'\x00\x09\xE3\x23vkDestroySampler',0,b'\x00\x09\xDE\x23vkDestroySamplerYcbcrConversion',0,b'\x00\x09\xDE\x23vkDestroySamplerYcbcrConversionKHR',0,b'\x00\x09\xE8\x23vkDestroySemaphore',0,b'\x00\x09\xED\x23vkDestroyShaderEXT',0,b'\x00\x09\xF2\x23vkDestroyShaderModule',0,b'\x00\x0A\x4D\x23vkDestroySurfaceKHR',0,b'\x00\x09\xFC\x23vkDestroySwapchainKHR',0,b'\x00\x0A\x10\x23vkDestroyValidationCacheEXT',0,b'\x00\x0A\x15\x23vkDestroyVideoSessionKHR',0,b'\x00\x0A\x1A\x23vkDestroyVideoSessionParametersKHR',0,b'\x00\x00\x21\x23vkDeviceWaitIdle',0,b'\x00\x02\x63\x23vkDisplayPowerControlEXT',0,b'\x00\x00\x0A\x23vkEndCommandBuffer',0,b'\x00\x04\x0F\x23vkEnumerateDeviceExtensionProperties',0,b'\x00\x04\x7C\x23vkEnumerateDeviceLayerProperties',0,b'\x00\x00\x05\x23vkEnumerateInstanceExtensionProperties',0,b'\x00\x04\xC8\x23vkEnumerateInstanceLayerProperties',0,b'\x00\x04\xC5\x23vkEnumerateInstanceVersion',0,b'\x00\x03\xBB\x23vkEnumeratePhysicalDeviceGroups',0,b'\x00\x03\xBB\x23vkEnumeratePhysicalDeviceGroupsKHR',0,b'\x00\x04\x9B\x23vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR',0,b'\x00\x03\xC0\x23vkEnumeratePhysicalDevices',0,b'\x00\x03\x54\x23vkFlushMappedMemoryRanges',0,b'\x00\x09\x1F\x23vkFreeCommandBuffers',0,b'\x00\x02\x48\x23vkFreeDescriptorSets',0,b'\x00\x09\x67\x23vkFreeMemory',0,b'\x00\x08\x87\x23vkGetAccelerationStructureBuildSizesKHR',0,b'\x00\x04\xF9\x23vkGetAccelerationStructureDeviceAddressKHR',0,b'\x00\x01\xF4\x23vkGetAccelerationStructureHandleNV',0,b'\x00\x08\x94\x23vkGetAccelerationStructureMemoryRequirementsNV',0,b'\x00\x00\x24\x23vkGetAccelerationStructureOpaqueCaptureDescriptorDataEXT',0,b'\x00\x01\xEF\x23vkGetAndroidHardwareBufferPropertiesANDROID',0,b'\x00\x04\xFD\x23vkGetBufferDeviceAddress',0,b'\x00\x04\xFD\x23vkGetBufferDeviceAddressEXT',0,b'\x00\x04\xFD\x23vkGetBufferDeviceAddressKHR',0,b'\x00\x09\x10\x23vkGetBufferMemoryRequirements',0,b'\x00\x08\xA2\x23vkGetBufferMemoryRequirements2',0,b'\x00\x08\xA2\x23vkGetBufferMemoryRequirements2KHR',0,b'\x00\x04\xFD\x23vkGetBufferOpaqueCaptureAddress',0,b'\x00\x04\xFD\x23vkGetBufferOpaqueCaptureAddressKHR',0,b'\x00\x00\x43\x23vkGetBufferOpaqueCaptureDescriptorDataEXT',0,b'\x00\x03\x48\x23vkGetCalibratedTimestampsEXT',0,b'\x00\x03\x48\x23vkGetCalibratedTimestampsKHR',0,b'\x00\x02\x05\x23vkGetCudaModuleCacheNV',0,b'\x00\x04\xD6\x23vkGetDeferredOperationMaxConcurrencyKHR',0,b'\x00\x02\x0B\x23vkGetDeferredOperationResultKHR',0,b'\x00\x08\xAC\x23vkGetDescriptorEXT',0,b'\x00\x09\x59\x23vkGetDescriptorSetHostMappingVALVE',0,b'\x00\x09\x48\x23vkGetDescriptorSetLayoutBindingOffsetEXT',0,b'\x00\x08\xB2\x23vkGetDescriptorSetLayoutHostMappingInfoVALVE',0,b'\x00\x09\x4E\x23vkGetDescriptorSetLayoutSizeEXT',0,b'\x00\x08\xB7\x23vkGetDescriptorSetLayoutSupport',0,b'\x00\x08\xB7\x23vkGetDescriptorSetLayoutSupportKHR',0,b'\x00\x08\x99\x23vkGetDeviceAccelerationStructureCompatibilityKHR',0,b'\x00\x08\xBC\x23vkGetDeviceBufferMemoryRequirements',0,b'\x00\x08\xBC\x23vkGetDeviceBufferMemoryRequirementsKHR',0,b'\x00\x00\xB0\x23vkGetDeviceFaultInfoEXT',0,b'\x00\x0A\x32\x23vkGetDeviceGroupPeerMemoryFeatures',0,b'\x00\x0A\x32\x23vkGetDeviceGroupPeerMemoryFeaturesKHR',0,b'\x00\x00\xB5\x23vkGetDeviceGroupPresentCapabilitiesKHR',0,b'\x00\x01\x57\x23vkGetDeviceGroupSurfacePresentModes2EXT',0,b'\x00\x02\xE4\x23vkGetDeviceGroupSurfacePresentModesKHR',0,b'\x00\x08\xC1\x23vkGetDeviceImageMemoryRequirements',0,b'\x00\x08\xC1\x23vkGetDeviceImageMemoryRequirementsKHR',0,b'\x00\x08\xC6\x23vkGetDeviceImageSparseMemoryRequirements',0,b'\x00\x08\xC6\x23vkGetDeviceImageSparseMemoryRequirementsKHR',0,b'\x00\x08\xCC\x23vkGetDeviceImageSubresourceLayoutKHR',0,b'\x00\x09\x71\x23vkGetDeviceMemoryCommitment',0,b'\x00\x05\x01\x23vkGetDeviceMemoryOpaqueCaptureAddress',0,b'\x00\x05\x01\x23vkGetDeviceMemoryOpaqueCaptureAddressKHR',0,b'\x00\x08\xE6\x23vkGetDeviceMicromapCompatibilityEXT',0,b'\x00\x0A\xD2\x23vkGetDeviceProcAddr',0,b'\x00\x0A\x2C\x23vkGetDeviceQueue',0,b'\x00\x08\xD1\x23vkGetDeviceQueue2',0,b'\x00\x02\xD4\x23vkGetDeviceSubpassShadingMaxWorkgroupSizeHUAWEI',0,b'\x00\x04\x2B\x23vkGetDisplayModeProperties2KHR',0,b'\x00\x04\x31\x23vkGetDisplayModePropertiesKHR',0,b'\x00\x03\xCB\x23vkGetDisplayPlaneCapabilities2KHR',0,b'\x00\x04\x37\x23vkGetDisplayPlaneCapabilitiesKHR',0,b'\x00\x04\xA2\x23vkGetDisplayPlaneSupportedDisplaysKHR',0,b'\x00\x04\x1A\x23vkGetDrmDisplayEXT',0,b'\x00\x01\x9B\x23vkGetDynamicRenderingTilePropertiesQCOM',0,b'\x00\x01\xDC\x23vkGetEncodedVideoSessionParametersKHR',0,b'\x00\x02\x68\x23vkGetEventStatus',0,b'\x00\x00\xD7\x23vkGetFenceFdKHR',0,b'\x00\x02\x6C\x23vkGetFenceStatus',0,b'\x00\x00\xDC\x23vkGetFenceWin32HandleKHR',0,b'\x00\x02\x70\x23vkGetFramebufferTilePropertiesQCOM',0,b'\x00\x08\xD6\x23vkGetGeneratedCommandsMemoryRequirementsNV',0,b'\x00\x02\x7B\x23vkGetImageDrmFormatModifierPropertiesEXT',0,b'\x00\x09\x9B\x23vkGetImageMemoryRequirements',0,b'\x00\x08\xDB\x23vkGetImageMemoryRequirements2',0,b'\x00\x08\xDB\x23vkGetImageMemoryRequirements2KHR',0,b'\x00\x00\xE7\x23vkGetImageOpaqueCaptureDescriptorDataEXT',0,b'\x00\x09\xA0\x23vkGetImageSparseMemoryRequirements',0,b'\x00\x08\xE0\x23vkGetImageSparseMemoryRequirements2',0,b'\x00\x08\xE0\x23vkGetImageSparseMemoryRequirements2KHR',0,b'\x00\x09\x8F\x23vkGetImageSubresourceLayout',0,b'\x00\x09\x95\x23vkGetImageSubresourceLayout2EXT',0,b'\x00\x09\x95\x23vkGetImageSubresourceLayout2KHR',0,b'\x00\x02\x76\x23vkGetImageViewAddressNVX',0,b'\x00\x04\xD2\x23vkGetImageViewHandleNVX',0,b'\x00\x00\xF2\x23vkGetImageViewOpaqueCaptureDescriptorDataEXT',0,b'\x00\x0A\xD6\x23vkGetInstanceProcAddr',0,b'\x00\x0A\x01\x23vkGetLatencyTimingsNV',0,b'\x00\x01\x1D\x23vkGetMemoryAndroidHardwareBufferANDROID',0,b'\x00\x01\x22\x23vkGetMemoryFdKHR',0,b'\x00\x00\xBF\x23vkGetMemoryFdPropertiesKHR',0,b'\x00\x00\xCB\x23vkGetMemoryHostPointerPropertiesEXT',0,b'\x00\x01\x27\x23vkGetMemoryRemoteAddressNV',0,b'\x00\x01\x2C\x23vkGetMemoryWin32HandleKHR',0,b'\x00\x02\x4E\x23vkGetMemoryWin32HandleNV',0,b'\x00\x00\xC5\x23vkGetMemoryWin32HandlePropertiesKHR',0,b'\x00\x08\x8E\x23vkGetMicromapBuildSizesEXT',0,b'\x00\x03\x02\x23vkGetPastPresentationTimingGOOGLE',0,b'\x00\x01\x52\x23vkGetPerformanceParameterINTEL',0,b'\x00\x04\x8B\x23vkGetPhysicalDeviceCalibrateableTimeDomainsEXT',0,b'\x00\x04\x8B\x23vkGetPhysicalDeviceCalibrateableTimeDomainsKHR',0,b'\x00\x04\x59\x23vkGetPhysicalDeviceCooperativeMatrixPropertiesKHR',0,b'\x00\x04\x5E\x23vkGetPhysicalDeviceCooperativeMatrixPropertiesNV',0,b'\x00\x04\x63\x23vkGetPhysicalDeviceDisplayPlaneProperties2KHR',0,b'\x00\x04\x68\x23vkGetPhysicalDeviceDisplayPlanePropertiesKHR',0,b'\x00\x04\x6D\x23vkGetPhysicalDeviceDisplayProperties2KHR',0,b'\x00\x04\x72\x23vkGetPhysicalDeviceDisplayPropertiesKHR',0,b'\x00\x0A\x70\x23vkGetPhysicalDeviceExternalBufferProperties',0,b'\x00\x0A\x70\x23vkGetPhysicalDeviceExternalBufferPropertiesKHR',0,b'\x00\x0A\x75\x23vkGetPhysicalDeviceExternalFenceProperties',0,b'\x00\x0A\x75\x23vkGetPhysicalDeviceExternalFencePropertiesKHR',0,b'\x00\x03\xD9\x23vkGetPhysicalDeviceExternalImageFormatPropertiesNV',0,b'\x00\x0A\x7A\x23vkGetPhysicalDeviceExternalSemaphoreProperties',0,b'\x00\x0A\x7A\x23vkGetPhysicalDeviceExternalSemaphorePropertiesKHR',0,b'\x00\x0A\x7F\x23vkGetPhysicalDeviceFeatures',0,b'\x00\x0A\x83\x23vkGetPhysicalDeviceFeatures2',0,b'\x00\x0A\x83\x23vkGetPhysicalDeviceFeatures2KHR',0,b'\x00\x0A\x5C\x23vkGetPhysicalDeviceFormatProperties',0,b'\x00\x0A\x61\x23vkGetPhysicalDeviceFormatProperties2',0,b'\x00\x0A\x61\x23vkGetPhysicalDeviceFormatProperties2KHR',0,b'\x00\x04\x81\x23vkGetPhysicalDeviceFragmentShadingRatesKHR',0,b'\x00\x03\xD0\x23vkGetPhysicalDeviceImageFormatProperties',0,b'\x00\x03\xE9\x23vkGetPhysicalDeviceImageFormatProperties2',0,b'\x00\x03\xE9\x23vkGetPhysicalDeviceImageFormatProperties2KHR',0,b'\x00\x0A\x87\x23vkGetPhysicalDeviceMemoryProperties',0,b'\x00\x0A\x8B\x23vkGetPhysicalDeviceMemoryProperties2',0,b'\x00\x0A\x8B\x23vkGetPhysicalDeviceMemoryProperties2KHR',0,b'\x00\x0A\xA2\x23vkGetPhysicalDeviceMultisamplePropertiesEXT',0,b'\x00\x03\xE3\x23vkGetPhysicalDeviceOpticalFlowImageFormatsNV',0,b'\x00\x04\x4D\x23vkGetPhysicalDevicePresentRectanglesKHR',0,b'\x00\x0A\x8F\x23vkGetPhysicalDeviceProperties',0,b'\x00\x0A\x93\x23vkGetPhysicalDeviceProperties2',0,b'\x00\x0A\x93\x23vkGetPhysicalDeviceProperties2KHR',0,b'\x00\x0A\x9D\x23vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR',0,b'\x00\x0A\xA7\x23vkGetPhysicalDeviceQueueFamilyProperties',0,b'\x00\x0A\xAC\x23vkGetPhysicalDeviceQueueFamilyProperties2',0,b'\x00\x0A\xAC\x23vkGetPhysicalDeviceQueueFamilyProperties2KHR',0,b'\x00\x0A\x66\x23vkGetPhysicalDeviceSparseImageFormatProperties',0,b'\x00\x0A\x97\x23vkGetPhysicalDeviceSparseImageFormatProperties2',0,b'\x00\x0A\x97\x23vkGetPhysicalDeviceSparseImageFormatProperties2KHR',0,b'\x00\x04\x77\x23vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV',0,b'\x00\x04\x3D\x23vkGetPhysicalDeviceSurfaceCapabilities2EXT',0,b'\x00\x03\xEE\x23vkGetPhysicalDeviceSurfaceCapabilities2KHR',0,b'\x00\x04\x42\x23vkGetPhysicalDeviceSurfaceCapabilitiesKHR',0,b'\x00\x03\xF9\x23vkGetPhysicalDeviceSurfaceFormats2KHR',0,b'\x00\x04\x53\x23vkGetPhysicalDeviceSurfaceFormatsKHR',0,b'\x00\x03\xF3\x23vkGetPhysicalDeviceSurfacePresentModes2EXT',0,b'\x00\x04\x47\x23vkGetPhysicalDeviceSurfacePresentModesKHR',0,b'\x00\x04\x95\x23vkGetPhysicalDeviceSurfaceSupportKHR',0,b'\x00\x04\x86\x23vkGetPhysicalDeviceToolProperties',0,b'\x00\x04\x86\x23vkGetPhysicalDeviceToolPropertiesEXT',0,b'\x00\x04\x0A\x23vkGetPhysicalDeviceVideoCapabilitiesKHR',0,b'\x00\x03\xFF\x23vkGetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR',0,b'\x00\x04\x04\x23vkGetPhysicalDeviceVideoFormatPropertiesKHR',0,b'\x00\x04\xE4\x23vkGetPhysicalDeviceWaylandPresentationSupportKHR',0,b'\x00\x04\xDA\x23vkGetPhysicalDeviceWin32PresentationSupportKHR',0,b'\x00\x04\xE9\x23vkGetPhysicalDeviceXcbPresentationSupportKHR',0,b'\x00\x04\xDE\x23vkGetPhysicalDeviceXlibPresentationSupportKHR',0,b'\x00\x02\x91\x23vkGetPipelineCacheData',0,b'\x00\x01\x62\x23vkGetPipelineExecutableInternalRepresentationsKHR',0,b'\x00\x01\x73\x23vkGetPipelineExecutablePropertiesKHR',0,b'\x00\x01\x68\x23vkGetPipelineExecutableStatisticsKHR',0,b'\x00\x05\x05\x23vkGetPipelineIndirectDeviceAddressNV',0,b'\x00\x08\xA7\x23vkGetPipelineIndirectMemoryRequirementsNV',0,b'\x00\x01\x6E\x23vkGetPipelinePropertiesEXT',0,b'\x00\x08\xEB\x23vkGetPrivateData',0,b'\x00\x08\xEB\x23vkGetPrivateDataEXT',0,b'\x00\x02\xCA\x23vkGetQueryPoolResults',0,b'\x00\x0A\xBC\x23vkGetQueueCheckpointData2NV',0,b'\x00\x0A\xC1\x23vkGetQueueCheckpointDataNV',0,b'\x00\x02\xC2\x23vkGetRayTracingCaptureReplayShaderGroupHandlesKHR',0,b'\x00\x02\xC2\x23vkGetRayTracingShaderGroupHandlesKHR',0,b'\x00\x02\xC2\x23vkGetRayTracingShaderGroupHandlesNV',0,b'\x00\x05\x09\x23vkGetRayTracingShaderGroupStackSizeKHR',0,b'\x00\x02\xF7\x23vkGetRefreshCycleDurationGOOGLE',0,b'\x00\x09\xD9\x23vkGetRenderAreaGranularity',0,b'\x00\x08\xF2\x23vkGetRenderingAreaGranularityKHR',0,b'\x00\x01\xA0\x23vkGetSamplerOpaqueCaptureDescriptorDataEXT',0,b'\x00\x02\xD9\x23vkGetSemaphoreCounterValue',0,b'\x00\x02\xD9\x23vkGetSemaphoreCounterValueKHR',0,b'\x00\x01\xB7\x23vkGetSemaphoreFdKHR',0,b'\x00\x01\xBC\x23vkGetSemaphoreWin32HandleKHR',0,b'\x00\x02\xDE\x23vkGetShaderBinaryDataEXT',0,b'\x00\x02\xB5\x23vkGetShaderInfoAMD',0,b'\x00\x08\xF7\x23vkGetShaderModuleCreateInfoIdentifierEXT',0,b'\x00\x09\xF7\x23vkGetShaderModuleIdentifierEXT',0,b'\x00\x02\xFC\x23vkGetSwapchainCounterEXT',0,b'\x00\x03\x08\x23vkGetSwapchainImagesKHR',0,b'\x00\x02\xE9\x23vkGetSwapchainStatusKHR',0,b'\x00\x03\x1C\x23vkGetValidationCacheDataEXT',0,b'\x00\x03\x28\x23vkGetVideoSessionMemoryRequirementsKHR',0,b'\x00\x04\x90\x23vkGetWinrtDisplayNV',0,b'\x00\x00\xFD\x23vkImportFenceFdKHR',0,b'\x00\x01\x01\x23vkImportFenceWin32HandleKHR',0,b'\x00\x01\x05\x23vkImportSemaphoreFdKHR',0,b'\x00\x01\x09\x23vkImportSemaphoreWin32HandleKHR',0,b'\x00\x01\x13\x23vkInitializePerformanceApiINTEL',0,b'\x00\x03\x54\x23vkInvalidateMappedMemoryRanges',0,b'\x00\x02\xED\x23vkLatencySleepNV',0,b'\x00\x02\x54\x23vkMapMemory',0,b'\x00\x01\x31\x23vkMapMemory2KHR',0,b'\x00\x02\xAF\x23vkMergePipelineCaches',0,b'\x00\x03\x22\x23vkMergeValidationCachesEXT',0,b'\x00\x0A\xB4\x23vkQueueBeginDebugUtilsLabelEXT',0,b'\x00\x04\xB3\x23vkQueueBindSparse',0,b'\x00\x0A\xB1\x23vkQueueEndDebugUtilsLabelEXT',0,b'\x00\x0A\xB4\x23vkQueueInsertDebugUtilsLabelEXT',0,b'\x00\x0A\xB8\x23vkQueueNotifyOutOfBandNV',0,b'\x00\x04\xAB\x23vkQueuePresentKHR',0,b'\x00\x04\xAF\x23vkQueueSetPerformanceConfigurationINTEL',0,b'\x00\x04\xB9\x23vkQueueSubmit',0,b'\x00\x04\xBF\x23vkQueueSubmit2',0,b'\x00\x04\xBF\x23vkQueueSubmit2KHR',0,b'\x00\x04\xA8\x23vkQueueWaitIdle',0,b'\x00\x00\xAA\x23vkRegisterDeviceEventEXT',0,b'\x00\x02\x5C\x23vkRegisterDisplayEventEXT',0,b'\x00\x04\x20\x23vkReleaseDisplayEXT',0,b'\x00\x02\xE9\x23vkReleaseFullScreenExclusiveModeEXT',0,b'\x00\x02\x8D\x23vkReleasePerformanceConfigurationINTEL',0,b'\x00\x08\x84\x23vkReleaseProfilingLockKHR',0,b'\x00\x01\x8B\x23vkReleaseSwapchainImagesEXT',0,b'\x00\x00\x1D\x23vkResetCommandBuffer',0,b'\x00\x02\x00\x23vkResetCommandPool',0,b'\x00\x02\x43\x23vkResetDescriptorPool',0,b'\x00\x02\x68\x23vkResetEvent',0,b'\x00\x03\x70\x23vkResetFences',0,b'\x00\x09\xCE\x23vkResetQueryPool',0,b'\x00\x09\xCE\x23vkResetQueryPoolEXT',0,b'\x00\x00\x8B\x23vkSetDebugUtilsObjectNameEXT',0,b'\x00\x00\x8F\x23vkSetDebugUtilsObjectTagEXT',0,b'\x00\x09\x6C\x23vkSetDeviceMemoryPriorityEXT',0,b'\x00\x02\x68\x23vkSetEvent',0,b'\x00\x0A\x26\x23vkSetHdrMetadataEXT',0,b'\x00\x0A\x06\x23vkSetLatencyMarkerNV',0,b'\x00\x02\xF2\x23vkSetLatencySleepModeNV',0,b'\x00\x0A\x0B\x23vkSetLocalDimmingAMD',0,b'\x00\x01\x40\x23vkSetPrivateData',0,b'\x00\x01\x40\x23vkSetPrivateDataEXT',0,b'\x00\x01\xC1\x23vkSignalSemaphore',0,b'\x00\x01\xC1\x23vkSignalSemaphoreKHR',0,b'\x00\x0A\x3D\x23vkSubmitDebugUtilsMessageEXT',0,b'\x00\x03\x4F\x23vkTransitionImageLayoutEXT',0,b'\x00\x09\x1A\x23vkTrimCommandPool',0,b'\x00\x09\x1A\x23vkTrimCommandPoolKHR',0,b'\x00\x08\x84\x23vkUninitializePerformanceApiINTEL',0,b'\x00\x09\x63\x23vkUnmapMemory',0,b'\x00\x01\x36\x23vkUnmapMemory2KHR',0,b'\x00\x09\x53\x23vkUpdateDescriptorSetWithTemplate',0,b'\x00\x09\x53\x23vkUpdateDescriptorSetWithTemplateKHR',0,b'\x00\x0A\x1F\x23vkUpdateDescriptorSets',0,b'\x00\x03\x34\x23vkUpdateVideoSessionParametersKHR',0,b'\x00\x03\x75\x23vkWaitForFences',0,b'\x00\x03\x16\x23vkWaitForPresentKHR',0,b'\x00\x01\xC5\x23vkWaitSemaphores',0,b'\x00\x01\xC5\x23vkWaitSemaphoresKHR',0,b'\x00\x03\x67\x23vkWriteAccelerationStructuresPropertiesKHR',0,b'\x00\x03\x7C\x23vkWriteMicromapsPropertiesEXT',0),
+    _struct_unions = ((b'\x00\x00\x11\x64\x00\x00\x00\x10AHardwareBuffer',),(b'\x00\x00\x0A\xDB\x00\x00\x00\x10ANativeWindow',),(b'\x00\x00\x0A\xDC\x00\x00\x00\x10Display',),(b'\x00\x00\x0A\xDD\x00\x00\x00\x10MirBlob',),(b'\x00\x00\x0A\xDE\x00\x00\x00\x10MirBufferStream',),(b'\x00\x00\x0A\xDF\x00\x00\x00\x10MirConnection',),(b'\x00\x00\x0A\xE0\x00\x00\x00\x10MirDisplayConfig',),(b'\x00\x00\x0A\xE1\x00\x00\x00\x10MirPersistentId',),(b'\x00\x00\x0A\xE2\x00\x00\x00\x10MirPromptSession',),(b'\x00\x00\x0A\xE3\x00\x00\x00\x10MirScreencast',),(b'\x00\x00\x0A\xE4\x00\x00\x00\x10MirSurface',),(b'\x00\x00\x0A\xE5\x00\x00\x00\x10MirSurfaceSpec',),(b'\x00\x00\x0A\xEB\x00\x00\x00\x02StdVideoDecodeH264PictureInfo',b'\x00\x0A\xEC\x11flags',b'\x00\x11\xCC\x11seq_parameter_set_id',b'\x00\x11\xCC\x11pic_parameter_set_id',b'\x00\x11\xCC\x11reserved1',b'\x00\x11\xCC\x11reserved2',b'\x00\x07\xD3\x11frame_num',b'\x00\x07\xD3\x11idr_pic_id',b'\x00\x11\x51\x11PicOrderCnt'),(b'\x00\x00\x0A\xEC\x00\x00\x00\x02StdVideoDecodeH264PictureInfoFlags',b'\x00\x00\x1F\x13\x00\x00\x00\x01field_pic_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01is_intra',b'\x00\x00\x1F\x13\x00\x00\x00\x01IdrPicFlag',b'\x00\x00\x1F\x13\x00\x00\x00\x01bottom_field_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01is_reference',b'\x00\x00\x1F\x13\x00\x00\x00\x01complementary_field_pair'),(b'\x00\x00\x0A\xEE\x00\x00\x00\x02StdVideoDecodeH264ReferenceInfo',b'\x00\x0A\xEF\x11flags',b'\x00\x07\xD3\x11FrameNum',b'\x00\x07\xD3\x11reserved',b'\x00\x11\x51\x11PicOrderCnt'),(b'\x00\x00\x0A\xEF\x00\x00\x00\x02StdVideoDecodeH264ReferenceInfoFlags',b'\x00\x00\x1F\x13\x00\x00\x00\x01top_field_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01bottom_field_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01used_for_long_term_reference',b'\x00\x00\x1F\x13\x00\x00\x00\x01is_non_existing'),(b'\x00\x00\x0A\xF1\x00\x00\x00\x02StdVideoDecodeH265PictureInfo',b'\x00\x0A\xF2\x11flags',b'\x00\x11\xCC\x11sps_video_parameter_set_id',b'\x00\x11\xCC\x11pps_seq_parameter_set_id',b'\x00\x11\xCC\x11pps_pic_parameter_set_id',b'\x00\x11\xCC\x11NumDeltaPocsOfRefRpsIdx',b'\x00\x04\x17\x11PicOrderCntVal',b'\x00\x07\xD3\x11NumBitsForSTRefPicSetInSlice',b'\x00\x07\xD3\x11reserved',b'\x00\x11\xE5\x11RefPicSetStCurrBefore',b'\x00\x11\xE5\x11RefPicSetStCurrAfter',b'\x00\x11\xE5\x11RefPicSetLtCurr'),(b'\x00\x00\x0A\xF2\x00\x00\x00\x02StdVideoDecodeH265PictureInfoFlags',b'\x00\x00\x1F\x13\x00\x00\x00\x01IrapPicFlag',b'\x00\x00\x1F\x13\x00\x00\x00\x01IdrPicFlag',b'\x00\x00\x1F\x13\x00\x00\x00\x01IsReference',b'\x00\x00\x1F\x13\x00\x00\x00\x01short_term_ref_pic_set_sps_flag'),(b'\x00\x00\x0A\xF4\x00\x00\x00\x02StdVideoDecodeH265ReferenceInfo',b'\x00\x0A\xF5\x11flags',b'\x00\x04\x17\x11PicOrderCntVal'),(b'\x00\x00\x0A\xF5\x00\x00\x00\x02StdVideoDecodeH265ReferenceInfoFlags',b'\x00\x00\x1F\x13\x00\x00\x00\x01used_for_long_term_reference',b'\x00\x00\x1F\x13\x00\x00\x00\x01unused_for_reference'),(b'\x00\x00\x0A\xF7\x00\x00\x00\x02StdVideoEncodeH264PictureInfo',b'\x00\x0A\xF8\x11flags',b'\x00\x11\xCC\x11seq_parameter_set_id',b'\x00\x11\xCC\x11pic_parameter_set_id',b'\x00\x07\xD3\x11idr_pic_id',b'\x00\x0B\x26\x11primary_pic_type',b'\x00\x00\x1F\x11frame_num',b'\x00\x04\x17\x11PicOrderCnt',b'\x00\x11\xCC\x11temporal_id',b'\x00\x11\xD7\x11reserved1',b'\x00\x0B\x00\x11pRefLists'),(b'\x00\x00\x0A\xF8\x00\x00\x00\x02StdVideoEncodeH264PictureInfoFlags',b'\x00\x00\x1F\x13\x00\x00\x00\x01IdrPicFlag',b'\x00\x00\x1F\x13\x00\x00\x00\x01is_reference',b'\x00\x00\x1F\x13\x00\x00\x00\x01no_output_of_prior_pics_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01long_term_reference_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01adaptive_ref_pic_marking_mode_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x1Breserved'),(b'\x00\x00\x0A\xFA\x00\x00\x00\x02StdVideoEncodeH264RefListModEntry',b'\x00\x0B\x22\x11modification_of_pic_nums_idc',b'\x00\x07\xD3\x11abs_diff_pic_num_minus1',b'\x00\x07\xD3\x11long_term_pic_num'),(b'\x00\x00\x0A\xFC\x00\x00\x00\x02StdVideoEncodeH264RefPicMarkingEntry',b'\x00\x0B\x21\x11memory_management_control_operation',b'\x00\x07\xD3\x11difference_of_pic_nums_minus1',b'\x00\x07\xD3\x11long_term_pic_num',b'\x00\x07\xD3\x11long_term_frame_idx',b'\x00\x07\xD3\x11max_long_term_frame_idx_plus1'),(b'\x00\x00\x0A\xFE\x00\x00\x00\x02StdVideoEncodeH264ReferenceInfo',b'\x00\x0A\xFF\x11flags',b'\x00\x0B\x26\x11primary_pic_type',b'\x00\x00\x1F\x11FrameNum',b'\x00\x04\x17\x11PicOrderCnt',b'\x00\x07\xD3\x11long_term_pic_num',b'\x00\x07\xD3\x11long_term_frame_idx',b'\x00\x11\xCC\x11temporal_id'),(b'\x00\x00\x0A\xFF\x00\x00\x00\x02StdVideoEncodeH264ReferenceInfoFlags',b'\x00\x00\x1F\x13\x00\x00\x00\x01used_for_long_term_reference',b'\x00\x00\x1F\x13\x00\x00\x00\x1Freserved'),(b'\x00\x00\x0B\x01\x00\x00\x00\x02StdVideoEncodeH264ReferenceListsInfo',b'\x00\x0B\x02\x11flags',b'\x00\x11\xCC\x11num_ref_idx_l0_active_minus1',b'\x00\x11\xCC\x11num_ref_idx_l1_active_minus1',b'\x00\x11\xD5\x11RefPicList0',b'\x00\x11\xD5\x11RefPicList1',b'\x00\x11\xCC\x11refList0ModOpCount',b'\x00\x11\xCC\x11refList1ModOpCount',b'\x00\x11\xCC\x11refPicMarkingOpCount',b'\x00\x11\xE3\x11reserved1',b'\x00\x0A\xF9\x11pRefList0ModOperations',b'\x00\x0A\xF9\x11pRefList1ModOperations',b'\x00\x0A\xFB\x11pRefPicMarkingOperations'),(b'\x00\x00\x0B\x02\x00\x00\x00\x02StdVideoEncodeH264ReferenceListsInfoFlags',b'\x00\x00\x1F\x13\x00\x00\x00\x01ref_pic_list_modification_flag_l0',b'\x00\x00\x1F\x13\x00\x00\x00\x01ref_pic_list_modification_flag_l1',b'\x00\x00\x1F\x13\x00\x00\x00\x1Ereserved'),(b'\x00\x00\x0B\x04\x00\x00\x00\x02StdVideoEncodeH264SliceHeader',b'\x00\x0B\x05\x11flags',b'\x00\x00\x1F\x11first_mb_in_slice',b'\x00\x0B\x30\x11slice_type',b'\x00\x11\x56\x11slice_alpha_c0_offset_div2',b'\x00\x11\x56\x11slice_beta_offset_div2',b'\x00\x11\x56\x11slice_qp_delta',b'\x00\x11\xCC\x11reserved1',b'\x00\x0B\x1B\x11cabac_init_idc',b'\x00\x0B\x1D\x11disable_deblocking_filter_idc',b'\x00\x0B\x06\x11pWeightTable'),(b'\x00\x00\x0B\x05\x00\x00\x00\x02StdVideoEncodeH264SliceHeaderFlags',b'\x00\x00\x1F\x13\x00\x00\x00\x01direct_spatial_mv_pred_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01num_ref_idx_active_override_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x1Ereserved'),(b'\x00\x00\x0B\x07\x00\x00\x00\x02StdVideoEncodeH264WeightTable',b'\x00\x0B\x08\x11flags',b'\x00\x11\xCC\x11luma_log2_weight_denom',b'\x00\x11\xCC\x11chroma_log2_weight_denom',b'\x00\x11\x5D\x11luma_weight_l0',b'\x00\x11\x5D\x11luma_offset_l0',b'\x00\x11\x5F\x11chroma_weight_l0',b'\x00\x11\x5F\x11chroma_offset_l0',b'\x00\x11\x5D\x11luma_weight_l1',b'\x00\x11\x5D\x11luma_offset_l1',b'\x00\x11\x5F\x11chroma_weight_l1',b'\x00\x11\x5F\x11chroma_offset_l1'),(b'\x00\x00\x0B\x08\x00\x00\x00\x02StdVideoEncodeH264WeightTableFlags',b'\x00\x00\x1F\x11luma_weight_l0_flag',b'\x00\x00\x1F\x11chroma_weight_l0_flag',b'\x00\x00\x1F\x11luma_weight_l1_flag',b'\x00\x00\x1F\x11chroma_weight_l1_flag'),(b'\x00\x00\x0B\x0A\x00\x00\x00\x02StdVideoEncodeH265LongTermRefPics',b'\x00\x11\xCC\x11num_long_term_sps',b'\x00\x11\xCC\x11num_long_term_pics',b'\x00\x11\xD5\x11lt_idx_sps',b'\x00\x11\xCF\x11poc_lsb_lt',b'\x00\x07\xD3\x11used_by_curr_pic_lt_flag',b'\x00\x11\xD9\x11delta_poc_msb_present_flag',b'\x00\x11\xD9\x11delta_poc_msb_cycle_lt'),(b'\x00\x00\x0B\x0C\x00\x00\x00\x02StdVideoEncodeH265PictureInfo',b'\x00\x0B\x0D\x11flags',b'\x00\x0B\x40\x11pic_type',b'\x00\x11\xCC\x11sps_video_parameter_set_id',b'\x00\x11\xCC\x11pps_seq_parameter_set_id',b'\x00\x11\xCC\x11pps_pic_parameter_set_id',b'\x00\x11\xCC\x11short_term_ref_pic_set_idx',b'\x00\x04\x17\x11PicOrderCntVal',b'\x00\x11\xCC\x11TemporalId',b'\x00\x11\xE3\x11reserved1',b'\x00\x0B\x11\x11pRefLists',b'\x00\x0B\x4E\x11pShortTermRefPicSet',b'\x00\x0B\x09\x11pLongTermRefPics'),(b'\x00\x00\x0B\x0D\x00\x00\x00\x02StdVideoEncodeH265PictureInfoFlags',b'\x00\x00\x1F\x13\x00\x00\x00\x01is_reference',b'\x00\x00\x1F\x13\x00\x00\x00\x01IrapPicFlag',b'\x00\x00\x1F\x13\x00\x00\x00\x01used_for_long_term_reference',b'\x00\x00\x1F\x13\x00\x00\x00\x01discardable_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01cross_layer_bla_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01pic_output_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01no_output_of_prior_pics_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01short_term_ref_pic_set_sps_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01slice_temporal_mvp_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x17reserved'),(b'\x00\x00\x0B\x0F\x00\x00\x00\x02StdVideoEncodeH265ReferenceInfo',b'\x00\x0B\x10\x11flags',b'\x00\x0B\x40\x11pic_type',b'\x00\x04\x17\x11PicOrderCntVal',b'\x00\x11\xCC\x11TemporalId'),(b'\x00\x00\x0B\x10\x00\x00\x00\x02StdVideoEncodeH265ReferenceInfoFlags',b'\x00\x00\x1F\x13\x00\x00\x00\x01used_for_long_term_reference',b'\x00\x00\x1F\x13\x00\x00\x00\x01unused_for_reference',b'\x00\x00\x1F\x13\x00\x00\x00\x1Ereserved'),(b'\x00\x00\x0B\x12\x00\x00\x00\x02StdVideoEncodeH265ReferenceListsInfo',b'\x00\x0B\x13\x11flags',b'\x00\x11\xCC\x11num_ref_idx_l0_active_minus1',b'\x00\x11\xCC\x11num_ref_idx_l1_active_minus1',b'\x00\x11\xCD\x11RefPicList0',b'\x00\x11\xCD\x11RefPicList1',b'\x00\x11\xCD\x11list_entry_l0',b'\x00\x11\xCD\x11list_entry_l1'),(b'\x00\x00\x0B\x13\x00\x00\x00\x02StdVideoEncodeH265ReferenceListsInfoFlags',b'\x00\x00\x1F\x13\x00\x00\x00\x01ref_pic_list_modification_flag_l0',b'\x00\x00\x1F\x13\x00\x00\x00\x01ref_pic_list_modification_flag_l1',b'\x00\x00\x1F\x13\x00\x00\x00\x1Ereserved'),(b'\x00\x00\x0B\x15\x00\x00\x00\x02StdVideoEncodeH265SliceSegmentHeader',b'\x00\x0B\x16\x11flags',b'\x00\x0B\x51\x11slice_type',b'\x00\x00\x1F\x11slice_segment_address',b'\x00\x11\xCC\x11collocated_ref_idx',b'\x00\x11\xCC\x11MaxNumMergeCand',b'\x00\x11\x56\x11slice_cb_qp_offset',b'\x00\x11\x56\x11slice_cr_qp_offset',b'\x00\x11\x56\x11slice_beta_offset_div2',b'\x00\x11\x56\x11slice_tc_offset_div2',b'\x00\x11\x56\x11slice_act_y_qp_offset',b'\x00\x11\x56\x11slice_act_cb_qp_offset',b'\x00\x11\x56\x11slice_act_cr_qp_offset',b'\x00\x11\x56\x11slice_qp_delta',b'\x00\x07\xD3\x11reserved1',b'\x00\x0B\x17\x11pWeightTable'),(b'\x00\x00\x0B\x16\x00\x00\x00\x02StdVideoEncodeH265SliceSegmentHeaderFlags',b'\x00\x00\x1F\x13\x00\x00\x00\x01first_slice_segment_in_pic_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01dependent_slice_segment_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01slice_sao_luma_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01slice_sao_chroma_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01num_ref_idx_active_override_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01mvd_l1_zero_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01cabac_init_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01cu_chroma_qp_offset_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01deblocking_filter_override_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01slice_deblocking_filter_disabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01collocated_from_l0_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01slice_loop_filter_across_slices_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x14reserved'),(b'\x00\x00\x0B\x18\x00\x00\x00\x02StdVideoEncodeH265WeightTable',b'\x00\x0B\x19\x11flags',b'\x00\x11\xCC\x11luma_log2_weight_denom',b'\x00\x11\x56\x11delta_chroma_log2_weight_denom',b'\x00\x11\x57\x11delta_luma_weight_l0',b'\x00\x11\x57\x11luma_offset_l0',b'\x00\x11\x59\x11delta_chroma_weight_l0',b'\x00\x11\x59\x11delta_chroma_offset_l0',b'\x00\x11\x57\x11delta_luma_weight_l1',b'\x00\x11\x57\x11luma_offset_l1',b'\x00\x11\x59\x11delta_chroma_weight_l1',b'\x00\x11\x59\x11delta_chroma_offset_l1'),(b'\x00\x00\x0B\x19\x00\x00\x00\x02StdVideoEncodeH265WeightTableFlags',b'\x00\x07\xD3\x11luma_weight_l0_flag',b'\x00\x07\xD3\x11chroma_weight_l0_flag',b'\x00\x07\xD3\x11luma_weight_l1_flag',b'\x00\x07\xD3\x11chroma_weight_l1_flag'),(b'\x00\x00\x0B\x1F\x00\x00\x00\x02StdVideoH264HrdParameters',b'\x00\x11\xCC\x11cpb_cnt_minus1',b'\x00\x11\xCC\x11bit_rate_scale',b'\x00\x11\xCC\x11cpb_size_scale',b'\x00\x11\xCC\x11reserved1',b'\x00\x11\xBC\x11bit_rate_value_minus1',b'\x00\x11\xBC\x11cpb_size_value_minus1',b'\x00\x11\xD5\x11cbr_flag',b'\x00\x00\x1F\x11initial_cpb_removal_delay_length_minus1',b'\x00\x00\x1F\x11cpb_removal_delay_length_minus1',b'\x00\x00\x1F\x11dpb_output_delay_length_minus1',b'\x00\x00\x1F\x11time_offset_length'),(b'\x00\x00\x0B\x25\x00\x00\x00\x02StdVideoH264PictureParameterSet',b'\x00\x0B\x28\x11flags',b'\x00\x11\xCC\x11seq_parameter_set_id',b'\x00\x11\xCC\x11pic_parameter_set_id',b'\x00\x11\xCC\x11num_ref_idx_l0_default_active_minus1',b'\x00\x11\xCC\x11num_ref_idx_l1_default_active_minus1',b'\x00\x0B\x33\x11weighted_bipred_idc',b'\x00\x11\x56\x11pic_init_qp_minus26',b'\x00\x11\x56\x11pic_init_qs_minus26',b'\x00\x11\x56\x11chroma_qp_index_offset',b'\x00\x11\x56\x11second_chroma_qp_index_offset',b'\x00\x0B\x2A\x11pScalingLists'),(b'\x00\x00\x0B\x28\x00\x00\x00\x02StdVideoH264PpsFlags',b'\x00\x00\x1F\x13\x00\x00\x00\x01transform_8x8_mode_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01redundant_pic_cnt_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01constrained_intra_pred_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01deblocking_filter_control_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01weighted_pred_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01bottom_field_pic_order_in_frame_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01entropy_coding_mode_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01pic_scaling_matrix_present_flag'),(b'\x00\x00\x0B\x2B\x00\x00\x00\x02StdVideoH264ScalingLists',b'\x00\x07\xD3\x11scaling_list_present_mask',b'\x00\x07\xD3\x11use_default_scaling_matrix_mask',b'\x00\x11\xDF\x11ScalingList4x4',b'\x00\x11\xE1\x11ScalingList8x8'),(b'\x00\x00\x0B\x2D\x00\x00\x00\x02StdVideoH264SequenceParameterSet',b'\x00\x0B\x31\x11flags',b'\x00\x0B\x29\x11profile_idc',b'\x00\x0B\x20\x11level_idc',b'\x00\x0B\x1C\x11chroma_format_idc',b'\x00\x11\xCC\x11seq_parameter_set_id',b'\x00\x11\xCC\x11bit_depth_luma_minus8',b'\x00\x11\xCC\x11bit_depth_chroma_minus8',b'\x00\x11\xCC\x11log2_max_frame_num_minus4',b'\x00\x0B\x27\x11pic_order_cnt_type',b'\x00\x04\x17\x11offset_for_non_ref_pic',b'\x00\x04\x17\x11offset_for_top_to_bottom_field',b'\x00\x11\xCC\x11log2_max_pic_order_cnt_lsb_minus4',b'\x00\x11\xCC\x11num_ref_frames_in_pic_order_cnt_cycle',b'\x00\x11\xCC\x11max_num_ref_frames',b'\x00\x11\xCC\x11reserved1',b'\x00\x00\x1F\x11pic_width_in_mbs_minus1',b'\x00\x00\x1F\x11pic_height_in_map_units_minus1',b'\x00\x00\x1F\x11frame_crop_left_offset',b'\x00\x00\x1F\x11frame_crop_right_offset',b'\x00\x00\x1F\x11frame_crop_top_offset',b'\x00\x00\x1F\x11frame_crop_bottom_offset',b'\x00\x00\x1F\x11reserved2',b'\x00\x07\x72\x11pOffsetForRefFrame',b'\x00\x0B\x2A\x11pScalingLists',b'\x00\x0B\x2E\x11pSequenceParameterSetVui'),(b'\x00\x00\x0B\x2F\x00\x00\x00\x02StdVideoH264SequenceParameterSetVui',b'\x00\x0B\x32\x11flags',b'\x00\x0B\x1A\x11aspect_ratio_idc',b'\x00\x07\xD3\x11sar_width',b'\x00\x07\xD3\x11sar_height',b'\x00\x11\xCC\x11video_format',b'\x00\x11\xCC\x11colour_primaries',b'\x00\x11\xCC\x11transfer_characteristics',b'\x00\x11\xCC\x11matrix_coefficients',b'\x00\x00\x1F\x11num_units_in_tick',b'\x00\x00\x1F\x11time_scale',b'\x00\x11\xCC\x11max_num_reorder_frames',b'\x00\x11\xCC\x11max_dec_frame_buffering',b'\x00\x11\xCC\x11chroma_sample_loc_type_top_field',b'\x00\x11\xCC\x11chroma_sample_loc_type_bottom_field',b'\x00\x00\x1F\x11reserved1',b'\x00\x0B\x1E\x11pHrdParameters'),(b'\x00\x00\x0B\x31\x00\x00\x00\x02StdVideoH264SpsFlags',b'\x00\x00\x1F\x13\x00\x00\x00\x01constraint_set0_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01constraint_set1_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01constraint_set2_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01constraint_set3_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01constraint_set4_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01constraint_set5_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01direct_8x8_inference_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01mb_adaptive_frame_field_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01frame_mbs_only_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01delta_pic_order_always_zero_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01separate_colour_plane_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01gaps_in_frame_num_value_allowed_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01qpprime_y_zero_transform_bypass_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01frame_cropping_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01seq_scaling_matrix_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01vui_parameters_present_flag'),(b'\x00\x00\x0B\x32\x00\x00\x00\x02StdVideoH264SpsVuiFlags',b'\x00\x00\x1F\x13\x00\x00\x00\x01aspect_ratio_info_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01overscan_info_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01overscan_appropriate_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01video_signal_type_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01video_full_range_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01color_description_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01chroma_loc_info_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01timing_info_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01fixed_frame_rate_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01bitstream_restriction_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01nal_hrd_parameters_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01vcl_hrd_parameters_present_flag'),(b'\x00\x00\x0B\x37\x00\x00\x00\x02StdVideoH265DecPicBufMgr',b'\x00\x11\xC2\x11max_latency_increase_plus1',b'\x00\x11\xE3\x11max_dec_pic_buffering_minus1',b'\x00\x11\xE3\x11max_num_reorder_pics'),(b'\x00\x00\x0B\x38\x00\x00\x00\x02StdVideoH265HrdFlags',b'\x00\x00\x1F\x13\x00\x00\x00\x01nal_hrd_parameters_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01vcl_hrd_parameters_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01sub_pic_hrd_params_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01sub_pic_cpb_params_in_pic_timing_sei_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x08fixed_pic_rate_general_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x08fixed_pic_rate_within_cvs_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x08low_delay_hrd_flag'),(b'\x00\x00\x0B\x3A\x00\x00\x00\x02StdVideoH265HrdParameters',b'\x00\x0B\x38\x11flags',b'\x00\x11\xCC\x11tick_divisor_minus2',b'\x00\x11\xCC\x11du_cpb_removal_delay_increment_length_minus1',b'\x00\x11\xCC\x11dpb_output_delay_du_length_minus1',b'\x00\x11\xCC\x11bit_rate_scale',b'\x00\x11\xCC\x11cpb_size_scale',b'\x00\x11\xCC\x11cpb_size_du_scale',b'\x00\x11\xCC\x11initial_cpb_removal_delay_length_minus1',b'\x00\x11\xCC\x11au_cpb_removal_delay_length_minus1',b'\x00\x11\xCC\x11dpb_output_delay_length_minus1',b'\x00\x11\xE3\x11cpb_cnt_minus1',b'\x00\x11\xB0\x11elemental_duration_in_tc_minus1',b'\x00\x11\xAC\x11reserved',b'\x00\x0B\x54\x11pSubLayerHrdParametersNal',b'\x00\x0B\x54\x11pSubLayerHrdParametersVcl'),(b'\x00\x00\x0B\x3D\x00\x00\x00\x02StdVideoH265LongTermRefPicsSps',b'\x00\x00\x1F\x11used_by_curr_pic_lt_sps_flag',b'\x00\x11\xBC\x11lt_ref_pic_poc_lsb_sps'),(b'\x00\x00\x0B\x3F\x00\x00\x00\x02StdVideoH265PictureParameterSet',b'\x00\x0B\x41\x11flags',b'\x00\x11\xCC\x11pps_pic_parameter_set_id',b'\x00\x11\xCC\x11pps_seq_parameter_set_id',b'\x00\x11\xCC\x11sps_video_parameter_set_id',b'\x00\x11\xCC\x11num_extra_slice_header_bits',b'\x00\x11\xCC\x11num_ref_idx_l0_default_active_minus1',b'\x00\x11\xCC\x11num_ref_idx_l1_default_active_minus1',b'\x00\x11\x56\x11init_qp_minus26',b'\x00\x11\xCC\x11diff_cu_qp_delta_depth',b'\x00\x11\x56\x11pps_cb_qp_offset',b'\x00\x11\x56\x11pps_cr_qp_offset',b'\x00\x11\x56\x11pps_beta_offset_div2',b'\x00\x11\x56\x11pps_tc_offset_div2',b'\x00\x11\xCC\x11log2_parallel_merge_level_minus2',b'\x00\x11\xCC\x11log2_max_transform_skip_block_size_minus2',b'\x00\x11\xCC\x11diff_cu_chroma_qp_offset_depth',b'\x00\x11\xCC\x11chroma_qp_offset_list_len_minus1',b'\x00\x11\x61\x11cb_qp_offset_list',b'\x00\x11\x61\x11cr_qp_offset_list',b'\x00\x11\xCC\x11log2_sao_offset_scale_luma',b'\x00\x11\xCC\x11log2_sao_offset_scale_chroma',b'\x00\x11\x56\x11pps_act_y_qp_offset_plus5',b'\x00\x11\x56\x11pps_act_cb_qp_offset_plus5',b'\x00\x11\x56\x11pps_act_cr_qp_offset_plus3',b'\x00\x11\xCC\x11pps_num_palette_predictor_initializers',b'\x00\x11\xCC\x11luma_bit_depth_entry_minus8',b'\x00\x11\xCC\x11chroma_bit_depth_entry_minus8',b'\x00\x11\xCC\x11num_tile_columns_minus1',b'\x00\x11\xCC\x11num_tile_rows_minus1',b'\x00\x11\xCC\x11reserved1',b'\x00\x11\xCC\x11reserved2',b'\x00\x11\xA8\x11column_width_minus1',b'\x00\x11\xAA\x11row_height_minus1',b'\x00\x00\x1F\x11reserved3',b'\x00\x0B\x48\x11pScalingLists',b'\x00\x0B\x42\x11pPredictorPaletteEntries'),(b'\x00\x00\x0B\x41\x00\x00\x00\x02StdVideoH265PpsFlags',b'\x00\x00\x1F\x13\x00\x00\x00\x01dependent_slice_segments_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01output_flag_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01sign_data_hiding_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01cabac_init_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01constrained_intra_pred_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01transform_skip_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01cu_qp_delta_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01pps_slice_chroma_qp_offsets_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01weighted_pred_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01weighted_bipred_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01transquant_bypass_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01tiles_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01entropy_coding_sync_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01uniform_spacing_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01loop_filter_across_tiles_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01pps_loop_filter_across_slices_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01deblocking_filter_control_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01deblocking_filter_override_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01pps_deblocking_filter_disabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01pps_scaling_list_data_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01lists_modification_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01slice_segment_header_extension_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01pps_extension_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01cross_component_prediction_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01chroma_qp_offset_list_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01pps_curr_pic_ref_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01residual_adaptive_colour_transform_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01pps_slice_act_qp_offsets_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01pps_palette_predictor_initializers_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01monochrome_palette_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01pps_range_extension_flag'),(b'\x00\x00\x0B\x43\x00\x00\x00\x02StdVideoH265PredictorPaletteEntries',b'\x00\x11\xAE\x11PredictorPaletteEntries'),(b'\x00\x00\x0B\x46\x00\x00\x00\x02StdVideoH265ProfileTierLevel',b'\x00\x0B\x47\x11flags',b'\x00\x0B\x44\x11general_profile_idc',b'\x00\x0B\x3B\x11general_level_idc'),(b'\x00\x00\x0B\x47\x00\x00\x00\x02StdVideoH265ProfileTierLevelFlags',b'\x00\x00\x1F\x13\x00\x00\x00\x01general_tier_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01general_progressive_source_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01general_interlaced_source_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01general_non_packed_constraint_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01general_frame_only_constraint_flag'),(b'\x00\x00\x0B\x49\x00\x00\x00\x02StdVideoH265ScalingLists',b'\x00\x11\xDF\x11ScalingList4x4',b'\x00\x11\xE1\x11ScalingList8x8',b'\x00\x11\xE1\x11ScalingList16x16',b'\x00\x11\xD3\x11ScalingList32x32',b'\x00\x11\xDD\x11ScalingListDCCoef16x16',b'\x00\x11\xD1\x11ScalingListDCCoef32x32'),(b'\x00\x00\x0B\x4B\x00\x00\x00\x02StdVideoH265SequenceParameterSet',b'\x00\x0B\x52\x11flags',b'\x00\x0B\x35\x11chroma_format_idc',b'\x00\x00\x1F\x11pic_width_in_luma_samples',b'\x00\x00\x1F\x11pic_height_in_luma_samples',b'\x00\x11\xCC\x11sps_video_parameter_set_id',b'\x00\x11\xCC\x11sps_max_sub_layers_minus1',b'\x00\x11\xCC\x11sps_seq_parameter_set_id',b'\x00\x11\xCC\x11bit_depth_luma_minus8',b'\x00\x11\xCC\x11bit_depth_chroma_minus8',b'\x00\x11\xCC\x11log2_max_pic_order_cnt_lsb_minus4',b'\x00\x11\xCC\x11log2_min_luma_coding_block_size_minus3',b'\x00\x11\xCC\x11log2_diff_max_min_luma_coding_block_size',b'\x00\x11\xCC\x11log2_min_luma_transform_block_size_minus2',b'\x00\x11\xCC\x11log2_diff_max_min_luma_transform_block_size',b'\x00\x11\xCC\x11max_transform_hierarchy_depth_inter',b'\x00\x11\xCC\x11max_transform_hierarchy_depth_intra',b'\x00\x11\xCC\x11num_short_term_ref_pic_sets',b'\x00\x11\xCC\x11num_long_term_ref_pics_sps',b'\x00\x11\xCC\x11pcm_sample_bit_depth_luma_minus1',b'\x00\x11\xCC\x11pcm_sample_bit_depth_chroma_minus1',b'\x00\x11\xCC\x11log2_min_pcm_luma_coding_block_size_minus3',b'\x00\x11\xCC\x11log2_diff_max_min_pcm_luma_coding_block_size',b'\x00\x11\xCC\x11reserved1',b'\x00\x11\xCC\x11reserved2',b'\x00\x11\xCC\x11palette_max_size',b'\x00\x11\xCC\x11delta_palette_max_predictor_size',b'\x00\x11\xCC\x11motion_vector_resolution_control_idc',b'\x00\x11\xCC\x11sps_num_palette_predictor_initializers_minus1',b'\x00\x00\x1F\x11conf_win_left_offset',b'\x00\x00\x1F\x11conf_win_right_offset',b'\x00\x00\x1F\x11conf_win_top_offset',b'\x00\x00\x1F\x11conf_win_bottom_offset',b'\x00\x0B\x45\x11pProfileTierLevel',b'\x00\x0B\x36\x11pDecPicBufMgr',b'\x00\x0B\x48\x11pScalingLists',b'\x00\x0B\x4E\x11pShortTermRefPicSet',b'\x00\x0B\x3C\x11pLongTermRefPicsSps',b'\x00\x0B\x4C\x11pSequenceParameterSetVui',b'\x00\x0B\x42\x11pPredictorPaletteEntries'),(b'\x00\x00\x0B\x4D\x00\x00\x00\x02StdVideoH265SequenceParameterSetVui',b'\x00\x0B\x53\x11flags',b'\x00\x0B\x34\x11aspect_ratio_idc',b'\x00\x07\xD3\x11sar_width',b'\x00\x07\xD3\x11sar_height',b'\x00\x11\xCC\x11video_format',b'\x00\x11\xCC\x11colour_primaries',b'\x00\x11\xCC\x11transfer_characteristics',b'\x00\x11\xCC\x11matrix_coeffs',b'\x00\x11\xCC\x11chroma_sample_loc_type_top_field',b'\x00\x11\xCC\x11chroma_sample_loc_type_bottom_field',b'\x00\x11\xCC\x11reserved1',b'\x00\x11\xCC\x11reserved2',b'\x00\x07\xD3\x11def_disp_win_left_offset',b'\x00\x07\xD3\x11def_disp_win_right_offset',b'\x00\x07\xD3\x11def_disp_win_top_offset',b'\x00\x07\xD3\x11def_disp_win_bottom_offset',b'\x00\x00\x1F\x11vui_num_units_in_tick',b'\x00\x00\x1F\x11vui_time_scale',b'\x00\x00\x1F\x11vui_num_ticks_poc_diff_one_minus1',b'\x00\x07\xD3\x11min_spatial_segmentation_idc',b'\x00\x07\xD3\x11reserved3',b'\x00\x11\xCC\x11max_bytes_per_pic_denom',b'\x00\x11\xCC\x11max_bits_per_min_cu_denom',b'\x00\x11\xCC\x11log2_max_mv_length_horizontal',b'\x00\x11\xCC\x11log2_max_mv_length_vertical',b'\x00\x0B\x39\x11pHrdParameters'),(b'\x00\x00\x0B\x4F\x00\x00\x00\x02StdVideoH265ShortTermRefPicSet',b'\x00\x0B\x50\x11flags',b'\x00\x00\x1F\x11delta_idx_minus1',b'\x00\x07\xD3\x11use_delta_flag',b'\x00\x07\xD3\x11abs_delta_rps_minus1',b'\x00\x07\xD3\x11used_by_curr_pic_flag',b'\x00\x07\xD3\x11used_by_curr_pic_s0_flag',b'\x00\x07\xD3\x11used_by_curr_pic_s1_flag',b'\x00\x07\xD3\x11reserved1',b'\x00\x11\xCC\x11reserved2',b'\x00\x11\xCC\x11reserved3',b'\x00\x11\xCC\x11num_negative_pics',b'\x00\x11\xCC\x11num_positive_pics',b'\x00\x11\xA6\x11delta_poc_s0_minus1',b'\x00\x11\xA6\x11delta_poc_s1_minus1'),(b'\x00\x00\x0B\x50\x00\x00\x00\x02StdVideoH265ShortTermRefPicSetFlags',b'\x00\x00\x1F\x13\x00\x00\x00\x01inter_ref_pic_set_prediction_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01delta_rps_sign'),(b'\x00\x00\x0B\x52\x00\x00\x00\x02StdVideoH265SpsFlags',b'\x00\x00\x1F\x13\x00\x00\x00\x01sps_temporal_id_nesting_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01separate_colour_plane_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01conformance_window_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01sps_sub_layer_ordering_info_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01scaling_list_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01sps_scaling_list_data_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01amp_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01sample_adaptive_offset_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01pcm_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01pcm_loop_filter_disabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01long_term_ref_pics_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01sps_temporal_mvp_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01strong_intra_smoothing_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01vui_parameters_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01sps_extension_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01sps_range_extension_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01transform_skip_rotation_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01transform_skip_context_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01implicit_rdpcm_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01explicit_rdpcm_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01extended_precision_processing_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01intra_smoothing_disabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01high_precision_offsets_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01persistent_rice_adaptation_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01cabac_bypass_alignment_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01sps_scc_extension_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01sps_curr_pic_ref_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01palette_mode_enabled_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01sps_palette_predictor_initializers_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01intra_boundary_filtering_disabled_flag'),(b'\x00\x00\x0B\x53\x00\x00\x00\x02StdVideoH265SpsVuiFlags',b'\x00\x00\x1F\x13\x00\x00\x00\x01aspect_ratio_info_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01overscan_info_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01overscan_appropriate_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01video_signal_type_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01video_full_range_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01colour_description_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01chroma_loc_info_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01neutral_chroma_indication_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01field_seq_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01frame_field_info_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01default_display_window_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01vui_timing_info_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01vui_poc_proportional_to_timing_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01vui_hrd_parameters_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01bitstream_restriction_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01tiles_fixed_structure_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01motion_vectors_over_pic_boundaries_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01restricted_ref_pic_lists_flag'),(b'\x00\x00\x0B\x55\x00\x00\x00\x02StdVideoH265SubLayerHrdParameters',b'\x00\x11\xBC\x11bit_rate_value_minus1',b'\x00\x11\xBC\x11cpb_size_value_minus1',b'\x00\x11\xBC\x11cpb_size_du_value_minus1',b'\x00\x11\xBC\x11bit_rate_du_value_minus1',b'\x00\x00\x1F\x11cbr_flag'),(b'\x00\x00\x0B\x57\x00\x00\x00\x02StdVideoH265VideoParameterSet',b'\x00\x0B\x58\x11flags',b'\x00\x11\xCC\x11vps_video_parameter_set_id',b'\x00\x11\xCC\x11vps_max_sub_layers_minus1',b'\x00\x11\xCC\x11reserved1',b'\x00\x11\xCC\x11reserved2',b'\x00\x00\x1F\x11vps_num_units_in_tick',b'\x00\x00\x1F\x11vps_time_scale',b'\x00\x00\x1F\x11vps_num_ticks_poc_diff_one_minus1',b'\x00\x00\x1F\x11reserved3',b'\x00\x0B\x36\x11pDecPicBufMgr',b'\x00\x0B\x39\x11pHrdParameters',b'\x00\x0B\x45\x11pProfileTierLevel'),(b'\x00\x00\x0B\x58\x00\x00\x00\x02StdVideoH265VpsFlags',b'\x00\x00\x1F\x13\x00\x00\x00\x01vps_temporal_id_nesting_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01vps_sub_layer_ordering_info_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01vps_timing_info_present_flag',b'\x00\x00\x1F\x13\x00\x00\x00\x01vps_poc_proportional_to_timing_flag'),(b'\x00\x00\x0B\x59\x00\x00\x00\x02VkAabbPositionsKHR',b'\x00\x06\x63\x11minX',b'\x00\x06\x63\x11minY',b'\x00\x06\x63\x11minZ',b'\x00\x06\x63\x11maxX',b'\x00\x06\x63\x11maxY',b'\x00\x06\x63\x11maxZ'),(b'\x00\x00\x0B\x5A\x00\x00\x00\x02VkAccelerationStructureBuildGeometryInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0B\x77\x11type',b'\x00\x00\x1F\x11flags',b'\x00\x0B\xC5\x11mode',b'\x00\x08\xFE\x11srcAccelerationStructure',b'\x00\x08\xFE\x11dstAccelerationStructure',b'\x00\x00\x1F\x11geometryCount',b'\x00\x0B\x68\x11pGeometries',b'\x00\x0B\x67\x11ppGeometries',b'\x00\x0C\x67\x11scratchData'),(b'\x00\x00\x0B\x5C\x00\x00\x00\x02VkAccelerationStructureBuildRangeInfoKHR',b'\x00\x00\x1F\x11primitiveCount',b'\x00\x00\x1F\x11primitiveOffset',b'\x00\x00\x1F\x11firstVertex',b'\x00\x00\x1F\x11transformOffset'),(b'\x00\x00\x0B\x5D\x00\x00\x00\x02VkAccelerationStructureBuildSizesInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x43\x11accelerationStructureSize',b'\x00\x01\x43\x11updateScratchSize',b'\x00\x01\x43\x11buildScratchSize'),(b'\x00\x00\x0B\x5E\x00\x00\x00\x02VkAccelerationStructureCaptureDescriptorDataInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x08\xFE\x11accelerationStructure',b'\x00\x01\xF6\x11accelerationStructureNV'),(b'\x00\x00\x0B\x61\x00\x00\x00\x02VkAccelerationStructureCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11createFlags',b'\x00\x01\xFC\x11buffer',b'\x00\x01\x43\x11offset',b'\x00\x01\x43\x11size',b'\x00\x0B\x77\x11type',b'\x00\x01\x43\x11deviceAddress'),(b'\x00\x00\x0B\x62\x00\x00\x00\x02VkAccelerationStructureCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x43\x11compactedSize',b'\x00\x0B\x6C\x11info'),(b'\x00\x00\x0B\x63\x00\x00\x00\x02VkAccelerationStructureDeviceAddressInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x08\xFE\x11accelerationStructure'),(b'\x00\x00\x0B\x64\x00\x00\x00\x02VkAccelerationStructureGeometryAabbsDataKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0C\x66\x11data',b'\x00\x01\x43\x11stride'),(b'\x00\x00\x0B\x65\x00\x00\x00\x03VkAccelerationStructureGeometryDataKHR',b'\x00\x0B\x6B\x11triangles',b'\x00\x0B\x64\x11aabbs',b'\x00\x0B\x66\x11instances'),(b'\x00\x00\x0B\x66\x00\x00\x00\x02VkAccelerationStructureGeometryInstancesDataKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11arrayOfPointers',b'\x00\x0C\x66\x11data'),(b'\x00\x00\x0B\x69\x00\x00\x00\x02VkAccelerationStructureGeometryKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0C\xD6\x11geometryType',b'\x00\x0B\x65\x11geometry',b'\x00\x00\x1F\x11flags'),(b'\x00\x00\x0B\x6A\x00\x00\x00\x02VkAccelerationStructureGeometryMotionTrianglesDataNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0C\x66\x11vertexData'),(b'\x00\x00\x0B\x6B\x00\x00\x00\x02VkAccelerationStructureGeometryTrianglesDataKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x03\xD2\x11vertexFormat',b'\x00\x0C\x66\x11vertexData',b'\x00\x01\x43\x11vertexStride',b'\x00\x00\x1F\x11maxVertex',b'\x00\x06\x8E\x11indexType',b'\x00\x0C\x66\x11indexData',b'\x00\x0C\x66\x11transformData'),(b'\x00\x00\x0B\x6C\x00\x00\x00\x02VkAccelerationStructureInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0B\x77\x11type',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11instanceCount',b'\x00\x00\x1F\x11geometryCount',b'\x00\x0C\xD3\x11pGeometries'),(b'\x00\x00\x0B\x6D\x00\x00\x00\x02VkAccelerationStructureInstanceKHR',b'\x00\x10\xBC\x11transform',b'\x00\x00\x1F\x13\x00\x00\x00\x18instanceCustomIndex',b'\x00\x00\x1F\x13\x00\x00\x00\x08mask',b'\x00\x00\x1F\x13\x00\x00\x00\x18instanceShaderBindingTableRecordOffset',b'\x00\x00\x1F\x13\x00\x00\x00\x08flags',b'\x00\x01\x43\x11accelerationStructureReference'),(b'\x00\x00\x11\x65\x00\x00\x00\x10VkAccelerationStructureKHR_T',),(b'\x00\x00\x0B\x6E\x00\x00\x00\x02VkAccelerationStructureMatrixMotionInstanceNV',b'\x00\x10\xBC\x11transformT0',b'\x00\x10\xBC\x11transformT1',b'\x00\x00\x1F\x13\x00\x00\x00\x18instanceCustomIndex',b'\x00\x00\x1F\x13\x00\x00\x00\x08mask',b'\x00\x00\x1F\x13\x00\x00\x00\x18instanceShaderBindingTableRecordOffset',b'\x00\x00\x1F\x13\x00\x00\x00\x08flags',b'\x00\x01\x43\x11accelerationStructureReference'),(b'\x00\x00\x0B\x6F\x00\x00\x00\x02VkAccelerationStructureMemoryRequirementsInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0B\x70\x11type',b'\x00\x01\xF6\x11accelerationStructure'),(b'\x00\x00\x0B\x71\x00\x00\x00\x02VkAccelerationStructureMotionInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11maxInstances',b'\x00\x00\x1F\x11flags'),(b'\x00\x00\x0B\x72\x00\x00\x00\x03VkAccelerationStructureMotionInstanceDataNV',b'\x00\x0B\x6D\x11staticInstance',b'\x00\x0B\x6E\x11matrixMotionInstance',b'\x00\x0B\x75\x11srtMotionInstance'),(b'\x00\x00\x0B\x73\x00\x00\x00\x02VkAccelerationStructureMotionInstanceNV',b'\x00\x0B\x74\x11type',b'\x00\x00\x1F\x11flags',b'\x00\x0B\x72\x11data'),(b'\x00\x00\x11\x66\x00\x00\x00\x10VkAccelerationStructureNV_T',),(b'\x00\x00\x0B\x75\x00\x00\x00\x02VkAccelerationStructureSRTMotionInstanceNV',b'\x00\x10\x37\x11transformT0',b'\x00\x10\x37\x11transformT1',b'\x00\x00\x1F\x13\x00\x00\x00\x18instanceCustomIndex',b'\x00\x00\x1F\x13\x00\x00\x00\x08mask',b'\x00\x00\x1F\x13\x00\x00\x00\x18instanceShaderBindingTableRecordOffset',b'\x00\x00\x1F\x13\x00\x00\x00\x08flags',b'\x00\x01\x43\x11accelerationStructureReference'),(b'\x00\x00\x0B\x76\x00\x00\x00\x02VkAccelerationStructureTrianglesOpacityMicromapEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x06\x8E\x11indexType',b'\x00\x0C\x66\x11indexBuffer',b'\x00\x01\x43\x11indexStride',b'\x00\x00\x1F\x11baseTriangle',b'\x00\x00\x1F\x11usageCountsCount',b'\x00\x0D\x61\x11pUsageCounts',b'\x00\x0D\x60\x11ppUsageCounts',b'\x00\x09\xAD\x11micromap'),(b'\x00\x00\x0B\x78\x00\x00\x00\x02VkAccelerationStructureVersionInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x11\xCB\x11pVersionData'),(b'\x00\x00\x0B\x7A\x00\x00\x00\x02VkAcquireNextImageInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\xEB\x11swapchain',b'\x00\x01\x43\x11timeout',b'\x00\x02\xDB\x11semaphore',b'\x00\x02\x6E\x11fence',b'\x00\x00\x1F\x11deviceMask'),(b'\x00\x00\x0B\x7C\x00\x00\x00\x02VkAcquireProfilingLockInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x01\x43\x11timeout'),(b'\x00\x00\x0B\x7D\x00\x00\x00\x02VkAllocationCallbacks',b'\x00\x00\x27\x11pUserData',b'\x00\x11\xE7\x11pfnAllocation',b'\x00\x11\xE8\x11pfnReallocation',b'\x00\x12\xF2\x11pfnFree',b'\x00\x12\xF1\x11pfnInternalAllocation',b'\x00\x12\xF1\x11pfnInternalFree'),(b'\x00\x00\x0B\x7E\x00\x00\x00\x02VkAmigoProfilingSubmitInfoSEC',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x43\x11firstDrawTimestamp',b'\x00\x01\x43\x11swapBufferTimestamp'),(b'\x00\x00\x0B\x7F\x00\x00\x00\x02VkAndroidHardwareBufferFormatProperties2ANDROID',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x03\xD2\x11format',b'\x00\x01\x43\x11externalFormat',b'\x00\x01\x43\x11formatFeatures',b'\x00\x0B\xE9\x11samplerYcbcrConversionComponents',b'\x00\x10\x4B\x11suggestedYcbcrModel',b'\x00\x10\x4C\x11suggestedYcbcrRange',b'\x00\x0B\xCB\x11suggestedXChromaOffset',b'\x00\x0B\xCB\x11suggestedYChromaOffset'),(b'\x00\x00\x0B\x80\x00\x00\x00\x02VkAndroidHardwareBufferFormatPropertiesANDROID',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x03\xD2\x11format',b'\x00\x01\x43\x11externalFormat',b'\x00\x00\x1F\x11formatFeatures',b'\x00\x0B\xE9\x11samplerYcbcrConversionComponents',b'\x00\x10\x4B\x11suggestedYcbcrModel',b'\x00\x10\x4C\x11suggestedYcbcrRange',b'\x00\x0B\xCB\x11suggestedXChromaOffset',b'\x00\x0B\xCB\x11suggestedYChromaOffset'),(b'\x00\x00\x0B\x81\x00\x00\x00\x02VkAndroidHardwareBufferFormatResolvePropertiesANDROID',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x03\xD2\x11colorAttachmentFormat'),(b'\x00\x00\x0B\x82\x00\x00\x00\x02VkAndroidHardwareBufferPropertiesANDROID',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\x43\x11allocationSize',b'\x00\x00\x1F\x11memoryTypeBits'),(b'\x00\x00\x0B\x83\x00\x00\x00\x02VkAndroidHardwareBufferUsageANDROID',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\x43\x11androidHardwareBufferUsage'),(b'\x00\x00\x0B\x84\x00\x00\x00\x02VkAndroidSurfaceCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x0A\xDA\x11window'),(b'\x00\x00\x0B\x86\x00\x00\x00\x02VkApplicationInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x06\x11pApplicationName',b'\x00\x00\x1F\x11applicationVersion',b'\x00\x00\x06\x11pEngineName',b'\x00\x00\x1F\x11engineVersion',b'\x00\x00\x1F\x11apiVersion'),(b'\x00\x00\x0B\x8A\x00\x00\x00\x02VkAttachmentDescription',b'\x00\x00\x1F\x11flags',b'\x00\x03\xD2\x11format',b'\x00\x06\x17\x11samples',b'\x00\x0B\x8D\x11loadOp',b'\x00\x0B\x96\x11storeOp',b'\x00\x0B\x8D\x11stencilLoadOp',b'\x00\x0B\x96\x11stencilStoreOp',b'\x00\x02\x8B\x11initialLayout',b'\x00\x02\x8B\x11finalLayout'),(b'\x00\x00\x0B\x89\x00\x00\x00\x02VkAttachmentDescription2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x03\xD2\x11format',b'\x00\x06\x17\x11samples',b'\x00\x0B\x8D\x11loadOp',b'\x00\x0B\x96\x11storeOp',b'\x00\x0B\x8D\x11stencilLoadOp',b'\x00\x0B\x96\x11stencilStoreOp',b'\x00\x02\x8B\x11initialLayout',b'\x00\x02\x8B\x11finalLayout'),(b'\x00\x00\x0B\x8C\x00\x00\x00\x02VkAttachmentDescriptionStencilLayout',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x02\x8B\x11stencilInitialLayout',b'\x00\x02\x8B\x11stencilFinalLayout'),(b'\x00\x00\x0B\x91\x00\x00\x00\x02VkAttachmentReference',b'\x00\x00\x1F\x11attachment',b'\x00\x02\x8B\x11layout'),(b'\x00\x00\x0B\x90\x00\x00\x00\x02VkAttachmentReference2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11attachment',b'\x00\x02\x8B\x11layout',b'\x00\x00\x1F\x11aspectMask'),(b'\x00\x00\x0B\x92\x00\x00\x00\x02VkAttachmentReferenceStencilLayout',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x02\x8B\x11stencilLayout'),(b'\x00\x00\x0B\x93\x00\x00\x00\x02VkAttachmentSampleCountInfoAMD',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11colorAttachmentCount',b'\x00\x10\x38\x11pColorAttachmentSamples',b'\x00\x06\x17\x11depthStencilAttachmentSamples'),(b'\x00\x00\x0B\x95\x00\x00\x00\x02VkAttachmentSampleLocationsEXT',b'\x00\x00\x1F\x11attachmentIndex',b'\x00\x10\x3B\x11sampleLocationsInfo'),(b'\x00\x00\x0B\x98\x00\x00\x00\x02VkBaseInStructure',b'\x00\x10\x82\x11sType',b'\x00\x0B\x97\x11pNext'),(b'\x00\x00\x0B\x99\x00\x00\x00\x02VkBaseOutStructure',b'\x00\x10\x82\x11sType',b'\x00\x01\x71\x11pNext'),(b'\x00\x00\x0B\x9A\x00\x00\x00\x02VkBindAccelerationStructureMemoryInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\xF6\x11accelerationStructure',b'\x00\x01\xFD\x11memory',b'\x00\x01\x43\x11memoryOffset',b'\x00\x00\x1F\x11deviceIndexCount',b'\x00\x05\xC8\x11pDeviceIndices'),(b'\x00\x00\x0B\x9B\x00\x00\x00\x02VkBindBufferMemoryDeviceGroupInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11deviceIndexCount',b'\x00\x05\xC8\x11pDeviceIndices'),(b'\x00\x00\x0B\x9C\x00\x00\x00\x02VkBindBufferMemoryInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\xFC\x11buffer',b'\x00\x01\xFD\x11memory',b'\x00\x01\x43\x11memoryOffset'),(b'\x00\x00\x0B\x9D\x00\x00\x00\x02VkBindDescriptorBufferEmbeddedSamplersInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11stageFlags',b'\x00\x05\xB5\x11layout',b'\x00\x00\x1F\x11set'),(b'\x00\x00\x0B\x9E\x00\x00\x00\x02VkBindDescriptorSetsInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11stageFlags',b'\x00\x05\xB5\x11layout',b'\x00\x00\x1F\x11firstSet',b'\x00\x00\x1F\x11descriptorSetCount',b'\x00\x02\x4C\x11pDescriptorSets',b'\x00\x00\x1F\x11dynamicOffsetCount',b'\x00\x05\xC8\x11pDynamicOffsets'),(b'\x00\x00\x0B\x9F\x00\x00\x00\x02VkBindImageMemoryDeviceGroupInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11deviceIndexCount',b'\x00\x05\xC8\x11pDeviceIndices',b'\x00\x00\x1F\x11splitInstanceBindRegionCount',b'\x00\x07\x7F\x11pSplitInstanceBindRegions'),(b'\x00\x00\x0B\xA0\x00\x00\x00\x02VkBindImageMemoryInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\x7D\x11image',b'\x00\x01\xFD\x11memory',b'\x00\x01\x43\x11memoryOffset'),(b'\x00\x00\x0B\xA1\x00\x00\x00\x02VkBindImageMemorySwapchainInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\xEB\x11swapchain',b'\x00\x00\x1F\x11imageIndex'),(b'\x00\x00\x0B\xA2\x00\x00\x00\x02VkBindImagePlaneMemoryInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0C\xE3\x11planeAspect'),(b'\x00\x00\x0B\xA3\x00\x00\x00\x02VkBindIndexBufferIndirectCommandNV',b'\x00\x01\x43\x11bufferAddress',b'\x00\x00\x1F\x11size',b'\x00\x06\x8E\x11indexType'),(b'\x00\x00\x0B\xA4\x00\x00\x00\x02VkBindMemoryStatusKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0F\x57\x11pResult'),(b'\x00\x00\x0B\xA5\x00\x00\x00\x02VkBindPipelineIndirectCommandNV',b'\x00\x01\x43\x11pipelineAddress'),(b'\x00\x00\x0B\xA6\x00\x00\x00\x02VkBindShaderGroupIndirectCommandNV',b'\x00\x00\x1F\x11groupIndex'),(b'\x00\x00\x0B\xA7\x00\x00\x00\x02VkBindSparseInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11waitSemaphoreCount',b'\x00\x11\x98\x11pWaitSemaphores',b'\x00\x00\x1F\x11bufferBindCount',b'\x00\x10\x6B\x11pBufferBinds',b'\x00\x00\x1F\x11imageOpaqueBindCount',b'\x00\x10\x76\x11pImageOpaqueBinds',b'\x00\x00\x1F\x11imageBindCount',b'\x00\x10\x72\x11pImageBinds',b'\x00\x00\x1F\x11signalSemaphoreCount',b'\x00\x11\x98\x11pSignalSemaphores'),(b'\x00\x00\x0B\xA8\x00\x00\x00\x02VkBindVertexBufferIndirectCommandNV',b'\x00\x01\x43\x11bufferAddress',b'\x00\x00\x1F\x11size',b'\x00\x00\x1F\x11stride'),(b'\x00\x00\x0B\xA9\x00\x00\x00\x02VkBindVideoSessionMemoryInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11memoryBindIndex',b'\x00\x01\xFD\x11memory',b'\x00\x01\x43\x11memoryOffset',b'\x00\x01\x43\x11memorySize'),(b'\x00\x00\x0B\xAD\x00\x00\x00\x02VkBlitImageCubicWeightsInfoQCOM',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0C\x09\x11cubicWeights'),(b'\x00\x00\x0B\xAE\x00\x00\x00\x02VkBlitImageInfo2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\x7D\x11srcImage',b'\x00\x02\x8B\x11srcImageLayout',b'\x00\x02\x7D\x11dstImage',b'\x00\x02\x8B\x11dstImageLayout',b'\x00\x00\x1F\x11regionCount',b'\x00\x0C\xE4\x11pRegions',b'\x00\x07\x01\x11filter'),(b'\x00\x00\x0B\xB1\x00\x00\x00\x02VkBufferCaptureDescriptorDataInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\xFC\x11buffer'),(b'\x00\x00\x0B\xB4\x00\x00\x00\x02VkBufferCopy',b'\x00\x01\x43\x11srcOffset',b'\x00\x01\x43\x11dstOffset',b'\x00\x01\x43\x11size'),(b'\x00\x00\x0B\xB3\x00\x00\x00\x02VkBufferCopy2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x43\x11srcOffset',b'\x00\x01\x43\x11dstOffset',b'\x00\x01\x43\x11size'),(b'\x00\x00\x0B\xB6\x00\x00\x00\x02VkBufferCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x01\x43\x11size',b'\x00\x00\x1F\x11usage',b'\x00\x10\x6A\x11sharingMode',b'\x00\x00\x1F\x11queueFamilyIndexCount',b'\x00\x05\xC8\x11pQueueFamilyIndices'),(b'\x00\x00\x0B\xB7\x00\x00\x00\x02VkBufferDeviceAddressCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x43\x11deviceAddress'),(b'\x00\x00\x0B\xB8\x00\x00\x00\x02VkBufferDeviceAddressInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\xFC\x11buffer'),(b'\x00\x00\x0B\xBB\x00\x00\x00\x02VkBufferImageCopy',b'\x00\x01\x43\x11bufferOffset',b'\x00\x00\x1F\x11bufferRowLength',b'\x00\x00\x1F\x11bufferImageHeight',b'\x00\x0D\x04\x11imageSubresource',b'\x00\x0D\x6F\x11imageOffset',b'\x00\x0C\xA1\x11imageExtent'),(b'\x00\x00\x0B\xBA\x00\x00\x00\x02VkBufferImageCopy2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x43\x11bufferOffset',b'\x00\x00\x1F\x11bufferRowLength',b'\x00\x00\x1F\x11bufferImageHeight',b'\x00\x0D\x04\x11imageSubresource',b'\x00\x0D\x6F\x11imageOffset',b'\x00\x0C\xA1\x11imageExtent'),(b'\x00\x00\x0B\xBE\x00\x00\x00\x02VkBufferMemoryBarrier',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11srcAccessMask',b'\x00\x00\x1F\x11dstAccessMask',b'\x00\x00\x1F\x11srcQueueFamilyIndex',b'\x00\x00\x1F\x11dstQueueFamilyIndex',b'\x00\x01\xFC\x11buffer',b'\x00\x01\x43\x11offset',b'\x00\x01\x43\x11size'),(b'\x00\x00\x0B\xBD\x00\x00\x00\x02VkBufferMemoryBarrier2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x43\x11srcStageMask',b'\x00\x01\x43\x11srcAccessMask',b'\x00\x01\x43\x11dstStageMask',b'\x00\x01\x43\x11dstAccessMask',b'\x00\x00\x1F\x11srcQueueFamilyIndex',b'\x00\x00\x1F\x11dstQueueFamilyIndex',b'\x00\x01\xFC\x11buffer',b'\x00\x01\x43\x11offset',b'\x00\x01\x43\x11size'),(b'\x00\x00\x0B\xBF\x00\x00\x00\x02VkBufferMemoryRequirementsInfo2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\xFC\x11buffer'),(b'\x00\x00\x0B\xC0\x00\x00\x00\x02VkBufferOpaqueCaptureAddressCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x43\x11opaqueCaptureAddress'),(b'\x00\x00\x0B\xC2\x00\x00\x00\x02VkBufferUsageFlags2CreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x43\x11usage'),(b'\x00\x00\x0B\xC3\x00\x00\x00\x02VkBufferViewCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x01\xFC\x11buffer',b'\x00\x03\xD2\x11format',b'\x00\x01\x43\x11offset',b'\x00\x01\x43\x11range'),(b'\x00\x00\x11\x68\x00\x00\x00\x10VkBufferView_T',),(b'\x00\x00\x11\x69\x00\x00\x00\x10VkBuffer_T',),(b'\x00\x00\x0B\xC8\x00\x00\x00\x02VkCalibratedTimestampInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x10\xB7\x11timeDomain'),(b'\x00\x00\x0B\xC9\x00\x00\x00\x02VkCheckpointData2NV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\x43\x11stage',b'\x00\x00\x27\x11pCheckpointMarker'),(b'\x00\x00\x0B\xCA\x00\x00\x00\x02VkCheckpointDataNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x05\xE0\x11stage',b'\x00\x00\x27\x11pCheckpointMarker'),(b'\x00\x00\x0B\xCC\x00\x00\x00\x02VkClearAttachment',b'\x00\x00\x1F\x11aspectMask',b'\x00\x00\x1F\x11colorAttachment',b'\x00\x0B\xD1\x11clearValue'),(b'\x00\x00\x0B\xCD\x00\x00\x00\x03VkClearColorValue',b'\x00\x11\x4F\x11float32',b'\x00\x11\x53\x11int32',b'\x00\x11\xC0\x11uint32'),(b'\x00\x00\x0B\xCE\x00\x00\x00\x02VkClearDepthStencilValue',b'\x00\x06\x63\x11depth',b'\x00\x00\x1F\x11stencil'),(b'\x00\x00\x0B\xCF\x00\x00\x00\x02VkClearRect',b'\x00\x0F\x34\x11rect',b'\x00\x00\x1F\x11baseArrayLayer',b'\x00\x00\x1F\x11layerCount'),(b'\x00\x00\x0B\xD1\x00\x00\x00\x03VkClearValue',b'\x00\x0B\xCD\x11color',b'\x00\x0B\xCE\x11depthStencil'),(b'\x00\x00\x0B\xD3\x00\x00\x00\x02VkCoarseSampleLocationNV',b'\x00\x00\x1F\x11pixelX',b'\x00\x00\x1F\x11pixelY',b'\x00\x00\x1F\x11sample'),(b'\x00\x00\x0B\xD4\x00\x00\x00\x02VkCoarseSampleOrderCustomNV',b'\x00\x10\x67\x11shadingRate',b'\x00\x00\x1F\x11sampleCount',b'\x00\x00\x1F\x11sampleLocationCount',b'\x00\x0B\xD2\x11pSampleLocations'),(b'\x00\x00\x0B\xD5\x00\x00\x00\x02VkColorBlendAdvancedEXT',b'\x00\x0B\xAB\x11advancedBlendOp',b'\x00\x00\x1F\x11srcPremultiplied',b'\x00\x00\x1F\x11dstPremultiplied',b'\x00\x0B\xAC\x11blendOverlap',b'\x00\x00\x1F\x11clampResults'),(b'\x00\x00\x0B\xD6\x00\x00\x00\x02VkColorBlendEquationEXT',b'\x00\x0B\xAA\x11srcColorBlendFactor',b'\x00\x0B\xAA\x11dstColorBlendFactor',b'\x00\x0B\xAB\x11colorBlendOp',b'\x00\x0B\xAA\x11srcAlphaBlendFactor',b'\x00\x0B\xAA\x11dstAlphaBlendFactor',b'\x00\x0B\xAB\x11alphaBlendOp'),(b'\x00\x00\x0B\xD9\x00\x00\x00\x02VkCommandBufferAllocateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\x02\x11commandPool',b'\x00\x0B\xE1\x11level',b'\x00\x00\x1F\x11commandBufferCount'),(b'\x00\x00\x0B\xDA\x00\x00\x00\x02VkCommandBufferBeginInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x0B\xDC\x11pInheritanceInfo'),(b'\x00\x00\x0B\xDB\x00\x00\x00\x02VkCommandBufferInheritanceConditionalRenderingInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11conditionalRenderingEnable'),(b'\x00\x00\x0B\xDD\x00\x00\x00\x02VkCommandBufferInheritanceInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\xD6\x11renderPass',b'\x00\x00\x1F\x11subpass',b'\x00\x02\x72\x11framebuffer',b'\x00\x00\x1F\x11occlusionQueryEnable',b'\x00\x00\x1F\x11queryFlags',b'\x00\x00\x1F\x11pipelineStatistics'),(b'\x00\x00\x0B\xDE\x00\x00\x00\x02VkCommandBufferInheritanceRenderPassTransformInfoQCOM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x10\xAA\x11transform',b'\x00\x0F\x34\x11renderArea'),(b'\x00\x00\x0B\xDF\x00\x00\x00\x02VkCommandBufferInheritanceRenderingInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11viewMask',b'\x00\x00\x1F\x11colorAttachmentCount',b'\x00\x0C\xBA\x11pColorAttachmentFormats',b'\x00\x03\xD2\x11depthAttachmentFormat',b'\x00\x03\xD2\x11stencilAttachmentFormat',b'\x00\x06\x17\x11rasterizationSamples'),(b'\x00\x00\x0B\xE0\x00\x00\x00\x02VkCommandBufferInheritanceViewportScissorInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11viewportScissor2D',b'\x00\x00\x1F\x11viewportDepthCount',b'\x00\x07\x99\x11pViewportDepths'),(b'\x00\x00\x0B\xE4\x00\x00\x00\x02VkCommandBufferSubmitInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x0B\x11commandBuffer',b'\x00\x00\x1F\x11deviceMask'),(b'\x00\x00\x11\x6A\x00\x00\x00\x10VkCommandBuffer_T',),(b'\x00\x00\x0B\xE7\x00\x00\x00\x02VkCommandPoolCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11queueFamilyIndex'),(b'\x00\x00\x11\x6B\x00\x00\x00\x10VkCommandPool_T',),(b'\x00\x00\x0B\xE9\x00\x00\x00\x02VkComponentMapping',b'\x00\x0B\xEA\x11r',b'\x00\x0B\xEA\x11g',b'\x00\x0B\xEA\x11b',b'\x00\x0B\xEA\x11a'),(b'\x00\x00\x0B\xED\x00\x00\x00\x02VkComputePipelineCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x0E\xEF\x11stage',b'\x00\x05\xB5\x11layout',b'\x00\x02\xB7\x11basePipelineHandle',b'\x00\x04\x17\x11basePipelineIndex'),(b'\x00\x00\x0B\xEE\x00\x00\x00\x02VkComputePipelineIndirectBufferInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x43\x11deviceAddress',b'\x00\x01\x43\x11size',b'\x00\x01\x43\x11pipelineDeviceAddressCaptureReplay'),(b'\x00\x00\x0B\xEF\x00\x00\x00\x02VkConditionalRenderingBeginInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\xFC\x11buffer',b'\x00\x01\x43\x11offset',b'\x00\x00\x1F\x11flags'),(b'\x00\x00\x0B\xF1\x00\x00\x00\x02VkConformanceVersion',b'\x00\x11\xCC\x11major',b'\x00\x11\xCC\x11minor',b'\x00\x11\xCC\x11subminor',b'\x00\x11\xCC\x11patch'),(b'\x00\x00\x0B\xF2\x00\x00\x00\x02VkCooperativeMatrixPropertiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11MSize',b'\x00\x00\x1F\x11NSize',b'\x00\x00\x1F\x11KSize',b'\x00\x0B\xEB\x11AType',b'\x00\x0B\xEB\x11BType',b'\x00\x0B\xEB\x11CType',b'\x00\x0B\xEB\x11ResultType',b'\x00\x00\x1F\x11saturatingAccumulation',b'\x00\x10\x4D\x11scope'),(b'\x00\x00\x0B\xF3\x00\x00\x00\x02VkCooperativeMatrixPropertiesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11MSize',b'\x00\x00\x1F\x11NSize',b'\x00\x00\x1F\x11KSize',b'\x00\x0B\xEB\x11AType',b'\x00\x0B\xEB\x11BType',b'\x00\x0B\xEB\x11CType',b'\x00\x0B\xEB\x11DType',b'\x00\x10\x4D\x11scope'),(b'\x00\x00\x0B\xF4\x00\x00\x00\x02VkCopyAccelerationStructureInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x08\xFE\x11src',b'\x00\x08\xFE\x11dst',b'\x00\x06\x74\x11mode'),(b'\x00\x00\x0B\xF5\x00\x00\x00\x02VkCopyAccelerationStructureToMemoryInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x08\xFE\x11src',b'\x00\x0C\x67\x11dst',b'\x00\x06\x74\x11mode'),(b'\x00\x00\x0B\xF6\x00\x00\x00\x02VkCopyBufferInfo2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\xFC\x11srcBuffer',b'\x00\x01\xFC\x11dstBuffer',b'\x00\x00\x1F\x11regionCount',b'\x00\x0B\xB2\x11pRegions'),(b'\x00\x00\x0B\xF7\x00\x00\x00\x02VkCopyBufferToImageInfo2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\xFC\x11srcBuffer',b'\x00\x02\x7D\x11dstImage',b'\x00\x02\x8B\x11dstImageLayout',b'\x00\x00\x1F\x11regionCount',b'\x00\x0B\xB9\x11pRegions'),(b'\x00\x00\x0B\xF8\x00\x00\x00\x02VkCopyCommandTransformInfoQCOM',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x10\xAA\x11transform'),(b'\x00\x00\x0B\xF9\x00\x00\x00\x02VkCopyDescriptorSet',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x09\x55\x11srcSet',b'\x00\x00\x1F\x11srcBinding',b'\x00\x00\x1F\x11srcArrayElement',b'\x00\x09\x55\x11dstSet',b'\x00\x00\x1F\x11dstBinding',b'\x00\x00\x1F\x11dstArrayElement',b'\x00\x00\x1F\x11descriptorCount'),(b'\x00\x00\x0B\xFA\x00\x00\x00\x02VkCopyImageInfo2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\x7D\x11srcImage',b'\x00\x02\x8B\x11srcImageLayout',b'\x00\x02\x7D\x11dstImage',b'\x00\x02\x8B\x11dstImageLayout',b'\x00\x00\x1F\x11regionCount',b'\x00\x0C\xEC\x11pRegions'),(b'\x00\x00\x0B\xFB\x00\x00\x00\x02VkCopyImageToBufferInfo2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\x7D\x11srcImage',b'\x00\x02\x8B\x11srcImageLayout',b'\x00\x01\xFC\x11dstBuffer',b'\x00\x00\x1F\x11regionCount',b'\x00\x0B\xB9\x11pRegions'),(b'\x00\x00\x0B\xFC\x00\x00\x00\x02VkCopyImageToImageInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x02\x7D\x11srcImage',b'\x00\x02\x8B\x11srcImageLayout',b'\x00\x02\x7D\x11dstImage',b'\x00\x02\x8B\x11dstImageLayout',b'\x00\x00\x1F\x11regionCount',b'\x00\x0C\xEC\x11pRegions'),(b'\x00\x00\x0B\xFD\x00\x00\x00\x02VkCopyImageToMemoryInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x02\x7D\x11srcImage',b'\x00\x02\x8B\x11srcImageLayout',b'\x00\x00\x1F\x11regionCount',b'\x00\x0D\x07\x11pRegions'),(b'\x00\x00\x0B\xFE\x00\x00\x00\x02VkCopyMemoryIndirectCommandNV',b'\x00\x01\x43\x11srcAddress',b'\x00\x01\x43\x11dstAddress',b'\x00\x01\x43\x11size'),(b'\x00\x00\x0B\xFF\x00\x00\x00\x02VkCopyMemoryToAccelerationStructureInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0C\x66\x11src',b'\x00\x08\xFE\x11dst',b'\x00\x06\x74\x11mode'),(b'\x00\x00\x0C\x00\x00\x00\x00\x02VkCopyMemoryToImageIndirectCommandNV',b'\x00\x01\x43\x11srcAddress',b'\x00\x00\x1F\x11bufferRowLength',b'\x00\x00\x1F\x11bufferImageHeight',b'\x00\x0D\x04\x11imageSubresource',b'\x00\x0D\x6F\x11imageOffset',b'\x00\x0C\xA1\x11imageExtent'),(b'\x00\x00\x0C\x01\x00\x00\x00\x02VkCopyMemoryToImageInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x02\x7D\x11dstImage',b'\x00\x02\x8B\x11dstImageLayout',b'\x00\x00\x1F\x11regionCount',b'\x00\x0D\x53\x11pRegions'),(b'\x00\x00\x0C\x02\x00\x00\x00\x02VkCopyMemoryToMicromapInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0C\x66\x11src',b'\x00\x09\xAD\x11dst',b'\x00\x0C\x04\x11mode'),(b'\x00\x00\x0C\x03\x00\x00\x00\x02VkCopyMicromapInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x09\xAD\x11src',b'\x00\x09\xAD\x11dst',b'\x00\x0C\x04\x11mode'),(b'\x00\x00\x0C\x05\x00\x00\x00\x02VkCopyMicromapToMemoryInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x09\xAD\x11src',b'\x00\x0C\x67\x11dst',b'\x00\x0C\x04\x11mode'),(b'\x00\x00\x0C\x06\x00\x00\x00\x02VkCuFunctionCreateInfoNVX',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x09\x2C\x11module',b'\x00\x00\x06\x11pName'),(b'\x00\x00\x11\x6C\x00\x00\x00\x10VkCuFunctionNVX_T',),(b'\x00\x00\x0C\x07\x00\x00\x00\x02VkCuLaunchInfoNVX',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x09\x27\x11function',b'\x00\x00\x1F\x11gridDimX',b'\x00\x00\x1F\x11gridDimY',b'\x00\x00\x1F\x11gridDimZ',b'\x00\x00\x1F\x11blockDimX',b'\x00\x00\x1F\x11blockDimY',b'\x00\x00\x1F\x11blockDimZ',b'\x00\x00\x1F\x11sharedMemBytes',b'\x00\x01\xF7\x11paramCount',b'\x00\x11\xE9\x11pParams',b'\x00\x01\xF7\x11extraCount',b'\x00\x11\xE9\x11pExtras'),(b'\x00\x00\x0C\x08\x00\x00\x00\x02VkCuModuleCreateInfoNVX',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\xF7\x11dataSize',b'\x00\x00\xCE\x11pData'),(b'\x00\x00\x11\x6D\x00\x00\x00\x10VkCuModuleNVX_T',),(b'\x00\x00\x0C\x0A\x00\x00\x00\x02VkCudaFunctionCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\x07\x11module',b'\x00\x00\x06\x11pName'),(b'\x00\x00\x11\x6E\x00\x00\x00\x10VkCudaFunctionNV_T',),(b'\x00\x00\x0C\x0B\x00\x00\x00\x02VkCudaLaunchInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x09\x31\x11function',b'\x00\x00\x1F\x11gridDimX',b'\x00\x00\x1F\x11gridDimY',b'\x00\x00\x1F\x11gridDimZ',b'\x00\x00\x1F\x11blockDimX',b'\x00\x00\x1F\x11blockDimY',b'\x00\x00\x1F\x11blockDimZ',b'\x00\x00\x1F\x11sharedMemBytes',b'\x00\x01\xF7\x11paramCount',b'\x00\x11\xE9\x11pParams',b'\x00\x01\xF7\x11extraCount',b'\x00\x11\xE9\x11pExtras'),(b'\x00\x00\x0C\x0C\x00\x00\x00\x02VkCudaModuleCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\xF7\x11dataSize',b'\x00\x00\xCE\x11pData'),(b'\x00\x00\x11\x6F\x00\x00\x00\x10VkCudaModuleNV_T',),(b'\x00\x00\x0C\x0E\x00\x00\x00\x02VkD3D12FenceSubmitInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11waitSemaphoreValuesCount',b'\x00\x05\xD1\x11pWaitSemaphoreValues',b'\x00\x00\x1F\x11signalSemaphoreValuesCount',b'\x00\x05\xD1\x11pSignalSemaphoreValues'),(b'\x00\x00\x0C\x0F\x00\x00\x00\x02VkDebugMarkerMarkerInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x06\x11pMarkerName',b'\x00\x11\x4F\x11color'),(b'\x00\x00\x0C\x10\x00\x00\x00\x02VkDebugMarkerObjectNameInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x04\xF1\x11objectType',b'\x00\x01\x43\x11object',b'\x00\x00\x06\x11pObjectName'),(b'\x00\x00\x0C\x11\x00\x00\x00\x02VkDebugMarkerObjectTagInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x04\xF1\x11objectType',b'\x00\x01\x43\x11object',b'\x00\x01\x43\x11tagName',b'\x00\x01\xF7\x11tagSize',b'\x00\x00\xCE\x11pTag'),(b'\x00\x00\x0C\x12\x00\x00\x00\x02VkDebugReportCallbackCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x11\xB9\x11pfnCallback',b'\x00\x00\x27\x11pUserData'),(b'\x00\x00\x11\x70\x00\x00\x00\x10VkDebugReportCallbackEXT_T',),(b'\x00\x00\x0C\x14\x00\x00\x00\x02VkDebugUtilsLabelEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x06\x11pLabelName',b'\x00\x11\x4F\x11color'),(b'\x00\x00\x0C\x16\x00\x00\x00\x02VkDebugUtilsMessengerCallbackDataEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x06\x11pMessageIdName',b'\x00\x04\x17\x11messageIdNumber',b'\x00\x00\x06\x11pMessage',b'\x00\x00\x1F\x11queueLabelCount',b'\x00\x05\x8A\x11pQueueLabels',b'\x00\x00\x1F\x11cmdBufLabelCount',b'\x00\x05\x8A\x11pCmdBufLabels',b'\x00\x00\x1F\x11objectCount',b'\x00\x00\x8D\x11pObjects'),(b'\x00\x00\x0C\x17\x00\x00\x00\x02VkDebugUtilsMessengerCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11messageSeverity',b'\x00\x00\x1F\x11messageType',b'\x00\x11\xB2\x11pfnUserCallback',b'\x00\x00\x27\x11pUserData'),(b'\x00\x00\x11\x71\x00\x00\x00\x10VkDebugUtilsMessengerEXT_T',),(b'\x00\x00\x0C\x18\x00\x00\x00\x02VkDebugUtilsObjectNameInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x42\x11objectType',b'\x00\x01\x43\x11objectHandle',b'\x00\x00\x06\x11pObjectName'),(b'\x00\x00\x0C\x19\x00\x00\x00\x02VkDebugUtilsObjectTagInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x42\x11objectType',b'\x00\x01\x43\x11objectHandle',b'\x00\x01\x43\x11tagName',b'\x00\x01\xF7\x11tagSize',b'\x00\x00\xCE\x11pTag'),(b'\x00\x00\x0C\x1A\x00\x00\x00\x02VkDecompressMemoryRegionNV',b'\x00\x01\x43\x11srcAddress',b'\x00\x01\x43\x11dstAddress',b'\x00\x01\x43\x11compressedSize',b'\x00\x01\x43\x11decompressedSize',b'\x00\x01\x43\x11decompressionMethod'),(b'\x00\x00\x0C\x1B\x00\x00\x00\x02VkDedicatedAllocationBufferCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11dedicatedAllocation'),(b'\x00\x00\x0C\x1C\x00\x00\x00\x02VkDedicatedAllocationImageCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11dedicatedAllocation'),(b'\x00\x00\x0C\x1D\x00\x00\x00\x02VkDedicatedAllocationMemoryAllocateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\x7D\x11image',b'\x00\x01\xFC\x11buffer'),(b'\x00\x00\x11\x72\x00\x00\x00\x10VkDeferredOperationKHR_T',),(b'\x00\x00\x0C\x1F\x00\x00\x00\x02VkDependencyInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11dependencyFlags',b'\x00\x00\x1F\x11memoryBarrierCount',b'\x00\x0D\x3D\x11pMemoryBarriers',b'\x00\x00\x1F\x11bufferMemoryBarrierCount',b'\x00\x0B\xBC\x11pBufferMemoryBarriers',b'\x00\x00\x1F\x11imageMemoryBarrierCount',b'\x00\x0C\xF8\x11pImageMemoryBarriers'),(b'\x00\x00\x0C\x20\x00\x00\x00\x02VkDepthBiasInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x06\x63\x11depthBiasConstantFactor',b'\x00\x06\x63\x11depthBiasClamp',b'\x00\x06\x63\x11depthBiasSlopeFactor'),(b'\x00\x00\x0C\x22\x00\x00\x00\x02VkDepthBiasRepresentationInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0C\x21\x11depthBiasRepresentation',b'\x00\x00\x1F\x11depthBiasExact'),(b'\x00\x00\x0C\x24\x00\x00\x00\x02VkDescriptorAddressInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\x43\x11address',b'\x00\x01\x43\x11range',b'\x00\x03\xD2\x11format'),(b'\x00\x00\x0C\x26\x00\x00\x00\x02VkDescriptorBufferBindingInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\x43\x11address',b'\x00\x00\x1F\x11usage'),(b'\x00\x00\x0C\x27\x00\x00\x00\x02VkDescriptorBufferBindingPushDescriptorBufferHandleEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\xFC\x11buffer'),(b'\x00\x00\x0C\x29\x00\x00\x00\x02VkDescriptorBufferInfo',b'\x00\x01\xFC\x11buffer',b'\x00\x01\x43\x11offset',b'\x00\x01\x43\x11range'),(b'\x00\x00\x0C\x2A\x00\x00\x00\x03VkDescriptorDataEXT',b'\x00\x11\x96\x11pSampler',b'\x00\x0C\x2C\x11pCombinedImageSampler',b'\x00\x0C\x2C\x11pInputAttachmentImage',b'\x00\x0C\x2C\x11pSampledImage',b'\x00\x0C\x2C\x11pStorageImage',b'\x00\x0C\x23\x11pUniformTexelBuffer',b'\x00\x0C\x23\x11pStorageTexelBuffer',b'\x00\x0C\x23\x11pUniformBuffer',b'\x00\x0C\x23\x11pStorageBuffer',b'\x00\x01\x43\x11accelerationStructure'),(b'\x00\x00\x0C\x2B\x00\x00\x00\x02VkDescriptorGetInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0C\x3F\x11type',b'\x00\x0C\x2A\x11data'),(b'\x00\x00\x0C\x2D\x00\x00\x00\x02VkDescriptorImageInfo',b'\x00\x09\xE5\x11sampler',b'\x00\x02\x78\x11imageView',b'\x00\x02\x8B\x11imageLayout'),(b'\x00\x00\x0C\x2F\x00\x00\x00\x02VkDescriptorPoolCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11maxSets',b'\x00\x00\x1F\x11poolSizeCount',b'\x00\x0C\x31\x11pPoolSizes'),(b'\x00\x00\x0C\x30\x00\x00\x00\x02VkDescriptorPoolInlineUniformBlockCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11maxInlineUniformBlockBindings'),(b'\x00\x00\x0C\x32\x00\x00\x00\x02VkDescriptorPoolSize',b'\x00\x0C\x3F\x11type',b'\x00\x00\x1F\x11descriptorCount'),(b'\x00\x00\x11\x73\x00\x00\x00\x10VkDescriptorPool_T',),(b'\x00\x00\x0C\x33\x00\x00\x00\x02VkDescriptorSetAllocateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\x45\x11descriptorPool',b'\x00\x00\x1F\x11descriptorSetCount',b'\x00\x11\x74\x11pSetLayouts'),(b'\x00\x00\x0C\x34\x00\x00\x00\x02VkDescriptorSetBindingReferenceVALVE',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x09\x45\x11descriptorSetLayout',b'\x00\x00\x1F\x11binding'),(b'\x00\x00\x0C\x36\x00\x00\x00\x02VkDescriptorSetLayoutBinding',b'\x00\x00\x1F\x11binding',b'\x00\x0C\x3F\x11descriptorType',b'\x00\x00\x1F\x11descriptorCount',b'\x00\x00\x1F\x11stageFlags',b'\x00\x11\x96\x11pImmutableSamplers'),(b'\x00\x00\x0C\x37\x00\x00\x00\x02VkDescriptorSetLayoutBindingFlagsCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11bindingCount',b'\x00\x05\xC8\x11pBindingFlags'),(b'\x00\x00\x0C\x39\x00\x00\x00\x02VkDescriptorSetLayoutCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11bindingCount',b'\x00\x0C\x35\x11pBindings'),(b'\x00\x00\x0C\x3A\x00\x00\x00\x02VkDescriptorSetLayoutHostMappingInfoVALVE',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\xF7\x11descriptorOffset',b'\x00\x00\x1F\x11descriptorSize'),(b'\x00\x00\x0C\x3B\x00\x00\x00\x02VkDescriptorSetLayoutSupport',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11supported'),(b'\x00\x00\x11\x75\x00\x00\x00\x10VkDescriptorSetLayout_T',),(b'\x00\x00\x0C\x3C\x00\x00\x00\x02VkDescriptorSetVariableDescriptorCountAllocateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11descriptorSetCount',b'\x00\x05\xC8\x11pDescriptorCounts'),(b'\x00\x00\x0C\x3D\x00\x00\x00\x02VkDescriptorSetVariableDescriptorCountLayoutSupport',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11maxVariableDescriptorCount'),(b'\x00\x00\x11\x76\x00\x00\x00\x10VkDescriptorSet_T',),(b'\x00\x00\x0C\x40\x00\x00\x00\x02VkDescriptorUpdateTemplateCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11descriptorUpdateEntryCount',b'\x00\x0C\x41\x11pDescriptorUpdateEntries',b'\x00\x0C\x43\x11templateType',b'\x00\x09\x45\x11descriptorSetLayout',b'\x00\x05\xB4\x11pipelineBindPoint',b'\x00\x05\xB5\x11pipelineLayout',b'\x00\x00\x1F\x11set'),(b'\x00\x00\x0C\x42\x00\x00\x00\x02VkDescriptorUpdateTemplateEntry',b'\x00\x00\x1F\x11dstBinding',b'\x00\x00\x1F\x11dstArrayElement',b'\x00\x00\x1F\x11descriptorCount',b'\x00\x0C\x3F\x11descriptorType',b'\x00\x01\xF7\x11offset',b'\x00\x01\xF7\x11stride'),(b'\x00\x00\x11\x77\x00\x00\x00\x10VkDescriptorUpdateTemplate_T',),(b'\x00\x00\x0C\x44\x00\x00\x00\x02VkDeviceAddressBindingCallbackDataEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x01\x43\x11baseAddress',b'\x00\x01\x43\x11size',b'\x00\x0C\x46\x11bindingType'),(b'\x00\x00\x0C\x47\x00\x00\x00\x02VkDeviceBufferMemoryRequirements',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x4A\x11pCreateInfo'),(b'\x00\x00\x0C\x48\x00\x00\x00\x02VkDeviceCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11queueCreateInfoCount',b'\x00\x0C\x6A\x11pQueueCreateInfos',b'\x00\x00\x1F\x11enabledLayerCount',b'\x00\x11\x46\x11ppEnabledLayerNames',b'\x00\x00\x1F\x11enabledExtensionCount',b'\x00\x11\x46\x11ppEnabledExtensionNames',b'\x00\x0D\xE0\x11pEnabledFeatures'),(b'\x00\x00\x0C\x49\x00\x00\x00\x02VkDeviceDeviceMemoryReportCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x11\xEC\x11pfnUserCallback',b'\x00\x00\x27\x11pUserData'),(b'\x00\x00\x0C\x4A\x00\x00\x00\x02VkDeviceDiagnosticsConfigCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags'),(b'\x00\x00\x0C\x4C\x00\x00\x00\x02VkDeviceEventInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0C\x4D\x11deviceEvent'),(b'\x00\x00\x0C\x4F\x00\x00\x00\x02VkDeviceFaultAddressInfoEXT',b'\x00\x0C\x50\x11addressType',b'\x00\x01\x43\x11reportedAddress',b'\x00\x01\x43\x11addressPrecision'),(b'\x00\x00\x0C\x51\x00\x00\x00\x02VkDeviceFaultCountsEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11addressInfoCount',b'\x00\x00\x1F\x11vendorInfoCount',b'\x00\x01\x43\x11vendorBinarySize'),(b'\x00\x00\x0C\x52\x00\x00\x00\x02VkDeviceFaultInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x11\x48\x11description',b'\x00\x0C\x4E\x11pAddressInfos',b'\x00\x0C\x55\x11pVendorInfos',b'\x00\x00\x27\x11pVendorBinaryData'),(b'\x00\x00\x0C\x54\x00\x00\x00\x02VkDeviceFaultVendorBinaryHeaderVersionOneEXT',b'\x00\x00\x1F\x11headerSize',b'\x00\x0C\x53\x11headerVersion',b'\x00\x00\x1F\x11vendorID',b'\x00\x00\x1F\x11deviceID',b'\x00\x00\x1F\x11driverVersion',b'\x00\x11\xCF\x11pipelineCacheUUID',b'\x00\x00\x1F\x11applicationNameOffset',b'\x00\x00\x1F\x11applicationVersion',b'\x00\x00\x1F\x11engineNameOffset',b'\x00\x00\x1F\x11engineVersion',b'\x00\x00\x1F\x11apiVersion'),(b'\x00\x00\x0C\x56\x00\x00\x00\x02VkDeviceFaultVendorInfoEXT',b'\x00\x11\x48\x11description',b'\x00\x01\x43\x11vendorFaultCode',b'\x00\x01\x43\x11vendorFaultData'),(b'\x00\x00\x0C\x57\x00\x00\x00\x02VkDeviceGroupBindSparseInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11resourceDeviceIndex',b'\x00\x00\x1F\x11memoryDeviceIndex'),(b'\x00\x00\x0C\x58\x00\x00\x00\x02VkDeviceGroupCommandBufferBeginInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11deviceMask'),(b'\x00\x00\x0C\x59\x00\x00\x00\x02VkDeviceGroupDeviceCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11physicalDeviceCount',b'\x00\x11\x89\x11pPhysicalDevices'),(b'\x00\x00\x0C\x5A\x00\x00\x00\x02VkDeviceGroupPresentCapabilitiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x11\xBC\x11presentMask',b'\x00\x00\x1F\x11modes'),(b'\x00\x00\x0C\x5B\x00\x00\x00\x02VkDeviceGroupPresentInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11swapchainCount',b'\x00\x05\xC8\x11pDeviceMasks',b'\x00\x0C\x5C\x11mode'),(b'\x00\x00\x0C\x5D\x00\x00\x00\x02VkDeviceGroupRenderPassBeginInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11deviceMask',b'\x00\x00\x1F\x11deviceRenderAreaCount',b'\x00\x07\x7F\x11pDeviceRenderAreas'),(b'\x00\x00\x0C\x5E\x00\x00\x00\x02VkDeviceGroupSubmitInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11waitSemaphoreCount',b'\x00\x05\xC8\x11pWaitSemaphoreDeviceIndices',b'\x00\x00\x1F\x11commandBufferCount',b'\x00\x05\xC8\x11pCommandBufferDeviceMasks',b'\x00\x00\x1F\x11signalSemaphoreCount',b'\x00\x05\xC8\x11pSignalSemaphoreDeviceIndices'),(b'\x00\x00\x0C\x5F\x00\x00\x00\x02VkDeviceGroupSwapchainCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11modes'),(b'\x00\x00\x0C\x60\x00\x00\x00\x02VkDeviceImageMemoryRequirements',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\xEE\x11pCreateInfo',b'\x00\x0C\xE3\x11planeAspect'),(b'\x00\x00\x0C\x61\x00\x00\x00\x02VkDeviceImageSubresourceInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\xEE\x11pCreateInfo',b'\x00\x09\x98\x11pSubresource'),(b'\x00\x00\x0C\x62\x00\x00\x00\x02VkDeviceMemoryOpaqueCaptureAddressInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\xFD\x11memory'),(b'\x00\x00\x0C\x63\x00\x00\x00\x02VkDeviceMemoryOverallocationCreateInfoAMD',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0D\x4E\x11overallocationBehavior'),(b'\x00\x00\x0C\x64\x00\x00\x00\x02VkDeviceMemoryReportCallbackDataEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x0C\x65\x11type',b'\x00\x01\x43\x11memoryObjectId',b'\x00\x01\x43\x11size',b'\x00\x01\x42\x11objectType',b'\x00\x01\x43\x11objectHandle',b'\x00\x00\x1F\x11heapIndex'),(b'\x00\x00\x11\x79\x00\x00\x00\x10VkDeviceMemory_T',),(b'\x00\x00\x0C\x66\x00\x00\x00\x03VkDeviceOrHostAddressConstKHR',b'\x00\x01\x43\x11deviceAddress',b'\x00\x00\xCE\x11hostAddress'),(b'\x00\x00\x0C\x67\x00\x00\x00\x03VkDeviceOrHostAddressKHR',b'\x00\x01\x43\x11deviceAddress',b'\x00\x00\x27\x11hostAddress'),(b'\x00\x00\x0C\x68\x00\x00\x00\x02VkDevicePrivateDataCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11privateDataSlotRequestCount'),(b'\x00\x00\x0C\x6B\x00\x00\x00\x02VkDeviceQueueCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11queueFamilyIndex',b'\x00\x00\x1F\x11queueCount',b'\x00\x06\x5F\x11pQueuePriorities'),(b'\x00\x00\x0C\x6C\x00\x00\x00\x02VkDeviceQueueGlobalPriorityCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0F\x26\x11globalPriority'),(b'\x00\x00\x0C\x6D\x00\x00\x00\x02VkDeviceQueueInfo2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11queueFamilyIndex',b'\x00\x00\x1F\x11queueIndex'),(b'\x00\x00\x0C\x6E\x00\x00\x00\x02VkDeviceQueueShaderCoreControlCreateInfoARM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderCoreCount'),(b'\x00\x00\x11\x7A\x00\x00\x00\x10VkDevice_T',),(b'\x00\x00\x0C\x70\x00\x00\x00\x02VkDirectDriverLoadingInfoLUNARG',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x11\xEB\x11pfnGetInstanceProcAddr'),(b'\x00\x00\x0C\x71\x00\x00\x00\x02VkDirectDriverLoadingListLUNARG',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0C\x72\x11mode',b'\x00\x00\x1F\x11driverCount',b'\x00\x0C\x6F\x11pDrivers'),(b'\x00\x00\x0C\x73\x00\x00\x00\x02VkDispatchIndirectCommand',b'\x00\x00\x1F\x11x',b'\x00\x00\x1F\x11y',b'\x00\x00\x1F\x11z'),(b'\x00\x00\x0C\x74\x00\x00\x00\x02VkDisplayEventInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0C\x75\x11displayEvent'),(b'\x00\x00\x11\x7B\x00\x00\x00\x10VkDisplayKHR_T',),(b'\x00\x00\x0C\x76\x00\x00\x00\x02VkDisplayModeCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x0C\x77\x11parameters'),(b'\x00\x00\x11\x7C\x00\x00\x00\x10VkDisplayModeKHR_T',),(b'\x00\x00\x0C\x77\x00\x00\x00\x02VkDisplayModeParametersKHR',b'\x00\x0C\xA0\x11visibleRegion',b'\x00\x00\x1F\x11refreshRate'),(b'\x00\x00\x0C\x78\x00\x00\x00\x02VkDisplayModeProperties2KHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0C\x79\x11displayModeProperties'),(b'\x00\x00\x0C\x79\x00\x00\x00\x02VkDisplayModePropertiesKHR',b'\x00\x04\x39\x11displayMode',b'\x00\x0C\x77\x11parameters'),(b'\x00\x00\x0C\x7A\x00\x00\x00\x02VkDisplayNativeHdrSurfaceCapabilitiesAMD',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11localDimmingSupport'),(b'\x00\x00\x0C\x7C\x00\x00\x00\x02VkDisplayPlaneCapabilities2KHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0C\x7D\x11capabilities'),(b'\x00\x00\x0C\x7D\x00\x00\x00\x02VkDisplayPlaneCapabilitiesKHR',b'\x00\x00\x1F\x11supportedAlpha',b'\x00\x0D\x6E\x11minSrcPosition',b'\x00\x0D\x6E\x11maxSrcPosition',b'\x00\x0C\xA0\x11minSrcExtent',b'\x00\x0C\xA0\x11maxSrcExtent',b'\x00\x0D\x6E\x11minDstPosition',b'\x00\x0D\x6E\x11maxDstPosition',b'\x00\x0C\xA0\x11minDstExtent',b'\x00\x0C\xA0\x11maxDstExtent'),(b'\x00\x00\x0C\x7E\x00\x00\x00\x02VkDisplayPlaneInfo2KHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x04\x39\x11mode',b'\x00\x00\x1F\x11planeIndex'),(b'\x00\x00\x0C\x7F\x00\x00\x00\x02VkDisplayPlaneProperties2KHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0C\x80\x11displayPlaneProperties'),(b'\x00\x00\x0C\x80\x00\x00\x00\x02VkDisplayPlanePropertiesKHR',b'\x00\x02\x5E\x11currentDisplay',b'\x00\x00\x1F\x11currentStackIndex'),(b'\x00\x00\x0C\x81\x00\x00\x00\x02VkDisplayPowerInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0C\x82\x11powerState'),(b'\x00\x00\x0C\x83\x00\x00\x00\x02VkDisplayPresentInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0F\x34\x11srcRect',b'\x00\x0F\x34\x11dstRect',b'\x00\x00\x1F\x11persistent'),(b'\x00\x00\x0C\x84\x00\x00\x00\x02VkDisplayProperties2KHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0C\x85\x11displayProperties'),(b'\x00\x00\x0C\x85\x00\x00\x00\x02VkDisplayPropertiesKHR',b'\x00\x02\x5E\x11display',b'\x00\x00\x06\x11displayName',b'\x00\x0C\xA0\x11physicalDimensions',b'\x00\x0C\xA0\x11physicalResolution',b'\x00\x00\x1F\x11supportedTransforms',b'\x00\x00\x1F\x11planeReorderPossible',b'\x00\x00\x1F\x11persistentContent'),(b'\x00\x00\x0C\x86\x00\x00\x00\x02VkDisplaySurfaceCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x04\x39\x11displayMode',b'\x00\x00\x1F\x11planeIndex',b'\x00\x00\x1F\x11planeStackIndex',b'\x00\x10\xAA\x11transform',b'\x00\x06\x63\x11globalAlpha',b'\x00\x0C\x7B\x11alphaMode',b'\x00\x0C\xA0\x11imageExtent'),(b'\x00\x00\x0C\x87\x00\x00\x00\x02VkDrawIndexedIndirectCommand',b'\x00\x00\x1F\x11indexCount',b'\x00\x00\x1F\x11instanceCount',b'\x00\x00\x1F\x11firstIndex',b'\x00\x04\x17\x11vertexOffset',b'\x00\x00\x1F\x11firstInstance'),(b'\x00\x00\x0C\x88\x00\x00\x00\x02VkDrawIndirectCommand',b'\x00\x00\x1F\x11vertexCount',b'\x00\x00\x1F\x11instanceCount',b'\x00\x00\x1F\x11firstVertex',b'\x00\x00\x1F\x11firstInstance'),(b'\x00\x00\x0C\x89\x00\x00\x00\x02VkDrawMeshTasksIndirectCommandEXT',b'\x00\x00\x1F\x11groupCountX',b'\x00\x00\x1F\x11groupCountY',b'\x00\x00\x1F\x11groupCountZ'),(b'\x00\x00\x0C\x8A\x00\x00\x00\x02VkDrawMeshTasksIndirectCommandNV',b'\x00\x00\x1F\x11taskCount',b'\x00\x00\x1F\x11firstTask'),(b'\x00\x00\x0C\x8D\x00\x00\x00\x02VkDrmFormatModifierProperties2EXT',b'\x00\x01\x43\x11drmFormatModifier',b'\x00\x00\x1F\x11drmFormatModifierPlaneCount',b'\x00\x01\x43\x11drmFormatModifierTilingFeatures'),(b'\x00\x00\x0C\x8F\x00\x00\x00\x02VkDrmFormatModifierPropertiesEXT',b'\x00\x01\x43\x11drmFormatModifier',b'\x00\x00\x1F\x11drmFormatModifierPlaneCount',b'\x00\x00\x1F\x11drmFormatModifierTilingFeatures'),(b'\x00\x00\x0C\x90\x00\x00\x00\x02VkDrmFormatModifierPropertiesList2EXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11drmFormatModifierCount',b'\x00\x0C\x8C\x11pDrmFormatModifierProperties'),(b'\x00\x00\x0C\x91\x00\x00\x00\x02VkDrmFormatModifierPropertiesListEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11drmFormatModifierCount',b'\x00\x0C\x8E\x11pDrmFormatModifierProperties'),(b'\x00\x00\x0C\x95\x00\x00\x00\x02VkEventCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags'),(b'\x00\x00\x11\x7D\x00\x00\x00\x10VkEvent_T',),(b'\x00\x00\x0C\x96\x00\x00\x00\x02VkExportFenceCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11handleTypes'),(b'\x00\x00\x0C\x97\x00\x00\x00\x02VkExportFenceWin32HandleInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0A\xE7\x11pAttributes',b'\x00\x04\xE2\x11dwAccess',b'\x00\x12\xF5\x11name'),(b'\x00\x00\x0C\x98\x00\x00\x00\x02VkExportMemoryAllocateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11handleTypes'),(b'\x00\x00\x0C\x99\x00\x00\x00\x02VkExportMemoryAllocateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11handleTypes'),(b'\x00\x00\x0C\x9A\x00\x00\x00\x02VkExportMemoryWin32HandleInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0A\xE7\x11pAttributes',b'\x00\x04\xE2\x11dwAccess',b'\x00\x12\xF5\x11name'),(b'\x00\x00\x0C\x9B\x00\x00\x00\x02VkExportMemoryWin32HandleInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0A\xE7\x11pAttributes',b'\x00\x04\xE2\x11dwAccess'),(b'\x00\x00\x0C\x9C\x00\x00\x00\x02VkExportSemaphoreCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11handleTypes'),(b'\x00\x00\x0C\x9D\x00\x00\x00\x02VkExportSemaphoreWin32HandleInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0A\xE7\x11pAttributes',b'\x00\x04\xE2\x11dwAccess',b'\x00\x12\xF5\x11name'),(b'\x00\x00\x0C\x9F\x00\x00\x00\x02VkExtensionProperties',b'\x00\x11\x48\x11extensionName',b'\x00\x00\x1F\x11specVersion'),(b'\x00\x00\x0C\xA0\x00\x00\x00\x02VkExtent2D',b'\x00\x00\x1F\x11width',b'\x00\x00\x1F\x11height'),(b'\x00\x00\x0C\xA1\x00\x00\x00\x02VkExtent3D',b'\x00\x00\x1F\x11width',b'\x00\x00\x1F\x11height',b'\x00\x00\x1F\x11depth'),(b'\x00\x00\x0C\xA2\x00\x00\x00\x02VkExternalBufferProperties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0C\xB0\x11externalMemoryProperties'),(b'\x00\x00\x0C\xA5\x00\x00\x00\x02VkExternalFenceProperties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11exportFromImportedHandleTypes',b'\x00\x00\x1F\x11compatibleHandleTypes',b'\x00\x00\x1F\x11externalFenceFeatures'),(b'\x00\x00\x0C\xA6\x00\x00\x00\x02VkExternalFormatANDROID',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\x43\x11externalFormat'),(b'\x00\x00\x0C\xA7\x00\x00\x00\x02VkExternalImageFormatProperties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0C\xB0\x11externalMemoryProperties'),(b'\x00\x00\x0C\xA8\x00\x00\x00\x02VkExternalImageFormatPropertiesNV',b'\x00\x0C\xF6\x11imageFormatProperties',b'\x00\x00\x1F\x11externalMemoryFeatures',b'\x00\x00\x1F\x11exportFromImportedHandleTypes',b'\x00\x00\x1F\x11compatibleHandleTypes'),(b'\x00\x00\x0C\xA9\x00\x00\x00\x02VkExternalMemoryAcquireUnmodifiedEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11acquireUnmodifiedMemory'),(b'\x00\x00\x0C\xAA\x00\x00\x00\x02VkExternalMemoryBufferCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11handleTypes'),(b'\x00\x00\x0C\xAE\x00\x00\x00\x02VkExternalMemoryImageCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11handleTypes'),(b'\x00\x00\x0C\xAF\x00\x00\x00\x02VkExternalMemoryImageCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11handleTypes'),(b'\x00\x00\x0C\xB0\x00\x00\x00\x02VkExternalMemoryProperties',b'\x00\x00\x1F\x11externalMemoryFeatures',b'\x00\x00\x1F\x11exportFromImportedHandleTypes',b'\x00\x00\x1F\x11compatibleHandleTypes'),(b'\x00\x00\x0C\xB3\x00\x00\x00\x02VkExternalSemaphoreProperties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11exportFromImportedHandleTypes',b'\x00\x00\x1F\x11compatibleHandleTypes',b'\x00\x00\x1F\x11externalSemaphoreFeatures'),(b'\x00\x00\x0C\xB5\x00\x00\x00\x02VkFenceCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags'),(b'\x00\x00\x0C\xB6\x00\x00\x00\x02VkFenceGetFdInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\x6E\x11fence',b'\x00\x0C\xA4\x11handleType'),(b'\x00\x00\x0C\xB7\x00\x00\x00\x02VkFenceGetWin32HandleInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\x6E\x11fence',b'\x00\x0C\xA4\x11handleType'),(b'\x00\x00\x11\x7E\x00\x00\x00\x10VkFence_T',),(b'\x00\x00\x0C\xB9\x00\x00\x00\x02VkFilterCubicImageViewImageFormatPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11filterCubic',b'\x00\x00\x1F\x11filterCubicMinmax'),(b'\x00\x00\x0C\xBE\x00\x00\x00\x02VkFormatProperties',b'\x00\x00\x1F\x11linearTilingFeatures',b'\x00\x00\x1F\x11optimalTilingFeatures',b'\x00\x00\x1F\x11bufferFeatures'),(b'\x00\x00\x0C\xBC\x00\x00\x00\x02VkFormatProperties2',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0C\xBE\x11formatProperties'),(b'\x00\x00\x0C\xBD\x00\x00\x00\x02VkFormatProperties3',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\x43\x11linearTilingFeatures',b'\x00\x01\x43\x11optimalTilingFeatures',b'\x00\x01\x43\x11bufferFeatures'),(b'\x00\x00\x0C\xBF\x00\x00\x00\x02VkFragmentShadingRateAttachmentInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0B\x8F\x11pFragmentShadingRateAttachment',b'\x00\x0C\xA0\x11shadingRateAttachmentTexelSize'),(b'\x00\x00\x0C\xC4\x00\x00\x00\x02VkFrameBoundaryEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x01\x43\x11frameID',b'\x00\x00\x1F\x11imageCount',b'\x00\x11\x82\x11pImages',b'\x00\x00\x1F\x11bufferCount',b'\x00\x08\x0D\x11pBuffers',b'\x00\x01\x43\x11tagName',b'\x00\x01\xF7\x11tagSize',b'\x00\x00\xCE\x11pTag'),(b'\x00\x00\x0C\xC7\x00\x00\x00\x02VkFramebufferAttachmentImageInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11usage',b'\x00\x00\x1F\x11width',b'\x00\x00\x1F\x11height',b'\x00\x00\x1F\x11layerCount',b'\x00\x00\x1F\x11viewFormatCount',b'\x00\x0C\xBA\x11pViewFormats'),(b'\x00\x00\x0C\xC8\x00\x00\x00\x02VkFramebufferAttachmentsCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11attachmentImageInfoCount',b'\x00\x0C\xC6\x11pAttachmentImageInfos'),(b'\x00\x00\x0C\xCA\x00\x00\x00\x02VkFramebufferCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x02\xD6\x11renderPass',b'\x00\x00\x1F\x11attachmentCount',b'\x00\x11\x80\x11pAttachments',b'\x00\x00\x1F\x11width',b'\x00\x00\x1F\x11height',b'\x00\x00\x1F\x11layers'),(b'\x00\x00\x0C\xCB\x00\x00\x00\x02VkFramebufferMixedSamplesCombinationNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x05\x7A\x11coverageReductionMode',b'\x00\x06\x17\x11rasterizationSamples',b'\x00\x00\x1F\x11depthStencilSamples',b'\x00\x00\x1F\x11colorSamples'),(b'\x00\x00\x11\x7F\x00\x00\x00\x10VkFramebuffer_T',),(b'\x00\x00\x0C\xCD\x00\x00\x00\x02VkGeneratedCommandsInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x05\xB4\x11pipelineBindPoint',b'\x00\x02\xB7\x11pipeline',b'\x00\x09\xA8\x11indirectCommandsLayout',b'\x00\x00\x1F\x11streamCount',b'\x00\x0D\x23\x11pStreams',b'\x00\x00\x1F\x11sequencesCount',b'\x00\x01\xFC\x11preprocessBuffer',b'\x00\x01\x43\x11preprocessOffset',b'\x00\x01\x43\x11preprocessSize',b'\x00\x01\xFC\x11sequencesCountBuffer',b'\x00\x01\x43\x11sequencesCountOffset',b'\x00\x01\xFC\x11sequencesIndexBuffer',b'\x00\x01\x43\x11sequencesIndexOffset'),(b'\x00\x00\x0C\xCE\x00\x00\x00\x02VkGeneratedCommandsMemoryRequirementsInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x05\xB4\x11pipelineBindPoint',b'\x00\x02\xB7\x11pipeline',b'\x00\x09\xA8\x11indirectCommandsLayout',b'\x00\x00\x1F\x11maxSequencesCount'),(b'\x00\x00\x0C\xCF\x00\x00\x00\x02VkGeometryAABBNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\xFC\x11aabbData',b'\x00\x00\x1F\x11numAABBs',b'\x00\x00\x1F\x11stride',b'\x00\x01\x43\x11offset'),(b'\x00\x00\x0C\xD0\x00\x00\x00\x02VkGeometryDataNV',b'\x00\x0C\xD5\x11triangles',b'\x00\x0C\xCF\x11aabbs'),(b'\x00\x00\x0C\xD4\x00\x00\x00\x02VkGeometryNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0C\xD6\x11geometryType',b'\x00\x0C\xD0\x11geometry',b'\x00\x00\x1F\x11flags'),(b'\x00\x00\x0C\xD5\x00\x00\x00\x02VkGeometryTrianglesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\xFC\x11vertexData',b'\x00\x01\x43\x11vertexOffset',b'\x00\x00\x1F\x11vertexCount',b'\x00\x01\x43\x11vertexStride',b'\x00\x03\xD2\x11vertexFormat',b'\x00\x01\xFC\x11indexData',b'\x00\x01\x43\x11indexOffset',b'\x00\x00\x1F\x11indexCount',b'\x00\x06\x8E\x11indexType',b'\x00\x01\xFC\x11transformData',b'\x00\x01\x43\x11transformOffset'),(b'\x00\x00\x0C\xD7\x00\x00\x00\x02VkGetLatencyMarkerInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11timingCount',b'\x00\x0D\x31\x11pTimings'),(b'\x00\x00\x0C\xD8\x00\x00\x00\x02VkGraphicsPipelineCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11stageCount',b'\x00\x0E\xEE\x11pStages',b'\x00\x0E\xF6\x11pVertexInputState',b'\x00\x0E\xD6\x11pInputAssemblyState',b'\x00\x0E\xF3\x11pTessellationState',b'\x00\x0E\xFC\x11pViewportState',b'\x00\x0E\xE3\x11pRasterizationState',b'\x00\x0E\xDC\x11pMultisampleState',b'\x00\x0E\xC7\x11pDepthStencilState',b'\x00\x0E\xB8\x11pColorBlendState',b'\x00\x0E\xCA\x11pDynamicState',b'\x00\x05\xB5\x11layout',b'\x00\x02\xD6\x11renderPass',b'\x00\x00\x1F\x11subpass',b'\x00\x02\xB7\x11basePipelineHandle',b'\x00\x04\x17\x11basePipelineIndex'),(b'\x00\x00\x0C\xD9\x00\x00\x00\x02VkGraphicsPipelineLibraryCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags'),(b'\x00\x00\x0C\xDB\x00\x00\x00\x02VkGraphicsPipelineShaderGroupsCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11groupCount',b'\x00\x0C\xDC\x11pGroups',b'\x00\x00\x1F\x11pipelineCount',b'\x00\x11\x8F\x11pPipelines'),(b'\x00\x00\x0C\xDD\x00\x00\x00\x02VkGraphicsShaderGroupCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11stageCount',b'\x00\x0E\xEE\x11pStages',b'\x00\x0E\xF6\x11pVertexInputState',b'\x00\x0E\xF3\x11pTessellationState'),(b'\x00\x00\x0C\xDE\x00\x00\x00\x02VkHdrMetadataEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x11\x43\x11displayPrimaryRed',b'\x00\x11\x43\x11displayPrimaryGreen',b'\x00\x11\x43\x11displayPrimaryBlue',b'\x00\x11\x43\x11whitePoint',b'\x00\x06\x63\x11maxLuminance',b'\x00\x06\x63\x11minLuminance',b'\x00\x06\x63\x11maxContentLightLevel',b'\x00\x06\x63\x11maxFrameAverageLightLevel'),(b'\x00\x00\x0C\xDF\x00\x00\x00\x02VkHeadlessSurfaceCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags'),(b'\x00\x00\x0C\xE0\x00\x00\x00\x02VkHostImageCopyDevicePerformanceQueryEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11optimalDeviceAccess',b'\x00\x00\x1F\x11identicalMemoryLayout'),(b'\x00\x00\x0C\xE2\x00\x00\x00\x02VkHostImageLayoutTransitionInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\x7D\x11image',b'\x00\x02\x8B\x11oldLayout',b'\x00\x02\x8B\x11newLayout',b'\x00\x0D\x05\x11subresourceRange'),(b'\x00\x00\x0C\xE6\x00\x00\x00\x02VkImageBlit',b'\x00\x0D\x04\x11srcSubresource',b'\x00\x0D\x70\x11srcOffsets',b'\x00\x0D\x04\x11dstSubresource',b'\x00\x0D\x70\x11dstOffsets'),(b'\x00\x00\x0C\xE5\x00\x00\x00\x02VkImageBlit2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0D\x04\x11srcSubresource',b'\x00\x0D\x70\x11srcOffsets',b'\x00\x0D\x04\x11dstSubresource',b'\x00\x0D\x70\x11dstOffsets'),(b'\x00\x00\x0C\xE7\x00\x00\x00\x02VkImageCaptureDescriptorDataInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\x7D\x11image'),(b'\x00\x00\x0C\xE8\x00\x00\x00\x02VkImageCompressionControlEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11compressionControlPlaneCount',b'\x00\x00\x07\x11pFixedRateFlags'),(b'\x00\x00\x0C\xEB\x00\x00\x00\x02VkImageCompressionPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11imageCompressionFlags',b'\x00\x00\x1F\x11imageCompressionFixedRateFlags'),(b'\x00\x00\x0C\xEE\x00\x00\x00\x02VkImageCopy',b'\x00\x0D\x04\x11srcSubresource',b'\x00\x0D\x6F\x11srcOffset',b'\x00\x0D\x04\x11dstSubresource',b'\x00\x0D\x6F\x11dstOffset',b'\x00\x0C\xA1\x11extent'),(b'\x00\x00\x0C\xED\x00\x00\x00\x02VkImageCopy2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0D\x04\x11srcSubresource',b'\x00\x0D\x6F\x11srcOffset',b'\x00\x0D\x04\x11dstSubresource',b'\x00\x0D\x6F\x11dstOffset',b'\x00\x0C\xA1\x11extent'),(b'\x00\x00\x0C\xF0\x00\x00\x00\x02VkImageCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x03\xD3\x11imageType',b'\x00\x03\xD2\x11format',b'\x00\x0C\xA1\x11extent',b'\x00\x00\x1F\x11mipLevels',b'\x00\x00\x1F\x11arrayLayers',b'\x00\x06\x17\x11samples',b'\x00\x03\xD4\x11tiling',b'\x00\x00\x1F\x11usage',b'\x00\x10\x6A\x11sharingMode',b'\x00\x00\x1F\x11queueFamilyIndexCount',b'\x00\x05\xC8\x11pQueueFamilyIndices',b'\x00\x02\x8B\x11initialLayout'),(b'\x00\x00\x0C\xF1\x00\x00\x00\x02VkImageDrmFormatModifierExplicitCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x43\x11drmFormatModifier',b'\x00\x00\x1F\x11drmFormatModifierPlaneCount',b'\x00\x10\x9A\x11pPlaneLayouts'),(b'\x00\x00\x0C\xF2\x00\x00\x00\x02VkImageDrmFormatModifierListCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11drmFormatModifierCount',b'\x00\x05\xD1\x11pDrmFormatModifiers'),(b'\x00\x00\x0C\xF3\x00\x00\x00\x02VkImageDrmFormatModifierPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\x43\x11drmFormatModifier'),(b'\x00\x00\x0C\xF4\x00\x00\x00\x02VkImageFormatListCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11viewFormatCount',b'\x00\x0C\xBA\x11pViewFormats'),(b'\x00\x00\x0C\xF6\x00\x00\x00\x02VkImageFormatProperties',b'\x00\x0C\xA1\x11maxExtent',b'\x00\x00\x1F\x11maxMipLevels',b'\x00\x00\x1F\x11maxArrayLayers',b'\x00\x00\x1F\x11sampleCounts',b'\x00\x01\x43\x11maxResourceSize'),(b'\x00\x00\x0C\xF5\x00\x00\x00\x02VkImageFormatProperties2',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0C\xF6\x11imageFormatProperties'),(b'\x00\x00\x0C\xFA\x00\x00\x00\x02VkImageMemoryBarrier',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11srcAccessMask',b'\x00\x00\x1F\x11dstAccessMask',b'\x00\x02\x8B\x11oldLayout',b'\x00\x02\x8B\x11newLayout',b'\x00\x00\x1F\x11srcQueueFamilyIndex',b'\x00\x00\x1F\x11dstQueueFamilyIndex',b'\x00\x02\x7D\x11image',b'\x00\x0D\x05\x11subresourceRange'),(b'\x00\x00\x0C\xF9\x00\x00\x00\x02VkImageMemoryBarrier2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x43\x11srcStageMask',b'\x00\x01\x43\x11srcAccessMask',b'\x00\x01\x43\x11dstStageMask',b'\x00\x01\x43\x11dstAccessMask',b'\x00\x02\x8B\x11oldLayout',b'\x00\x02\x8B\x11newLayout',b'\x00\x00\x1F\x11srcQueueFamilyIndex',b'\x00\x00\x1F\x11dstQueueFamilyIndex',b'\x00\x02\x7D\x11image',b'\x00\x0D\x05\x11subresourceRange'),(b'\x00\x00\x0C\xFB\x00\x00\x00\x02VkImageMemoryRequirementsInfo2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\x7D\x11image'),(b'\x00\x00\x0C\xFC\x00\x00\x00\x02VkImagePlaneMemoryRequirementsInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0C\xE3\x11planeAspect'),(b'\x00\x00\x0C\xFF\x00\x00\x00\x02VkImageResolve',b'\x00\x0D\x04\x11srcSubresource',b'\x00\x0D\x6F\x11srcOffset',b'\x00\x0D\x04\x11dstSubresource',b'\x00\x0D\x6F\x11dstOffset',b'\x00\x0C\xA1\x11extent'),(b'\x00\x00\x0C\xFE\x00\x00\x00\x02VkImageResolve2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0D\x04\x11srcSubresource',b'\x00\x0D\x6F\x11srcOffset',b'\x00\x0D\x04\x11dstSubresource',b'\x00\x0D\x6F\x11dstOffset',b'\x00\x0C\xA1\x11extent'),(b'\x00\x00\x0D\x00\x00\x00\x00\x02VkImageSparseMemoryRequirementsInfo2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\x7D\x11image'),(b'\x00\x00\x0D\x01\x00\x00\x00\x02VkImageStencilUsageCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11stencilUsage'),(b'\x00\x00\x0D\x03\x00\x00\x00\x02VkImageSubresource',b'\x00\x00\x1F\x11aspectMask',b'\x00\x00\x1F\x11mipLevel',b'\x00\x00\x1F\x11arrayLayer'),(b'\x00\x00\x0D\x02\x00\x00\x00\x02VkImageSubresource2KHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0D\x03\x11imageSubresource'),(b'\x00\x00\x0D\x04\x00\x00\x00\x02VkImageSubresourceLayers',b'\x00\x00\x1F\x11aspectMask',b'\x00\x00\x1F\x11mipLevel',b'\x00\x00\x1F\x11baseArrayLayer',b'\x00\x00\x1F\x11layerCount'),(b'\x00\x00\x0D\x05\x00\x00\x00\x02VkImageSubresourceRange',b'\x00\x00\x1F\x11aspectMask',b'\x00\x00\x1F\x11baseMipLevel',b'\x00\x00\x1F\x11levelCount',b'\x00\x00\x1F\x11baseArrayLayer',b'\x00\x00\x1F\x11layerCount'),(b'\x00\x00\x0D\x06\x00\x00\x00\x02VkImageSwapchainCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\xEB\x11swapchain'),(b'\x00\x00\x0D\x08\x00\x00\x00\x02VkImageToMemoryCopyEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x27\x11pHostPointer',b'\x00\x00\x1F\x11memoryRowLength',b'\x00\x00\x1F\x11memoryImageHeight',b'\x00\x0D\x04\x11imageSubresource',b'\x00\x0D\x6F\x11imageOffset',b'\x00\x0C\xA1\x11imageExtent'),(b'\x00\x00\x0D\x0A\x00\x00\x00\x02VkImageViewASTCDecodeModeEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x03\xD2\x11decodeMode'),(b'\x00\x00\x0D\x0B\x00\x00\x00\x02VkImageViewAddressPropertiesNVX',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\x43\x11deviceAddress',b'\x00\x01\x43\x11size'),(b'\x00\x00\x0D\x0C\x00\x00\x00\x02VkImageViewCaptureDescriptorDataInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\x78\x11imageView'),(b'\x00\x00\x0D\x0E\x00\x00\x00\x02VkImageViewCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x02\x7D\x11image',b'\x00\x0D\x13\x11viewType',b'\x00\x03\xD2\x11format',b'\x00\x0B\xE9\x11components',b'\x00\x0D\x05\x11subresourceRange'),(b'\x00\x00\x0D\x0F\x00\x00\x00\x02VkImageViewHandleInfoNVX',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\x78\x11imageView',b'\x00\x0C\x3F\x11descriptorType',b'\x00\x09\xE5\x11sampler'),(b'\x00\x00\x0D\x10\x00\x00\x00\x02VkImageViewMinLodCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x06\x63\x11minLod'),(b'\x00\x00\x0D\x11\x00\x00\x00\x02VkImageViewSampleWeightCreateInfoQCOM',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0D\x6E\x11filterCenter',b'\x00\x0C\xA0\x11filterSize',b'\x00\x00\x1F\x11numPhases'),(b'\x00\x00\x0D\x12\x00\x00\x00\x02VkImageViewSlicedCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11sliceOffset',b'\x00\x00\x1F\x11sliceCount'),(b'\x00\x00\x0D\x14\x00\x00\x00\x02VkImageViewUsageCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11usage'),(b'\x00\x00\x11\x81\x00\x00\x00\x10VkImageView_T',),(b'\x00\x00\x11\x83\x00\x00\x00\x10VkImage_T',),(b'\x00\x00\x0D\x15\x00\x00\x00\x02VkImportAndroidHardwareBufferInfoANDROID',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x11\x63\x11buffer'),(b'\x00\x00\x0D\x16\x00\x00\x00\x02VkImportFenceFdInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\x6E\x11fence',b'\x00\x00\x1F\x11flags',b'\x00\x0C\xA4\x11handleType',b'\x00\x00\xC2\x11fd'),(b'\x00\x00\x0D\x17\x00\x00\x00\x02VkImportFenceWin32HandleInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\x6E\x11fence',b'\x00\x00\x1F\x11flags',b'\x00\x0C\xA4\x11handleType',b'\x00\x00\x27\x11handle',b'\x00\x12\xF5\x11name'),(b'\x00\x00\x0D\x18\x00\x00\x00\x02VkImportMemoryFdInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\xC1\x11handleType',b'\x00\x00\xC2\x11fd'),(b'\x00\x00\x0D\x19\x00\x00\x00\x02VkImportMemoryHostPointerInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\xC1\x11handleType',b'\x00\x00\x27\x11pHostPointer'),(b'\x00\x00\x0D\x1A\x00\x00\x00\x02VkImportMemoryWin32HandleInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\xC1\x11handleType',b'\x00\x00\x27\x11handle',b'\x00\x12\xF5\x11name'),(b'\x00\x00\x0D\x1B\x00\x00\x00\x02VkImportMemoryWin32HandleInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11handleType',b'\x00\x00\x27\x11handle'),(b'\x00\x00\x0D\x1C\x00\x00\x00\x02VkImportSemaphoreFdInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\xDB\x11semaphore',b'\x00\x00\x1F\x11flags',b'\x00\x0C\xB2\x11handleType',b'\x00\x00\xC2\x11fd'),(b'\x00\x00\x0D\x1D\x00\x00\x00\x02VkImportSemaphoreWin32HandleInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\xDB\x11semaphore',b'\x00\x00\x1F\x11flags',b'\x00\x0C\xB2\x11handleType',b'\x00\x00\x27\x11handle',b'\x00\x12\xF5\x11name'),(b'\x00\x00\x0D\x1F\x00\x00\x00\x02VkIndirectCommandsLayoutCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x05\xB4\x11pipelineBindPoint',b'\x00\x00\x1F\x11tokenCount',b'\x00\x0D\x20\x11pTokens',b'\x00\x00\x1F\x11streamCount',b'\x00\x05\xC8\x11pStreamStrides'),(b'\x00\x00\x11\x84\x00\x00\x00\x10VkIndirectCommandsLayoutNV_T',),(b'\x00\x00\x0D\x21\x00\x00\x00\x02VkIndirectCommandsLayoutTokenNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0D\x25\x11tokenType',b'\x00\x00\x1F\x11stream',b'\x00\x00\x1F\x11offset',b'\x00\x00\x1F\x11vertexBindingUnit',b'\x00\x00\x1F\x11vertexDynamicStride',b'\x00\x05\xB5\x11pushconstantPipelineLayout',b'\x00\x00\x1F\x11pushconstantShaderStageFlags',b'\x00\x00\x1F\x11pushconstantOffset',b'\x00\x00\x1F\x11pushconstantSize',b'\x00\x00\x1F\x11indirectStateFlags',b'\x00\x00\x1F\x11indexTypeCount',b'\x00\x0D\x1E\x11pIndexTypes',b'\x00\x05\xC8\x11pIndexTypeValues'),(b'\x00\x00\x0D\x24\x00\x00\x00\x02VkIndirectCommandsStreamNV',b'\x00\x01\xFC\x11buffer',b'\x00\x01\x43\x11offset'),(b'\x00\x00\x0D\x27\x00\x00\x00\x02VkInitializePerformanceApiInfoINTEL',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x27\x11pUserData'),(b'\x00\x00\x0D\x29\x00\x00\x00\x02VkInputAttachmentAspectReference',b'\x00\x00\x1F\x11subpass',b'\x00\x00\x1F\x11inputAttachmentIndex',b'\x00\x00\x1F\x11aspectMask'),(b'\x00\x00\x0D\x2B\x00\x00\x00\x02VkInstanceCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x0B\x85\x11pApplicationInfo',b'\x00\x00\x1F\x11enabledLayerCount',b'\x00\x11\x46\x11ppEnabledLayerNames',b'\x00\x00\x1F\x11enabledExtensionCount',b'\x00\x11\x46\x11ppEnabledExtensionNames'),(b'\x00\x00\x11\x85\x00\x00\x00\x10VkInstance_T',),(b'\x00\x00\x0D\x2D\x00\x00\x00\x02VkLatencySleepInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\xDB\x11signalSemaphore',b'\x00\x01\x43\x11value'),(b'\x00\x00\x0D\x2E\x00\x00\x00\x02VkLatencySleepModeInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11lowLatencyMode',b'\x00\x00\x1F\x11lowLatencyBoost',b'\x00\x00\x1F\x11minimumIntervalUs'),(b'\x00\x00\x0D\x2F\x00\x00\x00\x02VkLatencySubmissionPresentIdNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x43\x11presentID'),(b'\x00\x00\x0D\x30\x00\x00\x00\x02VkLatencySurfaceCapabilitiesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11presentModeCount',b'\x00\x03\xF7\x11pPresentModes'),(b'\x00\x00\x0D\x32\x00\x00\x00\x02VkLatencyTimingsFrameReportNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x43\x11presentID',b'\x00\x01\x43\x11inputSampleTimeUs',b'\x00\x01\x43\x11simStartTimeUs',b'\x00\x01\x43\x11simEndTimeUs',b'\x00\x01\x43\x11renderSubmitStartTimeUs',b'\x00\x01\x43\x11renderSubmitEndTimeUs',b'\x00\x01\x43\x11presentStartTimeUs',b'\x00\x01\x43\x11presentEndTimeUs',b'\x00\x01\x43\x11driverStartTimeUs',b'\x00\x01\x43\x11driverEndTimeUs',b'\x00\x01\x43\x11osRenderQueueStartTimeUs',b'\x00\x01\x43\x11osRenderQueueEndTimeUs',b'\x00\x01\x43\x11gpuRenderStartTimeUs',b'\x00\x01\x43\x11gpuRenderEndTimeUs'),(b'\x00\x00\x0D\x33\x00\x00\x00\x02VkLayerProperties',b'\x00\x11\x48\x11layerName',b'\x00\x00\x1F\x11specVersion',b'\x00\x00\x1F\x11implementationVersion',b'\x00\x11\x48\x11description'),(b'\x00\x00\x0D\x35\x00\x00\x00\x02VkLayerSettingEXT',b'\x00\x00\x06\x11pLayerName',b'\x00\x00\x06\x11pSettingName',b'\x00\x0D\x36\x11type',b'\x00\x00\x1F\x11valueCount',b'\x00\x00\xCE\x11pValues'),(b'\x00\x00\x0D\x37\x00\x00\x00\x02VkLayerSettingsCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11settingCount',b'\x00\x0D\x34\x11pSettings'),(b'\x00\x00\x0D\x39\x00\x00\x00\x02VkMappedMemoryRange',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\xFD\x11memory',b'\x00\x01\x43\x11offset',b'\x00\x01\x43\x11size'),(b'\x00\x00\x0D\x3B\x00\x00\x00\x02VkMemoryAllocateFlagsInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11deviceMask'),(b'\x00\x00\x0D\x3C\x00\x00\x00\x02VkMemoryAllocateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x43\x11allocationSize',b'\x00\x00\x1F\x11memoryTypeIndex'),(b'\x00\x00\x0D\x3F\x00\x00\x00\x02VkMemoryBarrier',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11srcAccessMask',b'\x00\x00\x1F\x11dstAccessMask'),(b'\x00\x00\x0D\x3E\x00\x00\x00\x02VkMemoryBarrier2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x43\x11srcStageMask',b'\x00\x01\x43\x11srcAccessMask',b'\x00\x01\x43\x11dstStageMask',b'\x00\x01\x43\x11dstAccessMask'),(b'\x00\x00\x0D\x40\x00\x00\x00\x02VkMemoryDedicatedAllocateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\x7D\x11image',b'\x00\x01\xFC\x11buffer'),(b'\x00\x00\x0D\x41\x00\x00\x00\x02VkMemoryDedicatedRequirements',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11prefersDedicatedAllocation',b'\x00\x00\x1F\x11requiresDedicatedAllocation'),(b'\x00\x00\x0D\x42\x00\x00\x00\x02VkMemoryFdPropertiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11memoryTypeBits'),(b'\x00\x00\x0D\x43\x00\x00\x00\x02VkMemoryGetAndroidHardwareBufferInfoANDROID',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\xFD\x11memory'),(b'\x00\x00\x0D\x44\x00\x00\x00\x02VkMemoryGetFdInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\xFD\x11memory',b'\x00\x00\xC1\x11handleType'),(b'\x00\x00\x0D\x45\x00\x00\x00\x02VkMemoryGetRemoteAddressInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\xFD\x11memory',b'\x00\x00\xC1\x11handleType'),(b'\x00\x00\x0D\x46\x00\x00\x00\x02VkMemoryGetWin32HandleInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\xFD\x11memory',b'\x00\x00\xC1\x11handleType'),(b'\x00\x00\x0D\x47\x00\x00\x00\x02VkMemoryHeap',b'\x00\x01\x43\x11size',b'\x00\x00\x1F\x11flags'),(b'\x00\x00\x0D\x4B\x00\x00\x00\x02VkMemoryHostPointerPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11memoryTypeBits'),(b'\x00\x00\x0D\x4C\x00\x00\x00\x02VkMemoryMapInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x01\xFD\x11memory',b'\x00\x01\x43\x11offset',b'\x00\x01\x43\x11size'),(b'\x00\x00\x0D\x4D\x00\x00\x00\x02VkMemoryOpaqueCaptureAddressAllocateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x43\x11opaqueCaptureAddress'),(b'\x00\x00\x0D\x4F\x00\x00\x00\x02VkMemoryPriorityAllocateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x06\x63\x11priority'),(b'\x00\x00\x0D\x52\x00\x00\x00\x02VkMemoryRequirements',b'\x00\x01\x43\x11size',b'\x00\x01\x43\x11alignment',b'\x00\x00\x1F\x11memoryTypeBits'),(b'\x00\x00\x0D\x51\x00\x00\x00\x02VkMemoryRequirements2',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0D\x52\x11memoryRequirements'),(b'\x00\x00\x0D\x54\x00\x00\x00\x02VkMemoryToImageCopyEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\xCE\x11pHostPointer',b'\x00\x00\x1F\x11memoryRowLength',b'\x00\x00\x1F\x11memoryImageHeight',b'\x00\x0D\x04\x11imageSubresource',b'\x00\x0D\x6F\x11imageOffset',b'\x00\x0C\xA1\x11imageExtent'),(b'\x00\x00\x0D\x55\x00\x00\x00\x02VkMemoryType',b'\x00\x00\x1F\x11propertyFlags',b'\x00\x00\x1F\x11heapIndex'),(b'\x00\x00\x0D\x58\x00\x00\x00\x02VkMemoryUnmapInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x01\xFD\x11memory'),(b'\x00\x00\x0D\x59\x00\x00\x00\x02VkMemoryWin32HandlePropertiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11memoryTypeBits'),(b'\x00\x00\x0D\x5A\x00\x00\x00\x02VkMicromapBuildInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0D\x5F\x11type',b'\x00\x00\x1F\x11flags',b'\x00\x0B\xC7\x11mode',b'\x00\x09\xAD\x11dstMicromap',b'\x00\x00\x1F\x11usageCountsCount',b'\x00\x0D\x61\x11pUsageCounts',b'\x00\x0D\x60\x11ppUsageCounts',b'\x00\x0C\x66\x11data',b'\x00\x0C\x67\x11scratchData',b'\x00\x0C\x66\x11triangleArray',b'\x00\x01\x43\x11triangleArrayStride'),(b'\x00\x00\x0D\x5B\x00\x00\x00\x02VkMicromapBuildSizesInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x43\x11micromapSize',b'\x00\x01\x43\x11buildScratchSize',b'\x00\x00\x1F\x11discardable'),(b'\x00\x00\x0D\x5D\x00\x00\x00\x02VkMicromapCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11createFlags',b'\x00\x01\xFC\x11buffer',b'\x00\x01\x43\x11offset',b'\x00\x01\x43\x11size',b'\x00\x0D\x5F\x11type',b'\x00\x01\x43\x11deviceAddress'),(b'\x00\x00\x11\x86\x00\x00\x00\x10VkMicromapEXT_T',),(b'\x00\x00\x0D\x5E\x00\x00\x00\x02VkMicromapTriangleEXT',b'\x00\x00\x1F\x11dataOffset',b'\x00\x07\xD3\x11subdivisionLevel',b'\x00\x07\xD3\x11format'),(b'\x00\x00\x0D\x62\x00\x00\x00\x02VkMicromapUsageEXT',b'\x00\x00\x1F\x11count',b'\x00\x00\x1F\x11subdivisionLevel',b'\x00\x00\x1F\x11format'),(b'\x00\x00\x0D\x63\x00\x00\x00\x02VkMicromapVersionInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x11\xCB\x11pVersionData'),(b'\x00\x00\x0D\x64\x00\x00\x00\x02VkMultiDrawIndexedInfoEXT',b'\x00\x00\x1F\x11firstIndex',b'\x00\x00\x1F\x11indexCount',b'\x00\x04\x17\x11vertexOffset'),(b'\x00\x00\x0D\x65\x00\x00\x00\x02VkMultiDrawInfoEXT',b'\x00\x00\x1F\x11firstVertex',b'\x00\x00\x1F\x11vertexCount'),(b'\x00\x00\x0D\x66\x00\x00\x00\x02VkMultisamplePropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0C\xA0\x11maxSampleLocationGridSize'),(b'\x00\x00\x0D\x67\x00\x00\x00\x02VkMultisampledRenderToSingleSampledInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11multisampledRenderToSingleSampledEnable',b'\x00\x06\x17\x11rasterizationSamples'),(b'\x00\x00\x0D\x68\x00\x00\x00\x02VkMultiviewPerViewAttributesInfoNVX',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11perViewAttributes',b'\x00\x00\x1F\x11perViewAttributesPositionXOnly'),(b'\x00\x00\x0D\x69\x00\x00\x00\x02VkMultiviewPerViewRenderAreasRenderPassBeginInfoQCOM',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11perViewRenderAreaCount',b'\x00\x07\x7F\x11pPerViewRenderAreas'),(b'\x00\x00\x0D\x6A\x00\x00\x00\x02VkMutableDescriptorTypeCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11mutableDescriptorTypeListCount',b'\x00\x0D\x6B\x11pMutableDescriptorTypeLists'),(b'\x00\x00\x0D\x6C\x00\x00\x00\x02VkMutableDescriptorTypeListEXT',b'\x00\x00\x1F\x11descriptorTypeCount',b'\x00\x0C\x3E\x11pDescriptorTypes'),(b'\x00\x00\x0D\x6E\x00\x00\x00\x02VkOffset2D',b'\x00\x04\x17\x11x',b'\x00\x04\x17\x11y'),(b'\x00\x00\x0D\x6F\x00\x00\x00\x02VkOffset3D',b'\x00\x04\x17\x11x',b'\x00\x04\x17\x11y',b'\x00\x04\x17\x11z'),(b'\x00\x00\x0D\x74\x00\x00\x00\x02VkOpaqueCaptureDescriptorDataCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\xCE\x11opaqueCaptureDescriptorData'),(b'\x00\x00\x0D\x76\x00\x00\x00\x02VkOpticalFlowExecuteInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11regionCount',b'\x00\x07\x7F\x11pRegions'),(b'\x00\x00\x0D\x78\x00\x00\x00\x02VkOpticalFlowImageFormatInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11usage'),(b'\x00\x00\x0D\x79\x00\x00\x00\x02VkOpticalFlowImageFormatPropertiesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x03\xD2\x11format'),(b'\x00\x00\x0D\x7C\x00\x00\x00\x02VkOpticalFlowSessionCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11width',b'\x00\x00\x1F\x11height',b'\x00\x03\xD2\x11imageFormat',b'\x00\x03\xD2\x11flowVectorFormat',b'\x00\x03\xD2\x11costFormat',b'\x00\x00\x1F\x11outputGridSize',b'\x00\x00\x1F\x11hintGridSize',b'\x00\x0D\x7A\x11performanceLevel',b'\x00\x00\x1F\x11flags'),(b'\x00\x00\x0D\x7D\x00\x00\x00\x02VkOpticalFlowSessionCreatePrivateDataInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11id',b'\x00\x00\x1F\x11size',b'\x00\x00\xCE\x11pPrivateData'),(b'\x00\x00\x11\x87\x00\x00\x00\x10VkOpticalFlowSessionNV_T',),(b'\x00\x00\x0D\x7F\x00\x00\x00\x02VkOutOfBandQueueTypeInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0D\x80\x11queueType'),(b'\x00\x00\x0D\x81\x00\x00\x00\x02VkPastPresentationTimingGOOGLE',b'\x00\x00\x1F\x11presentID',b'\x00\x01\x43\x11desiredPresentTime',b'\x00\x01\x43\x11actualPresentTime',b'\x00\x01\x43\x11earliestPresentTime',b'\x00\x01\x43\x11presentMargin'),(b'\x00\x00\x0D\x83\x00\x00\x00\x02VkPerformanceConfigurationAcquireInfoINTEL',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0D\x84\x11type'),(b'\x00\x00\x11\x88\x00\x00\x00\x10VkPerformanceConfigurationINTEL_T',),(b'\x00\x00\x0D\x86\x00\x00\x00\x02VkPerformanceCounterDescriptionKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x11\x48\x11name',b'\x00\x11\x48\x11category',b'\x00\x11\x48\x11description'),(b'\x00\x00\x0D\x87\x00\x00\x00\x02VkPerformanceCounterKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0D\x8B\x11unit',b'\x00\x0D\x89\x11scope',b'\x00\x0D\x8A\x11storage',b'\x00\x11\xCF\x11uuid'),(b'\x00\x00\x0D\x88\x00\x00\x00\x03VkPerformanceCounterResultKHR',b'\x00\x04\x17\x11int32',b'\x00\x11\x55\x11int64',b'\x00\x00\x1F\x11uint32',b'\x00\x01\x43\x11uint64',b'\x00\x06\x63\x11float32',b'\x00\x11\x4A\x11float64'),(b'\x00\x00\x0D\x8C\x00\x00\x00\x02VkPerformanceMarkerInfoINTEL',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x43\x11marker'),(b'\x00\x00\x0D\x8D\x00\x00\x00\x02VkPerformanceOverrideInfoINTEL',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0D\x8E\x11type',b'\x00\x00\x1F\x11enable',b'\x00\x01\x43\x11parameter'),(b'\x00\x00\x0D\x8F\x00\x00\x00\x02VkPerformanceQuerySubmitInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11counterPassIndex'),(b'\x00\x00\x0D\x90\x00\x00\x00\x02VkPerformanceStreamMarkerInfoINTEL',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11marker'),(b'\x00\x00\x0D\x91\x00\x00\x00\x03VkPerformanceValueDataINTEL',b'\x00\x00\x1F\x11value32',b'\x00\x01\x43\x11value64',b'\x00\x06\x63\x11valueFloat',b'\x00\x00\x1F\x11valueBool',b'\x00\x00\x06\x11valueString'),(b'\x00\x00\x0D\x92\x00\x00\x00\x02VkPerformanceValueINTEL',b'\x00\x0D\x93\x11type',b'\x00\x0D\x91\x11data'),(b'\x00\x00\x0D\x94\x00\x00\x00\x02VkPhysicalDevice16BitStorageFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11storageBuffer16BitAccess',b'\x00\x00\x1F\x11uniformAndStorageBuffer16BitAccess',b'\x00\x00\x1F\x11storagePushConstant16',b'\x00\x00\x1F\x11storageInputOutput16'),(b'\x00\x00\x0D\x95\x00\x00\x00\x02VkPhysicalDevice4444FormatsFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11formatA4R4G4B4',b'\x00\x00\x1F\x11formatA4B4G4R4'),(b'\x00\x00\x0D\x96\x00\x00\x00\x02VkPhysicalDevice8BitStorageFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11storageBuffer8BitAccess',b'\x00\x00\x1F\x11uniformAndStorageBuffer8BitAccess',b'\x00\x00\x1F\x11storagePushConstant8'),(b'\x00\x00\x0D\x97\x00\x00\x00\x02VkPhysicalDeviceASTCDecodeFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11decodeModeSharedExponent'),(b'\x00\x00\x0D\x98\x00\x00\x00\x02VkPhysicalDeviceAccelerationStructureFeaturesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11accelerationStructure',b'\x00\x00\x1F\x11accelerationStructureCaptureReplay',b'\x00\x00\x1F\x11accelerationStructureIndirectBuild',b'\x00\x00\x1F\x11accelerationStructureHostCommands',b'\x00\x00\x1F\x11descriptorBindingAccelerationStructureUpdateAfterBind'),(b'\x00\x00\x0D\x99\x00\x00\x00\x02VkPhysicalDeviceAccelerationStructurePropertiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\x43\x11maxGeometryCount',b'\x00\x01\x43\x11maxInstanceCount',b'\x00\x01\x43\x11maxPrimitiveCount',b'\x00\x00\x1F\x11maxPerStageDescriptorAccelerationStructures',b'\x00\x00\x1F\x11maxPerStageDescriptorUpdateAfterBindAccelerationStructures',b'\x00\x00\x1F\x11maxDescriptorSetAccelerationStructures',b'\x00\x00\x1F\x11maxDescriptorSetUpdateAfterBindAccelerationStructures',b'\x00\x00\x1F\x11minAccelerationStructureScratchOffsetAlignment'),(b'\x00\x00\x0D\x9A\x00\x00\x00\x02VkPhysicalDeviceAddressBindingReportFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11reportAddressBinding'),(b'\x00\x00\x0D\x9B\x00\x00\x00\x02VkPhysicalDeviceAmigoProfilingFeaturesSEC',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11amigoProfiling'),(b'\x00\x00\x0D\x9C\x00\x00\x00\x02VkPhysicalDeviceAttachmentFeedbackLoopDynamicStateFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11attachmentFeedbackLoopDynamicState'),(b'\x00\x00\x0D\x9D\x00\x00\x00\x02VkPhysicalDeviceAttachmentFeedbackLoopLayoutFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11attachmentFeedbackLoopLayout'),(b'\x00\x00\x0D\x9E\x00\x00\x00\x02VkPhysicalDeviceBlendOperationAdvancedFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11advancedBlendCoherentOperations'),(b'\x00\x00\x0D\x9F\x00\x00\x00\x02VkPhysicalDeviceBlendOperationAdvancedPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11advancedBlendMaxColorAttachments',b'\x00\x00\x1F\x11advancedBlendIndependentBlend',b'\x00\x00\x1F\x11advancedBlendNonPremultipliedSrcColor',b'\x00\x00\x1F\x11advancedBlendNonPremultipliedDstColor',b'\x00\x00\x1F\x11advancedBlendCorrelatedOverlap',b'\x00\x00\x1F\x11advancedBlendAllOperations'),(b'\x00\x00\x0D\xA0\x00\x00\x00\x02VkPhysicalDeviceBorderColorSwizzleFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11borderColorSwizzle',b'\x00\x00\x1F\x11borderColorSwizzleFromImage'),(b'\x00\x00\x0D\xA1\x00\x00\x00\x02VkPhysicalDeviceBufferDeviceAddressFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11bufferDeviceAddress',b'\x00\x00\x1F\x11bufferDeviceAddressCaptureReplay',b'\x00\x00\x1F\x11bufferDeviceAddressMultiDevice'),(b'\x00\x00\x0D\xA2\x00\x00\x00\x02VkPhysicalDeviceBufferDeviceAddressFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11bufferDeviceAddress',b'\x00\x00\x1F\x11bufferDeviceAddressCaptureReplay',b'\x00\x00\x1F\x11bufferDeviceAddressMultiDevice'),(b'\x00\x00\x0D\xA3\x00\x00\x00\x02VkPhysicalDeviceClusterCullingShaderFeaturesHUAWEI',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11clustercullingShader',b'\x00\x00\x1F\x11multiviewClusterCullingShader'),(b'\x00\x00\x0D\xA4\x00\x00\x00\x02VkPhysicalDeviceClusterCullingShaderPropertiesHUAWEI',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x11\xBE\x11maxWorkGroupCount',b'\x00\x11\xBE\x11maxWorkGroupSize',b'\x00\x00\x1F\x11maxOutputClusterCount',b'\x00\x01\x43\x11indirectBufferOffsetAlignment'),(b'\x00\x00\x0D\xA5\x00\x00\x00\x02VkPhysicalDeviceClusterCullingShaderVrsFeaturesHUAWEI',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11clusterShadingRate'),(b'\x00\x00\x0D\xA6\x00\x00\x00\x02VkPhysicalDeviceCoherentMemoryFeaturesAMD',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11deviceCoherentMemory'),(b'\x00\x00\x0D\xA7\x00\x00\x00\x02VkPhysicalDeviceColorWriteEnableFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11colorWriteEnable'),(b'\x00\x00\x0D\xA8\x00\x00\x00\x02VkPhysicalDeviceComputeShaderDerivativesFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11computeDerivativeGroupQuads',b'\x00\x00\x1F\x11computeDerivativeGroupLinear'),(b'\x00\x00\x0D\xA9\x00\x00\x00\x02VkPhysicalDeviceConditionalRenderingFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11conditionalRendering',b'\x00\x00\x1F\x11inheritedConditionalRendering'),(b'\x00\x00\x0D\xAA\x00\x00\x00\x02VkPhysicalDeviceConservativeRasterizationPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x06\x63\x11primitiveOverestimationSize',b'\x00\x06\x63\x11maxExtraPrimitiveOverestimationSize',b'\x00\x06\x63\x11extraPrimitiveOverestimationSizeGranularity',b'\x00\x00\x1F\x11primitiveUnderestimation',b'\x00\x00\x1F\x11conservativePointAndLineRasterization',b'\x00\x00\x1F\x11degenerateTrianglesRasterized',b'\x00\x00\x1F\x11degenerateLinesRasterized',b'\x00\x00\x1F\x11fullyCoveredFragmentShaderInputVariable',b'\x00\x00\x1F\x11conservativeRasterizationPostDepthCoverage'),(b'\x00\x00\x0D\xAB\x00\x00\x00\x02VkPhysicalDeviceCooperativeMatrixFeaturesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11cooperativeMatrix',b'\x00\x00\x1F\x11cooperativeMatrixRobustBufferAccess'),(b'\x00\x00\x0D\xAC\x00\x00\x00\x02VkPhysicalDeviceCooperativeMatrixFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11cooperativeMatrix',b'\x00\x00\x1F\x11cooperativeMatrixRobustBufferAccess'),(b'\x00\x00\x0D\xAD\x00\x00\x00\x02VkPhysicalDeviceCooperativeMatrixPropertiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11cooperativeMatrixSupportedStages'),(b'\x00\x00\x0D\xAE\x00\x00\x00\x02VkPhysicalDeviceCooperativeMatrixPropertiesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11cooperativeMatrixSupportedStages'),(b'\x00\x00\x0D\xAF\x00\x00\x00\x02VkPhysicalDeviceCopyMemoryIndirectFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11indirectCopy'),(b'\x00\x00\x0D\xB0\x00\x00\x00\x02VkPhysicalDeviceCopyMemoryIndirectPropertiesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11supportedQueues'),(b'\x00\x00\x0D\xB1\x00\x00\x00\x02VkPhysicalDeviceCornerSampledImageFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11cornerSampledImage'),(b'\x00\x00\x0D\xB2\x00\x00\x00\x02VkPhysicalDeviceCoverageReductionModeFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11coverageReductionMode'),(b'\x00\x00\x0D\xB3\x00\x00\x00\x02VkPhysicalDeviceCubicClampFeaturesQCOM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11cubicRangeClamp'),(b'\x00\x00\x0D\xB4\x00\x00\x00\x02VkPhysicalDeviceCubicWeightsFeaturesQCOM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11selectableCubicWeights'),(b'\x00\x00\x0D\xB5\x00\x00\x00\x02VkPhysicalDeviceCudaKernelLaunchFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11cudaKernelLaunchFeatures'),(b'\x00\x00\x0D\xB6\x00\x00\x00\x02VkPhysicalDeviceCudaKernelLaunchPropertiesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11computeCapabilityMinor',b'\x00\x00\x1F\x11computeCapabilityMajor'),(b'\x00\x00\x0D\xB7\x00\x00\x00\x02VkPhysicalDeviceCustomBorderColorFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11customBorderColors',b'\x00\x00\x1F\x11customBorderColorWithoutFormat'),(b'\x00\x00\x0D\xB8\x00\x00\x00\x02VkPhysicalDeviceCustomBorderColorPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11maxCustomBorderColorSamplers'),(b'\x00\x00\x0D\xB9\x00\x00\x00\x02VkPhysicalDeviceDedicatedAllocationImageAliasingFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11dedicatedAllocationImageAliasing'),(b'\x00\x00\x0D\xBA\x00\x00\x00\x02VkPhysicalDeviceDepthBiasControlFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11depthBiasControl',b'\x00\x00\x1F\x11leastRepresentableValueForceUnormRepresentation',b'\x00\x00\x1F\x11floatRepresentation',b'\x00\x00\x1F\x11depthBiasExact'),(b'\x00\x00\x0D\xBB\x00\x00\x00\x02VkPhysicalDeviceDepthClampZeroOneFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11depthClampZeroOne'),(b'\x00\x00\x0D\xBC\x00\x00\x00\x02VkPhysicalDeviceDepthClipControlFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11depthClipControl'),(b'\x00\x00\x0D\xBD\x00\x00\x00\x02VkPhysicalDeviceDepthClipEnableFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11depthClipEnable'),(b'\x00\x00\x0D\xBE\x00\x00\x00\x02VkPhysicalDeviceDepthStencilResolveProperties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11supportedDepthResolveModes',b'\x00\x00\x1F\x11supportedStencilResolveModes',b'\x00\x00\x1F\x11independentResolveNone',b'\x00\x00\x1F\x11independentResolve'),(b'\x00\x00\x0D\xBF\x00\x00\x00\x02VkPhysicalDeviceDescriptorBufferDensityMapPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\xF7\x11combinedImageSamplerDensityMapDescriptorSize'),(b'\x00\x00\x0D\xC0\x00\x00\x00\x02VkPhysicalDeviceDescriptorBufferFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11descriptorBuffer',b'\x00\x00\x1F\x11descriptorBufferCaptureReplay',b'\x00\x00\x1F\x11descriptorBufferImageLayoutIgnored',b'\x00\x00\x1F\x11descriptorBufferPushDescriptors'),(b'\x00\x00\x0D\xC1\x00\x00\x00\x02VkPhysicalDeviceDescriptorBufferPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11combinedImageSamplerDescriptorSingleArray',b'\x00\x00\x1F\x11bufferlessPushDescriptors',b'\x00\x00\x1F\x11allowSamplerImageViewPostSubmitCreation',b'\x00\x01\x43\x11descriptorBufferOffsetAlignment',b'\x00\x00\x1F\x11maxDescriptorBufferBindings',b'\x00\x00\x1F\x11maxResourceDescriptorBufferBindings',b'\x00\x00\x1F\x11maxSamplerDescriptorBufferBindings',b'\x00\x00\x1F\x11maxEmbeddedImmutableSamplerBindings',b'\x00\x00\x1F\x11maxEmbeddedImmutableSamplers',b'\x00\x01\xF7\x11bufferCaptureReplayDescriptorDataSize',b'\x00\x01\xF7\x11imageCaptureReplayDescriptorDataSize',b'\x00\x01\xF7\x11imageViewCaptureReplayDescriptorDataSize',b'\x00\x01\xF7\x11samplerCaptureReplayDescriptorDataSize',b'\x00\x01\xF7\x11accelerationStructureCaptureReplayDescriptorDataSize',b'\x00\x01\xF7\x11samplerDescriptorSize',b'\x00\x01\xF7\x11combinedImageSamplerDescriptorSize',b'\x00\x01\xF7\x11sampledImageDescriptorSize',b'\x00\x01\xF7\x11storageImageDescriptorSize',b'\x00\x01\xF7\x11uniformTexelBufferDescriptorSize',b'\x00\x01\xF7\x11robustUniformTexelBufferDescriptorSize',b'\x00\x01\xF7\x11storageTexelBufferDescriptorSize',b'\x00\x01\xF7\x11robustStorageTexelBufferDescriptorSize',b'\x00\x01\xF7\x11uniformBufferDescriptorSize',b'\x00\x01\xF7\x11robustUniformBufferDescriptorSize',b'\x00\x01\xF7\x11storageBufferDescriptorSize',b'\x00\x01\xF7\x11robustStorageBufferDescriptorSize',b'\x00\x01\xF7\x11inputAttachmentDescriptorSize',b'\x00\x01\xF7\x11accelerationStructureDescriptorSize',b'\x00\x01\x43\x11maxSamplerDescriptorBufferRange',b'\x00\x01\x43\x11maxResourceDescriptorBufferRange',b'\x00\x01\x43\x11samplerDescriptorBufferAddressSpaceSize',b'\x00\x01\x43\x11resourceDescriptorBufferAddressSpaceSize',b'\x00\x01\x43\x11descriptorBufferAddressSpaceSize'),(b'\x00\x00\x0D\xC2\x00\x00\x00\x02VkPhysicalDeviceDescriptorIndexingFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderInputAttachmentArrayDynamicIndexing',b'\x00\x00\x1F\x11shaderUniformTexelBufferArrayDynamicIndexing',b'\x00\x00\x1F\x11shaderStorageTexelBufferArrayDynamicIndexing',b'\x00\x00\x1F\x11shaderUniformBufferArrayNonUniformIndexing',b'\x00\x00\x1F\x11shaderSampledImageArrayNonUniformIndexing',b'\x00\x00\x1F\x11shaderStorageBufferArrayNonUniformIndexing',b'\x00\x00\x1F\x11shaderStorageImageArrayNonUniformIndexing',b'\x00\x00\x1F\x11shaderInputAttachmentArrayNonUniformIndexing',b'\x00\x00\x1F\x11shaderUniformTexelBufferArrayNonUniformIndexing',b'\x00\x00\x1F\x11shaderStorageTexelBufferArrayNonUniformIndexing',b'\x00\x00\x1F\x11descriptorBindingUniformBufferUpdateAfterBind',b'\x00\x00\x1F\x11descriptorBindingSampledImageUpdateAfterBind',b'\x00\x00\x1F\x11descriptorBindingStorageImageUpdateAfterBind',b'\x00\x00\x1F\x11descriptorBindingStorageBufferUpdateAfterBind',b'\x00\x00\x1F\x11descriptorBindingUniformTexelBufferUpdateAfterBind',b'\x00\x00\x1F\x11descriptorBindingStorageTexelBufferUpdateAfterBind',b'\x00\x00\x1F\x11descriptorBindingUpdateUnusedWhilePending',b'\x00\x00\x1F\x11descriptorBindingPartiallyBound',b'\x00\x00\x1F\x11descriptorBindingVariableDescriptorCount',b'\x00\x00\x1F\x11runtimeDescriptorArray'),(b'\x00\x00\x0D\xC3\x00\x00\x00\x02VkPhysicalDeviceDescriptorIndexingProperties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11maxUpdateAfterBindDescriptorsInAllPools',b'\x00\x00\x1F\x11shaderUniformBufferArrayNonUniformIndexingNative',b'\x00\x00\x1F\x11shaderSampledImageArrayNonUniformIndexingNative',b'\x00\x00\x1F\x11shaderStorageBufferArrayNonUniformIndexingNative',b'\x00\x00\x1F\x11shaderStorageImageArrayNonUniformIndexingNative',b'\x00\x00\x1F\x11shaderInputAttachmentArrayNonUniformIndexingNative',b'\x00\x00\x1F\x11robustBufferAccessUpdateAfterBind',b'\x00\x00\x1F\x11quadDivergentImplicitLod',b'\x00\x00\x1F\x11maxPerStageDescriptorUpdateAfterBindSamplers',b'\x00\x00\x1F\x11maxPerStageDescriptorUpdateAfterBindUniformBuffers',b'\x00\x00\x1F\x11maxPerStageDescriptorUpdateAfterBindStorageBuffers',b'\x00\x00\x1F\x11maxPerStageDescriptorUpdateAfterBindSampledImages',b'\x00\x00\x1F\x11maxPerStageDescriptorUpdateAfterBindStorageImages',b'\x00\x00\x1F\x11maxPerStageDescriptorUpdateAfterBindInputAttachments',b'\x00\x00\x1F\x11maxPerStageUpdateAfterBindResources',b'\x00\x00\x1F\x11maxDescriptorSetUpdateAfterBindSamplers',b'\x00\x00\x1F\x11maxDescriptorSetUpdateAfterBindUniformBuffers',b'\x00\x00\x1F\x11maxDescriptorSetUpdateAfterBindUniformBuffersDynamic',b'\x00\x00\x1F\x11maxDescriptorSetUpdateAfterBindStorageBuffers',b'\x00\x00\x1F\x11maxDescriptorSetUpdateAfterBindStorageBuffersDynamic',b'\x00\x00\x1F\x11maxDescriptorSetUpdateAfterBindSampledImages',b'\x00\x00\x1F\x11maxDescriptorSetUpdateAfterBindStorageImages',b'\x00\x00\x1F\x11maxDescriptorSetUpdateAfterBindInputAttachments'),(b'\x00\x00\x0D\xC4\x00\x00\x00\x02VkPhysicalDeviceDescriptorPoolOverallocationFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11descriptorPoolOverallocation'),(b'\x00\x00\x0D\xC5\x00\x00\x00\x02VkPhysicalDeviceDescriptorSetHostMappingFeaturesVALVE',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11descriptorSetHostMapping'),(b'\x00\x00\x0D\xC6\x00\x00\x00\x02VkPhysicalDeviceDeviceGeneratedCommandsComputeFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11deviceGeneratedCompute',b'\x00\x00\x1F\x11deviceGeneratedComputePipelines',b'\x00\x00\x1F\x11deviceGeneratedComputeCaptureReplay'),(b'\x00\x00\x0D\xC7\x00\x00\x00\x02VkPhysicalDeviceDeviceGeneratedCommandsFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11deviceGeneratedCommands'),(b'\x00\x00\x0D\xC8\x00\x00\x00\x02VkPhysicalDeviceDeviceGeneratedCommandsPropertiesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11maxGraphicsShaderGroupCount',b'\x00\x00\x1F\x11maxIndirectSequenceCount',b'\x00\x00\x1F\x11maxIndirectCommandsTokenCount',b'\x00\x00\x1F\x11maxIndirectCommandsStreamCount',b'\x00\x00\x1F\x11maxIndirectCommandsTokenOffset',b'\x00\x00\x1F\x11maxIndirectCommandsStreamStride',b'\x00\x00\x1F\x11minSequencesCountBufferOffsetAlignment',b'\x00\x00\x1F\x11minSequencesIndexBufferOffsetAlignment',b'\x00\x00\x1F\x11minIndirectCommandsBufferOffsetAlignment'),(b'\x00\x00\x0D\xC9\x00\x00\x00\x02VkPhysicalDeviceDeviceMemoryReportFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11deviceMemoryReport'),(b'\x00\x00\x0D\xCA\x00\x00\x00\x02VkPhysicalDeviceDiagnosticsConfigFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11diagnosticsConfig'),(b'\x00\x00\x0D\xCB\x00\x00\x00\x02VkPhysicalDeviceDiscardRectanglePropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11maxDiscardRectangles'),(b'\x00\x00\x0D\xCC\x00\x00\x00\x02VkPhysicalDeviceDriverProperties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0C\x8B\x11driverID',b'\x00\x11\x48\x11driverName',b'\x00\x11\x48\x11driverInfo',b'\x00\x0B\xF1\x11conformanceVersion'),(b'\x00\x00\x0D\xCD\x00\x00\x00\x02VkPhysicalDeviceDrmPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11hasPrimary',b'\x00\x00\x1F\x11hasRender',b'\x00\x11\x55\x11primaryMajor',b'\x00\x11\x55\x11primaryMinor',b'\x00\x11\x55\x11renderMajor',b'\x00\x11\x55\x11renderMinor'),(b'\x00\x00\x0D\xCE\x00\x00\x00\x02VkPhysicalDeviceDynamicRenderingFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11dynamicRendering'),(b'\x00\x00\x0D\xCF\x00\x00\x00\x02VkPhysicalDeviceDynamicRenderingUnusedAttachmentsFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11dynamicRenderingUnusedAttachments'),(b'\x00\x00\x0D\xD0\x00\x00\x00\x02VkPhysicalDeviceExclusiveScissorFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11exclusiveScissor'),(b'\x00\x00\x0D\xD1\x00\x00\x00\x02VkPhysicalDeviceExtendedDynamicState2FeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11extendedDynamicState2',b'\x00\x00\x1F\x11extendedDynamicState2LogicOp',b'\x00\x00\x1F\x11extendedDynamicState2PatchControlPoints'),(b'\x00\x00\x0D\xD2\x00\x00\x00\x02VkPhysicalDeviceExtendedDynamicState3FeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11extendedDynamicState3TessellationDomainOrigin',b'\x00\x00\x1F\x11extendedDynamicState3DepthClampEnable',b'\x00\x00\x1F\x11extendedDynamicState3PolygonMode',b'\x00\x00\x1F\x11extendedDynamicState3RasterizationSamples',b'\x00\x00\x1F\x11extendedDynamicState3SampleMask',b'\x00\x00\x1F\x11extendedDynamicState3AlphaToCoverageEnable',b'\x00\x00\x1F\x11extendedDynamicState3AlphaToOneEnable',b'\x00\x00\x1F\x11extendedDynamicState3LogicOpEnable',b'\x00\x00\x1F\x11extendedDynamicState3ColorBlendEnable',b'\x00\x00\x1F\x11extendedDynamicState3ColorBlendEquation',b'\x00\x00\x1F\x11extendedDynamicState3ColorWriteMask',b'\x00\x00\x1F\x11extendedDynamicState3RasterizationStream',b'\x00\x00\x1F\x11extendedDynamicState3ConservativeRasterizationMode',b'\x00\x00\x1F\x11extendedDynamicState3ExtraPrimitiveOverestimationSize',b'\x00\x00\x1F\x11extendedDynamicState3DepthClipEnable',b'\x00\x00\x1F\x11extendedDynamicState3SampleLocationsEnable',b'\x00\x00\x1F\x11extendedDynamicState3ColorBlendAdvanced',b'\x00\x00\x1F\x11extendedDynamicState3ProvokingVertexMode',b'\x00\x00\x1F\x11extendedDynamicState3LineRasterizationMode',b'\x00\x00\x1F\x11extendedDynamicState3LineStippleEnable',b'\x00\x00\x1F\x11extendedDynamicState3DepthClipNegativeOneToOne',b'\x00\x00\x1F\x11extendedDynamicState3ViewportWScalingEnable',b'\x00\x00\x1F\x11extendedDynamicState3ViewportSwizzle',b'\x00\x00\x1F\x11extendedDynamicState3CoverageToColorEnable',b'\x00\x00\x1F\x11extendedDynamicState3CoverageToColorLocation',b'\x00\x00\x1F\x11extendedDynamicState3CoverageModulationMode',b'\x00\x00\x1F\x11extendedDynamicState3CoverageModulationTableEnable',b'\x00\x00\x1F\x11extendedDynamicState3CoverageModulationTable',b'\x00\x00\x1F\x11extendedDynamicState3CoverageReductionMode',b'\x00\x00\x1F\x11extendedDynamicState3RepresentativeFragmentTestEnable',b'\x00\x00\x1F\x11extendedDynamicState3ShadingRateImageEnable'),(b'\x00\x00\x0D\xD3\x00\x00\x00\x02VkPhysicalDeviceExtendedDynamicState3PropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11dynamicPrimitiveTopologyUnrestricted'),(b'\x00\x00\x0D\xD4\x00\x00\x00\x02VkPhysicalDeviceExtendedDynamicStateFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11extendedDynamicState'),(b'\x00\x00\x0D\xD5\x00\x00\x00\x02VkPhysicalDeviceExtendedSparseAddressSpaceFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11extendedSparseAddressSpace'),(b'\x00\x00\x0D\xD6\x00\x00\x00\x02VkPhysicalDeviceExtendedSparseAddressSpacePropertiesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\x43\x11extendedSparseAddressSpaceSize',b'\x00\x00\x1F\x11extendedSparseImageUsageFlags',b'\x00\x00\x1F\x11extendedSparseBufferUsageFlags'),(b'\x00\x00\x0D\xD7\x00\x00\x00\x02VkPhysicalDeviceExternalBufferInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11usage',b'\x00\x00\xC1\x11handleType'),(b'\x00\x00\x0D\xD8\x00\x00\x00\x02VkPhysicalDeviceExternalFenceInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0C\xA4\x11handleType'),(b'\x00\x00\x0D\xD9\x00\x00\x00\x02VkPhysicalDeviceExternalFormatResolveFeaturesANDROID',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11externalFormatResolve'),(b'\x00\x00\x0D\xDA\x00\x00\x00\x02VkPhysicalDeviceExternalFormatResolvePropertiesANDROID',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11nullColorAttachmentWithExternalFormatResolve',b'\x00\x0B\xCB\x11externalFormatResolveChromaOffsetX',b'\x00\x0B\xCB\x11externalFormatResolveChromaOffsetY'),(b'\x00\x00\x0D\xDB\x00\x00\x00\x02VkPhysicalDeviceExternalImageFormatInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\xC1\x11handleType'),(b'\x00\x00\x0D\xDC\x00\x00\x00\x02VkPhysicalDeviceExternalMemoryHostPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\x43\x11minImportedHostPointerAlignment'),(b'\x00\x00\x0D\xDD\x00\x00\x00\x02VkPhysicalDeviceExternalMemoryRDMAFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11externalMemoryRDMA'),(b'\x00\x00\x0D\xDE\x00\x00\x00\x02VkPhysicalDeviceExternalSemaphoreInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0C\xB2\x11handleType'),(b'\x00\x00\x0D\xDF\x00\x00\x00\x02VkPhysicalDeviceFaultFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11deviceFault',b'\x00\x00\x1F\x11deviceFaultVendorBinary'),(b'\x00\x00\x0D\xE2\x00\x00\x00\x02VkPhysicalDeviceFeatures',b'\x00\x00\x1F\x11robustBufferAccess',b'\x00\x00\x1F\x11fullDrawIndexUint32',b'\x00\x00\x1F\x11imageCubeArray',b'\x00\x00\x1F\x11independentBlend',b'\x00\x00\x1F\x11geometryShader',b'\x00\x00\x1F\x11tessellationShader',b'\x00\x00\x1F\x11sampleRateShading',b'\x00\x00\x1F\x11dualSrcBlend',b'\x00\x00\x1F\x11logicOp',b'\x00\x00\x1F\x11multiDrawIndirect',b'\x00\x00\x1F\x11drawIndirectFirstInstance',b'\x00\x00\x1F\x11depthClamp',b'\x00\x00\x1F\x11depthBiasClamp',b'\x00\x00\x1F\x11fillModeNonSolid',b'\x00\x00\x1F\x11depthBounds',b'\x00\x00\x1F\x11wideLines',b'\x00\x00\x1F\x11largePoints',b'\x00\x00\x1F\x11alphaToOne',b'\x00\x00\x1F\x11multiViewport',b'\x00\x00\x1F\x11samplerAnisotropy',b'\x00\x00\x1F\x11textureCompressionETC2',b'\x00\x00\x1F\x11textureCompressionASTC_LDR',b'\x00\x00\x1F\x11textureCompressionBC',b'\x00\x00\x1F\x11occlusionQueryPrecise',b'\x00\x00\x1F\x11pipelineStatisticsQuery',b'\x00\x00\x1F\x11vertexPipelineStoresAndAtomics',b'\x00\x00\x1F\x11fragmentStoresAndAtomics',b'\x00\x00\x1F\x11shaderTessellationAndGeometryPointSize',b'\x00\x00\x1F\x11shaderImageGatherExtended',b'\x00\x00\x1F\x11shaderStorageImageExtendedFormats',b'\x00\x00\x1F\x11shaderStorageImageMultisample',b'\x00\x00\x1F\x11shaderStorageImageReadWithoutFormat',b'\x00\x00\x1F\x11shaderStorageImageWriteWithoutFormat',b'\x00\x00\x1F\x11shaderUniformBufferArrayDynamicIndexing',b'\x00\x00\x1F\x11shaderSampledImageArrayDynamicIndexing',b'\x00\x00\x1F\x11shaderStorageBufferArrayDynamicIndexing',b'\x00\x00\x1F\x11shaderStorageImageArrayDynamicIndexing',b'\x00\x00\x1F\x11shaderClipDistance',b'\x00\x00\x1F\x11shaderCullDistance',b'\x00\x00\x1F\x11shaderFloat64',b'\x00\x00\x1F\x11shaderInt64',b'\x00\x00\x1F\x11shaderInt16',b'\x00\x00\x1F\x11shaderResourceResidency',b'\x00\x00\x1F\x11shaderResourceMinLod',b'\x00\x00\x1F\x11sparseBinding',b'\x00\x00\x1F\x11sparseResidencyBuffer',b'\x00\x00\x1F\x11sparseResidencyImage2D',b'\x00\x00\x1F\x11sparseResidencyImage3D',b'\x00\x00\x1F\x11sparseResidency2Samples',b'\x00\x00\x1F\x11sparseResidency4Samples',b'\x00\x00\x1F\x11sparseResidency8Samples',b'\x00\x00\x1F\x11sparseResidency16Samples',b'\x00\x00\x1F\x11sparseResidencyAliased',b'\x00\x00\x1F\x11variableMultisampleRate',b'\x00\x00\x1F\x11inheritedQueries'),(b'\x00\x00\x0D\xE1\x00\x00\x00\x02VkPhysicalDeviceFeatures2',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0D\xE2\x11features'),(b'\x00\x00\x0D\xE3\x00\x00\x00\x02VkPhysicalDeviceFloatControlsProperties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x10\x60\x11denormBehaviorIndependence',b'\x00\x10\x60\x11roundingModeIndependence',b'\x00\x00\x1F\x11shaderSignedZeroInfNanPreserveFloat16',b'\x00\x00\x1F\x11shaderSignedZeroInfNanPreserveFloat32',b'\x00\x00\x1F\x11shaderSignedZeroInfNanPreserveFloat64',b'\x00\x00\x1F\x11shaderDenormPreserveFloat16',b'\x00\x00\x1F\x11shaderDenormPreserveFloat32',b'\x00\x00\x1F\x11shaderDenormPreserveFloat64',b'\x00\x00\x1F\x11shaderDenormFlushToZeroFloat16',b'\x00\x00\x1F\x11shaderDenormFlushToZeroFloat32',b'\x00\x00\x1F\x11shaderDenormFlushToZeroFloat64',b'\x00\x00\x1F\x11shaderRoundingModeRTEFloat16',b'\x00\x00\x1F\x11shaderRoundingModeRTEFloat32',b'\x00\x00\x1F\x11shaderRoundingModeRTEFloat64',b'\x00\x00\x1F\x11shaderRoundingModeRTZFloat16',b'\x00\x00\x1F\x11shaderRoundingModeRTZFloat32',b'\x00\x00\x1F\x11shaderRoundingModeRTZFloat64'),(b'\x00\x00\x0D\xE4\x00\x00\x00\x02VkPhysicalDeviceFragmentDensityMap2FeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11fragmentDensityMapDeferred'),(b'\x00\x00\x0D\xE5\x00\x00\x00\x02VkPhysicalDeviceFragmentDensityMap2PropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11subsampledLoads',b'\x00\x00\x1F\x11subsampledCoarseReconstructionEarlyAccess',b'\x00\x00\x1F\x11maxSubsampledArrayLayers',b'\x00\x00\x1F\x11maxDescriptorSetSubsampledSamplers'),(b'\x00\x00\x0D\xE6\x00\x00\x00\x02VkPhysicalDeviceFragmentDensityMapFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11fragmentDensityMap',b'\x00\x00\x1F\x11fragmentDensityMapDynamic',b'\x00\x00\x1F\x11fragmentDensityMapNonSubsampledImages'),(b'\x00\x00\x0D\xE7\x00\x00\x00\x02VkPhysicalDeviceFragmentDensityMapOffsetFeaturesQCOM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11fragmentDensityMapOffset'),(b'\x00\x00\x0D\xE8\x00\x00\x00\x02VkPhysicalDeviceFragmentDensityMapOffsetPropertiesQCOM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0C\xA0\x11fragmentDensityOffsetGranularity'),(b'\x00\x00\x0D\xE9\x00\x00\x00\x02VkPhysicalDeviceFragmentDensityMapPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0C\xA0\x11minFragmentDensityTexelSize',b'\x00\x0C\xA0\x11maxFragmentDensityTexelSize',b'\x00\x00\x1F\x11fragmentDensityInvocations'),(b'\x00\x00\x0D\xEA\x00\x00\x00\x02VkPhysicalDeviceFragmentShaderBarycentricFeaturesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11fragmentShaderBarycentric'),(b'\x00\x00\x0D\xEB\x00\x00\x00\x02VkPhysicalDeviceFragmentShaderBarycentricPropertiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11triStripVertexOrderIndependentOfProvokingVertex'),(b'\x00\x00\x0D\xEC\x00\x00\x00\x02VkPhysicalDeviceFragmentShaderInterlockFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11fragmentShaderSampleInterlock',b'\x00\x00\x1F\x11fragmentShaderPixelInterlock',b'\x00\x00\x1F\x11fragmentShaderShadingRateInterlock'),(b'\x00\x00\x0D\xED\x00\x00\x00\x02VkPhysicalDeviceFragmentShadingRateEnumsFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11fragmentShadingRateEnums',b'\x00\x00\x1F\x11supersampleFragmentShadingRates',b'\x00\x00\x1F\x11noInvocationFragmentShadingRates'),(b'\x00\x00\x0D\xEE\x00\x00\x00\x02VkPhysicalDeviceFragmentShadingRateEnumsPropertiesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x06\x17\x11maxFragmentShadingRateInvocationCount'),(b'\x00\x00\x0D\xEF\x00\x00\x00\x02VkPhysicalDeviceFragmentShadingRateFeaturesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11pipelineFragmentShadingRate',b'\x00\x00\x1F\x11primitiveFragmentShadingRate',b'\x00\x00\x1F\x11attachmentFragmentShadingRate'),(b'\x00\x00\x0D\xF0\x00\x00\x00\x02VkPhysicalDeviceFragmentShadingRateKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11sampleCounts',b'\x00\x0C\xA0\x11fragmentSize'),(b'\x00\x00\x0D\xF1\x00\x00\x00\x02VkPhysicalDeviceFragmentShadingRatePropertiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0C\xA0\x11minFragmentShadingRateAttachmentTexelSize',b'\x00\x0C\xA0\x11maxFragmentShadingRateAttachmentTexelSize',b'\x00\x00\x1F\x11maxFragmentShadingRateAttachmentTexelSizeAspectRatio',b'\x00\x00\x1F\x11primitiveFragmentShadingRateWithMultipleViewports',b'\x00\x00\x1F\x11layeredShadingRateAttachments',b'\x00\x00\x1F\x11fragmentShadingRateNonTrivialCombinerOps',b'\x00\x0C\xA0\x11maxFragmentSize',b'\x00\x00\x1F\x11maxFragmentSizeAspectRatio',b'\x00\x00\x1F\x11maxFragmentShadingRateCoverageSamples',b'\x00\x06\x17\x11maxFragmentShadingRateRasterizationSamples',b'\x00\x00\x1F\x11fragmentShadingRateWithShaderDepthStencilWrites',b'\x00\x00\x1F\x11fragmentShadingRateWithSampleMask',b'\x00\x00\x1F\x11fragmentShadingRateWithShaderSampleMask',b'\x00\x00\x1F\x11fragmentShadingRateWithConservativeRasterization',b'\x00\x00\x1F\x11fragmentShadingRateWithFragmentShaderInterlock',b'\x00\x00\x1F\x11fragmentShadingRateWithCustomSampleLocations',b'\x00\x00\x1F\x11fragmentShadingRateStrictMultiplyCombiner'),(b'\x00\x00\x0D\xF2\x00\x00\x00\x02VkPhysicalDeviceFrameBoundaryFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11frameBoundary'),(b'\x00\x00\x0D\xF3\x00\x00\x00\x02VkPhysicalDeviceGlobalPriorityQueryFeaturesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11globalPriorityQuery'),(b'\x00\x00\x0D\xF4\x00\x00\x00\x02VkPhysicalDeviceGraphicsPipelineLibraryFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11graphicsPipelineLibrary'),(b'\x00\x00\x0D\xF5\x00\x00\x00\x02VkPhysicalDeviceGraphicsPipelineLibraryPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11graphicsPipelineLibraryFastLinking',b'\x00\x00\x1F\x11graphicsPipelineLibraryIndependentInterpolationDecoration'),(b'\x00\x00\x0D\xF6\x00\x00\x00\x02VkPhysicalDeviceGroupProperties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11physicalDeviceCount',b'\x00\x11\x8A\x11physicalDevices',b'\x00\x00\x1F\x11subsetAllocation'),(b'\x00\x00\x0D\xF7\x00\x00\x00\x02VkPhysicalDeviceHostImageCopyFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11hostImageCopy'),(b'\x00\x00\x0D\xF8\x00\x00\x00\x02VkPhysicalDeviceHostImageCopyPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11copySrcLayoutCount',b'\x00\x0C\xF7\x11pCopySrcLayouts',b'\x00\x00\x1F\x11copyDstLayoutCount',b'\x00\x0C\xF7\x11pCopyDstLayouts',b'\x00\x11\xCF\x11optimalTilingLayoutUUID',b'\x00\x00\x1F\x11identicalMemoryTypeRequirements'),(b'\x00\x00\x0D\xF9\x00\x00\x00\x02VkPhysicalDeviceHostQueryResetFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11hostQueryReset'),(b'\x00\x00\x0D\xFA\x00\x00\x00\x02VkPhysicalDeviceIDProperties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x11\xCF\x11deviceUUID',b'\x00\x11\xCF\x11driverUUID',b'\x00\x11\xE5\x11deviceLUID',b'\x00\x00\x1F\x11deviceNodeMask',b'\x00\x00\x1F\x11deviceLUIDValid'),(b'\x00\x00\x0D\xFB\x00\x00\x00\x02VkPhysicalDeviceImage2DViewOf3DFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11image2DViewOf3D',b'\x00\x00\x1F\x11sampler2DViewOf3D'),(b'\x00\x00\x0D\xFC\x00\x00\x00\x02VkPhysicalDeviceImageCompressionControlFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11imageCompressionControl'),(b'\x00\x00\x0D\xFD\x00\x00\x00\x02VkPhysicalDeviceImageCompressionControlSwapchainFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11imageCompressionControlSwapchain'),(b'\x00\x00\x0D\xFE\x00\x00\x00\x02VkPhysicalDeviceImageDrmFormatModifierInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x43\x11drmFormatModifier',b'\x00\x10\x6A\x11sharingMode',b'\x00\x00\x1F\x11queueFamilyIndexCount',b'\x00\x05\xC8\x11pQueueFamilyIndices'),(b'\x00\x00\x0D\xFF\x00\x00\x00\x02VkPhysicalDeviceImageFormatInfo2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x03\xD2\x11format',b'\x00\x03\xD3\x11type',b'\x00\x03\xD4\x11tiling',b'\x00\x00\x1F\x11usage',b'\x00\x00\x1F\x11flags'),(b'\x00\x00\x0E\x00\x00\x00\x00\x02VkPhysicalDeviceImageProcessing2FeaturesQCOM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11textureBlockMatch2'),(b'\x00\x00\x0E\x01\x00\x00\x00\x02VkPhysicalDeviceImageProcessing2PropertiesQCOM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0C\xA0\x11maxBlockMatchWindow'),(b'\x00\x00\x0E\x02\x00\x00\x00\x02VkPhysicalDeviceImageProcessingFeaturesQCOM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11textureSampleWeighted',b'\x00\x00\x1F\x11textureBoxFilter',b'\x00\x00\x1F\x11textureBlockMatch'),(b'\x00\x00\x0E\x03\x00\x00\x00\x02VkPhysicalDeviceImageProcessingPropertiesQCOM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11maxWeightFilterPhases',b'\x00\x0C\xA0\x11maxWeightFilterDimension',b'\x00\x0C\xA0\x11maxBlockMatchRegion',b'\x00\x0C\xA0\x11maxBoxFilterBlockSize'),(b'\x00\x00\x0E\x04\x00\x00\x00\x02VkPhysicalDeviceImageRobustnessFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11robustImageAccess'),(b'\x00\x00\x0E\x05\x00\x00\x00\x02VkPhysicalDeviceImageSlicedViewOf3DFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11imageSlicedViewOf3D'),(b'\x00\x00\x0E\x06\x00\x00\x00\x02VkPhysicalDeviceImageViewImageFormatInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0D\x13\x11imageViewType'),(b'\x00\x00\x0E\x07\x00\x00\x00\x02VkPhysicalDeviceImageViewMinLodFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11minLod'),(b'\x00\x00\x0E\x08\x00\x00\x00\x02VkPhysicalDeviceImagelessFramebufferFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11imagelessFramebuffer'),(b'\x00\x00\x0E\x09\x00\x00\x00\x02VkPhysicalDeviceIndexTypeUint8FeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11indexTypeUint8'),(b'\x00\x00\x0E\x0A\x00\x00\x00\x02VkPhysicalDeviceInheritedViewportScissorFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11inheritedViewportScissor2D'),(b'\x00\x00\x0E\x0B\x00\x00\x00\x02VkPhysicalDeviceInlineUniformBlockFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11inlineUniformBlock',b'\x00\x00\x1F\x11descriptorBindingInlineUniformBlockUpdateAfterBind'),(b'\x00\x00\x0E\x0C\x00\x00\x00\x02VkPhysicalDeviceInlineUniformBlockProperties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11maxInlineUniformBlockSize',b'\x00\x00\x1F\x11maxPerStageDescriptorInlineUniformBlocks',b'\x00\x00\x1F\x11maxPerStageDescriptorUpdateAfterBindInlineUniformBlocks',b'\x00\x00\x1F\x11maxDescriptorSetInlineUniformBlocks',b'\x00\x00\x1F\x11maxDescriptorSetUpdateAfterBindInlineUniformBlocks'),(b'\x00\x00\x0E\x0D\x00\x00\x00\x02VkPhysicalDeviceInvocationMaskFeaturesHUAWEI',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11invocationMask'),(b'\x00\x00\x0E\x0E\x00\x00\x00\x02VkPhysicalDeviceLayeredDriverPropertiesMSFT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0D\x38\x11underlyingAPI'),(b'\x00\x00\x0E\x0F\x00\x00\x00\x02VkPhysicalDeviceLegacyDitheringFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11legacyDithering'),(b'\x00\x00\x0E\x10\x00\x00\x00\x02VkPhysicalDeviceLimits',b'\x00\x00\x1F\x11maxImageDimension1D',b'\x00\x00\x1F\x11maxImageDimension2D',b'\x00\x00\x1F\x11maxImageDimension3D',b'\x00\x00\x1F\x11maxImageDimensionCube',b'\x00\x00\x1F\x11maxImageArrayLayers',b'\x00\x00\x1F\x11maxTexelBufferElements',b'\x00\x00\x1F\x11maxUniformBufferRange',b'\x00\x00\x1F\x11maxStorageBufferRange',b'\x00\x00\x1F\x11maxPushConstantsSize',b'\x00\x00\x1F\x11maxMemoryAllocationCount',b'\x00\x00\x1F\x11maxSamplerAllocationCount',b'\x00\x01\x43\x11bufferImageGranularity',b'\x00\x01\x43\x11sparseAddressSpaceSize',b'\x00\x00\x1F\x11maxBoundDescriptorSets',b'\x00\x00\x1F\x11maxPerStageDescriptorSamplers',b'\x00\x00\x1F\x11maxPerStageDescriptorUniformBuffers',b'\x00\x00\x1F\x11maxPerStageDescriptorStorageBuffers',b'\x00\x00\x1F\x11maxPerStageDescriptorSampledImages',b'\x00\x00\x1F\x11maxPerStageDescriptorStorageImages',b'\x00\x00\x1F\x11maxPerStageDescriptorInputAttachments',b'\x00\x00\x1F\x11maxPerStageResources',b'\x00\x00\x1F\x11maxDescriptorSetSamplers',b'\x00\x00\x1F\x11maxDescriptorSetUniformBuffers',b'\x00\x00\x1F\x11maxDescriptorSetUniformBuffersDynamic',b'\x00\x00\x1F\x11maxDescriptorSetStorageBuffers',b'\x00\x00\x1F\x11maxDescriptorSetStorageBuffersDynamic',b'\x00\x00\x1F\x11maxDescriptorSetSampledImages',b'\x00\x00\x1F\x11maxDescriptorSetStorageImages',b'\x00\x00\x1F\x11maxDescriptorSetInputAttachments',b'\x00\x00\x1F\x11maxVertexInputAttributes',b'\x00\x00\x1F\x11maxVertexInputBindings',b'\x00\x00\x1F\x11maxVertexInputAttributeOffset',b'\x00\x00\x1F\x11maxVertexInputBindingStride',b'\x00\x00\x1F\x11maxVertexOutputComponents',b'\x00\x00\x1F\x11maxTessellationGenerationLevel',b'\x00\x00\x1F\x11maxTessellationPatchSize',b'\x00\x00\x1F\x11maxTessellationControlPerVertexInputComponents',b'\x00\x00\x1F\x11maxTessellationControlPerVertexOutputComponents',b'\x00\x00\x1F\x11maxTessellationControlPerPatchOutputComponents',b'\x00\x00\x1F\x11maxTessellationControlTotalOutputComponents',b'\x00\x00\x1F\x11maxTessellationEvaluationInputComponents',b'\x00\x00\x1F\x11maxTessellationEvaluationOutputComponents',b'\x00\x00\x1F\x11maxGeometryShaderInvocations',b'\x00\x00\x1F\x11maxGeometryInputComponents',b'\x00\x00\x1F\x11maxGeometryOutputComponents',b'\x00\x00\x1F\x11maxGeometryOutputVertices',b'\x00\x00\x1F\x11maxGeometryTotalOutputComponents',b'\x00\x00\x1F\x11maxFragmentInputComponents',b'\x00\x00\x1F\x11maxFragmentOutputAttachments',b'\x00\x00\x1F\x11maxFragmentDualSrcAttachments',b'\x00\x00\x1F\x11maxFragmentCombinedOutputResources',b'\x00\x00\x1F\x11maxComputeSharedMemorySize',b'\x00\x11\xBE\x11maxComputeWorkGroupCount',b'\x00\x00\x1F\x11maxComputeWorkGroupInvocations',b'\x00\x11\xBE\x11maxComputeWorkGroupSize',b'\x00\x00\x1F\x11subPixelPrecisionBits',b'\x00\x00\x1F\x11subTexelPrecisionBits',b'\x00\x00\x1F\x11mipmapPrecisionBits',b'\x00\x00\x1F\x11maxDrawIndexedIndexValue',b'\x00\x00\x1F\x11maxDrawIndirectCount',b'\x00\x06\x63\x11maxSamplerLodBias',b'\x00\x06\x63\x11maxSamplerAnisotropy',b'\x00\x00\x1F\x11maxViewports',b'\x00\x11\xBA\x11maxViewportDimensions',b'\x00\x11\x4B\x11viewportBoundsRange',b'\x00\x00\x1F\x11viewportSubPixelBits',b'\x00\x01\xF7\x11minMemoryMapAlignment',b'\x00\x01\x43\x11minTexelBufferOffsetAlignment',b'\x00\x01\x43\x11minUniformBufferOffsetAlignment',b'\x00\x01\x43\x11minStorageBufferOffsetAlignment',b'\x00\x04\x17\x11minTexelOffset',b'\x00\x00\x1F\x11maxTexelOffset',b'\x00\x04\x17\x11minTexelGatherOffset',b'\x00\x00\x1F\x11maxTexelGatherOffset',b'\x00\x06\x63\x11minInterpolationOffset',b'\x00\x06\x63\x11maxInterpolationOffset',b'\x00\x00\x1F\x11subPixelInterpolationOffsetBits',b'\x00\x00\x1F\x11maxFramebufferWidth',b'\x00\x00\x1F\x11maxFramebufferHeight',b'\x00\x00\x1F\x11maxFramebufferLayers',b'\x00\x00\x1F\x11framebufferColorSampleCounts',b'\x00\x00\x1F\x11framebufferDepthSampleCounts',b'\x00\x00\x1F\x11framebufferStencilSampleCounts',b'\x00\x00\x1F\x11framebufferNoAttachmentsSampleCounts',b'\x00\x00\x1F\x11maxColorAttachments',b'\x00\x00\x1F\x11sampledImageColorSampleCounts',b'\x00\x00\x1F\x11sampledImageIntegerSampleCounts',b'\x00\x00\x1F\x11sampledImageDepthSampleCounts',b'\x00\x00\x1F\x11sampledImageStencilSampleCounts',b'\x00\x00\x1F\x11storageImageSampleCounts',b'\x00\x00\x1F\x11maxSampleMaskWords',b'\x00\x00\x1F\x11timestampComputeAndGraphics',b'\x00\x06\x63\x11timestampPeriod',b'\x00\x00\x1F\x11maxClipDistances',b'\x00\x00\x1F\x11maxCullDistances',b'\x00\x00\x1F\x11maxCombinedClipAndCullDistances',b'\x00\x00\x1F\x11discreteQueuePriorities',b'\x00\x11\x4B\x11pointSizeRange',b'\x00\x11\x4B\x11lineWidthRange',b'\x00\x06\x63\x11pointSizeGranularity',b'\x00\x06\x63\x11lineWidthGranularity',b'\x00\x00\x1F\x11strictLines',b'\x00\x00\x1F\x11standardSampleLocations',b'\x00\x01\x43\x11optimalBufferCopyOffsetAlignment',b'\x00\x01\x43\x11optimalBufferCopyRowPitchAlignment',b'\x00\x01\x43\x11nonCoherentAtomSize'),(b'\x00\x00\x0E\x11\x00\x00\x00\x02VkPhysicalDeviceLineRasterizationFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11rectangularLines',b'\x00\x00\x1F\x11bresenhamLines',b'\x00\x00\x1F\x11smoothLines',b'\x00\x00\x1F\x11stippledRectangularLines',b'\x00\x00\x1F\x11stippledBresenhamLines',b'\x00\x00\x1F\x11stippledSmoothLines'),(b'\x00\x00\x0E\x12\x00\x00\x00\x02VkPhysicalDeviceLineRasterizationPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11lineSubPixelPrecisionBits'),(b'\x00\x00\x0E\x13\x00\x00\x00\x02VkPhysicalDeviceLinearColorAttachmentFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11linearColorAttachment'),(b'\x00\x00\x0E\x14\x00\x00\x00\x02VkPhysicalDeviceMaintenance3Properties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11maxPerSetDescriptors',b'\x00\x01\x43\x11maxMemoryAllocationSize'),(b'\x00\x00\x0E\x15\x00\x00\x00\x02VkPhysicalDeviceMaintenance4Features',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11maintenance4'),(b'\x00\x00\x0E\x16\x00\x00\x00\x02VkPhysicalDeviceMaintenance4Properties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\x43\x11maxBufferSize'),(b'\x00\x00\x0E\x17\x00\x00\x00\x02VkPhysicalDeviceMaintenance5FeaturesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11maintenance5'),(b'\x00\x00\x0E\x18\x00\x00\x00\x02VkPhysicalDeviceMaintenance5PropertiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11earlyFragmentMultisampleCoverageAfterSampleCounting',b'\x00\x00\x1F\x11earlyFragmentSampleMaskTestBeforeSampleCounting',b'\x00\x00\x1F\x11depthStencilSwizzleOneSupport',b'\x00\x00\x1F\x11polygonModePointSize',b'\x00\x00\x1F\x11nonStrictSinglePixelWideLinesUseParallelogram',b'\x00\x00\x1F\x11nonStrictWideLinesUseParallelogram'),(b'\x00\x00\x0E\x19\x00\x00\x00\x02VkPhysicalDeviceMaintenance6FeaturesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11maintenance6'),(b'\x00\x00\x0E\x1A\x00\x00\x00\x02VkPhysicalDeviceMaintenance6PropertiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11blockTexelViewCompatibleMultipleLayers',b'\x00\x00\x1F\x11maxCombinedImageSamplerDescriptorCount',b'\x00\x00\x1F\x11fragmentShadingRateClampCombinerInputs'),(b'\x00\x00\x0E\x1B\x00\x00\x00\x02VkPhysicalDeviceMemoryBudgetPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x11\xC9\x11heapBudget',b'\x00\x11\xC9\x11heapUsage'),(b'\x00\x00\x0E\x1C\x00\x00\x00\x02VkPhysicalDeviceMemoryDecompressionFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11memoryDecompression'),(b'\x00\x00\x0E\x1D\x00\x00\x00\x02VkPhysicalDeviceMemoryDecompressionPropertiesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\x43\x11decompressionMethods',b'\x00\x01\x43\x11maxDecompressionIndirectCount'),(b'\x00\x00\x0E\x1E\x00\x00\x00\x02VkPhysicalDeviceMemoryPriorityFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11memoryPriority'),(b'\x00\x00\x0E\x20\x00\x00\x00\x02VkPhysicalDeviceMemoryProperties',b'\x00\x00\x1F\x11memoryTypeCount',b'\x00\x0D\x56\x11memoryTypes',b'\x00\x00\x1F\x11memoryHeapCount',b'\x00\x0D\x49\x11memoryHeaps'),(b'\x00\x00\x0E\x1F\x00\x00\x00\x02VkPhysicalDeviceMemoryProperties2',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0E\x20\x11memoryProperties'),(b'\x00\x00\x0E\x21\x00\x00\x00\x02VkPhysicalDeviceMeshShaderFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11taskShader',b'\x00\x00\x1F\x11meshShader',b'\x00\x00\x1F\x11multiviewMeshShader',b'\x00\x00\x1F\x11primitiveFragmentShadingRateMeshShader',b'\x00\x00\x1F\x11meshShaderQueries'),(b'\x00\x00\x0E\x22\x00\x00\x00\x02VkPhysicalDeviceMeshShaderFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11taskShader',b'\x00\x00\x1F\x11meshShader'),(b'\x00\x00\x0E\x23\x00\x00\x00\x02VkPhysicalDeviceMeshShaderPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11maxTaskWorkGroupTotalCount',b'\x00\x11\xBE\x11maxTaskWorkGroupCount',b'\x00\x00\x1F\x11maxTaskWorkGroupInvocations',b'\x00\x11\xBE\x11maxTaskWorkGroupSize',b'\x00\x00\x1F\x11maxTaskPayloadSize',b'\x00\x00\x1F\x11maxTaskSharedMemorySize',b'\x00\x00\x1F\x11maxTaskPayloadAndSharedMemorySize',b'\x00\x00\x1F\x11maxMeshWorkGroupTotalCount',b'\x00\x11\xBE\x11maxMeshWorkGroupCount',b'\x00\x00\x1F\x11maxMeshWorkGroupInvocations',b'\x00\x11\xBE\x11maxMeshWorkGroupSize',b'\x00\x00\x1F\x11maxMeshSharedMemorySize',b'\x00\x00\x1F\x11maxMeshPayloadAndSharedMemorySize',b'\x00\x00\x1F\x11maxMeshOutputMemorySize',b'\x00\x00\x1F\x11maxMeshPayloadAndOutputMemorySize',b'\x00\x00\x1F\x11maxMeshOutputComponents',b'\x00\x00\x1F\x11maxMeshOutputVertices',b'\x00\x00\x1F\x11maxMeshOutputPrimitives',b'\x00\x00\x1F\x11maxMeshOutputLayers',b'\x00\x00\x1F\x11maxMeshMultiviewViewCount',b'\x00\x00\x1F\x11meshOutputPerVertexGranularity',b'\x00\x00\x1F\x11meshOutputPerPrimitiveGranularity',b'\x00\x00\x1F\x11maxPreferredTaskWorkGroupInvocations',b'\x00\x00\x1F\x11maxPreferredMeshWorkGroupInvocations',b'\x00\x00\x1F\x11prefersLocalInvocationVertexOutput',b'\x00\x00\x1F\x11prefersLocalInvocationPrimitiveOutput',b'\x00\x00\x1F\x11prefersCompactVertexOutput',b'\x00\x00\x1F\x11prefersCompactPrimitiveOutput'),(b'\x00\x00\x0E\x24\x00\x00\x00\x02VkPhysicalDeviceMeshShaderPropertiesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11maxDrawMeshTasksCount',b'\x00\x00\x1F\x11maxTaskWorkGroupInvocations',b'\x00\x11\xBE\x11maxTaskWorkGroupSize',b'\x00\x00\x1F\x11maxTaskTotalMemorySize',b'\x00\x00\x1F\x11maxTaskOutputCount',b'\x00\x00\x1F\x11maxMeshWorkGroupInvocations',b'\x00\x11\xBE\x11maxMeshWorkGroupSize',b'\x00\x00\x1F\x11maxMeshTotalMemorySize',b'\x00\x00\x1F\x11maxMeshOutputVertices',b'\x00\x00\x1F\x11maxMeshOutputPrimitives',b'\x00\x00\x1F\x11maxMeshMultiviewViewCount',b'\x00\x00\x1F\x11meshOutputPerVertexGranularity',b'\x00\x00\x1F\x11meshOutputPerPrimitiveGranularity'),(b'\x00\x00\x0E\x25\x00\x00\x00\x02VkPhysicalDeviceMultiDrawFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11multiDraw'),(b'\x00\x00\x0E\x26\x00\x00\x00\x02VkPhysicalDeviceMultiDrawPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11maxMultiDrawCount'),(b'\x00\x00\x0E\x27\x00\x00\x00\x02VkPhysicalDeviceMultisampledRenderToSingleSampledFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11multisampledRenderToSingleSampled'),(b'\x00\x00\x0E\x28\x00\x00\x00\x02VkPhysicalDeviceMultiviewFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11multiview',b'\x00\x00\x1F\x11multiviewGeometryShader',b'\x00\x00\x1F\x11multiviewTessellationShader'),(b'\x00\x00\x0E\x29\x00\x00\x00\x02VkPhysicalDeviceMultiviewPerViewAttributesPropertiesNVX',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11perViewPositionAllComponents'),(b'\x00\x00\x0E\x2A\x00\x00\x00\x02VkPhysicalDeviceMultiviewPerViewRenderAreasFeaturesQCOM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11multiviewPerViewRenderAreas'),(b'\x00\x00\x0E\x2B\x00\x00\x00\x02VkPhysicalDeviceMultiviewPerViewViewportsFeaturesQCOM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11multiviewPerViewViewports'),(b'\x00\x00\x0E\x2C\x00\x00\x00\x02VkPhysicalDeviceMultiviewProperties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11maxMultiviewViewCount',b'\x00\x00\x1F\x11maxMultiviewInstanceIndex'),(b'\x00\x00\x0E\x2D\x00\x00\x00\x02VkPhysicalDeviceMutableDescriptorTypeFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11mutableDescriptorType'),(b'\x00\x00\x0E\x2E\x00\x00\x00\x02VkPhysicalDeviceNestedCommandBufferFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11nestedCommandBuffer',b'\x00\x00\x1F\x11nestedCommandBufferRendering',b'\x00\x00\x1F\x11nestedCommandBufferSimultaneousUse'),(b'\x00\x00\x0E\x2F\x00\x00\x00\x02VkPhysicalDeviceNestedCommandBufferPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11maxCommandBufferNestingLevel'),(b'\x00\x00\x0E\x30\x00\x00\x00\x02VkPhysicalDeviceNonSeamlessCubeMapFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11nonSeamlessCubeMap'),(b'\x00\x00\x0E\x31\x00\x00\x00\x02VkPhysicalDeviceOpacityMicromapFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11micromap',b'\x00\x00\x1F\x11micromapCaptureReplay',b'\x00\x00\x1F\x11micromapHostCommands'),(b'\x00\x00\x0E\x32\x00\x00\x00\x02VkPhysicalDeviceOpacityMicromapPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11maxOpacity2StateSubdivisionLevel',b'\x00\x00\x1F\x11maxOpacity4StateSubdivisionLevel'),(b'\x00\x00\x0E\x33\x00\x00\x00\x02VkPhysicalDeviceOpticalFlowFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11opticalFlow'),(b'\x00\x00\x0E\x34\x00\x00\x00\x02VkPhysicalDeviceOpticalFlowPropertiesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11supportedOutputGridSizes',b'\x00\x00\x1F\x11supportedHintGridSizes',b'\x00\x00\x1F\x11hintSupported',b'\x00\x00\x1F\x11costSupported',b'\x00\x00\x1F\x11bidirectionalFlowSupported',b'\x00\x00\x1F\x11globalFlowSupported',b'\x00\x00\x1F\x11minWidth',b'\x00\x00\x1F\x11minHeight',b'\x00\x00\x1F\x11maxWidth',b'\x00\x00\x1F\x11maxHeight',b'\x00\x00\x1F\x11maxNumRegionsOfInterest'),(b'\x00\x00\x0E\x35\x00\x00\x00\x02VkPhysicalDevicePCIBusInfoPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11pciDomain',b'\x00\x00\x1F\x11pciBus',b'\x00\x00\x1F\x11pciDevice',b'\x00\x00\x1F\x11pciFunction'),(b'\x00\x00\x0E\x36\x00\x00\x00\x02VkPhysicalDevicePageableDeviceLocalMemoryFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11pageableDeviceLocalMemory'),(b'\x00\x00\x0E\x37\x00\x00\x00\x02VkPhysicalDevicePerStageDescriptorSetFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11perStageDescriptorSet',b'\x00\x00\x1F\x11dynamicPipelineLayout'),(b'\x00\x00\x0E\x38\x00\x00\x00\x02VkPhysicalDevicePerformanceQueryFeaturesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11performanceCounterQueryPools',b'\x00\x00\x1F\x11performanceCounterMultipleQueryPools'),(b'\x00\x00\x0E\x39\x00\x00\x00\x02VkPhysicalDevicePerformanceQueryPropertiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11allowCommandBufferQueryCopies'),(b'\x00\x00\x0E\x3A\x00\x00\x00\x02VkPhysicalDevicePipelineCreationCacheControlFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11pipelineCreationCacheControl'),(b'\x00\x00\x0E\x3B\x00\x00\x00\x02VkPhysicalDevicePipelineExecutablePropertiesFeaturesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11pipelineExecutableInfo'),(b'\x00\x00\x0E\x3C\x00\x00\x00\x02VkPhysicalDevicePipelineLibraryGroupHandlesFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11pipelineLibraryGroupHandles'),(b'\x00\x00\x0E\x3D\x00\x00\x00\x02VkPhysicalDevicePipelinePropertiesFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11pipelinePropertiesIdentifier'),(b'\x00\x00\x0E\x3E\x00\x00\x00\x02VkPhysicalDevicePipelineProtectedAccessFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11pipelineProtectedAccess'),(b'\x00\x00\x0E\x3F\x00\x00\x00\x02VkPhysicalDevicePipelineRobustnessFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11pipelineRobustness'),(b'\x00\x00\x0E\x40\x00\x00\x00\x02VkPhysicalDevicePipelineRobustnessPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0E\xE9\x11defaultRobustnessStorageBuffers',b'\x00\x0E\xE9\x11defaultRobustnessUniformBuffers',b'\x00\x0E\xE9\x11defaultRobustnessVertexInputs',b'\x00\x0E\xEB\x11defaultRobustnessImages'),(b'\x00\x00\x0E\x41\x00\x00\x00\x02VkPhysicalDevicePointClippingProperties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0F\x00\x11pointClippingBehavior'),(b'\x00\x00\x0E\x42\x00\x00\x00\x02VkPhysicalDevicePresentBarrierFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11presentBarrier'),(b'\x00\x00\x0E\x43\x00\x00\x00\x02VkPhysicalDevicePresentIdFeaturesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11presentId'),(b'\x00\x00\x0E\x44\x00\x00\x00\x02VkPhysicalDevicePresentWaitFeaturesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11presentWait'),(b'\x00\x00\x0E\x45\x00\x00\x00\x02VkPhysicalDevicePrimitiveTopologyListRestartFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11primitiveTopologyListRestart',b'\x00\x00\x1F\x11primitiveTopologyPatchListRestart'),(b'\x00\x00\x0E\x46\x00\x00\x00\x02VkPhysicalDevicePrimitivesGeneratedQueryFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11primitivesGeneratedQuery',b'\x00\x00\x1F\x11primitivesGeneratedQueryWithRasterizerDiscard',b'\x00\x00\x1F\x11primitivesGeneratedQueryWithNonZeroStreams'),(b'\x00\x00\x0E\x47\x00\x00\x00\x02VkPhysicalDevicePrivateDataFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11privateData'),(b'\x00\x00\x0E\x49\x00\x00\x00\x02VkPhysicalDeviceProperties',b'\x00\x00\x1F\x11apiVersion',b'\x00\x00\x1F\x11driverVersion',b'\x00\x00\x1F\x11vendorID',b'\x00\x00\x1F\x11deviceID',b'\x00\x0E\x9A\x11deviceType',b'\x00\x11\x48\x11deviceName',b'\x00\x11\xCF\x11pipelineCacheUUID',b'\x00\x0E\x10\x11limits',b'\x00\x0E\x87\x11sparseProperties'),(b'\x00\x00\x0E\x48\x00\x00\x00\x02VkPhysicalDeviceProperties2',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0E\x49\x11properties'),(b'\x00\x00\x0E\x4A\x00\x00\x00\x02VkPhysicalDeviceProtectedMemoryFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11protectedMemory'),(b'\x00\x00\x0E\x4B\x00\x00\x00\x02VkPhysicalDeviceProtectedMemoryProperties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11protectedNoFault'),(b'\x00\x00\x0E\x4C\x00\x00\x00\x02VkPhysicalDeviceProvokingVertexFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11provokingVertexLast',b'\x00\x00\x1F\x11transformFeedbackPreservesProvokingVertex'),(b'\x00\x00\x0E\x4D\x00\x00\x00\x02VkPhysicalDeviceProvokingVertexPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11provokingVertexModePerPipeline',b'\x00\x00\x1F\x11transformFeedbackPreservesTriangleFanProvokingVertex'),(b'\x00\x00\x0E\x4E\x00\x00\x00\x02VkPhysicalDevicePushDescriptorPropertiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11maxPushDescriptors'),(b'\x00\x00\x0E\x4F\x00\x00\x00\x02VkPhysicalDeviceRGBA10X6FormatsFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11formatRgba10x6WithoutYCbCrSampler'),(b'\x00\x00\x0E\x50\x00\x00\x00\x02VkPhysicalDeviceRasterizationOrderAttachmentAccessFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11rasterizationOrderColorAttachmentAccess',b'\x00\x00\x1F\x11rasterizationOrderDepthAttachmentAccess',b'\x00\x00\x1F\x11rasterizationOrderStencilAttachmentAccess'),(b'\x00\x00\x0E\x51\x00\x00\x00\x02VkPhysicalDeviceRayQueryFeaturesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11rayQuery'),(b'\x00\x00\x0E\x52\x00\x00\x00\x02VkPhysicalDeviceRayTracingInvocationReorderFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11rayTracingInvocationReorder'),(b'\x00\x00\x0E\x53\x00\x00\x00\x02VkPhysicalDeviceRayTracingInvocationReorderPropertiesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0F\x2A\x11rayTracingInvocationReorderReorderingHint'),(b'\x00\x00\x0E\x54\x00\x00\x00\x02VkPhysicalDeviceRayTracingMaintenance1FeaturesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11rayTracingMaintenance1',b'\x00\x00\x1F\x11rayTracingPipelineTraceRaysIndirect2'),(b'\x00\x00\x0E\x55\x00\x00\x00\x02VkPhysicalDeviceRayTracingMotionBlurFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11rayTracingMotionBlur',b'\x00\x00\x1F\x11rayTracingMotionBlurPipelineTraceRaysIndirect'),(b'\x00\x00\x0E\x56\x00\x00\x00\x02VkPhysicalDeviceRayTracingPipelineFeaturesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11rayTracingPipeline',b'\x00\x00\x1F\x11rayTracingPipelineShaderGroupHandleCaptureReplay',b'\x00\x00\x1F\x11rayTracingPipelineShaderGroupHandleCaptureReplayMixed',b'\x00\x00\x1F\x11rayTracingPipelineTraceRaysIndirect',b'\x00\x00\x1F\x11rayTraversalPrimitiveCulling'),(b'\x00\x00\x0E\x57\x00\x00\x00\x02VkPhysicalDeviceRayTracingPipelinePropertiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderGroupHandleSize',b'\x00\x00\x1F\x11maxRayRecursionDepth',b'\x00\x00\x1F\x11maxShaderGroupStride',b'\x00\x00\x1F\x11shaderGroupBaseAlignment',b'\x00\x00\x1F\x11shaderGroupHandleCaptureReplaySize',b'\x00\x00\x1F\x11maxRayDispatchInvocationCount',b'\x00\x00\x1F\x11shaderGroupHandleAlignment',b'\x00\x00\x1F\x11maxRayHitAttributeSize'),(b'\x00\x00\x0E\x58\x00\x00\x00\x02VkPhysicalDeviceRayTracingPositionFetchFeaturesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11rayTracingPositionFetch'),(b'\x00\x00\x0E\x59\x00\x00\x00\x02VkPhysicalDeviceRayTracingPropertiesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderGroupHandleSize',b'\x00\x00\x1F\x11maxRecursionDepth',b'\x00\x00\x1F\x11maxShaderGroupStride',b'\x00\x00\x1F\x11shaderGroupBaseAlignment',b'\x00\x01\x43\x11maxGeometryCount',b'\x00\x01\x43\x11maxInstanceCount',b'\x00\x01\x43\x11maxTriangleCount',b'\x00\x00\x1F\x11maxDescriptorSetAccelerationStructures'),(b'\x00\x00\x0E\x5A\x00\x00\x00\x02VkPhysicalDeviceRelaxedLineRasterizationFeaturesIMG',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11relaxedLineRasterization'),(b'\x00\x00\x0E\x5B\x00\x00\x00\x02VkPhysicalDeviceRenderPassStripedFeaturesARM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11renderPassStriped'),(b'\x00\x00\x0E\x5C\x00\x00\x00\x02VkPhysicalDeviceRenderPassStripedPropertiesARM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0C\xA0\x11renderPassStripeGranularity',b'\x00\x00\x1F\x11maxRenderPassStripes'),(b'\x00\x00\x0E\x5D\x00\x00\x00\x02VkPhysicalDeviceRepresentativeFragmentTestFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11representativeFragmentTest'),(b'\x00\x00\x0E\x5E\x00\x00\x00\x02VkPhysicalDeviceRobustness2FeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11robustBufferAccess2',b'\x00\x00\x1F\x11robustImageAccess2',b'\x00\x00\x1F\x11nullDescriptor'),(b'\x00\x00\x0E\x5F\x00\x00\x00\x02VkPhysicalDeviceRobustness2PropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\x43\x11robustStorageBufferAccessSizeAlignment',b'\x00\x01\x43\x11robustUniformBufferAccessSizeAlignment'),(b'\x00\x00\x0E\x60\x00\x00\x00\x02VkPhysicalDeviceSampleLocationsPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11sampleLocationSampleCounts',b'\x00\x0C\xA0\x11maxSampleLocationGridSize',b'\x00\x11\x4B\x11sampleLocationCoordinateRange',b'\x00\x00\x1F\x11sampleLocationSubPixelBits',b'\x00\x00\x1F\x11variableSampleLocations'),(b'\x00\x00\x0E\x61\x00\x00\x00\x02VkPhysicalDeviceSamplerFilterMinmaxProperties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11filterMinmaxSingleComponentFormats',b'\x00\x00\x1F\x11filterMinmaxImageComponentMapping'),(b'\x00\x00\x0E\x62\x00\x00\x00\x02VkPhysicalDeviceSamplerYcbcrConversionFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11samplerYcbcrConversion'),(b'\x00\x00\x0E\x63\x00\x00\x00\x02VkPhysicalDeviceScalarBlockLayoutFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11scalarBlockLayout'),(b'\x00\x00\x0E\x64\x00\x00\x00\x02VkPhysicalDeviceSchedulingControlsFeaturesARM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11schedulingControls'),(b'\x00\x00\x0E\x65\x00\x00\x00\x02VkPhysicalDeviceSchedulingControlsPropertiesARM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\x43\x11schedulingControlsFlags'),(b'\x00\x00\x0E\x66\x00\x00\x00\x02VkPhysicalDeviceSeparateDepthStencilLayoutsFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11separateDepthStencilLayouts'),(b'\x00\x00\x0E\x67\x00\x00\x00\x02VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderBufferFloat16Atomics',b'\x00\x00\x1F\x11shaderBufferFloat16AtomicAdd',b'\x00\x00\x1F\x11shaderBufferFloat16AtomicMinMax',b'\x00\x00\x1F\x11shaderBufferFloat32AtomicMinMax',b'\x00\x00\x1F\x11shaderBufferFloat64AtomicMinMax',b'\x00\x00\x1F\x11shaderSharedFloat16Atomics',b'\x00\x00\x1F\x11shaderSharedFloat16AtomicAdd',b'\x00\x00\x1F\x11shaderSharedFloat16AtomicMinMax',b'\x00\x00\x1F\x11shaderSharedFloat32AtomicMinMax',b'\x00\x00\x1F\x11shaderSharedFloat64AtomicMinMax',b'\x00\x00\x1F\x11shaderImageFloat32AtomicMinMax',b'\x00\x00\x1F\x11sparseImageFloat32AtomicMinMax'),(b'\x00\x00\x0E\x68\x00\x00\x00\x02VkPhysicalDeviceShaderAtomicFloatFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderBufferFloat32Atomics',b'\x00\x00\x1F\x11shaderBufferFloat32AtomicAdd',b'\x00\x00\x1F\x11shaderBufferFloat64Atomics',b'\x00\x00\x1F\x11shaderBufferFloat64AtomicAdd',b'\x00\x00\x1F\x11shaderSharedFloat32Atomics',b'\x00\x00\x1F\x11shaderSharedFloat32AtomicAdd',b'\x00\x00\x1F\x11shaderSharedFloat64Atomics',b'\x00\x00\x1F\x11shaderSharedFloat64AtomicAdd',b'\x00\x00\x1F\x11shaderImageFloat32Atomics',b'\x00\x00\x1F\x11shaderImageFloat32AtomicAdd',b'\x00\x00\x1F\x11sparseImageFloat32Atomics',b'\x00\x00\x1F\x11sparseImageFloat32AtomicAdd'),(b'\x00\x00\x0E\x69\x00\x00\x00\x02VkPhysicalDeviceShaderAtomicInt64Features',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderBufferInt64Atomics',b'\x00\x00\x1F\x11shaderSharedInt64Atomics'),(b'\x00\x00\x0E\x6A\x00\x00\x00\x02VkPhysicalDeviceShaderClockFeaturesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderSubgroupClock',b'\x00\x00\x1F\x11shaderDeviceClock'),(b'\x00\x00\x0E\x6B\x00\x00\x00\x02VkPhysicalDeviceShaderCoreBuiltinsFeaturesARM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderCoreBuiltins'),(b'\x00\x00\x0E\x6C\x00\x00\x00\x02VkPhysicalDeviceShaderCoreBuiltinsPropertiesARM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\x43\x11shaderCoreMask',b'\x00\x00\x1F\x11shaderCoreCount',b'\x00\x00\x1F\x11shaderWarpsPerCore'),(b'\x00\x00\x0E\x6D\x00\x00\x00\x02VkPhysicalDeviceShaderCoreProperties2AMD',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderCoreFeatures',b'\x00\x00\x1F\x11activeComputeUnitCount'),(b'\x00\x00\x0E\x6E\x00\x00\x00\x02VkPhysicalDeviceShaderCorePropertiesAMD',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderEngineCount',b'\x00\x00\x1F\x11shaderArraysPerEngineCount',b'\x00\x00\x1F\x11computeUnitsPerShaderArray',b'\x00\x00\x1F\x11simdPerComputeUnit',b'\x00\x00\x1F\x11wavefrontsPerSimd',b'\x00\x00\x1F\x11wavefrontSize',b'\x00\x00\x1F\x11sgprsPerSimd',b'\x00\x00\x1F\x11minSgprAllocation',b'\x00\x00\x1F\x11maxSgprAllocation',b'\x00\x00\x1F\x11sgprAllocationGranularity',b'\x00\x00\x1F\x11vgprsPerSimd',b'\x00\x00\x1F\x11minVgprAllocation',b'\x00\x00\x1F\x11maxVgprAllocation',b'\x00\x00\x1F\x11vgprAllocationGranularity'),(b'\x00\x00\x0E\x6F\x00\x00\x00\x02VkPhysicalDeviceShaderCorePropertiesARM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11pixelRate',b'\x00\x00\x1F\x11texelRate',b'\x00\x00\x1F\x11fmaRate'),(b'\x00\x00\x0E\x70\x00\x00\x00\x02VkPhysicalDeviceShaderDemoteToHelperInvocationFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderDemoteToHelperInvocation'),(b'\x00\x00\x0E\x71\x00\x00\x00\x02VkPhysicalDeviceShaderDrawParametersFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderDrawParameters'),(b'\x00\x00\x0E\x72\x00\x00\x00\x02VkPhysicalDeviceShaderEarlyAndLateFragmentTestsFeaturesAMD',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderEarlyAndLateFragmentTests'),(b'\x00\x00\x0E\x73\x00\x00\x00\x02VkPhysicalDeviceShaderFloat16Int8Features',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderFloat16',b'\x00\x00\x1F\x11shaderInt8'),(b'\x00\x00\x0E\x74\x00\x00\x00\x02VkPhysicalDeviceShaderImageAtomicInt64FeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderImageInt64Atomics',b'\x00\x00\x1F\x11sparseImageInt64Atomics'),(b'\x00\x00\x0E\x75\x00\x00\x00\x02VkPhysicalDeviceShaderImageFootprintFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11imageFootprint'),(b'\x00\x00\x0E\x76\x00\x00\x00\x02VkPhysicalDeviceShaderIntegerDotProductFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderIntegerDotProduct'),(b'\x00\x00\x0E\x77\x00\x00\x00\x02VkPhysicalDeviceShaderIntegerDotProductProperties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11integerDotProduct8BitUnsignedAccelerated',b'\x00\x00\x1F\x11integerDotProduct8BitSignedAccelerated',b'\x00\x00\x1F\x11integerDotProduct8BitMixedSignednessAccelerated',b'\x00\x00\x1F\x11integerDotProduct4x8BitPackedUnsignedAccelerated',b'\x00\x00\x1F\x11integerDotProduct4x8BitPackedSignedAccelerated',b'\x00\x00\x1F\x11integerDotProduct4x8BitPackedMixedSignednessAccelerated',b'\x00\x00\x1F\x11integerDotProduct16BitUnsignedAccelerated',b'\x00\x00\x1F\x11integerDotProduct16BitSignedAccelerated',b'\x00\x00\x1F\x11integerDotProduct16BitMixedSignednessAccelerated',b'\x00\x00\x1F\x11integerDotProduct32BitUnsignedAccelerated',b'\x00\x00\x1F\x11integerDotProduct32BitSignedAccelerated',b'\x00\x00\x1F\x11integerDotProduct32BitMixedSignednessAccelerated',b'\x00\x00\x1F\x11integerDotProduct64BitUnsignedAccelerated',b'\x00\x00\x1F\x11integerDotProduct64BitSignedAccelerated',b'\x00\x00\x1F\x11integerDotProduct64BitMixedSignednessAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating8BitUnsignedAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating8BitSignedAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating8BitMixedSignednessAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating4x8BitPackedUnsignedAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating4x8BitPackedSignedAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating4x8BitPackedMixedSignednessAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating16BitUnsignedAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating16BitSignedAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating16BitMixedSignednessAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating32BitUnsignedAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating32BitSignedAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating32BitMixedSignednessAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating64BitUnsignedAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating64BitSignedAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating64BitMixedSignednessAccelerated'),(b'\x00\x00\x0E\x78\x00\x00\x00\x02VkPhysicalDeviceShaderIntegerFunctions2FeaturesINTEL',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderIntegerFunctions2'),(b'\x00\x00\x0E\x79\x00\x00\x00\x02VkPhysicalDeviceShaderModuleIdentifierFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderModuleIdentifier'),(b'\x00\x00\x0E\x7A\x00\x00\x00\x02VkPhysicalDeviceShaderModuleIdentifierPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x11\xCF\x11shaderModuleIdentifierAlgorithmUUID'),(b'\x00\x00\x0E\x7B\x00\x00\x00\x02VkPhysicalDeviceShaderObjectFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderObject'),(b'\x00\x00\x0E\x7C\x00\x00\x00\x02VkPhysicalDeviceShaderObjectPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x11\xCF\x11shaderBinaryUUID',b'\x00\x00\x1F\x11shaderBinaryVersion'),(b'\x00\x00\x0E\x7D\x00\x00\x00\x02VkPhysicalDeviceShaderSMBuiltinsFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderSMBuiltins'),(b'\x00\x00\x0E\x7E\x00\x00\x00\x02VkPhysicalDeviceShaderSMBuiltinsPropertiesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderSMCount',b'\x00\x00\x1F\x11shaderWarpsPerSM'),(b'\x00\x00\x0E\x7F\x00\x00\x00\x02VkPhysicalDeviceShaderSubgroupExtendedTypesFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderSubgroupExtendedTypes'),(b'\x00\x00\x0E\x80\x00\x00\x00\x02VkPhysicalDeviceShaderSubgroupUniformControlFlowFeaturesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderSubgroupUniformControlFlow'),(b'\x00\x00\x0E\x81\x00\x00\x00\x02VkPhysicalDeviceShaderTerminateInvocationFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderTerminateInvocation'),(b'\x00\x00\x0E\x82\x00\x00\x00\x02VkPhysicalDeviceShaderTileImageFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderTileImageColorReadAccess',b'\x00\x00\x1F\x11shaderTileImageDepthReadAccess',b'\x00\x00\x1F\x11shaderTileImageStencilReadAccess'),(b'\x00\x00\x0E\x83\x00\x00\x00\x02VkPhysicalDeviceShaderTileImagePropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderTileImageCoherentReadAccelerated',b'\x00\x00\x1F\x11shaderTileImageReadSampleFromPixelRateInvocation',b'\x00\x00\x1F\x11shaderTileImageReadFromHelperInvocation'),(b'\x00\x00\x0E\x84\x00\x00\x00\x02VkPhysicalDeviceShadingRateImageFeaturesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shadingRateImage',b'\x00\x00\x1F\x11shadingRateCoarseSampleOrder'),(b'\x00\x00\x0E\x85\x00\x00\x00\x02VkPhysicalDeviceShadingRateImagePropertiesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0C\xA0\x11shadingRateTexelSize',b'\x00\x00\x1F\x11shadingRatePaletteSize',b'\x00\x00\x1F\x11shadingRateMaxCoarseSamples'),(b'\x00\x00\x0E\x86\x00\x00\x00\x02VkPhysicalDeviceSparseImageFormatInfo2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x03\xD2\x11format',b'\x00\x03\xD3\x11type',b'\x00\x06\x17\x11samples',b'\x00\x00\x1F\x11usage',b'\x00\x03\xD4\x11tiling'),(b'\x00\x00\x0E\x87\x00\x00\x00\x02VkPhysicalDeviceSparseProperties',b'\x00\x00\x1F\x11residencyStandard2DBlockShape',b'\x00\x00\x1F\x11residencyStandard2DMultisampleBlockShape',b'\x00\x00\x1F\x11residencyStandard3DBlockShape',b'\x00\x00\x1F\x11residencyAlignedMipSize',b'\x00\x00\x1F\x11residencyNonResidentStrict'),(b'\x00\x00\x0E\x88\x00\x00\x00\x02VkPhysicalDeviceSubgroupProperties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11subgroupSize',b'\x00\x00\x1F\x11supportedStages',b'\x00\x00\x1F\x11supportedOperations',b'\x00\x00\x1F\x11quadOperationsInAllStages'),(b'\x00\x00\x0E\x89\x00\x00\x00\x02VkPhysicalDeviceSubgroupSizeControlFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11subgroupSizeControl',b'\x00\x00\x1F\x11computeFullSubgroups'),(b'\x00\x00\x0E\x8A\x00\x00\x00\x02VkPhysicalDeviceSubgroupSizeControlProperties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11minSubgroupSize',b'\x00\x00\x1F\x11maxSubgroupSize',b'\x00\x00\x1F\x11maxComputeWorkgroupSubgroups',b'\x00\x00\x1F\x11requiredSubgroupSizeStages'),(b'\x00\x00\x0E\x8B\x00\x00\x00\x02VkPhysicalDeviceSubpassMergeFeedbackFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11subpassMergeFeedback'),(b'\x00\x00\x0E\x8C\x00\x00\x00\x02VkPhysicalDeviceSubpassShadingFeaturesHUAWEI',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11subpassShading'),(b'\x00\x00\x0E\x8D\x00\x00\x00\x02VkPhysicalDeviceSubpassShadingPropertiesHUAWEI',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11maxSubpassShadingWorkgroupSizeAspectRatio'),(b'\x00\x00\x0E\x8E\x00\x00\x00\x02VkPhysicalDeviceSurfaceInfo2KHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\xE6\x11surface'),(b'\x00\x00\x0E\x8F\x00\x00\x00\x02VkPhysicalDeviceSwapchainMaintenance1FeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11swapchainMaintenance1'),(b'\x00\x00\x0E\x90\x00\x00\x00\x02VkPhysicalDeviceSynchronization2Features',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11synchronization2'),(b'\x00\x00\x0E\x91\x00\x00\x00\x02VkPhysicalDeviceTexelBufferAlignmentFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11texelBufferAlignment'),(b'\x00\x00\x0E\x92\x00\x00\x00\x02VkPhysicalDeviceTexelBufferAlignmentProperties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\x43\x11storageTexelBufferOffsetAlignmentBytes',b'\x00\x00\x1F\x11storageTexelBufferOffsetSingleTexelAlignment',b'\x00\x01\x43\x11uniformTexelBufferOffsetAlignmentBytes',b'\x00\x00\x1F\x11uniformTexelBufferOffsetSingleTexelAlignment'),(b'\x00\x00\x0E\x93\x00\x00\x00\x02VkPhysicalDeviceTextureCompressionASTCHDRFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11textureCompressionASTC_HDR'),(b'\x00\x00\x0E\x94\x00\x00\x00\x02VkPhysicalDeviceTilePropertiesFeaturesQCOM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11tileProperties'),(b'\x00\x00\x0E\x95\x00\x00\x00\x02VkPhysicalDeviceTimelineSemaphoreFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11timelineSemaphore'),(b'\x00\x00\x0E\x96\x00\x00\x00\x02VkPhysicalDeviceTimelineSemaphoreProperties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\x43\x11maxTimelineSemaphoreValueDifference'),(b'\x00\x00\x0E\x97\x00\x00\x00\x02VkPhysicalDeviceToolProperties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x11\x48\x11name',b'\x00\x11\x48\x11version',b'\x00\x00\x1F\x11purposes',b'\x00\x11\x48\x11description',b'\x00\x11\x48\x11layer'),(b'\x00\x00\x0E\x98\x00\x00\x00\x02VkPhysicalDeviceTransformFeedbackFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11transformFeedback',b'\x00\x00\x1F\x11geometryStreams'),(b'\x00\x00\x0E\x99\x00\x00\x00\x02VkPhysicalDeviceTransformFeedbackPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11maxTransformFeedbackStreams',b'\x00\x00\x1F\x11maxTransformFeedbackBuffers',b'\x00\x01\x43\x11maxTransformFeedbackBufferSize',b'\x00\x00\x1F\x11maxTransformFeedbackStreamDataSize',b'\x00\x00\x1F\x11maxTransformFeedbackBufferDataSize',b'\x00\x00\x1F\x11maxTransformFeedbackBufferDataStride',b'\x00\x00\x1F\x11transformFeedbackQueries',b'\x00\x00\x1F\x11transformFeedbackStreamsLinesTriangles',b'\x00\x00\x1F\x11transformFeedbackRasterizationStreamSelect',b'\x00\x00\x1F\x11transformFeedbackDraw'),(b'\x00\x00\x0E\x9B\x00\x00\x00\x02VkPhysicalDeviceUniformBufferStandardLayoutFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11uniformBufferStandardLayout'),(b'\x00\x00\x0E\x9C\x00\x00\x00\x02VkPhysicalDeviceVariablePointersFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11variablePointersStorageBuffer',b'\x00\x00\x1F\x11variablePointers'),(b'\x00\x00\x0E\x9D\x00\x00\x00\x02VkPhysicalDeviceVertexAttributeDivisorFeaturesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11vertexAttributeInstanceRateDivisor',b'\x00\x00\x1F\x11vertexAttributeInstanceRateZeroDivisor'),(b'\x00\x00\x0E\x9E\x00\x00\x00\x02VkPhysicalDeviceVertexAttributeDivisorPropertiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11maxVertexAttribDivisor'),(b'\x00\x00\x0E\x9F\x00\x00\x00\x02VkPhysicalDeviceVertexAttributeDivisorPropertiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11maxVertexAttribDivisor',b'\x00\x00\x1F\x11supportsNonZeroFirstInstance'),(b'\x00\x00\x0E\xA0\x00\x00\x00\x02VkPhysicalDeviceVertexInputDynamicStateFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11vertexInputDynamicState'),(b'\x00\x00\x0E\xA1\x00\x00\x00\x02VkPhysicalDeviceVideoEncodeQualityLevelInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x04\x0C\x11pVideoProfile',b'\x00\x00\x1F\x11qualityLevel'),(b'\x00\x00\x0E\xA2\x00\x00\x00\x02VkPhysicalDeviceVideoFormatInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11imageUsage'),(b'\x00\x00\x0E\xA3\x00\x00\x00\x02VkPhysicalDeviceVideoMaintenance1FeaturesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11videoMaintenance1'),(b'\x00\x00\x0E\xA4\x00\x00\x00\x02VkPhysicalDeviceVulkan11Features',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11storageBuffer16BitAccess',b'\x00\x00\x1F\x11uniformAndStorageBuffer16BitAccess',b'\x00\x00\x1F\x11storagePushConstant16',b'\x00\x00\x1F\x11storageInputOutput16',b'\x00\x00\x1F\x11multiview',b'\x00\x00\x1F\x11multiviewGeometryShader',b'\x00\x00\x1F\x11multiviewTessellationShader',b'\x00\x00\x1F\x11variablePointersStorageBuffer',b'\x00\x00\x1F\x11variablePointers',b'\x00\x00\x1F\x11protectedMemory',b'\x00\x00\x1F\x11samplerYcbcrConversion',b'\x00\x00\x1F\x11shaderDrawParameters'),(b'\x00\x00\x0E\xA5\x00\x00\x00\x02VkPhysicalDeviceVulkan11Properties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x11\xCF\x11deviceUUID',b'\x00\x11\xCF\x11driverUUID',b'\x00\x11\xE5\x11deviceLUID',b'\x00\x00\x1F\x11deviceNodeMask',b'\x00\x00\x1F\x11deviceLUIDValid',b'\x00\x00\x1F\x11subgroupSize',b'\x00\x00\x1F\x11subgroupSupportedStages',b'\x00\x00\x1F\x11subgroupSupportedOperations',b'\x00\x00\x1F\x11subgroupQuadOperationsInAllStages',b'\x00\x0F\x00\x11pointClippingBehavior',b'\x00\x00\x1F\x11maxMultiviewViewCount',b'\x00\x00\x1F\x11maxMultiviewInstanceIndex',b'\x00\x00\x1F\x11protectedNoFault',b'\x00\x00\x1F\x11maxPerSetDescriptors',b'\x00\x01\x43\x11maxMemoryAllocationSize'),(b'\x00\x00\x0E\xA6\x00\x00\x00\x02VkPhysicalDeviceVulkan12Features',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11samplerMirrorClampToEdge',b'\x00\x00\x1F\x11drawIndirectCount',b'\x00\x00\x1F\x11storageBuffer8BitAccess',b'\x00\x00\x1F\x11uniformAndStorageBuffer8BitAccess',b'\x00\x00\x1F\x11storagePushConstant8',b'\x00\x00\x1F\x11shaderBufferInt64Atomics',b'\x00\x00\x1F\x11shaderSharedInt64Atomics',b'\x00\x00\x1F\x11shaderFloat16',b'\x00\x00\x1F\x11shaderInt8',b'\x00\x00\x1F\x11descriptorIndexing',b'\x00\x00\x1F\x11shaderInputAttachmentArrayDynamicIndexing',b'\x00\x00\x1F\x11shaderUniformTexelBufferArrayDynamicIndexing',b'\x00\x00\x1F\x11shaderStorageTexelBufferArrayDynamicIndexing',b'\x00\x00\x1F\x11shaderUniformBufferArrayNonUniformIndexing',b'\x00\x00\x1F\x11shaderSampledImageArrayNonUniformIndexing',b'\x00\x00\x1F\x11shaderStorageBufferArrayNonUniformIndexing',b'\x00\x00\x1F\x11shaderStorageImageArrayNonUniformIndexing',b'\x00\x00\x1F\x11shaderInputAttachmentArrayNonUniformIndexing',b'\x00\x00\x1F\x11shaderUniformTexelBufferArrayNonUniformIndexing',b'\x00\x00\x1F\x11shaderStorageTexelBufferArrayNonUniformIndexing',b'\x00\x00\x1F\x11descriptorBindingUniformBufferUpdateAfterBind',b'\x00\x00\x1F\x11descriptorBindingSampledImageUpdateAfterBind',b'\x00\x00\x1F\x11descriptorBindingStorageImageUpdateAfterBind',b'\x00\x00\x1F\x11descriptorBindingStorageBufferUpdateAfterBind',b'\x00\x00\x1F\x11descriptorBindingUniformTexelBufferUpdateAfterBind',b'\x00\x00\x1F\x11descriptorBindingStorageTexelBufferUpdateAfterBind',b'\x00\x00\x1F\x11descriptorBindingUpdateUnusedWhilePending',b'\x00\x00\x1F\x11descriptorBindingPartiallyBound',b'\x00\x00\x1F\x11descriptorBindingVariableDescriptorCount',b'\x00\x00\x1F\x11runtimeDescriptorArray',b'\x00\x00\x1F\x11samplerFilterMinmax',b'\x00\x00\x1F\x11scalarBlockLayout',b'\x00\x00\x1F\x11imagelessFramebuffer',b'\x00\x00\x1F\x11uniformBufferStandardLayout',b'\x00\x00\x1F\x11shaderSubgroupExtendedTypes',b'\x00\x00\x1F\x11separateDepthStencilLayouts',b'\x00\x00\x1F\x11hostQueryReset',b'\x00\x00\x1F\x11timelineSemaphore',b'\x00\x00\x1F\x11bufferDeviceAddress',b'\x00\x00\x1F\x11bufferDeviceAddressCaptureReplay',b'\x00\x00\x1F\x11bufferDeviceAddressMultiDevice',b'\x00\x00\x1F\x11vulkanMemoryModel',b'\x00\x00\x1F\x11vulkanMemoryModelDeviceScope',b'\x00\x00\x1F\x11vulkanMemoryModelAvailabilityVisibilityChains',b'\x00\x00\x1F\x11shaderOutputViewportIndex',b'\x00\x00\x1F\x11shaderOutputLayer',b'\x00\x00\x1F\x11subgroupBroadcastDynamicId'),(b'\x00\x00\x0E\xA7\x00\x00\x00\x02VkPhysicalDeviceVulkan12Properties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0C\x8B\x11driverID',b'\x00\x11\x48\x11driverName',b'\x00\x11\x48\x11driverInfo',b'\x00\x0B\xF1\x11conformanceVersion',b'\x00\x10\x60\x11denormBehaviorIndependence',b'\x00\x10\x60\x11roundingModeIndependence',b'\x00\x00\x1F\x11shaderSignedZeroInfNanPreserveFloat16',b'\x00\x00\x1F\x11shaderSignedZeroInfNanPreserveFloat32',b'\x00\x00\x1F\x11shaderSignedZeroInfNanPreserveFloat64',b'\x00\x00\x1F\x11shaderDenormPreserveFloat16',b'\x00\x00\x1F\x11shaderDenormPreserveFloat32',b'\x00\x00\x1F\x11shaderDenormPreserveFloat64',b'\x00\x00\x1F\x11shaderDenormFlushToZeroFloat16',b'\x00\x00\x1F\x11shaderDenormFlushToZeroFloat32',b'\x00\x00\x1F\x11shaderDenormFlushToZeroFloat64',b'\x00\x00\x1F\x11shaderRoundingModeRTEFloat16',b'\x00\x00\x1F\x11shaderRoundingModeRTEFloat32',b'\x00\x00\x1F\x11shaderRoundingModeRTEFloat64',b'\x00\x00\x1F\x11shaderRoundingModeRTZFloat16',b'\x00\x00\x1F\x11shaderRoundingModeRTZFloat32',b'\x00\x00\x1F\x11shaderRoundingModeRTZFloat64',b'\x00\x00\x1F\x11maxUpdateAfterBindDescriptorsInAllPools',b'\x00\x00\x1F\x11shaderUniformBufferArrayNonUniformIndexingNative',b'\x00\x00\x1F\x11shaderSampledImageArrayNonUniformIndexingNative',b'\x00\x00\x1F\x11shaderStorageBufferArrayNonUniformIndexingNative',b'\x00\x00\x1F\x11shaderStorageImageArrayNonUniformIndexingNative',b'\x00\x00\x1F\x11shaderInputAttachmentArrayNonUniformIndexingNative',b'\x00\x00\x1F\x11robustBufferAccessUpdateAfterBind',b'\x00\x00\x1F\x11quadDivergentImplicitLod',b'\x00\x00\x1F\x11maxPerStageDescriptorUpdateAfterBindSamplers',b'\x00\x00\x1F\x11maxPerStageDescriptorUpdateAfterBindUniformBuffers',b'\x00\x00\x1F\x11maxPerStageDescriptorUpdateAfterBindStorageBuffers',b'\x00\x00\x1F\x11maxPerStageDescriptorUpdateAfterBindSampledImages',b'\x00\x00\x1F\x11maxPerStageDescriptorUpdateAfterBindStorageImages',b'\x00\x00\x1F\x11maxPerStageDescriptorUpdateAfterBindInputAttachments',b'\x00\x00\x1F\x11maxPerStageUpdateAfterBindResources',b'\x00\x00\x1F\x11maxDescriptorSetUpdateAfterBindSamplers',b'\x00\x00\x1F\x11maxDescriptorSetUpdateAfterBindUniformBuffers',b'\x00\x00\x1F\x11maxDescriptorSetUpdateAfterBindUniformBuffersDynamic',b'\x00\x00\x1F\x11maxDescriptorSetUpdateAfterBindStorageBuffers',b'\x00\x00\x1F\x11maxDescriptorSetUpdateAfterBindStorageBuffersDynamic',b'\x00\x00\x1F\x11maxDescriptorSetUpdateAfterBindSampledImages',b'\x00\x00\x1F\x11maxDescriptorSetUpdateAfterBindStorageImages',b'\x00\x00\x1F\x11maxDescriptorSetUpdateAfterBindInputAttachments',b'\x00\x00\x1F\x11supportedDepthResolveModes',b'\x00\x00\x1F\x11supportedStencilResolveModes',b'\x00\x00\x1F\x11independentResolveNone',b'\x00\x00\x1F\x11independentResolve',b'\x00\x00\x1F\x11filterMinmaxSingleComponentFormats',b'\x00\x00\x1F\x11filterMinmaxImageComponentMapping',b'\x00\x01\x43\x11maxTimelineSemaphoreValueDifference',b'\x00\x00\x1F\x11framebufferIntegerColorSampleCounts'),(b'\x00\x00\x0E\xA8\x00\x00\x00\x02VkPhysicalDeviceVulkan13Features',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11robustImageAccess',b'\x00\x00\x1F\x11inlineUniformBlock',b'\x00\x00\x1F\x11descriptorBindingInlineUniformBlockUpdateAfterBind',b'\x00\x00\x1F\x11pipelineCreationCacheControl',b'\x00\x00\x1F\x11privateData',b'\x00\x00\x1F\x11shaderDemoteToHelperInvocation',b'\x00\x00\x1F\x11shaderTerminateInvocation',b'\x00\x00\x1F\x11subgroupSizeControl',b'\x00\x00\x1F\x11computeFullSubgroups',b'\x00\x00\x1F\x11synchronization2',b'\x00\x00\x1F\x11textureCompressionASTC_HDR',b'\x00\x00\x1F\x11shaderZeroInitializeWorkgroupMemory',b'\x00\x00\x1F\x11dynamicRendering',b'\x00\x00\x1F\x11shaderIntegerDotProduct',b'\x00\x00\x1F\x11maintenance4'),(b'\x00\x00\x0E\xA9\x00\x00\x00\x02VkPhysicalDeviceVulkan13Properties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11minSubgroupSize',b'\x00\x00\x1F\x11maxSubgroupSize',b'\x00\x00\x1F\x11maxComputeWorkgroupSubgroups',b'\x00\x00\x1F\x11requiredSubgroupSizeStages',b'\x00\x00\x1F\x11maxInlineUniformBlockSize',b'\x00\x00\x1F\x11maxPerStageDescriptorInlineUniformBlocks',b'\x00\x00\x1F\x11maxPerStageDescriptorUpdateAfterBindInlineUniformBlocks',b'\x00\x00\x1F\x11maxDescriptorSetInlineUniformBlocks',b'\x00\x00\x1F\x11maxDescriptorSetUpdateAfterBindInlineUniformBlocks',b'\x00\x00\x1F\x11maxInlineUniformTotalSize',b'\x00\x00\x1F\x11integerDotProduct8BitUnsignedAccelerated',b'\x00\x00\x1F\x11integerDotProduct8BitSignedAccelerated',b'\x00\x00\x1F\x11integerDotProduct8BitMixedSignednessAccelerated',b'\x00\x00\x1F\x11integerDotProduct4x8BitPackedUnsignedAccelerated',b'\x00\x00\x1F\x11integerDotProduct4x8BitPackedSignedAccelerated',b'\x00\x00\x1F\x11integerDotProduct4x8BitPackedMixedSignednessAccelerated',b'\x00\x00\x1F\x11integerDotProduct16BitUnsignedAccelerated',b'\x00\x00\x1F\x11integerDotProduct16BitSignedAccelerated',b'\x00\x00\x1F\x11integerDotProduct16BitMixedSignednessAccelerated',b'\x00\x00\x1F\x11integerDotProduct32BitUnsignedAccelerated',b'\x00\x00\x1F\x11integerDotProduct32BitSignedAccelerated',b'\x00\x00\x1F\x11integerDotProduct32BitMixedSignednessAccelerated',b'\x00\x00\x1F\x11integerDotProduct64BitUnsignedAccelerated',b'\x00\x00\x1F\x11integerDotProduct64BitSignedAccelerated',b'\x00\x00\x1F\x11integerDotProduct64BitMixedSignednessAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating8BitUnsignedAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating8BitSignedAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating8BitMixedSignednessAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating4x8BitPackedUnsignedAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating4x8BitPackedSignedAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating4x8BitPackedMixedSignednessAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating16BitUnsignedAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating16BitSignedAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating16BitMixedSignednessAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating32BitUnsignedAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating32BitSignedAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating32BitMixedSignednessAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating64BitUnsignedAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating64BitSignedAccelerated',b'\x00\x00\x1F\x11integerDotProductAccumulatingSaturating64BitMixedSignednessAccelerated',b'\x00\x01\x43\x11storageTexelBufferOffsetAlignmentBytes',b'\x00\x00\x1F\x11storageTexelBufferOffsetSingleTexelAlignment',b'\x00\x01\x43\x11uniformTexelBufferOffsetAlignmentBytes',b'\x00\x00\x1F\x11uniformTexelBufferOffsetSingleTexelAlignment',b'\x00\x01\x43\x11maxBufferSize'),(b'\x00\x00\x0E\xAA\x00\x00\x00\x02VkPhysicalDeviceVulkanMemoryModelFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11vulkanMemoryModel',b'\x00\x00\x1F\x11vulkanMemoryModelDeviceScope',b'\x00\x00\x1F\x11vulkanMemoryModelAvailabilityVisibilityChains'),(b'\x00\x00\x0E\xAB\x00\x00\x00\x02VkPhysicalDeviceWorkgroupMemoryExplicitLayoutFeaturesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11workgroupMemoryExplicitLayout',b'\x00\x00\x1F\x11workgroupMemoryExplicitLayoutScalarBlockLayout',b'\x00\x00\x1F\x11workgroupMemoryExplicitLayout8BitAccess',b'\x00\x00\x1F\x11workgroupMemoryExplicitLayout16BitAccess'),(b'\x00\x00\x0E\xAC\x00\x00\x00\x02VkPhysicalDeviceYcbcr2Plane444FormatsFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11ycbcr2plane444Formats'),(b'\x00\x00\x0E\xAD\x00\x00\x00\x02VkPhysicalDeviceYcbcrDegammaFeaturesQCOM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11ycbcrDegamma'),(b'\x00\x00\x0E\xAE\x00\x00\x00\x02VkPhysicalDeviceYcbcrImageArraysFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11ycbcrImageArrays'),(b'\x00\x00\x0E\xAF\x00\x00\x00\x02VkPhysicalDeviceZeroInitializeWorkgroupMemoryFeatures',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11shaderZeroInitializeWorkgroupMemory'),(b'\x00\x00\x11\x8C\x00\x00\x00\x10VkPhysicalDevice_T',),(b'\x00\x00\x0E\xB1\x00\x00\x00\x02VkPipelineCacheCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x01\xF7\x11initialDataSize',b'\x00\x00\xCE\x11pInitialData'),(b'\x00\x00\x0E\xB3\x00\x00\x00\x02VkPipelineCacheHeaderVersionOne',b'\x00\x00\x1F\x11headerSize',b'\x00\x0E\xB2\x11headerVersion',b'\x00\x00\x1F\x11vendorID',b'\x00\x00\x1F\x11deviceID',b'\x00\x11\xCF\x11pipelineCacheUUID'),(b'\x00\x00\x11\x8D\x00\x00\x00\x10VkPipelineCache_T',),(b'\x00\x00\x0E\xB4\x00\x00\x00\x02VkPipelineColorBlendAdvancedStateCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11srcPremultiplied',b'\x00\x00\x1F\x11dstPremultiplied',b'\x00\x0B\xAC\x11blendOverlap'),(b'\x00\x00\x0E\xB6\x00\x00\x00\x02VkPipelineColorBlendAttachmentState',b'\x00\x00\x1F\x11blendEnable',b'\x00\x0B\xAA\x11srcColorBlendFactor',b'\x00\x0B\xAA\x11dstColorBlendFactor',b'\x00\x0B\xAB\x11colorBlendOp',b'\x00\x0B\xAA\x11srcAlphaBlendFactor',b'\x00\x0B\xAA\x11dstAlphaBlendFactor',b'\x00\x0B\xAB\x11alphaBlendOp',b'\x00\x00\x1F\x11colorWriteMask'),(b'\x00\x00\x0E\xB9\x00\x00\x00\x02VkPipelineColorBlendStateCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11logicOpEnable',b'\x00\x05\xB0\x11logicOp',b'\x00\x00\x1F\x11attachmentCount',b'\x00\x0E\xB5\x11pAttachments',b'\x00\x11\x4F\x11blendConstants'),(b'\x00\x00\x0E\xBA\x00\x00\x00\x02VkPipelineColorWriteCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11attachmentCount',b'\x00\x05\xC8\x11pColorWriteEnables'),(b'\x00\x00\x0E\xBB\x00\x00\x00\x02VkPipelineCompilerControlCreateInfoAMD',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11compilerControlFlags'),(b'\x00\x00\x0E\xBD\x00\x00\x00\x02VkPipelineCoverageModulationStateCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x05\x76\x11coverageModulationMode',b'\x00\x00\x1F\x11coverageModulationTableEnable',b'\x00\x00\x1F\x11coverageModulationTableCount',b'\x00\x06\x5F\x11pCoverageModulationTable'),(b'\x00\x00\x0E\xBE\x00\x00\x00\x02VkPipelineCoverageReductionStateCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x05\x7A\x11coverageReductionMode'),(b'\x00\x00\x0E\xBF\x00\x00\x00\x02VkPipelineCoverageToColorStateCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11coverageToColorEnable',b'\x00\x00\x1F\x11coverageToColorLocation'),(b'\x00\x00\x0E\xC1\x00\x00\x00\x02VkPipelineCreateFlags2CreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x43\x11flags'),(b'\x00\x00\x0E\xC3\x00\x00\x00\x02VkPipelineCreationFeedback',b'\x00\x00\x1F\x11flags',b'\x00\x01\x43\x11duration'),(b'\x00\x00\x0E\xC4\x00\x00\x00\x02VkPipelineCreationFeedbackCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0E\xC2\x11pPipelineCreationFeedback',b'\x00\x00\x1F\x11pipelineStageCreationFeedbackCount',b'\x00\x0E\xC2\x11pPipelineStageCreationFeedbacks'),(b'\x00\x00\x0E\xC8\x00\x00\x00\x02VkPipelineDepthStencilStateCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11depthTestEnable',b'\x00\x00\x1F\x11depthWriteEnable',b'\x00\x05\x42\x11depthCompareOp',b'\x00\x00\x1F\x11depthBoundsTestEnable',b'\x00\x00\x1F\x11stencilTestEnable',b'\x00\x10\x80\x11front',b'\x00\x10\x80\x11back',b'\x00\x06\x63\x11minDepthBounds',b'\x00\x06\x63\x11maxDepthBounds'),(b'\x00\x00\x0E\xC9\x00\x00\x00\x02VkPipelineDiscardRectangleStateCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x05\x96\x11discardRectangleMode',b'\x00\x00\x1F\x11discardRectangleCount',b'\x00\x07\x7F\x11pDiscardRectangles'),(b'\x00\x00\x0E\xCB\x00\x00\x00\x02VkPipelineDynamicStateCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11dynamicStateCount',b'\x00\x0C\x92\x11pDynamicStates'),(b'\x00\x00\x0E\xCC\x00\x00\x00\x02VkPipelineExecutableInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\xB7\x11pipeline',b'\x00\x00\x1F\x11executableIndex'),(b'\x00\x00\x0E\xCD\x00\x00\x00\x02VkPipelineExecutableInternalRepresentationKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x11\x48\x11name',b'\x00\x11\x48\x11description',b'\x00\x00\x1F\x11isText',b'\x00\x01\xF7\x11dataSize',b'\x00\x00\x27\x11pData'),(b'\x00\x00\x0E\xCE\x00\x00\x00\x02VkPipelineExecutablePropertiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11stages',b'\x00\x11\x48\x11name',b'\x00\x11\x48\x11description',b'\x00\x00\x1F\x11subgroupSize'),(b'\x00\x00\x0E\xD0\x00\x00\x00\x02VkPipelineExecutableStatisticKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x11\x48\x11name',b'\x00\x11\x48\x11description',b'\x00\x0E\xCF\x11format',b'\x00\x0E\xD1\x11value'),(b'\x00\x00\x0E\xD1\x00\x00\x00\x03VkPipelineExecutableStatisticValueKHR',b'\x00\x00\x1F\x11b32',b'\x00\x11\x55\x11i64',b'\x00\x01\x43\x11u64',b'\x00\x11\x4A\x11f64'),(b'\x00\x00\x0E\xD2\x00\x00\x00\x02VkPipelineFragmentShadingRateEnumStateCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0C\xC3\x11shadingRateType',b'\x00\x05\x9F\x11shadingRate',b'\x00\x0C\xC1\x11combinerOps'),(b'\x00\x00\x0E\xD3\x00\x00\x00\x02VkPipelineFragmentShadingRateStateCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0C\xA0\x11fragmentSize',b'\x00\x0C\xC1\x11combinerOps'),(b'\x00\x00\x0E\xD4\x00\x00\x00\x02VkPipelineIndirectDeviceAddressInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x05\xB4\x11pipelineBindPoint',b'\x00\x02\xB7\x11pipeline'),(b'\x00\x00\x0E\xD5\x00\x00\x00\x02VkPipelineInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\xB7\x11pipeline'),(b'\x00\x00\x0E\xD7\x00\x00\x00\x02VkPipelineInputAssemblyStateCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x05\xF1\x11topology',b'\x00\x00\x1F\x11primitiveRestartEnable'),(b'\x00\x00\x0E\xD9\x00\x00\x00\x02VkPipelineLayoutCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11setLayoutCount',b'\x00\x11\x74\x11pSetLayouts',b'\x00\x00\x1F\x11pushConstantRangeCount',b'\x00\x0F\x0F\x11pPushConstantRanges'),(b'\x00\x00\x11\x8E\x00\x00\x00\x10VkPipelineLayout_T',),(b'\x00\x00\x0E\xDB\x00\x00\x00\x02VkPipelineLibraryCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11libraryCount',b'\x00\x11\x8F\x11pLibraries'),(b'\x00\x00\x0E\xDD\x00\x00\x00\x02VkPipelineMultisampleStateCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x06\x17\x11rasterizationSamples',b'\x00\x00\x1F\x11sampleShadingEnable',b'\x00\x06\x63\x11minSampleShading',b'\x00\x05\xC8\x11pSampleMask',b'\x00\x00\x1F\x11alphaToCoverageEnable',b'\x00\x00\x1F\x11alphaToOneEnable'),(b'\x00\x00\x0E\xDE\x00\x00\x00\x02VkPipelinePropertiesIdentifierEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x11\xCF\x11pipelineIdentifier'),(b'\x00\x00\x0E\xDF\x00\x00\x00\x02VkPipelineRasterizationConservativeStateCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x05\x4A\x11conservativeRasterizationMode',b'\x00\x06\x63\x11extraPrimitiveOverestimationSize'),(b'\x00\x00\x0E\xE0\x00\x00\x00\x02VkPipelineRasterizationDepthClipStateCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11depthClipEnable'),(b'\x00\x00\x0E\xE1\x00\x00\x00\x02VkPipelineRasterizationLineStateCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x05\xAC\x11lineRasterizationMode',b'\x00\x00\x1F\x11stippledLineEnable',b'\x00\x00\x1F\x11lineStippleFactor',b'\x00\x07\xD3\x11lineStipplePattern'),(b'\x00\x00\x0E\xE2\x00\x00\x00\x02VkPipelineRasterizationProvokingVertexStateCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x05\xF5\x11provokingVertexMode'),(b'\x00\x00\x0E\xE4\x00\x00\x00\x02VkPipelineRasterizationStateCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11depthClampEnable',b'\x00\x00\x1F\x11rasterizerDiscardEnable',b'\x00\x05\xED\x11polygonMode',b'\x00\x00\x1F\x11cullMode',b'\x00\x05\xA4\x11frontFace',b'\x00\x00\x1F\x11depthBiasEnable',b'\x00\x06\x63\x11depthBiasConstantFactor',b'\x00\x06\x63\x11depthBiasClamp',b'\x00\x06\x63\x11depthBiasSlopeFactor',b'\x00\x06\x63\x11lineWidth'),(b'\x00\x00\x0E\xE5\x00\x00\x00\x02VkPipelineRasterizationStateRasterizationOrderAMD',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0F\x29\x11rasterizationOrder'),(b'\x00\x00\x0E\xE6\x00\x00\x00\x02VkPipelineRasterizationStateStreamCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11rasterizationStream'),(b'\x00\x00\x0E\xE7\x00\x00\x00\x02VkPipelineRenderingCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11viewMask',b'\x00\x00\x1F\x11colorAttachmentCount',b'\x00\x0C\xBA\x11pColorAttachmentFormats',b'\x00\x03\xD2\x11depthAttachmentFormat',b'\x00\x03\xD2\x11stencilAttachmentFormat'),(b'\x00\x00\x0E\xE8\x00\x00\x00\x02VkPipelineRepresentativeFragmentTestStateCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11representativeFragmentTestEnable'),(b'\x00\x00\x0E\xEA\x00\x00\x00\x02VkPipelineRobustnessCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0E\xE9\x11storageBuffers',b'\x00\x0E\xE9\x11uniformBuffers',b'\x00\x0E\xE9\x11vertexInputs',b'\x00\x0E\xEB\x11images'),(b'\x00\x00\x0E\xEC\x00\x00\x00\x02VkPipelineSampleLocationsStateCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11sampleLocationsEnable',b'\x00\x10\x3B\x11sampleLocationsInfo'),(b'\x00\x00\x0E\xEF\x00\x00\x00\x02VkPipelineShaderStageCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x02\xB8\x11stage',b'\x00\x09\xF4\x11module',b'\x00\x00\x06\x11pName',b'\x00\x10\x7B\x11pSpecializationInfo'),(b'\x00\x00\x0E\xF0\x00\x00\x00\x02VkPipelineShaderStageModuleIdentifierCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11identifierSize',b'\x00\x11\xCB\x11pIdentifier'),(b'\x00\x00\x0E\xF1\x00\x00\x00\x02VkPipelineShaderStageRequiredSubgroupSizeCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11requiredSubgroupSize'),(b'\x00\x00\x0E\xF2\x00\x00\x00\x02VkPipelineTessellationDomainOriginStateCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x06\x47\x11domainOrigin'),(b'\x00\x00\x0E\xF4\x00\x00\x00\x02VkPipelineTessellationStateCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11patchControlPoints'),(b'\x00\x00\x0E\xF5\x00\x00\x00\x02VkPipelineVertexInputDivisorStateCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11vertexBindingDivisorCount',b'\x00\x10\xCE\x11pVertexBindingDivisors'),(b'\x00\x00\x0E\xF7\x00\x00\x00\x02VkPipelineVertexInputStateCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11vertexBindingDescriptionCount',b'\x00\x10\xCB\x11pVertexBindingDescriptions',b'\x00\x00\x1F\x11vertexAttributeDescriptionCount',b'\x00\x10\xC8\x11pVertexAttributeDescriptions'),(b'\x00\x00\x0E\xF8\x00\x00\x00\x02VkPipelineViewportCoarseSampleOrderStateCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x05\x3C\x11sampleOrderType',b'\x00\x00\x1F\x11customSampleOrderCount',b'\x00\x05\x3E\x11pCustomSampleOrders'),(b'\x00\x00\x0E\xF9\x00\x00\x00\x02VkPipelineViewportDepthClipControlCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11negativeOneToOne'),(b'\x00\x00\x0E\xFA\x00\x00\x00\x02VkPipelineViewportExclusiveScissorStateCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11exclusiveScissorCount',b'\x00\x07\x7F\x11pExclusiveScissors'),(b'\x00\x00\x0E\xFB\x00\x00\x00\x02VkPipelineViewportShadingRateImageStateCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11shadingRateImageEnable',b'\x00\x00\x1F\x11viewportCount',b'\x00\x07\xF5\x11pShadingRatePalettes'),(b'\x00\x00\x0E\xFD\x00\x00\x00\x02VkPipelineViewportStateCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11viewportCount',b'\x00\x07\x99\x11pViewports',b'\x00\x00\x1F\x11scissorCount',b'\x00\x07\x7F\x11pScissors'),(b'\x00\x00\x0E\xFE\x00\x00\x00\x02VkPipelineViewportSwizzleStateCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11viewportCount',b'\x00\x08\x01\x11pViewportSwizzles'),(b'\x00\x00\x0E\xFF\x00\x00\x00\x02VkPipelineViewportWScalingStateCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11viewportWScalingEnable',b'\x00\x00\x1F\x11viewportCount',b'\x00\x08\x07\x11pViewportWScalings'),(b'\x00\x00\x11\x90\x00\x00\x00\x10VkPipeline_T',),(b'\x00\x00\x0F\x02\x00\x00\x00\x02VkPresentIdKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11swapchainCount',b'\x00\x05\xD1\x11pPresentIds'),(b'\x00\x00\x0F\x03\x00\x00\x00\x02VkPresentInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11waitSemaphoreCount',b'\x00\x11\x98\x11pWaitSemaphores',b'\x00\x00\x1F\x11swapchainCount',b'\x00\x0A\x29\x11pSwapchains',b'\x00\x05\xC8\x11pImageIndices',b'\x00\x0F\x57\x11pResults'),(b'\x00\x00\x0F\x07\x00\x00\x00\x02VkPresentRegionKHR',b'\x00\x00\x1F\x11rectangleCount',b'\x00\x0F\x35\x11pRectangles'),(b'\x00\x00\x0F\x08\x00\x00\x00\x02VkPresentRegionsKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11swapchainCount',b'\x00\x0F\x06\x11pRegions'),(b'\x00\x00\x0F\x0B\x00\x00\x00\x02VkPresentTimeGOOGLE',b'\x00\x00\x1F\x11presentID',b'\x00\x01\x43\x11desiredPresentTime'),(b'\x00\x00\x0F\x0C\x00\x00\x00\x02VkPresentTimesInfoGOOGLE',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11swapchainCount',b'\x00\x0F\x0A\x11pTimes'),(b'\x00\x00\x0F\x0D\x00\x00\x00\x02VkPrivateDataSlotCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags'),(b'\x00\x00\x11\x91\x00\x00\x00\x10VkPrivateDataSlot_T',),(b'\x00\x00\x0F\x0E\x00\x00\x00\x02VkProtectedSubmitInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11protectedSubmit'),(b'\x00\x00\x0F\x10\x00\x00\x00\x02VkPushConstantRange',b'\x00\x00\x1F\x11stageFlags',b'\x00\x00\x1F\x11offset',b'\x00\x00\x1F\x11size'),(b'\x00\x00\x0F\x11\x00\x00\x00\x02VkPushConstantsInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x05\xB5\x11layout',b'\x00\x00\x1F\x11stageFlags',b'\x00\x00\x1F\x11offset',b'\x00\x00\x1F\x11size',b'\x00\x00\xCE\x11pValues'),(b'\x00\x00\x0F\x12\x00\x00\x00\x02VkPushDescriptorSetInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11stageFlags',b'\x00\x05\xB5\x11layout',b'\x00\x00\x1F\x11set',b'\x00\x00\x1F\x11descriptorWriteCount',b'\x00\x05\xBE\x11pDescriptorWrites'),(b'\x00\x00\x0F\x13\x00\x00\x00\x02VkPushDescriptorSetWithTemplateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x06\xC8\x11descriptorUpdateTemplate',b'\x00\x05\xB5\x11layout',b'\x00\x00\x1F\x11set',b'\x00\x00\xCE\x11pData'),(b'\x00\x00\x0F\x15\x00\x00\x00\x02VkQueryLowLatencySupportNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x27\x11pQueriedLowLatencyData'),(b'\x00\x00\x0F\x17\x00\x00\x00\x02VkQueryPoolCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x03\x6B\x11queryType',b'\x00\x00\x1F\x11queryCount',b'\x00\x00\x1F\x11pipelineStatistics'),(b'\x00\x00\x0F\x18\x00\x00\x00\x02VkQueryPoolPerformanceCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11queueFamilyIndex',b'\x00\x00\x1F\x11counterIndexCount',b'\x00\x05\xC8\x11pCounterIndices'),(b'\x00\x00\x0F\x19\x00\x00\x00\x02VkQueryPoolPerformanceQueryCreateInfoINTEL',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0F\x1A\x11performanceCountersSampling'),(b'\x00\x00\x0F\x1B\x00\x00\x00\x02VkQueryPoolVideoEncodeFeedbackCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11encodeFeedbackFlags'),(b'\x00\x00\x11\x92\x00\x00\x00\x10VkQueryPool_T',),(b'\x00\x00\x0F\x1E\x00\x00\x00\x02VkQueueFamilyCheckpointProperties2NV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\x43\x11checkpointExecutionStageMask'),(b'\x00\x00\x0F\x1F\x00\x00\x00\x02VkQueueFamilyCheckpointPropertiesNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11checkpointExecutionStageMask'),(b'\x00\x00\x0F\x20\x00\x00\x00\x02VkQueueFamilyGlobalPriorityPropertiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11priorityCount',b'\x00\x0F\x27\x11priorities'),(b'\x00\x00\x0F\x22\x00\x00\x00\x02VkQueueFamilyProperties',b'\x00\x00\x1F\x11queueFlags',b'\x00\x00\x1F\x11queueCount',b'\x00\x00\x1F\x11timestampValidBits',b'\x00\x0C\xA1\x11minImageTransferGranularity'),(b'\x00\x00\x0F\x21\x00\x00\x00\x02VkQueueFamilyProperties2',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0F\x22\x11queueFamilyProperties'),(b'\x00\x00\x0F\x23\x00\x00\x00\x02VkQueueFamilyQueryResultStatusPropertiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11queryResultStatusSupport'),(b'\x00\x00\x0F\x24\x00\x00\x00\x02VkQueueFamilyVideoPropertiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11videoCodecOperations'),(b'\x00\x00\x11\x93\x00\x00\x00\x10VkQueue_T',),(b'\x00\x00\x0F\x2B\x00\x00\x00\x02VkRayTracingPipelineCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11stageCount',b'\x00\x0E\xEE\x11pStages',b'\x00\x00\x1F\x11groupCount',b'\x00\x0F\x2F\x11pGroups',b'\x00\x00\x1F\x11maxPipelineRayRecursionDepth',b'\x00\x0E\xDA\x11pLibraryInfo',b'\x00\x0F\x2D\x11pLibraryInterface',b'\x00\x0E\xCA\x11pDynamicState',b'\x00\x05\xB5\x11layout',b'\x00\x02\xB7\x11basePipelineHandle',b'\x00\x04\x17\x11basePipelineIndex'),(b'\x00\x00\x0F\x2C\x00\x00\x00\x02VkRayTracingPipelineCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11stageCount',b'\x00\x0E\xEE\x11pStages',b'\x00\x00\x1F\x11groupCount',b'\x00\x0F\x31\x11pGroups',b'\x00\x00\x1F\x11maxRecursionDepth',b'\x00\x05\xB5\x11layout',b'\x00\x02\xB7\x11basePipelineHandle',b'\x00\x04\x17\x11basePipelineIndex'),(b'\x00\x00\x0F\x2E\x00\x00\x00\x02VkRayTracingPipelineInterfaceCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11maxPipelineRayPayloadSize',b'\x00\x00\x1F\x11maxPipelineRayHitAttributeSize'),(b'\x00\x00\x0F\x30\x00\x00\x00\x02VkRayTracingShaderGroupCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0F\x33\x11type',b'\x00\x00\x1F\x11generalShader',b'\x00\x00\x1F\x11closestHitShader',b'\x00\x00\x1F\x11anyHitShader',b'\x00\x00\x1F\x11intersectionShader',b'\x00\x00\xCE\x11pShaderGroupCaptureReplayHandle'),(b'\x00\x00\x0F\x32\x00\x00\x00\x02VkRayTracingShaderGroupCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0F\x33\x11type',b'\x00\x00\x1F\x11generalShader',b'\x00\x00\x1F\x11closestHitShader',b'\x00\x00\x1F\x11anyHitShader',b'\x00\x00\x1F\x11intersectionShader'),(b'\x00\x00\x0F\x34\x00\x00\x00\x02VkRect2D',b'\x00\x0D\x6E\x11offset',b'\x00\x0C\xA0\x11extent'),(b'\x00\x00\x0F\x36\x00\x00\x00\x02VkRectLayerKHR',b'\x00\x0D\x6E\x11offset',b'\x00\x0C\xA0\x11extent',b'\x00\x00\x1F\x11layer'),(b'\x00\x00\x0F\x37\x00\x00\x00\x02VkRefreshCycleDurationGOOGLE',b'\x00\x01\x43\x11refreshDuration'),(b'\x00\x00\x0F\x38\x00\x00\x00\x02VkReleaseSwapchainImagesInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\xEB\x11swapchain',b'\x00\x00\x1F\x11imageIndexCount',b'\x00\x05\xC8\x11pImageIndices'),(b'\x00\x00\x0F\x39\x00\x00\x00\x02VkRenderPassAttachmentBeginInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11attachmentCount',b'\x00\x11\x80\x11pAttachments'),(b'\x00\x00\x0F\x3A\x00\x00\x00\x02VkRenderPassBeginInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\xD6\x11renderPass',b'\x00\x02\x72\x11framebuffer',b'\x00\x0F\x34\x11renderArea',b'\x00\x00\x1F\x11clearValueCount',b'\x00\x0B\xD0\x11pClearValues'),(b'\x00\x00\x0F\x3D\x00\x00\x00\x02VkRenderPassCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11attachmentCount',b'\x00\x0B\x87\x11pAttachments',b'\x00\x00\x1F\x11subpassCount',b'\x00\x10\x8C\x11pSubpasses',b'\x00\x00\x1F\x11dependencyCount',b'\x00\x10\x88\x11pDependencies'),(b'\x00\x00\x0F\x3C\x00\x00\x00\x02VkRenderPassCreateInfo2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11attachmentCount',b'\x00\x0B\x88\x11pAttachments',b'\x00\x00\x1F\x11subpassCount',b'\x00\x10\x8D\x11pSubpasses',b'\x00\x00\x1F\x11dependencyCount',b'\x00\x10\x89\x11pDependencies',b'\x00\x00\x1F\x11correlatedViewMaskCount',b'\x00\x05\xC8\x11pCorrelatedViewMasks'),(b'\x00\x00\x0F\x3E\x00\x00\x00\x02VkRenderPassCreationControlEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11disallowMerging'),(b'\x00\x00\x0F\x3F\x00\x00\x00\x02VkRenderPassCreationFeedbackCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0F\x40\x11pRenderPassFeedback'),(b'\x00\x00\x0F\x41\x00\x00\x00\x02VkRenderPassCreationFeedbackInfoEXT',b'\x00\x00\x1F\x11postMergeSubpassCount'),(b'\x00\x00\x0F\x42\x00\x00\x00\x02VkRenderPassFragmentDensityMapCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0B\x91\x11fragmentDensityMapAttachment'),(b'\x00\x00\x0F\x43\x00\x00\x00\x02VkRenderPassInputAttachmentAspectCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11aspectReferenceCount',b'\x00\x0D\x28\x11pAspectReferences'),(b'\x00\x00\x0F\x44\x00\x00\x00\x02VkRenderPassMultiviewCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11subpassCount',b'\x00\x05\xC8\x11pViewMasks',b'\x00\x00\x1F\x11dependencyCount',b'\x00\x07\x72\x11pViewOffsets',b'\x00\x00\x1F\x11correlationMaskCount',b'\x00\x05\xC8\x11pCorrelationMasks'),(b'\x00\x00\x0F\x45\x00\x00\x00\x02VkRenderPassSampleLocationsBeginInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11attachmentInitialSampleLocationsCount',b'\x00\x0B\x94\x11pAttachmentInitialSampleLocations',b'\x00\x00\x1F\x11postSubpassSampleLocationsCount',b'\x00\x10\x96\x11pPostSubpassSampleLocations'),(b'\x00\x00\x0F\x46\x00\x00\x00\x02VkRenderPassStripeBeginInfoARM',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11stripeInfoCount',b'\x00\x0F\x47\x11pStripeInfos'),(b'\x00\x00\x0F\x48\x00\x00\x00\x02VkRenderPassStripeInfoARM',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0F\x34\x11stripeArea'),(b'\x00\x00\x0F\x49\x00\x00\x00\x02VkRenderPassStripeSubmitInfoARM',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11stripeSemaphoreInfoCount',b'\x00\x10\x53\x11pStripeSemaphoreInfos'),(b'\x00\x00\x0F\x4A\x00\x00\x00\x02VkRenderPassSubpassFeedbackCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0F\x4B\x11pSubpassFeedback'),(b'\x00\x00\x0F\x4C\x00\x00\x00\x02VkRenderPassSubpassFeedbackInfoEXT',b'\x00\x10\x94\x11subpassMergeStatus',b'\x00\x11\x48\x11description',b'\x00\x00\x1F\x11postMergeIndex'),(b'\x00\x00\x0F\x4D\x00\x00\x00\x02VkRenderPassTransformBeginInfoQCOM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x10\xAA\x11transform'),(b'\x00\x00\x11\x94\x00\x00\x00\x10VkRenderPass_T',),(b'\x00\x00\x0F\x4E\x00\x00\x00\x02VkRenderingAreaInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11viewMask',b'\x00\x00\x1F\x11colorAttachmentCount',b'\x00\x0C\xBA\x11pColorAttachmentFormats',b'\x00\x03\xD2\x11depthAttachmentFormat',b'\x00\x03\xD2\x11stencilAttachmentFormat'),(b'\x00\x00\x0F\x50\x00\x00\x00\x02VkRenderingAttachmentInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\x78\x11imageView',b'\x00\x02\x8B\x11imageLayout',b'\x00\x0F\x56\x11resolveMode',b'\x00\x02\x78\x11resolveImageView',b'\x00\x02\x8B\x11resolveImageLayout',b'\x00\x0B\x8D\x11loadOp',b'\x00\x0B\x96\x11storeOp',b'\x00\x0B\xD1\x11clearValue'),(b'\x00\x00\x0F\x52\x00\x00\x00\x02VkRenderingFragmentDensityMapAttachmentInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\x78\x11imageView',b'\x00\x02\x8B\x11imageLayout'),(b'\x00\x00\x0F\x53\x00\x00\x00\x02VkRenderingFragmentShadingRateAttachmentInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\x78\x11imageView',b'\x00\x02\x8B\x11imageLayout',b'\x00\x0C\xA0\x11shadingRateAttachmentTexelSize'),(b'\x00\x00\x0F\x54\x00\x00\x00\x02VkRenderingInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x0F\x34\x11renderArea',b'\x00\x00\x1F\x11layerCount',b'\x00\x00\x1F\x11viewMask',b'\x00\x00\x1F\x11colorAttachmentCount',b'\x00\x0F\x4F\x11pColorAttachments',b'\x00\x0F\x4F\x11pDepthAttachment',b'\x00\x0F\x4F\x11pStencilAttachment'),(b'\x00\x00\x0F\x55\x00\x00\x00\x02VkResolveImageInfo2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\x7D\x11srcImage',b'\x00\x02\x8B\x11srcImageLayout',b'\x00\x02\x7D\x11dstImage',b'\x00\x02\x8B\x11dstImageLayout',b'\x00\x00\x1F\x11regionCount',b'\x00\x0C\xFD\x11pRegions'),(b'\x00\x00\x10\x37\x00\x00\x00\x02VkSRTDataNV',b'\x00\x06\x63\x11sx',b'\x00\x06\x63\x11a',b'\x00\x06\x63\x11b',b'\x00\x06\x63\x11pvx',b'\x00\x06\x63\x11sy',b'\x00\x06\x63\x11c',b'\x00\x06\x63\x11pvy',b'\x00\x06\x63\x11sz',b'\x00\x06\x63\x11pvz',b'\x00\x06\x63\x11qx',b'\x00\x06\x63\x11qy',b'\x00\x06\x63\x11qz',b'\x00\x06\x63\x11qw',b'\x00\x06\x63\x11tx',b'\x00\x06\x63\x11ty',b'\x00\x06\x63\x11tz'),(b'\x00\x00\x10\x3A\x00\x00\x00\x02VkSampleLocationEXT',b'\x00\x06\x63\x11x',b'\x00\x06\x63\x11y'),(b'\x00\x00\x10\x3B\x00\x00\x00\x02VkSampleLocationsInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x06\x17\x11sampleLocationsPerPixel',b'\x00\x0C\xA0\x11sampleLocationGridSize',b'\x00\x00\x1F\x11sampleLocationsCount',b'\x00\x10\x39\x11pSampleLocations'),(b'\x00\x00\x10\x3D\x00\x00\x00\x02VkSamplerBlockMatchWindowCreateInfoQCOM',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0C\xA0\x11windowExtent',b'\x00\x0B\xAF\x11windowCompareMode'),(b'\x00\x00\x10\x3E\x00\x00\x00\x02VkSamplerBorderColorComponentMappingCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0B\xE9\x11components',b'\x00\x00\x1F\x11srgb'),(b'\x00\x00\x10\x3F\x00\x00\x00\x02VkSamplerCaptureDescriptorDataInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x09\xE5\x11sampler'),(b'\x00\x00\x10\x41\x00\x00\x00\x02VkSamplerCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x07\x01\x11magFilter',b'\x00\x07\x01\x11minFilter',b'\x00\x10\x44\x11mipmapMode',b'\x00\x10\x3C\x11addressModeU',b'\x00\x10\x3C\x11addressModeV',b'\x00\x10\x3C\x11addressModeW',b'\x00\x06\x63\x11mipLodBias',b'\x00\x00\x1F\x11anisotropyEnable',b'\x00\x06\x63\x11maxAnisotropy',b'\x00\x00\x1F\x11compareEnable',b'\x00\x05\x42\x11compareOp',b'\x00\x06\x63\x11minLod',b'\x00\x06\x63\x11maxLod',b'\x00\x0B\xB0\x11borderColor',b'\x00\x00\x1F\x11unnormalizedCoordinates'),(b'\x00\x00\x10\x42\x00\x00\x00\x02VkSamplerCubicWeightsCreateInfoQCOM',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0C\x09\x11cubicWeights'),(b'\x00\x00\x10\x43\x00\x00\x00\x02VkSamplerCustomBorderColorCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0B\xCD\x11customBorderColor',b'\x00\x03\xD2\x11format'),(b'\x00\x00\x10\x46\x00\x00\x00\x02VkSamplerReductionModeCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x10\x45\x11reductionMode'),(b'\x00\x00\x10\x47\x00\x00\x00\x02VkSamplerYcbcrConversionCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x03\xD2\x11format',b'\x00\x10\x4B\x11ycbcrModel',b'\x00\x10\x4C\x11ycbcrRange',b'\x00\x0B\xE9\x11components',b'\x00\x0B\xCB\x11xChromaOffset',b'\x00\x0B\xCB\x11yChromaOffset',b'\x00\x07\x01\x11chromaFilter',b'\x00\x00\x1F\x11forceExplicitReconstruction'),(b'\x00\x00\x10\x48\x00\x00\x00\x02VkSamplerYcbcrConversionImageFormatProperties',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11combinedImageSamplerDescriptorCount'),(b'\x00\x00\x10\x49\x00\x00\x00\x02VkSamplerYcbcrConversionInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x09\xE0\x11conversion'),(b'\x00\x00\x10\x4A\x00\x00\x00\x02VkSamplerYcbcrConversionYcbcrDegammaCreateInfoQCOM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11enableYDegamma',b'\x00\x00\x1F\x11enableCbCrDegamma'),(b'\x00\x00\x11\x95\x00\x00\x00\x10VkSamplerYcbcrConversion_T',),(b'\x00\x00\x11\x97\x00\x00\x00\x10VkSampler_T',),(b'\x00\x00\x10\x4E\x00\x00\x00\x02VkSemaphoreCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags'),(b'\x00\x00\x10\x4F\x00\x00\x00\x02VkSemaphoreGetFdInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\xDB\x11semaphore',b'\x00\x0C\xB2\x11handleType'),(b'\x00\x00\x10\x50\x00\x00\x00\x02VkSemaphoreGetWin32HandleInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\xDB\x11semaphore',b'\x00\x0C\xB2\x11handleType'),(b'\x00\x00\x10\x52\x00\x00\x00\x02VkSemaphoreSignalInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\xDB\x11semaphore',b'\x00\x01\x43\x11value'),(b'\x00\x00\x10\x54\x00\x00\x00\x02VkSemaphoreSubmitInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\xDB\x11semaphore',b'\x00\x01\x43\x11value',b'\x00\x01\x43\x11stageMask',b'\x00\x00\x1F\x11deviceIndex'),(b'\x00\x00\x10\x56\x00\x00\x00\x02VkSemaphoreTypeCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x10\x55\x11semaphoreType',b'\x00\x01\x43\x11initialValue'),(b'\x00\x00\x10\x58\x00\x00\x00\x02VkSemaphoreWaitInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11semaphoreCount',b'\x00\x11\x98\x11pSemaphores',b'\x00\x05\xD1\x11pValues'),(b'\x00\x00\x11\x99\x00\x00\x00\x10VkSemaphore_T',),(b'\x00\x00\x10\x59\x00\x00\x00\x02VkSetDescriptorBufferOffsetsInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11stageFlags',b'\x00\x05\xB5\x11layout',b'\x00\x00\x1F\x11firstSet',b'\x00\x00\x1F\x11setCount',b'\x00\x05\xC8\x11pBufferIndices',b'\x00\x05\xD1\x11pOffsets'),(b'\x00\x00\x10\x5A\x00\x00\x00\x02VkSetLatencyMarkerInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x43\x11presentID',b'\x00\x0D\x2C\x11marker'),(b'\x00\x00\x10\x5B\x00\x00\x00\x02VkSetStateFlagsIndirectCommandNV',b'\x00\x00\x1F\x11data'),(b'\x00\x00\x10\x5F\x00\x00\x00\x02VkShaderCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x02\xB8\x11stage',b'\x00\x00\x1F\x11nextStage',b'\x00\x10\x5C\x11codeType',b'\x00\x01\xF7\x11codeSize',b'\x00\x00\xCE\x11pCode',b'\x00\x00\x06\x11pName',b'\x00\x00\x1F\x11setLayoutCount',b'\x00\x11\x74\x11pSetLayouts',b'\x00\x00\x1F\x11pushConstantRangeCount',b'\x00\x0F\x0F\x11pPushConstantRanges',b'\x00\x10\x7B\x11pSpecializationInfo'),(b'\x00\x00\x11\x9A\x00\x00\x00\x10VkShaderEXT_T',),(b'\x00\x00\x10\x61\x00\x00\x00\x02VkShaderModuleCreateInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x01\xF7\x11codeSize',b'\x00\x05\xC8\x11pCode'),(b'\x00\x00\x10\x62\x00\x00\x00\x02VkShaderModuleIdentifierEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11identifierSize',b'\x00\x11\xD5\x11identifier'),(b'\x00\x00\x10\x63\x00\x00\x00\x02VkShaderModuleValidationCacheCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x03\x1E\x11validationCache'),(b'\x00\x00\x11\x9B\x00\x00\x00\x10VkShaderModule_T',),(b'\x00\x00\x10\x64\x00\x00\x00\x02VkShaderResourceUsageAMD',b'\x00\x00\x1F\x11numUsedVgprs',b'\x00\x00\x1F\x11numUsedSgprs',b'\x00\x00\x1F\x11ldsSizePerLocalWorkGroup',b'\x00\x01\xF7\x11ldsUsageSizeInBytes',b'\x00\x01\xF7\x11scratchMemUsageInBytes'),(b'\x00\x00\x10\x65\x00\x00\x00\x02VkShaderStatisticsInfoAMD',b'\x00\x00\x1F\x11shaderStageMask',b'\x00\x10\x64\x11resourceUsage',b'\x00\x00\x1F\x11numPhysicalVgprs',b'\x00\x00\x1F\x11numPhysicalSgprs',b'\x00\x00\x1F\x11numAvailableVgprs',b'\x00\x00\x1F\x11numAvailableSgprs',b'\x00\x11\xBE\x11computeWorkGroupSize'),(b'\x00\x00\x10\x68\x00\x00\x00\x02VkShadingRatePaletteNV',b'\x00\x00\x1F\x11shadingRatePaletteEntryCount',b'\x00\x10\x66\x11pShadingRatePaletteEntries'),(b'\x00\x00\x10\x69\x00\x00\x00\x02VkSharedPresentSurfaceCapabilitiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11sharedPresentSupportedUsageFlags'),(b'\x00\x00\x10\x6C\x00\x00\x00\x02VkSparseBufferMemoryBindInfo',b'\x00\x01\xFC\x11buffer',b'\x00\x00\x1F\x11bindCount',b'\x00\x10\x78\x11pBinds'),(b'\x00\x00\x10\x6F\x00\x00\x00\x02VkSparseImageFormatProperties',b'\x00\x00\x1F\x11aspectMask',b'\x00\x0C\xA1\x11imageGranularity',b'\x00\x00\x1F\x11flags'),(b'\x00\x00\x10\x6E\x00\x00\x00\x02VkSparseImageFormatProperties2',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x10\x6F\x11properties'),(b'\x00\x00\x10\x71\x00\x00\x00\x02VkSparseImageMemoryBind',b'\x00\x0D\x03\x11subresource',b'\x00\x0D\x6F\x11offset',b'\x00\x0C\xA1\x11extent',b'\x00\x01\xFD\x11memory',b'\x00\x01\x43\x11memoryOffset',b'\x00\x00\x1F\x11flags'),(b'\x00\x00\x10\x73\x00\x00\x00\x02VkSparseImageMemoryBindInfo',b'\x00\x02\x7D\x11image',b'\x00\x00\x1F\x11bindCount',b'\x00\x10\x70\x11pBinds'),(b'\x00\x00\x10\x75\x00\x00\x00\x02VkSparseImageMemoryRequirements',b'\x00\x10\x6F\x11formatProperties',b'\x00\x00\x1F\x11imageMipTailFirstLod',b'\x00\x01\x43\x11imageMipTailSize',b'\x00\x01\x43\x11imageMipTailOffset',b'\x00\x01\x43\x11imageMipTailStride'),(b'\x00\x00\x10\x74\x00\x00\x00\x02VkSparseImageMemoryRequirements2',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x10\x75\x11memoryRequirements'),(b'\x00\x00\x10\x77\x00\x00\x00\x02VkSparseImageOpaqueMemoryBindInfo',b'\x00\x02\x7D\x11image',b'\x00\x00\x1F\x11bindCount',b'\x00\x10\x78\x11pBinds'),(b'\x00\x00\x10\x79\x00\x00\x00\x02VkSparseMemoryBind',b'\x00\x01\x43\x11resourceOffset',b'\x00\x01\x43\x11size',b'\x00\x01\xFD\x11memory',b'\x00\x01\x43\x11memoryOffset',b'\x00\x00\x1F\x11flags'),(b'\x00\x00\x10\x7C\x00\x00\x00\x02VkSpecializationInfo',b'\x00\x00\x1F\x11mapEntryCount',b'\x00\x10\x7D\x11pMapEntries',b'\x00\x01\xF7\x11dataSize',b'\x00\x00\xCE\x11pData'),(b'\x00\x00\x10\x7E\x00\x00\x00\x02VkSpecializationMapEntry',b'\x00\x00\x1F\x11constantID',b'\x00\x00\x1F\x11offset',b'\x00\x01\xF7\x11size'),(b'\x00\x00\x10\x80\x00\x00\x00\x02VkStencilOpState',b'\x00\x07\x8A\x11failOp',b'\x00\x07\x8A\x11passOp',b'\x00\x07\x8A\x11depthFailOp',b'\x00\x05\x42\x11compareOp',b'\x00\x00\x1F\x11compareMask',b'\x00\x00\x1F\x11writeMask',b'\x00\x00\x1F\x11reference'),(b'\x00\x00\x10\x81\x00\x00\x00\x02VkStridedDeviceAddressRegionKHR',b'\x00\x01\x43\x11deviceAddress',b'\x00\x01\x43\x11stride',b'\x00\x01\x43\x11size'),(b'\x00\x00\x10\x86\x00\x00\x00\x02VkSubmitInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11waitSemaphoreCount',b'\x00\x11\x98\x11pWaitSemaphores',b'\x00\x05\xC8\x11pWaitDstStageMask',b'\x00\x00\x1F\x11commandBufferCount',b'\x00\x07\xB3\x11pCommandBuffers',b'\x00\x00\x1F\x11signalSemaphoreCount',b'\x00\x11\x98\x11pSignalSemaphores'),(b'\x00\x00\x10\x85\x00\x00\x00\x02VkSubmitInfo2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11waitSemaphoreInfoCount',b'\x00\x10\x53\x11pWaitSemaphoreInfos',b'\x00\x00\x1F\x11commandBufferInfoCount',b'\x00\x0B\xE3\x11pCommandBufferInfos',b'\x00\x00\x1F\x11signalSemaphoreInfoCount',b'\x00\x10\x53\x11pSignalSemaphoreInfos'),(b'\x00\x00\x10\x87\x00\x00\x00\x02VkSubpassBeginInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x06\x0B\x11contents'),(b'\x00\x00\x10\x8B\x00\x00\x00\x02VkSubpassDependency',b'\x00\x00\x1F\x11srcSubpass',b'\x00\x00\x1F\x11dstSubpass',b'\x00\x00\x1F\x11srcStageMask',b'\x00\x00\x1F\x11dstStageMask',b'\x00\x00\x1F\x11srcAccessMask',b'\x00\x00\x1F\x11dstAccessMask',b'\x00\x00\x1F\x11dependencyFlags'),(b'\x00\x00\x10\x8A\x00\x00\x00\x02VkSubpassDependency2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11srcSubpass',b'\x00\x00\x1F\x11dstSubpass',b'\x00\x00\x1F\x11srcStageMask',b'\x00\x00\x1F\x11dstStageMask',b'\x00\x00\x1F\x11srcAccessMask',b'\x00\x00\x1F\x11dstAccessMask',b'\x00\x00\x1F\x11dependencyFlags',b'\x00\x04\x17\x11viewOffset'),(b'\x00\x00\x10\x8F\x00\x00\x00\x02VkSubpassDescription',b'\x00\x00\x1F\x11flags',b'\x00\x05\xB4\x11pipelineBindPoint',b'\x00\x00\x1F\x11inputAttachmentCount',b'\x00\x0B\x8E\x11pInputAttachments',b'\x00\x00\x1F\x11colorAttachmentCount',b'\x00\x0B\x8E\x11pColorAttachments',b'\x00\x0B\x8E\x11pResolveAttachments',b'\x00\x0B\x8E\x11pDepthStencilAttachment',b'\x00\x00\x1F\x11preserveAttachmentCount',b'\x00\x05\xC8\x11pPreserveAttachments'),(b'\x00\x00\x10\x8E\x00\x00\x00\x02VkSubpassDescription2',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x05\xB4\x11pipelineBindPoint',b'\x00\x00\x1F\x11viewMask',b'\x00\x00\x1F\x11inputAttachmentCount',b'\x00\x0B\x8F\x11pInputAttachments',b'\x00\x00\x1F\x11colorAttachmentCount',b'\x00\x0B\x8F\x11pColorAttachments',b'\x00\x0B\x8F\x11pResolveAttachments',b'\x00\x0B\x8F\x11pDepthStencilAttachment',b'\x00\x00\x1F\x11preserveAttachmentCount',b'\x00\x05\xC8\x11pPreserveAttachments'),(b'\x00\x00\x10\x90\x00\x00\x00\x02VkSubpassDescriptionDepthStencilResolve',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0F\x56\x11depthResolveMode',b'\x00\x0F\x56\x11stencilResolveMode',b'\x00\x0B\x8F\x11pDepthStencilResolveAttachment'),(b'\x00\x00\x10\x92\x00\x00\x00\x02VkSubpassEndInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext'),(b'\x00\x00\x10\x93\x00\x00\x00\x02VkSubpassFragmentDensityMapOffsetEndInfoQCOM',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11fragmentDensityOffsetCount',b'\x00\x0D\x6D\x11pFragmentDensityOffsets'),(b'\x00\x00\x10\x95\x00\x00\x00\x02VkSubpassResolvePerformanceQueryEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11optimal'),(b'\x00\x00\x10\x97\x00\x00\x00\x02VkSubpassSampleLocationsEXT',b'\x00\x00\x1F\x11subpassIndex',b'\x00\x10\x3B\x11sampleLocationsInfo'),(b'\x00\x00\x10\x98\x00\x00\x00\x02VkSubpassShadingPipelineCreateInfoHUAWEI',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x02\xD6\x11renderPass',b'\x00\x00\x1F\x11subpass'),(b'\x00\x00\x10\x99\x00\x00\x00\x02VkSubresourceHostMemcpySizeEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x01\x43\x11size'),(b'\x00\x00\x10\x9C\x00\x00\x00\x02VkSubresourceLayout',b'\x00\x01\x43\x11offset',b'\x00\x01\x43\x11size',b'\x00\x01\x43\x11rowPitch',b'\x00\x01\x43\x11arrayPitch',b'\x00\x01\x43\x11depthPitch'),(b'\x00\x00\x10\x9B\x00\x00\x00\x02VkSubresourceLayout2KHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x10\x9C\x11subresourceLayout'),(b'\x00\x00\x10\x9D\x00\x00\x00\x02VkSurfaceCapabilities2EXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11minImageCount',b'\x00\x00\x1F\x11maxImageCount',b'\x00\x0C\xA0\x11currentExtent',b'\x00\x0C\xA0\x11minImageExtent',b'\x00\x0C\xA0\x11maxImageExtent',b'\x00\x00\x1F\x11maxImageArrayLayers',b'\x00\x00\x1F\x11supportedTransforms',b'\x00\x10\xAA\x11currentTransform',b'\x00\x00\x1F\x11supportedCompositeAlpha',b'\x00\x00\x1F\x11supportedUsageFlags',b'\x00\x00\x1F\x11supportedSurfaceCounters'),(b'\x00\x00\x10\x9E\x00\x00\x00\x02VkSurfaceCapabilities2KHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x10\xA0\x11surfaceCapabilities'),(b'\x00\x00\x10\x9F\x00\x00\x00\x02VkSurfaceCapabilitiesFullScreenExclusiveEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11fullScreenExclusiveSupported'),(b'\x00\x00\x10\xA0\x00\x00\x00\x02VkSurfaceCapabilitiesKHR',b'\x00\x00\x1F\x11minImageCount',b'\x00\x00\x1F\x11maxImageCount',b'\x00\x0C\xA0\x11currentExtent',b'\x00\x0C\xA0\x11minImageExtent',b'\x00\x0C\xA0\x11maxImageExtent',b'\x00\x00\x1F\x11maxImageArrayLayers',b'\x00\x00\x1F\x11supportedTransforms',b'\x00\x10\xAA\x11currentTransform',b'\x00\x00\x1F\x11supportedCompositeAlpha',b'\x00\x00\x1F\x11supportedUsageFlags'),(b'\x00\x00\x10\xA1\x00\x00\x00\x02VkSurfaceCapabilitiesPresentBarrierNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11presentBarrierSupported'),(b'\x00\x00\x10\xA2\x00\x00\x00\x02VkSurfaceFormat2KHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x10\xA3\x11surfaceFormat'),(b'\x00\x00\x10\xA3\x00\x00\x00\x02VkSurfaceFormatKHR',b'\x00\x03\xD2\x11format',b'\x00\x0B\xD8\x11colorSpace'),(b'\x00\x00\x10\xA4\x00\x00\x00\x02VkSurfaceFullScreenExclusiveInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0C\xCC\x11fullScreenExclusive'),(b'\x00\x00\x10\xA5\x00\x00\x00\x02VkSurfaceFullScreenExclusiveWin32InfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x27\x11hmonitor'),(b'\x00\x00\x11\x9C\x00\x00\x00\x10VkSurfaceKHR_T',),(b'\x00\x00\x10\xA6\x00\x00\x00\x02VkSurfacePresentModeCompatibilityEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11presentModeCount',b'\x00\x03\xF7\x11pPresentModes'),(b'\x00\x00\x10\xA7\x00\x00\x00\x02VkSurfacePresentModeEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0F\x05\x11presentMode'),(b'\x00\x00\x10\xA8\x00\x00\x00\x02VkSurfacePresentScalingCapabilitiesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11supportedPresentScaling',b'\x00\x00\x1F\x11supportedPresentGravityX',b'\x00\x00\x1F\x11supportedPresentGravityY',b'\x00\x0C\xA0\x11minScaledImageExtent',b'\x00\x0C\xA0\x11maxScaledImageExtent'),(b'\x00\x00\x10\xA9\x00\x00\x00\x02VkSurfaceProtectedCapabilitiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11supportsProtected'),(b'\x00\x00\x10\xAB\x00\x00\x00\x02VkSwapchainCounterCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11surfaceCounters'),(b'\x00\x00\x10\xAD\x00\x00\x00\x02VkSwapchainCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x02\xE6\x11surface',b'\x00\x00\x1F\x11minImageCount',b'\x00\x03\xD2\x11imageFormat',b'\x00\x0B\xD8\x11imageColorSpace',b'\x00\x0C\xA0\x11imageExtent',b'\x00\x00\x1F\x11imageArrayLayers',b'\x00\x00\x1F\x11imageUsage',b'\x00\x10\x6A\x11imageSharingMode',b'\x00\x00\x1F\x11queueFamilyIndexCount',b'\x00\x05\xC8\x11pQueueFamilyIndices',b'\x00\x10\xAA\x11preTransform',b'\x00\x0B\xEC\x11compositeAlpha',b'\x00\x0F\x05\x11presentMode',b'\x00\x00\x1F\x11clipped',b'\x00\x02\xEB\x11oldSwapchain'),(b'\x00\x00\x10\xAE\x00\x00\x00\x02VkSwapchainDisplayNativeHdrCreateInfoAMD',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11localDimmingEnable'),(b'\x00\x00\x11\x9D\x00\x00\x00\x10VkSwapchainKHR_T',),(b'\x00\x00\x10\xAF\x00\x00\x00\x02VkSwapchainLatencyCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11latencyModeEnable'),(b'\x00\x00\x10\xB0\x00\x00\x00\x02VkSwapchainPresentBarrierCreateInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11presentBarrierEnable'),(b'\x00\x00\x10\xB1\x00\x00\x00\x02VkSwapchainPresentFenceInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11swapchainCount',b'\x00\x03\x73\x11pFences'),(b'\x00\x00\x10\xB2\x00\x00\x00\x02VkSwapchainPresentModeInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11swapchainCount',b'\x00\x0F\x04\x11pPresentModes'),(b'\x00\x00\x10\xB3\x00\x00\x00\x02VkSwapchainPresentModesCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11presentModeCount',b'\x00\x0F\x04\x11pPresentModes'),(b'\x00\x00\x10\xB4\x00\x00\x00\x02VkSwapchainPresentScalingCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11scalingBehavior',b'\x00\x00\x1F\x11presentGravityX',b'\x00\x00\x1F\x11presentGravityY'),(b'\x00\x00\x10\xB5\x00\x00\x00\x02VkTextureLODGatherFormatPropertiesAMD',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11supportsTextureGatherLODBiasAMD'),(b'\x00\x00\x10\xB6\x00\x00\x00\x02VkTilePropertiesQCOM',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0C\xA1\x11tileSize',b'\x00\x0C\xA0\x11apronSize',b'\x00\x0D\x6E\x11origin'),(b'\x00\x00\x10\xB8\x00\x00\x00\x02VkTimelineSemaphoreSubmitInfo',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11waitSemaphoreValueCount',b'\x00\x05\xD1\x11pWaitSemaphoreValues',b'\x00\x00\x1F\x11signalSemaphoreValueCount',b'\x00\x05\xD1\x11pSignalSemaphoreValues'),(b'\x00\x00\x10\xBA\x00\x00\x00\x02VkTraceRaysIndirectCommand2KHR',b'\x00\x01\x43\x11raygenShaderRecordAddress',b'\x00\x01\x43\x11raygenShaderRecordSize',b'\x00\x01\x43\x11missShaderBindingTableAddress',b'\x00\x01\x43\x11missShaderBindingTableSize',b'\x00\x01\x43\x11missShaderBindingTableStride',b'\x00\x01\x43\x11hitShaderBindingTableAddress',b'\x00\x01\x43\x11hitShaderBindingTableSize',b'\x00\x01\x43\x11hitShaderBindingTableStride',b'\x00\x01\x43\x11callableShaderBindingTableAddress',b'\x00\x01\x43\x11callableShaderBindingTableSize',b'\x00\x01\x43\x11callableShaderBindingTableStride',b'\x00\x00\x1F\x11width',b'\x00\x00\x1F\x11height',b'\x00\x00\x1F\x11depth'),(b'\x00\x00\x10\xBB\x00\x00\x00\x02VkTraceRaysIndirectCommandKHR',b'\x00\x00\x1F\x11width',b'\x00\x00\x1F\x11height',b'\x00\x00\x1F\x11depth'),(b'\x00\x00\x10\xBC\x00\x00\x00\x02VkTransformMatrixKHR',b'\x00\x11\x4D\x11matrix'),(b'\x00\x00\x10\xBD\x00\x00\x00\x02VkValidationCacheCreateInfoEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x01\xF7\x11initialDataSize',b'\x00\x00\xCE\x11pInitialData'),(b'\x00\x00\x11\x9E\x00\x00\x00\x10VkValidationCacheEXT_T',),(b'\x00\x00\x10\xC5\x00\x00\x00\x02VkValidationFeaturesEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11enabledValidationFeatureCount',b'\x00\x10\xC3\x11pEnabledValidationFeatures',b'\x00\x00\x1F\x11disabledValidationFeatureCount',b'\x00\x10\xC1\x11pDisabledValidationFeatures'),(b'\x00\x00\x10\xC6\x00\x00\x00\x02VkValidationFlagsEXT',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11disabledValidationCheckCount',b'\x00\x10\xBF\x11pDisabledValidationChecks'),(b'\x00\x00\x10\xCA\x00\x00\x00\x02VkVertexInputAttributeDescription',b'\x00\x00\x1F\x11location',b'\x00\x00\x1F\x11binding',b'\x00\x03\xD2\x11format',b'\x00\x00\x1F\x11offset'),(b'\x00\x00\x10\xC9\x00\x00\x00\x02VkVertexInputAttributeDescription2EXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11location',b'\x00\x00\x1F\x11binding',b'\x00\x03\xD2\x11format',b'\x00\x00\x1F\x11offset'),(b'\x00\x00\x10\xCD\x00\x00\x00\x02VkVertexInputBindingDescription',b'\x00\x00\x1F\x11binding',b'\x00\x00\x1F\x11stride',b'\x00\x10\xD0\x11inputRate'),(b'\x00\x00\x10\xCC\x00\x00\x00\x02VkVertexInputBindingDescription2EXT',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11binding',b'\x00\x00\x1F\x11stride',b'\x00\x10\xD0\x11inputRate',b'\x00\x00\x1F\x11divisor'),(b'\x00\x00\x10\xCF\x00\x00\x00\x02VkVertexInputBindingDivisorDescriptionKHR',b'\x00\x00\x1F\x11binding',b'\x00\x00\x1F\x11divisor'),(b'\x00\x00\x10\xD1\x00\x00\x00\x02VkVideoBeginCodingInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x03\x2A\x11videoSession',b'\x00\x03\x36\x11videoSessionParameters',b'\x00\x00\x1F\x11referenceSlotCount',b'\x00\x11\x30\x11pReferenceSlots'),(b'\x00\x00\x10\xD2\x00\x00\x00\x02VkVideoCapabilitiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x01\x43\x11minBitstreamBufferOffsetAlignment',b'\x00\x01\x43\x11minBitstreamBufferSizeAlignment',b'\x00\x0C\xA0\x11pictureAccessGranularity',b'\x00\x0C\xA0\x11minCodedExtent',b'\x00\x0C\xA0\x11maxCodedExtent',b'\x00\x00\x1F\x11maxDpbSlots',b'\x00\x00\x1F\x11maxActiveReferencePictures',b'\x00\x0C\x9F\x11stdHeaderVersion'),(b'\x00\x00\x10\xD7\x00\x00\x00\x02VkVideoCodingControlInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags'),(b'\x00\x00\x10\xD9\x00\x00\x00\x02VkVideoDecodeCapabilitiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11flags'),(b'\x00\x00\x10\xDB\x00\x00\x00\x02VkVideoDecodeH264CapabilitiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0B\x20\x11maxLevelIdc',b'\x00\x0D\x6E\x11fieldOffsetGranularity'),(b'\x00\x00\x10\xDC\x00\x00\x00\x02VkVideoDecodeH264DpbSlotInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0A\xED\x11pStdReferenceInfo'),(b'\x00\x00\x10\xDD\x00\x00\x00\x02VkVideoDecodeH264PictureInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0A\xEA\x11pStdPictureInfo',b'\x00\x00\x1F\x11sliceCount',b'\x00\x05\xC8\x11pSliceOffsets'),(b'\x00\x00\x10\xDF\x00\x00\x00\x02VkVideoDecodeH264ProfileInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0B\x29\x11stdProfileIdc',b'\x00\x10\xDE\x11pictureLayout'),(b'\x00\x00\x10\xE1\x00\x00\x00\x02VkVideoDecodeH264SessionParametersAddInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11stdSPSCount',b'\x00\x0B\x2C\x11pStdSPSs',b'\x00\x00\x1F\x11stdPPSCount',b'\x00\x0B\x24\x11pStdPPSs'),(b'\x00\x00\x10\xE2\x00\x00\x00\x02VkVideoDecodeH264SessionParametersCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11maxStdSPSCount',b'\x00\x00\x1F\x11maxStdPPSCount',b'\x00\x10\xE0\x11pParametersAddInfo'),(b'\x00\x00\x10\xE3\x00\x00\x00\x02VkVideoDecodeH265CapabilitiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x0B\x3B\x11maxLevelIdc'),(b'\x00\x00\x10\xE4\x00\x00\x00\x02VkVideoDecodeH265DpbSlotInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0A\xF3\x11pStdReferenceInfo'),(b'\x00\x00\x10\xE5\x00\x00\x00\x02VkVideoDecodeH265PictureInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0A\xF0\x11pStdPictureInfo',b'\x00\x00\x1F\x11sliceSegmentCount',b'\x00\x05\xC8\x11pSliceSegmentOffsets'),(b'\x00\x00\x10\xE6\x00\x00\x00\x02VkVideoDecodeH265ProfileInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0B\x44\x11stdProfileIdc'),(b'\x00\x00\x10\xE8\x00\x00\x00\x02VkVideoDecodeH265SessionParametersAddInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11stdVPSCount',b'\x00\x0B\x56\x11pStdVPSs',b'\x00\x00\x1F\x11stdSPSCount',b'\x00\x0B\x4A\x11pStdSPSs',b'\x00\x00\x1F\x11stdPPSCount',b'\x00\x0B\x3E\x11pStdPPSs'),(b'\x00\x00\x10\xE9\x00\x00\x00\x02VkVideoDecodeH265SessionParametersCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11maxStdVPSCount',b'\x00\x00\x1F\x11maxStdSPSCount',b'\x00\x00\x1F\x11maxStdPPSCount',b'\x00\x10\xE7\x11pParametersAddInfo'),(b'\x00\x00\x10\xEA\x00\x00\x00\x02VkVideoDecodeInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x01\xFC\x11srcBuffer',b'\x00\x01\x43\x11srcBufferOffset',b'\x00\x01\x43\x11srcBufferRange',b'\x00\x11\x2D\x11dstPictureResource',b'\x00\x11\x30\x11pSetupReferenceSlot',b'\x00\x00\x1F\x11referenceSlotCount',b'\x00\x11\x30\x11pReferenceSlots'),(b'\x00\x00\x10\xEC\x00\x00\x00\x02VkVideoDecodeUsageInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11videoUsageHints'),(b'\x00\x00\x10\xED\x00\x00\x00\x02VkVideoEncodeCapabilitiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11rateControlModes',b'\x00\x00\x1F\x11maxRateControlLayers',b'\x00\x01\x43\x11maxBitrate',b'\x00\x00\x1F\x11maxQualityLevels',b'\x00\x0C\xA0\x11encodeInputPictureGranularity',b'\x00\x00\x1F\x11supportedEncodeFeedbackFlags'),(b'\x00\x00\x10\xF1\x00\x00\x00\x02VkVideoEncodeH264CapabilitiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x0B\x20\x11maxLevelIdc',b'\x00\x00\x1F\x11maxSliceCount',b'\x00\x00\x1F\x11maxPPictureL0ReferenceCount',b'\x00\x00\x1F\x11maxBPictureL0ReferenceCount',b'\x00\x00\x1F\x11maxL1ReferenceCount',b'\x00\x00\x1F\x11maxTemporalLayerCount',b'\x00\x00\x1F\x11expectDyadicTemporalLayerPattern',b'\x00\x04\x17\x11minQp',b'\x00\x04\x17\x11maxQp',b'\x00\x00\x1F\x11prefersGopRemainingFrames',b'\x00\x00\x1F\x11requiresGopRemainingFrames',b'\x00\x00\x1F\x11stdSyntaxFlags'),(b'\x00\x00\x10\xF3\x00\x00\x00\x02VkVideoEncodeH264DpbSlotInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0A\xFD\x11pStdReferenceInfo'),(b'\x00\x00\x10\xF4\x00\x00\x00\x02VkVideoEncodeH264FrameSizeKHR',b'\x00\x00\x1F\x11frameISize',b'\x00\x00\x1F\x11framePSize',b'\x00\x00\x1F\x11frameBSize'),(b'\x00\x00\x10\xF5\x00\x00\x00\x02VkVideoEncodeH264GopRemainingFrameInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11useGopRemainingFrames',b'\x00\x00\x1F\x11gopRemainingI',b'\x00\x00\x1F\x11gopRemainingP',b'\x00\x00\x1F\x11gopRemainingB'),(b'\x00\x00\x10\xF7\x00\x00\x00\x02VkVideoEncodeH264NaluSliceInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x04\x17\x11constantQp',b'\x00\x0B\x03\x11pStdSliceHeader'),(b'\x00\x00\x10\xF8\x00\x00\x00\x02VkVideoEncodeH264PictureInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11naluSliceEntryCount',b'\x00\x10\xF6\x11pNaluSliceEntries',b'\x00\x0A\xF6\x11pStdPictureInfo',b'\x00\x00\x1F\x11generatePrefixNalu'),(b'\x00\x00\x10\xF9\x00\x00\x00\x02VkVideoEncodeH264ProfileInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0B\x29\x11stdProfileIdc'),(b'\x00\x00\x10\xFA\x00\x00\x00\x02VkVideoEncodeH264QpKHR',b'\x00\x04\x17\x11qpI',b'\x00\x04\x17\x11qpP',b'\x00\x04\x17\x11qpB'),(b'\x00\x00\x10\xFB\x00\x00\x00\x02VkVideoEncodeH264QualityLevelPropertiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11preferredRateControlFlags',b'\x00\x00\x1F\x11preferredGopFrameCount',b'\x00\x00\x1F\x11preferredIdrPeriod',b'\x00\x00\x1F\x11preferredConsecutiveBFrameCount',b'\x00\x00\x1F\x11preferredTemporalLayerCount',b'\x00\x10\xFA\x11preferredConstantQp',b'\x00\x00\x1F\x11preferredMaxL0ReferenceCount',b'\x00\x00\x1F\x11preferredMaxL1ReferenceCount',b'\x00\x00\x1F\x11preferredStdEntropyCodingModeFlag'),(b'\x00\x00\x10\xFD\x00\x00\x00\x02VkVideoEncodeH264RateControlInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11gopFrameCount',b'\x00\x00\x1F\x11idrPeriod',b'\x00\x00\x1F\x11consecutiveBFrameCount',b'\x00\x00\x1F\x11temporalLayerCount'),(b'\x00\x00\x10\xFE\x00\x00\x00\x02VkVideoEncodeH264RateControlLayerInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11useMinQp',b'\x00\x10\xFA\x11minQp',b'\x00\x00\x1F\x11useMaxQp',b'\x00\x10\xFA\x11maxQp',b'\x00\x00\x1F\x11useMaxFrameSize',b'\x00\x10\xF4\x11maxFrameSize'),(b'\x00\x00\x10\xFF\x00\x00\x00\x02VkVideoEncodeH264SessionCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11useMaxLevelIdc',b'\x00\x0B\x20\x11maxLevelIdc'),(b'\x00\x00\x11\x01\x00\x00\x00\x02VkVideoEncodeH264SessionParametersAddInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11stdSPSCount',b'\x00\x0B\x2C\x11pStdSPSs',b'\x00\x00\x1F\x11stdPPSCount',b'\x00\x0B\x24\x11pStdPPSs'),(b'\x00\x00\x11\x02\x00\x00\x00\x02VkVideoEncodeH264SessionParametersCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11maxStdSPSCount',b'\x00\x00\x1F\x11maxStdPPSCount',b'\x00\x11\x00\x11pParametersAddInfo'),(b'\x00\x00\x11\x03\x00\x00\x00\x02VkVideoEncodeH264SessionParametersFeedbackInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11hasStdSPSOverrides',b'\x00\x00\x1F\x11hasStdPPSOverrides'),(b'\x00\x00\x11\x04\x00\x00\x00\x02VkVideoEncodeH264SessionParametersGetInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11writeStdSPS',b'\x00\x00\x1F\x11writeStdPPS',b'\x00\x00\x1F\x11stdSPSId',b'\x00\x00\x1F\x11stdPPSId'),(b'\x00\x00\x11\x06\x00\x00\x00\x02VkVideoEncodeH265CapabilitiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x0B\x3B\x11maxLevelIdc',b'\x00\x00\x1F\x11maxSliceSegmentCount',b'\x00\x0C\xA0\x11maxTiles',b'\x00\x00\x1F\x11ctbSizes',b'\x00\x00\x1F\x11transformBlockSizes',b'\x00\x00\x1F\x11maxPPictureL0ReferenceCount',b'\x00\x00\x1F\x11maxBPictureL0ReferenceCount',b'\x00\x00\x1F\x11maxL1ReferenceCount',b'\x00\x00\x1F\x11maxSubLayerCount',b'\x00\x00\x1F\x11expectDyadicTemporalSubLayerPattern',b'\x00\x04\x17\x11minQp',b'\x00\x04\x17\x11maxQp',b'\x00\x00\x1F\x11prefersGopRemainingFrames',b'\x00\x00\x1F\x11requiresGopRemainingFrames',b'\x00\x00\x1F\x11stdSyntaxFlags'),(b'\x00\x00\x11\x09\x00\x00\x00\x02VkVideoEncodeH265DpbSlotInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0B\x0E\x11pStdReferenceInfo'),(b'\x00\x00\x11\x0A\x00\x00\x00\x02VkVideoEncodeH265FrameSizeKHR',b'\x00\x00\x1F\x11frameISize',b'\x00\x00\x1F\x11framePSize',b'\x00\x00\x1F\x11frameBSize'),(b'\x00\x00\x11\x0B\x00\x00\x00\x02VkVideoEncodeH265GopRemainingFrameInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11useGopRemainingFrames',b'\x00\x00\x1F\x11gopRemainingI',b'\x00\x00\x1F\x11gopRemainingP',b'\x00\x00\x1F\x11gopRemainingB'),(b'\x00\x00\x11\x0D\x00\x00\x00\x02VkVideoEncodeH265NaluSliceSegmentInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x04\x17\x11constantQp',b'\x00\x0B\x14\x11pStdSliceSegmentHeader'),(b'\x00\x00\x11\x0E\x00\x00\x00\x02VkVideoEncodeH265PictureInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11naluSliceSegmentEntryCount',b'\x00\x11\x0C\x11pNaluSliceSegmentEntries',b'\x00\x0B\x0B\x11pStdPictureInfo'),(b'\x00\x00\x11\x0F\x00\x00\x00\x02VkVideoEncodeH265ProfileInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0B\x44\x11stdProfileIdc'),(b'\x00\x00\x11\x10\x00\x00\x00\x02VkVideoEncodeH265QpKHR',b'\x00\x04\x17\x11qpI',b'\x00\x04\x17\x11qpP',b'\x00\x04\x17\x11qpB'),(b'\x00\x00\x11\x11\x00\x00\x00\x02VkVideoEncodeH265QualityLevelPropertiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11preferredRateControlFlags',b'\x00\x00\x1F\x11preferredGopFrameCount',b'\x00\x00\x1F\x11preferredIdrPeriod',b'\x00\x00\x1F\x11preferredConsecutiveBFrameCount',b'\x00\x00\x1F\x11preferredSubLayerCount',b'\x00\x11\x10\x11preferredConstantQp',b'\x00\x00\x1F\x11preferredMaxL0ReferenceCount',b'\x00\x00\x1F\x11preferredMaxL1ReferenceCount'),(b'\x00\x00\x11\x13\x00\x00\x00\x02VkVideoEncodeH265RateControlInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x1F\x11gopFrameCount',b'\x00\x00\x1F\x11idrPeriod',b'\x00\x00\x1F\x11consecutiveBFrameCount',b'\x00\x00\x1F\x11subLayerCount'),(b'\x00\x00\x11\x14\x00\x00\x00\x02VkVideoEncodeH265RateControlLayerInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11useMinQp',b'\x00\x11\x10\x11minQp',b'\x00\x00\x1F\x11useMaxQp',b'\x00\x11\x10\x11maxQp',b'\x00\x00\x1F\x11useMaxFrameSize',b'\x00\x11\x0A\x11maxFrameSize'),(b'\x00\x00\x11\x15\x00\x00\x00\x02VkVideoEncodeH265SessionCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11useMaxLevelIdc',b'\x00\x0B\x3B\x11maxLevelIdc'),(b'\x00\x00\x11\x17\x00\x00\x00\x02VkVideoEncodeH265SessionParametersAddInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11stdVPSCount',b'\x00\x0B\x56\x11pStdVPSs',b'\x00\x00\x1F\x11stdSPSCount',b'\x00\x0B\x4A\x11pStdSPSs',b'\x00\x00\x1F\x11stdPPSCount',b'\x00\x0B\x3E\x11pStdPPSs'),(b'\x00\x00\x11\x18\x00\x00\x00\x02VkVideoEncodeH265SessionParametersCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11maxStdVPSCount',b'\x00\x00\x1F\x11maxStdSPSCount',b'\x00\x00\x1F\x11maxStdPPSCount',b'\x00\x11\x16\x11pParametersAddInfo'),(b'\x00\x00\x11\x19\x00\x00\x00\x02VkVideoEncodeH265SessionParametersFeedbackInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11hasStdVPSOverrides',b'\x00\x00\x1F\x11hasStdSPSOverrides',b'\x00\x00\x1F\x11hasStdPPSOverrides'),(b'\x00\x00\x11\x1A\x00\x00\x00\x02VkVideoEncodeH265SessionParametersGetInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11writeStdVPS',b'\x00\x00\x1F\x11writeStdSPS',b'\x00\x00\x1F\x11writeStdPPS',b'\x00\x00\x1F\x11stdVPSId',b'\x00\x00\x1F\x11stdSPSId',b'\x00\x00\x1F\x11stdPPSId'),(b'\x00\x00\x11\x1D\x00\x00\x00\x02VkVideoEncodeInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x01\xFC\x11dstBuffer',b'\x00\x01\x43\x11dstBufferOffset',b'\x00\x01\x43\x11dstBufferRange',b'\x00\x11\x2D\x11srcPictureResource',b'\x00\x11\x30\x11pSetupReferenceSlot',b'\x00\x00\x1F\x11referenceSlotCount',b'\x00\x11\x30\x11pReferenceSlots',b'\x00\x00\x1F\x11precedingExternallyEncodedBytes'),(b'\x00\x00\x11\x1E\x00\x00\x00\x02VkVideoEncodeQualityLevelInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11qualityLevel'),(b'\x00\x00\x11\x1F\x00\x00\x00\x02VkVideoEncodeQualityLevelPropertiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x11\x23\x11preferredRateControlMode',b'\x00\x00\x1F\x11preferredRateControlLayerCount'),(b'\x00\x00\x11\x20\x00\x00\x00\x02VkVideoEncodeRateControlInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x11\x23\x11rateControlMode',b'\x00\x00\x1F\x11layerCount',b'\x00\x11\x21\x11pLayers',b'\x00\x00\x1F\x11virtualBufferSizeInMs',b'\x00\x00\x1F\x11initialVirtualBufferSizeInMs'),(b'\x00\x00\x11\x22\x00\x00\x00\x02VkVideoEncodeRateControlLayerInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x01\x43\x11averageBitrate',b'\x00\x01\x43\x11maxBitrate',b'\x00\x00\x1F\x11frameRateNumerator',b'\x00\x00\x1F\x11frameRateDenominator'),(b'\x00\x00\x11\x24\x00\x00\x00\x02VkVideoEncodeSessionParametersFeedbackInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11hasOverrides'),(b'\x00\x00\x11\x25\x00\x00\x00\x02VkVideoEncodeSessionParametersGetInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x03\x36\x11videoSessionParameters'),(b'\x00\x00\x11\x28\x00\x00\x00\x02VkVideoEncodeUsageInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11videoUsageHints',b'\x00\x00\x1F\x11videoContentHints',b'\x00\x11\x26\x11tuningMode'),(b'\x00\x00\x11\x29\x00\x00\x00\x02VkVideoEndCodingInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags'),(b'\x00\x00\x11\x2A\x00\x00\x00\x02VkVideoFormatPropertiesKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x03\xD2\x11format',b'\x00\x0B\xE9\x11componentMapping',b'\x00\x00\x1F\x11imageCreateFlags',b'\x00\x03\xD3\x11imageType',b'\x00\x03\xD4\x11imageTiling',b'\x00\x00\x1F\x11imageUsageFlags'),(b'\x00\x00\x11\x2B\x00\x00\x00\x02VkVideoInlineQueryInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x02\xCC\x11queryPool',b'\x00\x00\x1F\x11firstQuery',b'\x00\x00\x1F\x11queryCount'),(b'\x00\x00\x11\x2D\x00\x00\x00\x02VkVideoPictureResourceInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x0D\x6E\x11codedOffset',b'\x00\x0C\xA0\x11codedExtent',b'\x00\x00\x1F\x11baseArrayLayer',b'\x00\x02\x78\x11imageViewBinding'),(b'\x00\x00\x11\x2E\x00\x00\x00\x02VkVideoProfileInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x10\xD5\x11videoCodecOperation',b'\x00\x00\x1F\x11chromaSubsampling',b'\x00\x00\x1F\x11lumaBitDepth',b'\x00\x00\x1F\x11chromaBitDepth'),(b'\x00\x00\x11\x2F\x00\x00\x00\x02VkVideoProfileListInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11profileCount',b'\x00\x04\x0C\x11pProfiles'),(b'\x00\x00\x11\x31\x00\x00\x00\x02VkVideoReferenceSlotInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x04\x17\x11slotIndex',b'\x00\x11\x2C\x11pPictureResource'),(b'\x00\x00\x11\x33\x00\x00\x00\x02VkVideoSessionCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11queueFamilyIndex',b'\x00\x00\x1F\x11flags',b'\x00\x04\x0C\x11pVideoProfile',b'\x00\x03\xD2\x11pictureFormat',b'\x00\x0C\xA0\x11maxCodedExtent',b'\x00\x03\xD2\x11referencePictureFormat',b'\x00\x00\x1F\x11maxDpbSlots',b'\x00\x00\x1F\x11maxActiveReferencePictures',b'\x00\x0C\x9E\x11pStdHeaderVersion'),(b'\x00\x00\x11\x9F\x00\x00\x00\x10VkVideoSessionKHR_T',),(b'\x00\x00\x11\x34\x00\x00\x00\x02VkVideoSessionMemoryRequirementsKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\x27\x11pNext',b'\x00\x00\x1F\x11memoryBindIndex',b'\x00\x0D\x52\x11memoryRequirements'),(b'\x00\x00\x11\x35\x00\x00\x00\x02VkVideoSessionParametersCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x03\x36\x11videoSessionParametersTemplate',b'\x00\x03\x2A\x11videoSession'),(b'\x00\x00\x11\xA0\x00\x00\x00\x10VkVideoSessionParametersKHR_T',),(b'\x00\x00\x11\x36\x00\x00\x00\x02VkVideoSessionParametersUpdateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11updateSequenceCount'),(b'\x00\x00\x11\x37\x00\x00\x00\x02VkViewport',b'\x00\x06\x63\x11x',b'\x00\x06\x63\x11y',b'\x00\x06\x63\x11width',b'\x00\x06\x63\x11height',b'\x00\x06\x63\x11minDepth',b'\x00\x06\x63\x11maxDepth'),(b'\x00\x00\x11\x39\x00\x00\x00\x02VkViewportSwizzleNV',b'\x00\x11\x38\x11x',b'\x00\x11\x38\x11y',b'\x00\x11\x38\x11z',b'\x00\x11\x38\x11w'),(b'\x00\x00\x11\x3A\x00\x00\x00\x02VkViewportWScalingNV',b'\x00\x06\x63\x11xcoeff',b'\x00\x06\x63\x11ycoeff'),(b'\x00\x00\x11\x3B\x00\x00\x00\x02VkWaylandSurfaceCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x04\xE7\x11display',b'\x00\x11\xA2\x11surface'),(b'\x00\x00\x11\x3C\x00\x00\x00\x02VkWin32KeyedMutexAcquireReleaseInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11acquireCount',b'\x00\x11\x78\x11pAcquireSyncs',b'\x00\x05\xD1\x11pAcquireKeys',b'\x00\x05\xC8\x11pAcquireTimeouts',b'\x00\x00\x1F\x11releaseCount',b'\x00\x11\x78\x11pReleaseSyncs',b'\x00\x05\xD1\x11pReleaseKeys'),(b'\x00\x00\x11\x3D\x00\x00\x00\x02VkWin32KeyedMutexAcquireReleaseInfoNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11acquireCount',b'\x00\x11\x78\x11pAcquireSyncs',b'\x00\x05\xD1\x11pAcquireKeys',b'\x00\x05\xC8\x11pAcquireTimeoutMilliseconds',b'\x00\x00\x1F\x11releaseCount',b'\x00\x11\x78\x11pReleaseSyncs',b'\x00\x05\xD1\x11pReleaseKeys'),(b'\x00\x00\x11\x3E\x00\x00\x00\x02VkWin32SurfaceCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x00\x27\x11hinstance',b'\x00\x00\x27\x11hwnd'),(b'\x00\x00\x11\x3F\x00\x00\x00\x02VkWriteDescriptorSet',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x09\x55\x11dstSet',b'\x00\x00\x1F\x11dstBinding',b'\x00\x00\x1F\x11dstArrayElement',b'\x00\x00\x1F\x11descriptorCount',b'\x00\x0C\x3F\x11descriptorType',b'\x00\x0C\x2C\x11pImageInfo',b'\x00\x0C\x28\x11pBufferInfo',b'\x00\x11\x67\x11pTexelBufferView'),(b'\x00\x00\x11\x40\x00\x00\x00\x02VkWriteDescriptorSetAccelerationStructureKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11accelerationStructureCount',b'\x00\x03\x6A\x11pAccelerationStructures'),(b'\x00\x00\x11\x41\x00\x00\x00\x02VkWriteDescriptorSetAccelerationStructureNV',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11accelerationStructureCount',b'\x00\x07\xAB\x11pAccelerationStructures'),(b'\x00\x00\x11\x42\x00\x00\x00\x02VkWriteDescriptorSetInlineUniformBlock',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11dataSize',b'\x00\x00\xCE\x11pData'),(b'\x00\x00\x11\x43\x00\x00\x00\x02VkXYColorEXT',b'\x00\x06\x63\x11x',b'\x00\x06\x63\x11y'),(b'\x00\x00\x11\x44\x00\x00\x00\x02VkXcbSurfaceCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x04\xEC\x11connection',b'\x00\x00\x1F\x11window'),(b'\x00\x00\x11\x45\x00\x00\x00\x02VkXlibSurfaceCreateInfoKHR',b'\x00\x10\x82\x11sType',b'\x00\x00\xCE\x11pNext',b'\x00\x00\x1F\x11flags',b'\x00\x04\xE1\x11dpy',b'\x00\x04\xE2\x11window'),(b'\x00\x00\x0A\xE8\x00\x00\x00\x02_SECURITY_ATTRIBUTES',b'\x00\x04\xE2\x11nLength',b'\x00\x00\x27\x11lpSecurityDescriptor',b'\x00\x00\xC2\x11bInheritHandle'),(b'\x00\x00\x11\xA1\x00\x00\x00\x10wl_display',),(b'\x00\x00\x11\xA3\x00\x00\x00\x10wl_surface',),(b'\x00\x00\x12\xF7\x00\x00\x00\x10xcb_connection_t',)),
+    _enums = (b'\x00\x00\x0A\xE9\x00\x00\x00\x16StdVideoDecodeH264FieldOrderCount\x00STD_VIDEO_DECODE_H264_FIELD_ORDER_COUNT_TOP,STD_VIDEO_DECODE_H264_FIELD_ORDER_COUNT_BOTTOM,STD_VIDEO_DECODE_H264_FIELD_ORDER_COUNT_INVALID,STD_VIDEO_DECODE_H264_FIELD_ORDER_COUNT_MAX_ENUM',b'\x00\x00\x0B\x1A\x00\x00\x00\x16StdVideoH264AspectRatioIdc\x00STD_VIDEO_H264_ASPECT_RATIO_IDC_UNSPECIFIED,STD_VIDEO_H264_ASPECT_RATIO_IDC_SQUARE,STD_VIDEO_H264_ASPECT_RATIO_IDC_12_11,STD_VIDEO_H264_ASPECT_RATIO_IDC_10_11,STD_VIDEO_H264_ASPECT_RATIO_IDC_16_11,STD_VIDEO_H264_ASPECT_RATIO_IDC_40_33,STD_VIDEO_H264_ASPECT_RATIO_IDC_24_11,STD_VIDEO_H264_ASPECT_RATIO_IDC_20_11,STD_VIDEO_H264_ASPECT_RATIO_IDC_32_11,STD_VIDEO_H264_ASPECT_RATIO_IDC_80_33,STD_VIDEO_H264_ASPECT_RATIO_IDC_18_11,STD_VIDEO_H264_ASPECT_RATIO_IDC_15_11,STD_VIDEO_H264_ASPECT_RATIO_IDC_64_33,STD_VIDEO_H264_ASPECT_RATIO_IDC_160_99,STD_VIDEO_H264_ASPECT_RATIO_IDC_4_3,STD_VIDEO_H264_ASPECT_RATIO_IDC_3_2,STD_VIDEO_H264_ASPECT_RATIO_IDC_2_1,STD_VIDEO_H264_ASPECT_RATIO_IDC_EXTENDED_SAR,STD_VIDEO_H264_ASPECT_RATIO_IDC_INVALID,STD_VIDEO_H264_ASPECT_RATIO_IDC_MAX_ENUM',b'\x00\x00\x0B\x1B\x00\x00\x00\x16StdVideoH264CabacInitIdc\x00STD_VIDEO_H264_CABAC_INIT_IDC_0,STD_VIDEO_H264_CABAC_INIT_IDC_1,STD_VIDEO_H264_CABAC_INIT_IDC_2,STD_VIDEO_H264_CABAC_INIT_IDC_INVALID,STD_VIDEO_H264_CABAC_INIT_IDC_MAX_ENUM',b'\x00\x00\x0B\x1C\x00\x00\x00\x16StdVideoH264ChromaFormatIdc\x00STD_VIDEO_H264_CHROMA_FORMAT_IDC_MONOCHROME,STD_VIDEO_H264_CHROMA_FORMAT_IDC_420,STD_VIDEO_H264_CHROMA_FORMAT_IDC_422,STD_VIDEO_H264_CHROMA_FORMAT_IDC_444,STD_VIDEO_H264_CHROMA_FORMAT_IDC_INVALID,STD_VIDEO_H264_CHROMA_FORMAT_IDC_MAX_ENUM',b'\x00\x00\x0B\x1D\x00\x00\x00\x16StdVideoH264DisableDeblockingFilterIdc\x00STD_VIDEO_H264_DISABLE_DEBLOCKING_FILTER_IDC_DISABLED,STD_VIDEO_H264_DISABLE_DEBLOCKING_FILTER_IDC_ENABLED,STD_VIDEO_H264_DISABLE_DEBLOCKING_FILTER_IDC_PARTIAL,STD_VIDEO_H264_DISABLE_DEBLOCKING_FILTER_IDC_INVALID,STD_VIDEO_H264_DISABLE_DEBLOCKING_FILTER_IDC_MAX_ENUM',b'\x00\x00\x0B\x20\x00\x00\x00\x16StdVideoH264LevelIdc\x00STD_VIDEO_H264_LEVEL_IDC_1_0,STD_VIDEO_H264_LEVEL_IDC_1_1,STD_VIDEO_H264_LEVEL_IDC_1_2,STD_VIDEO_H264_LEVEL_IDC_1_3,STD_VIDEO_H264_LEVEL_IDC_2_0,STD_VIDEO_H264_LEVEL_IDC_2_1,STD_VIDEO_H264_LEVEL_IDC_2_2,STD_VIDEO_H264_LEVEL_IDC_3_0,STD_VIDEO_H264_LEVEL_IDC_3_1,STD_VIDEO_H264_LEVEL_IDC_3_2,STD_VIDEO_H264_LEVEL_IDC_4_0,STD_VIDEO_H264_LEVEL_IDC_4_1,STD_VIDEO_H264_LEVEL_IDC_4_2,STD_VIDEO_H264_LEVEL_IDC_5_0,STD_VIDEO_H264_LEVEL_IDC_5_1,STD_VIDEO_H264_LEVEL_IDC_5_2,STD_VIDEO_H264_LEVEL_IDC_6_0,STD_VIDEO_H264_LEVEL_IDC_6_1,STD_VIDEO_H264_LEVEL_IDC_6_2,STD_VIDEO_H264_LEVEL_IDC_INVALID,STD_VIDEO_H264_LEVEL_IDC_MAX_ENUM',b'\x00\x00\x0B\x21\x00\x00\x00\x16StdVideoH264MemMgmtControlOp\x00STD_VIDEO_H264_MEM_MGMT_CONTROL_OP_END,STD_VIDEO_H264_MEM_MGMT_CONTROL_OP_UNMARK_SHORT_TERM,STD_VIDEO_H264_MEM_MGMT_CONTROL_OP_UNMARK_LONG_TERM,STD_VIDEO_H264_MEM_MGMT_CONTROL_OP_MARK_LONG_TERM,STD_VIDEO_H264_MEM_MGMT_CONTROL_OP_SET_MAX_LONG_TERM_INDEX,STD_VIDEO_H264_MEM_MGMT_CONTROL_OP_UNMARK_ALL,STD_VIDEO_H264_MEM_MGMT_CONTROL_OP_MARK_CURRENT_AS_LONG_TERM,STD_VIDEO_H264_MEM_MGMT_CONTROL_OP_INVALID,STD_VIDEO_H264_MEM_MGMT_CONTROL_OP_MAX_ENUM',b'\x00\x00\x0B\x22\x00\x00\x00\x16StdVideoH264ModificationOfPicNumsIdc\x00STD_VIDEO_H264_MODIFICATION_OF_PIC_NUMS_IDC_SHORT_TERM_SUBTRACT,STD_VIDEO_H264_MODIFICATION_OF_PIC_NUMS_IDC_SHORT_TERM_ADD,STD_VIDEO_H264_MODIFICATION_OF_PIC_NUMS_IDC_LONG_TERM,STD_VIDEO_H264_MODIFICATION_OF_PIC_NUMS_IDC_END,STD_VIDEO_H264_MODIFICATION_OF_PIC_NUMS_IDC_INVALID,STD_VIDEO_H264_MODIFICATION_OF_PIC_NUMS_IDC_MAX_ENUM',b'\x00\x00\x0B\x23\x00\x00\x00\x16StdVideoH264NonVclNaluType\x00STD_VIDEO_H264_NON_VCL_NALU_TYPE_SPS,STD_VIDEO_H264_NON_VCL_NALU_TYPE_PPS,STD_VIDEO_H264_NON_VCL_NALU_TYPE_AUD,STD_VIDEO_H264_NON_VCL_NALU_TYPE_PREFIX,STD_VIDEO_H264_NON_VCL_NALU_TYPE_END_OF_SEQUENCE,STD_VIDEO_H264_NON_VCL_NALU_TYPE_END_OF_STREAM,STD_VIDEO_H264_NON_VCL_NALU_TYPE_PRECODED,STD_VIDEO_H264_NON_VCL_NALU_TYPE_INVALID,STD_VIDEO_H264_NON_VCL_NALU_TYPE_MAX_ENUM',b'\x00\x00\x0B\x26\x00\x00\x00\x16StdVideoH264PictureType\x00STD_VIDEO_H264_PICTURE_TYPE_P,STD_VIDEO_H264_PICTURE_TYPE_B,STD_VIDEO_H264_PICTURE_TYPE_I,STD_VIDEO_H264_PICTURE_TYPE_IDR,STD_VIDEO_H264_PICTURE_TYPE_INVALID,STD_VIDEO_H264_PICTURE_TYPE_MAX_ENUM',b'\x00\x00\x0B\x27\x00\x00\x00\x16StdVideoH264PocType\x00STD_VIDEO_H264_POC_TYPE_0,STD_VIDEO_H264_POC_TYPE_1,STD_VIDEO_H264_POC_TYPE_2,STD_VIDEO_H264_POC_TYPE_INVALID,STD_VIDEO_H264_POC_TYPE_MAX_ENUM',b'\x00\x00\x0B\x29\x00\x00\x00\x16StdVideoH264ProfileIdc\x00STD_VIDEO_H264_PROFILE_IDC_BASELINE,STD_VIDEO_H264_PROFILE_IDC_MAIN,STD_VIDEO_H264_PROFILE_IDC_HIGH,STD_VIDEO_H264_PROFILE_IDC_HIGH_444_PREDICTIVE,STD_VIDEO_H264_PROFILE_IDC_INVALID,STD_VIDEO_H264_PROFILE_IDC_MAX_ENUM',b'\x00\x00\x0B\x30\x00\x00\x00\x16StdVideoH264SliceType\x00STD_VIDEO_H264_SLICE_TYPE_P,STD_VIDEO_H264_SLICE_TYPE_B,STD_VIDEO_H264_SLICE_TYPE_I,STD_VIDEO_H264_SLICE_TYPE_INVALID,STD_VIDEO_H264_SLICE_TYPE_MAX_ENUM',b'\x00\x00\x0B\x33\x00\x00\x00\x16StdVideoH264WeightedBipredIdc\x00STD_VIDEO_H264_WEIGHTED_BIPRED_IDC_DEFAULT,STD_VIDEO_H264_WEIGHTED_BIPRED_IDC_EXPLICIT,STD_VIDEO_H264_WEIGHTED_BIPRED_IDC_IMPLICIT,STD_VIDEO_H264_WEIGHTED_BIPRED_IDC_INVALID,STD_VIDEO_H264_WEIGHTED_BIPRED_IDC_MAX_ENUM',b'\x00\x00\x0B\x34\x00\x00\x00\x16StdVideoH265AspectRatioIdc\x00STD_VIDEO_H265_ASPECT_RATIO_IDC_UNSPECIFIED,STD_VIDEO_H265_ASPECT_RATIO_IDC_SQUARE,STD_VIDEO_H265_ASPECT_RATIO_IDC_12_11,STD_VIDEO_H265_ASPECT_RATIO_IDC_10_11,STD_VIDEO_H265_ASPECT_RATIO_IDC_16_11,STD_VIDEO_H265_ASPECT_RATIO_IDC_40_33,STD_VIDEO_H265_ASPECT_RATIO_IDC_24_11,STD_VIDEO_H265_ASPECT_RATIO_IDC_20_11,STD_VIDEO_H265_ASPECT_RATIO_IDC_32_11,STD_VIDEO_H265_ASPECT_RATIO_IDC_80_33,STD_VIDEO_H265_ASPECT_RATIO_IDC_18_11,STD_VIDEO_H265_ASPECT_RATIO_IDC_15_11,STD_VIDEO_H265_ASPECT_RATIO_IDC_64_33,STD_VIDEO_H265_ASPECT_RATIO_IDC_160_99,STD_VIDEO_H265_ASPECT_RATIO_IDC_4_3,STD_VIDEO_H265_ASPECT_RATIO_IDC_3_2,STD_VIDEO_H265_ASPECT_RATIO_IDC_2_1,STD_VIDEO_H265_ASPECT_RATIO_IDC_EXTENDED_SAR,STD_VIDEO_H265_ASPECT_RATIO_IDC_INVALID,STD_VIDEO_H265_ASPECT_RATIO_IDC_MAX_ENUM',b'\x00\x00\x0B\x35\x00\x00\x00\x16StdVideoH265ChromaFormatIdc\x00STD_VIDEO_H265_CHROMA_FORMAT_IDC_MONOCHROME,STD_VIDEO_H265_CHROMA_FORMAT_IDC_420,STD_VIDEO_H265_CHROMA_FORMAT_IDC_422,STD_VIDEO_H265_CHROMA_FORMAT_IDC_444,STD_VIDEO_H265_CHROMA_FORMAT_IDC_INVALID,STD_VIDEO_H265_CHROMA_FORMAT_IDC_MAX_ENUM',b'\x00\x00\x0B\x3B\x00\x00\x00\x16StdVideoH265LevelIdc\x00STD_VIDEO_H265_LEVEL_IDC_1_0,STD_VIDEO_H265_LEVEL_IDC_2_0,STD_VIDEO_H265_LEVEL_IDC_2_1,STD_VIDEO_H265_LEVEL_IDC_3_0,STD_VIDEO_H265_LEVEL_IDC_3_1,STD_VIDEO_H265_LEVEL_IDC_4_0,STD_VIDEO_H265_LEVEL_IDC_4_1,STD_VIDEO_H265_LEVEL_IDC_5_0,STD_VIDEO_H265_LEVEL_IDC_5_1,STD_VIDEO_H265_LEVEL_IDC_5_2,STD_VIDEO_H265_LEVEL_IDC_6_0,STD_VIDEO_H265_LEVEL_IDC_6_1,STD_VIDEO_H265_LEVEL_IDC_6_2,STD_VIDEO_H265_LEVEL_IDC_INVALID,STD_VIDEO_H265_LEVEL_IDC_MAX_ENUM',b'\x00\x00\x0B\x40\x00\x00\x00\x16StdVideoH265PictureType\x00STD_VIDEO_H265_PICTURE_TYPE_P,STD_VIDEO_H265_PICTURE_TYPE_B,STD_VIDEO_H265_PICTURE_TYPE_I,STD_VIDEO_H265_PICTURE_TYPE_IDR,STD_VIDEO_H265_PICTURE_TYPE_INVALID,STD_VIDEO_H265_PICTURE_TYPE_MAX_ENUM',b'\x00\x00\x0B\x44\x00\x00\x00\x16StdVideoH265ProfileIdc\x00STD_VIDEO_H265_PROFILE_IDC_MAIN,STD_VIDEO_H265_PROFILE_IDC_MAIN_10,STD_VIDEO_H265_PROFILE_IDC_MAIN_STILL_PICTURE,STD_VIDEO_H265_PROFILE_IDC_FORMAT_RANGE_EXTENSIONS,STD_VIDEO_H265_PROFILE_IDC_SCC_EXTENSIONS,STD_VIDEO_H265_PROFILE_IDC_INVALID,STD_VIDEO_H265_PROFILE_IDC_MAX_ENUM',b'\x00\x00\x0B\x51\x00\x00\x00\x16StdVideoH265SliceType\x00STD_VIDEO_H265_SLICE_TYPE_B,STD_VIDEO_H265_SLICE_TYPE_P,STD_VIDEO_H265_SLICE_TYPE_I,STD_VIDEO_H265_SLICE_TYPE_INVALID,STD_VIDEO_H265_SLICE_TYPE_MAX_ENUM',b'\x00\x00\x08\x89\x00\x00\x00\x16VkAccelerationStructureBuildTypeKHR\x00VK_ACCELERATION_STRUCTURE_BUILD_TYPE_HOST_KHR,VK_ACCELERATION_STRUCTURE_BUILD_TYPE_DEVICE_KHR,VK_ACCELERATION_STRUCTURE_BUILD_TYPE_HOST_OR_DEVICE_KHR,VK_ACCELERATION_STRUCTURE_BUILD_TYPE_MAX_ENUM_KHR',b'\x00\x00\x0B\x5F\x00\x00\x00\x16VkAccelerationStructureCompatibilityKHR\x00VK_ACCELERATION_STRUCTURE_COMPATIBILITY_COMPATIBLE_KHR,VK_ACCELERATION_STRUCTURE_COMPATIBILITY_INCOMPATIBLE_KHR,VK_ACCELERATION_STRUCTURE_COMPATIBILITY_MAX_ENUM_KHR',b'\x00\x00\x0B\x60\x00\x00\x00\x16VkAccelerationStructureCreateFlagBitsKHR\x00VK_ACCELERATION_STRUCTURE_CREATE_DEVICE_ADDRESS_CAPTURE_REPLAY_BIT_KHR,VK_ACCELERATION_STRUCTURE_CREATE_DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT,VK_ACCELERATION_STRUCTURE_CREATE_MOTION_BIT_NV,VK_ACCELERATION_STRUCTURE_CREATE_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x0B\x70\x00\x00\x00\x16VkAccelerationStructureMemoryRequirementsTypeNV\x00VK_ACCELERATION_STRUCTURE_MEMORY_REQUIREMENTS_TYPE_OBJECT_NV,VK_ACCELERATION_STRUCTURE_MEMORY_REQUIREMENTS_TYPE_BUILD_SCRATCH_NV,VK_ACCELERATION_STRUCTURE_MEMORY_REQUIREMENTS_TYPE_UPDATE_SCRATCH_NV,VK_ACCELERATION_STRUCTURE_MEMORY_REQUIREMENTS_TYPE_MAX_ENUM_NV',b'\x00\x00\x0B\x74\x00\x00\x00\x16VkAccelerationStructureMotionInstanceTypeNV\x00VK_ACCELERATION_STRUCTURE_MOTION_INSTANCE_TYPE_STATIC_NV,VK_ACCELERATION_STRUCTURE_MOTION_INSTANCE_TYPE_MATRIX_MOTION_NV,VK_ACCELERATION_STRUCTURE_MOTION_INSTANCE_TYPE_SRT_MOTION_NV,VK_ACCELERATION_STRUCTURE_MOTION_INSTANCE_TYPE_MAX_ENUM_NV',b'\x00\x00\x0B\x77\x00\x00\x00\x16VkAccelerationStructureTypeKHR\x00VK_ACCELERATION_STRUCTURE_TYPE_TOP_LEVEL_KHR,VK_ACCELERATION_STRUCTURE_TYPE_BOTTOM_LEVEL_KHR,VK_ACCELERATION_STRUCTURE_TYPE_GENERIC_KHR,VK_ACCELERATION_STRUCTURE_TYPE_TOP_LEVEL_NV,VK_ACCELERATION_STRUCTURE_TYPE_BOTTOM_LEVEL_NV,VK_ACCELERATION_STRUCTURE_TYPE_MAX_ENUM_KHR',b'\x00\x00\x0B\x79\x00\x00\x00\x16VkAccessFlagBits\x00VK_ACCESS_INDIRECT_COMMAND_READ_BIT,VK_ACCESS_INDEX_READ_BIT,VK_ACCESS_VERTEX_ATTRIBUTE_READ_BIT,VK_ACCESS_UNIFORM_READ_BIT,VK_ACCESS_INPUT_ATTACHMENT_READ_BIT,VK_ACCESS_SHADER_READ_BIT,VK_ACCESS_SHADER_WRITE_BIT,VK_ACCESS_COLOR_ATTACHMENT_READ_BIT,VK_ACCESS_COLOR_ATTACHMENT_WRITE_BIT,VK_ACCESS_DEPTH_STENCIL_ATTACHMENT_READ_BIT,VK_ACCESS_DEPTH_STENCIL_ATTACHMENT_WRITE_BIT,VK_ACCESS_TRANSFER_READ_BIT,VK_ACCESS_TRANSFER_WRITE_BIT,VK_ACCESS_HOST_READ_BIT,VK_ACCESS_HOST_WRITE_BIT,VK_ACCESS_MEMORY_READ_BIT,VK_ACCESS_MEMORY_WRITE_BIT,VK_ACCESS_NONE,VK_ACCESS_TRANSFORM_FEEDBACK_WRITE_BIT_EXT,VK_ACCESS_TRANSFORM_FEEDBACK_COUNTER_READ_BIT_EXT,VK_ACCESS_TRANSFORM_FEEDBACK_COUNTER_WRITE_BIT_EXT,VK_ACCESS_CONDITIONAL_RENDERING_READ_BIT_EXT,VK_ACCESS_COLOR_ATTACHMENT_READ_NONCOHERENT_BIT_EXT,VK_ACCESS_ACCELERATION_STRUCTURE_READ_BIT_KHR,VK_ACCESS_ACCELERATION_STRUCTURE_WRITE_BIT_KHR,VK_ACCESS_FRAGMENT_DENSITY_MAP_READ_BIT_EXT,VK_ACCESS_FRAGMENT_SHADING_RATE_ATTACHMENT_READ_BIT_KHR,VK_ACCESS_COMMAND_PREPROCESS_READ_BIT_NV,VK_ACCESS_COMMAND_PREPROCESS_WRITE_BIT_NV,VK_ACCESS_SHADING_RATE_IMAGE_READ_BIT_NV,VK_ACCESS_ACCELERATION_STRUCTURE_READ_BIT_NV,VK_ACCESS_ACCELERATION_STRUCTURE_WRITE_BIT_NV,VK_ACCESS_NONE_KHR,VK_ACCESS_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0B\x7B\x00\x00\x00\x16VkAcquireProfilingLockFlagBitsKHR\x00VK_ACQUIRE_PROFILING_LOCK_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x0B\x8B\x00\x00\x00\x16VkAttachmentDescriptionFlagBits\x00VK_ATTACHMENT_DESCRIPTION_MAY_ALIAS_BIT,VK_ATTACHMENT_DESCRIPTION_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0B\x8D\x00\x00\x00\x16VkAttachmentLoadOp\x00VK_ATTACHMENT_LOAD_OP_LOAD,VK_ATTACHMENT_LOAD_OP_CLEAR,VK_ATTACHMENT_LOAD_OP_DONT_CARE,VK_ATTACHMENT_LOAD_OP_NONE_EXT,VK_ATTACHMENT_LOAD_OP_MAX_ENUM',b'\x00\x00\x0B\x96\x00\x00\x00\x16VkAttachmentStoreOp\x00VK_ATTACHMENT_STORE_OP_STORE,VK_ATTACHMENT_STORE_OP_DONT_CARE,VK_ATTACHMENT_STORE_OP_NONE,VK_ATTACHMENT_STORE_OP_NONE_KHR,VK_ATTACHMENT_STORE_OP_NONE_QCOM,VK_ATTACHMENT_STORE_OP_NONE_EXT,VK_ATTACHMENT_STORE_OP_MAX_ENUM',b'\x00\x00\x0B\xAA\x00\x00\x00\x16VkBlendFactor\x00VK_BLEND_FACTOR_ZERO,VK_BLEND_FACTOR_ONE,VK_BLEND_FACTOR_SRC_COLOR,VK_BLEND_FACTOR_ONE_MINUS_SRC_COLOR,VK_BLEND_FACTOR_DST_COLOR,VK_BLEND_FACTOR_ONE_MINUS_DST_COLOR,VK_BLEND_FACTOR_SRC_ALPHA,VK_BLEND_FACTOR_ONE_MINUS_SRC_ALPHA,VK_BLEND_FACTOR_DST_ALPHA,VK_BLEND_FACTOR_ONE_MINUS_DST_ALPHA,VK_BLEND_FACTOR_CONSTANT_COLOR,VK_BLEND_FACTOR_ONE_MINUS_CONSTANT_COLOR,VK_BLEND_FACTOR_CONSTANT_ALPHA,VK_BLEND_FACTOR_ONE_MINUS_CONSTANT_ALPHA,VK_BLEND_FACTOR_SRC_ALPHA_SATURATE,VK_BLEND_FACTOR_SRC1_COLOR,VK_BLEND_FACTOR_ONE_MINUS_SRC1_COLOR,VK_BLEND_FACTOR_SRC1_ALPHA,VK_BLEND_FACTOR_ONE_MINUS_SRC1_ALPHA,VK_BLEND_FACTOR_MAX_ENUM',b'\x00\x00\x0B\xAB\x00\x00\x00\x16VkBlendOp\x00VK_BLEND_OP_ADD,VK_BLEND_OP_SUBTRACT,VK_BLEND_OP_REVERSE_SUBTRACT,VK_BLEND_OP_MIN,VK_BLEND_OP_MAX,VK_BLEND_OP_ZERO_EXT,VK_BLEND_OP_SRC_EXT,VK_BLEND_OP_DST_EXT,VK_BLEND_OP_SRC_OVER_EXT,VK_BLEND_OP_DST_OVER_EXT,VK_BLEND_OP_SRC_IN_EXT,VK_BLEND_OP_DST_IN_EXT,VK_BLEND_OP_SRC_OUT_EXT,VK_BLEND_OP_DST_OUT_EXT,VK_BLEND_OP_SRC_ATOP_EXT,VK_BLEND_OP_DST_ATOP_EXT,VK_BLEND_OP_XOR_EXT,VK_BLEND_OP_MULTIPLY_EXT,VK_BLEND_OP_SCREEN_EXT,VK_BLEND_OP_OVERLAY_EXT,VK_BLEND_OP_DARKEN_EXT,VK_BLEND_OP_LIGHTEN_EXT,VK_BLEND_OP_COLORDODGE_EXT,VK_BLEND_OP_COLORBURN_EXT,VK_BLEND_OP_HARDLIGHT_EXT,VK_BLEND_OP_SOFTLIGHT_EXT,VK_BLEND_OP_DIFFERENCE_EXT,VK_BLEND_OP_EXCLUSION_EXT,VK_BLEND_OP_INVERT_EXT,VK_BLEND_OP_INVERT_RGB_EXT,VK_BLEND_OP_LINEARDODGE_EXT,VK_BLEND_OP_LINEARBURN_EXT,VK_BLEND_OP_VIVIDLIGHT_EXT,VK_BLEND_OP_LINEARLIGHT_EXT,VK_BLEND_OP_PINLIGHT_EXT,VK_BLEND_OP_HARDMIX_EXT,VK_BLEND_OP_HSL_HUE_EXT,VK_BLEND_OP_HSL_SATURATION_EXT,VK_BLEND_OP_HSL_COLOR_EXT,VK_BLEND_OP_HSL_LUMINOSITY_EXT,VK_BLEND_OP_PLUS_EXT,VK_BLEND_OP_PLUS_CLAMPED_EXT,VK_BLEND_OP_PLUS_CLAMPED_ALPHA_EXT,VK_BLEND_OP_PLUS_DARKER_EXT,VK_BLEND_OP_MINUS_EXT,VK_BLEND_OP_MINUS_CLAMPED_EXT,VK_BLEND_OP_CONTRAST_EXT,VK_BLEND_OP_INVERT_OVG_EXT,VK_BLEND_OP_RED_EXT,VK_BLEND_OP_GREEN_EXT,VK_BLEND_OP_BLUE_EXT,VK_BLEND_OP_MAX_ENUM',b'\x00\x00\x0B\xAC\x00\x00\x00\x16VkBlendOverlapEXT\x00VK_BLEND_OVERLAP_UNCORRELATED_EXT,VK_BLEND_OVERLAP_DISJOINT_EXT,VK_BLEND_OVERLAP_CONJOINT_EXT,VK_BLEND_OVERLAP_MAX_ENUM_EXT',b'\x00\x00\x0B\xAF\x00\x00\x00\x16VkBlockMatchWindowCompareModeQCOM\x00VK_BLOCK_MATCH_WINDOW_COMPARE_MODE_MIN_QCOM,VK_BLOCK_MATCH_WINDOW_COMPARE_MODE_MAX_QCOM,VK_BLOCK_MATCH_WINDOW_COMPARE_MODE_MAX_ENUM_QCOM',b'\x00\x00\x0B\xB0\x00\x00\x00\x16VkBorderColor\x00VK_BORDER_COLOR_FLOAT_TRANSPARENT_BLACK,VK_BORDER_COLOR_INT_TRANSPARENT_BLACK,VK_BORDER_COLOR_FLOAT_OPAQUE_BLACK,VK_BORDER_COLOR_INT_OPAQUE_BLACK,VK_BORDER_COLOR_FLOAT_OPAQUE_WHITE,VK_BORDER_COLOR_INT_OPAQUE_WHITE,VK_BORDER_COLOR_FLOAT_CUSTOM_EXT,VK_BORDER_COLOR_INT_CUSTOM_EXT,VK_BORDER_COLOR_MAX_ENUM',b'\x00\x00\x0B\xB5\x00\x00\x00\x16VkBufferCreateFlagBits\x00VK_BUFFER_CREATE_SPARSE_BINDING_BIT,VK_BUFFER_CREATE_SPARSE_RESIDENCY_BIT,VK_BUFFER_CREATE_SPARSE_ALIASED_BIT,VK_BUFFER_CREATE_PROTECTED_BIT,VK_BUFFER_CREATE_DEVICE_ADDRESS_CAPTURE_REPLAY_BIT,VK_BUFFER_CREATE_DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT,VK_BUFFER_CREATE_VIDEO_PROFILE_INDEPENDENT_BIT_KHR,VK_BUFFER_CREATE_DEVICE_ADDRESS_CAPTURE_REPLAY_BIT_EXT,VK_BUFFER_CREATE_DEVICE_ADDRESS_CAPTURE_REPLAY_BIT_KHR,VK_BUFFER_CREATE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0B\xC1\x00\x00\x00\x16VkBufferUsageFlagBits\x00VK_BUFFER_USAGE_TRANSFER_SRC_BIT,VK_BUFFER_USAGE_TRANSFER_DST_BIT,VK_BUFFER_USAGE_UNIFORM_TEXEL_BUFFER_BIT,VK_BUFFER_USAGE_STORAGE_TEXEL_BUFFER_BIT,VK_BUFFER_USAGE_UNIFORM_BUFFER_BIT,VK_BUFFER_USAGE_STORAGE_BUFFER_BIT,VK_BUFFER_USAGE_INDEX_BUFFER_BIT,VK_BUFFER_USAGE_VERTEX_BUFFER_BIT,VK_BUFFER_USAGE_INDIRECT_BUFFER_BIT,VK_BUFFER_USAGE_SHADER_DEVICE_ADDRESS_BIT,VK_BUFFER_USAGE_VIDEO_DECODE_SRC_BIT_KHR,VK_BUFFER_USAGE_VIDEO_DECODE_DST_BIT_KHR,VK_BUFFER_USAGE_TRANSFORM_FEEDBACK_BUFFER_BIT_EXT,VK_BUFFER_USAGE_TRANSFORM_FEEDBACK_COUNTER_BUFFER_BIT_EXT,VK_BUFFER_USAGE_CONDITIONAL_RENDERING_BIT_EXT,VK_BUFFER_USAGE_ACCELERATION_STRUCTURE_BUILD_INPUT_READ_ONLY_BIT_KHR,VK_BUFFER_USAGE_ACCELERATION_STRUCTURE_STORAGE_BIT_KHR,VK_BUFFER_USAGE_SHADER_BINDING_TABLE_BIT_KHR,VK_BUFFER_USAGE_VIDEO_ENCODE_DST_BIT_KHR,VK_BUFFER_USAGE_VIDEO_ENCODE_SRC_BIT_KHR,VK_BUFFER_USAGE_SAMPLER_DESCRIPTOR_BUFFER_BIT_EXT,VK_BUFFER_USAGE_RESOURCE_DESCRIPTOR_BUFFER_BIT_EXT,VK_BUFFER_USAGE_PUSH_DESCRIPTORS_DESCRIPTOR_BUFFER_BIT_EXT,VK_BUFFER_USAGE_MICROMAP_BUILD_INPUT_READ_ONLY_BIT_EXT,VK_BUFFER_USAGE_MICROMAP_STORAGE_BIT_EXT,VK_BUFFER_USAGE_RAY_TRACING_BIT_NV,VK_BUFFER_USAGE_SHADER_DEVICE_ADDRESS_BIT_EXT,VK_BUFFER_USAGE_SHADER_DEVICE_ADDRESS_BIT_KHR,VK_BUFFER_USAGE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0B\xC4\x00\x00\x00\x16VkBuildAccelerationStructureFlagBitsKHR\x00VK_BUILD_ACCELERATION_STRUCTURE_ALLOW_UPDATE_BIT_KHR,VK_BUILD_ACCELERATION_STRUCTURE_ALLOW_COMPACTION_BIT_KHR,VK_BUILD_ACCELERATION_STRUCTURE_PREFER_FAST_TRACE_BIT_KHR,VK_BUILD_ACCELERATION_STRUCTURE_PREFER_FAST_BUILD_BIT_KHR,VK_BUILD_ACCELERATION_STRUCTURE_LOW_MEMORY_BIT_KHR,VK_BUILD_ACCELERATION_STRUCTURE_MOTION_BIT_NV,VK_BUILD_ACCELERATION_STRUCTURE_ALLOW_OPACITY_MICROMAP_UPDATE_EXT,VK_BUILD_ACCELERATION_STRUCTURE_ALLOW_DISABLE_OPACITY_MICROMAPS_EXT,VK_BUILD_ACCELERATION_STRUCTURE_ALLOW_OPACITY_MICROMAP_DATA_UPDATE_EXT,VK_BUILD_ACCELERATION_STRUCTURE_ALLOW_DATA_ACCESS_KHR,VK_BUILD_ACCELERATION_STRUCTURE_ALLOW_UPDATE_BIT_NV,VK_BUILD_ACCELERATION_STRUCTURE_ALLOW_COMPACTION_BIT_NV,VK_BUILD_ACCELERATION_STRUCTURE_PREFER_FAST_TRACE_BIT_NV,VK_BUILD_ACCELERATION_STRUCTURE_PREFER_FAST_BUILD_BIT_NV,VK_BUILD_ACCELERATION_STRUCTURE_LOW_MEMORY_BIT_NV,VK_BUILD_ACCELERATION_STRUCTURE_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x0B\xC5\x00\x00\x00\x16VkBuildAccelerationStructureModeKHR\x00VK_BUILD_ACCELERATION_STRUCTURE_MODE_BUILD_KHR,VK_BUILD_ACCELERATION_STRUCTURE_MODE_UPDATE_KHR,VK_BUILD_ACCELERATION_STRUCTURE_MODE_MAX_ENUM_KHR',b'\x00\x00\x0B\xC6\x00\x00\x00\x16VkBuildMicromapFlagBitsEXT\x00VK_BUILD_MICROMAP_PREFER_FAST_TRACE_BIT_EXT,VK_BUILD_MICROMAP_PREFER_FAST_BUILD_BIT_EXT,VK_BUILD_MICROMAP_ALLOW_COMPACTION_BIT_EXT,VK_BUILD_MICROMAP_FLAG_BITS_MAX_ENUM_EXT',b'\x00\x00\x0B\xC7\x00\x00\x00\x16VkBuildMicromapModeEXT\x00VK_BUILD_MICROMAP_MODE_BUILD_EXT,VK_BUILD_MICROMAP_MODE_MAX_ENUM_EXT',b'\x00\x00\x0B\xCB\x00\x00\x00\x16VkChromaLocation\x00VK_CHROMA_LOCATION_COSITED_EVEN,VK_CHROMA_LOCATION_MIDPOINT,VK_CHROMA_LOCATION_COSITED_EVEN_KHR,VK_CHROMA_LOCATION_MIDPOINT_KHR,VK_CHROMA_LOCATION_MAX_ENUM',b'\x00\x00\x05\x3C\x00\x00\x00\x16VkCoarseSampleOrderTypeNV\x00VK_COARSE_SAMPLE_ORDER_TYPE_DEFAULT_NV,VK_COARSE_SAMPLE_ORDER_TYPE_CUSTOM_NV,VK_COARSE_SAMPLE_ORDER_TYPE_PIXEL_MAJOR_NV,VK_COARSE_SAMPLE_ORDER_TYPE_SAMPLE_MAJOR_NV,VK_COARSE_SAMPLE_ORDER_TYPE_MAX_ENUM_NV',b'\x00\x00\x0B\xD7\x00\x00\x00\x16VkColorComponentFlagBits\x00VK_COLOR_COMPONENT_R_BIT,VK_COLOR_COMPONENT_G_BIT,VK_COLOR_COMPONENT_B_BIT,VK_COLOR_COMPONENT_A_BIT,VK_COLOR_COMPONENT_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0B\xD8\x00\x00\x00\x16VkColorSpaceKHR\x00VK_COLOR_SPACE_SRGB_NONLINEAR_KHR,VK_COLOR_SPACE_DISPLAY_P3_NONLINEAR_EXT,VK_COLOR_SPACE_EXTENDED_SRGB_LINEAR_EXT,VK_COLOR_SPACE_DISPLAY_P3_LINEAR_EXT,VK_COLOR_SPACE_DCI_P3_NONLINEAR_EXT,VK_COLOR_SPACE_BT709_LINEAR_EXT,VK_COLOR_SPACE_BT709_NONLINEAR_EXT,VK_COLOR_SPACE_BT2020_LINEAR_EXT,VK_COLOR_SPACE_HDR10_ST2084_EXT,VK_COLOR_SPACE_DOLBYVISION_EXT,VK_COLOR_SPACE_HDR10_HLG_EXT,VK_COLOR_SPACE_ADOBERGB_LINEAR_EXT,VK_COLOR_SPACE_ADOBERGB_NONLINEAR_EXT,VK_COLOR_SPACE_PASS_THROUGH_EXT,VK_COLOR_SPACE_EXTENDED_SRGB_NONLINEAR_EXT,VK_COLOR_SPACE_DISPLAY_NATIVE_AMD,VK_COLORSPACE_SRGB_NONLINEAR_KHR,VK_COLOR_SPACE_DCI_P3_LINEAR_EXT,VK_COLOR_SPACE_MAX_ENUM_KHR',b'\x00\x00\x0B\xE1\x00\x00\x00\x16VkCommandBufferLevel\x00VK_COMMAND_BUFFER_LEVEL_PRIMARY,VK_COMMAND_BUFFER_LEVEL_SECONDARY,VK_COMMAND_BUFFER_LEVEL_MAX_ENUM',b'\x00\x00\x0B\xE2\x00\x00\x00\x16VkCommandBufferResetFlagBits\x00VK_COMMAND_BUFFER_RESET_RELEASE_RESOURCES_BIT,VK_COMMAND_BUFFER_RESET_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0B\xE5\x00\x00\x00\x16VkCommandBufferUsageFlagBits\x00VK_COMMAND_BUFFER_USAGE_ONE_TIME_SUBMIT_BIT,VK_COMMAND_BUFFER_USAGE_RENDER_PASS_CONTINUE_BIT,VK_COMMAND_BUFFER_USAGE_SIMULTANEOUS_USE_BIT,VK_COMMAND_BUFFER_USAGE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0B\xE6\x00\x00\x00\x16VkCommandPoolCreateFlagBits\x00VK_COMMAND_POOL_CREATE_TRANSIENT_BIT,VK_COMMAND_POOL_CREATE_RESET_COMMAND_BUFFER_BIT,VK_COMMAND_POOL_CREATE_PROTECTED_BIT,VK_COMMAND_POOL_CREATE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0B\xE8\x00\x00\x00\x16VkCommandPoolResetFlagBits\x00VK_COMMAND_POOL_RESET_RELEASE_RESOURCES_BIT,VK_COMMAND_POOL_RESET_FLAG_BITS_MAX_ENUM',b'\x00\x00\x05\x42\x00\x00\x00\x16VkCompareOp\x00VK_COMPARE_OP_NEVER,VK_COMPARE_OP_LESS,VK_COMPARE_OP_EQUAL,VK_COMPARE_OP_LESS_OR_EQUAL,VK_COMPARE_OP_GREATER,VK_COMPARE_OP_NOT_EQUAL,VK_COMPARE_OP_GREATER_OR_EQUAL,VK_COMPARE_OP_ALWAYS,VK_COMPARE_OP_MAX_ENUM',b'\x00\x00\x0B\xEA\x00\x00\x00\x16VkComponentSwizzle\x00VK_COMPONENT_SWIZZLE_IDENTITY,VK_COMPONENT_SWIZZLE_ZERO,VK_COMPONENT_SWIZZLE_ONE,VK_COMPONENT_SWIZZLE_R,VK_COMPONENT_SWIZZLE_G,VK_COMPONENT_SWIZZLE_B,VK_COMPONENT_SWIZZLE_A,VK_COMPONENT_SWIZZLE_MAX_ENUM',b'\x00\x00\x0B\xEB\x00\x00\x00\x16VkComponentTypeKHR\x00VK_COMPONENT_TYPE_FLOAT16_KHR,VK_COMPONENT_TYPE_FLOAT32_KHR,VK_COMPONENT_TYPE_FLOAT64_KHR,VK_COMPONENT_TYPE_SINT8_KHR,VK_COMPONENT_TYPE_SINT16_KHR,VK_COMPONENT_TYPE_SINT32_KHR,VK_COMPONENT_TYPE_SINT64_KHR,VK_COMPONENT_TYPE_UINT8_KHR,VK_COMPONENT_TYPE_UINT16_KHR,VK_COMPONENT_TYPE_UINT32_KHR,VK_COMPONENT_TYPE_UINT64_KHR,VK_COMPONENT_TYPE_FLOAT16_NV,VK_COMPONENT_TYPE_FLOAT32_NV,VK_COMPONENT_TYPE_FLOAT64_NV,VK_COMPONENT_TYPE_SINT8_NV,VK_COMPONENT_TYPE_SINT16_NV,VK_COMPONENT_TYPE_SINT32_NV,VK_COMPONENT_TYPE_SINT64_NV,VK_COMPONENT_TYPE_UINT8_NV,VK_COMPONENT_TYPE_UINT16_NV,VK_COMPONENT_TYPE_UINT32_NV,VK_COMPONENT_TYPE_UINT64_NV,VK_COMPONENT_TYPE_MAX_ENUM_KHR',b'\x00\x00\x0B\xEC\x00\x00\x00\x16VkCompositeAlphaFlagBitsKHR\x00VK_COMPOSITE_ALPHA_OPAQUE_BIT_KHR,VK_COMPOSITE_ALPHA_PRE_MULTIPLIED_BIT_KHR,VK_COMPOSITE_ALPHA_POST_MULTIPLIED_BIT_KHR,VK_COMPOSITE_ALPHA_INHERIT_BIT_KHR,VK_COMPOSITE_ALPHA_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x0B\xF0\x00\x00\x00\x16VkConditionalRenderingFlagBitsEXT\x00VK_CONDITIONAL_RENDERING_INVERTED_BIT_EXT,VK_CONDITIONAL_RENDERING_FLAG_BITS_MAX_ENUM_EXT',b'\x00\x00\x05\x4A\x00\x00\x00\x16VkConservativeRasterizationModeEXT\x00VK_CONSERVATIVE_RASTERIZATION_MODE_DISABLED_EXT,VK_CONSERVATIVE_RASTERIZATION_MODE_OVERESTIMATE_EXT,VK_CONSERVATIVE_RASTERIZATION_MODE_UNDERESTIMATE_EXT,VK_CONSERVATIVE_RASTERIZATION_MODE_MAX_ENUM_EXT',b'\x00\x00\x06\x74\x00\x00\x00\x16VkCopyAccelerationStructureModeKHR\x00VK_COPY_ACCELERATION_STRUCTURE_MODE_CLONE_KHR,VK_COPY_ACCELERATION_STRUCTURE_MODE_COMPACT_KHR,VK_COPY_ACCELERATION_STRUCTURE_MODE_SERIALIZE_KHR,VK_COPY_ACCELERATION_STRUCTURE_MODE_DESERIALIZE_KHR,VK_COPY_ACCELERATION_STRUCTURE_MODE_CLONE_NV,VK_COPY_ACCELERATION_STRUCTURE_MODE_COMPACT_NV,VK_COPY_ACCELERATION_STRUCTURE_MODE_MAX_ENUM_KHR',b'\x00\x00\x0C\x04\x00\x00\x00\x16VkCopyMicromapModeEXT\x00VK_COPY_MICROMAP_MODE_CLONE_EXT,VK_COPY_MICROMAP_MODE_SERIALIZE_EXT,VK_COPY_MICROMAP_MODE_DESERIALIZE_EXT,VK_COPY_MICROMAP_MODE_COMPACT_EXT,VK_COPY_MICROMAP_MODE_MAX_ENUM_EXT',b'\x00\x00\x05\x76\x00\x00\x00\x16VkCoverageModulationModeNV\x00VK_COVERAGE_MODULATION_MODE_NONE_NV,VK_COVERAGE_MODULATION_MODE_RGB_NV,VK_COVERAGE_MODULATION_MODE_ALPHA_NV,VK_COVERAGE_MODULATION_MODE_RGBA_NV,VK_COVERAGE_MODULATION_MODE_MAX_ENUM_NV',b'\x00\x00\x05\x7A\x00\x00\x00\x16VkCoverageReductionModeNV\x00VK_COVERAGE_REDUCTION_MODE_MERGE_NV,VK_COVERAGE_REDUCTION_MODE_TRUNCATE_NV,VK_COVERAGE_REDUCTION_MODE_MAX_ENUM_NV',b'\x00\x00\x0C\x09\x00\x00\x00\x16VkCubicFilterWeightsQCOM\x00VK_CUBIC_FILTER_WEIGHTS_CATMULL_ROM_QCOM,VK_CUBIC_FILTER_WEIGHTS_ZERO_TANGENT_CARDINAL_QCOM,VK_CUBIC_FILTER_WEIGHTS_B_SPLINE_QCOM,VK_CUBIC_FILTER_WEIGHTS_MITCHELL_NETRAVALI_QCOM,VK_CUBIC_FILTER_WEIGHTS_MAX_ENUM_QCOM',b'\x00\x00\x0C\x0D\x00\x00\x00\x16VkCullModeFlagBits\x00VK_CULL_MODE_NONE,VK_CULL_MODE_FRONT_BIT,VK_CULL_MODE_BACK_BIT,VK_CULL_MODE_FRONT_AND_BACK,VK_CULL_MODE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0C\x13\x00\x00\x00\x16VkDebugReportFlagBitsEXT\x00VK_DEBUG_REPORT_INFORMATION_BIT_EXT,VK_DEBUG_REPORT_WARNING_BIT_EXT,VK_DEBUG_REPORT_PERFORMANCE_WARNING_BIT_EXT,VK_DEBUG_REPORT_ERROR_BIT_EXT,VK_DEBUG_REPORT_DEBUG_BIT_EXT,VK_DEBUG_REPORT_FLAG_BITS_MAX_ENUM_EXT',b'\x00\x00\x04\xF1\x00\x00\x00\x16VkDebugReportObjectTypeEXT\x00VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_INSTANCE_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_PHYSICAL_DEVICE_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_QUEUE_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_SEMAPHORE_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_BUFFER_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_FENCE_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_MEMORY_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_EVENT_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_QUERY_POOL_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_VIEW_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_VIEW_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_SHADER_MODULE_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_CACHE_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_LAYOUT_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_RENDER_PASS_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_SAMPLER_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_POOL_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_FRAMEBUFFER_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_POOL_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_SURFACE_KHR_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_SWAPCHAIN_KHR_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_DEBUG_REPORT_CALLBACK_EXT_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_KHR_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_MODE_KHR_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_VALIDATION_CACHE_EXT_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_SAMPLER_YCBCR_CONVERSION_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_UPDATE_TEMPLATE_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_CU_MODULE_NVX_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_CU_FUNCTION_NVX_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_ACCELERATION_STRUCTURE_KHR_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_ACCELERATION_STRUCTURE_NV_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_CUDA_MODULE_NV_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_CUDA_FUNCTION_NV_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_COLLECTION_FUCHSIA_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_DEBUG_REPORT_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_VALIDATION_CACHE_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_UPDATE_TEMPLATE_KHR_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_SAMPLER_YCBCR_CONVERSION_KHR_EXT,VK_DEBUG_REPORT_OBJECT_TYPE_MAX_ENUM_EXT',b'\x00\x00\x04\xCD\x00\x00\x00\x16VkDebugUtilsMessageSeverityFlagBitsEXT\x00VK_DEBUG_UTILS_MESSAGE_SEVERITY_VERBOSE_BIT_EXT,VK_DEBUG_UTILS_MESSAGE_SEVERITY_INFO_BIT_EXT,VK_DEBUG_UTILS_MESSAGE_SEVERITY_WARNING_BIT_EXT,VK_DEBUG_UTILS_MESSAGE_SEVERITY_ERROR_BIT_EXT,VK_DEBUG_UTILS_MESSAGE_SEVERITY_FLAG_BITS_MAX_ENUM_EXT',b'\x00\x00\x0C\x15\x00\x00\x00\x16VkDebugUtilsMessageTypeFlagBitsEXT\x00VK_DEBUG_UTILS_MESSAGE_TYPE_GENERAL_BIT_EXT,VK_DEBUG_UTILS_MESSAGE_TYPE_VALIDATION_BIT_EXT,VK_DEBUG_UTILS_MESSAGE_TYPE_PERFORMANCE_BIT_EXT,VK_DEBUG_UTILS_MESSAGE_TYPE_DEVICE_ADDRESS_BINDING_BIT_EXT,VK_DEBUG_UTILS_MESSAGE_TYPE_FLAG_BITS_MAX_ENUM_EXT',b'\x00\x00\x0C\x1E\x00\x00\x00\x16VkDependencyFlagBits\x00VK_DEPENDENCY_BY_REGION_BIT,VK_DEPENDENCY_DEVICE_GROUP_BIT,VK_DEPENDENCY_VIEW_LOCAL_BIT,VK_DEPENDENCY_FEEDBACK_LOOP_BIT_EXT,VK_DEPENDENCY_VIEW_LOCAL_BIT_KHR,VK_DEPENDENCY_DEVICE_GROUP_BIT_KHR,VK_DEPENDENCY_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0C\x21\x00\x00\x00\x16VkDepthBiasRepresentationEXT\x00VK_DEPTH_BIAS_REPRESENTATION_LEAST_REPRESENTABLE_VALUE_FORMAT_EXT,VK_DEPTH_BIAS_REPRESENTATION_LEAST_REPRESENTABLE_VALUE_FORCE_UNORM_EXT,VK_DEPTH_BIAS_REPRESENTATION_FLOAT_EXT,VK_DEPTH_BIAS_REPRESENTATION_MAX_ENUM_EXT',b'\x00\x00\x0C\x25\x00\x00\x00\x16VkDescriptorBindingFlagBits\x00VK_DESCRIPTOR_BINDING_UPDATE_AFTER_BIND_BIT,VK_DESCRIPTOR_BINDING_UPDATE_UNUSED_WHILE_PENDING_BIT,VK_DESCRIPTOR_BINDING_PARTIALLY_BOUND_BIT,VK_DESCRIPTOR_BINDING_VARIABLE_DESCRIPTOR_COUNT_BIT,VK_DESCRIPTOR_BINDING_UPDATE_AFTER_BIND_BIT_EXT,VK_DESCRIPTOR_BINDING_UPDATE_UNUSED_WHILE_PENDING_BIT_EXT,VK_DESCRIPTOR_BINDING_PARTIALLY_BOUND_BIT_EXT,VK_DESCRIPTOR_BINDING_VARIABLE_DESCRIPTOR_COUNT_BIT_EXT,VK_DESCRIPTOR_BINDING_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0C\x2E\x00\x00\x00\x16VkDescriptorPoolCreateFlagBits\x00VK_DESCRIPTOR_POOL_CREATE_FREE_DESCRIPTOR_SET_BIT,VK_DESCRIPTOR_POOL_CREATE_UPDATE_AFTER_BIND_BIT,VK_DESCRIPTOR_POOL_CREATE_HOST_ONLY_BIT_EXT,VK_DESCRIPTOR_POOL_CREATE_ALLOW_OVERALLOCATION_SETS_BIT_NV,VK_DESCRIPTOR_POOL_CREATE_ALLOW_OVERALLOCATION_POOLS_BIT_NV,VK_DESCRIPTOR_POOL_CREATE_UPDATE_AFTER_BIND_BIT_EXT,VK_DESCRIPTOR_POOL_CREATE_HOST_ONLY_BIT_VALVE,VK_DESCRIPTOR_POOL_CREATE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0C\x38\x00\x00\x00\x16VkDescriptorSetLayoutCreateFlagBits\x00VK_DESCRIPTOR_SET_LAYOUT_CREATE_UPDATE_AFTER_BIND_POOL_BIT,VK_DESCRIPTOR_SET_LAYOUT_CREATE_PUSH_DESCRIPTOR_BIT_KHR,VK_DESCRIPTOR_SET_LAYOUT_CREATE_DESCRIPTOR_BUFFER_BIT_EXT,VK_DESCRIPTOR_SET_LAYOUT_CREATE_EMBEDDED_IMMUTABLE_SAMPLERS_BIT_EXT,VK_DESCRIPTOR_SET_LAYOUT_CREATE_INDIRECT_BINDABLE_BIT_NV,VK_DESCRIPTOR_SET_LAYOUT_CREATE_HOST_ONLY_POOL_BIT_EXT,VK_DESCRIPTOR_SET_LAYOUT_CREATE_PER_STAGE_BIT_NV,VK_DESCRIPTOR_SET_LAYOUT_CREATE_UPDATE_AFTER_BIND_POOL_BIT_EXT,VK_DESCRIPTOR_SET_LAYOUT_CREATE_HOST_ONLY_POOL_BIT_VALVE,VK_DESCRIPTOR_SET_LAYOUT_CREATE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0C\x3F\x00\x00\x00\x16VkDescriptorType\x00VK_DESCRIPTOR_TYPE_SAMPLER,VK_DESCRIPTOR_TYPE_COMBINED_IMAGE_SAMPLER,VK_DESCRIPTOR_TYPE_SAMPLED_IMAGE,VK_DESCRIPTOR_TYPE_STORAGE_IMAGE,VK_DESCRIPTOR_TYPE_UNIFORM_TEXEL_BUFFER,VK_DESCRIPTOR_TYPE_STORAGE_TEXEL_BUFFER,VK_DESCRIPTOR_TYPE_UNIFORM_BUFFER,VK_DESCRIPTOR_TYPE_STORAGE_BUFFER,VK_DESCRIPTOR_TYPE_UNIFORM_BUFFER_DYNAMIC,VK_DESCRIPTOR_TYPE_STORAGE_BUFFER_DYNAMIC,VK_DESCRIPTOR_TYPE_INPUT_ATTACHMENT,VK_DESCRIPTOR_TYPE_INLINE_UNIFORM_BLOCK,VK_DESCRIPTOR_TYPE_ACCELERATION_STRUCTURE_KHR,VK_DESCRIPTOR_TYPE_ACCELERATION_STRUCTURE_NV,VK_DESCRIPTOR_TYPE_SAMPLE_WEIGHT_IMAGE_QCOM,VK_DESCRIPTOR_TYPE_BLOCK_MATCH_IMAGE_QCOM,VK_DESCRIPTOR_TYPE_MUTABLE_EXT,VK_DESCRIPTOR_TYPE_INLINE_UNIFORM_BLOCK_EXT,VK_DESCRIPTOR_TYPE_MUTABLE_VALVE,VK_DESCRIPTOR_TYPE_MAX_ENUM',b'\x00\x00\x0C\x43\x00\x00\x00\x16VkDescriptorUpdateTemplateType\x00VK_DESCRIPTOR_UPDATE_TEMPLATE_TYPE_DESCRIPTOR_SET,VK_DESCRIPTOR_UPDATE_TEMPLATE_TYPE_PUSH_DESCRIPTORS_KHR,VK_DESCRIPTOR_UPDATE_TEMPLATE_TYPE_DESCRIPTOR_SET_KHR,VK_DESCRIPTOR_UPDATE_TEMPLATE_TYPE_MAX_ENUM',b'\x00\x00\x0C\x45\x00\x00\x00\x16VkDeviceAddressBindingFlagBitsEXT\x00VK_DEVICE_ADDRESS_BINDING_INTERNAL_OBJECT_BIT_EXT,VK_DEVICE_ADDRESS_BINDING_FLAG_BITS_MAX_ENUM_EXT',b'\x00\x00\x0C\x46\x00\x00\x00\x16VkDeviceAddressBindingTypeEXT\x00VK_DEVICE_ADDRESS_BINDING_TYPE_BIND_EXT,VK_DEVICE_ADDRESS_BINDING_TYPE_UNBIND_EXT,VK_DEVICE_ADDRESS_BINDING_TYPE_MAX_ENUM_EXT',b'\x00\x00\x0C\x4B\x00\x00\x00\x16VkDeviceDiagnosticsConfigFlagBitsNV\x00VK_DEVICE_DIAGNOSTICS_CONFIG_ENABLE_SHADER_DEBUG_INFO_BIT_NV,VK_DEVICE_DIAGNOSTICS_CONFIG_ENABLE_RESOURCE_TRACKING_BIT_NV,VK_DEVICE_DIAGNOSTICS_CONFIG_ENABLE_AUTOMATIC_CHECKPOINTS_BIT_NV,VK_DEVICE_DIAGNOSTICS_CONFIG_ENABLE_SHADER_ERROR_REPORTING_BIT_NV,VK_DEVICE_DIAGNOSTICS_CONFIG_FLAG_BITS_MAX_ENUM_NV',b'\x00\x00\x0C\x4D\x00\x00\x00\x16VkDeviceEventTypeEXT\x00VK_DEVICE_EVENT_TYPE_DISPLAY_HOTPLUG_EXT,VK_DEVICE_EVENT_TYPE_MAX_ENUM_EXT',b'\x00\x00\x0C\x50\x00\x00\x00\x16VkDeviceFaultAddressTypeEXT\x00VK_DEVICE_FAULT_ADDRESS_TYPE_NONE_EXT,VK_DEVICE_FAULT_ADDRESS_TYPE_READ_INVALID_EXT,VK_DEVICE_FAULT_ADDRESS_TYPE_WRITE_INVALID_EXT,VK_DEVICE_FAULT_ADDRESS_TYPE_EXECUTE_INVALID_EXT,VK_DEVICE_FAULT_ADDRESS_TYPE_INSTRUCTION_POINTER_UNKNOWN_EXT,VK_DEVICE_FAULT_ADDRESS_TYPE_INSTRUCTION_POINTER_INVALID_EXT,VK_DEVICE_FAULT_ADDRESS_TYPE_INSTRUCTION_POINTER_FAULT_EXT,VK_DEVICE_FAULT_ADDRESS_TYPE_MAX_ENUM_EXT',b'\x00\x00\x0C\x53\x00\x00\x00\x16VkDeviceFaultVendorBinaryHeaderVersionEXT\x00VK_DEVICE_FAULT_VENDOR_BINARY_HEADER_VERSION_ONE_EXT,VK_DEVICE_FAULT_VENDOR_BINARY_HEADER_VERSION_MAX_ENUM_EXT',b'\x00\x00\x0C\x5C\x00\x00\x00\x16VkDeviceGroupPresentModeFlagBitsKHR\x00VK_DEVICE_GROUP_PRESENT_MODE_LOCAL_BIT_KHR,VK_DEVICE_GROUP_PRESENT_MODE_REMOTE_BIT_KHR,VK_DEVICE_GROUP_PRESENT_MODE_SUM_BIT_KHR,VK_DEVICE_GROUP_PRESENT_MODE_LOCAL_MULTI_DEVICE_BIT_KHR,VK_DEVICE_GROUP_PRESENT_MODE_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x0C\x65\x00\x00\x00\x16VkDeviceMemoryReportEventTypeEXT\x00VK_DEVICE_MEMORY_REPORT_EVENT_TYPE_ALLOCATE_EXT,VK_DEVICE_MEMORY_REPORT_EVENT_TYPE_FREE_EXT,VK_DEVICE_MEMORY_REPORT_EVENT_TYPE_IMPORT_EXT,VK_DEVICE_MEMORY_REPORT_EVENT_TYPE_UNIMPORT_EXT,VK_DEVICE_MEMORY_REPORT_EVENT_TYPE_ALLOCATION_FAILED_EXT,VK_DEVICE_MEMORY_REPORT_EVENT_TYPE_MAX_ENUM_EXT',b'\x00\x00\x0C\x69\x00\x00\x00\x16VkDeviceQueueCreateFlagBits\x00VK_DEVICE_QUEUE_CREATE_PROTECTED_BIT,VK_DEVICE_QUEUE_CREATE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0C\x72\x00\x00\x00\x16VkDirectDriverLoadingModeLUNARG\x00VK_DIRECT_DRIVER_LOADING_MODE_EXCLUSIVE_LUNARG,VK_DIRECT_DRIVER_LOADING_MODE_INCLUSIVE_LUNARG,VK_DIRECT_DRIVER_LOADING_MODE_MAX_ENUM_LUNARG',b'\x00\x00\x05\x96\x00\x00\x00\x16VkDiscardRectangleModeEXT\x00VK_DISCARD_RECTANGLE_MODE_INCLUSIVE_EXT,VK_DISCARD_RECTANGLE_MODE_EXCLUSIVE_EXT,VK_DISCARD_RECTANGLE_MODE_MAX_ENUM_EXT',b'\x00\x00\x0C\x75\x00\x00\x00\x16VkDisplayEventTypeEXT\x00VK_DISPLAY_EVENT_TYPE_FIRST_PIXEL_OUT_EXT,VK_DISPLAY_EVENT_TYPE_MAX_ENUM_EXT',b'\x00\x00\x0C\x7B\x00\x00\x00\x16VkDisplayPlaneAlphaFlagBitsKHR\x00VK_DISPLAY_PLANE_ALPHA_OPAQUE_BIT_KHR,VK_DISPLAY_PLANE_ALPHA_GLOBAL_BIT_KHR,VK_DISPLAY_PLANE_ALPHA_PER_PIXEL_BIT_KHR,VK_DISPLAY_PLANE_ALPHA_PER_PIXEL_PREMULTIPLIED_BIT_KHR,VK_DISPLAY_PLANE_ALPHA_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x0C\x82\x00\x00\x00\x16VkDisplayPowerStateEXT\x00VK_DISPLAY_POWER_STATE_OFF_EXT,VK_DISPLAY_POWER_STATE_SUSPEND_EXT,VK_DISPLAY_POWER_STATE_ON_EXT,VK_DISPLAY_POWER_STATE_MAX_ENUM_EXT',b'\x00\x00\x0C\x8B\x00\x00\x00\x16VkDriverId\x00VK_DRIVER_ID_AMD_PROPRIETARY,VK_DRIVER_ID_AMD_OPEN_SOURCE,VK_DRIVER_ID_MESA_RADV,VK_DRIVER_ID_NVIDIA_PROPRIETARY,VK_DRIVER_ID_INTEL_PROPRIETARY_WINDOWS,VK_DRIVER_ID_INTEL_OPEN_SOURCE_MESA,VK_DRIVER_ID_IMAGINATION_PROPRIETARY,VK_DRIVER_ID_QUALCOMM_PROPRIETARY,VK_DRIVER_ID_ARM_PROPRIETARY,VK_DRIVER_ID_GOOGLE_SWIFTSHADER,VK_DRIVER_ID_GGP_PROPRIETARY,VK_DRIVER_ID_BROADCOM_PROPRIETARY,VK_DRIVER_ID_MESA_LLVMPIPE,VK_DRIVER_ID_MOLTENVK,VK_DRIVER_ID_COREAVI_PROPRIETARY,VK_DRIVER_ID_JUICE_PROPRIETARY,VK_DRIVER_ID_VERISILICON_PROPRIETARY,VK_DRIVER_ID_MESA_TURNIP,VK_DRIVER_ID_MESA_V3DV,VK_DRIVER_ID_MESA_PANVK,VK_DRIVER_ID_SAMSUNG_PROPRIETARY,VK_DRIVER_ID_MESA_VENUS,VK_DRIVER_ID_MESA_DOZEN,VK_DRIVER_ID_MESA_NVK,VK_DRIVER_ID_IMAGINATION_OPEN_SOURCE_MESA,VK_DRIVER_ID_MESA_AGXV,VK_DRIVER_ID_AMD_PROPRIETARY_KHR,VK_DRIVER_ID_AMD_OPEN_SOURCE_KHR,VK_DRIVER_ID_MESA_RADV_KHR,VK_DRIVER_ID_NVIDIA_PROPRIETARY_KHR,VK_DRIVER_ID_INTEL_PROPRIETARY_WINDOWS_KHR,VK_DRIVER_ID_INTEL_OPEN_SOURCE_MESA_KHR,VK_DRIVER_ID_IMAGINATION_PROPRIETARY_KHR,VK_DRIVER_ID_QUALCOMM_PROPRIETARY_KHR,VK_DRIVER_ID_ARM_PROPRIETARY_KHR,VK_DRIVER_ID_GOOGLE_SWIFTSHADER_KHR,VK_DRIVER_ID_GGP_PROPRIETARY_KHR,VK_DRIVER_ID_BROADCOM_PROPRIETARY_KHR,VK_DRIVER_ID_MAX_ENUM',b'\x00\x00\x0C\x93\x00\x00\x00\x16VkDynamicState\x00VK_DYNAMIC_STATE_VIEWPORT,VK_DYNAMIC_STATE_SCISSOR,VK_DYNAMIC_STATE_LINE_WIDTH,VK_DYNAMIC_STATE_DEPTH_BIAS,VK_DYNAMIC_STATE_BLEND_CONSTANTS,VK_DYNAMIC_STATE_DEPTH_BOUNDS,VK_DYNAMIC_STATE_STENCIL_COMPARE_MASK,VK_DYNAMIC_STATE_STENCIL_WRITE_MASK,VK_DYNAMIC_STATE_STENCIL_REFERENCE,VK_DYNAMIC_STATE_CULL_MODE,VK_DYNAMIC_STATE_FRONT_FACE,VK_DYNAMIC_STATE_PRIMITIVE_TOPOLOGY,VK_DYNAMIC_STATE_VIEWPORT_WITH_COUNT,VK_DYNAMIC_STATE_SCISSOR_WITH_COUNT,VK_DYNAMIC_STATE_VERTEX_INPUT_BINDING_STRIDE,VK_DYNAMIC_STATE_DEPTH_TEST_ENABLE,VK_DYNAMIC_STATE_DEPTH_WRITE_ENABLE,VK_DYNAMIC_STATE_DEPTH_COMPARE_OP,VK_DYNAMIC_STATE_DEPTH_BOUNDS_TEST_ENABLE,VK_DYNAMIC_STATE_STENCIL_TEST_ENABLE,VK_DYNAMIC_STATE_STENCIL_OP,VK_DYNAMIC_STATE_RASTERIZER_DISCARD_ENABLE,VK_DYNAMIC_STATE_DEPTH_BIAS_ENABLE,VK_DYNAMIC_STATE_PRIMITIVE_RESTART_ENABLE,VK_DYNAMIC_STATE_VIEWPORT_W_SCALING_NV,VK_DYNAMIC_STATE_DISCARD_RECTANGLE_EXT,VK_DYNAMIC_STATE_DISCARD_RECTANGLE_ENABLE_EXT,VK_DYNAMIC_STATE_DISCARD_RECTANGLE_MODE_EXT,VK_DYNAMIC_STATE_SAMPLE_LOCATIONS_EXT,VK_DYNAMIC_STATE_RAY_TRACING_PIPELINE_STACK_SIZE_KHR,VK_DYNAMIC_STATE_VIEWPORT_SHADING_RATE_PALETTE_NV,VK_DYNAMIC_STATE_VIEWPORT_COARSE_SAMPLE_ORDER_NV,VK_DYNAMIC_STATE_EXCLUSIVE_SCISSOR_ENABLE_NV,VK_DYNAMIC_STATE_EXCLUSIVE_SCISSOR_NV,VK_DYNAMIC_STATE_FRAGMENT_SHADING_RATE_KHR,VK_DYNAMIC_STATE_LINE_STIPPLE_EXT,VK_DYNAMIC_STATE_VERTEX_INPUT_EXT,VK_DYNAMIC_STATE_PATCH_CONTROL_POINTS_EXT,VK_DYNAMIC_STATE_LOGIC_OP_EXT,VK_DYNAMIC_STATE_COLOR_WRITE_ENABLE_EXT,VK_DYNAMIC_STATE_TESSELLATION_DOMAIN_ORIGIN_EXT,VK_DYNAMIC_STATE_DEPTH_CLAMP_ENABLE_EXT,VK_DYNAMIC_STATE_POLYGON_MODE_EXT,VK_DYNAMIC_STATE_RASTERIZATION_SAMPLES_EXT,VK_DYNAMIC_STATE_SAMPLE_MASK_EXT,VK_DYNAMIC_STATE_ALPHA_TO_COVERAGE_ENABLE_EXT,VK_DYNAMIC_STATE_ALPHA_TO_ONE_ENABLE_EXT,VK_DYNAMIC_STATE_LOGIC_OP_ENABLE_EXT,VK_DYNAMIC_STATE_COLOR_BLEND_ENABLE_EXT,VK_DYNAMIC_STATE_COLOR_BLEND_EQUATION_EXT,VK_DYNAMIC_STATE_COLOR_WRITE_MASK_EXT,VK_DYNAMIC_STATE_RASTERIZATION_STREAM_EXT,VK_DYNAMIC_STATE_CONSERVATIVE_RASTERIZATION_MODE_EXT,VK_DYNAMIC_STATE_EXTRA_PRIMITIVE_OVERESTIMATION_SIZE_EXT,VK_DYNAMIC_STATE_DEPTH_CLIP_ENABLE_EXT,VK_DYNAMIC_STATE_SAMPLE_LOCATIONS_ENABLE_EXT,VK_DYNAMIC_STATE_COLOR_BLEND_ADVANCED_EXT,VK_DYNAMIC_STATE_PROVOKING_VERTEX_MODE_EXT,VK_DYNAMIC_STATE_LINE_RASTERIZATION_MODE_EXT,VK_DYNAMIC_STATE_LINE_STIPPLE_ENABLE_EXT,VK_DYNAMIC_STATE_DEPTH_CLIP_NEGATIVE_ONE_TO_ONE_EXT,VK_DYNAMIC_STATE_VIEWPORT_W_SCALING_ENABLE_NV,VK_DYNAMIC_STATE_VIEWPORT_SWIZZLE_NV,VK_DYNAMIC_STATE_COVERAGE_TO_COLOR_ENABLE_NV,VK_DYNAMIC_STATE_COVERAGE_TO_COLOR_LOCATION_NV,VK_DYNAMIC_STATE_COVERAGE_MODULATION_MODE_NV,VK_DYNAMIC_STATE_COVERAGE_MODULATION_TABLE_ENABLE_NV,VK_DYNAMIC_STATE_COVERAGE_MODULATION_TABLE_NV,VK_DYNAMIC_STATE_SHADING_RATE_IMAGE_ENABLE_NV,VK_DYNAMIC_STATE_REPRESENTATIVE_FRAGMENT_TEST_ENABLE_NV,VK_DYNAMIC_STATE_COVERAGE_REDUCTION_MODE_NV,VK_DYNAMIC_STATE_ATTACHMENT_FEEDBACK_LOOP_ENABLE_EXT,VK_DYNAMIC_STATE_CULL_MODE_EXT,VK_DYNAMIC_STATE_FRONT_FACE_EXT,VK_DYNAMIC_STATE_PRIMITIVE_TOPOLOGY_EXT,VK_DYNAMIC_STATE_VIEWPORT_WITH_COUNT_EXT,VK_DYNAMIC_STATE_SCISSOR_WITH_COUNT_EXT,VK_DYNAMIC_STATE_VERTEX_INPUT_BINDING_STRIDE_EXT,VK_DYNAMIC_STATE_DEPTH_TEST_ENABLE_EXT,VK_DYNAMIC_STATE_DEPTH_WRITE_ENABLE_EXT,VK_DYNAMIC_STATE_DEPTH_COMPARE_OP_EXT,VK_DYNAMIC_STATE_DEPTH_BOUNDS_TEST_ENABLE_EXT,VK_DYNAMIC_STATE_STENCIL_TEST_ENABLE_EXT,VK_DYNAMIC_STATE_STENCIL_OP_EXT,VK_DYNAMIC_STATE_RASTERIZER_DISCARD_ENABLE_EXT,VK_DYNAMIC_STATE_DEPTH_BIAS_ENABLE_EXT,VK_DYNAMIC_STATE_PRIMITIVE_RESTART_ENABLE_EXT,VK_DYNAMIC_STATE_MAX_ENUM',b'\x00\x00\x0C\x94\x00\x00\x00\x16VkEventCreateFlagBits\x00VK_EVENT_CREATE_DEVICE_ONLY_BIT,VK_EVENT_CREATE_DEVICE_ONLY_BIT_KHR,VK_EVENT_CREATE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0C\xA3\x00\x00\x00\x16VkExternalFenceFeatureFlagBits\x00VK_EXTERNAL_FENCE_FEATURE_EXPORTABLE_BIT,VK_EXTERNAL_FENCE_FEATURE_IMPORTABLE_BIT,VK_EXTERNAL_FENCE_FEATURE_EXPORTABLE_BIT_KHR,VK_EXTERNAL_FENCE_FEATURE_IMPORTABLE_BIT_KHR,VK_EXTERNAL_FENCE_FEATURE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0C\xA4\x00\x00\x00\x16VkExternalFenceHandleTypeFlagBits\x00VK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_FD_BIT,VK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_WIN32_BIT,VK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT,VK_EXTERNAL_FENCE_HANDLE_TYPE_SYNC_FD_BIT,VK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_FD_BIT_KHR,VK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_WIN32_BIT_KHR,VK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT_KHR,VK_EXTERNAL_FENCE_HANDLE_TYPE_SYNC_FD_BIT_KHR,VK_EXTERNAL_FENCE_HANDLE_TYPE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0C\xAB\x00\x00\x00\x16VkExternalMemoryFeatureFlagBits\x00VK_EXTERNAL_MEMORY_FEATURE_DEDICATED_ONLY_BIT,VK_EXTERNAL_MEMORY_FEATURE_EXPORTABLE_BIT,VK_EXTERNAL_MEMORY_FEATURE_IMPORTABLE_BIT,VK_EXTERNAL_MEMORY_FEATURE_DEDICATED_ONLY_BIT_KHR,VK_EXTERNAL_MEMORY_FEATURE_EXPORTABLE_BIT_KHR,VK_EXTERNAL_MEMORY_FEATURE_IMPORTABLE_BIT_KHR,VK_EXTERNAL_MEMORY_FEATURE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0C\xAC\x00\x00\x00\x16VkExternalMemoryFeatureFlagBitsNV\x00VK_EXTERNAL_MEMORY_FEATURE_DEDICATED_ONLY_BIT_NV,VK_EXTERNAL_MEMORY_FEATURE_EXPORTABLE_BIT_NV,VK_EXTERNAL_MEMORY_FEATURE_IMPORTABLE_BIT_NV,VK_EXTERNAL_MEMORY_FEATURE_FLAG_BITS_MAX_ENUM_NV',b'\x00\x00\x00\xC1\x00\x00\x00\x16VkExternalMemoryHandleTypeFlagBits\x00VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_FD_BIT,VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_BIT,VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT,VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_TEXTURE_BIT,VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_TEXTURE_KMT_BIT,VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D12_HEAP_BIT,VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D12_RESOURCE_BIT,VK_EXTERNAL_MEMORY_HANDLE_TYPE_DMA_BUF_BIT_EXT,VK_EXTERNAL_MEMORY_HANDLE_TYPE_ANDROID_HARDWARE_BUFFER_BIT_ANDROID,VK_EXTERNAL_MEMORY_HANDLE_TYPE_HOST_ALLOCATION_BIT_EXT,VK_EXTERNAL_MEMORY_HANDLE_TYPE_HOST_MAPPED_FOREIGN_MEMORY_BIT_EXT,VK_EXTERNAL_MEMORY_HANDLE_TYPE_ZIRCON_VMO_BIT_FUCHSIA,VK_EXTERNAL_MEMORY_HANDLE_TYPE_RDMA_ADDRESS_BIT_NV,VK_EXTERNAL_MEMORY_HANDLE_TYPE_SCREEN_BUFFER_BIT_QNX,VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_FD_BIT_KHR,VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_BIT_KHR,VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT_KHR,VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_TEXTURE_BIT_KHR,VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_TEXTURE_KMT_BIT_KHR,VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D12_HEAP_BIT_KHR,VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D12_RESOURCE_BIT_KHR,VK_EXTERNAL_MEMORY_HANDLE_TYPE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0C\xAD\x00\x00\x00\x16VkExternalMemoryHandleTypeFlagBitsNV\x00VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_BIT_NV,VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT_NV,VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_IMAGE_BIT_NV,VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_IMAGE_KMT_BIT_NV,VK_EXTERNAL_MEMORY_HANDLE_TYPE_FLAG_BITS_MAX_ENUM_NV',b'\x00\x00\x0C\xB1\x00\x00\x00\x16VkExternalSemaphoreFeatureFlagBits\x00VK_EXTERNAL_SEMAPHORE_FEATURE_EXPORTABLE_BIT,VK_EXTERNAL_SEMAPHORE_FEATURE_IMPORTABLE_BIT,VK_EXTERNAL_SEMAPHORE_FEATURE_EXPORTABLE_BIT_KHR,VK_EXTERNAL_SEMAPHORE_FEATURE_IMPORTABLE_BIT_KHR,VK_EXTERNAL_SEMAPHORE_FEATURE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0C\xB2\x00\x00\x00\x16VkExternalSemaphoreHandleTypeFlagBits\x00VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_FD_BIT,VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_WIN32_BIT,VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT,VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_D3D12_FENCE_BIT,VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_SYNC_FD_BIT,VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_ZIRCON_EVENT_BIT_FUCHSIA,VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_D3D11_FENCE_BIT,VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_FD_BIT_KHR,VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_WIN32_BIT_KHR,VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT_KHR,VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_D3D12_FENCE_BIT_KHR,VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_SYNC_FD_BIT_KHR,VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0C\xB4\x00\x00\x00\x16VkFenceCreateFlagBits\x00VK_FENCE_CREATE_SIGNALED_BIT,VK_FENCE_CREATE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0C\xB8\x00\x00\x00\x16VkFenceImportFlagBits\x00VK_FENCE_IMPORT_TEMPORARY_BIT,VK_FENCE_IMPORT_TEMPORARY_BIT_KHR,VK_FENCE_IMPORT_FLAG_BITS_MAX_ENUM',b'\x00\x00\x07\x01\x00\x00\x00\x16VkFilter\x00VK_FILTER_NEAREST,VK_FILTER_LINEAR,VK_FILTER_CUBIC_EXT,VK_FILTER_CUBIC_IMG,VK_FILTER_MAX_ENUM',b'\x00\x00\x03\xD2\x00\x00\x00\x16VkFormat\x00VK_FORMAT_UNDEFINED,VK_FORMAT_R4G4_UNORM_PACK8,VK_FORMAT_R4G4B4A4_UNORM_PACK16,VK_FORMAT_B4G4R4A4_UNORM_PACK16,VK_FORMAT_R5G6B5_UNORM_PACK16,VK_FORMAT_B5G6R5_UNORM_PACK16,VK_FORMAT_R5G5B5A1_UNORM_PACK16,VK_FORMAT_B5G5R5A1_UNORM_PACK16,VK_FORMAT_A1R5G5B5_UNORM_PACK16,VK_FORMAT_R8_UNORM,VK_FORMAT_R8_SNORM,VK_FORMAT_R8_USCALED,VK_FORMAT_R8_SSCALED,VK_FORMAT_R8_UINT,VK_FORMAT_R8_SINT,VK_FORMAT_R8_SRGB,VK_FORMAT_R8G8_UNORM,VK_FORMAT_R8G8_SNORM,VK_FORMAT_R8G8_USCALED,VK_FORMAT_R8G8_SSCALED,VK_FORMAT_R8G8_UINT,VK_FORMAT_R8G8_SINT,VK_FORMAT_R8G8_SRGB,VK_FORMAT_R8G8B8_UNORM,VK_FORMAT_R8G8B8_SNORM,VK_FORMAT_R8G8B8_USCALED,VK_FORMAT_R8G8B8_SSCALED,VK_FORMAT_R8G8B8_UINT,VK_FORMAT_R8G8B8_SINT,VK_FORMAT_R8G8B8_SRGB,VK_FORMAT_B8G8R8_UNORM,VK_FORMAT_B8G8R8_SNORM,VK_FORMAT_B8G8R8_USCALED,VK_FORMAT_B8G8R8_SSCALED,VK_FORMAT_B8G8R8_UINT,VK_FORMAT_B8G8R8_SINT,VK_FORMAT_B8G8R8_SRGB,VK_FORMAT_R8G8B8A8_UNORM,VK_FORMAT_R8G8B8A8_SNORM,VK_FORMAT_R8G8B8A8_USCALED,VK_FORMAT_R8G8B8A8_SSCALED,VK_FORMAT_R8G8B8A8_UINT,VK_FORMAT_R8G8B8A8_SINT,VK_FORMAT_R8G8B8A8_SRGB,VK_FORMAT_B8G8R8A8_UNORM,VK_FORMAT_B8G8R8A8_SNORM,VK_FORMAT_B8G8R8A8_USCALED,VK_FORMAT_B8G8R8A8_SSCALED,VK_FORMAT_B8G8R8A8_UINT,VK_FORMAT_B8G8R8A8_SINT,VK_FORMAT_B8G8R8A8_SRGB,VK_FORMAT_A8B8G8R8_UNORM_PACK32,VK_FORMAT_A8B8G8R8_SNORM_PACK32,VK_FORMAT_A8B8G8R8_USCALED_PACK32,VK_FORMAT_A8B8G8R8_SSCALED_PACK32,VK_FORMAT_A8B8G8R8_UINT_PACK32,VK_FORMAT_A8B8G8R8_SINT_PACK32,VK_FORMAT_A8B8G8R8_SRGB_PACK32,VK_FORMAT_A2R10G10B10_UNORM_PACK32,VK_FORMAT_A2R10G10B10_SNORM_PACK32,VK_FORMAT_A2R10G10B10_USCALED_PACK32,VK_FORMAT_A2R10G10B10_SSCALED_PACK32,VK_FORMAT_A2R10G10B10_UINT_PACK32,VK_FORMAT_A2R10G10B10_SINT_PACK32,VK_FORMAT_A2B10G10R10_UNORM_PACK32,VK_FORMAT_A2B10G10R10_SNORM_PACK32,VK_FORMAT_A2B10G10R10_USCALED_PACK32,VK_FORMAT_A2B10G10R10_SSCALED_PACK32,VK_FORMAT_A2B10G10R10_UINT_PACK32,VK_FORMAT_A2B10G10R10_SINT_PACK32,VK_FORMAT_R16_UNORM,VK_FORMAT_R16_SNORM,VK_FORMAT_R16_USCALED,VK_FORMAT_R16_SSCALED,VK_FORMAT_R16_UINT,VK_FORMAT_R16_SINT,VK_FORMAT_R16_SFLOAT,VK_FORMAT_R16G16_UNORM,VK_FORMAT_R16G16_SNORM,VK_FORMAT_R16G16_USCALED,VK_FORMAT_R16G16_SSCALED,VK_FORMAT_R16G16_UINT,VK_FORMAT_R16G16_SINT,VK_FORMAT_R16G16_SFLOAT,VK_FORMAT_R16G16B16_UNORM,VK_FORMAT_R16G16B16_SNORM,VK_FORMAT_R16G16B16_USCALED,VK_FORMAT_R16G16B16_SSCALED,VK_FORMAT_R16G16B16_UINT,VK_FORMAT_R16G16B16_SINT,VK_FORMAT_R16G16B16_SFLOAT,VK_FORMAT_R16G16B16A16_UNORM,VK_FORMAT_R16G16B16A16_SNORM,VK_FORMAT_R16G16B16A16_USCALED,VK_FORMAT_R16G16B16A16_SSCALED,VK_FORMAT_R16G16B16A16_UINT,VK_FORMAT_R16G16B16A16_SINT,VK_FORMAT_R16G16B16A16_SFLOAT,VK_FORMAT_R32_UINT,VK_FORMAT_R32_SINT,VK_FORMAT_R32_SFLOAT,VK_FORMAT_R32G32_UINT,VK_FORMAT_R32G32_SINT,VK_FORMAT_R32G32_SFLOAT,VK_FORMAT_R32G32B32_UINT,VK_FORMAT_R32G32B32_SINT,VK_FORMAT_R32G32B32_SFLOAT,VK_FORMAT_R32G32B32A32_UINT,VK_FORMAT_R32G32B32A32_SINT,VK_FORMAT_R32G32B32A32_SFLOAT,VK_FORMAT_R64_UINT,VK_FORMAT_R64_SINT,VK_FORMAT_R64_SFLOAT,VK_FORMAT_R64G64_UINT,VK_FORMAT_R64G64_SINT,VK_FORMAT_R64G64_SFLOAT,VK_FORMAT_R64G64B64_UINT,VK_FORMAT_R64G64B64_SINT,VK_FORMAT_R64G64B64_SFLOAT,VK_FORMAT_R64G64B64A64_UINT,VK_FORMAT_R64G64B64A64_SINT,VK_FORMAT_R64G64B64A64_SFLOAT,VK_FORMAT_B10G11R11_UFLOAT_PACK32,VK_FORMAT_E5B9G9R9_UFLOAT_PACK32,VK_FORMAT_D16_UNORM,VK_FORMAT_X8_D24_UNORM_PACK32,VK_FORMAT_D32_SFLOAT,VK_FORMAT_S8_UINT,VK_FORMAT_D16_UNORM_S8_UINT,VK_FORMAT_D24_UNORM_S8_UINT,VK_FORMAT_D32_SFLOAT_S8_UINT,VK_FORMAT_BC1_RGB_UNORM_BLOCK,VK_FORMAT_BC1_RGB_SRGB_BLOCK,VK_FORMAT_BC1_RGBA_UNORM_BLOCK,VK_FORMAT_BC1_RGBA_SRGB_BLOCK,VK_FORMAT_BC2_UNORM_BLOCK,VK_FORMAT_BC2_SRGB_BLOCK,VK_FORMAT_BC3_UNORM_BLOCK,VK_FORMAT_BC3_SRGB_BLOCK,VK_FORMAT_BC4_UNORM_BLOCK,VK_FORMAT_BC4_SNORM_BLOCK,VK_FORMAT_BC5_UNORM_BLOCK,VK_FORMAT_BC5_SNORM_BLOCK,VK_FORMAT_BC6H_UFLOAT_BLOCK,VK_FORMAT_BC6H_SFLOAT_BLOCK,VK_FORMAT_BC7_UNORM_BLOCK,VK_FORMAT_BC7_SRGB_BLOCK,VK_FORMAT_ETC2_R8G8B8_UNORM_BLOCK,VK_FORMAT_ETC2_R8G8B8_SRGB_BLOCK,VK_FORMAT_ETC2_R8G8B8A1_UNORM_BLOCK,VK_FORMAT_ETC2_R8G8B8A1_SRGB_BLOCK,VK_FORMAT_ETC2_R8G8B8A8_UNORM_BLOCK,VK_FORMAT_ETC2_R8G8B8A8_SRGB_BLOCK,VK_FORMAT_EAC_R11_UNORM_BLOCK,VK_FORMAT_EAC_R11_SNORM_BLOCK,VK_FORMAT_EAC_R11G11_UNORM_BLOCK,VK_FORMAT_EAC_R11G11_SNORM_BLOCK,VK_FORMAT_ASTC_4x4_UNORM_BLOCK,VK_FORMAT_ASTC_4x4_SRGB_BLOCK,VK_FORMAT_ASTC_5x4_UNORM_BLOCK,VK_FORMAT_ASTC_5x4_SRGB_BLOCK,VK_FORMAT_ASTC_5x5_UNORM_BLOCK,VK_FORMAT_ASTC_5x5_SRGB_BLOCK,VK_FORMAT_ASTC_6x5_UNORM_BLOCK,VK_FORMAT_ASTC_6x5_SRGB_BLOCK,VK_FORMAT_ASTC_6x6_UNORM_BLOCK,VK_FORMAT_ASTC_6x6_SRGB_BLOCK,VK_FORMAT_ASTC_8x5_UNORM_BLOCK,VK_FORMAT_ASTC_8x5_SRGB_BLOCK,VK_FORMAT_ASTC_8x6_UNORM_BLOCK,VK_FORMAT_ASTC_8x6_SRGB_BLOCK,VK_FORMAT_ASTC_8x8_UNORM_BLOCK,VK_FORMAT_ASTC_8x8_SRGB_BLOCK,VK_FORMAT_ASTC_10x5_UNORM_BLOCK,VK_FORMAT_ASTC_10x5_SRGB_BLOCK,VK_FORMAT_ASTC_10x6_UNORM_BLOCK,VK_FORMAT_ASTC_10x6_SRGB_BLOCK,VK_FORMAT_ASTC_10x8_UNORM_BLOCK,VK_FORMAT_ASTC_10x8_SRGB_BLOCK,VK_FORMAT_ASTC_10x10_UNORM_BLOCK,VK_FORMAT_ASTC_10x10_SRGB_BLOCK,VK_FORMAT_ASTC_12x10_UNORM_BLOCK,VK_FORMAT_ASTC_12x10_SRGB_BLOCK,VK_FORMAT_ASTC_12x12_UNORM_BLOCK,VK_FORMAT_ASTC_12x12_SRGB_BLOCK,VK_FORMAT_G8B8G8R8_422_UNORM,VK_FORMAT_B8G8R8G8_422_UNORM,VK_FORMAT_G8_B8_R8_3PLANE_420_UNORM,VK_FORMAT_G8_B8R8_2PLANE_420_UNORM,VK_FORMAT_G8_B8_R8_3PLANE_422_UNORM,VK_FORMAT_G8_B8R8_2PLANE_422_UNORM,VK_FORMAT_G8_B8_R8_3PLANE_444_UNORM,VK_FORMAT_R10X6_UNORM_PACK16,VK_FORMAT_R10X6G10X6_UNORM_2PACK16,VK_FORMAT_R10X6G10X6B10X6A10X6_UNORM_4PACK16,VK_FORMAT_G10X6B10X6G10X6R10X6_422_UNORM_4PACK16,VK_FORMAT_B10X6G10X6R10X6G10X6_422_UNORM_4PACK16,VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_420_UNORM_3PACK16,VK_FORMAT_G10X6_B10X6R10X6_2PLANE_420_UNORM_3PACK16,VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_422_UNORM_3PACK16,VK_FORMAT_G10X6_B10X6R10X6_2PLANE_422_UNORM_3PACK16,VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_444_UNORM_3PACK16,VK_FORMAT_R12X4_UNORM_PACK16,VK_FORMAT_R12X4G12X4_UNORM_2PACK16,VK_FORMAT_R12X4G12X4B12X4A12X4_UNORM_4PACK16,VK_FORMAT_G12X4B12X4G12X4R12X4_422_UNORM_4PACK16,VK_FORMAT_B12X4G12X4R12X4G12X4_422_UNORM_4PACK16,VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_420_UNORM_3PACK16,VK_FORMAT_G12X4_B12X4R12X4_2PLANE_420_UNORM_3PACK16,VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_422_UNORM_3PACK16,VK_FORMAT_G12X4_B12X4R12X4_2PLANE_422_UNORM_3PACK16,VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_444_UNORM_3PACK16,VK_FORMAT_G16B16G16R16_422_UNORM,VK_FORMAT_B16G16R16G16_422_UNORM,VK_FORMAT_G16_B16_R16_3PLANE_420_UNORM,VK_FORMAT_G16_B16R16_2PLANE_420_UNORM,VK_FORMAT_G16_B16_R16_3PLANE_422_UNORM,VK_FORMAT_G16_B16R16_2PLANE_422_UNORM,VK_FORMAT_G16_B16_R16_3PLANE_444_UNORM,VK_FORMAT_G8_B8R8_2PLANE_444_UNORM,VK_FORMAT_G10X6_B10X6R10X6_2PLANE_444_UNORM_3PACK16,VK_FORMAT_G12X4_B12X4R12X4_2PLANE_444_UNORM_3PACK16,VK_FORMAT_G16_B16R16_2PLANE_444_UNORM,VK_FORMAT_A4R4G4B4_UNORM_PACK16,VK_FORMAT_A4B4G4R4_UNORM_PACK16,VK_FORMAT_ASTC_4x4_SFLOAT_BLOCK,VK_FORMAT_ASTC_5x4_SFLOAT_BLOCK,VK_FORMAT_ASTC_5x5_SFLOAT_BLOCK,VK_FORMAT_ASTC_6x5_SFLOAT_BLOCK,VK_FORMAT_ASTC_6x6_SFLOAT_BLOCK,VK_FORMAT_ASTC_8x5_SFLOAT_BLOCK,VK_FORMAT_ASTC_8x6_SFLOAT_BLOCK,VK_FORMAT_ASTC_8x8_SFLOAT_BLOCK,VK_FORMAT_ASTC_10x5_SFLOAT_BLOCK,VK_FORMAT_ASTC_10x6_SFLOAT_BLOCK,VK_FORMAT_ASTC_10x8_SFLOAT_BLOCK,VK_FORMAT_ASTC_10x10_SFLOAT_BLOCK,VK_FORMAT_ASTC_12x10_SFLOAT_BLOCK,VK_FORMAT_ASTC_12x12_SFLOAT_BLOCK,VK_FORMAT_PVRTC1_2BPP_UNORM_BLOCK_IMG,VK_FORMAT_PVRTC1_4BPP_UNORM_BLOCK_IMG,VK_FORMAT_PVRTC2_2BPP_UNORM_BLOCK_IMG,VK_FORMAT_PVRTC2_4BPP_UNORM_BLOCK_IMG,VK_FORMAT_PVRTC1_2BPP_SRGB_BLOCK_IMG,VK_FORMAT_PVRTC1_4BPP_SRGB_BLOCK_IMG,VK_FORMAT_PVRTC2_2BPP_SRGB_BLOCK_IMG,VK_FORMAT_PVRTC2_4BPP_SRGB_BLOCK_IMG,VK_FORMAT_R16G16_S10_5_NV,VK_FORMAT_A1B5G5R5_UNORM_PACK16_KHR,VK_FORMAT_A8_UNORM_KHR,VK_FORMAT_ASTC_4x4_SFLOAT_BLOCK_EXT,VK_FORMAT_ASTC_5x4_SFLOAT_BLOCK_EXT,VK_FORMAT_ASTC_5x5_SFLOAT_BLOCK_EXT,VK_FORMAT_ASTC_6x5_SFLOAT_BLOCK_EXT,VK_FORMAT_ASTC_6x6_SFLOAT_BLOCK_EXT,VK_FORMAT_ASTC_8x5_SFLOAT_BLOCK_EXT,VK_FORMAT_ASTC_8x6_SFLOAT_BLOCK_EXT,VK_FORMAT_ASTC_8x8_SFLOAT_BLOCK_EXT,VK_FORMAT_ASTC_10x5_SFLOAT_BLOCK_EXT,VK_FORMAT_ASTC_10x6_SFLOAT_BLOCK_EXT,VK_FORMAT_ASTC_10x8_SFLOAT_BLOCK_EXT,VK_FORMAT_ASTC_10x10_SFLOAT_BLOCK_EXT,VK_FORMAT_ASTC_12x10_SFLOAT_BLOCK_EXT,VK_FORMAT_ASTC_12x12_SFLOAT_BLOCK_EXT,VK_FORMAT_G8B8G8R8_422_UNORM_KHR,VK_FORMAT_B8G8R8G8_422_UNORM_KHR,VK_FORMAT_G8_B8_R8_3PLANE_420_UNORM_KHR,VK_FORMAT_G8_B8R8_2PLANE_420_UNORM_KHR,VK_FORMAT_G8_B8_R8_3PLANE_422_UNORM_KHR,VK_FORMAT_G8_B8R8_2PLANE_422_UNORM_KHR,VK_FORMAT_G8_B8_R8_3PLANE_444_UNORM_KHR,VK_FORMAT_R10X6_UNORM_PACK16_KHR,VK_FORMAT_R10X6G10X6_UNORM_2PACK16_KHR,VK_FORMAT_R10X6G10X6B10X6A10X6_UNORM_4PACK16_KHR,VK_FORMAT_G10X6B10X6G10X6R10X6_422_UNORM_4PACK16_KHR,VK_FORMAT_B10X6G10X6R10X6G10X6_422_UNORM_4PACK16_KHR,VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_420_UNORM_3PACK16_KHR,VK_FORMAT_G10X6_B10X6R10X6_2PLANE_420_UNORM_3PACK16_KHR,VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_422_UNORM_3PACK16_KHR,VK_FORMAT_G10X6_B10X6R10X6_2PLANE_422_UNORM_3PACK16_KHR,VK_FORMAT_G10X6_B10X6_R10X6_3PLANE_444_UNORM_3PACK16_KHR,VK_FORMAT_R12X4_UNORM_PACK16_KHR,VK_FORMAT_R12X4G12X4_UNORM_2PACK16_KHR,VK_FORMAT_R12X4G12X4B12X4A12X4_UNORM_4PACK16_KHR,VK_FORMAT_G12X4B12X4G12X4R12X4_422_UNORM_4PACK16_KHR,VK_FORMAT_B12X4G12X4R12X4G12X4_422_UNORM_4PACK16_KHR,VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_420_UNORM_3PACK16_KHR,VK_FORMAT_G12X4_B12X4R12X4_2PLANE_420_UNORM_3PACK16_KHR,VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_422_UNORM_3PACK16_KHR,VK_FORMAT_G12X4_B12X4R12X4_2PLANE_422_UNORM_3PACK16_KHR,VK_FORMAT_G12X4_B12X4_R12X4_3PLANE_444_UNORM_3PACK16_KHR,VK_FORMAT_G16B16G16R16_422_UNORM_KHR,VK_FORMAT_B16G16R16G16_422_UNORM_KHR,VK_FORMAT_G16_B16_R16_3PLANE_420_UNORM_KHR,VK_FORMAT_G16_B16R16_2PLANE_420_UNORM_KHR,VK_FORMAT_G16_B16_R16_3PLANE_422_UNORM_KHR,VK_FORMAT_G16_B16R16_2PLANE_422_UNORM_KHR,VK_FORMAT_G16_B16_R16_3PLANE_444_UNORM_KHR,VK_FORMAT_G8_B8R8_2PLANE_444_UNORM_EXT,VK_FORMAT_G10X6_B10X6R10X6_2PLANE_444_UNORM_3PACK16_EXT,VK_FORMAT_G12X4_B12X4R12X4_2PLANE_444_UNORM_3PACK16_EXT,VK_FORMAT_G16_B16R16_2PLANE_444_UNORM_EXT,VK_FORMAT_A4R4G4B4_UNORM_PACK16_EXT,VK_FORMAT_A4B4G4R4_UNORM_PACK16_EXT,VK_FORMAT_MAX_ENUM',b'\x00\x00\x0C\xBB\x00\x00\x00\x16VkFormatFeatureFlagBits\x00VK_FORMAT_FEATURE_SAMPLED_IMAGE_BIT,VK_FORMAT_FEATURE_STORAGE_IMAGE_BIT,VK_FORMAT_FEATURE_STORAGE_IMAGE_ATOMIC_BIT,VK_FORMAT_FEATURE_UNIFORM_TEXEL_BUFFER_BIT,VK_FORMAT_FEATURE_STORAGE_TEXEL_BUFFER_BIT,VK_FORMAT_FEATURE_STORAGE_TEXEL_BUFFER_ATOMIC_BIT,VK_FORMAT_FEATURE_VERTEX_BUFFER_BIT,VK_FORMAT_FEATURE_COLOR_ATTACHMENT_BIT,VK_FORMAT_FEATURE_COLOR_ATTACHMENT_BLEND_BIT,VK_FORMAT_FEATURE_DEPTH_STENCIL_ATTACHMENT_BIT,VK_FORMAT_FEATURE_BLIT_SRC_BIT,VK_FORMAT_FEATURE_BLIT_DST_BIT,VK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_LINEAR_BIT,VK_FORMAT_FEATURE_TRANSFER_SRC_BIT,VK_FORMAT_FEATURE_TRANSFER_DST_BIT,VK_FORMAT_FEATURE_MIDPOINT_CHROMA_SAMPLES_BIT,VK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_LINEAR_FILTER_BIT,VK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_SEPARATE_RECONSTRUCTION_FILTER_BIT,VK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT_BIT,VK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT_FORCEABLE_BIT,VK_FORMAT_FEATURE_DISJOINT_BIT,VK_FORMAT_FEATURE_COSITED_CHROMA_SAMPLES_BIT,VK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_MINMAX_BIT,VK_FORMAT_FEATURE_VIDEO_DECODE_OUTPUT_BIT_KHR,VK_FORMAT_FEATURE_VIDEO_DECODE_DPB_BIT_KHR,VK_FORMAT_FEATURE_ACCELERATION_STRUCTURE_VERTEX_BUFFER_BIT_KHR,VK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_CUBIC_BIT_EXT,VK_FORMAT_FEATURE_FRAGMENT_DENSITY_MAP_BIT_EXT,VK_FORMAT_FEATURE_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR,VK_FORMAT_FEATURE_VIDEO_ENCODE_INPUT_BIT_KHR,VK_FORMAT_FEATURE_VIDEO_ENCODE_DPB_BIT_KHR,VK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_CUBIC_BIT_IMG,VK_FORMAT_FEATURE_TRANSFER_SRC_BIT_KHR,VK_FORMAT_FEATURE_TRANSFER_DST_BIT_KHR,VK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_MINMAX_BIT_EXT,VK_FORMAT_FEATURE_MIDPOINT_CHROMA_SAMPLES_BIT_KHR,VK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_LINEAR_FILTER_BIT_KHR,VK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_SEPARATE_RECONSTRUCTION_FILTER_BIT_KHR,VK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT_BIT_KHR,VK_FORMAT_FEATURE_SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT_FORCEABLE_BIT_KHR,VK_FORMAT_FEATURE_DISJOINT_BIT_KHR,VK_FORMAT_FEATURE_COSITED_CHROMA_SAMPLES_BIT_KHR,VK_FORMAT_FEATURE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0C\xC0\x00\x00\x00\x16VkFragmentShadingRateCombinerOpKHR\x00VK_FRAGMENT_SHADING_RATE_COMBINER_OP_KEEP_KHR,VK_FRAGMENT_SHADING_RATE_COMBINER_OP_REPLACE_KHR,VK_FRAGMENT_SHADING_RATE_COMBINER_OP_MIN_KHR,VK_FRAGMENT_SHADING_RATE_COMBINER_OP_MAX_KHR,VK_FRAGMENT_SHADING_RATE_COMBINER_OP_MUL_KHR,VK_FRAGMENT_SHADING_RATE_COMBINER_OP_MAX_ENUM_KHR',b'\x00\x00\x05\x9F\x00\x00\x00\x16VkFragmentShadingRateNV\x00VK_FRAGMENT_SHADING_RATE_1_INVOCATION_PER_PIXEL_NV,VK_FRAGMENT_SHADING_RATE_1_INVOCATION_PER_1X2_PIXELS_NV,VK_FRAGMENT_SHADING_RATE_1_INVOCATION_PER_2X1_PIXELS_NV,VK_FRAGMENT_SHADING_RATE_1_INVOCATION_PER_2X2_PIXELS_NV,VK_FRAGMENT_SHADING_RATE_1_INVOCATION_PER_2X4_PIXELS_NV,VK_FRAGMENT_SHADING_RATE_1_INVOCATION_PER_4X2_PIXELS_NV,VK_FRAGMENT_SHADING_RATE_1_INVOCATION_PER_4X4_PIXELS_NV,VK_FRAGMENT_SHADING_RATE_2_INVOCATIONS_PER_PIXEL_NV,VK_FRAGMENT_SHADING_RATE_4_INVOCATIONS_PER_PIXEL_NV,VK_FRAGMENT_SHADING_RATE_8_INVOCATIONS_PER_PIXEL_NV,VK_FRAGMENT_SHADING_RATE_16_INVOCATIONS_PER_PIXEL_NV,VK_FRAGMENT_SHADING_RATE_NO_INVOCATIONS_NV,VK_FRAGMENT_SHADING_RATE_MAX_ENUM_NV',b'\x00\x00\x0C\xC3\x00\x00\x00\x16VkFragmentShadingRateTypeNV\x00VK_FRAGMENT_SHADING_RATE_TYPE_FRAGMENT_SIZE_NV,VK_FRAGMENT_SHADING_RATE_TYPE_ENUMS_NV,VK_FRAGMENT_SHADING_RATE_TYPE_MAX_ENUM_NV',b'\x00\x00\x0C\xC5\x00\x00\x00\x16VkFrameBoundaryFlagBitsEXT\x00VK_FRAME_BOUNDARY_FRAME_END_BIT_EXT,VK_FRAME_BOUNDARY_FLAG_BITS_MAX_ENUM_EXT',b'\x00\x00\x0C\xC9\x00\x00\x00\x16VkFramebufferCreateFlagBits\x00VK_FRAMEBUFFER_CREATE_IMAGELESS_BIT,VK_FRAMEBUFFER_CREATE_IMAGELESS_BIT_KHR,VK_FRAMEBUFFER_CREATE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x05\xA4\x00\x00\x00\x16VkFrontFace\x00VK_FRONT_FACE_COUNTER_CLOCKWISE,VK_FRONT_FACE_CLOCKWISE,VK_FRONT_FACE_MAX_ENUM',b'\x00\x00\x0C\xCC\x00\x00\x00\x16VkFullScreenExclusiveEXT\x00VK_FULL_SCREEN_EXCLUSIVE_DEFAULT_EXT,VK_FULL_SCREEN_EXCLUSIVE_ALLOWED_EXT,VK_FULL_SCREEN_EXCLUSIVE_DISALLOWED_EXT,VK_FULL_SCREEN_EXCLUSIVE_APPLICATION_CONTROLLED_EXT,VK_FULL_SCREEN_EXCLUSIVE_MAX_ENUM_EXT',b'\x00\x00\x0C\xD1\x00\x00\x00\x16VkGeometryFlagBitsKHR\x00VK_GEOMETRY_OPAQUE_BIT_KHR,VK_GEOMETRY_NO_DUPLICATE_ANY_HIT_INVOCATION_BIT_KHR,VK_GEOMETRY_OPAQUE_BIT_NV,VK_GEOMETRY_NO_DUPLICATE_ANY_HIT_INVOCATION_BIT_NV,VK_GEOMETRY_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x0C\xD2\x00\x00\x00\x16VkGeometryInstanceFlagBitsKHR\x00VK_GEOMETRY_INSTANCE_TRIANGLE_FACING_CULL_DISABLE_BIT_KHR,VK_GEOMETRY_INSTANCE_TRIANGLE_FLIP_FACING_BIT_KHR,VK_GEOMETRY_INSTANCE_FORCE_OPAQUE_BIT_KHR,VK_GEOMETRY_INSTANCE_FORCE_NO_OPAQUE_BIT_KHR,VK_GEOMETRY_INSTANCE_FORCE_OPACITY_MICROMAP_2_STATE_EXT,VK_GEOMETRY_INSTANCE_DISABLE_OPACITY_MICROMAPS_EXT,VK_GEOMETRY_INSTANCE_TRIANGLE_FRONT_COUNTERCLOCKWISE_BIT_KHR,VK_GEOMETRY_INSTANCE_TRIANGLE_CULL_DISABLE_BIT_NV,VK_GEOMETRY_INSTANCE_TRIANGLE_FRONT_COUNTERCLOCKWISE_BIT_NV,VK_GEOMETRY_INSTANCE_FORCE_OPAQUE_BIT_NV,VK_GEOMETRY_INSTANCE_FORCE_NO_OPAQUE_BIT_NV,VK_GEOMETRY_INSTANCE_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x0C\xD6\x00\x00\x00\x16VkGeometryTypeKHR\x00VK_GEOMETRY_TYPE_TRIANGLES_KHR,VK_GEOMETRY_TYPE_AABBS_KHR,VK_GEOMETRY_TYPE_INSTANCES_KHR,VK_GEOMETRY_TYPE_TRIANGLES_NV,VK_GEOMETRY_TYPE_AABBS_NV,VK_GEOMETRY_TYPE_MAX_ENUM_KHR',b'\x00\x00\x0C\xDA\x00\x00\x00\x16VkGraphicsPipelineLibraryFlagBitsEXT\x00VK_GRAPHICS_PIPELINE_LIBRARY_VERTEX_INPUT_INTERFACE_BIT_EXT,VK_GRAPHICS_PIPELINE_LIBRARY_PRE_RASTERIZATION_SHADERS_BIT_EXT,VK_GRAPHICS_PIPELINE_LIBRARY_FRAGMENT_SHADER_BIT_EXT,VK_GRAPHICS_PIPELINE_LIBRARY_FRAGMENT_OUTPUT_INTERFACE_BIT_EXT,VK_GRAPHICS_PIPELINE_LIBRARY_FLAG_BITS_MAX_ENUM_EXT',b'\x00\x00\x0C\xE1\x00\x00\x00\x16VkHostImageCopyFlagBitsEXT\x00VK_HOST_IMAGE_COPY_MEMCPY_EXT,VK_HOST_IMAGE_COPY_FLAG_BITS_MAX_ENUM_EXT',b'\x00\x00\x0C\xE3\x00\x00\x00\x16VkImageAspectFlagBits\x00VK_IMAGE_ASPECT_COLOR_BIT,VK_IMAGE_ASPECT_DEPTH_BIT,VK_IMAGE_ASPECT_STENCIL_BIT,VK_IMAGE_ASPECT_METADATA_BIT,VK_IMAGE_ASPECT_PLANE_0_BIT,VK_IMAGE_ASPECT_PLANE_1_BIT,VK_IMAGE_ASPECT_PLANE_2_BIT,VK_IMAGE_ASPECT_NONE,VK_IMAGE_ASPECT_MEMORY_PLANE_0_BIT_EXT,VK_IMAGE_ASPECT_MEMORY_PLANE_1_BIT_EXT,VK_IMAGE_ASPECT_MEMORY_PLANE_2_BIT_EXT,VK_IMAGE_ASPECT_MEMORY_PLANE_3_BIT_EXT,VK_IMAGE_ASPECT_PLANE_0_BIT_KHR,VK_IMAGE_ASPECT_PLANE_1_BIT_KHR,VK_IMAGE_ASPECT_PLANE_2_BIT_KHR,VK_IMAGE_ASPECT_NONE_KHR,VK_IMAGE_ASPECT_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0C\xE9\x00\x00\x00\x16VkImageCompressionFixedRateFlagBitsEXT\x00VK_IMAGE_COMPRESSION_FIXED_RATE_NONE_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_1BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_2BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_3BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_4BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_5BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_6BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_7BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_8BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_9BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_10BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_11BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_12BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_13BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_14BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_15BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_16BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_17BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_18BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_19BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_20BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_21BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_22BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_23BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_24BPC_BIT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_FLAG_BITS_MAX_ENUM_EXT',b'\x00\x00\x0C\xEA\x00\x00\x00\x16VkImageCompressionFlagBitsEXT\x00VK_IMAGE_COMPRESSION_DEFAULT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_DEFAULT_EXT,VK_IMAGE_COMPRESSION_FIXED_RATE_EXPLICIT_EXT,VK_IMAGE_COMPRESSION_DISABLED_EXT,VK_IMAGE_COMPRESSION_FLAG_BITS_MAX_ENUM_EXT',b'\x00\x00\x0C\xEF\x00\x00\x00\x16VkImageCreateFlagBits\x00VK_IMAGE_CREATE_SPARSE_BINDING_BIT,VK_IMAGE_CREATE_SPARSE_RESIDENCY_BIT,VK_IMAGE_CREATE_SPARSE_ALIASED_BIT,VK_IMAGE_CREATE_MUTABLE_FORMAT_BIT,VK_IMAGE_CREATE_CUBE_COMPATIBLE_BIT,VK_IMAGE_CREATE_ALIAS_BIT,VK_IMAGE_CREATE_SPLIT_INSTANCE_BIND_REGIONS_BIT,VK_IMAGE_CREATE_2D_ARRAY_COMPATIBLE_BIT,VK_IMAGE_CREATE_BLOCK_TEXEL_VIEW_COMPATIBLE_BIT,VK_IMAGE_CREATE_EXTENDED_USAGE_BIT,VK_IMAGE_CREATE_PROTECTED_BIT,VK_IMAGE_CREATE_DISJOINT_BIT,VK_IMAGE_CREATE_CORNER_SAMPLED_BIT_NV,VK_IMAGE_CREATE_SAMPLE_LOCATIONS_COMPATIBLE_DEPTH_BIT_EXT,VK_IMAGE_CREATE_SUBSAMPLED_BIT_EXT,VK_IMAGE_CREATE_DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT,VK_IMAGE_CREATE_MULTISAMPLED_RENDER_TO_SINGLE_SAMPLED_BIT_EXT,VK_IMAGE_CREATE_2D_VIEW_COMPATIBLE_BIT_EXT,VK_IMAGE_CREATE_FRAGMENT_DENSITY_MAP_OFFSET_BIT_QCOM,VK_IMAGE_CREATE_VIDEO_PROFILE_INDEPENDENT_BIT_KHR,VK_IMAGE_CREATE_SPLIT_INSTANCE_BIND_REGIONS_BIT_KHR,VK_IMAGE_CREATE_2D_ARRAY_COMPATIBLE_BIT_KHR,VK_IMAGE_CREATE_BLOCK_TEXEL_VIEW_COMPATIBLE_BIT_KHR,VK_IMAGE_CREATE_EXTENDED_USAGE_BIT_KHR,VK_IMAGE_CREATE_DISJOINT_BIT_KHR,VK_IMAGE_CREATE_ALIAS_BIT_KHR,VK_IMAGE_CREATE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x02\x8B\x00\x00\x00\x16VkImageLayout\x00VK_IMAGE_LAYOUT_UNDEFINED,VK_IMAGE_LAYOUT_GENERAL,VK_IMAGE_LAYOUT_COLOR_ATTACHMENT_OPTIMAL,VK_IMAGE_LAYOUT_DEPTH_STENCIL_ATTACHMENT_OPTIMAL,VK_IMAGE_LAYOUT_DEPTH_STENCIL_READ_ONLY_OPTIMAL,VK_IMAGE_LAYOUT_SHADER_READ_ONLY_OPTIMAL,VK_IMAGE_LAYOUT_TRANSFER_SRC_OPTIMAL,VK_IMAGE_LAYOUT_TRANSFER_DST_OPTIMAL,VK_IMAGE_LAYOUT_PREINITIALIZED,VK_IMAGE_LAYOUT_DEPTH_READ_ONLY_STENCIL_ATTACHMENT_OPTIMAL,VK_IMAGE_LAYOUT_DEPTH_ATTACHMENT_STENCIL_READ_ONLY_OPTIMAL,VK_IMAGE_LAYOUT_DEPTH_ATTACHMENT_OPTIMAL,VK_IMAGE_LAYOUT_DEPTH_READ_ONLY_OPTIMAL,VK_IMAGE_LAYOUT_STENCIL_ATTACHMENT_OPTIMAL,VK_IMAGE_LAYOUT_STENCIL_READ_ONLY_OPTIMAL,VK_IMAGE_LAYOUT_READ_ONLY_OPTIMAL,VK_IMAGE_LAYOUT_ATTACHMENT_OPTIMAL,VK_IMAGE_LAYOUT_PRESENT_SRC_KHR,VK_IMAGE_LAYOUT_VIDEO_DECODE_DST_KHR,VK_IMAGE_LAYOUT_VIDEO_DECODE_SRC_KHR,VK_IMAGE_LAYOUT_VIDEO_DECODE_DPB_KHR,VK_IMAGE_LAYOUT_SHARED_PRESENT_KHR,VK_IMAGE_LAYOUT_FRAGMENT_DENSITY_MAP_OPTIMAL_EXT,VK_IMAGE_LAYOUT_FRAGMENT_SHADING_RATE_ATTACHMENT_OPTIMAL_KHR,VK_IMAGE_LAYOUT_VIDEO_ENCODE_DST_KHR,VK_IMAGE_LAYOUT_VIDEO_ENCODE_SRC_KHR,VK_IMAGE_LAYOUT_VIDEO_ENCODE_DPB_KHR,VK_IMAGE_LAYOUT_ATTACHMENT_FEEDBACK_LOOP_OPTIMAL_EXT,VK_IMAGE_LAYOUT_DEPTH_READ_ONLY_STENCIL_ATTACHMENT_OPTIMAL_KHR,VK_IMAGE_LAYOUT_DEPTH_ATTACHMENT_STENCIL_READ_ONLY_OPTIMAL_KHR,VK_IMAGE_LAYOUT_SHADING_RATE_OPTIMAL_NV,VK_IMAGE_LAYOUT_DEPTH_ATTACHMENT_OPTIMAL_KHR,VK_IMAGE_LAYOUT_DEPTH_READ_ONLY_OPTIMAL_KHR,VK_IMAGE_LAYOUT_STENCIL_ATTACHMENT_OPTIMAL_KHR,VK_IMAGE_LAYOUT_STENCIL_READ_ONLY_OPTIMAL_KHR,VK_IMAGE_LAYOUT_READ_ONLY_OPTIMAL_KHR,VK_IMAGE_LAYOUT_ATTACHMENT_OPTIMAL_KHR,VK_IMAGE_LAYOUT_MAX_ENUM',b'\x00\x00\x03\xD4\x00\x00\x00\x16VkImageTiling\x00VK_IMAGE_TILING_OPTIMAL,VK_IMAGE_TILING_LINEAR,VK_IMAGE_TILING_DRM_FORMAT_MODIFIER_EXT,VK_IMAGE_TILING_MAX_ENUM',b'\x00\x00\x03\xD3\x00\x00\x00\x16VkImageType\x00VK_IMAGE_TYPE_1D,VK_IMAGE_TYPE_2D,VK_IMAGE_TYPE_3D,VK_IMAGE_TYPE_MAX_ENUM',b'\x00\x00\x0D\x09\x00\x00\x00\x16VkImageUsageFlagBits\x00VK_IMAGE_USAGE_TRANSFER_SRC_BIT,VK_IMAGE_USAGE_TRANSFER_DST_BIT,VK_IMAGE_USAGE_SAMPLED_BIT,VK_IMAGE_USAGE_STORAGE_BIT,VK_IMAGE_USAGE_COLOR_ATTACHMENT_BIT,VK_IMAGE_USAGE_DEPTH_STENCIL_ATTACHMENT_BIT,VK_IMAGE_USAGE_TRANSIENT_ATTACHMENT_BIT,VK_IMAGE_USAGE_INPUT_ATTACHMENT_BIT,VK_IMAGE_USAGE_VIDEO_DECODE_DST_BIT_KHR,VK_IMAGE_USAGE_VIDEO_DECODE_SRC_BIT_KHR,VK_IMAGE_USAGE_VIDEO_DECODE_DPB_BIT_KHR,VK_IMAGE_USAGE_FRAGMENT_DENSITY_MAP_BIT_EXT,VK_IMAGE_USAGE_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR,VK_IMAGE_USAGE_HOST_TRANSFER_BIT_EXT,VK_IMAGE_USAGE_VIDEO_ENCODE_DST_BIT_KHR,VK_IMAGE_USAGE_VIDEO_ENCODE_SRC_BIT_KHR,VK_IMAGE_USAGE_VIDEO_ENCODE_DPB_BIT_KHR,VK_IMAGE_USAGE_ATTACHMENT_FEEDBACK_LOOP_BIT_EXT,VK_IMAGE_USAGE_INVOCATION_MASK_BIT_HUAWEI,VK_IMAGE_USAGE_SAMPLE_WEIGHT_BIT_QCOM,VK_IMAGE_USAGE_SAMPLE_BLOCK_MATCH_BIT_QCOM,VK_IMAGE_USAGE_SHADING_RATE_IMAGE_BIT_NV,VK_IMAGE_USAGE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0D\x0D\x00\x00\x00\x16VkImageViewCreateFlagBits\x00VK_IMAGE_VIEW_CREATE_FRAGMENT_DENSITY_MAP_DYNAMIC_BIT_EXT,VK_IMAGE_VIEW_CREATE_DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT,VK_IMAGE_VIEW_CREATE_FRAGMENT_DENSITY_MAP_DEFERRED_BIT_EXT,VK_IMAGE_VIEW_CREATE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0D\x13\x00\x00\x00\x16VkImageViewType\x00VK_IMAGE_VIEW_TYPE_1D,VK_IMAGE_VIEW_TYPE_2D,VK_IMAGE_VIEW_TYPE_3D,VK_IMAGE_VIEW_TYPE_CUBE,VK_IMAGE_VIEW_TYPE_1D_ARRAY,VK_IMAGE_VIEW_TYPE_2D_ARRAY,VK_IMAGE_VIEW_TYPE_CUBE_ARRAY,VK_IMAGE_VIEW_TYPE_MAX_ENUM',b'\x00\x00\x06\x8E\x00\x00\x00\x16VkIndexType\x00VK_INDEX_TYPE_UINT16,VK_INDEX_TYPE_UINT32,VK_INDEX_TYPE_NONE_KHR,VK_INDEX_TYPE_UINT8_EXT,VK_INDEX_TYPE_NONE_NV,VK_INDEX_TYPE_MAX_ENUM',b'\x00\x00\x0D\x22\x00\x00\x00\x16VkIndirectCommandsLayoutUsageFlagBitsNV\x00VK_INDIRECT_COMMANDS_LAYOUT_USAGE_EXPLICIT_PREPROCESS_BIT_NV,VK_INDIRECT_COMMANDS_LAYOUT_USAGE_INDEXED_SEQUENCES_BIT_NV,VK_INDIRECT_COMMANDS_LAYOUT_USAGE_UNORDERED_SEQUENCES_BIT_NV,VK_INDIRECT_COMMANDS_LAYOUT_USAGE_FLAG_BITS_MAX_ENUM_NV',b'\x00\x00\x0D\x25\x00\x00\x00\x16VkIndirectCommandsTokenTypeNV\x00VK_INDIRECT_COMMANDS_TOKEN_TYPE_SHADER_GROUP_NV,VK_INDIRECT_COMMANDS_TOKEN_TYPE_STATE_FLAGS_NV,VK_INDIRECT_COMMANDS_TOKEN_TYPE_INDEX_BUFFER_NV,VK_INDIRECT_COMMANDS_TOKEN_TYPE_VERTEX_BUFFER_NV,VK_INDIRECT_COMMANDS_TOKEN_TYPE_PUSH_CONSTANT_NV,VK_INDIRECT_COMMANDS_TOKEN_TYPE_DRAW_INDEXED_NV,VK_INDIRECT_COMMANDS_TOKEN_TYPE_DRAW_NV,VK_INDIRECT_COMMANDS_TOKEN_TYPE_DRAW_TASKS_NV,VK_INDIRECT_COMMANDS_TOKEN_TYPE_DRAW_MESH_TASKS_NV,VK_INDIRECT_COMMANDS_TOKEN_TYPE_PIPELINE_NV,VK_INDIRECT_COMMANDS_TOKEN_TYPE_DISPATCH_NV,VK_INDIRECT_COMMANDS_TOKEN_TYPE_MAX_ENUM_NV',b'\x00\x00\x0D\x26\x00\x00\x00\x16VkIndirectStateFlagBitsNV\x00VK_INDIRECT_STATE_FLAG_FRONTFACE_BIT_NV,VK_INDIRECT_STATE_FLAG_BITS_MAX_ENUM_NV',b'\x00\x00\x0D\x2A\x00\x00\x00\x16VkInstanceCreateFlagBits\x00VK_INSTANCE_CREATE_ENUMERATE_PORTABILITY_BIT_KHR,VK_INSTANCE_CREATE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0A\xC9\x00\x00\x00\x16VkInternalAllocationType\x00VK_INTERNAL_ALLOCATION_TYPE_EXECUTABLE,VK_INTERNAL_ALLOCATION_TYPE_MAX_ENUM',b'\x00\x00\x0D\x2C\x00\x00\x00\x16VkLatencyMarkerNV\x00VK_LATENCY_MARKER_SIMULATION_START_NV,VK_LATENCY_MARKER_SIMULATION_END_NV,VK_LATENCY_MARKER_RENDERSUBMIT_START_NV,VK_LATENCY_MARKER_RENDERSUBMIT_END_NV,VK_LATENCY_MARKER_PRESENT_START_NV,VK_LATENCY_MARKER_PRESENT_END_NV,VK_LATENCY_MARKER_INPUT_SAMPLE_NV,VK_LATENCY_MARKER_TRIGGER_FLASH_NV,VK_LATENCY_MARKER_OUT_OF_BAND_RENDERSUBMIT_START_NV,VK_LATENCY_MARKER_OUT_OF_BAND_RENDERSUBMIT_END_NV,VK_LATENCY_MARKER_OUT_OF_BAND_PRESENT_START_NV,VK_LATENCY_MARKER_OUT_OF_BAND_PRESENT_END_NV,VK_LATENCY_MARKER_MAX_ENUM_NV',b'\x00\x00\x0D\x36\x00\x00\x00\x16VkLayerSettingTypeEXT\x00VK_LAYER_SETTING_TYPE_BOOL32_EXT,VK_LAYER_SETTING_TYPE_INT32_EXT,VK_LAYER_SETTING_TYPE_INT64_EXT,VK_LAYER_SETTING_TYPE_UINT32_EXT,VK_LAYER_SETTING_TYPE_UINT64_EXT,VK_LAYER_SETTING_TYPE_FLOAT32_EXT,VK_LAYER_SETTING_TYPE_FLOAT64_EXT,VK_LAYER_SETTING_TYPE_STRING_EXT,VK_LAYER_SETTING_TYPE_MAX_ENUM_EXT',b'\x00\x00\x0D\x38\x00\x00\x00\x16VkLayeredDriverUnderlyingApiMSFT\x00VK_LAYERED_DRIVER_UNDERLYING_API_NONE_MSFT,VK_LAYERED_DRIVER_UNDERLYING_API_D3D12_MSFT,VK_LAYERED_DRIVER_UNDERLYING_API_MAX_ENUM_MSFT',b'\x00\x00\x05\xAC\x00\x00\x00\x16VkLineRasterizationModeEXT\x00VK_LINE_RASTERIZATION_MODE_DEFAULT_EXT,VK_LINE_RASTERIZATION_MODE_RECTANGULAR_EXT,VK_LINE_RASTERIZATION_MODE_BRESENHAM_EXT,VK_LINE_RASTERIZATION_MODE_RECTANGULAR_SMOOTH_EXT,VK_LINE_RASTERIZATION_MODE_MAX_ENUM_EXT',b'\x00\x00\x05\xB0\x00\x00\x00\x16VkLogicOp\x00VK_LOGIC_OP_CLEAR,VK_LOGIC_OP_AND,VK_LOGIC_OP_AND_REVERSE,VK_LOGIC_OP_COPY,VK_LOGIC_OP_AND_INVERTED,VK_LOGIC_OP_NO_OP,VK_LOGIC_OP_XOR,VK_LOGIC_OP_OR,VK_LOGIC_OP_NOR,VK_LOGIC_OP_EQUIVALENT,VK_LOGIC_OP_INVERT,VK_LOGIC_OP_OR_REVERSE,VK_LOGIC_OP_COPY_INVERTED,VK_LOGIC_OP_OR_INVERTED,VK_LOGIC_OP_NAND,VK_LOGIC_OP_SET,VK_LOGIC_OP_MAX_ENUM',b'\x00\x00\x0D\x3A\x00\x00\x00\x16VkMemoryAllocateFlagBits\x00VK_MEMORY_ALLOCATE_DEVICE_MASK_BIT,VK_MEMORY_ALLOCATE_DEVICE_ADDRESS_BIT,VK_MEMORY_ALLOCATE_DEVICE_ADDRESS_CAPTURE_REPLAY_BIT,VK_MEMORY_ALLOCATE_DEVICE_MASK_BIT_KHR,VK_MEMORY_ALLOCATE_DEVICE_ADDRESS_BIT_KHR,VK_MEMORY_ALLOCATE_DEVICE_ADDRESS_CAPTURE_REPLAY_BIT_KHR,VK_MEMORY_ALLOCATE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0D\x48\x00\x00\x00\x16VkMemoryHeapFlagBits\x00VK_MEMORY_HEAP_DEVICE_LOCAL_BIT,VK_MEMORY_HEAP_MULTI_INSTANCE_BIT,VK_MEMORY_HEAP_MULTI_INSTANCE_BIT_KHR,VK_MEMORY_HEAP_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0D\x4E\x00\x00\x00\x16VkMemoryOverallocationBehaviorAMD\x00VK_MEMORY_OVERALLOCATION_BEHAVIOR_DEFAULT_AMD,VK_MEMORY_OVERALLOCATION_BEHAVIOR_ALLOWED_AMD,VK_MEMORY_OVERALLOCATION_BEHAVIOR_DISALLOWED_AMD,VK_MEMORY_OVERALLOCATION_BEHAVIOR_MAX_ENUM_AMD',b'\x00\x00\x0D\x50\x00\x00\x00\x16VkMemoryPropertyFlagBits\x00VK_MEMORY_PROPERTY_DEVICE_LOCAL_BIT,VK_MEMORY_PROPERTY_HOST_VISIBLE_BIT,VK_MEMORY_PROPERTY_HOST_COHERENT_BIT,VK_MEMORY_PROPERTY_HOST_CACHED_BIT,VK_MEMORY_PROPERTY_LAZILY_ALLOCATED_BIT,VK_MEMORY_PROPERTY_PROTECTED_BIT,VK_MEMORY_PROPERTY_DEVICE_COHERENT_BIT_AMD,VK_MEMORY_PROPERTY_DEVICE_UNCACHED_BIT_AMD,VK_MEMORY_PROPERTY_RDMA_CAPABLE_BIT_NV,VK_MEMORY_PROPERTY_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0D\x5C\x00\x00\x00\x16VkMicromapCreateFlagBitsEXT\x00VK_MICROMAP_CREATE_DEVICE_ADDRESS_CAPTURE_REPLAY_BIT_EXT,VK_MICROMAP_CREATE_FLAG_BITS_MAX_ENUM_EXT',b'\x00\x00\x0D\x5F\x00\x00\x00\x16VkMicromapTypeEXT\x00VK_MICROMAP_TYPE_OPACITY_MICROMAP_EXT,VK_MICROMAP_TYPE_MAX_ENUM_EXT',b'\x00\x00\x01\x42\x00\x00\x00\x16VkObjectType\x00VK_OBJECT_TYPE_UNKNOWN,VK_OBJECT_TYPE_INSTANCE,VK_OBJECT_TYPE_PHYSICAL_DEVICE,VK_OBJECT_TYPE_DEVICE,VK_OBJECT_TYPE_QUEUE,VK_OBJECT_TYPE_SEMAPHORE,VK_OBJECT_TYPE_COMMAND_BUFFER,VK_OBJECT_TYPE_FENCE,VK_OBJECT_TYPE_DEVICE_MEMORY,VK_OBJECT_TYPE_BUFFER,VK_OBJECT_TYPE_IMAGE,VK_OBJECT_TYPE_EVENT,VK_OBJECT_TYPE_QUERY_POOL,VK_OBJECT_TYPE_BUFFER_VIEW,VK_OBJECT_TYPE_IMAGE_VIEW,VK_OBJECT_TYPE_SHADER_MODULE,VK_OBJECT_TYPE_PIPELINE_CACHE,VK_OBJECT_TYPE_PIPELINE_LAYOUT,VK_OBJECT_TYPE_RENDER_PASS,VK_OBJECT_TYPE_PIPELINE,VK_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT,VK_OBJECT_TYPE_SAMPLER,VK_OBJECT_TYPE_DESCRIPTOR_POOL,VK_OBJECT_TYPE_DESCRIPTOR_SET,VK_OBJECT_TYPE_FRAMEBUFFER,VK_OBJECT_TYPE_COMMAND_POOL,VK_OBJECT_TYPE_SAMPLER_YCBCR_CONVERSION,VK_OBJECT_TYPE_DESCRIPTOR_UPDATE_TEMPLATE,VK_OBJECT_TYPE_PRIVATE_DATA_SLOT,VK_OBJECT_TYPE_SURFACE_KHR,VK_OBJECT_TYPE_SWAPCHAIN_KHR,VK_OBJECT_TYPE_DISPLAY_KHR,VK_OBJECT_TYPE_DISPLAY_MODE_KHR,VK_OBJECT_TYPE_DEBUG_REPORT_CALLBACK_EXT,VK_OBJECT_TYPE_VIDEO_SESSION_KHR,VK_OBJECT_TYPE_VIDEO_SESSION_PARAMETERS_KHR,VK_OBJECT_TYPE_CU_MODULE_NVX,VK_OBJECT_TYPE_CU_FUNCTION_NVX,VK_OBJECT_TYPE_DEBUG_UTILS_MESSENGER_EXT,VK_OBJECT_TYPE_ACCELERATION_STRUCTURE_KHR,VK_OBJECT_TYPE_VALIDATION_CACHE_EXT,VK_OBJECT_TYPE_ACCELERATION_STRUCTURE_NV,VK_OBJECT_TYPE_PERFORMANCE_CONFIGURATION_INTEL,VK_OBJECT_TYPE_DEFERRED_OPERATION_KHR,VK_OBJECT_TYPE_INDIRECT_COMMANDS_LAYOUT_NV,VK_OBJECT_TYPE_CUDA_MODULE_NV,VK_OBJECT_TYPE_CUDA_FUNCTION_NV,VK_OBJECT_TYPE_BUFFER_COLLECTION_FUCHSIA,VK_OBJECT_TYPE_MICROMAP_EXT,VK_OBJECT_TYPE_OPTICAL_FLOW_SESSION_NV,VK_OBJECT_TYPE_SHADER_EXT,VK_OBJECT_TYPE_DESCRIPTOR_UPDATE_TEMPLATE_KHR,VK_OBJECT_TYPE_SAMPLER_YCBCR_CONVERSION_KHR,VK_OBJECT_TYPE_PRIVATE_DATA_SLOT_EXT,VK_OBJECT_TYPE_MAX_ENUM',b'\x00\x00\x0D\x72\x00\x00\x00\x16VkOpacityMicromapFormatEXT\x00VK_OPACITY_MICROMAP_FORMAT_2_STATE_EXT,VK_OPACITY_MICROMAP_FORMAT_4_STATE_EXT,VK_OPACITY_MICROMAP_FORMAT_MAX_ENUM_EXT',b'\x00\x00\x0D\x73\x00\x00\x00\x15VkOpacityMicromapSpecialIndexEXT\x00VK_OPACITY_MICROMAP_SPECIAL_INDEX_FULLY_TRANSPARENT_EXT,VK_OPACITY_MICROMAP_SPECIAL_INDEX_FULLY_OPAQUE_EXT,VK_OPACITY_MICROMAP_SPECIAL_INDEX_FULLY_UNKNOWN_TRANSPARENT_EXT,VK_OPACITY_MICROMAP_SPECIAL_INDEX_FULLY_UNKNOWN_OPAQUE_EXT,VK_OPACITY_MICROMAP_SPECIAL_INDEX_MAX_ENUM_EXT',b'\x00\x00\x0D\x75\x00\x00\x00\x16VkOpticalFlowExecuteFlagBitsNV\x00VK_OPTICAL_FLOW_EXECUTE_DISABLE_TEMPORAL_HINTS_BIT_NV,VK_OPTICAL_FLOW_EXECUTE_FLAG_BITS_MAX_ENUM_NV',b'\x00\x00\x0D\x77\x00\x00\x00\x16VkOpticalFlowGridSizeFlagBitsNV\x00VK_OPTICAL_FLOW_GRID_SIZE_UNKNOWN_NV,VK_OPTICAL_FLOW_GRID_SIZE_1X1_BIT_NV,VK_OPTICAL_FLOW_GRID_SIZE_2X2_BIT_NV,VK_OPTICAL_FLOW_GRID_SIZE_4X4_BIT_NV,VK_OPTICAL_FLOW_GRID_SIZE_8X8_BIT_NV,VK_OPTICAL_FLOW_GRID_SIZE_FLAG_BITS_MAX_ENUM_NV',b'\x00\x00\x0D\x7A\x00\x00\x00\x16VkOpticalFlowPerformanceLevelNV\x00VK_OPTICAL_FLOW_PERFORMANCE_LEVEL_UNKNOWN_NV,VK_OPTICAL_FLOW_PERFORMANCE_LEVEL_SLOW_NV,VK_OPTICAL_FLOW_PERFORMANCE_LEVEL_MEDIUM_NV,VK_OPTICAL_FLOW_PERFORMANCE_LEVEL_FAST_NV,VK_OPTICAL_FLOW_PERFORMANCE_LEVEL_MAX_ENUM_NV',b'\x00\x00\x02\x89\x00\x00\x00\x16VkOpticalFlowSessionBindingPointNV\x00VK_OPTICAL_FLOW_SESSION_BINDING_POINT_UNKNOWN_NV,VK_OPTICAL_FLOW_SESSION_BINDING_POINT_INPUT_NV,VK_OPTICAL_FLOW_SESSION_BINDING_POINT_REFERENCE_NV,VK_OPTICAL_FLOW_SESSION_BINDING_POINT_HINT_NV,VK_OPTICAL_FLOW_SESSION_BINDING_POINT_FLOW_VECTOR_NV,VK_OPTICAL_FLOW_SESSION_BINDING_POINT_BACKWARD_FLOW_VECTOR_NV,VK_OPTICAL_FLOW_SESSION_BINDING_POINT_COST_NV,VK_OPTICAL_FLOW_SESSION_BINDING_POINT_BACKWARD_COST_NV,VK_OPTICAL_FLOW_SESSION_BINDING_POINT_GLOBAL_FLOW_NV,VK_OPTICAL_FLOW_SESSION_BINDING_POINT_MAX_ENUM_NV',b'\x00\x00\x0D\x7B\x00\x00\x00\x16VkOpticalFlowSessionCreateFlagBitsNV\x00VK_OPTICAL_FLOW_SESSION_CREATE_ENABLE_HINT_BIT_NV,VK_OPTICAL_FLOW_SESSION_CREATE_ENABLE_COST_BIT_NV,VK_OPTICAL_FLOW_SESSION_CREATE_ENABLE_GLOBAL_FLOW_BIT_NV,VK_OPTICAL_FLOW_SESSION_CREATE_ALLOW_REGIONS_BIT_NV,VK_OPTICAL_FLOW_SESSION_CREATE_BOTH_DIRECTIONS_BIT_NV,VK_OPTICAL_FLOW_SESSION_CREATE_FLAG_BITS_MAX_ENUM_NV',b'\x00\x00\x0D\x7E\x00\x00\x00\x16VkOpticalFlowUsageFlagBitsNV\x00VK_OPTICAL_FLOW_USAGE_UNKNOWN_NV,VK_OPTICAL_FLOW_USAGE_INPUT_BIT_NV,VK_OPTICAL_FLOW_USAGE_OUTPUT_BIT_NV,VK_OPTICAL_FLOW_USAGE_HINT_BIT_NV,VK_OPTICAL_FLOW_USAGE_COST_BIT_NV,VK_OPTICAL_FLOW_USAGE_GLOBAL_FLOW_BIT_NV,VK_OPTICAL_FLOW_USAGE_FLAG_BITS_MAX_ENUM_NV',b'\x00\x00\x0D\x80\x00\x00\x00\x16VkOutOfBandQueueTypeNV\x00VK_OUT_OF_BAND_QUEUE_TYPE_RENDER_NV,VK_OUT_OF_BAND_QUEUE_TYPE_PRESENT_NV,VK_OUT_OF_BAND_QUEUE_TYPE_MAX_ENUM_NV',b'\x00\x00\x0D\x82\x00\x00\x00\x16VkPeerMemoryFeatureFlagBits\x00VK_PEER_MEMORY_FEATURE_COPY_SRC_BIT,VK_PEER_MEMORY_FEATURE_COPY_DST_BIT,VK_PEER_MEMORY_FEATURE_GENERIC_SRC_BIT,VK_PEER_MEMORY_FEATURE_GENERIC_DST_BIT,VK_PEER_MEMORY_FEATURE_COPY_SRC_BIT_KHR,VK_PEER_MEMORY_FEATURE_COPY_DST_BIT_KHR,VK_PEER_MEMORY_FEATURE_GENERIC_SRC_BIT_KHR,VK_PEER_MEMORY_FEATURE_GENERIC_DST_BIT_KHR,VK_PEER_MEMORY_FEATURE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0D\x84\x00\x00\x00\x16VkPerformanceConfigurationTypeINTEL\x00VK_PERFORMANCE_CONFIGURATION_TYPE_COMMAND_QUEUE_METRICS_DISCOVERY_ACTIVATED_INTEL,VK_PERFORMANCE_CONFIGURATION_TYPE_MAX_ENUM_INTEL',b'\x00\x00\x0D\x85\x00\x00\x00\x16VkPerformanceCounterDescriptionFlagBitsKHR\x00VK_PERFORMANCE_COUNTER_DESCRIPTION_PERFORMANCE_IMPACTING_BIT_KHR,VK_PERFORMANCE_COUNTER_DESCRIPTION_CONCURRENTLY_IMPACTED_BIT_KHR,VK_PERFORMANCE_COUNTER_DESCRIPTION_PERFORMANCE_IMPACTING_KHR,VK_PERFORMANCE_COUNTER_DESCRIPTION_CONCURRENTLY_IMPACTED_KHR,VK_PERFORMANCE_COUNTER_DESCRIPTION_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x0D\x89\x00\x00\x00\x16VkPerformanceCounterScopeKHR\x00VK_PERFORMANCE_COUNTER_SCOPE_COMMAND_BUFFER_KHR,VK_PERFORMANCE_COUNTER_SCOPE_RENDER_PASS_KHR,VK_PERFORMANCE_COUNTER_SCOPE_COMMAND_KHR,VK_QUERY_SCOPE_COMMAND_BUFFER_KHR,VK_QUERY_SCOPE_RENDER_PASS_KHR,VK_QUERY_SCOPE_COMMAND_KHR,VK_PERFORMANCE_COUNTER_SCOPE_MAX_ENUM_KHR',b'\x00\x00\x0D\x8A\x00\x00\x00\x16VkPerformanceCounterStorageKHR\x00VK_PERFORMANCE_COUNTER_STORAGE_INT32_KHR,VK_PERFORMANCE_COUNTER_STORAGE_INT64_KHR,VK_PERFORMANCE_COUNTER_STORAGE_UINT32_KHR,VK_PERFORMANCE_COUNTER_STORAGE_UINT64_KHR,VK_PERFORMANCE_COUNTER_STORAGE_FLOAT32_KHR,VK_PERFORMANCE_COUNTER_STORAGE_FLOAT64_KHR,VK_PERFORMANCE_COUNTER_STORAGE_MAX_ENUM_KHR',b'\x00\x00\x0D\x8B\x00\x00\x00\x16VkPerformanceCounterUnitKHR\x00VK_PERFORMANCE_COUNTER_UNIT_GENERIC_KHR,VK_PERFORMANCE_COUNTER_UNIT_PERCENTAGE_KHR,VK_PERFORMANCE_COUNTER_UNIT_NANOSECONDS_KHR,VK_PERFORMANCE_COUNTER_UNIT_BYTES_KHR,VK_PERFORMANCE_COUNTER_UNIT_BYTES_PER_SECOND_KHR,VK_PERFORMANCE_COUNTER_UNIT_KELVIN_KHR,VK_PERFORMANCE_COUNTER_UNIT_WATTS_KHR,VK_PERFORMANCE_COUNTER_UNIT_VOLTS_KHR,VK_PERFORMANCE_COUNTER_UNIT_AMPS_KHR,VK_PERFORMANCE_COUNTER_UNIT_HERTZ_KHR,VK_PERFORMANCE_COUNTER_UNIT_CYCLES_KHR,VK_PERFORMANCE_COUNTER_UNIT_MAX_ENUM_KHR',b'\x00\x00\x0D\x8E\x00\x00\x00\x16VkPerformanceOverrideTypeINTEL\x00VK_PERFORMANCE_OVERRIDE_TYPE_NULL_HARDWARE_INTEL,VK_PERFORMANCE_OVERRIDE_TYPE_FLUSH_GPU_CACHES_INTEL,VK_PERFORMANCE_OVERRIDE_TYPE_MAX_ENUM_INTEL',b'\x00\x00\x01\x54\x00\x00\x00\x16VkPerformanceParameterTypeINTEL\x00VK_PERFORMANCE_PARAMETER_TYPE_HW_COUNTERS_SUPPORTED_INTEL,VK_PERFORMANCE_PARAMETER_TYPE_STREAM_MARKER_VALID_BITS_INTEL,VK_PERFORMANCE_PARAMETER_TYPE_MAX_ENUM_INTEL',b'\x00\x00\x0D\x93\x00\x00\x00\x16VkPerformanceValueTypeINTEL\x00VK_PERFORMANCE_VALUE_TYPE_UINT32_INTEL,VK_PERFORMANCE_VALUE_TYPE_UINT64_INTEL,VK_PERFORMANCE_VALUE_TYPE_FLOAT_INTEL,VK_PERFORMANCE_VALUE_TYPE_BOOL_INTEL,VK_PERFORMANCE_VALUE_TYPE_STRING_INTEL,VK_PERFORMANCE_VALUE_TYPE_MAX_ENUM_INTEL',b'\x00\x00\x0E\x9A\x00\x00\x00\x16VkPhysicalDeviceType\x00VK_PHYSICAL_DEVICE_TYPE_OTHER,VK_PHYSICAL_DEVICE_TYPE_INTEGRATED_GPU,VK_PHYSICAL_DEVICE_TYPE_DISCRETE_GPU,VK_PHYSICAL_DEVICE_TYPE_VIRTUAL_GPU,VK_PHYSICAL_DEVICE_TYPE_CPU,VK_PHYSICAL_DEVICE_TYPE_MAX_ENUM',b'\x00\x00\x05\xB4\x00\x00\x00\x16VkPipelineBindPoint\x00VK_PIPELINE_BIND_POINT_GRAPHICS,VK_PIPELINE_BIND_POINT_COMPUTE,VK_PIPELINE_BIND_POINT_RAY_TRACING_KHR,VK_PIPELINE_BIND_POINT_SUBPASS_SHADING_HUAWEI,VK_PIPELINE_BIND_POINT_RAY_TRACING_NV,VK_PIPELINE_BIND_POINT_MAX_ENUM',b'\x00\x00\x0E\xB0\x00\x00\x00\x16VkPipelineCacheCreateFlagBits\x00VK_PIPELINE_CACHE_CREATE_EXTERNALLY_SYNCHRONIZED_BIT,VK_PIPELINE_CACHE_CREATE_EXTERNALLY_SYNCHRONIZED_BIT_EXT,VK_PIPELINE_CACHE_CREATE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0E\xB2\x00\x00\x00\x16VkPipelineCacheHeaderVersion\x00VK_PIPELINE_CACHE_HEADER_VERSION_ONE,VK_PIPELINE_CACHE_HEADER_VERSION_MAX_ENUM',b'\x00\x00\x0E\xB7\x00\x00\x00\x16VkPipelineColorBlendStateCreateFlagBits\x00VK_PIPELINE_COLOR_BLEND_STATE_CREATE_RASTERIZATION_ORDER_ATTACHMENT_ACCESS_BIT_EXT,VK_PIPELINE_COLOR_BLEND_STATE_CREATE_RASTERIZATION_ORDER_ATTACHMENT_ACCESS_BIT_ARM,VK_PIPELINE_COLOR_BLEND_STATE_CREATE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0E\xBC\x00\x00\x00\x16VkPipelineCompilerControlFlagBitsAMD\x00VK_PIPELINE_COMPILER_CONTROL_FLAG_BITS_MAX_ENUM_AMD',b'\x00\x00\x0E\xC0\x00\x00\x00\x16VkPipelineCreateFlagBits\x00VK_PIPELINE_CREATE_DISABLE_OPTIMIZATION_BIT,VK_PIPELINE_CREATE_ALLOW_DERIVATIVES_BIT,VK_PIPELINE_CREATE_DERIVATIVE_BIT,VK_PIPELINE_CREATE_VIEW_INDEX_FROM_DEVICE_INDEX_BIT,VK_PIPELINE_CREATE_DISPATCH_BASE_BIT,VK_PIPELINE_CREATE_FAIL_ON_PIPELINE_COMPILE_REQUIRED_BIT,VK_PIPELINE_CREATE_EARLY_RETURN_ON_FAILURE_BIT,VK_PIPELINE_CREATE_RENDERING_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR,VK_PIPELINE_CREATE_RENDERING_FRAGMENT_DENSITY_MAP_ATTACHMENT_BIT_EXT,VK_PIPELINE_CREATE_RAY_TRACING_NO_NULL_ANY_HIT_SHADERS_BIT_KHR,VK_PIPELINE_CREATE_RAY_TRACING_NO_NULL_CLOSEST_HIT_SHADERS_BIT_KHR,VK_PIPELINE_CREATE_RAY_TRACING_NO_NULL_MISS_SHADERS_BIT_KHR,VK_PIPELINE_CREATE_RAY_TRACING_NO_NULL_INTERSECTION_SHADERS_BIT_KHR,VK_PIPELINE_CREATE_RAY_TRACING_SKIP_TRIANGLES_BIT_KHR,VK_PIPELINE_CREATE_RAY_TRACING_SKIP_AABBS_BIT_KHR,VK_PIPELINE_CREATE_RAY_TRACING_SHADER_GROUP_HANDLE_CAPTURE_REPLAY_BIT_KHR,VK_PIPELINE_CREATE_DEFER_COMPILE_BIT_NV,VK_PIPELINE_CREATE_CAPTURE_STATISTICS_BIT_KHR,VK_PIPELINE_CREATE_CAPTURE_INTERNAL_REPRESENTATIONS_BIT_KHR,VK_PIPELINE_CREATE_INDIRECT_BINDABLE_BIT_NV,VK_PIPELINE_CREATE_LIBRARY_BIT_KHR,VK_PIPELINE_CREATE_DESCRIPTOR_BUFFER_BIT_EXT,VK_PIPELINE_CREATE_RETAIN_LINK_TIME_OPTIMIZATION_INFO_BIT_EXT,VK_PIPELINE_CREATE_LINK_TIME_OPTIMIZATION_BIT_EXT,VK_PIPELINE_CREATE_RAY_TRACING_ALLOW_MOTION_BIT_NV,VK_PIPELINE_CREATE_COLOR_ATTACHMENT_FEEDBACK_LOOP_BIT_EXT,VK_PIPELINE_CREATE_DEPTH_STENCIL_ATTACHMENT_FEEDBACK_LOOP_BIT_EXT,VK_PIPELINE_CREATE_RAY_TRACING_OPACITY_MICROMAP_BIT_EXT,VK_PIPELINE_CREATE_NO_PROTECTED_ACCESS_BIT_EXT,VK_PIPELINE_CREATE_PROTECTED_ACCESS_ONLY_BIT_EXT,VK_PIPELINE_CREATE_DISPATCH_BASE,VK_PIPELINE_RASTERIZATION_STATE_CREATE_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR,VK_PIPELINE_RASTERIZATION_STATE_CREATE_FRAGMENT_DENSITY_MAP_ATTACHMENT_BIT_EXT,VK_PIPELINE_CREATE_VIEW_INDEX_FROM_DEVICE_INDEX_BIT_KHR,VK_PIPELINE_CREATE_DISPATCH_BASE_KHR,VK_PIPELINE_CREATE_FAIL_ON_PIPELINE_COMPILE_REQUIRED_BIT_EXT,VK_PIPELINE_CREATE_EARLY_RETURN_ON_FAILURE_BIT_EXT,VK_PIPELINE_CREATE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0E\xC5\x00\x00\x00\x16VkPipelineCreationFeedbackFlagBits\x00VK_PIPELINE_CREATION_FEEDBACK_VALID_BIT,VK_PIPELINE_CREATION_FEEDBACK_APPLICATION_PIPELINE_CACHE_HIT_BIT,VK_PIPELINE_CREATION_FEEDBACK_BASE_PIPELINE_ACCELERATION_BIT,VK_PIPELINE_CREATION_FEEDBACK_VALID_BIT_EXT,VK_PIPELINE_CREATION_FEEDBACK_APPLICATION_PIPELINE_CACHE_HIT_BIT_EXT,VK_PIPELINE_CREATION_FEEDBACK_BASE_PIPELINE_ACCELERATION_BIT_EXT,VK_PIPELINE_CREATION_FEEDBACK_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0E\xC6\x00\x00\x00\x16VkPipelineDepthStencilStateCreateFlagBits\x00VK_PIPELINE_DEPTH_STENCIL_STATE_CREATE_RASTERIZATION_ORDER_ATTACHMENT_DEPTH_ACCESS_BIT_EXT,VK_PIPELINE_DEPTH_STENCIL_STATE_CREATE_RASTERIZATION_ORDER_ATTACHMENT_STENCIL_ACCESS_BIT_EXT,VK_PIPELINE_DEPTH_STENCIL_STATE_CREATE_RASTERIZATION_ORDER_ATTACHMENT_DEPTH_ACCESS_BIT_ARM,VK_PIPELINE_DEPTH_STENCIL_STATE_CREATE_RASTERIZATION_ORDER_ATTACHMENT_STENCIL_ACCESS_BIT_ARM,VK_PIPELINE_DEPTH_STENCIL_STATE_CREATE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0E\xCF\x00\x00\x00\x16VkPipelineExecutableStatisticFormatKHR\x00VK_PIPELINE_EXECUTABLE_STATISTIC_FORMAT_BOOL32_KHR,VK_PIPELINE_EXECUTABLE_STATISTIC_FORMAT_INT64_KHR,VK_PIPELINE_EXECUTABLE_STATISTIC_FORMAT_UINT64_KHR,VK_PIPELINE_EXECUTABLE_STATISTIC_FORMAT_FLOAT64_KHR,VK_PIPELINE_EXECUTABLE_STATISTIC_FORMAT_MAX_ENUM_KHR',b'\x00\x00\x0E\xD8\x00\x00\x00\x16VkPipelineLayoutCreateFlagBits\x00VK_PIPELINE_LAYOUT_CREATE_INDEPENDENT_SETS_BIT_EXT,VK_PIPELINE_LAYOUT_CREATE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0E\xE9\x00\x00\x00\x16VkPipelineRobustnessBufferBehaviorEXT\x00VK_PIPELINE_ROBUSTNESS_BUFFER_BEHAVIOR_DEVICE_DEFAULT_EXT,VK_PIPELINE_ROBUSTNESS_BUFFER_BEHAVIOR_DISABLED_EXT,VK_PIPELINE_ROBUSTNESS_BUFFER_BEHAVIOR_ROBUST_BUFFER_ACCESS_EXT,VK_PIPELINE_ROBUSTNESS_BUFFER_BEHAVIOR_ROBUST_BUFFER_ACCESS_2_EXT,VK_PIPELINE_ROBUSTNESS_BUFFER_BEHAVIOR_MAX_ENUM_EXT',b'\x00\x00\x0E\xEB\x00\x00\x00\x16VkPipelineRobustnessImageBehaviorEXT\x00VK_PIPELINE_ROBUSTNESS_IMAGE_BEHAVIOR_DEVICE_DEFAULT_EXT,VK_PIPELINE_ROBUSTNESS_IMAGE_BEHAVIOR_DISABLED_EXT,VK_PIPELINE_ROBUSTNESS_IMAGE_BEHAVIOR_ROBUST_IMAGE_ACCESS_EXT,VK_PIPELINE_ROBUSTNESS_IMAGE_BEHAVIOR_ROBUST_IMAGE_ACCESS_2_EXT,VK_PIPELINE_ROBUSTNESS_IMAGE_BEHAVIOR_MAX_ENUM_EXT',b'\x00\x00\x0E\xED\x00\x00\x00\x16VkPipelineShaderStageCreateFlagBits\x00VK_PIPELINE_SHADER_STAGE_CREATE_ALLOW_VARYING_SUBGROUP_SIZE_BIT,VK_PIPELINE_SHADER_STAGE_CREATE_REQUIRE_FULL_SUBGROUPS_BIT,VK_PIPELINE_SHADER_STAGE_CREATE_ALLOW_VARYING_SUBGROUP_SIZE_BIT_EXT,VK_PIPELINE_SHADER_STAGE_CREATE_REQUIRE_FULL_SUBGROUPS_BIT_EXT,VK_PIPELINE_SHADER_STAGE_CREATE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x05\xE0\x00\x00\x00\x16VkPipelineStageFlagBits\x00VK_PIPELINE_STAGE_TOP_OF_PIPE_BIT,VK_PIPELINE_STAGE_DRAW_INDIRECT_BIT,VK_PIPELINE_STAGE_VERTEX_INPUT_BIT,VK_PIPELINE_STAGE_VERTEX_SHADER_BIT,VK_PIPELINE_STAGE_TESSELLATION_CONTROL_SHADER_BIT,VK_PIPELINE_STAGE_TESSELLATION_EVALUATION_SHADER_BIT,VK_PIPELINE_STAGE_GEOMETRY_SHADER_BIT,VK_PIPELINE_STAGE_FRAGMENT_SHADER_BIT,VK_PIPELINE_STAGE_EARLY_FRAGMENT_TESTS_BIT,VK_PIPELINE_STAGE_LATE_FRAGMENT_TESTS_BIT,VK_PIPELINE_STAGE_COLOR_ATTACHMENT_OUTPUT_BIT,VK_PIPELINE_STAGE_COMPUTE_SHADER_BIT,VK_PIPELINE_STAGE_TRANSFER_BIT,VK_PIPELINE_STAGE_BOTTOM_OF_PIPE_BIT,VK_PIPELINE_STAGE_HOST_BIT,VK_PIPELINE_STAGE_ALL_GRAPHICS_BIT,VK_PIPELINE_STAGE_ALL_COMMANDS_BIT,VK_PIPELINE_STAGE_NONE,VK_PIPELINE_STAGE_TRANSFORM_FEEDBACK_BIT_EXT,VK_PIPELINE_STAGE_CONDITIONAL_RENDERING_BIT_EXT,VK_PIPELINE_STAGE_ACCELERATION_STRUCTURE_BUILD_BIT_KHR,VK_PIPELINE_STAGE_RAY_TRACING_SHADER_BIT_KHR,VK_PIPELINE_STAGE_FRAGMENT_DENSITY_PROCESS_BIT_EXT,VK_PIPELINE_STAGE_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR,VK_PIPELINE_STAGE_COMMAND_PREPROCESS_BIT_NV,VK_PIPELINE_STAGE_TASK_SHADER_BIT_EXT,VK_PIPELINE_STAGE_MESH_SHADER_BIT_EXT,VK_PIPELINE_STAGE_SHADING_RATE_IMAGE_BIT_NV,VK_PIPELINE_STAGE_RAY_TRACING_SHADER_BIT_NV,VK_PIPELINE_STAGE_ACCELERATION_STRUCTURE_BUILD_BIT_NV,VK_PIPELINE_STAGE_TASK_SHADER_BIT_NV,VK_PIPELINE_STAGE_MESH_SHADER_BIT_NV,VK_PIPELINE_STAGE_NONE_KHR,VK_PIPELINE_STAGE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0F\x00\x00\x00\x00\x16VkPointClippingBehavior\x00VK_POINT_CLIPPING_BEHAVIOR_ALL_CLIP_PLANES,VK_POINT_CLIPPING_BEHAVIOR_USER_CLIP_PLANES_ONLY,VK_POINT_CLIPPING_BEHAVIOR_ALL_CLIP_PLANES_KHR,VK_POINT_CLIPPING_BEHAVIOR_USER_CLIP_PLANES_ONLY_KHR,VK_POINT_CLIPPING_BEHAVIOR_MAX_ENUM',b'\x00\x00\x05\xED\x00\x00\x00\x16VkPolygonMode\x00VK_POLYGON_MODE_FILL,VK_POLYGON_MODE_LINE,VK_POLYGON_MODE_POINT,VK_POLYGON_MODE_FILL_RECTANGLE_NV,VK_POLYGON_MODE_MAX_ENUM',b'\x00\x00\x0F\x01\x00\x00\x00\x16VkPresentGravityFlagBitsEXT\x00VK_PRESENT_GRAVITY_MIN_BIT_EXT,VK_PRESENT_GRAVITY_MAX_BIT_EXT,VK_PRESENT_GRAVITY_CENTERED_BIT_EXT,VK_PRESENT_GRAVITY_FLAG_BITS_MAX_ENUM_EXT',b'\x00\x00\x0F\x05\x00\x00\x00\x16VkPresentModeKHR\x00VK_PRESENT_MODE_IMMEDIATE_KHR,VK_PRESENT_MODE_MAILBOX_KHR,VK_PRESENT_MODE_FIFO_KHR,VK_PRESENT_MODE_FIFO_RELAXED_KHR,VK_PRESENT_MODE_SHARED_DEMAND_REFRESH_KHR,VK_PRESENT_MODE_SHARED_CONTINUOUS_REFRESH_KHR,VK_PRESENT_MODE_MAX_ENUM_KHR',b'\x00\x00\x0F\x09\x00\x00\x00\x16VkPresentScalingFlagBitsEXT\x00VK_PRESENT_SCALING_ONE_TO_ONE_BIT_EXT,VK_PRESENT_SCALING_ASPECT_RATIO_STRETCH_BIT_EXT,VK_PRESENT_SCALING_STRETCH_BIT_EXT,VK_PRESENT_SCALING_FLAG_BITS_MAX_ENUM_EXT',b'\x00\x00\x05\xF1\x00\x00\x00\x16VkPrimitiveTopology\x00VK_PRIMITIVE_TOPOLOGY_POINT_LIST,VK_PRIMITIVE_TOPOLOGY_LINE_LIST,VK_PRIMITIVE_TOPOLOGY_LINE_STRIP,VK_PRIMITIVE_TOPOLOGY_TRIANGLE_LIST,VK_PRIMITIVE_TOPOLOGY_TRIANGLE_STRIP,VK_PRIMITIVE_TOPOLOGY_TRIANGLE_FAN,VK_PRIMITIVE_TOPOLOGY_LINE_LIST_WITH_ADJACENCY,VK_PRIMITIVE_TOPOLOGY_LINE_STRIP_WITH_ADJACENCY,VK_PRIMITIVE_TOPOLOGY_TRIANGLE_LIST_WITH_ADJACENCY,VK_PRIMITIVE_TOPOLOGY_TRIANGLE_STRIP_WITH_ADJACENCY,VK_PRIMITIVE_TOPOLOGY_PATCH_LIST,VK_PRIMITIVE_TOPOLOGY_MAX_ENUM',b'\x00\x00\x05\xF5\x00\x00\x00\x16VkProvokingVertexModeEXT\x00VK_PROVOKING_VERTEX_MODE_FIRST_VERTEX_EXT,VK_PROVOKING_VERTEX_MODE_LAST_VERTEX_EXT,VK_PROVOKING_VERTEX_MODE_MAX_ENUM_EXT',b'\x00\x00\x0F\x14\x00\x00\x00\x16VkQueryControlFlagBits\x00VK_QUERY_CONTROL_PRECISE_BIT,VK_QUERY_CONTROL_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0F\x16\x00\x00\x00\x16VkQueryPipelineStatisticFlagBits\x00VK_QUERY_PIPELINE_STATISTIC_INPUT_ASSEMBLY_VERTICES_BIT,VK_QUERY_PIPELINE_STATISTIC_INPUT_ASSEMBLY_PRIMITIVES_BIT,VK_QUERY_PIPELINE_STATISTIC_VERTEX_SHADER_INVOCATIONS_BIT,VK_QUERY_PIPELINE_STATISTIC_GEOMETRY_SHADER_INVOCATIONS_BIT,VK_QUERY_PIPELINE_STATISTIC_GEOMETRY_SHADER_PRIMITIVES_BIT,VK_QUERY_PIPELINE_STATISTIC_CLIPPING_INVOCATIONS_BIT,VK_QUERY_PIPELINE_STATISTIC_CLIPPING_PRIMITIVES_BIT,VK_QUERY_PIPELINE_STATISTIC_FRAGMENT_SHADER_INVOCATIONS_BIT,VK_QUERY_PIPELINE_STATISTIC_TESSELLATION_CONTROL_SHADER_PATCHES_BIT,VK_QUERY_PIPELINE_STATISTIC_TESSELLATION_EVALUATION_SHADER_INVOCATIONS_BIT,VK_QUERY_PIPELINE_STATISTIC_COMPUTE_SHADER_INVOCATIONS_BIT,VK_QUERY_PIPELINE_STATISTIC_TASK_SHADER_INVOCATIONS_BIT_EXT,VK_QUERY_PIPELINE_STATISTIC_MESH_SHADER_INVOCATIONS_BIT_EXT,VK_QUERY_PIPELINE_STATISTIC_CLUSTER_CULLING_SHADER_INVOCATIONS_BIT_HUAWEI,VK_QUERY_PIPELINE_STATISTIC_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0F\x1A\x00\x00\x00\x16VkQueryPoolSamplingModeINTEL\x00VK_QUERY_POOL_SAMPLING_MODE_MANUAL_INTEL,VK_QUERY_POOL_SAMPLING_MODE_MAX_ENUM_INTEL',b'\x00\x00\x0F\x1C\x00\x00\x00\x16VkQueryResultFlagBits\x00VK_QUERY_RESULT_64_BIT,VK_QUERY_RESULT_WAIT_BIT,VK_QUERY_RESULT_WITH_AVAILABILITY_BIT,VK_QUERY_RESULT_PARTIAL_BIT,VK_QUERY_RESULT_WITH_STATUS_BIT_KHR,VK_QUERY_RESULT_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0F\x1D\x00\x00\x00\x15VkQueryResultStatusKHR\x00VK_QUERY_RESULT_STATUS_ERROR_KHR,VK_QUERY_RESULT_STATUS_NOT_READY_KHR,VK_QUERY_RESULT_STATUS_COMPLETE_KHR,VK_QUERY_RESULT_STATUS_INSUFFICIENT_BITSTREAM_BUFFER_RANGE_KHR,VK_QUERY_RESULT_STATUS_MAX_ENUM_KHR',b'\x00\x00\x03\x6B\x00\x00\x00\x16VkQueryType\x00VK_QUERY_TYPE_OCCLUSION,VK_QUERY_TYPE_PIPELINE_STATISTICS,VK_QUERY_TYPE_TIMESTAMP,VK_QUERY_TYPE_RESULT_STATUS_ONLY_KHR,VK_QUERY_TYPE_TRANSFORM_FEEDBACK_STREAM_EXT,VK_QUERY_TYPE_PERFORMANCE_QUERY_KHR,VK_QUERY_TYPE_ACCELERATION_STRUCTURE_COMPACTED_SIZE_KHR,VK_QUERY_TYPE_ACCELERATION_STRUCTURE_SERIALIZATION_SIZE_KHR,VK_QUERY_TYPE_ACCELERATION_STRUCTURE_COMPACTED_SIZE_NV,VK_QUERY_TYPE_PERFORMANCE_QUERY_INTEL,VK_QUERY_TYPE_VIDEO_ENCODE_FEEDBACK_KHR,VK_QUERY_TYPE_MESH_PRIMITIVES_GENERATED_EXT,VK_QUERY_TYPE_PRIMITIVES_GENERATED_EXT,VK_QUERY_TYPE_ACCELERATION_STRUCTURE_SERIALIZATION_BOTTOM_LEVEL_POINTERS_KHR,VK_QUERY_TYPE_ACCELERATION_STRUCTURE_SIZE_KHR,VK_QUERY_TYPE_MICROMAP_SERIALIZATION_SIZE_EXT,VK_QUERY_TYPE_MICROMAP_COMPACTED_SIZE_EXT,VK_QUERY_TYPE_MAX_ENUM',b'\x00\x00\x0F\x25\x00\x00\x00\x16VkQueueFlagBits\x00VK_QUEUE_GRAPHICS_BIT,VK_QUEUE_COMPUTE_BIT,VK_QUEUE_TRANSFER_BIT,VK_QUEUE_SPARSE_BINDING_BIT,VK_QUEUE_PROTECTED_BIT,VK_QUEUE_VIDEO_DECODE_BIT_KHR,VK_QUEUE_VIDEO_ENCODE_BIT_KHR,VK_QUEUE_OPTICAL_FLOW_BIT_NV,VK_QUEUE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0F\x26\x00\x00\x00\x16VkQueueGlobalPriorityKHR\x00VK_QUEUE_GLOBAL_PRIORITY_LOW_KHR,VK_QUEUE_GLOBAL_PRIORITY_MEDIUM_KHR,VK_QUEUE_GLOBAL_PRIORITY_HIGH_KHR,VK_QUEUE_GLOBAL_PRIORITY_REALTIME_KHR,VK_QUEUE_GLOBAL_PRIORITY_LOW_EXT,VK_QUEUE_GLOBAL_PRIORITY_MEDIUM_EXT,VK_QUEUE_GLOBAL_PRIORITY_HIGH_EXT,VK_QUEUE_GLOBAL_PRIORITY_REALTIME_EXT,VK_QUEUE_GLOBAL_PRIORITY_MAX_ENUM_KHR',b'\x00\x00\x0F\x29\x00\x00\x00\x16VkRasterizationOrderAMD\x00VK_RASTERIZATION_ORDER_STRICT_AMD,VK_RASTERIZATION_ORDER_RELAXED_AMD,VK_RASTERIZATION_ORDER_MAX_ENUM_AMD',b'\x00\x00\x0F\x2A\x00\x00\x00\x16VkRayTracingInvocationReorderModeNV\x00VK_RAY_TRACING_INVOCATION_REORDER_MODE_NONE_NV,VK_RAY_TRACING_INVOCATION_REORDER_MODE_REORDER_NV,VK_RAY_TRACING_INVOCATION_REORDER_MODE_MAX_ENUM_NV',b'\x00\x00\x0F\x33\x00\x00\x00\x16VkRayTracingShaderGroupTypeKHR\x00VK_RAY_TRACING_SHADER_GROUP_TYPE_GENERAL_KHR,VK_RAY_TRACING_SHADER_GROUP_TYPE_TRIANGLES_HIT_GROUP_KHR,VK_RAY_TRACING_SHADER_GROUP_TYPE_PROCEDURAL_HIT_GROUP_KHR,VK_RAY_TRACING_SHADER_GROUP_TYPE_GENERAL_NV,VK_RAY_TRACING_SHADER_GROUP_TYPE_TRIANGLES_HIT_GROUP_NV,VK_RAY_TRACING_SHADER_GROUP_TYPE_PROCEDURAL_HIT_GROUP_NV,VK_RAY_TRACING_SHADER_GROUP_TYPE_MAX_ENUM_KHR',b'\x00\x00\x0F\x3B\x00\x00\x00\x16VkRenderPassCreateFlagBits\x00VK_RENDER_PASS_CREATE_TRANSFORM_BIT_QCOM,VK_RENDER_PASS_CREATE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0F\x51\x00\x00\x00\x16VkRenderingFlagBits\x00VK_RENDERING_CONTENTS_SECONDARY_COMMAND_BUFFERS_BIT,VK_RENDERING_SUSPENDING_BIT,VK_RENDERING_RESUMING_BIT,VK_RENDERING_CONTENTS_INLINE_BIT_EXT,VK_RENDERING_ENABLE_LEGACY_DITHERING_BIT_EXT,VK_RENDERING_CONTENTS_SECONDARY_COMMAND_BUFFERS_BIT_KHR,VK_RENDERING_SUSPENDING_BIT_KHR,VK_RENDERING_RESUMING_BIT_KHR,VK_RENDERING_FLAG_BITS_MAX_ENUM',b'\x00\x00\x0F\x56\x00\x00\x00\x16VkResolveModeFlagBits\x00VK_RESOLVE_MODE_NONE,VK_RESOLVE_MODE_SAMPLE_ZERO_BIT,VK_RESOLVE_MODE_AVERAGE_BIT,VK_RESOLVE_MODE_MIN_BIT,VK_RESOLVE_MODE_MAX_BIT,VK_RESOLVE_MODE_EXTERNAL_FORMAT_DOWNSAMPLE_ANDROID,VK_RESOLVE_MODE_NONE_KHR,VK_RESOLVE_MODE_SAMPLE_ZERO_BIT_KHR,VK_RESOLVE_MODE_AVERAGE_BIT_KHR,VK_RESOLVE_MODE_MIN_BIT_KHR,VK_RESOLVE_MODE_MAX_BIT_KHR,VK_RESOLVE_MODE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x10\x36\x00\x00\x00\x15VkResult\x00VK_SUCCESS,VK_NOT_READY,VK_TIMEOUT,VK_EVENT_SET,VK_EVENT_RESET,VK_INCOMPLETE,VK_ERROR_OUT_OF_HOST_MEMORY,VK_ERROR_OUT_OF_DEVICE_MEMORY,VK_ERROR_INITIALIZATION_FAILED,VK_ERROR_DEVICE_LOST,VK_ERROR_MEMORY_MAP_FAILED,VK_ERROR_LAYER_NOT_PRESENT,VK_ERROR_EXTENSION_NOT_PRESENT,VK_ERROR_FEATURE_NOT_PRESENT,VK_ERROR_INCOMPATIBLE_DRIVER,VK_ERROR_TOO_MANY_OBJECTS,VK_ERROR_FORMAT_NOT_SUPPORTED,VK_ERROR_FRAGMENTED_POOL,VK_ERROR_UNKNOWN,VK_ERROR_OUT_OF_POOL_MEMORY,VK_ERROR_INVALID_EXTERNAL_HANDLE,VK_ERROR_FRAGMENTATION,VK_ERROR_INVALID_OPAQUE_CAPTURE_ADDRESS,VK_PIPELINE_COMPILE_REQUIRED,VK_ERROR_SURFACE_LOST_KHR,VK_ERROR_NATIVE_WINDOW_IN_USE_KHR,VK_SUBOPTIMAL_KHR,VK_ERROR_OUT_OF_DATE_KHR,VK_ERROR_INCOMPATIBLE_DISPLAY_KHR,VK_ERROR_VALIDATION_FAILED_EXT,VK_ERROR_INVALID_SHADER_NV,VK_ERROR_IMAGE_USAGE_NOT_SUPPORTED_KHR,VK_ERROR_VIDEO_PICTURE_LAYOUT_NOT_SUPPORTED_KHR,VK_ERROR_VIDEO_PROFILE_OPERATION_NOT_SUPPORTED_KHR,VK_ERROR_VIDEO_PROFILE_FORMAT_NOT_SUPPORTED_KHR,VK_ERROR_VIDEO_PROFILE_CODEC_NOT_SUPPORTED_KHR,VK_ERROR_VIDEO_STD_VERSION_NOT_SUPPORTED_KHR,VK_ERROR_INVALID_DRM_FORMAT_MODIFIER_PLANE_LAYOUT_EXT,VK_ERROR_NOT_PERMITTED_KHR,VK_ERROR_FULL_SCREEN_EXCLUSIVE_MODE_LOST_EXT,VK_THREAD_IDLE_KHR,VK_THREAD_DONE_KHR,VK_OPERATION_DEFERRED_KHR,VK_OPERATION_NOT_DEFERRED_KHR,VK_ERROR_INVALID_VIDEO_STD_PARAMETERS_KHR,VK_ERROR_COMPRESSION_EXHAUSTED_EXT,VK_ERROR_INCOMPATIBLE_SHADER_BINARY_EXT,VK_ERROR_OUT_OF_POOL_MEMORY_KHR,VK_ERROR_INVALID_EXTERNAL_HANDLE_KHR,VK_ERROR_FRAGMENTATION_EXT,VK_ERROR_NOT_PERMITTED_EXT,VK_ERROR_INVALID_DEVICE_ADDRESS_EXT,VK_ERROR_INVALID_OPAQUE_CAPTURE_ADDRESS_KHR,VK_PIPELINE_COMPILE_REQUIRED_EXT,VK_ERROR_PIPELINE_COMPILE_REQUIRED_EXT,VK_RESULT_MAX_ENUM',b'\x00\x00\x06\x17\x00\x00\x00\x16VkSampleCountFlagBits\x00VK_SAMPLE_COUNT_1_BIT,VK_SAMPLE_COUNT_2_BIT,VK_SAMPLE_COUNT_4_BIT,VK_SAMPLE_COUNT_8_BIT,VK_SAMPLE_COUNT_16_BIT,VK_SAMPLE_COUNT_32_BIT,VK_SAMPLE_COUNT_64_BIT,VK_SAMPLE_COUNT_FLAG_BITS_MAX_ENUM',b'\x00\x00\x10\x3C\x00\x00\x00\x16VkSamplerAddressMode\x00VK_SAMPLER_ADDRESS_MODE_REPEAT,VK_SAMPLER_ADDRESS_MODE_MIRRORED_REPEAT,VK_SAMPLER_ADDRESS_MODE_CLAMP_TO_EDGE,VK_SAMPLER_ADDRESS_MODE_CLAMP_TO_BORDER,VK_SAMPLER_ADDRESS_MODE_MIRROR_CLAMP_TO_EDGE,VK_SAMPLER_ADDRESS_MODE_MIRROR_CLAMP_TO_EDGE_KHR,VK_SAMPLER_ADDRESS_MODE_MAX_ENUM',b'\x00\x00\x10\x40\x00\x00\x00\x16VkSamplerCreateFlagBits\x00VK_SAMPLER_CREATE_SUBSAMPLED_BIT_EXT,VK_SAMPLER_CREATE_SUBSAMPLED_COARSE_RECONSTRUCTION_BIT_EXT,VK_SAMPLER_CREATE_DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT,VK_SAMPLER_CREATE_NON_SEAMLESS_CUBE_MAP_BIT_EXT,VK_SAMPLER_CREATE_IMAGE_PROCESSING_BIT_QCOM,VK_SAMPLER_CREATE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x10\x44\x00\x00\x00\x16VkSamplerMipmapMode\x00VK_SAMPLER_MIPMAP_MODE_NEAREST,VK_SAMPLER_MIPMAP_MODE_LINEAR,VK_SAMPLER_MIPMAP_MODE_MAX_ENUM',b'\x00\x00\x10\x45\x00\x00\x00\x16VkSamplerReductionMode\x00VK_SAMPLER_REDUCTION_MODE_WEIGHTED_AVERAGE,VK_SAMPLER_REDUCTION_MODE_MIN,VK_SAMPLER_REDUCTION_MODE_MAX,VK_SAMPLER_REDUCTION_MODE_WEIGHTED_AVERAGE_RANGECLAMP_QCOM,VK_SAMPLER_REDUCTION_MODE_WEIGHTED_AVERAGE_EXT,VK_SAMPLER_REDUCTION_MODE_MIN_EXT,VK_SAMPLER_REDUCTION_MODE_MAX_EXT,VK_SAMPLER_REDUCTION_MODE_MAX_ENUM',b'\x00\x00\x10\x4B\x00\x00\x00\x16VkSamplerYcbcrModelConversion\x00VK_SAMPLER_YCBCR_MODEL_CONVERSION_RGB_IDENTITY,VK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_IDENTITY,VK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_709,VK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_601,VK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_2020,VK_SAMPLER_YCBCR_MODEL_CONVERSION_RGB_IDENTITY_KHR,VK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_IDENTITY_KHR,VK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_709_KHR,VK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_601_KHR,VK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_2020_KHR,VK_SAMPLER_YCBCR_MODEL_CONVERSION_MAX_ENUM',b'\x00\x00\x10\x4C\x00\x00\x00\x16VkSamplerYcbcrRange\x00VK_SAMPLER_YCBCR_RANGE_ITU_FULL,VK_SAMPLER_YCBCR_RANGE_ITU_NARROW,VK_SAMPLER_YCBCR_RANGE_ITU_FULL_KHR,VK_SAMPLER_YCBCR_RANGE_ITU_NARROW_KHR,VK_SAMPLER_YCBCR_RANGE_MAX_ENUM',b'\x00\x00\x10\x4D\x00\x00\x00\x16VkScopeKHR\x00VK_SCOPE_DEVICE_KHR,VK_SCOPE_WORKGROUP_KHR,VK_SCOPE_SUBGROUP_KHR,VK_SCOPE_QUEUE_FAMILY_KHR,VK_SCOPE_DEVICE_NV,VK_SCOPE_WORKGROUP_NV,VK_SCOPE_SUBGROUP_NV,VK_SCOPE_QUEUE_FAMILY_NV,VK_SCOPE_MAX_ENUM_KHR',b'\x00\x00\x10\x51\x00\x00\x00\x16VkSemaphoreImportFlagBits\x00VK_SEMAPHORE_IMPORT_TEMPORARY_BIT,VK_SEMAPHORE_IMPORT_TEMPORARY_BIT_KHR,VK_SEMAPHORE_IMPORT_FLAG_BITS_MAX_ENUM',b'\x00\x00\x10\x55\x00\x00\x00\x16VkSemaphoreType\x00VK_SEMAPHORE_TYPE_BINARY,VK_SEMAPHORE_TYPE_TIMELINE,VK_SEMAPHORE_TYPE_BINARY_KHR,VK_SEMAPHORE_TYPE_TIMELINE_KHR,VK_SEMAPHORE_TYPE_MAX_ENUM',b'\x00\x00\x10\x57\x00\x00\x00\x16VkSemaphoreWaitFlagBits\x00VK_SEMAPHORE_WAIT_ANY_BIT,VK_SEMAPHORE_WAIT_ANY_BIT_KHR,VK_SEMAPHORE_WAIT_FLAG_BITS_MAX_ENUM',b'\x00\x00\x10\x5C\x00\x00\x00\x16VkShaderCodeTypeEXT\x00VK_SHADER_CODE_TYPE_BINARY_EXT,VK_SHADER_CODE_TYPE_SPIRV_EXT,VK_SHADER_CODE_TYPE_MAX_ENUM_EXT',b'\x00\x00\x10\x5D\x00\x00\x00\x16VkShaderCorePropertiesFlagBitsAMD\x00VK_SHADER_CORE_PROPERTIES_FLAG_BITS_MAX_ENUM_AMD',b'\x00\x00\x10\x5E\x00\x00\x00\x16VkShaderCreateFlagBitsEXT\x00VK_SHADER_CREATE_LINK_STAGE_BIT_EXT,VK_SHADER_CREATE_ALLOW_VARYING_SUBGROUP_SIZE_BIT_EXT,VK_SHADER_CREATE_REQUIRE_FULL_SUBGROUPS_BIT_EXT,VK_SHADER_CREATE_NO_TASK_SHADER_BIT_EXT,VK_SHADER_CREATE_DISPATCH_BASE_BIT_EXT,VK_SHADER_CREATE_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_EXT,VK_SHADER_CREATE_FRAGMENT_DENSITY_MAP_ATTACHMENT_BIT_EXT,VK_SHADER_CREATE_FLAG_BITS_MAX_ENUM_EXT',b'\x00\x00\x10\x60\x00\x00\x00\x16VkShaderFloatControlsIndependence\x00VK_SHADER_FLOAT_CONTROLS_INDEPENDENCE_32_BIT_ONLY,VK_SHADER_FLOAT_CONTROLS_INDEPENDENCE_ALL,VK_SHADER_FLOAT_CONTROLS_INDEPENDENCE_NONE,VK_SHADER_FLOAT_CONTROLS_INDEPENDENCE_32_BIT_ONLY_KHR,VK_SHADER_FLOAT_CONTROLS_INDEPENDENCE_ALL_KHR,VK_SHADER_FLOAT_CONTROLS_INDEPENDENCE_NONE_KHR,VK_SHADER_FLOAT_CONTROLS_INDEPENDENCE_MAX_ENUM',b'\x00\x00\x05\x0D\x00\x00\x00\x16VkShaderGroupShaderKHR\x00VK_SHADER_GROUP_SHADER_GENERAL_KHR,VK_SHADER_GROUP_SHADER_CLOSEST_HIT_KHR,VK_SHADER_GROUP_SHADER_ANY_HIT_KHR,VK_SHADER_GROUP_SHADER_INTERSECTION_KHR,VK_SHADER_GROUP_SHADER_MAX_ENUM_KHR',b'\x00\x00\x02\xB9\x00\x00\x00\x16VkShaderInfoTypeAMD\x00VK_SHADER_INFO_TYPE_STATISTICS_AMD,VK_SHADER_INFO_TYPE_BINARY_AMD,VK_SHADER_INFO_TYPE_DISASSEMBLY_AMD,VK_SHADER_INFO_TYPE_MAX_ENUM_AMD',b'\x00\x00\x02\xB8\x00\x00\x00\x16VkShaderStageFlagBits\x00VK_SHADER_STAGE_VERTEX_BIT,VK_SHADER_STAGE_TESSELLATION_CONTROL_BIT,VK_SHADER_STAGE_TESSELLATION_EVALUATION_BIT,VK_SHADER_STAGE_GEOMETRY_BIT,VK_SHADER_STAGE_FRAGMENT_BIT,VK_SHADER_STAGE_COMPUTE_BIT,VK_SHADER_STAGE_ALL_GRAPHICS,VK_SHADER_STAGE_ALL,VK_SHADER_STAGE_RAYGEN_BIT_KHR,VK_SHADER_STAGE_ANY_HIT_BIT_KHR,VK_SHADER_STAGE_CLOSEST_HIT_BIT_KHR,VK_SHADER_STAGE_MISS_BIT_KHR,VK_SHADER_STAGE_INTERSECTION_BIT_KHR,VK_SHADER_STAGE_CALLABLE_BIT_KHR,VK_SHADER_STAGE_TASK_BIT_EXT,VK_SHADER_STAGE_MESH_BIT_EXT,VK_SHADER_STAGE_SUBPASS_SHADING_BIT_HUAWEI,VK_SHADER_STAGE_CLUSTER_CULLING_BIT_HUAWEI,VK_SHADER_STAGE_RAYGEN_BIT_NV,VK_SHADER_STAGE_ANY_HIT_BIT_NV,VK_SHADER_STAGE_CLOSEST_HIT_BIT_NV,VK_SHADER_STAGE_MISS_BIT_NV,VK_SHADER_STAGE_INTERSECTION_BIT_NV,VK_SHADER_STAGE_CALLABLE_BIT_NV,VK_SHADER_STAGE_TASK_BIT_NV,VK_SHADER_STAGE_MESH_BIT_NV,VK_SHADER_STAGE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x10\x67\x00\x00\x00\x16VkShadingRatePaletteEntryNV\x00VK_SHADING_RATE_PALETTE_ENTRY_NO_INVOCATIONS_NV,VK_SHADING_RATE_PALETTE_ENTRY_16_INVOCATIONS_PER_PIXEL_NV,VK_SHADING_RATE_PALETTE_ENTRY_8_INVOCATIONS_PER_PIXEL_NV,VK_SHADING_RATE_PALETTE_ENTRY_4_INVOCATIONS_PER_PIXEL_NV,VK_SHADING_RATE_PALETTE_ENTRY_2_INVOCATIONS_PER_PIXEL_NV,VK_SHADING_RATE_PALETTE_ENTRY_1_INVOCATION_PER_PIXEL_NV,VK_SHADING_RATE_PALETTE_ENTRY_1_INVOCATION_PER_2X1_PIXELS_NV,VK_SHADING_RATE_PALETTE_ENTRY_1_INVOCATION_PER_1X2_PIXELS_NV,VK_SHADING_RATE_PALETTE_ENTRY_1_INVOCATION_PER_2X2_PIXELS_NV,VK_SHADING_RATE_PALETTE_ENTRY_1_INVOCATION_PER_4X2_PIXELS_NV,VK_SHADING_RATE_PALETTE_ENTRY_1_INVOCATION_PER_2X4_PIXELS_NV,VK_SHADING_RATE_PALETTE_ENTRY_1_INVOCATION_PER_4X4_PIXELS_NV,VK_SHADING_RATE_PALETTE_ENTRY_MAX_ENUM_NV',b'\x00\x00\x10\x6A\x00\x00\x00\x16VkSharingMode\x00VK_SHARING_MODE_EXCLUSIVE,VK_SHARING_MODE_CONCURRENT,VK_SHARING_MODE_MAX_ENUM',b'\x00\x00\x10\x6D\x00\x00\x00\x16VkSparseImageFormatFlagBits\x00VK_SPARSE_IMAGE_FORMAT_SINGLE_MIPTAIL_BIT,VK_SPARSE_IMAGE_FORMAT_ALIGNED_MIP_SIZE_BIT,VK_SPARSE_IMAGE_FORMAT_NONSTANDARD_BLOCK_SIZE_BIT,VK_SPARSE_IMAGE_FORMAT_FLAG_BITS_MAX_ENUM',b'\x00\x00\x10\x7A\x00\x00\x00\x16VkSparseMemoryBindFlagBits\x00VK_SPARSE_MEMORY_BIND_METADATA_BIT,VK_SPARSE_MEMORY_BIND_FLAG_BITS_MAX_ENUM',b'\x00\x00\x10\x7F\x00\x00\x00\x16VkStencilFaceFlagBits\x00VK_STENCIL_FACE_FRONT_BIT,VK_STENCIL_FACE_BACK_BIT,VK_STENCIL_FACE_FRONT_AND_BACK,VK_STENCIL_FRONT_AND_BACK,VK_STENCIL_FACE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x07\x8A\x00\x00\x00\x16VkStencilOp\x00VK_STENCIL_OP_KEEP,VK_STENCIL_OP_ZERO,VK_STENCIL_OP_REPLACE,VK_STENCIL_OP_INCREMENT_AND_CLAMP,VK_STENCIL_OP_DECREMENT_AND_CLAMP,VK_STENCIL_OP_INVERT,VK_STENCIL_OP_INCREMENT_AND_WRAP,VK_STENCIL_OP_DECREMENT_AND_WRAP,VK_STENCIL_OP_MAX_ENUM',b'\x00\x00\x10\x82\x00\x00\x00\x16VkStructureType\x00VK_STRUCTURE_TYPE_APPLICATION_INFO,VK_STRUCTURE_TYPE_INSTANCE_CREATE_INFO,VK_STRUCTURE_TYPE_DEVICE_QUEUE_CREATE_INFO,VK_STRUCTURE_TYPE_DEVICE_CREATE_INFO,VK_STRUCTURE_TYPE_SUBMIT_INFO,VK_STRUCTURE_TYPE_MEMORY_ALLOCATE_INFO,VK_STRUCTURE_TYPE_MAPPED_MEMORY_RANGE,VK_STRUCTURE_TYPE_BIND_SPARSE_INFO,VK_STRUCTURE_TYPE_FENCE_CREATE_INFO,VK_STRUCTURE_TYPE_SEMAPHORE_CREATE_INFO,VK_STRUCTURE_TYPE_EVENT_CREATE_INFO,VK_STRUCTURE_TYPE_QUERY_POOL_CREATE_INFO,VK_STRUCTURE_TYPE_BUFFER_CREATE_INFO,VK_STRUCTURE_TYPE_BUFFER_VIEW_CREATE_INFO,VK_STRUCTURE_TYPE_IMAGE_CREATE_INFO,VK_STRUCTURE_TYPE_IMAGE_VIEW_CREATE_INFO,VK_STRUCTURE_TYPE_SHADER_MODULE_CREATE_INFO,VK_STRUCTURE_TYPE_PIPELINE_CACHE_CREATE_INFO,VK_STRUCTURE_TYPE_PIPELINE_SHADER_STAGE_CREATE_INFO,VK_STRUCTURE_TYPE_PIPELINE_VERTEX_INPUT_STATE_CREATE_INFO,VK_STRUCTURE_TYPE_PIPELINE_INPUT_ASSEMBLY_STATE_CREATE_INFO,VK_STRUCTURE_TYPE_PIPELINE_TESSELLATION_STATE_CREATE_INFO,VK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_STATE_CREATE_INFO,VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_STATE_CREATE_INFO,VK_STRUCTURE_TYPE_PIPELINE_MULTISAMPLE_STATE_CREATE_INFO,VK_STRUCTURE_TYPE_PIPELINE_DEPTH_STENCIL_STATE_CREATE_INFO,VK_STRUCTURE_TYPE_PIPELINE_COLOR_BLEND_STATE_CREATE_INFO,VK_STRUCTURE_TYPE_PIPELINE_DYNAMIC_STATE_CREATE_INFO,VK_STRUCTURE_TYPE_GRAPHICS_PIPELINE_CREATE_INFO,VK_STRUCTURE_TYPE_COMPUTE_PIPELINE_CREATE_INFO,VK_STRUCTURE_TYPE_PIPELINE_LAYOUT_CREATE_INFO,VK_STRUCTURE_TYPE_SAMPLER_CREATE_INFO,VK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_CREATE_INFO,VK_STRUCTURE_TYPE_DESCRIPTOR_POOL_CREATE_INFO,VK_STRUCTURE_TYPE_DESCRIPTOR_SET_ALLOCATE_INFO,VK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET,VK_STRUCTURE_TYPE_COPY_DESCRIPTOR_SET,VK_STRUCTURE_TYPE_FRAMEBUFFER_CREATE_INFO,VK_STRUCTURE_TYPE_RENDER_PASS_CREATE_INFO,VK_STRUCTURE_TYPE_COMMAND_POOL_CREATE_INFO,VK_STRUCTURE_TYPE_COMMAND_BUFFER_ALLOCATE_INFO,VK_STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_INFO,VK_STRUCTURE_TYPE_COMMAND_BUFFER_BEGIN_INFO,VK_STRUCTURE_TYPE_RENDER_PASS_BEGIN_INFO,VK_STRUCTURE_TYPE_BUFFER_MEMORY_BARRIER,VK_STRUCTURE_TYPE_IMAGE_MEMORY_BARRIER,VK_STRUCTURE_TYPE_MEMORY_BARRIER,VK_STRUCTURE_TYPE_LOADER_INSTANCE_CREATE_INFO,VK_STRUCTURE_TYPE_LOADER_DEVICE_CREATE_INFO,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBGROUP_PROPERTIES,VK_STRUCTURE_TYPE_BIND_BUFFER_MEMORY_INFO,VK_STRUCTURE_TYPE_BIND_IMAGE_MEMORY_INFO,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_16BIT_STORAGE_FEATURES,VK_STRUCTURE_TYPE_MEMORY_DEDICATED_REQUIREMENTS,VK_STRUCTURE_TYPE_MEMORY_DEDICATED_ALLOCATE_INFO,VK_STRUCTURE_TYPE_MEMORY_ALLOCATE_FLAGS_INFO,VK_STRUCTURE_TYPE_DEVICE_GROUP_RENDER_PASS_BEGIN_INFO,VK_STRUCTURE_TYPE_DEVICE_GROUP_COMMAND_BUFFER_BEGIN_INFO,VK_STRUCTURE_TYPE_DEVICE_GROUP_SUBMIT_INFO,VK_STRUCTURE_TYPE_DEVICE_GROUP_BIND_SPARSE_INFO,VK_STRUCTURE_TYPE_BIND_BUFFER_MEMORY_DEVICE_GROUP_INFO,VK_STRUCTURE_TYPE_BIND_IMAGE_MEMORY_DEVICE_GROUP_INFO,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_GROUP_PROPERTIES,VK_STRUCTURE_TYPE_DEVICE_GROUP_DEVICE_CREATE_INFO,VK_STRUCTURE_TYPE_BUFFER_MEMORY_REQUIREMENTS_INFO_2,VK_STRUCTURE_TYPE_IMAGE_MEMORY_REQUIREMENTS_INFO_2,VK_STRUCTURE_TYPE_IMAGE_SPARSE_MEMORY_REQUIREMENTS_INFO_2,VK_STRUCTURE_TYPE_MEMORY_REQUIREMENTS_2,VK_STRUCTURE_TYPE_SPARSE_IMAGE_MEMORY_REQUIREMENTS_2,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PROPERTIES_2,VK_STRUCTURE_TYPE_FORMAT_PROPERTIES_2,VK_STRUCTURE_TYPE_IMAGE_FORMAT_PROPERTIES_2,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_FORMAT_INFO_2,VK_STRUCTURE_TYPE_QUEUE_FAMILY_PROPERTIES_2,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MEMORY_PROPERTIES_2,VK_STRUCTURE_TYPE_SPARSE_IMAGE_FORMAT_PROPERTIES_2,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SPARSE_IMAGE_FORMAT_INFO_2,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_POINT_CLIPPING_PROPERTIES,VK_STRUCTURE_TYPE_RENDER_PASS_INPUT_ATTACHMENT_ASPECT_CREATE_INFO,VK_STRUCTURE_TYPE_IMAGE_VIEW_USAGE_CREATE_INFO,VK_STRUCTURE_TYPE_PIPELINE_TESSELLATION_DOMAIN_ORIGIN_STATE_CREATE_INFO,VK_STRUCTURE_TYPE_RENDER_PASS_MULTIVIEW_CREATE_INFO,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTIVIEW_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTIVIEW_PROPERTIES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VARIABLE_POINTERS_FEATURES,VK_STRUCTURE_TYPE_PROTECTED_SUBMIT_INFO,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PROTECTED_MEMORY_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PROTECTED_MEMORY_PROPERTIES,VK_STRUCTURE_TYPE_DEVICE_QUEUE_INFO_2,VK_STRUCTURE_TYPE_SAMPLER_YCBCR_CONVERSION_CREATE_INFO,VK_STRUCTURE_TYPE_SAMPLER_YCBCR_CONVERSION_INFO,VK_STRUCTURE_TYPE_BIND_IMAGE_PLANE_MEMORY_INFO,VK_STRUCTURE_TYPE_IMAGE_PLANE_MEMORY_REQUIREMENTS_INFO,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SAMPLER_YCBCR_CONVERSION_FEATURES,VK_STRUCTURE_TYPE_SAMPLER_YCBCR_CONVERSION_IMAGE_FORMAT_PROPERTIES,VK_STRUCTURE_TYPE_DESCRIPTOR_UPDATE_TEMPLATE_CREATE_INFO,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_IMAGE_FORMAT_INFO,VK_STRUCTURE_TYPE_EXTERNAL_IMAGE_FORMAT_PROPERTIES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_BUFFER_INFO,VK_STRUCTURE_TYPE_EXTERNAL_BUFFER_PROPERTIES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ID_PROPERTIES,VK_STRUCTURE_TYPE_EXTERNAL_MEMORY_BUFFER_CREATE_INFO,VK_STRUCTURE_TYPE_EXTERNAL_MEMORY_IMAGE_CREATE_INFO,VK_STRUCTURE_TYPE_EXPORT_MEMORY_ALLOCATE_INFO,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_FENCE_INFO,VK_STRUCTURE_TYPE_EXTERNAL_FENCE_PROPERTIES,VK_STRUCTURE_TYPE_EXPORT_FENCE_CREATE_INFO,VK_STRUCTURE_TYPE_EXPORT_SEMAPHORE_CREATE_INFO,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_SEMAPHORE_INFO,VK_STRUCTURE_TYPE_EXTERNAL_SEMAPHORE_PROPERTIES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_3_PROPERTIES,VK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_SUPPORT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_DRAW_PARAMETERS_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_1_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_1_PROPERTIES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_2_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_2_PROPERTIES,VK_STRUCTURE_TYPE_IMAGE_FORMAT_LIST_CREATE_INFO,VK_STRUCTURE_TYPE_ATTACHMENT_DESCRIPTION_2,VK_STRUCTURE_TYPE_ATTACHMENT_REFERENCE_2,VK_STRUCTURE_TYPE_SUBPASS_DESCRIPTION_2,VK_STRUCTURE_TYPE_SUBPASS_DEPENDENCY_2,VK_STRUCTURE_TYPE_RENDER_PASS_CREATE_INFO_2,VK_STRUCTURE_TYPE_SUBPASS_BEGIN_INFO,VK_STRUCTURE_TYPE_SUBPASS_END_INFO,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_8BIT_STORAGE_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DRIVER_PROPERTIES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_ATOMIC_INT64_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_FLOAT16_INT8_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FLOAT_CONTROLS_PROPERTIES,VK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_BINDING_FLAGS_CREATE_INFO,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_INDEXING_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_INDEXING_PROPERTIES,VK_STRUCTURE_TYPE_DESCRIPTOR_SET_VARIABLE_DESCRIPTOR_COUNT_ALLOCATE_INFO,VK_STRUCTURE_TYPE_DESCRIPTOR_SET_VARIABLE_DESCRIPTOR_COUNT_LAYOUT_SUPPORT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEPTH_STENCIL_RESOLVE_PROPERTIES,VK_STRUCTURE_TYPE_SUBPASS_DESCRIPTION_DEPTH_STENCIL_RESOLVE,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SCALAR_BLOCK_LAYOUT_FEATURES,VK_STRUCTURE_TYPE_IMAGE_STENCIL_USAGE_CREATE_INFO,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SAMPLER_FILTER_MINMAX_PROPERTIES,VK_STRUCTURE_TYPE_SAMPLER_REDUCTION_MODE_CREATE_INFO,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_MEMORY_MODEL_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGELESS_FRAMEBUFFER_FEATURES,VK_STRUCTURE_TYPE_FRAMEBUFFER_ATTACHMENTS_CREATE_INFO,VK_STRUCTURE_TYPE_FRAMEBUFFER_ATTACHMENT_IMAGE_INFO,VK_STRUCTURE_TYPE_RENDER_PASS_ATTACHMENT_BEGIN_INFO,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_UNIFORM_BUFFER_STANDARD_LAYOUT_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_SUBGROUP_EXTENDED_TYPES_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SEPARATE_DEPTH_STENCIL_LAYOUTS_FEATURES,VK_STRUCTURE_TYPE_ATTACHMENT_REFERENCE_STENCIL_LAYOUT,VK_STRUCTURE_TYPE_ATTACHMENT_DESCRIPTION_STENCIL_LAYOUT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_HOST_QUERY_RESET_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TIMELINE_SEMAPHORE_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TIMELINE_SEMAPHORE_PROPERTIES,VK_STRUCTURE_TYPE_SEMAPHORE_TYPE_CREATE_INFO,VK_STRUCTURE_TYPE_TIMELINE_SEMAPHORE_SUBMIT_INFO,VK_STRUCTURE_TYPE_SEMAPHORE_WAIT_INFO,VK_STRUCTURE_TYPE_SEMAPHORE_SIGNAL_INFO,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_BUFFER_DEVICE_ADDRESS_FEATURES,VK_STRUCTURE_TYPE_BUFFER_DEVICE_ADDRESS_INFO,VK_STRUCTURE_TYPE_BUFFER_OPAQUE_CAPTURE_ADDRESS_CREATE_INFO,VK_STRUCTURE_TYPE_MEMORY_OPAQUE_CAPTURE_ADDRESS_ALLOCATE_INFO,VK_STRUCTURE_TYPE_DEVICE_MEMORY_OPAQUE_CAPTURE_ADDRESS_INFO,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_3_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_3_PROPERTIES,VK_STRUCTURE_TYPE_PIPELINE_CREATION_FEEDBACK_CREATE_INFO,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_TERMINATE_INVOCATION_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TOOL_PROPERTIES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_DEMOTE_TO_HELPER_INVOCATION_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PRIVATE_DATA_FEATURES,VK_STRUCTURE_TYPE_DEVICE_PRIVATE_DATA_CREATE_INFO,VK_STRUCTURE_TYPE_PRIVATE_DATA_SLOT_CREATE_INFO,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PIPELINE_CREATION_CACHE_CONTROL_FEATURES,VK_STRUCTURE_TYPE_MEMORY_BARRIER_2,VK_STRUCTURE_TYPE_BUFFER_MEMORY_BARRIER_2,VK_STRUCTURE_TYPE_IMAGE_MEMORY_BARRIER_2,VK_STRUCTURE_TYPE_DEPENDENCY_INFO,VK_STRUCTURE_TYPE_SUBMIT_INFO_2,VK_STRUCTURE_TYPE_SEMAPHORE_SUBMIT_INFO,VK_STRUCTURE_TYPE_COMMAND_BUFFER_SUBMIT_INFO,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SYNCHRONIZATION_2_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ZERO_INITIALIZE_WORKGROUP_MEMORY_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_ROBUSTNESS_FEATURES,VK_STRUCTURE_TYPE_COPY_BUFFER_INFO_2,VK_STRUCTURE_TYPE_COPY_IMAGE_INFO_2,VK_STRUCTURE_TYPE_COPY_BUFFER_TO_IMAGE_INFO_2,VK_STRUCTURE_TYPE_COPY_IMAGE_TO_BUFFER_INFO_2,VK_STRUCTURE_TYPE_BLIT_IMAGE_INFO_2,VK_STRUCTURE_TYPE_RESOLVE_IMAGE_INFO_2,VK_STRUCTURE_TYPE_BUFFER_COPY_2,VK_STRUCTURE_TYPE_IMAGE_COPY_2,VK_STRUCTURE_TYPE_IMAGE_BLIT_2,VK_STRUCTURE_TYPE_BUFFER_IMAGE_COPY_2,VK_STRUCTURE_TYPE_IMAGE_RESOLVE_2,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBGROUP_SIZE_CONTROL_PROPERTIES,VK_STRUCTURE_TYPE_PIPELINE_SHADER_STAGE_REQUIRED_SUBGROUP_SIZE_CREATE_INFO,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBGROUP_SIZE_CONTROL_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_INLINE_UNIFORM_BLOCK_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_INLINE_UNIFORM_BLOCK_PROPERTIES,VK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET_INLINE_UNIFORM_BLOCK,VK_STRUCTURE_TYPE_DESCRIPTOR_POOL_INLINE_UNIFORM_BLOCK_CREATE_INFO,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TEXTURE_COMPRESSION_ASTC_HDR_FEATURES,VK_STRUCTURE_TYPE_RENDERING_INFO,VK_STRUCTURE_TYPE_RENDERING_ATTACHMENT_INFO,VK_STRUCTURE_TYPE_PIPELINE_RENDERING_CREATE_INFO,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DYNAMIC_RENDERING_FEATURES,VK_STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_RENDERING_INFO,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_INTEGER_DOT_PRODUCT_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_INTEGER_DOT_PRODUCT_PROPERTIES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TEXEL_BUFFER_ALIGNMENT_PROPERTIES,VK_STRUCTURE_TYPE_FORMAT_PROPERTIES_3,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_4_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_4_PROPERTIES,VK_STRUCTURE_TYPE_DEVICE_BUFFER_MEMORY_REQUIREMENTS,VK_STRUCTURE_TYPE_DEVICE_IMAGE_MEMORY_REQUIREMENTS,VK_STRUCTURE_TYPE_SWAPCHAIN_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_PRESENT_INFO_KHR,VK_STRUCTURE_TYPE_DEVICE_GROUP_PRESENT_CAPABILITIES_KHR,VK_STRUCTURE_TYPE_IMAGE_SWAPCHAIN_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_BIND_IMAGE_MEMORY_SWAPCHAIN_INFO_KHR,VK_STRUCTURE_TYPE_ACQUIRE_NEXT_IMAGE_INFO_KHR,VK_STRUCTURE_TYPE_DEVICE_GROUP_PRESENT_INFO_KHR,VK_STRUCTURE_TYPE_DEVICE_GROUP_SWAPCHAIN_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_DISPLAY_MODE_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_DISPLAY_SURFACE_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_DISPLAY_PRESENT_INFO_KHR,VK_STRUCTURE_TYPE_XLIB_SURFACE_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_XCB_SURFACE_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_WAYLAND_SURFACE_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_ANDROID_SURFACE_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_WIN32_SURFACE_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_DEBUG_REPORT_CALLBACK_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_STATE_RASTERIZATION_ORDER_AMD,VK_STRUCTURE_TYPE_DEBUG_MARKER_OBJECT_NAME_INFO_EXT,VK_STRUCTURE_TYPE_DEBUG_MARKER_OBJECT_TAG_INFO_EXT,VK_STRUCTURE_TYPE_DEBUG_MARKER_MARKER_INFO_EXT,VK_STRUCTURE_TYPE_VIDEO_PROFILE_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_CAPABILITIES_KHR,VK_STRUCTURE_TYPE_VIDEO_PICTURE_RESOURCE_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_SESSION_MEMORY_REQUIREMENTS_KHR,VK_STRUCTURE_TYPE_BIND_VIDEO_SESSION_MEMORY_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_SESSION_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_SESSION_PARAMETERS_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_SESSION_PARAMETERS_UPDATE_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_BEGIN_CODING_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_END_CODING_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_CODING_CONTROL_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_REFERENCE_SLOT_INFO_KHR,VK_STRUCTURE_TYPE_QUEUE_FAMILY_VIDEO_PROPERTIES_KHR,VK_STRUCTURE_TYPE_VIDEO_PROFILE_LIST_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VIDEO_FORMAT_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_FORMAT_PROPERTIES_KHR,VK_STRUCTURE_TYPE_QUEUE_FAMILY_QUERY_RESULT_STATUS_PROPERTIES_KHR,VK_STRUCTURE_TYPE_VIDEO_DECODE_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_DECODE_CAPABILITIES_KHR,VK_STRUCTURE_TYPE_VIDEO_DECODE_USAGE_INFO_KHR,VK_STRUCTURE_TYPE_DEDICATED_ALLOCATION_IMAGE_CREATE_INFO_NV,VK_STRUCTURE_TYPE_DEDICATED_ALLOCATION_BUFFER_CREATE_INFO_NV,VK_STRUCTURE_TYPE_DEDICATED_ALLOCATION_MEMORY_ALLOCATE_INFO_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TRANSFORM_FEEDBACK_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TRANSFORM_FEEDBACK_PROPERTIES_EXT,VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_STATE_STREAM_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_CU_MODULE_CREATE_INFO_NVX,VK_STRUCTURE_TYPE_CU_FUNCTION_CREATE_INFO_NVX,VK_STRUCTURE_TYPE_CU_LAUNCH_INFO_NVX,VK_STRUCTURE_TYPE_IMAGE_VIEW_HANDLE_INFO_NVX,VK_STRUCTURE_TYPE_IMAGE_VIEW_ADDRESS_PROPERTIES_NVX,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_CAPABILITIES_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_SESSION_PARAMETERS_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_SESSION_PARAMETERS_ADD_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_PICTURE_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_DPB_SLOT_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_NALU_SLICE_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_GOP_REMAINING_FRAME_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_PROFILE_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_RATE_CONTROL_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_RATE_CONTROL_LAYER_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_SESSION_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_QUALITY_LEVEL_PROPERTIES_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_SESSION_PARAMETERS_GET_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H264_SESSION_PARAMETERS_FEEDBACK_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_CAPABILITIES_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_SESSION_PARAMETERS_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_SESSION_PARAMETERS_ADD_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_PICTURE_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_DPB_SLOT_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_NALU_SLICE_SEGMENT_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_GOP_REMAINING_FRAME_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_PROFILE_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_RATE_CONTROL_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_RATE_CONTROL_LAYER_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_SESSION_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_QUALITY_LEVEL_PROPERTIES_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_SESSION_PARAMETERS_GET_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_H265_SESSION_PARAMETERS_FEEDBACK_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_DECODE_H264_CAPABILITIES_KHR,VK_STRUCTURE_TYPE_VIDEO_DECODE_H264_PICTURE_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_DECODE_H264_PROFILE_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_DECODE_H264_SESSION_PARAMETERS_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_DECODE_H264_SESSION_PARAMETERS_ADD_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_DECODE_H264_DPB_SLOT_INFO_KHR,VK_STRUCTURE_TYPE_TEXTURE_LOD_GATHER_FORMAT_PROPERTIES_AMD,VK_STRUCTURE_TYPE_RENDERING_FRAGMENT_SHADING_RATE_ATTACHMENT_INFO_KHR,VK_STRUCTURE_TYPE_RENDERING_FRAGMENT_DENSITY_MAP_ATTACHMENT_INFO_EXT,VK_STRUCTURE_TYPE_ATTACHMENT_SAMPLE_COUNT_INFO_AMD,VK_STRUCTURE_TYPE_MULTIVIEW_PER_VIEW_ATTRIBUTES_INFO_NVX,VK_STRUCTURE_TYPE_STREAM_DESCRIPTOR_SURFACE_CREATE_INFO_GGP,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CORNER_SAMPLED_IMAGE_FEATURES_NV,VK_STRUCTURE_TYPE_EXTERNAL_MEMORY_IMAGE_CREATE_INFO_NV,VK_STRUCTURE_TYPE_EXPORT_MEMORY_ALLOCATE_INFO_NV,VK_STRUCTURE_TYPE_IMPORT_MEMORY_WIN32_HANDLE_INFO_NV,VK_STRUCTURE_TYPE_EXPORT_MEMORY_WIN32_HANDLE_INFO_NV,VK_STRUCTURE_TYPE_WIN32_KEYED_MUTEX_ACQUIRE_RELEASE_INFO_NV,VK_STRUCTURE_TYPE_VALIDATION_FLAGS_EXT,VK_STRUCTURE_TYPE_VI_SURFACE_CREATE_INFO_NN,VK_STRUCTURE_TYPE_IMAGE_VIEW_ASTC_DECODE_MODE_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ASTC_DECODE_FEATURES_EXT,VK_STRUCTURE_TYPE_PIPELINE_ROBUSTNESS_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PIPELINE_ROBUSTNESS_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PIPELINE_ROBUSTNESS_PROPERTIES_EXT,VK_STRUCTURE_TYPE_IMPORT_MEMORY_WIN32_HANDLE_INFO_KHR,VK_STRUCTURE_TYPE_EXPORT_MEMORY_WIN32_HANDLE_INFO_KHR,VK_STRUCTURE_TYPE_MEMORY_WIN32_HANDLE_PROPERTIES_KHR,VK_STRUCTURE_TYPE_MEMORY_GET_WIN32_HANDLE_INFO_KHR,VK_STRUCTURE_TYPE_IMPORT_MEMORY_FD_INFO_KHR,VK_STRUCTURE_TYPE_MEMORY_FD_PROPERTIES_KHR,VK_STRUCTURE_TYPE_MEMORY_GET_FD_INFO_KHR,VK_STRUCTURE_TYPE_WIN32_KEYED_MUTEX_ACQUIRE_RELEASE_INFO_KHR,VK_STRUCTURE_TYPE_IMPORT_SEMAPHORE_WIN32_HANDLE_INFO_KHR,VK_STRUCTURE_TYPE_EXPORT_SEMAPHORE_WIN32_HANDLE_INFO_KHR,VK_STRUCTURE_TYPE_D3D12_FENCE_SUBMIT_INFO_KHR,VK_STRUCTURE_TYPE_SEMAPHORE_GET_WIN32_HANDLE_INFO_KHR,VK_STRUCTURE_TYPE_IMPORT_SEMAPHORE_FD_INFO_KHR,VK_STRUCTURE_TYPE_SEMAPHORE_GET_FD_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PUSH_DESCRIPTOR_PROPERTIES_KHR,VK_STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_CONDITIONAL_RENDERING_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CONDITIONAL_RENDERING_FEATURES_EXT,VK_STRUCTURE_TYPE_CONDITIONAL_RENDERING_BEGIN_INFO_EXT,VK_STRUCTURE_TYPE_PRESENT_REGIONS_KHR,VK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_W_SCALING_STATE_CREATE_INFO_NV,VK_STRUCTURE_TYPE_SURFACE_CAPABILITIES_2_EXT,VK_STRUCTURE_TYPE_DISPLAY_POWER_INFO_EXT,VK_STRUCTURE_TYPE_DEVICE_EVENT_INFO_EXT,VK_STRUCTURE_TYPE_DISPLAY_EVENT_INFO_EXT,VK_STRUCTURE_TYPE_SWAPCHAIN_COUNTER_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PRESENT_TIMES_INFO_GOOGLE,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTIVIEW_PER_VIEW_ATTRIBUTES_PROPERTIES_NVX,VK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_SWIZZLE_STATE_CREATE_INFO_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DISCARD_RECTANGLE_PROPERTIES_EXT,VK_STRUCTURE_TYPE_PIPELINE_DISCARD_RECTANGLE_STATE_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CONSERVATIVE_RASTERIZATION_PROPERTIES_EXT,VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_CONSERVATIVE_STATE_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEPTH_CLIP_ENABLE_FEATURES_EXT,VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_DEPTH_CLIP_STATE_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_HDR_METADATA_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RELAXED_LINE_RASTERIZATION_FEATURES_IMG,VK_STRUCTURE_TYPE_SHARED_PRESENT_SURFACE_CAPABILITIES_KHR,VK_STRUCTURE_TYPE_IMPORT_FENCE_WIN32_HANDLE_INFO_KHR,VK_STRUCTURE_TYPE_EXPORT_FENCE_WIN32_HANDLE_INFO_KHR,VK_STRUCTURE_TYPE_FENCE_GET_WIN32_HANDLE_INFO_KHR,VK_STRUCTURE_TYPE_IMPORT_FENCE_FD_INFO_KHR,VK_STRUCTURE_TYPE_FENCE_GET_FD_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PERFORMANCE_QUERY_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PERFORMANCE_QUERY_PROPERTIES_KHR,VK_STRUCTURE_TYPE_QUERY_POOL_PERFORMANCE_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_PERFORMANCE_QUERY_SUBMIT_INFO_KHR,VK_STRUCTURE_TYPE_ACQUIRE_PROFILING_LOCK_INFO_KHR,VK_STRUCTURE_TYPE_PERFORMANCE_COUNTER_KHR,VK_STRUCTURE_TYPE_PERFORMANCE_COUNTER_DESCRIPTION_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SURFACE_INFO_2_KHR,VK_STRUCTURE_TYPE_SURFACE_CAPABILITIES_2_KHR,VK_STRUCTURE_TYPE_SURFACE_FORMAT_2_KHR,VK_STRUCTURE_TYPE_DISPLAY_PROPERTIES_2_KHR,VK_STRUCTURE_TYPE_DISPLAY_PLANE_PROPERTIES_2_KHR,VK_STRUCTURE_TYPE_DISPLAY_MODE_PROPERTIES_2_KHR,VK_STRUCTURE_TYPE_DISPLAY_PLANE_INFO_2_KHR,VK_STRUCTURE_TYPE_DISPLAY_PLANE_CAPABILITIES_2_KHR,VK_STRUCTURE_TYPE_IOS_SURFACE_CREATE_INFO_MVK,VK_STRUCTURE_TYPE_MACOS_SURFACE_CREATE_INFO_MVK,VK_STRUCTURE_TYPE_DEBUG_UTILS_OBJECT_NAME_INFO_EXT,VK_STRUCTURE_TYPE_DEBUG_UTILS_OBJECT_TAG_INFO_EXT,VK_STRUCTURE_TYPE_DEBUG_UTILS_LABEL_EXT,VK_STRUCTURE_TYPE_DEBUG_UTILS_MESSENGER_CALLBACK_DATA_EXT,VK_STRUCTURE_TYPE_DEBUG_UTILS_MESSENGER_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_ANDROID_HARDWARE_BUFFER_USAGE_ANDROID,VK_STRUCTURE_TYPE_ANDROID_HARDWARE_BUFFER_PROPERTIES_ANDROID,VK_STRUCTURE_TYPE_ANDROID_HARDWARE_BUFFER_FORMAT_PROPERTIES_ANDROID,VK_STRUCTURE_TYPE_IMPORT_ANDROID_HARDWARE_BUFFER_INFO_ANDROID,VK_STRUCTURE_TYPE_MEMORY_GET_ANDROID_HARDWARE_BUFFER_INFO_ANDROID,VK_STRUCTURE_TYPE_EXTERNAL_FORMAT_ANDROID,VK_STRUCTURE_TYPE_ANDROID_HARDWARE_BUFFER_FORMAT_PROPERTIES_2_ANDROID,VK_STRUCTURE_TYPE_SAMPLE_LOCATIONS_INFO_EXT,VK_STRUCTURE_TYPE_RENDER_PASS_SAMPLE_LOCATIONS_BEGIN_INFO_EXT,VK_STRUCTURE_TYPE_PIPELINE_SAMPLE_LOCATIONS_STATE_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SAMPLE_LOCATIONS_PROPERTIES_EXT,VK_STRUCTURE_TYPE_MULTISAMPLE_PROPERTIES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_BLEND_OPERATION_ADVANCED_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_BLEND_OPERATION_ADVANCED_PROPERTIES_EXT,VK_STRUCTURE_TYPE_PIPELINE_COLOR_BLEND_ADVANCED_STATE_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PIPELINE_COVERAGE_TO_COLOR_STATE_CREATE_INFO_NV,VK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET_ACCELERATION_STRUCTURE_KHR,VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_BUILD_GEOMETRY_INFO_KHR,VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_DEVICE_ADDRESS_INFO_KHR,VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_GEOMETRY_AABBS_DATA_KHR,VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_GEOMETRY_INSTANCES_DATA_KHR,VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_GEOMETRY_TRIANGLES_DATA_KHR,VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_GEOMETRY_KHR,VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_VERSION_INFO_KHR,VK_STRUCTURE_TYPE_COPY_ACCELERATION_STRUCTURE_INFO_KHR,VK_STRUCTURE_TYPE_COPY_ACCELERATION_STRUCTURE_TO_MEMORY_INFO_KHR,VK_STRUCTURE_TYPE_COPY_MEMORY_TO_ACCELERATION_STRUCTURE_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ACCELERATION_STRUCTURE_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ACCELERATION_STRUCTURE_PROPERTIES_KHR,VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_BUILD_SIZES_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_PIPELINE_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_PIPELINE_PROPERTIES_KHR,VK_STRUCTURE_TYPE_RAY_TRACING_PIPELINE_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_RAY_TRACING_SHADER_GROUP_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_RAY_TRACING_PIPELINE_INTERFACE_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_QUERY_FEATURES_KHR,VK_STRUCTURE_TYPE_PIPELINE_COVERAGE_MODULATION_STATE_CREATE_INFO_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_SM_BUILTINS_FEATURES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_SM_BUILTINS_PROPERTIES_NV,VK_STRUCTURE_TYPE_DRM_FORMAT_MODIFIER_PROPERTIES_LIST_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_DRM_FORMAT_MODIFIER_INFO_EXT,VK_STRUCTURE_TYPE_IMAGE_DRM_FORMAT_MODIFIER_LIST_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_IMAGE_DRM_FORMAT_MODIFIER_EXPLICIT_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_IMAGE_DRM_FORMAT_MODIFIER_PROPERTIES_EXT,VK_STRUCTURE_TYPE_DRM_FORMAT_MODIFIER_PROPERTIES_LIST_2_EXT,VK_STRUCTURE_TYPE_VALIDATION_CACHE_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_SHADER_MODULE_VALIDATION_CACHE_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_SHADING_RATE_IMAGE_STATE_CREATE_INFO_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADING_RATE_IMAGE_FEATURES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADING_RATE_IMAGE_PROPERTIES_NV,VK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_COARSE_SAMPLE_ORDER_STATE_CREATE_INFO_NV,VK_STRUCTURE_TYPE_RAY_TRACING_PIPELINE_CREATE_INFO_NV,VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_CREATE_INFO_NV,VK_STRUCTURE_TYPE_GEOMETRY_NV,VK_STRUCTURE_TYPE_GEOMETRY_TRIANGLES_NV,VK_STRUCTURE_TYPE_GEOMETRY_AABB_NV,VK_STRUCTURE_TYPE_BIND_ACCELERATION_STRUCTURE_MEMORY_INFO_NV,VK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET_ACCELERATION_STRUCTURE_NV,VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_MEMORY_REQUIREMENTS_INFO_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_PROPERTIES_NV,VK_STRUCTURE_TYPE_RAY_TRACING_SHADER_GROUP_CREATE_INFO_NV,VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_INFO_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_REPRESENTATIVE_FRAGMENT_TEST_FEATURES_NV,VK_STRUCTURE_TYPE_PIPELINE_REPRESENTATIVE_FRAGMENT_TEST_STATE_CREATE_INFO_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_VIEW_IMAGE_FORMAT_INFO_EXT,VK_STRUCTURE_TYPE_FILTER_CUBIC_IMAGE_VIEW_IMAGE_FORMAT_PROPERTIES_EXT,VK_STRUCTURE_TYPE_IMPORT_MEMORY_HOST_POINTER_INFO_EXT,VK_STRUCTURE_TYPE_MEMORY_HOST_POINTER_PROPERTIES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_MEMORY_HOST_PROPERTIES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_CLOCK_FEATURES_KHR,VK_STRUCTURE_TYPE_PIPELINE_COMPILER_CONTROL_CREATE_INFO_AMD,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_CORE_PROPERTIES_AMD,VK_STRUCTURE_TYPE_VIDEO_DECODE_H265_CAPABILITIES_KHR,VK_STRUCTURE_TYPE_VIDEO_DECODE_H265_SESSION_PARAMETERS_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_DECODE_H265_SESSION_PARAMETERS_ADD_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_DECODE_H265_PROFILE_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_DECODE_H265_PICTURE_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_DECODE_H265_DPB_SLOT_INFO_KHR,VK_STRUCTURE_TYPE_DEVICE_QUEUE_GLOBAL_PRIORITY_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_GLOBAL_PRIORITY_QUERY_FEATURES_KHR,VK_STRUCTURE_TYPE_QUEUE_FAMILY_GLOBAL_PRIORITY_PROPERTIES_KHR,VK_STRUCTURE_TYPE_DEVICE_MEMORY_OVERALLOCATION_CREATE_INFO_AMD,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_PROPERTIES_EXT,VK_STRUCTURE_TYPE_PRESENT_FRAME_TOKEN_GGP,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COMPUTE_SHADER_DERIVATIVES_FEATURES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MESH_SHADER_FEATURES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MESH_SHADER_PROPERTIES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_IMAGE_FOOTPRINT_FEATURES_NV,VK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_EXCLUSIVE_SCISSOR_STATE_CREATE_INFO_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXCLUSIVE_SCISSOR_FEATURES_NV,VK_STRUCTURE_TYPE_CHECKPOINT_DATA_NV,VK_STRUCTURE_TYPE_QUEUE_FAMILY_CHECKPOINT_PROPERTIES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_INTEGER_FUNCTIONS_2_FEATURES_INTEL,VK_STRUCTURE_TYPE_QUERY_POOL_PERFORMANCE_QUERY_CREATE_INFO_INTEL,VK_STRUCTURE_TYPE_INITIALIZE_PERFORMANCE_API_INFO_INTEL,VK_STRUCTURE_TYPE_PERFORMANCE_MARKER_INFO_INTEL,VK_STRUCTURE_TYPE_PERFORMANCE_STREAM_MARKER_INFO_INTEL,VK_STRUCTURE_TYPE_PERFORMANCE_OVERRIDE_INFO_INTEL,VK_STRUCTURE_TYPE_PERFORMANCE_CONFIGURATION_ACQUIRE_INFO_INTEL,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PCI_BUS_INFO_PROPERTIES_EXT,VK_STRUCTURE_TYPE_DISPLAY_NATIVE_HDR_SURFACE_CAPABILITIES_AMD,VK_STRUCTURE_TYPE_SWAPCHAIN_DISPLAY_NATIVE_HDR_CREATE_INFO_AMD,VK_STRUCTURE_TYPE_IMAGEPIPE_SURFACE_CREATE_INFO_FUCHSIA,VK_STRUCTURE_TYPE_METAL_SURFACE_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_PROPERTIES_EXT,VK_STRUCTURE_TYPE_RENDER_PASS_FRAGMENT_DENSITY_MAP_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_FRAGMENT_SHADING_RATE_ATTACHMENT_INFO_KHR,VK_STRUCTURE_TYPE_PIPELINE_FRAGMENT_SHADING_RATE_STATE_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_PROPERTIES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_CORE_PROPERTIES_2_AMD,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COHERENT_MEMORY_FEATURES_AMD,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_IMAGE_ATOMIC_INT64_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MEMORY_BUDGET_PROPERTIES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MEMORY_PRIORITY_FEATURES_EXT,VK_STRUCTURE_TYPE_MEMORY_PRIORITY_ALLOCATE_INFO_EXT,VK_STRUCTURE_TYPE_SURFACE_PROTECTED_CAPABILITIES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEDICATED_ALLOCATION_IMAGE_ALIASING_FEATURES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_BUFFER_DEVICE_ADDRESS_FEATURES_EXT,VK_STRUCTURE_TYPE_BUFFER_DEVICE_ADDRESS_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_VALIDATION_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PRESENT_WAIT_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COOPERATIVE_MATRIX_FEATURES_NV,VK_STRUCTURE_TYPE_COOPERATIVE_MATRIX_PROPERTIES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COOPERATIVE_MATRIX_PROPERTIES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COVERAGE_REDUCTION_MODE_FEATURES_NV,VK_STRUCTURE_TYPE_PIPELINE_COVERAGE_REDUCTION_STATE_CREATE_INFO_NV,VK_STRUCTURE_TYPE_FRAMEBUFFER_MIXED_SAMPLES_COMBINATION_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADER_INTERLOCK_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_YCBCR_IMAGE_ARRAYS_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PROVOKING_VERTEX_FEATURES_EXT,VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_PROVOKING_VERTEX_STATE_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PROVOKING_VERTEX_PROPERTIES_EXT,VK_STRUCTURE_TYPE_SURFACE_FULL_SCREEN_EXCLUSIVE_INFO_EXT,VK_STRUCTURE_TYPE_SURFACE_CAPABILITIES_FULL_SCREEN_EXCLUSIVE_EXT,VK_STRUCTURE_TYPE_SURFACE_FULL_SCREEN_EXCLUSIVE_WIN32_INFO_EXT,VK_STRUCTURE_TYPE_HEADLESS_SURFACE_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_LINE_RASTERIZATION_FEATURES_EXT,VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_LINE_STATE_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_LINE_RASTERIZATION_PROPERTIES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_ATOMIC_FLOAT_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_INDEX_TYPE_UINT8_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PIPELINE_EXECUTABLE_PROPERTIES_FEATURES_KHR,VK_STRUCTURE_TYPE_PIPELINE_INFO_KHR,VK_STRUCTURE_TYPE_PIPELINE_EXECUTABLE_PROPERTIES_KHR,VK_STRUCTURE_TYPE_PIPELINE_EXECUTABLE_INFO_KHR,VK_STRUCTURE_TYPE_PIPELINE_EXECUTABLE_STATISTIC_KHR,VK_STRUCTURE_TYPE_PIPELINE_EXECUTABLE_INTERNAL_REPRESENTATION_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_HOST_IMAGE_COPY_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_HOST_IMAGE_COPY_PROPERTIES_EXT,VK_STRUCTURE_TYPE_MEMORY_TO_IMAGE_COPY_EXT,VK_STRUCTURE_TYPE_IMAGE_TO_MEMORY_COPY_EXT,VK_STRUCTURE_TYPE_COPY_IMAGE_TO_MEMORY_INFO_EXT,VK_STRUCTURE_TYPE_COPY_MEMORY_TO_IMAGE_INFO_EXT,VK_STRUCTURE_TYPE_HOST_IMAGE_LAYOUT_TRANSITION_INFO_EXT,VK_STRUCTURE_TYPE_COPY_IMAGE_TO_IMAGE_INFO_EXT,VK_STRUCTURE_TYPE_SUBRESOURCE_HOST_MEMCPY_SIZE_EXT,VK_STRUCTURE_TYPE_HOST_IMAGE_COPY_DEVICE_PERFORMANCE_QUERY_EXT,VK_STRUCTURE_TYPE_MEMORY_MAP_INFO_KHR,VK_STRUCTURE_TYPE_MEMORY_UNMAP_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_ATOMIC_FLOAT_2_FEATURES_EXT,VK_STRUCTURE_TYPE_SURFACE_PRESENT_MODE_EXT,VK_STRUCTURE_TYPE_SURFACE_PRESENT_SCALING_CAPABILITIES_EXT,VK_STRUCTURE_TYPE_SURFACE_PRESENT_MODE_COMPATIBILITY_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SWAPCHAIN_MAINTENANCE_1_FEATURES_EXT,VK_STRUCTURE_TYPE_SWAPCHAIN_PRESENT_FENCE_INFO_EXT,VK_STRUCTURE_TYPE_SWAPCHAIN_PRESENT_MODES_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_SWAPCHAIN_PRESENT_MODE_INFO_EXT,VK_STRUCTURE_TYPE_SWAPCHAIN_PRESENT_SCALING_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_RELEASE_SWAPCHAIN_IMAGES_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_PROPERTIES_NV,VK_STRUCTURE_TYPE_GRAPHICS_SHADER_GROUP_CREATE_INFO_NV,VK_STRUCTURE_TYPE_GRAPHICS_PIPELINE_SHADER_GROUPS_CREATE_INFO_NV,VK_STRUCTURE_TYPE_INDIRECT_COMMANDS_LAYOUT_TOKEN_NV,VK_STRUCTURE_TYPE_INDIRECT_COMMANDS_LAYOUT_CREATE_INFO_NV,VK_STRUCTURE_TYPE_GENERATED_COMMANDS_INFO_NV,VK_STRUCTURE_TYPE_GENERATED_COMMANDS_MEMORY_REQUIREMENTS_INFO_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_FEATURES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_INHERITED_VIEWPORT_SCISSOR_FEATURES_NV,VK_STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_VIEWPORT_SCISSOR_INFO_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TEXEL_BUFFER_ALIGNMENT_FEATURES_EXT,VK_STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_RENDER_PASS_TRANSFORM_INFO_QCOM,VK_STRUCTURE_TYPE_RENDER_PASS_TRANSFORM_BEGIN_INFO_QCOM,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEPTH_BIAS_CONTROL_FEATURES_EXT,VK_STRUCTURE_TYPE_DEPTH_BIAS_INFO_EXT,VK_STRUCTURE_TYPE_DEPTH_BIAS_REPRESENTATION_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEVICE_MEMORY_REPORT_FEATURES_EXT,VK_STRUCTURE_TYPE_DEVICE_DEVICE_MEMORY_REPORT_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_DEVICE_MEMORY_REPORT_CALLBACK_DATA_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ROBUSTNESS_2_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ROBUSTNESS_2_PROPERTIES_EXT,VK_STRUCTURE_TYPE_SAMPLER_CUSTOM_BORDER_COLOR_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CUSTOM_BORDER_COLOR_PROPERTIES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CUSTOM_BORDER_COLOR_FEATURES_EXT,VK_STRUCTURE_TYPE_PIPELINE_LIBRARY_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PRESENT_BARRIER_FEATURES_NV,VK_STRUCTURE_TYPE_SURFACE_CAPABILITIES_PRESENT_BARRIER_NV,VK_STRUCTURE_TYPE_SWAPCHAIN_PRESENT_BARRIER_CREATE_INFO_NV,VK_STRUCTURE_TYPE_PRESENT_ID_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PRESENT_ID_FEATURES_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_RATE_CONTROL_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_RATE_CONTROL_LAYER_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_CAPABILITIES_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_USAGE_INFO_KHR,VK_STRUCTURE_TYPE_QUERY_POOL_VIDEO_ENCODE_FEEDBACK_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VIDEO_ENCODE_QUALITY_LEVEL_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_QUALITY_LEVEL_PROPERTIES_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_QUALITY_LEVEL_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_SESSION_PARAMETERS_GET_INFO_KHR,VK_STRUCTURE_TYPE_VIDEO_ENCODE_SESSION_PARAMETERS_FEEDBACK_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DIAGNOSTICS_CONFIG_FEATURES_NV,VK_STRUCTURE_TYPE_DEVICE_DIAGNOSTICS_CONFIG_CREATE_INFO_NV,VK_STRUCTURE_TYPE_CUDA_MODULE_CREATE_INFO_NV,VK_STRUCTURE_TYPE_CUDA_FUNCTION_CREATE_INFO_NV,VK_STRUCTURE_TYPE_CUDA_LAUNCH_INFO_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CUDA_KERNEL_LAUNCH_FEATURES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CUDA_KERNEL_LAUNCH_PROPERTIES_NV,VK_STRUCTURE_TYPE_QUERY_LOW_LATENCY_SUPPORT_NV,VK_STRUCTURE_TYPE_EXPORT_METAL_OBJECT_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_EXPORT_METAL_OBJECTS_INFO_EXT,VK_STRUCTURE_TYPE_EXPORT_METAL_DEVICE_INFO_EXT,VK_STRUCTURE_TYPE_EXPORT_METAL_COMMAND_QUEUE_INFO_EXT,VK_STRUCTURE_TYPE_EXPORT_METAL_BUFFER_INFO_EXT,VK_STRUCTURE_TYPE_IMPORT_METAL_BUFFER_INFO_EXT,VK_STRUCTURE_TYPE_EXPORT_METAL_TEXTURE_INFO_EXT,VK_STRUCTURE_TYPE_IMPORT_METAL_TEXTURE_INFO_EXT,VK_STRUCTURE_TYPE_EXPORT_METAL_IO_SURFACE_INFO_EXT,VK_STRUCTURE_TYPE_IMPORT_METAL_IO_SURFACE_INFO_EXT,VK_STRUCTURE_TYPE_EXPORT_METAL_SHARED_EVENT_INFO_EXT,VK_STRUCTURE_TYPE_IMPORT_METAL_SHARED_EVENT_INFO_EXT,VK_STRUCTURE_TYPE_QUEUE_FAMILY_CHECKPOINT_PROPERTIES_2_NV,VK_STRUCTURE_TYPE_CHECKPOINT_DATA_2_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_PROPERTIES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_DENSITY_MAP_PROPERTIES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_FEATURES_EXT,VK_STRUCTURE_TYPE_DESCRIPTOR_ADDRESS_INFO_EXT,VK_STRUCTURE_TYPE_DESCRIPTOR_GET_INFO_EXT,VK_STRUCTURE_TYPE_BUFFER_CAPTURE_DESCRIPTOR_DATA_INFO_EXT,VK_STRUCTURE_TYPE_IMAGE_CAPTURE_DESCRIPTOR_DATA_INFO_EXT,VK_STRUCTURE_TYPE_IMAGE_VIEW_CAPTURE_DESCRIPTOR_DATA_INFO_EXT,VK_STRUCTURE_TYPE_SAMPLER_CAPTURE_DESCRIPTOR_DATA_INFO_EXT,VK_STRUCTURE_TYPE_OPAQUE_CAPTURE_DESCRIPTOR_DATA_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_DESCRIPTOR_BUFFER_BINDING_INFO_EXT,VK_STRUCTURE_TYPE_DESCRIPTOR_BUFFER_BINDING_PUSH_DESCRIPTOR_BUFFER_HANDLE_EXT,VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_CAPTURE_DESCRIPTOR_DATA_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_GRAPHICS_PIPELINE_LIBRARY_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_GRAPHICS_PIPELINE_LIBRARY_PROPERTIES_EXT,VK_STRUCTURE_TYPE_GRAPHICS_PIPELINE_LIBRARY_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_EARLY_AND_LATE_FRAGMENT_TESTS_FEATURES_AMD,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADER_BARYCENTRIC_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADER_BARYCENTRIC_PROPERTIES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_SUBGROUP_UNIFORM_CONTROL_FLOW_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_ENUMS_PROPERTIES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_ENUMS_FEATURES_NV,VK_STRUCTURE_TYPE_PIPELINE_FRAGMENT_SHADING_RATE_ENUM_STATE_CREATE_INFO_NV,VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_GEOMETRY_MOTION_TRIANGLES_DATA_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_MOTION_BLUR_FEATURES_NV,VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_MOTION_INFO_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MESH_SHADER_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MESH_SHADER_PROPERTIES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_YCBCR_2_PLANE_444_FORMATS_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_2_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_2_PROPERTIES_EXT,VK_STRUCTURE_TYPE_COPY_COMMAND_TRANSFORM_INFO_QCOM,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_WORKGROUP_MEMORY_EXPLICIT_LAYOUT_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_COMPRESSION_CONTROL_FEATURES_EXT,VK_STRUCTURE_TYPE_IMAGE_COMPRESSION_CONTROL_EXT,VK_STRUCTURE_TYPE_IMAGE_COMPRESSION_PROPERTIES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ATTACHMENT_FEEDBACK_LOOP_LAYOUT_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_4444_FORMATS_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FAULT_FEATURES_EXT,VK_STRUCTURE_TYPE_DEVICE_FAULT_COUNTS_EXT,VK_STRUCTURE_TYPE_DEVICE_FAULT_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RGBA10X6_FORMATS_FEATURES_EXT,VK_STRUCTURE_TYPE_DIRECTFB_SURFACE_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VERTEX_INPUT_DYNAMIC_STATE_FEATURES_EXT,VK_STRUCTURE_TYPE_VERTEX_INPUT_BINDING_DESCRIPTION_2_EXT,VK_STRUCTURE_TYPE_VERTEX_INPUT_ATTRIBUTE_DESCRIPTION_2_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DRM_PROPERTIES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ADDRESS_BINDING_REPORT_FEATURES_EXT,VK_STRUCTURE_TYPE_DEVICE_ADDRESS_BINDING_CALLBACK_DATA_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEPTH_CLIP_CONTROL_FEATURES_EXT,VK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_DEPTH_CLIP_CONTROL_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PRIMITIVE_TOPOLOGY_LIST_RESTART_FEATURES_EXT,VK_STRUCTURE_TYPE_IMPORT_MEMORY_ZIRCON_HANDLE_INFO_FUCHSIA,VK_STRUCTURE_TYPE_MEMORY_ZIRCON_HANDLE_PROPERTIES_FUCHSIA,VK_STRUCTURE_TYPE_MEMORY_GET_ZIRCON_HANDLE_INFO_FUCHSIA,VK_STRUCTURE_TYPE_IMPORT_SEMAPHORE_ZIRCON_HANDLE_INFO_FUCHSIA,VK_STRUCTURE_TYPE_SEMAPHORE_GET_ZIRCON_HANDLE_INFO_FUCHSIA,VK_STRUCTURE_TYPE_BUFFER_COLLECTION_CREATE_INFO_FUCHSIA,VK_STRUCTURE_TYPE_IMPORT_MEMORY_BUFFER_COLLECTION_FUCHSIA,VK_STRUCTURE_TYPE_BUFFER_COLLECTION_IMAGE_CREATE_INFO_FUCHSIA,VK_STRUCTURE_TYPE_BUFFER_COLLECTION_PROPERTIES_FUCHSIA,VK_STRUCTURE_TYPE_BUFFER_CONSTRAINTS_INFO_FUCHSIA,VK_STRUCTURE_TYPE_BUFFER_COLLECTION_BUFFER_CREATE_INFO_FUCHSIA,VK_STRUCTURE_TYPE_IMAGE_CONSTRAINTS_INFO_FUCHSIA,VK_STRUCTURE_TYPE_IMAGE_FORMAT_CONSTRAINTS_INFO_FUCHSIA,VK_STRUCTURE_TYPE_SYSMEM_COLOR_SPACE_FUCHSIA,VK_STRUCTURE_TYPE_BUFFER_COLLECTION_CONSTRAINTS_INFO_FUCHSIA,VK_STRUCTURE_TYPE_SUBPASS_SHADING_PIPELINE_CREATE_INFO_HUAWEI,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBPASS_SHADING_FEATURES_HUAWEI,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBPASS_SHADING_PROPERTIES_HUAWEI,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_INVOCATION_MASK_FEATURES_HUAWEI,VK_STRUCTURE_TYPE_MEMORY_GET_REMOTE_ADDRESS_INFO_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_MEMORY_RDMA_FEATURES_NV,VK_STRUCTURE_TYPE_PIPELINE_PROPERTIES_IDENTIFIER_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PIPELINE_PROPERTIES_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAME_BOUNDARY_FEATURES_EXT,VK_STRUCTURE_TYPE_FRAME_BOUNDARY_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTISAMPLED_RENDER_TO_SINGLE_SAMPLED_FEATURES_EXT,VK_STRUCTURE_TYPE_SUBPASS_RESOLVE_PERFORMANCE_QUERY_EXT,VK_STRUCTURE_TYPE_MULTISAMPLED_RENDER_TO_SINGLE_SAMPLED_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_2_FEATURES_EXT,VK_STRUCTURE_TYPE_SCREEN_SURFACE_CREATE_INFO_QNX,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COLOR_WRITE_ENABLE_FEATURES_EXT,VK_STRUCTURE_TYPE_PIPELINE_COLOR_WRITE_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PRIMITIVES_GENERATED_QUERY_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_MAINTENANCE_1_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_VIEW_MIN_LOD_FEATURES_EXT,VK_STRUCTURE_TYPE_IMAGE_VIEW_MIN_LOD_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTI_DRAW_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTI_DRAW_PROPERTIES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_2D_VIEW_OF_3D_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_TILE_IMAGE_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_TILE_IMAGE_PROPERTIES_EXT,VK_STRUCTURE_TYPE_MICROMAP_BUILD_INFO_EXT,VK_STRUCTURE_TYPE_MICROMAP_VERSION_INFO_EXT,VK_STRUCTURE_TYPE_COPY_MICROMAP_INFO_EXT,VK_STRUCTURE_TYPE_COPY_MICROMAP_TO_MEMORY_INFO_EXT,VK_STRUCTURE_TYPE_COPY_MEMORY_TO_MICROMAP_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_OPACITY_MICROMAP_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_OPACITY_MICROMAP_PROPERTIES_EXT,VK_STRUCTURE_TYPE_MICROMAP_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_MICROMAP_BUILD_SIZES_INFO_EXT,VK_STRUCTURE_TYPE_ACCELERATION_STRUCTURE_TRIANGLES_OPACITY_MICROMAP_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CLUSTER_CULLING_SHADER_FEATURES_HUAWEI,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CLUSTER_CULLING_SHADER_PROPERTIES_HUAWEI,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CLUSTER_CULLING_SHADER_VRS_FEATURES_HUAWEI,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_BORDER_COLOR_SWIZZLE_FEATURES_EXT,VK_STRUCTURE_TYPE_SAMPLER_BORDER_COLOR_COMPONENT_MAPPING_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PAGEABLE_DEVICE_LOCAL_MEMORY_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_CORE_PROPERTIES_ARM,VK_STRUCTURE_TYPE_DEVICE_QUEUE_SHADER_CORE_CONTROL_CREATE_INFO_ARM,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SCHEDULING_CONTROLS_FEATURES_ARM,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SCHEDULING_CONTROLS_PROPERTIES_ARM,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_SLICED_VIEW_OF_3D_FEATURES_EXT,VK_STRUCTURE_TYPE_IMAGE_VIEW_SLICED_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_SET_HOST_MAPPING_FEATURES_VALVE,VK_STRUCTURE_TYPE_DESCRIPTOR_SET_BINDING_REFERENCE_VALVE,VK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_HOST_MAPPING_INFO_VALVE,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEPTH_CLAMP_ZERO_ONE_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_NON_SEAMLESS_CUBE_MAP_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RENDER_PASS_STRIPED_FEATURES_ARM,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RENDER_PASS_STRIPED_PROPERTIES_ARM,VK_STRUCTURE_TYPE_RENDER_PASS_STRIPE_BEGIN_INFO_ARM,VK_STRUCTURE_TYPE_RENDER_PASS_STRIPE_INFO_ARM,VK_STRUCTURE_TYPE_RENDER_PASS_STRIPE_SUBMIT_INFO_ARM,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_OFFSET_FEATURES_QCOM,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_OFFSET_PROPERTIES_QCOM,VK_STRUCTURE_TYPE_SUBPASS_FRAGMENT_DENSITY_MAP_OFFSET_END_INFO_QCOM,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COPY_MEMORY_INDIRECT_FEATURES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COPY_MEMORY_INDIRECT_PROPERTIES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MEMORY_DECOMPRESSION_FEATURES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MEMORY_DECOMPRESSION_PROPERTIES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_COMPUTE_FEATURES_NV,VK_STRUCTURE_TYPE_COMPUTE_PIPELINE_INDIRECT_BUFFER_INFO_NV,VK_STRUCTURE_TYPE_PIPELINE_INDIRECT_DEVICE_ADDRESS_INFO_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_LINEAR_COLOR_ATTACHMENT_FEATURES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_COMPRESSION_CONTROL_SWAPCHAIN_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_PROCESSING_FEATURES_QCOM,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_PROCESSING_PROPERTIES_QCOM,VK_STRUCTURE_TYPE_IMAGE_VIEW_SAMPLE_WEIGHT_CREATE_INFO_QCOM,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_NESTED_COMMAND_BUFFER_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_NESTED_COMMAND_BUFFER_PROPERTIES_EXT,VK_STRUCTURE_TYPE_EXTERNAL_MEMORY_ACQUIRE_UNMODIFIED_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_3_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_3_PROPERTIES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBPASS_MERGE_FEEDBACK_FEATURES_EXT,VK_STRUCTURE_TYPE_RENDER_PASS_CREATION_CONTROL_EXT,VK_STRUCTURE_TYPE_RENDER_PASS_CREATION_FEEDBACK_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_RENDER_PASS_SUBPASS_FEEDBACK_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_DIRECT_DRIVER_LOADING_INFO_LUNARG,VK_STRUCTURE_TYPE_DIRECT_DRIVER_LOADING_LIST_LUNARG,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_MODULE_IDENTIFIER_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_MODULE_IDENTIFIER_PROPERTIES_EXT,VK_STRUCTURE_TYPE_PIPELINE_SHADER_STAGE_MODULE_IDENTIFIER_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_SHADER_MODULE_IDENTIFIER_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RASTERIZATION_ORDER_ATTACHMENT_ACCESS_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_OPTICAL_FLOW_FEATURES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_OPTICAL_FLOW_PROPERTIES_NV,VK_STRUCTURE_TYPE_OPTICAL_FLOW_IMAGE_FORMAT_INFO_NV,VK_STRUCTURE_TYPE_OPTICAL_FLOW_IMAGE_FORMAT_PROPERTIES_NV,VK_STRUCTURE_TYPE_OPTICAL_FLOW_SESSION_CREATE_INFO_NV,VK_STRUCTURE_TYPE_OPTICAL_FLOW_EXECUTE_INFO_NV,VK_STRUCTURE_TYPE_OPTICAL_FLOW_SESSION_CREATE_PRIVATE_DATA_INFO_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_LEGACY_DITHERING_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PIPELINE_PROTECTED_ACCESS_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_FORMAT_RESOLVE_FEATURES_ANDROID,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_FORMAT_RESOLVE_PROPERTIES_ANDROID,VK_STRUCTURE_TYPE_ANDROID_HARDWARE_BUFFER_FORMAT_RESOLVE_PROPERTIES_ANDROID,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_5_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_5_PROPERTIES_KHR,VK_STRUCTURE_TYPE_RENDERING_AREA_INFO_KHR,VK_STRUCTURE_TYPE_DEVICE_IMAGE_SUBRESOURCE_INFO_KHR,VK_STRUCTURE_TYPE_SUBRESOURCE_LAYOUT_2_KHR,VK_STRUCTURE_TYPE_IMAGE_SUBRESOURCE_2_KHR,VK_STRUCTURE_TYPE_PIPELINE_CREATE_FLAGS_2_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_BUFFER_USAGE_FLAGS_2_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_POSITION_FETCH_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_OBJECT_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_OBJECT_PROPERTIES_EXT,VK_STRUCTURE_TYPE_SHADER_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TILE_PROPERTIES_FEATURES_QCOM,VK_STRUCTURE_TYPE_TILE_PROPERTIES_QCOM,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_AMIGO_PROFILING_FEATURES_SEC,VK_STRUCTURE_TYPE_AMIGO_PROFILING_SUBMIT_INFO_SEC,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTIVIEW_PER_VIEW_VIEWPORTS_FEATURES_QCOM,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_INVOCATION_REORDER_FEATURES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_INVOCATION_REORDER_PROPERTIES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTENDED_SPARSE_ADDRESS_SPACE_FEATURES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTENDED_SPARSE_ADDRESS_SPACE_PROPERTIES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MUTABLE_DESCRIPTOR_TYPE_FEATURES_EXT,VK_STRUCTURE_TYPE_MUTABLE_DESCRIPTOR_TYPE_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_LAYER_SETTINGS_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_CORE_BUILTINS_FEATURES_ARM,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_CORE_BUILTINS_PROPERTIES_ARM,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PIPELINE_LIBRARY_GROUP_HANDLES_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DYNAMIC_RENDERING_UNUSED_ATTACHMENTS_FEATURES_EXT,VK_STRUCTURE_TYPE_LATENCY_SLEEP_MODE_INFO_NV,VK_STRUCTURE_TYPE_LATENCY_SLEEP_INFO_NV,VK_STRUCTURE_TYPE_SET_LATENCY_MARKER_INFO_NV,VK_STRUCTURE_TYPE_GET_LATENCY_MARKER_INFO_NV,VK_STRUCTURE_TYPE_LATENCY_TIMINGS_FRAME_REPORT_NV,VK_STRUCTURE_TYPE_LATENCY_SUBMISSION_PRESENT_ID_NV,VK_STRUCTURE_TYPE_OUT_OF_BAND_QUEUE_TYPE_INFO_NV,VK_STRUCTURE_TYPE_SWAPCHAIN_LATENCY_CREATE_INFO_NV,VK_STRUCTURE_TYPE_LATENCY_SURFACE_CAPABILITIES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COOPERATIVE_MATRIX_FEATURES_KHR,VK_STRUCTURE_TYPE_COOPERATIVE_MATRIX_PROPERTIES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_COOPERATIVE_MATRIX_PROPERTIES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTIVIEW_PER_VIEW_RENDER_AREAS_FEATURES_QCOM,VK_STRUCTURE_TYPE_MULTIVIEW_PER_VIEW_RENDER_AREAS_RENDER_PASS_BEGIN_INFO_QCOM,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VIDEO_MAINTENANCE_1_FEATURES_KHR,VK_STRUCTURE_TYPE_VIDEO_INLINE_QUERY_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PER_STAGE_DESCRIPTOR_SET_FEATURES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_PROCESSING_2_FEATURES_QCOM,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_PROCESSING_2_PROPERTIES_QCOM,VK_STRUCTURE_TYPE_SAMPLER_BLOCK_MATCH_WINDOW_CREATE_INFO_QCOM,VK_STRUCTURE_TYPE_SAMPLER_CUBIC_WEIGHTS_CREATE_INFO_QCOM,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CUBIC_WEIGHTS_FEATURES_QCOM,VK_STRUCTURE_TYPE_BLIT_IMAGE_CUBIC_WEIGHTS_INFO_QCOM,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_YCBCR_DEGAMMA_FEATURES_QCOM,VK_STRUCTURE_TYPE_SAMPLER_YCBCR_CONVERSION_YCBCR_DEGAMMA_CREATE_INFO_QCOM,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_CUBIC_CLAMP_FEATURES_QCOM,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ATTACHMENT_FEEDBACK_LOOP_DYNAMIC_STATE_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_PROPERTIES_KHR,VK_STRUCTURE_TYPE_PIPELINE_VERTEX_INPUT_DIVISOR_STATE_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_FEATURES_KHR,VK_STRUCTURE_TYPE_SCREEN_BUFFER_PROPERTIES_QNX,VK_STRUCTURE_TYPE_SCREEN_BUFFER_FORMAT_PROPERTIES_QNX,VK_STRUCTURE_TYPE_IMPORT_SCREEN_BUFFER_INFO_QNX,VK_STRUCTURE_TYPE_EXTERNAL_FORMAT_QNX,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_MEMORY_SCREEN_BUFFER_FEATURES_QNX,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_LAYERED_DRIVER_PROPERTIES_MSFT,VK_STRUCTURE_TYPE_CALIBRATED_TIMESTAMP_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_6_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_6_PROPERTIES_KHR,VK_STRUCTURE_TYPE_BIND_MEMORY_STATUS_KHR,VK_STRUCTURE_TYPE_BIND_DESCRIPTOR_SETS_INFO_KHR,VK_STRUCTURE_TYPE_PUSH_CONSTANTS_INFO_KHR,VK_STRUCTURE_TYPE_PUSH_DESCRIPTOR_SET_INFO_KHR,VK_STRUCTURE_TYPE_PUSH_DESCRIPTOR_SET_WITH_TEMPLATE_INFO_KHR,VK_STRUCTURE_TYPE_SET_DESCRIPTOR_BUFFER_OFFSETS_INFO_EXT,VK_STRUCTURE_TYPE_BIND_DESCRIPTOR_BUFFER_EMBEDDED_SAMPLERS_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_POOL_OVERALLOCATION_FEATURES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VARIABLE_POINTER_FEATURES,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_DRAW_PARAMETER_FEATURES,VK_STRUCTURE_TYPE_DEBUG_REPORT_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_RENDERING_INFO_KHR,VK_STRUCTURE_TYPE_RENDERING_ATTACHMENT_INFO_KHR,VK_STRUCTURE_TYPE_PIPELINE_RENDERING_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DYNAMIC_RENDERING_FEATURES_KHR,VK_STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_RENDERING_INFO_KHR,VK_STRUCTURE_TYPE_ATTACHMENT_SAMPLE_COUNT_INFO_NV,VK_STRUCTURE_TYPE_RENDER_PASS_MULTIVIEW_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTIVIEW_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTIVIEW_PROPERTIES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PROPERTIES_2_KHR,VK_STRUCTURE_TYPE_FORMAT_PROPERTIES_2_KHR,VK_STRUCTURE_TYPE_IMAGE_FORMAT_PROPERTIES_2_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_FORMAT_INFO_2_KHR,VK_STRUCTURE_TYPE_QUEUE_FAMILY_PROPERTIES_2_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MEMORY_PROPERTIES_2_KHR,VK_STRUCTURE_TYPE_SPARSE_IMAGE_FORMAT_PROPERTIES_2_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SPARSE_IMAGE_FORMAT_INFO_2_KHR,VK_STRUCTURE_TYPE_MEMORY_ALLOCATE_FLAGS_INFO_KHR,VK_STRUCTURE_TYPE_DEVICE_GROUP_RENDER_PASS_BEGIN_INFO_KHR,VK_STRUCTURE_TYPE_DEVICE_GROUP_COMMAND_BUFFER_BEGIN_INFO_KHR,VK_STRUCTURE_TYPE_DEVICE_GROUP_SUBMIT_INFO_KHR,VK_STRUCTURE_TYPE_DEVICE_GROUP_BIND_SPARSE_INFO_KHR,VK_STRUCTURE_TYPE_BIND_BUFFER_MEMORY_DEVICE_GROUP_INFO_KHR,VK_STRUCTURE_TYPE_BIND_IMAGE_MEMORY_DEVICE_GROUP_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TEXTURE_COMPRESSION_ASTC_HDR_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_GROUP_PROPERTIES_KHR,VK_STRUCTURE_TYPE_DEVICE_GROUP_DEVICE_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_IMAGE_FORMAT_INFO_KHR,VK_STRUCTURE_TYPE_EXTERNAL_IMAGE_FORMAT_PROPERTIES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_BUFFER_INFO_KHR,VK_STRUCTURE_TYPE_EXTERNAL_BUFFER_PROPERTIES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ID_PROPERTIES_KHR,VK_STRUCTURE_TYPE_EXTERNAL_MEMORY_BUFFER_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_EXTERNAL_MEMORY_IMAGE_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_EXPORT_MEMORY_ALLOCATE_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_SEMAPHORE_INFO_KHR,VK_STRUCTURE_TYPE_EXTERNAL_SEMAPHORE_PROPERTIES_KHR,VK_STRUCTURE_TYPE_EXPORT_SEMAPHORE_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_FLOAT16_INT8_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FLOAT16_INT8_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_16BIT_STORAGE_FEATURES_KHR,VK_STRUCTURE_TYPE_DESCRIPTOR_UPDATE_TEMPLATE_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_SURFACE_CAPABILITIES2_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGELESS_FRAMEBUFFER_FEATURES_KHR,VK_STRUCTURE_TYPE_FRAMEBUFFER_ATTACHMENTS_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_FRAMEBUFFER_ATTACHMENT_IMAGE_INFO_KHR,VK_STRUCTURE_TYPE_RENDER_PASS_ATTACHMENT_BEGIN_INFO_KHR,VK_STRUCTURE_TYPE_ATTACHMENT_DESCRIPTION_2_KHR,VK_STRUCTURE_TYPE_ATTACHMENT_REFERENCE_2_KHR,VK_STRUCTURE_TYPE_SUBPASS_DESCRIPTION_2_KHR,VK_STRUCTURE_TYPE_SUBPASS_DEPENDENCY_2_KHR,VK_STRUCTURE_TYPE_RENDER_PASS_CREATE_INFO_2_KHR,VK_STRUCTURE_TYPE_SUBPASS_BEGIN_INFO_KHR,VK_STRUCTURE_TYPE_SUBPASS_END_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_FENCE_INFO_KHR,VK_STRUCTURE_TYPE_EXTERNAL_FENCE_PROPERTIES_KHR,VK_STRUCTURE_TYPE_EXPORT_FENCE_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_POINT_CLIPPING_PROPERTIES_KHR,VK_STRUCTURE_TYPE_RENDER_PASS_INPUT_ATTACHMENT_ASPECT_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_IMAGE_VIEW_USAGE_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_PIPELINE_TESSELLATION_DOMAIN_ORIGIN_STATE_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VARIABLE_POINTERS_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VARIABLE_POINTER_FEATURES_KHR,VK_STRUCTURE_TYPE_MEMORY_DEDICATED_REQUIREMENTS_KHR,VK_STRUCTURE_TYPE_MEMORY_DEDICATED_ALLOCATE_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SAMPLER_FILTER_MINMAX_PROPERTIES_EXT,VK_STRUCTURE_TYPE_SAMPLER_REDUCTION_MODE_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_INLINE_UNIFORM_BLOCK_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_INLINE_UNIFORM_BLOCK_PROPERTIES_EXT,VK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET_INLINE_UNIFORM_BLOCK_EXT,VK_STRUCTURE_TYPE_DESCRIPTOR_POOL_INLINE_UNIFORM_BLOCK_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_BUFFER_MEMORY_REQUIREMENTS_INFO_2_KHR,VK_STRUCTURE_TYPE_IMAGE_MEMORY_REQUIREMENTS_INFO_2_KHR,VK_STRUCTURE_TYPE_IMAGE_SPARSE_MEMORY_REQUIREMENTS_INFO_2_KHR,VK_STRUCTURE_TYPE_MEMORY_REQUIREMENTS_2_KHR,VK_STRUCTURE_TYPE_SPARSE_IMAGE_MEMORY_REQUIREMENTS_2_KHR,VK_STRUCTURE_TYPE_IMAGE_FORMAT_LIST_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_SAMPLER_YCBCR_CONVERSION_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_SAMPLER_YCBCR_CONVERSION_INFO_KHR,VK_STRUCTURE_TYPE_BIND_IMAGE_PLANE_MEMORY_INFO_KHR,VK_STRUCTURE_TYPE_IMAGE_PLANE_MEMORY_REQUIREMENTS_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SAMPLER_YCBCR_CONVERSION_FEATURES_KHR,VK_STRUCTURE_TYPE_SAMPLER_YCBCR_CONVERSION_IMAGE_FORMAT_PROPERTIES_KHR,VK_STRUCTURE_TYPE_BIND_BUFFER_MEMORY_INFO_KHR,VK_STRUCTURE_TYPE_BIND_IMAGE_MEMORY_INFO_KHR,VK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_BINDING_FLAGS_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_INDEXING_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_INDEXING_PROPERTIES_EXT,VK_STRUCTURE_TYPE_DESCRIPTOR_SET_VARIABLE_DESCRIPTOR_COUNT_ALLOCATE_INFO_EXT,VK_STRUCTURE_TYPE_DESCRIPTOR_SET_VARIABLE_DESCRIPTOR_COUNT_LAYOUT_SUPPORT_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_3_PROPERTIES_KHR,VK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_SUPPORT_KHR,VK_STRUCTURE_TYPE_DEVICE_QUEUE_GLOBAL_PRIORITY_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_SUBGROUP_EXTENDED_TYPES_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_8BIT_STORAGE_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_ATOMIC_INT64_FEATURES_KHR,VK_STRUCTURE_TYPE_CALIBRATED_TIMESTAMP_INFO_EXT,VK_STRUCTURE_TYPE_PIPELINE_VERTEX_INPUT_DIVISOR_STATE_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_FEATURES_EXT,VK_STRUCTURE_TYPE_PIPELINE_CREATION_FEEDBACK_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DRIVER_PROPERTIES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FLOAT_CONTROLS_PROPERTIES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_DEPTH_STENCIL_RESOLVE_PROPERTIES_KHR,VK_STRUCTURE_TYPE_SUBPASS_DESCRIPTION_DEPTH_STENCIL_RESOLVE_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADER_BARYCENTRIC_FEATURES_NV,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TIMELINE_SEMAPHORE_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TIMELINE_SEMAPHORE_PROPERTIES_KHR,VK_STRUCTURE_TYPE_SEMAPHORE_TYPE_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_TIMELINE_SEMAPHORE_SUBMIT_INFO_KHR,VK_STRUCTURE_TYPE_SEMAPHORE_WAIT_INFO_KHR,VK_STRUCTURE_TYPE_SEMAPHORE_SIGNAL_INFO_KHR,VK_STRUCTURE_TYPE_QUERY_POOL_CREATE_INFO_INTEL,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_MEMORY_MODEL_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_TERMINATE_INVOCATION_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SCALAR_BLOCK_LAYOUT_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBGROUP_SIZE_CONTROL_PROPERTIES_EXT,VK_STRUCTURE_TYPE_PIPELINE_SHADER_STAGE_REQUIRED_SUBGROUP_SIZE_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBGROUP_SIZE_CONTROL_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SEPARATE_DEPTH_STENCIL_LAYOUTS_FEATURES_KHR,VK_STRUCTURE_TYPE_ATTACHMENT_REFERENCE_STENCIL_LAYOUT_KHR,VK_STRUCTURE_TYPE_ATTACHMENT_DESCRIPTION_STENCIL_LAYOUT_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_BUFFER_ADDRESS_FEATURES_EXT,VK_STRUCTURE_TYPE_BUFFER_DEVICE_ADDRESS_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TOOL_PROPERTIES_EXT,VK_STRUCTURE_TYPE_IMAGE_STENCIL_USAGE_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_UNIFORM_BUFFER_STANDARD_LAYOUT_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_BUFFER_DEVICE_ADDRESS_FEATURES_KHR,VK_STRUCTURE_TYPE_BUFFER_DEVICE_ADDRESS_INFO_KHR,VK_STRUCTURE_TYPE_BUFFER_OPAQUE_CAPTURE_ADDRESS_CREATE_INFO_KHR,VK_STRUCTURE_TYPE_MEMORY_OPAQUE_CAPTURE_ADDRESS_ALLOCATE_INFO_KHR,VK_STRUCTURE_TYPE_DEVICE_MEMORY_OPAQUE_CAPTURE_ADDRESS_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_HOST_QUERY_RESET_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_DEMOTE_TO_HELPER_INVOCATION_FEATURES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_INTEGER_DOT_PRODUCT_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_INTEGER_DOT_PRODUCT_PROPERTIES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_TEXEL_BUFFER_ALIGNMENT_PROPERTIES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PRIVATE_DATA_FEATURES_EXT,VK_STRUCTURE_TYPE_DEVICE_PRIVATE_DATA_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PRIVATE_DATA_SLOT_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PIPELINE_CREATION_CACHE_CONTROL_FEATURES_EXT,VK_STRUCTURE_TYPE_MEMORY_BARRIER_2_KHR,VK_STRUCTURE_TYPE_BUFFER_MEMORY_BARRIER_2_KHR,VK_STRUCTURE_TYPE_IMAGE_MEMORY_BARRIER_2_KHR,VK_STRUCTURE_TYPE_DEPENDENCY_INFO_KHR,VK_STRUCTURE_TYPE_SUBMIT_INFO_2_KHR,VK_STRUCTURE_TYPE_SEMAPHORE_SUBMIT_INFO_KHR,VK_STRUCTURE_TYPE_COMMAND_BUFFER_SUBMIT_INFO_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SYNCHRONIZATION_2_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ZERO_INITIALIZE_WORKGROUP_MEMORY_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_ROBUSTNESS_FEATURES_EXT,VK_STRUCTURE_TYPE_COPY_BUFFER_INFO_2_KHR,VK_STRUCTURE_TYPE_COPY_IMAGE_INFO_2_KHR,VK_STRUCTURE_TYPE_COPY_BUFFER_TO_IMAGE_INFO_2_KHR,VK_STRUCTURE_TYPE_COPY_IMAGE_TO_BUFFER_INFO_2_KHR,VK_STRUCTURE_TYPE_BLIT_IMAGE_INFO_2_KHR,VK_STRUCTURE_TYPE_RESOLVE_IMAGE_INFO_2_KHR,VK_STRUCTURE_TYPE_BUFFER_COPY_2_KHR,VK_STRUCTURE_TYPE_IMAGE_COPY_2_KHR,VK_STRUCTURE_TYPE_IMAGE_BLIT_2_KHR,VK_STRUCTURE_TYPE_BUFFER_IMAGE_COPY_2_KHR,VK_STRUCTURE_TYPE_IMAGE_RESOLVE_2_KHR,VK_STRUCTURE_TYPE_SUBRESOURCE_LAYOUT_2_EXT,VK_STRUCTURE_TYPE_IMAGE_SUBRESOURCE_2_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_RASTERIZATION_ORDER_ATTACHMENT_ACCESS_FEATURES_ARM,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MUTABLE_DESCRIPTOR_TYPE_FEATURES_VALVE,VK_STRUCTURE_TYPE_MUTABLE_DESCRIPTOR_TYPE_CREATE_INFO_VALVE,VK_STRUCTURE_TYPE_FORMAT_PROPERTIES_3_KHR,VK_STRUCTURE_TYPE_PIPELINE_INFO_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_GLOBAL_PRIORITY_QUERY_FEATURES_EXT,VK_STRUCTURE_TYPE_QUEUE_FAMILY_GLOBAL_PRIORITY_PROPERTIES_EXT,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_4_FEATURES_KHR,VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_4_PROPERTIES_KHR,VK_STRUCTURE_TYPE_DEVICE_BUFFER_MEMORY_REQUIREMENTS_KHR,VK_STRUCTURE_TYPE_DEVICE_IMAGE_MEMORY_REQUIREMENTS_KHR,VK_STRUCTURE_TYPE_SHADER_REQUIRED_SUBGROUP_SIZE_CREATE_INFO_EXT,VK_STRUCTURE_TYPE_MAX_ENUM',b'\x00\x00\x10\x83\x00\x00\x00\x16VkSubgroupFeatureFlagBits\x00VK_SUBGROUP_FEATURE_BASIC_BIT,VK_SUBGROUP_FEATURE_VOTE_BIT,VK_SUBGROUP_FEATURE_ARITHMETIC_BIT,VK_SUBGROUP_FEATURE_BALLOT_BIT,VK_SUBGROUP_FEATURE_SHUFFLE_BIT,VK_SUBGROUP_FEATURE_SHUFFLE_RELATIVE_BIT,VK_SUBGROUP_FEATURE_CLUSTERED_BIT,VK_SUBGROUP_FEATURE_QUAD_BIT,VK_SUBGROUP_FEATURE_PARTITIONED_BIT_NV,VK_SUBGROUP_FEATURE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x10\x84\x00\x00\x00\x16VkSubmitFlagBits\x00VK_SUBMIT_PROTECTED_BIT,VK_SUBMIT_PROTECTED_BIT_KHR,VK_SUBMIT_FLAG_BITS_MAX_ENUM',b'\x00\x00\x06\x0B\x00\x00\x00\x16VkSubpassContents\x00VK_SUBPASS_CONTENTS_INLINE,VK_SUBPASS_CONTENTS_SECONDARY_COMMAND_BUFFERS,VK_SUBPASS_CONTENTS_INLINE_AND_SECONDARY_COMMAND_BUFFERS_EXT,VK_SUBPASS_CONTENTS_MAX_ENUM',b'\x00\x00\x10\x91\x00\x00\x00\x16VkSubpassDescriptionFlagBits\x00VK_SUBPASS_DESCRIPTION_PER_VIEW_ATTRIBUTES_BIT_NVX,VK_SUBPASS_DESCRIPTION_PER_VIEW_POSITION_X_ONLY_BIT_NVX,VK_SUBPASS_DESCRIPTION_FRAGMENT_REGION_BIT_QCOM,VK_SUBPASS_DESCRIPTION_SHADER_RESOLVE_BIT_QCOM,VK_SUBPASS_DESCRIPTION_RASTERIZATION_ORDER_ATTACHMENT_COLOR_ACCESS_BIT_EXT,VK_SUBPASS_DESCRIPTION_RASTERIZATION_ORDER_ATTACHMENT_DEPTH_ACCESS_BIT_EXT,VK_SUBPASS_DESCRIPTION_RASTERIZATION_ORDER_ATTACHMENT_STENCIL_ACCESS_BIT_EXT,VK_SUBPASS_DESCRIPTION_ENABLE_LEGACY_DITHERING_BIT_EXT,VK_SUBPASS_DESCRIPTION_RASTERIZATION_ORDER_ATTACHMENT_COLOR_ACCESS_BIT_ARM,VK_SUBPASS_DESCRIPTION_RASTERIZATION_ORDER_ATTACHMENT_DEPTH_ACCESS_BIT_ARM,VK_SUBPASS_DESCRIPTION_RASTERIZATION_ORDER_ATTACHMENT_STENCIL_ACCESS_BIT_ARM,VK_SUBPASS_DESCRIPTION_FLAG_BITS_MAX_ENUM',b'\x00\x00\x10\x94\x00\x00\x00\x16VkSubpassMergeStatusEXT\x00VK_SUBPASS_MERGE_STATUS_MERGED_EXT,VK_SUBPASS_MERGE_STATUS_DISALLOWED_EXT,VK_SUBPASS_MERGE_STATUS_NOT_MERGED_SIDE_EFFECTS_EXT,VK_SUBPASS_MERGE_STATUS_NOT_MERGED_SAMPLES_MISMATCH_EXT,VK_SUBPASS_MERGE_STATUS_NOT_MERGED_VIEWS_MISMATCH_EXT,VK_SUBPASS_MERGE_STATUS_NOT_MERGED_ALIASING_EXT,VK_SUBPASS_MERGE_STATUS_NOT_MERGED_DEPENDENCIES_EXT,VK_SUBPASS_MERGE_STATUS_NOT_MERGED_INCOMPATIBLE_INPUT_ATTACHMENT_EXT,VK_SUBPASS_MERGE_STATUS_NOT_MERGED_TOO_MANY_ATTACHMENTS_EXT,VK_SUBPASS_MERGE_STATUS_NOT_MERGED_INSUFFICIENT_STORAGE_EXT,VK_SUBPASS_MERGE_STATUS_NOT_MERGED_DEPTH_STENCIL_COUNT_EXT,VK_SUBPASS_MERGE_STATUS_NOT_MERGED_RESOLVE_ATTACHMENT_REUSE_EXT,VK_SUBPASS_MERGE_STATUS_NOT_MERGED_SINGLE_SUBPASS_EXT,VK_SUBPASS_MERGE_STATUS_NOT_MERGED_UNSPECIFIED_EXT,VK_SUBPASS_MERGE_STATUS_MAX_ENUM_EXT',b'\x00\x00\x02\xFF\x00\x00\x00\x16VkSurfaceCounterFlagBitsEXT\x00VK_SURFACE_COUNTER_VBLANK_BIT_EXT,VK_SURFACE_COUNTER_VBLANK_EXT,VK_SURFACE_COUNTER_FLAG_BITS_MAX_ENUM_EXT',b'\x00\x00\x10\xAA\x00\x00\x00\x16VkSurfaceTransformFlagBitsKHR\x00VK_SURFACE_TRANSFORM_IDENTITY_BIT_KHR,VK_SURFACE_TRANSFORM_ROTATE_90_BIT_KHR,VK_SURFACE_TRANSFORM_ROTATE_180_BIT_KHR,VK_SURFACE_TRANSFORM_ROTATE_270_BIT_KHR,VK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_BIT_KHR,VK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_ROTATE_90_BIT_KHR,VK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_ROTATE_180_BIT_KHR,VK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_ROTATE_270_BIT_KHR,VK_SURFACE_TRANSFORM_INHERIT_BIT_KHR,VK_SURFACE_TRANSFORM_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x10\xAC\x00\x00\x00\x16VkSwapchainCreateFlagBitsKHR\x00VK_SWAPCHAIN_CREATE_SPLIT_INSTANCE_BIND_REGIONS_BIT_KHR,VK_SWAPCHAIN_CREATE_PROTECTED_BIT_KHR,VK_SWAPCHAIN_CREATE_MUTABLE_FORMAT_BIT_KHR,VK_SWAPCHAIN_CREATE_DEFERRED_MEMORY_ALLOCATION_BIT_EXT,VK_SWAPCHAIN_CREATE_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x05\x13\x00\x00\x00\x16VkSystemAllocationScope\x00VK_SYSTEM_ALLOCATION_SCOPE_COMMAND,VK_SYSTEM_ALLOCATION_SCOPE_OBJECT,VK_SYSTEM_ALLOCATION_SCOPE_CACHE,VK_SYSTEM_ALLOCATION_SCOPE_DEVICE,VK_SYSTEM_ALLOCATION_SCOPE_INSTANCE,VK_SYSTEM_ALLOCATION_SCOPE_MAX_ENUM',b'\x00\x00\x06\x47\x00\x00\x00\x16VkTessellationDomainOrigin\x00VK_TESSELLATION_DOMAIN_ORIGIN_UPPER_LEFT,VK_TESSELLATION_DOMAIN_ORIGIN_LOWER_LEFT,VK_TESSELLATION_DOMAIN_ORIGIN_UPPER_LEFT_KHR,VK_TESSELLATION_DOMAIN_ORIGIN_LOWER_LEFT_KHR,VK_TESSELLATION_DOMAIN_ORIGIN_MAX_ENUM',b'\x00\x00\x10\xB7\x00\x00\x00\x16VkTimeDomainKHR\x00VK_TIME_DOMAIN_DEVICE_KHR,VK_TIME_DOMAIN_CLOCK_MONOTONIC_KHR,VK_TIME_DOMAIN_CLOCK_MONOTONIC_RAW_KHR,VK_TIME_DOMAIN_QUERY_PERFORMANCE_COUNTER_KHR,VK_TIME_DOMAIN_DEVICE_EXT,VK_TIME_DOMAIN_CLOCK_MONOTONIC_EXT,VK_TIME_DOMAIN_CLOCK_MONOTONIC_RAW_EXT,VK_TIME_DOMAIN_QUERY_PERFORMANCE_COUNTER_EXT,VK_TIME_DOMAIN_MAX_ENUM_KHR',b'\x00\x00\x10\xB9\x00\x00\x00\x16VkToolPurposeFlagBits\x00VK_TOOL_PURPOSE_VALIDATION_BIT,VK_TOOL_PURPOSE_PROFILING_BIT,VK_TOOL_PURPOSE_TRACING_BIT,VK_TOOL_PURPOSE_ADDITIONAL_FEATURES_BIT,VK_TOOL_PURPOSE_MODIFYING_FEATURES_BIT,VK_TOOL_PURPOSE_DEBUG_REPORTING_BIT_EXT,VK_TOOL_PURPOSE_DEBUG_MARKERS_BIT_EXT,VK_TOOL_PURPOSE_VALIDATION_BIT_EXT,VK_TOOL_PURPOSE_PROFILING_BIT_EXT,VK_TOOL_PURPOSE_TRACING_BIT_EXT,VK_TOOL_PURPOSE_ADDITIONAL_FEATURES_BIT_EXT,VK_TOOL_PURPOSE_MODIFYING_FEATURES_BIT_EXT,VK_TOOL_PURPOSE_FLAG_BITS_MAX_ENUM',b'\x00\x00\x10\xBE\x00\x00\x00\x16VkValidationCacheHeaderVersionEXT\x00VK_VALIDATION_CACHE_HEADER_VERSION_ONE_EXT,VK_VALIDATION_CACHE_HEADER_VERSION_MAX_ENUM_EXT',b'\x00\x00\x10\xC0\x00\x00\x00\x16VkValidationCheckEXT\x00VK_VALIDATION_CHECK_ALL_EXT,VK_VALIDATION_CHECK_SHADERS_EXT,VK_VALIDATION_CHECK_MAX_ENUM_EXT',b'\x00\x00\x10\xC2\x00\x00\x00\x16VkValidationFeatureDisableEXT\x00VK_VALIDATION_FEATURE_DISABLE_ALL_EXT,VK_VALIDATION_FEATURE_DISABLE_SHADERS_EXT,VK_VALIDATION_FEATURE_DISABLE_THREAD_SAFETY_EXT,VK_VALIDATION_FEATURE_DISABLE_API_PARAMETERS_EXT,VK_VALIDATION_FEATURE_DISABLE_OBJECT_LIFETIMES_EXT,VK_VALIDATION_FEATURE_DISABLE_CORE_CHECKS_EXT,VK_VALIDATION_FEATURE_DISABLE_UNIQUE_HANDLES_EXT,VK_VALIDATION_FEATURE_DISABLE_SHADER_VALIDATION_CACHE_EXT,VK_VALIDATION_FEATURE_DISABLE_MAX_ENUM_EXT',b'\x00\x00\x10\xC4\x00\x00\x00\x16VkValidationFeatureEnableEXT\x00VK_VALIDATION_FEATURE_ENABLE_GPU_ASSISTED_EXT,VK_VALIDATION_FEATURE_ENABLE_GPU_ASSISTED_RESERVE_BINDING_SLOT_EXT,VK_VALIDATION_FEATURE_ENABLE_BEST_PRACTICES_EXT,VK_VALIDATION_FEATURE_ENABLE_DEBUG_PRINTF_EXT,VK_VALIDATION_FEATURE_ENABLE_SYNCHRONIZATION_VALIDATION_EXT,VK_VALIDATION_FEATURE_ENABLE_MAX_ENUM_EXT',b'\x00\x00\x10\xC7\x00\x00\x00\x16VkVendorId\x00VK_VENDOR_ID_VIV,VK_VENDOR_ID_VSI,VK_VENDOR_ID_KAZAN,VK_VENDOR_ID_CODEPLAY,VK_VENDOR_ID_MESA,VK_VENDOR_ID_POCL,VK_VENDOR_ID_MOBILEYE,VK_VENDOR_ID_MAX_ENUM',b'\x00\x00\x10\xD0\x00\x00\x00\x16VkVertexInputRate\x00VK_VERTEX_INPUT_RATE_VERTEX,VK_VERTEX_INPUT_RATE_INSTANCE,VK_VERTEX_INPUT_RATE_MAX_ENUM',b'\x00\x00\x10\xD3\x00\x00\x00\x16VkVideoCapabilityFlagBitsKHR\x00VK_VIDEO_CAPABILITY_PROTECTED_CONTENT_BIT_KHR,VK_VIDEO_CAPABILITY_SEPARATE_REFERENCE_IMAGES_BIT_KHR,VK_VIDEO_CAPABILITY_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x10\xD4\x00\x00\x00\x16VkVideoChromaSubsamplingFlagBitsKHR\x00VK_VIDEO_CHROMA_SUBSAMPLING_INVALID_KHR,VK_VIDEO_CHROMA_SUBSAMPLING_MONOCHROME_BIT_KHR,VK_VIDEO_CHROMA_SUBSAMPLING_420_BIT_KHR,VK_VIDEO_CHROMA_SUBSAMPLING_422_BIT_KHR,VK_VIDEO_CHROMA_SUBSAMPLING_444_BIT_KHR,VK_VIDEO_CHROMA_SUBSAMPLING_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x10\xD5\x00\x00\x00\x16VkVideoCodecOperationFlagBitsKHR\x00VK_VIDEO_CODEC_OPERATION_NONE_KHR,VK_VIDEO_CODEC_OPERATION_ENCODE_H264_BIT_KHR,VK_VIDEO_CODEC_OPERATION_ENCODE_H265_BIT_KHR,VK_VIDEO_CODEC_OPERATION_DECODE_H264_BIT_KHR,VK_VIDEO_CODEC_OPERATION_DECODE_H265_BIT_KHR,VK_VIDEO_CODEC_OPERATION_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x10\xD6\x00\x00\x00\x16VkVideoCodingControlFlagBitsKHR\x00VK_VIDEO_CODING_CONTROL_RESET_BIT_KHR,VK_VIDEO_CODING_CONTROL_ENCODE_RATE_CONTROL_BIT_KHR,VK_VIDEO_CODING_CONTROL_ENCODE_QUALITY_LEVEL_BIT_KHR,VK_VIDEO_CODING_CONTROL_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x10\xD8\x00\x00\x00\x16VkVideoComponentBitDepthFlagBitsKHR\x00VK_VIDEO_COMPONENT_BIT_DEPTH_INVALID_KHR,VK_VIDEO_COMPONENT_BIT_DEPTH_8_BIT_KHR,VK_VIDEO_COMPONENT_BIT_DEPTH_10_BIT_KHR,VK_VIDEO_COMPONENT_BIT_DEPTH_12_BIT_KHR,VK_VIDEO_COMPONENT_BIT_DEPTH_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x10\xDA\x00\x00\x00\x16VkVideoDecodeCapabilityFlagBitsKHR\x00VK_VIDEO_DECODE_CAPABILITY_DPB_AND_OUTPUT_COINCIDE_BIT_KHR,VK_VIDEO_DECODE_CAPABILITY_DPB_AND_OUTPUT_DISTINCT_BIT_KHR,VK_VIDEO_DECODE_CAPABILITY_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x10\xDE\x00\x00\x00\x16VkVideoDecodeH264PictureLayoutFlagBitsKHR\x00VK_VIDEO_DECODE_H264_PICTURE_LAYOUT_PROGRESSIVE_KHR,VK_VIDEO_DECODE_H264_PICTURE_LAYOUT_INTERLACED_INTERLEAVED_LINES_BIT_KHR,VK_VIDEO_DECODE_H264_PICTURE_LAYOUT_INTERLACED_SEPARATE_PLANES_BIT_KHR,VK_VIDEO_DECODE_H264_PICTURE_LAYOUT_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x10\xEB\x00\x00\x00\x16VkVideoDecodeUsageFlagBitsKHR\x00VK_VIDEO_DECODE_USAGE_DEFAULT_KHR,VK_VIDEO_DECODE_USAGE_TRANSCODING_BIT_KHR,VK_VIDEO_DECODE_USAGE_OFFLINE_BIT_KHR,VK_VIDEO_DECODE_USAGE_STREAMING_BIT_KHR,VK_VIDEO_DECODE_USAGE_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x10\xEE\x00\x00\x00\x16VkVideoEncodeCapabilityFlagBitsKHR\x00VK_VIDEO_ENCODE_CAPABILITY_PRECEDING_EXTERNALLY_ENCODED_BYTES_BIT_KHR,VK_VIDEO_ENCODE_CAPABILITY_INSUFFICIENT_BITSTREAM_BUFFER_RANGE_DETECTION_BIT_KHR,VK_VIDEO_ENCODE_CAPABILITY_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x10\xEF\x00\x00\x00\x16VkVideoEncodeContentFlagBitsKHR\x00VK_VIDEO_ENCODE_CONTENT_DEFAULT_KHR,VK_VIDEO_ENCODE_CONTENT_CAMERA_BIT_KHR,VK_VIDEO_ENCODE_CONTENT_DESKTOP_BIT_KHR,VK_VIDEO_ENCODE_CONTENT_RENDERED_BIT_KHR,VK_VIDEO_ENCODE_CONTENT_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x10\xF0\x00\x00\x00\x16VkVideoEncodeFeedbackFlagBitsKHR\x00VK_VIDEO_ENCODE_FEEDBACK_BITSTREAM_BUFFER_OFFSET_BIT_KHR,VK_VIDEO_ENCODE_FEEDBACK_BITSTREAM_BYTES_WRITTEN_BIT_KHR,VK_VIDEO_ENCODE_FEEDBACK_BITSTREAM_HAS_OVERRIDES_BIT_KHR,VK_VIDEO_ENCODE_FEEDBACK_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x10\xF2\x00\x00\x00\x16VkVideoEncodeH264CapabilityFlagBitsKHR\x00VK_VIDEO_ENCODE_H264_CAPABILITY_HRD_COMPLIANCE_BIT_KHR,VK_VIDEO_ENCODE_H264_CAPABILITY_PREDICTION_WEIGHT_TABLE_GENERATED_BIT_KHR,VK_VIDEO_ENCODE_H264_CAPABILITY_ROW_UNALIGNED_SLICE_BIT_KHR,VK_VIDEO_ENCODE_H264_CAPABILITY_DIFFERENT_SLICE_TYPE_BIT_KHR,VK_VIDEO_ENCODE_H264_CAPABILITY_B_FRAME_IN_L0_LIST_BIT_KHR,VK_VIDEO_ENCODE_H264_CAPABILITY_B_FRAME_IN_L1_LIST_BIT_KHR,VK_VIDEO_ENCODE_H264_CAPABILITY_PER_PICTURE_TYPE_MIN_MAX_QP_BIT_KHR,VK_VIDEO_ENCODE_H264_CAPABILITY_PER_SLICE_CONSTANT_QP_BIT_KHR,VK_VIDEO_ENCODE_H264_CAPABILITY_GENERATE_PREFIX_NALU_BIT_KHR,VK_VIDEO_ENCODE_H264_CAPABILITY_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x10\xFC\x00\x00\x00\x16VkVideoEncodeH264RateControlFlagBitsKHR\x00VK_VIDEO_ENCODE_H264_RATE_CONTROL_ATTEMPT_HRD_COMPLIANCE_BIT_KHR,VK_VIDEO_ENCODE_H264_RATE_CONTROL_REGULAR_GOP_BIT_KHR,VK_VIDEO_ENCODE_H264_RATE_CONTROL_REFERENCE_PATTERN_FLAT_BIT_KHR,VK_VIDEO_ENCODE_H264_RATE_CONTROL_REFERENCE_PATTERN_DYADIC_BIT_KHR,VK_VIDEO_ENCODE_H264_RATE_CONTROL_TEMPORAL_LAYER_PATTERN_DYADIC_BIT_KHR,VK_VIDEO_ENCODE_H264_RATE_CONTROL_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x11\x05\x00\x00\x00\x16VkVideoEncodeH264StdFlagBitsKHR\x00VK_VIDEO_ENCODE_H264_STD_SEPARATE_COLOR_PLANE_FLAG_SET_BIT_KHR,VK_VIDEO_ENCODE_H264_STD_QPPRIME_Y_ZERO_TRANSFORM_BYPASS_FLAG_SET_BIT_KHR,VK_VIDEO_ENCODE_H264_STD_SCALING_MATRIX_PRESENT_FLAG_SET_BIT_KHR,VK_VIDEO_ENCODE_H264_STD_CHROMA_QP_INDEX_OFFSET_BIT_KHR,VK_VIDEO_ENCODE_H264_STD_SECOND_CHROMA_QP_INDEX_OFFSET_BIT_KHR,VK_VIDEO_ENCODE_H264_STD_PIC_INIT_QP_MINUS26_BIT_KHR,VK_VIDEO_ENCODE_H264_STD_WEIGHTED_PRED_FLAG_SET_BIT_KHR,VK_VIDEO_ENCODE_H264_STD_WEIGHTED_BIPRED_IDC_EXPLICIT_BIT_KHR,VK_VIDEO_ENCODE_H264_STD_WEIGHTED_BIPRED_IDC_IMPLICIT_BIT_KHR,VK_VIDEO_ENCODE_H264_STD_TRANSFORM_8X8_MODE_FLAG_SET_BIT_KHR,VK_VIDEO_ENCODE_H264_STD_DIRECT_SPATIAL_MV_PRED_FLAG_UNSET_BIT_KHR,VK_VIDEO_ENCODE_H264_STD_ENTROPY_CODING_MODE_FLAG_UNSET_BIT_KHR,VK_VIDEO_ENCODE_H264_STD_ENTROPY_CODING_MODE_FLAG_SET_BIT_KHR,VK_VIDEO_ENCODE_H264_STD_DIRECT_8X8_INFERENCE_FLAG_UNSET_BIT_KHR,VK_VIDEO_ENCODE_H264_STD_CONSTRAINED_INTRA_PRED_FLAG_SET_BIT_KHR,VK_VIDEO_ENCODE_H264_STD_DEBLOCKING_FILTER_DISABLED_BIT_KHR,VK_VIDEO_ENCODE_H264_STD_DEBLOCKING_FILTER_ENABLED_BIT_KHR,VK_VIDEO_ENCODE_H264_STD_DEBLOCKING_FILTER_PARTIAL_BIT_KHR,VK_VIDEO_ENCODE_H264_STD_SLICE_QP_DELTA_BIT_KHR,VK_VIDEO_ENCODE_H264_STD_DIFFERENT_SLICE_QP_DELTA_BIT_KHR,VK_VIDEO_ENCODE_H264_STD_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x11\x07\x00\x00\x00\x16VkVideoEncodeH265CapabilityFlagBitsKHR\x00VK_VIDEO_ENCODE_H265_CAPABILITY_HRD_COMPLIANCE_BIT_KHR,VK_VIDEO_ENCODE_H265_CAPABILITY_PREDICTION_WEIGHT_TABLE_GENERATED_BIT_KHR,VK_VIDEO_ENCODE_H265_CAPABILITY_ROW_UNALIGNED_SLICE_SEGMENT_BIT_KHR,VK_VIDEO_ENCODE_H265_CAPABILITY_DIFFERENT_SLICE_SEGMENT_TYPE_BIT_KHR,VK_VIDEO_ENCODE_H265_CAPABILITY_B_FRAME_IN_L0_LIST_BIT_KHR,VK_VIDEO_ENCODE_H265_CAPABILITY_B_FRAME_IN_L1_LIST_BIT_KHR,VK_VIDEO_ENCODE_H265_CAPABILITY_PER_PICTURE_TYPE_MIN_MAX_QP_BIT_KHR,VK_VIDEO_ENCODE_H265_CAPABILITY_PER_SLICE_SEGMENT_CONSTANT_QP_BIT_KHR,VK_VIDEO_ENCODE_H265_CAPABILITY_MULTIPLE_TILES_PER_SLICE_SEGMENT_BIT_KHR,VK_VIDEO_ENCODE_H265_CAPABILITY_MULTIPLE_SLICE_SEGMENTS_PER_TILE_BIT_KHR,VK_VIDEO_ENCODE_H265_CAPABILITY_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x11\x08\x00\x00\x00\x16VkVideoEncodeH265CtbSizeFlagBitsKHR\x00VK_VIDEO_ENCODE_H265_CTB_SIZE_16_BIT_KHR,VK_VIDEO_ENCODE_H265_CTB_SIZE_32_BIT_KHR,VK_VIDEO_ENCODE_H265_CTB_SIZE_64_BIT_KHR,VK_VIDEO_ENCODE_H265_CTB_SIZE_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x11\x12\x00\x00\x00\x16VkVideoEncodeH265RateControlFlagBitsKHR\x00VK_VIDEO_ENCODE_H265_RATE_CONTROL_ATTEMPT_HRD_COMPLIANCE_BIT_KHR,VK_VIDEO_ENCODE_H265_RATE_CONTROL_REGULAR_GOP_BIT_KHR,VK_VIDEO_ENCODE_H265_RATE_CONTROL_REFERENCE_PATTERN_FLAT_BIT_KHR,VK_VIDEO_ENCODE_H265_RATE_CONTROL_REFERENCE_PATTERN_DYADIC_BIT_KHR,VK_VIDEO_ENCODE_H265_RATE_CONTROL_TEMPORAL_SUB_LAYER_PATTERN_DYADIC_BIT_KHR,VK_VIDEO_ENCODE_H265_RATE_CONTROL_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x11\x1B\x00\x00\x00\x16VkVideoEncodeH265StdFlagBitsKHR\x00VK_VIDEO_ENCODE_H265_STD_SEPARATE_COLOR_PLANE_FLAG_SET_BIT_KHR,VK_VIDEO_ENCODE_H265_STD_SAMPLE_ADAPTIVE_OFFSET_ENABLED_FLAG_SET_BIT_KHR,VK_VIDEO_ENCODE_H265_STD_SCALING_LIST_DATA_PRESENT_FLAG_SET_BIT_KHR,VK_VIDEO_ENCODE_H265_STD_PCM_ENABLED_FLAG_SET_BIT_KHR,VK_VIDEO_ENCODE_H265_STD_SPS_TEMPORAL_MVP_ENABLED_FLAG_SET_BIT_KHR,VK_VIDEO_ENCODE_H265_STD_INIT_QP_MINUS26_BIT_KHR,VK_VIDEO_ENCODE_H265_STD_WEIGHTED_PRED_FLAG_SET_BIT_KHR,VK_VIDEO_ENCODE_H265_STD_WEIGHTED_BIPRED_FLAG_SET_BIT_KHR,VK_VIDEO_ENCODE_H265_STD_LOG2_PARALLEL_MERGE_LEVEL_MINUS2_BIT_KHR,VK_VIDEO_ENCODE_H265_STD_SIGN_DATA_HIDING_ENABLED_FLAG_SET_BIT_KHR,VK_VIDEO_ENCODE_H265_STD_TRANSFORM_SKIP_ENABLED_FLAG_SET_BIT_KHR,VK_VIDEO_ENCODE_H265_STD_TRANSFORM_SKIP_ENABLED_FLAG_UNSET_BIT_KHR,VK_VIDEO_ENCODE_H265_STD_PPS_SLICE_CHROMA_QP_OFFSETS_PRESENT_FLAG_SET_BIT_KHR,VK_VIDEO_ENCODE_H265_STD_TRANSQUANT_BYPASS_ENABLED_FLAG_SET_BIT_KHR,VK_VIDEO_ENCODE_H265_STD_CONSTRAINED_INTRA_PRED_FLAG_SET_BIT_KHR,VK_VIDEO_ENCODE_H265_STD_ENTROPY_CODING_SYNC_ENABLED_FLAG_SET_BIT_KHR,VK_VIDEO_ENCODE_H265_STD_DEBLOCKING_FILTER_OVERRIDE_ENABLED_FLAG_SET_BIT_KHR,VK_VIDEO_ENCODE_H265_STD_DEPENDENT_SLICE_SEGMENTS_ENABLED_FLAG_SET_BIT_KHR,VK_VIDEO_ENCODE_H265_STD_DEPENDENT_SLICE_SEGMENT_FLAG_SET_BIT_KHR,VK_VIDEO_ENCODE_H265_STD_SLICE_QP_DELTA_BIT_KHR,VK_VIDEO_ENCODE_H265_STD_DIFFERENT_SLICE_QP_DELTA_BIT_KHR,VK_VIDEO_ENCODE_H265_STD_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x11\x1C\x00\x00\x00\x16VkVideoEncodeH265TransformBlockSizeFlagBitsKHR\x00VK_VIDEO_ENCODE_H265_TRANSFORM_BLOCK_SIZE_4_BIT_KHR,VK_VIDEO_ENCODE_H265_TRANSFORM_BLOCK_SIZE_8_BIT_KHR,VK_VIDEO_ENCODE_H265_TRANSFORM_BLOCK_SIZE_16_BIT_KHR,VK_VIDEO_ENCODE_H265_TRANSFORM_BLOCK_SIZE_32_BIT_KHR,VK_VIDEO_ENCODE_H265_TRANSFORM_BLOCK_SIZE_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x11\x23\x00\x00\x00\x16VkVideoEncodeRateControlModeFlagBitsKHR\x00VK_VIDEO_ENCODE_RATE_CONTROL_MODE_DEFAULT_KHR,VK_VIDEO_ENCODE_RATE_CONTROL_MODE_DISABLED_BIT_KHR,VK_VIDEO_ENCODE_RATE_CONTROL_MODE_CBR_BIT_KHR,VK_VIDEO_ENCODE_RATE_CONTROL_MODE_VBR_BIT_KHR,VK_VIDEO_ENCODE_RATE_CONTROL_MODE_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x11\x26\x00\x00\x00\x16VkVideoEncodeTuningModeKHR\x00VK_VIDEO_ENCODE_TUNING_MODE_DEFAULT_KHR,VK_VIDEO_ENCODE_TUNING_MODE_HIGH_QUALITY_KHR,VK_VIDEO_ENCODE_TUNING_MODE_LOW_LATENCY_KHR,VK_VIDEO_ENCODE_TUNING_MODE_ULTRA_LOW_LATENCY_KHR,VK_VIDEO_ENCODE_TUNING_MODE_LOSSLESS_KHR,VK_VIDEO_ENCODE_TUNING_MODE_MAX_ENUM_KHR',b'\x00\x00\x11\x27\x00\x00\x00\x16VkVideoEncodeUsageFlagBitsKHR\x00VK_VIDEO_ENCODE_USAGE_DEFAULT_KHR,VK_VIDEO_ENCODE_USAGE_TRANSCODING_BIT_KHR,VK_VIDEO_ENCODE_USAGE_STREAMING_BIT_KHR,VK_VIDEO_ENCODE_USAGE_RECORDING_BIT_KHR,VK_VIDEO_ENCODE_USAGE_CONFERENCING_BIT_KHR,VK_VIDEO_ENCODE_USAGE_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x11\x32\x00\x00\x00\x16VkVideoSessionCreateFlagBitsKHR\x00VK_VIDEO_SESSION_CREATE_PROTECTED_CONTENT_BIT_KHR,VK_VIDEO_SESSION_CREATE_ALLOW_ENCODE_PARAMETER_OPTIMIZATIONS_BIT_KHR,VK_VIDEO_SESSION_CREATE_INLINE_QUERIES_BIT_KHR,VK_VIDEO_SESSION_CREATE_FLAG_BITS_MAX_ENUM_KHR',b'\x00\x00\x11\x38\x00\x00\x00\x16VkViewportCoordinateSwizzleNV\x00VK_VIEWPORT_COORDINATE_SWIZZLE_POSITIVE_X_NV,VK_VIEWPORT_COORDINATE_SWIZZLE_NEGATIVE_X_NV,VK_VIEWPORT_COORDINATE_SWIZZLE_POSITIVE_Y_NV,VK_VIEWPORT_COORDINATE_SWIZZLE_NEGATIVE_Y_NV,VK_VIEWPORT_COORDINATE_SWIZZLE_POSITIVE_Z_NV,VK_VIEWPORT_COORDINATE_SWIZZLE_NEGATIVE_Z_NV,VK_VIEWPORT_COORDINATE_SWIZZLE_POSITIVE_W_NV,VK_VIEWPORT_COORDINATE_SWIZZLE_NEGATIVE_W_NV,VK_VIEWPORT_COORDINATE_SWIZZLE_MAX_ENUM_NV'),
+    _typenames = (b'\x00\x00\x0A\xDBANativeWindow',b'\x00\x00\x04\xE2DWORD',b'\x00\x00\x0A\xDCDisplay',b'\x00\x00\x00\x27HANDLE',b'\x00\x00\x00\x27HINSTANCE',b'\x00\x00\x00\x27HMONITOR',b'\x00\x00\x00\x27HWND',b'\x00\x00\x12\xF5LPCWSTR',b'\x00\x00\x0A\xE6LPSECURITY_ATTRIBUTES',b'\x00\x00\x00\x27LPVOID',b'\x00\x00\x0A\xDDMirBlob',b'\x00\x00\x0A\xDEMirBufferStream',b'\x00\x00\x0A\xDFMirConnection',b'\x00\x00\x0A\xE0MirDisplayConfig',b'\x00\x00\x00\x27MirEGLNativeDisplayType',b'\x00\x00\x00\x27MirEGLNativeWindowType',b'\x00\x00\x0A\xE1MirPersistentId',b'\x00\x00\x0A\xE2MirPromptSession',b'\x00\x00\x0A\xE3MirScreencast',b'\x00\x00\x0A\xE4MirSurface',b'\x00\x00\x0A\xE5MirSurfaceSpec',b'\x00\x00\x10\x13PFN_vkAcquireDrmDisplayEXT',b'\x00\x00\x0F\xE1PFN_vkAcquireFullScreenExclusiveModeEXT',b'\x00\x00\x0F\x64PFN_vkAcquireNextImage2KHR',b'\x00\x00\x0F\xE8PFN_vkAcquireNextImageKHR',b'\x00\x00\x0F\x9APFN_vkAcquirePerformanceConfigurationINTEL',b'\x00\x00\x0F\x65PFN_vkAcquireProfilingLockKHR',b'\x00\x00\x10\x15PFN_vkAcquireWinrtDisplayNV',b'\x00\x00\x0F\x6APFN_vkAllocateCommandBuffers',b'\x00\x00\x0F\x78PFN_vkAllocateDescriptorSets',b'\x00\x00\x0F\x90PFN_vkAllocateMemory',b'\x00\x00\x11\xE7PFN_vkAllocationFunction',b'\x00\x00\x0F\x5BPFN_vkBeginCommandBuffer',b'\x00\x00\x0F\xEFPFN_vkBindAccelerationStructureMemoryNV',b'\x00\x00\x0F\xB9PFN_vkBindBufferMemory',b'\x00\x00\x0F\xF0PFN_vkBindBufferMemory2',b'\x00\x00\x0F\xF0PFN_vkBindBufferMemory2KHR',b'\x00\x00\x0F\xD1PFN_vkBindImageMemory',b'\x00\x00\x0F\xF1PFN_vkBindImageMemory2',b'\x00\x00\x0F\xF1PFN_vkBindImageMemory2KHR',b'\x00\x00\x0F\xD2PFN_vkBindOpticalFlowSessionImageNV',b'\x00\x00\x0F\xEDPFN_vkBindVideoSessionMemoryKHR',b'\x00\x00\x0F\xC4PFN_vkBuildAccelerationStructuresKHR',b'\x00\x00\x0F\xC5PFN_vkBuildMicromapsEXT',b'\x00\x00\x11\xF4PFN_vkCmdBeginConditionalRenderingEXT',b'\x00\x00\x12\x05PFN_vkCmdBeginDebugUtilsLabelEXT',b'\x00\x00\x12\x4DPFN_vkCmdBeginQuery',b'\x00\x00\x12\x4FPFN_vkCmdBeginQueryIndexedEXT',b'\x00\x00\x12\x1EPFN_vkCmdBeginRenderPass',b'\x00\x00\x12\x1DPFN_vkCmdBeginRenderPass2',b'\x00\x00\x12\x1DPFN_vkCmdBeginRenderPass2KHR',b'\x00\x00\x12\x1FPFN_vkCmdBeginRendering',b'\x00\x00\x12\x1FPFN_vkCmdBeginRenderingKHR',b'\x00\x00\x12\x70PFN_vkCmdBeginTransformFeedbackEXT',b'\x00\x00\x12\x2BPFN_vkCmdBeginVideoCodingKHR',b'\x00\x00\x11\xEFPFN_vkCmdBindDescriptorBufferEmbeddedSamplers2EXT',b'\x00\x00\x12\x0FPFN_vkCmdBindDescriptorBufferEmbeddedSamplersEXT',b'\x00\x00\x12\x55PFN_vkCmdBindDescriptorBuffersEXT',b'\x00\x00\x12\x11PFN_vkCmdBindDescriptorSets',b'\x00\x00\x11\xF0PFN_vkCmdBindDescriptorSets2KHR',b'\x00\x00\x12\x38PFN_vkCmdBindIndexBuffer',b'\x00\x00\x12\x3CPFN_vkCmdBindIndexBuffer2KHR',b'\x00\x00\x12\x43PFN_vkCmdBindInvocationMaskHUAWEI',b'\x00\x00\x12\x13PFN_vkCmdBindPipeline',b'\x00\x00\x12\x14PFN_vkCmdBindPipelineShaderGroupNV',b'\x00\x00\x12\x5BPFN_vkCmdBindShadersEXT',b'\x00\x00\x12\x43PFN_vkCmdBindShadingRateImageNV',b'\x00\x00\x12\x71PFN_vkCmdBindTransformFeedbackBuffersEXT',b'\x00\x00\x12\x70PFN_vkCmdBindVertexBuffers',b'\x00\x00\x12\x72PFN_vkCmdBindVertexBuffers2',b'\x00\x00\x12\x72PFN_vkCmdBindVertexBuffers2EXT',b'\x00\x00\x12\x47PFN_vkCmdBlitImage',b'\x00\x00\x11\xF1PFN_vkCmdBlitImage2',b'\x00\x00\x11\xF1PFN_vkCmdBlitImage2KHR',b'\x00\x00\x11\xEEPFN_vkCmdBuildAccelerationStructureNV',b'\x00\x00\x12\x52PFN_vkCmdBuildAccelerationStructuresIndirectKHR',b'\x00\x00\x12\x51PFN_vkCmdBuildAccelerationStructuresKHR',b'\x00\x00\x12\x57PFN_vkCmdBuildMicromapsEXT',b'\x00\x00\x12\x53PFN_vkCmdClearAttachments',b'\x00\x00\x12\x44PFN_vkCmdClearColorImage',b'\x00\x00\x12\x45PFN_vkCmdClearDepthStencilImage',b'\x00\x00\x12\x2CPFN_vkCmdControlVideoCodingKHR',b'\x00\x00\x11\xF6PFN_vkCmdCopyAccelerationStructureKHR',b'\x00\x00\x12\x34PFN_vkCmdCopyAccelerationStructureNV',b'\x00\x00\x11\xF7PFN_vkCmdCopyAccelerationStructureToMemoryKHR',b'\x00\x00\x12\x35PFN_vkCmdCopyBuffer',b'\x00\x00\x11\xF8PFN_vkCmdCopyBuffer2',b'\x00\x00\x11\xF8PFN_vkCmdCopyBuffer2KHR',b'\x00\x00\x12\x36PFN_vkCmdCopyBufferToImage',b'\x00\x00\x11\xF9PFN_vkCmdCopyBufferToImage2',b'\x00\x00\x11\xF9PFN_vkCmdCopyBufferToImage2KHR',b'\x00\x00\x12\x48PFN_vkCmdCopyImage',b'\x00\x00\x11\xFAPFN_vkCmdCopyImage2',b'\x00\x00\x11\xFAPFN_vkCmdCopyImage2KHR',b'\x00\x00\x12\x46PFN_vkCmdCopyImageToBuffer',b'\x00\x00\x11\xFBPFN_vkCmdCopyImageToBuffer2',b'\x00\x00\x11\xFBPFN_vkCmdCopyImageToBuffer2KHR',b'\x00\x00\x12\x7DPFN_vkCmdCopyMemoryIndirectNV',b'\x00\x00\x11\xFCPFN_vkCmdCopyMemoryToAccelerationStructureKHR',b'\x00\x00\x12\x7EPFN_vkCmdCopyMemoryToImageIndirectNV',b'\x00\x00\x11\xFDPFN_vkCmdCopyMemoryToMicromapEXT',b'\x00\x00\x11\xFEPFN_vkCmdCopyMicromapEXT',b'\x00\x00\x11\xFFPFN_vkCmdCopyMicromapToMemoryEXT',b'\x00\x00\x12\x4EPFN_vkCmdCopyQueryPoolResults',b'\x00\x00\x12\x02PFN_vkCmdCuLaunchKernelNVX',b'\x00\x00\x12\x03PFN_vkCmdCudaLaunchKernelNV',b'\x00\x00\x12\x04PFN_vkCmdDebugMarkerBeginEXT',b'\x00\x00\x11\xEDPFN_vkCmdDebugMarkerEndEXT',b'\x00\x00\x12\x04PFN_vkCmdDebugMarkerInsertEXT',b'\x00\x00\x12\x2DPFN_vkCmdDecodeVideoKHR',b'\x00\x00\x12\x7FPFN_vkCmdDecompressMemoryIndirectCountNV',b'\x00\x00\x12\x54PFN_vkCmdDecompressMemoryNV',b'\x00\x00\x12\x75PFN_vkCmdDispatch',b'\x00\x00\x12\x79PFN_vkCmdDispatchBase',b'\x00\x00\x12\x79PFN_vkCmdDispatchBaseKHR',b'\x00\x00\x12\x37PFN_vkCmdDispatchIndirect',b'\x00\x00\x12\x77PFN_vkCmdDraw',b'\x00\x00\x12\x75PFN_vkCmdDrawClusterHUAWEI',b'\x00\x00\x12\x37PFN_vkCmdDrawClusterIndirectHUAWEI',b'\x00\x00\x12\x76PFN_vkCmdDrawIndexed',b'\x00\x00\x12\x3BPFN_vkCmdDrawIndexedIndirect',b'\x00\x00\x12\x39PFN_vkCmdDrawIndexedIndirectCount',b'\x00\x00\x12\x39PFN_vkCmdDrawIndexedIndirectCountAMD',b'\x00\x00\x12\x39PFN_vkCmdDrawIndexedIndirectCountKHR',b'\x00\x00\x12\x3BPFN_vkCmdDrawIndirect',b'\x00\x00\x12\x73PFN_vkCmdDrawIndirectByteCountEXT',b'\x00\x00\x12\x39PFN_vkCmdDrawIndirectCount',b'\x00\x00\x12\x39PFN_vkCmdDrawIndirectCountAMD',b'\x00\x00\x12\x39PFN_vkCmdDrawIndirectCountKHR',b'\x00\x00\x12\x75PFN_vkCmdDrawMeshTasksEXT',b'\x00\x00\x12\x39PFN_vkCmdDrawMeshTasksIndirectCountEXT',b'\x00\x00\x12\x39PFN_vkCmdDrawMeshTasksIndirectCountNV',b'\x00\x00\x12\x3BPFN_vkCmdDrawMeshTasksIndirectEXT',b'\x00\x00\x12\x3BPFN_vkCmdDrawMeshTasksIndirectNV',b'\x00\x00\x12\x68PFN_vkCmdDrawMeshTasksNV',b'\x00\x00\x12\x59PFN_vkCmdDrawMultiEXT',b'\x00\x00\x12\x58PFN_vkCmdDrawMultiIndexedEXT',b'\x00\x00\x12\x2EPFN_vkCmdEncodeVideoKHR',b'\x00\x00\x11\xEDPFN_vkCmdEndConditionalRenderingEXT',b'\x00\x00\x11\xEDPFN_vkCmdEndDebugUtilsLabelEXT',b'\x00\x00\x12\x4CPFN_vkCmdEndQuery',b'\x00\x00\x12\x4DPFN_vkCmdEndQueryIndexedEXT',b'\x00\x00\x11\xEDPFN_vkCmdEndRenderPass',b'\x00\x00\x12\x29PFN_vkCmdEndRenderPass2',b'\x00\x00\x12\x29PFN_vkCmdEndRenderPass2KHR',b'\x00\x00\x11\xEDPFN_vkCmdEndRendering',b'\x00\x00\x11\xEDPFN_vkCmdEndRenderingKHR',b'\x00\x00\x12\x70PFN_vkCmdEndTransformFeedbackEXT',b'\x00\x00\x12\x2FPFN_vkCmdEndVideoCodingKHR',b'\x00\x00\x12\x62PFN_vkCmdExecuteCommands',b'\x00\x00\x12\x56PFN_vkCmdExecuteGeneratedCommandsNV',b'\x00\x00\x12\x3DPFN_vkCmdFillBuffer',b'\x00\x00\x12\x05PFN_vkCmdInsertDebugUtilsLabelEXT',b'\x00\x00\x12\x28PFN_vkCmdNextSubpass',b'\x00\x00\x12\x27PFN_vkCmdNextSubpass2',b'\x00\x00\x12\x27PFN_vkCmdNextSubpass2KHR',b'\x00\x00\x12\x4APFN_vkCmdOpticalFlowExecuteNV',b'\x00\x00\x12\x78PFN_vkCmdPipelineBarrier',b'\x00\x00\x12\x06PFN_vkCmdPipelineBarrier2',b'\x00\x00\x12\x06PFN_vkCmdPipelineBarrier2KHR',b'\x00\x00\x12\x0CPFN_vkCmdPreprocessGeneratedCommandsNV',b'\x00\x00\x12\x4BPFN_vkCmdPushConstants',b'\x00\x00\x12\x1APFN_vkCmdPushConstants2KHR',b'\x00\x00\x12\x1BPFN_vkCmdPushDescriptorSet2KHR',b'\x00\x00\x12\x10PFN_vkCmdPushDescriptorSetKHR',b'\x00\x00\x12\x1CPFN_vkCmdPushDescriptorSetWithTemplate2KHR',b'\x00\x00\x12\x3FPFN_vkCmdPushDescriptorSetWithTemplateKHR',b'\x00\x00\x12\x41PFN_vkCmdResetEvent',b'\x00\x00\x12\x42PFN_vkCmdResetEvent2',b'\x00\x00\x12\x42PFN_vkCmdResetEvent2KHR',b'\x00\x00\x12\x4DPFN_vkCmdResetQueryPool',b'\x00\x00\x12\x49PFN_vkCmdResolveImage',b'\x00\x00\x12\x20PFN_vkCmdResolveImage2',b'\x00\x00\x12\x20PFN_vkCmdResolveImage2KHR',b'\x00\x00\x12\x50PFN_vkCmdSetAlphaToCoverageEnableEXT',b'\x00\x00\x12\x50PFN_vkCmdSetAlphaToOneEnableEXT',b'\x00\x00\x12\x50PFN_vkCmdSetAttachmentFeedbackLoopEnableEXT',b'\x00\x00\x12\x30PFN_vkCmdSetBlendConstants',b'\x00\x00\x12\x80PFN_vkCmdSetCheckpointNV',b'\x00\x00\x11\xF2PFN_vkCmdSetCoarseSampleOrderNV',b'\x00\x00\x12\x69PFN_vkCmdSetColorBlendAdvancedEXT',b'\x00\x00\x12\x74PFN_vkCmdSetColorBlendEnableEXT',b'\x00\x00\x12\x6APFN_vkCmdSetColorBlendEquationEXT',b'\x00\x00\x12\x67PFN_vkCmdSetColorWriteEnableEXT',b'\x00\x00\x12\x74PFN_vkCmdSetColorWriteMaskEXT',b'\x00\x00\x11\xF5PFN_vkCmdSetConservativeRasterizationModeEXT',b'\x00\x00\x12\x00PFN_vkCmdSetCoverageModulationModeNV',b'\x00\x00\x12\x50PFN_vkCmdSetCoverageModulationTableEnableNV',b'\x00\x00\x12\x5FPFN_vkCmdSetCoverageModulationTableNV',b'\x00\x00\x12\x01PFN_vkCmdSetCoverageReductionModeNV',b'\x00\x00\x12\x50PFN_vkCmdSetCoverageToColorEnableNV',b'\x00\x00\x12\x50PFN_vkCmdSetCoverageToColorLocationNV',b'\x00\x00\x12\x50PFN_vkCmdSetCullMode',b'\x00\x00\x12\x50PFN_vkCmdSetCullModeEXT',b'\x00\x00\x12\x33PFN_vkCmdSetDepthBias',b'\x00\x00\x12\x07PFN_vkCmdSetDepthBias2EXT',b'\x00\x00\x12\x50PFN_vkCmdSetDepthBiasEnable',b'\x00\x00\x12\x50PFN_vkCmdSetDepthBiasEnableEXT',b'\x00\x00\x12\x32PFN_vkCmdSetDepthBounds',b'\x00\x00\x12\x50PFN_vkCmdSetDepthBoundsTestEnable',b'\x00\x00\x12\x50PFN_vkCmdSetDepthBoundsTestEnableEXT',b'\x00\x00\x12\x50PFN_vkCmdSetDepthClampEnableEXT',b'\x00\x00\x12\x50PFN_vkCmdSetDepthClipEnableEXT',b'\x00\x00\x12\x50PFN_vkCmdSetDepthClipNegativeOneToOneEXT',b'\x00\x00\x11\xF3PFN_vkCmdSetDepthCompareOp',b'\x00\x00\x11\xF3PFN_vkCmdSetDepthCompareOpEXT',b'\x00\x00\x12\x50PFN_vkCmdSetDepthTestEnable',b'\x00\x00\x12\x50PFN_vkCmdSetDepthTestEnableEXT',b'\x00\x00\x12\x50PFN_vkCmdSetDepthWriteEnable',b'\x00\x00\x12\x50PFN_vkCmdSetDepthWriteEnableEXT',b'\x00\x00\x12\x24PFN_vkCmdSetDescriptorBufferOffsets2EXT',b'\x00\x00\x12\x12PFN_vkCmdSetDescriptorBufferOffsetsEXT',b'\x00\x00\x12\x50PFN_vkCmdSetDeviceMask',b'\x00\x00\x12\x50PFN_vkCmdSetDeviceMaskKHR',b'\x00\x00\x12\x6BPFN_vkCmdSetDiscardRectangleEXT',b'\x00\x00\x12\x50PFN_vkCmdSetDiscardRectangleEnableEXT',b'\x00\x00\x12\x08PFN_vkCmdSetDiscardRectangleModeEXT',b'\x00\x00\x12\x41PFN_vkCmdSetEvent',b'\x00\x00\x12\x40PFN_vkCmdSetEvent2',b'\x00\x00\x12\x40PFN_vkCmdSetEvent2KHR',b'\x00\x00\x12\x74PFN_vkCmdSetExclusiveScissorEnableNV',b'\x00\x00\x12\x6BPFN_vkCmdSetExclusiveScissorNV',b'\x00\x00\x12\x31PFN_vkCmdSetExtraPrimitiveOverestimationSizeEXT',b'\x00\x00\x12\x0APFN_vkCmdSetFragmentShadingRateEnumNV',b'\x00\x00\x12\x09PFN_vkCmdSetFragmentShadingRateKHR',b'\x00\x00\x12\x0BPFN_vkCmdSetFrontFace',b'\x00\x00\x12\x0BPFN_vkCmdSetFrontFaceEXT',b'\x00\x00\x12\x0DPFN_vkCmdSetLineRasterizationModeEXT',b'\x00\x00\x12\x66PFN_vkCmdSetLineStippleEXT',b'\x00\x00\x12\x50PFN_vkCmdSetLineStippleEnableEXT',b'\x00\x00\x12\x31PFN_vkCmdSetLineWidth',b'\x00\x00\x12\x0EPFN_vkCmdSetLogicOpEXT',b'\x00\x00\x12\x50PFN_vkCmdSetLogicOpEnableEXT',b'\x00\x00\x12\x50PFN_vkCmdSetPatchControlPointsEXT',b'\x00\x00\x0F\x5CPFN_vkCmdSetPerformanceMarkerINTEL',b'\x00\x00\x0F\x5DPFN_vkCmdSetPerformanceOverrideINTEL',b'\x00\x00\x0F\x5EPFN_vkCmdSetPerformanceStreamMarkerINTEL',b'\x00\x00\x12\x17PFN_vkCmdSetPolygonModeEXT',b'\x00\x00\x12\x50PFN_vkCmdSetPrimitiveRestartEnable',b'\x00\x00\x12\x50PFN_vkCmdSetPrimitiveRestartEnableEXT',b'\x00\x00\x12\x18PFN_vkCmdSetPrimitiveTopology',b'\x00\x00\x12\x18PFN_vkCmdSetPrimitiveTopologyEXT',b'\x00\x00\x12\x19PFN_vkCmdSetProvokingVertexModeEXT',b'\x00\x00\x12\x21PFN_vkCmdSetRasterizationSamplesEXT',b'\x00\x00\x12\x50PFN_vkCmdSetRasterizationStreamEXT',b'\x00\x00\x12\x50PFN_vkCmdSetRasterizerDiscardEnable',b'\x00\x00\x12\x50PFN_vkCmdSetRasterizerDiscardEnableEXT',b'\x00\x00\x12\x50PFN_vkCmdSetRayTracingPipelineStackSizeKHR',b'\x00\x00\x12\x50PFN_vkCmdSetRepresentativeFragmentTestEnableNV',b'\x00\x00\x12\x23PFN_vkCmdSetSampleLocationsEXT',b'\x00\x00\x12\x50PFN_vkCmdSetSampleLocationsEnableEXT',b'\x00\x00\x12\x22PFN_vkCmdSetSampleMaskEXT',b'\x00\x00\x12\x6BPFN_vkCmdSetScissor',b'\x00\x00\x12\x5APFN_vkCmdSetScissorWithCount',b'\x00\x00\x12\x5APFN_vkCmdSetScissorWithCountEXT',b'\x00\x00\x12\x50PFN_vkCmdSetShadingRateImageEnableNV',b'\x00\x00\x12\x68PFN_vkCmdSetStencilCompareMask',b'\x00\x00\x12\x5CPFN_vkCmdSetStencilOp',b'\x00\x00\x12\x5CPFN_vkCmdSetStencilOpEXT',b'\x00\x00\x12\x68PFN_vkCmdSetStencilReference',b'\x00\x00\x12\x50PFN_vkCmdSetStencilTestEnable',b'\x00\x00\x12\x50PFN_vkCmdSetStencilTestEnableEXT',b'\x00\x00\x12\x68PFN_vkCmdSetStencilWriteMask',b'\x00\x00\x12\x2APFN_vkCmdSetTessellationDomainOriginEXT',b'\x00\x00\x12\x5DPFN_vkCmdSetVertexInputEXT',b'\x00\x00\x12\x6DPFN_vkCmdSetViewport',b'\x00\x00\x12\x6CPFN_vkCmdSetViewportShadingRatePaletteNV',b'\x00\x00\x12\x6EPFN_vkCmdSetViewportSwizzleNV',b'\x00\x00\x12\x50PFN_vkCmdSetViewportWScalingEnableNV',b'\x00\x00\x12\x6FPFN_vkCmdSetViewportWScalingNV',b'\x00\x00\x12\x5EPFN_vkCmdSetViewportWithCount',b'\x00\x00\x12\x5EPFN_vkCmdSetViewportWithCountEXT',b'\x00\x00\x11\xEDPFN_vkCmdSubpassShadingHUAWEI',b'\x00\x00\x12\x7APFN_vkCmdTraceRaysIndirect2KHR',b'\x00\x00\x12\x26PFN_vkCmdTraceRaysIndirectKHR',b'\x00\x00\x12\x25PFN_vkCmdTraceRaysKHR',b'\x00\x00\x12\x3APFN_vkCmdTraceRaysNV',b'\x00\x00\x12\x3EPFN_vkCmdUpdateBuffer',b'\x00\x00\x12\x13PFN_vkCmdUpdatePipelineIndirectBufferNV',b'\x00\x00\x12\x64PFN_vkCmdWaitEvents',b'\x00\x00\x12\x63PFN_vkCmdWaitEvents2',b'\x00\x00\x12\x63PFN_vkCmdWaitEvents2KHR',b'\x00\x00\x12\x60PFN_vkCmdWriteAccelerationStructuresPropertiesKHR',b'\x00\x00\x12\x61PFN_vkCmdWriteAccelerationStructuresPropertiesNV',b'\x00\x00\x12\x7BPFN_vkCmdWriteBufferMarker2AMD',b'\x00\x00\x12\x15PFN_vkCmdWriteBufferMarkerAMD',b'\x00\x00\x12\x65PFN_vkCmdWriteMicromapsPropertiesEXT',b'\x00\x00\x12\x16PFN_vkCmdWriteTimestamp',b'\x00\x00\x12\x7CPFN_vkCmdWriteTimestamp2',b'\x00\x00\x12\x7CPFN_vkCmdWriteTimestamp2KHR',b'\x00\x00\x0F\xDAPFN_vkCompileDeferredNV',b'\x00\x00\x0F\xBDPFN_vkCopyAccelerationStructureKHR',b'\x00\x00\x0F\xBEPFN_vkCopyAccelerationStructureToMemoryKHR',b'\x00\x00\x0F\x6CPFN_vkCopyImageToImageEXT',b'\x00\x00\x0F\x6DPFN_vkCopyImageToMemoryEXT',b'\x00\x00\x0F\xBFPFN_vkCopyMemoryToAccelerationStructureKHR',b'\x00\x00\x0F\x6EPFN_vkCopyMemoryToImageEXT',b'\x00\x00\x0F\xC0PFN_vkCopyMemoryToMicromapEXT',b'\x00\x00\x0F\xC1PFN_vkCopyMicromapEXT',b'\x00\x00\x0F\xC2PFN_vkCopyMicromapToMemoryEXT',b'\x00\x00\x0F\x62PFN_vkCreateAccelerationStructureKHR',b'\x00\x00\x0F\x63PFN_vkCreateAccelerationStructureNV',b'\x00\x00\x0F\xFBPFN_vkCreateAndroidSurfaceKHR',b'\x00\x00\x0F\x68PFN_vkCreateBuffer',b'\x00\x00\x0F\x69PFN_vkCreateBufferView',b'\x00\x00\x0F\x6BPFN_vkCreateCommandPool',b'\x00\x00\x0F\xD5PFN_vkCreateComputePipelines',b'\x00\x00\x0F\x6FPFN_vkCreateCuFunctionNVX',b'\x00\x00\x0F\x70PFN_vkCreateCuModuleNVX',b'\x00\x00\x0F\x71PFN_vkCreateCudaFunctionNV',b'\x00\x00\x0F\x72PFN_vkCreateCudaModuleNV',b'\x00\x00\x0F\xFCPFN_vkCreateDebugReportCallbackEXT',b'\x00\x00\x0F\xFDPFN_vkCreateDebugUtilsMessengerEXT',b'\x00\x00\x0F\x66PFN_vkCreateDeferredOperationKHR',b'\x00\x00\x0F\x77PFN_vkCreateDescriptorPool',b'\x00\x00\x0F\x79PFN_vkCreateDescriptorSetLayout',b'\x00\x00\x0F\x7APFN_vkCreateDescriptorUpdateTemplate',b'\x00\x00\x0F\x7APFN_vkCreateDescriptorUpdateTemplateKHR',b'\x00\x00\x10\x06PFN_vkCreateDevice',b'\x00\x00\x10\x16PFN_vkCreateDisplayModeKHR',b'\x00\x00\x0F\xFEPFN_vkCreateDisplayPlaneSurfaceKHR',b'\x00\x00\x0F\x7EPFN_vkCreateEvent',b'\x00\x00\x0F\x82PFN_vkCreateFence',b'\x00\x00\x0F\x85PFN_vkCreateFramebuffer',b'\x00\x00\x0F\xD6PFN_vkCreateGraphicsPipelines',b'\x00\x00\x0F\xFFPFN_vkCreateHeadlessSurfaceEXT',b'\x00\x00\x0F\x87PFN_vkCreateImage',b'\x00\x00\x0F\x89PFN_vkCreateImageView',b'\x00\x00\x0F\x8EPFN_vkCreateIndirectCommandsLayoutNV',b'\x00\x00\x0F\x58PFN_vkCreateInstance',b'\x00\x00\x0F\x97PFN_vkCreateMicromapEXT',b'\x00\x00\x0F\x99PFN_vkCreateOpticalFlowSessionNV',b'\x00\x00\x0F\x9DPFN_vkCreatePipelineCache',b'\x00\x00\x0F\xA2PFN_vkCreatePipelineLayout',b'\x00\x00\x0F\xA3PFN_vkCreatePrivateDataSlot',b'\x00\x00\x0F\xA3PFN_vkCreatePrivateDataSlotEXT',b'\x00\x00\x0F\xA4PFN_vkCreateQueryPool',b'\x00\x00\x0F\xC3PFN_vkCreateRayTracingPipelinesKHR',b'\x00\x00\x0F\xD7PFN_vkCreateRayTracingPipelinesNV',b'\x00\x00\x0F\xA6PFN_vkCreateRenderPass',b'\x00\x00\x0F\xA7PFN_vkCreateRenderPass2',b'\x00\x00\x0F\xA7PFN_vkCreateRenderPass2KHR',b'\x00\x00\x0F\xAAPFN_vkCreateSampler',b'\x00\x00\x0F\xABPFN_vkCreateSamplerYcbcrConversion',b'\x00\x00\x0F\xABPFN_vkCreateSamplerYcbcrConversionKHR',b'\x00\x00\x0F\xACPFN_vkCreateSemaphore',b'\x00\x00\x0F\xB1PFN_vkCreateShaderModule',b'\x00\x00\x0F\xF5PFN_vkCreateShadersEXT',b'\x00\x00\x0F\xF6PFN_vkCreateSharedSwapchainsKHR',b'\x00\x00\x0F\xB2PFN_vkCreateSwapchainKHR',b'\x00\x00\x0F\xB3PFN_vkCreateValidationCacheEXT',b'\x00\x00\x0F\xB5PFN_vkCreateVideoSessionKHR',b'\x00\x00\x0F\xB6PFN_vkCreateVideoSessionParametersKHR',b'\x00\x00\x10\x00PFN_vkCreateWaylandSurfaceKHR',b'\x00\x00\x10\x01PFN_vkCreateWin32SurfaceKHR',b'\x00\x00\x10\x02PFN_vkCreateXcbSurfaceKHR',b'\x00\x00\x10\x03PFN_vkCreateXlibSurfaceKHR',b'\x00\x00\x0F\x73PFN_vkDebugMarkerSetObjectNameEXT',b'\x00\x00\x0F\x74PFN_vkDebugMarkerSetObjectTagEXT',b'\x00\x00\x11\xB9PFN_vkDebugReportCallbackEXT',b'\x00\x00\x12\xDAPFN_vkDebugReportMessageEXT',b'\x00\x00\x11\xB2PFN_vkDebugUtilsMessengerCallbackEXT',b'\x00\x00\x0F\xBCPFN_vkDeferredOperationJoinKHR',b'\x00\x00\x12\x98PFN_vkDestroyAccelerationStructureKHR',b'\x00\x00\x12\x99PFN_vkDestroyAccelerationStructureNV',b'\x00\x00\x12\x9BPFN_vkDestroyBuffer',b'\x00\x00\x12\x9APFN_vkDestroyBufferView',b'\x00\x00\x12\x9DPFN_vkDestroyCommandPool',b'\x00\x00\x12\xA0PFN_vkDestroyCuFunctionNVX',b'\x00\x00\x12\xA1PFN_vkDestroyCuModuleNVX',b'\x00\x00\x12\xA2PFN_vkDestroyCudaFunctionNV',b'\x00\x00\x12\xA3PFN_vkDestroyCudaModuleNV',b'\x00\x00\x12\xD7PFN_vkDestroyDebugReportCallbackEXT',b'\x00\x00\x12\xD8PFN_vkDestroyDebugUtilsMessengerEXT',b'\x00\x00\x12\xA4PFN_vkDestroyDeferredOperationKHR',b'\x00\x00\x12\xA5PFN_vkDestroyDescriptorPool',b'\x00\x00\x12\xA6PFN_vkDestroyDescriptorSetLayout',b'\x00\x00\x12\xABPFN_vkDestroyDescriptorUpdateTemplate',b'\x00\x00\x12\xABPFN_vkDestroyDescriptorUpdateTemplateKHR',b'\x00\x00\x12\x86PFN_vkDestroyDevice',b'\x00\x00\x12\xB0PFN_vkDestroyEvent',b'\x00\x00\x12\xB1PFN_vkDestroyFence',b'\x00\x00\x12\xB2PFN_vkDestroyFramebuffer',b'\x00\x00\x12\xB4PFN_vkDestroyImage',b'\x00\x00\x12\xB3PFN_vkDestroyImageView',b'\x00\x00\x12\xB9PFN_vkDestroyIndirectCommandsLayoutNV',b'\x00\x00\x12\xD5PFN_vkDestroyInstance',b'\x00\x00\x12\xBAPFN_vkDestroyMicromapEXT',b'\x00\x00\x12\xBBPFN_vkDestroyOpticalFlowSessionNV',b'\x00\x00\x12\xBEPFN_vkDestroyPipeline',b'\x00\x00\x12\xBCPFN_vkDestroyPipelineCache',b'\x00\x00\x12\xBDPFN_vkDestroyPipelineLayout',b'\x00\x00\x12\xBFPFN_vkDestroyPrivateDataSlot',b'\x00\x00\x12\xBFPFN_vkDestroyPrivateDataSlotEXT',b'\x00\x00\x12\xC0PFN_vkDestroyQueryPool',b'\x00\x00\x12\xC2PFN_vkDestroyRenderPass',b'\x00\x00\x12\xC5PFN_vkDestroySampler',b'\x00\x00\x12\xC4PFN_vkDestroySamplerYcbcrConversion',b'\x00\x00\x12\xC4PFN_vkDestroySamplerYcbcrConversionKHR',b'\x00\x00\x12\xC6PFN_vkDestroySemaphore',b'\x00\x00\x12\xC7PFN_vkDestroyShaderEXT',b'\x00\x00\x12\xC8PFN_vkDestroyShaderModule',b'\x00\x00\x12\xD9PFN_vkDestroySurfaceKHR',b'\x00\x00\x12\xCAPFN_vkDestroySwapchainKHR',b'\x00\x00\x12\xCEPFN_vkDestroyValidationCacheEXT',b'\x00\x00\x12\xCFPFN_vkDestroyVideoSessionKHR',b'\x00\x00\x12\xD0PFN_vkDestroyVideoSessionParametersKHR',b'\x00\x00\x11\xECPFN_vkDeviceMemoryReportCallbackEXT',b'\x00\x00\x0F\x60PFN_vkDeviceWaitIdle',b'\x00\x00\x0F\xCBPFN_vkDisplayPowerControlEXT',b'\x00\x00\x0F\x5APFN_vkEndCommandBuffer',b'\x00\x00\x10\x12PFN_vkEnumerateDeviceExtensionProperties',b'\x00\x00\x10\x26PFN_vkEnumerateDeviceLayerProperties',b'\x00\x00\x0F\x59PFN_vkEnumerateInstanceExtensionProperties',b'\x00\x00\x10\x35PFN_vkEnumerateInstanceLayerProperties',b'\x00\x00\x10\x34PFN_vkEnumerateInstanceVersion',b'\x00\x00\x10\x04PFN_vkEnumeratePhysicalDeviceGroups',b'\x00\x00\x10\x04PFN_vkEnumeratePhysicalDeviceGroupsKHR',b'\x00\x00\x10\x2CPFN_vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR',b'\x00\x00\x10\x05PFN_vkEnumeratePhysicalDevices',b'\x00\x00\x0F\xF4PFN_vkFlushMappedMemoryRanges',b'\x00\x00\x12\x9FPFN_vkFreeCommandBuffers',b'\x00\x00\x0F\xC7PFN_vkFreeDescriptorSets',b'\x00\x00\x12\xF2PFN_vkFreeFunction',b'\x00\x00\x12\xADPFN_vkFreeMemory',b'\x00\x00\x12\x82PFN_vkGetAccelerationStructureBuildSizesKHR',b'\x00\x00\x11\xC4PFN_vkGetAccelerationStructureDeviceAddressKHR',b'\x00\x00\x0F\xB8PFN_vkGetAccelerationStructureHandleNV',b'\x00\x00\x12\x84PFN_vkGetAccelerationStructureMemoryRequirementsNV',b'\x00\x00\x0F\x61PFN_vkGetAccelerationStructureOpaqueCaptureDescriptorDataEXT',b'\x00\x00\x0F\xB7PFN_vkGetAndroidHardwareBufferPropertiesANDROID',b'\x00\x00\x11\xC5PFN_vkGetBufferDeviceAddress',b'\x00\x00\x11\xC5PFN_vkGetBufferDeviceAddressEXT',b'\x00\x00\x11\xC5PFN_vkGetBufferDeviceAddressKHR',b'\x00\x00\x12\x9CPFN_vkGetBufferMemoryRequirements',b'\x00\x00\x12\x87PFN_vkGetBufferMemoryRequirements2',b'\x00\x00\x12\x87PFN_vkGetBufferMemoryRequirements2KHR',b'\x00\x00\x11\xC5PFN_vkGetBufferOpaqueCaptureAddress',b'\x00\x00\x11\xC5PFN_vkGetBufferOpaqueCaptureAddressKHR',b'\x00\x00\x0F\x67PFN_vkGetBufferOpaqueCaptureDescriptorDataEXT',b'\x00\x00\x0F\xF2PFN_vkGetCalibratedTimestampsEXT',b'\x00\x00\x0F\xF2PFN_vkGetCalibratedTimestampsKHR',b'\x00\x00\x0F\xBBPFN_vkGetCudaModuleCacheNV',b'\x00\x00\x11\xB4PFN_vkGetDeferredOperationMaxConcurrencyKHR',b'\x00\x00\x0F\xBCPFN_vkGetDeferredOperationResultKHR',b'\x00\x00\x12\x89PFN_vkGetDescriptorEXT',b'\x00\x00\x12\xAAPFN_vkGetDescriptorSetHostMappingVALVE',b'\x00\x00\x12\xA7PFN_vkGetDescriptorSetLayoutBindingOffsetEXT',b'\x00\x00\x12\x8APFN_vkGetDescriptorSetLayoutHostMappingInfoVALVE',b'\x00\x00\x12\xA8PFN_vkGetDescriptorSetLayoutSizeEXT',b'\x00\x00\x12\x8BPFN_vkGetDescriptorSetLayoutSupport',b'\x00\x00\x12\x8BPFN_vkGetDescriptorSetLayoutSupportKHR',b'\x00\x00\x12\x85PFN_vkGetDeviceAccelerationStructureCompatibilityKHR',b'\x00\x00\x12\x8CPFN_vkGetDeviceBufferMemoryRequirements',b'\x00\x00\x12\x8CPFN_vkGetDeviceBufferMemoryRequirementsKHR',b'\x00\x00\x0F\x7CPFN_vkGetDeviceFaultInfoEXT',b'\x00\x00\x12\xD4PFN_vkGetDeviceGroupPeerMemoryFeatures',b'\x00\x00\x12\xD4PFN_vkGetDeviceGroupPeerMemoryFeaturesKHR',b'\x00\x00\x0F\x7DPFN_vkGetDeviceGroupPresentCapabilitiesKHR',b'\x00\x00\x0F\x9CPFN_vkGetDeviceGroupSurfacePresentModes2EXT',b'\x00\x00\x0F\xE0PFN_vkGetDeviceGroupSurfacePresentModesKHR',b'\x00\x00\x12\x8DPFN_vkGetDeviceImageMemoryRequirements',b'\x00\x00\x12\x8DPFN_vkGetDeviceImageMemoryRequirementsKHR',b'\x00\x00\x12\x8EPFN_vkGetDeviceImageSparseMemoryRequirements',b'\x00\x00\x12\x8EPFN_vkGetDeviceImageSparseMemoryRequirementsKHR',b'\x00\x00\x12\x8FPFN_vkGetDeviceImageSubresourceLayoutKHR',b'\x00\x00\x12\xAFPFN_vkGetDeviceMemoryCommitment',b'\x00\x00\x11\xC6PFN_vkGetDeviceMemoryOpaqueCaptureAddress',b'\x00\x00\x11\xC6PFN_vkGetDeviceMemoryOpaqueCaptureAddressKHR',b'\x00\x00\x12\x94PFN_vkGetDeviceMicromapCompatibilityEXT',b'\x00\x00\x11\xEAPFN_vkGetDeviceProcAddr',b'\x00\x00\x12\xD3PFN_vkGetDeviceQueue',b'\x00\x00\x12\x90PFN_vkGetDeviceQueue2',b'\x00\x00\x0F\xDDPFN_vkGetDeviceSubpassShadingMaxWorkgroupSizeHUAWEI',b'\x00\x00\x10\x17PFN_vkGetDisplayModeProperties2KHR',b'\x00\x00\x10\x18PFN_vkGetDisplayModePropertiesKHR',b'\x00\x00\x10\x07PFN_vkGetDisplayPlaneCapabilities2KHR',b'\x00\x00\x10\x19PFN_vkGetDisplayPlaneCapabilitiesKHR',b'\x00\x00\x10\x2DPFN_vkGetDisplayPlaneSupportedDisplaysKHR',b'\x00\x00\x10\x14PFN_vkGetDrmDisplayEXT',b'\x00\x00\x0F\xA8PFN_vkGetDynamicRenderingTilePropertiesQCOM',b'\x00\x00\x0F\xB4PFN_vkGetEncodedVideoSessionParametersKHR',b'\x00\x00\x0F\xCCPFN_vkGetEventStatus',b'\x00\x00\x0F\x83PFN_vkGetFenceFdKHR',b'\x00\x00\x0F\xCDPFN_vkGetFenceStatus',b'\x00\x00\x0F\x84PFN_vkGetFenceWin32HandleKHR',b'\x00\x00\x0F\xCEPFN_vkGetFramebufferTilePropertiesQCOM',b'\x00\x00\x12\x91PFN_vkGetGeneratedCommandsMemoryRequirementsNV',b'\x00\x00\x0F\xD0PFN_vkGetImageDrmFormatModifierPropertiesEXT',b'\x00\x00\x12\xB7PFN_vkGetImageMemoryRequirements',b'\x00\x00\x12\x92PFN_vkGetImageMemoryRequirements2',b'\x00\x00\x12\x92PFN_vkGetImageMemoryRequirements2KHR',b'\x00\x00\x0F\x86PFN_vkGetImageOpaqueCaptureDescriptorDataEXT',b'\x00\x00\x12\xB8PFN_vkGetImageSparseMemoryRequirements',b'\x00\x00\x12\x93PFN_vkGetImageSparseMemoryRequirements2',b'\x00\x00\x12\x93PFN_vkGetImageSparseMemoryRequirements2KHR',b'\x00\x00\x12\xB5PFN_vkGetImageSubresourceLayout',b'\x00\x00\x12\xB6PFN_vkGetImageSubresourceLayout2EXT',b'\x00\x00\x12\xB6PFN_vkGetImageSubresourceLayout2KHR',b'\x00\x00\x0F\xCFPFN_vkGetImageViewAddressNVX',b'\x00\x00\x11\xB3PFN_vkGetImageViewHandleNVX',b'\x00\x00\x0F\x88PFN_vkGetImageViewOpaqueCaptureDescriptorDataEXT',b'\x00\x00\x11\xEBPFN_vkGetInstanceProcAddr',b'\x00\x00\x11\xEBPFN_vkGetInstanceProcAddrLUNARG',b'\x00\x00\x12\xCBPFN_vkGetLatencyTimingsNV',b'\x00\x00\x0F\x91PFN_vkGetMemoryAndroidHardwareBufferANDROID',b'\x00\x00\x0F\x92PFN_vkGetMemoryFdKHR',b'\x00\x00\x0F\x7FPFN_vkGetMemoryFdPropertiesKHR',b'\x00\x00\x0F\x81PFN_vkGetMemoryHostPointerPropertiesEXT',b'\x00\x00\x0F\x93PFN_vkGetMemoryRemoteAddressNV',b'\x00\x00\x0F\x94PFN_vkGetMemoryWin32HandleKHR',b'\x00\x00\x0F\xC8PFN_vkGetMemoryWin32HandleNV',b'\x00\x00\x0F\x80PFN_vkGetMemoryWin32HandlePropertiesKHR',b'\x00\x00\x12\x83PFN_vkGetMicromapBuildSizesEXT',b'\x00\x00\x0F\xE6PFN_vkGetPastPresentationTimingGOOGLE',b'\x00\x00\x0F\x9BPFN_vkGetPerformanceParameterINTEL',b'\x00\x00\x10\x29PFN_vkGetPhysicalDeviceCalibrateableTimeDomainsEXT',b'\x00\x00\x10\x29PFN_vkGetPhysicalDeviceCalibrateableTimeDomainsKHR',b'\x00\x00\x10\x1FPFN_vkGetPhysicalDeviceCooperativeMatrixPropertiesKHR',b'\x00\x00\x10\x20PFN_vkGetPhysicalDeviceCooperativeMatrixPropertiesNV',b'\x00\x00\x10\x21PFN_vkGetPhysicalDeviceDisplayPlaneProperties2KHR',b'\x00\x00\x10\x22PFN_vkGetPhysicalDeviceDisplayPlanePropertiesKHR',b'\x00\x00\x10\x23PFN_vkGetPhysicalDeviceDisplayProperties2KHR',b'\x00\x00\x10\x24PFN_vkGetPhysicalDeviceDisplayPropertiesKHR',b'\x00\x00\x12\xDEPFN_vkGetPhysicalDeviceExternalBufferProperties',b'\x00\x00\x12\xDEPFN_vkGetPhysicalDeviceExternalBufferPropertiesKHR',b'\x00\x00\x12\xDFPFN_vkGetPhysicalDeviceExternalFenceProperties',b'\x00\x00\x12\xDFPFN_vkGetPhysicalDeviceExternalFencePropertiesKHR',b'\x00\x00\x10\x09PFN_vkGetPhysicalDeviceExternalImageFormatPropertiesNV',b'\x00\x00\x12\xE0PFN_vkGetPhysicalDeviceExternalSemaphoreProperties',b'\x00\x00\x12\xE0PFN_vkGetPhysicalDeviceExternalSemaphorePropertiesKHR',b'\x00\x00\x12\xE1PFN_vkGetPhysicalDeviceFeatures',b'\x00\x00\x12\xE2PFN_vkGetPhysicalDeviceFeatures2',b'\x00\x00\x12\xE2PFN_vkGetPhysicalDeviceFeatures2KHR',b'\x00\x00\x12\xDBPFN_vkGetPhysicalDeviceFormatProperties',b'\x00\x00\x12\xDCPFN_vkGetPhysicalDeviceFormatProperties2',b'\x00\x00\x12\xDCPFN_vkGetPhysicalDeviceFormatProperties2KHR',b'\x00\x00\x10\x27PFN_vkGetPhysicalDeviceFragmentShadingRatesKHR',b'\x00\x00\x10\x08PFN_vkGetPhysicalDeviceImageFormatProperties',b'\x00\x00\x10\x0BPFN_vkGetPhysicalDeviceImageFormatProperties2',b'\x00\x00\x10\x0BPFN_vkGetPhysicalDeviceImageFormatProperties2KHR',b'\x00\x00\x12\xE3PFN_vkGetPhysicalDeviceMemoryProperties',b'\x00\x00\x12\xE4PFN_vkGetPhysicalDeviceMemoryProperties2',b'\x00\x00\x12\xE4PFN_vkGetPhysicalDeviceMemoryProperties2KHR',b'\x00\x00\x12\xE9PFN_vkGetPhysicalDeviceMultisamplePropertiesEXT',b'\x00\x00\x10\x0APFN_vkGetPhysicalDeviceOpticalFlowImageFormatsNV',b'\x00\x00\x10\x1DPFN_vkGetPhysicalDevicePresentRectanglesKHR',b'\x00\x00\x12\xE5PFN_vkGetPhysicalDeviceProperties',b'\x00\x00\x12\xE6PFN_vkGetPhysicalDeviceProperties2',b'\x00\x00\x12\xE6PFN_vkGetPhysicalDeviceProperties2KHR',b'\x00\x00\x12\xE8PFN_vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR',b'\x00\x00\x12\xEAPFN_vkGetPhysicalDeviceQueueFamilyProperties',b'\x00\x00\x12\xEBPFN_vkGetPhysicalDeviceQueueFamilyProperties2',b'\x00\x00\x12\xEBPFN_vkGetPhysicalDeviceQueueFamilyProperties2KHR',b'\x00\x00\x12\xDDPFN_vkGetPhysicalDeviceSparseImageFormatProperties',b'\x00\x00\x12\xE7PFN_vkGetPhysicalDeviceSparseImageFormatProperties2',b'\x00\x00\x12\xE7PFN_vkGetPhysicalDeviceSparseImageFormatProperties2KHR',b'\x00\x00\x10\x25PFN_vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV',b'\x00\x00\x10\x1APFN_vkGetPhysicalDeviceSurfaceCapabilities2EXT',b'\x00\x00\x10\x0CPFN_vkGetPhysicalDeviceSurfaceCapabilities2KHR',b'\x00\x00\x10\x1BPFN_vkGetPhysicalDeviceSurfaceCapabilitiesKHR',b'\x00\x00\x10\x0EPFN_vkGetPhysicalDeviceSurfaceFormats2KHR',b'\x00\x00\x10\x1EPFN_vkGetPhysicalDeviceSurfaceFormatsKHR',b'\x00\x00\x10\x0DPFN_vkGetPhysicalDeviceSurfacePresentModes2EXT',b'\x00\x00\x10\x1CPFN_vkGetPhysicalDeviceSurfacePresentModesKHR',b'\x00\x00\x10\x2BPFN_vkGetPhysicalDeviceSurfaceSupportKHR',b'\x00\x00\x10\x28PFN_vkGetPhysicalDeviceToolProperties',b'\x00\x00\x10\x28PFN_vkGetPhysicalDeviceToolPropertiesEXT',b'\x00\x00\x10\x11PFN_vkGetPhysicalDeviceVideoCapabilitiesKHR',b'\x00\x00\x10\x0FPFN_vkGetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR',b'\x00\x00\x10\x10PFN_vkGetPhysicalDeviceVideoFormatPropertiesKHR',b'\x00\x00\x11\xB7PFN_vkGetPhysicalDeviceWaylandPresentationSupportKHR',b'\x00\x00\x11\xB5PFN_vkGetPhysicalDeviceWin32PresentationSupportKHR',b'\x00\x00\x11\xB8PFN_vkGetPhysicalDeviceXcbPresentationSupportKHR',b'\x00\x00\x11\xB6PFN_vkGetPhysicalDeviceXlibPresentationSupportKHR',b'\x00\x00\x0F\xD4PFN_vkGetPipelineCacheData',b'\x00\x00\x0F\x9EPFN_vkGetPipelineExecutableInternalRepresentationsKHR',b'\x00\x00\x0F\xA1PFN_vkGetPipelineExecutablePropertiesKHR',b'\x00\x00\x0F\x9FPFN_vkGetPipelineExecutableStatisticsKHR',b'\x00\x00\x11\xC7PFN_vkGetPipelineIndirectDeviceAddressNV',b'\x00\x00\x12\x88PFN_vkGetPipelineIndirectMemoryRequirementsNV',b'\x00\x00\x0F\xA0PFN_vkGetPipelinePropertiesEXT',b'\x00\x00\x12\x95PFN_vkGetPrivateData',b'\x00\x00\x12\x95PFN_vkGetPrivateDataEXT',b'\x00\x00\x0F\xDCPFN_vkGetQueryPoolResults',b'\x00\x00\x12\xEFPFN_vkGetQueueCheckpointData2NV',b'\x00\x00\x12\xF0PFN_vkGetQueueCheckpointDataNV',b'\x00\x00\x0F\xDBPFN_vkGetRayTracingCaptureReplayShaderGroupHandlesKHR',b'\x00\x00\x0F\xDBPFN_vkGetRayTracingShaderGroupHandlesKHR',b'\x00\x00\x0F\xDBPFN_vkGetRayTracingShaderGroupHandlesNV',b'\x00\x00\x11\xC8PFN_vkGetRayTracingShaderGroupStackSizeKHR',b'\x00\x00\x0F\xE4PFN_vkGetRefreshCycleDurationGOOGLE',b'\x00\x00\x12\xC3PFN_vkGetRenderAreaGranularity',b'\x00\x00\x12\x96PFN_vkGetRenderingAreaGranularityKHR',b'\x00\x00\x0F\xA9PFN_vkGetSamplerOpaqueCaptureDescriptorDataEXT',b'\x00\x00\x0F\xDEPFN_vkGetSemaphoreCounterValue',b'\x00\x00\x0F\xDEPFN_vkGetSemaphoreCounterValueKHR',b'\x00\x00\x0F\xADPFN_vkGetSemaphoreFdKHR',b'\x00\x00\x0F\xAEPFN_vkGetSemaphoreWin32HandleKHR',b'\x00\x00\x0F\xDFPFN_vkGetShaderBinaryDataEXT',b'\x00\x00\x0F\xD9PFN_vkGetShaderInfoAMD',b'\x00\x00\x12\x97PFN_vkGetShaderModuleCreateInfoIdentifierEXT',b'\x00\x00\x12\xC9PFN_vkGetShaderModuleIdentifierEXT',b'\x00\x00\x0F\xE5PFN_vkGetSwapchainCounterEXT',b'\x00\x00\x0F\xE7PFN_vkGetSwapchainImagesKHR',b'\x00\x00\x0F\xE1PFN_vkGetSwapchainStatusKHR',b'\x00\x00\x0F\xEAPFN_vkGetValidationCacheDataEXT',b'\x00\x00\x0F\xECPFN_vkGetVideoSessionMemoryRequirementsKHR',b'\x00\x00\x10\x2APFN_vkGetWinrtDisplayNV',b'\x00\x00\x0F\x8APFN_vkImportFenceFdKHR',b'\x00\x00\x0F\x8BPFN_vkImportFenceWin32HandleKHR',b'\x00\x00\x0F\x8CPFN_vkImportSemaphoreFdKHR',b'\x00\x00\x0F\x8DPFN_vkImportSemaphoreWin32HandleKHR',b'\x00\x00\x0F\x8FPFN_vkInitializePerformanceApiINTEL',b'\x00\x00\x12\xF1PFN_vkInternalAllocationNotification',b'\x00\x00\x12\xF1PFN_vkInternalFreeNotification',b'\x00\x00\x0F\xF4PFN_vkInvalidateMappedMemoryRanges',b'\x00\x00\x0F\xE2PFN_vkLatencySleepNV',b'\x00\x00\x0F\xC9PFN_vkMapMemory',b'\x00\x00\x0F\x95PFN_vkMapMemory2KHR',b'\x00\x00\x0F\xD8PFN_vkMergePipelineCaches',b'\x00\x00\x0F\xEBPFN_vkMergeValidationCachesEXT',b'\x00\x00\x12\xEDPFN_vkQueueBeginDebugUtilsLabelEXT',b'\x00\x00\x10\x31PFN_vkQueueBindSparse',b'\x00\x00\x12\xECPFN_vkQueueEndDebugUtilsLabelEXT',b'\x00\x00\x12\xEDPFN_vkQueueInsertDebugUtilsLabelEXT',b'\x00\x00\x12\xEEPFN_vkQueueNotifyOutOfBandNV',b'\x00\x00\x10\x2FPFN_vkQueuePresentKHR',b'\x00\x00\x10\x30PFN_vkQueueSetPerformanceConfigurationINTEL',b'\x00\x00\x10\x32PFN_vkQueueSubmit',b'\x00\x00\x10\x33PFN_vkQueueSubmit2',b'\x00\x00\x10\x33PFN_vkQueueSubmit2KHR',b'\x00\x00\x10\x2EPFN_vkQueueWaitIdle',b'\x00\x00\x11\xE8PFN_vkReallocationFunction',b'\x00\x00\x0F\x7BPFN_vkRegisterDeviceEventEXT',b'\x00\x00\x0F\xCAPFN_vkRegisterDisplayEventEXT',b'\x00\x00\x10\x15PFN_vkReleaseDisplayEXT',b'\x00\x00\x0F\xE1PFN_vkReleaseFullScreenExclusiveModeEXT',b'\x00\x00\x0F\xD3PFN_vkReleasePerformanceConfigurationINTEL',b'\x00\x00\x12\x81PFN_vkReleaseProfilingLockKHR',b'\x00\x00\x0F\xA5PFN_vkReleaseSwapchainImagesEXT',b'\x00\x00\x0F\x5FPFN_vkResetCommandBuffer',b'\x00\x00\x0F\xBAPFN_vkResetCommandPool',b'\x00\x00\x0F\xC6PFN_vkResetDescriptorPool',b'\x00\x00\x0F\xCCPFN_vkResetEvent',b'\x00\x00\x0F\xF8PFN_vkResetFences',b'\x00\x00\x12\xC1PFN_vkResetQueryPool',b'\x00\x00\x12\xC1PFN_vkResetQueryPoolEXT',b'\x00\x00\x0F\x75PFN_vkSetDebugUtilsObjectNameEXT',b'\x00\x00\x0F\x76PFN_vkSetDebugUtilsObjectTagEXT',b'\x00\x00\x12\xAEPFN_vkSetDeviceMemoryPriorityEXT',b'\x00\x00\x0F\xCCPFN_vkSetEvent',b'\x00\x00\x12\xD2PFN_vkSetHdrMetadataEXT',b'\x00\x00\x12\xCCPFN_vkSetLatencyMarkerNV',b'\x00\x00\x0F\xE3PFN_vkSetLatencySleepModeNV',b'\x00\x00\x12\xCDPFN_vkSetLocalDimmingAMD',b'\x00\x00\x0F\x98PFN_vkSetPrivateData',b'\x00\x00\x0F\x98PFN_vkSetPrivateDataEXT',b'\x00\x00\x0F\xAFPFN_vkSignalSemaphore',b'\x00\x00\x0F\xAFPFN_vkSignalSemaphoreKHR',b'\x00\x00\x12\xD6PFN_vkSubmitDebugUtilsMessageEXT',b'\x00\x00\x0F\xF3PFN_vkTransitionImageLayoutEXT',b'\x00\x00\x12\x9EPFN_vkTrimCommandPool',b'\x00\x00\x12\x9EPFN_vkTrimCommandPoolKHR',b'\x00\x00\x12\x81PFN_vkUninitializePerformanceApiINTEL',b'\x00\x00\x12\xACPFN_vkUnmapMemory',b'\x00\x00\x0F\x96PFN_vkUnmapMemory2KHR',b'\x00\x00\x12\xA9PFN_vkUpdateDescriptorSetWithTemplate',b'\x00\x00\x12\xA9PFN_vkUpdateDescriptorSetWithTemplateKHR',b'\x00\x00\x12\xD1PFN_vkUpdateDescriptorSets',b'\x00\x00\x0F\xEEPFN_vkUpdateVideoSessionParametersKHR',b'\x00\x00\x12\xF3PFN_vkVoidFunction',b'\x00\x00\x0F\xF9PFN_vkWaitForFences',b'\x00\x00\x0F\xE9PFN_vkWaitForPresentKHR',b'\x00\x00\x0F\xB0PFN_vkWaitSemaphores',b'\x00\x00\x0F\xB0PFN_vkWaitSemaphoresKHR',b'\x00\x00\x0F\xF7PFN_vkWriteAccelerationStructuresPropertiesKHR',b'\x00\x00\x0F\xFAPFN_vkWriteMicromapsPropertiesEXT',b'\x00\x00\x0A\xE6PSECURITY_ATTRIBUTES',b'\x00\x00\x00\x27PVOID',b'\x00\x00\x0A\xE8SECURITY_ATTRIBUTES',b'\x00\x00\x0A\xE9StdVideoDecodeH264FieldOrderCount',b'\x00\x00\x0A\xEBStdVideoDecodeH264PictureInfo',b'\x00\x00\x0A\xECStdVideoDecodeH264PictureInfoFlags',b'\x00\x00\x0A\xEEStdVideoDecodeH264ReferenceInfo',b'\x00\x00\x0A\xEFStdVideoDecodeH264ReferenceInfoFlags',b'\x00\x00\x0A\xF1StdVideoDecodeH265PictureInfo',b'\x00\x00\x0A\xF2StdVideoDecodeH265PictureInfoFlags',b'\x00\x00\x0A\xF4StdVideoDecodeH265ReferenceInfo',b'\x00\x00\x0A\xF5StdVideoDecodeH265ReferenceInfoFlags',b'\x00\x00\x0A\xF7StdVideoEncodeH264PictureInfo',b'\x00\x00\x0A\xF8StdVideoEncodeH264PictureInfoFlags',b'\x00\x00\x0A\xFAStdVideoEncodeH264RefListModEntry',b'\x00\x00\x0A\xFCStdVideoEncodeH264RefPicMarkingEntry',b'\x00\x00\x0A\xFEStdVideoEncodeH264ReferenceInfo',b'\x00\x00\x0A\xFFStdVideoEncodeH264ReferenceInfoFlags',b'\x00\x00\x0B\x01StdVideoEncodeH264ReferenceListsInfo',b'\x00\x00\x0B\x02StdVideoEncodeH264ReferenceListsInfoFlags',b'\x00\x00\x0B\x04StdVideoEncodeH264SliceHeader',b'\x00\x00\x0B\x05StdVideoEncodeH264SliceHeaderFlags',b'\x00\x00\x0B\x07StdVideoEncodeH264WeightTable',b'\x00\x00\x0B\x08StdVideoEncodeH264WeightTableFlags',b'\x00\x00\x0B\x0AStdVideoEncodeH265LongTermRefPics',b'\x00\x00\x0B\x0CStdVideoEncodeH265PictureInfo',b'\x00\x00\x0B\x0DStdVideoEncodeH265PictureInfoFlags',b'\x00\x00\x0B\x0FStdVideoEncodeH265ReferenceInfo',b'\x00\x00\x0B\x10StdVideoEncodeH265ReferenceInfoFlags',b'\x00\x00\x0B\x12StdVideoEncodeH265ReferenceListsInfo',b'\x00\x00\x0B\x13StdVideoEncodeH265ReferenceListsInfoFlags',b'\x00\x00\x0B\x15StdVideoEncodeH265SliceSegmentHeader',b'\x00\x00\x0B\x16StdVideoEncodeH265SliceSegmentHeaderFlags',b'\x00\x00\x0B\x18StdVideoEncodeH265WeightTable',b'\x00\x00\x0B\x19StdVideoEncodeH265WeightTableFlags',b'\x00\x00\x0B\x1AStdVideoH264AspectRatioIdc',b'\x00\x00\x0B\x1BStdVideoH264CabacInitIdc',b'\x00\x00\x0B\x1CStdVideoH264ChromaFormatIdc',b'\x00\x00\x0B\x1DStdVideoH264DisableDeblockingFilterIdc',b'\x00\x00\x0B\x1FStdVideoH264HrdParameters',b'\x00\x00\x0B\x20StdVideoH264LevelIdc',b'\x00\x00\x0B\x21StdVideoH264MemMgmtControlOp',b'\x00\x00\x0B\x22StdVideoH264ModificationOfPicNumsIdc',b'\x00\x00\x0B\x23StdVideoH264NonVclNaluType',b'\x00\x00\x0B\x25StdVideoH264PictureParameterSet',b'\x00\x00\x0B\x26StdVideoH264PictureType',b'\x00\x00\x0B\x27StdVideoH264PocType',b'\x00\x00\x0B\x28StdVideoH264PpsFlags',b'\x00\x00\x0B\x29StdVideoH264ProfileIdc',b'\x00\x00\x0B\x2BStdVideoH264ScalingLists',b'\x00\x00\x0B\x2DStdVideoH264SequenceParameterSet',b'\x00\x00\x0B\x2FStdVideoH264SequenceParameterSetVui',b'\x00\x00\x0B\x30StdVideoH264SliceType',b'\x00\x00\x0B\x31StdVideoH264SpsFlags',b'\x00\x00\x0B\x32StdVideoH264SpsVuiFlags',b'\x00\x00\x0B\x33StdVideoH264WeightedBipredIdc',b'\x00\x00\x0B\x34StdVideoH265AspectRatioIdc',b'\x00\x00\x0B\x35StdVideoH265ChromaFormatIdc',b'\x00\x00\x0B\x37StdVideoH265DecPicBufMgr',b'\x00\x00\x0B\x38StdVideoH265HrdFlags',b'\x00\x00\x0B\x3AStdVideoH265HrdParameters',b'\x00\x00\x0B\x3BStdVideoH265LevelIdc',b'\x00\x00\x0B\x3DStdVideoH265LongTermRefPicsSps',b'\x00\x00\x0B\x3FStdVideoH265PictureParameterSet',b'\x00\x00\x0B\x40StdVideoH265PictureType',b'\x00\x00\x0B\x41StdVideoH265PpsFlags',b'\x00\x00\x0B\x43StdVideoH265PredictorPaletteEntries',b'\x00\x00\x0B\x44StdVideoH265ProfileIdc',b'\x00\x00\x0B\x46StdVideoH265ProfileTierLevel',b'\x00\x00\x0B\x47StdVideoH265ProfileTierLevelFlags',b'\x00\x00\x0B\x49StdVideoH265ScalingLists',b'\x00\x00\x0B\x4BStdVideoH265SequenceParameterSet',b'\x00\x00\x0B\x4DStdVideoH265SequenceParameterSetVui',b'\x00\x00\x0B\x4FStdVideoH265ShortTermRefPicSet',b'\x00\x00\x0B\x50StdVideoH265ShortTermRefPicSetFlags',b'\x00\x00\x0B\x51StdVideoH265SliceType',b'\x00\x00\x0B\x52StdVideoH265SpsFlags',b'\x00\x00\x0B\x53StdVideoH265SpsVuiFlags',b'\x00\x00\x0B\x55StdVideoH265SubLayerHrdParameters',b'\x00\x00\x0B\x57StdVideoH265VideoParameterSet',b'\x00\x00\x0B\x58StdVideoH265VpsFlags',b'\x00\x00\x04\xE2VisualID',b'\x00\x00\x0B\x59VkAabbPositionsKHR',b'\x00\x00\x0B\x59VkAabbPositionsNV',b'\x00\x00\x0B\x5AVkAccelerationStructureBuildGeometryInfoKHR',b'\x00\x00\x0B\x5CVkAccelerationStructureBuildRangeInfoKHR',b'\x00\x00\x0B\x5DVkAccelerationStructureBuildSizesInfoKHR',b'\x00\x00\x08\x89VkAccelerationStructureBuildTypeKHR',b'\x00\x00\x0B\x5EVkAccelerationStructureCaptureDescriptorDataInfoEXT',b'\x00\x00\x0B\x5FVkAccelerationStructureCompatibilityKHR',b'\x00\x00\x0B\x60VkAccelerationStructureCreateFlagBitsKHR',b'\x00\x00\x00\x1FVkAccelerationStructureCreateFlagsKHR',b'\x00\x00\x0B\x61VkAccelerationStructureCreateInfoKHR',b'\x00\x00\x0B\x62VkAccelerationStructureCreateInfoNV',b'\x00\x00\x0B\x63VkAccelerationStructureDeviceAddressInfoKHR',b'\x00\x00\x0B\x64VkAccelerationStructureGeometryAabbsDataKHR',b'\x00\x00\x0B\x65VkAccelerationStructureGeometryDataKHR',b'\x00\x00\x0B\x66VkAccelerationStructureGeometryInstancesDataKHR',b'\x00\x00\x0B\x69VkAccelerationStructureGeometryKHR',b'\x00\x00\x0B\x6AVkAccelerationStructureGeometryMotionTrianglesDataNV',b'\x00\x00\x0B\x6BVkAccelerationStructureGeometryTrianglesDataKHR',b'\x00\x00\x0B\x6CVkAccelerationStructureInfoNV',b'\x00\x00\x0B\x6DVkAccelerationStructureInstanceKHR',b'\x00\x00\x0B\x6DVkAccelerationStructureInstanceNV',b'\x00\x00\x08\xFEVkAccelerationStructureKHR',b'\x00\x00\x0B\x6EVkAccelerationStructureMatrixMotionInstanceNV',b'\x00\x00\x0B\x6FVkAccelerationStructureMemoryRequirementsInfoNV',b'\x00\x00\x0B\x70VkAccelerationStructureMemoryRequirementsTypeNV',b'\x00\x00\x00\x1FVkAccelerationStructureMotionInfoFlagsNV',b'\x00\x00\x0B\x71VkAccelerationStructureMotionInfoNV',b'\x00\x00\x0B\x72VkAccelerationStructureMotionInstanceDataNV',b'\x00\x00\x00\x1FVkAccelerationStructureMotionInstanceFlagsNV',b'\x00\x00\x0B\x73VkAccelerationStructureMotionInstanceNV',b'\x00\x00\x0B\x74VkAccelerationStructureMotionInstanceTypeNV',b'\x00\x00\x01\xF6VkAccelerationStructureNV',b'\x00\x00\x0B\x75VkAccelerationStructureSRTMotionInstanceNV',b'\x00\x00\x0B\x76VkAccelerationStructureTrianglesOpacityMicromapEXT',b'\x00\x00\x0B\x77VkAccelerationStructureTypeKHR',b'\x00\x00\x0B\x77VkAccelerationStructureTypeNV',b'\x00\x00\x0B\x78VkAccelerationStructureVersionInfoKHR',b'\x00\x00\x0B\x79VkAccessFlagBits',b'\x00\x00\x01\x43VkAccessFlagBits2',b'\x00\x00\x01\x43VkAccessFlagBits2KHR',b'\x00\x00\x00\x1FVkAccessFlags',b'\x00\x00\x01\x43VkAccessFlags2',b'\x00\x00\x01\x43VkAccessFlags2KHR',b'\x00\x00\x0B\x7AVkAcquireNextImageInfoKHR',b'\x00\x00\x0B\x7BVkAcquireProfilingLockFlagBitsKHR',b'\x00\x00\x00\x1FVkAcquireProfilingLockFlagsKHR',b'\x00\x00\x0B\x7CVkAcquireProfilingLockInfoKHR',b'\x00\x00\x0B\x7DVkAllocationCallbacks',b'\x00\x00\x0B\x7EVkAmigoProfilingSubmitInfoSEC',b'\x00\x00\x0B\x7FVkAndroidHardwareBufferFormatProperties2ANDROID',b'\x00\x00\x0B\x80VkAndroidHardwareBufferFormatPropertiesANDROID',b'\x00\x00\x0B\x81VkAndroidHardwareBufferFormatResolvePropertiesANDROID',b'\x00\x00\x0B\x82VkAndroidHardwareBufferPropertiesANDROID',b'\x00\x00\x0B\x83VkAndroidHardwareBufferUsageANDROID',b'\x00\x00\x00\x1FVkAndroidSurfaceCreateFlagsKHR',b'\x00\x00\x0B\x84VkAndroidSurfaceCreateInfoKHR',b'\x00\x00\x0B\x86VkApplicationInfo',b'\x00\x00\x0B\x8AVkAttachmentDescription',b'\x00\x00\x0B\x89VkAttachmentDescription2',b'\x00\x00\x0B\x89VkAttachmentDescription2KHR',b'\x00\x00\x0B\x8BVkAttachmentDescriptionFlagBits',b'\x00\x00\x00\x1FVkAttachmentDescriptionFlags',b'\x00\x00\x0B\x8CVkAttachmentDescriptionStencilLayout',b'\x00\x00\x0B\x8CVkAttachmentDescriptionStencilLayoutKHR',b'\x00\x00\x0B\x8DVkAttachmentLoadOp',b'\x00\x00\x0B\x91VkAttachmentReference',b'\x00\x00\x0B\x90VkAttachmentReference2',b'\x00\x00\x0B\x90VkAttachmentReference2KHR',b'\x00\x00\x0B\x92VkAttachmentReferenceStencilLayout',b'\x00\x00\x0B\x92VkAttachmentReferenceStencilLayoutKHR',b'\x00\x00\x0B\x93VkAttachmentSampleCountInfoAMD',b'\x00\x00\x0B\x93VkAttachmentSampleCountInfoNV',b'\x00\x00\x0B\x95VkAttachmentSampleLocationsEXT',b'\x00\x00\x0B\x96VkAttachmentStoreOp',b'\x00\x00\x0B\x98VkBaseInStructure',b'\x00\x00\x0B\x99VkBaseOutStructure',b'\x00\x00\x0B\x9AVkBindAccelerationStructureMemoryInfoNV',b'\x00\x00\x0B\x9BVkBindBufferMemoryDeviceGroupInfo',b'\x00\x00\x0B\x9BVkBindBufferMemoryDeviceGroupInfoKHR',b'\x00\x00\x0B\x9CVkBindBufferMemoryInfo',b'\x00\x00\x0B\x9CVkBindBufferMemoryInfoKHR',b'\x00\x00\x0B\x9DVkBindDescriptorBufferEmbeddedSamplersInfoEXT',b'\x00\x00\x0B\x9EVkBindDescriptorSetsInfoKHR',b'\x00\x00\x0B\x9FVkBindImageMemoryDeviceGroupInfo',b'\x00\x00\x0B\x9FVkBindImageMemoryDeviceGroupInfoKHR',b'\x00\x00\x0B\xA0VkBindImageMemoryInfo',b'\x00\x00\x0B\xA0VkBindImageMemoryInfoKHR',b'\x00\x00\x0B\xA1VkBindImageMemorySwapchainInfoKHR',b'\x00\x00\x0B\xA2VkBindImagePlaneMemoryInfo',b'\x00\x00\x0B\xA2VkBindImagePlaneMemoryInfoKHR',b'\x00\x00\x0B\xA3VkBindIndexBufferIndirectCommandNV',b'\x00\x00\x0B\xA4VkBindMemoryStatusKHR',b'\x00\x00\x0B\xA5VkBindPipelineIndirectCommandNV',b'\x00\x00\x0B\xA6VkBindShaderGroupIndirectCommandNV',b'\x00\x00\x0B\xA7VkBindSparseInfo',b'\x00\x00\x0B\xA8VkBindVertexBufferIndirectCommandNV',b'\x00\x00\x0B\xA9VkBindVideoSessionMemoryInfoKHR',b'\x00\x00\x0B\xAAVkBlendFactor',b'\x00\x00\x0B\xABVkBlendOp',b'\x00\x00\x0B\xACVkBlendOverlapEXT',b'\x00\x00\x0B\xADVkBlitImageCubicWeightsInfoQCOM',b'\x00\x00\x0B\xAEVkBlitImageInfo2',b'\x00\x00\x0B\xAEVkBlitImageInfo2KHR',b'\x00\x00\x0B\xAFVkBlockMatchWindowCompareModeQCOM',b'\x00\x00\x00\x1FVkBool32',b'\x00\x00\x0B\xB0VkBorderColor',b'\x00\x00\x01\xFCVkBuffer',b'\x00\x00\x0B\xB1VkBufferCaptureDescriptorDataInfoEXT',b'\x00\x00\x0B\xB4VkBufferCopy',b'\x00\x00\x0B\xB3VkBufferCopy2',b'\x00\x00\x0B\xB3VkBufferCopy2KHR',b'\x00\x00\x0B\xB5VkBufferCreateFlagBits',b'\x00\x00\x00\x1FVkBufferCreateFlags',b'\x00\x00\x0B\xB6VkBufferCreateInfo',b'\x00\x00\x0B\xB7VkBufferDeviceAddressCreateInfoEXT',b'\x00\x00\x0B\xB8VkBufferDeviceAddressInfo',b'\x00\x00\x0B\xB8VkBufferDeviceAddressInfoEXT',b'\x00\x00\x0B\xB8VkBufferDeviceAddressInfoKHR',b'\x00\x00\x0B\xBBVkBufferImageCopy',b'\x00\x00\x0B\xBAVkBufferImageCopy2',b'\x00\x00\x0B\xBAVkBufferImageCopy2KHR',b'\x00\x00\x0B\xBEVkBufferMemoryBarrier',b'\x00\x00\x0B\xBDVkBufferMemoryBarrier2',b'\x00\x00\x0B\xBDVkBufferMemoryBarrier2KHR',b'\x00\x00\x0B\xBFVkBufferMemoryRequirementsInfo2',b'\x00\x00\x0B\xBFVkBufferMemoryRequirementsInfo2KHR',b'\x00\x00\x0B\xC0VkBufferOpaqueCaptureAddressCreateInfo',b'\x00\x00\x0B\xC0VkBufferOpaqueCaptureAddressCreateInfoKHR',b'\x00\x00\x0B\xC1VkBufferUsageFlagBits',b'\x00\x00\x01\x43VkBufferUsageFlagBits2KHR',b'\x00\x00\x00\x1FVkBufferUsageFlags',b'\x00\x00\x0B\xC2VkBufferUsageFlags2CreateInfoKHR',b'\x00\x00\x01\x43VkBufferUsageFlags2KHR',b'\x00\x00\x09\x08VkBufferView',b'\x00\x00\x00\x1FVkBufferViewCreateFlags',b'\x00\x00\x0B\xC3VkBufferViewCreateInfo',b'\x00\x00\x0B\xC4VkBuildAccelerationStructureFlagBitsKHR',b'\x00\x00\x0B\xC4VkBuildAccelerationStructureFlagBitsNV',b'\x00\x00\x00\x1FVkBuildAccelerationStructureFlagsKHR',b'\x00\x00\x00\x1FVkBuildAccelerationStructureFlagsNV',b'\x00\x00\x0B\xC5VkBuildAccelerationStructureModeKHR',b'\x00\x00\x0B\xC6VkBuildMicromapFlagBitsEXT',b'\x00\x00\x00\x1FVkBuildMicromapFlagsEXT',b'\x00\x00\x0B\xC7VkBuildMicromapModeEXT',b'\x00\x00\x0B\xC8VkCalibratedTimestampInfoEXT',b'\x00\x00\x0B\xC8VkCalibratedTimestampInfoKHR',b'\x00\x00\x0B\xC9VkCheckpointData2NV',b'\x00\x00\x0B\xCAVkCheckpointDataNV',b'\x00\x00\x0B\xCBVkChromaLocation',b'\x00\x00\x0B\xCBVkChromaLocationKHR',b'\x00\x00\x0B\xCCVkClearAttachment',b'\x00\x00\x0B\xCDVkClearColorValue',b'\x00\x00\x0B\xCEVkClearDepthStencilValue',b'\x00\x00\x0B\xCFVkClearRect',b'\x00\x00\x0B\xD1VkClearValue',b'\x00\x00\x0B\xD3VkCoarseSampleLocationNV',b'\x00\x00\x0B\xD4VkCoarseSampleOrderCustomNV',b'\x00\x00\x05\x3CVkCoarseSampleOrderTypeNV',b'\x00\x00\x0B\xD5VkColorBlendAdvancedEXT',b'\x00\x00\x0B\xD6VkColorBlendEquationEXT',b'\x00\x00\x0B\xD7VkColorComponentFlagBits',b'\x00\x00\x00\x1FVkColorComponentFlags',b'\x00\x00\x0B\xD8VkColorSpaceKHR',b'\x00\x00\x00\x0BVkCommandBuffer',b'\x00\x00\x0B\xD9VkCommandBufferAllocateInfo',b'\x00\x00\x0B\xDAVkCommandBufferBeginInfo',b'\x00\x00\x0B\xDBVkCommandBufferInheritanceConditionalRenderingInfoEXT',b'\x00\x00\x0B\xDDVkCommandBufferInheritanceInfo',b'\x00\x00\x0B\xDEVkCommandBufferInheritanceRenderPassTransformInfoQCOM',b'\x00\x00\x0B\xDFVkCommandBufferInheritanceRenderingInfo',b'\x00\x00\x0B\xDFVkCommandBufferInheritanceRenderingInfoKHR',b'\x00\x00\x0B\xE0VkCommandBufferInheritanceViewportScissorInfoNV',b'\x00\x00\x0B\xE1VkCommandBufferLevel',b'\x00\x00\x0B\xE2VkCommandBufferResetFlagBits',b'\x00\x00\x00\x1FVkCommandBufferResetFlags',b'\x00\x00\x0B\xE4VkCommandBufferSubmitInfo',b'\x00\x00\x0B\xE4VkCommandBufferSubmitInfoKHR',b'\x00\x00\x0B\xE5VkCommandBufferUsageFlagBits',b'\x00\x00\x00\x1FVkCommandBufferUsageFlags',b'\x00\x00\x02\x02VkCommandPool',b'\x00\x00\x0B\xE6VkCommandPoolCreateFlagBits',b'\x00\x00\x00\x1FVkCommandPoolCreateFlags',b'\x00\x00\x0B\xE7VkCommandPoolCreateInfo',b'\x00\x00\x0B\xE8VkCommandPoolResetFlagBits',b'\x00\x00\x00\x1FVkCommandPoolResetFlags',b'\x00\x00\x00\x1FVkCommandPoolTrimFlags',b'\x00\x00\x00\x1FVkCommandPoolTrimFlagsKHR',b'\x00\x00\x05\x42VkCompareOp',b'\x00\x00\x0B\xE9VkComponentMapping',b'\x00\x00\x0B\xEAVkComponentSwizzle',b'\x00\x00\x0B\xEBVkComponentTypeKHR',b'\x00\x00\x0B\xEBVkComponentTypeNV',b'\x00\x00\x0B\xECVkCompositeAlphaFlagBitsKHR',b'\x00\x00\x00\x1FVkCompositeAlphaFlagsKHR',b'\x00\x00\x0B\xEDVkComputePipelineCreateInfo',b'\x00\x00\x0B\xEEVkComputePipelineIndirectBufferInfoNV',b'\x00\x00\x0B\xEFVkConditionalRenderingBeginInfoEXT',b'\x00\x00\x0B\xF0VkConditionalRenderingFlagBitsEXT',b'\x00\x00\x00\x1FVkConditionalRenderingFlagsEXT',b'\x00\x00\x0B\xF1VkConformanceVersion',b'\x00\x00\x0B\xF1VkConformanceVersionKHR',b'\x00\x00\x05\x4AVkConservativeRasterizationModeEXT',b'\x00\x00\x0B\xF2VkCooperativeMatrixPropertiesKHR',b'\x00\x00\x0B\xF3VkCooperativeMatrixPropertiesNV',b'\x00\x00\x0B\xF4VkCopyAccelerationStructureInfoKHR',b'\x00\x00\x06\x74VkCopyAccelerationStructureModeKHR',b'\x00\x00\x06\x74VkCopyAccelerationStructureModeNV',b'\x00\x00\x0B\xF5VkCopyAccelerationStructureToMemoryInfoKHR',b'\x00\x00\x0B\xF6VkCopyBufferInfo2',b'\x00\x00\x0B\xF6VkCopyBufferInfo2KHR',b'\x00\x00\x0B\xF7VkCopyBufferToImageInfo2',b'\x00\x00\x0B\xF7VkCopyBufferToImageInfo2KHR',b'\x00\x00\x0B\xF8VkCopyCommandTransformInfoQCOM',b'\x00\x00\x0B\xF9VkCopyDescriptorSet',b'\x00\x00\x0B\xFAVkCopyImageInfo2',b'\x00\x00\x0B\xFAVkCopyImageInfo2KHR',b'\x00\x00\x0B\xFBVkCopyImageToBufferInfo2',b'\x00\x00\x0B\xFBVkCopyImageToBufferInfo2KHR',b'\x00\x00\x0B\xFCVkCopyImageToImageInfoEXT',b'\x00\x00\x0B\xFDVkCopyImageToMemoryInfoEXT',b'\x00\x00\x0B\xFEVkCopyMemoryIndirectCommandNV',b'\x00\x00\x0B\xFFVkCopyMemoryToAccelerationStructureInfoKHR',b'\x00\x00\x0C\x00VkCopyMemoryToImageIndirectCommandNV',b'\x00\x00\x0C\x01VkCopyMemoryToImageInfoEXT',b'\x00\x00\x0C\x02VkCopyMemoryToMicromapInfoEXT',b'\x00\x00\x0C\x03VkCopyMicromapInfoEXT',b'\x00\x00\x0C\x04VkCopyMicromapModeEXT',b'\x00\x00\x0C\x05VkCopyMicromapToMemoryInfoEXT',b'\x00\x00\x05\x76VkCoverageModulationModeNV',b'\x00\x00\x05\x7AVkCoverageReductionModeNV',b'\x00\x00\x0C\x06VkCuFunctionCreateInfoNVX',b'\x00\x00\x09\x27VkCuFunctionNVX',b'\x00\x00\x0C\x07VkCuLaunchInfoNVX',b'\x00\x00\x0C\x08VkCuModuleCreateInfoNVX',b'\x00\x00\x09\x2CVkCuModuleNVX',b'\x00\x00\x0C\x09VkCubicFilterWeightsQCOM',b'\x00\x00\x0C\x0AVkCudaFunctionCreateInfoNV',b'\x00\x00\x09\x31VkCudaFunctionNV',b'\x00\x00\x0C\x0BVkCudaLaunchInfoNV',b'\x00\x00\x0C\x0CVkCudaModuleCreateInfoNV',b'\x00\x00\x02\x07VkCudaModuleNV',b'\x00\x00\x0C\x0DVkCullModeFlagBits',b'\x00\x00\x00\x1FVkCullModeFlags',b'\x00\x00\x0C\x0EVkD3D12FenceSubmitInfoKHR',b'\x00\x00\x0C\x0FVkDebugMarkerMarkerInfoEXT',b'\x00\x00\x0C\x10VkDebugMarkerObjectNameInfoEXT',b'\x00\x00\x0C\x11VkDebugMarkerObjectTagInfoEXT',b'\x00\x00\x0C\x12VkDebugReportCallbackCreateInfoEXT',b'\x00\x00\x0A\x45VkDebugReportCallbackEXT',b'\x00\x00\x0C\x13VkDebugReportFlagBitsEXT',b'\x00\x00\x00\x1FVkDebugReportFlagsEXT',b'\x00\x00\x04\xF1VkDebugReportObjectTypeEXT',b'\x00\x00\x0C\x14VkDebugUtilsLabelEXT',b'\x00\x00\x04\xCDVkDebugUtilsMessageSeverityFlagBitsEXT',b'\x00\x00\x00\x1FVkDebugUtilsMessageSeverityFlagsEXT',b'\x00\x00\x0C\x15VkDebugUtilsMessageTypeFlagBitsEXT',b'\x00\x00\x00\x1FVkDebugUtilsMessageTypeFlagsEXT',b'\x00\x00\x0C\x16VkDebugUtilsMessengerCallbackDataEXT',b'\x00\x00\x00\x1FVkDebugUtilsMessengerCallbackDataFlagsEXT',b'\x00\x00\x00\x1FVkDebugUtilsMessengerCreateFlagsEXT',b'\x00\x00\x0C\x17VkDebugUtilsMessengerCreateInfoEXT',b'\x00\x00\x0A\x4AVkDebugUtilsMessengerEXT',b'\x00\x00\x0C\x18VkDebugUtilsObjectNameInfoEXT',b'\x00\x00\x0C\x19VkDebugUtilsObjectTagInfoEXT',b'\x00\x00\x0C\x1AVkDecompressMemoryRegionNV',b'\x00\x00\x0C\x1BVkDedicatedAllocationBufferCreateInfoNV',b'\x00\x00\x0C\x1CVkDedicatedAllocationImageCreateInfoNV',b'\x00\x00\x0C\x1DVkDedicatedAllocationMemoryAllocateInfoNV',b'\x00\x00\x02\x0DVkDeferredOperationKHR',b'\x00\x00\x0C\x1EVkDependencyFlagBits',b'\x00\x00\x00\x1FVkDependencyFlags',b'\x00\x00\x0C\x1FVkDependencyInfo',b'\x00\x00\x0C\x1FVkDependencyInfoKHR',b'\x00\x00\x0C\x20VkDepthBiasInfoEXT',b'\x00\x00\x0C\x21VkDepthBiasRepresentationEXT',b'\x00\x00\x0C\x22VkDepthBiasRepresentationInfoEXT',b'\x00\x00\x0C\x24VkDescriptorAddressInfoEXT',b'\x00\x00\x0C\x25VkDescriptorBindingFlagBits',b'\x00\x00\x0C\x25VkDescriptorBindingFlagBitsEXT',b'\x00\x00\x00\x1FVkDescriptorBindingFlags',b'\x00\x00\x00\x1FVkDescriptorBindingFlagsEXT',b'\x00\x00\x0C\x26VkDescriptorBufferBindingInfoEXT',b'\x00\x00\x0C\x27VkDescriptorBufferBindingPushDescriptorBufferHandleEXT',b'\x00\x00\x0C\x29VkDescriptorBufferInfo',b'\x00\x00\x0C\x2AVkDescriptorDataEXT',b'\x00\x00\x0C\x2BVkDescriptorGetInfoEXT',b'\x00\x00\x0C\x2DVkDescriptorImageInfo',b'\x00\x00\x02\x45VkDescriptorPool',b'\x00\x00\x0C\x2EVkDescriptorPoolCreateFlagBits',b'\x00\x00\x00\x1FVkDescriptorPoolCreateFlags',b'\x00\x00\x0C\x2FVkDescriptorPoolCreateInfo',b'\x00\x00\x0C\x30VkDescriptorPoolInlineUniformBlockCreateInfo',b'\x00\x00\x0C\x30VkDescriptorPoolInlineUniformBlockCreateInfoEXT',b'\x00\x00\x00\x1FVkDescriptorPoolResetFlags',b'\x00\x00\x0C\x32VkDescriptorPoolSize',b'\x00\x00\x09\x55VkDescriptorSet',b'\x00\x00\x0C\x33VkDescriptorSetAllocateInfo',b'\x00\x00\x0C\x34VkDescriptorSetBindingReferenceVALVE',b'\x00\x00\x09\x45VkDescriptorSetLayout',b'\x00\x00\x0C\x36VkDescriptorSetLayoutBinding',b'\x00\x00\x0C\x37VkDescriptorSetLayoutBindingFlagsCreateInfo',b'\x00\x00\x0C\x37VkDescriptorSetLayoutBindingFlagsCreateInfoEXT',b'\x00\x00\x0C\x38VkDescriptorSetLayoutCreateFlagBits',b'\x00\x00\x00\x1FVkDescriptorSetLayoutCreateFlags',b'\x00\x00\x0C\x39VkDescriptorSetLayoutCreateInfo',b'\x00\x00\x0C\x3AVkDescriptorSetLayoutHostMappingInfoVALVE',b'\x00\x00\x0C\x3BVkDescriptorSetLayoutSupport',b'\x00\x00\x0C\x3BVkDescriptorSetLayoutSupportKHR',b'\x00\x00\x0C\x3CVkDescriptorSetVariableDescriptorCountAllocateInfo',b'\x00\x00\x0C\x3CVkDescriptorSetVariableDescriptorCountAllocateInfoEXT',b'\x00\x00\x0C\x3DVkDescriptorSetVariableDescriptorCountLayoutSupport',b'\x00\x00\x0C\x3DVkDescriptorSetVariableDescriptorCountLayoutSupportEXT',b'\x00\x00\x0C\x3FVkDescriptorType',b'\x00\x00\x06\xC8VkDescriptorUpdateTemplate',b'\x00\x00\x00\x1FVkDescriptorUpdateTemplateCreateFlags',b'\x00\x00\x00\x1FVkDescriptorUpdateTemplateCreateFlagsKHR',b'\x00\x00\x0C\x40VkDescriptorUpdateTemplateCreateInfo',b'\x00\x00\x0C\x40VkDescriptorUpdateTemplateCreateInfoKHR',b'\x00\x00\x0C\x42VkDescriptorUpdateTemplateEntry',b'\x00\x00\x0C\x42VkDescriptorUpdateTemplateEntryKHR',b'\x00\x00\x06\xC8VkDescriptorUpdateTemplateKHR',b'\x00\x00\x0C\x43VkDescriptorUpdateTemplateType',b'\x00\x00\x0C\x43VkDescriptorUpdateTemplateTypeKHR',b'\x00\x00\x00\x22VkDevice',b'\x00\x00\x01\x43VkDeviceAddress',b'\x00\x00\x0C\x44VkDeviceAddressBindingCallbackDataEXT',b'\x00\x00\x0C\x45VkDeviceAddressBindingFlagBitsEXT',b'\x00\x00\x00\x1FVkDeviceAddressBindingFlagsEXT',b'\x00\x00\x0C\x46VkDeviceAddressBindingTypeEXT',b'\x00\x00\x0C\x47VkDeviceBufferMemoryRequirements',b'\x00\x00\x0C\x47VkDeviceBufferMemoryRequirementsKHR',b'\x00\x00\x00\x1FVkDeviceCreateFlags',b'\x00\x00\x0C\x48VkDeviceCreateInfo',b'\x00\x00\x0C\x49VkDeviceDeviceMemoryReportCreateInfoEXT',b'\x00\x00\x0C\x4AVkDeviceDiagnosticsConfigCreateInfoNV',b'\x00\x00\x0C\x4BVkDeviceDiagnosticsConfigFlagBitsNV',b'\x00\x00\x00\x1FVkDeviceDiagnosticsConfigFlagsNV',b'\x00\x00\x0C\x4CVkDeviceEventInfoEXT',b'\x00\x00\x0C\x4DVkDeviceEventTypeEXT',b'\x00\x00\x0C\x4FVkDeviceFaultAddressInfoEXT',b'\x00\x00\x0C\x50VkDeviceFaultAddressTypeEXT',b'\x00\x00\x0C\x51VkDeviceFaultCountsEXT',b'\x00\x00\x0C\x52VkDeviceFaultInfoEXT',b'\x00\x00\x0C\x53VkDeviceFaultVendorBinaryHeaderVersionEXT',b'\x00\x00\x0C\x54VkDeviceFaultVendorBinaryHeaderVersionOneEXT',b'\x00\x00\x0C\x56VkDeviceFaultVendorInfoEXT',b'\x00\x00\x0C\x57VkDeviceGroupBindSparseInfo',b'\x00\x00\x0C\x57VkDeviceGroupBindSparseInfoKHR',b'\x00\x00\x0C\x58VkDeviceGroupCommandBufferBeginInfo',b'\x00\x00\x0C\x58VkDeviceGroupCommandBufferBeginInfoKHR',b'\x00\x00\x0C\x59VkDeviceGroupDeviceCreateInfo',b'\x00\x00\x0C\x59VkDeviceGroupDeviceCreateInfoKHR',b'\x00\x00\x0C\x5AVkDeviceGroupPresentCapabilitiesKHR',b'\x00\x00\x0C\x5BVkDeviceGroupPresentInfoKHR',b'\x00\x00\x0C\x5CVkDeviceGroupPresentModeFlagBitsKHR',b'\x00\x00\x00\x1FVkDeviceGroupPresentModeFlagsKHR',b'\x00\x00\x0C\x5DVkDeviceGroupRenderPassBeginInfo',b'\x00\x00\x0C\x5DVkDeviceGroupRenderPassBeginInfoKHR',b'\x00\x00\x0C\x5EVkDeviceGroupSubmitInfo',b'\x00\x00\x0C\x5EVkDeviceGroupSubmitInfoKHR',b'\x00\x00\x0C\x5FVkDeviceGroupSwapchainCreateInfoKHR',b'\x00\x00\x0C\x60VkDeviceImageMemoryRequirements',b'\x00\x00\x0C\x60VkDeviceImageMemoryRequirementsKHR',b'\x00\x00\x0C\x61VkDeviceImageSubresourceInfoKHR',b'\x00\x00\x01\xFDVkDeviceMemory',b'\x00\x00\x0C\x62VkDeviceMemoryOpaqueCaptureAddressInfo',b'\x00\x00\x0C\x62VkDeviceMemoryOpaqueCaptureAddressInfoKHR',b'\x00\x00\x0C\x63VkDeviceMemoryOverallocationCreateInfoAMD',b'\x00\x00\x0C\x64VkDeviceMemoryReportCallbackDataEXT',b'\x00\x00\x0C\x65VkDeviceMemoryReportEventTypeEXT',b'\x00\x00\x00\x1FVkDeviceMemoryReportFlagsEXT',b'\x00\x00\x0C\x66VkDeviceOrHostAddressConstKHR',b'\x00\x00\x0C\x67VkDeviceOrHostAddressKHR',b'\x00\x00\x0C\x68VkDevicePrivateDataCreateInfo',b'\x00\x00\x0C\x68VkDevicePrivateDataCreateInfoEXT',b'\x00\x00\x0C\x69VkDeviceQueueCreateFlagBits',b'\x00\x00\x00\x1FVkDeviceQueueCreateFlags',b'\x00\x00\x0C\x6BVkDeviceQueueCreateInfo',b'\x00\x00\x0C\x6CVkDeviceQueueGlobalPriorityCreateInfoEXT',b'\x00\x00\x0C\x6CVkDeviceQueueGlobalPriorityCreateInfoKHR',b'\x00\x00\x0C\x6DVkDeviceQueueInfo2',b'\x00\x00\x0C\x6EVkDeviceQueueShaderCoreControlCreateInfoARM',b'\x00\x00\x01\x43VkDeviceSize',b'\x00\x00\x00\x1FVkDirectDriverLoadingFlagsLUNARG',b'\x00\x00\x0C\x70VkDirectDriverLoadingInfoLUNARG',b'\x00\x00\x0C\x71VkDirectDriverLoadingListLUNARG',b'\x00\x00\x0C\x72VkDirectDriverLoadingModeLUNARG',b'\x00\x00\x05\x96VkDiscardRectangleModeEXT',b'\x00\x00\x0C\x73VkDispatchIndirectCommand',b'\x00\x00\x0C\x74VkDisplayEventInfoEXT',b'\x00\x00\x0C\x75VkDisplayEventTypeEXT',b'\x00\x00\x02\x5EVkDisplayKHR',b'\x00\x00\x00\x1FVkDisplayModeCreateFlagsKHR',b'\x00\x00\x0C\x76VkDisplayModeCreateInfoKHR',b'\x00\x00\x04\x39VkDisplayModeKHR',b'\x00\x00\x0C\x77VkDisplayModeParametersKHR',b'\x00\x00\x0C\x78VkDisplayModeProperties2KHR',b'\x00\x00\x0C\x79VkDisplayModePropertiesKHR',b'\x00\x00\x0C\x7AVkDisplayNativeHdrSurfaceCapabilitiesAMD',b'\x00\x00\x0C\x7BVkDisplayPlaneAlphaFlagBitsKHR',b'\x00\x00\x00\x1FVkDisplayPlaneAlphaFlagsKHR',b'\x00\x00\x0C\x7CVkDisplayPlaneCapabilities2KHR',b'\x00\x00\x0C\x7DVkDisplayPlaneCapabilitiesKHR',b'\x00\x00\x0C\x7EVkDisplayPlaneInfo2KHR',b'\x00\x00\x0C\x7FVkDisplayPlaneProperties2KHR',b'\x00\x00\x0C\x80VkDisplayPlanePropertiesKHR',b'\x00\x00\x0C\x81VkDisplayPowerInfoEXT',b'\x00\x00\x0C\x82VkDisplayPowerStateEXT',b'\x00\x00\x0C\x83VkDisplayPresentInfoKHR',b'\x00\x00\x0C\x84VkDisplayProperties2KHR',b'\x00\x00\x0C\x85VkDisplayPropertiesKHR',b'\x00\x00\x00\x1FVkDisplaySurfaceCreateFlagsKHR',b'\x00\x00\x0C\x86VkDisplaySurfaceCreateInfoKHR',b'\x00\x00\x0C\x87VkDrawIndexedIndirectCommand',b'\x00\x00\x0C\x88VkDrawIndirectCommand',b'\x00\x00\x0C\x89VkDrawMeshTasksIndirectCommandEXT',b'\x00\x00\x0C\x8AVkDrawMeshTasksIndirectCommandNV',b'\x00\x00\x0C\x8BVkDriverId',b'\x00\x00\x0C\x8BVkDriverIdKHR',b'\x00\x00\x0C\x8DVkDrmFormatModifierProperties2EXT',b'\x00\x00\x0C\x8FVkDrmFormatModifierPropertiesEXT',b'\x00\x00\x0C\x90VkDrmFormatModifierPropertiesList2EXT',b'\x00\x00\x0C\x91VkDrmFormatModifierPropertiesListEXT',b'\x00\x00\x0C\x93VkDynamicState',b'\x00\x00\x02\x6AVkEvent',b'\x00\x00\x0C\x94VkEventCreateFlagBits',b'\x00\x00\x00\x1FVkEventCreateFlags',b'\x00\x00\x0C\x95VkEventCreateInfo',b'\x00\x00\x0C\x96VkExportFenceCreateInfo',b'\x00\x00\x0C\x96VkExportFenceCreateInfoKHR',b'\x00\x00\x0C\x97VkExportFenceWin32HandleInfoKHR',b'\x00\x00\x0C\x98VkExportMemoryAllocateInfo',b'\x00\x00\x0C\x98VkExportMemoryAllocateInfoKHR',b'\x00\x00\x0C\x99VkExportMemoryAllocateInfoNV',b'\x00\x00\x0C\x9AVkExportMemoryWin32HandleInfoKHR',b'\x00\x00\x0C\x9BVkExportMemoryWin32HandleInfoNV',b'\x00\x00\x0C\x9CVkExportSemaphoreCreateInfo',b'\x00\x00\x0C\x9CVkExportSemaphoreCreateInfoKHR',b'\x00\x00\x0C\x9DVkExportSemaphoreWin32HandleInfoKHR',b'\x00\x00\x0C\x9FVkExtensionProperties',b'\x00\x00\x0C\xA0VkExtent2D',b'\x00\x00\x0C\xA1VkExtent3D',b'\x00\x00\x0C\xA2VkExternalBufferProperties',b'\x00\x00\x0C\xA2VkExternalBufferPropertiesKHR',b'\x00\x00\x0C\xA3VkExternalFenceFeatureFlagBits',b'\x00\x00\x0C\xA3VkExternalFenceFeatureFlagBitsKHR',b'\x00\x00\x00\x1FVkExternalFenceFeatureFlags',b'\x00\x00\x00\x1FVkExternalFenceFeatureFlagsKHR',b'\x00\x00\x0C\xA4VkExternalFenceHandleTypeFlagBits',b'\x00\x00\x0C\xA4VkExternalFenceHandleTypeFlagBitsKHR',b'\x00\x00\x00\x1FVkExternalFenceHandleTypeFlags',b'\x00\x00\x00\x1FVkExternalFenceHandleTypeFlagsKHR',b'\x00\x00\x0C\xA5VkExternalFenceProperties',b'\x00\x00\x0C\xA5VkExternalFencePropertiesKHR',b'\x00\x00\x0C\xA6VkExternalFormatANDROID',b'\x00\x00\x0C\xA7VkExternalImageFormatProperties',b'\x00\x00\x0C\xA7VkExternalImageFormatPropertiesKHR',b'\x00\x00\x0C\xA8VkExternalImageFormatPropertiesNV',b'\x00\x00\x0C\xA9VkExternalMemoryAcquireUnmodifiedEXT',b'\x00\x00\x0C\xAAVkExternalMemoryBufferCreateInfo',b'\x00\x00\x0C\xAAVkExternalMemoryBufferCreateInfoKHR',b'\x00\x00\x0C\xABVkExternalMemoryFeatureFlagBits',b'\x00\x00\x0C\xABVkExternalMemoryFeatureFlagBitsKHR',b'\x00\x00\x0C\xACVkExternalMemoryFeatureFlagBitsNV',b'\x00\x00\x00\x1FVkExternalMemoryFeatureFlags',b'\x00\x00\x00\x1FVkExternalMemoryFeatureFlagsKHR',b'\x00\x00\x00\x1FVkExternalMemoryFeatureFlagsNV',b'\x00\x00\x00\xC1VkExternalMemoryHandleTypeFlagBits',b'\x00\x00\x00\xC1VkExternalMemoryHandleTypeFlagBitsKHR',b'\x00\x00\x0C\xADVkExternalMemoryHandleTypeFlagBitsNV',b'\x00\x00\x00\x1FVkExternalMemoryHandleTypeFlags',b'\x00\x00\x00\x1FVkExternalMemoryHandleTypeFlagsKHR',b'\x00\x00\x00\x1FVkExternalMemoryHandleTypeFlagsNV',b'\x00\x00\x0C\xAEVkExternalMemoryImageCreateInfo',b'\x00\x00\x0C\xAEVkExternalMemoryImageCreateInfoKHR',b'\x00\x00\x0C\xAFVkExternalMemoryImageCreateInfoNV',b'\x00\x00\x0C\xB0VkExternalMemoryProperties',b'\x00\x00\x0C\xB0VkExternalMemoryPropertiesKHR',b'\x00\x00\x0C\xB1VkExternalSemaphoreFeatureFlagBits',b'\x00\x00\x0C\xB1VkExternalSemaphoreFeatureFlagBitsKHR',b'\x00\x00\x00\x1FVkExternalSemaphoreFeatureFlags',b'\x00\x00\x00\x1FVkExternalSemaphoreFeatureFlagsKHR',b'\x00\x00\x0C\xB2VkExternalSemaphoreHandleTypeFlagBits',b'\x00\x00\x0C\xB2VkExternalSemaphoreHandleTypeFlagBitsKHR',b'\x00\x00\x00\x1FVkExternalSemaphoreHandleTypeFlags',b'\x00\x00\x00\x1FVkExternalSemaphoreHandleTypeFlagsKHR',b'\x00\x00\x0C\xB3VkExternalSemaphoreProperties',b'\x00\x00\x0C\xB3VkExternalSemaphorePropertiesKHR',b'\x00\x00\x02\x6EVkFence',b'\x00\x00\x0C\xB4VkFenceCreateFlagBits',b'\x00\x00\x00\x1FVkFenceCreateFlags',b'\x00\x00\x0C\xB5VkFenceCreateInfo',b'\x00\x00\x0C\xB6VkFenceGetFdInfoKHR',b'\x00\x00\x0C\xB7VkFenceGetWin32HandleInfoKHR',b'\x00\x00\x0C\xB8VkFenceImportFlagBits',b'\x00\x00\x0C\xB8VkFenceImportFlagBitsKHR',b'\x00\x00\x00\x1FVkFenceImportFlags',b'\x00\x00\x00\x1FVkFenceImportFlagsKHR',b'\x00\x00\x07\x01VkFilter',b'\x00\x00\x0C\xB9VkFilterCubicImageViewImageFormatPropertiesEXT',b'\x00\x00\x00\x1FVkFlags',b'\x00\x00\x01\x43VkFlags64',b'\x00\x00\x03\xD2VkFormat',b'\x00\x00\x0C\xBBVkFormatFeatureFlagBits',b'\x00\x00\x01\x43VkFormatFeatureFlagBits2',b'\x00\x00\x01\x43VkFormatFeatureFlagBits2KHR',b'\x00\x00\x00\x1FVkFormatFeatureFlags',b'\x00\x00\x01\x43VkFormatFeatureFlags2',b'\x00\x00\x01\x43VkFormatFeatureFlags2KHR',b'\x00\x00\x0C\xBEVkFormatProperties',b'\x00\x00\x0C\xBCVkFormatProperties2',b'\x00\x00\x0C\xBCVkFormatProperties2KHR',b'\x00\x00\x0C\xBDVkFormatProperties3',b'\x00\x00\x0C\xBDVkFormatProperties3KHR',b'\x00\x00\x0C\xBFVkFragmentShadingRateAttachmentInfoKHR',b'\x00\x00\x0C\xC0VkFragmentShadingRateCombinerOpKHR',b'\x00\x00\x05\x9FVkFragmentShadingRateNV',b'\x00\x00\x0C\xC3VkFragmentShadingRateTypeNV',b'\x00\x00\x0C\xC4VkFrameBoundaryEXT',b'\x00\x00\x0C\xC5VkFrameBoundaryFlagBitsEXT',b'\x00\x00\x00\x1FVkFrameBoundaryFlagsEXT',b'\x00\x00\x02\x72VkFramebuffer',b'\x00\x00\x0C\xC7VkFramebufferAttachmentImageInfo',b'\x00\x00\x0C\xC7VkFramebufferAttachmentImageInfoKHR',b'\x00\x00\x0C\xC8VkFramebufferAttachmentsCreateInfo',b'\x00\x00\x0C\xC8VkFramebufferAttachmentsCreateInfoKHR',b'\x00\x00\x0C\xC9VkFramebufferCreateFlagBits',b'\x00\x00\x00\x1FVkFramebufferCreateFlags',b'\x00\x00\x0C\xCAVkFramebufferCreateInfo',b'\x00\x00\x0C\xCBVkFramebufferMixedSamplesCombinationNV',b'\x00\x00\x05\xA4VkFrontFace',b'\x00\x00\x0C\xCCVkFullScreenExclusiveEXT',b'\x00\x00\x0C\xCDVkGeneratedCommandsInfoNV',b'\x00\x00\x0C\xCEVkGeneratedCommandsMemoryRequirementsInfoNV',b'\x00\x00\x0C\xCFVkGeometryAABBNV',b'\x00\x00\x0C\xD0VkGeometryDataNV',b'\x00\x00\x0C\xD1VkGeometryFlagBitsKHR',b'\x00\x00\x0C\xD1VkGeometryFlagBitsNV',b'\x00\x00\x00\x1FVkGeometryFlagsKHR',b'\x00\x00\x00\x1FVkGeometryFlagsNV',b'\x00\x00\x0C\xD2VkGeometryInstanceFlagBitsKHR',b'\x00\x00\x0C\xD2VkGeometryInstanceFlagBitsNV',b'\x00\x00\x00\x1FVkGeometryInstanceFlagsKHR',b'\x00\x00\x00\x1FVkGeometryInstanceFlagsNV',b'\x00\x00\x0C\xD4VkGeometryNV',b'\x00\x00\x0C\xD5VkGeometryTrianglesNV',b'\x00\x00\x0C\xD6VkGeometryTypeKHR',b'\x00\x00\x0C\xD6VkGeometryTypeNV',b'\x00\x00\x0C\xD7VkGetLatencyMarkerInfoNV',b'\x00\x00\x0C\xD8VkGraphicsPipelineCreateInfo',b'\x00\x00\x0C\xD9VkGraphicsPipelineLibraryCreateInfoEXT',b'\x00\x00\x0C\xDAVkGraphicsPipelineLibraryFlagBitsEXT',b'\x00\x00\x00\x1FVkGraphicsPipelineLibraryFlagsEXT',b'\x00\x00\x0C\xDBVkGraphicsPipelineShaderGroupsCreateInfoNV',b'\x00\x00\x0C\xDDVkGraphicsShaderGroupCreateInfoNV',b'\x00\x00\x0C\xDEVkHdrMetadataEXT',b'\x00\x00\x00\x1FVkHeadlessSurfaceCreateFlagsEXT',b'\x00\x00\x0C\xDFVkHeadlessSurfaceCreateInfoEXT',b'\x00\x00\x0C\xE0VkHostImageCopyDevicePerformanceQueryEXT',b'\x00\x00\x0C\xE1VkHostImageCopyFlagBitsEXT',b'\x00\x00\x00\x1FVkHostImageCopyFlagsEXT',b'\x00\x00\x0C\xE2VkHostImageLayoutTransitionInfoEXT',b'\x00\x00\x02\x7DVkImage',b'\x00\x00\x0C\xE3VkImageAspectFlagBits',b'\x00\x00\x00\x1FVkImageAspectFlags',b'\x00\x00\x0C\xE6VkImageBlit',b'\x00\x00\x0C\xE5VkImageBlit2',b'\x00\x00\x0C\xE5VkImageBlit2KHR',b'\x00\x00\x0C\xE7VkImageCaptureDescriptorDataInfoEXT',b'\x00\x00\x0C\xE8VkImageCompressionControlEXT',b'\x00\x00\x0C\xE9VkImageCompressionFixedRateFlagBitsEXT',b'\x00\x00\x00\x1FVkImageCompressionFixedRateFlagsEXT',b'\x00\x00\x0C\xEAVkImageCompressionFlagBitsEXT',b'\x00\x00\x00\x1FVkImageCompressionFlagsEXT',b'\x00\x00\x0C\xEBVkImageCompressionPropertiesEXT',b'\x00\x00\x0C\xEEVkImageCopy',b'\x00\x00\x0C\xEDVkImageCopy2',b'\x00\x00\x0C\xEDVkImageCopy2KHR',b'\x00\x00\x0C\xEFVkImageCreateFlagBits',b'\x00\x00\x00\x1FVkImageCreateFlags',b'\x00\x00\x0C\xF0VkImageCreateInfo',b'\x00\x00\x0C\xF1VkImageDrmFormatModifierExplicitCreateInfoEXT',b'\x00\x00\x0C\xF2VkImageDrmFormatModifierListCreateInfoEXT',b'\x00\x00\x0C\xF3VkImageDrmFormatModifierPropertiesEXT',b'\x00\x00\x0C\xF4VkImageFormatListCreateInfo',b'\x00\x00\x0C\xF4VkImageFormatListCreateInfoKHR',b'\x00\x00\x0C\xF6VkImageFormatProperties',b'\x00\x00\x0C\xF5VkImageFormatProperties2',b'\x00\x00\x0C\xF5VkImageFormatProperties2KHR',b'\x00\x00\x02\x8BVkImageLayout',b'\x00\x00\x0C\xFAVkImageMemoryBarrier',b'\x00\x00\x0C\xF9VkImageMemoryBarrier2',b'\x00\x00\x0C\xF9VkImageMemoryBarrier2KHR',b'\x00\x00\x0C\xFBVkImageMemoryRequirementsInfo2',b'\x00\x00\x0C\xFBVkImageMemoryRequirementsInfo2KHR',b'\x00\x00\x0C\xFCVkImagePlaneMemoryRequirementsInfo',b'\x00\x00\x0C\xFCVkImagePlaneMemoryRequirementsInfoKHR',b'\x00\x00\x0C\xFFVkImageResolve',b'\x00\x00\x0C\xFEVkImageResolve2',b'\x00\x00\x0C\xFEVkImageResolve2KHR',b'\x00\x00\x0D\x00VkImageSparseMemoryRequirementsInfo2',b'\x00\x00\x0D\x00VkImageSparseMemoryRequirementsInfo2KHR',b'\x00\x00\x0D\x01VkImageStencilUsageCreateInfo',b'\x00\x00\x0D\x01VkImageStencilUsageCreateInfoEXT',b'\x00\x00\x0D\x03VkImageSubresource',b'\x00\x00\x0D\x02VkImageSubresource2EXT',b'\x00\x00\x0D\x02VkImageSubresource2KHR',b'\x00\x00\x0D\x04VkImageSubresourceLayers',b'\x00\x00\x0D\x05VkImageSubresourceRange',b'\x00\x00\x0D\x06VkImageSwapchainCreateInfoKHR',b'\x00\x00\x03\xD4VkImageTiling',b'\x00\x00\x0D\x08VkImageToMemoryCopyEXT',b'\x00\x00\x03\xD3VkImageType',b'\x00\x00\x0D\x09VkImageUsageFlagBits',b'\x00\x00\x00\x1FVkImageUsageFlags',b'\x00\x00\x02\x78VkImageView',b'\x00\x00\x0D\x0AVkImageViewASTCDecodeModeEXT',b'\x00\x00\x0D\x0BVkImageViewAddressPropertiesNVX',b'\x00\x00\x0D\x0CVkImageViewCaptureDescriptorDataInfoEXT',b'\x00\x00\x0D\x0DVkImageViewCreateFlagBits',b'\x00\x00\x00\x1FVkImageViewCreateFlags',b'\x00\x00\x0D\x0EVkImageViewCreateInfo',b'\x00\x00\x0D\x0FVkImageViewHandleInfoNVX',b'\x00\x00\x0D\x10VkImageViewMinLodCreateInfoEXT',b'\x00\x00\x0D\x11VkImageViewSampleWeightCreateInfoQCOM',b'\x00\x00\x0D\x12VkImageViewSlicedCreateInfoEXT',b'\x00\x00\x0D\x13VkImageViewType',b'\x00\x00\x0D\x14VkImageViewUsageCreateInfo',b'\x00\x00\x0D\x14VkImageViewUsageCreateInfoKHR',b'\x00\x00\x0D\x15VkImportAndroidHardwareBufferInfoANDROID',b'\x00\x00\x0D\x16VkImportFenceFdInfoKHR',b'\x00\x00\x0D\x17VkImportFenceWin32HandleInfoKHR',b'\x00\x00\x0D\x18VkImportMemoryFdInfoKHR',b'\x00\x00\x0D\x19VkImportMemoryHostPointerInfoEXT',b'\x00\x00\x0D\x1AVkImportMemoryWin32HandleInfoKHR',b'\x00\x00\x0D\x1BVkImportMemoryWin32HandleInfoNV',b'\x00\x00\x0D\x1CVkImportSemaphoreFdInfoKHR',b'\x00\x00\x0D\x1DVkImportSemaphoreWin32HandleInfoKHR',b'\x00\x00\x06\x8EVkIndexType',b'\x00\x00\x0D\x1FVkIndirectCommandsLayoutCreateInfoNV',b'\x00\x00\x09\xA8VkIndirectCommandsLayoutNV',b'\x00\x00\x0D\x21VkIndirectCommandsLayoutTokenNV',b'\x00\x00\x0D\x22VkIndirectCommandsLayoutUsageFlagBitsNV',b'\x00\x00\x00\x1FVkIndirectCommandsLayoutUsageFlagsNV',b'\x00\x00\x0D\x24VkIndirectCommandsStreamNV',b'\x00\x00\x0D\x25VkIndirectCommandsTokenTypeNV',b'\x00\x00\x0D\x26VkIndirectStateFlagBitsNV',b'\x00\x00\x00\x1FVkIndirectStateFlagsNV',b'\x00\x00\x0D\x27VkInitializePerformanceApiInfoINTEL',b'\x00\x00\x0D\x29VkInputAttachmentAspectReference',b'\x00\x00\x0D\x29VkInputAttachmentAspectReferenceKHR',b'\x00\x00\x03\x86VkInstance',b'\x00\x00\x0D\x2AVkInstanceCreateFlagBits',b'\x00\x00\x00\x1FVkInstanceCreateFlags',b'\x00\x00\x0D\x2BVkInstanceCreateInfo',b'\x00\x00\x0A\xC9VkInternalAllocationType',b'\x00\x00\x0D\x2CVkLatencyMarkerNV',b'\x00\x00\x0D\x2DVkLatencySleepInfoNV',b'\x00\x00\x0D\x2EVkLatencySleepModeInfoNV',b'\x00\x00\x0D\x2FVkLatencySubmissionPresentIdNV',b'\x00\x00\x0D\x30VkLatencySurfaceCapabilitiesNV',b'\x00\x00\x0D\x32VkLatencyTimingsFrameReportNV',b'\x00\x00\x0D\x33VkLayerProperties',b'\x00\x00\x0D\x35VkLayerSettingEXT',b'\x00\x00\x0D\x36VkLayerSettingTypeEXT',b'\x00\x00\x0D\x37VkLayerSettingsCreateInfoEXT',b'\x00\x00\x0D\x38VkLayeredDriverUnderlyingApiMSFT',b'\x00\x00\x05\xACVkLineRasterizationModeEXT',b'\x00\x00\x05\xB0VkLogicOp',b'\x00\x00\x0D\x39VkMappedMemoryRange',b'\x00\x00\x0D\x3AVkMemoryAllocateFlagBits',b'\x00\x00\x0D\x3AVkMemoryAllocateFlagBitsKHR',b'\x00\x00\x00\x1FVkMemoryAllocateFlags',b'\x00\x00\x0D\x3BVkMemoryAllocateFlagsInfo',b'\x00\x00\x0D\x3BVkMemoryAllocateFlagsInfoKHR',b'\x00\x00\x00\x1FVkMemoryAllocateFlagsKHR',b'\x00\x00\x0D\x3CVkMemoryAllocateInfo',b'\x00\x00\x0D\x3FVkMemoryBarrier',b'\x00\x00\x0D\x3EVkMemoryBarrier2',b'\x00\x00\x0D\x3EVkMemoryBarrier2KHR',b'\x00\x00\x01\x43VkMemoryDecompressionMethodFlagBitsNV',b'\x00\x00\x01\x43VkMemoryDecompressionMethodFlagsNV',b'\x00\x00\x0D\x40VkMemoryDedicatedAllocateInfo',b'\x00\x00\x0D\x40VkMemoryDedicatedAllocateInfoKHR',b'\x00\x00\x0D\x41VkMemoryDedicatedRequirements',b'\x00\x00\x0D\x41VkMemoryDedicatedRequirementsKHR',b'\x00\x00\x0D\x42VkMemoryFdPropertiesKHR',b'\x00\x00\x0D\x43VkMemoryGetAndroidHardwareBufferInfoANDROID',b'\x00\x00\x0D\x44VkMemoryGetFdInfoKHR',b'\x00\x00\x0D\x45VkMemoryGetRemoteAddressInfoNV',b'\x00\x00\x0D\x46VkMemoryGetWin32HandleInfoKHR',b'\x00\x00\x0D\x47VkMemoryHeap',b'\x00\x00\x0D\x48VkMemoryHeapFlagBits',b'\x00\x00\x00\x1FVkMemoryHeapFlags',b'\x00\x00\x0D\x4BVkMemoryHostPointerPropertiesEXT',b'\x00\x00\x00\x1FVkMemoryMapFlags',b'\x00\x00\x0D\x4CVkMemoryMapInfoKHR',b'\x00\x00\x0D\x4DVkMemoryOpaqueCaptureAddressAllocateInfo',b'\x00\x00\x0D\x4DVkMemoryOpaqueCaptureAddressAllocateInfoKHR',b'\x00\x00\x0D\x4EVkMemoryOverallocationBehaviorAMD',b'\x00\x00\x0D\x4FVkMemoryPriorityAllocateInfoEXT',b'\x00\x00\x0D\x50VkMemoryPropertyFlagBits',b'\x00\x00\x00\x1FVkMemoryPropertyFlags',b'\x00\x00\x0D\x52VkMemoryRequirements',b'\x00\x00\x0D\x51VkMemoryRequirements2',b'\x00\x00\x0D\x51VkMemoryRequirements2KHR',b'\x00\x00\x0D\x54VkMemoryToImageCopyEXT',b'\x00\x00\x0D\x55VkMemoryType',b'\x00\x00\x00\x1FVkMemoryUnmapFlagsKHR',b'\x00\x00\x0D\x58VkMemoryUnmapInfoKHR',b'\x00\x00\x0D\x59VkMemoryWin32HandlePropertiesKHR',b'\x00\x00\x0D\x5AVkMicromapBuildInfoEXT',b'\x00\x00\x0D\x5BVkMicromapBuildSizesInfoEXT',b'\x00\x00\x0D\x5CVkMicromapCreateFlagBitsEXT',b'\x00\x00\x00\x1FVkMicromapCreateFlagsEXT',b'\x00\x00\x0D\x5DVkMicromapCreateInfoEXT',b'\x00\x00\x09\xADVkMicromapEXT',b'\x00\x00\x0D\x5EVkMicromapTriangleEXT',b'\x00\x00\x0D\x5FVkMicromapTypeEXT',b'\x00\x00\x0D\x62VkMicromapUsageEXT',b'\x00\x00\x0D\x63VkMicromapVersionInfoEXT',b'\x00\x00\x0D\x64VkMultiDrawIndexedInfoEXT',b'\x00\x00\x0D\x65VkMultiDrawInfoEXT',b'\x00\x00\x0D\x66VkMultisamplePropertiesEXT',b'\x00\x00\x0D\x67VkMultisampledRenderToSingleSampledInfoEXT',b'\x00\x00\x0D\x68VkMultiviewPerViewAttributesInfoNVX',b'\x00\x00\x0D\x69VkMultiviewPerViewRenderAreasRenderPassBeginInfoQCOM',b'\x00\x00\x0D\x6AVkMutableDescriptorTypeCreateInfoEXT',b'\x00\x00\x0D\x6AVkMutableDescriptorTypeCreateInfoVALVE',b'\x00\x00\x0D\x6CVkMutableDescriptorTypeListEXT',b'\x00\x00\x0D\x6CVkMutableDescriptorTypeListVALVE',b'\x00\x00\x01\x42VkObjectType',b'\x00\x00\x0D\x6EVkOffset2D',b'\x00\x00\x0D\x6FVkOffset3D',b'\x00\x00\x0D\x72VkOpacityMicromapFormatEXT',b'\x00\x00\x0D\x73VkOpacityMicromapSpecialIndexEXT',b'\x00\x00\x0D\x74VkOpaqueCaptureDescriptorDataCreateInfoEXT',b'\x00\x00\x0D\x75VkOpticalFlowExecuteFlagBitsNV',b'\x00\x00\x00\x1FVkOpticalFlowExecuteFlagsNV',b'\x00\x00\x0D\x76VkOpticalFlowExecuteInfoNV',b'\x00\x00\x0D\x77VkOpticalFlowGridSizeFlagBitsNV',b'\x00\x00\x00\x1FVkOpticalFlowGridSizeFlagsNV',b'\x00\x00\x0D\x78VkOpticalFlowImageFormatInfoNV',b'\x00\x00\x0D\x79VkOpticalFlowImageFormatPropertiesNV',b'\x00\x00\x0D\x7AVkOpticalFlowPerformanceLevelNV',b'\x00\x00\x02\x89VkOpticalFlowSessionBindingPointNV',b'\x00\x00\x0D\x7BVkOpticalFlowSessionCreateFlagBitsNV',b'\x00\x00\x00\x1FVkOpticalFlowSessionCreateFlagsNV',b'\x00\x00\x0D\x7CVkOpticalFlowSessionCreateInfoNV',b'\x00\x00\x0D\x7DVkOpticalFlowSessionCreatePrivateDataInfoNV',b'\x00\x00\x02\x88VkOpticalFlowSessionNV',b'\x00\x00\x0D\x7EVkOpticalFlowUsageFlagBitsNV',b'\x00\x00\x00\x1FVkOpticalFlowUsageFlagsNV',b'\x00\x00\x0D\x7FVkOutOfBandQueueTypeInfoNV',b'\x00\x00\x0D\x80VkOutOfBandQueueTypeNV',b'\x00\x00\x0D\x81VkPastPresentationTimingGOOGLE',b'\x00\x00\x0D\x82VkPeerMemoryFeatureFlagBits',b'\x00\x00\x0D\x82VkPeerMemoryFeatureFlagBitsKHR',b'\x00\x00\x00\x1FVkPeerMemoryFeatureFlags',b'\x00\x00\x00\x1FVkPeerMemoryFeatureFlagsKHR',b'\x00\x00\x0D\x83VkPerformanceConfigurationAcquireInfoINTEL',b'\x00\x00\x02\x8FVkPerformanceConfigurationINTEL',b'\x00\x00\x0D\x84VkPerformanceConfigurationTypeINTEL',b'\x00\x00\x0D\x85VkPerformanceCounterDescriptionFlagBitsKHR',b'\x00\x00\x00\x1FVkPerformanceCounterDescriptionFlagsKHR',b'\x00\x00\x0D\x86VkPerformanceCounterDescriptionKHR',b'\x00\x00\x0D\x87VkPerformanceCounterKHR',b'\x00\x00\x0D\x88VkPerformanceCounterResultKHR',b'\x00\x00\x0D\x89VkPerformanceCounterScopeKHR',b'\x00\x00\x0D\x8AVkPerformanceCounterStorageKHR',b'\x00\x00\x0D\x8BVkPerformanceCounterUnitKHR',b'\x00\x00\x0D\x8CVkPerformanceMarkerInfoINTEL',b'\x00\x00\x0D\x8DVkPerformanceOverrideInfoINTEL',b'\x00\x00\x0D\x8EVkPerformanceOverrideTypeINTEL',b'\x00\x00\x01\x54VkPerformanceParameterTypeINTEL',b'\x00\x00\x0D\x8FVkPerformanceQuerySubmitInfoKHR',b'\x00\x00\x0D\x90VkPerformanceStreamMarkerInfoINTEL',b'\x00\x00\x0D\x91VkPerformanceValueDataINTEL',b'\x00\x00\x0D\x92VkPerformanceValueINTEL',b'\x00\x00\x0D\x93VkPerformanceValueTypeINTEL',b'\x00\x00\x03\xC6VkPhysicalDevice',b'\x00\x00\x0D\x94VkPhysicalDevice16BitStorageFeatures',b'\x00\x00\x0D\x94VkPhysicalDevice16BitStorageFeaturesKHR',b'\x00\x00\x0D\x95VkPhysicalDevice4444FormatsFeaturesEXT',b'\x00\x00\x0D\x96VkPhysicalDevice8BitStorageFeatures',b'\x00\x00\x0D\x96VkPhysicalDevice8BitStorageFeaturesKHR',b'\x00\x00\x0D\x97VkPhysicalDeviceASTCDecodeFeaturesEXT',b'\x00\x00\x0D\x98VkPhysicalDeviceAccelerationStructureFeaturesKHR',b'\x00\x00\x0D\x99VkPhysicalDeviceAccelerationStructurePropertiesKHR',b'\x00\x00\x0D\x9AVkPhysicalDeviceAddressBindingReportFeaturesEXT',b'\x00\x00\x0D\x9BVkPhysicalDeviceAmigoProfilingFeaturesSEC',b'\x00\x00\x0D\x9CVkPhysicalDeviceAttachmentFeedbackLoopDynamicStateFeaturesEXT',b'\x00\x00\x0D\x9DVkPhysicalDeviceAttachmentFeedbackLoopLayoutFeaturesEXT',b'\x00\x00\x0D\x9EVkPhysicalDeviceBlendOperationAdvancedFeaturesEXT',b'\x00\x00\x0D\x9FVkPhysicalDeviceBlendOperationAdvancedPropertiesEXT',b'\x00\x00\x0D\xA0VkPhysicalDeviceBorderColorSwizzleFeaturesEXT',b'\x00\x00\x0D\xA2VkPhysicalDeviceBufferAddressFeaturesEXT',b'\x00\x00\x0D\xA1VkPhysicalDeviceBufferDeviceAddressFeatures',b'\x00\x00\x0D\xA2VkPhysicalDeviceBufferDeviceAddressFeaturesEXT',b'\x00\x00\x0D\xA1VkPhysicalDeviceBufferDeviceAddressFeaturesKHR',b'\x00\x00\x0D\xA3VkPhysicalDeviceClusterCullingShaderFeaturesHUAWEI',b'\x00\x00\x0D\xA4VkPhysicalDeviceClusterCullingShaderPropertiesHUAWEI',b'\x00\x00\x0D\xA5VkPhysicalDeviceClusterCullingShaderVrsFeaturesHUAWEI',b'\x00\x00\x0D\xA6VkPhysicalDeviceCoherentMemoryFeaturesAMD',b'\x00\x00\x0D\xA7VkPhysicalDeviceColorWriteEnableFeaturesEXT',b'\x00\x00\x0D\xA8VkPhysicalDeviceComputeShaderDerivativesFeaturesNV',b'\x00\x00\x0D\xA9VkPhysicalDeviceConditionalRenderingFeaturesEXT',b'\x00\x00\x0D\xAAVkPhysicalDeviceConservativeRasterizationPropertiesEXT',b'\x00\x00\x0D\xABVkPhysicalDeviceCooperativeMatrixFeaturesKHR',b'\x00\x00\x0D\xACVkPhysicalDeviceCooperativeMatrixFeaturesNV',b'\x00\x00\x0D\xADVkPhysicalDeviceCooperativeMatrixPropertiesKHR',b'\x00\x00\x0D\xAEVkPhysicalDeviceCooperativeMatrixPropertiesNV',b'\x00\x00\x0D\xAFVkPhysicalDeviceCopyMemoryIndirectFeaturesNV',b'\x00\x00\x0D\xB0VkPhysicalDeviceCopyMemoryIndirectPropertiesNV',b'\x00\x00\x0D\xB1VkPhysicalDeviceCornerSampledImageFeaturesNV',b'\x00\x00\x0D\xB2VkPhysicalDeviceCoverageReductionModeFeaturesNV',b'\x00\x00\x0D\xB3VkPhysicalDeviceCubicClampFeaturesQCOM',b'\x00\x00\x0D\xB4VkPhysicalDeviceCubicWeightsFeaturesQCOM',b'\x00\x00\x0D\xB5VkPhysicalDeviceCudaKernelLaunchFeaturesNV',b'\x00\x00\x0D\xB6VkPhysicalDeviceCudaKernelLaunchPropertiesNV',b'\x00\x00\x0D\xB7VkPhysicalDeviceCustomBorderColorFeaturesEXT',b'\x00\x00\x0D\xB8VkPhysicalDeviceCustomBorderColorPropertiesEXT',b'\x00\x00\x0D\xB9VkPhysicalDeviceDedicatedAllocationImageAliasingFeaturesNV',b'\x00\x00\x0D\xBAVkPhysicalDeviceDepthBiasControlFeaturesEXT',b'\x00\x00\x0D\xBBVkPhysicalDeviceDepthClampZeroOneFeaturesEXT',b'\x00\x00\x0D\xBCVkPhysicalDeviceDepthClipControlFeaturesEXT',b'\x00\x00\x0D\xBDVkPhysicalDeviceDepthClipEnableFeaturesEXT',b'\x00\x00\x0D\xBEVkPhysicalDeviceDepthStencilResolveProperties',b'\x00\x00\x0D\xBEVkPhysicalDeviceDepthStencilResolvePropertiesKHR',b'\x00\x00\x0D\xBFVkPhysicalDeviceDescriptorBufferDensityMapPropertiesEXT',b'\x00\x00\x0D\xC0VkPhysicalDeviceDescriptorBufferFeaturesEXT',b'\x00\x00\x0D\xC1VkPhysicalDeviceDescriptorBufferPropertiesEXT',b'\x00\x00\x0D\xC2VkPhysicalDeviceDescriptorIndexingFeatures',b'\x00\x00\x0D\xC2VkPhysicalDeviceDescriptorIndexingFeaturesEXT',b'\x00\x00\x0D\xC3VkPhysicalDeviceDescriptorIndexingProperties',b'\x00\x00\x0D\xC3VkPhysicalDeviceDescriptorIndexingPropertiesEXT',b'\x00\x00\x0D\xC4VkPhysicalDeviceDescriptorPoolOverallocationFeaturesNV',b'\x00\x00\x0D\xC5VkPhysicalDeviceDescriptorSetHostMappingFeaturesVALVE',b'\x00\x00\x0D\xC6VkPhysicalDeviceDeviceGeneratedCommandsComputeFeaturesNV',b'\x00\x00\x0D\xC7VkPhysicalDeviceDeviceGeneratedCommandsFeaturesNV',b'\x00\x00\x0D\xC8VkPhysicalDeviceDeviceGeneratedCommandsPropertiesNV',b'\x00\x00\x0D\xC9VkPhysicalDeviceDeviceMemoryReportFeaturesEXT',b'\x00\x00\x0D\xCAVkPhysicalDeviceDiagnosticsConfigFeaturesNV',b'\x00\x00\x0D\xCBVkPhysicalDeviceDiscardRectanglePropertiesEXT',b'\x00\x00\x0D\xCCVkPhysicalDeviceDriverProperties',b'\x00\x00\x0D\xCCVkPhysicalDeviceDriverPropertiesKHR',b'\x00\x00\x0D\xCDVkPhysicalDeviceDrmPropertiesEXT',b'\x00\x00\x0D\xCEVkPhysicalDeviceDynamicRenderingFeatures',b'\x00\x00\x0D\xCEVkPhysicalDeviceDynamicRenderingFeaturesKHR',b'\x00\x00\x0D\xCFVkPhysicalDeviceDynamicRenderingUnusedAttachmentsFeaturesEXT',b'\x00\x00\x0D\xD0VkPhysicalDeviceExclusiveScissorFeaturesNV',b'\x00\x00\x0D\xD1VkPhysicalDeviceExtendedDynamicState2FeaturesEXT',b'\x00\x00\x0D\xD2VkPhysicalDeviceExtendedDynamicState3FeaturesEXT',b'\x00\x00\x0D\xD3VkPhysicalDeviceExtendedDynamicState3PropertiesEXT',b'\x00\x00\x0D\xD4VkPhysicalDeviceExtendedDynamicStateFeaturesEXT',b'\x00\x00\x0D\xD5VkPhysicalDeviceExtendedSparseAddressSpaceFeaturesNV',b'\x00\x00\x0D\xD6VkPhysicalDeviceExtendedSparseAddressSpacePropertiesNV',b'\x00\x00\x0D\xD7VkPhysicalDeviceExternalBufferInfo',b'\x00\x00\x0D\xD7VkPhysicalDeviceExternalBufferInfoKHR',b'\x00\x00\x0D\xD8VkPhysicalDeviceExternalFenceInfo',b'\x00\x00\x0D\xD8VkPhysicalDeviceExternalFenceInfoKHR',b'\x00\x00\x0D\xD9VkPhysicalDeviceExternalFormatResolveFeaturesANDROID',b'\x00\x00\x0D\xDAVkPhysicalDeviceExternalFormatResolvePropertiesANDROID',b'\x00\x00\x0D\xDBVkPhysicalDeviceExternalImageFormatInfo',b'\x00\x00\x0D\xDBVkPhysicalDeviceExternalImageFormatInfoKHR',b'\x00\x00\x0D\xDCVkPhysicalDeviceExternalMemoryHostPropertiesEXT',b'\x00\x00\x0D\xDDVkPhysicalDeviceExternalMemoryRDMAFeaturesNV',b'\x00\x00\x0D\xDEVkPhysicalDeviceExternalSemaphoreInfo',b'\x00\x00\x0D\xDEVkPhysicalDeviceExternalSemaphoreInfoKHR',b'\x00\x00\x0D\xDFVkPhysicalDeviceFaultFeaturesEXT',b'\x00\x00\x0D\xE2VkPhysicalDeviceFeatures',b'\x00\x00\x0D\xE1VkPhysicalDeviceFeatures2',b'\x00\x00\x0D\xE1VkPhysicalDeviceFeatures2KHR',b'\x00\x00\x0E\x73VkPhysicalDeviceFloat16Int8FeaturesKHR',b'\x00\x00\x0D\xE3VkPhysicalDeviceFloatControlsProperties',b'\x00\x00\x0D\xE3VkPhysicalDeviceFloatControlsPropertiesKHR',b'\x00\x00\x0D\xE4VkPhysicalDeviceFragmentDensityMap2FeaturesEXT',b'\x00\x00\x0D\xE5VkPhysicalDeviceFragmentDensityMap2PropertiesEXT',b'\x00\x00\x0D\xE6VkPhysicalDeviceFragmentDensityMapFeaturesEXT',b'\x00\x00\x0D\xE7VkPhysicalDeviceFragmentDensityMapOffsetFeaturesQCOM',b'\x00\x00\x0D\xE8VkPhysicalDeviceFragmentDensityMapOffsetPropertiesQCOM',b'\x00\x00\x0D\xE9VkPhysicalDeviceFragmentDensityMapPropertiesEXT',b'\x00\x00\x0D\xEAVkPhysicalDeviceFragmentShaderBarycentricFeaturesKHR',b'\x00\x00\x0D\xEAVkPhysicalDeviceFragmentShaderBarycentricFeaturesNV',b'\x00\x00\x0D\xEBVkPhysicalDeviceFragmentShaderBarycentricPropertiesKHR',b'\x00\x00\x0D\xECVkPhysicalDeviceFragmentShaderInterlockFeaturesEXT',b'\x00\x00\x0D\xEDVkPhysicalDeviceFragmentShadingRateEnumsFeaturesNV',b'\x00\x00\x0D\xEEVkPhysicalDeviceFragmentShadingRateEnumsPropertiesNV',b'\x00\x00\x0D\xEFVkPhysicalDeviceFragmentShadingRateFeaturesKHR',b'\x00\x00\x0D\xF0VkPhysicalDeviceFragmentShadingRateKHR',b'\x00\x00\x0D\xF1VkPhysicalDeviceFragmentShadingRatePropertiesKHR',b'\x00\x00\x0D\xF2VkPhysicalDeviceFrameBoundaryFeaturesEXT',b'\x00\x00\x0D\xF3VkPhysicalDeviceGlobalPriorityQueryFeaturesEXT',b'\x00\x00\x0D\xF3VkPhysicalDeviceGlobalPriorityQueryFeaturesKHR',b'\x00\x00\x0D\xF4VkPhysicalDeviceGraphicsPipelineLibraryFeaturesEXT',b'\x00\x00\x0D\xF5VkPhysicalDeviceGraphicsPipelineLibraryPropertiesEXT',b'\x00\x00\x0D\xF6VkPhysicalDeviceGroupProperties',b'\x00\x00\x0D\xF6VkPhysicalDeviceGroupPropertiesKHR',b'\x00\x00\x0D\xF7VkPhysicalDeviceHostImageCopyFeaturesEXT',b'\x00\x00\x0D\xF8VkPhysicalDeviceHostImageCopyPropertiesEXT',b'\x00\x00\x0D\xF9VkPhysicalDeviceHostQueryResetFeatures',b'\x00\x00\x0D\xF9VkPhysicalDeviceHostQueryResetFeaturesEXT',b'\x00\x00\x0D\xFAVkPhysicalDeviceIDProperties',b'\x00\x00\x0D\xFAVkPhysicalDeviceIDPropertiesKHR',b'\x00\x00\x0D\xFBVkPhysicalDeviceImage2DViewOf3DFeaturesEXT',b'\x00\x00\x0D\xFCVkPhysicalDeviceImageCompressionControlFeaturesEXT',b'\x00\x00\x0D\xFDVkPhysicalDeviceImageCompressionControlSwapchainFeaturesEXT',b'\x00\x00\x0D\xFEVkPhysicalDeviceImageDrmFormatModifierInfoEXT',b'\x00\x00\x0D\xFFVkPhysicalDeviceImageFormatInfo2',b'\x00\x00\x0D\xFFVkPhysicalDeviceImageFormatInfo2KHR',b'\x00\x00\x0E\x00VkPhysicalDeviceImageProcessing2FeaturesQCOM',b'\x00\x00\x0E\x01VkPhysicalDeviceImageProcessing2PropertiesQCOM',b'\x00\x00\x0E\x02VkPhysicalDeviceImageProcessingFeaturesQCOM',b'\x00\x00\x0E\x03VkPhysicalDeviceImageProcessingPropertiesQCOM',b'\x00\x00\x0E\x04VkPhysicalDeviceImageRobustnessFeatures',b'\x00\x00\x0E\x04VkPhysicalDeviceImageRobustnessFeaturesEXT',b'\x00\x00\x0E\x05VkPhysicalDeviceImageSlicedViewOf3DFeaturesEXT',b'\x00\x00\x0E\x06VkPhysicalDeviceImageViewImageFormatInfoEXT',b'\x00\x00\x0E\x07VkPhysicalDeviceImageViewMinLodFeaturesEXT',b'\x00\x00\x0E\x08VkPhysicalDeviceImagelessFramebufferFeatures',b'\x00\x00\x0E\x08VkPhysicalDeviceImagelessFramebufferFeaturesKHR',b'\x00\x00\x0E\x09VkPhysicalDeviceIndexTypeUint8FeaturesEXT',b'\x00\x00\x0E\x0AVkPhysicalDeviceInheritedViewportScissorFeaturesNV',b'\x00\x00\x0E\x0BVkPhysicalDeviceInlineUniformBlockFeatures',b'\x00\x00\x0E\x0BVkPhysicalDeviceInlineUniformBlockFeaturesEXT',b'\x00\x00\x0E\x0CVkPhysicalDeviceInlineUniformBlockProperties',b'\x00\x00\x0E\x0CVkPhysicalDeviceInlineUniformBlockPropertiesEXT',b'\x00\x00\x0E\x0DVkPhysicalDeviceInvocationMaskFeaturesHUAWEI',b'\x00\x00\x0E\x0EVkPhysicalDeviceLayeredDriverPropertiesMSFT',b'\x00\x00\x0E\x0FVkPhysicalDeviceLegacyDitheringFeaturesEXT',b'\x00\x00\x0E\x10VkPhysicalDeviceLimits',b'\x00\x00\x0E\x11VkPhysicalDeviceLineRasterizationFeaturesEXT',b'\x00\x00\x0E\x12VkPhysicalDeviceLineRasterizationPropertiesEXT',b'\x00\x00\x0E\x13VkPhysicalDeviceLinearColorAttachmentFeaturesNV',b'\x00\x00\x0E\x14VkPhysicalDeviceMaintenance3Properties',b'\x00\x00\x0E\x14VkPhysicalDeviceMaintenance3PropertiesKHR',b'\x00\x00\x0E\x15VkPhysicalDeviceMaintenance4Features',b'\x00\x00\x0E\x15VkPhysicalDeviceMaintenance4FeaturesKHR',b'\x00\x00\x0E\x16VkPhysicalDeviceMaintenance4Properties',b'\x00\x00\x0E\x16VkPhysicalDeviceMaintenance4PropertiesKHR',b'\x00\x00\x0E\x17VkPhysicalDeviceMaintenance5FeaturesKHR',b'\x00\x00\x0E\x18VkPhysicalDeviceMaintenance5PropertiesKHR',b'\x00\x00\x0E\x19VkPhysicalDeviceMaintenance6FeaturesKHR',b'\x00\x00\x0E\x1AVkPhysicalDeviceMaintenance6PropertiesKHR',b'\x00\x00\x0E\x1BVkPhysicalDeviceMemoryBudgetPropertiesEXT',b'\x00\x00\x0E\x1CVkPhysicalDeviceMemoryDecompressionFeaturesNV',b'\x00\x00\x0E\x1DVkPhysicalDeviceMemoryDecompressionPropertiesNV',b'\x00\x00\x0E\x1EVkPhysicalDeviceMemoryPriorityFeaturesEXT',b'\x00\x00\x0E\x20VkPhysicalDeviceMemoryProperties',b'\x00\x00\x0E\x1FVkPhysicalDeviceMemoryProperties2',b'\x00\x00\x0E\x1FVkPhysicalDeviceMemoryProperties2KHR',b'\x00\x00\x0E\x21VkPhysicalDeviceMeshShaderFeaturesEXT',b'\x00\x00\x0E\x22VkPhysicalDeviceMeshShaderFeaturesNV',b'\x00\x00\x0E\x23VkPhysicalDeviceMeshShaderPropertiesEXT',b'\x00\x00\x0E\x24VkPhysicalDeviceMeshShaderPropertiesNV',b'\x00\x00\x0E\x25VkPhysicalDeviceMultiDrawFeaturesEXT',b'\x00\x00\x0E\x26VkPhysicalDeviceMultiDrawPropertiesEXT',b'\x00\x00\x0E\x27VkPhysicalDeviceMultisampledRenderToSingleSampledFeaturesEXT',b'\x00\x00\x0E\x28VkPhysicalDeviceMultiviewFeatures',b'\x00\x00\x0E\x28VkPhysicalDeviceMultiviewFeaturesKHR',b'\x00\x00\x0E\x29VkPhysicalDeviceMultiviewPerViewAttributesPropertiesNVX',b'\x00\x00\x0E\x2AVkPhysicalDeviceMultiviewPerViewRenderAreasFeaturesQCOM',b'\x00\x00\x0E\x2BVkPhysicalDeviceMultiviewPerViewViewportsFeaturesQCOM',b'\x00\x00\x0E\x2CVkPhysicalDeviceMultiviewProperties',b'\x00\x00\x0E\x2CVkPhysicalDeviceMultiviewPropertiesKHR',b'\x00\x00\x0E\x2DVkPhysicalDeviceMutableDescriptorTypeFeaturesEXT',b'\x00\x00\x0E\x2DVkPhysicalDeviceMutableDescriptorTypeFeaturesVALVE',b'\x00\x00\x0E\x2EVkPhysicalDeviceNestedCommandBufferFeaturesEXT',b'\x00\x00\x0E\x2FVkPhysicalDeviceNestedCommandBufferPropertiesEXT',b'\x00\x00\x0E\x30VkPhysicalDeviceNonSeamlessCubeMapFeaturesEXT',b'\x00\x00\x0E\x31VkPhysicalDeviceOpacityMicromapFeaturesEXT',b'\x00\x00\x0E\x32VkPhysicalDeviceOpacityMicromapPropertiesEXT',b'\x00\x00\x0E\x33VkPhysicalDeviceOpticalFlowFeaturesNV',b'\x00\x00\x0E\x34VkPhysicalDeviceOpticalFlowPropertiesNV',b'\x00\x00\x0E\x35VkPhysicalDevicePCIBusInfoPropertiesEXT',b'\x00\x00\x0E\x36VkPhysicalDevicePageableDeviceLocalMemoryFeaturesEXT',b'\x00\x00\x0E\x37VkPhysicalDevicePerStageDescriptorSetFeaturesNV',b'\x00\x00\x0E\x38VkPhysicalDevicePerformanceQueryFeaturesKHR',b'\x00\x00\x0E\x39VkPhysicalDevicePerformanceQueryPropertiesKHR',b'\x00\x00\x0E\x3AVkPhysicalDevicePipelineCreationCacheControlFeatures',b'\x00\x00\x0E\x3AVkPhysicalDevicePipelineCreationCacheControlFeaturesEXT',b'\x00\x00\x0E\x3BVkPhysicalDevicePipelineExecutablePropertiesFeaturesKHR',b'\x00\x00\x0E\x3CVkPhysicalDevicePipelineLibraryGroupHandlesFeaturesEXT',b'\x00\x00\x0E\x3DVkPhysicalDevicePipelinePropertiesFeaturesEXT',b'\x00\x00\x0E\x3EVkPhysicalDevicePipelineProtectedAccessFeaturesEXT',b'\x00\x00\x0E\x3FVkPhysicalDevicePipelineRobustnessFeaturesEXT',b'\x00\x00\x0E\x40VkPhysicalDevicePipelineRobustnessPropertiesEXT',b'\x00\x00\x0E\x41VkPhysicalDevicePointClippingProperties',b'\x00\x00\x0E\x41VkPhysicalDevicePointClippingPropertiesKHR',b'\x00\x00\x0E\x42VkPhysicalDevicePresentBarrierFeaturesNV',b'\x00\x00\x0E\x43VkPhysicalDevicePresentIdFeaturesKHR',b'\x00\x00\x0E\x44VkPhysicalDevicePresentWaitFeaturesKHR',b'\x00\x00\x0E\x45VkPhysicalDevicePrimitiveTopologyListRestartFeaturesEXT',b'\x00\x00\x0E\x46VkPhysicalDevicePrimitivesGeneratedQueryFeaturesEXT',b'\x00\x00\x0E\x47VkPhysicalDevicePrivateDataFeatures',b'\x00\x00\x0E\x47VkPhysicalDevicePrivateDataFeaturesEXT',b'\x00\x00\x0E\x49VkPhysicalDeviceProperties',b'\x00\x00\x0E\x48VkPhysicalDeviceProperties2',b'\x00\x00\x0E\x48VkPhysicalDeviceProperties2KHR',b'\x00\x00\x0E\x4AVkPhysicalDeviceProtectedMemoryFeatures',b'\x00\x00\x0E\x4BVkPhysicalDeviceProtectedMemoryProperties',b'\x00\x00\x0E\x4CVkPhysicalDeviceProvokingVertexFeaturesEXT',b'\x00\x00\x0E\x4DVkPhysicalDeviceProvokingVertexPropertiesEXT',b'\x00\x00\x0E\x4EVkPhysicalDevicePushDescriptorPropertiesKHR',b'\x00\x00\x0E\x4FVkPhysicalDeviceRGBA10X6FormatsFeaturesEXT',b'\x00\x00\x0E\x50VkPhysicalDeviceRasterizationOrderAttachmentAccessFeaturesARM',b'\x00\x00\x0E\x50VkPhysicalDeviceRasterizationOrderAttachmentAccessFeaturesEXT',b'\x00\x00\x0E\x51VkPhysicalDeviceRayQueryFeaturesKHR',b'\x00\x00\x0E\x52VkPhysicalDeviceRayTracingInvocationReorderFeaturesNV',b'\x00\x00\x0E\x53VkPhysicalDeviceRayTracingInvocationReorderPropertiesNV',b'\x00\x00\x0E\x54VkPhysicalDeviceRayTracingMaintenance1FeaturesKHR',b'\x00\x00\x0E\x55VkPhysicalDeviceRayTracingMotionBlurFeaturesNV',b'\x00\x00\x0E\x56VkPhysicalDeviceRayTracingPipelineFeaturesKHR',b'\x00\x00\x0E\x57VkPhysicalDeviceRayTracingPipelinePropertiesKHR',b'\x00\x00\x0E\x58VkPhysicalDeviceRayTracingPositionFetchFeaturesKHR',b'\x00\x00\x0E\x59VkPhysicalDeviceRayTracingPropertiesNV',b'\x00\x00\x0E\x5AVkPhysicalDeviceRelaxedLineRasterizationFeaturesIMG',b'\x00\x00\x0E\x5BVkPhysicalDeviceRenderPassStripedFeaturesARM',b'\x00\x00\x0E\x5CVkPhysicalDeviceRenderPassStripedPropertiesARM',b'\x00\x00\x0E\x5DVkPhysicalDeviceRepresentativeFragmentTestFeaturesNV',b'\x00\x00\x0E\x5EVkPhysicalDeviceRobustness2FeaturesEXT',b'\x00\x00\x0E\x5FVkPhysicalDeviceRobustness2PropertiesEXT',b'\x00\x00\x0E\x60VkPhysicalDeviceSampleLocationsPropertiesEXT',b'\x00\x00\x0E\x61VkPhysicalDeviceSamplerFilterMinmaxProperties',b'\x00\x00\x0E\x61VkPhysicalDeviceSamplerFilterMinmaxPropertiesEXT',b'\x00\x00\x0E\x62VkPhysicalDeviceSamplerYcbcrConversionFeatures',b'\x00\x00\x0E\x62VkPhysicalDeviceSamplerYcbcrConversionFeaturesKHR',b'\x00\x00\x0E\x63VkPhysicalDeviceScalarBlockLayoutFeatures',b'\x00\x00\x0E\x63VkPhysicalDeviceScalarBlockLayoutFeaturesEXT',b'\x00\x00\x0E\x64VkPhysicalDeviceSchedulingControlsFeaturesARM',b'\x00\x00\x01\x43VkPhysicalDeviceSchedulingControlsFlagBitsARM',b'\x00\x00\x01\x43VkPhysicalDeviceSchedulingControlsFlagsARM',b'\x00\x00\x0E\x65VkPhysicalDeviceSchedulingControlsPropertiesARM',b'\x00\x00\x0E\x66VkPhysicalDeviceSeparateDepthStencilLayoutsFeatures',b'\x00\x00\x0E\x66VkPhysicalDeviceSeparateDepthStencilLayoutsFeaturesKHR',b'\x00\x00\x0E\x67VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT',b'\x00\x00\x0E\x68VkPhysicalDeviceShaderAtomicFloatFeaturesEXT',b'\x00\x00\x0E\x69VkPhysicalDeviceShaderAtomicInt64Features',b'\x00\x00\x0E\x69VkPhysicalDeviceShaderAtomicInt64FeaturesKHR',b'\x00\x00\x0E\x6AVkPhysicalDeviceShaderClockFeaturesKHR',b'\x00\x00\x0E\x6BVkPhysicalDeviceShaderCoreBuiltinsFeaturesARM',b'\x00\x00\x0E\x6CVkPhysicalDeviceShaderCoreBuiltinsPropertiesARM',b'\x00\x00\x0E\x6DVkPhysicalDeviceShaderCoreProperties2AMD',b'\x00\x00\x0E\x6EVkPhysicalDeviceShaderCorePropertiesAMD',b'\x00\x00\x0E\x6FVkPhysicalDeviceShaderCorePropertiesARM',b'\x00\x00\x0E\x70VkPhysicalDeviceShaderDemoteToHelperInvocationFeatures',b'\x00\x00\x0E\x70VkPhysicalDeviceShaderDemoteToHelperInvocationFeaturesEXT',b'\x00\x00\x0E\x71VkPhysicalDeviceShaderDrawParameterFeatures',b'\x00\x00\x0E\x71VkPhysicalDeviceShaderDrawParametersFeatures',b'\x00\x00\x0E\x72VkPhysicalDeviceShaderEarlyAndLateFragmentTestsFeaturesAMD',b'\x00\x00\x0E\x73VkPhysicalDeviceShaderFloat16Int8Features',b'\x00\x00\x0E\x73VkPhysicalDeviceShaderFloat16Int8FeaturesKHR',b'\x00\x00\x0E\x74VkPhysicalDeviceShaderImageAtomicInt64FeaturesEXT',b'\x00\x00\x0E\x75VkPhysicalDeviceShaderImageFootprintFeaturesNV',b'\x00\x00\x0E\x76VkPhysicalDeviceShaderIntegerDotProductFeatures',b'\x00\x00\x0E\x76VkPhysicalDeviceShaderIntegerDotProductFeaturesKHR',b'\x00\x00\x0E\x77VkPhysicalDeviceShaderIntegerDotProductProperties',b'\x00\x00\x0E\x77VkPhysicalDeviceShaderIntegerDotProductPropertiesKHR',b'\x00\x00\x0E\x78VkPhysicalDeviceShaderIntegerFunctions2FeaturesINTEL',b'\x00\x00\x0E\x79VkPhysicalDeviceShaderModuleIdentifierFeaturesEXT',b'\x00\x00\x0E\x7AVkPhysicalDeviceShaderModuleIdentifierPropertiesEXT',b'\x00\x00\x0E\x7BVkPhysicalDeviceShaderObjectFeaturesEXT',b'\x00\x00\x0E\x7CVkPhysicalDeviceShaderObjectPropertiesEXT',b'\x00\x00\x0E\x7DVkPhysicalDeviceShaderSMBuiltinsFeaturesNV',b'\x00\x00\x0E\x7EVkPhysicalDeviceShaderSMBuiltinsPropertiesNV',b'\x00\x00\x0E\x7FVkPhysicalDeviceShaderSubgroupExtendedTypesFeatures',b'\x00\x00\x0E\x7FVkPhysicalDeviceShaderSubgroupExtendedTypesFeaturesKHR',b'\x00\x00\x0E\x80VkPhysicalDeviceShaderSubgroupUniformControlFlowFeaturesKHR',b'\x00\x00\x0E\x81VkPhysicalDeviceShaderTerminateInvocationFeatures',b'\x00\x00\x0E\x81VkPhysicalDeviceShaderTerminateInvocationFeaturesKHR',b'\x00\x00\x0E\x82VkPhysicalDeviceShaderTileImageFeaturesEXT',b'\x00\x00\x0E\x83VkPhysicalDeviceShaderTileImagePropertiesEXT',b'\x00\x00\x0E\x84VkPhysicalDeviceShadingRateImageFeaturesNV',b'\x00\x00\x0E\x85VkPhysicalDeviceShadingRateImagePropertiesNV',b'\x00\x00\x0E\x86VkPhysicalDeviceSparseImageFormatInfo2',b'\x00\x00\x0E\x86VkPhysicalDeviceSparseImageFormatInfo2KHR',b'\x00\x00\x0E\x87VkPhysicalDeviceSparseProperties',b'\x00\x00\x0E\x88VkPhysicalDeviceSubgroupProperties',b'\x00\x00\x0E\x89VkPhysicalDeviceSubgroupSizeControlFeatures',b'\x00\x00\x0E\x89VkPhysicalDeviceSubgroupSizeControlFeaturesEXT',b'\x00\x00\x0E\x8AVkPhysicalDeviceSubgroupSizeControlProperties',b'\x00\x00\x0E\x8AVkPhysicalDeviceSubgroupSizeControlPropertiesEXT',b'\x00\x00\x0E\x8BVkPhysicalDeviceSubpassMergeFeedbackFeaturesEXT',b'\x00\x00\x0E\x8CVkPhysicalDeviceSubpassShadingFeaturesHUAWEI',b'\x00\x00\x0E\x8DVkPhysicalDeviceSubpassShadingPropertiesHUAWEI',b'\x00\x00\x0E\x8EVkPhysicalDeviceSurfaceInfo2KHR',b'\x00\x00\x0E\x8FVkPhysicalDeviceSwapchainMaintenance1FeaturesEXT',b'\x00\x00\x0E\x90VkPhysicalDeviceSynchronization2Features',b'\x00\x00\x0E\x90VkPhysicalDeviceSynchronization2FeaturesKHR',b'\x00\x00\x0E\x91VkPhysicalDeviceTexelBufferAlignmentFeaturesEXT',b'\x00\x00\x0E\x92VkPhysicalDeviceTexelBufferAlignmentProperties',b'\x00\x00\x0E\x92VkPhysicalDeviceTexelBufferAlignmentPropertiesEXT',b'\x00\x00\x0E\x93VkPhysicalDeviceTextureCompressionASTCHDRFeatures',b'\x00\x00\x0E\x93VkPhysicalDeviceTextureCompressionASTCHDRFeaturesEXT',b'\x00\x00\x0E\x94VkPhysicalDeviceTilePropertiesFeaturesQCOM',b'\x00\x00\x0E\x95VkPhysicalDeviceTimelineSemaphoreFeatures',b'\x00\x00\x0E\x95VkPhysicalDeviceTimelineSemaphoreFeaturesKHR',b'\x00\x00\x0E\x96VkPhysicalDeviceTimelineSemaphoreProperties',b'\x00\x00\x0E\x96VkPhysicalDeviceTimelineSemaphorePropertiesKHR',b'\x00\x00\x0E\x97VkPhysicalDeviceToolProperties',b'\x00\x00\x0E\x97VkPhysicalDeviceToolPropertiesEXT',b'\x00\x00\x0E\x98VkPhysicalDeviceTransformFeedbackFeaturesEXT',b'\x00\x00\x0E\x99VkPhysicalDeviceTransformFeedbackPropertiesEXT',b'\x00\x00\x0E\x9AVkPhysicalDeviceType',b'\x00\x00\x0E\x9BVkPhysicalDeviceUniformBufferStandardLayoutFeatures',b'\x00\x00\x0E\x9BVkPhysicalDeviceUniformBufferStandardLayoutFeaturesKHR',b'\x00\x00\x0E\x9CVkPhysicalDeviceVariablePointerFeatures',b'\x00\x00\x0E\x9CVkPhysicalDeviceVariablePointerFeaturesKHR',b'\x00\x00\x0E\x9CVkPhysicalDeviceVariablePointersFeatures',b'\x00\x00\x0E\x9CVkPhysicalDeviceVariablePointersFeaturesKHR',b'\x00\x00\x0E\x9DVkPhysicalDeviceVertexAttributeDivisorFeaturesEXT',b'\x00\x00\x0E\x9DVkPhysicalDeviceVertexAttributeDivisorFeaturesKHR',b'\x00\x00\x0E\x9EVkPhysicalDeviceVertexAttributeDivisorPropertiesEXT',b'\x00\x00\x0E\x9FVkPhysicalDeviceVertexAttributeDivisorPropertiesKHR',b'\x00\x00\x0E\xA0VkPhysicalDeviceVertexInputDynamicStateFeaturesEXT',b'\x00\x00\x0E\xA1VkPhysicalDeviceVideoEncodeQualityLevelInfoKHR',b'\x00\x00\x0E\xA2VkPhysicalDeviceVideoFormatInfoKHR',b'\x00\x00\x0E\xA3VkPhysicalDeviceVideoMaintenance1FeaturesKHR',b'\x00\x00\x0E\xA4VkPhysicalDeviceVulkan11Features',b'\x00\x00\x0E\xA5VkPhysicalDeviceVulkan11Properties',b'\x00\x00\x0E\xA6VkPhysicalDeviceVulkan12Features',b'\x00\x00\x0E\xA7VkPhysicalDeviceVulkan12Properties',b'\x00\x00\x0E\xA8VkPhysicalDeviceVulkan13Features',b'\x00\x00\x0E\xA9VkPhysicalDeviceVulkan13Properties',b'\x00\x00\x0E\xAAVkPhysicalDeviceVulkanMemoryModelFeatures',b'\x00\x00\x0E\xAAVkPhysicalDeviceVulkanMemoryModelFeaturesKHR',b'\x00\x00\x0E\xABVkPhysicalDeviceWorkgroupMemoryExplicitLayoutFeaturesKHR',b'\x00\x00\x0E\xACVkPhysicalDeviceYcbcr2Plane444FormatsFeaturesEXT',b'\x00\x00\x0E\xADVkPhysicalDeviceYcbcrDegammaFeaturesQCOM',b'\x00\x00\x0E\xAEVkPhysicalDeviceYcbcrImageArraysFeaturesEXT',b'\x00\x00\x0E\xAFVkPhysicalDeviceZeroInitializeWorkgroupMemoryFeatures',b'\x00\x00\x0E\xAFVkPhysicalDeviceZeroInitializeWorkgroupMemoryFeaturesKHR',b'\x00\x00\x02\xB7VkPipeline',b'\x00\x00\x05\xB4VkPipelineBindPoint',b'\x00\x00\x02\x30VkPipelineCache',b'\x00\x00\x0E\xB0VkPipelineCacheCreateFlagBits',b'\x00\x00\x00\x1FVkPipelineCacheCreateFlags',b'\x00\x00\x0E\xB1VkPipelineCacheCreateInfo',b'\x00\x00\x0E\xB2VkPipelineCacheHeaderVersion',b'\x00\x00\x0E\xB3VkPipelineCacheHeaderVersionOne',b'\x00\x00\x0E\xB4VkPipelineColorBlendAdvancedStateCreateInfoEXT',b'\x00\x00\x0E\xB6VkPipelineColorBlendAttachmentState',b'\x00\x00\x0E\xB7VkPipelineColorBlendStateCreateFlagBits',b'\x00\x00\x00\x1FVkPipelineColorBlendStateCreateFlags',b'\x00\x00\x0E\xB9VkPipelineColorBlendStateCreateInfo',b'\x00\x00\x0E\xBAVkPipelineColorWriteCreateInfoEXT',b'\x00\x00\x0E\xBBVkPipelineCompilerControlCreateInfoAMD',b'\x00\x00\x0E\xBCVkPipelineCompilerControlFlagBitsAMD',b'\x00\x00\x00\x1FVkPipelineCompilerControlFlagsAMD',b'\x00\x00\x00\x1FVkPipelineCoverageModulationStateCreateFlagsNV',b'\x00\x00\x0E\xBDVkPipelineCoverageModulationStateCreateInfoNV',b'\x00\x00\x00\x1FVkPipelineCoverageReductionStateCreateFlagsNV',b'\x00\x00\x0E\xBEVkPipelineCoverageReductionStateCreateInfoNV',b'\x00\x00\x00\x1FVkPipelineCoverageToColorStateCreateFlagsNV',b'\x00\x00\x0E\xBFVkPipelineCoverageToColorStateCreateInfoNV',b'\x00\x00\x0E\xC0VkPipelineCreateFlagBits',b'\x00\x00\x01\x43VkPipelineCreateFlagBits2KHR',b'\x00\x00\x00\x1FVkPipelineCreateFlags',b'\x00\x00\x0E\xC1VkPipelineCreateFlags2CreateInfoKHR',b'\x00\x00\x01\x43VkPipelineCreateFlags2KHR',b'\x00\x00\x0E\xC3VkPipelineCreationFeedback',b'\x00\x00\x0E\xC4VkPipelineCreationFeedbackCreateInfo',b'\x00\x00\x0E\xC4VkPipelineCreationFeedbackCreateInfoEXT',b'\x00\x00\x0E\xC3VkPipelineCreationFeedbackEXT',b'\x00\x00\x0E\xC5VkPipelineCreationFeedbackFlagBits',b'\x00\x00\x0E\xC5VkPipelineCreationFeedbackFlagBitsEXT',b'\x00\x00\x00\x1FVkPipelineCreationFeedbackFlags',b'\x00\x00\x00\x1FVkPipelineCreationFeedbackFlagsEXT',b'\x00\x00\x0E\xC6VkPipelineDepthStencilStateCreateFlagBits',b'\x00\x00\x00\x1FVkPipelineDepthStencilStateCreateFlags',b'\x00\x00\x0E\xC8VkPipelineDepthStencilStateCreateInfo',b'\x00\x00\x00\x1FVkPipelineDiscardRectangleStateCreateFlagsEXT',b'\x00\x00\x0E\xC9VkPipelineDiscardRectangleStateCreateInfoEXT',b'\x00\x00\x00\x1FVkPipelineDynamicStateCreateFlags',b'\x00\x00\x0E\xCBVkPipelineDynamicStateCreateInfo',b'\x00\x00\x0E\xCCVkPipelineExecutableInfoKHR',b'\x00\x00\x0E\xCDVkPipelineExecutableInternalRepresentationKHR',b'\x00\x00\x0E\xCEVkPipelineExecutablePropertiesKHR',b'\x00\x00\x0E\xCFVkPipelineExecutableStatisticFormatKHR',b'\x00\x00\x0E\xD0VkPipelineExecutableStatisticKHR',b'\x00\x00\x0E\xD1VkPipelineExecutableStatisticValueKHR',b'\x00\x00\x0E\xD2VkPipelineFragmentShadingRateEnumStateCreateInfoNV',b'\x00\x00\x0E\xD3VkPipelineFragmentShadingRateStateCreateInfoKHR',b'\x00\x00\x0E\xD4VkPipelineIndirectDeviceAddressInfoNV',b'\x00\x00\x0E\xD5VkPipelineInfoEXT',b'\x00\x00\x0E\xD5VkPipelineInfoKHR',b'\x00\x00\x00\x1FVkPipelineInputAssemblyStateCreateFlags',b'\x00\x00\x0E\xD7VkPipelineInputAssemblyStateCreateInfo',b'\x00\x00\x05\xB5VkPipelineLayout',b'\x00\x00\x0E\xD8VkPipelineLayoutCreateFlagBits',b'\x00\x00\x00\x1FVkPipelineLayoutCreateFlags',b'\x00\x00\x0E\xD9VkPipelineLayoutCreateInfo',b'\x00\x00\x0E\xDBVkPipelineLibraryCreateInfoKHR',b'\x00\x00\x00\x1FVkPipelineMultisampleStateCreateFlags',b'\x00\x00\x0E\xDDVkPipelineMultisampleStateCreateInfo',b'\x00\x00\x0E\xDEVkPipelinePropertiesIdentifierEXT',b'\x00\x00\x00\x1FVkPipelineRasterizationConservativeStateCreateFlagsEXT',b'\x00\x00\x0E\xDFVkPipelineRasterizationConservativeStateCreateInfoEXT',b'\x00\x00\x00\x1FVkPipelineRasterizationDepthClipStateCreateFlagsEXT',b'\x00\x00\x0E\xE0VkPipelineRasterizationDepthClipStateCreateInfoEXT',b'\x00\x00\x0E\xE1VkPipelineRasterizationLineStateCreateInfoEXT',b'\x00\x00\x0E\xE2VkPipelineRasterizationProvokingVertexStateCreateInfoEXT',b'\x00\x00\x00\x1FVkPipelineRasterizationStateCreateFlags',b'\x00\x00\x0E\xE4VkPipelineRasterizationStateCreateInfo',b'\x00\x00\x0E\xE5VkPipelineRasterizationStateRasterizationOrderAMD',b'\x00\x00\x00\x1FVkPipelineRasterizationStateStreamCreateFlagsEXT',b'\x00\x00\x0E\xE6VkPipelineRasterizationStateStreamCreateInfoEXT',b'\x00\x00\x0E\xE7VkPipelineRenderingCreateInfo',b'\x00\x00\x0E\xE7VkPipelineRenderingCreateInfoKHR',b'\x00\x00\x0E\xE8VkPipelineRepresentativeFragmentTestStateCreateInfoNV',b'\x00\x00\x0E\xE9VkPipelineRobustnessBufferBehaviorEXT',b'\x00\x00\x0E\xEAVkPipelineRobustnessCreateInfoEXT',b'\x00\x00\x0E\xEBVkPipelineRobustnessImageBehaviorEXT',b'\x00\x00\x0E\xECVkPipelineSampleLocationsStateCreateInfoEXT',b'\x00\x00\x0E\xEDVkPipelineShaderStageCreateFlagBits',b'\x00\x00\x00\x1FVkPipelineShaderStageCreateFlags',b'\x00\x00\x0E\xEFVkPipelineShaderStageCreateInfo',b'\x00\x00\x0E\xF0VkPipelineShaderStageModuleIdentifierCreateInfoEXT',b'\x00\x00\x0E\xF1VkPipelineShaderStageRequiredSubgroupSizeCreateInfo',b'\x00\x00\x0E\xF1VkPipelineShaderStageRequiredSubgroupSizeCreateInfoEXT',b'\x00\x00\x05\xE0VkPipelineStageFlagBits',b'\x00\x00\x01\x43VkPipelineStageFlagBits2',b'\x00\x00\x01\x43VkPipelineStageFlagBits2KHR',b'\x00\x00\x00\x1FVkPipelineStageFlags',b'\x00\x00\x01\x43VkPipelineStageFlags2',b'\x00\x00\x01\x43VkPipelineStageFlags2KHR',b'\x00\x00\x0E\xF2VkPipelineTessellationDomainOriginStateCreateInfo',b'\x00\x00\x0E\xF2VkPipelineTessellationDomainOriginStateCreateInfoKHR',b'\x00\x00\x00\x1FVkPipelineTessellationStateCreateFlags',b'\x00\x00\x0E\xF4VkPipelineTessellationStateCreateInfo',b'\x00\x00\x0E\xF5VkPipelineVertexInputDivisorStateCreateInfoEXT',b'\x00\x00\x0E\xF5VkPipelineVertexInputDivisorStateCreateInfoKHR',b'\x00\x00\x00\x1FVkPipelineVertexInputStateCreateFlags',b'\x00\x00\x0E\xF7VkPipelineVertexInputStateCreateInfo',b'\x00\x00\x0E\xF8VkPipelineViewportCoarseSampleOrderStateCreateInfoNV',b'\x00\x00\x0E\xF9VkPipelineViewportDepthClipControlCreateInfoEXT',b'\x00\x00\x0E\xFAVkPipelineViewportExclusiveScissorStateCreateInfoNV',b'\x00\x00\x0E\xFBVkPipelineViewportShadingRateImageStateCreateInfoNV',b'\x00\x00\x00\x1FVkPipelineViewportStateCreateFlags',b'\x00\x00\x0E\xFDVkPipelineViewportStateCreateInfo',b'\x00\x00\x00\x1FVkPipelineViewportSwizzleStateCreateFlagsNV',b'\x00\x00\x0E\xFEVkPipelineViewportSwizzleStateCreateInfoNV',b'\x00\x00\x0E\xFFVkPipelineViewportWScalingStateCreateInfoNV',b'\x00\x00\x0F\x00VkPointClippingBehavior',b'\x00\x00\x0F\x00VkPointClippingBehaviorKHR',b'\x00\x00\x05\xEDVkPolygonMode',b'\x00\x00\x0F\x01VkPresentGravityFlagBitsEXT',b'\x00\x00\x00\x1FVkPresentGravityFlagsEXT',b'\x00\x00\x0F\x02VkPresentIdKHR',b'\x00\x00\x0F\x03VkPresentInfoKHR',b'\x00\x00\x0F\x05VkPresentModeKHR',b'\x00\x00\x0F\x07VkPresentRegionKHR',b'\x00\x00\x0F\x08VkPresentRegionsKHR',b'\x00\x00\x0F\x09VkPresentScalingFlagBitsEXT',b'\x00\x00\x00\x1FVkPresentScalingFlagsEXT',b'\x00\x00\x0F\x0BVkPresentTimeGOOGLE',b'\x00\x00\x0F\x0CVkPresentTimesInfoGOOGLE',b'\x00\x00\x05\xF1VkPrimitiveTopology',b'\x00\x00\x01\x44VkPrivateDataSlot',b'\x00\x00\x00\x1FVkPrivateDataSlotCreateFlags',b'\x00\x00\x00\x1FVkPrivateDataSlotCreateFlagsEXT',b'\x00\x00\x0F\x0DVkPrivateDataSlotCreateInfo',b'\x00\x00\x0F\x0DVkPrivateDataSlotCreateInfoEXT',b'\x00\x00\x01\x44VkPrivateDataSlotEXT',b'\x00\x00\x0F\x0EVkProtectedSubmitInfo',b'\x00\x00\x05\xF5VkProvokingVertexModeEXT',b'\x00\x00\x0F\x10VkPushConstantRange',b'\x00\x00\x0F\x11VkPushConstantsInfoKHR',b'\x00\x00\x0F\x12VkPushDescriptorSetInfoKHR',b'\x00\x00\x0F\x13VkPushDescriptorSetWithTemplateInfoKHR',b'\x00\x00\x0F\x14VkQueryControlFlagBits',b'\x00\x00\x00\x1FVkQueryControlFlags',b'\x00\x00\x0F\x15VkQueryLowLatencySupportNV',b'\x00\x00\x0F\x16VkQueryPipelineStatisticFlagBits',b'\x00\x00\x00\x1FVkQueryPipelineStatisticFlags',b'\x00\x00\x02\xCCVkQueryPool',b'\x00\x00\x00\x1FVkQueryPoolCreateFlags',b'\x00\x00\x0F\x17VkQueryPoolCreateInfo',b'\x00\x00\x0F\x19VkQueryPoolCreateInfoINTEL',b'\x00\x00\x0F\x18VkQueryPoolPerformanceCreateInfoKHR',b'\x00\x00\x0F\x19VkQueryPoolPerformanceQueryCreateInfoINTEL',b'\x00\x00\x0F\x1AVkQueryPoolSamplingModeINTEL',b'\x00\x00\x0F\x1BVkQueryPoolVideoEncodeFeedbackCreateInfoKHR',b'\x00\x00\x0F\x1CVkQueryResultFlagBits',b'\x00\x00\x00\x1FVkQueryResultFlags',b'\x00\x00\x0F\x1DVkQueryResultStatusKHR',b'\x00\x00\x03\x6BVkQueryType',b'\x00\x00\x04\xA9VkQueue',b'\x00\x00\x0F\x1EVkQueueFamilyCheckpointProperties2NV',b'\x00\x00\x0F\x1FVkQueueFamilyCheckpointPropertiesNV',b'\x00\x00\x0F\x20VkQueueFamilyGlobalPriorityPropertiesEXT',b'\x00\x00\x0F\x20VkQueueFamilyGlobalPriorityPropertiesKHR',b'\x00\x00\x0F\x22VkQueueFamilyProperties',b'\x00\x00\x0F\x21VkQueueFamilyProperties2',b'\x00\x00\x0F\x21VkQueueFamilyProperties2KHR',b'\x00\x00\x0F\x23VkQueueFamilyQueryResultStatusPropertiesKHR',b'\x00\x00\x0F\x24VkQueueFamilyVideoPropertiesKHR',b'\x00\x00\x0F\x25VkQueueFlagBits',b'\x00\x00\x00\x1FVkQueueFlags',b'\x00\x00\x0F\x26VkQueueGlobalPriorityEXT',b'\x00\x00\x0F\x26VkQueueGlobalPriorityKHR',b'\x00\x00\x0F\x29VkRasterizationOrderAMD',b'\x00\x00\x0F\x2AVkRayTracingInvocationReorderModeNV',b'\x00\x00\x0F\x2BVkRayTracingPipelineCreateInfoKHR',b'\x00\x00\x0F\x2CVkRayTracingPipelineCreateInfoNV',b'\x00\x00\x0F\x2EVkRayTracingPipelineInterfaceCreateInfoKHR',b'\x00\x00\x0F\x30VkRayTracingShaderGroupCreateInfoKHR',b'\x00\x00\x0F\x32VkRayTracingShaderGroupCreateInfoNV',b'\x00\x00\x0F\x33VkRayTracingShaderGroupTypeKHR',b'\x00\x00\x0F\x33VkRayTracingShaderGroupTypeNV',b'\x00\x00\x0F\x34VkRect2D',b'\x00\x00\x0F\x36VkRectLayerKHR',b'\x00\x00\x0F\x37VkRefreshCycleDurationGOOGLE',b'\x00\x00\x0F\x38VkReleaseSwapchainImagesInfoEXT',b'\x00\x00\x00\x27VkRemoteAddressNV',b'\x00\x00\x02\xD6VkRenderPass',b'\x00\x00\x0F\x39VkRenderPassAttachmentBeginInfo',b'\x00\x00\x0F\x39VkRenderPassAttachmentBeginInfoKHR',b'\x00\x00\x0F\x3AVkRenderPassBeginInfo',b'\x00\x00\x0F\x3BVkRenderPassCreateFlagBits',b'\x00\x00\x00\x1FVkRenderPassCreateFlags',b'\x00\x00\x0F\x3DVkRenderPassCreateInfo',b'\x00\x00\x0F\x3CVkRenderPassCreateInfo2',b'\x00\x00\x0F\x3CVkRenderPassCreateInfo2KHR',b'\x00\x00\x0F\x3EVkRenderPassCreationControlEXT',b'\x00\x00\x0F\x3FVkRenderPassCreationFeedbackCreateInfoEXT',b'\x00\x00\x0F\x41VkRenderPassCreationFeedbackInfoEXT',b'\x00\x00\x0F\x42VkRenderPassFragmentDensityMapCreateInfoEXT',b'\x00\x00\x0F\x43VkRenderPassInputAttachmentAspectCreateInfo',b'\x00\x00\x0F\x43VkRenderPassInputAttachmentAspectCreateInfoKHR',b'\x00\x00\x0F\x44VkRenderPassMultiviewCreateInfo',b'\x00\x00\x0F\x44VkRenderPassMultiviewCreateInfoKHR',b'\x00\x00\x0F\x45VkRenderPassSampleLocationsBeginInfoEXT',b'\x00\x00\x0F\x46VkRenderPassStripeBeginInfoARM',b'\x00\x00\x0F\x48VkRenderPassStripeInfoARM',b'\x00\x00\x0F\x49VkRenderPassStripeSubmitInfoARM',b'\x00\x00\x0F\x4AVkRenderPassSubpassFeedbackCreateInfoEXT',b'\x00\x00\x0F\x4CVkRenderPassSubpassFeedbackInfoEXT',b'\x00\x00\x0F\x4DVkRenderPassTransformBeginInfoQCOM',b'\x00\x00\x0F\x4EVkRenderingAreaInfoKHR',b'\x00\x00\x0F\x50VkRenderingAttachmentInfo',b'\x00\x00\x0F\x50VkRenderingAttachmentInfoKHR',b'\x00\x00\x0F\x51VkRenderingFlagBits',b'\x00\x00\x0F\x51VkRenderingFlagBitsKHR',b'\x00\x00\x00\x1FVkRenderingFlags',b'\x00\x00\x00\x1FVkRenderingFlagsKHR',b'\x00\x00\x0F\x52VkRenderingFragmentDensityMapAttachmentInfoEXT',b'\x00\x00\x0F\x53VkRenderingFragmentShadingRateAttachmentInfoKHR',b'\x00\x00\x0F\x54VkRenderingInfo',b'\x00\x00\x0F\x54VkRenderingInfoKHR',b'\x00\x00\x0F\x55VkResolveImageInfo2',b'\x00\x00\x0F\x55VkResolveImageInfo2KHR',b'\x00\x00\x0F\x56VkResolveModeFlagBits',b'\x00\x00\x0F\x56VkResolveModeFlagBitsKHR',b'\x00\x00\x00\x1FVkResolveModeFlags',b'\x00\x00\x00\x1FVkResolveModeFlagsKHR',b'\x00\x00\x10\x36VkResult',b'\x00\x00\x10\x37VkSRTDataNV',b'\x00\x00\x06\x17VkSampleCountFlagBits',b'\x00\x00\x00\x1FVkSampleCountFlags',b'\x00\x00\x10\x3AVkSampleLocationEXT',b'\x00\x00\x10\x3BVkSampleLocationsInfoEXT',b'\x00\x00\x00\x1FVkSampleMask',b'\x00\x00\x09\xE5VkSampler',b'\x00\x00\x10\x3CVkSamplerAddressMode',b'\x00\x00\x10\x3DVkSamplerBlockMatchWindowCreateInfoQCOM',b'\x00\x00\x10\x3EVkSamplerBorderColorComponentMappingCreateInfoEXT',b'\x00\x00\x10\x3FVkSamplerCaptureDescriptorDataInfoEXT',b'\x00\x00\x10\x40VkSamplerCreateFlagBits',b'\x00\x00\x00\x1FVkSamplerCreateFlags',b'\x00\x00\x10\x41VkSamplerCreateInfo',b'\x00\x00\x10\x42VkSamplerCubicWeightsCreateInfoQCOM',b'\x00\x00\x10\x43VkSamplerCustomBorderColorCreateInfoEXT',b'\x00\x00\x10\x44VkSamplerMipmapMode',b'\x00\x00\x10\x45VkSamplerReductionMode',b'\x00\x00\x10\x46VkSamplerReductionModeCreateInfo',b'\x00\x00\x10\x46VkSamplerReductionModeCreateInfoEXT',b'\x00\x00\x10\x45VkSamplerReductionModeEXT',b'\x00\x00\x09\xE0VkSamplerYcbcrConversion',b'\x00\x00\x10\x47VkSamplerYcbcrConversionCreateInfo',b'\x00\x00\x10\x47VkSamplerYcbcrConversionCreateInfoKHR',b'\x00\x00\x10\x48VkSamplerYcbcrConversionImageFormatProperties',b'\x00\x00\x10\x48VkSamplerYcbcrConversionImageFormatPropertiesKHR',b'\x00\x00\x10\x49VkSamplerYcbcrConversionInfo',b'\x00\x00\x10\x49VkSamplerYcbcrConversionInfoKHR',b'\x00\x00\x09\xE0VkSamplerYcbcrConversionKHR',b'\x00\x00\x10\x4AVkSamplerYcbcrConversionYcbcrDegammaCreateInfoQCOM',b'\x00\x00\x10\x4BVkSamplerYcbcrModelConversion',b'\x00\x00\x10\x4BVkSamplerYcbcrModelConversionKHR',b'\x00\x00\x10\x4CVkSamplerYcbcrRange',b'\x00\x00\x10\x4CVkSamplerYcbcrRangeKHR',b'\x00\x00\x10\x4DVkScopeKHR',b'\x00\x00\x10\x4DVkScopeNV',b'\x00\x00\x02\xDBVkSemaphore',b'\x00\x00\x00\x1FVkSemaphoreCreateFlags',b'\x00\x00\x10\x4EVkSemaphoreCreateInfo',b'\x00\x00\x10\x4FVkSemaphoreGetFdInfoKHR',b'\x00\x00\x10\x50VkSemaphoreGetWin32HandleInfoKHR',b'\x00\x00\x10\x51VkSemaphoreImportFlagBits',b'\x00\x00\x10\x51VkSemaphoreImportFlagBitsKHR',b'\x00\x00\x00\x1FVkSemaphoreImportFlags',b'\x00\x00\x00\x1FVkSemaphoreImportFlagsKHR',b'\x00\x00\x10\x52VkSemaphoreSignalInfo',b'\x00\x00\x10\x52VkSemaphoreSignalInfoKHR',b'\x00\x00\x10\x54VkSemaphoreSubmitInfo',b'\x00\x00\x10\x54VkSemaphoreSubmitInfoKHR',b'\x00\x00\x10\x55VkSemaphoreType',b'\x00\x00\x10\x56VkSemaphoreTypeCreateInfo',b'\x00\x00\x10\x56VkSemaphoreTypeCreateInfoKHR',b'\x00\x00\x10\x55VkSemaphoreTypeKHR',b'\x00\x00\x10\x57VkSemaphoreWaitFlagBits',b'\x00\x00\x10\x57VkSemaphoreWaitFlagBitsKHR',b'\x00\x00\x00\x1FVkSemaphoreWaitFlags',b'\x00\x00\x00\x1FVkSemaphoreWaitFlagsKHR',b'\x00\x00\x10\x58VkSemaphoreWaitInfo',b'\x00\x00\x10\x58VkSemaphoreWaitInfoKHR',b'\x00\x00\x10\x59VkSetDescriptorBufferOffsetsInfoEXT',b'\x00\x00\x10\x5AVkSetLatencyMarkerInfoNV',b'\x00\x00\x10\x5BVkSetStateFlagsIndirectCommandNV',b'\x00\x00\x10\x5CVkShaderCodeTypeEXT',b'\x00\x00\x10\x5DVkShaderCorePropertiesFlagBitsAMD',b'\x00\x00\x00\x1FVkShaderCorePropertiesFlagsAMD',b'\x00\x00\x10\x5EVkShaderCreateFlagBitsEXT',b'\x00\x00\x00\x1FVkShaderCreateFlagsEXT',b'\x00\x00\x10\x5FVkShaderCreateInfoEXT',b'\x00\x00\x02\xE0VkShaderEXT',b'\x00\x00\x10\x60VkShaderFloatControlsIndependence',b'\x00\x00\x10\x60VkShaderFloatControlsIndependenceKHR',b'\x00\x00\x05\x0DVkShaderGroupShaderKHR',b'\x00\x00\x02\xB9VkShaderInfoTypeAMD',b'\x00\x00\x09\xF4VkShaderModule',b'\x00\x00\x00\x1FVkShaderModuleCreateFlags',b'\x00\x00\x10\x61VkShaderModuleCreateInfo',b'\x00\x00\x10\x62VkShaderModuleIdentifierEXT',b'\x00\x00\x10\x63VkShaderModuleValidationCacheCreateInfoEXT',b'\x00\x00\x0E\xF1VkShaderRequiredSubgroupSizeCreateInfoEXT',b'\x00\x00\x10\x64VkShaderResourceUsageAMD',b'\x00\x00\x02\xB8VkShaderStageFlagBits',b'\x00\x00\x00\x1FVkShaderStageFlags',b'\x00\x00\x10\x65VkShaderStatisticsInfoAMD',b'\x00\x00\x10\x67VkShadingRatePaletteEntryNV',b'\x00\x00\x10\x68VkShadingRatePaletteNV',b'\x00\x00\x10\x69VkSharedPresentSurfaceCapabilitiesKHR',b'\x00\x00\x10\x6AVkSharingMode',b'\x00\x00\x10\x6CVkSparseBufferMemoryBindInfo',b'\x00\x00\x10\x6DVkSparseImageFormatFlagBits',b'\x00\x00\x00\x1FVkSparseImageFormatFlags',b'\x00\x00\x10\x6FVkSparseImageFormatProperties',b'\x00\x00\x10\x6EVkSparseImageFormatProperties2',b'\x00\x00\x10\x6EVkSparseImageFormatProperties2KHR',b'\x00\x00\x10\x71VkSparseImageMemoryBind',b'\x00\x00\x10\x73VkSparseImageMemoryBindInfo',b'\x00\x00\x10\x75VkSparseImageMemoryRequirements',b'\x00\x00\x10\x74VkSparseImageMemoryRequirements2',b'\x00\x00\x10\x74VkSparseImageMemoryRequirements2KHR',b'\x00\x00\x10\x77VkSparseImageOpaqueMemoryBindInfo',b'\x00\x00\x10\x79VkSparseMemoryBind',b'\x00\x00\x10\x7AVkSparseMemoryBindFlagBits',b'\x00\x00\x00\x1FVkSparseMemoryBindFlags',b'\x00\x00\x10\x7CVkSpecializationInfo',b'\x00\x00\x10\x7EVkSpecializationMapEntry',b'\x00\x00\x10\x7FVkStencilFaceFlagBits',b'\x00\x00\x00\x1FVkStencilFaceFlags',b'\x00\x00\x07\x8AVkStencilOp',b'\x00\x00\x10\x80VkStencilOpState',b'\x00\x00\x10\x81VkStridedDeviceAddressRegionKHR',b'\x00\x00\x10\x82VkStructureType',b'\x00\x00\x10\x83VkSubgroupFeatureFlagBits',b'\x00\x00\x00\x1FVkSubgroupFeatureFlags',b'\x00\x00\x10\x84VkSubmitFlagBits',b'\x00\x00\x10\x84VkSubmitFlagBitsKHR',b'\x00\x00\x00\x1FVkSubmitFlags',b'\x00\x00\x00\x1FVkSubmitFlagsKHR',b'\x00\x00\x10\x86VkSubmitInfo',b'\x00\x00\x10\x85VkSubmitInfo2',b'\x00\x00\x10\x85VkSubmitInfo2KHR',b'\x00\x00\x10\x87VkSubpassBeginInfo',b'\x00\x00\x10\x87VkSubpassBeginInfoKHR',b'\x00\x00\x06\x0BVkSubpassContents',b'\x00\x00\x10\x8BVkSubpassDependency',b'\x00\x00\x10\x8AVkSubpassDependency2',b'\x00\x00\x10\x8AVkSubpassDependency2KHR',b'\x00\x00\x10\x8FVkSubpassDescription',b'\x00\x00\x10\x8EVkSubpassDescription2',b'\x00\x00\x10\x8EVkSubpassDescription2KHR',b'\x00\x00\x10\x90VkSubpassDescriptionDepthStencilResolve',b'\x00\x00\x10\x90VkSubpassDescriptionDepthStencilResolveKHR',b'\x00\x00\x10\x91VkSubpassDescriptionFlagBits',b'\x00\x00\x00\x1FVkSubpassDescriptionFlags',b'\x00\x00\x10\x92VkSubpassEndInfo',b'\x00\x00\x10\x92VkSubpassEndInfoKHR',b'\x00\x00\x10\x93VkSubpassFragmentDensityMapOffsetEndInfoQCOM',b'\x00\x00\x10\x94VkSubpassMergeStatusEXT',b'\x00\x00\x10\x95VkSubpassResolvePerformanceQueryEXT',b'\x00\x00\x10\x97VkSubpassSampleLocationsEXT',b'\x00\x00\x10\x98VkSubpassShadingPipelineCreateInfoHUAWEI',b'\x00\x00\x10\x99VkSubresourceHostMemcpySizeEXT',b'\x00\x00\x10\x9CVkSubresourceLayout',b'\x00\x00\x10\x9BVkSubresourceLayout2EXT',b'\x00\x00\x10\x9BVkSubresourceLayout2KHR',b'\x00\x00\x10\x9DVkSurfaceCapabilities2EXT',b'\x00\x00\x10\x9EVkSurfaceCapabilities2KHR',b'\x00\x00\x10\x9FVkSurfaceCapabilitiesFullScreenExclusiveEXT',b'\x00\x00\x10\xA0VkSurfaceCapabilitiesKHR',b'\x00\x00\x10\xA1VkSurfaceCapabilitiesPresentBarrierNV',b'\x00\x00\x02\xFFVkSurfaceCounterFlagBitsEXT',b'\x00\x00\x00\x1FVkSurfaceCounterFlagsEXT',b'\x00\x00\x10\xA2VkSurfaceFormat2KHR',b'\x00\x00\x10\xA3VkSurfaceFormatKHR',b'\x00\x00\x10\xA4VkSurfaceFullScreenExclusiveInfoEXT',b'\x00\x00\x10\xA5VkSurfaceFullScreenExclusiveWin32InfoEXT',b'\x00\x00\x02\xE6VkSurfaceKHR',b'\x00\x00\x10\xA6VkSurfacePresentModeCompatibilityEXT',b'\x00\x00\x10\xA7VkSurfacePresentModeEXT',b'\x00\x00\x10\xA8VkSurfacePresentScalingCapabilitiesEXT',b'\x00\x00\x10\xA9VkSurfaceProtectedCapabilitiesKHR',b'\x00\x00\x10\xAAVkSurfaceTransformFlagBitsKHR',b'\x00\x00\x00\x1FVkSurfaceTransformFlagsKHR',b'\x00\x00\x10\xABVkSwapchainCounterCreateInfoEXT',b'\x00\x00\x10\xACVkSwapchainCreateFlagBitsKHR',b'\x00\x00\x00\x1FVkSwapchainCreateFlagsKHR',b'\x00\x00\x10\xADVkSwapchainCreateInfoKHR',b'\x00\x00\x10\xAEVkSwapchainDisplayNativeHdrCreateInfoAMD',b'\x00\x00\x02\xEBVkSwapchainKHR',b'\x00\x00\x10\xAFVkSwapchainLatencyCreateInfoNV',b'\x00\x00\x10\xB0VkSwapchainPresentBarrierCreateInfoNV',b'\x00\x00\x10\xB1VkSwapchainPresentFenceInfoEXT',b'\x00\x00\x10\xB2VkSwapchainPresentModeInfoEXT',b'\x00\x00\x10\xB3VkSwapchainPresentModesCreateInfoEXT',b'\x00\x00\x10\xB4VkSwapchainPresentScalingCreateInfoEXT',b'\x00\x00\x05\x13VkSystemAllocationScope',b'\x00\x00\x06\x47VkTessellationDomainOrigin',b'\x00\x00\x06\x47VkTessellationDomainOriginKHR',b'\x00\x00\x10\xB5VkTextureLODGatherFormatPropertiesAMD',b'\x00\x00\x10\xB6VkTilePropertiesQCOM',b'\x00\x00\x10\xB7VkTimeDomainEXT',b'\x00\x00\x10\xB7VkTimeDomainKHR',b'\x00\x00\x10\xB8VkTimelineSemaphoreSubmitInfo',b'\x00\x00\x10\xB8VkTimelineSemaphoreSubmitInfoKHR',b'\x00\x00\x10\xB9VkToolPurposeFlagBits',b'\x00\x00\x10\xB9VkToolPurposeFlagBitsEXT',b'\x00\x00\x00\x1FVkToolPurposeFlags',b'\x00\x00\x00\x1FVkToolPurposeFlagsEXT',b'\x00\x00\x10\xBAVkTraceRaysIndirectCommand2KHR',b'\x00\x00\x10\xBBVkTraceRaysIndirectCommandKHR',b'\x00\x00\x10\xBCVkTransformMatrixKHR',b'\x00\x00\x10\xBCVkTransformMatrixNV',b'\x00\x00\x00\x1FVkValidationCacheCreateFlagsEXT',b'\x00\x00\x10\xBDVkValidationCacheCreateInfoEXT',b'\x00\x00\x03\x1EVkValidationCacheEXT',b'\x00\x00\x10\xBEVkValidationCacheHeaderVersionEXT',b'\x00\x00\x10\xC0VkValidationCheckEXT',b'\x00\x00\x10\xC2VkValidationFeatureDisableEXT',b'\x00\x00\x10\xC4VkValidationFeatureEnableEXT',b'\x00\x00\x10\xC5VkValidationFeaturesEXT',b'\x00\x00\x10\xC6VkValidationFlagsEXT',b'\x00\x00\x10\xC7VkVendorId',b'\x00\x00\x10\xCAVkVertexInputAttributeDescription',b'\x00\x00\x10\xC9VkVertexInputAttributeDescription2EXT',b'\x00\x00\x10\xCDVkVertexInputBindingDescription',b'\x00\x00\x10\xCCVkVertexInputBindingDescription2EXT',b'\x00\x00\x10\xCFVkVertexInputBindingDivisorDescriptionEXT',b'\x00\x00\x10\xCFVkVertexInputBindingDivisorDescriptionKHR',b'\x00\x00\x10\xD0VkVertexInputRate',b'\x00\x00\x00\x1FVkVideoBeginCodingFlagsKHR',b'\x00\x00\x10\xD1VkVideoBeginCodingInfoKHR',b'\x00\x00\x10\xD2VkVideoCapabilitiesKHR',b'\x00\x00\x10\xD3VkVideoCapabilityFlagBitsKHR',b'\x00\x00\x00\x1FVkVideoCapabilityFlagsKHR',b'\x00\x00\x10\xD4VkVideoChromaSubsamplingFlagBitsKHR',b'\x00\x00\x00\x1FVkVideoChromaSubsamplingFlagsKHR',b'\x00\x00\x10\xD5VkVideoCodecOperationFlagBitsKHR',b'\x00\x00\x00\x1FVkVideoCodecOperationFlagsKHR',b'\x00\x00\x10\xD6VkVideoCodingControlFlagBitsKHR',b'\x00\x00\x00\x1FVkVideoCodingControlFlagsKHR',b'\x00\x00\x10\xD7VkVideoCodingControlInfoKHR',b'\x00\x00\x10\xD8VkVideoComponentBitDepthFlagBitsKHR',b'\x00\x00\x00\x1FVkVideoComponentBitDepthFlagsKHR',b'\x00\x00\x10\xD9VkVideoDecodeCapabilitiesKHR',b'\x00\x00\x10\xDAVkVideoDecodeCapabilityFlagBitsKHR',b'\x00\x00\x00\x1FVkVideoDecodeCapabilityFlagsKHR',b'\x00\x00\x00\x1FVkVideoDecodeFlagsKHR',b'\x00\x00\x10\xDBVkVideoDecodeH264CapabilitiesKHR',b'\x00\x00\x10\xDCVkVideoDecodeH264DpbSlotInfoKHR',b'\x00\x00\x10\xDDVkVideoDecodeH264PictureInfoKHR',b'\x00\x00\x10\xDEVkVideoDecodeH264PictureLayoutFlagBitsKHR',b'\x00\x00\x00\x1FVkVideoDecodeH264PictureLayoutFlagsKHR',b'\x00\x00\x10\xDFVkVideoDecodeH264ProfileInfoKHR',b'\x00\x00\x10\xE1VkVideoDecodeH264SessionParametersAddInfoKHR',b'\x00\x00\x10\xE2VkVideoDecodeH264SessionParametersCreateInfoKHR',b'\x00\x00\x10\xE3VkVideoDecodeH265CapabilitiesKHR',b'\x00\x00\x10\xE4VkVideoDecodeH265DpbSlotInfoKHR',b'\x00\x00\x10\xE5VkVideoDecodeH265PictureInfoKHR',b'\x00\x00\x10\xE6VkVideoDecodeH265ProfileInfoKHR',b'\x00\x00\x10\xE8VkVideoDecodeH265SessionParametersAddInfoKHR',b'\x00\x00\x10\xE9VkVideoDecodeH265SessionParametersCreateInfoKHR',b'\x00\x00\x10\xEAVkVideoDecodeInfoKHR',b'\x00\x00\x10\xEBVkVideoDecodeUsageFlagBitsKHR',b'\x00\x00\x00\x1FVkVideoDecodeUsageFlagsKHR',b'\x00\x00\x10\xECVkVideoDecodeUsageInfoKHR',b'\x00\x00\x10\xEDVkVideoEncodeCapabilitiesKHR',b'\x00\x00\x10\xEEVkVideoEncodeCapabilityFlagBitsKHR',b'\x00\x00\x00\x1FVkVideoEncodeCapabilityFlagsKHR',b'\x00\x00\x10\xEFVkVideoEncodeContentFlagBitsKHR',b'\x00\x00\x00\x1FVkVideoEncodeContentFlagsKHR',b'\x00\x00\x10\xF0VkVideoEncodeFeedbackFlagBitsKHR',b'\x00\x00\x00\x1FVkVideoEncodeFeedbackFlagsKHR',b'\x00\x00\x00\x1FVkVideoEncodeFlagsKHR',b'\x00\x00\x10\xF1VkVideoEncodeH264CapabilitiesKHR',b'\x00\x00\x10\xF2VkVideoEncodeH264CapabilityFlagBitsKHR',b'\x00\x00\x00\x1FVkVideoEncodeH264CapabilityFlagsKHR',b'\x00\x00\x10\xF3VkVideoEncodeH264DpbSlotInfoKHR',b'\x00\x00\x10\xF4VkVideoEncodeH264FrameSizeKHR',b'\x00\x00\x10\xF5VkVideoEncodeH264GopRemainingFrameInfoKHR',b'\x00\x00\x10\xF7VkVideoEncodeH264NaluSliceInfoKHR',b'\x00\x00\x10\xF8VkVideoEncodeH264PictureInfoKHR',b'\x00\x00\x10\xF9VkVideoEncodeH264ProfileInfoKHR',b'\x00\x00\x10\xFAVkVideoEncodeH264QpKHR',b'\x00\x00\x10\xFBVkVideoEncodeH264QualityLevelPropertiesKHR',b'\x00\x00\x10\xFCVkVideoEncodeH264RateControlFlagBitsKHR',b'\x00\x00\x00\x1FVkVideoEncodeH264RateControlFlagsKHR',b'\x00\x00\x10\xFDVkVideoEncodeH264RateControlInfoKHR',b'\x00\x00\x10\xFEVkVideoEncodeH264RateControlLayerInfoKHR',b'\x00\x00\x10\xFFVkVideoEncodeH264SessionCreateInfoKHR',b'\x00\x00\x11\x01VkVideoEncodeH264SessionParametersAddInfoKHR',b'\x00\x00\x11\x02VkVideoEncodeH264SessionParametersCreateInfoKHR',b'\x00\x00\x11\x03VkVideoEncodeH264SessionParametersFeedbackInfoKHR',b'\x00\x00\x11\x04VkVideoEncodeH264SessionParametersGetInfoKHR',b'\x00\x00\x11\x05VkVideoEncodeH264StdFlagBitsKHR',b'\x00\x00\x00\x1FVkVideoEncodeH264StdFlagsKHR',b'\x00\x00\x11\x06VkVideoEncodeH265CapabilitiesKHR',b'\x00\x00\x11\x07VkVideoEncodeH265CapabilityFlagBitsKHR',b'\x00\x00\x00\x1FVkVideoEncodeH265CapabilityFlagsKHR',b'\x00\x00\x11\x08VkVideoEncodeH265CtbSizeFlagBitsKHR',b'\x00\x00\x00\x1FVkVideoEncodeH265CtbSizeFlagsKHR',b'\x00\x00\x11\x09VkVideoEncodeH265DpbSlotInfoKHR',b'\x00\x00\x11\x0AVkVideoEncodeH265FrameSizeKHR',b'\x00\x00\x11\x0BVkVideoEncodeH265GopRemainingFrameInfoKHR',b'\x00\x00\x11\x0DVkVideoEncodeH265NaluSliceSegmentInfoKHR',b'\x00\x00\x11\x0EVkVideoEncodeH265PictureInfoKHR',b'\x00\x00\x11\x0FVkVideoEncodeH265ProfileInfoKHR',b'\x00\x00\x11\x10VkVideoEncodeH265QpKHR',b'\x00\x00\x11\x11VkVideoEncodeH265QualityLevelPropertiesKHR',b'\x00\x00\x11\x12VkVideoEncodeH265RateControlFlagBitsKHR',b'\x00\x00\x00\x1FVkVideoEncodeH265RateControlFlagsKHR',b'\x00\x00\x11\x13VkVideoEncodeH265RateControlInfoKHR',b'\x00\x00\x11\x14VkVideoEncodeH265RateControlLayerInfoKHR',b'\x00\x00\x11\x15VkVideoEncodeH265SessionCreateInfoKHR',b'\x00\x00\x11\x17VkVideoEncodeH265SessionParametersAddInfoKHR',b'\x00\x00\x11\x18VkVideoEncodeH265SessionParametersCreateInfoKHR',b'\x00\x00\x11\x19VkVideoEncodeH265SessionParametersFeedbackInfoKHR',b'\x00\x00\x11\x1AVkVideoEncodeH265SessionParametersGetInfoKHR',b'\x00\x00\x11\x1BVkVideoEncodeH265StdFlagBitsKHR',b'\x00\x00\x00\x1FVkVideoEncodeH265StdFlagsKHR',b'\x00\x00\x11\x1CVkVideoEncodeH265TransformBlockSizeFlagBitsKHR',b'\x00\x00\x00\x1FVkVideoEncodeH265TransformBlockSizeFlagsKHR',b'\x00\x00\x11\x1DVkVideoEncodeInfoKHR',b'\x00\x00\x11\x1EVkVideoEncodeQualityLevelInfoKHR',b'\x00\x00\x11\x1FVkVideoEncodeQualityLevelPropertiesKHR',b'\x00\x00\x00\x1FVkVideoEncodeRateControlFlagsKHR',b'\x00\x00\x11\x20VkVideoEncodeRateControlInfoKHR',b'\x00\x00\x11\x22VkVideoEncodeRateControlLayerInfoKHR',b'\x00\x00\x11\x23VkVideoEncodeRateControlModeFlagBitsKHR',b'\x00\x00\x00\x1FVkVideoEncodeRateControlModeFlagsKHR',b'\x00\x00\x11\x24VkVideoEncodeSessionParametersFeedbackInfoKHR',b'\x00\x00\x11\x25VkVideoEncodeSessionParametersGetInfoKHR',b'\x00\x00\x11\x26VkVideoEncodeTuningModeKHR',b'\x00\x00\x11\x27VkVideoEncodeUsageFlagBitsKHR',b'\x00\x00\x00\x1FVkVideoEncodeUsageFlagsKHR',b'\x00\x00\x11\x28VkVideoEncodeUsageInfoKHR',b'\x00\x00\x00\x1FVkVideoEndCodingFlagsKHR',b'\x00\x00\x11\x29VkVideoEndCodingInfoKHR',b'\x00\x00\x11\x2AVkVideoFormatPropertiesKHR',b'\x00\x00\x11\x2BVkVideoInlineQueryInfoKHR',b'\x00\x00\x11\x2DVkVideoPictureResourceInfoKHR',b'\x00\x00\x11\x2EVkVideoProfileInfoKHR',b'\x00\x00\x11\x2FVkVideoProfileListInfoKHR',b'\x00\x00\x11\x31VkVideoReferenceSlotInfoKHR',b'\x00\x00\x11\x32VkVideoSessionCreateFlagBitsKHR',b'\x00\x00\x00\x1FVkVideoSessionCreateFlagsKHR',b'\x00\x00\x11\x33VkVideoSessionCreateInfoKHR',b'\x00\x00\x03\x2AVkVideoSessionKHR',b'\x00\x00\x11\x34VkVideoSessionMemoryRequirementsKHR',b'\x00\x00\x00\x1FVkVideoSessionParametersCreateFlagsKHR',b'\x00\x00\x11\x35VkVideoSessionParametersCreateInfoKHR',b'\x00\x00\x03\x36VkVideoSessionParametersKHR',b'\x00\x00\x11\x36VkVideoSessionParametersUpdateInfoKHR',b'\x00\x00\x11\x37VkViewport',b'\x00\x00\x11\x38VkViewportCoordinateSwizzleNV',b'\x00\x00\x11\x39VkViewportSwizzleNV',b'\x00\x00\x11\x3AVkViewportWScalingNV',b'\x00\x00\x00\x1FVkWaylandSurfaceCreateFlagsKHR',b'\x00\x00\x11\x3BVkWaylandSurfaceCreateInfoKHR',b'\x00\x00\x11\x3CVkWin32KeyedMutexAcquireReleaseInfoKHR',b'\x00\x00\x11\x3DVkWin32KeyedMutexAcquireReleaseInfoNV',b'\x00\x00\x00\x1FVkWin32SurfaceCreateFlagsKHR',b'\x00\x00\x11\x3EVkWin32SurfaceCreateInfoKHR',b'\x00\x00\x11\x3FVkWriteDescriptorSet',b'\x00\x00\x11\x40VkWriteDescriptorSetAccelerationStructureKHR',b'\x00\x00\x11\x41VkWriteDescriptorSetAccelerationStructureNV',b'\x00\x00\x11\x42VkWriteDescriptorSetInlineUniformBlock',b'\x00\x00\x11\x42VkWriteDescriptorSetInlineUniformBlockEXT',b'\x00\x00\x11\x43VkXYColorEXT',b'\x00\x00\x00\x1FVkXcbSurfaceCreateFlagsKHR',b'\x00\x00\x11\x44VkXcbSurfaceCreateInfoKHR',b'\x00\x00\x00\x1FVkXlibSurfaceCreateFlagsKHR',b'\x00\x00\x11\x45VkXlibSurfaceCreateInfoKHR',b'\x00\x00\x12\xF6WCHAR',b'\x00\x00\x04\xE2Window',b'\x00\x00\x04\xE2XID',b'\x00\x00\x00\xC2va_list',b'\x00\x00\x12\xF7xcb_connection_t',b'\x00\x00\x00\x1Fxcb_visualid_t',b'\x00\x00\x00\x1Fxcb_window_t'),
+)
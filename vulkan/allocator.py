@@ -0,0 +1,387 @@
+"""Device memory suballocation
+
+    allocator = Allocator(device, physical_device)
+    allocation = allocator.bind_buffer(
+        buffer, VK_MEMORY_PROPERTY_DEVICE_LOCAL_BIT)
+    ...
+    allocator.free(allocation)
+    allocator.destroy()
+
+Memory is allocated in large blocks per memory type (64 MiB by default),
+resources get ranges of the blocks instead of a VkDeviceMemory each. Ranges
+are managed with TLSF (two-level segregated fit): free ranges are indexed by
+size class in a bitmap, allocation and free take constant time and free
+ranges are merged with their neighbors.
+
+When bufferImageGranularity is above 1, linear resources (buffers, linear
+images) and optimal images are allocated in separate blocks, so they never
+share a granularity page. Resources bigger than half a block get a block of
+their own. Host visible blocks are mapped once on request, see
+`Allocation.mapped`.
+"""
+from collections import namedtuple
+import threading
+
+from vulkan import _vulkan
+from vulkan._vulkan import ffi
+from vulkan.memory import MappedMemory, memory_types
+
+
+_SL_BITS = 4
+_SL_COUNT = 1 << _SL_BITS
+
+
+def _bucket(size):
+    """Size class of a free range: 16 linear subdivisions per power of 2"""
+    if size < _SL_COUNT:
+        return size
+    fl = size.bit_length() - 1
+    return (fl - _SL_BITS + 1) * _SL_COUNT + (size >> (fl - _SL_BITS)) - \
+        _SL_COUNT
+
+
+def _search_bucket(size):
+    """First size class whose ranges are all at least size"""
+    if size >= _SL_COUNT:
+        size += (1 << (size.bit_length() - 1 - _SL_BITS)) - 1
+    return _bucket(size)
+
+
+class _TLSF(object):
+    """Offset allocator of a range of `size` bytes"""
+    def __init__(self, size):
+        self.size = size
+        self.used = 0
+        self.count = 0
+        # {offset: size} and {offset: offset of the previous range} of all
+        # the ranges, free or not
+        self._sizes = {0: size}
+        self._prev = {0: None}
+        # {offset: size class} of the free ranges
+        self._free = {}
+        # free ranges {offset: None} of each size class, bit n of _bitmap is
+        # set if the ranges of class n are not empty
+        self._lists = [{} for _ in range(_bucket(size) + 1)]
+        self._bitmap = 0
+        self._insert(0, size)
+
+    def _insert(self, offset, size):
+        bucket = _bucket(size)
+        self._free[offset] = bucket
+        self._lists[bucket][offset] = None
+        self._bitmap |= 1 << bucket
+
+    def _remove(self, offset):
+        bucket = self._free.pop(offset)
+        ranges = self._lists[bucket]
+        del ranges[offset]
+        if not ranges:
+            self._bitmap &= ~(1 << bucket)
+
+    def alloc(self, size, alignment=1):
+        """Offset of a free range of size bytes, None if there is none
+
+        alignment must be a power of 2.
+        """
+        needed = size + alignment - 1
+        bucket = _search_bucket(needed)
+        mask = self._bitmap >> bucket
+        if mask:
+            bucket += (mask & -mask).bit_length() - 1
+            # popitem, iterating from the start of a dict skips the holes
+            # of the removed keys
+            ranges = self._lists[bucket]
+            offset, _ = ranges.popitem()
+            del self._free[offset]
+            if not ranges:
+                self._bitmap &= ~(1 << bucket)
+        elif not self.count and needed <= self.size:
+            # the single free range can be in the class of needed
+            offset = 0
+            self._remove(offset)
+        else:
+            return None
+
+        sizes = self._sizes
+        prev = self._prev
+        total = sizes[offset]
+
+        aligned = (offset + alignment - 1) & -alignment
+        if aligned != offset:
+            # the padding stays free
+            padding = aligned - offset
+            sizes[offset] = padding
+            self._insert(offset, padding)
+            prev[aligned] = offset
+            offset = aligned
+            total -= padding
+            following = offset + total
+            if following < self.size:
+                prev[following] = offset
+
+        sizes[offset] = size
+        if total > size:
+            rest = offset + size
+            sizes[rest] = total - size
+            prev[rest] = offset
+            following = offset + total
+            if following < self.size:
+                prev[following] = rest
+            self._insert(rest, total - size)
+
+        self.used += size
+        self.count += 1
+        return offset
+
+    def free(self, offset):
+        free = self._free
+        if offset in free:
+            raise ValueError('Range at %d is already free' % offset)
+        sizes = self._sizes
+        prev = self._prev
+        size = sizes[offset]
+        self.used -= size
+        self.count -= 1
+
+        following = offset + size
+        if following in free:
+            self._remove(following)
+            size += sizes.pop(following)
+            del prev[following]
+
+        previous = prev[offset]
+        if previous is not None and previous in free:
+            self._remove(previous)
+            del sizes[offset]
+            del prev[offset]
+            size += sizes[previous]
+            offset = previous
+
+        sizes[offset] = size
+        following = offset + size
+        if following < self.size:
+            prev[following] = offset
+        self._insert(offset, size)
+
+    def free_ranges(self):
+        """Sizes of the free ranges"""
+        return [self._sizes[offset] for offset in self._free]
+
+
+class _Block(object):
+    def __init__(self, device, memory, size, memory_type, property_flags,
+                 linear, dedicated, atom_size, lock):
+        self.device = device
+        self.memory = memory
+        self.size = size
+        self.memory_type = memory_type
+        self.property_flags = property_flags
+        self.linear = linear
+        self.dedicated = dedicated
+        self.atom_size = atom_size
+        self.ranges = _TLSF(size)
+        self.mapping = None
+        # lock of the allocator, for the mapping
+        self.lock = lock
+
+
+class Allocation(object):
+    """Range of a VkDeviceMemory returned by Allocator"""
+    __slots__ = ('memory', 'offset', 'size', 'memory_type', '_block')
+
+    def __init__(self, block, offset, size):
+        self.memory = block.memory
+        self.offset = offset
+        self.size = size
+        self.memory_type = block.memory_type
+        self._block = block
+
+    def mapped(self):
+        """MappedMemory of the whole block, the allocation is at self.offset
+
+        The block is mapped on the first call and stays mapped until the
+        allocator is destroyed. The memory type must be host visible.
+        """
+        block = self._block
+        if block.mapping is None:
+            with block.lock:
+                if block.mapping is None:
+                    block.mapping = MappedMemory(
+                        block.device, block.memory, block.size,
+                        block.property_flags, block.atom_size)
+        return block.mapping
+
+    def __repr__(self):
+        return '<Allocation type %d offset %d size %d>' % (
+            self.memory_type, self.offset, self.size)
+
+
+AllocatorStatistics = namedtuple('AllocatorStatistics', (
+    'blocks', 'block_bytes', 'allocations', 'used_bytes', 'free_ranges',
+    'largest_free_range', 'fragmentation'))
+AllocatorStatistics.__doc__ = """Usage of the blocks of an Allocator
+
+blocks, block_bytes: number and total size of the VkDeviceMemory blocks
+allocations, used_bytes: number and total size of the live allocations
+free_ranges: number of free ranges in the blocks
+largest_free_range: size of the biggest one
+fragmentation: 1 - sum of the largest free range of each block / free
+               bytes, 0 when the free space of each block is contiguous
+"""
+
+
+class Allocator(object):
+    """Suballocate VkDeviceMemory blocks of a device
+
+    Thread safe: allocate, free, the bind methods, statistics and
+    Allocation.mapped take a lock of the allocator. As for any Vulkan
+    command, a buffer or image must not be bound from two threads at once.
+    """
+    def __init__(self, device, physicalDevice, block_size=64 << 20,
+                 pAllocator=None):
+        self.device = device
+        self.block_size = block_size
+        self.pAllocator = pAllocator
+
+        properties = _vulkan.vkGetPhysicalDeviceProperties(physicalDevice)
+        self.buffer_image_granularity = \
+            properties.limits.bufferImageGranularity
+        self.non_coherent_atom_size = properties.limits.nonCoherentAtomSize
+
+        self.memory_types = memory_types(physicalDevice)
+
+        # {(memory type, linear): [_Block]}
+        self._pools = {}
+        self._lock = threading.Lock()
+
+    def _new_block(self, size, memory_type, linear, dedicated):
+        info = ffi.new('VkMemoryAllocateInfo*', {
+            'sType': _vulkan.VK_STRUCTURE_TYPE_MEMORY_ALLOCATE_INFO,
+            'allocationSize': size,
+            'memoryTypeIndex': memory_type})
+        memory = _vulkan.vkAllocateMemory(self.device, info[0],
+                                          self.pAllocator)
+        return _Block(self.device, memory, size, memory_type,
+                      self.memory_types.flags[memory_type], linear,
+                      dedicated, self.non_coherent_atom_size, self._lock)
+
+    def _allocate(self, size, alignment, memory_type, linear):
+        if self.buffer_image_granularity <= 1:
+            linear = True
+        pool = self._pools.setdefault((memory_type, linear), [])
+
+        if size > self.block_size // 2:
+            block = self._new_block(size, memory_type, linear, True)
+            pool.append(block)
+            return Allocation(block, block.ranges.alloc(size), size)
+
+        for block in pool:
+            if not block.dedicated:
+                offset = block.ranges.alloc(size, alignment)
+                if offset is not None:
+                    return Allocation(block, offset, size)
+
+        block = self._new_block(self.block_size, memory_type, linear, False)
+        pool.append(block)
+        return Allocation(block, block.ranges.alloc(size, alignment), size)
+
+    def allocate(self, requirements, requiredFlags=0, preferredFlags=0,
+                 linear=True):
+        """Allocate a range for a VkMemoryRequirements
+
+        The memory type is the best one with all `requiredFlags` allowed by
+        requirements.memoryTypeBits, see vulkan.memory.MemoryTypes; the
+        next one is tried when a type is out of memory. `linear` is False for
+        optimal tiling images. Return an Allocation.
+        """
+        size = requirements.size
+        alignment = requirements.alignment
+        type_bits = requirements.memoryTypeBits
+        types = self.memory_types.candidates(type_bits, requiredFlags,
+                                             preferredFlags)
+        if not types:
+            raise ValueError('No memory type with flags 0x%x in 0x%x' %
+                             (requiredFlags, type_bits))
+
+        with self._lock:
+            for memory_type in types:
+                try:
+                    allocation = self._allocate(size, alignment, memory_type,
+                                                linear)
+                except _vulkan.VkErrorOutOfDeviceMemory:
+                    if memory_type == types[-1]:
+                        raise
+                else:
+                    return allocation
+
+    def free(self, allocation):
+        """Release an allocation
+
+        Empty blocks are freed, except the last one of a memory type.
+        """
+        with self._lock:
+            block = allocation._block
+            block.ranges.free(allocation.offset)
+            if block.ranges.count:
+                return
+
+            pool = self._pools[(block.memory_type, block.linear)]
+            shared = [b for b in pool if not b.dedicated]
+            if block.dedicated or len(shared) > 1:
+                pool.remove(block)
+                self._free_block(block)
+
+    def _free_block(self, block):
+        if block.mapping is not None:
+            block.mapping.unmap()
+        _vulkan.vkFreeMemory(self.device, block.memory, self.pAllocator)
+
+    def bind_buffer(self, buffer, requiredFlags=0, preferredFlags=0):
+        """Allocate memory for a VkBuffer and bind it"""
+        requirements = _vulkan.vkGetBufferMemoryRequirements(self.device,
+                                                             buffer)
+        allocation = self.allocate(requirements, requiredFlags,
+                                   preferredFlags)
+        _vulkan.vkBindBufferMemory(self.device, buffer, allocation.memory,
+                                   allocation.offset)
+        return allocation
+
+    def bind_image(self, image, requiredFlags=0, preferredFlags=0,
+                   linear=False):
+        """Allocate memory for a VkImage and bind it
+
+        `linear` must be True for images with VK_IMAGE_TILING_LINEAR.
+        """
+        requirements = _vulkan.vkGetImageMemoryRequirements(self.device,
+                                                            image)
+        allocation = self.allocate(requirements, requiredFlags,
+                                   preferredFlags, linear)
+        _vulkan.vkBindImageMemory(self.device, image, allocation.memory,
+                                  allocation.offset)
+        return allocation
+
+    def statistics(self):
+        """AllocatorStatistics of all the blocks"""
+        with self._lock:
+            blocks = [b for pool in self._pools.values() for b in pool]
+            free = [b.ranges.free_ranges() for b in blocks]
+
+        free_bytes = sum(sum(sizes) for sizes in free)
+        largest = [max(sizes) for sizes in free if sizes]
+        return AllocatorStatistics(
+            blocks=len(blocks),
+            block_bytes=sum(b.size for b in blocks),
+            allocations=sum(b.ranges.count for b in blocks),
+            used_bytes=sum(b.ranges.used for b in blocks),
+            free_ranges=sum(len(sizes) for sizes in free),
+            largest_free_range=max(largest) if largest else 0,
+            fragmentation=(1 - sum(largest) / free_bytes) if free_bytes
+            else 0.)
+
+    def destroy(self):
+        """Free all the blocks, every allocation becomes invalid"""
+        with self._lock:
+            for pool in self._pools.values():
+                for block in pool:
+                    self._free_block(block)
+            self._pools.clear()
@@ -0,0 +1,127 @@
+"""Frame arena for transient structs and arrays
+
+    arena = Arena(1 << 20)
+    while running:
+        with arena:
+            vkQueueSubmit(queue, 1, [VkSubmitInfo(...)], fence)
+
+Inside the block, struct constructors and the arrays created from Python
+lists are allocated in one preallocated block instead of one `ffi.new` each.
+Leaving the block resets the arena: everything allocated in it becomes
+invalid, don't keep these structs after the vk* calls using them.
+
+The arena is only used by the thread that entered it. It can be entered
+again inside its own block, it is then reset by the outermost exit only.
+When the block is full, more blocks are allocated until the next reset,
+which then replaces them by a single block big enough for the whole frame.
+"""
+from vulkan._vulkan import ffi, _arena_state
+
+
+# {pointer ctype: (size, alignment) of the item}
+_layouts = {}
+# {item ctype: pointer ctype}
+_pointers = {}
+
+
+class Arena(object):
+    """Bump allocator reset at the end of each `with` block"""
+    def __init__(self, size=1 << 20):
+        self.size = size
+        self.offset = 0
+        self._block = None
+        self._address = 0
+        self._extra = []
+        self._refs = []
+        self._previous = []
+        self._depth = 0
+        self._new_block(size)
+
+    def _new_block(self, size):
+        self._block = ffi.new('char[]', size)
+        self._address = int(ffi.cast('uintptr_t', self._block))
+        self.size = size
+        self.offset = 0
+
+    def _alloc(self, size, align):
+        offset = (self.offset + align - 1) & -align
+        if offset + size > self.size:
+            # keep the full block alive until reset
+            self._extra.append((self._block, self.offset))
+            self._new_block(max(self.size, size + align))
+            offset = 0
+
+        self.offset = offset + size
+        return self._address + offset
+
+    def new(self, ptr_type, init=None):
+        """Allocate an initialized struct, like `ffi.new(ptr_type, init)[0]`"""
+        try:
+            size, align = _layouts[ptr_type]
+        except KeyError:
+            size, align = _layouts[ptr_type] = (ffi.sizeof(ptr_type.item),
+                                                ffi.alignof(ptr_type.item))
+
+        # _alloc inlined, this is called for each struct
+        offset = (self.offset + align - 1) & -align
+        if offset + size > self.size:
+            address = self._alloc(size, align)
+        else:
+            self.offset = offset + size
+            address = self._address + offset
+
+        ptr = ffi.cast(ptr_type, address)
+        if init:
+            ptr[0] = init
+        return ptr[0]
+
+    def new_array(self, item, values):
+        """Allocate an array of `item` initialized with values
+
+        Return an `item *` pointer. Like `ffi.new`, a terminating null is
+        added to bytes.
+        """
+        if not isinstance(values, (list, tuple, bytes)):
+            values = list(values)
+        length = len(values)
+        if isinstance(values, bytes):
+            length += 1
+
+        try:
+            ptr_type = _pointers[item]
+        except KeyError:
+            ptr_type = _pointers[item] = ffi.typeof(ffi.getctype(item, '*'))
+            _layouts[ptr_type] = (ffi.sizeof(item), ffi.alignof(item))
+
+        size, align = _layouts[ptr_type]
+        ptr = ffi.cast(ptr_type, self._alloc(size * length, align))
+        if values:
+            ptr[0:len(values)] = values
+        return ptr
+
+    def keep(self, refs):
+        """Keep refs alive until the next reset"""
+        self._refs.append(refs)
+
+    def reset(self):
+        """Free everything allocated since the last reset"""
+        if self._extra:
+            used = sum(offset for _, offset in self._extra) + self.offset
+            self._extra = []
+            self._new_block(max(used, self.size))
+        else:
+            ffi.memmove(self._block, bytes(self.offset), self.offset)
+            self.offset = 0
+        self._refs = []
+
+    def __enter__(self):
+        self._previous.append(_arena_state.arena)
+        _arena_state.arena = self
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        _arena_state.arena = self._previous.pop()
+        self._depth -= 1
+        if not self._depth:
+            self.reset()
@@ -0,0 +1,43 @@
+"""Sets of supported extension names
+
+    supported = device_extension_names(physical_device)
+    missing = set(required) - supported
+
+The names are decoded once from the properties arrays, membership tests
+don't go through StrWrap. The extensions of a physical device don't change:
+they are kept with the physical device queries of `vulkan.query_cache` and
+dropped with them.
+"""
+from vulkan import _vulkan
+from vulkan._vulkan import ffi, _decode
+from vulkan.query_cache import _address, _cache
+
+
+def _names(properties):
+    return frozenset([_decode(p.extensionName) for p in properties])
+
+
+def instance_extension_names(pLayerName=None):
+    """frozenset of the instance extensions of the loader or of a layer"""
+    # an array as last parameter returns the cdata array, not StrWrap
+    return _names(_vulkan.vkEnumerateInstanceExtensionProperties(
+        pLayerName, ffi.new('VkExtensionProperties[]', 0)))
+
+
+def device_extension_names(physicalDevice, pLayerName=None):
+    """frozenset of the device extensions of a physical device or of a layer
+
+    Cached per physical device and layer.
+    """
+    device_cache = _cache.setdefault(_address(physicalDevice), {})
+    key = ('device_extension_names', pLayerName)
+    try:
+        return device_cache[key]
+    except KeyError:
+        pass
+
+    result = device_cache[key] = _names(
+        _vulkan.vkEnumerateDeviceExtensionProperties(
+            physicalDevice, pLayerName,
+            ffi.new('VkExtensionProperties[]', 0)))
+    return result
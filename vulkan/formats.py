@@ -0,0 +1,199 @@
+"""Format capability table
+
+    table = format_table(physical_device, images=[
+        (VK_IMAGE_TILING_OPTIMAL, VK_IMAGE_USAGE_SAMPLED_BIT),
+        (VK_IMAGE_TILING_OPTIMAL, VK_IMAGE_USAGE_STORAGE_BIT)])
+    depth = table.select(
+        optimal=VK_FORMAT_FEATURE_DEPTH_STENCIL_ATTACHMENT_BIT)
+    storage = table.select(images=[1])
+
+`format_table` queries the features of every VkFormat and, for each
+combination in `images`, whether an image of the format can be created.
+Its `array` is a numpy structured array with one row per format, sorted by
+format:
+
+    format: the VkFormat
+    linear, optimal, buffer: VkFormatFeatureFlags of the format
+    images: bitset, bit i is set if the combination images[i] is supported
+
+Formats are selected with vectorized masks over the whole table instead of
+one wrapped call per format. The table is computed once per physical device
+and set of combinations, it is kept with the physical device queries of
+`vulkan.query_cache` and dropped with them.
+
+This module needs numpy, which is an optional dependency of vulkan.
+"""
+import numpy as np
+
+from vulkan import _vulkan
+from vulkan._vulkan import ffi, lib, _formats, _handle
+from vulkan.ndarray import as_cdata, dtype
+from vulkan.query_cache import _address, _cache
+
+
+TABLE_DTYPE = np.dtype([
+    ('format', np.int32),
+    ('linear', np.uint32),
+    ('optimal', np.uint32),
+    ('buffer', np.uint32),
+    ('images', np.uint64),
+])
+
+_VERSION_1_1 = _vulkan.VK_MAKE_VERSION(1, 1, 0)
+_TILING_FIELDS = {
+    _vulkan.VK_IMAGE_TILING_LINEAR: 'linear',
+    _vulkan.VK_IMAGE_TILING_OPTIMAL: 'optimal',
+}
+
+
+class FormatTable(object):
+    """Capabilities of all the formats of a physical device
+
+    `array` is read-only, see TABLE_DTYPE. `images` are the image
+    combinations (tiling, usage, type, flags) of the bits of
+    array['images'].
+    """
+    def __init__(self, array, images):
+        self.array = array
+        self.images = images
+
+    def mask(self, linear=0, optimal=0, buffer=0, images=()):
+        """Boolean array of the formats supporting all the given features
+
+        `images` are indices in self.images.
+        """
+        array = self.array
+        result = np.ones(len(array), bool)
+        for name, flags in (('linear', linear), ('optimal', optimal),
+                            ('buffer', buffer)):
+            if flags:
+                result &= (array[name] & flags) == flags
+        if images:
+            bits = np.uint64(sum(1 << i for i in set(images)))
+            result &= (array['images'] & bits) == bits
+        return result
+
+    def select(self, linear=0, optimal=0, buffer=0, images=()):
+        """Formats supporting all the given features, see mask"""
+        return self.array['format'][self.mask(linear, optimal, buffer,
+                                              images)]
+
+    def __getitem__(self, format):
+        """Row of a format"""
+        formats = self.array['format']
+        i = np.searchsorted(formats, format)
+        if i == len(formats) or formats[i] != format:
+            raise KeyError(format)
+        return self.array[i]
+
+    def __len__(self):
+        return len(self.array)
+
+
+def _image_combination(combination):
+    tiling, usage = combination[:2]
+    image_type, flags = (tuple(combination[2:]) +
+                         (_vulkan.VK_IMAGE_TYPE_2D, 0)[len(combination) - 2:])
+    return tiling, usage, image_type, flags
+
+
+def _query_features(physical_device, formats, version_1_1):
+    if version_1_1:
+        properties = np.zeros(len(formats), dtype('VkFormatProperties2'))
+        properties['sType'] = _vulkan.VK_STRUCTURE_TYPE_FORMAT_PROPERTIES_2
+        fn = lib.vkGetPhysicalDeviceFormatProperties2
+    else:
+        properties = np.zeros(len(formats), dtype('VkFormatProperties'))
+        fn = lib.vkGetPhysicalDeviceFormatProperties
+
+    # the raw command fills the array in place
+    cdata = as_cdata(properties)
+    for i, format in enumerate(formats):
+        fn(physical_device, format, cdata + i)
+
+    if version_1_1:
+        properties = properties['formatProperties']
+    return (properties['linearTilingFeatures'],
+            properties['optimalTilingFeatures'],
+            properties['bufferFeatures'])
+
+
+def _query_images(physical_device, formats, combination, features,
+                  version_1_1):
+    """Boolean array of the formats supporting an image combination"""
+    tiling, usage, image_type, flags = combination
+    result = np.zeros(len(formats), bool)
+
+    if version_1_1:
+        info = ffi.new('VkPhysicalDeviceImageFormatInfo2*', {
+            'sType':
+                _vulkan.VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_FORMAT_INFO_2,
+            'type': image_type, 'tiling': tiling, 'usage': usage,
+            'flags': flags})
+        out = ffi.new('VkImageFormatProperties2*', {
+            'sType': _vulkan.VK_STRUCTURE_TYPE_IMAGE_FORMAT_PROPERTIES_2})
+        fn = lib.vkGetPhysicalDeviceImageFormatProperties2
+    else:
+        out = ffi.new('VkImageFormatProperties*')
+        fn = lib.vkGetPhysicalDeviceImageFormatProperties
+
+    # a format without features for the tiling can't be used in an image
+    candidates = np.arange(len(formats))
+    field = _TILING_FIELDS.get(tiling)
+    if field is not None:
+        candidates = candidates[features[field] != 0]
+
+    for i in candidates.tolist():
+        if version_1_1:
+            info.format = formats[i]
+            status = fn(physical_device, info, out)
+        else:
+            status = fn(physical_device, formats[i], image_type, tiling,
+                        usage, flags, out)
+        result[i] = status == _vulkan.VK_SUCCESS
+    return result
+
+
+def format_table(physicalDevice, images=(), instanceApiVersion=0):
+    """Capabilities of every VkFormat on a physical device
+
+    `images` is a sequence of image combinations (tiling, usage) or
+    (tiling, usage, imageType, flags), imageType defaults to
+    VK_IMAGE_TYPE_2D and flags to 0. Up to 64 combinations.
+    `instanceApiVersion` is the apiVersion of the VkApplicationInfo of the
+    instance: the Vulkan 1.1 queries are used when both the instance and
+    the device support them, else the Vulkan 1.0 ones.
+    Return a FormatTable, cached per physical device and combinations.
+    """
+    images = tuple(_image_combination(c) for c in images)
+    if len(images) > 64:
+        raise ValueError('At most 64 image combinations, got %d' %
+                         len(images))
+
+    device_cache = _cache.setdefault(_address(physicalDevice), {})
+    key = ('format_table', images)
+    try:
+        return device_cache[key]
+    except KeyError:
+        pass
+
+    physical_device = _handle(physicalDevice, 'VkPhysicalDevice')
+    properties = ffi.new('VkPhysicalDeviceProperties*')
+    lib.vkGetPhysicalDeviceProperties(physical_device, properties)
+    version_1_1 = min(properties.apiVersion,
+                      instanceApiVersion) >= _VERSION_1_1
+
+    formats = sorted(set(_formats) - {_vulkan.VK_FORMAT_UNDEFINED})
+    array = np.zeros(len(formats), TABLE_DTYPE)
+    array['format'] = formats
+    array['linear'], array['optimal'], array['buffer'] = _query_features(
+        physical_device, formats, version_1_1)
+
+    for bit, combination in enumerate(images):
+        supported = _query_images(physical_device, formats, combination,
+                                  array, version_1_1)
+        array['images'][supported] |= np.uint64(1 << bit)
+
+    array.flags.writeable = False
+    result = device_cache[key] = FormatTable(array, images)
+    return result
@@ -0,0 +1,199 @@
+"""Content hash of struct graphs
+
+    key = content_hash(create_info)
+
+Two structs describing the same object have the same 128-bit key, wherever
+their nested structs and arrays are allocated: pointers are followed
+(pNext chains, counted arrays, strings) and only the pointed content is
+hashed, padding is skipped. Handles and other opaque pointers are hashed by
+value, the key of a struct without them is stable across processes. Unions
+are hashed by their bytes: the active member is unknown, their pointers are
+never followed.
+
+`ObjectCache` uses it to create each Vulkan object only once.
+"""
+import hashlib
+import struct as _struct
+
+from vulkan._vulkan import (ffi, _struct_lengths, _struct_length_formulas,
+                            _structure_types)
+
+
+_NULL = b'\0'
+_COUNT = _struct.Struct('<BQ')
+_plans = {}
+
+
+def _is_opaque(ctype):
+    try:
+        ffi.sizeof(ctype)
+    except ffi.error:
+        return True
+    return False
+
+
+def _plan(ctype):
+    """Cached (data ranges, nested fields, pointer fields) of a struct
+
+    data ranges: merged (start, end) offsets of the bytes hashed as is
+    nested fields: names of the struct (or struct array) members
+    pointer fields: (name, item ctype, name of the count member, function
+    of the struct giving the count, or None)
+    """
+    try:
+        return _plans[ctype]
+    except KeyError:
+        pass
+
+    if ctype.kind == 'union':
+        plan = _plans[ctype] = ([(0, ffi.sizeof(ctype))], [], [])
+        return plan
+
+    name = ctype.cname.split(' ')[-1]
+    lengths = dict(_struct_lengths.get(name, {}))
+    lengths.update(_struct_length_formulas.get(name, {}))
+    ranges = []
+    nested = []
+    pointers = []
+    for name, field in ctype.fields:
+        ftype = field.type
+        item = ftype
+        while item.kind == 'array':
+            item = item.item
+
+        if item.kind in ('struct', 'union'):
+            nested.append(name)
+            continue
+        if ftype.kind == 'pointer' and not (
+                ftype.item.kind in ('struct', 'union') and
+                _is_opaque(ftype.item)):
+            pointers.append((name, ftype.item, lengths.get(name)))
+            continue
+
+        # values, value arrays, bitfields, handles and function pointers
+        start = field.offset
+        end = start + ffi.sizeof(ftype)
+        if ranges and ranges[-1][1] >= start:
+            ranges[-1] = (ranges[-1][0], max(ranges[-1][1], end))
+        else:
+            ranges.append((start, end))
+
+    plan = _plans[ctype] = (ranges, nested, pointers)
+    return plan
+
+
+def _hash_struct(h, value):
+    ctype = ffi.typeof(value)
+    ranges, nested, pointers = _plan(ctype)
+
+    data = ffi.buffer(ffi.addressof(value))
+    h.update(b''.join([data[start:end] for start, end in ranges]))
+
+    for name in nested:
+        member = getattr(value, name)
+        if ffi.typeof(member).kind == 'array':
+            _hash_array(h, member)
+        else:
+            _hash_struct(h, member)
+
+    for name, item, count in pointers:
+        ptr = getattr(value, name)
+        if name == 'pNext':
+            _hash_chain(h, ptr)
+        elif count is None:
+            _hash_pointer(h, ptr, item, None)
+        elif callable(count):
+            _hash_pointer(h, ptr, item, count(value))
+        else:
+            _hash_pointer(h, ptr, item, getattr(value, count))
+
+
+def _hash_array(h, array):
+    for member in array:
+        if ffi.typeof(member).kind == 'array':
+            _hash_array(h, member)
+        else:
+            _hash_struct(h, member)
+
+
+def _hash_chain(h, ptr):
+    while ptr != ffi.NULL:
+        stype = ffi.cast('VkStructureType*', ptr)[0]
+        name = _structure_types.get(stype)
+        if name is None:
+            # unknown extension struct, only its type is known
+            h.update(_COUNT.pack(2, stype & 0xffffffff))
+            return
+
+        h.update(_COUNT.pack(1, stype & 0xffffffff))
+        value = ffi.cast(name + '*', ptr)[0]
+        _hash_struct(h, value)
+        ptr = value.pNext
+    h.update(_NULL)
+
+
+def _hash_pointer(h, ptr, item, count):
+    if ptr == ffi.NULL:
+        h.update(_NULL)
+        return
+
+    if item.kind in ('struct', 'union'):
+        h.update(_COUNT.pack(1, 1 if count is None else count))
+        for i in range(1 if count is None else count):
+            _hash_struct(h, ptr[i])
+    elif item.kind == 'pointer':
+        h.update(_COUNT.pack(1, 1 if count is None else count))
+        by_value = item.item.kind in ('void', 'function') or (
+            item.item.kind in ('struct', 'union') and _is_opaque(item.item))
+        for i in range(1 if count is None else count):
+            if by_value:
+                # handles
+                h.update(_COUNT.pack(3, int(ffi.cast('uintptr_t', ptr[i]))))
+            else:
+                _hash_pointer(h, ptr[i], item.item, None)
+    elif item.cname == 'char' and count is None:
+        data = ffi.string(ffi.cast('char*', ptr))
+        h.update(_COUNT.pack(1, len(data)))
+        h.update(data)
+    elif item.kind == 'void' and count is None:
+        # user data, identified by its address
+        h.update(_COUNT.pack(3, int(ffi.cast('uintptr_t', ptr))))
+    else:
+        size = 1 if item.kind == 'void' else ffi.sizeof(item)
+        size *= 1 if count is None else count
+        h.update(_COUNT.pack(1, size))
+        h.update(ffi.buffer(ffi.cast('char*', ptr), size))
+
+
+def content_hash(value):
+    """128-bit key (16 bytes) of a struct and everything it points to"""
+    h = hashlib.blake2b(digest_size=16)
+    _hash_struct(h, value)
+    return h.digest()
+
+
+class ObjectCache(object):
+    """Vulkan objects indexed by the content hash of their create info
+
+        samplers = ObjectCache(lambda info: vkCreateSampler(device, info,
+                                                            None))
+        sampler = samplers.get(VkSamplerCreateInfo(...))
+    """
+    def __init__(self, create):
+        self.create = create
+        self.objects = {}
+
+    def get(self, create_info):
+        """Return the object created with an equal create info, or create it"""
+        key = content_hash(create_info)
+        try:
+            return self.objects[key]
+        except KeyError:
+            result = self.objects[key] = self.create(create_info)
+            return result
+
+    def __len__(self):
+        return len(self.objects)
+
+    def values(self):
+        return self.objects.values()
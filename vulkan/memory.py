@@ -0,0 +1,345 @@
+"""Persistently mapped device memory
+
+    mapped = MappedMemory(device, memory, size, property_flags,
+                          limits.nonCoherentAtomSize)
+    mapped.write(offset, vertices)
+    with mapped.reading(offset, size) as view:
+        pixels = numpy.frombuffer(view, numpy.float32)
+    ...
+    mapped.unmap()
+
+The memory is mapped once, `view` and `array` return memoryview and numpy
+views of subranges of the mapping, without copy. Host writes are flushed
+and device writes invalidated by `write`, `read`, `writing` and `reading`
+when the memory type is not HOST_COHERENT; ranges are aligned to
+nonCoherentAtomSize as required. Views are invalid once the memory is
+unmapped.
+
+Writes through views are flushed by `flush`, or recorded in a
+`MappedRanges` to be flushed at once, merged with the other ranges of the
+frame, in a single vkFlushMappedMemoryRanges call (and likewise for
+invalidations before readbacks).
+
+`memory_types(physical_device).find(typeBits, required, preferred)` chooses
+the memory type of an allocation with a dict lookup, from a ranking of the
+memory types of the device computed once.
+"""
+from contextlib import contextmanager
+import struct
+
+from vulkan import _vulkan
+from vulkan._vulkan import ffi, lib, exception_codes, _handle
+from vulkan.query_cache import _address, _cache
+
+
+# VK_WHOLE_SIZE as a VkDeviceSize
+_WHOLE_SIZE = (1 << 64) - 1
+
+
+def _aligned_range(start, end, atom, mapping_start, mapping_end,
+                   memory_size):
+    """(offset, size) of a VkMappedMemoryRange covering [start, end)
+
+    The offset is aligned to atom but not below the mapping. The size is
+    VK_WHOLE_SIZE up to the end of the mapping when it ends on an atom
+    boundary or at the end of the memory, else a multiple of atom.
+    """
+    start = max(start - start % atom, mapping_start)
+    end += -end % atom
+    if end >= mapping_end and (mapping_end == memory_size or
+                               not mapping_end % atom):
+        return start, _WHOLE_SIZE
+    return start, min(end, memory_size) - start
+
+
+class MappedMemory(object):
+    """Host visible VkDeviceMemory mapped for its whole life
+
+    `size` is the size of the allocation, `propertyFlags` the
+    VkMemoryPropertyFlags of its memory type and `nonCoherentAtomSize` the
+    limit of the physical device. `offset` and `size` of the mapping can
+    restrict it to a part of the allocation of `allocationSize` bytes (by
+    default the mapping ends the allocation), view offsets are relative to
+    the mapping.
+    """
+    def __init__(self, device, memory, size, propertyFlags,
+                 nonCoherentAtomSize=1, offset=0, allocationSize=None):
+        self.device = _handle(device, 'VkDevice')
+        self.memory = _handle(memory, 'VkDeviceMemory')
+        self.offset = offset
+        self.size = size
+        self.allocationSize = (offset + size if allocationSize is None
+                               else allocationSize)
+        self.coherent = bool(
+            propertyFlags & _vulkan.VK_MEMORY_PROPERTY_HOST_COHERENT_BIT)
+        self.atom = max(nonCoherentAtomSize, 1)
+
+        ppData = ffi.new('void**')
+        result = lib.vkMapMemory(self.device, self.memory, offset, size, 0,
+                                 ppData)
+        if result != _vulkan.VK_SUCCESS:
+            raise exception_codes[result]
+
+        self.pointer = ffi.cast('char*', ppData[0])
+        self.address = int(ffi.cast('uintptr_t', self.pointer))
+        self._buffer = ffi.buffer(self.pointer, size)
+        self._view = memoryview(self._buffer)
+        self._range = ffi.new('VkMappedMemoryRange*', {
+            'sType': _vulkan.VK_STRUCTURE_TYPE_MAPPED_MEMORY_RANGE,
+            'memory': self.memory})
+
+    def _aligned(self, start, end):
+        """VkMappedMemoryRange (offset, size) of a range of the memory"""
+        return _aligned_range(start, end, self.atom, self.offset,
+                              self.offset + self.size, self.allocationSize)
+
+    def _check(self, offset, size, alignment=1):
+        if size is None:
+            size = self.size - offset
+        if offset < 0 or size < 0 or offset + size > self.size:
+            raise ValueError('Range [%d, %d) out of the mapping of %d bytes'
+                             % (offset, offset + size, self.size))
+        if (self.address + offset) % alignment:
+            raise ValueError('Offset %d is not aligned to %d' %
+                             (offset, alignment))
+        return size
+
+    def view(self, offset=0, size=None, format='B'):
+        """Writable memoryview of a range, items of the struct `format`"""
+        size = self._check(offset, size, struct.calcsize(format))
+        view = self._view[offset:offset + size]
+        return view if format == 'B' else view.cast(format)
+
+    def array(self, offset, shape, dtype):
+        """numpy array viewing the mapping at offset, without copy"""
+        import numpy as np
+
+        dtype = np.dtype(dtype)
+        if isinstance(shape, int):
+            shape = (shape,)
+        count = 1
+        for n in shape:
+            count *= n
+        self._check(offset, count * dtype.itemsize, dtype.alignment)
+        result = np.frombuffer(self._view, dtype, count, offset)
+        return result if len(shape) == 1 else result.reshape(shape)
+
+    def _call(self, fn, offset, size):
+        if self.coherent or size == 0:
+            return
+        start = self.offset + offset
+        start, size = self._aligned(start, start + size)
+        self._range.offset = start
+        self._range.size = size
+        result = fn(self.device, 1, self._range)
+        if result != _vulkan.VK_SUCCESS:
+            raise exception_codes[result]
+
+    def flush(self, offset=0, size=None):
+        """Make host writes of a range visible to the device"""
+        size = self._check(offset, size)
+        self._call(lib.vkFlushMappedMemoryRanges, offset, size)
+
+    def invalidate(self, offset=0, size=None):
+        """Make device writes of a range visible to the host"""
+        size = self._check(offset, size)
+        self._call(lib.vkInvalidateMappedMemoryRanges, offset, size)
+
+    def write(self, offset, data):
+        """Copy a bytes-like object at offset and flush it"""
+        data = memoryview(data).cast('B')
+        size = self._check(offset, len(data))
+        self._view[offset:offset + size] = data
+        self._call(lib.vkFlushMappedMemoryRanges, offset, size)
+
+    def read(self, offset=0, size=None):
+        """Invalidate a range and return a copy of it as bytes"""
+        size = self._check(offset, size)
+        self._call(lib.vkInvalidateMappedMemoryRanges, offset, size)
+        return self._view[offset:offset + size].tobytes()
+
+    @contextmanager
+    def writing(self, offset=0, size=None, format='B'):
+        """View of a range, flushed at the end of the block"""
+        size = self._check(offset, size)
+        yield self.view(offset, size, format)
+        self._call(lib.vkFlushMappedMemoryRanges, offset, size)
+
+    @contextmanager
+    def reading(self, offset=0, size=None, format='B'):
+        """View of a range, invalidated before the block"""
+        size = self._check(offset, size)
+        self._call(lib.vkInvalidateMappedMemoryRanges, offset, size)
+        yield self.view(offset, size, format)
+
+    def unmap(self):
+        """Unmap the memory, the views must not be used anymore"""
+        if self.pointer is None:
+            return
+        self.pointer = self._buffer = self._view = None
+        lib.vkUnmapMemory(self.device, self.memory)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.unmap()
+
+
+class MappedRanges(object):
+    """Ranges of MappedMemory flushed or invalidated together
+
+    `add` records a range written by the host (or to be read back), `flush`
+    and `invalidate` merge the recorded ranges of each memory, align them to
+    nonCoherentAtomSize and pass them all in a single
+    vkFlushMappedMemoryRanges or vkInvalidateMappedMemoryRanges call per
+    device, then forget them. Ranges of coherent memory are ignored.
+    """
+    def __init__(self):
+        # {id(MappedMemory): (MappedMemory, [(start, end)])}, offsets in
+        # the memory object
+        self._ranges = {}
+
+    def add(self, mapped, offset=0, size=None):
+        """Record a range of a MappedMemory, offset relative to the
+        mapping"""
+        if mapped.coherent:
+            return
+        size = mapped._check(offset, size)
+        if not size:
+            return
+        start = mapped.offset + offset
+        try:
+            ranges = self._ranges[id(mapped)][1]
+        except KeyError:
+            ranges = []
+            self._ranges[id(mapped)] = (mapped, ranges)
+        ranges.append((start, start + size))
+
+    def _merged(self):
+        """{device address: (device, [VkMappedMemoryRange fields])}"""
+        stype = _vulkan.VK_STRUCTURE_TYPE_MAPPED_MEMORY_RANGE
+        devices = {}
+        for mapped, ranges in self._ranges.values():
+            mapping_end = mapped.offset + mapped.size
+            ranges.sort()
+            # aligned ranges, merged when they overlap or touch
+            merged = []
+            for start, end in ranges:
+                start, size = mapped._aligned(start, end)
+                end = mapping_end if size == _WHOLE_SIZE else start + size
+                if merged and start <= merged[-1][1]:
+                    if end > merged[-1][1]:
+                        merged[-1][1] = end
+                else:
+                    merged.append([start, end])
+
+            key = int(ffi.cast('uintptr_t', mapped.device))
+            if key not in devices:
+                devices[key] = (mapped.device, [])
+            memory = mapped.memory
+            devices[key][1].extend(
+                (stype, ffi.NULL, memory) + mapped._aligned(start, end)
+                for start, end in merged)
+        return devices
+
+    def _call(self, fn):
+        devices = self._merged()
+        self._ranges.clear()
+        for device, ranges in devices.values():
+            # initialized from tuples in C, faster than setting each field
+            array = ffi.new('VkMappedMemoryRange[]', ranges)
+            result = fn(device, len(ranges), array)
+            if result != _vulkan.VK_SUCCESS:
+                raise exception_codes[result]
+
+    def flush(self):
+        """Make the host writes of the recorded ranges visible to the
+        device"""
+        self._call(lib.vkFlushMappedMemoryRanges)
+
+    def invalidate(self):
+        """Make the device writes of the recorded ranges visible to the
+        host"""
+        self._call(lib.vkInvalidateMappedMemoryRanges)
+
+    def clear(self):
+        """Forget the recorded ranges"""
+        self._ranges.clear()
+
+    def __len__(self):
+        return sum(len(ranges) for _, ranges in self._ranges.values())
+
+
+def _popcount(flags):
+    return bin(flags).count('1')
+
+
+class MemoryTypes(object):
+    """Memory types of a physical device, ranked per requested flags
+
+    Among the types allowed by typeBits with all the required flags, the
+    best one has the most preferred flags, then the fewest flags neither
+    required nor preferred (an upload buffer asking for HOST_VISIBLE gets a
+    plain HOST_COHERENT type rather than a DEVICE_LOCAL or HOST_CACHED one),
+    then the biggest heap, then the lowest index. Rankings are computed once
+    per (typeBits, required, preferred).
+    """
+    def __init__(self, memoryProperties):
+        count = memoryProperties.memoryTypeCount
+        types = memoryProperties.memoryTypes
+        heaps = memoryProperties.memoryHeaps
+        self.flags = [types[i].propertyFlags for i in range(count)]
+        self.heaps = [types[i].heapIndex for i in range(count)]
+        self.heap_sizes = [heaps[i].size
+                           for i in range(memoryProperties.memoryHeapCount)]
+        # {(typeBits, required, preferred): memory types, best first}
+        self._candidates = {}
+
+    def _rank(self, typeBits, required, preferred):
+        wanted = required | preferred
+        types = [i for i, flags in enumerate(self.flags)
+                 if typeBits & (1 << i) and flags & required == required]
+        types.sort(key=lambda i: (
+            -_popcount(self.flags[i] & preferred),
+            _popcount(self.flags[i] & ~wanted),
+            -self.heap_sizes[self.heaps[i]], i))
+        return tuple(types)
+
+    def candidates(self, typeBits, required=0, preferred=0):
+        """Memory types allowed by typeBits with the required flags, best
+        first"""
+        key = (typeBits, required, preferred)
+        try:
+            return self._candidates[key]
+        except KeyError:
+            result = self._candidates[key] = self._rank(typeBits, required,
+                                                        preferred)
+            return result
+
+    def find(self, typeBits, required=0, preferred=0):
+        """Best memory type, raise ValueError if none has the required
+        flags"""
+        key = (typeBits, required, preferred)
+        try:
+            candidates = self._candidates[key]
+        except KeyError:
+            candidates = self.candidates(typeBits, required, preferred)
+        if not candidates:
+            raise ValueError('No memory type with flags 0x%x in 0x%x' %
+                             (required, typeBits))
+        return candidates[0]
+
+
+def memory_types(physicalDevice):
+    """MemoryTypes of a physical device
+
+    Cached with the physical device queries of vulkan.query_cache.
+    """
+    device_cache = _cache.setdefault(_address(physicalDevice), {})
+    try:
+        return device_cache['memory_types']
+    except KeyError:
+        result = device_cache['memory_types'] = MemoryTypes(
+            _vulkan.vkGetPhysicalDeviceMemoryProperties(physicalDevice))
+        return result
@@ -0,0 +1,176 @@
+"""NumPy interoperability
+
+Every Vulkan struct and union has a structured dtype with the exact layout
+cffi uses (offsets, itemsize and alignment), available as `dtype(name)` or
+as an attribute of this module:
+
+    viewports = numpy.zeros(16, vulkan.ndarray.VkViewport)
+    viewports['width'] = 800.
+    vkCmdSetViewport(cmd, 0, 16, as_cdata(viewports))
+
+Pointers and handles are stored as addresses (uintp), char arrays as bytes.
+Bitfields sharing a storage unit are merged in one unsigned field named
+after them, joined with '|'.
+
+This module needs numpy, which is an optional dependency of vulkan.
+"""
+import numpy as np
+
+from vulkan._vulkan import ffi
+
+
+_dtypes = {}
+
+
+class _StructMemory(object):
+    """Bytes of a struct cdata for numpy, the array owns the struct"""
+    __slots__ = ('struct', '__array_interface__')
+
+    def __init__(self, struct):
+        self.struct = struct
+        self.__array_interface__ = {
+            'data': (int(ffi.cast('uintptr_t', ffi.addressof(struct))),
+                     False),
+            'shape': (ffi.sizeof(struct),),
+            'typestr': '|u1',
+            'version': 3,
+        }
+
+
+def _primitive_dtype(ctype):
+    size = ffi.sizeof(ctype)
+    name = ctype.cname
+    if ctype.kind == 'enum':
+        return np.dtype('i%d' % size)
+    if name in ('float', 'double'):
+        return np.dtype('f%d' % size)
+    if name == 'char':
+        return np.dtype('S1')
+
+    unsigned = name.startswith(('u', 'unsigned')) or name in ('size_t',
+                                                              '_Bool')
+    return np.dtype('%s%d' % ('u' if unsigned else 'i', size))
+
+
+def _record_dtype(ctype):
+    # the C type is kept in the metadata for as_cdata: dtypes compare by
+    # layout, distinct structs with the same fields are equal
+    names = []
+    formats = []
+    offsets = []
+    for name, field in ctype.fields:
+        if field.bitsize >= 0:
+            if field.bitshift > 0:
+                names[-1] += '|' + name
+                continue
+            field_dtype = _primitive_dtype(field.type)
+        else:
+            field_dtype = dtype(field.type)
+
+        names.append(name)
+        formats.append(field_dtype)
+        offsets.append(field.offset)
+
+    return np.dtype({'names': names, 'formats': formats, 'offsets': offsets,
+                     'itemsize': ffi.sizeof(ctype)}, align=True,
+                    metadata={'ctype': ctype})
+
+
+def dtype(ctype):
+    """NumPy dtype of a C type (a name or a cffi ctype)
+
+    Raise ffi.error for opaque structs.
+    """
+    if not isinstance(ctype, ffi.CType):
+        ctype = ffi.typeof(ctype)
+
+    try:
+        return _dtypes[ctype]
+    except KeyError:
+        pass
+
+    if ctype.kind in ('struct', 'union'):
+        # opaque struct have no fields, cffi must fail before accessing them
+        ffi.sizeof(ctype)
+        result = _record_dtype(ctype)
+    elif ctype.kind == 'array':
+        item = dtype(ctype.item)
+        if item == np.dtype('S1'):
+            result = np.dtype('S%d' % ctype.length)
+        else:
+            result = np.dtype((item, (ctype.length,)))
+    elif ctype.kind in ('pointer', 'function'):
+        result = np.dtype(np.uintp)
+    else:
+        result = _primitive_dtype(ctype)
+
+    _dtypes[ctype] = result
+    return result
+
+
+def as_cdata(array, ctype=None):
+    """View a structured array as a `ctype[]` cdata without copy
+
+    The array must be C-contiguous and its dtype must be `dtype(ctype)`.
+    `ctype` can be omitted for arrays created with a dtype of this module,
+    whose metadata names the struct. The returned cdata keeps the array
+    alive.
+    """
+    if ctype is None:
+        ctype = (array.dtype.metadata or {}).get('ctype')
+        if ctype is None:
+            raise TypeError('Unknown dtype %s, ctype is required' %
+                            (array.dtype,))
+    elif not isinstance(ctype, ffi.CType):
+        ctype = ffi.typeof(ctype)
+
+    if array.dtype != dtype(ctype):
+        raise TypeError('Array dtype %s does not match %s' %
+                        (array.dtype, ctype.cname))
+    if not array.flags.c_contiguous:
+        raise ValueError('Array must be C-contiguous')
+
+    return ffi.from_buffer(ctype.cname + '[]', array)
+
+
+def as_array(cdata, length=None):
+    """View a struct, array or pointer cdata as a structured array
+
+    `length` defaults to the array length, or 1 for pointers; a struct is
+    viewed as one element. No copy is made, the returned array keeps
+    `cdata` alive.
+    """
+    ctype = ffi.typeof(cdata)
+    if ctype.kind in ('struct', 'union'):
+        if length not in (None, 1):
+            raise ValueError('A struct cdata has a single element')
+        # ffi.buffer needs a pointer, which doesn't reference the struct
+        return np.asarray(_StructMemory(cdata)).view(dtype(ctype))
+    elif ctype.kind in ('array', 'pointer'):
+        ptr = cdata
+        item = ctype.item
+        if length is None and ctype.kind == 'array':
+            length = len(cdata)
+    else:
+        raise TypeError('Expected a struct, array or pointer cdata, got %s' %
+                        ctype.cname)
+
+    if length is None:
+        length = 1
+
+    buf = ffi.buffer(ptr, ffi.sizeof(item) * length)
+    return np.frombuffer(buf, dtype(item))
+
+
+def __getattr__(name):
+    try:
+        ctype = ffi.typeof(name)
+    except ffi.error:
+        ctype = None
+
+    if ctype is None or ctype.kind not in ('struct', 'union'):
+        raise AttributeError('module %r has no attribute %r' %
+                             (__name__, name))
+
+    result = globals()[name] = dtype(ctype)
+    return result
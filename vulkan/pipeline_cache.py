@@ -0,0 +1,79 @@
+"""Pipeline cache persisted on disk
+
+    store = PipelineCacheStore('pipelines.bin', physical_device)
+    cache = store.create(device)
+    ... create pipelines with cache ...
+    store.save(device, cache)
+
+The saved blob is only reused if its header matches the vendor ID, device
+ID and pipeline cache UUID of the physical device, otherwise an empty cache
+is created.
+"""
+import os
+import tempfile
+
+from vulkan._vulkan import (
+    ffi, VK_PIPELINE_CACHE_HEADER_VERSION_ONE, VkPipelineCacheCreateInfo,
+    vkCreatePipelineCache, vkGetPhysicalDeviceProperties,
+    vkGetPipelineCacheData)
+
+
+_HEADER_SIZE = ffi.sizeof('VkPipelineCacheHeaderVersionOne')
+
+
+class PipelineCacheStore(object):
+    """Load and save the pipeline cache of a physical device in a file"""
+    def __init__(self, path, physicalDevice):
+        self.path = path
+        properties = vkGetPhysicalDeviceProperties(physicalDevice)
+        self.vendor_id = properties.vendorID
+        self.device_id = properties.deviceID
+        self.uuid = bytes(ffi.buffer(properties.pipelineCacheUUID))
+
+    def is_valid(self, data):
+        """Check that the header of data matches the physical device"""
+        if len(data) < _HEADER_SIZE:
+            return False
+
+        header = ffi.new('VkPipelineCacheHeaderVersionOne*')
+        ffi.memmove(header, data, _HEADER_SIZE)
+        return (header.headerSize >= _HEADER_SIZE and
+                header.headerVersion ==
+                VK_PIPELINE_CACHE_HEADER_VERSION_ONE and
+                header.vendorID == self.vendor_id and
+                header.deviceID == self.device_id and
+                bytes(ffi.buffer(header.pipelineCacheUUID)) == self.uuid)
+
+    def load(self):
+        """Return the saved blob, None if missing or not valid"""
+        try:
+            with open(self.path, 'rb') as f:
+                data = f.read()
+        except (IOError, OSError):
+            return None
+
+        return data if self.is_valid(data) else None
+
+    def create(self, device, flags=0, pAllocator=None):
+        """Create a pipeline cache initialized with the saved blob"""
+        create_info = VkPipelineCacheCreateInfo(flags=flags,
+                                                pInitialData=self.load())
+        return vkCreatePipelineCache(device, create_info, pAllocator)
+
+    def save(self, device, pipelineCache):
+        """Write the pipeline cache data, atomically replacing the file"""
+        data = vkGetPipelineCacheData(device, pipelineCache)
+        if not self.is_valid(data):
+            return
+
+        folder = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=folder, prefix='.pipeline-cache')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
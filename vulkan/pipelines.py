@@ -0,0 +1,99 @@
+"""Parallel pipeline creation
+
+vkCreateGraphicsPipelines and vkCreateComputePipelines are thread safe and
+cffi releases the GIL during the call, so large batches of create infos can
+be compiled concurrently against one pipeline cache:
+
+    result = create_pipelines(device, cache, create_infos, max_workers=8)
+    for index, error in result.errors.items():
+        ...
+
+The pipeline cache must not have been created with
+VK_PIPELINE_CACHE_CREATE_EXTERNALLY_SYNCHRONIZED_BIT.
+"""
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from vulkan._vulkan import ffi, lib, exception_codes, VkError, _handle
+
+
+PipelineBatch = namedtuple('PipelineBatch', ('pipelines', 'errors'))
+PipelineBatch.__doc__ = """Result of create_pipelines
+
+pipelines: the VkPipeline of each create info, in input order, None when
+           its creation failed
+errors: {index: exception} of the failed create infos
+"""
+
+_COMMANDS = {
+    ffi.typeof('VkGraphicsPipelineCreateInfo'): 'vkCreateGraphicsPipelines',
+    ffi.typeof('VkComputePipelineCreateInfo'): 'vkCreateComputePipelines',
+}
+
+
+def _create_shard(fn, device, pipelineCache, shard, pAllocator):
+    infos = ffi.new(ffi.getctype(ffi.typeof(shard[0]), '[]'), shard)
+    pipelines = ffi.new('VkPipeline[]', len(shard))
+    result = fn(device, pipelineCache, len(shard), infos, pAllocator,
+                pipelines)
+
+    # failed pipelines are set to VK_NULL_HANDLE, the others are valid
+    # even when the command fails
+    return [(p, None) if p != ffi.NULL else
+            (None, exception_codes.get(result, VkError)())
+            for p in pipelines]
+
+
+def create_pipelines(device, pipelineCache, createInfos, pAllocator=None,
+                     max_workers=None, chunk_size=4, executor=None):
+    """Create pipelines from a list of create infos in a thread pool
+
+    createInfos are VkGraphicsPipelineCreateInfo or
+    VkComputePipelineCreateInfo (not mixed). They are split in chunks of
+    `chunk_size`, each chunk is one vk*Pipelines call. An existing
+    `executor` can be given instead of `max_workers`.
+    Return a PipelineBatch. If a chunk raises, the pipelines of the other
+    chunks are destroyed and its exception is raised.
+    """
+    createInfos = list(createInfos)
+    if not createInfos:
+        return PipelineBatch([], {})
+
+    ctype = ffi.typeof(createInfos[0])
+    if ctype not in _COMMANDS:
+        raise TypeError('Expected pipeline create infos, got %s' %
+                        ctype.cname)
+    fn = getattr(lib, _COMMANDS[ctype])
+
+    device = _handle(device, 'VkDevice')
+    pipelineCache = _handle(pipelineCache, 'VkPipelineCache')
+    if pAllocator is None:
+        pAllocator = ffi.NULL
+
+    shards = [createInfos[i:i + chunk_size]
+              for i in range(0, len(createInfos), chunk_size)]
+
+    pool = executor or ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [pool.submit(_create_shard, fn, device, pipelineCache,
+                               shard, pAllocator)
+                   for shard in shards]
+        wait(futures)
+    finally:
+        if executor is None:
+            pool.shutdown()
+
+    failed = [f for f in futures if f.exception() is not None]
+    if failed:
+        for future in futures:
+            if future.exception() is None:
+                for pipeline, _ in future.result():
+                    if pipeline is not None:
+                        lib.vkDestroyPipeline(device, pipeline, pAllocator)
+        raise failed[0].exception()
+
+    results = [r for future in futures for r in future.result()]
+
+    pipelines = [p for p, _ in results]
+    errors = {i: e for i, (_, e) in enumerate(results) if e is not None}
+    return PipelineBatch(pipelines, errors)
@@ -0,0 +1,221 @@
+"""Per-command call counting and timing
+
+    with profiling.profile() as prof:
+        render_frame()
+    for name, stats in sorted(prof.stats.items()):
+        print(name, stats.count, stats.total_time)
+
+`enable()` replaces every command of the vulkan modules by a timed version
+and `disable()` puts the original functions back, so there is no cost at all
+while disabled. Modules are patched in place: a command imported by name
+(`from vulkan import vkCmdDraw`) before enabling is not timed, use
+`vulkan.vkCmdDraw` instead.
+
+The time spent in the C function itself is measured for core commands, the
+remaining time is the argument marshalling done by the wrapper. Extension
+commands call their function pointer directly and only report their total
+time. They are timed if they are fetched (vkGetInstanceProcAddr,
+vkGetDeviceProcAddr) while profiling is enabled, and stay timed after.
+"""
+import functools
+import sys
+import threading
+from collections import namedtuple
+from time import perf_counter as _clock
+
+from vulkan import _vulkan
+from vulkan._vulkan import ffi, lib, _fn_args
+from vulkan.raw import _commands
+
+
+CallStats = namedtuple('CallStats', ('count', 'total_time', 'native_time',
+                                     'marshal_time'))
+CallStats.__doc__ = """Statistics of one command, times are in seconds
+
+native_time and marshal_time are None when the C call can't be measured.
+"""
+
+_lock = threading.Lock()
+_stats = {}
+# {id(timed function): (timed function, original function)} while enabled
+_originals = {}
+# called with (name, argument names, start, end, args, kwargs) after each
+# timed call, see vulkan.trace
+_tracer = None
+
+
+def _stat(name):
+    try:
+        return _stats[name]
+    except KeyError:
+        return _stats.setdefault(name, [0, 0., None])
+
+
+def _timed(name, func):
+    stat = _stat(name)
+    code = func.__code__
+    arg_names = code.co_varnames[:code.co_argcount]
+
+    @functools.wraps(func)
+    def timed(*args, **kwargs):
+        start = _clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            end = _clock()
+            with _lock:
+                stat[0] += 1
+                stat[1] += end - start
+            if _tracer is not None:
+                _tracer(name, arg_names, start, end, args, kwargs)
+
+    return timed
+
+
+def _timed_native(name, func):
+    stat = _stat(name)
+    if stat[2] is None:
+        stat[2] = 0.
+
+    def timed(*args):
+        start = _clock()
+        try:
+            return func(*args)
+        finally:
+            elapsed = _clock() - start
+            with _lock:
+                stat[2] += elapsed
+
+    return timed
+
+
+def _timed_wrap(name, wrap):
+    @functools.wraps(wrap)
+    def timed_wrap(fn):
+        return _timed(name, wrap(fn))
+
+    return timed_wrap
+
+
+class _TimedLib(object):
+    """Replace `lib` in the generated modules to time the C calls"""
+    def __init__(self, lib):
+        self._lib = lib
+
+    def __getattr__(self, name):
+        attr = getattr(self._lib, name)
+        if callable(attr):
+            # wrappers get their argument types from the cdata function
+            if name not in _fn_args:
+                _fn_args[name] = ffi.typeof(attr).args
+            attr = _timed_native(name, attr)
+        setattr(self, name, attr)
+        return attr
+
+
+def _modules():
+    # commands are spread over the lazy groups, load them all first
+    for module_name in _vulkan._lazy_groups:
+        getattr(_vulkan, _vulkan._lazy_groups[module_name][0])
+
+    return [sys.modules[name] for name in
+            ['vulkan', 'vulkan._vulkan'] +
+            ['vulkan.' + m for m in _vulkan._lazy_groups]]
+
+
+def is_enabled():
+    return bool(_originals)
+
+
+def enable():
+    """Start timing the commands, statistics are kept until reset()"""
+    if _originals:
+        return
+
+    modules = _modules()
+    replacements = {}
+    for module in modules:
+        for name, value in list(vars(module).items()):
+            if id(value) not in replacements:
+                if name in _commands and callable(value):
+                    timed = _timed(name, value)
+                elif name.startswith('_wrap_vk'):
+                    timed = _timed_wrap(name[6:], value)
+                else:
+                    continue
+                replacements[id(value)] = timed
+                _originals[id(timed)] = (timed, value)
+            setattr(module, name, replacements[id(value)])
+
+    timed_lib = _TimedLib(lib)
+    _originals[id(timed_lib)] = (timed_lib, lib)
+    for module in modules[2:]:
+        module.lib = timed_lib
+
+
+def disable():
+    """Put the original commands back"""
+    if not _originals:
+        return
+
+    # vulkan.__getattr__ may have cached timed commands since enable()
+    for module in _modules():
+        for name, value in list(vars(module).items()):
+            if id(value) in _originals:
+                setattr(module, name, _originals[id(value)][1])
+    _originals.clear()
+
+
+def reset():
+    """Clear the statistics"""
+    with _lock:
+        for stat in _stats.values():
+            stat[0] = 0
+            stat[1] = 0.
+            if stat[2] is not None:
+                stat[2] = 0.
+
+
+def snapshot():
+    """Return {command name: CallStats} of the commands called since reset"""
+    with _lock:
+        stats = [(name, tuple(stat)) for name, stat in _stats.items()
+                 if stat[0]]
+
+    return {name: CallStats(count, total, native,
+                            None if native is None else total - native)
+            for name, (count, total, native) in stats}
+
+
+class profile(object):
+    """Context manager enabling profiling in its block
+
+    `stats` is the snapshot of the calls made in the block. Profiling is
+    left enabled if it already was.
+    """
+    def __init__(self):
+        self.stats = {}
+        self._enabled = False
+        self._start = {}
+
+    def __enter__(self):
+        self._enabled = not is_enabled()
+        if self._enabled:
+            enable()
+        self._start = snapshot()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = snapshot()
+        if self._enabled:
+            disable()
+
+        self.stats = {}
+        for name, stats in end.items():
+            start = self._start.get(name)
+            if start is not None:
+                stats = CallStats(*[
+                    None if s is None else e - s
+                    for e, s in zip(stats, start)])
+            if stats.count:
+                self.stats[name] = stats
@@ -0,0 +1,45 @@
+"""Struct variants built from a prototype
+
+    base = VkGraphicsPipelineCreateInfo(pStages=stages, ...)
+    infos = [clone(base, renderPass=render_pass, layout=layout)
+             for render_pass, layout in permutations]
+
+`clone` copies the struct itself and converts only the replaced fields:
+the nested structs and arrays of the prototype are shared, not rebuilt.
+"""
+from vulkan._vulkan import (ffi, _arena_state, _fields, _new, _new_owned,
+                            _struct_lengths)
+
+
+def clone(struct, **fields):
+    """Copy of struct with some fields replaced
+
+    Values are converted as in the struct constructors, None or 0 clear the
+    field. The count of a replaced array is updated unless it is given.
+    The copy keeps the prototype alive.
+    """
+    name = ffi.typeof(struct).cname.split(' ')[-1]
+    ptr_type, _ = _fields(name)
+
+    lengths = _struct_lengths.get(name)
+    if lengths:
+        for k in list(fields):
+            count = lengths.get(k)
+            if count is not None and count not in fields:
+                value = fields[k]
+                fields[count] = 0 if value is None else len(value)
+
+    # replaced fields are converted in a struct of their own, which keeps
+    # alive what they point to
+    patch = _new(name, **fields)
+
+    arena = _arena_state.arena
+    if arena is None:
+        ret = _new_owned(ptr_type, struct, (struct, patch))[0]
+    else:
+        ret = arena.new(ptr_type, struct)
+        arena.keep((struct, patch))
+
+    for k in fields:
+        setattr(ret, k, getattr(patch, k))
+    return ret
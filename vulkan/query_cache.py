@@ -0,0 +1,333 @@
+"""Memoized physical device queries
+
+Properties, features, memory properties, queue families and format support
+of a physical device don't change during the life of its instance.
+
+    query_cache.enable()
+    ...
+    vkGetPhysicalDeviceProperties(physical_device)  # driver called once
+
+`enable()` replaces the query commands of the vulkan modules by memoized
+versions, `disable()` puts the original commands back and clears the cache.
+Results are cached per physical device and arguments; for the *2 commands
+per list of structs in the pNext chain of the output. Each call returns a
+fresh copy, or fills the output struct given by the caller, as the original
+commands do. Outputs with pointer members (arrays filled by the driver) are
+not cached.
+
+The cache of the physical devices of an instance is dropped by
+vkDestroyInstance, `invalidate()` drops it explicitly. Physical devices are
+linked to their instance by vkEnumeratePhysicalDevices once the cache is
+enabled: the instances created before must be given to `enable`, the cache
+of the devices they enumerated earlier is otherwise kept after their
+destruction.
+
+Struct arguments (the VkPhysicalDeviceImageFormatInfo2 chain) are keyed by
+their content. VK_ERROR_FORMAT_NOT_SUPPORTED is cached like a result, other
+errors are not.
+
+Memory budgets (VK_EXT_memory_budget) change, memory properties queried with
+a VkPhysicalDeviceMemoryBudgetPropertiesEXT in their chain are never cached.
+"""
+import inspect
+import sys
+
+from vulkan import _vulkan
+from vulkan._vulkan import (ffi, StrWrap, _formats, _slice,
+                            _structure_types)
+from vulkan.hashing import content_hash
+
+
+# {command: (output struct, result wrapped in StrWrap)}
+_QUERIES = {
+    'vkGetPhysicalDeviceProperties': ('VkPhysicalDeviceProperties', True),
+    'vkGetPhysicalDeviceFeatures': ('VkPhysicalDeviceFeatures', False),
+    'vkGetPhysicalDeviceMemoryProperties': (
+        'VkPhysicalDeviceMemoryProperties', False),
+    'vkGetPhysicalDeviceFormatProperties': ('VkFormatProperties', False),
+    'vkGetPhysicalDeviceImageFormatProperties': (
+        'VkImageFormatProperties', False),
+    'vkGetPhysicalDeviceProperties2': ('VkPhysicalDeviceProperties2', False),
+    'vkGetPhysicalDeviceFeatures2': ('VkPhysicalDeviceFeatures2', False),
+    'vkGetPhysicalDeviceMemoryProperties2': (
+        'VkPhysicalDeviceMemoryProperties2', False),
+    'vkGetPhysicalDeviceFormatProperties2': ('VkFormatProperties2', False),
+    'vkGetPhysicalDeviceImageFormatProperties2': (
+        'VkImageFormatProperties2', False),
+}
+
+# errors depending only on the arguments, the others (out of memory) are
+# not cached
+_CACHED_ERRORS = (_vulkan.VkErrorFormatNotSupported,)
+
+_HEADER = ffi.offsetof('VkBaseOutStructure', 'pNext') + ffi.sizeof('void*')
+_UNCACHED = frozenset([
+    _vulkan.VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_MEMORY_BUDGET_PROPERTIES_EXT])
+
+# {physical device: {(command, arguments, chain): payloads or exception
+# class}}
+_cache = {}
+# {physical device: instance}, filled by vkEnumeratePhysicalDevices
+_instances = {}
+# {name: original command} while enabled
+_originals = {}
+
+
+def _address(handle):
+    return int(ffi.cast('uintptr_t', handle)) if handle else 0
+
+
+def _chain(ptr, struct):
+    """[(address, struct)] of ptr and its pNext chain, None if it can't be
+    cached"""
+    chain = [(ptr, struct)]
+    if 'pNext' not in _fields(struct):
+        return chain
+
+    next_ = ffi.cast('VkBaseOutStructure*', ptr).pNext
+    while next_ != ffi.NULL:
+        stype = next_.sType
+        name = _structure_types.get(stype)
+        if name is None or stype in _UNCACHED or _has_pointers(name):
+            return None
+        chain.append((next_, name))
+        next_ = next_.pNext
+    return chain
+
+
+_fields_cache = {}
+
+
+def _fields(struct):
+    try:
+        return _fields_cache[struct]
+    except KeyError:
+        result = _fields_cache[struct] = dict(ffi.typeof(struct).fields)
+        return result
+
+
+_pointers_cache = {}
+
+
+def _has_pointers(struct):
+    """Whether the payload of a struct has pointers, set by the caller"""
+    try:
+        return _pointers_cache[struct]
+    except KeyError:
+        pass
+
+    def walk(ctype):
+        while ctype.kind == 'array':
+            ctype = ctype.item
+        if ctype.kind == 'pointer':
+            return True
+        if ctype.kind not in ('struct', 'union'):
+            return False
+        return any(walk(field.type) for name, field in ctype.fields
+                   if name != 'pNext')
+
+    result = _pointers_cache[struct] = walk(ffi.typeof(struct))
+    return result
+
+
+def _payload(struct):
+    """(start, end) of the bytes filled by the driver"""
+    size = ffi.sizeof(struct)
+    return (_HEADER if 'pNext' in _fields(struct) else 0), size
+
+
+def _key(value):
+    """Hashable key of an argument, structs by content"""
+    if not isinstance(value, ffi.CData):
+        return value
+    if ffi.typeof(value).kind == 'pointer':
+        value = value[0]
+    return content_hash(value)
+
+
+def _memoize(name, original, struct, wrap):
+    # the signature follows __wrapped__, original can be a profiling wrapper
+    parameters = list(inspect.signature(original).parameters)
+    arg_names = parameters[1:-1]
+    out_name = parameters[-1]
+    ptr_type = ffi.typeof(struct + '*')
+
+    def memoized(physicalDevice, *args, **kwargs):
+        values = dict(zip(arg_names, args))
+        values.update(kwargs)
+        out = values.pop(out_name, None)
+        if len(args) > len(arg_names):
+            out = args[len(arg_names)]
+        try:
+            args = tuple(values[n] for n in arg_names)
+        except KeyError:
+            # missing argument, the original raises the TypeError
+            return original(physicalDevice, *args, **kwargs)
+
+        custom_return = bool(out)
+        if not custom_return:
+            out = ffi.new(ptr_type)
+        ptr = out if ffi.typeof(out).kind == 'pointer' else \
+            ffi.addressof(out)
+
+        chain = _chain(ptr, struct)
+        if chain is None:
+            return original(physicalDevice, *(args + (out,)))
+
+        key = (name, tuple(_key(a) for a in args),
+               tuple(s for _, s in chain))
+        device_cache = _cache.setdefault(_address(physicalDevice), {})
+        try:
+            cached = device_cache[key]
+        except KeyError:
+            try:
+                original(physicalDevice, *(args + (out,)))
+            except _CACHED_ERRORS as e:
+                device_cache[key] = type(e)
+                raise
+            cached = device_cache[key] = [
+                ffi.buffer(p, ffi.sizeof(s))[slice(*_payload(s))]
+                for p, s in chain]
+        else:
+            if isinstance(cached, type):
+                raise cached()
+            for (p, s), payload in zip(chain, cached):
+                start, _ = _payload(s)
+                ffi.memmove(ffi.cast('char*', p) + start, payload,
+                            len(payload))
+
+        if custom_return:
+            return out
+        return StrWrap(out[0]) if wrap else out[0]
+
+    memoized.__name__ = name
+    memoized.__doc__ = original.__doc__
+    return memoized
+
+
+def _memoize_queue_families(original):
+    def vkGetPhysicalDeviceQueueFamilyProperties(physicalDevice,
+                                                 pQueueFamilyProperties=None):
+        device_cache = _cache.setdefault(_address(physicalDevice), {})
+        try:
+            cached = device_cache['vkGetPhysicalDeviceQueueFamilyProperties']
+        except KeyError:
+            result = original(physicalDevice)
+            cached = device_cache[
+                'vkGetPhysicalDeviceQueueFamilyProperties'] = (
+                len(result), ffi.buffer(result)[:])
+
+        count, data = cached
+        result = pQueueFamilyProperties
+        if result is None or len(result) < count:
+            result = ffi.new('VkQueueFamilyProperties[]', count)
+        ffi.memmove(result, data, len(data))
+        if count != len(result):
+            result = _slice(result, count)
+        return result
+
+    return vkGetPhysicalDeviceQueueFamilyProperties
+
+
+def _track_enumerate(original):
+    def vkEnumeratePhysicalDevices(instance, pPhysicalDevices=None):
+        result = original(instance, pPhysicalDevices)
+        for physical_device in result:
+            _instances[_address(physical_device)] = _address(instance)
+        return result
+
+    return vkEnumeratePhysicalDevices
+
+
+def _track_destroy(original):
+    def vkDestroyInstance(instance, pAllocator):
+        invalidate(instance)
+        return original(instance, pAllocator)
+
+    return vkDestroyInstance
+
+
+def _replace(name, replacement):
+    original = getattr(_vulkan, name)
+    for module in (sys.modules['vulkan'], _vulkan,
+                   sys.modules[original.__module__]):
+        if vars(module).get(name) is original:
+            setattr(module, name, replacement)
+    return original
+
+
+def is_enabled():
+    return bool(_originals)
+
+
+def enable(instances=()):
+    """Memoize the physical device queries
+
+    The physical devices of `instances`, created before, are linked to them
+    to be invalidated by vkDestroyInstance.
+    """
+    if not _originals:
+        for name, (struct, wrap) in _QUERIES.items():
+            original = getattr(_vulkan, name)
+            _originals[name] = _replace(name, _memoize(name, original,
+                                                       struct, wrap))
+        for name, factory in (
+                ('vkGetPhysicalDeviceQueueFamilyProperties',
+                 _memoize_queue_families),
+                ('vkEnumeratePhysicalDevices', _track_enumerate),
+                ('vkDestroyInstance', _track_destroy)):
+            original = getattr(_vulkan, name)
+            _originals[name] = _replace(name, factory(original))
+
+    for instance in instances:
+        _vulkan.vkEnumeratePhysicalDevices(instance)
+
+
+def disable():
+    """Put the original queries back and clear the cache"""
+    for name, original in _originals.items():
+        current = getattr(_vulkan, name)
+        for module in (sys.modules['vulkan'], _vulkan,
+                       sys.modules[original.__module__]):
+            if vars(module).get(name) is current:
+                setattr(module, name, original)
+    _originals.clear()
+    invalidate()
+
+
+def invalidate(instance=None):
+    """Drop the cache of the physical devices of instance, or all of it"""
+    if instance is None:
+        _cache.clear()
+        _instances.clear()
+        return
+
+    instance = _address(instance)
+    for physical_device, owner in list(_instances.items()):
+        if owner == instance:
+            _cache.pop(physical_device, None)
+            del _instances[physical_device]
+
+
+def snapshot(physicalDevice, formats=True):
+    """Query everything cacheable of a physical device at once
+
+    Return a dict with the properties, features, memory_properties and
+    queue_families of the device and, if `formats`, the VkFormatProperties
+    of every format (a dict by VkFormat). The results are kept if the cache
+    is enabled.
+    """
+    result = {
+        'properties': _vulkan.vkGetPhysicalDeviceProperties(physicalDevice),
+        'features': _vulkan.vkGetPhysicalDeviceFeatures(physicalDevice),
+        'memory_properties': _vulkan.vkGetPhysicalDeviceMemoryProperties(
+            physicalDevice),
+        'queue_families': _vulkan.vkGetPhysicalDeviceQueueFamilyProperties(
+            physicalDevice),
+    }
+    if formats:
+        get_format = _vulkan.vkGetPhysicalDeviceFormatProperties
+        result['formats'] = {f: get_format(physicalDevice, f)
+                             for f in sorted(set(_formats))
+                             if f != _vulkan.VK_FORMAT_UNDEFINED}
+    return result
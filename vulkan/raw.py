@@ -0,0 +1,1175 @@
+"""Unwrapped Vulkan commands
+
+Core commands are the cffi functions of the loader and extension commands
+are function pointers resolved once per instance or device. Arguments are
+not converted: pass cdata or values cffi accepts, and keep alive whatever
+they point to. VkResult is returned as an int, no exception is raised.
+"""
+from vulkan._vulkan import ffi, lib
+
+
+_commands = frozenset((
+    'vkCreateInstance',
+    'vkDestroyInstance',
+    'vkEnumeratePhysicalDevices',
+    'vkGetPhysicalDeviceProperties',
+    'vkGetPhysicalDeviceQueueFamilyProperties',
+    'vkGetPhysicalDeviceMemoryProperties',
+    'vkGetPhysicalDeviceFeatures',
+    'vkGetPhysicalDeviceFormatProperties',
+    'vkGetPhysicalDeviceImageFormatProperties',
+    'vkCreateDevice',
+    'vkCreateDevice',
+    'vkDestroyDevice',
+    'vkEnumerateInstanceVersion',
+    'vkEnumerateInstanceLayerProperties',
+    'vkEnumerateInstanceExtensionProperties',
+    'vkEnumerateDeviceLayerProperties',
+    'vkEnumerateDeviceLayerProperties',
+    'vkEnumerateDeviceExtensionProperties',
+    'vkGetDeviceQueue',
+    'vkQueueSubmit',
+    'vkQueueWaitIdle',
+    'vkDeviceWaitIdle',
+    'vkAllocateMemory',
+    'vkFreeMemory',
+    'vkUnmapMemory',
+    'vkFlushMappedMemoryRanges',
+    'vkInvalidateMappedMemoryRanges',
+    'vkGetDeviceMemoryCommitment',
+    'vkGetBufferMemoryRequirements',
+    'vkBindBufferMemory',
+    'vkGetImageMemoryRequirements',
+    'vkBindImageMemory',
+    'vkGetImageSparseMemoryRequirements',
+    'vkGetPhysicalDeviceSparseImageFormatProperties',
+    'vkQueueBindSparse',
+    'vkCreateFence',
+    'vkDestroyFence',
+    'vkResetFences',
+    'vkGetFenceStatus',
+    'vkWaitForFences',
+    'vkCreateSemaphore',
+    'vkDestroySemaphore',
+    'vkCreateEvent',
+    'vkDestroyEvent',
+    'vkGetEventStatus',
+    'vkSetEvent',
+    'vkResetEvent',
+    'vkCreateQueryPool',
+    'vkDestroyQueryPool',
+    'vkGetQueryPoolResults',
+    'vkResetQueryPool',
+    'vkCreateBuffer',
+    'vkDestroyBuffer',
+    'vkCreateBufferView',
+    'vkDestroyBufferView',
+    'vkCreateImage',
+    'vkDestroyImage',
+    'vkGetImageSubresourceLayout',
+    'vkCreateImageView',
+    'vkDestroyImageView',
+    'vkCreateShaderModule',
+    'vkDestroyShaderModule',
+    'vkCreatePipelineCache',
+    'vkCreatePipelineCache',
+    'vkDestroyPipelineCache',
+    'vkMergePipelineCaches',
+    'vkCreateGraphicsPipelines',
+    'vkCreateGraphicsPipelines',
+    'vkCreateComputePipelines',
+    'vkCreateComputePipelines',
+    'vkDestroyPipeline',
+    'vkCreatePipelineLayout',
+    'vkDestroyPipelineLayout',
+    'vkCreateSampler',
+    'vkDestroySampler',
+    'vkCreateDescriptorSetLayout',
+    'vkDestroyDescriptorSetLayout',
+    'vkCreateDescriptorPool',
+    'vkDestroyDescriptorPool',
+    'vkResetDescriptorPool',
+    'vkAllocateDescriptorSets',
+    'vkFreeDescriptorSets',
+    'vkUpdateDescriptorSets',
+    'vkCreateFramebuffer',
+    'vkDestroyFramebuffer',
+    'vkCreateRenderPass',
+    'vkDestroyRenderPass',
+    'vkGetRenderAreaGranularity',
+    'vkCreateCommandPool',
+    'vkDestroyCommandPool',
+    'vkResetCommandPool',
+    'vkAllocateCommandBuffers',
+    'vkFreeCommandBuffers',
+    'vkBeginCommandBuffer',
+    'vkEndCommandBuffer',
+    'vkResetCommandBuffer',
+    'vkCmdBindPipeline',
+    'vkCmdSetViewport',
+    'vkCmdSetScissor',
+    'vkCmdSetLineWidth',
+    'vkCmdSetDepthBias',
+    'vkCmdSetBlendConstants',
+    'vkCmdSetDepthBounds',
+    'vkCmdSetStencilCompareMask',
+    'vkCmdSetStencilWriteMask',
+    'vkCmdSetStencilReference',
+    'vkCmdBindDescriptorSets',
+    'vkCmdBindIndexBuffer',
+    'vkCmdBindVertexBuffers',
+    'vkCmdDraw',
+    'vkCmdDrawIndexed',
+    'vkCmdDrawIndirect',
+    'vkCmdDrawIndexedIndirect',
+    'vkCmdDispatch',
+    'vkCmdDispatchIndirect',
+    'vkCmdCopyBuffer',
+    'vkCmdCopyImage',
+    'vkCmdBlitImage',
+    'vkCmdCopyBufferToImage',
+    'vkCmdCopyImageToBuffer',
+    'vkCmdUpdateBuffer',
+    'vkCmdFillBuffer',
+    'vkCmdClearColorImage',
+    'vkCmdClearDepthStencilImage',
+    'vkCmdClearAttachments',
+    'vkCmdResolveImage',
+    'vkCmdSetEvent',
+    'vkCmdResetEvent',
+    'vkCmdWaitEvents',
+    'vkCmdPipelineBarrier',
+    'vkCmdBeginQuery',
+    'vkCmdEndQuery',
+    'vkCmdResetQueryPool',
+    'vkCmdWriteTimestamp',
+    'vkCmdCopyQueryPoolResults',
+    'vkCmdPushConstants',
+    'vkCmdBeginRenderPass',
+    'vkCmdNextSubpass',
+    'vkCmdEndRenderPass',
+    'vkCmdExecuteCommands',
+    'vkGetPhysicalDeviceFeatures2',
+    'vkGetPhysicalDeviceProperties2',
+    'vkGetPhysicalDeviceFormatProperties2',
+    'vkGetPhysicalDeviceImageFormatProperties2',
+    'vkGetPhysicalDeviceQueueFamilyProperties2',
+    'vkGetPhysicalDeviceMemoryProperties2',
+    'vkGetPhysicalDeviceSparseImageFormatProperties2',
+    'vkTrimCommandPool',
+    'vkGetPhysicalDeviceExternalBufferProperties',
+    'vkGetPhysicalDeviceExternalSemaphoreProperties',
+    'vkGetPhysicalDeviceExternalFenceProperties',
+    'vkEnumeratePhysicalDeviceGroups',
+    'vkGetDeviceGroupPeerMemoryFeatures',
+    'vkBindBufferMemory2',
+    'vkBindImageMemory2',
+    'vkCmdSetDeviceMask',
+    'vkCmdDispatchBase',
+    'vkCreateDescriptorUpdateTemplate',
+    'vkDestroyDescriptorUpdateTemplate',
+    'vkUpdateDescriptorSetWithTemplate',
+    'vkGetBufferMemoryRequirements2',
+    'vkGetImageMemoryRequirements2',
+    'vkGetImageSparseMemoryRequirements2',
+    'vkGetDeviceBufferMemoryRequirements',
+    'vkGetDeviceImageMemoryRequirements',
+    'vkGetDeviceImageSparseMemoryRequirements',
+    'vkCreateSamplerYcbcrConversion',
+    'vkDestroySamplerYcbcrConversion',
+    'vkGetDeviceQueue2',
+    'vkGetDescriptorSetLayoutSupport',
+    'vkCreateRenderPass2',
+    'vkCmdBeginRenderPass2',
+    'vkCmdNextSubpass2',
+    'vkCmdEndRenderPass2',
+    'vkGetSemaphoreCounterValue',
+    'vkWaitSemaphores',
+    'vkSignalSemaphore',
+    'vkCmdDrawIndirectCount',
+    'vkCmdDrawIndexedIndirectCount',
+    'vkGetBufferOpaqueCaptureAddress',
+    'vkGetBufferDeviceAddress',
+    'vkGetDeviceMemoryOpaqueCaptureAddress',
+    'vkGetFaultData',
+    'vkGetPhysicalDeviceToolProperties',
+    'vkCmdSetCullMode',
+    'vkCmdSetFrontFace',
+    'vkCmdSetPrimitiveTopology',
+    'vkCmdSetViewportWithCount',
+    'vkCmdSetScissorWithCount',
+    'vkCmdBindVertexBuffers2',
+    'vkCmdSetDepthTestEnable',
+    'vkCmdSetDepthWriteEnable',
+    'vkCmdSetDepthCompareOp',
+    'vkCmdSetDepthBoundsTestEnable',
+    'vkCmdSetStencilTestEnable',
+    'vkCmdSetStencilOp',
+    'vkCmdSetRasterizerDiscardEnable',
+    'vkCmdSetDepthBiasEnable',
+    'vkCmdSetPrimitiveRestartEnable',
+    'vkCreatePrivateDataSlot',
+    'vkDestroyPrivateDataSlot',
+    'vkSetPrivateData',
+    'vkGetPrivateData',
+    'vkCmdCopyBuffer2',
+    'vkCmdCopyImage2',
+    'vkCmdBlitImage2',
+    'vkCmdCopyBufferToImage2',
+    'vkCmdCopyImageToBuffer2',
+    'vkCmdResolveImage2',
+    'vkCmdSetEvent2',
+    'vkCmdResetEvent2',
+    'vkCmdWaitEvents2',
+    'vkCmdPipelineBarrier2',
+    'vkQueueSubmit2',
+    'vkCmdWriteTimestamp2',
+    'vkGetCommandPoolMemoryConsumption',
+    'vkCmdBeginRendering',
+    'vkCmdEndRendering',
+    'vkGetInstanceProcAddr',
+    'vkGetDeviceProcAddr',
+    'vkMapMemory',
+    'vkGetPipelineCacheData',
+))
+
+_instance_commands = (
+    'vkDestroySurfaceKHR',
+    'vkGetPhysicalDeviceSurfaceSupportKHR',
+    'vkGetPhysicalDeviceSurfaceCapabilitiesKHR',
+    'vkGetPhysicalDeviceSurfaceFormatsKHR',
+    'vkGetPhysicalDeviceSurfacePresentModesKHR',
+    'vkGetPhysicalDeviceDisplayPropertiesKHR',
+    'vkGetPhysicalDeviceDisplayPlanePropertiesKHR',
+    'vkGetDisplayPlaneSupportedDisplaysKHR',
+    'vkGetDisplayModePropertiesKHR',
+    'vkCreateDisplayModeKHR',
+    'vkGetDisplayPlaneCapabilitiesKHR',
+    'vkCreateDisplayPlaneSurfaceKHR',
+    'vkCreateXlibSurfaceKHR',
+    'vkGetPhysicalDeviceXlibPresentationSupportKHR',
+    'vkCreateXcbSurfaceKHR',
+    'vkGetPhysicalDeviceXcbPresentationSupportKHR',
+    'vkCreateWaylandSurfaceKHR',
+    'vkGetPhysicalDeviceWaylandPresentationSupportKHR',
+    'vkCreateAndroidSurfaceKHR',
+    'vkCreateWin32SurfaceKHR',
+    'vkGetPhysicalDeviceWin32PresentationSupportKHR',
+    'vkCreateDebugReportCallbackEXT',
+    'vkDestroyDebugReportCallbackEXT',
+    'vkDebugReportMessageEXT',
+    'vkCreateStreamDescriptorSurfaceGGP',
+    'vkGetPhysicalDeviceExternalImageFormatPropertiesNV',
+    'vkGetPhysicalDeviceFeatures2KHR',
+    'vkGetPhysicalDeviceProperties2KHR',
+    'vkGetPhysicalDeviceFormatProperties2KHR',
+    'vkGetPhysicalDeviceImageFormatProperties2KHR',
+    'vkGetPhysicalDeviceQueueFamilyProperties2KHR',
+    'vkGetPhysicalDeviceMemoryProperties2KHR',
+    'vkGetPhysicalDeviceSparseImageFormatProperties2KHR',
+    'vkCreateViSurfaceNN',
+    'vkEnumeratePhysicalDeviceGroupsKHR',
+    'vkGetPhysicalDeviceExternalBufferPropertiesKHR',
+    'vkGetPhysicalDeviceExternalSemaphorePropertiesKHR',
+    'vkReleaseDisplayEXT',
+    'vkAcquireXlibDisplayEXT',
+    'vkGetRandROutputDisplayEXT',
+    'vkGetPhysicalDeviceSurfaceCapabilities2EXT',
+    'vkGetPhysicalDeviceExternalFencePropertiesKHR',
+    'vkGetPhysicalDeviceSurfaceCapabilities2KHR',
+    'vkGetPhysicalDeviceSurfaceFormats2KHR',
+    'vkGetPhysicalDeviceDisplayProperties2KHR',
+    'vkGetPhysicalDeviceDisplayPlaneProperties2KHR',
+    'vkGetDisplayModeProperties2KHR',
+    'vkGetDisplayPlaneCapabilities2KHR',
+    'vkCreateIOSSurfaceMVK',
+    'vkCreateMacOSSurfaceMVK',
+    'vkSetDebugUtilsObjectNameEXT',
+    'vkSetDebugUtilsObjectTagEXT',
+    'vkQueueBeginDebugUtilsLabelEXT',
+    'vkQueueEndDebugUtilsLabelEXT',
+    'vkQueueInsertDebugUtilsLabelEXT',
+    'vkCmdBeginDebugUtilsLabelEXT',
+    'vkCmdEndDebugUtilsLabelEXT',
+    'vkCmdInsertDebugUtilsLabelEXT',
+    'vkCreateDebugUtilsMessengerEXT',
+    'vkDestroyDebugUtilsMessengerEXT',
+    'vkSubmitDebugUtilsMessageEXT',
+    'vkCreateImagePipeSurfaceFUCHSIA',
+    'vkCreateMetalSurfaceEXT',
+    'vkCreateHeadlessSurfaceEXT',
+    'vkAcquireDrmDisplayEXT',
+    'vkGetDrmDisplayEXT',
+    'vkCreateDirectFBSurfaceEXT',
+    'vkGetPhysicalDeviceDirectFBPresentationSupportEXT',
+    'vkCreateScreenSurfaceQNX',
+    'vkGetPhysicalDeviceScreenPresentationSupportQNX',
+    'vkCreateSwapchainKHR',
+    'vkDestroySwapchainKHR',
+    'vkGetSwapchainImagesKHR',
+    'vkAcquireNextImageKHR',
+    'vkQueuePresentKHR',
+    'vkGetDeviceGroupPresentCapabilitiesKHR',
+    'vkGetDeviceGroupSurfacePresentModesKHR',
+    'vkGetPhysicalDevicePresentRectanglesKHR',
+    'vkAcquireNextImage2KHR',
+    'vkCreateSharedSwapchainsKHR',
+    'vkGetSwapchainGrallocUsageANDROID',
+    'vkAcquireImageANDROID',
+    'vkQueueSignalReleaseImageANDROID',
+    'vkGetSwapchainGrallocUsage2ANDROID',
+    'vkDebugMarkerSetObjectTagEXT',
+    'vkDebugMarkerSetObjectNameEXT',
+    'vkCmdDebugMarkerBeginEXT',
+    'vkCmdDebugMarkerEndEXT',
+    'vkCmdDebugMarkerInsertEXT',
+    'vkGetPhysicalDeviceVideoCapabilitiesKHR',
+    'vkGetPhysicalDeviceVideoFormatPropertiesKHR',
+    'vkCreateVideoSessionKHR',
+    'vkDestroyVideoSessionKHR',
+    'vkGetVideoSessionMemoryRequirementsKHR',
+    'vkBindVideoSessionMemoryKHR',
+    'vkCreateVideoSessionParametersKHR',
+    'vkUpdateVideoSessionParametersKHR',
+    'vkDestroyVideoSessionParametersKHR',
+    'vkCmdBeginVideoCodingKHR',
+    'vkCmdEndVideoCodingKHR',
+    'vkCmdControlVideoCodingKHR',
+    'vkCmdDecodeVideoKHR',
+    'vkCmdBindTransformFeedbackBuffersEXT',
+    'vkCmdBeginTransformFeedbackEXT',
+    'vkCmdEndTransformFeedbackEXT',
+    'vkCmdBeginQueryIndexedEXT',
+    'vkCmdEndQueryIndexedEXT',
+    'vkCmdDrawIndirectByteCountEXT',
+    'vkCreateCuModuleNVX',
+    'vkCreateCuFunctionNVX',
+    'vkDestroyCuModuleNVX',
+    'vkDestroyCuFunctionNVX',
+    'vkCmdCuLaunchKernelNVX',
+    'vkGetImageViewHandleNVX',
+    'vkGetImageViewAddressNVX',
+    'vkCmdDrawIndirectCountAMD',
+    'vkCmdDrawIndexedIndirectCountAMD',
+    'vkGetShaderInfoAMD',
+    'vkCmdBeginRenderingKHR',
+    'vkCmdEndRenderingKHR',
+    'vkGetMemoryWin32HandleNV',
+    'vkGetDeviceGroupPeerMemoryFeaturesKHR',
+    'vkCmdSetDeviceMaskKHR',
+    'vkCmdDispatchBaseKHR',
+    'vkTrimCommandPoolKHR',
+    'vkGetMemoryWin32HandleKHR',
+    'vkGetMemoryWin32HandlePropertiesKHR',
+    'vkGetMemoryFdKHR',
+    'vkGetMemoryFdPropertiesKHR',
+    'vkImportSemaphoreWin32HandleKHR',
+    'vkGetSemaphoreWin32HandleKHR',
+    'vkImportSemaphoreFdKHR',
+    'vkGetSemaphoreFdKHR',
+    'vkCmdPushDescriptorSetKHR',
+    'vkCmdPushDescriptorSetWithTemplateKHR',
+    'vkCmdBeginConditionalRenderingEXT',
+    'vkCmdEndConditionalRenderingEXT',
+    'vkCreateDescriptorUpdateTemplateKHR',
+    'vkDestroyDescriptorUpdateTemplateKHR',
+    'vkUpdateDescriptorSetWithTemplateKHR',
+    'vkCmdSetViewportWScalingNV',
+    'vkDisplayPowerControlEXT',
+    'vkRegisterDeviceEventEXT',
+    'vkRegisterDisplayEventEXT',
+    'vkGetSwapchainCounterEXT',
+    'vkGetRefreshCycleDurationGOOGLE',
+    'vkGetPastPresentationTimingGOOGLE',
+    'vkCmdSetDiscardRectangleEXT',
+    'vkCmdSetDiscardRectangleEnableEXT',
+    'vkCmdSetDiscardRectangleModeEXT',
+    'vkSetHdrMetadataEXT',
+    'vkCreateRenderPass2KHR',
+    'vkCmdBeginRenderPass2KHR',
+    'vkCmdNextSubpass2KHR',
+    'vkCmdEndRenderPass2KHR',
+    'vkGetSwapchainStatusKHR',
+    'vkImportFenceWin32HandleKHR',
+    'vkGetFenceWin32HandleKHR',
+    'vkImportFenceFdKHR',
+    'vkGetFenceFdKHR',
+    'vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR',
+    'vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR',
+    'vkAcquireProfilingLockKHR',
+    'vkReleaseProfilingLockKHR',
+    'vkGetAndroidHardwareBufferPropertiesANDROID',
+    'vkGetMemoryAndroidHardwareBufferANDROID',
+    'vkCreateExecutionGraphPipelinesAMDX',
+    'vkGetExecutionGraphPipelineScratchSizeAMDX',
+    'vkGetExecutionGraphPipelineNodeIndexAMDX',
+    'vkCmdInitializeGraphScratchMemoryAMDX',
+    'vkCmdDispatchGraphAMDX',
+    'vkCmdDispatchGraphIndirectAMDX',
+    'vkCmdDispatchGraphIndirectCountAMDX',
+    'vkCmdSetSampleLocationsEXT',
+    'vkGetPhysicalDeviceMultisamplePropertiesEXT',
+    'vkGetImageMemoryRequirements2KHR',
+    'vkGetBufferMemoryRequirements2KHR',
+    'vkGetImageSparseMemoryRequirements2KHR',
+    'vkCreateAccelerationStructureKHR',
+    'vkDestroyAccelerationStructureKHR',
+    'vkCmdBuildAccelerationStructuresKHR',
+    'vkCmdBuildAccelerationStructuresIndirectKHR',
+    'vkBuildAccelerationStructuresKHR',
+    'vkCopyAccelerationStructureKHR',
+    'vkCopyAccelerationStructureToMemoryKHR',
+    'vkCopyMemoryToAccelerationStructureKHR',
+    'vkWriteAccelerationStructuresPropertiesKHR',
+    'vkCmdCopyAccelerationStructureKHR',
+    'vkCmdCopyAccelerationStructureToMemoryKHR',
+    'vkCmdCopyMemoryToAccelerationStructureKHR',
+    'vkGetAccelerationStructureDeviceAddressKHR',
+    'vkCmdWriteAccelerationStructuresPropertiesKHR',
+    'vkGetDeviceAccelerationStructureCompatibilityKHR',
+    'vkGetAccelerationStructureBuildSizesKHR',
+    'vkCmdTraceRaysKHR',
+    'vkCreateRayTracingPipelinesKHR',
+    'vkGetRayTracingShaderGroupHandlesKHR',
+    'vkGetRayTracingCaptureReplayShaderGroupHandlesKHR',
+    'vkCmdTraceRaysIndirectKHR',
+    'vkGetRayTracingShaderGroupStackSizeKHR',
+    'vkCmdSetRayTracingPipelineStackSizeKHR',
+    'vkCreateSamplerYcbcrConversionKHR',
+    'vkDestroySamplerYcbcrConversionKHR',
+    'vkBindBufferMemory2KHR',
+    'vkBindImageMemory2KHR',
+    'vkGetImageDrmFormatModifierPropertiesEXT',
+    'vkCreateValidationCacheEXT',
+    'vkDestroyValidationCacheEXT',
+    'vkMergeValidationCachesEXT',
+    'vkGetValidationCacheDataEXT',
+    'vkCmdBindShadingRateImageNV',
+    'vkCmdSetViewportShadingRatePaletteNV',
+    'vkCmdSetCoarseSampleOrderNV',
+    'vkCreateAccelerationStructureNV',
+    'vkDestroyAccelerationStructureNV',
+    'vkGetAccelerationStructureMemoryRequirementsNV',
+    'vkBindAccelerationStructureMemoryNV',
+    'vkCmdBuildAccelerationStructureNV',
+    'vkCmdCopyAccelerationStructureNV',
+    'vkCmdTraceRaysNV',
+    'vkCreateRayTracingPipelinesNV',
+    'vkGetRayTracingShaderGroupHandlesNV',
+    'vkGetAccelerationStructureHandleNV',
+    'vkCmdWriteAccelerationStructuresPropertiesNV',
+    'vkCompileDeferredNV',
+    'vkGetDescriptorSetLayoutSupportKHR',
+    'vkCmdDrawIndirectCountKHR',
+    'vkCmdDrawIndexedIndirectCountKHR',
+    'vkGetMemoryHostPointerPropertiesEXT',
+    'vkCmdWriteBufferMarkerAMD',
+    'vkGetPhysicalDeviceCalibrateableTimeDomainsEXT',
+    'vkGetCalibratedTimestampsEXT',
+    'vkCmdDrawMeshTasksNV',
+    'vkCmdDrawMeshTasksIndirectNV',
+    'vkCmdDrawMeshTasksIndirectCountNV',
+    'vkCmdSetExclusiveScissorEnableNV',
+    'vkCmdSetExclusiveScissorNV',
+    'vkCmdSetCheckpointNV',
+    'vkGetQueueCheckpointDataNV',
+    'vkGetSemaphoreCounterValueKHR',
+    'vkWaitSemaphoresKHR',
+    'vkSignalSemaphoreKHR',
+    'vkInitializePerformanceApiINTEL',
+    'vkUninitializePerformanceApiINTEL',
+    'vkCmdSetPerformanceMarkerINTEL',
+    'vkCmdSetPerformanceStreamMarkerINTEL',
+    'vkCmdSetPerformanceOverrideINTEL',
+    'vkAcquirePerformanceConfigurationINTEL',
+    'vkReleasePerformanceConfigurationINTEL',
+    'vkQueueSetPerformanceConfigurationINTEL',
+    'vkGetPerformanceParameterINTEL',
+    'vkSetLocalDimmingAMD',
+    'vkGetPhysicalDeviceFragmentShadingRatesKHR',
+    'vkCmdSetFragmentShadingRateKHR',
+    'vkGetBufferDeviceAddressEXT',
+    'vkGetPhysicalDeviceToolPropertiesEXT',
+    'vkWaitForPresentKHR',
+    'vkGetPhysicalDeviceCooperativeMatrixPropertiesNV',
+    'vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV',
+    'vkGetPhysicalDeviceSurfacePresentModes2EXT',
+    'vkAcquireFullScreenExclusiveModeEXT',
+    'vkReleaseFullScreenExclusiveModeEXT',
+    'vkGetDeviceGroupSurfacePresentModes2EXT',
+    'vkGetBufferDeviceAddressKHR',
+    'vkGetBufferOpaqueCaptureAddressKHR',
+    'vkGetDeviceMemoryOpaqueCaptureAddressKHR',
+    'vkCmdSetLineStippleEXT',
+    'vkResetQueryPoolEXT',
+    'vkCmdSetCullModeEXT',
+    'vkCmdSetFrontFaceEXT',
+    'vkCmdSetPrimitiveTopologyEXT',
+    'vkCmdSetViewportWithCountEXT',
+    'vkCmdSetScissorWithCountEXT',
+    'vkCmdBindVertexBuffers2EXT',
+    'vkCmdSetDepthTestEnableEXT',
+    'vkCmdSetDepthWriteEnableEXT',
+    'vkCmdSetDepthCompareOpEXT',
+    'vkCmdSetDepthBoundsTestEnableEXT',
+    'vkCmdSetStencilTestEnableEXT',
+    'vkCmdSetStencilOpEXT',
+    'vkCreateDeferredOperationKHR',
+    'vkDestroyDeferredOperationKHR',
+    'vkGetDeferredOperationMaxConcurrencyKHR',
+    'vkGetDeferredOperationResultKHR',
+    'vkDeferredOperationJoinKHR',
+    'vkGetPipelineExecutablePropertiesKHR',
+    'vkGetPipelineExecutableStatisticsKHR',
+    'vkGetPipelineExecutableInternalRepresentationsKHR',
+    'vkCopyMemoryToImageEXT',
+    'vkCopyImageToMemoryEXT',
+    'vkCopyImageToImageEXT',
+    'vkTransitionImageLayoutEXT',
+    'vkGetImageSubresourceLayout2EXT',
+    'vkMapMemory2KHR',
+    'vkUnmapMemory2KHR',
+    'vkReleaseSwapchainImagesEXT',
+    'vkGetGeneratedCommandsMemoryRequirementsNV',
+    'vkCmdPreprocessGeneratedCommandsNV',
+    'vkCmdExecuteGeneratedCommandsNV',
+    'vkCmdBindPipelineShaderGroupNV',
+    'vkCreateIndirectCommandsLayoutNV',
+    'vkDestroyIndirectCommandsLayoutNV',
+    'vkCmdSetDepthBias2EXT',
+    'vkCreatePrivateDataSlotEXT',
+    'vkDestroyPrivateDataSlotEXT',
+    'vkSetPrivateDataEXT',
+    'vkGetPrivateDataEXT',
+    'vkGetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR',
+    'vkGetEncodedVideoSessionParametersKHR',
+    'vkCmdEncodeVideoKHR',
+    'vkCreateCudaModuleNV',
+    'vkGetCudaModuleCacheNV',
+    'vkCreateCudaFunctionNV',
+    'vkDestroyCudaModuleNV',
+    'vkDestroyCudaFunctionNV',
+    'vkCmdCudaLaunchKernelNV',
+    'vkCmdRefreshObjectsKHR',
+    'vkGetPhysicalDeviceRefreshableObjectTypesKHR',
+    'vkExportMetalObjectsEXT',
+    'vkCmdSetEvent2KHR',
+    'vkCmdResetEvent2KHR',
+    'vkCmdWaitEvents2KHR',
+    'vkCmdPipelineBarrier2KHR',
+    'vkCmdWriteTimestamp2KHR',
+    'vkQueueSubmit2KHR',
+    'vkCmdWriteBufferMarker2AMD',
+    'vkGetQueueCheckpointData2NV',
+    'vkGetDescriptorSetLayoutSizeEXT',
+    'vkGetDescriptorSetLayoutBindingOffsetEXT',
+    'vkGetDescriptorEXT',
+    'vkCmdBindDescriptorBuffersEXT',
+    'vkCmdSetDescriptorBufferOffsetsEXT',
+    'vkCmdBindDescriptorBufferEmbeddedSamplersEXT',
+    'vkGetBufferOpaqueCaptureDescriptorDataEXT',
+    'vkGetImageOpaqueCaptureDescriptorDataEXT',
+    'vkGetImageViewOpaqueCaptureDescriptorDataEXT',
+    'vkGetSamplerOpaqueCaptureDescriptorDataEXT',
+    'vkGetAccelerationStructureOpaqueCaptureDescriptorDataEXT',
+    'vkCmdSetFragmentShadingRateEnumNV',
+    'vkCmdDrawMeshTasksEXT',
+    'vkCmdDrawMeshTasksIndirectEXT',
+    'vkCmdDrawMeshTasksIndirectCountEXT',
+    'vkCmdCopyBuffer2KHR',
+    'vkCmdCopyImage2KHR',
+    'vkCmdCopyBufferToImage2KHR',
+    'vkCmdCopyImageToBuffer2KHR',
+    'vkCmdBlitImage2KHR',
+    'vkCmdResolveImage2KHR',
+    'vkGetDeviceFaultInfoEXT',
+    'vkAcquireWinrtDisplayNV',
+    'vkGetWinrtDisplayNV',
+    'vkCmdSetVertexInputEXT',
+    'vkGetMemoryZirconHandleFUCHSIA',
+    'vkGetMemoryZirconHandlePropertiesFUCHSIA',
+    'vkImportSemaphoreZirconHandleFUCHSIA',
+    'vkGetSemaphoreZirconHandleFUCHSIA',
+    'vkCreateBufferCollectionFUCHSIA',
+    'vkSetBufferCollectionImageConstraintsFUCHSIA',
+    'vkSetBufferCollectionBufferConstraintsFUCHSIA',
+    'vkDestroyBufferCollectionFUCHSIA',
+    'vkGetBufferCollectionPropertiesFUCHSIA',
+    'vkGetDeviceSubpassShadingMaxWorkgroupSizeHUAWEI',
+    'vkCmdSubpassShadingHUAWEI',
+    'vkCmdBindInvocationMaskHUAWEI',
+    'vkGetMemoryRemoteAddressNV',
+    'vkGetPipelinePropertiesEXT',
+    'vkGetFenceSciSyncFenceNV',
+    'vkGetFenceSciSyncObjNV',
+    'vkImportFenceSciSyncFenceNV',
+    'vkImportFenceSciSyncObjNV',
+    'vkGetPhysicalDeviceSciSyncAttributesNV',
+    'vkGetSemaphoreSciSyncObjNV',
+    'vkImportSemaphoreSciSyncObjNV',
+    'vkGetMemorySciBufNV',
+    'vkGetPhysicalDeviceExternalMemorySciBufPropertiesNV',
+    'vkGetPhysicalDeviceSciBufAttributesNV',
+    'vkCmdSetPatchControlPointsEXT',
+    'vkCmdSetRasterizerDiscardEnableEXT',
+    'vkCmdSetDepthBiasEnableEXT',
+    'vkCmdSetLogicOpEXT',
+    'vkCmdSetPrimitiveRestartEnableEXT',
+    'vkCmdSetColorWriteEnableEXT',
+    'vkCmdTraceRaysIndirect2KHR',
+    'vkCmdDrawMultiEXT',
+    'vkCmdDrawMultiIndexedEXT',
+    'vkCreateMicromapEXT',
+    'vkDestroyMicromapEXT',
+    'vkCmdBuildMicromapsEXT',
+    'vkBuildMicromapsEXT',
+    'vkCopyMicromapEXT',
+    'vkCopyMicromapToMemoryEXT',
+    'vkCopyMemoryToMicromapEXT',
+    'vkWriteMicromapsPropertiesEXT',
+    'vkCmdCopyMicromapEXT',
+    'vkCmdCopyMicromapToMemoryEXT',
+    'vkCmdCopyMemoryToMicromapEXT',
+    'vkCmdWriteMicromapsPropertiesEXT',
+    'vkGetDeviceMicromapCompatibilityEXT',
+    'vkGetMicromapBuildSizesEXT',
+    'vkCmdDrawClusterHUAWEI',
+    'vkCmdDrawClusterIndirectHUAWEI',
+    'vkSetDeviceMemoryPriorityEXT',
+    'vkGetDeviceBufferMemoryRequirementsKHR',
+    'vkGetDeviceImageMemoryRequirementsKHR',
+    'vkGetDeviceImageSparseMemoryRequirementsKHR',
+    'vkGetDescriptorSetLayoutHostMappingInfoVALVE',
+    'vkGetDescriptorSetHostMappingVALVE',
+    'vkCmdCopyMemoryIndirectNV',
+    'vkCmdCopyMemoryToImageIndirectNV',
+    'vkCmdDecompressMemoryNV',
+    'vkCmdDecompressMemoryIndirectCountNV',
+    'vkGetPipelineIndirectMemoryRequirementsNV',
+    'vkCmdUpdatePipelineIndirectBufferNV',
+    'vkGetPipelineIndirectDeviceAddressNV',
+    'vkCmdSetTessellationDomainOriginEXT',
+    'vkCmdSetDepthClampEnableEXT',
+    'vkCmdSetPolygonModeEXT',
+    'vkCmdSetRasterizationSamplesEXT',
+    'vkCmdSetSampleMaskEXT',
+    'vkCmdSetAlphaToCoverageEnableEXT',
+    'vkCmdSetAlphaToOneEnableEXT',
+    'vkCmdSetLogicOpEnableEXT',
+    'vkCmdSetColorBlendEnableEXT',
+    'vkCmdSetColorBlendEquationEXT',
+    'vkCmdSetColorWriteMaskEXT',
+    'vkCmdSetRasterizationStreamEXT',
+    'vkCmdSetConservativeRasterizationModeEXT',
+    'vkCmdSetExtraPrimitiveOverestimationSizeEXT',
+    'vkCmdSetDepthClipEnableEXT',
+    'vkCmdSetSampleLocationsEnableEXT',
+    'vkCmdSetColorBlendAdvancedEXT',
+    'vkCmdSetProvokingVertexModeEXT',
+    'vkCmdSetLineRasterizationModeEXT',
+    'vkCmdSetLineStippleEnableEXT',
+    'vkCmdSetDepthClipNegativeOneToOneEXT',
+    'vkCmdSetViewportWScalingEnableNV',
+    'vkCmdSetViewportSwizzleNV',
+    'vkCmdSetCoverageToColorEnableNV',
+    'vkCmdSetCoverageToColorLocationNV',
+    'vkCmdSetCoverageModulationModeNV',
+    'vkCmdSetCoverageModulationTableEnableNV',
+    'vkCmdSetCoverageModulationTableNV',
+    'vkCmdSetShadingRateImageEnableNV',
+    'vkCmdSetRepresentativeFragmentTestEnableNV',
+    'vkCmdSetCoverageReductionModeNV',
+    'vkGetShaderModuleIdentifierEXT',
+    'vkGetShaderModuleCreateInfoIdentifierEXT',
+    'vkGetPhysicalDeviceOpticalFlowImageFormatsNV',
+    'vkCreateOpticalFlowSessionNV',
+    'vkDestroyOpticalFlowSessionNV',
+    'vkBindOpticalFlowSessionImageNV',
+    'vkCmdOpticalFlowExecuteNV',
+    'vkCmdBindIndexBuffer2KHR',
+    'vkGetRenderingAreaGranularityKHR',
+    'vkGetDeviceImageSubresourceLayoutKHR',
+    'vkGetImageSubresourceLayout2KHR',
+    'vkCreateShadersEXT',
+    'vkDestroyShaderEXT',
+    'vkGetShaderBinaryDataEXT',
+    'vkCmdBindShadersEXT',
+    'vkGetFramebufferTilePropertiesQCOM',
+    'vkGetDynamicRenderingTilePropertiesQCOM',
+    'vkCreateSemaphoreSciSyncPoolNV',
+    'vkDestroySemaphoreSciSyncPoolNV',
+    'vkSetLatencySleepModeNV',
+    'vkLatencySleepNV',
+    'vkSetLatencyMarkerNV',
+    'vkGetLatencyTimingsNV',
+    'vkQueueNotifyOutOfBandNV',
+    'vkGetPhysicalDeviceCooperativeMatrixPropertiesKHR',
+    'vkCmdSetAttachmentFeedbackLoopEnableEXT',
+    'vkGetScreenBufferPropertiesQNX',
+    'vkGetPhysicalDeviceCalibrateableTimeDomainsKHR',
+    'vkGetCalibratedTimestampsKHR',
+    'vkCmdBindDescriptorSets2KHR',
+    'vkCmdPushConstants2KHR',
+    'vkCmdPushDescriptorSet2KHR',
+    'vkCmdPushDescriptorSetWithTemplate2KHR',
+    'vkCmdSetDescriptorBufferOffsets2EXT',
+    'vkCmdBindDescriptorBufferEmbeddedSamplers2EXT',
+)
+
+_device_commands = (
+    'vkCreateSwapchainKHR',
+    'vkDestroySwapchainKHR',
+    'vkGetSwapchainImagesKHR',
+    'vkAcquireNextImageKHR',
+    'vkQueuePresentKHR',
+    'vkGetDeviceGroupPresentCapabilitiesKHR',
+    'vkGetDeviceGroupSurfacePresentModesKHR',
+    'vkGetPhysicalDevicePresentRectanglesKHR',
+    'vkAcquireNextImage2KHR',
+    'vkCreateSharedSwapchainsKHR',
+    'vkGetSwapchainGrallocUsageANDROID',
+    'vkAcquireImageANDROID',
+    'vkQueueSignalReleaseImageANDROID',
+    'vkGetSwapchainGrallocUsage2ANDROID',
+    'vkDebugMarkerSetObjectTagEXT',
+    'vkDebugMarkerSetObjectNameEXT',
+    'vkCmdDebugMarkerBeginEXT',
+    'vkCmdDebugMarkerEndEXT',
+    'vkCmdDebugMarkerInsertEXT',
+    'vkGetPhysicalDeviceVideoCapabilitiesKHR',
+    'vkGetPhysicalDeviceVideoFormatPropertiesKHR',
+    'vkCreateVideoSessionKHR',
+    'vkDestroyVideoSessionKHR',
+    'vkGetVideoSessionMemoryRequirementsKHR',
+    'vkBindVideoSessionMemoryKHR',
+    'vkCreateVideoSessionParametersKHR',
+    'vkUpdateVideoSessionParametersKHR',
+    'vkDestroyVideoSessionParametersKHR',
+    'vkCmdBeginVideoCodingKHR',
+    'vkCmdEndVideoCodingKHR',
+    'vkCmdControlVideoCodingKHR',
+    'vkCmdDecodeVideoKHR',
+    'vkCmdBindTransformFeedbackBuffersEXT',
+    'vkCmdBeginTransformFeedbackEXT',
+    'vkCmdEndTransformFeedbackEXT',
+    'vkCmdBeginQueryIndexedEXT',
+    'vkCmdEndQueryIndexedEXT',
+    'vkCmdDrawIndirectByteCountEXT',
+    'vkCreateCuModuleNVX',
+    'vkCreateCuFunctionNVX',
+    'vkDestroyCuModuleNVX',
+    'vkDestroyCuFunctionNVX',
+    'vkCmdCuLaunchKernelNVX',
+    'vkGetImageViewHandleNVX',
+    'vkGetImageViewAddressNVX',
+    'vkCmdDrawIndirectCountAMD',
+    'vkCmdDrawIndexedIndirectCountAMD',
+    'vkGetShaderInfoAMD',
+    'vkCmdBeginRenderingKHR',
+    'vkCmdEndRenderingKHR',
+    'vkGetMemoryWin32HandleNV',
+    'vkGetDeviceGroupPeerMemoryFeaturesKHR',
+    'vkCmdSetDeviceMaskKHR',
+    'vkCmdDispatchBaseKHR',
+    'vkTrimCommandPoolKHR',
+    'vkGetMemoryWin32HandleKHR',
+    'vkGetMemoryWin32HandlePropertiesKHR',
+    'vkGetMemoryFdKHR',
+    'vkGetMemoryFdPropertiesKHR',
+    'vkImportSemaphoreWin32HandleKHR',
+    'vkGetSemaphoreWin32HandleKHR',
+    'vkImportSemaphoreFdKHR',
+    'vkGetSemaphoreFdKHR',
+    'vkCmdPushDescriptorSetKHR',
+    'vkCmdPushDescriptorSetWithTemplateKHR',
+    'vkCmdBeginConditionalRenderingEXT',
+    'vkCmdEndConditionalRenderingEXT',
+    'vkCreateDescriptorUpdateTemplateKHR',
+    'vkDestroyDescriptorUpdateTemplateKHR',
+    'vkUpdateDescriptorSetWithTemplateKHR',
+    'vkCmdSetViewportWScalingNV',
+    'vkDisplayPowerControlEXT',
+    'vkRegisterDeviceEventEXT',
+    'vkRegisterDisplayEventEXT',
+    'vkGetSwapchainCounterEXT',
+    'vkGetRefreshCycleDurationGOOGLE',
+    'vkGetPastPresentationTimingGOOGLE',
+    'vkCmdSetDiscardRectangleEXT',
+    'vkCmdSetDiscardRectangleEnableEXT',
+    'vkCmdSetDiscardRectangleModeEXT',
+    'vkSetHdrMetadataEXT',
+    'vkCreateRenderPass2KHR',
+    'vkCmdBeginRenderPass2KHR',
+    'vkCmdNextSubpass2KHR',
+    'vkCmdEndRenderPass2KHR',
+    'vkGetSwapchainStatusKHR',
+    'vkImportFenceWin32HandleKHR',
+    'vkGetFenceWin32HandleKHR',
+    'vkImportFenceFdKHR',
+    'vkGetFenceFdKHR',
+    'vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR',
+    'vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR',
+    'vkAcquireProfilingLockKHR',
+    'vkReleaseProfilingLockKHR',
+    'vkGetAndroidHardwareBufferPropertiesANDROID',
+    'vkGetMemoryAndroidHardwareBufferANDROID',
+    'vkCreateExecutionGraphPipelinesAMDX',
+    'vkGetExecutionGraphPipelineScratchSizeAMDX',
+    'vkGetExecutionGraphPipelineNodeIndexAMDX',
+    'vkCmdInitializeGraphScratchMemoryAMDX',
+    'vkCmdDispatchGraphAMDX',
+    'vkCmdDispatchGraphIndirectAMDX',
+    'vkCmdDispatchGraphIndirectCountAMDX',
+    'vkCmdSetSampleLocationsEXT',
+    'vkGetPhysicalDeviceMultisamplePropertiesEXT',
+    'vkGetImageMemoryRequirements2KHR',
+    'vkGetBufferMemoryRequirements2KHR',
+    'vkGetImageSparseMemoryRequirements2KHR',
+    'vkCreateAccelerationStructureKHR',
+    'vkDestroyAccelerationStructureKHR',
+    'vkCmdBuildAccelerationStructuresKHR',
+    'vkCmdBuildAccelerationStructuresIndirectKHR',
+    'vkBuildAccelerationStructuresKHR',
+    'vkCopyAccelerationStructureKHR',
+    'vkCopyAccelerationStructureToMemoryKHR',
+    'vkCopyMemoryToAccelerationStructureKHR',
+    'vkWriteAccelerationStructuresPropertiesKHR',
+    'vkCmdCopyAccelerationStructureKHR',
+    'vkCmdCopyAccelerationStructureToMemoryKHR',
+    'vkCmdCopyMemoryToAccelerationStructureKHR',
+    'vkGetAccelerationStructureDeviceAddressKHR',
+    'vkCmdWriteAccelerationStructuresPropertiesKHR',
+    'vkGetDeviceAccelerationStructureCompatibilityKHR',
+    'vkGetAccelerationStructureBuildSizesKHR',
+    'vkCmdTraceRaysKHR',
+    'vkCreateRayTracingPipelinesKHR',
+    'vkGetRayTracingShaderGroupHandlesKHR',
+    'vkGetRayTracingCaptureReplayShaderGroupHandlesKHR',
+    'vkCmdTraceRaysIndirectKHR',
+    'vkGetRayTracingShaderGroupStackSizeKHR',
+    'vkCmdSetRayTracingPipelineStackSizeKHR',
+    'vkCreateSamplerYcbcrConversionKHR',
+    'vkDestroySamplerYcbcrConversionKHR',
+    'vkBindBufferMemory2KHR',
+    'vkBindImageMemory2KHR',
+    'vkGetImageDrmFormatModifierPropertiesEXT',
+    'vkCreateValidationCacheEXT',
+    'vkDestroyValidationCacheEXT',
+    'vkMergeValidationCachesEXT',
+    'vkGetValidationCacheDataEXT',
+    'vkCmdBindShadingRateImageNV',
+    'vkCmdSetViewportShadingRatePaletteNV',
+    'vkCmdSetCoarseSampleOrderNV',
+    'vkCreateAccelerationStructureNV',
+    'vkDestroyAccelerationStructureNV',
+    'vkGetAccelerationStructureMemoryRequirementsNV',
+    'vkBindAccelerationStructureMemoryNV',
+    'vkCmdBuildAccelerationStructureNV',
+    'vkCmdCopyAccelerationStructureNV',
+    'vkCmdTraceRaysNV',
+    'vkCreateRayTracingPipelinesNV',
+    'vkGetRayTracingShaderGroupHandlesNV',
+    'vkGetAccelerationStructureHandleNV',
+    'vkCmdWriteAccelerationStructuresPropertiesNV',
+    'vkCompileDeferredNV',
+    'vkGetDescriptorSetLayoutSupportKHR',
+    'vkCmdDrawIndirectCountKHR',
+    'vkCmdDrawIndexedIndirectCountKHR',
+    'vkGetMemoryHostPointerPropertiesEXT',
+    'vkCmdWriteBufferMarkerAMD',
+    'vkGetPhysicalDeviceCalibrateableTimeDomainsEXT',
+    'vkGetCalibratedTimestampsEXT',
+    'vkCmdDrawMeshTasksNV',
+    'vkCmdDrawMeshTasksIndirectNV',
+    'vkCmdDrawMeshTasksIndirectCountNV',
+    'vkCmdSetExclusiveScissorEnableNV',
+    'vkCmdSetExclusiveScissorNV',
+    'vkCmdSetCheckpointNV',
+    'vkGetQueueCheckpointDataNV',
+    'vkGetSemaphoreCounterValueKHR',
+    'vkWaitSemaphoresKHR',
+    'vkSignalSemaphoreKHR',
+    'vkInitializePerformanceApiINTEL',
+    'vkUninitializePerformanceApiINTEL',
+    'vkCmdSetPerformanceMarkerINTEL',
+    'vkCmdSetPerformanceStreamMarkerINTEL',
+    'vkCmdSetPerformanceOverrideINTEL',
+    'vkAcquirePerformanceConfigurationINTEL',
+    'vkReleasePerformanceConfigurationINTEL',
+    'vkQueueSetPerformanceConfigurationINTEL',
+    'vkGetPerformanceParameterINTEL',
+    'vkSetLocalDimmingAMD',
+    'vkGetPhysicalDeviceFragmentShadingRatesKHR',
+    'vkCmdSetFragmentShadingRateKHR',
+    'vkGetBufferDeviceAddressEXT',
+    'vkGetPhysicalDeviceToolPropertiesEXT',
+    'vkWaitForPresentKHR',
+    'vkGetPhysicalDeviceCooperativeMatrixPropertiesNV',
+    'vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV',
+    'vkGetPhysicalDeviceSurfacePresentModes2EXT',
+    'vkAcquireFullScreenExclusiveModeEXT',
+    'vkReleaseFullScreenExclusiveModeEXT',
+    'vkGetDeviceGroupSurfacePresentModes2EXT',
+    'vkGetBufferDeviceAddressKHR',
+    'vkGetBufferOpaqueCaptureAddressKHR',
+    'vkGetDeviceMemoryOpaqueCaptureAddressKHR',
+    'vkCmdSetLineStippleEXT',
+    'vkResetQueryPoolEXT',
+    'vkCmdSetCullModeEXT',
+    'vkCmdSetFrontFaceEXT',
+    'vkCmdSetPrimitiveTopologyEXT',
+    'vkCmdSetViewportWithCountEXT',
+    'vkCmdSetScissorWithCountEXT',
+    'vkCmdBindVertexBuffers2EXT',
+    'vkCmdSetDepthTestEnableEXT',
+    'vkCmdSetDepthWriteEnableEXT',
+    'vkCmdSetDepthCompareOpEXT',
+    'vkCmdSetDepthBoundsTestEnableEXT',
+    'vkCmdSetStencilTestEnableEXT',
+    'vkCmdSetStencilOpEXT',
+    'vkCreateDeferredOperationKHR',
+    'vkDestroyDeferredOperationKHR',
+    'vkGetDeferredOperationMaxConcurrencyKHR',
+    'vkGetDeferredOperationResultKHR',
+    'vkDeferredOperationJoinKHR',
+    'vkGetPipelineExecutablePropertiesKHR',
+    'vkGetPipelineExecutableStatisticsKHR',
+    'vkGetPipelineExecutableInternalRepresentationsKHR',
+    'vkCopyMemoryToImageEXT',
+    'vkCopyImageToMemoryEXT',
+    'vkCopyImageToImageEXT',
+    'vkTransitionImageLayoutEXT',
+    'vkGetImageSubresourceLayout2EXT',
+    'vkMapMemory2KHR',
+    'vkUnmapMemory2KHR',
+    'vkReleaseSwapchainImagesEXT',
+    'vkGetGeneratedCommandsMemoryRequirementsNV',
+    'vkCmdPreprocessGeneratedCommandsNV',
+    'vkCmdExecuteGeneratedCommandsNV',
+    'vkCmdBindPipelineShaderGroupNV',
+    'vkCreateIndirectCommandsLayoutNV',
+    'vkDestroyIndirectCommandsLayoutNV',
+    'vkCmdSetDepthBias2EXT',
+    'vkCreatePrivateDataSlotEXT',
+    'vkDestroyPrivateDataSlotEXT',
+    'vkSetPrivateDataEXT',
+    'vkGetPrivateDataEXT',
+    'vkGetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR',
+    'vkGetEncodedVideoSessionParametersKHR',
+    'vkCmdEncodeVideoKHR',
+    'vkCreateCudaModuleNV',
+    'vkGetCudaModuleCacheNV',
+    'vkCreateCudaFunctionNV',
+    'vkDestroyCudaModuleNV',
+    'vkDestroyCudaFunctionNV',
+    'vkCmdCudaLaunchKernelNV',
+    'vkCmdRefreshObjectsKHR',
+    'vkGetPhysicalDeviceRefreshableObjectTypesKHR',
+    'vkExportMetalObjectsEXT',
+    'vkCmdSetEvent2KHR',
+    'vkCmdResetEvent2KHR',
+    'vkCmdWaitEvents2KHR',
+    'vkCmdPipelineBarrier2KHR',
+    'vkCmdWriteTimestamp2KHR',
+    'vkQueueSubmit2KHR',
+    'vkCmdWriteBufferMarker2AMD',
+    'vkGetQueueCheckpointData2NV',
+    'vkGetDescriptorSetLayoutSizeEXT',
+    'vkGetDescriptorSetLayoutBindingOffsetEXT',
+    'vkGetDescriptorEXT',
+    'vkCmdBindDescriptorBuffersEXT',
+    'vkCmdSetDescriptorBufferOffsetsEXT',
+    'vkCmdBindDescriptorBufferEmbeddedSamplersEXT',
+    'vkGetBufferOpaqueCaptureDescriptorDataEXT',
+    'vkGetImageOpaqueCaptureDescriptorDataEXT',
+    'vkGetImageViewOpaqueCaptureDescriptorDataEXT',
+    'vkGetSamplerOpaqueCaptureDescriptorDataEXT',
+    'vkGetAccelerationStructureOpaqueCaptureDescriptorDataEXT',
+    'vkCmdSetFragmentShadingRateEnumNV',
+    'vkCmdDrawMeshTasksEXT',
+    'vkCmdDrawMeshTasksIndirectEXT',
+    'vkCmdDrawMeshTasksIndirectCountEXT',
+    'vkCmdCopyBuffer2KHR',
+    'vkCmdCopyImage2KHR',
+    'vkCmdCopyBufferToImage2KHR',
+    'vkCmdCopyImageToBuffer2KHR',
+    'vkCmdBlitImage2KHR',
+    'vkCmdResolveImage2KHR',
+    'vkGetDeviceFaultInfoEXT',
+    'vkAcquireWinrtDisplayNV',
+    'vkGetWinrtDisplayNV',
+    'vkCmdSetVertexInputEXT',
+    'vkGetMemoryZirconHandleFUCHSIA',
+    'vkGetMemoryZirconHandlePropertiesFUCHSIA',
+    'vkImportSemaphoreZirconHandleFUCHSIA',
+    'vkGetSemaphoreZirconHandleFUCHSIA',
+    'vkCreateBufferCollectionFUCHSIA',
+    'vkSetBufferCollectionImageConstraintsFUCHSIA',
+    'vkSetBufferCollectionBufferConstraintsFUCHSIA',
+    'vkDestroyBufferCollectionFUCHSIA',
+    'vkGetBufferCollectionPropertiesFUCHSIA',
+    'vkGetDeviceSubpassShadingMaxWorkgroupSizeHUAWEI',
+    'vkCmdSubpassShadingHUAWEI',
+    'vkCmdBindInvocationMaskHUAWEI',
+    'vkGetMemoryRemoteAddressNV',
+    'vkGetPipelinePropertiesEXT',
+    'vkGetFenceSciSyncFenceNV',
+    'vkGetFenceSciSyncObjNV',
+    'vkImportFenceSciSyncFenceNV',
+    'vkImportFenceSciSyncObjNV',
+    'vkGetPhysicalDeviceSciSyncAttributesNV',
+    'vkGetSemaphoreSciSyncObjNV',
+    'vkImportSemaphoreSciSyncObjNV',
+    'vkGetMemorySciBufNV',
+    'vkGetPhysicalDeviceExternalMemorySciBufPropertiesNV',
+    'vkGetPhysicalDeviceSciBufAttributesNV',
+    'vkCmdSetPatchControlPointsEXT',
+    'vkCmdSetRasterizerDiscardEnableEXT',
+    'vkCmdSetDepthBiasEnableEXT',
+    'vkCmdSetLogicOpEXT',
+    'vkCmdSetPrimitiveRestartEnableEXT',
+    'vkCmdSetColorWriteEnableEXT',
+    'vkCmdTraceRaysIndirect2KHR',
+    'vkCmdDrawMultiEXT',
+    'vkCmdDrawMultiIndexedEXT',
+    'vkCreateMicromapEXT',
+    'vkDestroyMicromapEXT',
+    'vkCmdBuildMicromapsEXT',
+    'vkBuildMicromapsEXT',
+    'vkCopyMicromapEXT',
+    'vkCopyMicromapToMemoryEXT',
+    'vkCopyMemoryToMicromapEXT',
+    'vkWriteMicromapsPropertiesEXT',
+    'vkCmdCopyMicromapEXT',
+    'vkCmdCopyMicromapToMemoryEXT',
+    'vkCmdCopyMemoryToMicromapEXT',
+    'vkCmdWriteMicromapsPropertiesEXT',
+    'vkGetDeviceMicromapCompatibilityEXT',
+    'vkGetMicromapBuildSizesEXT',
+    'vkCmdDrawClusterHUAWEI',
+    'vkCmdDrawClusterIndirectHUAWEI',
+    'vkSetDeviceMemoryPriorityEXT',
+    'vkGetDeviceBufferMemoryRequirementsKHR',
+    'vkGetDeviceImageMemoryRequirementsKHR',
+    'vkGetDeviceImageSparseMemoryRequirementsKHR',
+    'vkGetDescriptorSetLayoutHostMappingInfoVALVE',
+    'vkGetDescriptorSetHostMappingVALVE',
+    'vkCmdCopyMemoryIndirectNV',
+    'vkCmdCopyMemoryToImageIndirectNV',
+    'vkCmdDecompressMemoryNV',
+    'vkCmdDecompressMemoryIndirectCountNV',
+    'vkGetPipelineIndirectMemoryRequirementsNV',
+    'vkCmdUpdatePipelineIndirectBufferNV',
+    'vkGetPipelineIndirectDeviceAddressNV',
+    'vkCmdSetTessellationDomainOriginEXT',
+    'vkCmdSetDepthClampEnableEXT',
+    'vkCmdSetPolygonModeEXT',
+    'vkCmdSetRasterizationSamplesEXT',
+    'vkCmdSetSampleMaskEXT',
+    'vkCmdSetAlphaToCoverageEnableEXT',
+    'vkCmdSetAlphaToOneEnableEXT',
+    'vkCmdSetLogicOpEnableEXT',
+    'vkCmdSetColorBlendEnableEXT',
+    'vkCmdSetColorBlendEquationEXT',
+    'vkCmdSetColorWriteMaskEXT',
+    'vkCmdSetRasterizationStreamEXT',
+    'vkCmdSetConservativeRasterizationModeEXT',
+    'vkCmdSetExtraPrimitiveOverestimationSizeEXT',
+    'vkCmdSetDepthClipEnableEXT',
+    'vkCmdSetSampleLocationsEnableEXT',
+    'vkCmdSetColorBlendAdvancedEXT',
+    'vkCmdSetProvokingVertexModeEXT',
+    'vkCmdSetLineRasterizationModeEXT',
+    'vkCmdSetLineStippleEnableEXT',
+    'vkCmdSetDepthClipNegativeOneToOneEXT',
+    'vkCmdSetViewportWScalingEnableNV',
+    'vkCmdSetViewportSwizzleNV',
+    'vkCmdSetCoverageToColorEnableNV',
+    'vkCmdSetCoverageToColorLocationNV',
+    'vkCmdSetCoverageModulationModeNV',
+    'vkCmdSetCoverageModulationTableEnableNV',
+    'vkCmdSetCoverageModulationTableNV',
+    'vkCmdSetShadingRateImageEnableNV',
+    'vkCmdSetRepresentativeFragmentTestEnableNV',
+    'vkCmdSetCoverageReductionModeNV',
+    'vkGetShaderModuleIdentifierEXT',
+    'vkGetShaderModuleCreateInfoIdentifierEXT',
+    'vkGetPhysicalDeviceOpticalFlowImageFormatsNV',
+    'vkCreateOpticalFlowSessionNV',
+    'vkDestroyOpticalFlowSessionNV',
+    'vkBindOpticalFlowSessionImageNV',
+    'vkCmdOpticalFlowExecuteNV',
+    'vkCmdBindIndexBuffer2KHR',
+    'vkGetRenderingAreaGranularityKHR',
+    'vkGetDeviceImageSubresourceLayoutKHR',
+    'vkGetImageSubresourceLayout2KHR',
+    'vkCreateShadersEXT',
+    'vkDestroyShaderEXT',
+    'vkGetShaderBinaryDataEXT',
+    'vkCmdBindShadersEXT',
+    'vkGetFramebufferTilePropertiesQCOM',
+    'vkGetDynamicRenderingTilePropertiesQCOM',
+    'vkCreateSemaphoreSciSyncPoolNV',
+    'vkDestroySemaphoreSciSyncPoolNV',
+    'vkSetLatencySleepModeNV',
+    'vkLatencySleepNV',
+    'vkSetLatencyMarkerNV',
+    'vkGetLatencyTimingsNV',
+    'vkQueueNotifyOutOfBandNV',
+    'vkGetPhysicalDeviceCooperativeMatrixPropertiesKHR',
+    'vkCmdSetAttachmentFeedbackLoopEnableEXT',
+    'vkGetScreenBufferPropertiesQNX',
+    'vkGetPhysicalDeviceCalibrateableTimeDomainsKHR',
+    'vkGetCalibratedTimestampsKHR',
+    'vkCmdBindDescriptorSets2KHR',
+    'vkCmdPushConstants2KHR',
+    'vkCmdPushDescriptorSet2KHR',
+    'vkCmdPushDescriptorSetWithTemplate2KHR',
+    'vkCmdSetDescriptorBufferOffsets2EXT',
+    'vkCmdBindDescriptorBufferEmbeddedSamplers2EXT',
+)
+
+
+def __getattr__(name):
+    if name not in _commands:
+        raise AttributeError('module %r has no attribute %r' %
+                             (__name__, name))
+
+    fn = globals()[name] = getattr(lib, name)
+    return fn
+
+
+def __dir__():
+    return sorted(set(globals()) | _commands)
+
+
+class _ProcTable(object):
+    """Extension commands resolved with a vkGet*ProcAddr function
+
+    Each command returned by the driver is set as an attribute holding the
+    typed function pointer, unsupported ones are left out.
+    """
+    def __init__(self, get_proc_addr, handle, names):
+        for name in names:
+            fn = get_proc_addr(handle, name.encode('ascii'))
+            if fn == ffi.NULL:
+                continue
+            try:
+                setattr(self, name, ffi.cast('PFN_' + name, fn))
+            except ffi.error:
+                # not declared in vulkan.cdef.h
+                pass
+
+
+class InstanceProcs(_ProcTable):
+    """Instance extension commands, `names` defaults to all of them"""
+    def __init__(self, instance, names=None):
+        super(InstanceProcs, self).__init__(
+            lib.vkGetInstanceProcAddr, instance, names or _instance_commands)
+
+
+class DeviceProcs(_ProcTable):
+    """Device extension commands, `names` defaults to all of them"""
+    def __init__(self, device, names=None):
+        super(DeviceProcs, self).__init__(
+            lib.vkGetDeviceProcAddr, device, names or _device_commands)
\ No newline at end of file
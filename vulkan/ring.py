@@ -0,0 +1,193 @@
+"""Ring buffer for per-frame uploads
+
+    ring = RingBuffer(device, physical_device, 8 << 20,
+                      VK_BUFFER_USAGE_UNIFORM_BUFFER_BIT)
+    while running:
+        offset = ring.write(uniforms)
+        ... descriptors or copies use ring.buffer at offset ...
+        vkQueueSubmit(queue, 1, [submit_info], fence)
+        ring.end_frame(fence)
+
+A host visible VkBuffer is created and mapped once, each allocation takes
+the next aligned range. `end_frame` closes the ranges allocated since the
+previous one: they are reused once the fence of their frame signals (polled
+without blocking, waited for only when the ring is full). Nothing is
+reallocated or remapped per frame. Writes to non-coherent memory are
+flushed by `end_frame`, in a single call when the frame wraps around.
+"""
+from collections import deque
+
+from vulkan import _vulkan
+from vulkan._vulkan import ffi, lib, exception_codes, _handle
+from vulkan.memory import MappedMemory, MappedRanges, memory_types
+
+
+class RingBuffer(object):
+    """Persistently mapped VkBuffer suballocated in frames
+
+    `alignment` is the default alignment of the allocations, offsets are
+    relative to the buffer. Given an `allocator` (vulkan.allocator), the
+    memory is suballocated from it, else it has its own VkDeviceMemory.
+    """
+    def __init__(self, device, physicalDevice, size, usage, alignment=256,
+                 preferredFlags=_vulkan.VK_MEMORY_PROPERTY_HOST_COHERENT_BIT,
+                 allocator=None, pAllocator=None):
+        self.device = device
+        self.size = size
+        self.alignment = alignment
+        self.pAllocator = pAllocator
+        self.allocator = allocator
+
+        self.buffer = _vulkan.vkCreateBuffer(
+            device, _vulkan.VkBufferCreateInfo(
+                size=size, usage=usage,
+                sharingMode=_vulkan.VK_SHARING_MODE_EXCLUSIVE), pAllocator)
+
+        required = _vulkan.VK_MEMORY_PROPERTY_HOST_VISIBLE_BIT
+        if allocator is not None:
+            self.allocation = allocator.bind_buffer(self.buffer, required,
+                                                    preferredFlags)
+            self.memory = None
+            self.mapping = self.allocation.mapped()
+            self._base = self.allocation.offset
+        else:
+            requirements = _vulkan.vkGetBufferMemoryRequirements(
+                device, self.buffer)
+            types = memory_types(physicalDevice)
+            memory_type = types.find(requirements.memoryTypeBits, required,
+                                     preferredFlags)
+            self.allocation = None
+            self.memory = _vulkan.vkAllocateMemory(
+                device, _vulkan.VkMemoryAllocateInfo(
+                    allocationSize=requirements.size,
+                    memoryTypeIndex=memory_type), pAllocator)
+            _vulkan.vkBindBufferMemory(device, self.buffer, self.memory, 0)
+            properties = _vulkan.vkGetPhysicalDeviceProperties(
+                physicalDevice)
+            self.mapping = MappedMemory(
+                device, self.memory, requirements.size,
+                types.flags[memory_type],
+                properties.limits.nonCoherentAtomSize)
+            self._base = 0
+
+        # allocated and released bytes since the creation, the used range
+        # is [_tail, _head) modulo size
+        self._head = 0
+        self._tail = 0
+        self._frame_start = 0
+        # (fence, end of the frame) of the frames in flight
+        self._frames = deque()
+        self._device = _handle(device, 'VkDevice')
+        self._fence = ffi.new('VkFence*')
+        self._ranges = MappedRanges()
+
+    def _release(self, wait):
+        """Release the oldest frame if its fence signaled (or wait for it)
+
+        Return False if there is no frame in flight or it is not done.
+        """
+        if not self._frames:
+            return False
+        fence, end = self._frames[0]
+        if wait:
+            self._fence[0] = fence
+            result = lib.vkWaitForFences(self._device, 1, self._fence, True,
+                                         (1 << 64) - 1)
+        else:
+            result = lib.vkGetFenceStatus(self._device, fence)
+            if result == _vulkan.VK_NOT_READY:
+                return False
+        if result != _vulkan.VK_SUCCESS:
+            raise exception_codes[result]
+
+        self._frames.popleft()
+        self._tail = end
+        return True
+
+    def allocate(self, size, alignment=None):
+        """Offset in the buffer of size free bytes
+
+        Finished frames are released; when the ring is still full, wait for
+        the oldest frame in flight. Raise ValueError if the frame being
+        built doesn't leave size bytes.
+        """
+        if alignment is None:
+            alignment = self.alignment
+        if size > self.size:
+            raise ValueError('Allocation of %d bytes in a RingBuffer of %d'
+                             % (size, self.size))
+        head = self._head
+        offset = head % self.size
+        aligned = -(-offset // alignment) * alignment
+        if aligned + size > self.size:
+            # not enough room before the end, continue at the start
+            head += self.size - offset
+            aligned = 0
+        head += aligned - head % self.size
+        end = head + size
+
+        while end - self._tail > self.size:
+            if not (self._release(False) or self._release(True)):
+                raise ValueError(
+                    'RingBuffer of %d bytes full with the current frame' %
+                    self.size)
+
+        self._head = end
+        return aligned
+
+    def view(self, offset, size, format='B'):
+        """memoryview of an allocated range"""
+        return self.mapping.view(self._base + offset, size, format)
+
+    def array(self, offset, shape, dtype):
+        """numpy array viewing an allocated range"""
+        return self.mapping.array(self._base + offset, shape, dtype)
+
+    def write(self, data, alignment=None):
+        """Copy a bytes-like object in a new allocation, return its offset"""
+        data = memoryview(data).cast('B')
+        offset = self.allocate(len(data), alignment)
+        self.mapping.view(self._base + offset, len(data))[:] = data
+        return offset
+
+    def end_frame(self, fence, ranges=None):
+        """Close the current frame, its ranges are reused when fence signals
+
+        If the memory is not coherent, the frame is flushed, or added to a
+        vulkan.memory.MappedRanges to be flushed by the caller with the
+        other ranges of the frame.
+        """
+        start, end = self._frame_start, self._head
+        flush = ranges is None
+        if flush:
+            ranges = self._ranges
+        if end - start >= self.size:
+            ranges.add(self.mapping, self._base, self.size)
+        elif end > start:
+            offset = start % self.size
+            if offset + end - start <= self.size:
+                ranges.add(self.mapping, self._base + offset, end - start)
+            else:
+                ranges.add(self.mapping, self._base + offset,
+                           self.size - offset)
+                ranges.add(self.mapping, self._base,
+                           end - start - (self.size - offset))
+        if flush:
+            ranges.flush()
+
+        self._frames.append((_handle(fence, 'VkFence'), end))
+        self._frame_start = end
+
+    def release(self):
+        """Release the frames whose fence signaled, without waiting"""
+        while self._release(False):
+            pass
+
+    def destroy(self):
+        """Destroy the buffer and free its memory"""
+        if self.allocation is not None:
+            self.allocator.free(self.allocation)
+        else:
+            self.mapping.unmap()
+            _vulkan.vkFreeMemory(self.device, self.memory, self.pAllocator)
+        _vulkan.vkDestroyBuffer(self.device, self.buffer, self.pAllocator)
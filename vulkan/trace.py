@@ -0,0 +1,162 @@
+"""Timeline of the Vulkan calls in the Chrome trace format
+
+    recorder = TraceRecorder()
+    with recorder:
+        with recorder.region('frame'):
+            render_frame()
+    recorder.save('trace.json')
+
+The file opens in chrome://tracing or https://ui.perfetto.dev. Each command
+call is a complete event on the thread that made it, with its integer and
+handle arguments. Application events can be added with `region()` and
+`mark()`.
+
+Recording builds on vulkan.profiling, see its documentation for which calls
+are captured. Each thread appends to its own bounded buffer, the oldest
+events are dropped when it is full; `flush()` moves the buffered events to
+the recorder and can be called at any time from any thread.
+"""
+import json
+import os
+import threading
+from collections import deque
+
+from vulkan import profiling
+from vulkan._vulkan import ffi
+
+
+def _arg_value(value):
+    if isinstance(value, int):
+        return value
+    if isinstance(value, ffi.CData) and ffi.typeof(value).kind == 'pointer':
+        return hex(int(ffi.cast('uintptr_t', value)))
+    return None
+
+
+class TraceRecorder(object):
+    """Record the calls of all threads between start() and stop()
+
+    `capacity` is the number of events each thread keeps until the next
+    flush().
+    """
+    def __init__(self, capacity=1 << 16):
+        self.capacity = capacity
+        self.events = []
+        self._local = threading.local()
+        self._buffers = []
+        self._lock = threading.Lock()
+        self._origin = profiling._clock()
+        self._enabled = False
+
+    def _buffer(self):
+        try:
+            return self._local.buffer
+        except AttributeError:
+            buffer = self._local.buffer = deque(maxlen=self.capacity)
+            thread = threading.current_thread()
+            with self._lock:
+                self._buffers.append((thread.ident, thread.name, buffer))
+            return buffer
+
+    def _record(self, name, arg_names, start, end, args, kwargs):
+        values = {}
+        for arg_name, value in zip(arg_names, args):
+            value = _arg_value(value)
+            if value is not None:
+                values[arg_name] = value
+        for arg_name, value in kwargs.items():
+            value = _arg_value(value)
+            if value is not None:
+                values[arg_name] = value
+
+        self._buffer().append((name, start, end, values))
+
+    def start(self):
+        """Start recording, enable profiling if needed"""
+        if profiling._tracer is not None:
+            raise RuntimeError('A trace is already being recorded')
+
+        self._enabled = not profiling.is_enabled()
+        if self._enabled:
+            profiling.enable()
+        profiling._tracer = self._record
+
+    def stop(self):
+        """Stop recording and flush the events"""
+        profiling._tracer = None
+        if self._enabled:
+            profiling.disable()
+            self._enabled = False
+        self.flush()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def mark(self, name, **args):
+        """Add an instant event to the timeline of the current thread"""
+        now = profiling._clock()
+        self._buffer().append((name, now, None, args))
+
+    def region(self, name, **args):
+        """Context manager adding a duration event around its block"""
+        return _Region(self, name, args)
+
+    def flush(self):
+        """Move the events of the thread buffers to `events`"""
+        pid = os.getpid()
+        with self._lock:
+            buffers = list(self._buffers)
+
+        for tid, _, buffer in buffers:
+            # popleft is atomic, threads can keep appending meanwhile
+            while True:
+                try:
+                    name, start, end, args = buffer.popleft()
+                except IndexError:
+                    break
+
+                event = {'name': name, 'pid': pid, 'tid': tid,
+                         'ts': (start - self._origin) * 1e6, 'args': args}
+                if end is None:
+                    event.update(ph='i', s='t')
+                else:
+                    event.update(ph='X', dur=(end - start) * 1e6)
+                self.events.append(event)
+
+    def to_json(self):
+        """Return the trace as a Chrome Trace Event JSON object"""
+        self.flush()
+        pid = os.getpid()
+        with self._lock:
+            threads = [{'name': 'thread_name', 'ph': 'M', 'pid': pid,
+                        'tid': tid, 'args': {'name': name}}
+                       for tid, name, _ in self._buffers]
+
+        return {'traceEvents': threads + self.events,
+                'displayTimeUnit': 'ns'}
+
+    def save(self, path):
+        """Write the trace in the file `path`"""
+        with open(path, 'w') as f:
+            json.dump(self.to_json(), f)
+
+
+class _Region(object):
+    def __init__(self, recorder, name, args):
+        self.recorder = recorder
+        self.name = name
+        self.args = args
+        self.start = None
+
+    def __enter__(self):
+        self.start = profiling._clock()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = profiling._clock()
+        self.recorder._buffer().append((self.name, self.start, end,
+                                        self.args))
@@ -0,0 +1,312 @@
+"""Streaming of files to buffers and images
+
+    uploader = FileUploader(device, physical_device, queue, queue_family)
+    uploader.upload_buffer('mesh.bin', vertex_buffer)
+    uploader.upload_image('albedo.raw', image, 2048, 2048, texel_size=4)
+    uploader.wait()
+    uploader.destroy()
+
+Files are memory mapped and copied in chunks straight from the mapping to a
+staging buffer split in slots, no `bytes` object holds their content. Each
+slot has its command buffer and fence: when a slot is full, its copies are
+recorded (one vkCmdCopyBuffer or vkCmdCopyBufferToImage per destination)
+and submitted, and the next slot is filled while the device copies the
+previous ones. The kernel is asked to read ahead the next chunk of the file
+while the current one is copied.
+
+Images must be in `layout` (TRANSFER_DST_OPTIMAL by default) when the
+copies execute, transitions are left to the caller. Only formats with one
+texel per block are supported.
+"""
+import mmap
+import os
+
+from vulkan import _vulkan
+from vulkan.memory import MappedMemory, memory_types
+from vulkan.query_cache import _address
+
+
+_UINT64_MAX = (1 << 64) - 1
+_WILLNEED = getattr(mmap, 'MADV_WILLNEED', None)
+
+
+def _align(offset, alignment):
+    return -(-offset // alignment) * alignment
+
+
+def _gcd(a, b):
+    while b:
+        a, b = b, a % b
+    return a
+
+
+class _Slot(object):
+    def __init__(self, offset, command_buffer, fence):
+        self.offset = offset
+        self.command_buffer = command_buffer
+        self.fence = fence
+        self.fill = 0
+        # {destination address: (destination, [VkBufferCopy])}
+        self.buffer_copies = {}
+        # {(image address, layout): (image, layout, [VkBufferImageCopy])}
+        self.image_copies = {}
+
+
+class _MappedFile(object):
+    """Read-only memory mapping of a file, a path or a file object"""
+    def __init__(self, source):
+        self.file = None
+        if not hasattr(source, 'fileno'):
+            source = self.file = open(source, 'rb')
+        self.size = os.fstat(source.fileno()).st_size
+        self.map = None
+        self.view = memoryview(b'')
+        if self.size:
+            self.map = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+            self.view = memoryview(self.map)
+
+    def read_ahead(self, start, size):
+        if _WILLNEED is None or self.map is None or start >= self.size:
+            return
+        page = start - start % mmap.PAGESIZE
+        self.map.madvise(_WILLNEED, page,
+                         min(start + size, self.size) - page)
+
+    def close(self):
+        self.view.release()
+        if self.map is not None:
+            self.map.close()
+        if self.file is not None:
+            self.file.close()
+
+
+class FileUploader(object):
+    """Copy files to device buffers and images through staging slots
+
+    The staging buffer has `slots` slots of `slot_size` bytes, in host
+    visible memory. Commands are submitted to `queue`, of the family
+    `queueFamilyIndex`.
+    """
+    def __init__(self, device, physicalDevice, queue, queueFamilyIndex,
+                 slot_size=16 << 20, slots=3, pAllocator=None):
+        self.device = device
+        self.queue = queue
+        self.slot_size = slot_size
+        self.pAllocator = pAllocator
+
+        size = slot_size * slots
+        self.buffer = _vulkan.vkCreateBuffer(
+            device, _vulkan.VkBufferCreateInfo(
+                size=size, usage=_vulkan.VK_BUFFER_USAGE_TRANSFER_SRC_BIT,
+                sharingMode=_vulkan.VK_SHARING_MODE_EXCLUSIVE), pAllocator)
+        requirements = _vulkan.vkGetBufferMemoryRequirements(device,
+                                                             self.buffer)
+        types = memory_types(physicalDevice)
+        memory_type = types.find(
+            requirements.memoryTypeBits,
+            _vulkan.VK_MEMORY_PROPERTY_HOST_VISIBLE_BIT,
+            _vulkan.VK_MEMORY_PROPERTY_HOST_COHERENT_BIT)
+        self.memory = _vulkan.vkAllocateMemory(
+            device, _vulkan.VkMemoryAllocateInfo(
+                allocationSize=requirements.size,
+                memoryTypeIndex=memory_type), pAllocator)
+        _vulkan.vkBindBufferMemory(device, self.buffer, self.memory, 0)
+
+        limits = _vulkan.vkGetPhysicalDeviceProperties(physicalDevice).limits
+        self.mapping = MappedMemory(device, self.memory, size,
+                                    types.flags[memory_type],
+                                    limits.nonCoherentAtomSize)
+        self.copy_alignment = max(limits.optimalBufferCopyOffsetAlignment, 4)
+
+        self.command_pool = _vulkan.vkCreateCommandPool(
+            device, _vulkan.VkCommandPoolCreateInfo(
+                flags=(
+                    _vulkan.VK_COMMAND_POOL_CREATE_TRANSIENT_BIT |
+                    _vulkan.VK_COMMAND_POOL_CREATE_RESET_COMMAND_BUFFER_BIT),
+                queueFamilyIndex=queueFamilyIndex), pAllocator)
+        command_buffers = _vulkan.vkAllocateCommandBuffers(
+            device, _vulkan.VkCommandBufferAllocateInfo(
+                commandPool=self.command_pool,
+                level=_vulkan.VK_COMMAND_BUFFER_LEVEL_PRIMARY,
+                commandBufferCount=slots))
+        self.slots = [
+            _Slot(i * slot_size, command_buffers[i], _vulkan.vkCreateFence(
+                device, _vulkan.VkFenceCreateInfo(
+                    flags=_vulkan.VK_FENCE_CREATE_SIGNALED_BIT), pAllocator))
+            for i in range(slots)]
+        self._current = 0
+        self._pending = [False] * slots
+
+    def _reserve(self, size, alignment, unit):
+        """(slot, offset in the slot) of up to size bytes, a multiple of
+        unit, in the current slot or the next one"""
+        # offsets are aligned in the staging buffer, not only in the slot
+        slot = self.slots[self._current]
+        offset = _align(slot.offset + slot.fill, alignment) - slot.offset
+        if offset + unit > self.slot_size and slot.fill:
+            # submit moves to the next slot once it is free
+            self.submit()
+            slot = self.slots[self._current]
+            offset = _align(slot.offset, alignment) - slot.offset
+        available = max(self.slot_size - offset, 0) // unit * unit
+        if not available:
+            raise ValueError('Rows of %d bytes bigger than the slots' % unit)
+        size = min(size, available)
+        slot.fill = offset + size
+        return slot, offset, size
+
+    def _next_slot(self):
+        self._current = (self._current + 1) % len(self.slots)
+        slot = self.slots[self._current]
+        if self._pending[self._current]:
+            _vulkan.vkWaitForFences(self.device, 1, [slot.fence], True,
+                                    _UINT64_MAX)
+            self._pending[self._current] = False
+        return slot
+
+    def _stream(self, mapped, file_offset, size, alignment, unit, record):
+        """Copy size bytes of a _MappedFile from file_offset to the slots,
+        calling record(slot, staging offset, offset in the copied range,
+        size) for each chunk
+
+        Each chunk is a multiple of unit bytes starting at a multiple of
+        alignment in the staging buffer.
+        """
+        done = 0
+        while done < size:
+            slot, offset, chunk = self._reserve(size - done, alignment, unit)
+            start = file_offset + done
+            mapped.read_ahead(start + chunk, self.slot_size)
+            self.mapping.view(slot.offset + offset, chunk)[:] = \
+                mapped.view[start:start + chunk]
+            record(slot, slot.offset + offset, done, chunk)
+            done += chunk
+
+    @staticmethod
+    def _open(source, file_offset, size):
+        """_MappedFile of source and the size to copy, checked"""
+        mapped = _MappedFile(source)
+        if size is None:
+            size = mapped.size - file_offset
+        if file_offset < 0 or file_offset + size > mapped.size:
+            mapped.close()
+            raise ValueError('Range [%d, %d) out of a file of %d bytes' %
+                             (file_offset, file_offset + size, mapped.size))
+        return mapped, size
+
+    def upload_buffer(self, source, buffer, offset=0, file_offset=0,
+                      size=None):
+        """Copy size bytes of a file (all of it from file_offset by
+        default) to buffer at offset
+
+        `source` is a path or a file object opened in binary mode.
+        """
+        def record(slot, staging_offset, done, chunk):
+            key = _address(buffer)
+            if key not in slot.buffer_copies:
+                slot.buffer_copies[key] = (buffer, [])
+            slot.buffer_copies[key][1].append(_vulkan.VkBufferCopy(
+                srcOffset=staging_offset, dstOffset=offset + done,
+                size=chunk))
+
+        mapped, size = self._open(source, file_offset, size)
+        try:
+            self._stream(mapped, file_offset, size, self.copy_alignment, 1,
+                         record)
+        finally:
+            mapped.close()
+
+    def upload_image(self, source, image, width, height, texel_size,
+                     layers=1, mipLevel=0, baseArrayLayer=0,
+                     aspectMask=_vulkan.VK_IMAGE_ASPECT_COLOR_BIT,
+                     layout=_vulkan.VK_IMAGE_LAYOUT_TRANSFER_DST_OPTIMAL,
+                     file_offset=0):
+        """Copy tightly packed texels of a file to a 2D image
+
+        The file holds `layers` layers of height rows of width texels of
+        texel_size bytes, from file_offset. Chunks are made of whole rows
+        of a layer.
+        """
+        row = width * texel_size
+        layer_size = row * height
+        # offsets of copies to images are multiples of the texel size and 4,
+        # each chunk is a region starting at such an offset
+        alignment = self.copy_alignment
+        alignment = alignment * texel_size // _gcd(alignment, texel_size)
+        key = (_address(image), layout)
+
+        def record(slot, staging_offset, done, chunk):
+            if key not in slot.image_copies:
+                slot.image_copies[key] = (image, layout, [])
+            slot.image_copies[key][2].append(_vulkan.VkBufferImageCopy(
+                bufferOffset=staging_offset,
+                imageSubresource=_vulkan.VkImageSubresourceLayers(
+                    aspectMask=aspectMask, mipLevel=mipLevel,
+                    baseArrayLayer=baseArrayLayer + layer, layerCount=1),
+                imageOffset=_vulkan.VkOffset3D(x=0, y=done // row, z=0),
+                imageExtent=_vulkan.VkExtent3D(width=width,
+                                               height=chunk // row,
+                                               depth=1)))
+
+        mapped, _ = self._open(source, file_offset, layer_size * layers)
+        try:
+            # streamed layer by layer, a chunk never spans two layers
+            for layer in range(layers):
+                self._stream(mapped, file_offset + layer * layer_size,
+                             layer_size, alignment, row, record)
+        finally:
+            mapped.close()
+
+    def submit(self):
+        """Record and submit the copies of the current slot"""
+        slot = self.slots[self._current]
+        if not slot.fill:
+            return
+
+        self.mapping.flush(slot.offset, slot.fill)
+        command_buffer = slot.command_buffer
+        _vulkan.vkResetCommandBuffer(command_buffer, 0)
+        _vulkan.vkBeginCommandBuffer(
+            command_buffer, _vulkan.VkCommandBufferBeginInfo(
+                flags=_vulkan.VK_COMMAND_BUFFER_USAGE_ONE_TIME_SUBMIT_BIT))
+        for dst, regions in slot.buffer_copies.values():
+            _vulkan.vkCmdCopyBuffer(command_buffer, self.buffer, dst,
+                                    len(regions), regions)
+        for image, layout, regions in slot.image_copies.values():
+            _vulkan.vkCmdCopyBufferToImage(command_buffer, self.buffer,
+                                           image, layout, len(regions),
+                                           regions)
+        _vulkan.vkEndCommandBuffer(command_buffer)
+
+        _vulkan.vkResetFences(self.device, 1, [slot.fence])
+        _vulkan.vkQueueSubmit(self.queue, 1, [_vulkan.VkSubmitInfo(
+            commandBufferCount=1, pCommandBuffers=[command_buffer])],
+            slot.fence)
+        self._pending[self._current] = True
+
+        slot.fill = 0
+        slot.buffer_copies = {}
+        slot.image_copies = {}
+        self._next_slot()
+
+    def wait(self):
+        """Submit the pending copies and wait until all are done"""
+        self.submit()
+        fences = [slot.fence for slot, pending in zip(self.slots,
+                                                      self._pending)
+                  if pending]
+        if fences:
+            _vulkan.vkWaitForFences(self.device, len(fences), fences, True,
+                                    _UINT64_MAX)
+        self._pending = [False] * len(self.slots)
+
+    def destroy(self):
+        """Wait for the copies and destroy the staging resources"""
+        self.wait()
+        for slot in self.slots:
+            _vulkan.vkDestroyFence(self.device, slot.fence, self.pAllocator)
+        _vulkan.vkDestroyCommandPool(self.device, self.command_pool,
+                                     self.pAllocator)
+        self.mapping.unmap()
+        _vulkan.vkFreeMemory(self.device, self.memory, self.pAllocator)
+        _vulkan.vkDestroyBuffer(self.device, self.buffer, self.pAllocator)
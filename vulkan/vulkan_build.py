@@ -1,8 +1,19 @@
 from cffi import FFI
-from os import path
+from os import environ, path
+import re
+import sys
 
 HERE = path.dirname(path.realpath(__file__))
 
+# Function prototypes as emitted by `cpp -P` in vulkan.cdef.h
+PROTOTYPE_RE = re.compile(r'^ +[\w \*]+?\b(vk\w+)\([^;]*?\);\n', re.M)
+# First declaration of the VK_KHR_surface extension: every prototype before
+# it belongs to the core API, which is what the loader exports
+CORE_END_MARKER = 'typedef struct VkSurfaceKHR_T'
+C_HEADERS = '#include <stddef.h>\n#include <stdint.h>\n'
+# Placeholder from fake_libc_include, it clashes with the real <stdarg.h>
+FAKE_TYPEDEFS = ('typedef int va_list;\n',)
+
 ffi = FFI()
 
 # read file
@@ -12,3 +23,40 @@ with open(path.join(HERE, 'vulkan.cdef.h')) as f:
 # configure cffi
 ffi.cdef(cdef)
 ffi.set_source('vulkan._vulkancache', None)
+
+
+def split_cdef(cdef):
+    """Split the cdef in (types, core prototypes)
+
+    Extension prototypes are dropped, they are not exported by the loader
+    and are only reachable through vkGet*ProcAddr.
+    """
+    for typedef in FAKE_TYPEDEFS:
+        cdef = cdef.replace(typedef, '')
+
+    end = cdef.index(CORE_END_MARKER)
+    core = [m.group(0) for m in PROTOTYPE_RE.finditer(cdef) if m.start() < end]
+    return PROTOTYPE_RE.sub('', cdef), ''.join(core)
+
+
+def ffi_api():
+    """Build the API mode ffi
+
+    The resulting `vulkan._vulkancache_api` extension is linked against the
+    loader and calls the core functions directly instead of going through
+    libffi. It is only built when `VULKAN_CFFI_API_MODE` is set, see setup.py.
+    """
+    types, prototypes = split_cdef(cdef)
+
+    library_dirs = []
+    if environ.get('VULKAN_SDK'):
+        lib_dir = 'Lib' if sys.platform == 'win32' else 'lib'
+        library_dirs.append(path.join(environ['VULKAN_SDK'], lib_dir))
+
+    api = FFI()
+    api.cdef(types + prototypes)
+    api.set_source(
+        'vulkan._vulkancache_api', C_HEADERS + types + prototypes,
+        libraries=['vulkan-1' if sys.platform == 'win32' else 'vulkan'],
+        library_dirs=library_dirs)
+    return api